@@ -1,12 +1,19 @@
+import ast
 import dataclasses
+import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
+import os
 import re
 import subprocess
 import sys
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from shutil import rmtree
+from typing import cast
 
 from algokit_utils.config import config
 from dotenv import load_dotenv
@@ -204,6 +211,206 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     return output_dir
 
 
+# ----------------------- Incremental Build Logic ----------------------- #
+
+BUILD_MANIFEST_FILE_NAME = "build_manifest.json"
+
+# Bump to invalidate every stored manifest when the build recipe changes
+BUILD_CACHE_VERSION = 1
+
+# Python packages whose versions affect the generated artifacts
+BUILD_TOOL_PACKAGES = ("puyapy", "algokit-client-generator")
+
+
+def _module_path(module_name: str) -> Path | None:
+    """Resolves a dotted module name to a source file of this project, if any."""
+    parts = module_name.split(".")
+    if parts[0] != root_path.name:
+        return None
+    base = root_path.parent.joinpath(*parts)
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _local_imports(source_path: Path) -> set[Path]:
+    """Returns the project source files directly imported by a source file."""
+    tree = ast.parse(source_path.read_bytes(), filename=str(source_path))
+    package = source_path.relative_to(root_path.parent).with_suffix("").parts[:-1]
+
+    imported: set[Path] = set()
+    for node in ast.walk(tree):
+        module_names: list[str] = []
+        if isinstance(node, ast.Import):
+            module_names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = package[: len(package) - node.level + 1] if node.level else ()
+            module = ".".join((*base, *node.module.split(".")) if node.module else base)
+            # `from package import name` may import either a module or an attribute
+            module_names = [module] + [f"{module}.{alias.name}" for alias in node.names]
+        for module_name in module_names:
+            module_path = _module_path(module_name)
+            if module_path is not None and module_path != source_path:
+                imported.add(module_path)
+    return imported
+
+
+def contract_sources(contract_path: Path) -> list[Path]:
+    """Returns the contract source and all its transitive project imports."""
+    sources: set[Path] = set()
+    pending = [contract_path.resolve()]
+    while pending:
+        source_path = pending.pop()
+        if source_path in sources:
+            continue
+        sources.add(source_path)
+        pending.extend(_local_imports(source_path))
+    return sorted(sources)
+
+
+def _build_tool_versions() -> dict[str, str]:
+    versions = {}
+    for package in BUILD_TOOL_PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+    return versions
+
+
+def contract_source_hash(contract_path: Path) -> str:
+    """
+    Hashes the contract source, its transitive project imports and the build
+    settings, so that any change affecting the compiled artifacts changes the hash.
+    """
+    settings: dict[str, object] = {
+        "cache_version": BUILD_CACHE_VERSION,
+        "avm_version": AVM_VERSION,
+        "tools": _build_tool_versions(),
+    }
+    digest = hashlib.sha256()
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    for source_path in contract_sources(contract_path):
+        digest.update(source_path.relative_to(root_path).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(source_path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _read_manifest(output_dir: Path) -> dict[str, object] | None:
+    manifest_path = output_dir / BUILD_MANIFEST_FILE_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        manifest: object = json.loads(manifest_path.read_text())
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring corrupted build manifest {manifest_path}")
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    return cast(dict[str, object], manifest)
+
+
+def is_build_up_to_date(output_dir: Path, source_hash: str) -> bool:
+    """Checks whether the artifacts in output_dir were built from source_hash."""
+    manifest = _read_manifest(output_dir)
+    if manifest is None or manifest.get("source_hash") != source_hash:
+        return False
+    outputs = manifest.get("outputs")
+    return isinstance(outputs, list) and all(
+        (output_dir / str(output)).is_file() for output in outputs
+    )
+
+
+def write_manifest(output_dir: Path, contract_path: Path, source_hash: str) -> None:
+    manifest = {
+        "source_hash": source_hash,
+        "sources": [
+            source.relative_to(root_path).as_posix()
+            for source in contract_sources(contract_path)
+        ],
+        "outputs": sorted(
+            file.name
+            for file in output_dir.iterdir()
+            if file.is_file() and file.name != BUILD_MANIFEST_FILE_NAME
+        ),
+    }
+    (output_dir / BUILD_MANIFEST_FILE_NAME).write_text(
+        json.dumps(manifest, indent=2) + "\n"
+    )
+
+
+def build_contracts(
+    artifact_path: Path,
+    contracts_to_build: list[SmartContract],
+    *,
+    force: bool = False,
+    jobs: int | None = None,
+) -> None:
+    """
+    Builds the contracts whose sources changed since the last build, compiling
+    independent contracts concurrently in a process pool.
+
+    Args:
+        artifact_path: Root folder of the contract artifacts
+        contracts_to_build: Contracts to build
+        force: Rebuild every contract, ignoring the stored build manifests
+        jobs: Maximum number of concurrent builds (defaults to the CPU count)
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be a positive integer, got {jobs}")
+
+    stale: list[tuple[SmartContract, str]] = []
+    for contract in contracts_to_build:
+        source_hash = contract_source_hash(contract.path)
+        if not force and is_build_up_to_date(
+            artifact_path / contract.name, source_hash
+        ):
+            logger.info(f"Skipping {contract.name}, artifacts are up to date")
+            continue
+        stale.append((contract, source_hash))
+
+    if not stale:
+        return
+
+    max_workers = min(jobs or os.cpu_count() or 1, len(stale))
+    logger.info(
+        f"Building {[contract.name for contract, _ in stale]} with {max_workers} worker(s)"
+    )
+    if max_workers == 1:
+        for contract, source_hash in stale:
+            build(artifact_path / contract.name, contract.path)
+            write_manifest(artifact_path / contract.name, contract.path, source_hash)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(build, artifact_path / contract.name, contract.path)
+            for contract, _ in stale
+        ]
+        for future, (contract, source_hash) in zip(futures, stale, strict=True):
+            future.result()
+            write_manifest(artifact_path / contract.name, contract.path, source_hash)
+
+
+def _build_options_from_env() -> tuple[bool, int | None]:
+    force = os.environ.get("SMART_CONTRACTS_BUILD_FORCE", "false").lower() == "true"
+    jobs = os.environ.get("SMART_CONTRACTS_BUILD_JOBS")
+    if not jobs:
+        return force, None
+    try:
+        build_jobs = int(jobs)
+    except ValueError:
+        build_jobs = 0
+    if build_jobs < 1:
+        raise ValueError(
+            f"SMART_CONTRACTS_BUILD_JOBS must be a positive integer, got {jobs!r}"
+        )
+    return force, build_jobs
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
@@ -218,11 +425,13 @@ def main(action: str, contract_name: str | None = None) -> None:
         if contract_name is None or contract.name == contract_name
     ]
 
+    force_build, build_jobs = _build_options_from_env()
+
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_contracts(
+                artifact_path, filtered_contracts, force=force_build, jobs=build_jobs
+            )
         case "deploy":
             logger.info(
                 f"Deploying contracts... {[c.name for c in filtered_contracts]}"
@@ -248,9 +457,10 @@ def main(action: str, contract_name: str | None = None) -> None:
                     logger.info(f"Deploying app {contract.name}")
                     contract.deploy()
         case "all":
+            build_contracts(
+                artifact_path, filtered_contracts, force=force_build, jobs=build_jobs
+            )
             for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
@@ -52,6 +52,16 @@ class Council(algopy.arc4.ARC4Client, typing.Protocol):
         Cast a vote on a proposal.
         """
 
+    @algopy.arc4.abimethod
+    def vote_many(
+        self,
+        votes: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.Bool]],
+    ) -> None:
+        """
+        Cast votes on several proposals in a single app call. Proposals reaching
+        the majority are reviewed within the call.
+        """
+
     @algopy.arc4.abimethod
     def op_up(
         self,
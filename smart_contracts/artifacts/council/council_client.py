@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "desc": "The application ID of the XGovRegistry contract.", "name": "registry_id"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new council contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_council", "returns": {"type": "void"}, "desc": "Update the council contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the member to add.", "name": "address"}], "name": "add_member", "returns": {"type": "void"}, "desc": "Add a member to the council.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the member to remove.", "name": "address"}], "name": "remove_member", "returns": {"type": "void"}, "desc": "Remove a member from the council.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the proposal to vote on.", "name": "proposal_id"}, {"type": "bool", "desc": "Whether or not to block the proposal.", "name": "block"}], "name": "vote", "returns": {"type": "void"}, "desc": "Cast a vote on a proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Council", "state": {"keys": {"box": {}, "global": {"registry_app_id": {"key": "cmVnaXN0cnlfYXBwX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "member_count": {"key": "bWVtYmVyX2NvdW50", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"members": {"keyType": "address", "valueType": "byte[0]", "prefix": "TQ=="}, "votes": {"keyType": "uint64", "valueType": "(address,bool)[]", "prefix": "Vg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAAECICYEDG1lbWJlcl9jb3VudA9yZWdpc3RyeV9hcHBfaWQBTQEAMRhAABcxNRREMTQkEkQxNxREMTYURCkiZygiZ4AEB47ylTYaAI4BAD0xGRREMRhBACaCBAQZ1wL6BJLr9t4E9/RIHwTb2D3ZNhoAjgQATQBwAJEAAQAjQ4AEJA0vZzYaAI4BAA0AMRmBBBIxGBBEQgAUNhoBSRWBCBJEF0lEKUxnKCJnI0MxAIAMeGdvdl9tYW5hZ2VyiAGBSRUlEkQSRCNDNhoBSRUlEkSIAXlEKkxQSb1FARREgAC/IihlRCMIKExnI0M2GgFJFSUSRIgBVkQqTFBJvUUBRLxIIihlRCMJKExnI0OAAEcENhoBRwIVgQgSRBdJNhoCSRUjEkQiU0wqMQBQvUUBRBaAAVZMUEm9RQFAAEKxIillRLIYgAQmmDIAshpLA7IagQayECKyAbNLAoAGc3RhdHVzZUSBHhJEMQArIksEVFCAAgABTFBLAUm8SEy/I0MiKGVEJAojCEUHSwEUSUUKFEUFSSIkuhdFCCJFBksFSwgMQQA2MQBLBoEhCyQISwJMgSG6SVcAIE8CE0SBgAJTQQAPSwQjCEUFSwUjCEUGQv/LSwgjCEUJQv/uMQArIksEVFBLAUkiJLoXSwG9SIEhCEsCTNNJIwgWVwYCSwIiTwK7gSELJAgiTwPSSwhLBw9AAAhLBEsHD0H/Y0sESwcPsSsiTwJUSwOyGIAEIS2fB7IashqBBrIQIrIBs0m8SEL/PIoBASIpZUSL/2VEiTEAgBFjb21taXR0ZWVfbWFuYWdlcoj/3EkVJRJEEok=", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiAzMgogICAgYnl0ZWNibG9jayAweDZkNjU2ZDYyNjU3MjVmNjM2Zjc1NmU3NCAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NCAweDRkIDB4MDAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNvdW5jaWxfY2ZnLkdMT0JBTF9CWVRFUwogICAgdHhuIEdsb2JhbE51bUJ5dGVTbGljZQogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzgtNDAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBjb3VuY2lsX2NmZy5HTE9CQUxfQllURVMKICAgIC8vICksIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NDEKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV91aW50ID09IGNvdW5jaWxfY2ZnLkdMT0JBTF9VSU5UUywgZXJyLldST05HX0dMT0JBTF9VSU5UUwogICAgdHhuIEdsb2JhbE51bVVpbnQKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo0MwogICAgLy8gVHhuLmxvY2FsX251bV9ieXRlX3NsaWNlID09IGNvdW5jaWxfY2ZnLkxPQ0FMX0JZVEVTCiAgICB0eG4gTG9jYWxOdW1CeXRlU2xpY2UKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjQyLTQ0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5sb2NhbF9udW1fYnl0ZV9zbGljZSA9PSBjb3VuY2lsX2NmZy5MT0NBTF9CWVRFUwogICAgLy8gKSwgZXJyLldST05HX0xPQ0FMX0JZVEVTCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NDUKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX3VpbnQgPT0gY291bmNpbF9jZmcuTE9DQUxfVUlOVFMsIGVyci5XUk9OR19MT0NBTF9VSU5UUwogICAgdHhuIExvY2FsTnVtVWludAogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBrZXk9Y291bmNpbF9jZmcuR1NfS0VZX1JFR0lTVFJZX0FQUF9JRCwKICAgIGJ5dGVjXzEgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo0Ny01MAogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y291bmNpbF9jZmcuR1NfS0VZX1JFR0lTVFJZX0FQUF9JRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo1NAogICAgLy8ga2V5PWNvdW5jaWxfY2ZnLkdTX0tFWV9NRU1CRVJfQ09VTlQsCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo1MwogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NTItNTUKICAgIC8vIHNlbGYubWVtYmVyX2NvdW50ID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PWNvdW5jaWxfY2ZnLkdTX0tFWV9NRU1CRVJfQ09VTlQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyOC0zNgogICAgLy8gY2xhc3MgQ291bmNpbCgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y291bmNpbF9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y291bmNpbF9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jb3VuY2lsX2NmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y291bmNpbF9jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICBwdXNoYnl0ZXMgMHgwNzhlZjI5NSAvLyBtZXRob2QgInVwZGF0ZV9jb3VuY2lsKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfY291bmNpbF9yb3V0ZUA0CgptYWluX3N3aXRjaF9jYXNlX25leHRANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjI4LTM2CiAgICAvLyBjbGFzcyBDb3VuY2lsKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jb3VuY2lsX2NmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jb3VuY2lsX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNvdW5jaWxfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jb3VuY2lsX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMTIKICAgIHB1c2hieXRlc3MgMHgxOWQ3MDJmYSAweDkyZWJmNmRlIDB4ZjdmNDQ4MWYgMHhkYmQ4M2RkOSAvLyBtZXRob2QgImFkZF9tZW1iZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJyZW1vdmVfbWVtYmVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAidm90ZSh1aW50NjQsYm9vbCl2b2lkIiwgbWV0aG9kICJvcF91cCgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGFkZF9tZW1iZXIgcmVtb3ZlX21lbWJlciB2b3RlIG1haW5fb3BfdXBfcm91dGVAMTAKICAgIGVycgoKbWFpbl9vcF91cF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX05vT3BAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyOC0zNgogICAgLy8gY2xhc3MgQ291bmNpbCgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9Y291bmNpbF9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y291bmNpbF9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jb3VuY2lsX2NmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9Y291bmNpbF9jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICBwdXNoYnl0ZXMgMHgyNDBkMmY2NyAvLyBtZXRob2QgImNyZWF0ZSh1aW50NjQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgptYWluX3VwZGF0ZV9jb3VuY2lsX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQKICAgIGIgdXBkYXRlX2NvdW5jaWwKCgovLyBzbWFydF9jb250cmFjdHMuY291bmNpbC5jb250cmFjdC5Db3VuY2lsLmNyZWF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo5NAogICAgLy8gYXNzZXJ0IHJlZ2lzdHJ5X2lkID4gMCwgZXJyLklOVkFMSURfUkVHSVNUUllfSUQKICAgIGR1cAogICAgYXNzZXJ0IC8vIEludmFsaWQgcmVnaXN0cnkgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSA9IHJlZ2lzdHJ5X2lkCiAgICBieXRlY18xIC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6OTcKICAgIC8vIHNlbGYubWVtYmVyX2NvdW50LnZhbHVlID0gVUludDY0KDApCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY291bmNpbC5jb250cmFjdC5Db3VuY2lsLnVwZGF0ZV9jb3VuY2lsW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX2NvdW5jaWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo3MwogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gQWNjb3VudCgKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9YR09WX01BTkFHRVIpKQogICAgcHVzaGJ5dGVzIDB4Nzg2NzZmNzY1ZjZkNjE2ZTYxNjc2NTcyCiAgICBjYWxsc3ViIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NzMtNzUKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICAvLyAgICAgc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9NQU5BR0VSKSkKICAgIC8vICkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMDgKICAgIC8vIGFzc2VydCBzZWxmLmlzX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6OTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY291bmNpbC5jb250cmFjdC5Db3VuY2lsLmFkZF9tZW1iZXJbcm91dGluZ10oKSAtPiB2b2lkOgphZGRfbWVtYmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTEwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjMKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NvbW1pdHRlZV9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfY29tbWl0dGVlX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEyNAogICAgLy8gYXNzZXJ0IGFkZHJlc3MubmF0aXZlIG5vdCBpbiBzZWxmLm1lbWJlcnMsIGVyci5WT1RFUl9BTFJFQURZX0FTU0lHTkVECiAgICBieXRlY18yIC8vIDB4NGQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBWb3RlciBBbHJlYWR5IEFzc2lnbmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjYKICAgIC8vIHNlbGYubWVtYmVyc1thZGRyZXNzLm5hdGl2ZV0gPSB0eXAuRW1wdHkoKQogICAgcHVzaGJ5dGVzIDB4CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjcKICAgIC8vIHNlbGYubWVtYmVyX2NvdW50LnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVtYmVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gMHg2ZDY1NmQ2MjY1NzI1ZjYzNmY3NTZlNzQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC5yZW1vdmVfbWVtYmVyW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVtb3ZlX21lbWJlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTQyCiAgICAvLyBhc3NlcnQgc2VsZi5pc19jb21taXR0ZWVfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX2NvbW1pdHRlZV9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNDMKICAgIC8vIGFzc2VydCBhZGRyZXNzLm5hdGl2ZSBpbiBzZWxmLm1lbWJlcnMsIGVyci5WT1RFUl9OT1RfRk9VTkQKICAgIGJ5dGVjXzIgLy8gMHg0ZAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFZvdGVyIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTQ1CiAgICAvLyBkZWwgc2VsZi5tZW1iZXJzW2FkZHJlc3MubmF0aXZlXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNDYKICAgIC8vIHNlbGYubWVtYmVyX2NvdW50LnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVtYmVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gMHg2ZDY1NmQ2MjY1NzI1ZjYzNmY3NTZlNzQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC52b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZToKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTY0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBpbiBzZWxmLm1lbWJlcnMsIGVyci5WT1RFUl9OT1RfRk9VTkQKICAgIGJ5dGVjXzIgLy8gMHg0ZAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWb3RlciBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gaWYgcHJvcG9zYWxfaWQgbm90IGluIHNlbGYudm90ZXM6CiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg1NgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IHZvdGVfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE2Ny0xNzMKICAgIC8vICMgd2UgZG9udCBuZWVkIGFueSBlcnJvciBoYW5kbGluZyBoZXJlCiAgICAvLyAjIGlmIGl0cyBpbnZhbGlkIHRoZSB0cmFuc2FjdGlvbiB3aWxsIGZhaWwKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcmVnaXN0cnlfY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmlzX3Byb3Bvc2FsLAogICAgLy8gICAgIGFyYzQuVUludDY0KHByb3Bvc2FsX2lkKSwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNzIKICAgIC8vIGFwcF9pZD1zZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwX2lkIGV4aXN0cwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNzAKICAgIC8vIHJlZ2lzdHJ5X2NvbnRyYWN0LlhHb3ZSZWdpc3RyeS5pc19wcm9wb3NhbCwKICAgIHB1c2hieXRlcyAweDI2OTgzMjAwIC8vIG1ldGhvZCAiaXNfcHJvcG9zYWwodWludDY0KXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNjctMTczCiAgICAvLyAjIHdlIGRvbnQgbmVlZCBhbnkgZXJyb3IgaGFuZGxpbmcgaGVyZQogICAgLy8gIyBpZiBpdHMgaW52YWxpZCB0aGUgdHJhbnNhY3Rpb24gd2lsbCBmYWlsCiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHJlZ2lzdHJ5X2NvbnRyYWN0LlhHb3ZSZWdpc3RyeS5pc19wcm9wb3NhbCwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChwcm9wb3NhbF9pZCksCiAgICAvLyAgICAgYXBwX2lkPXNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE3NS0xNzcKICAgIC8vIHN0YXR1cywgZXhpc3RzID0gQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsIEJ5dGVzKHByb3Bvc2FsX2NmZy5HU19LRVlfU1RBVFVTKQogICAgLy8gKQogICAgZGlnIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gcHJvcG9zYWxfaWQsIEJ5dGVzKHByb3Bvc2FsX2NmZy5HU19LRVlfU1RBVFVTKQogICAgcHVzaGJ5dGVzIDB4NzM3NDYxNzQ3NTczCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNzUtMTc3CiAgICAvLyBzdGF0dXMsIGV4aXN0cyA9IEFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHByb3Bvc2FsX2lkLCBCeXRlcyhwcm9wb3NhbF9jZmcuR1NfS0VZX1NUQVRVUykKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNzkKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBhc3NlcnQgLy8gSW52YWxpZCBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTgwCiAgICAvLyBhc3NlcnQgc3RhdHVzID09IHByb3Bvc2FsX2VubS5TVEFUVVNfQVBQUk9WRUQsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIHB1c2hpbnQgMzAKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTg0CiAgICAvLyBhZGRyZXNzPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxODMtMTg2CiAgICAvLyB0eXAuQ291bmNpbFZvdGUoCiAgICAvLyAgICAgYWRkcmVzcz1UeG4uc2VuZGVyLAogICAgLy8gICAgIGJsb2NrPWJsb2NrLAogICAgLy8gKQogICAgYnl0ZWNfMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDQKICAgIHNldGJpdAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxODItMTg3CiAgICAvLyBzZWxmLnZvdGVzW3Byb3Bvc2FsX2lkXSA9IGFyYzQuRHluYW1pY0FycmF5KAogICAgLy8gICAgIHR5cC5Db3VuY2lsVm90ZSgKICAgIC8vICAgICAgICAgYWRkcmVzcz1UeG4uc2VuZGVyLAogICAgLy8gICAgICAgICBibG9jaz1ibG9jaywKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAoKdm90ZV9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTQ4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdm90ZV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gaGFsZl9wbHVzX29uZSA9IChzZWxmLm1lbWJlcl9jb3VudC52YWx1ZSAvLyAyKSArIDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVtYmVyX2NvdW50IGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgIC8KICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE5MQogICAgLy8gYXBwcm92YWxzID0gVUludDY0KDApIGlmIGJsb2NrIGVsc2UgVUludDY0KDEpCiAgICBkaWcgMQogICAgIQogICAgZHVwCiAgICBidXJ5IDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxOTIKICAgIC8vIHJlamVjdGlvbnMgPSBVSW50NjQoMCkgaWYgbm90IGJsb2NrIGVsc2UgVUludDY0KDEpCiAgICAhCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHNlbGYudm90ZXNbcHJvcG9zYWxfaWRdLmxlbmd0aCk6CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGJ1cnkgOAogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNgoKdm90ZV9mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxOTQKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLnZvdGVzW3Byb3Bvc2FsX2lkXS5sZW5ndGgpOgogICAgZGlnIDUKICAgIGRpZyA4CiAgICA8CiAgICBieiB2b3RlX2FmdGVyX2ZvckAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTk2CiAgICAvLyBUeG4uc2VuZGVyICE9IHNlbGYudm90ZXNbcHJvcG9zYWxfaWRdW2ldLmFkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGRpZyA2CiAgICBwdXNoaW50IDMzCiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZGlnIDIKICAgIHN3YXAKICAgIHB1c2hpbnQgMzMKICAgIGJveF9leHRyYWN0IC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgdW5jb3ZlciAyCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTk1LTE5NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyICE9IHNlbGYudm90ZXNbcHJvcG9zYWxfaWRdW2ldLmFkZHJlc3MKICAgIC8vICksIGVyci5WT1RFUl9BTFJFQURZX1ZPVEVECiAgICBhc3NlcnQgLy8gVm90ZXIgYWxyZWFkeSB2b3RlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTk5CiAgICAvLyBpZiBzZWxmLnZvdGVzW3Byb3Bvc2FsX2lkXVtpXS5ibG9jazoKICAgIHB1c2hpbnQgMjU2CiAgICBnZXRiaXQKICAgIGJ6IHZvdGVfZWxzZV9ib2R5QDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gcmVqZWN0aW9ucyArPSAxCiAgICBkaWcgNAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgNQoKdm90ZV9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxOTQKICAgIC8vIGZvciBpIGluIHVyYW5nZShzZWxmLnZvdGVzW3Byb3Bvc2FsX2lkXS5sZW5ndGgpOgogICAgZGlnIDUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDYKICAgIGIgdm90ZV9mb3JfaGVhZGVyQDUKCnZvdGVfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMDIKICAgIC8vIGFwcHJvdmFscyArPSAxCiAgICBkaWcgOAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgOQogICAgYiB2b3RlX2FmdGVyX2lmX2Vsc2VAOQoKdm90ZV9hZnRlcl9mb3JAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMDYKICAgIC8vIGFkZHJlc3M9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIwNS0yMDgKICAgIC8vIHR5cC5Db3VuY2lsVm90ZSgKICAgIC8vICAgICBhZGRyZXNzPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYmxvY2s9YmxvY2ssCiAgICAvLyApCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgNAogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIwNC0yMDkKICAgIC8vIHNlbGYudm90ZXNbcHJvcG9zYWxfaWRdLmFwcGVuZCgKICAgIC8vICAgICB0eXAuQ291bmNpbFZvdGUoCiAgICAvLyAgICAgICAgIGFkZHJlc3M9VHhuLnNlbmRlciwKICAgIC8vICAgICAgICAgYmxvY2s9YmxvY2ssCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyAyCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgZGlnIDEKICAgIGJveF9sZW4KICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjA0LTIwOQogICAgLy8gc2VsZi52b3Rlc1twcm9wb3NhbF9pZF0uYXBwZW5kKAogICAgLy8gICAgIHR5cC5Db3VuY2lsVm90ZSgKICAgIC8vICAgICAgICAgYWRkcmVzcz1UeG4uc2VuZGVyLAogICAgLy8gICAgICAgICBibG9jaz1ibG9jaywKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoaW50IDMzCiAgICArCiAgICBkaWcgMgogICAgc3dhcAogICAgYm94X3Jlc2l6ZQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMDQtMjA5CiAgICAvLyBzZWxmLnZvdGVzW3Byb3Bvc2FsX2lkXS5hcHBlbmQoCiAgICAvLyAgICAgdHlwLkNvdW5jaWxWb3RlKAogICAgLy8gICAgICAgICBhZGRyZXNzPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgICAgIGJsb2NrPWJsb2NrLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZGlnIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIwNC0yMDkKICAgIC8vIHNlbGYudm90ZXNbcHJvcG9zYWxfaWRdLmFwcGVuZCgKICAgIC8vICAgICB0eXAuQ291bmNpbFZvdGUoCiAgICAvLyAgICAgICAgIGFkZHJlc3M9VHhuLnNlbmRlciwKICAgIC8vICAgICAgICAgYmxvY2s9YmxvY2ssCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIwNC0yMDkKICAgIC8vIHNlbGYudm90ZXNbcHJvcG9zYWxfaWRdLmFwcGVuZCgKICAgIC8vICAgICB0eXAuQ291bmNpbFZvdGUoCiAgICAvLyAgICAgICAgIGFkZHJlc3M9VHhuLnNlbmRlciwKICAgIC8vICAgICAgICAgYmxvY2s9YmxvY2ssCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGludCAzMwogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIGJveF9zcGxpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gaWYgYXBwcm92YWxzID49IGhhbGZfcGx1c19vbmUgb3IgcmVqZWN0aW9ucyA+PSBoYWxmX3BsdXNfb25lOgogICAgZGlnIDgKICAgIGRpZyA3CiAgICA+PQogICAgYm56IHZvdGVfaWZfYm9keUAxMwogICAgZGlnIDQKICAgIGRpZyA3CiAgICA+PQogICAgYnogdm90ZV9hZnRlcl9pZl9lbHNlQDE2Cgp2b3RlX2lmX2JvZHlAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMTItMjEzCiAgICAvLyAjIHRoaXMgd2lsbCBhbGxvdyB0aGUgcHJvcG9zYWwgdG8gYmUgcmV2aWV3ZWQKICAgIC8vIGJsb2NrID0gcmVqZWN0aW9ucyA+PSBoYWxmX3BsdXNfb25lCiAgICBkaWcgNAogICAgZGlnIDcKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMTUtMjE3CiAgICAvLyBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnJldmlldywgYmxvY2ssIGFwcF9pZD1wcm9wb3NhbF9pZAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjE2CiAgICAvLyBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5yZXZpZXcsIGJsb2NrLCBhcHBfaWQ9cHJvcG9zYWxfaWQKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBkaWcgMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHgyMTJkOWYwNyAvLyBtZXRob2QgInJldmlldyhib29sKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIxNS0yMTcKICAgIC8vIGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwucmV2aWV3LCBibG9jaywgYXBwX2lkPXByb3Bvc2FsX2lkCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjE5CiAgICAvLyBkZWwgc2VsZi52b3Rlc1twcm9wb3NhbF9pZF0KICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBiIHZvdGVfYWZ0ZXJfaWZfZWxzZUAxNgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VuY2lsLmNvbnRyYWN0LkNvdW5jaWwuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKGdsb2JhbF9zdGF0ZV9rZXk6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NjUKICAgIC8vIGRlZiBnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoc2VsZiwgZ2xvYmFsX3N0YXRlX2tleTogQnl0ZXMpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo2NwogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUsIGdsb2JhbF9zdGF0ZV9rZXkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NjYtNjgKICAgIC8vIHZhbHVlLCBleGlzdHMgPSBBcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlLCBnbG9iYWxfc3RhdGVfa2V5CiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo2OQogICAgLy8gYXNzZXJ0IGV4aXN0cywgZXJyLk1JU1NJTkdfQ09ORklHCiAgICBhc3NlcnQgLy8gTWlzc2luZyBDb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjcwCiAgICAvLyByZXR1cm4gdmFsdWUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VuY2lsLmNvbnRyYWN0LkNvdW5jaWwuaXNfY29tbWl0dGVlX21hbmFnZXIoKSAtPiB1aW50NjQ6CmlzX2NvbW1pdHRlZV9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NzgKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX01BTkFHRVIpKQogICAgcHVzaGJ5dGVzIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDYxNmU2MTY3NjU3MgogICAgY2FsbHN1YiBnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5Ojc4LTgwCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBBY2NvdW50KAogICAgLy8gICAgIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9NQU5BR0VSKSkKICAgIC8vICkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgID09CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [199, 620], "errorMessage": "Address length is 32 bytes"}, {"pc": [358], "errorMessage": "Invalid proposal"}, {"pc": [167], "errorMessage": "Invalid registry ID"}, {"pc": [590], "errorMessage": "Missing Config"}, {"pc": [201, 215, 250], "errorMessage": "Unauthorized"}, {"pc": [224], "errorMessage": "Voter Already Assigned"}, {"pc": [445], "errorMessage": "Voter already voted"}, {"pc": [258, 306], "errorMessage": "Voter not found"}, {"pc": [50], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [55], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [59], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [63], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [362], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [231, 264, 389], "errorMessage": "check self.member_count exists"}, {"pc": [324, 586], "errorMessage": "check self.registry_app_id exists"}, {"pc": [437], "errorMessage": "index out of bounds"}, {"pc": [295], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [211, 246], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [164, 285], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "uint64", "desc": "The application ID of the XGovRegistry contract.", "name": "registry_id"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new council contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_council", "returns": {"type": "void"}, "desc": "Update the council contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the member to add.", "name": "address"}], "name": "add_member", "returns": {"type": "void"}, "desc": "Add a member to the council.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the member to remove.", "name": "address"}], "name": "remove_member", "returns": {"type": "void"}, "desc": "Remove a member from the council.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the proposal to vote on.", "name": "proposal_id"}, {"type": "bool", "desc": "Whether or not to block the proposal.", "name": "block"}], "name": "vote", "returns": {"type": "void"}, "desc": "Cast a vote on a proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,bool)[]", "desc": "The IDs of the proposals to vote on, with whether or not to block each of them.", "name": "votes"}], "name": "vote_many", "returns": {"type": "void"}, "desc": "Cast votes on several proposals in a single app call. Proposals reaching\nthe majority are reviewed within the call.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Council", "state": {"keys": {"box": {"next_member_ordinal": {"key": "Tg==", "keyType": "AVMBytes", "valueType": "uint64"}}, "global": {"registry_app_id": {"key": "cmVnaXN0cnlfYXBwX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "member_count": {"key": "bWVtYmVyX2NvdW50", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"members": {"keyType": "address", "valueType": "uint64", "prefix": "TQ=="}, "member_ordinals": {"keyType": "address", "valueType": "uint64", "prefix": "Tw=="}, "tallies": {"keyType": "uint64", "valueType": "CouncilTally", "prefix": "VA=="}, "voted_bitmap": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "Qg=="}, "legacy_votes": {"keyType": "uint64", "valueType": "(address,bool)[]", "prefix": "Vg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CouncilTally": [{"name": "approvals", "type": "uint64"}, {"name": "rejections", "type": "uint64"}]}, "byteCode": {"approval": "CiAEAAEICSYFDG1lbWJlcl9jb3VudAFND3JlZ2lzdHJ5X2FwcF9pZAFOAUIxGEAAGDE1FEQxNIECEkQxNxREMTYURCoiZygiZ4AEB47ylTYaAI4BAEQxGRREMRhBAC2CBQQZ1wL6BJLr9t4E9/RIHwRA0ceABNvYPdk2GgCOBQBNAHUAlwC8AAEAI0OABCQNL2c2GgCOAQANADEZgQQSMRgQREIAEzYaAUkVJBJEF0lEKkxnKCJnI0MxAIAMeGdvdl9tYW5hZ2VyiAEQSRWBIBJEEkQjQzYaAUkVgSASRIgBBkQpSwFQSb1FARRETIgBFxa/IihlRCMIKExnI0M2GgFJFYEgEkSIAN5EKUxQSb1FAUS8SCIoZUQjCShMZyNDNhoBSRUkEkQXNhoCSRUjEkQiUykxAFC9RQFEMQCIAPSIAUojQ4AASTYaAUcCIllJTgJJJQuBAghPAhUSRCkxAFC9RQFERCNJSwIMQQA6IkUFSwRLAQxBACdLAlcCAEsBJQtLAUwlWCJbSwZJTgMlC08CTCVYIlsTRCMIRQVC/9FJIwhFAUL/vzEAiACHRQQiRQFJSwIMQQAhSwJXAgBLAUlOAiULJVhJIltMgUBTSwaIALojCEUBQv/YI0OKAQEiKmVEi/9lRIkxAIARY29tbWl0dGVlX21hbmFnZXKI/9xJFYEgEkQSiYoBAYABT4v/UEm9RQFAABUrvkwXIkxPAk1JIwgWK0y/FosATL+LAL5EF0yJigEBKYv/UEm9REAADIsASSTTi/+I/70Wv4sAvkQXTImKAgCL/hYnBExQSYv/JApJTwK9RA9BAAiLASMIiwBM04sASYsBSU4DI7qL/yQYSlMURCNUTE4Cu4mKAwAiRwKAAEcDi/0WSYABVExQSb1FAUAAy4v9cgdEIiplRHIIRBJEi/2ABnN0YXR1c2VEgR4SRIsIgBAAAAAAAAAAAAAAAAAAAAAAvycEiwdJTgJQK75EF4EHCCQKuUiAAVZMUEmMAb1FAUEAd4sBIoECuheMAyKMBosGiwMMQQBfiwaBIQuBAghJjASLAUyBIbqBgAJTQQA3iwhJvkQkWyMIFiRMu4sBiwSBIbpXACBJjAApTFC9RQFBAAuLAIj+5Yv9TIj+/4sGIwiMBkL/qYsISb5EIlsjCBYiTLtC/8aLAbxIi/2L/4j+24v+QQBmiwhJvkQkWyMIFiRMuyIoZUSBAgojCEmMBYsIvkxJTgKMAkQiWw5AAAqLAiRbiwUPQQAyiwIkW4sFD4z+sYABACKL/lSL/bIYgAQhLZ8HshqyGoEGshAisgGziwi8SCcEiwdQvEiJiwhJvkQiWyMIFiJMu0L/lw==", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCA5CiAgICBieXRlY2Jsb2NrIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0IDB4NGQgMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQgMHg0ZSAweDQyCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo0MwogICAgLy8gVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBjb3VuY2lsX2NmZy5HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjQyLTQ0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5nbG9iYWxfbnVtX2J5dGVfc2xpY2UgPT0gY291bmNpbF9jZmcuR0xPQkFMX0JZVEVTCiAgICAvLyApLCBlcnIuV1JPTkdfR0xPQkFMX0JZVEVTCiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjb3VuY2lsX2NmZy5HTE9CQUxfVUlOVFMsIGVyci5XUk9OR19HTE9CQUxfVUlOVFMKICAgIHR4biBHbG9iYWxOdW1VaW50CiAgICBwdXNoaW50IDIKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY291bmNpbF9jZmcuTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NDYtNDgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLmxvY2FsX251bV9ieXRlX3NsaWNlID09IGNvdW5jaWxfY2ZnLkxPQ0FMX0JZVEVTCiAgICAvLyApLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBCeXRlcyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo0OQogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fdWludCA9PSBjb3VuY2lsX2NmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NTMKICAgIC8vIGtleT1jb3VuY2lsX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgYnl0ZWNfMiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6NTIKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjUxLTU0CiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1jb3VuY2lsX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBrZXk9Y291bmNpbF9jZmcuR1NfS0VZX01FTUJFUl9DT1VOVCwKICAgIGJ5dGVjXzAgLy8gMHg2ZDY1NmQ2MjY1NzI1ZjYzNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo1Ni01OQogICAgLy8gc2VsZi5tZW1iZXJfY291bnQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9Y291bmNpbF9jZmcuR1NfS0VZX01FTUJFUl9DT1VOVCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjMyLTQwCiAgICAvLyBjbGFzcyBDb3VuY2lsKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jb3VuY2lsX2NmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jb3VuY2lsX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPWNvdW5jaWxfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jb3VuY2lsX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweDA3OGVmMjk1IC8vIG1ldGhvZCAidXBkYXRlX2NvdW5jaWwoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV9jb3VuY2lsX3JvdXRlQDQKCm1haW5fc3dpdGNoX2Nhc2VfbmV4dEA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzItNDAKICAgIC8vIGNsYXNzIENvdW5jaWwoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNvdW5jaWxfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNvdW5jaWxfY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y291bmNpbF9jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNvdW5jaWxfY2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAxMwogICAgcHVzaGJ5dGVzcyAweDE5ZDcwMmZhIDB4OTJlYmY2ZGUgMHhmN2Y0NDgxZiAweDQwZDFjNzgwIDB4ZGJkODNkZDkgLy8gbWV0aG9kICJhZGRfbWVtYmVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAicmVtb3ZlX21lbWJlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInZvdGUodWludDY0LGJvb2wpdm9pZCIsIG1ldGhvZCAidm90ZV9tYW55KCh1aW50NjQsYm9vbClbXSl2b2lkIiwgbWV0aG9kICJvcF91cCgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGFkZF9tZW1iZXIgcmVtb3ZlX21lbWJlciB2b3RlIHZvdGVfbWFueSBtYWluX29wX3VwX3JvdXRlQDExCiAgICBlcnIKCm1haW5fb3BfdXBfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9Ob09wQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzItNDAKICAgIC8vIGNsYXNzIENvdW5jaWwoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNvdW5jaWxfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPWNvdW5jaWxfY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y291bmNpbF9jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNvdW5jaWxfY2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4MjQwZDJmNjcgLy8gbWV0aG9kICJjcmVhdGUodWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKbWFpbl91cGRhdGVfY291bmNpbF9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDQgLy8gVXBkYXRlQXBwbGljYXRpb24KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydAogICAgYiB1cGRhdGVfY291bmNpbAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VuY2lsLmNvbnRyYWN0LkNvdW5jaWwuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gYXNzZXJ0IHJlZ2lzdHJ5X2lkID4gMCwgZXJyLklOVkFMSURfUkVHSVNUUllfSUQKICAgIGR1cAogICAgYXNzZXJ0IC8vIEludmFsaWQgcmVnaXN0cnkgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUgPSByZWdpc3RyeV9pZAogICAgYnl0ZWNfMiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gc2VsZi5tZW1iZXJfY291bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gMHg2ZDY1NmQ2MjY1NzI1ZjYzNmY3NTZlNzQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY291bmNpbC5jb250cmFjdC5Db3VuY2lsLnVwZGF0ZV9jb3VuY2lsW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX2NvdW5jaWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo5NgogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gQWNjb3VudCgKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9YR09WX01BTkFHRVIpKQogICAgcHVzaGJ5dGVzIDB4Nzg2NzZmNzY1ZjZkNjE2ZTYxNjc2NTcyCiAgICBjYWxsc3ViIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6OTYtOTgKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICAvLyAgICAgc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9NQU5BR0VSKSkKICAgIC8vICkKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTc4CiAgICAvLyBhc3NlcnQgc2VsZi5pc19tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VuY2lsLmNvbnRyYWN0LkNvdW5jaWwuYWRkX21lbWJlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFkZF9tZW1iZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxOTMKICAgIC8vIGFzc2VydCBzZWxmLmlzX2NvbW1pdHRlZV9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfY29tbWl0dGVlX21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gYXNzZXJ0IGFkZHJlc3MubmF0aXZlIG5vdCBpbiBzZWxmLm1lbWJlcnMsIGVyci5WT1RFUl9BTFJFQURZX0FTU0lHTkVECiAgICBieXRlY18xIC8vIDB4NGQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gVm90ZXIgQWxyZWFkeSBBc3NpZ25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTk2CiAgICAvLyBzZWxmLm1lbWJlcnNbYWRkcmVzcy5uYXRpdmVdID0gc2VsZi50YWtlX21lbWJlcl9vcmRpbmFsKGFkZHJlc3MubmF0aXZlKQogICAgc3dhcAogICAgY2FsbHN1YiB0YWtlX21lbWJlcl9vcmRpbmFsCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxOTcKICAgIC8vIHNlbGYubWVtYmVyX2NvdW50LnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVtYmVyX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gMHg2ZDY1NmQ2MjY1NzI1ZjYzNmY3NTZlNzQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC5yZW1vdmVfbWVtYmVyW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVtb3ZlX21lbWJlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY29tbWl0dGVlX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19jb21taXR0ZWVfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjEzCiAgICAvLyBhc3NlcnQgYWRkcmVzcy5uYXRpdmUgaW4gc2VsZi5tZW1iZXJzLCBlcnIuVk9URVJfTk9UX0ZPVU5ECiAgICBieXRlY18xIC8vIDB4NGQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWb3RlciBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gZGVsIHNlbGYubWVtYmVyc1thZGRyZXNzLm5hdGl2ZV0KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjE2CiAgICAvLyBzZWxmLm1lbWJlcl9jb3VudC52YWx1ZSAtPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDZkNjU2ZDYyNjU3MjVmNjM2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1lbWJlcl9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlY18wIC8vIDB4NmQ2NTZkNjI2NTcyNWY2MzZmNzU2ZTc0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTk5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb3VuY2lsLmNvbnRyYWN0LkNvdW5jaWwudm90ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyNjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjgyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBpbiBzZWxmLm1lbWJlcnMsIGVyci5WT1RFUl9OT1RfRk9VTkQKICAgIGJ5dGVjXzEgLy8gMHg0ZAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBWb3RlciBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gc2VsZi5yZWdpc3Rlcl92b3RlKHByb3Bvc2FsX2lkLCBibG9jaywgc2VsZi5nZXRfbWVtYmVyX29yZGluYWwoVHhuLnNlbmRlcikpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIGdldF9tZW1iZXJfb3JkaW5hbAogICAgY2FsbHN1YiByZWdpc3Rlcl92b3RlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyNjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC52b3RlX21hbnlbcm91dGluZ10oKSAtPiB2b2lkOgp2b3RlX21hbnk6CiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6Mjg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMyAvLyA5CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuQ291bmNpbFByb3Bvc2FsVm90ZT4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjMwNQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgaW4gc2VsZi5tZW1iZXJzLCBlcnIuVk9URVJfTk9UX0ZPVU5ECiAgICBieXRlY18xIC8vIDB4NGQKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVm90ZXIgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMDYKICAgIC8vIGFzc2VydCB2b3Rlcy5sZW5ndGgsIGVyci5FTVBUWV9QQVlMT0FECiAgICBhc3NlcnQgLy8gRW1wdHkgcGF5bG9hZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzA3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMSwgdm90ZXMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCgp2b3RlX21hbnlfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzA3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMSwgdm90ZXMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHZvdGVfbWFueV9hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzA4CiAgICAvLyBmb3IgaiBpbiB1cmFuZ2UoaSk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA1Cgp2b3RlX21hbnlfZm9yX2hlYWRlckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzA4CiAgICAvLyBmb3IgaiBpbiB1cmFuZ2UoaSk6CiAgICBkaWcgNAogICAgZGlnIDEKICAgIDwKICAgIGJ6IHZvdGVfbWFueV9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzEwCiAgICAvLyB2b3Rlc1tpXS5wcm9wb3NhbF9pZCAhPSB2b3Rlc1tqXS5wcm9wb3NhbF9pZAogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDkKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gOQogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyA2CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGludGNfMyAvLyA5CiAgICAqCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGludGNfMyAvLyA5CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjMwOS0zMTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdm90ZXNbaV0ucHJvcG9zYWxfaWQgIT0gdm90ZXNbal0ucHJvcG9zYWxfaWQKICAgIC8vICksIGVyci5EVVBMSUNBVEVfUFJPUE9TQUwKICAgIGFzc2VydCAvLyBEdXBsaWNhdGUgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjMwOAogICAgLy8gZm9yIGogaW4gdXJhbmdlKGkpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgNQogICAgYiB2b3RlX21hbnlfZm9yX2hlYWRlckA0Cgp2b3RlX21hbnlfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMDcKICAgIC8vIGZvciBpIGluIHVyYW5nZSgxLCB2b3Rlcy5sZW5ndGgpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHZvdGVfbWFueV9mb3JfaGVhZGVyQDIKCnZvdGVfbWFueV9hZnRlcl9mb3JAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjMxMwogICAgLy8gb3JkaW5hbCA9IHNlbGYuZ2V0X21lbWJlcl9vcmRpbmFsKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIGdldF9tZW1iZXJfb3JkaW5hbAogICAgYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTQKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3Rlcy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMQoKdm90ZV9tYW55X2Zvcl9oZWFkZXJAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTQKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3Rlcy5sZW5ndGgpOgogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgYnogdm90ZV9tYW55X2FmdGVyX2ZvckAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzE1LTMxNgogICAgLy8gdm90ZSA9IHZvdGVzW2ldLmNvcHkoKQogICAgLy8gc2VsZi5yZWdpc3Rlcl92b3RlKHZvdGUucHJvcG9zYWxfaWQsIHZvdGUuYmxvY2ssIG9yZGluYWwpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyA5CiAgICAqCiAgICBpbnRjXzMgLy8gOQogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTYKICAgIC8vIHNlbGYucmVnaXN0ZXJfdm90ZSh2b3RlLnByb3Bvc2FsX2lkLCB2b3RlLmJsb2NrLCBvcmRpbmFsKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTUtMzE2CiAgICAvLyB2b3RlID0gdm90ZXNbaV0uY29weSgpCiAgICAvLyBzZWxmLnJlZ2lzdGVyX3ZvdGUodm90ZS5wcm9wb3NhbF9pZCwgdm90ZS5ibG9jaywgb3JkaW5hbCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTYKICAgIC8vIHNlbGYucmVnaXN0ZXJfdm90ZSh2b3RlLnByb3Bvc2FsX2lkLCB2b3RlLmJsb2NrLCBvcmRpbmFsKQogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjMxNS0zMTYKICAgIC8vIHZvdGUgPSB2b3Rlc1tpXS5jb3B5KCkKICAgIC8vIHNlbGYucmVnaXN0ZXJfdm90ZSh2b3RlLnByb3Bvc2FsX2lkLCB2b3RlLmJsb2NrLCBvcmRpbmFsKQogICAgc3dhcAogICAgcHVzaGludCA2NAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTozMTYKICAgIC8vIHNlbGYucmVnaXN0ZXJfdm90ZSh2b3RlLnByb3Bvc2FsX2lkLCB2b3RlLmJsb2NrLCBvcmRpbmFsKQogICAgZGlnIDYKICAgIGNhbGxzdWIgcmVnaXN0ZXJfdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MzE0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgdm90ZV9tYW55X2Zvcl9oZWFkZXJAMTAKCnZvdGVfbWFueV9hZnRlcl9mb3JAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyODYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoZ2xvYmFsX3N0YXRlX2tleTogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo4OAogICAgLy8gZGVmIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhzZWxmLCBnbG9iYWxfc3RhdGVfa2V5OiBCeXRlcykgLT4gQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwgZ2xvYmFsX3N0YXRlX2tleQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weTo4OS05MQogICAgLy8gdmFsdWUsIGV4aXN0cyA9IEFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUsIGdsb2JhbF9zdGF0ZV9rZXkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuTUlTU0lOR19DT05GSUcKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6OTMKICAgIC8vIHJldHVybiB2YWx1ZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC5pc19jb21taXR0ZWVfbWFuYWdlcigpIC0+IHVpbnQ2NDoKaXNfY29tbWl0dGVlX21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMDEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMDIKICAgIC8vIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9NQU5BR0VSKSkKICAgIHB1c2hieXRlcyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2MTZlNjE2NzY1NzIKICAgIGNhbGxzdWIgZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMDEtMTAzCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBBY2NvdW50KAogICAgLy8gICAgIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9NQU5BR0VSKSkKICAgIC8vICkKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICA9PQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC50YWtlX21lbWJlcl9vcmRpbmFsKG1lbWJlcjogYnl0ZXMpIC0+IHVpbnQ2NDoKdGFrZV9tZW1iZXJfb3JkaW5hbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gZGVmIHRha2VfbWVtYmVyX29yZGluYWwoc2VsZiwgbWVtYmVyOiBBY2NvdW50KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEwNgogICAgLy8gaWYgbWVtYmVyIG5vdCBpbiBzZWxmLm1lbWJlcl9vcmRpbmFsczoKICAgIHB1c2hieXRlcyAweDRmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiB0YWtlX21lbWJlcl9vcmRpbmFsX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTA3CiAgICAvLyBvcmRpbmFsID0gc2VsZi5uZXh0X21lbWJlcl9vcmRpbmFsLmdldChkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGJ5dGVjXzMgLy8gMHg0ZQogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMDgKICAgIC8vIHNlbGYubmV4dF9tZW1iZXJfb3JkaW5hbC52YWx1ZSA9IG9yZGluYWwgKyAxCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBieXRlY18zIC8vIDB4NGUKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gc2VsZi5tZW1iZXJfb3JkaW5hbHNbbWVtYmVyXSA9IG9yZGluYWwKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBib3hfcHV0Cgp0YWtlX21lbWJlcl9vcmRpbmFsX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjExMAogICAgLy8gcmV0dXJuIHNlbGYubWVtYmVyX29yZGluYWxzW21lbWJlcl0KICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tZW1iZXJfb3JkaW5hbHMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY291bmNpbC5jb250cmFjdC5Db3VuY2lsLmdldF9tZW1iZXJfb3JkaW5hbChtZW1iZXI6IGJ5dGVzKSAtPiB1aW50NjQ6CmdldF9tZW1iZXJfb3JkaW5hbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjExMgogICAgLy8gZGVmIGdldF9tZW1iZXJfb3JkaW5hbChzZWxmLCBtZW1iZXI6IEFjY291bnQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTEzLTExNAogICAgLy8gIyBNZW1iZXJzIGFkZGVkIGJlZm9yZSB0aGUgb3JkaW5hbHMgZ2V0IG9uZSBvbiB0aGVpciBmaXJzdCB2b3RlCiAgICAvLyBpZiBzZWxmLm1lbWJlcnMubGVuZ3RoKG1lbWJlcikgPT0gMDoKICAgIGJ5dGVjXzEgLy8gMHg0ZAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWVtYmVycyBlbnRyeSBleGlzdHMKICAgIGJueiBnZXRfbWVtYmVyX29yZGluYWxfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMTUKICAgIC8vIHNlbGYubWVtYmVycy5ib3gobWVtYmVyKS5yZXNpemUoc2l6ZV9vZihVSW50NjQpKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGJveF9yZXNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjExNgogICAgLy8gc2VsZi5tZW1iZXJzW21lbWJlcl0gPSBzZWxmLnRha2VfbWVtYmVyX29yZGluYWwobWVtYmVyKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHRha2VfbWVtYmVyX29yZGluYWwKICAgIGl0b2IKICAgIGJveF9wdXQKCmdldF9tZW1iZXJfb3JkaW5hbF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMTcKICAgIC8vIHJldHVybiBzZWxmLm1lbWJlcnNbbWVtYmVyXQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1lbWJlcnMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY291bmNpbC5jb250cmFjdC5Db3VuY2lsLnNldF92b3RlZChwcm9wb3NhbF9pZDogdWludDY0LCBvcmRpbmFsOiB1aW50NjQpIC0+IHZvaWQ6CnNldF92b3RlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjExOQogICAgLy8gZGVmIHNldF92b3RlZChzZWxmLCBwcm9wb3NhbF9pZDogVUludDY0LCBvcmRpbmFsOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEyMAogICAgLy8gdm90ZWRfYml0bWFwID0gc2VsZi52b3RlZF9iaXRtYXAuYm94KHByb3Bvc2FsX2lkKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjEKICAgIC8vIGJ5dGVfaW5kZXggPSBvcmRpbmFsIC8vIDgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjIKICAgIC8vIGlmIHZvdGVkX2JpdG1hcC5sZW5ndGggPD0gYnl0ZV9pbmRleDoKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBCb3ggZXhpc3RzCiAgICA+PQogICAgYnogc2V0X3ZvdGVkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTIzLTEyNAogICAgLy8gIyBNZW1iZXJzIGFkZGVkIGFmdGVyIHRoZSBmaXJzdCB2b3RlIG9mIHRoZSBQcm9wb3NhbAogICAgLy8gdm90ZWRfYml0bWFwLnJlc2l6ZShieXRlX2luZGV4ICsgMSkKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGJveF9yZXNpemUKCnNldF92b3RlZF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjYKICAgIC8vIHZvdGVkX2J5dGUgPSB2b3RlZF9iaXRtYXAuZXh0cmFjdChieXRlX2luZGV4LCAxKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjcKICAgIC8vIGJpdF9pbmRleCA9IG9yZGluYWwgJSA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyA4CiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMjgKICAgIC8vIGFzc2VydCBub3Qgb3AuZ2V0Yml0KHZvdGVkX2J5dGUsIGJpdF9pbmRleCksIGVyci5WT1RFUl9BTFJFQURZX1ZPVEVECiAgICBkdXAyCiAgICBnZXRiaXQKICAgICEKICAgIGFzc2VydCAvLyBWb3RlciBhbHJlYWR5IHZvdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMzAKICAgIC8vIGJ5dGVfaW5kZXgsIG9wLnNldGJpdF9ieXRlcyh2b3RlZF9ieXRlLCBiaXRfaW5kZXgsIFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTI5LTEzMQogICAgLy8gdm90ZWRfYml0bWFwLnJlcGxhY2UoCiAgICAvLyAgICAgYnl0ZV9pbmRleCwgb3Auc2V0Yml0X2J5dGVzKHZvdGVkX2J5dGUsIGJpdF9pbmRleCwgVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICAvLyApCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvdW5jaWwuY29udHJhY3QuQ291bmNpbC5yZWdpc3Rlcl92b3RlKHByb3Bvc2FsX2lkOiB1aW50NjQsIGJsb2NrOiB1aW50NjQsIG9yZGluYWw6IHVpbnQ2NCkgLT4gdm9pZDoKcmVnaXN0ZXJfdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIyNS0yMjcKICAgIC8vIGRlZiByZWdpc3Rlcl92b3RlKAogICAgLy8gICAgIHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQsIGJsb2NrOiBib29sLCBvcmRpbmFsOiBVSW50NjQgICMgbm9xYTogRkJUMDAxCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIHB1c2hieXRlcyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMjgKICAgIC8vIGlmIHByb3Bvc2FsX2lkIG5vdCBpbiBzZWxmLnRhbGxpZXM6CiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGR1cAogICAgcHVzaGJ5dGVzIDB4NTQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiByZWdpc3Rlcl92b3RlX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjIxCiAgICAvLyBBcHBsaWNhdGlvbihwcm9wb3NhbF9pZCkuY3JlYXRvcgogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMjIKICAgIC8vID09IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKS5hZGRyZXNzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCBleGlzdHMKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIyMS0yMjIKICAgIC8vIEFwcGxpY2F0aW9uKHByb3Bvc2FsX2lkKS5jcmVhdG9yCiAgICAvLyA9PSBBcHBsaWNhdGlvbihzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSkuYWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIyOQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIzMS0yMzMKICAgIC8vIHN0YXR1cywgZXhpc3RzID0gQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgcHJvcG9zYWxfaWQsIEJ5dGVzKHByb3Bvc2FsX2NmZy5HU19LRVlfU1RBVFVTKQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyMzIKICAgIC8vIHByb3Bvc2FsX2lkLCBCeXRlcyhwcm9wb3NhbF9jZmcuR1NfS0VZX1NUQVRVUykKICAgIHB1c2hieXRlcyAweDczNzQ2MTc0NzU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjMxLTIzMwogICAgLy8gc3RhdHVzLCBleGlzdHMgPSBBcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBwcm9wb3NhbF9pZCwgQnl0ZXMocHJvcG9zYWxfY2ZnLkdTX0tFWV9TVEFUVVMpCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjM1CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIzNgogICAgLy8gYXNzZXJ0IHN0YXR1cyA9PSBwcm9wb3NhbF9lbm0uU1RBVFVTX0FQUFJPVkVELCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTCiAgICBwdXNoaW50IDMwCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjIzOC0yNDEKICAgIC8vIHNlbGYudGFsbGllc1twcm9wb3NhbF9pZF0gPSB0eXAuQ291bmNpbFRhbGx5KAogICAgLy8gICAgIGFwcHJvdmFscz1VSW50NjQoMCksCiAgICAvLyAgICAgcmVqZWN0aW9ucz1VSW50NjQoMCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgOAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gc2VsZi52b3RlZF9iaXRtYXAuYm94KHByb3Bvc2FsX2lkKS5jcmVhdGUoCiAgICBieXRlYyA0IC8vIDB4NDIKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjQzCiAgICAvLyBzaXplPShzZWxmLm5leHRfbWVtYmVyX29yZGluYWwudmFsdWUgKyA3KSAvLyA4CiAgICBieXRlY18zIC8vIDB4NGUKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5leHRfbWVtYmVyX29yZGluYWwgZXhpc3RzCiAgICBidG9pCiAgICBwdXNoaW50IDcKICAgICsKICAgIGludGNfMiAvLyA4CiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyNDItMjQ0CiAgICAvLyBzZWxmLnZvdGVkX2JpdG1hcC5ib3gocHJvcG9zYWxfaWQpLmNyZWF0ZSgKICAgIC8vICAgICBzaXplPShzZWxmLm5leHRfbWVtYmVyX29yZGluYWwudmFsdWUgKyA3KSAvLyA4CiAgICAvLyApCiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gaWYgcHJvcG9zYWxfaWQgaW4gc2VsZi5sZWdhY3lfdm90ZXM6CiAgICBwdXNoYnl0ZXMgMHg1NgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiByZWdpc3Rlcl92b3RlX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTM0LTEzNwogICAgLy8gIyBSZXZpZXdzIGluIGZsaWdodCBkdXJpbmcgdGhlIHVwZGF0ZSB0byB0aGUgdGFsbGllcyBrZWVwIHRoZWlyIHZvdGVzLAogICAgLy8gIyBhbmQgdGhlIGxlZ2FjeSBib3ggTUJSIGlzIGZyZWVkCiAgICAvLyBsZWdhY3lfdm90ZXMgPSBzZWxmLmxlZ2FjeV92b3Rlc1twcm9wb3NhbF9pZF0uY29weSgpCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobGVnYWN5X3ZvdGVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgMgogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTM3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobGVnYWN5X3ZvdGVzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA2CgpyZWdpc3Rlcl92b3RlX2Zvcl9oZWFkZXJAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMzcKICAgIC8vIGZvciBpIGluIHVyYW5nZShsZWdhY3lfdm90ZXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA2CiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogcmVnaXN0ZXJfdm90ZV9hZnRlcl9mb3JAMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjEzOC0xMzkKICAgIC8vIGxlZ2FjeV92b3RlID0gbGVnYWN5X3ZvdGVzW2ldLmNvcHkoKQogICAgLy8gaWYgbGVnYWN5X3ZvdGUuYmxvY2s6CiAgICBmcmFtZV9kaWcgNgogICAgcHVzaGludCAzMwogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIHB1c2hpbnQgMzMKICAgIGJveF9leHRyYWN0IC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICBwdXNoaW50IDI1NgogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxMzkKICAgIC8vIGlmIGxlZ2FjeV92b3RlLmJsb2NrOgogICAgYnogcmVnaXN0ZXJfdm90ZV9lbHNlX2JvZHlAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gc2VsZi50YWxsaWVzW3Byb3Bvc2FsX2lkXS5yZWplY3Rpb25zICs9IDEKICAgIGZyYW1lX2RpZyA4CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRhbGxpZXMgZW50cnkgZXhpc3RzCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBpbnRjXzIgLy8gOAogICAgc3dhcAogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKCnJlZ2lzdGVyX3ZvdGVfYWZ0ZXJfaWZfZWxzZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE0NC0xNDUKICAgIC8vICMgUmVtb3ZlZCBtZW1iZXJzIGNhbiBubyBsb25nZXIgdm90ZQogICAgLy8gaWYgbGVnYWN5X3ZvdGUuYWRkcmVzcyBpbiBzZWxmLm1lbWJlcnM6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDQKICAgIHB1c2hpbnQgMzMKICAgIGJveF9leHRyYWN0IC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICBleHRyYWN0IDAgMzIKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBieXRlY18xIC8vIDB4NGQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiByZWdpc3Rlcl92b3RlX2FmdGVyX2lmX2Vsc2VAMTkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gcHJvcG9zYWxfaWQsIHNlbGYuZ2V0X21lbWJlcl9vcmRpbmFsKGxlZ2FjeV92b3RlLmFkZHJlc3MpCiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBnZXRfbWVtYmVyX29yZGluYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjE0Ni0xNDgKICAgIC8vIHNlbGYuc2V0X3ZvdGVkKAogICAgLy8gICAgIHByb3Bvc2FsX2lkLCBzZWxmLmdldF9tZW1iZXJfb3JkaW5hbChsZWdhY3lfdm90ZS5hZGRyZXNzKQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjYWxsc3ViIHNldF92b3RlZAoKcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTM3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobGVnYWN5X3ZvdGVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgYiByZWdpc3Rlcl92b3RlX2Zvcl9oZWFkZXJAMTMKCnJlZ2lzdGVyX3ZvdGVfZWxzZV9ib2R5QDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MTQyCiAgICAvLyBzZWxmLnRhbGxpZXNbcHJvcG9zYWxfaWRdLmFwcHJvdmFscyArPSAxCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50YWxsaWVzIGVudHJ5IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICBiIHJlZ2lzdGVyX3ZvdGVfYWZ0ZXJfaWZfZWxzZUAxNwoKcmVnaXN0ZXJfdm90ZV9hZnRlcl9mb3JAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToxNTAKICAgIC8vIGRlbCBzZWxmLmxlZ2FjeV92b3Rlc1twcm9wb3NhbF9pZF0KICAgIGZyYW1lX2RpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKCnJlZ2lzdGVyX3ZvdGVfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjQ4CiAgICAvLyBzZWxmLnNldF92b3RlZChwcm9wb3NhbF9pZCwgb3JkaW5hbCkKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHNldF92b3RlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjUwCiAgICAvLyBpZiBibG9jazoKICAgIGZyYW1lX2RpZyAtMgogICAgYnogcmVnaXN0ZXJfdm90ZV9lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjUxCiAgICAvLyBzZWxmLnRhbGxpZXNbcHJvcG9zYWxfaWRdLnJlamVjdGlvbnMgKz0gMQogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGFsbGllcyBlbnRyeSBleGlzdHMKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGludGNfMiAvLyA4CiAgICBzd2FwCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwoKcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyNTUKICAgIC8vIGhhbGZfcGx1c19vbmUgPSAoc2VsZi5tZW1iZXJfY291bnQudmFsdWUgLy8gMikgKyAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDZkNjU2ZDYyNjU3MjVmNjM2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1lbWJlcl9jb3VudCBleGlzdHMKICAgIHB1c2hpbnQgMgogICAgLwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyNTYKICAgIC8vIHRhbGx5ID0gc2VsZi50YWxsaWVzW3Byb3Bvc2FsX2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyA4CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGFsbGllcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gaWYgdGFsbHkuYXBwcm92YWxzID49IGhhbGZfcGx1c19vbmUgb3IgdGFsbHkucmVqZWN0aW9ucyA+PSBoYWxmX3BsdXNfb25lOgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICA8PQogICAgYm56IHJlZ2lzdGVyX3ZvdGVfaWZfYm9keUA5CiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgNQogICAgPj0KICAgIGJ6IHJlZ2lzdGVyX3ZvdGVfYWZ0ZXJfaWZfZWxzZUAxMQoKcmVnaXN0ZXJfdm90ZV9pZl9ib2R5QDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY291bmNpbC9jb250cmFjdC5weToyNTgtMjU5CiAgICAvLyAjIHRoaXMgd2lsbCBhbGxvdyB0aGUgcHJvcG9zYWwgdG8gYmUgcmV2aWV3ZWQKICAgIC8vIGJsb2NrID0gdGFsbHkucmVqZWN0aW9ucyA+PSBoYWxmX3BsdXNfb25lCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgNQogICAgPj0KICAgIGZyYW1lX2J1cnkgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb3VuY2lsL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gYXJjNC5hYmlfY2FsbChwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5yZXZpZXcsIGJsb2NrLCBhcHBfaWQ9cHJvcG9zYWxfaWQpCiAgICBpdHhuX2JlZ2luCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2RpZyAtMgogICAgc2V0Yml0CiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGJ5dGVzIDB4MjEyZDlmMDcgLy8gbWV0aG9kICJyZXZpZXcoYm9vbCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjYzCiAgICAvLyBkZWwgc2VsZi50YWxsaWVzW3Byb3Bvc2FsX2lkXQogICAgZnJhbWVfZGlnIDgKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjY0CiAgICAvLyBkZWwgc2VsZi52b3RlZF9iaXRtYXBbcHJvcG9zYWxfaWRdCiAgICBieXRlYyA0IC8vIDB4NDIKICAgIGZyYW1lX2RpZyA3CiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAoKcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDExOgogICAgcmV0c3ViCgpyZWdpc3Rlcl92b3RlX2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvdW5jaWwvY29udHJhY3QucHk6MjUzCiAgICAvLyBzZWxmLnRhbGxpZXNbcHJvcG9zYWxfaWRdLmFwcHJvdmFscyArPSAxCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50YWxsaWVzIGVudHJ5IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICBiIHJlZ2lzdGVyX3ZvdGVfYWZ0ZXJfaWZfZWxzZUA3Cg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [209, 517], "errorMessage": "Address length is 32 bytes"}, {"pc": [408], "errorMessage": "Duplicate proposal"}, {"pc": [357], "errorMessage": "Empty payload"}, {"pc": [692, 704], "errorMessage": "Invalid proposal"}, {"pc": [176], "errorMessage": "Invalid registry ID"}, {"pc": [486], "errorMessage": "Missing Config"}, {"pc": [211, 226, 266], "errorMessage": "Unauthorized"}, {"pc": [236], "errorMessage": "Voter Already Assigned"}, {"pc": [645], "errorMessage": "Voter already voted"}, {"pc": [274, 314, 356], "errorMessage": "Voter not found"}, {"pc": [52], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [58], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [62], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [66], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [708], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [683, 690], "errorMessage": "application exists"}, {"pc": [615], "errorMessage": "check Box exists"}, {"pc": [246, 280, 910], "errorMessage": "check self.member_count exists"}, {"pc": [560], "errorMessage": "check self.member_ordinals entry exists"}, {"pc": [573, 592], "errorMessage": "check self.members entry exists"}, {"pc": [740], "errorMessage": "check self.next_member_ordinal exists"}, {"pc": [482, 687], "errorMessage": "check self.registry_app_id exists"}, {"pc": [811, 866, 898, 928, 1000], "errorMessage": "check self.tallies entry exists"}, {"pc": [390, 404, 454], "errorMessage": "index access is out of bounds"}, {"pc": [799, 819, 826, 874, 906, 1008], "errorMessage": "index out of bounds"}, {"pc": [334], "errorMessage": "invalid array length header"}, {"pc": [304], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [348], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.CouncilProposalVote>"}, {"pc": [222, 262], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [173, 295], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,13 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class CouncilTally:
+    """Struct for CouncilTally"""
+    approvals: int
+    rejections: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class AddMemberArgs:
     """Dataclass for add_member arguments"""
@@ -92,6 +99,15 @@ class VoteArgs:
     def abi_method_signature(self) -> str:
         return "vote(uint64,bool)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteManyArgs:
+    """Dataclass for vote_many arguments"""
+    votes: list[tuple[int, bool]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_many((uint64,bool)[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateArgs:
     """Dataclass for create arguments"""
@@ -167,6 +183,19 @@ class CouncilParams:
             "args": method_args,
         }))
 
+    def vote_many(
+        self,
+        args: tuple[list[tuple[int, bool]]] | VoteManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_many((uint64,bool)[])void",
+            "args": method_args,
+        }))
+
     def op_up(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -267,6 +296,19 @@ class CouncilCreateTransactionParams:
             "args": method_args,
         }))
 
+    def vote_many(
+        self,
+        args: tuple[list[tuple[int, bool]]] | VoteManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_many((uint64,bool)[])void",
+            "args": method_args,
+        }))
+
     def op_up(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -379,6 +421,22 @@ class CouncilSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def vote_many(
+        self,
+        args: tuple[list[tuple[int, bool]]] | VoteManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_many((uint64,bool)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def op_up(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -425,6 +483,10 @@ class GlobalStateValue(typing.TypedDict):
     registry_app_id: int
     member_count: int
 
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    next_member_ordinal: int
+
 class CouncilState:
     """Methods to access state for the current Council app"""
 
@@ -489,13 +551,15 @@ class _BoxState:
         self.app_client = app_client
         
         # Pre-generated mapping of value types to their struct classes
-        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "CouncilTally": CouncilTally
+        }
 
-    def get_all(self) -> dict[str, typing.Any]:
+    def get_all(self) -> BoxStateValue:
         """Get all current keyed values from box state"""
         result = self.app_client.state.box.get_all()
         if not result:
-            return {}
+            return typing.cast(BoxStateValue, {})
 
         converted = {}
         for key, value in result.items():
@@ -505,10 +569,18 @@ class _BoxState:
                 _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
                 else value
             )
-        return converted
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def next_member_ordinal(self) -> int:
+        """Get the current value of the next_member_ordinal key in box state"""
+        value = self.app_client.state.box.get_value("next_member_ordinal")
+        if isinstance(value, dict) and "uint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
+        return typing.cast(int, value)
 
     @property
-    def members(self) -> "_MapState[str, bytes]":
+    def members(self) -> "_MapState[str, int]":
         """Get values from the members map in box state"""
         return _MapState(
             self.app_client.state.box,
@@ -517,11 +589,38 @@ class _BoxState:
         )
 
     @property
-    def votes(self) -> "_MapState[int, list[tuple[str, bool]]]":
-        """Get values from the votes map in box state"""
+    def member_ordinals(self) -> "_MapState[str, int]":
+        """Get values from the member_ordinals map in box state"""
         return _MapState(
             self.app_client.state.box,
-            "votes",
+            "member_ordinals",
+            None
+        )
+
+    @property
+    def tallies(self) -> "_MapState[int, CouncilTally]":
+        """Get values from the tallies map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "tallies",
+            self._struct_classes.get("CouncilTally")
+        )
+
+    @property
+    def voted_bitmap(self) -> "_MapState[int, bytes]":
+        """Get values from the voted_bitmap map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "voted_bitmap",
+            None
+        )
+
+    @property
+    def legacy_votes(self) -> "_MapState[int, list[tuple[str, bool]]]":
+        """Get values from the legacy_votes map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "legacy_votes",
             None
         )
 
@@ -722,6 +821,12 @@ class CouncilClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_many((uint64,bool)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["op_up()void"],
@@ -1015,6 +1120,26 @@ class CouncilFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def vote_many(
+        self,
+        args: tuple[list[tuple[int, bool]]] | VoteManyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_many((uint64,bool)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_many((uint64,bool)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def op_up(
         self,
         *,
@@ -1296,6 +1421,25 @@ class CouncilComposer:
         )
         return self
 
+    def vote_many(
+        self,
+        args: tuple[list[tuple[int, bool]]] | VoteManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "CouncilComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_many(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_many((uint64,bool)[])void", v
+            )
+        )
+        return self
+
     def op_up(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -90,7 +90,8 @@ class Proposal(algopy.arc4.ARC4Client, typing.Protocol):
         self,
     ) -> None:
         """
-        submit the proposal.
+        submit the proposal. If the Committee has a Merkle root, the voting opens
+        right away, otherwise once the xGov Daemon has assigned the voters.
         """
 
     @algopy.arc4.abimethod
@@ -102,6 +103,16 @@ class Proposal(algopy.arc4.ARC4Client, typing.Protocol):
         Assign multiple voters to the proposal.
         """
 
+    @algopy.arc4.abimethod
+    def assign_voters_to_buckets(
+        self,
+        voters: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]]],
+    ) -> None:
+        """
+        Assign multiple voters to the proposal, packed in bucket boxes.
+        Voters are stored in `ceil(committee_members / VOTER_BUCKET_MEMBERS)` bucket boxes of sorted (address, votes) records, a bucket covering a range of the address 2-byte prefix. Voters of a bucket must be assigned by ascending address, up to `VOTER_BUCKET_MAX_MEMBERS` so that a bucket stays within the box I/O budget of two box references. A proposal uses either voter boxes or voter buckets.
+        """
+
     @algopy.arc4.abimethod
     def vote(
         self,
@@ -113,6 +124,30 @@ class Proposal(algopy.arc4.ARC4Client, typing.Protocol):
         Vote on the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.
         """
 
+    @algopy.arc4.abimethod
+    def vote_batch(
+        self,
+        votes: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]],
+    ) -> algopy.arc4.String:
+        """
+        Vote on the proposal for several voters. MUST BE CALLED BY THE REGISTRY CONTRACT.
+        """
+
+    @algopy.arc4.abimethod
+    def vote_with_proof(
+        self,
+        voter: algopy.arc4.Address,
+        voting_power: algopy.arc4.UIntN[typing.Literal[64]],
+        ordinal: algopy.arc4.UIntN[typing.Literal[64]],
+        proof: algopy.arc4.DynamicArray[algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]]],
+        approvals: algopy.arc4.UIntN[typing.Literal[64]],
+        rejections: algopy.arc4.UIntN[typing.Literal[64]],
+    ) -> algopy.arc4.String:
+        """
+        Vote on the proposal as a member of a committee declared with a Merkle root.
+        MUST BE CALLED BY THE REGISTRY CONTRACT.
+        """
+
     @algopy.arc4.abimethod
     def scrutiny(
         self,
@@ -130,6 +165,19 @@ class Proposal(algopy.arc4.ARC4Client, typing.Protocol):
         Unassign absentees from the scrutinized proposal.
         """
 
+    @algopy.arc4.abimethod
+    def unassign_absentee_with_proof(
+        self,
+        absentee: algopy.arc4.Address,
+        voting_power: algopy.arc4.UIntN[typing.Literal[64]],
+        ordinal: algopy.arc4.UIntN[typing.Literal[64]],
+        proof: algopy.arc4.DynamicArray[algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]]],
+    ) -> algopy.arc4.String:
+        """
+        Unassign an absentee of a committee declared with a Merkle root from the
+        scrutinized proposal. Its ordinal is marked in the voted bitmap, so it is unassigned once.
+        """
+
     @algopy.arc4.abimethod
     def review(
         self,
@@ -181,6 +229,14 @@ class Proposal(algopy.arc4.ARC4Client, typing.Protocol):
         Get the proposal state.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_state_version(
+        self,
+    ) -> algopy.arc4.UIntN[typing.Literal[64]]:
+        """
+        Get the proposal state version, incremented by every mutating method.
+        """
+
     @algopy.arc4.abimethod(readonly=True)
     def get_voter_box(
         self,
@@ -190,6 +246,16 @@ class Proposal(algopy.arc4.ARC4Client, typing.Protocol):
         Returns the Voter box for the given address.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_voted_bitmap_page(
+        self,
+        page: algopy.arc4.UIntN[typing.Literal[64]],
+    ) -> algopy.arc4.Tuple[algopy.arc4.DynamicBytes, algopy.arc4.Bool]:
+        """
+        Returns a page of the voted bitmap, where the bit of a Committee member
+        ordinal is set once the member has voted.
+        """
+
     @algopy.arc4.abimethod(readonly=True)
     def get_voting_state(
         self,
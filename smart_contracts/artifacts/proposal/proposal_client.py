@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "address", "desc": "Address of the proposer", "name": "proposer"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Commitment payment transaction from the proposer to the contract", "name": "payment"}, {"type": "string", "desc": "Proposal title, max TITLE_MAX_BYTES bytes", "name": "title"}, {"type": "uint64", "desc": "Funding type (Proactive / Retroactive)", "name": "funding_type"}, {"type": "uint64", "desc": "Requested amount in microAlgos", "name": "requested_amount"}, {"type": "uint8", "desc": "Proposal focus area", "name": "focus"}], "name": "open", "returns": {"type": "void"}, "desc": "Open the first draft of the proposal.", "events": [{"args": [{"type": "uint8", "name": "funding_type"}, {"type": "uint64", "name": "requested_amount"}, {"type": "uint8", "name": "category"}, {"type": "uint64", "name": "round"}], "name": "Opened", "desc": "The Proposal has been opened"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "desc": "Metadata payload", "name": "payload"}, {"type": "bool", "desc": "True if this is the first upload call in a group transaction", "name": "is_first_in_group"}], "name": "upload_metadata", "returns": {"type": "void"}, "desc": "Upload the proposal metadata.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "drop", "returns": {"type": "string"}, "desc": "Drop the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "submit", "returns": {"type": "void"}, "desc": "submit the proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "desc": "List of voter addresses with their voting power", "name": "voters"}], "name": "assign_voters", "returns": {"type": "void"}, "desc": "Assign multiple voters to the proposal.", "events": [{"args": [{"type": "uint64", "name": "vote_opening"}, {"type": "uint64", "name": "vote_closing"}, {"type": "uint32", "name": "quorum_voters"}, {"type": "uint32", "name": "weighted_quorum_votes"}, {"type": "uint64", "name": "round"}], "name": "Submitted", "desc": "The Proposal has been submitted for voting"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Voter address", "name": "voter"}, {"type": "uint64", "desc": "Number of approvals", "name": "approvals"}, {"type": "uint64", "desc": "Number of rejections", "name": "rejections"}], "name": "vote", "returns": {"type": "string"}, "desc": "Vote on the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "uint32", "name": "approvals"}, {"type": "uint32", "name": "rejections"}, {"type": "uint32", "name": "nulls"}, {"type": "bool", "name": "boycotted"}, {"type": "uint32", "name": "total_voters"}, {"type": "uint32", "name": "total_boycott"}, {"type": "uint32", "name": "total_approvals"}, {"type": "uint32", "name": "total_rejections"}, {"type": "uint32", "name": "total_nulls"}, {"type": "uint64", "name": "round"}], "name": "Vote", "desc": "A vote has been cast on the Proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "scrutiny", "returns": {"type": "void"}, "desc": "Scrutinize the proposal.", "events": [{"args": [{"type": "bool", "name": "approved"}, {"type": "bool", "name": "plebiscite"}, {"type": "uint64", "name": "round"}], "name": "Scrutiny", "desc": "The vote has been scrutinized"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "List of absentees to be unassigned", "name": "absentees"}], "name": "unassign_absentees", "returns": {"type": "string"}, "desc": "Unassign absentees from the scrutinized proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "bool", "desc": "Whether to block the proposal or not", "name": "block"}], "name": "review", "returns": {"type": "void"}, "desc": "Review the proposal.", "events": [{"args": [{"type": "bool", "name": "veto"}, {"type": "uint64", "name": "round"}], "name": "Review", "desc": "The xGov Council has reviewed the Proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "fund", "returns": {"type": "string"}, "desc": "Fund the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "List of voters to be unassigned", "name": "voters"}], "name": "unassign_voters", "returns": {"type": "void"}, "desc": "Unassign voters from the submitted proposal. This method is an admin method\nto rollback and fix wrong committee assignments.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "finalize", "returns": {"type": "string"}, "desc": "Finalize the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "desc": "Delete the proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state", "returns": {"type": "(address,uint64,string,uint64,uint64,uint64,uint64,bool,uint64,uint8,uint64,uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64,uint64)", "desc": "The proposal state", "struct": "ProposalTypedGlobalState"}, "desc": "Get the proposal state.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}], "name": "get_voter_box", "returns": {"type": "(uint64,bool)", "desc": "The voter's votes bool: `True` if voter's box exists, else `False`"}, "desc": "Returns the Voter box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voting_state", "returns": {"type": "(uint32,uint32,uint32,uint32,uint32,uint32,uint32,bool,bool,bool,bool)", "desc": "quorum_voters (UInt32): The number of voters to reach the quorum weighted_quorum_votes (UInt32): The number of voters to reach the weighted quorum total_voters (UInt32): The total number of voters so far total_boycott (UInt32): The total number of boycotters so far total_approvals (UInt32): The total number of approval votes so far total_rejections (UInt32): The total number of rejection votes so far total_nulls (UInt32): The total number of null votes so far quorum_reached (Bool): Whether the voters quorum has been reached or not weighted_quorum_reached (Bool): Whether the votes weighted quorum has been reached or not majority_approved (Bool): Whether the majority approved the proposal or not plebiscite (Bool): Whether all the Committee members voted or not", "struct": "VotingState"}, "desc": "Returns the voting state of the Proposal.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Proposal", "state": {"keys": {"box": {"metadata": {"key": "TQ==", "keyType": "AVMString", "valueType": "AVMBytes"}}, "global": {"proposer": {"key": "cHJvcG9zZXI=", "keyType": "AVMBytes", "valueType": "address"}, "registry_app_id": {"key": "cmVnaXN0cnlfYXBwX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_id": {"key": "Y29tbWl0dGVlX2lk", "keyType": "AVMBytes", "valueType": "byte[32]"}, "committee_members": {"key": "Y29tbWl0dGVlX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_votes": {"key": "Y29tbWl0dGVlX3ZvdGVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_proposal_fee": {"key": "b3Blbl9wcm9wb3NhbF9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "daemon_ops_funding_bps": {"key": "ZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_ts": {"key": "b3Blbl90aW1lc3RhbXA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "submission_ts": {"key": "c3VibWlzc2lvbl90aW1lc3RhbXA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_open_ts": {"key": "dm90ZV9vcGVuaW5nX3RpbWVzdGFtcA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "finalized": {"key": "ZmluYWxpemVk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "metadata_uploaded": {"key": "bWV0YWRhdGFfdXBsb2FkZWQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "title": {"key": "dGl0bGU=", "keyType": "AVMBytes", "valueType": "AVMString"}, "funding_category": {"key": "ZnVuZGluZ19jYXRlZ29yeQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "focus": {"key": "Zm9jdXM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "funding_type": {"key": "ZnVuZGluZ190eXBl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "requested_amount": {"key": "cmVxdWVzdGVkX2Ftb3VudA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "locked_amount": {"key": "bG9ja2VkX2Ftb3VudA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbg==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration": {"key": "dm90aW5nX2R1cmF0aW9u", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_threshold": {"key": "cXVvcnVtX3RocmVzaG9sZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_threshold": {"key": "d2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "assigned_members": {"key": "YXNzaWduZWRfbWVtYmVycw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "assigned_votes": {"key": "YXNzaWduZWRfdm90ZXM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voted_members": {"key": "dm90ZWRfbWVtYmVycw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "boycotted_members": {"key": "Ym95Y290dGVkX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "approvals": {"key": "YXBwcm92YWxz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "rejections": {"key": "cmVqZWN0aW9ucw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "nulls": {"key": "bnVsbHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"voters": {"keyType": "address", "valueType": "uint64", "prefix": "Vg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 3, "ints": 27}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"ProposalTypedGlobalState": [{"name": "proposer", "type": "address"}, {"name": "registry_app_id", "type": "uint64"}, {"name": "title", "type": "string"}, {"name": "open_ts", "type": "uint64"}, {"name": "submission_ts", "type": "uint64"}, {"name": "vote_open_ts", "type": "uint64"}, {"name": "status", "type": "uint64"}, {"name": "finalized", "type": "bool"}, {"name": "funding_category", "type": "uint64"}, {"name": "focus", "type": "uint8"}, {"name": "funding_type", "type": "uint64"}, {"name": "requested_amount", "type": "uint64"}, {"name": "locked_amount", "type": "uint64"}, {"name": "committee_id", "type": "byte[32]"}, {"name": "committee_members", "type": "uint64"}, {"name": "committee_votes", "type": "uint64"}, {"name": "voted_members", "type": "uint64"}, {"name": "boycotted_members", "type": "uint64"}, {"name": "approvals", "type": "uint64"}, {"name": "rejections", "type": "uint64"}, {"name": "nulls", "type": "uint64"}], "VotingState": [{"name": "quorum_voters", "type": "uint32"}, {"name": "weighted_quorum_votes", "type": "uint32"}, {"name": "total_voters", "type": "uint32"}, {"name": "total_boycott", "type": "uint32"}, {"name": "total_approvals", "type": "uint32"}, {"name": "total_rejections", "type": "uint32"}, {"name": "total_nulls", "type": "uint32"}, {"name": "quorum_reached", "type": "bool"}, {"name": "weighted_quorum_reached", "type": "bool"}, {"name": "majority_approved", "type": "bool"}, {"name": "plebiscite", "type": "bool"}]}, "byteCode": {"approval": "CiAFAAEgCpBOJikGc3RhdHVzAAlmaW5hbGl6ZWQIcHJvcG9zZXIPcmVnaXN0cnlfYXBwX2lkEGFzc2lnbmVkX21lbWJlcnMNdm90ZWRfbWVtYmVycwlhcHByb3ZhbHMKcmVqZWN0aW9ucwFNBBUffHURY29tbWl0dGVlX21lbWJlcnMQcmVxdWVzdGVkX2Ftb3VudBFib3ljb3R0ZWRfbWVtYmVycwVudWxscw9jb21taXR0ZWVfdm90ZXMQZnVuZGluZ19jYXRlZ29yeQ5hc3NpZ25lZF92b3RlcwFWAQANbG9ja2VkX2Ftb3VudBBxdW9ydW1fdGhyZXNob2xkGXdlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQmRVJSOldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQMY29tbWl0dGVlX2lkEW9wZW5fcHJvcG9zYWxfZmVlHGRhZW1vbl9vcGVyYXRpb25fZnVuZGluZ19icHMOb3Blbl90aW1lc3RhbXAWdm90ZV9vcGVuaW5nX3RpbWVzdGFtcAxmdW5kaW5nX3R5cGUPdm90aW5nX2R1cmF0aW9uD3BhdXNlZF9yZWdpc3RyeRRzdWJtaXNzaW9uX3RpbWVzdGFtcBFtZXRhZGF0YV91cGxvYWRlZAV0aXRsZQVmb2N1cxNkaXNjdXNzaW9uX2R1cmF0aW9uFG1pbl9yZXF1ZXN0ZWRfYW1vdW50Gm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlC3hnb3ZfZGFlbW9uE0VSUjpWb3RlciBub3QgZm91bmQxGEAAijE1gQMSRDE0gRsSRDE3FEQxNhREKzIDZycEImcnGClnJwsiZycPImcnGSJnJxoiZycbImcnICJnJxwiZygiZyoiZychImcnIilnJxAiZycjImcnHSJnJwwiZycUImcnJCJnJx4iZycVImcnFiJnJwUiZycRImcnBiJnJw0iZycHImcnCCJnJw4iZ4AEJDeNPDYaAI4BAJExGRREMRhBAHqCEATtrrnKBHFDmU8Ec3EyGgQ05hPKBA2asNcEGEGg0gRzTb7MBHb/THAEIS2fBwSKXkyABCrBmwUEgCBptAS2Seh0BCRhX5AENpxCugTb2D3ZNhoAjhAAXwOOA+QEKwRwBXAHUwfDCF4IyAj/CYcKaAtBC24AAQAjQ4AEzGlOqjYaAI4BAA0AMRmBBRIxGBBEQgosNhoBSRUkEkQyDUQrTGcnBDINZycYiAvkJxhMZycLiAvOJwtMZycPiAvFJw9MZycZiAu8JxlMZycaiAuzJxpMZyNDKUcCMRYjCUk4ECMSRDYaAUkiWYECCEsBFRJEVwIANhoCSRWBCBJEFzYaA0kVgQgSRBc2GgRJFSMSRCcfiAtuFESIC9BEIihlREAC3yIqZURAAtgjREsDSRWBew5EKRNESwIlEkAACEsCgRQSQQK4I0QnJYgLNycmiAsySwNJTgJPAw9ESwEPRIAXcHJvcG9zYWxfY29tbWl0bWVudF9icHOICwlLAQshBApLBkk4ACIrZUQSREk4BzIKEkQ4CElFCRJEJyJLBWeAGm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsiArGgBttYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW2ICqZFCQ5BAgglJxBMZycdSwNnJwxLAmdJFycjTGcnFEsGZyInEGVMSU4CRQpESUQiJwxlREQlEkEBi4AZZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbIgKUCckTGciJxBlTElOAkUKRCUSQQESgBV2b3RpbmdfZHVyYXRpb25fc21hbGyICiJFBiceSwZngAxxdW9ydW1fc21hbGyICgqADHF1b3J1bV9sYXJnZYgJ+UsBCScliAnxJyaICexLAQkiJwxlRE8CCU8CC0wKCCInC2VECyEECicVTGeAFXdlaWdodGVkX3F1b3J1bV9zbWFsbIgJtIAVd2VpZ2h0ZWRfcXVvcnVtX2xhcmdliAmaSwEJJyWICZInJogJjUsBCSInDGVETwIJTwILTAoIIicPZUQLIQQKJxZMZyglZycbMgdnIicdZUQWSZOBCA5EVwcBIicMZUQiJxBlRBZJk4EIDkRXBwEyBk8CFk8DTFBPAlBMFlCABEsVjZhMULAjQ0sHgRQSQQAggBZ2b3RpbmdfZHVyYXRpb25fbWVkaXVtiAkHRQZC/uKAFXZvdGluZ19kdXJhdGlvbl9sYXJnZYgI6EUGQv7DSweBFBJBACKAGmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtiAi8Qv5pgBlkaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdliAibQv5ISwFLBw5BAAWBFEL97IEeQv3nIkL9RSJC/SU2GgFJIlmBAghLARUSRFcCAEk2GgJJFSMSRCJTJx+ICF0URIgIpEwVSU4DRCchI2dBAA4nCbxIJwm8SCcJTL8jQycJvURJSwMIJwlM0ycJTE8Cu0L/6SKICKFEIihlRCUTQAAHIiplREEALCcXRQFJKRNBABBJSRUWVwYCTFAnCkxQsCNDIitlRIgIjCcJvEgqI2cpQv/fKUUBQv/SJx+IB9wURIgIIzIHIicbZUQJIickZUQPRCInIWVERCcniAfKSRUkEkQiJxllRCInGmVECyEECogILSiBFGcnIDIHZyNDKUk2GgFHAiJZSU4CgSgLgQIITBUSRIgH8kQiKGVEgRQSRDEWQADSMgRFAyNFBEsDSwMMQQANSwNJiAgNIwhFBEL/6yJFBEsDSwEMQQBFSwFXAgBLBElOAoEoC4EoWElXACBMJFsnEk8CUEm9RQEUREsBREsBFr8iJwVlRCMIJwVMZyInEWVECCcRTGcjCEUEQv+zIicFZUQiJwtlRBJBAFYiJxFlRCInD2VEEkQogRlnMgcnHEsBZyInHmVESwEIIicVZUQWSZMkDkRXBAQiJxZlRBZJkyQORFcEBDIGTwQWTwQWUE8DUE8CUEwWUIAE3OvhxUxQsCNDIogHTEL/QyJJKTYaAUkVJBJENhoCSRWBCBJEFzYaA0kVgQgSRBeIBvdEIihlRIEZE0EBiicXRQZLBSkTQQARSwVJFRZXBgJMUCcKTFCwI0MnEksDUElFBr1FAUABJScoRQZLBSkSQQEVSwS+RBdJRQUiJwZlRCMIJwZMZ0sCSwKIBklBAMMiJw1lRCMIJw1MZyIjSwRLBogHCEsGSRUjSwEPI0sCTwJNTFJJFSQSREsEFkmTJA5EVwQESwQWSZMkDkRXBARPBBZJkyQORFcEBCInBmVEFkmTJA5EVwQEIicNZUQWSZMkDkRXBAQiJwdlRBZJkyQORFcEBCInCGVEFkmTJA5EVwQEIicOZUQWSZMkDkRXBAQyBk8JTwlQTwhQTwdQJxMiTwlUUE8GUE8FUE8EUE8DUE8CUEwWUIAEqRCKGkxQsClC/vgiSwRLA0lOAglLA0lOAwlJTgNOBCInB2VECCcHTGciJwhlRAgnCExnIicOZUQIJw5MZ0L/FUsFQv6+SwS+RBdJRQVLAksCCAxBACRLA0sCSwKIBS9AABiAEUVSUjpWb3RlcyBpbnZhbGlkRQZC/qopRQZC/qSIBPxAACCAGUVSUjpWb3RpbmcgUGVyaW9kIEV4cGlyZWRFBkL+VClFBkL+TiknH4gEsxREIihlRIEZEkSIBMBBAAaIBOBBAFAjRIgFW0EAQogFakEAPIgFf0EANiNFAUlBACEogR5niAS7MgYnEyJLBFQjTwNUTBZQgASLeJUUTFCwI0MogShnIitlRIgE8EL/1SJFAUL/xyJC/60iRwIpNhoBRwIiWUlOAiQLgQIITBUSRIgErEQiKGVEgR4SQAAKIihlRIEoEkEAByIqZURBAF8nF0UFSwQpE0EAEUsESRUWVwYCTFAnCkxQsCNDIkUDSwJLAQxBADRLAVcCAEsDJAskWElFBycSTFBJRQW9RQFAAAUnKEL/xksDvkQXSwZMiATASwIjCEUDQv/EKUL/rilFBUL/nzYaAUkVIxJEIlNJMQCADHhnb3ZfY291bmNpbIgDnUkVJBJEEkQiKGVEgR4SRCInBWVEFERBACUogTxnIicEZURyCESIBAIyBicTIksDVEwWUIAErugXGUxQsCNDKIEtZyIrZUSIA+FC/9wiiAO9RCIoZUSBLRNBACInF0UBSSkTQQAQSUkVFlcGAkxQJwpMULAjQyiBMmcpQv/pKUUBQv/cIkkpRwI2GgFHAiJZSU4CJAuBAghMFRJEiANhRCIoZUSBFBJEMRZAAFgyBEUDI0UFSwRLAwxBAA1LBEmIA3wjCEUFQv/rIkUESwNLAQxBAC9LAVcCAEsEJAskWElFBycSTFBJRQi9RQFBAAtLBr5EF0sGTIgDlksDIwhFBEL/ySNDIogDNUL/vSKIAv5EIiplREAALiIoZURBAKkiKGVEJRNBAKAiKGVEgTITQQCWIihlRIE8E0EAjCIoZUSBKBNBAIInF0UBSSkTQQAQSUkVFlcGAkxQJwpMULAjQyInBWVEQQAzgC5FUlI6VGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsQv+2IihlRCUSQQAHIitlRIgCgCInBGVEcghEMgpzAEQyCnMBRAmIAlYqI2cpQv+JKUUBQv98iAIvRCIqZUREJwm8SCInBGVEcghEMgpzAESIAiwjQyIrZUQiJwRlRCInImVEIicbZUQiJyBlRCInHGVEIihlRCIqZUQiJxBlRCInI2VEFkmTgQgORFcHASInHWVEIicMZUQiJxRlRCInGGVEIicLZUQiJw9lRCInBmVEIicNZUQiJwdlRCInCGVEIicOZURPExZPFExQSxMVFlcGAk8UUEyAAgDEUE8TFlBPEhZQTxEWUE8QFlAnEyJPEVRQTw4WUE8NUE8MFlBPCxZQTwoWUE8JUE8IFlBPBxZQTwYWUE8FFlBPBBZQTwMWUE8CFlBMUCcKTFCwI0M2GgFJFSQSRCcSTFBJvUlPAkhBABRLAb5EFxYnEyJLA1RQJwpMULAjQyJC/+0iJxVlRBZJkyQORFcEBCInFmVEFkmTJA5EVwQEIicGZUQWSZMkDkRXBAQiJw1lRBZJkyQORFcEBCInB2VEFkmTJA5EVwQEIicIZUQWSZMkDkRXBAQiJw5lRBZJkyQORFcEBIgA/IgBDogBJogAcE8KTwpQTwlQTwhQTwdQTwZQTwVQJxMiTwZUI08FVIECTwRUgQNPA1RQJwpMULAjQ4oBASInBGVEi/9lRImKAQEiJwRlRIv/ZUSJMgciJxxlRAkiJx5lRA6JigMBi/6L/RJBAAqL/4v9EkEAAiOJIokiJwZlRCInC2VEEomIABhEIihlRCUSQQAKIiplREAAAyNEiSJC//oxACIrZUQSiTEAJyeI/5dJFSQSRBKJMg0iJwRlRBKJigIAsYv/sgiL/rIHI7IQIrIBs4mKAQAiJxRlRIv/TIj/3icUImeJigEAi/84GDIIEkSL/zkaADYaABJEiSInFWVEIicGZUQiJw1lRAlLAQ8QiSInFmVEIicHZUQiJwhlRAgiJw5lRAhLAQ8QiSInB2VEIicIZUQNiYoCACcSi/5QSb1FAUSL/0QiJwVlRCMJJwVMZyInEWVEi/8JJxFMZ7xIiQ==", "clear": "CoEBQw=="}, "desc": "Proposal Contract", "events": [{"args": [{"type": "uint8", "name": "funding_type"}, {"type": "uint64", "name": "requested_amount"}, {"type": "uint8", "name": "category"}, {"type": "uint64", "name": "round"}], "name": "Opened", "desc": "The Proposal has been opened"}, {"args": [{"type": "uint64", "name": "vote_opening"}, {"type": "uint64", "name": "vote_closing"}, {"type": "uint32", "name": "quorum_voters"}, {"type": "uint32", "name": "weighted_quorum_votes"}, {"type": "uint64", "name": "round"}], "name": "Submitted", "desc": "The Proposal has been submitted for voting"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint32", "name": "approvals"}, {"type": "uint32", "name": "rejections"}, {"type": "uint32", "name": "nulls"}, {"type": "bool", "name": "boycotted"}, {"type": "uint32", "name": "total_voters"}, {"type": "uint32", "name": "total_boycott"}, {"type": "uint32", "name": "total_approvals"}, {"type": "uint32", "name": "total_rejections"}, {"type": "uint32", "name": "total_nulls"}, {"type": "uint64", "name": "round"}], "name": "Vote", "desc": "A vote has been cast on the Proposal"}, {"args": [{"type": "bool", "name": "approved"}, {"type": "bool", "name": "plebiscite"}, {"type": "uint64", "name": "round"}], "name": "Scrutiny", "desc": "The vote has been scrutinized"}, {"args": [{"type": "bool", "name": "veto"}, {"type": "uint64", "name": "round"}], "name": "Review", "desc": "The xGov Council has reviewed the Proposal"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgMTAgMTAwMDAKICAgIGJ5dGVjYmxvY2sgMHg3Mzc0NjE3NDc1NzMgMHggMHg2NjY5NmU2MTZjNjk3YTY1NjQgMHg3MDcyNmY3MDZmNzM2NTcyIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0IDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMgMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MyAweDYxNzA3MDcyNmY3NjYxNmM3MyAweDcyNjU2YTY1NjM3NDY5NmY2ZTczICJNIiAweDE1MWY3Yzc1IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MyAweDcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0IDB4NjI2Zjc5NjM2Zjc0NzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MyAweDZlNzU2YzZjNzMgMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMgMHg2Njc1NmU2NDY5NmU2NzVmNjM2MTc0NjU2NzZmNzI3OSAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMgIlYiIDB4MDAgMHg2YzZmNjM2YjY1NjQ1ZjYxNmQ2Zjc1NmU3NCAweDcxNzU2ZjcyNzU2ZDVmNzQ2ODcyNjU3MzY4NmY2YzY0IDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQgIkVSUjpXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIiAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NCAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUgMHg2NDYxNjU2ZDZmNmU1ZjZmNzA2NTcyNjE3NDY5NmY2ZTVmNjY3NTZlNjQ2OTZlNjc1ZjYyNzA3MyAweDZmNzA2NTZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAgMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MCAweDY2NzU2ZTY0Njk2ZTY3NWY3NDc5NzA2NSAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZSAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OSAweDczNzU2MjZkNjk3MzczNjk2ZjZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAgMHg2ZDY1NzQ2MTY0NjE3NDYxNWY3NTcwNmM2ZjYxNjQ2NTY0IDB4NzQ2OTc0NmM2NSAweDY2NmY2Mzc1NzMgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZSAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1IDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZSAiRVJSOlZvdGVyIG5vdCBmb3VuZCIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0OAogICAgLy8gVHhuLmdsb2JhbF9udW1fYnl0ZV9zbGljZSA9PSBwcm9wX2NmZy5HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIHB1c2hpbnQgMwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0Ni00OQogICAgLy8gIyBQcmVjb25kaXRpb25zCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5nbG9iYWxfbnVtX2J5dGVfc2xpY2UgPT0gcHJvcF9jZmcuR0xPQkFMX0JZVEVTCiAgICAvLyApLCBlcnIuV1JPTkdfR0xPQkFMX0JZVEVTCiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MAogICAgLy8gYXNzZXJ0IFR4bi5nbG9iYWxfbnVtX3VpbnQgPT0gcHJvcF9jZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgcHVzaGludCAyNwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV9ieXRlX3NsaWNlID09IHByb3BfY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MgogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fdWludCA9PSBwcm9wX2NmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1BST1BPU0VSLAogICAgYnl0ZWNfMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NgogICAgLy8gQWNjb3VudCgpLAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTQtNTgKICAgIC8vICMgQmFzZSBTdGF0ZQogICAgLy8gc2VsZi5wcm9wb3NlciA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFjY291bnQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1BST1BPU0VSLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9SRUdJU1RSWV9BUFBfSUQsCiAgICBieXRlYyA0IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjAKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1OS02MgogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1JFR0lTVFJZX0FQUF9JRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjcKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfSUQsCiAgICBieXRlYyAyNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2CiAgICAvLyB0eXAuQnl0ZXMzMi5mcm9tX2J5dGVzKGIiIiksCiAgICBieXRlY18xIC8vIDB4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjQtNjgKICAgIC8vICMgRnJvbSB4R292IFJlZ2lzdHJ5CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9pZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIHR5cC5CeXRlczMyLmZyb21fYnl0ZXMoYiIiKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX0lELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9NRU1CRVJTLAogICAgYnl0ZWMgMTEgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzAKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2OS03MgogICAgLy8gc2VsZi5jb21taXR0ZWVfbWVtYmVycyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzUKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMsCiAgICBieXRlYyAxNSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzMtNzYKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9WT1RFUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzkKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9PUEVOX1BST1BPU0FMX0ZFRSwKICAgIGJ5dGVjIDI1IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzctODAKICAgIC8vIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgzCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUywKICAgIGJ5dGVjIDI2IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxLTg0CiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODkKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfT1BFTl9UUywKICAgIGJ5dGVjIDI3IC8vIDB4NmY3MDY1NmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODYtOTAKICAgIC8vICMgVGltZSBBbmNob3JzCiAgICAvLyBzZWxmLm9wZW5fdHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX09QRU5fVFMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1NVQk1JU1NJT05fVFMsCiAgICBieXRlYyAzMiAvLyAweDczNzU2MjZkNjk3MzczNjk2ZjZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkxLTk0CiAgICAvLyBzZWxmLnN1Ym1pc3Npb25fdHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1NVQk1JU1NJT05fVFMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUywKICAgIGJ5dGVjIDI4IC8vIDB4NzY2Zjc0NjU1ZjZmNzA2NTZlNjk2ZTY3NWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk1LTk4CiAgICAvLyBzZWxmLnZvdGVfb3Blbl90cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9URV9PUEVOX1RTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDMKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfU1RBVFVTLAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gVUludDY0KGVubS5TVEFUVVNfRU1QVFkpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDAtMTA0CiAgICAvLyAjIFByb3Bvc2FsIFN0YXRlCiAgICAvLyBzZWxmLnN0YXR1cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChlbm0uU1RBVFVTX0VNUFRZKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1NUQVRVUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA3CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZJTkFMSVpFRCwKICAgIGJ5dGVjXzIgLy8gMHg2NjY5NmU2MTZjNjk3YTY1NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDYKICAgIC8vIEZhbHNlLCAgIyBub3FhOiBGQlQwMDMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA1LTEwOAogICAgLy8gc2VsZi5maW5hbGl6ZWQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBGYWxzZSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9GSU5BTElaRUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9NRVRBREFUQV9VUExPQURFRCwKICAgIGJ5dGVjIDMzIC8vIDB4NmQ2NTc0NjE2NDYxNzQ2MTVmNzU3MDZjNmY2MTY0NjU2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMAogICAgLy8gRmFsc2UsICAjIG5vcWE6IEZCVDAwMwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDktMTEyCiAgICAvLyBzZWxmLm1ldGFkYXRhX3VwbG9hZGVkID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgRmFsc2UsICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfTUVUQURBVEFfVVBMT0FERUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9USVRMRSwKICAgIGJ5dGVjIDM0IC8vIDB4NzQ2OTc0NmM2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNgogICAgLy8gU3RyaW5nKCksCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE0LTExOAogICAgLy8gIyBQcm9wb3NhbCBDb25maWd1cmF0aW9uCiAgICAvLyBzZWxmLnRpdGxlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgU3RyaW5nKCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9USVRMRSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIxCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZVTkRJTkdfQ0FURUdPUlksCiAgICBieXRlYyAxNiAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY2MzYxNzQ2NTY3NmY3Mjc5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIwCiAgICAvLyBVSW50NjQoZW5tLkZVTkRJTkdfQ0FURUdPUllfTlVMTCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExOS0xMjIKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChlbm0uRlVORElOR19DQVRFR09SWV9OVUxMKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZVTkRJTkdfQ0FURUdPUlksCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9GT0NVUywKICAgIGJ5dGVjIDM1IC8vIDB4NjY2ZjYzNzU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNAogICAgLy8gVUludDY0KGVubS5GT0NVU19OVUxMKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIzLTEyNgogICAgLy8gc2VsZi5mb2N1cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChlbm0uRk9DVVNfTlVMTCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9GT0NVUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI5CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZVTkRJTkdfVFlQRSwKICAgIGJ5dGVjIDI5IC8vIDB4NjY3NTZlNjQ2OTZlNjc1Zjc0Nzk3MDY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI4CiAgICAvLyBVSW50NjQoZW5tLkZVTkRJTkdfTlVMTCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNy0xMzAKICAgIC8vIHNlbGYuZnVuZGluZ190eXBlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KGVubS5GVU5ESU5HX05VTEwpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfRlVORElOR19UWVBFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzMKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUkVRVUVTVEVEX0FNT1VOVCwKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzIKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzEtMTM0CiAgICAvLyBzZWxmLnJlcXVlc3RlZF9hbW91bnQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1JFUVVFU1RFRF9BTU9VTlQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9MT0NLRURfQU1PVU5ULAogICAgYnl0ZWMgMjAgLy8gMHg2YzZmNjM2YjY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNS0xMzgKICAgIC8vIHNlbGYubG9ja2VkX2Ftb3VudCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfTE9DS0VEX0FNT1VOVCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQxCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT04sCiAgICBieXRlYyAzNiAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQwCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM5LTE0MgogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDUKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OLAogICAgYnl0ZWMgMzAgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDQKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDMtMTQ2CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbiA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDkKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUVVPUlVNX1RIUkVTSE9MRCwKICAgIGJ5dGVjIDIxIC8vIDB4NzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDctMTUwCiAgICAvLyBzZWxmLnF1b3J1bV90aHJlc2hvbGQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1FVT1JVTV9USFJFU0hPTEQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fVEhSRVNIT0xELAogICAgYnl0ZWMgMjIgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MS0xNTQKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX1RIUkVTSE9MRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTU5CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0FTU0lHTkVEX01FTUJFUlMsCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTgKICAgIC8vIFVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTU2LTE2MAogICAgLy8gIyBQcm9wb3NhbCBWb3RlCiAgICAvLyBzZWxmLmFzc2lnbmVkX21lbWJlcnMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoMCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9BU1NJR05FRF9NRU1CRVJTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjMKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfQVNTSUdORURfVk9URVMsCiAgICBieXRlYyAxNyAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjIKICAgIC8vIFVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTYxLTE2NAogICAgLy8gc2VsZi5hc3NpZ25lZF92b3RlcyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgwKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX0FTU0lHTkVEX1ZPVEVTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjcKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfVk9URURfTUVNQkVSUywKICAgIGJ5dGVjIDYgLy8gMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2NS0xNjgKICAgIC8vIHNlbGYudm90ZWRfbWVtYmVycyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9URURfTUVNQkVSUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTcxCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0JPWUNPVFRFRF9NRU1CRVJTLAogICAgYnl0ZWMgMTMgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTcwCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTY5LTE3MgogICAgLy8gc2VsZi5ib3ljb3R0ZWRfbWVtYmVycyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfQk9ZQ09UVEVEX01FTUJFUlMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE3NQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9BUFBST1ZBTFMsCiAgICBieXRlYyA3IC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTc0CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTczLTE3NgogICAgLy8gc2VsZi5hcHByb3ZhbHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX0FQUFJPVkFMUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTc5CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1JFSkVDVElPTlMsCiAgICBieXRlYyA4IC8vIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNzgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNzctMTgwCiAgICAvLyBzZWxmLnJlamVjdGlvbnMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1JFSkVDVElPTlMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE4MwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9OVUxMUywKICAgIGJ5dGVjIDE0IC8vIDB4NmU3NTZjNmM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE4MS0xODQKICAgIC8vIHNlbGYubnVsbHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX05VTExTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM0LTQyCiAgICAvLyBjbGFzcyBQcm9wb3NhbCgKICAgIC8vICAgICBQcm9wb3NhbEludGVyZmFjZSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1wcm9wX2NmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1wcm9wX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPXByb3BfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1wcm9wX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweDI0Mzc4ZDNjIC8vIG1ldGhvZCAiZGVsZXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9kZWxldGVfcm91dGVANAoKbWFpbl9zd2l0Y2hfY2FzZV9uZXh0QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQtNDIKICAgIC8vIGNsYXNzIFByb3Bvc2FsKAogICAgLy8gICAgIFByb3Bvc2FsSW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPXByb3BfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPXByb3BfY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9cHJvcF9jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPXByb3BfY2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAyNAogICAgcHVzaGJ5dGVzcyAweGVkYWViOWNhIDB4NzE0Mzk5NGYgMHg3MzcxMzIxYSAweDM0ZTYxM2NhIDB4MGQ5YWIwZDcgMHgxODQxYTBkMiAweDczNGRiZWNjIDB4NzZmZjRjNzAgMHgyMTJkOWYwNyAweDhhNWU0YzgwIDB4MmFjMTliMDUgMHg4MDIwNjliNCAweGI2NDllODc0IDB4MjQ2MTVmOTAgMHgzNjljNDJiYSAweGRiZDgzZGQ5IC8vIG1ldGhvZCAib3BlbihwYXksc3RyaW5nLHVpbnQ2NCx1aW50NjQsdWludDgpdm9pZCIsIG1ldGhvZCAidXBsb2FkX21ldGFkYXRhKGJ5dGVbXSxib29sKXZvaWQiLCBtZXRob2QgImRyb3AoKXN0cmluZyIsIG1ldGhvZCAic3VibWl0KCl2b2lkIiwgbWV0aG9kICJhc3NpZ25fdm90ZXJzKChhZGRyZXNzLHVpbnQ2NClbXSl2b2lkIiwgbWV0aG9kICJ2b3RlKGFkZHJlc3MsdWludDY0LHVpbnQ2NClzdHJpbmciLCBtZXRob2QgInNjcnV0aW55KCl2b2lkIiwgbWV0aG9kICJ1bmFzc2lnbl9hYnNlbnRlZXMoYWRkcmVzc1tdKXN0cmluZyIsIG1ldGhvZCAicmV2aWV3KGJvb2wpdm9pZCIsIG1ldGhvZCAiZnVuZCgpc3RyaW5nIiwgbWV0aG9kICJ1bmFzc2lnbl92b3RlcnMoYWRkcmVzc1tdKXZvaWQiLCBtZXRob2QgImZpbmFsaXplKClzdHJpbmciLCBtZXRob2QgImdldF9zdGF0ZSgpKGFkZHJlc3MsdWludDY0LHN0cmluZyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYm9vbCx1aW50NjQsdWludDgsdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVszMl0sdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3ZvdGVyX2JveChhZGRyZXNzKSh1aW50NjQsYm9vbCkiLCBtZXRob2QgImdldF92b3Rpbmdfc3RhdGUoKSh1aW50MzIsdWludDMyLHVpbnQzMix1aW50MzIsdWludDMyLHVpbnQzMix1aW50MzIsYm9vbCxib29sLGJvb2wsYm9vbCkiLCBtZXRob2QgIm9wX3VwKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggb3BlbiB1cGxvYWRfbWV0YWRhdGEgZHJvcCBzdWJtaXQgYXNzaWduX3ZvdGVycyB2b3RlIHNjcnV0aW55IHVuYXNzaWduX2Fic2VudGVlcyByZXZpZXcgZnVuZCB1bmFzc2lnbl92b3RlcnMgZmluYWxpemUgZ2V0X3N0YXRlIGdldF92b3Rlcl9ib3ggZ2V0X3ZvdGluZ19zdGF0ZSBtYWluX29wX3VwX3JvdXRlQDIyCiAgICBlcnIKCm1haW5fb3BfdXBfcm91dGVAMjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE5NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX05vT3BAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQtNDIKICAgIC8vIGNsYXNzIFByb3Bvc2FsKAogICAgLy8gICAgIFByb3Bvc2FsSW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPXByb3BfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPXByb3BfY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9cHJvcF9jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPXByb3BfY2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4Y2M2OTRlYWEgLy8gbWV0aG9kICJjcmVhdGUoYWRkcmVzcyl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fZGVsZXRlX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgYXNzZXJ0CiAgICBiIGRlbGV0ZQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU4OAogICAgLy8gR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCAhPSAwCiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU4Ny01ODkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCAhPSAwCiAgICAvLyApLCBlcnIuVU5BVVRIT1JJWkVEICAjIE9ubHkgY2FsbGFibGUgYnkgYW5vdGhlciBjb250cmFjdAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU5MS01OTIKICAgIC8vICMgU2V0IFByb3Bvc2FsIEJhc2UgU3RhdGUKICAgIC8vIHNlbGYucHJvcG9zZXIudmFsdWUgPSBwcm9wb3NlcgogICAgYnl0ZWNfMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTkzCiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSA9IEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQKICAgIGJ5dGVjIDQgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU5NwogICAgLy8gc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX0lEKSkKICAgIGJ5dGVjIDI0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICBjYWxsc3ViIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU5NS01OTYKICAgIC8vICMgU2V0IHZhbHVlcyBmcm9tIHhHb3YgUmVnaXN0cnkKICAgIC8vIHNlbGYuY29tbWl0dGVlX2lkLnZhbHVlID0gdHlwLkJ5dGVzMzIuZnJvbV9ieXRlcygKICAgIGJ5dGVjIDI0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTk1LTU5OAogICAgLy8gIyBTZXQgdmFsdWVzIGZyb20geEdvdiBSZWdpc3RyeQogICAgLy8gc2VsZi5jb21taXR0ZWVfaWQudmFsdWUgPSB0eXAuQnl0ZXMzMi5mcm9tX2J5dGVzKAogICAgLy8gICAgIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9JRCkpCiAgICAvLyApICAjIFRoZSB4R292IFJlZ2lzdHJ5IENPTU1JVFRFRV9TVEFMRSBlcnJvciBlbnN1cmVzIHRoZSBDb21taXR0ZWUgaXMgYXZhaWxhYmxlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX01FTUJFUlMpCiAgICBieXRlYyAxMSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1OTktNjAxCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUykKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1OTkKICAgIC8vIHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgYnl0ZWMgMTEgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTk5LTYwMQogICAgLy8gc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX01FTUJFUlMpCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwMwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTKQogICAgYnl0ZWMgMTUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDItNjA0CiAgICAvLyBzZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwMgogICAgLy8gc2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgYnl0ZWMgMTUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDItNjA0CiAgICAvLyBzZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTKQogICAgLy8gKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDYKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX09QRU5fUFJPUE9TQUxfRkVFKQogICAgYnl0ZWMgMjUgLy8gMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjA1LTYwNwogICAgLy8gc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjA1CiAgICAvLyBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIGJ5dGVjIDI1IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwNS02MDcKICAgIC8vIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX09QRU5fUFJPUE9TQUxfRkVFKQogICAgLy8gKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDkKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMpCiAgICBieXRlYyAyNiAvLyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjA4LTYxMAogICAgLy8gc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9EQUVNT05fT1BTX0ZVTkRJTkdfQlBTKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwOAogICAgLy8gc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIGJ5dGVjIDI2IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDgtNjEwCiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMpCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLm9wZW5bcm91dGluZ10oKSAtPiB2b2lkOgpvcGVuOgogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjEyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQ0CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkpCiAgICBieXRlYyAzMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ0My00NDUKICAgIC8vIHJlZ2lzdHJ5X3BhdXNlZCA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ0NgogICAgLy8gYXNzZXJ0IG5vdCByZWdpc3RyeV9wYXVzZWQsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNzAKICAgIC8vIGFzc2VydCBzZWxmLmlzX3Byb3Bvc2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcHJvcG9zZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNzIKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfRU1QVFkgYW5kIG5vdCBzZWxmLmZpbmFsaXplZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBibnogb3Blbl9ib29sX2ZhbHNlQDQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgYm56IG9wZW5fYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQoKb3Blbl9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzcxLTM3MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0VNUFRZIGFuZCBub3Qgc2VsZi5maW5hbGl6ZWQudmFsdWUKICAgIC8vICksIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIGFzc2VydCAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzgyCiAgICAvLyBhc3NlcnQgdGl0bGUuYnl0ZXMubGVuZ3RoIDw9IGNvbnN0LlRJVExFX01BWF9CWVRFUywgZXJyLldST05HX1RJVExFX0xFTkdUSAogICAgZGlnIDMKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDEyMwogICAgPD0KICAgIGFzc2VydCAvLyBXcm9uZyBUaXRsZSBsZW5ndGgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozODMKICAgIC8vIGFzc2VydCB0aXRsZSAhPSAiIiwgZXJyLldST05HX1RJVExFX0xFTkdUSAogICAgYnl0ZWNfMSAvLyAiIgogICAgIT0KICAgIGFzc2VydCAvLyBXcm9uZyBUaXRsZSBsZW5ndGgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozODYKICAgIC8vIGZ1bmRpbmdfdHlwZSA9PSBlbm0uRlVORElOR19QUk9BQ1RJVkUKICAgIGRpZyAyCiAgICBpbnRjXzMgLy8gMTAKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzg2LTM4NwogICAgLy8gZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1BST0FDVElWRQogICAgLy8gb3IgZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1JFVFJPQUNUSVZFCiAgICBibnogb3Blbl9ib29sX3RydWVAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM4NwogICAgLy8gb3IgZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1JFVFJPQUNUSVZFCiAgICBkaWcgMgogICAgcHVzaGludCAyMAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozODYtMzg3CiAgICAvLyBmdW5kaW5nX3R5cGUgPT0gZW5tLkZVTkRJTkdfUFJPQUNUSVZFCiAgICAvLyBvciBmdW5kaW5nX3R5cGUgPT0gZW5tLkZVTkRJTkdfUkVUUk9BQ1RJVkUKICAgIGJ6IG9wZW5fYm9vbF9mYWxzZUAxMAoKb3Blbl9ib29sX3RydWVAOToKICAgIGludGNfMSAvLyAxCgpvcGVuX2Jvb2xfbWVyZ2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzg1LTM4OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBmdW5kaW5nX3R5cGUgPT0gZW5tLkZVTkRJTkdfUFJPQUNUSVZFCiAgICAvLyAgICAgb3IgZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1JFVFJPQUNUSVZFCiAgICAvLyApLCBlcnIuV1JPTkdfRlVORElOR19UWVBFCiAgICBhc3NlcnQgLy8gV3JvbmcgRnVuZGluZyBUeXBlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzkxCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NSU5fUkVRVUVTVEVEX0FNT1VOVCkKICAgIGJ5dGVjIDM3IC8vIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM5MC0zOTIKICAgIC8vIG1pbl9yZXF1ZXN0ZWRfYW1vdW50ID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NSU5fUkVRVUVTVEVEX0FNT1VOVCkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozOTUKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKQogICAgYnl0ZWMgMzggLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzk0LTM5NgogICAgLy8gbWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM5OAogICAgLy8gYXNzZXJ0IHJlcXVlc3RlZF9hbW91bnQgPj0gbWluX3JlcXVlc3RlZF9hbW91bnQsIGVyci5XUk9OR19NSU5fUkVRVUVTVEVEX0FNT1VOVAogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICA+PQogICAgYXNzZXJ0IC8vIFJlcXVlc3RlZCBhbW91bnQgaXMgbGVzcyB0aGFuIHRoZSBtaW5pbXVtIHJlcXVlc3RlZCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MDAKICAgIC8vIHJlcXVlc3RlZF9hbW91bnQgPD0gbWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UKICAgIGRpZyAxCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM5OS00MDEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcmVxdWVzdGVkX2Ftb3VudCA8PSBtYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZQogICAgLy8gKSwgZXJyLldST05HX01BWF9SRVFVRVNURURfQU1PVU5UCiAgICBhc3NlcnQgLy8gUmVxdWVzdGVkIGFtb3VudCBpcyBtb3JlIHRoYW4gdGhlIG1heGltdW0gcmVxdWVzdGVkIGFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQxMAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfUFJPUE9TQUxfQ09NTUlUTUVOVF9CUFMpCiAgICBwdXNoYnl0ZXMgMHg3MDcyNmY3MDZmNzM2MTZjNWY2MzZmNmQ2ZDY5NzQ2ZDY1NmU3NDVmNjI3MDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDA5LTQxMQogICAgLy8gcHJvcG9zYWxfY29tbWl0bWVudF9icHMgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BST1BPU0FMX0NPTU1JVE1FTlRfQlBTKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gcmV0dXJuIGFtb3VudCAqIGZyYWN0aW9uX2luX2JwcyAvLyBjb25zdC5CUFMKICAgIGRpZyAxCiAgICAqCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MjIKICAgIC8vIGFzc2VydCBwYXltZW50LnNlbmRlciA9PSBzZWxmLnByb3Bvc2VyLnZhbHVlLCBlcnIuV1JPTkdfU0VOREVSCiAgICBkaWcgNgogICAgZHVwCiAgICBndHhucyBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MjQKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDIzLTQyNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksIGVyci5XUk9OR19SRUNFSVZFUgogICAgYXNzZXJ0IC8vIFdyb25nIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDI2CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gZXhwZWN0ZWRfbG9ja19hbW91bnQsIGVyci5XUk9OR19MT0NLRURfQU1PVU5UCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgYnVyeSA5CiAgICA9PQogICAgYXNzZXJ0IC8vIExvY2tlZCBhbW91bnQgaXMgaW5jb3JyZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjUzLTY1NAogICAgLy8gIyBDb25maWd1cmUgUHJvcG9zYWwKICAgIC8vIHNlbGYudGl0bGUudmFsdWUgPSB0aXRsZQogICAgYnl0ZWMgMzQgLy8gMHg3NDY5NzQ2YzY1CiAgICBkaWcgNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MzAKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX1NNQUxMKQogICAgcHVzaGJ5dGVzIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNzM2ZDYxNmM2YwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQyOS00MzEKICAgIC8vIG1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTCkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MzMKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX01FRElVTSkKICAgIHB1c2hieXRlcyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZkNjU2NDY5NzU2ZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQzMi00MzQKICAgIC8vIG1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTUVESVVNKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDM1CiAgICAvLyBpZiByZXF1ZXN0ZWRfYW1vdW50IDw9IG1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsOgogICAgPD0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDM2CiAgICAvLyByZXR1cm4gVUludDY0KGVubS5GVU5ESU5HX0NBVEVHT1JZX1NNQUxMKQogICAgaW50Y18zIC8vIDEwCgpvcGVuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF9jYXRlZ29yeUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NTUKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSA9IHNlbGYuZ2V0X2NhdGVnb3J5KHJlcXVlc3RlZF9hbW91bnQpCiAgICBieXRlYyAxNiAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY2MzYxNzQ2NTY3NmY3Mjc5CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY1NgogICAgLy8gc2VsZi5mdW5kaW5nX3R5cGUudmFsdWUgPSBmdW5kaW5nX3R5cGUKICAgIGJ5dGVjIDI5IC8vIDB4NjY3NTZlNjQ2OTZlNjc1Zjc0Nzk3MDY1CiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NTcKICAgIC8vIHNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSA9IHJlcXVlc3RlZF9hbW91bnQKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gc2VsZi5mb2N1cy52YWx1ZSA9IGZvY3VzLmFzX3VpbnQ2NCgpCiAgICBkdXAKICAgIGJ0b2kKICAgIGJ5dGVjIDM1IC8vIDB4NjY2ZjYzNzU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NTkKICAgIC8vIHNlbGYubG9ja2VkX2Ftb3VudC52YWx1ZSA9IHBheW1lbnQuYW1vdW50ICAjIFRoZSBhbW91bnQgaXMgdmFsaWRhdGVkCiAgICBieXRlYyAyMCAvLyAweDZjNmY2MzZiNjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBkaWcgNgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NjMKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSAhPSBlbm0uRlVORElOR19DQVRFR09SWV9OVUxMCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gMHg2Njc1NmU2NDY5NmU2NzVmNjM2MTc0NjU2NzZmNzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSAxMAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZ19jYXRlZ29yeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NjEtNjY0CiAgICAvLyAjIENvbmZpZ3VyZSBjYXRlZ29yeSBkZXBlbmRlbnQgdmFsdWVzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSAhPSBlbm0uRlVORElOR19DQVRFR09SWV9OVUxMCiAgICAvLyApLCBlcnIuTUlTU0lOR19DT05GSUcKICAgIGR1cAogICAgYXNzZXJ0IC8vIE1pc3NpbmcgQ29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjY1CiAgICAvLyBhc3NlcnQgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlICE9IDAsIGVyci5NSVNTSU5HX0NPTkZJRwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgYXNzZXJ0IC8vIE1pc3NpbmcgQ29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzE3CiAgICAvLyBpZiBjYXRlZ29yeSA9PSBlbm0uRlVORElOR19DQVRFR09SWV9TTUFMTDoKICAgIGludGNfMyAvLyAxMAogICAgPT0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDIzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzE5CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX1NNQUxMKQogICAgcHVzaGJ5dGVzIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMTgtMzIwCiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX1NNQUxMKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwoKb3Blbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfZGlzY3Vzc2lvbl9kdXJhdGlvbkAyNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NjYKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb24oCiAgICBieXRlYyAzNiAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjY2LTY2OAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uLnZhbHVlID0gc2VsZi5nZXRfZGlzY3Vzc2lvbl9kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjcwCiAgICAvLyBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY2MzYxNzQ2NTY3NmY3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDEwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nX2NhdGVnb3J5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMzMQogICAgLy8gaWYgY2F0ZWdvcnkgPT0gZW5tLkZVTkRJTkdfQ0FURUdPUllfU01BTEw6CiAgICBpbnRjXzMgLy8gMTAKICAgID09CiAgICBieiBvcGVuX2Vsc2VfYm9keUAyOQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMzMwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1NNQUxMKQogICAgcHVzaGJ5dGVzIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzMyLTMzNAogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1NNQUxMKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgYnVyeSA2CgpvcGVuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF92b3RpbmdfZHVyYXRpb25AMzI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjY5CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X3ZvdGluZ19kdXJhdGlvbigKICAgIGJ5dGVjIDMwIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjY5LTY3MQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb24udmFsdWUgPSBzZWxmLmdldF92b3RpbmdfZHVyYXRpb24oCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICAvLyApCiAgICBkaWcgNgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0ODgKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1FVT1JVTV9TTUFMTCkKICAgIHB1c2hieXRlcyAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ4Ny00ODkKICAgIC8vIHF1b3J1bV9taW5fYnBzID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9RVU9SVU1fU01BTEwpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDkxCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9RVU9SVU1fTEFSR0UpCiAgICBwdXNoYnl0ZXMgMHg3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0OTAtNDkyCiAgICAvLyBxdW9ydW1fbWF4X2JwcyA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfUVVPUlVNX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ5My00OTQKICAgIC8vICMgVGhlIHhHb3YgUmVnaXN0cnkgZW5zdXJlcyBxdW9ydW1fbWF4X2JwcyA+IHF1b3J1bV9taW5fYnBzCiAgICAvLyBkZWx0YV9xdW9ydW1fYnBzID0gcXVvcnVtX21heF9icHMgLSBxdW9ydW1fbWluX2JwcwogICAgZGlnIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0OTcKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01JTl9SRVFVRVNURURfQU1PVU5UKQogICAgYnl0ZWMgMzcgLy8gMHg2ZDY5NmU1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDk2LTQ5OAogICAgLy8gYW1vdW50X21pbiA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTAwCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSkKICAgIGJ5dGVjIDM4IC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ5OS01MDEKICAgIC8vIGFtb3VudF9tYXggPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUwMi01MDMKICAgIC8vICMgVGhlIHhHb3YgUmVnaXN0cnkgZW5zdXJlcyBhbW91bnRfbWF4ID4gYW1vdW50X21pbgogICAgLy8gZGVsdGFfYW1vdW50ID0gYW1vdW50X21heCAtIGFtb3VudF9taW4KICAgIGRpZyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTA4CiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTA3LTUwOAogICAgLy8gKyBkZWx0YV9xdW9ydW1fYnBzCiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgdW5jb3ZlciAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTA3LTUwOQogICAgLy8gKyBkZWx0YV9xdW9ydW1fYnBzCiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgLy8gLy8gZGVsdGFfYW1vdW50CiAgICBzd2FwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTA2LTUwOQogICAgLy8gcXVvcnVtX21pbl9icHMKICAgIC8vICsgZGVsdGFfcXVvcnVtX2JwcwogICAgLy8gKiAoc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlIC0gYW1vdW50X21pbikKICAgIC8vIC8vIGRlbHRhX2Ftb3VudAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUxMgogICAgLy8gc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwgcXVvcnVtX2JwcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gcmV0dXJuIGFtb3VudCAqIGZyYWN0aW9uX2luX2JwcyAvLyBjb25zdC5CUFMKICAgICoKICAgIGludGMgNCAvLyAxMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY3MgogICAgLy8gc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlID0gc2VsZi5jb21wdXRlX3F1b3J1bV90aHJlc2hvbGQoKQogICAgYnl0ZWMgMjEgLy8gMHg3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MTcKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1dFSUdIVEVEX1FVT1JVTV9TTUFMTCkKICAgIHB1c2hieXRlcyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUxNi01MTgKICAgIC8vIHdlaWdodGVkX3F1b3J1bV9taW5fYnBzID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTIwCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTEFSR0UpCiAgICBwdXNoYnl0ZXMgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MTktNTIxCiAgICAvLyB3ZWlnaHRlZF9xdW9ydW1fbWF4X2JwcyA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUyMi01MjMKICAgIC8vICMgVGhlIHhHb3YgUmVnaXN0cnkgZW5zdXJlcyB3ZWlnaHRlZF9xdW9ydW1fbWF4X2JwcyA+IHdlaWdodGVkX3F1b3J1bV9taW5fYnBzCiAgICAvLyBkZWx0YV93ZWlnaHRlZF9xdW9ydW1fYnBzID0gd2VpZ2h0ZWRfcXVvcnVtX21heF9icHMgLSB3ZWlnaHRlZF9xdW9ydW1fbWluX2JwcwogICAgZGlnIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MjYKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01JTl9SRVFVRVNURURfQU1PVU5UKQogICAgYnl0ZWMgMzcgLy8gMHg2ZDY5NmU1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTI1LTUyNwogICAgLy8gYW1vdW50X21pbiA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTI5CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSkKICAgIGJ5dGVjIDM4IC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUyOC01MzAKICAgIC8vIGFtb3VudF9tYXggPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUzMS01MzIKICAgIC8vICMgVGhlIHhHb3YgUmVnaXN0cnkgZW5zdXJlcyBhbW91bnRfbWF4ID4gYW1vdW50X21pbgogICAgLy8gZGVsdGFfYW1vdW50ID0gYW1vdW50X21heCAtIGFtb3VudF9taW4KICAgIGRpZyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTM3CiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTM2LTUzNwogICAgLy8gKyBkZWx0YV93ZWlnaHRlZF9xdW9ydW1fYnBzCiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgdW5jb3ZlciAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTM2LTUzOAogICAgLy8gKyBkZWx0YV93ZWlnaHRlZF9xdW9ydW1fYnBzCiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgLy8gLy8gZGVsdGFfYW1vdW50CiAgICBzd2FwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTM1LTUzOAogICAgLy8gd2VpZ2h0ZWRfcXVvcnVtX21pbl9icHMKICAgIC8vICsgZGVsdGFfd2VpZ2h0ZWRfcXVvcnVtX2JwcwogICAgLy8gKiAoc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlIC0gYW1vdW50X21pbikKICAgIC8vIC8vIGRlbHRhX2Ftb3VudAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU0MQogICAgLy8gc2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsIHdlaWdodGVkX3F1b3J1bV9icHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV92b3RlcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MDYKICAgIC8vIHJldHVybiBhbW91bnQgKiBmcmFjdGlvbl9pbl9icHMgLy8gY29uc3QuQlBTCiAgICAqCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NzMKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZC52YWx1ZSA9IHNlbGYuY29tcHV0ZV93ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkKCkKICAgIGJ5dGVjIDIyIC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Njc1LTY3NgogICAgLy8gIyBVcGRhdGUgUHJvcG9zYWwgU3RhdGUgYW5kIHRpbWUgYW5jaG9ycwogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19EUkFGVCkKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGludGNfMyAvLyAxMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NzcKICAgIC8vIHNlbGYub3Blbl90cy52YWx1ZSA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieXRlYyAyNyAvLyAweDZmNzA2NTZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjgxCiAgICAvLyBmdW5kaW5nX3R5cGU9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfdHlwZS52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjkgLy8gMHg2Njc1NmU2NDY5NmU2NzVmNzQ3OTcwNjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nX3R5cGUgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY4MgogICAgLy8gcmVxdWVzdGVkX2Ftb3VudD1zZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gMHg3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcXVlc3RlZF9hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjgzCiAgICAvLyBjYXRlZ29yeT1hcmM0LlVJbnQ4KHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gMHg2Njc1NmU2NDY5NmU2NzVmNjM2MTc0NjU2NzZmNzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY4NAogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjgwLTY4NQogICAgLy8gdHlwLk9wZW5lZCgKICAgIC8vICAgICBmdW5kaW5nX3R5cGU9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfdHlwZS52YWx1ZSksCiAgICAvLyAgICAgcmVxdWVzdGVkX2Ftb3VudD1zZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICAvLyAgICAgY2F0ZWdvcnk9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUpLAogICAgLy8gICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NzktNjg2CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgdHlwLk9wZW5lZCgKICAgIC8vICAgICAgICAgZnVuZGluZ190eXBlPWFyYzQuVUludDgoc2VsZi5mdW5kaW5nX3R5cGUudmFsdWUpLAogICAgLy8gICAgICAgICByZXF1ZXN0ZWRfYW1vdW50PXNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSwKICAgIC8vICAgICAgICAgY2F0ZWdvcnk9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUpLAogICAgLy8gICAgICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4NGIxNThkOTggLy8gbWV0aG9kICJPcGVuZWQodWludDgsdWludDY0LHVpbnQ4LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYxMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm9wZW5fZWxzZV9ib2R5QDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMzNQogICAgLy8gZWxpZiBjYXRlZ29yeSA9PSBlbm0uRlVORElOR19DQVRFR09SWV9NRURJVU06CiAgICBkaWcgNwogICAgcHVzaGludCAyMAogICAgPT0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDMxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzM3CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNKQogICAgcHVzaGJ5dGVzIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMzYtMzM4CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjY5LTY3MQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb24udmFsdWUgPSBzZWxmLmdldF92b3RpbmdfZHVyYXRpb24oCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICAvLyApCiAgICBiIG9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X3ZvdGluZ19kdXJhdGlvbkAzMgoKb3Blbl9lbHNlX2JvZHlAMzE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQxCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTEFSR0UpCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNDAtMzQyCiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTEFSR0UpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NjktNjcxCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X3ZvdGluZ19kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIC8vICkKICAgIGIgb3Blbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfdm90aW5nX2R1cmF0aW9uQDMyCgpvcGVuX2Vsc2VfYm9keUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMjEKICAgIC8vIGVsaWYgY2F0ZWdvcnkgPT0gZW5tLkZVTkRJTkdfQ0FURUdPUllfTUVESVVNOgogICAgZGlnIDcKICAgIHB1c2hpbnQgMjAKICAgID09CiAgICBieiBvcGVuX2Vsc2VfYm9keUAyNQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMyMwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0pCiAgICBwdXNoYnl0ZXMgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzIyLTMyNAogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0pCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjY2LTY2OAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uLnZhbHVlID0gc2VsZi5nZXRfZGlzY3Vzc2lvbl9kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIC8vICkKICAgIGIgb3Blbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfZGlzY3Vzc2lvbl9kdXJhdGlvbkAyNgoKb3Blbl9lbHNlX2JvZHlAMjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzI3CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFKQogICAgcHVzaGJ5dGVzIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMjYtMzI4CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2Ni02NjgKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb24oCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICAvLyApCiAgICBiIG9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb25AMjYKCm9wZW5fZWxzZV9ib2R5QDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQzNwogICAgLy8gZWxpZiByZXF1ZXN0ZWRfYW1vdW50IDw9IG1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bToKICAgIGRpZyAxCiAgICBkaWcgNwogICAgPD0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDM4CiAgICAvLyByZXR1cm4gVUludDY0KGVubS5GVU5ESU5HX0NBVEVHT1JZX01FRElVTSkKICAgIHB1c2hpbnQgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NTUKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSA9IHNlbGYuZ2V0X2NhdGVnb3J5KHJlcXVlc3RlZF9hbW91bnQpCiAgICBiIG9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X2NhdGVnb3J5QDIwCgpvcGVuX2Vsc2VfYm9keUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NDAKICAgIC8vIHJldHVybiBVSW50NjQoZW5tLkZVTkRJTkdfQ0FURUdPUllfTEFSR0UpCiAgICBwdXNoaW50IDMwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjU1CiAgICAvLyBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUgPSBzZWxmLmdldF9jYXRlZ29yeShyZXF1ZXN0ZWRfYW1vdW50KQogICAgYiBvcGVuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF9jYXRlZ29yeUAyMAoKb3Blbl9ib29sX2ZhbHNlQDEwOgogICAgaW50Y18wIC8vIDAKICAgIGIgb3Blbl9ib29sX21lcmdlQDExCgpvcGVuX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIG9wZW5fYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVwbG9hZF9tZXRhZGF0YVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwbG9hZF9tZXRhZGF0YToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2ODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NDQKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSkKICAgIGJ5dGVjIDMxIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQzLTQ0NQogICAgLy8gcmVnaXN0cnlfcGF1c2VkID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQ2CiAgICAvLyBhc3NlcnQgbm90IHJlZ2lzdHJ5X3BhdXNlZCwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2NAogICAgLy8gc2VsZi5hc3NlcnRfZHJhZnRfYW5kX3Byb3Bvc2VyKCkKICAgIGNhbGxzdWIgYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3NlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2NwogICAgLy8gYXNzZXJ0IHBheWxvYWQubGVuZ3RoID4gMCwgZXJyLkVNUFRZX1BBWUxPQUQKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBhc3NlcnQgLy8gRW1wdHkgcGF5bG9hZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcwOAogICAgLy8gc2VsZi5tZXRhZGF0YV91cGxvYWRlZC52YWx1ZSA9IFRydWUKICAgIGJ5dGVjIDMzIC8vIDB4NmQ2NTc0NjE2NDYxNzQ2MTVmNzU3MDZjNmY2MTY0NjU2NAogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzEwCiAgICAvLyBpZiBpc19maXJzdF9pbl9ncm91cDoKICAgIGJ6IHVwbG9hZF9tZXRhZGF0YV9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcxMS03MTIKICAgIC8vICMgY2xlYXIgYW5kIHdyaXRlIHRoZSBtZXRhZGF0YSB0byB0aGUgYm94CiAgICAvLyBkZWwgc2VsZi5tZXRhZGF0YS52YWx1ZQogICAgYnl0ZWMgOSAvLyAiTSIKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcxMwogICAgLy8gc2VsZi5tZXRhZGF0YS52YWx1ZSA9IHBheWxvYWQKICAgIGJ5dGVjIDkgLy8gIk0iCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjIDkgLy8gIk0iCiAgICBzd2FwCiAgICBib3hfcHV0Cgp1cGxvYWRfbWV0YWRhdGFfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY4OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnVwbG9hZF9tZXRhZGF0YV9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MTUtNzE2CiAgICAvLyAjIGFwcGVuZCB0aGUgbWV0YWRhdGEgdG8gdGhlIGJveAogICAgLy8gb2xkX3NpemUgPSBzZWxmLm1ldGFkYXRhLmxlbmd0aAogICAgYnl0ZWMgOSAvLyAiTSIKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1ldGFkYXRhIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcxNwogICAgLy8gc2VsZi5tZXRhZGF0YS5yZXNpemUoc2VsZi5tZXRhZGF0YS5sZW5ndGggKyBwYXlsb2FkLmxlbmd0aCkKICAgIGR1cAogICAgZGlnIDMKICAgICsKICAgIGJ5dGVjIDkgLy8gIk0iCiAgICBzd2FwCiAgICBib3hfcmVzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzE4CiAgICAvLyBzZWxmLm1ldGFkYXRhLnJlcGxhY2Uob2xkX3NpemUsIHBheWxvYWQpCiAgICBieXRlYyA5IC8vICJNIgogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgYiB1cGxvYWRfbWV0YWRhdGFfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmRyb3Bbcm91dGluZ10oKSAtPiB2b2lkOgpkcm9wOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNTgKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdHJ5X2NhbGwoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZWdpc3RyeV9jYWxsCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzU5CiAgICAvLyBpZiBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUIG9yIHNlbGYuZmluYWxpemVkLnZhbHVlOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzMgLy8gMTAKICAgICE9CiAgICBibnogZHJvcF9pZl9ib2R5QDcKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgYnogZHJvcF9hZnRlcl9pZl9lbHNlQDgKCmRyb3BfaWZfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2MAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBieXRlYyAyMyAvLyAiRVJSOldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICBidXJ5IDEKCmRyb3BfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZHJvcF9jaGVja19hdXRob3JpemF0aW9uQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzMxCiAgICAvLyBpZiBlcnJvciAhPSB0eXAuRXJyb3IoIiIpOgogICAgZHVwCiAgICBieXRlY18xIC8vICIiCiAgICAhPQogICAgYnogZHJvcF9hZnRlcl9pZl9lbHNlQDMKICAgIGR1cAoKZHJvcF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kcm9wQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDEwIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpkcm9wX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzUKICAgIC8vIHJlY2VpdmVyPXNlbGYucHJvcG9zZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzQtNzM2CiAgICAvLyBzZWxmLnRyYW5zZmVyX2xvY2tlZF9hbW91bnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIC8vICkKICAgIGNhbGxzdWIgdHJhbnNmZXJfbG9ja2VkX2Ftb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjczOAogICAgLy8gZGVsIHNlbGYubWV0YWRhdGEudmFsdWUKICAgIGJ5dGVjIDkgLy8gIk0iCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzkKICAgIC8vIHNlbGYuZmluYWxpemVkLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWNfMiAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzQxCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKCIiKQogICAgYnl0ZWNfMSAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcyMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgZHJvcF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kcm9wQDQKCmRyb3BfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2MQogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjczMAogICAgLy8gZXJyb3IgPSBzZWxmLmRyb3BfY2hlY2tfYXV0aG9yaXphdGlvbigpCiAgICBiIGRyb3BfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZHJvcF9jaGVja19hdXRob3JpemF0aW9uQDkKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuc3VibWl0W3JvdXRpbmddKCkgLT4gdm9pZDoKc3VibWl0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ0NAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZKQogICAgYnl0ZWMgMzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NDMtNDQ1CiAgICAvLyByZWdpc3RyeV9wYXVzZWQgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NDYKICAgIC8vIGFzc2VydCBub3QgcmVnaXN0cnlfcGF1c2VkLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzUxCiAgICAvLyBzZWxmLmFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXIoKQogICAgY2FsbHN1YiBhc3NlcnRfZHJhZnRfYW5kX3Byb3Bvc2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzUyCiAgICAvLyBlbGFwc2VkX2Rpc2N1c3Npb25fZHVyYXRpb24gPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCAtIHNlbGYub3Blbl90cy52YWx1ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI3IC8vIDB4NmY3MDY1NmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fdHMgZXhpc3RzCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzU0CiAgICAvLyBlbGFwc2VkX2Rpc2N1c3Npb25fZHVyYXRpb24gPj0gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzYgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb24gZXhpc3RzCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM1My0zNTUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZWxhcHNlZF9kaXNjdXNzaW9uX2R1cmF0aW9uID49IHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbi52YWx1ZQogICAgLy8gKSwgZXJyLlRPT19FQVJMWQogICAgYXNzZXJ0IC8vIFRvbyBlYXJseQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc1OQogICAgLy8gYXNzZXJ0IHNlbGYubWV0YWRhdGFfdXBsb2FkZWQudmFsdWUsIGVyci5NSVNTSU5HX01FVEFEQVRBCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzMgLy8gMHg2ZDY1NzQ2MTY0NjE3NDYxNWY3NTcwNmM2ZjYxNjQ2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWV0YWRhdGFfdXBsb2FkZWQgZXhpc3RzCiAgICBhc3NlcnQgLy8gTWlzc2luZyBNZXRhZGF0YQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc2MwogICAgLy8gc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9EQUVNT04pKQogICAgYnl0ZWMgMzkgLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBjYWxsc3ViIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc2Mi03NjQKICAgIC8vIHJlY2VpdmVyPUFjY291bnQoCiAgICAvLyAgICAgc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9EQUVNT04pKQogICAgLy8gKSwKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3NjYKICAgIC8vIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUsIHNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI1IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI2IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQwNgogICAgLy8gcmV0dXJuIGFtb3VudCAqIGZyYWN0aW9uX2luX2JwcyAvLyBjb25zdC5CUFMKICAgICoKICAgIGludGMgNCAvLyAxMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc2MS03NjgKICAgIC8vIHNlbGYucGF5KAogICAgLy8gICAgIHJlY2VpdmVyPUFjY291bnQoCiAgICAvLyAgICAgICAgIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1hHT1ZfREFFTU9OKSkKICAgIC8vICAgICApLAogICAgLy8gICAgIGFtb3VudD1zZWxmLnJlbGF0aXZlX3RvX2Fic29sdXRlX2Ftb3VudCgKICAgIC8vICAgICAgICAgc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSwgc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIGNhbGxzdWIgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzY5CiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9IFVJbnQ2NChlbm0uU1RBVFVTX1NVQk1JVFRFRCkKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIHB1c2hpbnQgMjAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzcwCiAgICAvLyBzZWxmLnN1Ym1pc3Npb25fdHMudmFsdWUgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgYnl0ZWMgMzIgLy8gMHg3Mzc1NjI2ZDY5NzM3MzY5NmY2ZTVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuYXNzaWduX3ZvdGVyc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2lnbl92b3RlcnM6CiAgICBieXRlY18xIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3ODYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDAKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuQ29tbWl0dGVlTWVtYmVyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9kYWVtb24oKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X2RhZW1vbgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfU1VCTUlUVEVELCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHB1c2hpbnQgMjAKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxMQogICAgLy8gaWYgVHhuLmdyb3VwX2luZGV4ID09IDA6CiAgICB0eG4gR3JvdXBJbmRleAogICAgYm56IGFzc2lnbl92b3RlcnNfZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MTItODEzCiAgICAvLyAjIENoZWNrIHRoYXQgdGhlIGVudGlyZSBncm91cCBjYWxscyB0aGUgc2FtZSBhcHAgYW5kIG1ldGhvZAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDEsIEdsb2JhbC5ncm91cF9zaXplKToKICAgIGdsb2JhbCBHcm91cFNpemUKICAgIGJ1cnkgMwogICAgaW50Y18xIC8vIDEKICAgIGJ1cnkgNAoKYXNzaWduX3ZvdGVyc19mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODEyLTgxMwogICAgLy8gIyBDaGVjayB0aGF0IHRoZSBlbnRpcmUgZ3JvdXAgY2FsbHMgdGhlIHNhbWUgYXBwIGFuZCBtZXRob2QKICAgIC8vIGZvciBpIGluIHVyYW5nZSgxLCBHbG9iYWwuZ3JvdXBfc2l6ZSk6CiAgICBkaWcgMwogICAgZGlnIDMKICAgIDwKICAgIGJ6IGFzc2lnbl92b3RlcnNfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODE0CiAgICAvLyBzZWxmLmFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kKGkpCiAgICBkaWcgMwogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODEyLTgxMwogICAgLy8gIyBDaGVjayB0aGF0IHRoZSBlbnRpcmUgZ3JvdXAgY2FsbHMgdGhlIHNhbWUgYXBwIGFuZCBtZXRob2QKICAgIC8vIGZvciBpIGluIHVyYW5nZSgxLCBHbG9iYWwuZ3JvdXBfc2l6ZSk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA0CiAgICBiIGFzc2lnbl92b3RlcnNfZm9yX2hlYWRlckAzCgphc3NpZ25fdm90ZXJzX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MTkKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3RlcnMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDQKCmFzc2lnbl92b3RlcnNfZm9yX2hlYWRlckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxOQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVycy5sZW5ndGgpOgogICAgZGlnIDMKICAgIGRpZyAxCiAgICA8CiAgICBieiBhc3NpZ25fdm90ZXJzX2FmdGVyX2ZvckAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgyMAogICAgLy8gc2VsZi5fYXNzaWduX3ZvdGVyKHZvdGVyc1tpXS5hZGRyZXNzLCB2b3RlcnNbaV0udm90aW5nX3Bvd2VyKQogICAgZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDQwCiAgICAqCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzA3CiAgICAvLyBhc3NlcnQgdm90ZXIgbm90IGluIHNlbGYudm90ZXJzLCBlcnIuVk9URVJfQUxSRUFEWV9BU1NJR05FRAogICAgYnl0ZWMgMTggLy8gIlYiCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBWb3RlciBBbHJlYWR5IEFzc2lnbmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzA4CiAgICAvLyBhc3NlcnQgdm90aW5nX3Bvd2VyID4gMCwgZXJyLklOVkFMSURfVk9USU5HX1BPV0VSCiAgICBkaWcgMQogICAgYXNzZXJ0IC8vIEludmFsaWQgVm90aW5nIFBvd2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Nzc1CiAgICAvLyBzZWxmLnZvdGVyc1t2b3Rlcl0gPSB2b3RpbmdfcG93ZXIKICAgIGRpZyAxCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Nzc2CiAgICAvLyBzZWxmLmFzc2lnbmVkX21lbWJlcnMudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2lnbmVkX21lbWJlcnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNSAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc3NwogICAgLy8gc2VsZi5hc3NpZ25lZF92b3Rlcy52YWx1ZSArPSB2b3RpbmdfcG93ZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNyAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF92b3RlcyBleGlzdHMKICAgICsKICAgIGJ5dGVjIDE3IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNzY2Zjc0NjU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MTkKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3RlcnMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDQKICAgIGIgYXNzaWduX3ZvdGVyc19mb3JfaGVhZGVyQDkKCmFzc2lnbl92b3RlcnNfYWZ0ZXJfZm9yQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgyMgogICAgLy8gaWYgc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlID09IHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWU6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzaWduZWRfbWVtYmVycyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWVtYmVycyBleGlzdHMKICAgID09CiAgICBieiBhc3NpZ25fdm90ZXJzX2FmdGVyX2lmX2Vsc2VAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MjQKICAgIC8vIHNlbGYuYXNzaWduZWRfdm90ZXMudmFsdWUgPT0gc2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNyAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF92b3RlcyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV92b3RlcyBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODIzLTgyNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmFzc2lnbmVkX3ZvdGVzLnZhbHVlID09IHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlCiAgICAvLyApLCBlcnIuVk9USU5HX1BPV0VSX01JU01BVENICiAgICBhc3NlcnQgLy8gVm90aW5nIFBvd2VyIE1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODI2CiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9IFVJbnQ2NChlbm0uU1RBVFVTX1ZPVElORykKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIHB1c2hpbnQgMjUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODI3CiAgICAvLyBzZWxmLnZvdGVfb3Blbl90cy52YWx1ZSA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBieXRlYyAyOCAvLyAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MzIKICAgIC8vIHZvdGVfY2xvc2luZz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSArIHNlbGYudm90aW5nX2R1cmF0aW9uLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMwIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MzMKICAgIC8vIHF1b3J1bV92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAweDcxNzU2ZjcyNzU2ZDVmNzQ2ODcyNjU3MzY4NmY2YzY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtX3RocmVzaG9sZCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODM1CiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzQ2ODcyNjU3MzY4NmY2YzY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MzQtODM2CiAgICAvLyB3ZWlnaHRlZF9xdW9ydW1fdm90ZXM9YXJjNC5VSW50MzIoCiAgICAvLyAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkLnZhbHVlCiAgICAvLyApLAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MzcKICAgIC8vIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgzMC04MzgKICAgIC8vIHR5cC5TdWJtaXR0ZWQoCiAgICAvLyAgICAgdm90ZV9vcGVuaW5nPXNlbGYudm90ZV9vcGVuX3RzLnZhbHVlLAogICAgLy8gICAgIHZvdGVfY2xvc2luZz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSArIHNlbGYudm90aW5nX2R1cmF0aW9uLnZhbHVlLAogICAgLy8gICAgIHF1b3J1bV92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlKSwKICAgIC8vICAgICB3ZWlnaHRlZF9xdW9ydW1fdm90ZXM9YXJjNC5VSW50MzIoCiAgICAvLyAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZC52YWx1ZQogICAgLy8gICAgICksCiAgICAvLyAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MjktODM5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgdHlwLlN1Ym1pdHRlZCgKICAgIC8vICAgICAgICAgdm90ZV9vcGVuaW5nPXNlbGYudm90ZV9vcGVuX3RzLnZhbHVlLAogICAgLy8gICAgICAgICB2b3RlX2Nsb3Npbmc9c2VsZi52b3RlX29wZW5fdHMudmFsdWUgKyBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZSwKICAgIC8vICAgICAgICAgcXVvcnVtX3ZvdGVycz1hcmM0LlVJbnQzMihzZWxmLnF1b3J1bV90aHJlc2hvbGQudmFsdWUpLAogICAgLy8gICAgICAgICB3ZWlnaHRlZF9xdW9ydW1fdm90ZXM9YXJjNC5VSW50MzIoCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGRjZWJlMWM1IC8vIG1ldGhvZCAiU3VibWl0dGVkKHVpbnQ2NCx1aW50NjQsdWludDMyLHVpbnQzMix1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKCmFzc2lnbl92b3RlcnNfYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3ODYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgphc3NpZ25fdm90ZXJzX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxNi04MTcKICAgIC8vICMgQ2hlY2sgdGhhdCB0aGUgZmlyc3QgdHJhbnNhY3Rpb24gaW4gdGhlIGdyb3VwIGNhbGxzIHRoZSBzYW1lIGFwcCBhbmQgbWV0aG9kCiAgICAvLyBzZWxmLmFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kKFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kCiAgICBiIGFzc2lnbl92b3RlcnNfYWZ0ZXJfaWZfZWxzZUA4CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVbcm91dGluZ10oKSAtPiB2b2lkOgp2b3RlOgogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgYnl0ZWNfMSAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjYyCiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RyeV9jYWxsKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVnaXN0cnlfY2FsbAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gaWYgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19WT1RJTkc6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHB1c2hpbnQgMjUKICAgICE9CiAgICBieiB2b3RlX2FmdGVyX2lmX2Vsc2VAMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNjUKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgYnl0ZWMgMjMgLy8gIkVSUjpXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgYnVyeSA2Cgp2b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbkAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NjQKICAgIC8vIGlmIGVycm9yICE9IHR5cC5FcnJvcigiIik6CiAgICBkaWcgNQogICAgYnl0ZWNfMSAvLyAiIgogICAgIT0KICAgIGJ6IHZvdGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICBkaWcgNQoKdm90ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC52b3RlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyAxMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdm90ZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjc4CiAgICAvLyBpZiB2b3RlciBub3QgaW4gc2VsZi52b3RlcnM6CiAgICBieXRlYyAxOCAvLyAiViIKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSA2CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiB2b3RlX2FmdGVyX2lmX2Vsc2VAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzkKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuVk9URVJfTk9UX0ZPVU5EKQogICAgYnl0ZWMgNDAgLy8gIkVSUjpWb3RlciBub3QgZm91bmQiCiAgICBidXJ5IDYKCnZvdGVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV9pbnB1dF92YWxpZGF0aW9uQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg2OAogICAgLy8gaWYgZXJyb3IgPT0gdHlwLkVycm9yKCIiKToKICAgIGRpZyA1CiAgICBieXRlY18xIC8vICIiCiAgICA9PQogICAgYnogdm90ZV9lbHNlX2JvZHlAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg2OQogICAgLy8gdm90ZXMgPSBzZWxmLnZvdGVyc1t2b3Rlcl0KICAgIGRpZyA0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlcnMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBkdXAKICAgIGJ1cnkgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg3MQogICAgLy8gc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NzIKICAgIC8vIGlmIHNlbGYuaXNfYm95Y290dCh2b3RlcywgYXBwcm92YWxzLCByZWplY3Rpb25zKToKICAgIGRpZyAyCiAgICBkaWcgMgogICAgY2FsbHN1YiBpc19ib3ljb3R0CiAgICBieiB2b3RlX2Vsc2VfYm9keUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODczCiAgICAvLyBzZWxmLmJveWNvdHRlZF9tZW1iZXJzLnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAweDYyNmY3OTYzNmY3NDc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3ljb3R0ZWRfbWVtYmVycyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMyAvLyAweDYyNmY3OTYzNmY3NDc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODc2CiAgICAvLyBudWxscyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NzQKICAgIC8vIGJveWNvdHRlZCA9IFRydWUKICAgIGludGNfMSAvLyAxCgp2b3RlX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4ODgKICAgIC8vIHNlbGYuX3VuYXNzaWduX3ZvdGVyKHZvdGVyLCB2b3RlcykKICAgIGRpZyA0CiAgICBkaWcgNgogICAgY2FsbHN1YiBfdW5hc3NpZ25fdm90ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4OTMKICAgIC8vIHNlbGYudm90ZXJzLmJveCh2b3Rlcikua2V5WzE6XQogICAgZGlnIDYKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgZGlnIDEKICAgID49CiAgICBpbnRjXzEgLy8gMQogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzd2FwCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODkyLTg5NAogICAgLy8geGdvdj1hcmM0LkFkZHJlc3MoCiAgICAvLyAgICAgc2VsZi52b3RlcnMuYm94KHZvdGVyKS5rZXlbMTpdCiAgICAvLyApLCAgIyByZW1vdmUgdGhlIEJveCBwcmVmaXgKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4OTUKICAgIC8vIGFwcHJvdmFscz1hcmM0LlVJbnQzMihhcHByb3ZhbHMpLAogICAgZGlnIDQKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODk2CiAgICAvLyByZWplY3Rpb25zPWFyYzQuVUludDMyKHJlamVjdGlvbnMpLAogICAgZGlnIDQKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODk3CiAgICAvLyBudWxscz1hcmM0LlVJbnQzMihudWxscyksCiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODk5CiAgICAvLyB0b3RhbF92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDAKICAgIC8vIHRvdGFsX2JveWNvdHQ9YXJjNC5VSW50MzIoc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm95Y290dGVkX21lbWJlcnMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkwMQogICAgLy8gdG90YWxfYXBwcm92YWxzPWFyYzQuVUludDMyKHNlbGYuYXBwcm92YWxzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDIKICAgIC8vIHRvdGFsX3JlamVjdGlvbnM9YXJjNC5VSW50MzIoc2VsZi5yZWplY3Rpb25zLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWplY3Rpb25zIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDMKICAgIC8vIHRvdGFsX251bGxzPWFyYzQuVUludDMyKHNlbGYubnVsbHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vIDB4NmU3NTZjNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm51bGxzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDQKICAgIC8vIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg5MS05MDUKICAgIC8vIHR5cC5Wb3RlKAogICAgLy8gICAgIHhnb3Y9YXJjNC5BZGRyZXNzKAogICAgLy8gICAgICAgICBzZWxmLnZvdGVycy5ib3godm90ZXIpLmtleVsxOl0KICAgIC8vICAgICApLCAgIyByZW1vdmUgdGhlIEJveCBwcmVmaXgKICAgIC8vICAgICBhcHByb3ZhbHM9YXJjNC5VSW50MzIoYXBwcm92YWxzKSwKICAgIC8vICAgICByZWplY3Rpb25zPWFyYzQuVUludDMyKHJlamVjdGlvbnMpLAogICAgLy8gICAgIG51bGxzPWFyYzQuVUludDMyKG51bGxzKSwKICAgIC8vICAgICBib3ljb3R0ZWQ9Ym95Y290dGVkLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1hcmM0LlVJbnQzMihzZWxmLnZvdGVkX21lbWJlcnMudmFsdWUpLAogICAgLy8gICAgIHRvdGFsX2JveWNvdHQ9YXJjNC5VSW50MzIoc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfYXBwcm92YWxzPWFyYzQuVUludDMyKHNlbGYuYXBwcm92YWxzLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9yZWplY3Rpb25zPWFyYzQuVUludDMyKHNlbGYucmVqZWN0aW9ucy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfbnVsbHM9YXJjNC5VSW50MzIoc2VsZi5udWxscy52YWx1ZSksCiAgICAvLyAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gKQogICAgdW5jb3ZlciA5CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICBieXRlYyAxOSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciA5CiAgICBzZXRiaXQKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4OTAtOTA2CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgdHlwLlZvdGUoCiAgICAvLyAgICAgICAgIHhnb3Y9YXJjNC5BZGRyZXNzKAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RlcnMuYm94KHZvdGVyKS5rZXlbMTpdCiAgICAvLyAgICAgICAgICksICAjIHJlbW92ZSB0aGUgQm94IHByZWZpeAogICAgLy8gICAgICAgICBhcHByb3ZhbHM9YXJjNC5VSW50MzIoYXBwcm92YWxzKSwKICAgIC8vICAgICAgICAgcmVqZWN0aW9ucz1hcmM0LlVJbnQzMihyZWplY3Rpb25zKSwKICAgIC8vICAgICAgICAgbnVsbHM9YXJjNC5VSW50MzIobnVsbHMpLAogICAgLy8gICAgICAgICBib3ljb3R0ZWQ9Ym95Y290dGVkLAogICAgLy8gICAgICAgICB0b3RhbF92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlKSwKICAgIC8vICAgICAgICAgdG90YWxfYm95Y290dD1hcmM0LlVJbnQzMihzZWxmLmJveWNvdHRlZF9tZW1iZXJzLnZhbHVlKSwKICAgIC8vICAgICAgICAgdG90YWxfYXBwcm92YWxzPWFyYzQuVUludDMyKHNlbGYuYXBwcm92YWxzLnZhbHVlKSwKICAgIC8vICAgICAgICAgdG90YWxfcmVqZWN0aW9ucz1hcmM0LlVJbnQzMihzZWxmLnJlamVjdGlvbnMudmFsdWUpLAogICAgLy8gICAgICAgICB0b3RhbF9udWxscz1hcmM0LlVJbnQzMihzZWxmLm51bGxzLnZhbHVlKSwKICAgIC8vICAgICAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGE5MTA4YTFhIC8vIG1ldGhvZCAiVm90ZShhZGRyZXNzLHVpbnQzMix1aW50MzIsdWludDMyLGJvb2wsdWludDMyLHVpbnQzMix1aW50MzIsdWludDMyLHVpbnQzMix1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDgKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB2b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVAMTAKCnZvdGVfZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODc4CiAgICAvLyBib3ljb3R0ZWQgPSBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4ODAKICAgIC8vIG51bGxzID0gdm90ZXMgLSBhcHByb3ZhbHMgLSByZWplY3Rpb25zCiAgICBkaWcgNAogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgLQogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgLQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBjb3ZlciA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODgyCiAgICAvLyBzZWxmLmFwcHJvdmFscy52YWx1ZSArPSBhcHByb3ZhbHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxzIGV4aXN0cwogICAgKwogICAgYnl0ZWMgNyAvLyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4ODMKICAgIC8vIHNlbGYucmVqZWN0aW9ucy52YWx1ZSArPSByZWplY3Rpb25zCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcyNjU2YTY1NjM3NDY5NmY2ZTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVqZWN0aW9ucyBleGlzdHMKICAgICsKICAgIGJ5dGVjIDggLy8gMHg3MjY1NmE2NTYzNzQ2OTZmNmU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4ODQKICAgIC8vIHNlbGYubnVsbHMudmFsdWUgKz0gbnVsbHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAweDZlNzU2YzZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5udWxscyBleGlzdHMKICAgICsKICAgIGJ5dGVjIDE0IC8vIDB4NmU3NTZjNmM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgdm90ZV9hZnRlcl9pZl9lbHNlQDcKCnZvdGVfZWxzZV9ib2R5QDg6CiAgICBkaWcgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgdm90ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC52b3RlQDEwCgp2b3RlX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjgxCiAgICAvLyB2b3RlcyA9IHNlbGYudm90ZXJzW3ZvdGVyXQogICAgZGlnIDQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVycyBlbnRyeSBleGlzdHMKICAgIGJ0b2kKICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjgzCiAgICAvLyBpZiAoYXBwcm92YWxzICsgcmVqZWN0aW9ucyA+IHZvdGVzKSBhbmQgbm90IHNlbGYuaXNfYm95Y290dCgKICAgIGRpZyAyCiAgICBkaWcgMgogICAgKwogICAgPAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI4My0yODUKICAgIC8vIGlmIChhcHByb3ZhbHMgKyByZWplY3Rpb25zID4gdm90ZXMpIGFuZCBub3Qgc2VsZi5pc19ib3ljb3R0KAogICAgLy8gICAgIHZvdGVzLCBhcHByb3ZhbHMsIHJlamVjdGlvbnMKICAgIC8vICk6CiAgICBieiB2b3RlX2FmdGVyX2lmX2Vsc2VAMTYKICAgIGRpZyAzCiAgICBkaWcgMgogICAgZGlnIDIKICAgIGNhbGxzdWIgaXNfYm95Y290dAogICAgYm56IHZvdGVfYWZ0ZXJfaWZfZWxzZUAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI4NgogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFU19JTlZBTElEKQogICAgcHVzaGJ5dGVzICJFUlI6Vm90ZXMgaW52YWxpZCIKICAgIGJ1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg2NwogICAgLy8gZXJyb3IgPSBzZWxmLnZvdGVfaW5wdXRfdmFsaWRhdGlvbih2b3RlciwgYXBwcm92YWxzLCByZWplY3Rpb25zKQogICAgYiB2b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfaW5wdXRfdmFsaWRhdGlvbkAxNwoKdm90ZV9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGJ1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg2NwogICAgLy8gZXJyb3IgPSBzZWxmLnZvdGVfaW5wdXRfdmFsaWRhdGlvbih2b3RlciwgYXBwcm92YWxzLCByZWplY3Rpb25zKQogICAgYiB2b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfaW5wdXRfdmFsaWRhdGlvbkAxNwoKdm90ZV9hZnRlcl9pZl9lbHNlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI2NwogICAgLy8gaWYgbm90IHNlbGYuaXNfdm90aW5nX29wZW4oKToKICAgIGNhbGxzdWIgaXNfdm90aW5nX29wZW4KICAgIGJueiB2b3RlX2FmdGVyX2lmX2Vsc2VAMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNjgKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEKQogICAgcHVzaGJ5dGVzICJFUlI6Vm90aW5nIFBlcmlvZCBFeHBpcmVkIgogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODYzCiAgICAvLyBlcnJvciA9IHNlbGYudm90ZV9jaGVja19hdXRob3JpemF0aW9uKCkKICAgIGIgdm90ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC52b3RlX2NoZWNrX2F1dGhvcml6YXRpb25AMjMKCnZvdGVfYWZ0ZXJfaWZfZWxzZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzAKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18xIC8vICIiCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NjMKICAgIC8vIGVycm9yID0gc2VsZi52b3RlX2NoZWNrX2F1dGhvcml6YXRpb24oKQogICAgYiB2b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbkAyMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5zY3J1dGlueVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNjcnV0aW55OgogICAgYnl0ZWNfMSAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ0NAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZKQogICAgYnl0ZWMgMzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NDMtNDQ1CiAgICAvLyByZWdpc3RyeV9wYXVzZWQgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NDYKICAgIC8vIGFzc2VydCBub3QgcmVnaXN0cnlfcGF1c2VkLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjk0CiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19WT1RJTkcsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAyNQogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjk2CiAgICAvLyBub3Qgc2VsZi5pc192b3Rpbmdfb3BlbigpICAjIHZvdGluZyBwZXJpb2QgaGFzIGVuZGVkCiAgICBjYWxsc3ViIGlzX3ZvdGluZ19vcGVuCiAgICBieiBzY3J1dGlueV9ib29sX3RydWVANwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gb3Igc2VsZi5pc19wbGViaXNjaXRlKCkgICMgYWxsIGNvbW1pdHRlZSBtZW1iZXJzIGFscmVhZHkgdm90ZWQKICAgIGNhbGxzdWIgaXNfcGxlYmlzY2l0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI5Ni0yOTcKICAgIC8vIG5vdCBzZWxmLmlzX3ZvdGluZ19vcGVuKCkgICMgdm90aW5nIHBlcmlvZCBoYXMgZW5kZWQKICAgIC8vIG9yIHNlbGYuaXNfcGxlYmlzY2l0ZSgpICAjIGFsbCBjb21taXR0ZWUgbWVtYmVycyBhbHJlYWR5IHZvdGVkCiAgICBieiBzY3J1dGlueV9ib29sX2ZhbHNlQDgKCnNjcnV0aW55X2Jvb2xfdHJ1ZUA3OgogICAgaW50Y18xIC8vIDEKCnNjcnV0aW55X2Jvb2xfbWVyZ2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyOTUtMjk4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG5vdCBzZWxmLmlzX3ZvdGluZ19vcGVuKCkgICMgdm90aW5nIHBlcmlvZCBoYXMgZW5kZWQKICAgIC8vICAgICBvciBzZWxmLmlzX3BsZWJpc2NpdGUoKSAgIyBhbGwgY29tbWl0dGVlIG1lbWJlcnMgYWxyZWFkeSB2b3RlZAogICAgLy8gKSwgZXJyLlZPVElOR19PTkdPSU5HCiAgICBhc3NlcnQgLy8gVm90aW5nIE9uZ29pbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzAKICAgIC8vIHNlbGYuaXNfcXVvcnVtX3ZvdGVyc19yZWFjaGVkKCkKICAgIGNhbGxzdWIgaXNfcXVvcnVtX3ZvdGVyc19yZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTcwLTU3MgogICAgLy8gc2VsZi5pc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQoKQogICAgLy8gYW5kIHNlbGYuaXNfd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzX3JlYWNoZWQoKQogICAgLy8gYW5kIHNlbGYuaGFzX21ham9yaXR5X2FwcHJvdmVkKCkKICAgIGJ6IHNjcnV0aW55X2Jvb2xfZmFsc2VAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzEKICAgIC8vIGFuZCBzZWxmLmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkKCkKICAgIGNhbGxzdWIgaXNfd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzX3JlYWNoZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzAtNTcyCiAgICAvLyBzZWxmLmlzX3F1b3J1bV92b3RlcnNfcmVhY2hlZCgpCiAgICAvLyBhbmQgc2VsZi5pc193ZWlnaHRlZF9xdW9ydW1fdm90ZXNfcmVhY2hlZCgpCiAgICAvLyBhbmQgc2VsZi5oYXNfbWFqb3JpdHlfYXBwcm92ZWQoKQogICAgYnogc2NydXRpbnlfYm9vbF9mYWxzZUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3MgogICAgLy8gYW5kIHNlbGYuaGFzX21ham9yaXR5X2FwcHJvdmVkKCkKICAgIGNhbGxzdWIgaGFzX21ham9yaXR5X2FwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTcwLTU3MgogICAgLy8gc2VsZi5pc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQoKQogICAgLy8gYW5kIHNlbGYuaXNfd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzX3JlYWNoZWQoKQogICAgLy8gYW5kIHNlbGYuaGFzX21ham9yaXR5X2FwcHJvdmVkKCkKICAgIGJ6IHNjcnV0aW55X2Jvb2xfZmFsc2VAMTUKICAgIGludGNfMSAvLyAxCiAgICBidXJ5IDEKCnNjcnV0aW55X2Jvb2xfbWVyZ2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTI3CiAgICAvLyBpZiBpc19hcHByb3ZlZDoKICAgIGR1cAogICAgYnogc2NydXRpbnlfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MjgKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KGVubS5TVEFUVVNfQVBQUk9WRUQpCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDMwCiAgICBhcHBfZ2xvYmFsX3B1dAoKc2NydXRpbnlfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzOAogICAgLy8gcGxlYmlzY2l0ZT1zZWxmLmlzX3BsZWJpc2NpdGUoKSwKICAgIGNhbGxzdWIgaXNfcGxlYmlzY2l0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzOQogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTM2LTk0MAogICAgLy8gdHlwLlNjcnV0aW55KAogICAgLy8gICAgIGFwcHJvdmVkPWlzX2FwcHJvdmVkLAogICAgLy8gICAgIHBsZWJpc2NpdGU9c2VsZi5pc19wbGViaXNjaXRlKCksCiAgICAvLyAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gKQogICAgYnl0ZWMgMTkgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGRpZyA0CiAgICBzZXRiaXQKICAgIGludGNfMSAvLyAxCiAgICB1bmNvdmVyIDMKICAgIHNldGJpdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTM1LTk0MQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIHR5cC5TY3J1dGlueSgKICAgIC8vICAgICAgICAgYXBwcm92ZWQ9aXNfYXBwcm92ZWQsCiAgICAvLyAgICAgICAgIHBsZWJpc2NpdGU9c2VsZi5pc19wbGViaXNjaXRlKCksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4Yjc4OTUxNCAvLyBtZXRob2QgIlNjcnV0aW55KGJvb2wsYm9vbCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpzY3J1dGlueV9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MzAKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KGVubS5TVEFUVVNfUkVKRUNURUQpCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDQwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzMgogICAgLy8gcmVjZWl2ZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzMS05MzMKICAgIC8vIHNlbGYudHJhbnNmZXJfbG9ja2VkX2Ftb3VudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnByb3Bvc2VyLnZhbHVlLAogICAgLy8gKQogICAgY2FsbHN1YiB0cmFuc2Zlcl9sb2NrZWRfYW1vdW50CiAgICBiIHNjcnV0aW55X2FmdGVyX2lmX2Vsc2VANAoKc2NydXRpbnlfYm9vbF9mYWxzZUAxNToKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDEKICAgIGIgc2NydXRpbnlfYm9vbF9tZXJnZUAxNgoKc2NydXRpbnlfYm9vbF9mYWxzZUA4OgogICAgaW50Y18wIC8vIDAKICAgIGIgc2NydXRpbnlfYm9vbF9tZXJnZUA5CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX2Fic2VudGVlczoKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIGJ5dGVjXzEgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIzMQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVnaXN0cnlfY2FsbCgpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3JlZ2lzdHJ5X2NhbGwKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMzQKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfQVBQUk9WRUQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAzMAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMzQtMjM1CiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0FQUFJPVkVECiAgICAvLyBvciBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBibnogdW5hc3NpZ25fYWJzZW50ZWVzX2FuZF9jb250ZEAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIzNQogICAgLy8gb3Igc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19SRUpFQ1RFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQwCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIzNC0yMzUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfQVBQUk9WRUQKICAgIC8vIG9yIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfUkVKRUNURUQKICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlc19pZl9ib2R5QDE0Cgp1bmFzc2lnbl9hYnNlbnRlZXNfYW5kX2NvbnRkQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIzNwogICAgLy8gYW5kIG5vdCBzZWxmLmZpbmFsaXplZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg2NjY5NmU2MTZjNjk3YTY1NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5maW5hbGl6ZWQgZXhpc3RzCiAgICBieiB1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaWZfZWxzZUAxNQoKdW5hc3NpZ25fYWJzZW50ZWVzX2lmX2JvZHlAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjM5CiAgICAvLyByZXR1cm4gdHlwLkVycm9yKGVyci5BUkNfNjVfUFJFRklYICsgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIGJ5dGVjIDIzIC8vICJFUlI6V3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIGJ1cnkgNQoKdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlc19jaGVja19hdXRob3JpemF0aW9uQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk1NwogICAgLy8gaWYgZXJyb3IgIT0gdHlwLkVycm9yKCIiKToKICAgIGRpZyA0CiAgICBieXRlY18xIC8vICIiCiAgICAhPQogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lmX2Vsc2VAMwogICAgZGlnIDQKCnVuYXNzaWduX2Fic2VudGVlc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXNAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDEwIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaWZfZWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMwoKdW5hc3NpZ25fYWJzZW50ZWVzX2Zvcl9oZWFkZXJANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NjAtOTYxCiAgICAvLyAjIHJlbW92ZSBhYnNlbnRlZQogICAgLy8gZm9yIGFic2VudGVlIGluIGFic2VudGVlczoKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPAogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2ZvckA5CiAgICBkaWcgMQogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAzCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2MgogICAgLy8gaWYgYWJzZW50ZWUgbm90IGluIHNlbGYudm90ZXJzOgogICAgYnl0ZWMgMTggLy8gIlYiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSA1CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiB1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTYzCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKGVyci5BUkNfNjVfUFJFRklYICsgZXJyLlZPVEVSX05PVF9GT1VORCkKICAgIGJ5dGVjIDQwIC8vICJFUlI6Vm90ZXIgbm90IGZvdW5kIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlc0AxMAoKdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NjQKICAgIC8vIHZvdGVzID0gc2VsZi52b3RlcnNbYWJzZW50ZWVdCiAgICBkaWcgMwogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXJzIGVudHJ5IGV4aXN0cwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2NQogICAgLy8gc2VsZi5fdW5hc3NpZ25fdm90ZXIoYWJzZW50ZWUsIHZvdGVzKQogICAgZGlnIDYKICAgIHN3YXAKICAgIGNhbGxzdWIgX3VuYXNzaWduX3ZvdGVyCiAgICBkaWcgMgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMwogICAgYiB1bmFzc2lnbl9hYnNlbnRlZXNfZm9yX2hlYWRlckA0Cgp1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfZm9yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTY3CiAgICAvLyByZXR1cm4gdHlwLkVycm9yKCIiKQogICAgYnl0ZWNfMSAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlc0AxMAoKdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQxCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKCIiKQogICAgYnl0ZWNfMSAvLyAiIgogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTU2CiAgICAvLyBlcnJvciA9IHNlbGYudW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb24oKQogICAgYiB1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb25AMTYKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwucmV2aWV3W3JvdXRpbmddKCkgLT4gdm9pZDoKcmV2aWV3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NTUKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDU2CiAgICAvLyBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9YR09WX0NPVU5DSUwpKQogICAgcHVzaGJ5dGVzIDB4Nzg2NzZmNzY1ZjYzNmY3NTZlNjM2OTZjCiAgICBjYWxsc3ViIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ1NS00NTcKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICAvLyAgICAgc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9DT1VOQ0lMKSkKICAgIC8vICkKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjE2CiAgICAvLyBhc3NlcnQgc2VsZi5pc19jb3VuY2lsKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMTcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0FQUFJPVkVELCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHB1c2hpbnQgMzAKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk4NS05ODYKICAgIC8vICMgY2hlY2sgbm8gYXNzaWduZWQgdm90ZXJzCiAgICAvLyBhc3NlcnQgc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlID09IDAsIGVyci5WT1RFUlNfQVNTSUdORUQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk4OAogICAgLy8gaWYgYmxvY2s6CiAgICBieiByZXZpZXdfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5ODkKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KGVubS5TVEFUVVNfQkxPQ0tFRCkKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIHB1c2hpbnQgNjAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTkxLTk5MgogICAgLy8gIyBzbGFzaGluZzogc2VuZCBsb2NrZWQgYW1vdW50IHRvIHRoZSByZWdpc3RyeSB0cmVhc3VyeQogICAgLy8gcmVnX2FwcCA9IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTk0CiAgICAvLyByZWNlaXZlcj1yZWdfYXBwLmFkZHJlc3MsCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTkzLTk5NQogICAgLy8gc2VsZi50cmFuc2Zlcl9sb2NrZWRfYW1vdW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlZ19hcHAuYWRkcmVzcywKICAgIC8vICkKICAgIGNhbGxzdWIgdHJhbnNmZXJfbG9ja2VkX2Ftb3VudAoKcmV2aWV3X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDA1CiAgICAvLyBhcmM0LmVtaXQodHlwLlJldmlldyh2ZXRvPWJsb2NrLCByb3VuZD1HbG9iYWwucm91bmQpKQogICAgZ2xvYmFsIFJvdW5kCiAgICBieXRlYyAxOSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDMKICAgIHNldGJpdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhhZWU4MTcxOSAvLyBtZXRob2QgIlJldmlldyhib29sLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnJldmlld19lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5OTgKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KGVubS5TVEFUVVNfUkVWSUVXRUQpCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDQ1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMDIKICAgIC8vIHJlY2VpdmVyPXNlbGYucHJvcG9zZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDAwLTEwMDMKICAgIC8vICMgcmVmdW5kIHRoZSBsb2NrZWQgYW1vdW50IHRvIHRoZSBwcm9wb3NlcgogICAgLy8gc2VsZi50cmFuc2Zlcl9sb2NrZWRfYW1vdW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYucHJvcG9zZXIudmFsdWUsCiAgICAvLyApCiAgICBjYWxsc3ViIHRyYW5zZmVyX2xvY2tlZF9hbW91bnQKICAgIGIgcmV2aWV3X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5mdW5kW3JvdXRpbmddKCkgLT4gdm9pZDoKZnVuZDoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjIwCiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RyeV9jYWxsKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVnaXN0cnlfY2FsbAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIyMQogICAgLy8gaWYgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19SRVZJRVdFRDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCA0NQogICAgIT0KICAgIGJ6IGZ1bmRfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjIyCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKGVyci5BUkNfNjVfUFJFRklYICsgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIGJ5dGVjIDIzIC8vICJFUlI6V3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIGJ1cnkgMQoKZnVuZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5mdW5kX2NoZWNrX2F1dGhvcml6YXRpb25AODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDE3CiAgICAvLyBpZiBlcnJvciAhPSB0eXAuRXJyb3IoIiIpOgogICAgZHVwCiAgICBieXRlY18xIC8vICIiCiAgICAhPQogICAgYnogZnVuZF9hZnRlcl9pZl9lbHNlQDMKICAgIGR1cAoKZnVuZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5mdW5kQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyAxMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZnVuZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAyMAogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19GVU5ERUQpCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDUwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMjIKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgZnVuZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5mdW5kQDQKCmZ1bmRfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMTYKICAgIC8vIGVycm9yID0gc2VsZi5mdW5kX2NoZWNrX2F1dGhvcml6YXRpb24oKQogICAgYiBmdW5kX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZ1bmRfY2hlY2tfYXV0aG9yaXphdGlvbkA4CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX3ZvdGVyc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX3ZvdGVyczoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9kYWVtb24oKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X2RhZW1vbgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIyOAogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfU1VCTUlUVEVELCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHB1c2hpbnQgMjAKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNDAKICAgIC8vIGlmIFR4bi5ncm91cF9pbmRleCA9PSAwOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGJueiB1bmFzc2lnbl92b3RlcnNfZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDQxLTEwNDIKICAgIC8vICMgQ2hlY2sgdGhhdCB0aGUgZW50aXJlIGdyb3VwIGNhbGxzIHRoZSBzYW1lIGFwcCBhbmQgbWV0aG9kCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMSwgR2xvYmFsLmdyb3VwX3NpemUpOgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgYnVyeSAzCiAgICBpbnRjXzEgLy8gMQogICAgYnVyeSA1Cgp1bmFzc2lnbl92b3RlcnNfZm9yX2hlYWRlckAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNDEtMTA0MgogICAgLy8gIyBDaGVjayB0aGF0IHRoZSBlbnRpcmUgZ3JvdXAgY2FsbHMgdGhlIHNhbWUgYXBwIGFuZCBtZXRob2QKICAgIC8vIGZvciBpIGluIHVyYW5nZSgxLCBHbG9iYWwuZ3JvdXBfc2l6ZSk6CiAgICBkaWcgNAogICAgZGlnIDMKICAgIDwKICAgIGJ6IHVuYXNzaWduX3ZvdGVyc19hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDQzCiAgICAvLyBzZWxmLmFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kKGkpCiAgICBkaWcgNAogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA0MS0xMDQyCiAgICAvLyAjIENoZWNrIHRoYXQgdGhlIGVudGlyZSBncm91cCBjYWxscyB0aGUgc2FtZSBhcHAgYW5kIG1ldGhvZAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKDEsIEdsb2JhbC5ncm91cF9zaXplKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIGIgdW5hc3NpZ25fdm90ZXJzX2Zvcl9oZWFkZXJAMwoKdW5hc3NpZ25fdm90ZXJzX2FmdGVyX2lmX2Vsc2VAODoKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDQKCnVuYXNzaWduX3ZvdGVyc19mb3JfaGVhZGVyQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA0OC0xMDQ5CiAgICAvLyAjIHJlbW92ZSB2b3RlcnMKICAgIC8vIGZvciB2b3RlciBpbiB2b3RlcnM6CiAgICBkaWcgMwogICAgZGlnIDEKICAgIDwKICAgIGJ6IHVuYXNzaWduX3ZvdGVyc19hZnRlcl9mb3JAMTQKICAgIGRpZyAxCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDQKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA1MAogICAgLy8gaWYgdm90ZXIgaW4gc2VsZi52b3RlcnM6CiAgICBieXRlYyAxOCAvLyAiViIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBidXJ5IDgKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogdW5hc3NpZ25fdm90ZXJzX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDUxCiAgICAvLyB2b3RlcyA9IHNlbGYudm90ZXJzW3ZvdGVyXQogICAgZGlnIDYKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVycyBlbnRyeSBleGlzdHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDUyCiAgICAvLyBzZWxmLl91bmFzc2lnbl92b3Rlcih2b3Rlciwgdm90ZXMpCiAgICBkaWcgNgogICAgc3dhcAogICAgY2FsbHN1YiBfdW5hc3NpZ25fdm90ZXIKCnVuYXNzaWduX3ZvdGVyc19hZnRlcl9pZl9lbHNlQDEyOgogICAgZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDQKICAgIGIgdW5hc3NpZ25fdm90ZXJzX2Zvcl9oZWFkZXJAOQoKdW5hc3NpZ25fdm90ZXJzX2FmdGVyX2ZvckAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdW5hc3NpZ25fdm90ZXJzX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNDUtMTA0NgogICAgLy8gIyBDaGVjayB0aGF0IHRoZSBmaXJzdCB0cmFuc2FjdGlvbiBpbiB0aGUgZ3JvdXAgY2FsbHMgdGhlIHNhbWUgYXBwIGFuZCBtZXRob2QKICAgIC8vIHNlbGYuYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2QoVUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2QKICAgIGIgdW5hc3NpZ25fdm90ZXJzX2FmdGVyX2lmX2Vsc2VAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmZpbmFsaXplOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNDQKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdHJ5X2NhbGwoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZWdpc3RyeV9jYWxsCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQ2CiAgICAvLyBpZiBzZWxmLmZpbmFsaXplZC52YWx1ZSBvciAoCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZpbmFsaXplZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNDYtMjUyCiAgICAvLyBpZiBzZWxmLmZpbmFsaXplZC52YWx1ZSBvciAoCiAgICAvLyAgICAgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19FTVBUWQogICAgLy8gICAgIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyAgICAgYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRlVOREVECiAgICAvLyAgICAgYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfQkxPQ0tFRAogICAgLy8gICAgIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICAvLyApOgogICAgYm56IGZpbmFsaXplX2lmX2JvZHlAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNDcKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI0Ny0yNTEKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0JMT0NLRUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBieiBmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQ4CiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19EUkFGVAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzMgLy8gMTAKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQ3LTI1MQogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19FTVBUWQogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRFJBRlQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0ZVTkRFRAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfQkxPQ0tFRAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfUkVKRUNURUQKICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNDkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0ZVTkRFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDUwCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI0Ny0yNTEKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0JMT0NLRUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBieiBmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjUwCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19CTE9DS0VECiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHB1c2hpbnQgNjAKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQ3LTI1MQogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19FTVBUWQogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRFJBRlQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0ZVTkRFRAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfQkxPQ0tFRAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfUkVKRUNURUQKICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNTEKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHB1c2hpbnQgNDAKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQ3LTI1MQogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19FTVBUWQogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRFJBRlQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0ZVTkRFRAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfQkxPQ0tFRAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfUkVKRUNURUQKICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VAMTYKCmZpbmFsaXplX2lmX2JvZHlAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjUzCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKGVyci5BUkNfNjVfUFJFRklYICsgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIGJ5dGVjIDIzIC8vICJFUlI6V3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIGJ1cnkgMQoKZmluYWxpemVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZmluYWxpemVfY2hlY2tfYXV0aG9yaXphdGlvbkAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDY2CiAgICAvLyBpZiBlcnJvciAhPSB0eXAuRXJyb3IoIiIpOgogICAgZHVwCiAgICBieXRlY18xIC8vICIiCiAgICAhPQogICAgYnogZmluYWxpemVfYWZ0ZXJfaWZfZWxzZUAzCiAgICBkdXAKCmZpbmFsaXplX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZpbmFsaXplQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyAxMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZmluYWxpemVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNjktMTA3MAogICAgLy8gIyBjaGVjayBubyBhc3NpZ25lZCB2b3RlcnMKICAgIC8vIGlmIHNlbGYuYXNzaWduZWRfbWVtYmVycy52YWx1ZSA+IDA6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzaWduZWRfbWVtYmVycyBleGlzdHMKICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNzEKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuVk9URVJTX0FTU0lHTkVEKQogICAgcHVzaGJ5dGVzICJFUlI6VGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBiIGZpbmFsaXplX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZpbmFsaXplQDgKCmZpbmFsaXplX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDczLTEwNzYKICAgIC8vICMgcmVmdW5kIHRoZSBsb2NrZWQgYW1vdW50IGZvciBEUkFGVCBwcm9wb3NhbHMKICAgIC8vICMgZm9yIFJFSkVDVEVEIHByb3Bvc2FscywgdGhlIGxvY2tlZCBhbW91bnQgaXMgYWxyZWFkeSByZWZ1bmRlZCBpbiB0aGUgc2NydXRpbnkgbWV0aG9kCiAgICAvLyAjIGZvciBFTVBUWSwgRlVOREVELCBvciBCTE9DS0VEIHByb3Bvc2FscywgdGhlIGxvY2tlZCBhbW91bnQgaXMgbm90IHJlZnVuZGFibGUKICAgIC8vIGlmIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfRFJBRlQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGludGNfMyAvLyAxMAogICAgPT0KICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNzgKICAgIC8vIHJlY2VpdmVyPXNlbGYucHJvcG9zZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDc3LTEwNzkKICAgIC8vIHNlbGYudHJhbnNmZXJfbG9ja2VkX2Ftb3VudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnByb3Bvc2VyLnZhbHVlLAogICAgLy8gKQogICAgY2FsbHN1YiB0cmFuc2Zlcl9sb2NrZWRfYW1vdW50CgpmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA4MAogICAgLy8gcmVnX2FwcCA9IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA4MgogICAgLy8gcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwODMKICAgIC8vIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwODQKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwODMtMTA4NAogICAgLy8gYW1vdW50PUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlLAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwODEtMTA4NQogICAgLy8gc2VsZi5wYXkoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vICAgICAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UsCiAgICAvLyApCiAgICBjYWxsc3ViIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwODYKICAgIC8vIHNlbGYuZmluYWxpemVkLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWNfMiAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA4OAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzEgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiBmaW5hbGl6ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZUA4CgpmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI1NQogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNjUKICAgIC8vIGVycm9yID0gc2VsZi5maW5hbGl6ZV9jaGVja19hdXRob3JpemF0aW9uKCkKICAgIGIgZmluYWxpemVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZmluYWxpemVfY2hlY2tfYXV0aG9yaXphdGlvbkAxNwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kZWxldGVbcm91dGluZ10oKSAtPiB2b2lkOgpkZWxldGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjU4CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X2RhZW1vbigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfZGFlbW9uCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjU5CiAgICAvLyBhc3NlcnQgc2VsZi5maW5hbGl6ZWQudmFsdWUsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgYXNzZXJ0IC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTAyLTExMDMKICAgIC8vICMgZGVsZXRlIG1ldGFkYXRhIGJveCBpZiBpdCBleGlzdHMKICAgIC8vIGRlbCBzZWxmLm1ldGFkYXRhLnZhbHVlCiAgICBieXRlYyA5IC8vICJNIgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEwNQogICAgLy8gcmVnX2FwcCA9IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEwNwogICAgLy8gcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMDgKICAgIC8vIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTA2LTExMDkKICAgIC8vIHNlbGYucGF5KAogICAgLy8gICAgIHJlY2VpdmVyPXJlZ19hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlLAogICAgLy8gKQogICAgY2FsbHN1YiBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz0oIkRlbGV0ZUFwcGxpY2F0aW9uIiwpKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfc3RhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEyMAogICAgLy8gcHJvcG9zZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjEKICAgIC8vIHJlZ2lzdHJ5X2FwcF9pZD1zZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjIKICAgIC8vIHRpdGxlPXNlbGYudGl0bGUudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzQgLy8gMHg3NDY5NzQ2YzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGl0bGUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEyMwogICAgLy8gb3Blbl90cz1zZWxmLm9wZW5fdHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjcgLy8gMHg2ZjcwNjU2ZTVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3Blbl90cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTI0CiAgICAvLyBzdWJtaXNzaW9uX3RzPXNlbGYuc3VibWlzc2lvbl90cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMiAvLyAweDczNzU2MjZkNjk3MzczNjk2ZjZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdWJtaXNzaW9uX3RzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjUKICAgIC8vIHZvdGVfb3Blbl90cz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOCAvLyAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZV9vcGVuX3RzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjYKICAgIC8vIHN0YXR1cz1zZWxmLnN0YXR1cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjcKICAgIC8vIGZpbmFsaXplZD1zZWxmLmZpbmFsaXplZC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjgKICAgIC8vIGZ1bmRpbmdfY2F0ZWdvcnk9c2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vIDB4NjY3NTZlNjQ2OTZlNjc1ZjYzNjE3NDY1Njc2ZjcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nX2NhdGVnb3J5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjkKICAgIC8vIGZvY3VzPWFyYzQuVUludDgoc2VsZi5mb2N1cy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzUgLy8gMHg2NjZmNjM3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZm9jdXMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMzAKICAgIC8vIGZ1bmRpbmdfdHlwZT1zZWxmLmZ1bmRpbmdfdHlwZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOSAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY3NDc5NzA2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmdfdHlwZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTMxCiAgICAvLyByZXF1ZXN0ZWRfYW1vdW50PXNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAweDcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdGVkX2Ftb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTMyCiAgICAvLyBsb2NrZWRfYW1vdW50PXNlbGYubG9ja2VkX2Ftb3VudC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAweDZjNmY2MzZiNjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubG9ja2VkX2Ftb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTMzCiAgICAvLyBjb21taXR0ZWVfaWQ9c2VsZi5jb21taXR0ZWVfaWQudmFsdWUuY29weSgpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMzQKICAgIC8vIGNvbW1pdHRlZV9tZW1iZXJzPXNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEzNQogICAgLy8gY29tbWl0dGVlX3ZvdGVzPXNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3NjZmNzQ2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX3ZvdGVzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMzYKICAgIC8vIHZvdGVkX21lbWJlcnM9c2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVkX21lbWJlcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEzNwogICAgLy8gYm95Y290dGVkX21lbWJlcnM9c2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAweDYyNmY3OTYzNmY3NDc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3ljb3R0ZWRfbWVtYmVycyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTM4CiAgICAvLyBhcHByb3ZhbHM9c2VsZi5hcHByb3ZhbHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFscyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTM5CiAgICAvLyByZWplY3Rpb25zPXNlbGYucmVqZWN0aW9ucy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWplY3Rpb25zIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNDAKICAgIC8vIG51bGxzPXNlbGYubnVsbHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gMHg2ZTc1NmM2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubnVsbHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTExOS0xMTQxCiAgICAvLyByZXR1cm4gdHlwLlByb3Bvc2FsVHlwZWRHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBwcm9wb3Nlcj1zZWxmLnByb3Bvc2VyLnZhbHVlLAogICAgLy8gICAgIHJlZ2lzdHJ5X2FwcF9pZD1zZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwKICAgIC8vICAgICB0aXRsZT1zZWxmLnRpdGxlLnZhbHVlLAogICAgLy8gICAgIG9wZW5fdHM9c2VsZi5vcGVuX3RzLnZhbHVlLAogICAgLy8gICAgIHN1Ym1pc3Npb25fdHM9c2VsZi5zdWJtaXNzaW9uX3RzLnZhbHVlLAogICAgLy8gICAgIHZvdGVfb3Blbl90cz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSwKICAgIC8vICAgICBzdGF0dXM9c2VsZi5zdGF0dXMudmFsdWUsCiAgICAvLyAgICAgZmluYWxpemVkPXNlbGYuZmluYWxpemVkLnZhbHVlLAogICAgLy8gICAgIGZ1bmRpbmdfY2F0ZWdvcnk9c2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlLAogICAgLy8gICAgIGZvY3VzPWFyYzQuVUludDgoc2VsZi5mb2N1cy52YWx1ZSksCiAgICAvLyAgICAgZnVuZGluZ190eXBlPXNlbGYuZnVuZGluZ190eXBlLnZhbHVlLAogICAgLy8gICAgIHJlcXVlc3RlZF9hbW91bnQ9c2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgLy8gICAgIGxvY2tlZF9hbW91bnQ9c2VsZi5sb2NrZWRfYW1vdW50LnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9pZD1zZWxmLmNvbW1pdHRlZV9pZC52YWx1ZS5jb3B5KCksCiAgICAvLyAgICAgY29tbWl0dGVlX21lbWJlcnM9c2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfdm90ZXM9c2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsCiAgICAvLyAgICAgdm90ZWRfbWVtYmVycz1zZWxmLnZvdGVkX21lbWJlcnMudmFsdWUsCiAgICAvLyAgICAgYm95Y290dGVkX21lbWJlcnM9c2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSwKICAgIC8vICAgICBhcHByb3ZhbHM9c2VsZi5hcHByb3ZhbHMudmFsdWUsCiAgICAvLyAgICAgcmVqZWN0aW9ucz1zZWxmLnJlamVjdGlvbnMudmFsdWUsCiAgICAvLyAgICAgbnVsbHM9c2VsZi5udWxscy52YWx1ZSwKICAgIC8vICkKICAgIHVuY292ZXIgMTkKICAgIGl0b2IKICAgIHVuY292ZXIgMjAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDE5CiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHB1c2hieXRlcyAweDAwYzQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxOQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE4CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTcKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNgogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlYyAxOSAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAxNwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDEyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTEKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgMTAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X3ZvdGVyX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3Rlcl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTU1CiAgICAvLyBleGlzdHMgPSB2b3Rlcl9hZGRyZXNzIGluIHNlbGYudm90ZXJzCiAgICBieXRlYyAxOCAvLyAiViIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE1NgogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3ZvdGVyX2JveF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNTcKICAgIC8vIHZvdGVzID0gc2VsZi52b3RlcnNbdm90ZXJfYWRkcmVzc10KICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlcnMgZW50cnkgZXhpc3RzCiAgICBidG9pCgpnZXRfdm90ZXJfYm94X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjIDE5IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjIDEwIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfdm90ZXJfYm94X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNTkKICAgIC8vIHZvdGVzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYiBnZXRfdm90ZXJfYm94X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfdm90aW5nX3N0YXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGluZ19zdGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTgzCiAgICAvLyBxdW9ydW1fdm90ZXJzPWFyYzQuVUludDMyKHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjEgLy8gMHg3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1b3J1bV90aHJlc2hvbGQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExODQKICAgIC8vIHdlaWdodGVkX3F1b3J1bV92b3Rlcz1hcmM0LlVJbnQzMihzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIyIC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTg1CiAgICAvLyB0b3RhbF92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTg2CiAgICAvLyB0b3RhbF9ib3ljb3R0PWFyYzQuVUludDMyKHNlbGYuYm95Y290dGVkX21lbWJlcnMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vIDB4NjI2Zjc5NjM2Zjc0NzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveWNvdHRlZF9tZW1iZXJzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTg3CiAgICAvLyB0b3RhbF9hcHByb3ZhbHM9YXJjNC5VSW50MzIoc2VsZi5hcHByb3ZhbHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg2MTcwNzA3MjZmNzY2MTZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZhbHMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExODgKICAgIC8vIHRvdGFsX3JlamVjdGlvbnM9YXJjNC5VSW50MzIoc2VsZi5yZWplY3Rpb25zLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWplY3Rpb25zIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTg5CiAgICAvLyB0b3RhbF9udWxscz1hcmM0LlVJbnQzMihzZWxmLm51bGxzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAweDZlNzU2YzZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5udWxscyBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE5MAogICAgLy8gcXVvcnVtX3JlYWNoZWQ9c2VsZi5pc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQoKSwKICAgIGNhbGxzdWIgaXNfcXVvcnVtX3ZvdGVyc19yZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE5MQogICAgLy8gd2VpZ2h0ZWRfcXVvcnVtX3JlYWNoZWQ9c2VsZi5pc193ZWlnaHRlZF9xdW9ydW1fdm90ZXNfcmVhY2hlZCgpLAogICAgY2FsbHN1YiBpc193ZWlnaHRlZF9xdW9ydW1fdm90ZXNfcmVhY2hlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExOTIKICAgIC8vIG1ham9yaXR5X2FwcHJvdmVkPXNlbGYuaGFzX21ham9yaXR5X2FwcHJvdmVkKCksCiAgICBjYWxsc3ViIGhhc19tYWpvcml0eV9hcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExOTMKICAgIC8vIHBsZWJpc2NpdGU9c2VsZi5pc19wbGViaXNjaXRlKCksCiAgICBjYWxsc3ViIGlzX3BsZWJpc2NpdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTgyLTExOTQKICAgIC8vIHJldHVybiB0eXAuVm90aW5nU3RhdGUoCiAgICAvLyAgICAgcXVvcnVtX3ZvdGVycz1hcmM0LlVJbnQzMihzZWxmLnF1b3J1bV90aHJlc2hvbGQudmFsdWUpLAogICAgLy8gICAgIHdlaWdodGVkX3F1b3J1bV92b3Rlcz1hcmM0LlVJbnQzMihzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUpLAogICAgLy8gICAgIHRvdGFsX3ZvdGVycz1hcmM0LlVJbnQzMihzZWxmLnZvdGVkX21lbWJlcnMudmFsdWUpLAogICAgLy8gICAgIHRvdGFsX2JveWNvdHQ9YXJjNC5VSW50MzIoc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfYXBwcm92YWxzPWFyYzQuVUludDMyKHNlbGYuYXBwcm92YWxzLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9yZWplY3Rpb25zPWFyYzQuVUludDMyKHNlbGYucmVqZWN0aW9ucy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfbnVsbHM9YXJjNC5VSW50MzIoc2VsZi5udWxscy52YWx1ZSksCiAgICAvLyAgICAgcXVvcnVtX3JlYWNoZWQ9c2VsZi5pc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQoKSwKICAgIC8vICAgICB3ZWlnaHRlZF9xdW9ydW1fcmVhY2hlZD1zZWxmLmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkKCksCiAgICAvLyAgICAgbWFqb3JpdHlfYXBwcm92ZWQ9c2VsZi5oYXNfbWFqb3JpdHlfYXBwcm92ZWQoKSwKICAgIC8vICAgICBwbGViaXNjaXRlPXNlbGYuaXNfcGxlYmlzY2l0ZSgpLAogICAgLy8gKQogICAgdW5jb3ZlciAxMAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIGJ5dGVjIDE5IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDYKICAgIHNldGJpdAogICAgaW50Y18xIC8vIDEKICAgIHVuY292ZXIgNQogICAgc2V0Yml0CiAgICBwdXNoaW50IDIKICAgIHVuY292ZXIgNAogICAgc2V0Yml0CiAgICBwdXNoaW50IDMKICAgIHVuY292ZXIgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDEwIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKGdsb2JhbF9zdGF0ZV9rZXk6IGJ5dGVzKSAtPiB1aW50NjQ6CmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE5NwogICAgLy8gZGVmIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKHNlbGYsIGdsb2JhbF9zdGF0ZV9rZXk6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxOTkKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlLCBnbG9iYWxfc3RhdGVfa2V5CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxOTgtMjAwCiAgICAvLyB2YWx1ZSwgZXhpc3RzID0gQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUsIGdsb2JhbF9zdGF0ZV9rZXkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMDEKICAgIC8vIGFzc2VydCBleGlzdHMsIGVyci5NSVNTSU5HX0NPTkZJRwogICAgYXNzZXJ0IC8vIE1pc3NpbmcgQ29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjAyCiAgICAvLyByZXR1cm4gdmFsdWUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoZ2xvYmFsX3N0YXRlX2tleTogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjA0CiAgICAvLyBkZWYgZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKHNlbGYsIGdsb2JhbF9zdGF0ZV9rZXk6IEJ5dGVzKSAtPiBCeXRlczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIwNgogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUsIGdsb2JhbF9zdGF0ZV9rZXkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIwNS0yMDcKICAgIC8vIHZhbHVlLCBleGlzdHMgPSBBcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlLCBnbG9iYWxfc3RhdGVfa2V5CiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjA4CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuTUlTU0lOR19DT05GSUcKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIwOQogICAgLy8gcmV0dXJuIHZhbHVlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuaXNfdm90aW5nX29wZW4oKSAtPiB1aW50NjQ6CmlzX3ZvdGluZ19vcGVuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gZWxhcHNlZF92b3RpbmdfZHVyYXRpb24gPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCAtIHNlbGYudm90ZV9vcGVuX3RzLnZhbHVlCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjggLy8gMHg3NjZmNzQ2NTVmNmY3MDY1NmU2OTZlNjc1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVfb3Blbl90cyBleGlzdHMKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMTMKICAgIC8vIHJldHVybiBlbGFwc2VkX3ZvdGluZ19kdXJhdGlvbiA8PSBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMwIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uIGV4aXN0cwogICAgPD0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5pc19ib3ljb3R0KHZvdGVzOiB1aW50NjQsIGFwcHJvdmFsczogdWludDY0LCByZWplY3Rpb25zOiB1aW50NjQpIC0+IHVpbnQ2NDoKaXNfYm95Y290dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzIKICAgIC8vIGRlZiBpc19ib3ljb3R0KHNlbGYsIHZvdGVzOiBVSW50NjQsIGFwcHJvdmFsczogVUludDY0LCByZWplY3Rpb25zOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzMKICAgIC8vIHJldHVybiBhcHByb3ZhbHMgPT0gdm90ZXMgYW5kIHJlamVjdGlvbnMgPT0gdm90ZXMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0zCiAgICA9PQogICAgYnogaXNfYm95Y290dF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0zCiAgICA9PQogICAgYnogaXNfYm95Y290dF9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCmlzX2JveWNvdHRfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzMKICAgIC8vIHJldHVybiBhcHByb3ZhbHMgPT0gdm90ZXMgYW5kIHJlamVjdGlvbnMgPT0gdm90ZXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5pc19wbGViaXNjaXRlKCkgLT4gdWludDY0Ogppc19wbGViaXNjaXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gcmV0dXJuIHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSA9PSBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAweDc2NmY3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZWRfbWVtYmVycyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWVtYmVycyBleGlzdHMKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3NlcigpIC0+IHZvaWQ6CmFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQ1CiAgICAvLyBhc3NlcnQgc2VsZi5pc19wcm9wb3NlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3Byb3Bvc2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQ3CiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0RSQUZUIGFuZCBub3Qgc2VsZi5maW5hbGl6ZWQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18zIC8vIDEwCiAgICA9PQogICAgYnogYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3Nlcl9ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgYm56IGFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXJfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3Nlcl9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQ2LTM0OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0RSQUZUIGFuZCBub3Qgc2VsZi5maW5hbGl6ZWQudmFsdWUKICAgIC8vICksIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIGFzc2VydCAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCiAgICByZXRzdWIKCmFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXJfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3Nlcl9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuaXNfcHJvcG9zZXIoKSAtPiB1aW50NjQ6CmlzX3Byb3Bvc2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ1MgogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gc2VsZi5wcm9wb3Nlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gMHg3MDcyNmY3MDZmNzM2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXIgZXhpc3RzCiAgICA9PQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmlzX3hnb3ZfZGFlbW9uKCkgLT4gdWludDY0Ogppc194Z292X2RhZW1vbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NjAKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDYxCiAgICAvLyBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9YR09WX0RBRU1PTikpCiAgICBieXRlYyAzOSAvLyAweDc4Njc2Zjc2NWY2NDYxNjU2ZDZmNmUKICAgIGNhbGxzdWIgZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDYwLTQ2MgogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gQWNjb3VudCgKICAgIC8vICAgICBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9YR09WX0RBRU1PTikpCiAgICAvLyApCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICA9PQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmlzX3JlZ2lzdHJ5X2NhbGwoKSAtPiB1aW50NjQ6CmlzX3JlZ2lzdHJ5X2NhbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDY1CiAgICAvLyByZXR1cm4gR2xvYmFsLmNhbGxlcl9hcHBsaWNhdGlvbl9pZCA9PSBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZQogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwX2lkIGV4aXN0cwogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5wYXkocmVjZWl2ZXI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKcGF5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ2NwogICAgLy8gZGVmIHBheShzZWxmLCByZWNlaXZlcjogQWNjb3VudCwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NjgtNDcyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVjZWl2ZXIsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9VUludDY0KDApLCAgIyBlbmZvcmNlcyB0aGUgc2VuZGVyIHRvIHBheSB0aGUgZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NjgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NzEKICAgIC8vIGZlZT1VSW50NjQoMCksICAjIGVuZm9yY2VzIHRoZSBzZW5kZXIgdG8gcGF5IHRoZSBmZWUKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ2OC00NzIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZWNlaXZlciwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT1VSW50NjQoMCksICAjIGVuZm9yY2VzIHRoZSBzZW5kZXIgdG8gcGF5IHRoZSBmZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudHJhbnNmZXJfbG9ja2VkX2Ftb3VudChyZWNlaXZlcjogYnl0ZXMpIC0+IHZvaWQ6CnRyYW5zZmVyX2xvY2tlZF9hbW91bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDc0CiAgICAvLyBkZWYgdHJhbnNmZXJfbG9ja2VkX2Ftb3VudChzZWxmLCByZWNlaXZlcjogQWNjb3VudCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gc2VsZi5wYXkocmVjZWl2ZXIsIHNlbGYubG9ja2VkX2Ftb3VudC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAweDZjNmY2MzZiNjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubG9ja2VkX2Ftb3VudCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NzYKICAgIC8vIHNlbGYubG9ja2VkX2Ftb3VudC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMjAgLy8gMHg2YzZmNjM2YjY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2QoZ3JvdXBfaW5kZXg6IHVpbnQ2NCkgLT4gdm9pZDoKYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDc4CiAgICAvLyBkZWYgYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2Qoc2VsZiwgZ3JvdXBfaW5kZXg6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gR1R4bi5hcHBsaWNhdGlvbl9pZChncm91cF9pbmRleCkgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQXBwbGljYXRpb25JRAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ3OS00ODEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR1R4bi5hcHBsaWNhdGlvbl9pZChncm91cF9pbmRleCkgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQKICAgIC8vICksIGVyci5XUk9OR19BUFBfSUQKICAgIGFzc2VydCAvLyBXcm9uZyBBcHAgSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0ODIKICAgIC8vIGFzc2VydCBHVHhuLmFwcGxpY2F0aW9uX2FyZ3MoZ3JvdXBfaW5kZXgsIDApID09IFR4bi5hcHBsaWNhdGlvbl9hcmdzKAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhuc2EgQXBwbGljYXRpb25BcmdzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0ODItNDg0CiAgICAvLyBhc3NlcnQgR1R4bi5hcHBsaWNhdGlvbl9hcmdzKGdyb3VwX2luZGV4LCAwKSA9PSBUeG4uYXBwbGljYXRpb25fYXJncygKICAgIC8vICAgICAwCiAgICAvLyApLCBlcnIuV1JPTkdfTUVUSE9EX0NBTEwKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgTWV0aG9kIENhbGwKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5pc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQoKSAtPiB1aW50NjQ6CmlzX3F1b3J1bV92b3RlcnNfcmVhY2hlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NDUtNTQ4CiAgICAvLyAjIEEgY2F0ZWdvcnkgZGVwZW5kZW50IHF1b3J1bSBvZiBhbGwgeEdvdiBWb3RpbmcgQ29tbWl0dGVlICgxIHhHb3YsIDEgdm90ZSkgaXMgcmVhY2hlZC4KICAgIC8vICMgTnVsbCB2b3RlcyBhZmZlY3QgdGhpcyBxdW9ydW0uCiAgICAvLyAjIEJveWNvdHQgdm90ZXMsIGkuZS4gaW52YWxpZCwgZG8gbm90IGFmZmVjdCB0aGlzIHF1b3J1bS4KICAgIC8vIHF1b3J1bV9kZWZpbmVkID0gc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlID4gMAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vIDB4NzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdW9ydW1fdGhyZXNob2xkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU1MAogICAgLy8gc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlIC0gc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGVkX21lbWJlcnMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm95Y290dGVkX21lbWJlcnMgZXhpc3RzCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTUwLTU1MQogICAgLy8gICAgIHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSAtIHNlbGYuYm95Y290dGVkX21lbWJlcnMudmFsdWUKICAgIC8vICkgPj0gc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlIGFuZCBxdW9ydW1fZGVmaW5lZAogICAgZGlnIDEKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTQ5LTU1MQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBzZWxmLnZvdGVkX21lbWJlcnMudmFsdWUgLSBzZWxmLmJveWNvdHRlZF9tZW1iZXJzLnZhbHVlCiAgICAvLyApID49IHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSBhbmQgcXVvcnVtX2RlZmluZWQKICAgICYmCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuaXNfd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzX3JlYWNoZWQoKSAtPiB1aW50NjQ6CmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU1NC01NTYKICAgIC8vICMgQSBjYXRlZ29yeSBkZXBlbmRlbnQgd2VpZ2h0ZWQgcXVvcnVtIG9mIGFsbCB4R292IFZvdGluZyBDb21taXR0ZWUgdm90aW5nIHBvd2VyICgxIHZvdGUpIGlzIHJlYWNoZWQuCiAgICAvLyAjIE51bGwgdm90ZXMgYWZmZWN0IHRoaXMgcXVvcnVtLgogICAgLy8gd2VpZ2h0ZWRfcXVvcnVtX2RlZmluZWQgPSBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUgPiAwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTU3CiAgICAvLyB0b3RhbF92b3RlcyA9IHNlbGYuYXBwcm92YWxzLnZhbHVlICsgc2VsZi5yZWplY3Rpb25zLnZhbHVlICsgc2VsZi5udWxscy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg2MTcwNzA3MjZmNzY2MTZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hcHByb3ZhbHMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcyNjU2YTY1NjM3NDY5NmY2ZTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVqZWN0aW9ucyBleGlzdHMKICAgICsKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAweDZlNzU2YzZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5udWxscyBleGlzdHMKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NTkKICAgIC8vIHRvdGFsX3ZvdGVzID49IHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZC52YWx1ZQogICAgZGlnIDEKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTU5LTU2MAogICAgLy8gdG90YWxfdm90ZXMgPj0gc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkLnZhbHVlCiAgICAvLyBhbmQgd2VpZ2h0ZWRfcXVvcnVtX2RlZmluZWQKICAgICYmCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTU4LTU2MQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICB0b3RhbF92b3RlcyA+PSBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUKICAgIC8vICAgICBhbmQgd2VpZ2h0ZWRfcXVvcnVtX2RlZmluZWQKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5oYXNfbWFqb3JpdHlfYXBwcm92ZWQoKSAtPiB1aW50NjQ6Cmhhc19tYWpvcml0eV9hcHByb3ZlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NjQtNTY2CiAgICAvLyAjIFRoZSByZWxhdGl2ZSBtYWpvcml0eSBvZiBBcHByb3ZlZCBvdmVyIFJlamVjdGVkIHZvdGVzIGlzIHJlYWNoZWQuCiAgICAvLyAjIE51bGwgdm90ZXMgZG8gbm90IGFmZmVjdCB0aGUgcmVsYXRpdmUgbWFqb3JpdHkuCiAgICAvLyByZXR1cm4gc2VsZi5hcHByb3ZhbHMudmFsdWUgPiBzZWxmLnJlamVjdGlvbnMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gMHg3MjY1NmE2NTYzNzQ2OTZmNmU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlamVjdGlvbnMgZXhpc3RzCiAgICA+CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuX3VuYXNzaWduX3ZvdGVyKHZvdGVyOiBieXRlcywgdm90aW5nX3Bvd2VyOiB1aW50NjQpIC0+IHZvaWQ6Cl91bmFzc2lnbl92b3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3NzkKICAgIC8vIGRlZiBfdW5hc3NpZ25fdm90ZXIoc2VsZiwgdm90ZXI6IEFjY291bnQsIHZvdGluZ19wb3dlcjogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzEzCiAgICAvLyBhc3NlcnQgdm90ZXIgaW4gc2VsZi52b3RlcnMsIGVyci5WT1RFUl9OT1RfRk9VTkQKICAgIGJ5dGVjIDE4IC8vICJWIgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVm90ZXIgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzE0CiAgICAvLyBhc3NlcnQgdm90aW5nX3Bvd2VyID4gMCwgZXJyLklOVkFMSURfVk9USU5HX1BPV0VSCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBJbnZhbGlkIFZvdGluZyBQb3dlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc4MgogICAgLy8gc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjIDUgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3ODMKICAgIC8vIHNlbGYuYXNzaWduZWRfdm90ZXMudmFsdWUgLT0gdm90aW5nX3Bvd2VyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY3NjZmNzQ2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzaWduZWRfdm90ZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGJ5dGVjIDE3IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNzY2Zjc0NjU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3ODQKICAgIC8vIGRlbCBzZWxmLnZvdGVyc1t2b3Rlcl0KICAgIGJveF9kZWwKICAgIHBvcAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [2005, 2457, 3074, 4104], "errorMessage": "Address length is 32 bytes"}, {"pc": [1851], "errorMessage": "Empty payload"}, {"pc": [2148, 4252], "errorMessage": "Invalid Voting Power"}, {"pc": [1187], "errorMessage": "Locked amount is incorrect"}, {"pc": [1300, 1306, 3993, 4006], "errorMessage": "Missing Config"}, {"pc": [1995], "errorMessage": "Missing Metadata"}, {"pc": [1057, 1842, 1971, 2780], "errorMessage": "Registry's non-admin methods are paused"}, {"pc": [1124], "errorMessage": "Requested amount is less than the minimum requested amount"}, {"pc": [1128], "errorMessage": "Requested amount is more than the maximum requested amount"}, {"pc": [3091], "errorMessage": "There are voters assigned to this proposal"}, {"pc": [1989], "errorMessage": "Too early"}, {"pc": [937, 1061, 1898, 2059, 2324, 2911, 3076, 3150, 3228, 3341, 3534, 4061], "errorMessage": "Unauthorized"}, {"pc": [2145], "errorMessage": "Voter Already Assigned"}, {"pc": [4249], "errorMessage": "Voter not found"}, {"pc": [2802], "errorMessage": "Voting Ongoing"}, {"pc": [2206], "errorMessage": "Voting Power Mismatch"}, {"pc": [4165], "errorMessage": "Wrong App ID"}, {"pc": [1105], "errorMessage": "Wrong Funding Type"}, {"pc": [624], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [630], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [634], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [638], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [4175], "errorMessage": "Wrong Method Call"}, {"pc": [1077, 2067, 2788, 3084, 3236, 3539, 4079], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [1180], "errorMessage": "Wrong Receiver"}, {"pc": [1173], "errorMessage": "Wrong Sender"}, {"pc": [1085, 1088], "errorMessage": "Wrong Title length"}, {"pc": [3508, 3513, 3556], "errorMessage": "account funded"}, {"pc": [3106, 3503, 3551], "errorMessage": "application exists"}, {"pc": [2523, 2636, 3663, 3884, 4207, 4229], "errorMessage": "check self.approvals exists"}, {"pc": [2157, 2185, 3089, 3425, 4257], "errorMessage": "check self.assigned_members exists"}, {"pc": [2168, 2199, 4268], "errorMessage": "check self.assigned_votes exists"}, {"pc": [2421, 2509, 3658, 3870, 4191], "errorMessage": "check self.boycotted_members exists"}, {"pc": [3638], "errorMessage": "check self.committee_id exists"}, {"pc": [1463, 2190, 3643, 4055], "errorMessage": "check self.committee_members exists"}, {"pc": [1558, 2204, 3648], "errorMessage": "check self.committee_votes exists"}, {"pc": [2015], "errorMessage": "check self.daemon_ops_funding_bps exists"}, {"pc": [1987], "errorMessage": "check self.discussion_duration exists"}, {"pc": [1072, 1911, 2935, 3345, 3538, 3598, 4074], "errorMessage": "check self.finalized exists"}, {"pc": [3608], "errorMessage": "check self.focus exists"}, {"pc": [1298, 1356, 1599, 3603], "errorMessage": "check self.funding_category exists"}, {"pc": [1579, 3623], "errorMessage": "check self.funding_type exists"}, {"pc": [3633, 4143], "errorMessage": "check self.locked_amount exists"}, {"pc": [1876], "errorMessage": "check self.metadata exists"}, {"pc": [1994], "errorMessage": "check self.metadata_uploaded exists"}, {"pc": [2551, 2656, 3673, 3912, 4218], "errorMessage": "check self.nulls exists"}, {"pc": [2010], "errorMessage": "check self.open_proposal_fee exists"}, {"pc": [1981, 3580], "errorMessage": "check self.open_ts exists"}, {"pc": [1171, 1944, 2868, 3139, 3492, 3565, 4090], "errorMessage": "check self.proposer exists"}, {"pc": [2230, 3828, 4181], "errorMessage": "check self.quorum_threshold exists"}, {"pc": [3103, 3500, 3548, 3570, 3989, 4002, 4113], "errorMessage": "check self.registry_app_id exists"}, {"pc": [2537, 2646, 3668, 3898, 4212, 4234], "errorMessage": "check self.rejections exists"}, {"pc": [1305, 1449, 1544, 1594, 3628], "errorMessage": "check self.requested_amount exists"}, {"pc": [1065, 1902, 2063, 2328, 2784, 2915, 2925, 3080, 3154, 3232, 3352, 3359, 3368, 3378, 3388, 3483, 3594, 4065], "errorMessage": "check self.status exists"}, {"pc": [3585], "errorMessage": "check self.submission_ts exists"}, {"pc": [3575], "errorMessage": "check self.title exists"}, {"pc": [3590, 4014], "errorMessage": "check self.vote_open_ts exists"}, {"pc": [2400, 2495, 3653, 3856, 4050, 4186], "errorMessage": "check self.voted_members exists"}, {"pc": [2391, 2673, 3013, 3311, 3803], "errorMessage": "check self.voters entry exists"}, {"pc": [2222, 4020], "errorMessage": "check self.voting_duration exists"}, {"pc": [2244, 3842, 4202], "errorMessage": "check self.weighted_quorum_threshold exists"}, {"pc": [2127, 2988, 3291], "errorMessage": "index access is out of bounds"}, {"pc": [1011, 1813, 2042, 2895, 3212], "errorMessage": "invalid array length header"}, {"pc": [1833, 3047], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [2907, 3224], "errorMessage": "invalid number of bytes for arc4.dynamic_array<account>"}, {"pc": [1019, 1821], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [2055], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.CommitteeMember>"}, {"pc": [934, 2300, 3786], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [1031, 1041, 2309, 2319], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1050], "errorMessage": "invalid number of bytes for arc4.uint8"}, {"pc": [1586, 1606, 2236, 2250, 2465, 2476, 2487, 2501, 2515, 2529, 2543, 2557, 3615, 3834, 3848, 3862, 3876, 3890, 3904, 3918], "errorMessage": "overflow"}, {"pc": [1005], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "address", "desc": "Address of the proposer", "name": "proposer"}], "name": "create", "returns": {"type": "void"}, "desc": "Create a new proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "Commitment payment transaction from the proposer to the contract", "name": "payment"}, {"type": "string", "desc": "Proposal title, max TITLE_MAX_BYTES bytes", "name": "title"}, {"type": "uint64", "desc": "Funding type (Proactive / Retroactive)", "name": "funding_type"}, {"type": "uint64", "desc": "Requested amount in microAlgos", "name": "requested_amount"}, {"type": "uint8", "desc": "Proposal focus area", "name": "focus"}], "name": "open", "returns": {"type": "void"}, "desc": "Open the first draft of the proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "uint8", "name": "funding_type"}, {"type": "uint64", "name": "requested_amount"}, {"type": "uint8", "name": "category"}, {"type": "uint64", "name": "round"}], "name": "Opened", "desc": "The Proposal has been opened"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "desc": "Metadata payload", "name": "payload"}, {"type": "bool", "desc": "True if this is the first upload call in a group transaction", "name": "is_first_in_group"}], "name": "upload_metadata", "returns": {"type": "void"}, "desc": "Upload the proposal metadata.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "drop", "returns": {"type": "string"}, "desc": "Drop the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "submit", "returns": {"type": "void"}, "desc": "submit the proposal. If the Committee has a Merkle root, the voting opens\nright away, otherwise once the xGov Daemon has assigned the voters.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "uint64", "name": "vote_opening"}, {"type": "uint64", "name": "vote_closing"}, {"type": "uint32", "name": "quorum_voters"}, {"type": "uint32", "name": "weighted_quorum_votes"}, {"type": "uint64", "name": "round"}], "name": "Submitted", "desc": "The Proposal has been submitted for voting"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "desc": "List of voter addresses with their voting power", "name": "voters"}], "name": "assign_voters", "returns": {"type": "void"}, "desc": "Assign multiple voters to the proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "uint64", "name": "vote_opening"}, {"type": "uint64", "name": "vote_closing"}, {"type": "uint32", "name": "quorum_voters"}, {"type": "uint32", "name": "weighted_quorum_votes"}, {"type": "uint64", "name": "round"}], "name": "Submitted", "desc": "The Proposal has been submitted for voting"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "desc": "List of voter addresses with their voting power", "name": "voters"}], "name": "assign_voters_to_buckets", "returns": {"type": "void"}, "desc": "Assign multiple voters to the proposal, packed in bucket boxes.\nVoters are stored in `ceil(committee_members / VOTER_BUCKET_MEMBERS)` bucket boxes of sorted (address, votes) records, a bucket covering a range of the address 2-byte prefix. Voters of a bucket must be assigned by ascending address, up to `VOTER_BUCKET_MAX_MEMBERS` so that a bucket stays within the box I/O budget of two box references. A proposal uses either voter boxes or voter buckets.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "uint64", "name": "vote_opening"}, {"type": "uint64", "name": "vote_closing"}, {"type": "uint32", "name": "quorum_voters"}, {"type": "uint32", "name": "weighted_quorum_votes"}, {"type": "uint64", "name": "round"}], "name": "Submitted", "desc": "The Proposal has been submitted for voting"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Voter address", "name": "voter"}, {"type": "uint64", "desc": "Number of approvals", "name": "approvals"}, {"type": "uint64", "desc": "Number of rejections", "name": "rejections"}], "name": "vote", "returns": {"type": "string"}, "desc": "Vote on the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint32", "name": "approvals"}, {"type": "uint32", "name": "rejections"}, {"type": "uint32", "name": "nulls"}, {"type": "bool", "name": "boycotted"}, {"type": "uint32", "name": "total_voters"}, {"type": "uint32", "name": "total_boycott"}, {"type": "uint32", "name": "total_approvals"}, {"type": "uint32", "name": "total_rejections"}, {"type": "uint32", "name": "total_nulls"}, {"type": "uint64", "name": "round"}], "name": "Vote", "desc": "A vote has been cast on the Proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64,uint64)[]", "desc": "Voter addresses with their approvals and rejections", "name": "votes"}], "name": "vote_batch", "returns": {"type": "string"}, "desc": "Vote on the proposal for several voters. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint32", "name": "approvals"}, {"type": "uint32", "name": "rejections"}, {"type": "uint32", "name": "nulls"}, {"type": "bool", "name": "boycotted"}, {"type": "uint32", "name": "total_voters"}, {"type": "uint32", "name": "total_boycott"}, {"type": "uint32", "name": "total_approvals"}, {"type": "uint32", "name": "total_rejections"}, {"type": "uint32", "name": "total_nulls"}, {"type": "uint64", "name": "round"}], "name": "Vote", "desc": "A vote has been cast on the Proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Voter address", "name": "voter"}, {"type": "uint64", "desc": "Voter's votes in the committee", "name": "voting_power"}, {"type": "uint64", "desc": "Voter's position in the committee Merkle tree", "name": "ordinal"}, {"type": "byte[32][]", "desc": "Sibling nodes from the voter's leaf to the root", "name": "proof"}, {"type": "uint64", "desc": "Number of approvals", "name": "approvals"}, {"type": "uint64", "desc": "Number of rejections", "name": "rejections"}], "name": "vote_with_proof", "returns": {"type": "string"}, "desc": "Vote on the proposal as a member of a committee declared with a Merkle root.\nMUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint32", "name": "approvals"}, {"type": "uint32", "name": "rejections"}, {"type": "uint32", "name": "nulls"}, {"type": "bool", "name": "boycotted"}, {"type": "uint32", "name": "total_voters"}, {"type": "uint32", "name": "total_boycott"}, {"type": "uint32", "name": "total_approvals"}, {"type": "uint32", "name": "total_rejections"}, {"type": "uint32", "name": "total_nulls"}, {"type": "uint64", "name": "round"}], "name": "Vote", "desc": "A vote has been cast on the Proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "scrutiny", "returns": {"type": "void"}, "desc": "Scrutinize the proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "bool", "name": "approved"}, {"type": "bool", "name": "plebiscite"}, {"type": "uint64", "name": "round"}], "name": "Scrutiny", "desc": "The vote has been scrutinized"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "List of absentees to be unassigned", "name": "absentees"}], "name": "unassign_absentees", "returns": {"type": "string"}, "desc": "Unassign absentees from the scrutinized proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Absentee address", "name": "absentee"}, {"type": "uint64", "desc": "Absentee's votes in the committee", "name": "voting_power"}, {"type": "uint64", "desc": "Absentee's position in the committee Merkle tree", "name": "ordinal"}, {"type": "byte[32][]", "desc": "Sibling nodes from the absentee's leaf to the root", "name": "proof"}], "name": "unassign_absentee_with_proof", "returns": {"type": "string"}, "desc": "Unassign an absentee of a committee declared with a Merkle root from the\nscrutinized proposal. Its ordinal is marked in the voted bitmap, so it is unassigned once.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "bool", "desc": "Whether to block the proposal or not", "name": "block"}], "name": "review", "returns": {"type": "void"}, "desc": "Review the proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "bool", "name": "veto"}, {"type": "uint64", "name": "round"}], "name": "Review", "desc": "The xGov Council has reviewed the Proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "fund", "returns": {"type": "string"}, "desc": "Fund the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "List of voters to be unassigned", "name": "voters"}], "name": "unassign_voters", "returns": {"type": "void"}, "desc": "Unassign voters from the submitted proposal. This method is an admin method\nto rollback and fix wrong committee assignments.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "finalize", "returns": {"type": "string"}, "desc": "Finalize the proposal. MUST BE CALLED BY THE REGISTRY CONTRACT.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "desc": "Delete the proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state", "returns": {"type": "(address,uint64,string,uint64,uint64,uint64,uint64,bool,uint64,uint8,uint64,uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64,uint64)", "desc": "The proposal state", "struct": "ProposalTypedGlobalState"}, "desc": "Get the proposal state.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state_version", "returns": {"type": "uint64", "desc": "The proposal state version"}, "desc": "Get the proposal state version, incremented by every mutating method.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Voter", "name": "voter_address"}], "name": "get_voter_box", "returns": {"type": "(uint64,bool)", "desc": "The voter's votes bool: `True` if voter's box exists, else `False`"}, "desc": "Returns the Voter box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The index of the page, covering ordinals from `page * VOTED_BITMAP_PAGE_MEMBERS`", "name": "page"}], "name": "get_voted_bitmap_page", "returns": {"type": "(byte[],bool)", "desc": "The page content, empty if no member of the page has voted bool: `True` if the page box exists, else `False`"}, "desc": "Returns a page of the voted bitmap, where the bit of a Committee member\nordinal is set once the member has voted.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_voting_state", "returns": {"type": "(uint32,uint32,uint32,uint32,uint32,uint32,uint32,bool,bool,bool,bool)", "desc": "quorum_voters (UInt32): The number of voters to reach the quorum weighted_quorum_votes (UInt32): The number of voters to reach the weighted quorum total_voters (UInt32): The total number of voters so far total_boycott (UInt32): The total number of boycotters so far total_approvals (UInt32): The total number of approval votes so far total_rejections (UInt32): The total number of rejection votes so far total_nulls (UInt32): The total number of null votes so far quorum_reached (Bool): Whether the voters quorum has been reached or not weighted_quorum_reached (Bool): Whether the votes weighted quorum has been reached or not majority_approved (Bool): Whether the majority approved the proposal or not plebiscite (Bool): Whether all the Committee members voted or not", "struct": "VotingState"}, "desc": "Returns the voting state of the Proposal.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "Proposal", "state": {"keys": {"box": {"metadata": {"key": "TQ==", "keyType": "AVMString", "valueType": "AVMBytes"}}, "global": {"proposer": {"key": "cHJvcG9zZXI=", "keyType": "AVMBytes", "valueType": "address"}, "registry_app_id": {"key": "cmVnaXN0cnlfYXBwX2lk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_id": {"key": "Y29tbWl0dGVlX2lk", "keyType": "AVMBytes", "valueType": "byte[32]"}, "committee_members": {"key": "Y29tbWl0dGVlX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_votes": {"key": "Y29tbWl0dGVlX3ZvdGVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_root": {"key": "Y29tbWl0dGVlX3Jvb3Q=", "keyType": "AVMBytes", "valueType": "AVMBytes"}, "open_proposal_fee": {"key": "b3Blbl9wcm9wb3NhbF9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "daemon_ops_funding_bps": {"key": "ZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_ts": {"key": "b3Blbl90aW1lc3RhbXA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "submission_ts": {"key": "c3VibWlzc2lvbl90aW1lc3RhbXA=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "vote_open_ts": {"key": "dm90ZV9vcGVuaW5nX3RpbWVzdGFtcA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "finalized": {"key": "ZmluYWxpemVk", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "metadata_uploaded": {"key": "bWV0YWRhdGFfdXBsb2FkZWQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "title": {"key": "dGl0bGU=", "keyType": "AVMBytes", "valueType": "AVMString"}, "funding_category": {"key": "ZnVuZGluZ19jYXRlZ29yeQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "focus": {"key": "Zm9jdXM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "funding_type": {"key": "ZnVuZGluZ190eXBl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "requested_amount": {"key": "cmVxdWVzdGVkX2Ftb3VudA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "locked_amount": {"key": "bG9ja2VkX2Ftb3VudA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbg==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration": {"key": "dm90aW5nX2R1cmF0aW9u", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_threshold": {"key": "cXVvcnVtX3RocmVzaG9sZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_threshold": {"key": "d2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "assigned_members": {"key": "YXNzaWduZWRfbWVtYmVycw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "assigned_votes": {"key": "YXNzaWduZWRfdm90ZXM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voted_members": {"key": "dm90ZWRfbWVtYmVycw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "boycotted_members": {"key": "Ym95Y290dGVkX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "approvals": {"key": "YXBwcm92YWxz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "rejections": {"key": "cmVqZWN0aW9ucw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "nulls": {"key": "bnVsbHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voter_buckets": {"key": "dm90ZXJfYnVja2V0cw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "state_version": {"key": "c3RhdGVfdmVyc2lvbg==", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"voters": {"keyType": "address", "valueType": "uint64", "prefix": "Vg=="}, "voted_bitmap": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "Qg=="}, "voter_bucket": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "Sw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 4, "ints": 29}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"ProposalTypedGlobalState": [{"name": "proposer", "type": "address"}, {"name": "registry_app_id", "type": "uint64"}, {"name": "title", "type": "string"}, {"name": "open_ts", "type": "uint64"}, {"name": "submission_ts", "type": "uint64"}, {"name": "vote_open_ts", "type": "uint64"}, {"name": "status", "type": "uint64"}, {"name": "finalized", "type": "bool"}, {"name": "funding_category", "type": "uint64"}, {"name": "focus", "type": "uint8"}, {"name": "funding_type", "type": "uint64"}, {"name": "requested_amount", "type": "uint64"}, {"name": "locked_amount", "type": "uint64"}, {"name": "committee_id", "type": "byte[32]"}, {"name": "committee_members", "type": "uint64"}, {"name": "committee_votes", "type": "uint64"}, {"name": "voted_members", "type": "uint64"}, {"name": "boycotted_members", "type": "uint64"}, {"name": "approvals", "type": "uint64"}, {"name": "rejections", "type": "uint64"}, {"name": "nulls", "type": "uint64"}], "VotingState": [{"name": "quorum_voters", "type": "uint32"}, {"name": "weighted_quorum_votes", "type": "uint32"}, {"name": "total_voters", "type": "uint32"}, {"name": "total_boycott", "type": "uint32"}, {"name": "total_approvals", "type": "uint32"}, {"name": "total_rejections", "type": "uint32"}, {"name": "total_nulls", "type": "uint32"}, {"name": "quorum_reached", "type": "bool"}, {"name": "weighted_quorum_reached", "type": "bool"}, {"name": "majority_approved", "type": "bool"}, {"name": "plebiscite", "type": "bool"}]}, "byteCode": {"approval": "CiAHAAEgCIBAkE6ACCYuAAZzdGF0dXMQYXNzaWduZWRfbWVtYmVycwQVH3x1EWNvbW1pdHRlZV9tZW1iZXJzDmFzc2lnbmVkX3ZvdGVzD3JlZ2lzdHJ5X2FwcF9pZAlmaW5hbGl6ZWQIcHJvcG9zZXINdm90ZWRfbWVtYmVycwlhcHByb3ZhbHMKcmVqZWN0aW9ucwFNAQAPY29tbWl0dGVlX3ZvdGVzEHJlcXVlc3RlZF9hbW91bnQRYm95Y290dGVkX21lbWJlcnMFbnVsbHMNdm90ZXJfYnVja2V0cxBmdW5kaW5nX2NhdGVnb3J5DmNvbW1pdHRlZV9yb290DWxvY2tlZF9hbW91bnQQcXVvcnVtX3RocmVzaG9sZBl3ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkJkVSUjpXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkDGNvbW1pdHRlZV9pZBFvcGVuX3Byb3Bvc2FsX2ZlZRxkYWVtb25fb3BlcmF0aW9uX2Z1bmRpbmdfYnBzDm9wZW5fdGltZXN0YW1wFnZvdGVfb3BlbmluZ190aW1lc3RhbXAMZnVuZGluZ190eXBlD3ZvdGluZ19kdXJhdGlvbg1zdGF0ZV92ZXJzaW9uD3BhdXNlZF9yZWdpc3RyeRNFUlI6Vm90ZXIgbm90IGZvdW5kAUIUc3VibWlzc2lvbl90aW1lc3RhbXARbWV0YWRhdGFfdXBsb2FkZWQFdGl0bGUFZm9jdXMTZGlzY3Vzc2lvbl9kdXJhdGlvbhRtaW5fcmVxdWVzdGVkX2Ftb3VudBptYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZQFWAUsLeGdvdl9kYWVtb24xGEAAlzE1gQQSRDE0gR0SRDE3FEQxNhREJwgyA2cnBiJnJxkoZycEImcnDiJnJxQoZycaImcnGyJnJxwiZyckImcnHSJnKSJnJwciZyclImcnJihnJxMiZycnImcnHiJnJw8iZycVImcnKCJnJx8iZycWImcnFyJnKiJnJwUiZycJImcnECJnJwoiZycLImcnESJnJxIiZycgImeABCQ3jTw2GgCOAQC7MRkURDEYQQCkghYE7a65ygRxQ5lPBHNxMhoENOYTygQNmrDXBJ3oI8AEGEGg0gR5NVNpBAZz/jkEc02+zAR2/0xwBKKWUYAEIS2fBwSKXkyABCrBmwUEgCBptAS2Seh0BClXATsEJGFfkAQwyx6uBDacQroE29g92TYaAI4WAG0DogP7BEgEqgUeBfIGMwakB2AH1AhFCLEJHglXCbMKywukC7ALzgwJAAEAI0OABMxpTqo2GgCOAQANADEZgQUSMRgQREIKXjYaAUkVJBJEMg1EJwhMZycGMg1nJxmIDH0nGUxnJwSIDGcnBExnJw6IDF4nDkxnIicGZUQnFGVIJxRMZycaiAxIJxpMZycbiAw/JxtMZyNDKEcCMRYjCUk4ECMSRDYaAUkiWYECCEsBFRJEVwIANhoCSRUlEkQXNhoDSRUlEkQXNhoESRUjEkQnIYgL/BREiA74RCIpZURAAuciJwdlREAC3yNESwNJFYF7DkQoE0RLAoEKEkAACEsCgRQSQQK+I0QnKYgLwycqiAu+SwNJTgJPAw9ESwEPRIAXcHJvcG9zYWxfY29tbWl0bWVudF9icHOIC5VLAQshBQpLBkk4ACInCGVEEkRJOAcyChJEOAhJRQkSRIgQlicmSwVngBptYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbIgLToAbbWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtiAsuRQkOQQIKgQonE0xnJx5LA2cnD0sCZ0kXJydMZycVSwZnIicTZUxJTgJFCkRJRCInD2VERIEKEkEBi4AZZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbIgK1icoTGciJxNlTElOAkUKRIEKEkEBEYAVdm90aW5nX2R1cmF0aW9uX3NtYWxsiAqnRQYnH0sGZ4AMcXVvcnVtX3NtYWxsiAqPgAxxdW9ydW1fbGFyZ2WICn5LAQknKYgKdicqiApxSwEJIicPZURPAglPAgtMCggiJwRlRAshBQonFkxngBV3ZWlnaHRlZF9xdW9ydW1fc21hbGyICjmAFXdlaWdodGVkX3F1b3J1bV9sYXJnZYgKH0sBCScpiAoXJyqIChJLAQkiJw9lRE8CCU8CC0wKCCInDmVECyEFCicXTGcpgQpnJxwyB2ciJx5lRBZJkyUORFcHASInD2VEIicTZUQWSZMlDkRXBwEyBk8CFk8DTFBPAlBMFlCABEsVjZhMULAjQ0sHgRQSQQAggBZ2b3RpbmdfZHVyYXRpb25fbWVkaXVtiAmNRQZC/uOAFXZvdGluZ19kdXJhdGlvbl9sYXJnZYgJbkUGQv7ESweBFBJBACKAGmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtiAlCQv5pgBlkaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdliAkhQv5ISwFLBw5BAAWBFEL964EeQv3mIkL9PyJC/R42GgFJIlmBAghLARUSRFcCAEk2GgJJFSMSRCJTJyGICOMURIgLwkwVSU4DRIgN+SclI2dBAA4nDLxIJwy8SCcMTL8jQycMvURJSwMIJwxM0ycMTE8Cu0L/6SKIC79EIillRIEKE0AACCInB2VEQQAwJxhFAUkoE0EAD0lJFRZXBgJMUCtMULAjQ4gNnCInCGVEiAulJwy8SCcHI2coQv/bKEUBQv/OJyGICFkURIgLODIHIiccZUQJIicoZUQPRCInJWVERIgNYCctiAhESRUkEkQiJxplRCInG2VECyEFCogLQimBFGcnJDIHZ4gI30EAFCInBGVEKkxnIicOZUQnBUxniA05I0M2GgFHAiJZSU4CgSgLgQIITBUSRIgJ3ogJ6CInEmVEFESIDPwiSUsCDEEAQ0sCVwIASwFJTgKBKAuBKFhJVwAgTCRbJytPAlBJvUUBFERLAURLARa/IiplRCMIKkxnIicFZUQIJwVMZyMIRQFC/7aIDRAjQyJJKEk2GgFHAiJZSU4CgSgLgQIITBUSRIgJZogJcIgMiyInEmVEQAAXIiplRBREIicEZUSBEAgjCYEQCicSTGciRQRLA0sBDEEAhEsBVwIASwSBKAuBKFhJVwAgSU4CRQckW0lFBUSICVAWJyxMUElFB71FAUEATUsFSb1MSU4CTgNESYEoCUsCTCS6SwikREmB+A8MRIEoCNNLA0kWSwdMUEsITwNPArsiKmVEIwgqTGciJwVlRAgnBUxnSwMjCEUEQv9+IksGgSi5SEL/y4gMPCNDNhoBSRUkEkQ2GgJJFSUSRBc2GgNJFSUSRBeIBuVJKBNBAA9JSRUWVwYCTFArTFCwI0OIC6NLA0sDSwOIC1hC/+MoNhoBRwIiWUlOAoEwC4ECCEwVEkSIBqlJKBNBAA9JSRUWVwYCTFArTFCwI0OIC2ciRQRLA0sCDEEAMksCVwIASwSBMAuBMFhJVwAgSwEkW08CgShbiAr9SUUCKBNBAARJQv+7SwMjCEUEQv/GKEL/rjYaAUkVJBJENhoCSRUlEkQXNhoDSRUlEkQXNhoERwIiWSQLgQIITBUSRDYaBUkVJRJEFzYaBkkVJRJEF4gGEUkoE0EAD0lJFRZXBgJMUCtMULAjQ4gKz0sGSwZLBksGiAZzSEAABSciQv/bSwSIBu5BAByAF0VSUjpWb3RlciBhbHJlYWR5IHZvdGVkQv+3SwVLA0sDiAYESUUCKBNBAARJQv+iSwRLBklOAogG2ksHTEsESwSICT0oQv+KKCchiAVAFEQiKWVEgRkSRIgFTUEABogHGkEAVCNEiApJiAiAQQBDiAiPQQA9iAikQQA3I0UBSUEAISmBHmeIBvIyBicNIksEVCNPA1RMFlCABIt4lRRMULAjQymBKGciJwhlRIgIFEL/1CJFAUL/xiJC/6kiKEcCNhoBRwIiWUlOAiQLgQIITBUSRIgE4UkoE0EAD0lJFRZXBgJMUCtMULAjQ4gJxCJFBksFSwIMQQAwSwJXAgBLBiQLJFhJRQiIBslFBklFBUAABSciQv/GSwZLBEsGiAgISwUjCEUGQv/IKEL/sDYaAUkVJBJENhoCSRUlEkQXNhoDSRUlEkQXNhoERwIiWSQLgQIITBUSRIgEXUkoE0EAD0lJFRZXBgJMUCtMULAjQ4gJQEsESwRLBEsEiATkSEEACEsCiAVkQQAFJyJC/9NLAksEiAV/KEL/yDYaAUkVIxJEIlNJMQCADHhnb3ZfY291bmNpbIgD5EkVJBJEEkQiKWVEgR4SRCIqZUQURIgI40EAJSmBPGciJwZlRHIIRIgG4jIGJw0iSwNUTBZQgASu6BcZTFCwI0MpgS1nIicIZUSIBsBC/9siiAacRCIpZUSBLRNBACQnGEUBSSgTQQAPSUkVFlcGAkxQK0xQsCNDiAiBKYEyZyhC/+coRQFC/9oiKEk2GgFHAiJZSU4CJAuBAghMFRJEiAZARCIpZUSBFBJEiAUwiAhLIklLAgxBACpLAlcCAEsBJAskWElFB4gFU0UGSUUFQQAJSwVLBEsGiAaXSSMIRQFC/88jQyKIBgdEIicHZURAAC8iKWVEQQCuIillRIEKE0EApCIpZUSBMhNBAJoiKWVEgTwTQQCQIillRIEoE0EAhicYRQFJKBNBAA9JSRUWVwYCTFArTFCwI0OIB78iKmVEQQAzgC5FUlI6VGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsQv+1IillRIEKEkEACCInCGVEiAWEIicGZURyCEQyCnMARDIKcwFECYgFWicHI2coQv+FKEUBQv94KEmIBTBEIicHZUREJwy8SIgC4kEAKCInBGVEIQQIIwkhBApFASJFAkoMQQARSwFJFicjTFC8SCMIRQJC/+oiJwZlRHIIRDIKcwBEiAT+I0MiJwhlRCInBmVEIicmZUQiJxxlRCInJGVEIicdZUQiKWVEIicHZUQiJxNlRCInJ2VEFkmTJQ5EVwcBIiceZUQiJw9lRCInFWVEIicZZUQiJwRlRCInDmVEIicJZUQiJxBlRCInCmVEIicLZUQiJxFlRE8TFk8UTFBLExUWVwYCTxRQTIACAMRQTxMWUE8SFlBPERZQTxAWUCcNIk8RVFBPDhZQTw1QTwwWUE8LFlBPChZQTwlQTwgWUE8HFlBPBhZQTwUWUE8EFlBPAxZQTwIWUExQK0xQsCNDIicgZUQWK0xQsCNDNhoBSRUkEkSIAzBISSINTBYnDSJPA1RQK0xQsCNDNhoBSRUlEkQXFicjTFBJvUlPAkhBACBLAb5ESRUWVwYCTFAnDSJLA1SAAgADTFBMUCtMULAjQyhC/+AiJxZlRBZJkyQORFcEBCInF2VEFkmTJA5EVwQEIicJZUQWSZMkDkRXBAQiJxBlRBZJkyQORFcEBCInCmVEFkmTJA5EVwQEIicLZUQWSZMkDkRXBAQiJxFlRBZJkyQORFcEBIgDlogDqIgDwIgCHE8KTwpQTwlQTwhQTwdQTwZQTwVQJw0iTwZUI08FVIECTwRUgQNPA1RQK0xQsCNDigEBIicGZUSL/2VEiYoBASInBmVEi/9lRIkyByInHWVECSInH2VEDomIAuxEIillRIEeEkAACiIpZUSBKBJBAAgiJwdlREEAAycYiSiJiALHRCIpZUSBGRNBAAMnGImI/7hAAByAGUVSUjpWb3RpbmcgUGVyaW9kIEV4cGlyZWSJKImKAwGL/ov9EkEACov/i/0SQQACI4kiiYoDAYv+i/8Ii/0NQQAgi/2L/ov/iP/SQAAUgBFFUlI6Vm90ZXMgaW52YWxpZIkoiSInFGVEFSINiYoEAicNi/xQi/0WUAGL/yJZi/4iiwOLAQxBAEaLAoECGEEAJov/VwIAiwMkCyRYgAEBTFCLAFABjACLAoECCowCiwMjCIwDQv/KgAEBiwBQi/9XAgCLAyQLJFhQAYwAQv/YiwJAAB4iJwRlRIv+DUEAEyInFGVEiwASQQAII4v/jAGMAIkiQv/1igEBi/8hBAoWJyNMUEm9RQFAAAMiTImL/yEEGEklCosATCO6TCUYU0yJigIAKIv+IQQKSRYnI0xQSb1FAUAAIyInBGVEgQcIJQqLASEGCwlJjAAhBg1BAAQhBowAiwKLALlIi/4hBBhJJQqLAklOA0sBI7pPAiUYI1S7IiplRCMJKkxnIicFZUSL/wknBUxniSInCWVEIicEZUQSiYgBDkQiKWVEgRQSRImKAAAoSTEWQAAdMgSMASOMAIsAiwEMQQANiwBJiAEjIwiMAEL/64kiiAEXiYoBAYv/IlkiJxJlRAuBgIAEComKAQIiSShHAyInEmVEQAATJyuL/1C+TBciTE8CTSKMAYwAiYv/iP/FFicsTFBJjAG9RQFAAAciSYwBjACJIowDiwG9RIEoCowCiwOLAgxBAEeLA4sCCIECCkmMBIEoC0mMBYsBTCS6SYwAi/8SQQAQiwVJJAiLAUwluheMAIwBiYsAi/+kQQAJiwQjCIwDQv+4iwSMAkL/sSJJjAGMAImIABpEIillRIEKEkEACyInB2VEQAADI0SJIkL/+jEAIicIZUQSiTEAJy2I/PxJFSQSRBKJMg0iJwZlRBKJigIAsYv/sgiL/rIHI7IQIrIBs4mKAQAiJxVlRIv/TIj/3icVImeJigEAi/84GDIIEkSL/zkaADYaABJEiSInFmVEIicJZUQiJxBlRAlLAQ8QiSInF2VEIicKZUQiJwtlRAgiJxFlRAhLAQ8QiSInCmVEIicLZUQNiYoDACgiJxJlREEAO4v9iP6HFicsTFBJvUSBKAlJjABBACBJi/+BKCjSiwDTIiplRCMJKkxnIicFZUSL/gknBUxnibxIQv/lJyuL/VBJvUUBRIv+RLxIQv/TigQAIicJZUQjCCcJTGeL/Yv+i/+I/HlBAKQiJxBlRCMIJxBMZyIji/4WSZMkDkRXBASL/xZJkyQORFcEBE8DFkmTJA5EVwQEIicJZUQWSZMkDkRXBAQiJxBlRBZJkyQORFcEBCInCmVEFkmTJA5EVwQEIicLZUQWSZMkDkRXBAQiJxFlRBZJkyQORFcEBDIGi/xPCVBPCFBPB1AnDSJPCVRQTwZQTwVQTwRQTwNQTwJQTBZQgASpEIoaTFCwiSKL/Yv+CYv/CUlOAiInCmVEi/4IJwpMZyInC2VEi/8IJwtMZyInEWVECCcRTGdC/ziKAwEii/2I/VpMSUAAJicijACLACgTQQABiYv9iwJJTgKLAYj+kov9TIv+i/+I/uEojACJiwKL/ov/iPt7jABC/9AiJyBlRCMIJyBLAWcWgATw2C3gTFCwiSmBGWcyBycdSwFnIicfZURLAQgiJxZlRBZJkyQORFcEBCInF2VEFkmTJA5EVwQEMgZPBBZPBBZQTwNQTwJQTBZQgATc6+HFTFCwiSIqZUQiJwRlRBJBAA8iJwVlRCInDmVEEkSI/5mJ", "clear": "CoEBQw=="}, "desc": "Proposal Contract", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "uint8", "name": "funding_type"}, {"type": "uint64", "name": "requested_amount"}, {"type": "uint8", "name": "category"}, {"type": "uint64", "name": "round"}], "name": "Opened", "desc": "The Proposal has been opened"}, {"args": [{"type": "uint64", "name": "vote_opening"}, {"type": "uint64", "name": "vote_closing"}, {"type": "uint32", "name": "quorum_voters"}, {"type": "uint32", "name": "weighted_quorum_votes"}, {"type": "uint64", "name": "round"}], "name": "Submitted", "desc": "The Proposal has been submitted for voting"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint32", "name": "approvals"}, {"type": "uint32", "name": "rejections"}, {"type": "uint32", "name": "nulls"}, {"type": "bool", "name": "boycotted"}, {"type": "uint32", "name": "total_voters"}, {"type": "uint32", "name": "total_boycott"}, {"type": "uint32", "name": "total_approvals"}, {"type": "uint32", "name": "total_rejections"}, {"type": "uint32", "name": "total_nulls"}, {"type": "uint64", "name": "round"}], "name": "Vote", "desc": "A vote has been cast on the Proposal"}, {"args": [{"type": "bool", "name": "approved"}, {"type": "bool", "name": "plebiscite"}, {"type": "uint64", "name": "round"}], "name": "Scrutiny", "desc": "The vote has been scrutinized"}, {"args": [{"type": "bool", "name": "veto"}, {"type": "uint64", "name": "round"}], "name": "Review", "desc": "The xGov Council has reviewed the Proposal"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOCA4MTkyIDEwMDAwIDEwMjQKICAgIGJ5dGVjYmxvY2sgMHggMHg3Mzc0NjE3NDc1NzMgMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MyAweDE1MWY3Yzc1IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMgMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQgMHg2NjY5NmU2MTZjNjk3YTY1NjQgMHg3MDcyNmY3MDZmNzM2NTcyIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMgMHg2MTcwNzA3MjZmNzY2MTZjNzMgMHg3MjY1NmE2NTYzNzQ2OTZmNmU3MyAiTSIgMHgwMCAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MyAweDcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0IDB4NjI2Zjc5NjM2Zjc0NzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MyAweDZlNzU2YzZjNzMgMHg3NjZmNzQ2NTcyNWY2Mjc1NjM2YjY1NzQ3MyAweDY2NzU2ZTY0Njk2ZTY3NWY2MzYxNzQ2NTY3NmY3Mjc5IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MjZmNmY3NCAweDZjNmY2MzZiNjU2NDVmNjE2ZDZmNzU2ZTc0IDB4NzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NCAiRVJSOldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0IDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NSAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczIDB4NmY3MDY1NmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MCAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwIDB4NjY3NTZlNjQ2OTZlNjc1Zjc0Nzk3MDY1IDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlIDB4NzM3NDYxNzQ2NTVmNzY2NTcyNzM2OTZmNmUgMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkgIkVSUjpWb3RlciBub3QgZm91bmQiICJCIiAweDczNzU2MjZkNjk3MzczNjk2ZjZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAgMHg2ZDY1NzQ2MTY0NjE3NDYxNWY3NTcwNmM2ZjYxNjQ2NTY0IDB4NzQ2OTc0NmM2NSAweDY2NmY2Mzc1NzMgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZSAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1ICJWIiAiSyIgMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTAKICAgIC8vIFR4bi5nbG9iYWxfbnVtX2J5dGVfc2xpY2UgPT0gcHJvcF9jZmcuR0xPQkFMX0JZVEVTCiAgICB0eG4gR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICBwdXNoaW50IDQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDgtNTEKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IHByb3BfY2ZnLkdMT0JBTF9CWVRFUwogICAgLy8gKSwgZXJyLldST05HX0dMT0JBTF9CWVRFUwogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBCeXRlcyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTIKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV91aW50ID09IHByb3BfY2ZnLkdMT0JBTF9VSU5UUywgZXJyLldST05HX0dMT0JBTF9VSU5UUwogICAgdHhuIEdsb2JhbE51bVVpbnQKICAgIHB1c2hpbnQgMjkKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MwogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fYnl0ZV9zbGljZSA9PSBwcm9wX2NmZy5MT0NBTF9CWVRFUywgZXJyLldST05HX0xPQ0FMX0JZVEVTCiAgICB0eG4gTG9jYWxOdW1CeXRlU2xpY2UKICAgICEKICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBCeXRlcyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTQKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX3VpbnQgPT0gcHJvcF9jZmcuTE9DQUxfVUlOVFMsIGVyci5XUk9OR19MT0NBTF9VSU5UUwogICAgdHhuIExvY2FsTnVtVWludAogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIFVJbnRzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1OQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9QUk9QT1NFUiwKICAgIGJ5dGVjIDggLy8gMHg3MDcyNmY3MDZmNzM2NTcyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTgKICAgIC8vIEFjY291bnQoKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU2LTYwCiAgICAvLyAjIEJhc2UgU3RhdGUKICAgIC8vIHNlbGYucHJvcG9zZXIgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9QUk9QT1NFUiwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjMKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUkVHSVNUUllfQVBQX0lELAogICAgYnl0ZWMgNiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjEtNjQKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwX2lkID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9SRUdJU1RSWV9BUFBfSUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY5CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX0lELAogICAgYnl0ZWMgMjUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2OAogICAgLy8gdHlwLkJ5dGVzMzIuZnJvbV9ieXRlcyhiIiIpLAogICAgYnl0ZWNfMCAvLyAweAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2LTcwCiAgICAvLyAjIEZyb20geEdvdiBSZWdpc3RyeQogICAgLy8gc2VsZi5jb21taXR0ZWVfaWQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICB0eXAuQnl0ZXMzMi5mcm9tX2J5dGVzKGIiIiksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9JRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzMKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUywKICAgIGJ5dGVjIDQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzIKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MS03NAogICAgLy8gc2VsZi5jb21taXR0ZWVfbWVtYmVycyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzcKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMsCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzUtNzgKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9WT1RFUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODEKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfUk9PVCwKICAgIGJ5dGVjIDIwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MjZmNmY3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBCeXRlcygpLAogICAgYnl0ZWNfMCAvLyAweAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc5LTgyCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9yb290ID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQnl0ZXMoKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1JPT1QsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUsCiAgICBieXRlYyAyNiAvLyAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgzLTg2CiAgICAvLyBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX09QRU5fUFJPUE9TQUxfRkVFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4OQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMsCiAgICBieXRlYyAyNyAvLyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4Ny05MAogICAgLy8gc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX09QRU5fVFMsCiAgICBieXRlYyAyOCAvLyAweDZmNzA2NTZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkyLTk2CiAgICAvLyAjIFRpbWUgQW5jaG9ycwogICAgLy8gc2VsZi5vcGVuX3RzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9PUEVOX1RTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5OQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9TVUJNSVNTSU9OX1RTLAogICAgYnl0ZWMgMzYgLy8gMHg3Mzc1NjI2ZDY5NzM3MzY5NmY2ZTVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5Ny0xMDAKICAgIC8vIHNlbGYuc3VibWlzc2lvbl90cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfU1VCTUlTU0lPTl9UUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAzCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUywKICAgIGJ5dGVjIDI5IC8vIDB4NzY2Zjc0NjU1ZjZmNzA2NTZlNjk2ZTY3NWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDIKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDEtMTA0CiAgICAvLyBzZWxmLnZvdGVfb3Blbl90cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9URV9PUEVOX1RTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDkKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfU1RBVFVTLAogICAgYnl0ZWNfMSAvLyAweDczNzQ2MTc0NzU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwOAogICAgLy8gVUludDY0KGVubS5TVEFUVVNfRU1QVFkpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDYtMTEwCiAgICAvLyAjIFByb3Bvc2FsIFN0YXRlCiAgICAvLyBzZWxmLnN0YXR1cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChlbm0uU1RBVFVTX0VNUFRZKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1NUQVRVUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEzCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZJTkFMSVpFRCwKICAgIGJ5dGVjIDcgLy8gMHg2NjY5NmU2MTZjNjk3YTY1NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTIKICAgIC8vIEZhbHNlLCAgIyBub3FhOiBGQlQwMDMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTExLTExNAogICAgLy8gc2VsZi5maW5hbGl6ZWQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBGYWxzZSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9GSU5BTElaRUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9NRVRBREFUQV9VUExPQURFRCwKICAgIGJ5dGVjIDM3IC8vIDB4NmQ2NTc0NjE2NDYxNzQ2MTVmNzU3MDZjNmY2MTY0NjU2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNgogICAgLy8gRmFsc2UsICAjIG5vcWE6IEZCVDAwMwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTUtMTE4CiAgICAvLyBzZWxmLm1ldGFkYXRhX3VwbG9hZGVkID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgRmFsc2UsICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfTUVUQURBVEFfVVBMT0FERUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyMwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9USVRMRSwKICAgIGJ5dGVjIDM4IC8vIDB4NzQ2OTc0NmM2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gU3RyaW5nKCksCiAgICBieXRlY18wIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIwLTEyNAogICAgLy8gIyBQcm9wb3NhbCBDb25maWd1cmF0aW9uCiAgICAvLyBzZWxmLnRpdGxlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgU3RyaW5nKCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9USVRMRSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI3CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZVTkRJTkdfQ0FURUdPUlksCiAgICBieXRlYyAxOSAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY2MzYxNzQ2NTY3NmY3Mjc5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI2CiAgICAvLyBVSW50NjQoZW5tLkZVTkRJTkdfQ0FURUdPUllfTlVMTCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNS0xMjgKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChlbm0uRlVORElOR19DQVRFR09SWV9OVUxMKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZVTkRJTkdfQ0FURUdPUlksCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzMQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9GT0NVUywKICAgIGJ5dGVjIDM5IC8vIDB4NjY2ZjYzNzU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gVUludDY0KGVubS5GT0NVU19OVUxMKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI5LTEzMgogICAgLy8gc2VsZi5mb2N1cyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChlbm0uRk9DVVNfTlVMTCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9GT0NVUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM1CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0ZVTkRJTkdfVFlQRSwKICAgIGJ5dGVjIDMwIC8vIDB4NjY3NTZlNjQ2OTZlNjc1Zjc0Nzk3MDY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM0CiAgICAvLyBVSW50NjQoZW5tLkZVTkRJTkdfTlVMTCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzMy0xMzYKICAgIC8vIHNlbGYuZnVuZGluZ190eXBlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KGVubS5GVU5ESU5HX05VTEwpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfRlVORElOR19UWVBFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzkKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUkVRVUVTVEVEX0FNT1VOVCwKICAgIGJ5dGVjIDE1IC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzctMTQwCiAgICAvLyBzZWxmLnJlcXVlc3RlZF9hbW91bnQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1JFUVVFU1RFRF9BTU9VTlQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0MwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9MT0NLRURfQU1PVU5ULAogICAgYnl0ZWMgMjEgLy8gMHg2YzZmNjM2YjY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0MS0xNDQKICAgIC8vIHNlbGYubG9ja2VkX2Ftb3VudCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfTE9DS0VEX0FNT1VOVCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ3CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT04sCiAgICBieXRlYyA0MCAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ2CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ1LTE0OAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTEKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OLAogICAgYnl0ZWMgMzEgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTAKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDktMTUyCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbiA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTUKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfUVVPUlVNX1RIUkVTSE9MRCwKICAgIGJ5dGVjIDIyIC8vIDB4NzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTQKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTMtMTU2CiAgICAvLyBzZWxmLnF1b3J1bV90aHJlc2hvbGQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1FVT1JVTV9USFJFU0hPTEQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1OQogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fVEhSRVNIT0xELAogICAgYnl0ZWMgMjMgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1OAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1Ny0xNjAKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX1RIUkVTSE9MRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTY1CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0FTU0lHTkVEX01FTUJFUlMsCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjQKICAgIC8vIFVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTYyLTE2NgogICAgLy8gIyBQcm9wb3NhbCBWb3RlCiAgICAvLyBzZWxmLmFzc2lnbmVkX21lbWJlcnMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoMCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9BU1NJR05FRF9NRU1CRVJTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjkKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfQVNTSUdORURfVk9URVMsCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gVUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjctMTcwCiAgICAvLyBzZWxmLmFzc2lnbmVkX3ZvdGVzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KDApLAogICAgLy8gICAgIGtleT1wcm9wX2NmZy5HU19LRVlfQVNTSUdORURfVk9URVMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE3MwogICAgLy8ga2V5PXByb3BfY2ZnLkdTX0tFWV9WT1RFRF9NRU1CRVJTLAogICAgYnl0ZWMgOSAvLyAweDc2NmY3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTcyCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTcxLTE3NAogICAgLy8gc2VsZi52b3RlZF9tZW1iZXJzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9WT1RFRF9NRU1CRVJTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNzcKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfQk9ZQ09UVEVEX01FTUJFUlMsCiAgICBieXRlYyAxNiAvLyAweDYyNmY3OTYzNmY3NDc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNzYKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNzUtMTc4CiAgICAvLyBzZWxmLmJveWNvdHRlZF9tZW1iZXJzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9CT1lDT1RURURfTUVNQkVSUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTgxCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX0FQUFJPVkFMUywKICAgIGJ5dGVjIDEwIC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTgwCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTc5LTE4MgogICAgLy8gc2VsZi5hcHByb3ZhbHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX0FQUFJPVkFMUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTg1CiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1JFSkVDVElPTlMsCiAgICBieXRlYyAxMSAvLyAweDcyNjU2YTY1NjM3NDY5NmY2ZTczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTg0CiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTgzLTE4NgogICAgLy8gc2VsZi5yZWplY3Rpb25zID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9SRUpFQ1RJT05TLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxODkKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfTlVMTFMsCiAgICBieXRlYyAxNyAvLyAweDZlNzU2YzZjNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxODgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxODctMTkwCiAgICAvLyBzZWxmLm51bGxzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9OVUxMUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTkzCiAgICAvLyBrZXk9cHJvcF9jZmcuR1NfS0VZX1ZPVEVSX0JVQ0tFVFMsCiAgICBieXRlYyAxOCAvLyAweDc2NmY3NDY1NzI1ZjYyNzU2MzZiNjU3NDczCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTkyCiAgICAvLyBVSW50NjQoKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTkxLTE5NAogICAgLy8gc2VsZi52b3Rlcl9idWNrZXRzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXByb3BfY2ZnLkdTX0tFWV9WT1RFUl9CVUNLRVRTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxOTcKICAgIC8vIGtleT1wcm9wX2NmZy5HU19LRVlfU1RBVEVfVkVSU0lPTiwKICAgIGJ5dGVjIDMyIC8vIDB4NzM3NDYxNzQ2NTVmNzY2NTcyNzM2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxOTYKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxOTUtMTk4CiAgICAvLyBzZWxmLnN0YXRlX3ZlcnNpb24gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cHJvcF9jZmcuR1NfS0VZX1NUQVRFX1ZFUlNJT04sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzYtNDQKICAgIC8vIGNsYXNzIFByb3Bvc2FsKAogICAgLy8gICAgIFByb3Bvc2FsSW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPXByb3BfY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICAgICAgZ2xvYmFsX3VpbnRzPXByb3BfY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9cHJvcF9jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPXByb3BfY2ZnLkxPQ0FMX1VJTlRTLAogICAgLy8gICAgICksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4MjQzNzhkM2MgLy8gbWV0aG9kICJkZWxldGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2RlbGV0ZV9yb3V0ZUA0CgptYWluX3N3aXRjaF9jYXNlX25leHRANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNi00NAogICAgLy8gY2xhc3MgUHJvcG9zYWwoCiAgICAvLyAgICAgUHJvcG9zYWxJbnRlcmZhY2UsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKAogICAgLy8gICAgICAgICBnbG9iYWxfYnl0ZXM9cHJvcF9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9cHJvcF9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1wcm9wX2NmZy5MT0NBTF9CWVRFUywKICAgIC8vICAgICAgICAgbG9jYWxfdWludHM9cHJvcF9jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDMwCiAgICBwdXNoYnl0ZXNzIDB4ZWRhZWI5Y2EgMHg3MTQzOTk0ZiAweDczNzEzMjFhIDB4MzRlNjEzY2EgMHgwZDlhYjBkNyAweDlkZTgyM2MwIDB4MTg0MWEwZDIgMHg3OTM1NTM2OSAweDA2NzNmZTM5IDB4NzM0ZGJlY2MgMHg3NmZmNGM3MCAweGEyOTY1MTgwIDB4MjEyZDlmMDcgMHg4YTVlNGM4MCAweDJhYzE5YjA1IDB4ODAyMDY5YjQgMHhiNjQ5ZTg3NCAweDI5NTcwMTNiIDB4MjQ2MTVmOTAgMHgzMGNiMWVhZSAweDM2OWM0MmJhIDB4ZGJkODNkZDkgLy8gbWV0aG9kICJvcGVuKHBheSxzdHJpbmcsdWludDY0LHVpbnQ2NCx1aW50OCl2b2lkIiwgbWV0aG9kICJ1cGxvYWRfbWV0YWRhdGEoYnl0ZVtdLGJvb2wpdm9pZCIsIG1ldGhvZCAiZHJvcCgpc3RyaW5nIiwgbWV0aG9kICJzdWJtaXQoKXZvaWQiLCBtZXRob2QgImFzc2lnbl92b3RlcnMoKGFkZHJlc3MsdWludDY0KVtdKXZvaWQiLCBtZXRob2QgImFzc2lnbl92b3RlcnNfdG9fYnVja2V0cygoYWRkcmVzcyx1aW50NjQpW10pdm9pZCIsIG1ldGhvZCAidm90ZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJ2b3RlX2JhdGNoKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQpW10pc3RyaW5nIiwgbWV0aG9kICJ2b3RlX3dpdGhfcHJvb2YoYWRkcmVzcyx1aW50NjQsdWludDY0LGJ5dGVbMzJdW10sdWludDY0LHVpbnQ2NClzdHJpbmciLCBtZXRob2QgInNjcnV0aW55KCl2b2lkIiwgbWV0aG9kICJ1bmFzc2lnbl9hYnNlbnRlZXMoYWRkcmVzc1tdKXN0cmluZyIsIG1ldGhvZCAidW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZihhZGRyZXNzLHVpbnQ2NCx1aW50NjQsYnl0ZVszMl1bXSlzdHJpbmciLCBtZXRob2QgInJldmlldyhib29sKXZvaWQiLCBtZXRob2QgImZ1bmQoKXN0cmluZyIsIG1ldGhvZCAidW5hc3NpZ25fdm90ZXJzKGFkZHJlc3NbXSl2b2lkIiwgbWV0aG9kICJmaW5hbGl6ZSgpc3RyaW5nIiwgbWV0aG9kICJnZXRfc3RhdGUoKShhZGRyZXNzLHVpbnQ2NCxzdHJpbmcsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGJvb2wsdWludDY0LHVpbnQ4LHVpbnQ2NCx1aW50NjQsdWludDY0LGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9zdGF0ZV92ZXJzaW9uKCl1aW50NjQiLCBtZXRob2QgImdldF92b3Rlcl9ib3goYWRkcmVzcykodWludDY0LGJvb2wpIiwgbWV0aG9kICJnZXRfdm90ZWRfYml0bWFwX3BhZ2UodWludDY0KShieXRlW10sYm9vbCkiLCBtZXRob2QgImdldF92b3Rpbmdfc3RhdGUoKSh1aW50MzIsdWludDMyLHVpbnQzMix1aW50MzIsdWludDMyLHVpbnQzMix1aW50MzIsYm9vbCxib29sLGJvb2wsYm9vbCkiLCBtZXRob2QgIm9wX3VwKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggb3BlbiB1cGxvYWRfbWV0YWRhdGEgZHJvcCBzdWJtaXQgYXNzaWduX3ZvdGVycyBhc3NpZ25fdm90ZXJzX3RvX2J1Y2tldHMgdm90ZSB2b3RlX2JhdGNoIHZvdGVfd2l0aF9wcm9vZiBzY3J1dGlueSB1bmFzc2lnbl9hYnNlbnRlZXMgdW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZiByZXZpZXcgZnVuZCB1bmFzc2lnbl92b3RlcnMgZmluYWxpemUgZ2V0X3N0YXRlIGdldF9zdGF0ZV92ZXJzaW9uIGdldF92b3Rlcl9ib3ggZ2V0X3ZvdGVkX2JpdG1hcF9wYWdlIGdldF92b3Rpbmdfc3RhdGUgbWFpbl9vcF91cF9yb3V0ZUAyOAogICAgZXJyCgptYWluX29wX3VwX3JvdXRlQDI4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2MTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9Ob09wQDMwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2LTQ0CiAgICAvLyBjbGFzcyBQcm9wb3NhbCgKICAgIC8vICAgICBQcm9wb3NhbEludGVyZmFjZSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1wcm9wX2NmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1wcm9wX2NmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgICAgIGxvY2FsX2J5dGVzPXByb3BfY2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1wcm9wX2NmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweGNjNjk0ZWFhIC8vIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgptYWluX2RlbGV0ZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydAogICAgYiBkZWxldGUKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcwNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MTgKICAgIC8vIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgIT0gMAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MTctNzE5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgIT0gMAogICAgLy8gKSwgZXJyLlVOQVVUSE9SSVpFRCAgIyBPbmx5IGNhbGxhYmxlIGJ5IGFub3RoZXIgY29udHJhY3QKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MjEtNzIyCiAgICAvLyAjIFNldCBQcm9wb3NhbCBCYXNlIFN0YXRlCiAgICAvLyBzZWxmLnByb3Bvc2VyLnZhbHVlID0gcHJvcG9zZXIKICAgIGJ5dGVjIDggLy8gMHg3MDcyNmY3MDZmNzM2NTcyCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcyMwogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUgPSBHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkCiAgICBieXRlYyA2IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBnbG9iYWwgQ2FsbGVyQXBwbGljYXRpb25JRAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MjcKICAgIC8vIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9JRCkpCiAgICBieXRlYyAyNSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NAogICAgY2FsbHN1YiBnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MjUtNzI2CiAgICAvLyAjIFNldCB2YWx1ZXMgZnJvbSB4R292IFJlZ2lzdHJ5CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9pZC52YWx1ZSA9IHR5cC5CeXRlczMyLmZyb21fYnl0ZXMoCiAgICBieXRlYyAyNSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcyNS03MjgKICAgIC8vICMgU2V0IHZhbHVlcyBmcm9tIHhHb3YgUmVnaXN0cnkKICAgIC8vIHNlbGYuY29tbWl0dGVlX2lkLnZhbHVlID0gdHlwLkJ5dGVzMzIuZnJvbV9ieXRlcygKICAgIC8vICAgICBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfSUQpKQogICAgLy8gKSAgIyBUaGUgeEdvdiBSZWdpc3RyeSBDT01NSVRURUVfU1RBTEUgZXJyb3IgZW5zdXJlcyB0aGUgQ29tbWl0dGVlIGlzIGF2YWlsYWJsZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzAKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9NRU1CRVJTKQogICAgYnl0ZWMgNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MjktNzMxCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUykKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MjkKICAgIC8vIHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgYnl0ZWMgNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MjktNzMxCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUykKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzMzCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMpCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjczMi03MzQKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzMyCiAgICAvLyBzZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjczMi03MzQKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMpCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjczNwogICAgLy8gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUsIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9ST09UKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICBieXRlYyAyMCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzI2ZjZmNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzUtNzM4CiAgICAvLyAjIEVtcHR5IGlmIHRoZSBDb21taXR0ZWUgaGFzIG5vIE1lcmtsZSByb290ICh2b3RlcnMgYXJlIGFzc2lnbmVkIGJ5IHRoZSBkYWVtb24pCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9yb290LnZhbHVlLCBfZXhpc3RzID0gQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwgQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1JPT1QpCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzM1LTczNgogICAgLy8gIyBFbXB0eSBpZiB0aGUgQ29tbWl0dGVlIGhhcyBubyBNZXJrbGUgcm9vdCAodm90ZXJzIGFyZSBhc3NpZ25lZCBieSB0aGUgZGFlbW9uKQogICAgLy8gc2VsZi5jb21taXR0ZWVfcm9vdC52YWx1ZSwgX2V4aXN0cyA9IEFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICBieXRlYyAyMCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzI2ZjZmNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzUtNzM4CiAgICAvLyAjIEVtcHR5IGlmIHRoZSBDb21taXR0ZWUgaGFzIG5vIE1lcmtsZSByb290ICh2b3RlcnMgYXJlIGFzc2lnbmVkIGJ5IHRoZSBkYWVtb24pCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9yb290LnZhbHVlLCBfZXhpc3RzID0gQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwgQnl0ZXMocmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1JPT1QpCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc0MAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUpCiAgICBieXRlYyAyNiAvLyAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzktNzQxCiAgICAvLyBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9PUEVOX1BST1BPU0FMX0ZFRSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MzkKICAgIC8vIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgYnl0ZWMgMjYgLy8gMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzM5LTc0MQogICAgLy8gc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUpCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc0MwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUykKICAgIGJ5dGVjIDI3IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3NDItNzQ0CiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzQyCiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgYnl0ZWMgMjcgLy8gMHg2NDYxNjU2ZDZmNmU1ZjZmNzA2NTcyNjE3NDY5NmY2ZTVmNjY3NTZlNjQ2OTZlNjc1ZjYyNzA3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc0Mi03NDQKICAgIC8vIHNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZSA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUykKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzA1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwub3Blbltyb3V0aW5nXSgpIC0+IHZvaWQ6Cm9wZW46CiAgICBieXRlY18wIC8vICIiCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3NDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTc0CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkpCiAgICBieXRlYyAzMyAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3My01NzUKICAgIC8vIHJlZ2lzdHJ5X3BhdXNlZCA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3NgogICAgLy8gYXNzZXJ0IG5vdCByZWdpc3RyeV9wYXVzZWQsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MDAKICAgIC8vIGFzc2VydCBzZWxmLmlzX3Byb3Bvc2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcHJvcG9zZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MDIKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfRU1QVFkgYW5kIG5vdCBzZWxmLmZpbmFsaXplZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBibnogb3Blbl9ib29sX2ZhbHNlQDQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgYm56IG9wZW5fYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQoKb3Blbl9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTAxLTUwMwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0VNUFRZIGFuZCBub3Qgc2VsZi5maW5hbGl6ZWQudmFsdWUKICAgIC8vICksIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIGFzc2VydCAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTEyCiAgICAvLyBhc3NlcnQgdGl0bGUuYnl0ZXMubGVuZ3RoIDw9IGNvbnN0LlRJVExFX01BWF9CWVRFUywgZXJyLldST05HX1RJVExFX0xFTkdUSAogICAgZGlnIDMKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDEyMwogICAgPD0KICAgIGFzc2VydCAvLyBXcm9uZyBUaXRsZSBsZW5ndGgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MTMKICAgIC8vIGFzc2VydCB0aXRsZSAhPSAiIiwgZXJyLldST05HX1RJVExFX0xFTkdUSAogICAgYnl0ZWNfMCAvLyAiIgogICAgIT0KICAgIGFzc2VydCAvLyBXcm9uZyBUaXRsZSBsZW5ndGgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MTYKICAgIC8vIGZ1bmRpbmdfdHlwZSA9PSBlbm0uRlVORElOR19QUk9BQ1RJVkUKICAgIGRpZyAyCiAgICBwdXNoaW50IDEwCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUxNi01MTcKICAgIC8vIGZ1bmRpbmdfdHlwZSA9PSBlbm0uRlVORElOR19QUk9BQ1RJVkUKICAgIC8vIG9yIGZ1bmRpbmdfdHlwZSA9PSBlbm0uRlVORElOR19SRVRST0FDVElWRQogICAgYm56IG9wZW5fYm9vbF90cnVlQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MTcKICAgIC8vIG9yIGZ1bmRpbmdfdHlwZSA9PSBlbm0uRlVORElOR19SRVRST0FDVElWRQogICAgZGlnIDIKICAgIHB1c2hpbnQgMjAKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTE2LTUxNwogICAgLy8gZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1BST0FDVElWRQogICAgLy8gb3IgZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1JFVFJPQUNUSVZFCiAgICBieiBvcGVuX2Jvb2xfZmFsc2VAMTAKCm9wZW5fYm9vbF90cnVlQDk6CiAgICBpbnRjXzEgLy8gMQoKb3Blbl9ib29sX21lcmdlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUxNS01MTgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZnVuZGluZ190eXBlID09IGVubS5GVU5ESU5HX1BST0FDVElWRQogICAgLy8gICAgIG9yIGZ1bmRpbmdfdHlwZSA9PSBlbm0uRlVORElOR19SRVRST0FDVElWRQogICAgLy8gKSwgZXJyLldST05HX0ZVTkRJTkdfVFlQRQogICAgYXNzZXJ0IC8vIFdyb25nIEZ1bmRpbmcgVHlwZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUyMQogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQpCiAgICBieXRlYyA0MSAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MjAtNTIyCiAgICAvLyBtaW5fcmVxdWVzdGVkX2Ftb3VudCA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTI1CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSkKICAgIGJ5dGVjIDQyIC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUyNC01MjYKICAgIC8vIG1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MjgKICAgIC8vIGFzc2VydCByZXF1ZXN0ZWRfYW1vdW50ID49IG1pbl9yZXF1ZXN0ZWRfYW1vdW50LCBlcnIuV1JPTkdfTUlOX1JFUVVFU1RFRF9BTU9VTlQKICAgIGRpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgPj0KICAgIGFzc2VydCAvLyBSZXF1ZXN0ZWQgYW1vdW50IGlzIGxlc3MgdGhhbiB0aGUgbWluaW11bSByZXF1ZXN0ZWQgYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTMwCiAgICAvLyByZXF1ZXN0ZWRfYW1vdW50IDw9IG1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlCiAgICBkaWcgMQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MjktNTMxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHJlcXVlc3RlZF9hbW91bnQgPD0gbWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UKICAgIC8vICksIGVyci5XUk9OR19NQVhfUkVRVUVTVEVEX0FNT1VOVAogICAgYXNzZXJ0IC8vIFJlcXVlc3RlZCBhbW91bnQgaXMgbW9yZSB0aGFuIHRoZSBtYXhpbXVtIHJlcXVlc3RlZCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NDAKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BST1BPU0FMX0NPTU1JVE1FTlRfQlBTKQogICAgcHVzaGJ5dGVzIDB4NzA3MjZmNzA2ZjczNjE2YzVmNjM2ZjZkNmQ2OTc0NmQ2NTZlNzQ1ZjYyNzA3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjUzOS01NDEKICAgIC8vIHByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9QUk9QT1NBTF9DT01NSVRNRU5UX0JQUykKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MzYKICAgIC8vIHJldHVybiBhbW91bnQgKiBmcmFjdGlvbl9pbl9icHMgLy8gY29uc3QuQlBTCiAgICBkaWcgMQogICAgKgogICAgaW50YyA1IC8vIDEwMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTUyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gc2VsZi5wcm9wb3Nlci52YWx1ZSwgZXJyLldST05HX1NFTkRFUgogICAgZGlnIDYKICAgIGR1cAogICAgZ3R4bnMgU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTU0CiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU1My01NTUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU1NgogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IGV4cGVjdGVkX2xvY2tfYW1vdW50LCBlcnIuV1JPTkdfTE9DS0VEX0FNT1VOVAogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGJ1cnkgOQogICAgPT0KICAgIGFzc2VydCAvLyBMb2NrZWQgYW1vdW50IGlzIGluY29ycmVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc4NwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3ODktNzkwCiAgICAvLyAjIENvbmZpZ3VyZSBQcm9wb3NhbAogICAgLy8gc2VsZi50aXRsZS52YWx1ZSA9IHRpdGxlCiAgICBieXRlYyAzOCAvLyAweDc0Njk3NDZjNjUKICAgIGRpZyA1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU2MAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfU01BTEwpCiAgICBwdXNoYnl0ZXMgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTU5LTU2MQogICAgLy8gbWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX1NNQUxMKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU2MwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTUVESVVNKQogICAgcHVzaGJ5dGVzIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmQ2NTY0Njk3NTZkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTYyLTU2NAogICAgLy8gbWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0pCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICBidXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NjUKICAgIC8vIGlmIHJlcXVlc3RlZF9hbW91bnQgPD0gbWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGw6CiAgICA8PQogICAgYnogb3Blbl9lbHNlX2JvZHlAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NjYKICAgIC8vIHJldHVybiBVSW50NjQoZW5tLkZVTkRJTkdfQ0FURUdPUllfU01BTEwpCiAgICBwdXNoaW50IDEwCgpvcGVuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF9jYXRlZ29yeUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3OTEKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSA9IHNlbGYuZ2V0X2NhdGVnb3J5KHJlcXVlc3RlZF9hbW91bnQpCiAgICBieXRlYyAxOSAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY2MzYxNzQ2NTY3NmY3Mjc5CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc5MgogICAgLy8gc2VsZi5mdW5kaW5nX3R5cGUudmFsdWUgPSBmdW5kaW5nX3R5cGUKICAgIGJ5dGVjIDMwIC8vIDB4NjY3NTZlNjQ2OTZlNjc1Zjc0Nzk3MDY1CiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3OTMKICAgIC8vIHNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSA9IHJlcXVlc3RlZF9hbW91bnQKICAgIGJ5dGVjIDE1IC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc5NAogICAgLy8gc2VsZi5mb2N1cy52YWx1ZSA9IGZvY3VzLmFzX3VpbnQ2NCgpCiAgICBkdXAKICAgIGJ0b2kKICAgIGJ5dGVjIDM5IC8vIDB4NjY2ZjYzNzU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3OTUKICAgIC8vIHNlbGYubG9ja2VkX2Ftb3VudC52YWx1ZSA9IHBheW1lbnQuYW1vdW50ICAjIFRoZSBhbW91bnQgaXMgdmFsaWRhdGVkCiAgICBieXRlYyAyMSAvLyAweDZjNmY2MzZiNjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBkaWcgNgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3OTkKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSAhPSBlbm0uRlVORElOR19DQVRFR09SWV9OVUxMCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gMHg2Njc1NmU2NDY5NmU2NzVmNjM2MTc0NjU2NzZmNzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSAxMAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZ19jYXRlZ29yeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3OTctODAwCiAgICAvLyAjIENvbmZpZ3VyZSBjYXRlZ29yeSBkZXBlbmRlbnQgdmFsdWVzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSAhPSBlbm0uRlVORElOR19DQVRFR09SWV9OVUxMCiAgICAvLyApLCBlcnIuTUlTU0lOR19DT05GSUcKICAgIGR1cAogICAgYXNzZXJ0IC8vIE1pc3NpbmcgQ29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODAxCiAgICAvLyBhc3NlcnQgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlICE9IDAsIGVyci5NSVNTSU5HX0NPTkZJRwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgYXNzZXJ0IC8vIE1pc3NpbmcgQ29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQ3CiAgICAvLyBpZiBjYXRlZ29yeSA9PSBlbm0uRlVORElOR19DQVRFR09SWV9TTUFMTDoKICAgIHB1c2hpbnQgMTAKICAgID09CiAgICBieiBvcGVuX2Vsc2VfYm9keUAyMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ0OQogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9TTUFMTCkKICAgIHB1c2hieXRlcyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQ4LTQ1MAogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9TTUFMTCkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKCm9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb25AMjY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODAyCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb24udmFsdWUgPSBzZWxmLmdldF9kaXNjdXNzaW9uX2R1cmF0aW9uKAogICAgYnl0ZWMgNDAgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgwMi04MDQKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb24oCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgwNgogICAgLy8gc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gMHg2Njc1NmU2NDY5NmU2NzVmNjM2MTc0NjU2NzZmNzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgYnVyeSAxMAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZ19jYXRlZ29yeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NjEKICAgIC8vIGlmIGNhdGVnb3J5ID09IGVubS5GVU5ESU5HX0NBVEVHT1JZX1NNQUxMOgogICAgcHVzaGludCAxMAogICAgPT0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDI5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDYzCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fU01BTEwpCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NjItNDY0CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fU01BTEwpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICBidXJ5IDYKCm9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X3ZvdGluZ19kdXJhdGlvbkAzMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MDUKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uLnZhbHVlID0gc2VsZi5nZXRfdm90aW5nX2R1cmF0aW9uKAogICAgYnl0ZWMgMzEgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MDUtODA3CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X3ZvdGluZ19kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIC8vICkKICAgIGRpZyA2CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYxOAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfUVVPUlVNX1NNQUxMKQogICAgcHVzaGJ5dGVzIDB4NzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjE3LTYxOQogICAgLy8gcXVvcnVtX21pbl9icHMgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1FVT1JVTV9TTUFMTCkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MjEKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1FVT1JVTV9MQVJHRSkKICAgIHB1c2hieXRlcyAweDcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYyMC02MjIKICAgIC8vIHF1b3J1bV9tYXhfYnBzID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9RVU9SVU1fTEFSR0UpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjIzLTYyNAogICAgLy8gIyBUaGUgeEdvdiBSZWdpc3RyeSBlbnN1cmVzIHF1b3J1bV9tYXhfYnBzID4gcXVvcnVtX21pbl9icHMKICAgIC8vIGRlbHRhX3F1b3J1bV9icHMgPSBxdW9ydW1fbWF4X2JwcyAtIHF1b3J1bV9taW5fYnBzCiAgICBkaWcgMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYyNwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQpCiAgICBieXRlYyA0MSAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MjYtNjI4CiAgICAvLyBhbW91bnRfbWluID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NSU5fUkVRVUVTVEVEX0FNT1VOVCkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MzAKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKQogICAgYnl0ZWMgNDIgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjI5LTYzMQogICAgLy8gYW1vdW50X21heCA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTEFSR0UpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjMyLTYzMwogICAgLy8gIyBUaGUgeEdvdiBSZWdpc3RyeSBlbnN1cmVzIGFtb3VudF9tYXggPiBhbW91bnRfbWluCiAgICAvLyBkZWx0YV9hbW91bnQgPSBhbW91bnRfbWF4IC0gYW1vdW50X21pbgogICAgZGlnIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MzgKICAgIC8vICogKHNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSAtIGFtb3VudF9taW4pCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gMHg3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcXVlc3RlZF9hbW91bnQgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MzctNjM4CiAgICAvLyArIGRlbHRhX3F1b3J1bV9icHMKICAgIC8vICogKHNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSAtIGFtb3VudF9taW4pCiAgICB1bmNvdmVyIDIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MzctNjM5CiAgICAvLyArIGRlbHRhX3F1b3J1bV9icHMKICAgIC8vICogKHNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSAtIGFtb3VudF9taW4pCiAgICAvLyAvLyBkZWx0YV9hbW91bnQKICAgIHN3YXAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MzYtNjM5CiAgICAvLyBxdW9ydW1fbWluX2JwcwogICAgLy8gKyBkZWx0YV9xdW9ydW1fYnBzCiAgICAvLyAqIChzZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUgLSBhbW91bnRfbWluKQogICAgLy8gLy8gZGVsdGFfYW1vdW50CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjQyCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlLCBxdW9ydW1fYnBzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWVtYmVycyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MzYKICAgIC8vIHJldHVybiBhbW91bnQgKiBmcmFjdGlvbl9pbl9icHMgLy8gY29uc3QuQlBTCiAgICAqCiAgICBpbnRjIDUgLy8gMTAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MDgKICAgIC8vIHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSA9IHNlbGYuY29tcHV0ZV9xdW9ydW1fdGhyZXNob2xkKCkKICAgIGJ5dGVjIDIyIC8vIDB4NzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjQ3CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwpCiAgICBwdXNoYnl0ZXMgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NDYtNjQ4CiAgICAvLyB3ZWlnaHRlZF9xdW9ydW1fbWluX2JwcyA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX1NNQUxMKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY1MAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX0xBUkdFKQogICAgcHVzaGJ5dGVzIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjQ5LTY1MQogICAgLy8gd2VpZ2h0ZWRfcXVvcnVtX21heF9icHMgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1dFSUdIVEVEX1FVT1JVTV9MQVJHRSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NTItNjUzCiAgICAvLyAjIFRoZSB4R292IFJlZ2lzdHJ5IGVuc3VyZXMgd2VpZ2h0ZWRfcXVvcnVtX21heF9icHMgPiB3ZWlnaHRlZF9xdW9ydW1fbWluX2JwcwogICAgLy8gZGVsdGFfd2VpZ2h0ZWRfcXVvcnVtX2JwcyA9IHdlaWdodGVkX3F1b3J1bV9tYXhfYnBzIC0gd2VpZ2h0ZWRfcXVvcnVtX21pbl9icHMKICAgIGRpZyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjU2CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NSU5fUkVRVUVTVEVEX0FNT1VOVCkKICAgIGJ5dGVjIDQxIC8vIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY1NS02NTcKICAgIC8vIGFtb3VudF9taW4gPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX01JTl9SRVFVRVNURURfQU1PVU5UKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY1OQogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTEFSR0UpCiAgICBieXRlYyA0MiAvLyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NTgtNjYwCiAgICAvLyBhbW91bnRfbWF4ID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NjEtNjYyCiAgICAvLyAjIFRoZSB4R292IFJlZ2lzdHJ5IGVuc3VyZXMgYW1vdW50X21heCA+IGFtb3VudF9taW4KICAgIC8vIGRlbHRhX2Ftb3VudCA9IGFtb3VudF9tYXggLSBhbW91bnRfbWluCiAgICBkaWcgMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2NwogICAgLy8gKiAoc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlIC0gYW1vdW50X21pbikKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAweDcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdGVkX2Ftb3VudCBleGlzdHMKICAgIHVuY292ZXIgMgogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2Ni02NjcKICAgIC8vICsgZGVsdGFfd2VpZ2h0ZWRfcXVvcnVtX2JwcwogICAgLy8gKiAoc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlIC0gYW1vdW50X21pbikKICAgIHVuY292ZXIgMgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2Ni02NjgKICAgIC8vICsgZGVsdGFfd2VpZ2h0ZWRfcXVvcnVtX2JwcwogICAgLy8gKiAoc2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlIC0gYW1vdW50X21pbikKICAgIC8vIC8vIGRlbHRhX2Ftb3VudAogICAgc3dhcAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY2NS02NjgKICAgIC8vIHdlaWdodGVkX3F1b3J1bV9taW5fYnBzCiAgICAvLyArIGRlbHRhX3dlaWdodGVkX3F1b3J1bV9icHMKICAgIC8vICogKHNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSAtIGFtb3VudF9taW4pCiAgICAvLyAvLyBkZWx0YV9hbW91bnQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2NzEKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlLCB3ZWlnaHRlZF9xdW9ydW1fYnBzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfdm90ZXMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTM2CiAgICAvLyByZXR1cm4gYW1vdW50ICogZnJhY3Rpb25faW5fYnBzIC8vIGNvbnN0LkJQUwogICAgKgogICAgaW50YyA1IC8vIDEwMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODA5CiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUgPSBzZWxmLmNvbXB1dGVfd2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZCgpCiAgICBieXRlYyAyMyAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzQ2ODcyNjU3MzY4NmY2YzY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxMS04MTIKICAgIC8vICMgVXBkYXRlIFByb3Bvc2FsIFN0YXRlIGFuZCB0aW1lIGFuY2hvcnMKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KGVubS5TVEFUVVNfRFJBRlQpCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDEwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxMwogICAgLy8gc2VsZi5vcGVuX3RzLnZhbHVlID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDI4IC8vIDB4NmY3MDY1NmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MTcKICAgIC8vIGZ1bmRpbmdfdHlwZT1hcmM0LlVJbnQ4KHNlbGYuZnVuZGluZ190eXBlLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMCAvLyAweDY2NzU2ZTY0Njk2ZTY3NWY3NDc5NzA2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZ1bmRpbmdfdHlwZSBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MTgKICAgIC8vIHJlcXVlc3RlZF9hbW91bnQ9c2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgxOQogICAgLy8gY2F0ZWdvcnk9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vIDB4NjY3NTZlNjQ2OTZlNjc1ZjYzNjE3NDY1Njc2ZjcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nX2NhdGVnb3J5IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgyMAogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODE2LTgyMQogICAgLy8gdHlwLk9wZW5lZCgKICAgIC8vICAgICBmdW5kaW5nX3R5cGU9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfdHlwZS52YWx1ZSksCiAgICAvLyAgICAgcmVxdWVzdGVkX2Ftb3VudD1zZWxmLnJlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICAvLyAgICAgY2F0ZWdvcnk9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUpLAogICAgLy8gICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MTUtODIyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgdHlwLk9wZW5lZCgKICAgIC8vICAgICAgICAgZnVuZGluZ190eXBlPWFyYzQuVUludDgoc2VsZi5mdW5kaW5nX3R5cGUudmFsdWUpLAogICAgLy8gICAgICAgICByZXF1ZXN0ZWRfYW1vdW50PXNlbGYucmVxdWVzdGVkX2Ftb3VudC52YWx1ZSwKICAgIC8vICAgICAgICAgY2F0ZWdvcnk9YXJjNC5VSW50OChzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUpLAogICAgLy8gICAgICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4NGIxNThkOTggLy8gbWV0aG9kICJPcGVuZWQodWludDgsdWludDY0LHVpbnQ4LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojc0NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm9wZW5fZWxzZV9ib2R5QDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gZWxpZiBjYXRlZ29yeSA9PSBlbm0uRlVORElOR19DQVRFR09SWV9NRURJVU06CiAgICBkaWcgNwogICAgcHVzaGludCAyMAogICAgPT0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDMxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDY3CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNKQogICAgcHVzaGJ5dGVzIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NjYtNDY4CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODA1LTgwNwogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb24udmFsdWUgPSBzZWxmLmdldF92b3RpbmdfZHVyYXRpb24oCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICAvLyApCiAgICBiIG9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X3ZvdGluZ19kdXJhdGlvbkAzMgoKb3Blbl9lbHNlX2JvZHlAMzE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDcxCiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTEFSR0UpCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NzAtNDcyCiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTEFSR0UpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MDUtODA3CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X3ZvdGluZ19kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIC8vICkKICAgIGIgb3Blbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfdm90aW5nX2R1cmF0aW9uQDMyCgpvcGVuX2Vsc2VfYm9keUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NTEKICAgIC8vIGVsaWYgY2F0ZWdvcnkgPT0gZW5tLkZVTkRJTkdfQ0FURUdPUllfTUVESVVNOgogICAgZGlnIDcKICAgIHB1c2hpbnQgMjAKICAgID09CiAgICBieiBvcGVuX2Vsc2VfYm9keUAyNQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ1MwogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0pCiAgICBwdXNoYnl0ZXMgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDUyLTQ1NAogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0pCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODAyLTgwNAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uLnZhbHVlID0gc2VsZi5nZXRfZGlzY3Vzc2lvbl9kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUKICAgIC8vICkKICAgIGIgb3Blbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfZGlzY3Vzc2lvbl9kdXJhdGlvbkAyNgoKb3Blbl9lbHNlX2JvZHlAMjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDU3CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFKQogICAgcHVzaGJ5dGVzIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0NTYtNDU4CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjgwMi04MDQKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbi52YWx1ZSA9IHNlbGYuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb24oCiAgICAvLyAgICAgc2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlCiAgICAvLyApCiAgICBiIG9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X2Rpc2N1c3Npb25fZHVyYXRpb25AMjYKCm9wZW5fZWxzZV9ib2R5QDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU2NwogICAgLy8gZWxpZiByZXF1ZXN0ZWRfYW1vdW50IDw9IG1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bToKICAgIGRpZyAxCiAgICBkaWcgNwogICAgPD0KICAgIGJ6IG9wZW5fZWxzZV9ib2R5QDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTY4CiAgICAvLyByZXR1cm4gVUludDY0KGVubS5GVU5ESU5HX0NBVEVHT1JZX01FRElVTSkKICAgIHB1c2hpbnQgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3OTEKICAgIC8vIHNlbGYuZnVuZGluZ19jYXRlZ29yeS52YWx1ZSA9IHNlbGYuZ2V0X2NhdGVnb3J5KHJlcXVlc3RlZF9hbW91bnQpCiAgICBiIG9wZW5fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X2NhdGVnb3J5QDIwCgpvcGVuX2Vsc2VfYm9keUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzAKICAgIC8vIHJldHVybiBVSW50NjQoZW5tLkZVTkRJTkdfQ0FURUdPUllfTEFSR0UpCiAgICBwdXNoaW50IDMwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzkxCiAgICAvLyBzZWxmLmZ1bmRpbmdfY2F0ZWdvcnkudmFsdWUgPSBzZWxmLmdldF9jYXRlZ29yeShyZXF1ZXN0ZWRfYW1vdW50KQogICAgYiBvcGVuX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF9jYXRlZ29yeUAyMAoKb3Blbl9ib29sX2ZhbHNlQDEwOgogICAgaW50Y18wIC8vIDAKICAgIGIgb3Blbl9ib29sX21lcmdlQDExCgpvcGVuX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIG9wZW5fYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVwbG9hZF9tZXRhZGF0YVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwbG9hZF9tZXRhZGF0YToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzQKICAgIC8vIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSkKICAgIGJ5dGVjIDMzIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTczLTU3NQogICAgLy8gcmVnaXN0cnlfcGF1c2VkID0gc2VsZi5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZygKICAgIC8vICAgICBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkpCiAgICAvLyApCiAgICBjYWxsc3ViIGdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTc2CiAgICAvLyBhc3NlcnQgbm90IHJlZ2lzdHJ5X3BhdXNlZCwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ5NAogICAgLy8gc2VsZi5hc3NlcnRfZHJhZnRfYW5kX3Byb3Bvc2VyKCkKICAgIGNhbGxzdWIgYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3NlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ5NwogICAgLy8gYXNzZXJ0IHBheWxvYWQubGVuZ3RoID4gMCwgZXJyLkVNUFRZX1BBWUxPQUQKICAgIHN3YXAKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBhc3NlcnQgLy8gRW1wdHkgcGF5bG9hZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg0NAogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NDYKICAgIC8vIHNlbGYubWV0YWRhdGFfdXBsb2FkZWQudmFsdWUgPSBUcnVlCiAgICBieXRlYyAzNyAvLyAweDZkNjU3NDYxNjQ2MTc0NjE1Zjc1NzA2YzZmNjE2NDY1NjQKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg0OAogICAgLy8gaWYgaXNfZmlyc3RfaW5fZ3JvdXA6CiAgICBieiB1cGxvYWRfbWV0YWRhdGFfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NDktODUwCiAgICAvLyAjIGNsZWFyIGFuZCB3cml0ZSB0aGUgbWV0YWRhdGEgdG8gdGhlIGJveAogICAgLy8gZGVsIHNlbGYubWV0YWRhdGEudmFsdWUKICAgIGJ5dGVjIDEyIC8vICJNIgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODUxCiAgICAvLyBzZWxmLm1ldGFkYXRhLnZhbHVlID0gcGF5bG9hZAogICAgYnl0ZWMgMTIgLy8gIk0iCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGJ5dGVjIDEyIC8vICJNIgogICAgc3dhcAogICAgYm94X3B1dAoKdXBsb2FkX21ldGFkYXRhX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4MjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp1cGxvYWRfbWV0YWRhdGFfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODUzLTg1NAogICAgLy8gIyBhcHBlbmQgdGhlIG1ldGFkYXRhIHRvIHRoZSBib3gKICAgIC8vIG9sZF9zaXplID0gc2VsZi5tZXRhZGF0YS5sZW5ndGgKICAgIGJ5dGVjIDEyIC8vICJNIgogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWV0YWRhdGEgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODU1CiAgICAvLyBzZWxmLm1ldGFkYXRhLnJlc2l6ZShzZWxmLm1ldGFkYXRhLmxlbmd0aCArIHBheWxvYWQubGVuZ3RoKQogICAgZHVwCiAgICBkaWcgMwogICAgKwogICAgYnl0ZWMgMTIgLy8gIk0iCiAgICBzd2FwCiAgICBib3hfcmVzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODU2CiAgICAvLyBzZWxmLm1ldGFkYXRhLnJlcGxhY2Uob2xkX3NpemUsIHBheWxvYWQpCiAgICBieXRlYyAxMiAvLyAiTSIKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIGIgdXBsb2FkX21ldGFkYXRhX2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kcm9wW3JvdXRpbmddKCkgLT4gdm9pZDoKZHJvcDoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDg4CiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RyeV9jYWxsKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVnaXN0cnlfY2FsbAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ4OQogICAgLy8gaWYgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19EUkFGVCBvciBzZWxmLmZpbmFsaXplZC52YWx1ZToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAxMAogICAgIT0KICAgIGJueiBkcm9wX2lmX2JvZHlANwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg2NjY5NmU2MTZjNjk3YTY1NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5maW5hbGl6ZWQgZXhpc3RzCiAgICBieiBkcm9wX2FmdGVyX2lmX2Vsc2VAOAoKZHJvcF9pZl9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDkwCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKGVyci5BUkNfNjVfUFJFRklYICsgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIGJ5dGVjIDI0IC8vICJFUlI6V3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIGJ1cnkgMQoKZHJvcF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kcm9wX2NoZWNrX2F1dGhvcml6YXRpb25AOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NjkKICAgIC8vIGlmIGVycm9yICE9IHR5cC5FcnJvcigiIik6CiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIiIKICAgICE9CiAgICBieiBkcm9wX2FmdGVyX2lmX2Vsc2VAMwogICAgZHVwCgpkcm9wX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmRyb3BANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZHJvcF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODcyCiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg3NQogICAgLy8gcmVjZWl2ZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg3NC04NzYKICAgIC8vIHNlbGYudHJhbnNmZXJfbG9ja2VkX2Ftb3VudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnByb3Bvc2VyLnZhbHVlLAogICAgLy8gKQogICAgY2FsbHN1YiB0cmFuc2Zlcl9sb2NrZWRfYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODc4CiAgICAvLyBkZWwgc2VsZi5tZXRhZGF0YS52YWx1ZQogICAgYnl0ZWMgMTIgLy8gIk0iCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo4NzkKICAgIC8vIHNlbGYuZmluYWxpemVkLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWMgNyAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6ODgxCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKCIiKQogICAgYnl0ZWNfMCAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg1OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgZHJvcF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kcm9wQDQKCmRyb3BfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg2OAogICAgLy8gZXJyb3IgPSBzZWxmLmRyb3BfY2hlY2tfYXV0aG9yaXphdGlvbigpCiAgICBiIGRyb3BfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZHJvcF9jaGVja19hdXRob3JpemF0aW9uQDkKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuc3VibWl0W3JvdXRpbmddKCkgLT4gdm9pZDoKc3VibWl0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3NAogICAgLy8gQnl0ZXMocmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZKQogICAgYnl0ZWMgMzMgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzMtNTc1CiAgICAvLyByZWdpc3RyeV9wYXVzZWQgPSBzZWxmLmdldF91aW50X2Zyb21fcmVnaXN0cnlfY29uZmlnKAogICAgLy8gICAgIEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSkKICAgIC8vICkKICAgIGNhbGxzdWIgZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1NzYKICAgIC8vIGFzc2VydCBub3QgcmVnaXN0cnlfcGF1c2VkLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLmFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXIoKQogICAgY2FsbHN1YiBhc3NlcnRfZHJhZnRfYW5kX3Byb3Bvc2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDgyCiAgICAvLyBlbGFwc2VkX2Rpc2N1c3Npb25fZHVyYXRpb24gPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCAtIHNlbGYub3Blbl90cy52YWx1ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI4IC8vIDB4NmY3MDY1NmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fdHMgZXhpc3RzCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDg0CiAgICAvLyBlbGFwc2VkX2Rpc2N1c3Npb25fZHVyYXRpb24gPj0gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDAgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb24gZXhpc3RzCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ4My00ODUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZWxhcHNlZF9kaXNjdXNzaW9uX2R1cmF0aW9uID49IHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbi52YWx1ZQogICAgLy8gKSwgZXJyLlRPT19FQVJMWQogICAgYXNzZXJ0IC8vIFRvbyBlYXJseQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkwMAogICAgLy8gYXNzZXJ0IHNlbGYubWV0YWRhdGFfdXBsb2FkZWQudmFsdWUsIGVyci5NSVNTSU5HX01FVEFEQVRBCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzcgLy8gMHg2ZDY1NzQ2MTY0NjE3NDYxNWY3NTcwNmM2ZjYxNjQ2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWV0YWRhdGFfdXBsb2FkZWQgZXhpc3RzCiAgICBhc3NlcnQgLy8gTWlzc2luZyBNZXRhZGF0YQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkwMgogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDYKICAgIC8vIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1hHT1ZfREFFTU9OKSkKICAgIGJ5dGVjIDQ1IC8vIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZQogICAgY2FsbHN1YiBnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDUtOTA3CiAgICAvLyByZWNlaXZlcj1BY2NvdW50KAogICAgLy8gICAgIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1hHT1ZfREFFTU9OKSkKICAgIC8vICksCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTA5CiAgICAvLyBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlLCBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNiAvLyAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZSBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNyAvLyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2JwcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1MzYKICAgIC8vIHJldHVybiBhbW91bnQgKiBmcmFjdGlvbl9pbl9icHMgLy8gY29uc3QuQlBTCiAgICAqCiAgICBpbnRjIDUgLy8gMTAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MDQtOTExCiAgICAvLyBzZWxmLnBheSgKICAgIC8vICAgICByZWNlaXZlcj1BY2NvdW50KAogICAgLy8gICAgICAgICBzZWxmLmdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhCeXRlcyhyZWdfY2ZnLkdTX0tFWV9YR09WX0RBRU1PTikpCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5yZWxhdGl2ZV90b19hYnNvbHV0ZV9hbW91bnQoCiAgICAvLyAgICAgICAgIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUsIHNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZQogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjYWxsc3ViIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkxMgogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19TVUJNSVRURUQpCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDIwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkxMwogICAgLy8gc2VsZi5zdWJtaXNzaW9uX3RzLnZhbHVlID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDM2IC8vIDB4NzM3NTYyNmQ2OTczNzM2OTZmNmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MTUKICAgIC8vIGlmIHNlbGYuaGFzX2NvbW1pdHRlZV9yb290KCk6CiAgICBjYWxsc3ViIGhhc19jb21taXR0ZWVfcm9vdAogICAgYnogc3VibWl0X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkxNi05MTkKICAgIC8vICMgTWVtYmVycyBwcm92ZSB0aGVpciBtZW1iZXJzaGlwIG9uIHZvdGUsIHRoZXJlIGFyZSBubyB2b3RlcnMgdG8gYXNzaWduOgogICAgLy8gIyB0aGUgd2hvbGUgQ29tbWl0dGVlIGlzIGFzc2lnbmVkLCB2b3RlcnMgYW5kIGFic2VudGVlcyBhcmUgdW5hc3NpZ25lZAogICAgLy8gIyBieSBwcm9vZgogICAgLy8gc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlID0gc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTIwCiAgICAvLyBzZWxmLmFzc2lnbmVkX3ZvdGVzLnZhbHVlID0gc2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV92b3RlcyBleGlzdHMKICAgIGJ5dGVjIDUgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY3NjZmNzQ2NTczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkyMQogICAgLy8gc2VsZi5vcGVuX3ZvdGluZygpCiAgICBjYWxsc3ViIG9wZW5fdm90aW5nCgpzdWJtaXRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojg4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuYXNzaWduX3ZvdGVyc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2lnbl92b3RlcnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAzNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0MAogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5Db21taXR0ZWVNZW1iZXI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA2MAogICAgLy8gc2VsZi5hc3NpZ25fdm90ZXJzX2NoZWNrX2F1dGhvcml6YXRpb24oKQogICAgY2FsbHN1YiBhc3NpZ25fdm90ZXJzX2NoZWNrX2F1dGhvcml6YXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDYxCiAgICAvLyBzZWxmLnZvdGVyc19ncm91cF92YWxpZGF0aW9uKCkKICAgIGNhbGxzdWIgdm90ZXJzX2dyb3VwX3ZhbGlkYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDYyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYudm90ZXJfYnVja2V0cy52YWx1ZSwgZXJyLlZPVEVSU19BU1NJR05FRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vIDB4NzY2Zjc0NjU3MjVmNjI3NTYzNmI2NTc0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3Rlcl9idWNrZXRzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNjQKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTA2NgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVycy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmFzc2lnbl92b3RlcnNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNjYKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3RlcnMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IGFzc2lnbl92b3RlcnNfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDY3CiAgICAvLyBzZWxmLl9hc3NpZ25fdm90ZXIodm90ZXJzW2ldLmFkZHJlc3MsIHZvdGVyc1tpXS52b3RpbmdfcG93ZXIpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDAKICAgICoKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MDUKICAgIC8vIGFzc2VydCB2b3RlciBub3QgaW4gc2VsZi52b3RlcnMsIGVyci5WT1RFUl9BTFJFQURZX0FTU0lHTkVECiAgICBieXRlYyA0MyAvLyAiViIKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIFZvdGVyIEFscmVhZHkgQXNzaWduZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MDYKICAgIC8vIGFzc2VydCB2b3RpbmdfcG93ZXIgPiAwLCBlcnIuSU5WQUxJRF9WT1RJTkdfUE9XRVIKICAgIGRpZyAxCiAgICBhc3NlcnQgLy8gSW52YWxpZCBWb3RpbmcgUG93ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MjYKICAgIC8vIHNlbGYudm90ZXJzW3ZvdGVyXSA9IHZvdGluZ19wb3dlcgogICAgZGlnIDEKICAgIGl0b2IKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MjcKICAgIC8vIHNlbGYuYXNzaWduZWRfbWVtYmVycy52YWx1ZSArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzaWduZWRfbWVtYmVycyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTI4CiAgICAvLyBzZWxmLmFzc2lnbmVkX3ZvdGVzLnZhbHVlICs9IHZvdGluZ19wb3dlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY3NjZmNzQ2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzaWduZWRfdm90ZXMgZXhpc3RzCiAgICArCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNzY2Zjc0NjU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDY2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXJzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGFzc2lnbl92b3RlcnNfZm9yX2hlYWRlckAyCgphc3NpZ25fdm90ZXJzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNjkKICAgIC8vIHNlbGYub3Blbl92b3RpbmdfaWZfYXNzaWduZWQoKQogICAgY2FsbHN1YiBvcGVuX3ZvdGluZ19pZl9hc3NpZ25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmFzc2lnbl92b3RlcnNfdG9fYnVja2V0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmFzc2lnbl92b3RlcnNfdG9fYnVja2V0czoKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwNzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDAKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuQ29tbWl0dGVlTWVtYmVyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMDUKICAgIC8vIHNlbGYuYXNzaWduX3ZvdGVyc19jaGVja19hdXRob3JpemF0aW9uKCkKICAgIGNhbGxzdWIgYXNzaWduX3ZvdGVyc19jaGVja19hdXRob3JpemF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEwNgogICAgLy8gc2VsZi52b3RlcnNfZ3JvdXBfdmFsaWRhdGlvbigpCiAgICBjYWxsc3ViIHZvdGVyc19ncm91cF92YWxpZGF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEwNwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTA5CiAgICAvLyBpZiBub3Qgc2VsZi52b3Rlcl9idWNrZXRzLnZhbHVlOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vIDB4NzY2Zjc0NjU3MjVmNjI3NTYzNmI2NTc0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3Rlcl9idWNrZXRzIGV4aXN0cwogICAgYm56IGFzc2lnbl92b3RlcnNfdG9fYnVja2V0c19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTEwCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuYXNzaWduZWRfbWVtYmVycy52YWx1ZSwgZXJyLlZPVEVSU19BU1NJR05FRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2lnbmVkX21lbWJlcnMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gVGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTExMgogICAgLy8gc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSArIGNvbnN0LlZPVEVSX0JVQ0tFVF9NRU1CRVJTIC0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICBwdXNoaW50IDE2CiAgICArCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMTMKICAgIC8vICkgLy8gY29uc3QuVk9URVJfQlVDS0VUX01FTUJFUlMKICAgIHB1c2hpbnQgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTExLTExMTMKICAgIC8vIHNlbGYudm90ZXJfYnVja2V0cy52YWx1ZSA9ICgKICAgIC8vICAgICBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlICsgY29uc3QuVk9URVJfQlVDS0VUX01FTUJFUlMgLSAxCiAgICAvLyApIC8vIGNvbnN0LlZPVEVSX0JVQ0tFVF9NRU1CRVJTCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTExMQogICAgLy8gc2VsZi52b3Rlcl9idWNrZXRzLnZhbHVlID0gKAogICAgYnl0ZWMgMTggLy8gMHg3NjZmNzQ2NTcyNWY2Mjc1NjM2YjY1NzQ3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMTEtMTExMwogICAgLy8gc2VsZi52b3Rlcl9idWNrZXRzLnZhbHVlID0gKAogICAgLy8gICAgIHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgKyBjb25zdC5WT1RFUl9CVUNLRVRfTUVNQkVSUyAtIDEKICAgIC8vICkgLy8gY29uc3QuVk9URVJfQlVDS0VUX01FTUJFUlMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0Cgphc3NpZ25fdm90ZXJzX3RvX2J1Y2tldHNfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMTUKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3RlcnMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDQKCmFzc2lnbl92b3RlcnNfdG9fYnVja2V0c19mb3JfaGVhZGVyQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTExNQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVycy5sZW5ndGgpOgogICAgZGlnIDMKICAgIGRpZyAxCiAgICA8CiAgICBieiBhc3NpZ25fdm90ZXJzX3RvX2J1Y2tldHNfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTE2CiAgICAvLyBzZWxmLl9hc3NpZ25fYnVja2V0X3ZvdGVyKHZvdGVyc1tpXS5hZGRyZXNzLCB2b3RlcnNbaV0udm90aW5nX3Bvd2VyKQogICAgZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgNAogICAgcHVzaGludCA0MAogICAgKgogICAgcHVzaGludCA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDcKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTMxCiAgICAvLyBhc3NlcnQgdm90aW5nX3Bvd2VyID4gMCwgZXJyLklOVkFMSURfVk9USU5HX1BPV0VSCiAgICBhc3NlcnQgLy8gSW52YWxpZCBWb3RpbmcgUG93ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MzMKICAgIC8vIGJ1Y2tldCA9IHNlbGYudm90ZXJfYnVja2V0LmJveChzZWxmLmdldF92b3Rlcl9idWNrZXQodm90ZXIpKQogICAgY2FsbHN1YiBnZXRfdm90ZXJfYnVja2V0CiAgICBpdG9iCiAgICBieXRlYyA0NCAvLyAiSyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5MzQKICAgIC8vIGlmIGJ1Y2tldDoKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogYXNzaWduX3ZvdGVyc190b19idWNrZXRzX2Vsc2VfYm9keUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzNQogICAgLy8gZW5kID0gYnVja2V0Lmxlbmd0aAogICAgZGlnIDUKICAgIGR1cAogICAgYm94X2xlbgogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciAzCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzNi05MzcKICAgIC8vICMgQXBwZW5kaW5nIHNvcnRlZCB2b3RlcnMga2VlcHMgdGhlIGJ1Y2tldCBzZWFyY2hhYmxlCiAgICAvLyBsYXN0X2FkZHJlc3MgPSBidWNrZXQuZXh0cmFjdChlbmQgLSBjb25zdC5WT1RFUl9CVUNLRVRfUkVDT1JEX1NJWkUsIDMyKQogICAgZHVwCiAgICBwdXNoaW50IDQwCiAgICAtCiAgICBkaWcgMgogICAgc3dhcAogICAgaW50Y18yIC8vIDMyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjkzOC05NDAKICAgIC8vIGFzc2VydCBCaWdVSW50LmZyb21fYnl0ZXMobGFzdF9hZGRyZXNzKSA8IEJpZ1VJbnQuZnJvbV9ieXRlcygKICAgIC8vICAgICB2b3Rlci5ieXRlcwogICAgLy8gKSwgZXJyLlZPVEVSX0FMUkVBRFlfQVNTSUdORUQKICAgIGRpZyA4CiAgICBiPAogICAgYXNzZXJ0IC8vIFZvdGVyIEFscmVhZHkgQXNzaWduZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NDIKICAgIC8vIGVuZCA8IGNvbnN0LlZPVEVSX0JVQ0tFVF9NQVhfTUVNQkVSUyAqIGNvbnN0LlZPVEVSX0JVQ0tFVF9SRUNPUkRfU0laRQogICAgZHVwCiAgICBwdXNoaW50IDIwNDAKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NDEtOTQzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGVuZCA8IGNvbnN0LlZPVEVSX0JVQ0tFVF9NQVhfTUVNQkVSUyAqIGNvbnN0LlZPVEVSX0JVQ0tFVF9SRUNPUkRfU0laRQogICAgLy8gKSwgZXJyLlZPVEVSX0JVQ0tFVF9GVUxMCiAgICBhc3NlcnQgLy8gVm90ZXIgYnVja2V0IGlzIGZ1bGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NDQKICAgIC8vIGJ1Y2tldC5yZXNpemUoZW5kICsgY29uc3QuVk9URVJfQlVDS0VUX1JFQ09SRF9TSVpFKQogICAgcHVzaGludCA0MAogICAgKwogICAgYm94X3Jlc2l6ZQoKYXNzaWduX3ZvdGVyc190b19idWNrZXRzX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTQ4CiAgICAvLyBidWNrZXQucmVwbGFjZShlbmQsIHZvdGVyLmJ5dGVzICsgb3AuaXRvYih2b3RpbmdfcG93ZXIpKQogICAgZGlnIDMKICAgIGR1cAogICAgaXRvYgogICAgZGlnIDcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDgKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk1MAogICAgLy8gc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzIgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NTEKICAgIC8vIHNlbGYuYXNzaWduZWRfdm90ZXMudmFsdWUgKz0gdm90aW5nX3Bvd2VyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF92b3RlcyBleGlzdHMKICAgICsKICAgIGJ5dGVjIDUgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY3NjZmNzQ2NTczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMTUKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3RlcnMubGVuZ3RoKToKICAgIGRpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA0CiAgICBiIGFzc2lnbl92b3RlcnNfdG9fYnVja2V0c19mb3JfaGVhZGVyQDQKCmFzc2lnbl92b3RlcnNfdG9fYnVja2V0c19lbHNlX2JvZHlAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTQ2CiAgICAvLyBlbmQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTQ3CiAgICAvLyBfY3JlYXRlZCA9IGJ1Y2tldC5jcmVhdGUoc2l6ZT1VSW50NjQoY29uc3QuVk9URVJfQlVDS0VUX1JFQ09SRF9TSVpFKSkKICAgIGRpZyA2CiAgICBwdXNoaW50IDQwCiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIGIgYXNzaWduX3ZvdGVyc190b19idWNrZXRzX2FmdGVyX2lmX2Vsc2VAMTEKCmFzc2lnbl92b3RlcnNfdG9fYnVja2V0c19hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTE4CiAgICAvLyBzZWxmLm9wZW5fdm90aW5nX2lmX2Fzc2lnbmVkKCkKICAgIGNhbGxzdWIgb3Blbl92b3RpbmdfaWZfYXNzaWduZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDcxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC52b3RlW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE0OQogICAgLy8gZXJyb3IgPSBzZWxmLnZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbigpCiAgICBjYWxsc3ViIHZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE1MAogICAgLy8gaWYgZXJyb3IgIT0gdHlwLkVycm9yKCIiKToKICAgIGJ5dGVjXzAgLy8gIiIKICAgICE9CiAgICBieiB2b3RlX2FmdGVyX2lmX2Vsc2VAMwogICAgZHVwCgp2b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnZvdGVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNTMKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE1NQogICAgLy8gcmV0dXJuIHNlbGYucmVnaXN0ZXJfdm90ZSh2b3RlciwgYXBwcm92YWxzLCByZWplY3Rpb25zKQogICAgZGlnIDMKICAgIGRpZyAzCiAgICBkaWcgMwogICAgY2FsbHN1YiByZWdpc3Rlcl92b3RlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgdm90ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC52b3RlQDQKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV9iYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfYmF0Y2g6CiAgICBieXRlY18wIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA0OAogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Vm90ZT4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTc1CiAgICAvLyBlcnJvciA9IHNlbGYudm90ZV9jaGVja19hdXRob3JpemF0aW9uKCkKICAgIGNhbGxzdWIgdm90ZV9jaGVja19hdXRob3JpemF0aW9uCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTc2CiAgICAvLyBpZiBlcnJvciAhPSB0eXAuRXJyb3IoIiIpOgogICAgYnl0ZWNfMCAvLyAiIgogICAgIT0KICAgIGJ6IHZvdGVfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAzCiAgICBkdXAKCnZvdGVfYmF0Y2hfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV9iYXRjaEAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnZvdGVfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExNzkKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE4MS0xMTgyCiAgICAvLyAjIFRoZSBmaXJzdCBlcnJvciBpcyByZXR1cm5lZCwgdGhlIHJlZ2lzdHJ5IGZhaWxzIHRoZSB3aG9sZSBiYXRjaCBvbiBpdAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA0Cgp2b3RlX2JhdGNoX2Zvcl9oZWFkZXJANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTgxLTExODIKICAgIC8vICMgVGhlIGZpcnN0IGVycm9yIGlzIHJldHVybmVkLCB0aGUgcmVnaXN0cnkgZmFpbHMgdGhlIHdob2xlIGJhdGNoIG9uIGl0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXMubGVuZ3RoKToKICAgIGRpZyAzCiAgICBkaWcgMgogICAgPAogICAgYnogdm90ZV9iYXRjaF9hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExODUKICAgIC8vIHZvdGUueGdvdl9hZGRyZXNzLCB2b3RlLmFwcHJvdmFscywgdm90ZS5yZWplY3Rpb25zCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyA0CiAgICBwdXNoaW50IDQ4CiAgICAqCiAgICBwdXNoaW50IDQ4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAyCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExODQtMTE4NgogICAgLy8gZXJyb3IgPSBzZWxmLnJlZ2lzdGVyX3ZvdGUoCiAgICAvLyAgICAgdm90ZS54Z292X2FkZHJlc3MsIHZvdGUuYXBwcm92YWxzLCB2b3RlLnJlamVjdGlvbnMKICAgIC8vICkKICAgIGNhbGxzdWIgcmVnaXN0ZXJfdm90ZQogICAgZHVwCiAgICBidXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTg3CiAgICAvLyBpZiBlcnJvciAhPSB0eXAuRXJyb3IoIiIpOgogICAgYnl0ZWNfMCAvLyAiIgogICAgIT0KICAgIGJ6IHZvdGVfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA3CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB2b3RlX2JhdGNoX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfYmF0Y2hAMTAKCnZvdGVfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExODEtMTE4MgogICAgLy8gIyBUaGUgZmlyc3QgZXJyb3IgaXMgcmV0dXJuZWQsIHRoZSByZWdpc3RyeSBmYWlscyB0aGUgd2hvbGUgYmF0Y2ggb24gaXQKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3Rlcy5sZW5ndGgpOgogICAgZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDQKICAgIGIgdm90ZV9iYXRjaF9mb3JfaGVhZGVyQDQKCnZvdGVfYmF0Y2hfYWZ0ZXJfZm9yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE5MAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzAgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB2b3RlX2JhdGNoX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfYmF0Y2hAMTAKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV93aXRoX3Byb29mW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV93aXRoX3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExOTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIyNAogICAgLy8gZXJyb3IgPSBzZWxmLnZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbigpCiAgICBjYWxsc3ViIHZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIyNQogICAgLy8gaWYgZXJyb3IgIT0gdHlwLkVycm9yKCIiKToKICAgIGJ5dGVjXzAgLy8gIiIKICAgICE9CiAgICBieiB2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAzCiAgICBkdXAKCnZvdGVfd2l0aF9wcm9vZl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC52b3RlX3dpdGhfcHJvb2ZAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyMjgKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIzMAogICAgLy8gaWYgbm90IHNlbGYuaXNfY29tbWl0dGVlX21lbWJlcih2b3Rlciwgdm90aW5nX3Bvd2VyLCBvcmRpbmFsLCBwcm9vZik6CiAgICBkaWcgNgogICAgZGlnIDYKICAgIGRpZyA2CiAgICBkaWcgNgogICAgY2FsbHN1YiBpc19jb21taXR0ZWVfbWVtYmVyCiAgICBwb3AKICAgIGJueiB2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIzMQogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFUl9OT1RfRk9VTkQpCiAgICBieXRlYyAzNCAvLyAiRVJSOlZvdGVyIG5vdCBmb3VuZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV93aXRoX3Byb29mQDEwCgp2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyMzMKICAgIC8vIGlmIHNlbGYuaGFzX3ZvdGVkKG9yZGluYWwpOgogICAgZGlnIDQKICAgIGNhbGxzdWIgaGFzX3ZvdGVkCiAgICBieiB2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTIzNAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFUl9BTFJFQURZX1ZPVEVEKQogICAgcHVzaGJ5dGVzICJFUlI6Vm90ZXIgYWxyZWFkeSB2b3RlZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV93aXRoX3Byb29mQDEwCgp2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyMzYKICAgIC8vIGVycm9yID0gc2VsZi52b3Rlc192YWxpZGF0aW9uKHZvdGluZ19wb3dlciwgYXBwcm92YWxzLCByZWplY3Rpb25zKQogICAgZGlnIDUKICAgIGRpZyAzCiAgICBkaWcgMwogICAgY2FsbHN1YiB2b3Rlc192YWxpZGF0aW9uCiAgICBkdXAKICAgIGJ1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyMzcKICAgIC8vIGlmIGVycm9yICE9IHR5cC5FcnJvcigiIik6CiAgICBieXRlY18wIC8vICIiCiAgICAhPQogICAgYnogdm90ZV93aXRoX3Byb29mX2FmdGVyX2lmX2Vsc2VAOQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTE5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgdm90ZV93aXRoX3Byb29mX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfd2l0aF9wcm9vZkAxMAoKdm90ZV93aXRoX3Byb29mX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjQwCiAgICAvLyBzZWxmLnVuYXNzaWduX21lbWJlcihvcmRpbmFsLCB2b3RpbmdfcG93ZXIpCiAgICBkaWcgNAogICAgZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgY2FsbHN1YiB1bmFzc2lnbl9tZW1iZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjQxCiAgICAvLyBzZWxmLmNvdW50X3ZvdGUodm90ZXIsIHZvdGluZ19wb3dlciwgYXBwcm92YWxzLCByZWplY3Rpb25zKQogICAgZGlnIDcKICAgIHN3YXAKICAgIGRpZyA0CiAgICBkaWcgNAogICAgY2FsbHN1YiBjb3VudF92b3RlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI0MwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzAgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB2b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV93aXRoX3Byb29mQDEwCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnNjcnV0aW55W3JvdXRpbmddKCkgLT4gdm9pZDoKc2NydXRpbnk6CiAgICBieXRlY18wIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTc0CiAgICAvLyBCeXRlcyhyZWdfY2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkpCiAgICBieXRlYyAzMyAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3My01NzUKICAgIC8vIHJlZ2lzdHJ5X3BhdXNlZCA9IHNlbGYuZ2V0X3VpbnRfZnJvbV9yZWdpc3RyeV9jb25maWcoCiAgICAvLyAgICAgQnl0ZXMocmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZKQogICAgLy8gKQogICAgY2FsbHN1YiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU3NgogICAgLy8gYXNzZXJ0IG5vdCByZWdpc3RyeV9wYXVzZWQsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozODMKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX1ZPVElORywgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDI1CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozODUKICAgIC8vIG5vdCBzZWxmLmlzX3ZvdGluZ19vcGVuKCkgICMgdm90aW5nIHBlcmlvZCBoYXMgZW5kZWQKICAgIGNhbGxzdWIgaXNfdm90aW5nX29wZW4KICAgIGJ6IHNjcnV0aW55X2Jvb2xfdHJ1ZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzg2CiAgICAvLyBvciBzZWxmLmlzX3BsZWJpc2NpdGUoKSAgIyBhbGwgY29tbWl0dGVlIG1lbWJlcnMgYWxyZWFkeSB2b3RlZAogICAgY2FsbHN1YiBpc19wbGViaXNjaXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzg1LTM4NgogICAgLy8gbm90IHNlbGYuaXNfdm90aW5nX29wZW4oKSAgIyB2b3RpbmcgcGVyaW9kIGhhcyBlbmRlZAogICAgLy8gb3Igc2VsZi5pc19wbGViaXNjaXRlKCkgICMgYWxsIGNvbW1pdHRlZSBtZW1iZXJzIGFscmVhZHkgdm90ZWQKICAgIGJ6IHNjcnV0aW55X2Jvb2xfZmFsc2VAOAoKc2NydXRpbnlfYm9vbF90cnVlQDc6CiAgICBpbnRjXzEgLy8gMQoKc2NydXRpbnlfYm9vbF9tZXJnZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM4NC0zODcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbm90IHNlbGYuaXNfdm90aW5nX29wZW4oKSAgIyB2b3RpbmcgcGVyaW9kIGhhcyBlbmRlZAogICAgLy8gICAgIG9yIHNlbGYuaXNfcGxlYmlzY2l0ZSgpICAjIGFsbCBjb21taXR0ZWUgbWVtYmVycyBhbHJlYWR5IHZvdGVkCiAgICAvLyApLCBlcnIuVk9USU5HX09OR09JTkcKICAgIGFzc2VydCAvLyBWb3RpbmcgT25nb2luZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNjAKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzAwCiAgICAvLyBzZWxmLmlzX3F1b3J1bV92b3RlcnNfcmVhY2hlZCgpCiAgICBjYWxsc3ViIGlzX3F1b3J1bV92b3RlcnNfcmVhY2hlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcwMC03MDIKICAgIC8vIHNlbGYuaXNfcXVvcnVtX3ZvdGVyc19yZWFjaGVkKCkKICAgIC8vIGFuZCBzZWxmLmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkKCkKICAgIC8vIGFuZCBzZWxmLmhhc19tYWpvcml0eV9hcHByb3ZlZCgpCiAgICBieiBzY3J1dGlueV9ib29sX2ZhbHNlQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzAxCiAgICAvLyBhbmQgc2VsZi5pc193ZWlnaHRlZF9xdW9ydW1fdm90ZXNfcmVhY2hlZCgpCiAgICBjYWxsc3ViIGlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NzAwLTcwMgogICAgLy8gc2VsZi5pc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQoKQogICAgLy8gYW5kIHNlbGYuaXNfd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzX3JlYWNoZWQoKQogICAgLy8gYW5kIHNlbGYuaGFzX21ham9yaXR5X2FwcHJvdmVkKCkKICAgIGJ6IHNjcnV0aW55X2Jvb2xfZmFsc2VAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo3MDIKICAgIC8vIGFuZCBzZWxmLmhhc19tYWpvcml0eV9hcHByb3ZlZCgpCiAgICBjYWxsc3ViIGhhc19tYWpvcml0eV9hcHByb3ZlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjcwMC03MDIKICAgIC8vIHNlbGYuaXNfcXVvcnVtX3ZvdGVyc19yZWFjaGVkKCkKICAgIC8vIGFuZCBzZWxmLmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkKCkKICAgIC8vIGFuZCBzZWxmLmhhc19tYWpvcml0eV9hcHByb3ZlZCgpCiAgICBieiBzY3J1dGlueV9ib29sX2ZhbHNlQDE1CiAgICBpbnRjXzEgLy8gMQogICAgYnVyeSAxCgpzY3J1dGlueV9ib29sX21lcmdlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNjQKICAgIC8vIGlmIGlzX2FwcHJvdmVkOgogICAgZHVwCiAgICBieiBzY3J1dGlueV9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNjUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID0gVUludDY0KGVubS5TVEFUVVNfQVBQUk9WRUQpCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDMwCiAgICBhcHBfZ2xvYmFsX3B1dAoKc2NydXRpbnlfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNzUKICAgIC8vIHBsZWJpc2NpdGU9c2VsZi5pc19wbGViaXNjaXRlKCksCiAgICBjYWxsc3ViIGlzX3BsZWJpc2NpdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjc2CiAgICAvLyByb3VuZD1HbG9iYWwucm91bmQsCiAgICBnbG9iYWwgUm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjczLTEyNzcKICAgIC8vIHR5cC5TY3J1dGlueSgKICAgIC8vICAgICBhcHByb3ZlZD1pc19hcHByb3ZlZCwKICAgIC8vICAgICBwbGViaXNjaXRlPXNlbGYuaXNfcGxlYmlzY2l0ZSgpLAogICAgLy8gICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIGJ5dGVjIDEzIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgNAogICAgc2V0Yml0CiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciAzCiAgICBzZXRiaXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNzItMTI3OAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIHR5cC5TY3J1dGlueSgKICAgIC8vICAgICAgICAgYXBwcm92ZWQ9aXNfYXBwcm92ZWQsCiAgICAvLyAgICAgICAgIHBsZWJpc2NpdGU9c2VsZi5pc19wbGViaXNjaXRlKCksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4Yjc4OTUxNCAvLyBtZXRob2QgIlNjcnV0aW55KGJvb2wsYm9vbCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjQ1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKc2NydXRpbnlfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI2NwogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19SRUpFQ1RFRCkKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIHB1c2hpbnQgNDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI2OQogICAgLy8gcmVjZWl2ZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyNjgtMTI3MAogICAgLy8gc2VsZi50cmFuc2Zlcl9sb2NrZWRfYW1vdW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYucHJvcG9zZXIudmFsdWUsCiAgICAvLyApCiAgICBjYWxsc3ViIHRyYW5zZmVyX2xvY2tlZF9hbW91bnQKICAgIGIgc2NydXRpbnlfYWZ0ZXJfaWZfZWxzZUA0CgpzY3J1dGlueV9ib29sX2ZhbHNlQDE1OgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgMQogICAgYiBzY3J1dGlueV9ib29sX21lcmdlQDE2CgpzY3J1dGlueV9ib29sX2ZhbHNlQDg6CiAgICBpbnRjXzAgLy8gMAogICAgYiBzY3J1dGlueV9ib29sX21lcmdlQDkKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVzW3JvdXRpbmddKCkgLT4gdm9pZDoKdW5hc3NpZ25fYWJzZW50ZWVzOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyOTMKICAgIC8vIGVycm9yID0gc2VsZi51bmFzc2lnbl9hYnNlbnRlZXNfY2hlY2tfYXV0aG9yaXphdGlvbigpCiAgICBjYWxsc3ViIHVuYXNzaWduX2Fic2VudGVlc19jaGVja19hdXRob3JpemF0aW9uCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjk0CiAgICAvLyBpZiBlcnJvciAhPSB0eXAuRXJyb3IoIiIpOgogICAgYnl0ZWNfMCAvLyAiIgogICAgIT0KICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlc19hZnRlcl9pZl9lbHNlQDMKICAgIGR1cAoKdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlc0AxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnVuYXNzaWduX2Fic2VudGVlc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI5NwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDYKCnVuYXNzaWduX2Fic2VudGVlc19mb3JfaGVhZGVyQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTI5OS0xMzAwCiAgICAvLyAjIHJlbW92ZSBhYnNlbnRlZQogICAgLy8gZm9yIGFic2VudGVlIGluIGFic2VudGVlczoKICAgIGRpZyA1CiAgICBkaWcgMgogICAgPAogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVzX2FmdGVyX2ZvckA5CiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyA2CiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzMDEKICAgIC8vIHZvdGVzLCByZWNvcmQgPSBzZWxmLmdldF92b3RlcihhYnNlbnRlZSkKICAgIGNhbGxzdWIgZ2V0X3ZvdGVyCiAgICBidXJ5IDYKICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTMwMgogICAgLy8gaWYgdm90ZXMgPT0gMDoKICAgIGJueiB1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTMwMwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFUl9OT1RfRk9VTkQpCiAgICBieXRlYyAzNCAvLyAiRVJSOlZvdGVyIG5vdCBmb3VuZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMjgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVzQDEwCgp1bmFzc2lnbl9hYnNlbnRlZXNfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzMDQKICAgIC8vIHNlbGYuX3VuYXNzaWduX3ZvdGVyKGFic2VudGVlLCB2b3RlcywgcmVjb3JkKQogICAgZGlnIDYKICAgIGRpZyA0CiAgICBkaWcgNgogICAgY2FsbHN1YiBfdW5hc3NpZ25fdm90ZXIKICAgIGRpZyA1CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA2CiAgICBiIHVuYXNzaWduX2Fic2VudGVlc19mb3JfaGVhZGVyQDQKCnVuYXNzaWduX2Fic2VudGVlc19hZnRlcl9mb3JAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzA2CiAgICAvLyByZXR1cm4gdHlwLkVycm9yKCIiKQogICAgYnl0ZWNfMCAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEyODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBiIHVuYXNzaWduX2Fic2VudGVlc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXNAMTAKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZltyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX2Fic2VudGVlX3dpdGhfcHJvb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTMwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzM0CiAgICAvLyBlcnJvciA9IHNlbGYudW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb24oKQogICAgY2FsbHN1YiB1bmFzc2lnbl9hYnNlbnRlZXNfY2hlY2tfYXV0aG9yaXphdGlvbgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTMzNQogICAgLy8gaWYgZXJyb3IgIT0gdHlwLkVycm9yKCIiKToKICAgIGJ5dGVjXzAgLy8gIiIKICAgICE9CiAgICBieiB1bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mX2FmdGVyX2lmX2Vsc2VAMwogICAgZHVwCgp1bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlX3dpdGhfcHJvb2ZANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnVuYXNzaWduX2Fic2VudGVlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzMzgKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM0MC0xMzQyCiAgICAvLyBpZiBub3Qgc2VsZi5pc19jb21taXR0ZWVfbWVtYmVyKAogICAgLy8gICAgIGFic2VudGVlLCB2b3RpbmdfcG93ZXIsIG9yZGluYWwsIHByb29mCiAgICAvLyApIG9yIHNlbGYuaGFzX3ZvdGVkKG9yZGluYWwpOgogICAgZGlnIDQKICAgIGRpZyA0CiAgICBkaWcgNAogICAgZGlnIDQKICAgIGNhbGxzdWIgaXNfY29tbWl0dGVlX21lbWJlcgogICAgcG9wCiAgICBieiB1bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mX2lmX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNDIKICAgIC8vICkgb3Igc2VsZi5oYXNfdm90ZWQob3JkaW5hbCk6CiAgICBkaWcgMgogICAgY2FsbHN1YiBoYXNfdm90ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzQwLTEzNDIKICAgIC8vIGlmIG5vdCBzZWxmLmlzX2NvbW1pdHRlZV9tZW1iZXIoCiAgICAvLyAgICAgYWJzZW50ZWUsIHZvdGluZ19wb3dlciwgb3JkaW5hbCwgcHJvb2YKICAgIC8vICkgb3Igc2VsZi5oYXNfdm90ZWQob3JkaW5hbCk6CiAgICBieiB1bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mX2FmdGVyX2lmX2Vsc2VANgoKdW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZl9pZl9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM0MwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFUl9OT1RfRk9VTkQpCiAgICBieXRlYyAzNCAvLyAiRVJSOlZvdGVyIG5vdCBmb3VuZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiB1bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlX3dpdGhfcHJvb2ZANwoKdW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZl9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM0NQogICAgLy8gc2VsZi51bmFzc2lnbl9tZW1iZXIob3JkaW5hbCwgdm90aW5nX3Bvd2VyKQogICAgZGlnIDIKICAgIGRpZyA0CiAgICBjYWxsc3ViIHVuYXNzaWduX21lbWJlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNDcKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18wIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTMwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgdW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mQDcKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwucmV2aWV3W3JvdXRpbmddKCkgLT4gdm9pZDoKcmV2aWV3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTg1CiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBBY2NvdW50KAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU4NgogICAgLy8gc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9DT1VOQ0lMKSkKICAgIHB1c2hieXRlcyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgY2FsbHN1YiBnZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1ODUtNTg3CiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBBY2NvdW50KAogICAgLy8gICAgIHNlbGYuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKEJ5dGVzKHJlZ19jZmcuR1NfS0VZX1hHT1ZfQ09VTkNJTCkpCiAgICAvLyApCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI0MAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfY291bmNpbCgpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQxCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19BUFBST1ZFRCwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDMwCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzY1LTEzNjYKICAgIC8vICMgY2hlY2sgbm8gYXNzaWduZWQgdm90ZXJzCiAgICAvLyBhc3NlcnQgc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlID09IDAsIGVyci5WT1RFUlNfQVNTSUdORUQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNjgKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM3MAogICAgLy8gaWYgYmxvY2s6CiAgICBieiByZXZpZXdfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzcxCiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9IFVJbnQ2NChlbm0uU1RBVFVTX0JMT0NLRUQpCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDYwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNzMtMTM3NAogICAgLy8gIyBzbGFzaGluZzogc2VuZCBsb2NrZWQgYW1vdW50IHRvIHRoZSByZWdpc3RyeSB0cmVhc3VyeQogICAgLy8gcmVnX2FwcCA9IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM3NgogICAgLy8gcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNzUtMTM3NwogICAgLy8gc2VsZi50cmFuc2Zlcl9sb2NrZWRfYW1vdW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlZ19hcHAuYWRkcmVzcywKICAgIC8vICkKICAgIGNhbGxzdWIgdHJhbnNmZXJfbG9ja2VkX2Ftb3VudAoKcmV2aWV3X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzg3CiAgICAvLyBhcmM0LmVtaXQodHlwLlJldmlldyh2ZXRvPWJsb2NrLCByb3VuZD1HbG9iYWwucm91bmQpKQogICAgZ2xvYmFsIFJvdW5kCiAgICBieXRlYyAxMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDMKICAgIHNldGJpdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhhZWU4MTcxOSAvLyBtZXRob2QgIlJldmlldyhib29sLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzNDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpyZXZpZXdfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM4MAogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19SRVZJRVdFRCkKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIHB1c2hpbnQgNDUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM4NAogICAgLy8gcmVjZWl2ZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzODItMTM4NQogICAgLy8gIyByZWZ1bmQgdGhlIGxvY2tlZCBhbW91bnQgdG8gdGhlIHByb3Bvc2VyCiAgICAvLyBzZWxmLnRyYW5zZmVyX2xvY2tlZF9hbW91bnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIC8vICkKICAgIGNhbGxzdWIgdHJhbnNmZXJfbG9ja2VkX2Ftb3VudAogICAgYiByZXZpZXdfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZ1bmRbcm91dGluZ10oKSAtPiB2b2lkOgpmdW5kOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNDQKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdHJ5X2NhbGwoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZWdpc3RyeV9jYWxsCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjQ1CiAgICAvLyBpZiBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFVklFV0VEOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQ1CiAgICAhPQogICAgYnogZnVuZF9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNDYKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgYnl0ZWMgMjQgLy8gIkVSUjpXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgYnVyeSAxCgpmdW5kX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZ1bmRfY2hlY2tfYXV0aG9yaXphdGlvbkA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzOTkKICAgIC8vIGlmIGVycm9yICE9IHR5cC5FcnJvcigiIik6CiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIiIKICAgICE9CiAgICBieiBmdW5kX2FmdGVyX2lmX2Vsc2VAMwogICAgZHVwCgpmdW5kX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZ1bmRANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMzg5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmZ1bmRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0MDIKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQwNAogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19GVU5ERUQpCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDUwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0MDYKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18wIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTM4OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgZnVuZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5mdW5kQDQKCmZ1bmRfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEzOTgKICAgIC8vIGVycm9yID0gc2VsZi5mdW5kX2NoZWNrX2F1dGhvcml6YXRpb24oKQogICAgYiBmdW5kX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZ1bmRfY2hlY2tfYXV0aG9yaXphdGlvbkA4CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX3ZvdGVyc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX3ZvdGVyczoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YWNjb3VudD4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNTEKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfZGFlbW9uKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9kYWVtb24KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNTIKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX1NVQk1JVFRFRCwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDIwCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDI0CiAgICAvLyBzZWxmLnZvdGVyc19ncm91cF92YWxpZGF0aW9uKCkKICAgIGNhbGxzdWIgdm90ZXJzX2dyb3VwX3ZhbGlkYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDI2CiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgaW50Y18wIC8vIDAKCnVuYXNzaWduX3ZvdGVyc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQyOC0xNDI5CiAgICAvLyAjIHJlbW92ZSB2b3RlcnMKICAgIC8vIGZvciB2b3RlciBpbiB2b3RlcnM6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiB1bmFzc2lnbl92b3RlcnNfYWZ0ZXJfZm9yQDcKICAgIGRpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQzMAogICAgLy8gdm90ZXMsIHJlY29yZCA9IHNlbGYuZ2V0X3ZvdGVyKHZvdGVyKQogICAgY2FsbHN1YiBnZXRfdm90ZXIKICAgIGJ1cnkgNgogICAgZHVwCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDMxCiAgICAvLyBpZiB2b3RlczoKICAgIGJ6IHVuYXNzaWduX3ZvdGVyc19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDMyCiAgICAvLyBzZWxmLl91bmFzc2lnbl92b3Rlcih2b3Rlciwgdm90ZXMsIHJlY29yZCkKICAgIGRpZyA1CiAgICBkaWcgNAogICAgZGlnIDYKICAgIGNhbGxzdWIgX3VuYXNzaWduX3ZvdGVyCgp1bmFzc2lnbl92b3RlcnNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHVuYXNzaWduX3ZvdGVyc19mb3JfaGVhZGVyQDIKCnVuYXNzaWduX3ZvdGVyc19hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmZpbmFsaXplOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNjgKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdHJ5X2NhbGwoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZWdpc3RyeV9jYWxsCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjcwCiAgICAvLyBpZiBzZWxmLmZpbmFsaXplZC52YWx1ZSBvciAoCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZpbmFsaXplZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzAtMjc2CiAgICAvLyBpZiBzZWxmLmZpbmFsaXplZC52YWx1ZSBvciAoCiAgICAvLyAgICAgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19FTVBUWQogICAgLy8gICAgIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyAgICAgYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRlVOREVECiAgICAvLyAgICAgYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfQkxPQ0tFRAogICAgLy8gICAgIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICAvLyApOgogICAgYm56IGZpbmFsaXplX2lmX2JvZHlAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzEKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3MS0yNzUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0JMT0NLRUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBieiBmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjcyCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19EUkFGVAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDEwCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3MS0yNzUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0JMT0NLRUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBieiBmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjczCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCA1MAogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNzEtMjc1CiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0VNUFRZCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19EUkFGVAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRlVOREVECiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19CTE9DS0VECiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19SRUpFQ1RFRAogICAgYnogZmluYWxpemVfYWZ0ZXJfaWZfZWxzZUAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gYW5kIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfQkxPQ0tFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDYwCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3MS0yNzUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0JMT0NLRUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBieiBmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjc1CiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19SRUpFQ1RFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQwCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3MS0yNzUKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlICE9IGVubS5TVEFUVVNfRU1QVFkKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyBhbmQgc2VsZi5zdGF0dXMudmFsdWUgIT0gZW5tLlNUQVRVU19GVU5ERUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX0JMT0NLRUQKICAgIC8vIGFuZCBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1JFSkVDVEVECiAgICBieiBmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2CgpmaW5hbGl6ZV9pZl9ib2R5QDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3NwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBieXRlYyAyNCAvLyAiRVJSOldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICBidXJ5IDEKCmZpbmFsaXplX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmZpbmFsaXplX2NoZWNrX2F1dGhvcml6YXRpb25AMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ0NgogICAgLy8gaWYgZXJyb3IgIT0gdHlwLkVycm9yKCIiKToKICAgIGR1cAogICAgYnl0ZWNfMCAvLyAiIgogICAgIT0KICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VAMwogICAgZHVwCgpmaW5hbGl6ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0MzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZmluYWxpemVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NDkKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ1MS0xNDUyCiAgICAvLyAjIGNoZWNrIG5vIGFzc2lnbmVkIHZvdGVycwogICAgLy8gaWYgc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlID4gMDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgYnogZmluYWxpemVfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ1MwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFUlNfQVNTSUdORUQpCiAgICBwdXNoYnl0ZXMgIkVSUjpUaGVyZSBhcmUgdm90ZXJzIGFzc2lnbmVkIHRvIHRoaXMgcHJvcG9zYWwiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQzNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGIgZmluYWxpemVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZmluYWxpemVAOAoKZmluYWxpemVfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NTUtMTQ1OAogICAgLy8gIyByZWZ1bmQgdGhlIGxvY2tlZCBhbW91bnQgZm9yIERSQUZUIHByb3Bvc2FscwogICAgLy8gIyBmb3IgUkVKRUNURUQgcHJvcG9zYWxzLCB0aGUgbG9ja2VkIGFtb3VudCBpcyBhbHJlYWR5IHJlZnVuZGVkIGluIHRoZSBzY3J1dGlueSBtZXRob2QKICAgIC8vICMgZm9yIEVNUFRZLCBGVU5ERUQsIG9yIEJMT0NLRUQgcHJvcG9zYWxzLCB0aGUgbG9ja2VkIGFtb3VudCBpcyBub3QgcmVmdW5kYWJsZQogICAgLy8gaWYgc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19EUkFGVDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAxMAogICAgPT0KICAgIGJ6IGZpbmFsaXplX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NjAKICAgIC8vIHJlY2VpdmVyPXNlbGYucHJvcG9zZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDU5LTE0NjEKICAgIC8vIHNlbGYudHJhbnNmZXJfbG9ja2VkX2Ftb3VudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnByb3Bvc2VyLnZhbHVlLAogICAgLy8gKQogICAgY2FsbHN1YiB0cmFuc2Zlcl9sb2NrZWRfYW1vdW50CgpmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ2MgogICAgLy8gcmVnX2FwcCA9IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ2NAogICAgLy8gcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NjUKICAgIC8vIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NjYKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NjUtMTQ2NgogICAgLy8gYW1vdW50PUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlLAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NjMtMTQ2NwogICAgLy8gc2VsZi5wYXkoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vICAgICAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UsCiAgICAvLyApCiAgICBjYWxsc3ViIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NjgKICAgIC8vIHNlbGYuZmluYWxpemVkLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWMgNyAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ3MAogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzAgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDM0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgYiBmaW5hbGl6ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZUA4CgpmaW5hbGl6ZV9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gcmV0dXJuIHR5cC5FcnJvcigiIikKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0NDUKICAgIC8vIGVycm9yID0gc2VsZi5maW5hbGl6ZV9jaGVja19hdXRob3JpemF0aW9uKCkKICAgIGIgZmluYWxpemVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZmluYWxpemVfY2hlY2tfYXV0aG9yaXphdGlvbkAxNwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5kZWxldGVbcm91dGluZ10oKSAtPiB2b2lkOgpkZWxldGU6CiAgICBieXRlY18wIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyODIKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfZGFlbW9uKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9kYWVtb24KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyODMKICAgIC8vIGFzc2VydCBzZWxmLmZpbmFsaXplZC52YWx1ZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg2NjY5NmU2MTZjNjk3YTY1NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5maW5hbGl6ZWQgZXhpc3RzCiAgICBhc3NlcnQgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0ODQtMTQ4NQogICAgLy8gIyBkZWxldGUgbWV0YWRhdGEgYm94IGlmIGl0IGV4aXN0cwogICAgLy8gZGVsIHNlbGYubWV0YWRhdGEudmFsdWUKICAgIGJ5dGVjIDEyIC8vICJNIgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ4Ny0xNDg4CiAgICAvLyAjIGRlbGV0ZSB2b3RlZCBiaXRtYXAgcGFnZXMgaWYgdGhleSBleGlzdAogICAgLy8gaWYgc2VsZi5oYXNfY29tbWl0dGVlX3Jvb3QoKToKICAgIGNhbGxzdWIgaGFzX2NvbW1pdHRlZV9yb290CiAgICBieiBkZWxldGVfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ5MAogICAgLy8gKHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgKyBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9NRU1CRVJTIC0gMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzIGV4aXN0cwogICAgaW50YyA0IC8vIDgxOTIKICAgICsKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ5MQogICAgLy8gLy8gY29uc3QuVk9URURfQklUTUFQX1BBR0VfTUVNQkVSUwogICAgaW50YyA0IC8vIDgxOTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDkwLTE0OTEKICAgIC8vIChzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlICsgY29uc3QuVk9URURfQklUTUFQX1BBR0VfTUVNQkVSUyAtIDEpCiAgICAvLyAvLyBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9NRU1CRVJTCiAgICAvCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDg5LTE0OTIKICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZSgKICAgIC8vICAgICAoc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSArIGNvbnN0LlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMgLSAxKQogICAgLy8gICAgIC8vIGNvbnN0LlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMKICAgIC8vICk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAyCgpkZWxldGVfZm9yX2hlYWRlckAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0ODktMTQ5MgogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKAogICAgLy8gICAgIChzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlICsgY29uc3QuVk9URURfQklUTUFQX1BBR0VfTUVNQkVSUyAtIDEpCiAgICAvLyAgICAgLy8gY29uc3QuVk9URURfQklUTUFQX1BBR0VfTUVNQkVSUwogICAgLy8gKToKICAgIGR1cDIKICAgIDwKICAgIGJ6IGRlbGV0ZV9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDkzCiAgICAvLyBkZWwgc2VsZi52b3RlZF9iaXRtYXBbcGFnZV0KICAgIGRpZyAxCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjIDM1IC8vICJCIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDg5LTE0OTIKICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZSgKICAgIC8vICAgICAoc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSArIGNvbnN0LlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMgLSAxKQogICAgLy8gICAgIC8vIGNvbnN0LlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMKICAgIC8vICk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAyCiAgICBiIGRlbGV0ZV9mb3JfaGVhZGVyQDMKCmRlbGV0ZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ5NQogICAgLy8gcmVnX2FwcCA9IEFwcGxpY2F0aW9uKHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTQ5NwogICAgLy8gcmVjZWl2ZXI9cmVnX2FwcC5hZGRyZXNzLAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE0OTgKICAgIC8vIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDk2LTE0OTkKICAgIC8vIHNlbGYucGF5KAogICAgLy8gICAgIHJlY2VpdmVyPXJlZ19hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlLAogICAgLy8gKQogICAgY2FsbHN1YiBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNDcyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz0oIkRlbGV0ZUFwcGxpY2F0aW9uIiwpKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfc3RhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTUxMAogICAgLy8gcHJvcG9zZXI9c2VsZi5wcm9wb3Nlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTEKICAgIC8vIHJlZ2lzdHJ5X2FwcF9pZD1zZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vIDB4NzI2NTY3Njk3Mzc0NzI3OTVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVnaXN0cnlfYXBwX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTIKICAgIC8vIHRpdGxlPXNlbGYudGl0bGUudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzggLy8gMHg3NDY5NzQ2YzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudGl0bGUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTUxMwogICAgLy8gb3Blbl90cz1zZWxmLm9wZW5fdHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjggLy8gMHg2ZjcwNjU2ZTVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3Blbl90cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTE0CiAgICAvLyBzdWJtaXNzaW9uX3RzPXNlbGYuc3VibWlzc2lvbl90cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNiAvLyAweDczNzU2MjZkNjk3MzczNjk2ZjZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdWJtaXNzaW9uX3RzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTUKICAgIC8vIHZvdGVfb3Blbl90cz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOSAvLyAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZV9vcGVuX3RzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTYKICAgIC8vIHN0YXR1cz1zZWxmLnN0YXR1cy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTcKICAgIC8vIGZpbmFsaXplZD1zZWxmLmZpbmFsaXplZC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NjY2OTZlNjE2YzY5N2E2NTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmluYWxpemVkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTgKICAgIC8vIGZ1bmRpbmdfY2F0ZWdvcnk9c2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vIDB4NjY3NTZlNjQ2OTZlNjc1ZjYzNjE3NDY1Njc2ZjcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mdW5kaW5nX2NhdGVnb3J5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MTkKICAgIC8vIGZvY3VzPWFyYzQuVUludDgoc2VsZi5mb2N1cy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzkgLy8gMHg2NjZmNjM3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZm9jdXMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTUyMAogICAgLy8gZnVuZGluZ190eXBlPXNlbGYuZnVuZGluZ190eXBlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMwIC8vIDB4NjY3NTZlNjQ2OTZlNjc1Zjc0Nzk3MDY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZnVuZGluZ190eXBlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MjEKICAgIC8vIHJlcXVlc3RlZF9hbW91bnQ9c2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4NzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MjIKICAgIC8vIGxvY2tlZF9hbW91bnQ9c2VsZi5sb2NrZWRfYW1vdW50LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vIDB4NmM2ZjYzNmI2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sb2NrZWRfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MjMKICAgIC8vIGNvbW1pdHRlZV9pZD1zZWxmLmNvbW1pdHRlZV9pZC52YWx1ZS5jb3B5KCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTUyNAogICAgLy8gY29tbWl0dGVlX21lbWJlcnM9c2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MjUKICAgIC8vIGNvbW1pdHRlZV92b3Rlcz1zZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV92b3RlcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTI2CiAgICAvLyB2b3RlZF9tZW1iZXJzPXNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MjcKICAgIC8vIGJveWNvdHRlZF9tZW1iZXJzPXNlbGYuYm95Y290dGVkX21lbWJlcnMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm95Y290dGVkX21lbWJlcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTUyOAogICAgLy8gYXBwcm92YWxzPXNlbGYuYXBwcm92YWxzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MjkKICAgIC8vIHJlamVjdGlvbnM9c2VsZi5yZWplY3Rpb25zLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWplY3Rpb25zIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MzAKICAgIC8vIG51bGxzPXNlbGYubnVsbHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gMHg2ZTc1NmM2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubnVsbHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTUwOS0xNTMxCiAgICAvLyByZXR1cm4gdHlwLlByb3Bvc2FsVHlwZWRHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBwcm9wb3Nlcj1zZWxmLnByb3Bvc2VyLnZhbHVlLAogICAgLy8gICAgIHJlZ2lzdHJ5X2FwcF9pZD1zZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwKICAgIC8vICAgICB0aXRsZT1zZWxmLnRpdGxlLnZhbHVlLAogICAgLy8gICAgIG9wZW5fdHM9c2VsZi5vcGVuX3RzLnZhbHVlLAogICAgLy8gICAgIHN1Ym1pc3Npb25fdHM9c2VsZi5zdWJtaXNzaW9uX3RzLnZhbHVlLAogICAgLy8gICAgIHZvdGVfb3Blbl90cz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSwKICAgIC8vICAgICBzdGF0dXM9c2VsZi5zdGF0dXMudmFsdWUsCiAgICAvLyAgICAgZmluYWxpemVkPXNlbGYuZmluYWxpemVkLnZhbHVlLAogICAgLy8gICAgIGZ1bmRpbmdfY2F0ZWdvcnk9c2VsZi5mdW5kaW5nX2NhdGVnb3J5LnZhbHVlLAogICAgLy8gICAgIGZvY3VzPWFyYzQuVUludDgoc2VsZi5mb2N1cy52YWx1ZSksCiAgICAvLyAgICAgZnVuZGluZ190eXBlPXNlbGYuZnVuZGluZ190eXBlLnZhbHVlLAogICAgLy8gICAgIHJlcXVlc3RlZF9hbW91bnQ9c2VsZi5yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgLy8gICAgIGxvY2tlZF9hbW91bnQ9c2VsZi5sb2NrZWRfYW1vdW50LnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9pZD1zZWxmLmNvbW1pdHRlZV9pZC52YWx1ZS5jb3B5KCksCiAgICAvLyAgICAgY29tbWl0dGVlX21lbWJlcnM9c2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfdm90ZXM9c2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsCiAgICAvLyAgICAgdm90ZWRfbWVtYmVycz1zZWxmLnZvdGVkX21lbWJlcnMudmFsdWUsCiAgICAvLyAgICAgYm95Y290dGVkX21lbWJlcnM9c2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSwKICAgIC8vICAgICBhcHByb3ZhbHM9c2VsZi5hcHByb3ZhbHMudmFsdWUsCiAgICAvLyAgICAgcmVqZWN0aW9ucz1zZWxmLnJlamVjdGlvbnMudmFsdWUsCiAgICAvLyAgICAgbnVsbHM9c2VsZi5udWxscy52YWx1ZSwKICAgIC8vICkKICAgIHVuY292ZXIgMTkKICAgIGl0b2IKICAgIHVuY292ZXIgMjAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDE5CiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHB1c2hieXRlcyAweDAwYzQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxOQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE4CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTcKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNgogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlYyAxMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAxNwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDEyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTEKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1MDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfc3RhdGVfdmVyc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9zdGF0ZV92ZXJzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1NDEKICAgIC8vIHJldHVybiBzZWxmLnN0YXRlX3ZlcnNpb24udmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMiAvLyAweDczNzQ2MTc0NjU1Zjc2NjU3MjczNjk2ZjZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdGVfdmVyc2lvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X3ZvdGVyX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3Rlcl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTU0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTU1CiAgICAvLyB2b3RlcywgX3JlY29yZCA9IHNlbGYuZ2V0X3ZvdGVyKHZvdGVyX2FkZHJlc3MpCiAgICBjYWxsc3ViIGdldF92b3RlcgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTU1NwogICAgLy8gcmV0dXJuIHZvdGVzLCB2b3RlcyA+IDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHN3YXAKICAgIGl0b2IKICAgIGJ5dGVjIDEzIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF92b3RlZF9iaXRtYXBfcGFnZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF92b3RlZF9iaXRtYXBfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNTczCiAgICAvLyBleGlzdHMgPSBwYWdlIGluIHNlbGYudm90ZWRfYml0bWFwCiAgICBpdG9iCiAgICBieXRlYyAzNSAvLyAiQiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTU3NAogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3ZvdGVkX2JpdG1hcF9wYWdlX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTU3NQogICAgLy8gYml0bWFwID0gc2VsZi52b3RlZF9iaXRtYXBbcGFnZV0KICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9iaXRtYXAgZW50cnkgZXhpc3RzCgpnZXRfdm90ZWRfYml0bWFwX3BhZ2VfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1NTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDEzIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgMwogICAgc2V0Yml0CiAgICBwdXNoYnl0ZXMgMHgwMDAzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X3ZvdGVkX2JpdG1hcF9wYWdlX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1NzcKICAgIC8vIGJpdG1hcCA9IEJ5dGVzKCkKICAgIGJ5dGVjXzAgLy8gMHgKICAgIGIgZ2V0X3ZvdGVkX2JpdG1hcF9wYWdlX2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfdm90aW5nX3N0YXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3ZvdGluZ19zdGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjAxCiAgICAvLyBxdW9ydW1fdm90ZXJzPWFyYzQuVUludDMyKHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gMHg3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1b3J1bV90aHJlc2hvbGQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2MDIKICAgIC8vIHdlaWdodGVkX3F1b3J1bV92b3Rlcz1hcmM0LlVJbnQzMihzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIzIC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjAzCiAgICAvLyB0b3RhbF92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjA0CiAgICAvLyB0b3RhbF9ib3ljb3R0PWFyYzQuVUludDMyKHNlbGYuYm95Y290dGVkX21lbWJlcnMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vIDB4NjI2Zjc5NjM2Zjc0NzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveWNvdHRlZF9tZW1iZXJzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjA1CiAgICAvLyB0b3RhbF9hcHByb3ZhbHM9YXJjNC5VSW50MzIoc2VsZi5hcHByb3ZhbHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjA2CiAgICAvLyB0b3RhbF9yZWplY3Rpb25zPWFyYzQuVUludDMyKHNlbGYucmVqZWN0aW9ucy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gMHg3MjY1NmE2NTYzNzQ2OTZmNmU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlamVjdGlvbnMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2MDcKICAgIC8vIHRvdGFsX251bGxzPWFyYzQuVUludDMyKHNlbGYubnVsbHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE3IC8vIDB4NmU3NTZjNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm51bGxzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjA4CiAgICAvLyBxdW9ydW1fcmVhY2hlZD1zZWxmLmlzX3F1b3J1bV92b3RlcnNfcmVhY2hlZCgpLAogICAgY2FsbHN1YiBpc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxNjA5CiAgICAvLyB3ZWlnaHRlZF9xdW9ydW1fcmVhY2hlZD1zZWxmLmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkKCksCiAgICBjYWxsc3ViIGlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTYxMAogICAgLy8gbWFqb3JpdHlfYXBwcm92ZWQ9c2VsZi5oYXNfbWFqb3JpdHlfYXBwcm92ZWQoKSwKICAgIGNhbGxzdWIgaGFzX21ham9yaXR5X2FwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTYxMQogICAgLy8gcGxlYmlzY2l0ZT1zZWxmLmlzX3BsZWJpc2NpdGUoKSwKICAgIGNhbGxzdWIgaXNfcGxlYmlzY2l0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE2MDAtMTYxMgogICAgLy8gcmV0dXJuIHR5cC5Wb3RpbmdTdGF0ZSgKICAgIC8vICAgICBxdW9ydW1fdm90ZXJzPWFyYzQuVUludDMyKHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSksCiAgICAvLyAgICAgd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzPWFyYzQuVUludDMyKHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZC52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPWFyYzQuVUludDMyKHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfYm95Y290dD1hcmM0LlVJbnQzMihzZWxmLmJveWNvdHRlZF9tZW1iZXJzLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9hcHByb3ZhbHM9YXJjNC5VSW50MzIoc2VsZi5hcHByb3ZhbHMudmFsdWUpLAogICAgLy8gICAgIHRvdGFsX3JlamVjdGlvbnM9YXJjNC5VSW50MzIoc2VsZi5yZWplY3Rpb25zLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9udWxscz1hcmM0LlVJbnQzMihzZWxmLm51bGxzLnZhbHVlKSwKICAgIC8vICAgICBxdW9ydW1fcmVhY2hlZD1zZWxmLmlzX3F1b3J1bV92b3RlcnNfcmVhY2hlZCgpLAogICAgLy8gICAgIHdlaWdodGVkX3F1b3J1bV9yZWFjaGVkPXNlbGYuaXNfd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzX3JlYWNoZWQoKSwKICAgIC8vICAgICBtYWpvcml0eV9hcHByb3ZlZD1zZWxmLmhhc19tYWpvcml0eV9hcHByb3ZlZCgpLAogICAgLy8gICAgIHBsZWJpc2NpdGU9c2VsZi5pc19wbGViaXNjaXRlKCksCiAgICAvLyApCiAgICB1bmNvdmVyIDEwCiAgICB1bmNvdmVyIDEwCiAgICBjb25jYXQKICAgIHVuY292ZXIgOQogICAgY29uY2F0CiAgICB1bmNvdmVyIDgKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBjb25jYXQKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgYnl0ZWMgMTMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgNgogICAgc2V0Yml0CiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciA1CiAgICBzZXRiaXQKICAgIHB1c2hpbnQgMgogICAgdW5jb3ZlciA0CiAgICBzZXRiaXQKICAgIHB1c2hpbnQgMwogICAgdW5jb3ZlciAzCiAgICBzZXRiaXQKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjE1ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhnbG9iYWxfc3RhdGVfa2V5OiBieXRlcykgLT4gdWludDY0OgpnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMjEKICAgIC8vIGRlZiBnZXRfdWludF9mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhzZWxmLCBnbG9iYWxfc3RhdGVfa2V5OiBCeXRlcykgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjIzCiAgICAvLyBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwgZ2xvYmFsX3N0YXRlX2tleQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3MjY1Njc2OTczNzQ3Mjc5NWY2MTcwNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZWdpc3RyeV9hcHBfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjIyLTIyNAogICAgLy8gdmFsdWUsIGV4aXN0cyA9IEFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlLCBnbG9iYWxfc3RhdGVfa2V5CiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjI1CiAgICAvLyBhc3NlcnQgZXhpc3RzLCBlcnIuTUlTU0lOR19DT05GSUcKICAgIGFzc2VydCAvLyBNaXNzaW5nIENvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gcmV0dXJuIHZhbHVlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnKGdsb2JhbF9zdGF0ZV9rZXk6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2J5dGVzX2Zyb21fcmVnaXN0cnlfY29uZmlnOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIyOAogICAgLy8gZGVmIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZyhzZWxmLCBnbG9iYWxfc3RhdGVfa2V5OiBCeXRlcykgLT4gQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMzAKICAgIC8vIHNlbGYucmVnaXN0cnlfYXBwX2lkLnZhbHVlLCBnbG9iYWxfc3RhdGVfa2V5CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMjktMjMxCiAgICAvLyB2YWx1ZSwgZXhpc3RzID0gQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICBzZWxmLnJlZ2lzdHJ5X2FwcF9pZC52YWx1ZSwgZ2xvYmFsX3N0YXRlX2tleQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjIzMgogICAgLy8gYXNzZXJ0IGV4aXN0cywgZXJyLk1JU1NJTkdfQ09ORklHCiAgICBhc3NlcnQgLy8gTWlzc2luZyBDb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMzMKICAgIC8vIHJldHVybiB2YWx1ZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmlzX3ZvdGluZ19vcGVuKCkgLT4gdWludDY0Ogppc192b3Rpbmdfb3BlbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyMzYKICAgIC8vIGVsYXBzZWRfdm90aW5nX2R1cmF0aW9uID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgLSBzZWxmLnZvdGVfb3Blbl90cy52YWx1ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI5IC8vIDB4NzY2Zjc0NjU1ZjZmNzA2NTZlNjk2ZTY3NWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlX29wZW5fdHMgZXhpc3RzCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjM3CiAgICAvLyByZXR1cm4gZWxhcHNlZF92b3RpbmdfZHVyYXRpb24gPD0gc2VsZi52b3RpbmdfZHVyYXRpb24udmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMSAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19kdXJhdGlvbiBleGlzdHMKICAgIDw9CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb24oKSAtPiBieXRlczoKdW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjU1CiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RyeV9jYWxsKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfcmVnaXN0cnlfY2FsbAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19BUFBST1ZFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDMwCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI1OC0yNTkKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfQVBQUk9WRUQKICAgIC8vIG9yIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfUkVKRUNURUQKICAgIGJueiB1bmFzc2lnbl9hYnNlbnRlZXNfY2hlY2tfYXV0aG9yaXphdGlvbl9hbmRfY29udGRAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI1OQogICAgLy8gb3Igc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19SRUpFQ1RFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3Mzc0NjE3NDc1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQwCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI1OC0yNTkKICAgIC8vIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfQVBQUk9WRUQKICAgIC8vIG9yIHNlbGYuc3RhdHVzLnZhbHVlID09IGVubS5TVEFUVVNfUkVKRUNURUQKICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlc19jaGVja19hdXRob3JpemF0aW9uX2lmX2JvZHlAMwoKdW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb25fYW5kX2NvbnRkQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjYxCiAgICAvLyBhbmQgbm90IHNlbGYuZmluYWxpemVkLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZpbmFsaXplZCBleGlzdHMKICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlc19jaGVja19hdXRob3JpemF0aW9uX2FmdGVyX2lmX2Vsc2VANAoKdW5hc3NpZ25fYWJzZW50ZWVzX2NoZWNrX2F1dGhvcml6YXRpb25faWZfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI2MwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBieXRlYyAyNCAvLyAiRVJSOldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICByZXRzdWIKCnVuYXNzaWduX2Fic2VudGVlc19jaGVja19hdXRob3JpemF0aW9uX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyNjUKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18wIC8vICIiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV9jaGVja19hdXRob3JpemF0aW9uKCkgLT4gYnl0ZXM6CnZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyODYKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdHJ5X2NhbGwoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc19yZWdpc3RyeV9jYWxsCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjg4CiAgICAvLyBpZiBzZWxmLnN0YXR1cy52YWx1ZSAhPSBlbm0uU1RBVFVTX1ZPVElORzoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAyNQogICAgIT0KICAgIGJ6IHZvdGVfY2hlY2tfYXV0aG9yaXphdGlvbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyODkKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgYnl0ZWMgMjQgLy8gIkVSUjpXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgcmV0c3ViCgp2b3RlX2NoZWNrX2F1dGhvcml6YXRpb25fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gaWYgbm90IHNlbGYuaXNfdm90aW5nX29wZW4oKToKICAgIGNhbGxzdWIgaXNfdm90aW5nX29wZW4KICAgIGJueiB2b3RlX2NoZWNrX2F1dGhvcml6YXRpb25fYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MjkyCiAgICAvLyByZXR1cm4gdHlwLkVycm9yKGVyci5BUkNfNjVfUFJFRklYICsgZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRCkKICAgIHB1c2hieXRlcyAiRVJSOlZvdGluZyBQZXJpb2QgRXhwaXJlZCIKICAgIHJldHN1YgoKdm90ZV9jaGVja19hdXRob3JpemF0aW9uX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToyOTQKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18wIC8vICIiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuaXNfYm95Y290dCh2b3RlczogdWludDY0LCBhcHByb3ZhbHM6IHVpbnQ2NCwgcmVqZWN0aW9uczogdWludDY0KSAtPiB1aW50NjQ6CmlzX2JveWNvdHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjk2CiAgICAvLyBkZWYgaXNfYm95Y290dChzZWxmLCB2b3RlczogVUludDY0LCBhcHByb3ZhbHM6IFVJbnQ2NCwgcmVqZWN0aW9uczogVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjk3CiAgICAvLyByZXR1cm4gYXBwcm92YWxzID09IHZvdGVzIGFuZCByZWplY3Rpb25zID09IHZvdGVzCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIGJ6IGlzX2JveWNvdHRfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIGJ6IGlzX2JveWNvdHRfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgppc19ib3ljb3R0X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mjk3CiAgICAvLyByZXR1cm4gYXBwcm92YWxzID09IHZvdGVzIGFuZCByZWplY3Rpb25zID09IHZvdGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZXNfdmFsaWRhdGlvbih2b3RlczogdWludDY0LCBhcHByb3ZhbHM6IHVpbnQ2NCwgcmVqZWN0aW9uczogdWludDY0KSAtPiBieXRlczoKdm90ZXNfdmFsaWRhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMDctMzA5CiAgICAvLyBkZWYgdm90ZXNfdmFsaWRhdGlvbigKICAgIC8vICAgICBzZWxmLCB2b3RlczogVUludDY0LCBhcHByb3ZhbHM6IFVJbnQ2NCwgcmVqZWN0aW9uczogVUludDY0CiAgICAvLyApIC0+IHR5cC5FcnJvcjoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gaWYgKGFwcHJvdmFscyArIHJlamVjdGlvbnMgPiB2b3RlcykgYW5kIG5vdCBzZWxmLmlzX2JveWNvdHQoCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgZnJhbWVfZGlnIC0zCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzEwLTMxMgogICAgLy8gaWYgKGFwcHJvdmFscyArIHJlamVjdGlvbnMgPiB2b3RlcykgYW5kIG5vdCBzZWxmLmlzX2JveWNvdHQoCiAgICAvLyAgICAgdm90ZXMsIGFwcHJvdmFscywgcmVqZWN0aW9ucwogICAgLy8gKToKICAgIGJ6IHZvdGVzX3ZhbGlkYXRpb25fYWZ0ZXJfaWZfZWxzZUAzCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGlzX2JveWNvdHQKICAgIGJueiB2b3Rlc192YWxpZGF0aW9uX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMxMwogICAgLy8gcmV0dXJuIHR5cC5FcnJvcihlcnIuQVJDXzY1X1BSRUZJWCArIGVyci5WT1RFU19JTlZBTElEKQogICAgcHVzaGJ5dGVzICJFUlI6Vm90ZXMgaW52YWxpZCIKICAgIHJldHN1YgoKdm90ZXNfdmFsaWRhdGlvbl9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzE1CiAgICAvLyByZXR1cm4gdHlwLkVycm9yKCIiKQogICAgYnl0ZWNfMCAvLyAiIgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmhhc19jb21taXR0ZWVfcm9vdCgpIC0+IHVpbnQ2NDoKaGFzX2NvbW1pdHRlZV9yb290OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMxOAogICAgLy8gcmV0dXJuIHNlbGYuY29tbWl0dGVlX3Jvb3QudmFsdWUubGVuZ3RoID4gMAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MjZmNmY3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9yb290IGV4aXN0cwogICAgbGVuCiAgICBpbnRjXzAgLy8gMAogICAgPgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmlzX2NvbW1pdHRlZV9tZW1iZXIodm90ZXI6IGJ5dGVzLCB2b3RpbmdfcG93ZXI6IHVpbnQ2NCwgb3JkaW5hbDogdWludDY0LCBwcm9vZjogYnl0ZXMpIC0+IHVpbnQ2NCwgYnl0ZXM6CmlzX2NvbW1pdHRlZV9tZW1iZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzIwLTMyNgogICAgLy8gZGVmIGlzX2NvbW1pdHRlZV9tZW1iZXIoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB2b3RlcjogQWNjb3VudCwKICAgIC8vICAgICB2b3RpbmdfcG93ZXI6IFVJbnQ2NCwKICAgIC8vICAgICBvcmRpbmFsOiBVSW50NjQsCiAgICAvLyAgICAgcHJvb2Y6IEFycmF5W3R5cC5CeXRlczMyXSwKICAgIC8vICkgLT4gYm9vbDoKICAgIHByb3RvIDQgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gQnl0ZXMoY29uc3QuQ09NTUlUVEVFX0xFQUZfUFJFRklYKSArIHZvdGVyLmJ5dGVzICsgb3AuaXRvYih2b3RpbmdfcG93ZXIpCiAgICBieXRlYyAxMyAvLyAweDAwCiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMjctMzI5CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KAogICAgLy8gICAgIEJ5dGVzKGNvbnN0LkNPTU1JVFRFRV9MRUFGX1BSRUZJWCkgKyB2b3Rlci5ieXRlcyArIG9wLml0b2Iodm90aW5nX3Bvd2VyKQogICAgLy8gKQogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzMyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKCmlzX2NvbW1pdHRlZV9tZW1iZXJfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMzMgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHByb29mLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGlzX2NvbW1pdHRlZV9tZW1iZXJfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMzMKICAgIC8vIGlmIGluZGV4ICUgMjoKICAgIGZyYW1lX2RpZyAyCiAgICBwdXNoaW50IDIKICAgICUKICAgIGJ6IGlzX2NvbW1pdHRlZV9tZW1iZXJfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMzUKICAgIC8vIEJ5dGVzKGNvbnN0LkNPTU1JVFRFRV9OT0RFX1BSRUZJWCkgKyBwcm9vZltpXS5ieXRlcyArIG5vZGUKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzM0LTMzNgogICAgLy8gbm9kZSA9IG9wLnNoYTI1NigKICAgIC8vICAgICBCeXRlcyhjb25zdC5DT01NSVRURUVfTk9ERV9QUkVGSVgpICsgcHJvb2ZbaV0uYnl0ZXMgKyBub2RlCiAgICAvLyApCiAgICBzaGEyNTYKICAgIGZyYW1lX2J1cnkgMAoKaXNfY29tbWl0dGVlX21lbWJlcl9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQxCiAgICAvLyBpbmRleCAvLz0gMgogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgMgogICAgLwogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzMyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGlzX2NvbW1pdHRlZV9tZW1iZXJfZm9yX2hlYWRlckAxCgppc19jb21taXR0ZWVfbWVtYmVyX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjMzOQogICAgLy8gQnl0ZXMoY29uc3QuQ09NTUlUVEVFX05PREVfUFJFRklYKSArIG5vZGUgKyBwcm9vZltpXS5ieXRlcwogICAgcHVzaGJ5dGVzIDB4MDEKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzIgLy8gMzIKICAgICoKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMzgtMzQwCiAgICAvLyBub2RlID0gb3Auc2hhMjU2KAogICAgLy8gICAgIEJ5dGVzKGNvbnN0LkNPTU1JVFRFRV9OT0RFX1BSRUZJWCkgKyBub2RlICsgcHJvb2ZbaV0uYnl0ZXMKICAgIC8vICkKICAgIHNoYTI1NgogICAgZnJhbWVfYnVyeSAwCiAgICBiIGlzX2NvbW1pdHRlZV9tZW1iZXJfYWZ0ZXJfaWZfZWxzZUA1Cgppc19jb21taXR0ZWVfbWVtYmVyX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM0NS0zNDcKICAgIC8vIGluZGV4ID09IDAKICAgIC8vIGFuZCBvcmRpbmFsIDwgc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZQogICAgLy8gYW5kIG5vZGUgPT0gc2VsZi5jb21taXR0ZWVfcm9vdC52YWx1ZQogICAgZnJhbWVfZGlnIDIKICAgIGJueiBpc19jb21taXR0ZWVfbWVtYmVyX2Jvb2xfZmFsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNDYKICAgIC8vIGFuZCBvcmRpbmFsIDwgc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNDUtMzQ3CiAgICAvLyBpbmRleCA9PSAwCiAgICAvLyBhbmQgb3JkaW5hbCA8IHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUKICAgIC8vIGFuZCBub2RlID09IHNlbGYuY29tbWl0dGVlX3Jvb3QudmFsdWUKICAgIGJ6IGlzX2NvbW1pdHRlZV9tZW1iZXJfYm9vbF9mYWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM0NwogICAgLy8gYW5kIG5vZGUgPT0gc2VsZi5jb21taXR0ZWVfcm9vdC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MjZmNmY3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9yb290IGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQ1LTM0NwogICAgLy8gaW5kZXggPT0gMAogICAgLy8gYW5kIG9yZGluYWwgPCBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlCiAgICAvLyBhbmQgbm9kZSA9PSBzZWxmLmNvbW1pdHRlZV9yb290LnZhbHVlCiAgICBieiBpc19jb21taXR0ZWVfbWVtYmVyX2Jvb2xfZmFsc2VAMTEKICAgIGludGNfMSAvLyAxCgppc19jb21taXR0ZWVfbWVtYmVyX2Jvb2xfbWVyZ2VAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzQzLTM0OAogICAgLy8gIyBBIGZ1bGx5IGNvbnN1bWVkIG9yZGluYWwgYmluZHMgZWFjaCBtZW1iZXIgdG8gYSBzaW5nbGUgYml0bWFwIHBvc2l0aW9uCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIGluZGV4ID09IDAKICAgIC8vICAgICBhbmQgb3JkaW5hbCA8IHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUKICAgIC8vICAgICBhbmQgbm9kZSA9PSBzZWxmLmNvbW1pdHRlZV9yb290LnZhbHVlCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmlzX2NvbW1pdHRlZV9tZW1iZXJfYm9vbF9mYWxzZUAxMToKICAgIGludGNfMCAvLyAwCiAgICBiIGlzX2NvbW1pdHRlZV9tZW1iZXJfYm9vbF9tZXJnZUAxMgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5oYXNfdm90ZWQob3JkaW5hbDogdWludDY0KSAtPiB1aW50NjQ6Cmhhc192b3RlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNTAKICAgIC8vIGRlZiBoYXNfdm90ZWQoc2VsZiwgb3JkaW5hbDogVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzUxCiAgICAvLyBwYWdlID0gb3JkaW5hbCAvLyBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9NRU1CRVJTCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGMgNCAvLyA4MTkyCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzUyCiAgICAvLyBpZiBwYWdlIG5vdCBpbiBzZWxmLnZvdGVkX2JpdG1hcDoKICAgIGl0b2IKICAgIGJ5dGVjIDM1IC8vICJCIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGhhc192b3RlZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNTMKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHJldHN1YgoKaGFzX3ZvdGVkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNTQKICAgIC8vIGJpdCA9IG9yZGluYWwgJSBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9NRU1CRVJTCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGMgNCAvLyA4MTkyCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzU1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KHNlbGYudm90ZWRfYml0bWFwLmJveChwYWdlKS5leHRyYWN0KGJpdCAvLyA4LCAxKSwgYml0ICUgOCkKICAgIGR1cAogICAgaW50Y18zIC8vIDgKICAgIC8KICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIHN3YXAKICAgIGludGNfMyAvLyA4CiAgICAlCiAgICBnZXRiaXQKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9tZW1iZXIob3JkaW5hbDogdWludDY0LCB2b3RpbmdfcG93ZXI6IHVpbnQ2NCkgLT4gdm9pZDoKdW5hc3NpZ25fbWVtYmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM3NAogICAgLy8gZGVmIHVuYXNzaWduX21lbWJlcihzZWxmLCBvcmRpbmFsOiBVSW50NjQsIHZvdGluZ19wb3dlcjogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBieXRlY18wIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzU4CiAgICAvLyBwYWdlID0gb3JkaW5hbCAvLyBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9NRU1CRVJTCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNCAvLyA4MTkyCiAgICAvCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNTkKICAgIC8vIGJpdG1hcCA9IHNlbGYudm90ZWRfYml0bWFwLmJveChwYWdlKQogICAgaXRvYgogICAgYnl0ZWMgMzUgLy8gIkIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2MAogICAgLy8gaWYgbm90IGJpdG1hcDoKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IHVuYXNzaWduX21lbWJlcl9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNjEtMzYyCiAgICAvLyAjIFRoZSBsYXN0IHBhZ2Ugb25seSBjb3ZlcnMgdGhlIHJlbWFpbmluZyBtZW1iZXJzCiAgICAvLyBwYWdlX3NpemUgPSAoc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSArIDcpIC8vIDggLSAoCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWVtYmVycyBleGlzdHMKICAgIHB1c2hpbnQgNwogICAgKwogICAgaW50Y18zIC8vIDgKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNjMKICAgIC8vIHBhZ2UgKiBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9TSVpFCiAgICBmcmFtZV9kaWcgMQogICAgaW50YyA2IC8vIDEwMjQKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNjEtMzY0CiAgICAvLyAjIFRoZSBsYXN0IHBhZ2Ugb25seSBjb3ZlcnMgdGhlIHJlbWFpbmluZyBtZW1iZXJzCiAgICAvLyBwYWdlX3NpemUgPSAoc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSArIDcpIC8vIDggLSAoCiAgICAvLyAgICAgcGFnZSAqIGNvbnN0LlZPVEVEX0JJVE1BUF9QQUdFX1NJWkUKICAgIC8vICkKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzY1CiAgICAvLyBpZiBwYWdlX3NpemUgPiBjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9TSVpFOgogICAgaW50YyA2IC8vIDEwMjQKICAgID4KICAgIGJ6IHVuYXNzaWduX21lbWJlcl9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNjYKICAgIC8vIHBhZ2Vfc2l6ZSA9IFVJbnQ2NChjb25zdC5WT1RFRF9CSVRNQVBfUEFHRV9TSVpFKQogICAgaW50YyA2IC8vIDEwMjQKICAgIGZyYW1lX2J1cnkgMAoKdW5hc3NpZ25fbWVtYmVyX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNjcKICAgIC8vIF9jcmVhdGVkID0gYml0bWFwLmNyZWF0ZShzaXplPXBhZ2Vfc2l6ZSkKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2NyZWF0ZQogICAgcG9wCgp1bmFzc2lnbl9tZW1iZXJfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2OAogICAgLy8gYml0ID0gb3JkaW5hbCAlIGNvbnN0LlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyA0IC8vIDgxOTIKICAgICUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozNzAKICAgIC8vIGJpdCAvLyA4LAogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM3MQogICAgLy8gb3Auc2V0Yml0X2J5dGVzKGJpdG1hcC5leHRyYWN0KGJpdCAvLyA4LCAxKSwgYml0ICUgOCwgVHJ1ZSksICAjIG5vcWE6IEZCVDAwMwogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMwogICAgZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgdW5jb3ZlciAyCiAgICBpbnRjXzMgLy8gOAogICAgJQogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM2OS0zNzIKICAgIC8vIGJpdG1hcC5yZXBsYWNlKAogICAgLy8gICAgIGJpdCAvLyA4LAogICAgLy8gICAgIG9wLnNldGJpdF9ieXRlcyhiaXRtYXAuZXh0cmFjdChiaXQgLy8gOCwgMSksIGJpdCAlIDgsIFRydWUpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICkKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzc2CiAgICAvLyBzZWxmLmFzc2lnbmVkX21lbWJlcnMudmFsdWUgLT0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2lnbmVkX21lbWJlcnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgYnl0ZWNfMiAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM3NwogICAgLy8gc2VsZi5hc3NpZ25lZF92b3Rlcy52YWx1ZSAtPSB2b3RpbmdfcG93ZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2lnbmVkX3ZvdGVzIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBieXRlYyA1IC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNzY2Zjc0NjU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5pc19wbGViaXNjaXRlKCkgLT4gdWludDY0Ogppc19wbGViaXNjaXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM4MAogICAgLy8gcmV0dXJuIHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSA9PSBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAweDc2NmY3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZWRfbWVtYmVycyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzIGV4aXN0cwogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5hc3NpZ25fdm90ZXJzX2NoZWNrX2F1dGhvcml6YXRpb24oKSAtPiB2b2lkOgphc3NpZ25fdm90ZXJzX2NoZWNrX2F1dGhvcml6YXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzkwCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X2RhZW1vbigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfZGFlbW9uCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzkxCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19TVUJNSVRURUQsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAyMAogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZXJzX2dyb3VwX3ZhbGlkYXRpb24oKSAtPiB2b2lkOgp2b3RlcnNfZ3JvdXBfdmFsaWRhdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozOTMKICAgIC8vIGRlZiB2b3RlcnNfZ3JvdXBfdmFsaWRhdGlvbihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICBieXRlY18wIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozOTQKICAgIC8vIGlmIFR4bi5ncm91cF9pbmRleCA9PSAwOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGJueiB2b3RlcnNfZ3JvdXBfdmFsaWRhdGlvbl9lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM5NS0zOTYKICAgIC8vICMgQ2hlY2sgdGhhdCB0aGUgZW50aXJlIGdyb3VwIGNhbGxzIHRoZSBzYW1lIGFwcCBhbmQgbWV0aG9kCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMSwgR2xvYmFsLmdyb3VwX3NpemUpOgogICAgZ2xvYmFsIEdyb3VwU2l6ZQogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAwCgp2b3RlcnNfZ3JvdXBfdmFsaWRhdGlvbl9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzk1LTM5NgogICAgLy8gIyBDaGVjayB0aGF0IHRoZSBlbnRpcmUgZ3JvdXAgY2FsbHMgdGhlIHNhbWUgYXBwIGFuZCBtZXRob2QKICAgIC8vIGZvciBpIGluIHVyYW5nZSgxLCBHbG9iYWwuZ3JvdXBfc2l6ZSk6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IHZvdGVyc19ncm91cF92YWxpZGF0aW9uX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM5NwogICAgLy8gc2VsZi5hc3NlcnRfc2FtZV9hcHBfYW5kX21ldGhvZChpKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfc2FtZV9hcHBfYW5kX21ldGhvZAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjM5NS0zOTYKICAgIC8vICMgQ2hlY2sgdGhhdCB0aGUgZW50aXJlIGdyb3VwIGNhbGxzIHRoZSBzYW1lIGFwcCBhbmQgbWV0aG9kCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoMSwgR2xvYmFsLmdyb3VwX3NpemUpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgYiB2b3RlcnNfZ3JvdXBfdmFsaWRhdGlvbl9mb3JfaGVhZGVyQDIKCnZvdGVyc19ncm91cF92YWxpZGF0aW9uX2FmdGVyX2lmX2Vsc2VANzoKICAgIHJldHN1YgoKdm90ZXJzX2dyb3VwX3ZhbGlkYXRpb25fZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Mzk5LTQwMAogICAgLy8gIyBDaGVjayB0aGF0IHRoZSBmaXJzdCB0cmFuc2FjdGlvbiBpbiB0aGUgZ3JvdXAgY2FsbHMgdGhlIHNhbWUgYXBwIGFuZCBtZXRob2QKICAgIC8vIHNlbGYuYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2QoVUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgYXNzZXJ0X3NhbWVfYXBwX2FuZF9tZXRob2QKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5nZXRfdm90ZXJfYnVja2V0KHZvdGVyOiBieXRlcykgLT4gdWludDY0OgpnZXRfdm90ZXJfYnVja2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gZGVmIGdldF92b3Rlcl9idWNrZXQoc2VsZiwgdm90ZXI6IEFjY291bnQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQxMQogICAgLy8gb3AuZXh0cmFjdF91aW50MTYodm90ZXIuYnl0ZXMsIDApCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQxMgogICAgLy8gKiBzZWxmLnZvdGVyX2J1Y2tldHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOCAvLyAweDc2NmY3NDY1NzI1ZjYyNzU2MzZiNjU3NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXJfYnVja2V0cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MTEtNDEyCiAgICAvLyBvcC5leHRyYWN0X3VpbnQxNih2b3Rlci5ieXRlcywgMCkKICAgIC8vICogc2VsZi52b3Rlcl9idWNrZXRzLnZhbHVlCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDEzCiAgICAvLyAvLyBjb25zdC5WT1RFUl9CVUNLRVRfUFJFRklYX1JBTkdFCiAgICBwdXNoaW50IDY1NTM2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDExLTQxMwogICAgLy8gb3AuZXh0cmFjdF91aW50MTYodm90ZXIuYnl0ZXMsIDApCiAgICAvLyAqIHNlbGYudm90ZXJfYnVja2V0cy52YWx1ZQogICAgLy8gLy8gY29uc3QuVk9URVJfQlVDS0VUX1BSRUZJWF9SQU5HRQogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQwOS00MTQKICAgIC8vICMgQnVja2V0cyBzcGxpdCB0aGUgYWRkcmVzcyBwcmVmaXggcmFuZ2UsIHNvIHZvdGVycyBhcmUgc29ydGVkIGFjcm9zcyBidWNrZXRzCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIG9wLmV4dHJhY3RfdWludDE2KHZvdGVyLmJ5dGVzLCAwKQogICAgLy8gICAgICogc2VsZi52b3Rlcl9idWNrZXRzLnZhbHVlCiAgICAvLyAgICAgLy8gY29uc3QuVk9URVJfQlVDS0VUX1BSRUZJWF9SQU5HRQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmdldF92b3Rlcih2b3RlcjogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfdm90ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDE2CiAgICAvLyBkZWYgZ2V0X3ZvdGVyKHNlbGYsIHZvdGVyOiBBY2NvdW50KSAtPiB0dXBsZVtVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAxIDIKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzAgLy8gIiIKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQxOAogICAgLy8gaWYgbm90IHNlbGYudm90ZXJfYnVja2V0cy52YWx1ZToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOCAvLyAweDc2NmY3NDY1NzI1ZjYyNzU2MzZiNjU3NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90ZXJfYnVja2V0cyBleGlzdHMKICAgIGJueiBnZXRfdm90ZXJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDE5CiAgICAvLyByZXR1cm4gc2VsZi52b3RlcnMuZ2V0KHZvdGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSksIFVJbnQ2NCgwKQogICAgYnl0ZWMgNDMgLy8gIlYiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3ZvdGVyX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MjEKICAgIC8vIGJ1Y2tldCA9IHNlbGYudm90ZXJfYnVja2V0LmJveChzZWxmLmdldF92b3Rlcl9idWNrZXQodm90ZXIpKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGdldF92b3Rlcl9idWNrZXQKICAgIGl0b2IKICAgIGJ5dGVjIDQ0IC8vICJLIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQyMgogICAgLy8gaWYgbm90IGJ1Y2tldDoKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGdldF92b3Rlcl9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MjMKICAgIC8vIHJldHVybiBVSW50NjQoMCksIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3ZvdGVyX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MjUtNDI2CiAgICAvLyAjIEJpbmFyeSBzZWFyY2ggb2YgdGhlIGJ1Y2tldCByZWNvcmRzLCBzb3J0ZWQgYnkgYWRkcmVzcwogICAgLy8gbG93ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDI3CiAgICAvLyBoaWdoID0gYnVja2V0Lmxlbmd0aCAvLyBjb25zdC5WT1RFUl9CVUNLRVRfUkVDT1JEX1NJWkUKICAgIGZyYW1lX2RpZyAxCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgcHVzaGludCA0MAogICAgLwogICAgZnJhbWVfYnVyeSAyCgpnZXRfdm90ZXJfd2hpbGVfdG9wQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDI4CiAgICAvLyB3aGlsZSBsb3cgPCBoaWdoOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBnZXRfdm90ZXJfYWZ0ZXJfd2hpbGVAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MjkKICAgIC8vIG1pZGRsZSA9IChsb3cgKyBoaWdoKSAvLyAyCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIHB1c2hpbnQgMgogICAgLwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MzAKICAgIC8vIHJlY29yZCA9IG1pZGRsZSAqIGNvbnN0LlZPVEVSX0JVQ0tFVF9SRUNPUkRfU0laRQogICAgcHVzaGludCA0MAogICAgKgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MzEKICAgIC8vIGFkZHJlc3MgPSBidWNrZXQuZXh0cmFjdChyZWNvcmQsIDMyKQogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGludGNfMiAvLyAzMgogICAgYm94X2V4dHJhY3QKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDMyCiAgICAvLyBpZiBhZGRyZXNzID09IHZvdGVyLmJ5dGVzOgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogZ2V0X3ZvdGVyX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQzMwogICAgLy8gcmV0dXJuIG9wLmJ0b2koYnVja2V0LmV4dHJhY3QocmVjb3JkICsgMzIsIDgpKSwgcmVjb3JkCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBpbnRjXzIgLy8gMzIKICAgICsKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfYnVyeSAxCiAgICByZXRzdWIKCmdldF92b3Rlcl9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDM0CiAgICAvLyBpZiBCaWdVSW50LmZyb21fYnl0ZXMoYWRkcmVzcykgPCBCaWdVSW50LmZyb21fYnl0ZXModm90ZXIuYnl0ZXMpOgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMQogICAgYjwKICAgIGJ6IGdldF92b3Rlcl9lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo0MzUKICAgIC8vIGxvdyA9IG1pZGRsZSArIDEKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGdldF92b3Rlcl93aGlsZV90b3BANQoKZ2V0X3ZvdGVyX2Vsc2VfYm9keUAxMDoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZ2V0X3ZvdGVyX3doaWxlX3RvcEA1CgpnZXRfdm90ZXJfYWZ0ZXJfd2hpbGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDM4CiAgICAvLyByZXR1cm4gVUludDY0KDApLCBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuYXNzZXJ0X2RyYWZ0X2FuZF9wcm9wb3NlcigpIC0+IHZvaWQ6CmFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDc1CiAgICAvLyBhc3NlcnQgc2VsZi5pc19wcm9wb3NlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3Byb3Bvc2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDc3CiAgICAvLyBzZWxmLnN0YXR1cy52YWx1ZSA9PSBlbm0uU1RBVFVTX0RSQUZUIGFuZCBub3Qgc2VsZi5maW5hbGl6ZWQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgcHVzaGludCAxMAogICAgPT0KICAgIGJ6IGFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXJfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDY2Njk2ZTYxNmM2OTdhNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZpbmFsaXplZCBleGlzdHMKICAgIGJueiBhc3NlcnRfZHJhZnRfYW5kX3Byb3Bvc2VyX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKCmFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXJfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjQ3Ni00NzgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5zdGF0dXMudmFsdWUgPT0gZW5tLlNUQVRVU19EUkFGVCBhbmQgbm90IHNlbGYuZmluYWxpemVkLnZhbHVlCiAgICAvLyApLCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTCiAgICBhc3NlcnQgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAogICAgcmV0c3ViCgphc3NlcnRfZHJhZnRfYW5kX3Byb3Bvc2VyX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGFzc2VydF9kcmFmdF9hbmRfcHJvcG9zZXJfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmlzX3Byb3Bvc2VyKCkgLT4gdWludDY0Ogppc19wcm9wb3NlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1ODIKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYucHJvcG9zZXIudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyIGV4aXN0cwogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5pc194Z292X2RhZW1vbigpIC0+IHVpbnQ2NDoKaXNfeGdvdl9kYWVtb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTkwCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBBY2NvdW50KAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU5MQogICAgLy8gc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9EQUVNT04pKQogICAgYnl0ZWMgNDUgLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBjYWxsc3ViIGdldF9ieXRlc19mcm9tX3JlZ2lzdHJ5X2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU5MC01OTIKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IEFjY291bnQoCiAgICAvLyAgICAgc2VsZi5nZXRfYnl0ZXNfZnJvbV9yZWdpc3RyeV9jb25maWcoQnl0ZXMocmVnX2NmZy5HU19LRVlfWEdPVl9EQUVNT04pKQogICAgLy8gKQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5pc19yZWdpc3RyeV9jYWxsKCkgLT4gdWludDY0Ogppc19yZWdpc3RyeV9jYWxsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjU5NQogICAgLy8gcmV0dXJuIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgPT0gc2VsZi5yZWdpc3RyeV9hcHBfaWQudmFsdWUKICAgIGdsb2JhbCBDYWxsZXJBcHBsaWNhdGlvbklECiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAweDcyNjU2NzY5NzM3NDcyNzk1ZjYxNzA3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlZ2lzdHJ5X2FwcF9pZCBleGlzdHMKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwucGF5KHJlY2VpdmVyOiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CnBheToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1OTcKICAgIC8vIGRlZiBwYXkoc2VsZiwgcmVjZWl2ZXI6IEFjY291bnQsIGFtb3VudDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTk4LTYwMgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlY2VpdmVyLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPVVJbnQ2NCgwKSwgICMgZW5mb3JjZXMgdGhlIHNlbmRlciB0byBwYXkgdGhlIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NTk4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjAxCiAgICAvLyBmZWU9VUludDY0KDApLCAgIyBlbmZvcmNlcyB0aGUgc2VuZGVyIHRvIHBheSB0aGUgZmVlCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo1OTgtNjAyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVjZWl2ZXIsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9VUludDY0KDApLCAgIyBlbmZvcmNlcyB0aGUgc2VuZGVyIHRvIHBheSB0aGUgZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnRyYW5zZmVyX2xvY2tlZF9hbW91bnQocmVjZWl2ZXI6IGJ5dGVzKSAtPiB2b2lkOgp0cmFuc2Zlcl9sb2NrZWRfYW1vdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwNAogICAgLy8gZGVmIHRyYW5zZmVyX2xvY2tlZF9hbW91bnQoc2VsZiwgcmVjZWl2ZXI6IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDUKICAgIC8vIHNlbGYucGF5KHJlY2VpdmVyLCBzZWxmLmxvY2tlZF9hbW91bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjEgLy8gMHg2YzZmNjM2YjY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxvY2tlZF9hbW91bnQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGNhbGxzdWIgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjA2CiAgICAvLyBzZWxmLmxvY2tlZF9hbW91bnQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDIxIC8vIDB4NmM2ZjYzNmI2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kKGdyb3VwX2luZGV4OiB1aW50NjQpIC0+IHZvaWQ6CmFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kOgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjYwOAogICAgLy8gZGVmIGFzc2VydF9zYW1lX2FwcF9hbmRfbWV0aG9kKHNlbGYsIGdyb3VwX2luZGV4OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MTAKICAgIC8vIEdUeG4uYXBwbGljYXRpb25faWQoZ3JvdXBfaW5kZXgpID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFwcGxpY2F0aW9uSUQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2MDktNjExCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdUeG4uYXBwbGljYXRpb25faWQoZ3JvdXBfaW5kZXgpID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkCiAgICAvLyApLCBlcnIuV1JPTkdfQVBQX0lECiAgICBhc3NlcnQgLy8gV3JvbmcgQXBwIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjEyCiAgICAvLyBhc3NlcnQgR1R4bi5hcHBsaWNhdGlvbl9hcmdzKGdyb3VwX2luZGV4LCAwKSA9PSBUeG4uYXBwbGljYXRpb25fYXJncygKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnNhIEFwcGxpY2F0aW9uQXJncyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NjEyLTYxNAogICAgLy8gYXNzZXJ0IEdUeG4uYXBwbGljYXRpb25fYXJncyhncm91cF9pbmRleCwgMCkgPT0gVHhuLmFwcGxpY2F0aW9uX2FyZ3MoCiAgICAvLyAgICAgMAogICAgLy8gKSwgZXJyLldST05HX01FVEhPRF9DQUxMCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIE1ldGhvZCBDYWxsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuaXNfcXVvcnVtX3ZvdGVyc19yZWFjaGVkKCkgLT4gdWludDY0Ogppc19xdW9ydW1fdm90ZXJzX3JlYWNoZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Njc1LTY3OAogICAgLy8gIyBBIGNhdGVnb3J5IGRlcGVuZGVudCBxdW9ydW0gb2YgYWxsIHhHb3YgVm90aW5nIENvbW1pdHRlZSAoMSB4R292LCAxIHZvdGUpIGlzIHJlYWNoZWQuCiAgICAvLyAjIE51bGwgdm90ZXMgYWZmZWN0IHRoaXMgcXVvcnVtLgogICAgLy8gIyBCb3ljb3R0IHZvdGVzLCBpLmUuIGludmFsaWQsIGRvIG5vdCBhZmZlY3QgdGhpcyBxdW9ydW0uCiAgICAvLyBxdW9ydW1fZGVmaW5lZCA9IHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSA+IDAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAweDcxNzU2ZjcyNzU2ZDVmNzQ2ODcyNjU3MzY4NmY2YzY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtX3RocmVzaG9sZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2ODAKICAgIC8vIHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSAtIHNlbGYuYm95Y290dGVkX21lbWJlcnMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vIDB4NjI2Zjc5NjM2Zjc0NzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJveWNvdHRlZF9tZW1iZXJzIGV4aXN0cwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY4MC02ODEKICAgIC8vICAgICBzZWxmLnZvdGVkX21lbWJlcnMudmFsdWUgLSBzZWxmLmJveWNvdHRlZF9tZW1iZXJzLnZhbHVlCiAgICAvLyApID49IHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSBhbmQgcXVvcnVtX2RlZmluZWQKICAgIGRpZyAxCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY3OS02ODEKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlIC0gc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZQogICAgLy8gKSA+PSBzZWxmLnF1b3J1bV90aHJlc2hvbGQudmFsdWUgYW5kIHF1b3J1bV9kZWZpbmVkCiAgICAmJgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmlzX3dlaWdodGVkX3F1b3J1bV92b3Rlc19yZWFjaGVkKCkgLT4gdWludDY0Ogppc193ZWlnaHRlZF9xdW9ydW1fdm90ZXNfcmVhY2hlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2ODQtNjg2CiAgICAvLyAjIEEgY2F0ZWdvcnkgZGVwZW5kZW50IHdlaWdodGVkIHF1b3J1bSBvZiBhbGwgeEdvdiBWb3RpbmcgQ29tbWl0dGVlIHZvdGluZyBwb3dlciAoMSB2b3RlKSBpcyByZWFjaGVkLgogICAgLy8gIyBOdWxsIHZvdGVzIGFmZmVjdCB0aGlzIHF1b3J1bS4KICAgIC8vIHdlaWdodGVkX3F1b3J1bV9kZWZpbmVkID0gc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkLnZhbHVlID4gMAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIzIC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjY4NwogICAgLy8gdG90YWxfdm90ZXMgPSBzZWxmLmFwcHJvdmFscy52YWx1ZSArIHNlbGYucmVqZWN0aW9ucy52YWx1ZSArIHNlbGYubnVsbHMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFscyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDcyNjU2YTY1NjM3NDY5NmY2ZTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVqZWN0aW9ucyBleGlzdHMKICAgICsKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNyAvLyAweDZlNzU2YzZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5udWxscyBleGlzdHMKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2ODkKICAgIC8vIHRvdGFsX3ZvdGVzID49IHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZC52YWx1ZQogICAgZGlnIDEKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Njg5LTY5MAogICAgLy8gdG90YWxfdm90ZXMgPj0gc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkLnZhbHVlCiAgICAvLyBhbmQgd2VpZ2h0ZWRfcXVvcnVtX2RlZmluZWQKICAgICYmCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6Njg4LTY5MQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICB0b3RhbF92b3RlcyA+PSBzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUKICAgIC8vICAgICBhbmQgd2VpZ2h0ZWRfcXVvcnVtX2RlZmluZWQKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5oYXNfbWFqb3JpdHlfYXBwcm92ZWQoKSAtPiB1aW50NjQ6Cmhhc19tYWpvcml0eV9hcHByb3ZlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo2OTQtNjk2CiAgICAvLyAjIFRoZSByZWxhdGl2ZSBtYWpvcml0eSBvZiBBcHByb3ZlZCBvdmVyIFJlamVjdGVkIHZvdGVzIGlzIHJlYWNoZWQuCiAgICAvLyAjIE51bGwgdm90ZXMgZG8gbm90IGFmZmVjdCB0aGUgcmVsYXRpdmUgbWFqb3JpdHkuCiAgICAvLyByZXR1cm4gc2VsZi5hcHByb3ZhbHMudmFsdWUgPiBzZWxmLnJlamVjdGlvbnMudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFscyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDcyNjU2YTY1NjM3NDY5NmY2ZTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVqZWN0aW9ucyBleGlzdHMKICAgID4KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcm9wb3NhbC5jb250cmFjdC5Qcm9wb3NhbC5fdW5hc3NpZ25fdm90ZXIodm90ZXI6IGJ5dGVzLCB2b3RpbmdfcG93ZXI6IHVpbnQ2NCwgcmVjb3JkOiB1aW50NjQpIC0+IHZvaWQ6Cl91bmFzc2lnbl92b3RlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NTMtOTU1CiAgICAvLyBkZWYgX3VuYXNzaWduX3ZvdGVyKAogICAgLy8gICAgIHNlbGYsIHZvdGVyOiBBY2NvdW50LCB2b3RpbmdfcG93ZXI6IFVJbnQ2NCwgcmVjb3JkOiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgYnl0ZWNfMCAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk1NgogICAgLy8gaWYgc2VsZi52b3Rlcl9idWNrZXRzLnZhbHVlOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vIDB4NzY2Zjc0NjU3MjVmNjI3NTYzNmI2NTc0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3Rlcl9idWNrZXRzIGV4aXN0cwogICAgYnogX3VuYXNzaWduX3ZvdGVyX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTU3CiAgICAvLyBidWNrZXQgPSBzZWxmLnZvdGVyX2J1Y2tldC5ib3goc2VsZi5nZXRfdm90ZXJfYnVja2V0KHZvdGVyKSkKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiBnZXRfdm90ZXJfYnVja2V0CiAgICBpdG9iCiAgICBieXRlYyA0NCAvLyAiSyIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTU4CiAgICAvLyBsZW5ndGggPSBidWNrZXQubGVuZ3RoIC0gY29uc3QuVk9URVJfQlVDS0VUX1JFQ09SRF9TSVpFCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgQm94IGV4aXN0cwogICAgcHVzaGludCA0MAogICAgLQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NTkKICAgIC8vIGlmIGxlbmd0aDoKICAgIGJ6IF91bmFzc2lnbl92b3Rlcl9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2MAogICAgLy8gYnVja2V0LnNwbGljZShyZWNvcmQsIGNvbnN0LlZPVEVSX0JVQ0tFVF9SRUNPUkRfU0laRSwgQnl0ZXMoKSkKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDQwCiAgICBieXRlY18wIC8vIDB4CiAgICBib3hfc3BsaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTYxCiAgICAvLyBidWNrZXQucmVzaXplKGxlbmd0aCkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcmVzaXplCgpfdW5hc3NpZ25fdm90ZXJfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2OAogICAgLy8gc2VsZi5hc3NpZ25lZF9tZW1iZXJzLnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzIgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NjkKICAgIC8vIHNlbGYuYXNzaWduZWRfdm90ZXMudmFsdWUgLT0gdm90aW5nX3Bvd2VyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF92b3RlcyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgLQogICAgYnl0ZWMgNSAvLyAweDYxNzM3MzY5Njc2ZTY1NjQ1Zjc2NmY3NDY1NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCl91bmFzc2lnbl92b3Rlcl9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NjMKICAgIC8vIGRlbCBidWNrZXQudmFsdWUKICAgIGJveF9kZWwKICAgIHBvcAogICAgYiBfdW5hc3NpZ25fdm90ZXJfYWZ0ZXJfaWZfZWxzZUA2CgpfdW5hc3NpZ25fdm90ZXJfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQzCiAgICAvLyBhc3NlcnQgdm90ZXIgaW4gc2VsZi52b3RlcnMsIGVyci5WT1RFUl9OT1RfRk9VTkQKICAgIGJ5dGVjIDQzIC8vICJWIgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVm90ZXIgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6NDQ0CiAgICAvLyBhc3NlcnQgdm90aW5nX3Bvd2VyID4gMCwgZXJyLklOVkFMSURfVk9USU5HX1BPV0VSCiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2VydCAvLyBJbnZhbGlkIFZvdGluZyBQb3dlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk2NgogICAgLy8gZGVsIHNlbGYudm90ZXJzW3ZvdGVyXQogICAgYm94X2RlbAogICAgcG9wCiAgICBiIF91bmFzc2lnbl92b3Rlcl9hZnRlcl9pZl9lbHNlQDYKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwuY291bnRfdm90ZSh2b3RlcjogYnl0ZXMsIHZvdGVzOiB1aW50NjQsIGFwcHJvdmFsczogdWludDY0LCByZWplY3Rpb25zOiB1aW50NjQpIC0+IHZvaWQ6CmNvdW50X3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTcxLTk3MwogICAgLy8gZGVmIGNvdW50X3ZvdGUoCiAgICAvLyAgICAgc2VsZiwgdm90ZXI6IEFjY291bnQsIHZvdGVzOiBVSW50NjQsIGFwcHJvdmFsczogVUludDY0LCByZWplY3Rpb25zOiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk3NAogICAgLy8gc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDkgLy8gMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5NzUKICAgIC8vIGlmIHNlbGYuaXNfYm95Y290dCh2b3RlcywgYXBwcm92YWxzLCByZWplY3Rpb25zKToKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgaXNfYm95Y290dAogICAgYnogY291bnRfdm90ZV9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk3NgogICAgLy8gc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm95Y290dGVkX21lbWJlcnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTYgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk3OQogICAgLy8gbnVsbHMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTc3CiAgICAvLyBib3ljb3R0ZWQgPSBUcnVlCiAgICBpbnRjXzEgLy8gMQoKY291bnRfdm90ZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTkyCiAgICAvLyBhcHByb3ZhbHM9YXJjNC5VSW50MzIoYXBwcm92YWxzKSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5OTMKICAgIC8vIHJlamVjdGlvbnM9YXJjNC5VSW50MzIocmVqZWN0aW9ucyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTk0CiAgICAvLyBudWxscz1hcmM0LlVJbnQzMihudWxscyksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTk2CiAgICAvLyB0b3RhbF92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi52b3RlZF9tZW1iZXJzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4NzY2Zjc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RlZF9tZW1iZXJzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5OTcKICAgIC8vIHRvdGFsX2JveWNvdHQ9YXJjNC5VSW50MzIoc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gMHg2MjZmNzk2MzZmNzQ3NDY1NjQ1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm95Y290dGVkX21lbWJlcnMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk5OAogICAgLy8gdG90YWxfYXBwcm92YWxzPWFyYzQuVUludDMyKHNlbGYuYXBwcm92YWxzLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFwcHJvdmFscyBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTk5CiAgICAvLyB0b3RhbF9yZWplY3Rpb25zPWFyYzQuVUludDMyKHNlbGYucmVqZWN0aW9ucy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gMHg3MjY1NmE2NTYzNzQ2OTZmNmU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlamVjdGlvbnMgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMDAKICAgIC8vIHRvdGFsX251bGxzPWFyYzQuVUludDMyKHNlbGYubnVsbHMudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE3IC8vIDB4NmU3NTZjNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm51bGxzIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDAxCiAgICAvLyByb3VuZD1HbG9iYWwucm91bmQsCiAgICBnbG9iYWwgUm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5OTAtMTAwMgogICAgLy8gdHlwLlZvdGUoCiAgICAvLyAgICAgeGdvdj1hcmM0LkFkZHJlc3Modm90ZXIpLAogICAgLy8gICAgIGFwcHJvdmFscz1hcmM0LlVJbnQzMihhcHByb3ZhbHMpLAogICAgLy8gICAgIHJlamVjdGlvbnM9YXJjNC5VSW50MzIocmVqZWN0aW9ucyksCiAgICAvLyAgICAgbnVsbHM9YXJjNC5VSW50MzIobnVsbHMpLAogICAgLy8gICAgIGJveWNvdHRlZD1ib3ljb3R0ZWQsCiAgICAvLyAgICAgdG90YWxfdm90ZXJzPWFyYzQuVUludDMyKHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfYm95Y290dD1hcmM0LlVJbnQzMihzZWxmLmJveWNvdHRlZF9tZW1iZXJzLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9hcHByb3ZhbHM9YXJjNC5VSW50MzIoc2VsZi5hcHByb3ZhbHMudmFsdWUpLAogICAgLy8gICAgIHRvdGFsX3JlamVjdGlvbnM9YXJjNC5VSW50MzIoc2VsZi5yZWplY3Rpb25zLnZhbHVlKSwKICAgIC8vICAgICB0b3RhbF9udWxscz1hcmM0LlVJbnQzMihzZWxmLm51bGxzLnZhbHVlKSwKICAgIC8vICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIHVuY292ZXIgOQogICAgY29uY2F0CiAgICB1bmNvdmVyIDgKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBjb25jYXQKICAgIGJ5dGVjIDEzIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDkKICAgIHNldGJpdAogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5Ojk4OS0xMDAzCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgdHlwLlZvdGUoCiAgICAvLyAgICAgICAgIHhnb3Y9YXJjNC5BZGRyZXNzKHZvdGVyKSwKICAgIC8vICAgICAgICAgYXBwcm92YWxzPWFyYzQuVUludDMyKGFwcHJvdmFscyksCiAgICAvLyAgICAgICAgIHJlamVjdGlvbnM9YXJjNC5VSW50MzIocmVqZWN0aW9ucyksCiAgICAvLyAgICAgICAgIG51bGxzPWFyYzQuVUludDMyKG51bGxzKSwKICAgIC8vICAgICAgICAgYm95Y290dGVkPWJveWNvdHRlZCwKICAgIC8vICAgICAgICAgdG90YWxfdm90ZXJzPWFyYzQuVUludDMyKHNlbGYudm90ZWRfbWVtYmVycy52YWx1ZSksCiAgICAvLyAgICAgICAgIHRvdGFsX2JveWNvdHQ9YXJjNC5VSW50MzIoc2VsZi5ib3ljb3R0ZWRfbWVtYmVycy52YWx1ZSksCiAgICAvLyAgICAgICAgIHRvdGFsX2FwcHJvdmFscz1hcmM0LlVJbnQzMihzZWxmLmFwcHJvdmFscy52YWx1ZSksCiAgICAvLyAgICAgICAgIHRvdGFsX3JlamVjdGlvbnM9YXJjNC5VSW50MzIoc2VsZi5yZWplY3Rpb25zLnZhbHVlKSwKICAgIC8vICAgICAgICAgdG90YWxfbnVsbHM9YXJjNC5VSW50MzIoc2VsZi5udWxscy52YWx1ZSksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhhOTEwOGExYSAvLyBtZXRob2QgIlZvdGUoYWRkcmVzcyx1aW50MzIsdWludDMyLHVpbnQzMixib29sLHVpbnQzMix1aW50MzIsdWludDMyLHVpbnQzMix1aW50MzIsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCmNvdW50X3ZvdGVfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTgxCiAgICAvLyBib3ljb3R0ZWQgPSBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5ODMKICAgIC8vIG51bGxzID0gdm90ZXMgLSBhcHByb3ZhbHMgLSByZWplY3Rpb25zCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgLQogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5ODUKICAgIC8vIHNlbGYuYXBwcm92YWxzLnZhbHVlICs9IGFwcHJvdmFscwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vIDB4NjE3MDcwNzI2Zjc2NjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXBwcm92YWxzIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBieXRlYyAxMCAvLyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTo5ODYKICAgIC8vIHNlbGYucmVqZWN0aW9ucy52YWx1ZSArPSByZWplY3Rpb25zCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gMHg3MjY1NmE2NTYzNzQ2OTZmNmU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlamVjdGlvbnMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGJ5dGVjIDExIC8vIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6OTg3CiAgICAvLyBzZWxmLm51bGxzLnZhbHVlICs9IG51bGxzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gMHg2ZTc1NmM2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubnVsbHMgZXhpc3RzCiAgICArCiAgICBieXRlYyAxNyAvLyAweDZlNzU2YzZjNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIGNvdW50X3ZvdGVfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnJlZ2lzdGVyX3ZvdGUodm90ZXI6IGJ5dGVzLCBhcHByb3ZhbHM6IHVpbnQ2NCwgcmVqZWN0aW9uczogdWludDY0KSAtPiBieXRlczoKcmVnaXN0ZXJfdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDA1LTEwMDcKICAgIC8vIGRlZiByZWdpc3Rlcl92b3RlKAogICAgLy8gICAgIHNlbGYsIHZvdGVyOiBBY2NvdW50LCBhcHByb3ZhbHM6IFVJbnQ2NCwgcmVqZWN0aW9uczogVUludDY0CiAgICAvLyApIC0+IHR5cC5FcnJvcjoKICAgIHByb3RvIDMgMQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDA4CiAgICAvLyB2b3RlcywgcmVjb3JkID0gc2VsZi5nZXRfdm90ZXIodm90ZXIpCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgZ2V0X3ZvdGVyCiAgICBzd2FwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMDIKICAgIC8vIGlmIHZvdGVzID09IDA6CiAgICBibnogcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weTozMDMKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoZXJyLkFSQ182NV9QUkVGSVggKyBlcnIuVk9URVJfTk9UX0ZPVU5EKQogICAgYnl0ZWMgMzQgLy8gIkVSUjpWb3RlciBub3QgZm91bmQiCiAgICBmcmFtZV9idXJ5IDAKCnJlZ2lzdGVyX3ZvdGVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwudm90ZV9pbnB1dF92YWxpZGF0aW9uQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAxMAogICAgLy8gaWYgZXJyb3IgIT0gdHlwLkVycm9yKCIiKToKICAgIGZyYW1lX2RpZyAwCiAgICBieXRlY18wIC8vICIiCiAgICAhPQogICAgYnogcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDExCiAgICAvLyByZXR1cm4gZXJyb3IKICAgIHJldHN1YgoKcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAxMwogICAgLy8gc2VsZi5fdW5hc3NpZ25fdm90ZXIodm90ZXIsIHZvdGVzLCByZWNvcmQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2RpZyAxCiAgICBjYWxsc3ViIF91bmFzc2lnbl92b3RlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMTQKICAgIC8vIHNlbGYuY291bnRfdm90ZSh2b3Rlciwgdm90ZXMsIGFwcHJvdmFscywgcmVqZWN0aW9ucykKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY291bnRfdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMTYKICAgIC8vIHJldHVybiB0eXAuRXJyb3IoIiIpCiAgICBieXRlY18wIC8vICIiCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKcmVnaXN0ZXJfdm90ZV9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MzA1CiAgICAvLyByZXR1cm4gc2VsZi52b3Rlc192YWxpZGF0aW9uKHZvdGVzLCBhcHByb3ZhbHMsIHJlamVjdGlvbnMpCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgdm90ZXNfdmFsaWRhdGlvbgogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAwOQogICAgLy8gZXJyb3IgPSBzZWxmLnZvdGVfaW5wdXRfdmFsaWRhdGlvbih2b3RlcywgYXBwcm92YWxzLCByZWplY3Rpb25zKQogICAgYiByZWdpc3Rlcl92b3RlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLnZvdGVfaW5wdXRfdmFsaWRhdGlvbkA2CgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLmJ1bXBfc3RhdGVfdmVyc2lvbigpIC0+IHZvaWQ6CmJ1bXBfc3RhdGVfdmVyc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDE5LTEwMjAKICAgIC8vICMgQ2FsbGVkIGJ5IGV2ZXJ5IG11dGF0aW5nIG1ldGhvZCwgbGV0cyBjbGllbnRzIGRldGVjdCBzdGF0ZSBjaGFuZ2VzCiAgICAvLyBzZWxmLnN0YXRlX3ZlcnNpb24udmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMyIC8vIDB4NzM3NDYxNzQ2NTVmNzY2NTcyNzM2OTZmNmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0ZV92ZXJzaW9uIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDMyIC8vIDB4NzM3NDYxNzQ2NTVmNzY2NTcyNzM2OTZmNmUKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMjEKICAgIC8vIGFyYzQuZW1pdCh0eXAuU3RhdGVWZXJzaW9uKHZlcnNpb249c2VsZi5zdGF0ZV92ZXJzaW9uLnZhbHVlKSkKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweGYwZDgyZGUwIC8vIG1ldGhvZCAiU3RhdGVWZXJzaW9uKHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByb3Bvc2FsLmNvbnRyYWN0LlByb3Bvc2FsLm9wZW5fdm90aW5nKCkgLT4gdm9pZDoKb3Blbl92b3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTAyNAogICAgLy8gc2VsZi5zdGF0dXMudmFsdWUgPSBVSW50NjQoZW5tLlNUQVRVU19WT1RJTkcpCiAgICBieXRlY18xIC8vIDB4NzM3NDYxNzQ3NTczCiAgICBwdXNoaW50IDI1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMjUKICAgIC8vIHNlbGYudm90ZV9vcGVuX3RzLnZhbHVlID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGJ5dGVjIDI5IC8vIDB4NzY2Zjc0NjU1ZjZmNzA2NTZlNjk2ZTY3NWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMzAKICAgIC8vIHZvdGVfY2xvc2luZz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSArIHNlbGYudm90aW5nX2R1cmF0aW9uLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMxIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDMxCiAgICAvLyBxdW9ydW1fdm90ZXJzPWFyYzQuVUludDMyKHNlbGYucXVvcnVtX3RocmVzaG9sZC52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gMHg3MTc1NmY3Mjc1NmQ1Zjc0Njg3MjY1NzM2ODZmNmM2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1b3J1bV90aHJlc2hvbGQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMzIKICAgIC8vIHdlaWdodGVkX3F1b3J1bV92b3Rlcz1hcmM0LlVJbnQzMihzZWxmLndlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQudmFsdWUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIzIC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkIGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMiAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDMzCiAgICAvLyByb3VuZD1HbG9iYWwucm91bmQsCiAgICBnbG9iYWwgUm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMDI4LTEwMzQKICAgIC8vIHR5cC5TdWJtaXR0ZWQoCiAgICAvLyAgICAgdm90ZV9vcGVuaW5nPXNlbGYudm90ZV9vcGVuX3RzLnZhbHVlLAogICAgLy8gICAgIHZvdGVfY2xvc2luZz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSArIHNlbGYudm90aW5nX2R1cmF0aW9uLnZhbHVlLAogICAgLy8gICAgIHF1b3J1bV92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlKSwKICAgIC8vICAgICB3ZWlnaHRlZF9xdW9ydW1fdm90ZXM9YXJjNC5VSW50MzIoc2VsZi53ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkLnZhbHVlKSwKICAgIC8vICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjEwMjctMTAzNQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIHR5cC5TdWJtaXR0ZWQoCiAgICAvLyAgICAgICAgIHZvdGVfb3BlbmluZz1zZWxmLnZvdGVfb3Blbl90cy52YWx1ZSwKICAgIC8vICAgICAgICAgdm90ZV9jbG9zaW5nPXNlbGYudm90ZV9vcGVuX3RzLnZhbHVlICsgc2VsZi52b3RpbmdfZHVyYXRpb24udmFsdWUsCiAgICAvLyAgICAgICAgIHF1b3J1bV92b3RlcnM9YXJjNC5VSW50MzIoc2VsZi5xdW9ydW1fdGhyZXNob2xkLnZhbHVlKSwKICAgIC8vICAgICAgICAgd2VpZ2h0ZWRfcXVvcnVtX3ZvdGVzPWFyYzQuVUludDMyKHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZC52YWx1ZSksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhkY2ViZTFjNSAvLyBtZXRob2QgIlN1Ym1pdHRlZCh1aW50NjQsdWludDY0LHVpbnQzMix1aW50MzIsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJvcG9zYWwuY29udHJhY3QuUHJvcG9zYWwub3Blbl92b3RpbmdfaWZfYXNzaWduZWQoKSAtPiB2b2lkOgpvcGVuX3ZvdGluZ19pZl9hc3NpZ25lZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcm9wb3NhbC9jb250cmFjdC5weToxMTIxCiAgICAvLyBpZiBzZWxmLmFzc2lnbmVkX21lbWJlcnMudmFsdWUgPT0gc2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vIDB4NjE3MzczNjk2NzZlNjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NpZ25lZF9tZW1iZXJzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICA9PQogICAgYnogb3Blbl92b3RpbmdfaWZfYXNzaWduZWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEyMwogICAgLy8gc2VsZi5hc3NpZ25lZF92b3Rlcy52YWx1ZSA9PSBzZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gMHg2MTczNzM2OTY3NmU2NTY0NWY3NjZmNzQ2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzaWduZWRfdm90ZXMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfdm90ZXMgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3Byb3Bvc2FsL2NvbnRyYWN0LnB5OjExMjItMTEyNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmFzc2lnbmVkX3ZvdGVzLnZhbHVlID09IHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlCiAgICAvLyApLCBlcnIuVk9USU5HX1BPV0VSX01JU01BVENICiAgICBhc3NlcnQgLy8gVm90aW5nIFBvd2VyIE1pc21hdGNoCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJvcG9zYWwvY29udHJhY3QucHk6MTEyNQogICAgLy8gc2VsZi5vcGVuX3ZvdGluZygpCiAgICBjYWxsc3ViIG9wZW5fdm90aW5nCgpvcGVuX3ZvdGluZ19pZl9hc3NpZ25lZF9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [2143, 3263, 5031], "errorMessage": "Address length is 32 bytes"}, {"pc": [1977], "errorMessage": "Empty payload"}, {"pc": [2278, 2416, 5247], "errorMessage": "Invalid Voting Power"}, {"pc": [1308], "errorMessage": "Locked amount is incorrect"}, {"pc": [1425, 1431, 4253, 4266], "errorMessage": "Missing Config"}, {"pc": [2130], "errorMessage": "Missing Metadata"}, {"pc": [1175, 1968, 2106, 2899], "errorMessage": "Registry's non-admin methods are paused"}, {"pc": [1244], "errorMessage": "Requested amount is less than the minimum requested amount"}, {"pc": [1248], "errorMessage": "Requested amount is more than the maximum requested amount"}, {"pc": [2230, 2360, 3279], "errorMessage": "There are voters assigned to this proposal"}, {"pc": [2124], "errorMessage": "Too early"}, {"pc": [1043, 1179, 2027, 3265, 3342, 3420, 3491, 3692, 4286, 4323, 4750, 4985], "errorMessage": "Unauthorized"}, {"pc": [2275, 2457], "errorMessage": "Voter Already Assigned"}, {"pc": [2463], "errorMessage": "Voter bucket is full"}, {"pc": [5244], "errorMessage": "Voter not found"}, {"pc": [2921], "errorMessage": "Voting Ongoing"}, {"pc": [5680], "errorMessage": "Voting Power Mismatch"}, {"pc": [5092], "errorMessage": "Wrong App ID"}, {"pc": [1225], "errorMessage": "Wrong Funding Type"}, {"pc": [675], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [681], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [685], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [689], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [5102], "errorMessage": "Wrong Method Call"}, {"pc": [1196, 2907, 3273, 3428, 3698, 4758, 5005], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [1301], "errorMessage": "Wrong Receiver"}, {"pc": [1294], "errorMessage": "Wrong Sender"}, {"pc": [1204, 1207], "errorMessage": "Wrong Title length"}, {"pc": [3663, 3668, 3761], "errorMessage": "account funded"}, {"pc": [3297, 3658, 3756], "errorMessage": "application exists"}, {"pc": [2444, 4890, 5188], "errorMessage": "check Box exists"}, {"pc": [3869, 4145, 5134, 5156, 5357, 5459], "errorMessage": "check self.approvals exists"}, {"pc": [2286, 2358, 2486, 3277, 3578, 4716, 5211, 5659], "errorMessage": "check self.assigned_members exists"}, {"pc": [2296, 2496, 4726, 5221, 5673], "errorMessage": "check self.assigned_votes exists"}, {"pc": [3864, 4131, 5118, 5283, 5343], "errorMessage": "check self.boycotted_members exists"}, {"pc": [3844], "errorMessage": "check self.committee_id exists"}, {"pc": [1590, 2180, 2365, 3713, 3849, 4560, 4658, 4744, 5664], "errorMessage": "check self.committee_members exists"}, {"pc": [4448, 4571], "errorMessage": "check self.committee_root exists"}, {"pc": [1685, 2188, 3854, 5678], "errorMessage": "check self.committee_votes exists"}, {"pc": [2153], "errorMessage": "check self.daemon_ops_funding_bps exists"}, {"pc": [2122], "errorMessage": "check self.discussion_duration exists"}, {"pc": [1191, 2042, 3496, 3697, 3805, 4311, 5000], "errorMessage": "check self.finalized exists"}, {"pc": [3815], "errorMessage": "check self.focus exists"}, {"pc": [1423, 1482, 1726, 3810], "errorMessage": "check self.funding_category exists"}, {"pc": [1707, 3829], "errorMessage": "check self.funding_type exists"}, {"pc": [3839, 5070], "errorMessage": "check self.locked_amount exists"}, {"pc": [2005], "errorMessage": "check self.metadata exists"}, {"pc": [2129], "errorMessage": "check self.metadata_uploaded exists"}, {"pc": [3879, 4173, 5145, 5385, 5483], "errorMessage": "check self.nulls exists"}, {"pc": [2148], "errorMessage": "check self.open_proposal_fee exists"}, {"pc": [2116, 3786], "errorMessage": "check self.open_ts exists"}, {"pc": [1292, 2078, 2991, 3331, 3647, 3771, 5017], "errorMessage": "check self.proposer exists"}, {"pc": [4089, 5108, 5604], "errorMessage": "check self.quorum_threshold exists"}, {"pc": [1084, 3294, 3655, 3753, 3776, 4249, 4262, 5040], "errorMessage": "check self.registry_app_id exists"}, {"pc": [3874, 4159, 5139, 5161, 5371, 5471], "errorMessage": "check self.rejections exists"}, {"pc": [1430, 1576, 1671, 1721, 3834], "errorMessage": "check self.requested_amount exists"}, {"pc": [3988, 5562], "errorMessage": "check self.state_version exists"}, {"pc": [1183, 2031, 2903, 3269, 3346, 3424, 3503, 3510, 3520, 3530, 3540, 3636, 3800, 4290, 4300, 4327, 4754, 4989], "errorMessage": "check self.status exists"}, {"pc": [3791], "errorMessage": "check self.submission_ts exists"}, {"pc": [3781], "errorMessage": "check self.title exists"}, {"pc": [3796, 4274], "errorMessage": "check self.vote_open_ts exists"}, {"pc": [4052], "errorMessage": "check self.voted_bitmap entry exists"}, {"pc": [3859, 4117, 4739, 5113, 5260, 5329], "errorMessage": "check self.voted_members exists"}, {"pc": [2228, 2351, 4815, 4835, 5172], "errorMessage": "check self.voter_buckets exists"}, {"pc": [4280, 5596], "errorMessage": "check self.voting_duration exists"}, {"pc": [4103, 5129, 5618], "errorMessage": "check self.weighted_quorum_threshold exists"}, {"pc": [2257, 2401, 2662, 3079, 3453, 4499, 4543], "errorMessage": "index access is out of bounds"}, {"pc": [1131, 1939, 2204, 2324, 2598, 2736, 3018, 3153, 3404, 4469], "errorMessage": "invalid array length header"}, {"pc": [1959, 3236], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [3030, 3416], "errorMessage": "invalid number of bytes for arc4.dynamic_array<account>"}, {"pc": [2745, 3162], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [1139, 1947], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [2217, 2337], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.CommitteeMember>"}, {"pc": [2611], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.XGovVote>"}, {"pc": [1040, 2533, 2711, 3128, 4003], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [1150, 1159, 2541, 2550, 2719, 2728, 2753, 2762, 3136, 3145, 4033], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1168], "errorMessage": "invalid number of bytes for arc4.uint8"}, {"pc": [1713, 1732, 3821, 4095, 4109, 4123, 4137, 4151, 4165, 4179, 5299, 5310, 5321, 5335, 5349, 5363, 5377, 5391, 5610, 5624], "errorMessage": "overflow"}, {"pc": [1125], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -137,6 +137,15 @@ class AssignVotersArgs:
     def abi_method_signature(self) -> str:
         return "assign_voters((address,uint64)[])void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssignVotersToBucketsArgs:
+    """Dataclass for assign_voters_to_buckets arguments"""
+    voters: list[tuple[str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "assign_voters_to_buckets((address,uint64)[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class VoteArgs:
     """Dataclass for vote arguments"""
@@ -148,6 +157,29 @@ class VoteArgs:
     def abi_method_signature(self) -> str:
         return "vote(address,uint64,uint64)string"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteBatchArgs:
+    """Dataclass for vote_batch arguments"""
+    votes: list[tuple[str, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_batch((address,uint64,uint64)[])string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteWithProofArgs:
+    """Dataclass for vote_with_proof arguments"""
+    voter: str
+    voting_power: int
+    ordinal: int
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    approvals: int
+    rejections: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class UnassignAbsenteesArgs:
     """Dataclass for unassign_absentees arguments"""
@@ -157,6 +189,18 @@ class UnassignAbsenteesArgs:
     def abi_method_signature(self) -> str:
         return "unassign_absentees(address[])string"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class UnassignAbsenteeWithProofArgs:
+    """Dataclass for unassign_absentee_with_proof arguments"""
+    absentee: str
+    voting_power: int
+    ordinal: int
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ReviewArgs:
     """Dataclass for review arguments"""
@@ -184,6 +228,15 @@ class GetVoterBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_voter_box(address)(uint64,bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetVotedBitmapPageArgs:
+    """Dataclass for get_voted_bitmap_page arguments"""
+    page: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_voted_bitmap_page(uint64)(byte[],bool)"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateArgs:
     """Dataclass for create arguments"""
@@ -279,6 +332,19 @@ class ProposalParams:
             "args": method_args,
         }))
 
+    def assign_voters_to_buckets(
+        self,
+        args: tuple[list[tuple[str, int]]] | AssignVotersToBucketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "assign_voters_to_buckets((address,uint64)[])void",
+            "args": method_args,
+        }))
+
     def vote(
         self,
         args: tuple[str, int, int] | VoteArgs,
@@ -292,6 +358,32 @@ class ProposalParams:
             "args": method_args,
         }))
 
+    def vote_batch(
+        self,
+        args: tuple[list[tuple[str, int, int]]] | VoteBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_batch((address,uint64,uint64)[])string",
+            "args": method_args,
+        }))
+
+    def vote_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string",
+            "args": method_args,
+        }))
+
     def scrutiny(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -316,6 +408,19 @@ class ProposalParams:
             "args": method_args,
         }))
 
+    def unassign_absentee_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string",
+            "args": method_args,
+        }))
+
     def review(
         self,
         args: tuple[bool] | ReviewArgs,
@@ -375,6 +480,17 @@ class ProposalParams:
             "method": "get_state()(address,uint64,string,uint64,uint64,uint64,uint64,bool,uint64,uint8,uint64,uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
         }))
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }))
+
     def get_voter_box(
         self,
         args: tuple[str] | GetVoterBoxArgs,
@@ -388,6 +504,19 @@ class ProposalParams:
             "args": method_args,
         }))
 
+    def get_voted_bitmap_page(
+        self,
+        args: tuple[int] | GetVotedBitmapPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voted_bitmap_page(uint64)(byte[],bool)",
+            "args": method_args,
+        }))
+
     def get_voting_state(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -519,6 +648,19 @@ class ProposalCreateTransactionParams:
             "args": method_args,
         }))
 
+    def assign_voters_to_buckets(
+        self,
+        args: tuple[list[tuple[str, int]]] | AssignVotersToBucketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "assign_voters_to_buckets((address,uint64)[])void",
+            "args": method_args,
+        }))
+
     def vote(
         self,
         args: tuple[str, int, int] | VoteArgs,
@@ -532,6 +674,32 @@ class ProposalCreateTransactionParams:
             "args": method_args,
         }))
 
+    def vote_batch(
+        self,
+        args: tuple[list[tuple[str, int, int]]] | VoteBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_batch((address,uint64,uint64)[])string",
+            "args": method_args,
+        }))
+
+    def vote_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string",
+            "args": method_args,
+        }))
+
     def scrutiny(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -556,6 +724,19 @@ class ProposalCreateTransactionParams:
             "args": method_args,
         }))
 
+    def unassign_absentee_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string",
+            "args": method_args,
+        }))
+
     def review(
         self,
         args: tuple[bool] | ReviewArgs,
@@ -615,6 +796,17 @@ class ProposalCreateTransactionParams:
             "method": "get_state()(address,uint64,string,uint64,uint64,uint64,uint64,bool,uint64,uint8,uint64,uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
         }))
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }))
+
     def get_voter_box(
         self,
         args: tuple[str] | GetVoterBoxArgs,
@@ -628,6 +820,19 @@ class ProposalCreateTransactionParams:
             "args": method_args,
         }))
 
+    def get_voted_bitmap_page(
+        self,
+        args: tuple[int] | GetVotedBitmapPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voted_bitmap_page(uint64)(byte[],bool)",
+            "args": method_args,
+        }))
+
     def get_voting_state(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -777,6 +982,22 @@ class ProposalSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def assign_voters_to_buckets(
+        self,
+        args: tuple[list[tuple[str, int]]] | AssignVotersToBucketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "assign_voters_to_buckets((address,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def vote(
         self,
         args: tuple[str, int, int] | VoteArgs,
@@ -793,6 +1014,38 @@ class ProposalSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
+    def vote_batch(
+        self,
+        args: tuple[list[tuple[str, int, int]]] | VoteBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_batch((address,uint64,uint64)[])string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def vote_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
     def scrutiny(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -823,6 +1076,22 @@ class ProposalSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
+    def unassign_absentee_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
     def review(
         self,
         args: tuple[bool] | ReviewArgs,
@@ -897,6 +1166,20 @@ class ProposalSend:
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ProposalTypedGlobalState, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[ProposalTypedGlobalState], parsed_response)
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def get_voter_box(
         self,
         args: tuple[str] | GetVoterBoxArgs,
@@ -913,6 +1196,22 @@ class ProposalSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, bool]], parsed_response)
 
+    def get_voted_bitmap_page(
+        self,
+        args: tuple[int] | GetVotedBitmapPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[bytes, bool]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_voted_bitmap_page(uint64)(byte[],bool)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[bytes, bool]], parsed_response)
+
     def get_voting_state(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -975,6 +1274,7 @@ class GlobalStateValue(typing.TypedDict):
     committee_id: bytes
     committee_members: int
     committee_votes: int
+    committee_root: bytes
     open_proposal_fee: int
     daemon_ops_funding_bps: int
     open_ts: int
@@ -1000,6 +1300,8 @@ class GlobalStateValue(typing.TypedDict):
     approvals: int
     rejections: int
     nulls: int
+    voter_buckets: int
+    state_version: int
 
 class BoxStateValue(typing.TypedDict):
     """Shape of box state key values"""
@@ -1088,6 +1390,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def committee_root(self) -> bytes:
+        """Get the current value of the committee_root key in global_state state"""
+        value = self.app_client.state.global_state.get_value("committee_root")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
     @property
     def open_proposal_fee(self) -> int:
         """Get the current value of the open_proposal_fee key in global_state state"""
@@ -1288,6 +1598,22 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def voter_buckets(self) -> int:
+        """Get the current value of the voter_buckets key in global_state state"""
+        value = self.app_client.state.global_state.get_value("voter_buckets")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def state_version(self) -> int:
+        """Get the current value of the state_version key in global_state state"""
+        value = self.app_client.state.global_state.get_value("state_version")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _BoxState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -1328,6 +1654,24 @@ class _BoxState:
             None
         )
 
+    @property
+    def voted_bitmap(self) -> "_MapState[int, bytes]":
+        """Get values from the voted_bitmap map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "voted_bitmap",
+            None
+        )
+
+    @property
+    def voter_bucket(self) -> "_MapState[int, bytes]":
+        """Get values from the voter_bucket map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "voter_bucket",
+            None
+        )
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -1537,12 +1881,30 @@ class ProposalClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["assign_voters_to_buckets((address,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["vote(address,uint64,uint64)string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_batch((address,uint64,uint64)[])string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["scrutiny()void"],
@@ -1555,6 +1917,12 @@ class ProposalClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["review(bool)void"],
@@ -1585,12 +1953,24 @@ class ProposalClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> ProposalTypedGlobalState | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_state_version()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_voter_box(address)(uint64,bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[int, bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_voted_bitmap_page(uint64)(byte[],bool)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[bytes, bool] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_voting_state()(uint32,uint32,uint32,uint32,uint32,uint32,uint32,bool,bool,bool,bool)"],
@@ -1625,7 +2005,7 @@ class ProposalClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | ProposalTypedGlobalState | VotingState | str | tuple[int, bool]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | ProposalTypedGlobalState | VotingState | int | str | tuple[bytes, bool] | tuple[int, bool]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1928,6 +2308,26 @@ class ProposalFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def assign_voters_to_buckets(
+        self,
+        args: tuple[list[tuple[str, int]]] | AssignVotersToBucketsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the assign_voters_to_buckets((address,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "assign_voters_to_buckets((address,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def vote(
         self,
         args: tuple[str, int, int] | VoteArgs,
@@ -1948,6 +2348,46 @@ class ProposalFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def vote_batch(
+        self,
+        args: tuple[list[tuple[str, int, int]]] | VoteBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_batch((address,uint64,uint64)[])string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_batch((address,uint64,uint64)[])string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def vote_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def scrutiny(
         self,
         *,
@@ -1987,6 +2427,26 @@ class ProposalFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def unassign_absentee_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def review(
         self,
         args: tuple[bool] | ReviewArgs,
@@ -2084,6 +2544,25 @@ class ProposalFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_state_version(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_state_version()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_state_version()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_voter_box(
         self,
         args: tuple[str] | GetVoterBoxArgs,
@@ -2104,6 +2583,26 @@ class ProposalFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_voted_bitmap_page(
+        self,
+        args: tuple[int] | GetVotedBitmapPageArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_voted_bitmap_page(uint64)(byte[],bool) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_voted_bitmap_page(uint64)(byte[],bool)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_voting_state(
         self,
         *,
@@ -2434,6 +2933,24 @@ class ProposalComposer:
         )
         return self
 
+    def assign_voters_to_buckets(
+        self,
+        args: tuple[list[tuple[str, int]]] | AssignVotersToBucketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.assign_voters_to_buckets(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "assign_voters_to_buckets((address,uint64)[])void", v
+            )
+        )
+        return self
+
     def vote(
         self,
         args: tuple[str, int, int] | VoteArgs,
@@ -2452,6 +2969,42 @@ class ProposalComposer:
         )
         return self
 
+    def vote_batch(
+        self,
+        args: tuple[list[tuple[str, int, int]]] | VoteBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_batch((address,uint64,uint64)[])string", v
+            )
+        )
+        return self
+
+    def vote_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_with_proof(address,uint64,uint64,byte[32][],uint64,uint64)string", v
+            )
+        )
+        return self
+
     def scrutiny(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -2487,6 +3040,24 @@ class ProposalComposer:
         )
         return self
 
+    def unassign_absentee_with_proof(
+        self,
+        args: tuple[str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.unassign_absentee_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "unassign_absentee_with_proof(address,uint64,uint64,byte[32][])string", v
+            )
+        )
+        return self
+
     def review(
         self,
         args: tuple[bool] | ReviewArgs,
@@ -2574,6 +3145,23 @@ class ProposalComposer:
         )
         return self
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_state_version(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_state_version()uint64", v
+            )
+        )
+        return self
+
     def get_voter_box(
         self,
         args: tuple[str] | GetVoterBoxArgs,
@@ -2592,6 +3180,24 @@ class ProposalComposer:
         )
         return self
 
+    def get_voted_bitmap_page(
+        self,
+        args: tuple[int] | GetVotedBitmapPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ProposalComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_voted_bitmap_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_voted_bitmap_page(uint64)(byte[],bool)", v
+            )
+        )
+        return self
+
     def get_voting_state(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
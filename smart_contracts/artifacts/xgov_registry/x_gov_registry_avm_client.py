@@ -227,8 +227,7 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         xgov_address: algopy.arc4.Address,
     ) -> None:
         """
-        Unsubscribes an absentee xGov. This is a temporary method used only for the
-        first absentees removal at the inception of the absenteeism penalty.
+        Unsubscribes an absentee xGov.
         """
 
     @algopy.arc4.abimethod
@@ -329,7 +328,21 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         votes: algopy.arc4.UIntN[typing.Literal[64]],
     ) -> None:
         """
-        Sets the xGov Committee in charge.
+        Sets the xGov Committee in charge. The xGov Daemon assigns its members to
+        each submitted Proposal.
+        """
+
+    @algopy.arc4.abimethod
+    def declare_committee_with_root(
+        self,
+        committee_id: algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]],
+        size: algopy.arc4.UIntN[typing.Literal[64]],
+        votes: algopy.arc4.UIntN[typing.Literal[64]],
+        committee_root: algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]],
+    ) -> None:
+        """
+        Sets the xGov Committee in charge, committed by the Merkle root of its
+        (address, votes) members. Members prove their membership when voting, so submitted Proposals open the voting without voters assignment.
         """
 
     @algopy.arc4.abimethod
@@ -353,6 +366,42 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Votes on a Proposal.
         """
 
+    @algopy.arc4.abimethod
+    def vote_proposal_with_proof(
+        self,
+        proposal_id: algopy.arc4.UIntN[typing.Literal[64]],
+        xgov_address: algopy.arc4.Address,
+        voting_power: algopy.arc4.UIntN[typing.Literal[64]],
+        ordinal: algopy.arc4.UIntN[typing.Literal[64]],
+        proof: algopy.arc4.DynamicArray[algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]]],
+        approval_votes: algopy.arc4.UIntN[typing.Literal[64]],
+        rejection_votes: algopy.arc4.UIntN[typing.Literal[64]],
+    ) -> None:
+        """
+        Votes on a Proposal whose xGov Committee was declared with a Merkle root.
+        """
+
+    @algopy.arc4.abimethod
+    def vote_proposal_batch(
+        self,
+        proposal_id: algopy.arc4.UIntN[typing.Literal[64]],
+        votes: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]],
+    ) -> None:
+        """
+        Votes on a Proposal on behalf of several xGovs in a single app call, as a
+        delegate holding their voting address.
+        """
+
+    @algopy.arc4.abimethod
+    def vote_proposals(
+        self,
+        xgov_address: algopy.arc4.Address,
+        votes: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]],
+    ) -> None:
+        """
+        Votes on several Proposals on behalf of an xGov in a single app call.
+        """
+
     @algopy.arc4.abimethod
     def unassign_absentee_from_proposal(
         self,
@@ -363,6 +412,20 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Unassign absentees from a scrutinized Proposal.
         """
 
+    @algopy.arc4.abimethod
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        proposal_id: algopy.arc4.UIntN[typing.Literal[64]],
+        xgov_address: algopy.arc4.Address,
+        voting_power: algopy.arc4.UIntN[typing.Literal[64]],
+        ordinal: algopy.arc4.UIntN[typing.Literal[64]],
+        proof: algopy.arc4.DynamicArray[algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]]],
+    ) -> None:
+        """
+        Unassign an absentee from a scrutinized Proposal whose xGov Committee was
+        declared with a Merkle root.
+        """
+
     @algopy.arc4.abimethod
     def pay_grant_proposal(
         self,
@@ -433,6 +496,14 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Returns the xGov Registry state.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_state_version(
+        self,
+    ) -> algopy.arc4.UIntN[typing.Literal[64]]:
+        """
+        Returns the xGov Registry state version, incremented by every mutating method.
+        """
+
     @algopy.arc4.abimethod(readonly=True)
     def get_xgov_box(
         self,
@@ -442,6 +513,15 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Returns the xGov box for the given address.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_xgov_boxes(
+        self,
+        xgov_addresses: algopy.arc4.DynamicArray[algopy.arc4.Address],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]:
+        """
+        Returns the xGov boxes for the given addresses, as `get_xgov_box`.
+        """
+
     @algopy.arc4.abimethod(readonly=True)
     def get_proposer_box(
         self,
@@ -451,6 +531,15 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Returns the Proposer box for the given address.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_proposer_boxes(
+        self,
+        proposer_addresses: algopy.arc4.DynamicArray[algopy.arc4.Address],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Bool, algopy.arc4.Bool, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]:
+        """
+        Returns the Proposer boxes for the given addresses, as `get_proposer_box`.
+        """
+
     @algopy.arc4.abimethod(readonly=True)
     def get_request_box(
         self,
@@ -460,6 +549,16 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Returns the xGov subscribe request box for the given request ID.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_request_boxes(
+        self,
+        request_ids: algopy.arc4.DynamicArray[algopy.arc4.UIntN[typing.Literal[64]]],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]:
+        """
+        Returns the xGov subscribe request boxes for the given request IDs, as
+        `get_request_box`.
+        """
+
     @algopy.arc4.abimethod(readonly=True)
     def get_request_unsubscribe_box(
         self,
@@ -469,6 +568,26 @@ class XGovRegistry(algopy.arc4.ARC4Client, typing.Protocol):
         Returns the xGov unsubscribe request box for the given unsubscribe request ID.
         """
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_request_unsubscribe_boxes(
+        self,
+        request_ids: algopy.arc4.DynamicArray[algopy.arc4.UIntN[typing.Literal[64]]],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]:
+        """
+        Returns the xGov unsubscribe request boxes for the given unsubscribe
+        request IDs, as `get_request_unsubscribe_box`.
+        """
+
+    @algopy.arc4.abimethod(readonly=True)
+    def get_proposals_summary(
+        self,
+        proposal_ids: algopy.arc4.DynamicArray[algopy.arc4.UIntN[typing.Literal[64]]],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Bool, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.Bool, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]]:
+        """
+        Returns a compact state of several Proposals, read from their global state.
+        The summaries are returned in a single log, which bounds a call to `MAX_PROPOSALS_SUMMARY` Proposals (see `read_proposals_summary` to read more Proposals across calls).
+        """
+
     @algopy.arc4.abimethod
     def is_proposal(
         self,
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Create the xGov Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The size of the Proposal Approval Program contract", "name": "size"}], "name": "init_proposal_contract", "returns": {"type": "void"}, "desc": "Initializes the Proposal Approval Program contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The offset in the Proposal Approval Program contract", "name": "offset"}, {"type": "byte[]", "desc": "The data to load into the Proposal Approval Program contract", "name": "data"}], "name": "load_proposal_contract", "returns": {"type": "void"}, "desc": "Loads the Proposal Approval Program contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "delete_proposal_contract_box", "returns": {"type": "void"}, "desc": "Deletes the Proposal Approval Program contract box.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_registry", "returns": {"type": "void"}, "desc": "Pauses the xGov Registry non-administrative methods.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_proposals", "returns": {"type": "void"}, "desc": "Pauses the creation of new Proposals.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_registry", "returns": {"type": "void"}, "desc": "Resumes the xGov Registry non-administrative methods.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_proposals", "returns": {"type": "void"}, "desc": "Resumes the creation of new Proposals.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Manager", "name": "manager"}], "name": "set_xgov_manager", "returns": {"type": "void"}, "desc": "Sets the xGov Manager.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Payor", "name": "payor"}], "name": "set_payor", "returns": {"type": "void"}, "desc": "Sets the xGov Payor.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Council", "name": "council"}], "name": "set_xgov_council", "returns": {"type": "void"}, "desc": "Sets the xGov Council.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Subscriber", "name": "subscriber"}], "name": "set_xgov_subscriber", "returns": {"type": "void"}, "desc": "Sets the xGov Subscriber.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new KYC Provider", "name": "provider"}], "name": "set_kyc_provider", "returns": {"type": "void"}, "desc": "Sets the KYC provider.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Manager", "name": "manager"}], "name": "set_committee_manager", "returns": {"type": "void"}, "desc": "Sets the Committee Manager.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Daemon", "name": "xgov_daemon"}], "name": "set_xgov_daemon", "returns": {"type": "void"}, "desc": "Sets the xGov Daemon.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,uint64)", "desc": "Configuration class containing the field data", "name": "config", "struct": "XGovRegistryConfig"}], "name": "config_xgov_registry", "returns": {"type": "void"}, "desc": "Sets the configuration of the xGov Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_xgov_registry", "returns": {"type": "void"}, "desc": "Updates the xGov Registry contract.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the voting account for the xGov", "name": "voting_address"}, {"type": "pay", "desc": "The payment transaction covering the xGov fee", "name": "payment"}], "name": "subscribe_xgov", "returns": {"type": "void"}, "desc": "Subscribes the sender to being an xGov.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "address", "name": "delegate"}, {"type": "uint64", "name": "round"}], "name": "XGovSubscribed", "desc": "An xGov subscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Unsubscribes the sender from being an xGov.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "(Account): The address of the absentee xGov to unsubscribe", "name": "xgov_address"}], "name": "unsubscribe_absentee", "returns": {"type": "void"}, "desc": "Unsubscribes an absentee xGov. This is a temporary method used only for the\nfirst absentees removal at the inception of the absenteeism penalty.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}, {"type": "address", "desc": "The address of the xGov Address owner/controller (Voting Address)", "name": "owner_address"}, {"type": "uint64", "desc": "The type of relationship enum", "name": "relation_type"}, {"type": "pay", "desc": "The payment transaction covering the xGov fee", "name": "payment"}], "name": "request_subscribe_xgov", "returns": {"type": "void"}, "desc": "Requests to subscribe to the xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the request to approve", "name": "request_id"}], "name": "approve_subscribe_xgov", "returns": {"type": "void"}, "desc": "Approves a subscribe request to xGov.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "address", "name": "delegate"}, {"type": "uint64", "name": "round"}], "name": "XGovSubscribed", "desc": "An xGov subscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the request to reject", "name": "request_id"}], "name": "reject_subscribe_xgov", "returns": {"type": "void"}, "desc": "Rejects a subscribe request to xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}, {"type": "address", "desc": "The address of the xGov Address owner/controller", "name": "owner_address"}, {"type": "uint64", "desc": "The type of relationship enum", "name": "relation_type"}, {"type": "pay", "desc": "The payment transaction covering the xGov (unsubscribe) fee", "name": "payment"}], "name": "request_unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Requests to unsubscribe from the xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the unsubscribe request to approve", "name": "request_id"}], "name": "approve_unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Approves a request to unsubscribe from xGov.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the unsubscribe request to reject", "name": "request_id"}], "name": "reject_unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Rejects a request to unsubscribe from xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The xGov address delegating voting power", "name": "xgov_address"}, {"type": "address", "desc": "The voting account address to delegate voting power to", "name": "voting_address"}], "name": "set_voting_account", "returns": {"type": "void"}, "desc": "Sets the Voting Address for the xGov.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "The payment transaction covering the Proposer fee", "name": "payment"}], "name": "subscribe_proposer", "returns": {"type": "void"}, "desc": "Subscribes the sender to being a Proposer.", "events": [{"args": [{"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "ProposerSubscribed", "desc": "A Proposer subscribed"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Proposer", "name": "proposer"}, {"type": "bool", "desc": "The new status of the Proposer", "name": "kyc_status"}, {"type": "uint64", "desc": "The expiration date as a unix timestamp of the time the KYC expires", "name": "kyc_expiring"}], "name": "set_proposer_kyc", "returns": {"type": "void"}, "desc": "Sets a proposer's KYC status.", "events": [{"args": [{"type": "address", "name": "proposer"}, {"type": "bool", "name": "valid_kyc"}, {"type": "uint64", "name": "round"}], "name": "ProposerKYC", "desc": "A Proposer KYC status update"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "desc": "The ID of the xGov Committee", "name": "committee_id"}, {"type": "uint64", "desc": "The size of the xGov Committee", "name": "size"}, {"type": "uint64", "desc": "The voting power of the xGov Committee", "name": "votes"}], "name": "declare_committee", "returns": {"type": "void"}, "desc": "Sets the xGov Committee in charge.", "events": [{"args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint32", "name": "size"}, {"type": "uint32", "name": "votes"}, {"type": "uint64", "name": "round"}], "name": "NewCommittee", "desc": "A new xGov Committee has been elected"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "payment for covering the proposal fee (includes child contract MBR)", "name": "payment"}], "name": "open_proposal", "returns": {"type": "uint64"}, "desc": "Creates a new Proposal.", "events": [{"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "NewProposal", "desc": "A new Proposal has been opened"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app being voted on", "name": "proposal_id"}, {"type": "address", "desc": "(Account): The address of the xGov being voted on behalf of", "name": "xgov_address"}, {"type": "uint64", "desc": "(UInt64): The number of approvals votes allocated", "name": "approval_votes"}, {"type": "uint64", "desc": "(UInt64): The number of rejections votes allocated", "name": "rejection_votes"}], "name": "vote_proposal", "returns": {"type": "void"}, "desc": "Votes on a Proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the scrutinized Proposal", "name": "proposal_id"}, {"type": "address[]", "desc": "List of absentees to be unassigned", "name": "absentees"}], "name": "unassign_absentee_from_proposal", "returns": {"type": "void"}, "desc": "Unassign absentees from a scrutinized Proposal.", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the approved Proposal", "name": "proposal_id"}], "name": "pay_grant_proposal", "returns": {"type": "void"}, "desc": "Disburses the funds for an approved Proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app to finalize", "name": "proposal_id"}], "name": "finalize_proposal", "returns": {"type": "void"}, "desc": "Finalize a Proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app to drop", "name": "proposal_id"}], "name": "drop_proposal", "returns": {"type": "void"}, "desc": "Drops a Proposal.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "the deposit transaction", "name": "payment"}], "name": "deposit_funds", "returns": {"type": "void"}, "desc": "Deposits xGov program funds into the xGov Treasury (xGov Registry Account).", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "the amount to remove", "name": "amount"}], "name": "withdraw_funds", "returns": {"type": "void"}, "desc": "Remove xGov program funds from the xGov Treasury (xGov Registry Account).", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Amount to withdraw (in microALGO)", "name": "amount"}], "name": "withdraw_available_funds", "returns": {"type": "void"}, "desc": "Withdraw the available balance (excluding MBR and Proposals funds) from the xGov Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_available_funds", "returns": {"type": "uint64", "desc": "The available funds in microALGO"}, "desc": "Get the available funds (excluding MBR and Proposals funds)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state", "returns": {"type": "(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)", "struct": "TypedGlobalState"}, "desc": "Returns the xGov Registry state.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}], "name": "get_xgov_box", "returns": {"type": "((address,uint64,uint64,uint64),bool)", "desc": "The xGov box value bool: `True` if xGov box exists, else `False`"}, "desc": "Returns the xGov box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Proposer", "name": "proposer_address"}], "name": "get_proposer_box", "returns": {"type": "((bool,bool,uint64),bool)", "desc": "The Proposer box value bool: `True` if Proposer box exists, else `False`"}, "desc": "Returns the Proposer box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the subscribe request", "name": "request_id"}], "name": "get_request_box", "returns": {"type": "((address,address,uint64),bool)", "desc": "The subscribe request box value bool: `True` if xGov subscribe request box exists, else `False`"}, "desc": "Returns the xGov subscribe request box for the given request ID.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the unsubscribe request", "name": "request_id"}], "name": "get_request_unsubscribe_box", "returns": {"type": "((address,address,uint64),bool)", "desc": "The unsubscribe request box value bool: `True` if xGov unsubscribe request box exists, else `False`"}, "desc": "Returns the xGov unsubscribe request box for the given unsubscribe request ID.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "is_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "XGovRegistry", "state": {"keys": {"box": {"proposal_approval_program": {"key": "cGE=", "keyType": "AVMBytes", "valueType": "AVMBytes"}}, "global": {"xgov_manager": {"key": "eGdvdl9tYW5hZ2Vy", "keyType": "AVMBytes", "valueType": "address"}, "xgov_subscriber": {"key": "eGdvdl9zdWJzY3JpYmVy", "keyType": "AVMBytes", "valueType": "address"}, "xgov_payor": {"key": "eGdvdl9wYXlvcg==", "keyType": "AVMBytes", "valueType": "address"}, "xgov_council": {"key": "eGdvdl9jb3VuY2ls", "keyType": "AVMBytes", "valueType": "address"}, "kyc_provider": {"key": "a3ljX3Byb3ZpZGVy", "keyType": "AVMBytes", "valueType": "address"}, "committee_manager": {"key": "Y29tbWl0dGVlX21hbmFnZXI=", "keyType": "AVMBytes", "valueType": "address"}, "xgov_daemon": {"key": "eGdvdl9kYWVtb24=", "keyType": "AVMBytes", "valueType": "address"}, "paused_registry": {"key": "cGF1c2VkX3JlZ2lzdHJ5", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused_proposals": {"key": "cGF1c2VkX3Byb3Bvc2Fscw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "outstanding_funds": {"key": "b3V0c3RhbmRpbmdfZnVuZHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "xgov_fee": {"key": "eGdvdl9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "proposer_fee": {"key": "cHJvcG9zZXJfZmVl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_proposal_fee": {"key": "b3Blbl9wcm9wb3NhbF9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "daemon_ops_funding_bps": {"key": "ZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "proposal_commitment_bps": {"key": "cHJvcG9zYWxfY29tbWl0bWVudF9icHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "min_requested_amount": {"key": "bWluX3JlcXVlc3RlZF9hbW91bnQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_small": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGw=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_medium": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVt", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_large": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_small": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_medium": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_large": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_xlarge": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_small": {"key": "dm90aW5nX2R1cmF0aW9uX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_medium": {"key": "dm90aW5nX2R1cmF0aW9uX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_large": {"key": "dm90aW5nX2R1cmF0aW9uX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_xlarge": {"key": "dm90aW5nX2R1cmF0aW9uX3hsYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_small": {"key": "cXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_medium": {"key": "cXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_large": {"key": "cXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_small": {"key": "d2VpZ2h0ZWRfcXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_medium": {"key": "d2VpZ2h0ZWRfcXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_large": {"key": "d2VpZ2h0ZWRfcXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_id": {"key": "Y29tbWl0dGVlX2lk", "keyType": "AVMBytes", "valueType": "byte[32]"}, "committee_members": {"key": "Y29tbWl0dGVlX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_votes": {"key": "Y29tbWl0dGVlX3ZvdGVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_committee_size": {"key": "bWF4X2NvbW1pdHRlZV9zaXpl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "xgovs": {"key": "eGdvdnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "pending_proposals": {"key": "cGVuZGluZ19wcm9wb3NhbHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "request_id": {"key": "cmVxdWVzdF9pZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "absence_tolerance": {"key": "YWJzZW5jZV90b2xlcmFuY2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "governance_period": {"key": "Z292ZXJuYW5jZV9wZXJpb2Q=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_grace_period": {"key": "Y29tbWl0dGVlX2dyYWNlX3BlcmlvZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_last_anchor": {"key": "Y29tbWl0dGVlX2xhc3RfYW5jaG9y", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"xgov_box": {"keyType": "address", "valueType": "XGovBoxValue", "prefix": "eA=="}, "request_box": {"keyType": "uint64", "valueType": "XGovSubscribeRequestBoxValue", "prefix": "cg=="}, "request_unsubscribe_box": {"keyType": "uint64", "valueType": "XGovSubscribeRequestBoxValue", "prefix": "cnU="}, "proposer_box": {"keyType": "address", "valueType": "ProposerBoxValue", "prefix": "cA=="}, "voters": {"keyType": "address", "valueType": "uint64", "prefix": "Vg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 28, "ints": 36}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"ProposerBoxValue": [{"name": "active_proposal", "type": "bool"}, {"name": "kyc_status", "type": "bool"}, {"name": "kyc_expiring", "type": "uint64"}], "TypedGlobalState": [{"name": "paused_registry", "type": "bool"}, {"name": "paused_proposals", "type": "bool"}, {"name": "xgov_manager", "type": "address"}, {"name": "xgov_payor", "type": "address"}, {"name": "xgov_council", "type": "address"}, {"name": "xgov_subscriber", "type": "address"}, {"name": "kyc_provider", "type": "address"}, {"name": "committee_manager", "type": "address"}, {"name": "xgov_daemon", "type": "address"}, {"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "outstanding_funds", "type": "uint64"}, {"name": "pending_proposals", "type": "uint64"}, {"name": "committee_id", "type": "byte[32]"}, {"name": "committee_members", "type": "uint64"}, {"name": "committee_votes", "type": "uint64"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}, {"name": "committee_last_anchor", "type": "uint64"}], "XGovBoxValue": [{"name": "voting_address", "type": "address"}, {"name": "tolerated_absences", "type": "uint64"}, {"name": "last_vote_timestamp", "type": "uint64"}, {"name": "subscription_round", "type": "uint64"}], "XGovRegistryConfig": [{"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}], "XGovSubscribeRequestBoxValue": [{"name": "xgov_addr", "type": "address"}, {"name": "owner_addr", "type": "address"}, {"name": "relation_type", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEgCIAQJjkPcGF1c2VkX3JlZ2lzdHJ5AXgEFR98dQFwEW91dHN0YW5kaW5nX2Z1bmRzAnBhAQAMeGdvdl9tYW5hZ2VyEXBlbmRpbmdfcHJvcG9zYWxzCnhnb3ZfcGF5b3IQcGF1c2VkX3Byb3Bvc2FscwV4Z292cwpyZXF1ZXN0X2lkIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQERVJSOg94Z292X3N1YnNjcmliZXIMa3ljX3Byb3ZpZGVyEWNvbW1pdHRlZV9tYW5hZ2VyC3hnb3ZfZGFlbW9uCHhnb3ZfZmVlDHByb3Bvc2VyX2ZlZRFvcGVuX3Byb3Bvc2FsX2ZlZRFhYnNlbmNlX3RvbGVyYW5jZQFyAnJ1DHhnb3ZfY291bmNpbBxkYWVtb25fb3BlcmF0aW9uX2Z1bmRpbmdfYnBzF3Byb3Bvc2FsX2NvbW1pdG1lbnRfYnBzFG1pbl9yZXF1ZXN0ZWRfYW1vdW50Gm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsG21heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bRptYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZRlkaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsGmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtGWRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UaZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UVdm90aW5nX2R1cmF0aW9uX3NtYWxsFnZvdGluZ19kdXJhdGlvbl9tZWRpdW0Vdm90aW5nX2R1cmF0aW9uX2xhcmdlFnZvdGluZ19kdXJhdGlvbl94bGFyZ2UMcXVvcnVtX3NtYWxsDXF1b3J1bV9tZWRpdW0McXVvcnVtX2xhcmdlFXdlaWdodGVkX3F1b3J1bV9zbWFsbBZ3ZWlnaHRlZF9xdW9ydW1fbWVkaXVtFXdlaWdodGVkX3F1b3J1bV9sYXJnZRFjb21taXR0ZWVfbWVtYmVycw9jb21taXR0ZWVfdm90ZXMSbWF4X2NvbW1pdHRlZV9zaXplEWdvdmVybmFuY2VfcGVyaW9kFmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QVY29tbWl0dGVlX2xhc3RfYW5jaG9yCQAAAAAAAAAAAAxjb21taXR0ZWVfaWQPVm90ZXIgbm90IGZvdW5kSAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxGEAAtjE1gRwSRDE0gSQSRDE3FEQxNhREJwcyA2cnDzIDZycJMgNnJxkyA2cnEDIDZycRMgNnJxIyA2coImcnCiJnJwQiZycTImcnFCJnJxUiZycaImcnGyJnJxwiZycdImcnHiJnJx8iZycgImcnISJnJyIiZycjImcnJCJnJyUiZycmImcnJyJnJygiZycpImcnKiJnJysiZycsImcnLSJnJy4iZycvImcnMCJnJwsiZycIImcnDCJngARJVsGrNhoAjgEBXDEZFEQxGEEBRYItBJWcR2IEbB9WTQThClEuBIb34OYEOeJtigSYNS6GBPpO1uIE1snMGgRcSEBVBDfWrfEE1CFrbgS6hSDyBBZ3sw4EhLfSaASvfxhgBKCCzvgE3zn9uQTKD2o6BEUHc5AEPDG8AgQNLHiRBJP6zboEzos6HAT66ggfBA2ieIUEek/uQwRS3RDXBNTTemQENDSdzAQVj43WBF/iWTUE2ye5rwT1kQdWBGVhCp8E/caVwgS6kKtUBBpnS0UEqNWulARq5etGBCdjDWUEgk+YvARJVIugBIJnhPYEJpgyAATb2D3ZNhoAji0AKQBMAHEAewCEAI4AlwChALMAxQDXAOkA+wENAR8DPANpA34DoAP7BCgEPgSYBL8E1QUABUEFoAYTBzcILwkmCewKyQtXC3cLrwvfC+kNXQ2/DekOFg5DAAEAI0OABExcYbo2GgCOAQANADEZgQQSMRgQREIDGScHMQBnJzhJEkQjQzYaAUkVJRJEF4gOHUQnBb1FAUEABicFTNMjQycFTLlIQv/2NhoBSRUlEkQXNhoCSSJZgQIISwEVEkRXAgCIDelEJwVOArsjQ4gN3kQnBbxII0OIDdREKCNnI0OIDctEJwojZyNDiA3BRCgiZyNDiA24RCcKImcjQzYaAUkVJBJEiA2mRCcHTGcjQzYaAUkVJBJEiA2URCcJTGcjQzYaAUkVJBJEiA2CRCcZTGcjQzYaAUkVJBJEiA1wRCcPTGcjQzYaAUkVJBJEiA1eRCcQTGcjQzYaAUkVJBJEiA1MRCcRTGcjQzYaAUkVJBJEiA06RCcSTGcjQyJHBIAARw02GgFHAhWB0AESRIgNHkQiW0mB1KkCD0EB8kmB1JACD0EB6SNESwFJJVtJRRCB5JYBD0SBKFtJRQ5BAcxLAVcwGElFEyJbSUUNSw0NQQG5SxElW0lFDEsMDUEBrEsRgRBbSwsNQQGhI0RLAUmBEFtJTgJFEUmBGFtJRRNLAguBkE4KgeTFgwgISwJLAQ1ETwJMCYHUkwEKJzBMZ1dIIElFEiJbSUULQQFbSxAlW0lFCksKD0EBTksQgRBbSUUJSwkPQQFASxCBGFtLCA9BATUjREsBV2ggSUUWIltJRQhBAR9LFCVbSUUHSwcPQQESSxSBEFtJRQZLBg9BAQRLFIEYW0sFD0EA+SNESwFXiBhJRRUiW0lFBUEA40sTgRBbSwQNQQDYI0RLAVegGElFFCJbSUUEQQDCSxKBEFtLAw1BALcjRCcTSwFnJxRLDmcnFUsPZycaSxBnSwFJJFsnG0xnJxxLDmdJVzAYSSJbJx1MZ0klWyceTGeBEFsnH0xnJyBLC2dLEUklWychTGdJgRBbJyJMZ4EYWycjTGcnJEsIZ0sVSSVbJyVMZ0mBEFsnJkxngRhbJydMZycoSwVnJykiZ0sUgRBbJypMZycrSwRnJywiZ0sTgRBbJy1MZ0mBuAFbJxZMZ0mBwAFbJzFMZ4HIAVsnMkxnI0MiQv9GIkL/JSJC/wQiQv7IIkL+XCJC/hSICxlEI0M2GgFJFSQSRDEWIwlJOBAjEkQiKGVEFEQpMQBQvUUBFESIC2NEMQBMiAvKI0MiKGVEFEQpMQBQvUUBRDEAiAv1I0M2GgFJFSQSRCIoZUQURClLAVBJvUUBRL5IJFsURIgL0yNDNhoBSRUkEkQ2GgJJFSQSRDYaA0kVJRJEFzEWIwlJOBAjEkQxAEsDEkQiKGVEFEQpSwRQvUUBFESICuhEIicMZURPA08DUE8CFlBLARYnF0xQTL8jCCcMTGcjQzYaAUkVJRJEF4gKXUQWJxdMUEm+RElXACBMVyAgKUsCUL1FARREiAsNvEgjQzYaAUkVJRJEF4gKMEQWJxdMULxII0M2GgFJFSQSRDYaAkkVJBJENhoDSRUlEkQXMRYjCUk4ECMSRDEASwMSRCIoZUQURClLBFC9RQFEiApLRCInDGVETwNPA1BPAhZQSwEWJxhMUEy/IwgnDExnI0M2GgFJFSUSRBeICcBEFicYTFBJvkRXACApSwFQvUUBRIgKtrxII0M2GgFJFSUSRBeICZlEFicYTFC8SCNDNhoBSRUkEkQ2GgJJFSQSRCIoZUQURClLAlBJvUUBRE8CiAl0RCJPArsjQzEWIwlJOBAjEkQiKGVEFEQrMQBQvUUBFERJOAcyChJEOAgiJxRlRBJEKzEAUCc0vzEAMgYWUIAEGsTtzUxQsCNDNhoBSRUkEkQ2GgJJFSMSRCJTNhoDSRUlEkQXMQAiJxBlRBJEK0sDUEm9RQFESb5IIlMnBiJPAlQjTwRUTwIWUL9JiAlbMgYnBiJPA1RPAkxQTBZQgASbWvdhTFCwI0M2GgFJFSQSRDYaAkkVJRJEFzYaA0kVJRJEFzEAIicRZUQSREsBRElEIicwZURLAg9EJzVLA2cnLksCZycvSwFniAkgJzNMZ0wWSZMkDkRXBARMFkmTJA5EVwQEMgZPA08DUE8CUEwWUIAEh5tWqUxQsCNDMRYjCUk4ECMSRCIoZUQURCInCmVEFESICNYyBksBCUwiJzNlRBJAAAsiJzJlREsBD0EA7CNEKzEAUL1FAUQrMQBQvkQiUxREMQCICIFEMQEyAIEDCw9ESwFJOAcyChJEOAgiJxVlRExLARJEMgpzAEQnBb1ESYEECCEECkmBAhJESSMJIQQLTwJMCScFIiEEuicFIQRPA7qxMQBPA7I4gQOyNYEbsjSABAqBAUOyQk8CskBMskCABMxpTqqyGrIagQayECKyAbO0PTIKcwBEsUsBcghETE8DCU8DTAmyCLIHI7IQIrIBszEAIicIZUQjCCcITGcrTFBJIiO6IiNUIky7MQAyBk8CFklPA1BPAhZQgAQNGgUZTFCwKkxQsCNDIkL/ETYaAUkVJRJEFzYaAkkVJBJENhoDSRUlEkQ2GgRJFSUSRCIoZUQUREsDiAcoRClLA1BJvUUBREsDiAb7RCInFmVEFksBJE8CuzIHFoEoTLuxTwOyGIAEGEGg0rIaTwKyGkyyGrIagQayECKyAbO0PkcCVwAEKhJESVcEAEkiWYECCEwVEkRXBgBJFUmBBAxBAFwiQQBQgQRLAUlOAg+BBEsCTwJNSwNMTwJSJw0nNoICDVZvdGVzIGludmFsaWQVVm90aW5nIFBlcmlvZCBFeHBpcmVkTwSOBAAEAAMAAgABAAAAAABLAYAAEkQjQ0sCVwYEJw4SQv+aIkmAADYaAUkVJRJEFzYaAklOAkkiWUlOAyQLgQIISwEVEkQiKGVEFERLAYgGLkSxTLIYgAR2/0xwshqyGoEGshAisgGztD5HAlcABCoSRElXBABJIlmBAghMFRJEVwYASRVJgQQMQQCDIkEAJIEESwFJTgIPgQRLAk8CTUsDTE8CUicNJzZPAo4CAAIAAQAAAEsBgAASRCJFBksFSwQMQQBISwRXAgBLBiQLJFhJRQkpTFBJRQi9RQFBACVLBr5EJFtBABxLBkm+RCRbIwkWSwEkTwK7vkgkW0AABUsHiAZhSwUjCEUGQv+wI0NLAlcGBCcOEkL/czYaAUkVJRJEF4gFKURJiAVUREmIBVtLAYAQcmVxdWVzdGVkX2Ftb3VudGVEK0sCUL1FAURLAYgFgkQiJwRlRElLAg9EsUsBsghPArIHI7IQIrIBs0wJJwRMZ7GyGIAEil5MgLIagQayECKyAbO0PkcCVwAEKhJESVcEAEkiWYECCEwVEkRXBgBJFUmBBAxBACoiQQAegQRLAUlOAg+BBEsCTwJNSwNMTwJSJw1MjgEAAQAASwGAABJEI0NLAlcGBCcOEkL/zCJJgAA2GgFJFSUSRBdJgAZzdGF0dXNlTElPAkRBAAdJgQoSQQAJMQAiJxJlRBJESwFJiARqRLGyGIAEgCBptLIagQayECKyAbO0PklFBklXAAQqEkRJVwQASSJZgQIITBUSRFcGAElFBRVJRQSBBAxBAF8iQQBOgQRLA0lOAg+BBEsCTwJNSwVMTwJSJw2AKlRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbE8CjgIAAgABAAAASwOAABJESwGIBFQjQ0sEVwYEJw4SQv+XNhoBSRUlEkQXSSIoZUQUREmIA65ESYgDtTEAEkSxshiABHNxMhqyGoEGshAisgGztD5HAlcABCoSRElXBABJIlmBAghMFRJEVwYASRVJgQQMQQAvIkEAHoEESwFJTgIPgQRLAk8CTUsDTE8CUicNTI4BAAEAAEsBgAASREsDiAPGI0NLAlcGBCcOEkL/xzEWIwlJOBAjEkRJOAcyChJEIicEZURMOAgIJwRMZyNDNhoBSRUlEkQXiALPRCInBGVESg5EMQEyAIECCw9ESwEJJwRMZ7EiJwdlRLIHsggjshAisgGzI0M2GgFJFSUSRBeIAqBEMQEyAIECCw9EiALmSwEPRLEiJwllRLIHsggjshAisgGzI0OIAswWKkxQsCNDIihlRCInCmVEIicHZUQiJwllRCInGWVEIicPZUQiJxBlRCInEWVEIicSZUQiJxNlRCInFGVEIicVZUQiJxplRCInG2VEIiccZUQiJx1lRCInHmVEIicfZURPAhZPAhZQTBZQIicgZUQiJyFlRCInImVEIicjZURPAxZPAxZQTwIWUEwWUCInJGVEIiclZUQiJyZlRCInJ2VETwMWTwMWUE8CFlBMFlAiJyhlRCInKWVEIicqZURPAhZPAhZQTBZQIicrZUQiJyxlRCInLWVETwIWTwIWUEwWUCInBGVEIicIZUQiJzVlRCInLmVEIicvZUQiJxZlRCInMWVEIicyZUQiJzNlRCcGIk8eVCNPHVRPG1BPGlBPGVBPGFBPF1BPFlBPFVBPFBZQTxMWUE8SFlBPERZQTxAWUE8PFlBPDlBPDVBPDFBPC1BPClBPCRZQTwgWUE8HUE8GFlBPBRZQTwQWUE8DFlBPAhZQTBZQKkxQsCNDNhoBSRUkEkQpTFBJvUlPAkhBABFLAb5EJwYiSwNUUCpMULAjQ4A4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABC/7Y2GgFJFSQSRCtMUEm9SU8CSEEAEUsBvkQnBiJLA1RQKkxQsCNDJzRC/+42GgFJFSUSRBcWJxdMUEm9SU8CSEEAEUsBvkQnBiJLA1RQKkxQsCNDJzdC/+42GgFJFSUSRBcWJxhMUEm9SU8CSEEAEUsBvkQnBiJLA1RQKkxQsCNDJzdC/+42GgFJFSUSRBeIADxEI0MxACInB2VEEokxACInCWVEEokxACInD2VEEomKAQExAIv/EkAADzEAKYv/UL5EVwAgEkEAAiOJIomKAQGL/3IHRDIKEomKAQGL/4AIcHJvcG9zZXJlREkVJBJEiTIKcwBEMgpzAUQJIicEZURKDUQJiYoBAYv/OAcyChJBAA+L/zgIIicTZUQSQQACI4kiiYoBASuL/1BJvkQjU0EAD4sAvkQjWzIHDUEAAyNMiSJC//oyBiInMWVESwFMGAmJigEAIicIZUQjCScITGeL/4j/dCtMUEkiI7oiSVQiTLuJigIAKYv+UEm9RQEURCInFmVEMgZMFov/TFAiFlBMFlC/IicLZUQjCCcLTGcyBov+i/9QTBZQgAQkH9xRTFCwiYoBACmL/1BJvUUBRLxIIicLZUQjCScLTGcyBhaL/0xQgAR7olgDTFCwiQ==", "clear": "CoEBQw=="}, "desc": "xGov Registry Contract", "events": [{"args": [{"type": "address", "name": "xgov"}, {"type": "address", "name": "delegate"}, {"type": "uint64", "name": "round"}], "name": "XGovSubscribed", "desc": "An xGov subscribed (either through self-onboarding or managed onboarding)"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}, {"args": [{"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "ProposerSubscribed", "desc": "A Proposer subscribed"}, {"args": [{"type": "address", "name": "proposer"}, {"type": "bool", "name": "valid_kyc"}, {"type": "uint64", "name": "round"}], "name": "ProposerKYC", "desc": "A Proposer KYC status update"}, {"args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint32", "name": "size"}, {"type": "uint32", "name": "votes"}, {"type": "uint64", "name": "round"}], "name": "NewCommittee", "desc": "A new xGov Committee has been elected"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "NewProposal", "desc": "A new Proposal has been opened"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMzIgOCAyMDQ4CiAgICBieXRlY2Jsb2NrIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5IDB4NzggMHgxNTFmN2M3NSAweDcwIDB4NmY3NTc0NzM3NDYxNmU2NDY5NmU2NzVmNjY3NTZlNjQ3MyAweDcwNjEgMHgwMCAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MiAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMgMHg3ODY3NmY3NjVmNzA2MTc5NmY3MiAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczIDB4Nzg2NzZmNzY3MyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0ICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIiAiRVJSOiIgMHg3ODY3NmY3NjVmNzM3NTYyNzM2MzcyNjk2MjY1NzIgMHg2Yjc5NjM1ZjcwNzI2Zjc2Njk2NDY1NzIgMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjE2ZTYxNjc2NTcyIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZSAweDc4Njc2Zjc2NWY2NjY1NjUgMHg3MDcyNmY3MDZmNzM2NTcyNWY2NjY1NjUgMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1IDB4NjE2MjczNjU2ZTYzNjU1Zjc0NmY2YzY1NzI2MTZlNjM2NSAweDcyIDB4NzI3NSAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczIDB4NzA3MjZmNzA2ZjczNjE2YzVmNjM2ZjZkNmQ2OTc0NmQ2NTZlNzQ1ZjYyNzA3MyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmQ2NTY0Njk3NTZkIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmM2MTcyNjc2NSAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZCAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1IDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NSAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1IDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUgMHg3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMgMHg3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZCAweDcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NSAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MyAweDZkNjE3ODVmNjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MzY5N2E2NSAweDY3NmY3NjY1NzI2ZTYxNmU2MzY1NWY3MDY1NzI2OTZmNjQgMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY3NzI2MTYzNjU1ZjcwNjU3MjY5NmY2NCAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmM2MTczNzQ1ZjYxNmU2MzY4NmY3MiAweDAwMDAwMDAwMDAwMDAwMDAwMCAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NCAiVm90ZXIgbm90IGZvdW5kIiBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpIFRNUExfZW50cm9weQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTctNTgKICAgIC8vICMgUHJlY29uZGl0aW9ucwogICAgLy8gYXNzZXJ0IFR4bi5nbG9iYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkdMT0JBTF9CWVRFUywgZXJyLldST05HX0dMT0JBTF9CWVRFUwogICAgdHhuIEdsb2JhbE51bUJ5dGVTbGljZQogICAgcHVzaGludCAyOAogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTkKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV91aW50ID09IGNmZy5HTE9CQUxfVUlOVFMsIGVyci5XUk9OR19HTE9CQUxfVUlOVFMKICAgIHR4biBHbG9iYWxOdW1VaW50CiAgICBwdXNoaW50IDM2CiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIEdsb2JhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2MAogICAgLy8gYXNzZXJ0IFR4bi5sb2NhbF9udW1fYnl0ZV9zbGljZSA9PSBjZmcuTE9DQUxfQllURVMsIGVyci5XUk9OR19MT0NBTF9CWVRFUwogICAgdHhuIExvY2FsTnVtQnl0ZVNsaWNlCiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgQnl0ZXMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjEKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX3VpbnQgPT0gY2ZnLkxPQ0FMX1VJTlRTLCBlcnIuV1JPTkdfTE9DQUxfVUlOVFMKICAgIHR4biBMb2NhbE51bVVpbnQKICAgICEKICAgIGFzc2VydCAvLyBXcm9uZyBMb2NhbCBVSW50cyBhbGxvY2F0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2My02NAogICAgLy8gIyBSb2xlLUJhc2VkIEFjY2VzcyBDb250cm9sIChSQkFDKQogICAgLy8gc2VsZi54Z292X21hbmFnZXIgPSBHbG9iYWxTdGF0ZShBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX1hHT1ZfTUFOQUdFUikKICAgIGJ5dGVjIDcgLy8gMHg3ODY3NmY3NjVmNmQ2MTZlNjE2NzY1NzIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1CiAgICAvLyBzZWxmLnhnb3Zfc3Vic2NyaWJlciA9IEdsb2JhbFN0YXRlKEFjY291bnQoKSwga2V5PWNmZy5HU19LRVlfWEdPVl9TVUJTQ1JJQkVSKQogICAgYnl0ZWMgMTUgLy8gMHg3ODY3NmY3NjVmNzM3NTYyNzM2MzcyNjk2MjY1NzIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2CiAgICAvLyBzZWxmLnhnb3ZfcGF5b3IgPSBHbG9iYWxTdGF0ZShBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX1hHT1ZfUEFZT1IpCiAgICBieXRlYyA5IC8vIDB4Nzg2NzZmNzY1ZjcwNjE3OTZmNzIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBzZWxmLnhnb3ZfY291bmNpbCA9IEdsb2JhbFN0YXRlKEFjY291bnQoKSwga2V5PWNmZy5HU19LRVlfWEdPVl9DT1VOQ0lMKQogICAgYnl0ZWMgMjUgLy8gMHg3ODY3NmY3NjVmNjM2Zjc1NmU2MzY5NmMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBzZWxmLmt5Y19wcm92aWRlciA9IEdsb2JhbFN0YXRlKEFjY291bnQoKSwga2V5PWNmZy5HU19LRVlfS1lDX1BST1ZJREVSKQogICAgYnl0ZWMgMTYgLy8gMHg2Yjc5NjM1ZjcwNzI2Zjc2Njk2NDY1NzIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX0NPTU1JVFRFRV9NQU5BR0VSCiAgICBieXRlYyAxNyAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2MTZlNjE2NzY1NzIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjktNzEKICAgIC8vIHNlbGYuY29tbWl0dGVlX21hbmFnZXIgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX0NPTU1JVFRFRV9NQU5BR0VSCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzIKICAgIC8vIHNlbGYueGdvdl9kYWVtb24gPSBHbG9iYWxTdGF0ZShBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX1hHT1ZfREFFTU9OKQogICAgYnl0ZWMgMTggLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NgogICAgLy8gRmFsc2UsIGtleT1jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSAgIyBub3FhOiBGQlQwMDMKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NC03NwogICAgLy8gIyBSZWdpc3RyeSBDb250cm9sIFN0YXRlcwogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBGYWxzZSwga2V5PWNmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZICAjIG5vcWE6IEZCVDAwMwogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBGYWxzZSwga2V5PWNmZy5HU19LRVlfUEFVU0VEX1BST1BPU0FMUyAgIyBub3FhOiBGQlQwMDMKICAgIGJ5dGVjIDEwIC8vIDB4NzA2MTc1NzM2NTY0NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3OC04MAogICAgLy8gc2VsZi5wYXVzZWRfcHJvcG9zYWxzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgRmFsc2UsIGtleT1jZmcuR1NfS0VZX1BBVVNFRF9QUk9QT1NBTFMgICMgbm9xYTogRkJUMDAzCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODItODMKICAgIC8vICMgeEdvdiBUcmVhc3VyeQogICAgLy8gc2VsZi5vdXRzdGFuZGluZ19mdW5kcyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9PVVRTVEFORElOR19GVU5EUykKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1LTg2CiAgICAvLyAjIEZlZXMKICAgIC8vIHNlbGYueGdvdl9mZWUgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfWEdPVl9GRUUpCiAgICBieXRlYyAxOSAvLyAweDc4Njc2Zjc2NWY2NjY1NjUKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODcKICAgIC8vIHNlbGYucHJvcG9zZXJfZmVlID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1BST1BPU0VSX0ZFRSkKICAgIGJ5dGVjIDIwIC8vIDB4NzA3MjZmNzA2ZjczNjU3MjVmNjY2NTY1CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX09QRU5fUFJPUE9TQUxfRkVFKQogICAgYnl0ZWMgMjEgLy8gMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUwogICAgYnl0ZWMgMjYgLy8gMHg2NDYxNjU2ZDZmNmU1ZjZmNzA2NTcyNjE3NDY5NmY2ZTVmNjY3NTZlNjQ2OTZlNjc1ZjYyNzA3MwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5LTkxCiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUwogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUFJPUE9TQUxfQ09NTUlUTUVOVF9CUFMKICAgIGJ5dGVjIDI3IC8vIDB4NzA3MjZmNzA2ZjczNjE2YzVmNjM2ZjZkNmQ2OTc0NmQ2NTZlNzQ1ZjYyNzA3MwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyLTk0CiAgICAvLyBzZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1BST1BPU0FMX0NPTU1JVE1FTlRfQlBTCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTgKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NSU5fUkVRVUVTVEVEX0FNT1VOVAogICAgYnl0ZWMgMjggLy8gMHg2ZDY5NmU1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTYtOTkKICAgIC8vICMgUmVxdWVzdGVkIEFtb3VudCBMaW1pdHMKICAgIC8vIHNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDIKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTAogICAgYnl0ZWMgMjkgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxLTEwMwogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNQogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX01FRElVTQogICAgYnl0ZWMgMzAgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDQtMTA2CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0KICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDgKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRQogICAgYnl0ZWMgMzEgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA3LTEwOQogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMwogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fU01BTEwKICAgIGJ5dGVjIDMyIC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTEtMTE0CiAgICAvLyAjIFRpbWUgTGltaXRzCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9TTUFMTAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNgogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fTUVESVVNCiAgICBieXRlYyAzMyAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTUtMTE3CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fTUVESVVNCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5CiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9MQVJHRQogICAgYnl0ZWMgMzQgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOC0xMjAKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UKICAgIGJ5dGVjIDM1IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMS0xMjMKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjUKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fU01BTEwKICAgIGJ5dGVjIDM2IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI0LTEyNgogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1NNQUxMCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4CiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX01FRElVTQogICAgYnl0ZWMgMzcgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNy0xMjkKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX0xBUkdFCiAgICBieXRlYyAzOCAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMC0xMzIKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9MQVJHRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNAogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9YTEFSR0UKICAgIGJ5dGVjIDM5IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzMtMTM1CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1hMQVJHRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNy0xMzgKICAgIC8vICMgUXVvcnVtcwogICAgLy8gc2VsZi5xdW9ydW1fc21hbGwgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUVVPUlVNX1NNQUxMKQogICAgYnl0ZWMgNDAgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUVVPUlVNX01FRElVTQogICAgYnl0ZWMgNDEgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOS0xNDEKICAgIC8vIHNlbGYucXVvcnVtX21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9RVU9SVU1fTUVESVVNCiAgICAvLyApICAjIE5vIGxvbmdlciB1c2VkCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyCiAgICAvLyBzZWxmLnF1b3J1bV9sYXJnZSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9RVU9SVU1fTEFSR0UpCiAgICBieXRlYyA0MiAvLyAweDcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDYKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwKICAgIGJ5dGVjIDQzIC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0LTE0NwogICAgLy8gIyBXZWlnaHRlZCBRdW9ydW1zCiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDkKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTUVESVVNICAjIE5vIGxvbmdlciB1c2VkCiAgICBieXRlYyA0NCAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ4LTE1MAogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1dFSUdIVEVEX1FVT1JVTV9NRURJVU0gICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTEFSR0UKICAgIGJ5dGVjIDQ1IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxLTE1MwogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX0xBUkdFCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU3CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0NPTU1JVFRFRV9NRU1CRVJTKQogICAgYnl0ZWMgNDYgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gc2VsZi5jb21taXR0ZWVfdm90ZXMgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTKQogICAgYnl0ZWMgNDcgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfTUFYX0NPTU1JVFRFRV9TSVpFCiAgICBieXRlYyA0OCAvLyAweDZkNjE3ODVmNjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MzY5N2E2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OS0xNjEKICAgIC8vIHNlbGYubWF4X2NvbW1pdHRlZV9zaXplID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX01BWF9DT01NSVRURUVfU0laRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2My0xNjQKICAgIC8vICMgQ291bnRlcnMKICAgIC8vIHNlbGYueGdvdnMgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfWEdPVlMpCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY1CiAgICAvLyBzZWxmLnBlbmRpbmdfcHJvcG9zYWxzID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1BFTkRJTkdfUFJPUE9TQUxTKQogICAgYnl0ZWMgOCAvLyAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY2CiAgICAvLyBzZWxmLnJlcXVlc3RfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUkVRVUVTVF9JRCkKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ1ZjY5NjQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NS01MwogICAgLy8gY2xhc3MgWEdvdlJlZ2lzdHJ5KAogICAgLy8gICAgIFhHb3ZSZWdpc3RyeUludGVyZmFjZSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICBwdXNoYnl0ZXMgMHg0OTU2YzFhYiAvLyBtZXRob2QgInVwZGF0ZV94Z292X3JlZ2lzdHJ5KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfeGdvdl9yZWdpc3RyeV9yb3V0ZUA0CgptYWluX3N3aXRjaF9jYXNlX25leHRANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1LTUzCiAgICAvLyBjbGFzcyBYR292UmVnaXN0cnkoCiAgICAvLyAgICAgWEdvdlJlZ2lzdHJ5SW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BANTMKICAgIHB1c2hieXRlc3MgMHg5NTljNDc2MiAweDZjMWY1NjRkIDB4ZTEwYTUxMmUgMHg4NmY3ZTBlNiAweDM5ZTI2ZDhhIDB4OTgzNTJlODYgMHhmYTRlZDZlMiAweGQ2YzljYzFhIDB4NWM0ODQwNTUgMHgzN2Q2YWRmMSAweGQ0MjE2YjZlIDB4YmE4NTIwZjIgMHgxNjc3YjMwZSAweDg0YjdkMjY4IDB4YWY3ZjE4NjAgMHhhMDgyY2VmOCAweGRmMzlmZGI5IDB4Y2EwZjZhM2EgMHg0NTA3NzM5MCAweDNjMzFiYzAyIDB4MGQyYzc4OTEgMHg5M2ZhY2RiYSAweGNlOGIzYTFjIDB4ZmFlYTA4MWYgMHgwZGEyNzg4NSAweDdhNGZlZTQzIDB4NTJkZDEwZDcgMHhkNGQzN2E2NCAweDM0MzQ5ZGNjIDB4MTU4ZjhkZDYgMHg1ZmUyNTkzNSAweGRiMjdiOWFmIDB4ZjU5MTA3NTYgMHg2NTYxMGE5ZiAweGZkYzY5NWMyIDB4YmE5MGFiNTQgMHgxYTY3NGI0NSAweGE4ZDVhZTk0IDB4NmFlNWViNDYgMHgyNzYzMGQ2NSAweDgyNGY5OGJjIDB4NDk1NDhiYTAgMHg4MjY3ODRmNiAweDI2OTgzMjAwIDB4ZGJkODNkZDkgLy8gbWV0aG9kICJpbml0X3Byb3Bvc2FsX2NvbnRyYWN0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJsb2FkX3Byb3Bvc2FsX2NvbnRyYWN0KHVpbnQ2NCxieXRlW10pdm9pZCIsIG1ldGhvZCAiZGVsZXRlX3Byb3Bvc2FsX2NvbnRyYWN0X2JveCgpdm9pZCIsIG1ldGhvZCAicGF1c2VfcmVnaXN0cnkoKXZvaWQiLCBtZXRob2QgInBhdXNlX3Byb3Bvc2Fscygpdm9pZCIsIG1ldGhvZCAicmVzdW1lX3JlZ2lzdHJ5KCl2b2lkIiwgbWV0aG9kICJyZXN1bWVfcHJvcG9zYWxzKCl2b2lkIiwgbWV0aG9kICJzZXRfeGdvdl9tYW5hZ2VyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3BheW9yKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfY291bmNpbChhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF94Z292X3N1YnNjcmliZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzZXRfa3ljX3Byb3ZpZGVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X2NvbW1pdHRlZV9tYW5hZ2VyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfZGFlbW9uKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiY29uZmlnX3hnb3ZfcmVnaXN0cnkoKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NFszXSx1aW50NjRbNF0sdWludDY0WzRdLHVpbnQ2NFszXSx1aW50NjRbM10sdWludDY0LHVpbnQ2NCx1aW50NjQpKXZvaWQiLCBtZXRob2QgInN1YnNjcmliZV94Z292KGFkZHJlc3MscGF5KXZvaWQiLCBtZXRob2QgInVuc3Vic2NyaWJlX3hnb3YoKXZvaWQiLCBtZXRob2QgInVuc3Vic2NyaWJlX2Fic2VudGVlKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAicmVxdWVzdF9zdWJzY3JpYmVfeGdvdihhZGRyZXNzLGFkZHJlc3MsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX3N1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWplY3Rfc3Vic2NyaWJlX3hnb3YodWludDY0KXZvaWQiLCBtZXRob2QgInJlcXVlc3RfdW5zdWJzY3JpYmVfeGdvdihhZGRyZXNzLGFkZHJlc3MsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX3Vuc3Vic2NyaWJlX3hnb3YodWludDY0KXZvaWQiLCBtZXRob2QgInJlamVjdF91bnN1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzZXRfdm90aW5nX2FjY291bnQoYWRkcmVzcyxhZGRyZXNzKXZvaWQiLCBtZXRob2QgInN1YnNjcmliZV9wcm9wb3NlcihwYXkpdm9pZCIsIG1ldGhvZCAic2V0X3Byb3Bvc2VyX2t5YyhhZGRyZXNzLGJvb2wsdWludDY0KXZvaWQiLCBtZXRob2QgImRlY2xhcmVfY29tbWl0dGVlKGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAib3Blbl9wcm9wb3NhbChwYXkpdWludDY0IiwgbWV0aG9kICJ2b3RlX3Byb3Bvc2FsKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAidW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbCh1aW50NjQsYWRkcmVzc1tdKXZvaWQiLCBtZXRob2QgInBheV9ncmFudF9wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZmluYWxpemVfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImRyb3BfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImRlcG9zaXRfZnVuZHMocGF5KXZvaWQiLCBtZXRob2QgIndpdGhkcmF3X2Z1bmRzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhd19hdmFpbGFibGVfZnVuZHModWludDY0KXZvaWQiLCBtZXRob2QgImdldF9hdmFpbGFibGVfZnVuZHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXRlKCkoYm9vbCxib29sLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0WzNdLHVpbnQ2NFs0XSx1aW50NjRbNF0sdWludDY0WzNdLHVpbnQ2NFszXSx1aW50NjQsdWludDY0LGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3Byb3Bvc2VyX2JveChhZGRyZXNzKSgoYm9vbCxib29sLHVpbnQ2NCksYm9vbCkiLCBtZXRob2QgImdldF9yZXF1ZXN0X2JveCh1aW50NjQpKChhZGRyZXNzLGFkZHJlc3MsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94KHVpbnQ2NCkoKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpLGJvb2wpIiwgbWV0aG9kICJpc19wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAib3BfdXAoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBpbml0X3Byb3Bvc2FsX2NvbnRyYWN0IGxvYWRfcHJvcG9zYWxfY29udHJhY3QgZGVsZXRlX3Byb3Bvc2FsX2NvbnRyYWN0X2JveCBwYXVzZV9yZWdpc3RyeSBwYXVzZV9wcm9wb3NhbHMgcmVzdW1lX3JlZ2lzdHJ5IHJlc3VtZV9wcm9wb3NhbHMgc2V0X3hnb3ZfbWFuYWdlciBzZXRfcGF5b3Igc2V0X3hnb3ZfY291bmNpbCBzZXRfeGdvdl9zdWJzY3JpYmVyIHNldF9reWNfcHJvdmlkZXIgc2V0X2NvbW1pdHRlZV9tYW5hZ2VyIHNldF94Z292X2RhZW1vbiBjb25maWdfeGdvdl9yZWdpc3RyeSBzdWJzY3JpYmVfeGdvdiB1bnN1YnNjcmliZV94Z292IHVuc3Vic2NyaWJlX2Fic2VudGVlIHJlcXVlc3Rfc3Vic2NyaWJlX3hnb3YgYXBwcm92ZV9zdWJzY3JpYmVfeGdvdiByZWplY3Rfc3Vic2NyaWJlX3hnb3YgcmVxdWVzdF91bnN1YnNjcmliZV94Z292IGFwcHJvdmVfdW5zdWJzY3JpYmVfeGdvdiByZWplY3RfdW5zdWJzY3JpYmVfeGdvdiBzZXRfdm90aW5nX2FjY291bnQgc3Vic2NyaWJlX3Byb3Bvc2VyIHNldF9wcm9wb3Nlcl9reWMgZGVjbGFyZV9jb21taXR0ZWUgb3Blbl9wcm9wb3NhbCB2b3RlX3Byb3Bvc2FsIHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWwgcGF5X2dyYW50X3Byb3Bvc2FsIGZpbmFsaXplX3Byb3Bvc2FsIGRyb3BfcHJvcG9zYWwgZGVwb3NpdF9mdW5kcyB3aXRoZHJhd19mdW5kcyB3aXRoZHJhd19hdmFpbGFibGVfZnVuZHMgZ2V0X2F2YWlsYWJsZV9mdW5kcyBnZXRfc3RhdGUgZ2V0X3hnb3ZfYm94IGdldF9wcm9wb3Nlcl9ib3ggZ2V0X3JlcXVlc3RfYm94IGdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveCBpc19wcm9wb3NhbCBtYWluX29wX3VwX3JvdXRlQDUxCiAgICBlcnIKCm1haW5fb3BfdXBfcm91dGVANTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfTm9PcEA1MzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1LTUzCiAgICAvLyBjbGFzcyBYR292UmVnaXN0cnkoCiAgICAvLyAgICAgWEdvdlJlZ2lzdHJ5SW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fdXBkYXRlX3hnb3ZfcmVnaXN0cnlfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQKICAgIGIgdXBkYXRlX3hnb3ZfcmVnaXN0cnkKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDE3CiAgICAvLyBzZWxmLnhnb3ZfbWFuYWdlci52YWx1ZSA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjIDcgLy8gMHg3ODY3NmY3NjVmNmQ2MTZlNjE2NzY1NzIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTIKICAgIC8vIHJldHVybiBUZW1wbGF0ZVZhcltCeXRlc10oImVudHJvcHkiKSAgIyB0cmljayB0byBhbGxvdyBmcmVzaCBkZXBsb3ltZW50CiAgICBieXRlYyA1NiAvLyBUTVBMX2VudHJvcHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxOAogICAgLy8gYXNzZXJ0IHNlbGYuZW50cm9weSgpID09IFRlbXBsYXRlVmFyW0J5dGVzXSgiZW50cm9weSIpCiAgICBkdXAKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmluaXRfcHJvcG9zYWxfY29udHJhY3Rbcm91dGluZ10oKSAtPiB2b2lkOgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDIwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDMyCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzNAogICAgLy8gaWYgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtOgogICAgYnl0ZWMgNSAvLyAweDcwNjEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogaW5pdF9wcm9wb3NhbF9jb250cmFjdF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDM1CiAgICAvLyBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0ucmVzaXplKHNpemUpCiAgICBieXRlYyA1IC8vIDB4NzA2MQogICAgc3dhcAogICAgYm94X3Jlc2l6ZQoKaW5pdF9wcm9wb3NhbF9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0MjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDM3LTQzOAogICAgLy8gIyBJbml0aWFsaXplIHRoZSBQcm9wb3NhbCBBcHByb3ZhbCBQcm9ncmFtIGNvbnRyYWN0CiAgICAvLyBfY3JlYXRlZCA9IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5jcmVhdGUoc2l6ZT1zaXplKQogICAgYnl0ZWMgNSAvLyAweDcwNjEKICAgIHN3YXAKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgYiBpbml0X3Byb3Bvc2FsX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5sb2FkX3Byb3Bvc2FsX2NvbnRyYWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKbG9hZF9wcm9wb3NhbF9jb250cmFjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDUzCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1NS00NTYKICAgIC8vICMgTG9hZCB0aGUgUHJvcG9zYWwgQXBwcm92YWwgUHJvZ3JhbSBjb250cmFjdAogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLnJlcGxhY2Uoc3RhcnRfaW5kZXg9b2Zmc2V0LCB2YWx1ZT1kYXRhKQogICAgYnl0ZWMgNSAvLyAweDcwNjEKICAgIGNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmRlbGV0ZV9wcm9wb3NhbF9jb250cmFjdF9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpkZWxldGVfcHJvcG9zYWxfY29udHJhY3RfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDY3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2OS00NzAKICAgIC8vICMgRGVsZXRlIHRoZSBQcm9wb3NhbCBBcHByb3ZhbCBQcm9ncmFtIGNvbnRyYWN0IGJveAogICAgLy8gZGVsIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS52YWx1ZQogICAgYnl0ZWMgNSAvLyAweDcwNjEKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDU4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5wYXVzZV9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnBhdXNlX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDc4CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3OQogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUgPSBUcnVlCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkucGF1c2VfcHJvcG9zYWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKcGF1c2VfcHJvcG9zYWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDg3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gc2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWMgMTAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0ODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlc3VtZV9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlc3VtZV9yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0OTcKICAgIC8vIHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlID0gRmFsc2UKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZXN1bWVfcHJvcG9zYWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVzdW1lX3Byb3Bvc2FsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwNQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1MDYKICAgIC8vIHNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSA9IEZhbHNlCiAgICBieXRlYyAxMCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X3hnb3ZfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1MDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyMAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1MjEKICAgIC8vIHNlbGYueGdvdl9tYW5hZ2VyLnZhbHVlID0gbWFuYWdlcgogICAgYnl0ZWMgNyAvLyAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X3BheW9yW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3BheW9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1MzUKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTM2CiAgICAvLyBzZWxmLnhnb3ZfcGF5b3IudmFsdWUgPSBwYXlvcgogICAgYnl0ZWMgOSAvLyAweDc4Njc2Zjc2NWY3MDYxNzk2ZjcyCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfeGdvdl9jb3VuY2lsW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3hnb3ZfY291bmNpbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTUwCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MQogICAgLy8gc2VsZi54Z292X2NvdW5jaWwudmFsdWUgPSBjb3VuY2lsCiAgICBieXRlYyAyNSAvLyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X3hnb3Zfc3Vic2NyaWJlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X3N1YnNjcmliZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2NQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1NjYKICAgIC8vIHNlbGYueGdvdl9zdWJzY3JpYmVyLnZhbHVlID0gc3Vic2NyaWJlcgogICAgYnl0ZWMgMTUgLy8gMHg3ODY3NmY3NjVmNzM3NTYyNzM2MzcyNjk2MjY1NzIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1NTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnNldF9reWNfcHJvdmlkZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfa3ljX3Byb3ZpZGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTY4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODAKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTgxCiAgICAvLyBzZWxmLmt5Y19wcm92aWRlci52YWx1ZSA9IHByb3ZpZGVyCiAgICBieXRlYyAxNiAvLyAweDZiNzk2MzVmNzA3MjZmNzY2OTY0NjU3MgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X2NvbW1pdHRlZV9tYW5hZ2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X2NvbW1pdHRlZV9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTUKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTk2CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tYW5hZ2VyLnZhbHVlID0gbWFuYWdlcgogICAgYnl0ZWMgMTcgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjE2ZTYxNjc2NTcyCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfeGdvdl9kYWVtb25bcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9kYWVtb246CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxMAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2MTEKICAgIC8vIHNlbGYueGdvdl9kYWVtb24udmFsdWUgPSB4Z292X2RhZW1vbgogICAgYnl0ZWMgMTggLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5jb25maWdfeGdvdl9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNvbmZpZ194Z292X3JlZ2lzdHJ5OgogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gNAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2MTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGludCAyMDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlhHb3ZSZWdpc3RyeUNvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjI1CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1NAogICAgLy8gY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfYm94X21iciBhbmQgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfcmVxdWVzdF9ib3hfbWJyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzA0LTMwNgogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIHB1c2hpbnQgMzgxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1NAogICAgLy8gY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfYm94X21iciBhbmQgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfcmVxdWVzdF9ib3hfbWJyCiAgICA+PQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUA0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwNC0zMDYKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAga2V5X3ByZWZpeF9sZW5ndGggKyBrZXlfdHlwZV9zaXplICsgdmFsdWVfdHlwZV9zaXplCiAgICAvLyApICogUEVSX0JZVEVfSU5fQk9YX01CUiArIFBFUl9CT1hfTUJSCiAgICBwdXNoaW50IDM0OTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NTQKICAgIC8vIGNvbmZpZy54Z292X2ZlZSA+PSB4Z292X2JveF9tYnIgYW5kIGNvbmZpZy54Z292X2ZlZSA+PSB4Z292X3JlcXVlc3RfYm94X21icgogICAgPj0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1My02NTUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfYm94X21iciBhbmQgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfcmVxdWVzdF9ib3hfbWJyCiAgICAvLyApLCBlcnIuSU5WQUxJRF9YR09WX0ZFRQogICAgYXNzZXJ0IC8vIEludmFsaWQgeEdvdiBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1NwogICAgLy8gYXNzZXJ0IGNvbmZpZy5wcm9wb3Nlcl9mZWUgPj0gcHJvcG9zZXJfYm94X21iciwgZXJyLklOVkFMSURfUFJPUE9TRVJfRkVFCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzA0LTMwNgogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIHB1c2hpbnQgMTkzMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1NwogICAgLy8gYXNzZXJ0IGNvbmZpZy5wcm9wb3Nlcl9mZWUgPj0gcHJvcG9zZXJfYm94X21iciwgZXJyLklOVkFMSURfUFJPUE9TRVJfRkVFCiAgICA+PQogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zZXIgZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjEKICAgIC8vIDwgY29uZmlnLm1pbl9yZXF1ZXN0ZWRfYW1vdW50CiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjAtNjYyCiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2MgogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIGRpZyAxCiAgICBleHRyYWN0IDQ4IDI0CiAgICBkdXAKICAgIGJ1cnkgMTkKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjEtNjYyCiAgICAvLyA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIGRpZyAxMwogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjYwLTY2MgogICAgLy8gMAogICAgLy8gPCBjb25maWcubWluX3JlcXVlc3RlZF9hbW91bnQKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjMKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICBkaWcgMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2Mi02NjMKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgaW50Y18zIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2MwogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMV0KICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2Mi02NjMKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgZGlnIDEyCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjEtNjYzCiAgICAvLyA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjQKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzJdCiAgICBkaWcgMTcKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjMtNjY0CiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMl0KICAgIGRpZyAxMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjYyLTY2NAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsyXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxMAogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NTktNjY1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIDAKICAgIC8vICAgICA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gICAgIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyAgICAgPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMV0KICAgIC8vICAgICA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsyXQogICAgLy8gKSwgZXJyLklOQ09OU0lTVEVOVF9SRVFVRVNURURfQU1PVU5UX0NPTkZJRwogICAgYXNzZXJ0IC8vIEluY29uc2lzdGVudCByZXF1ZXN0ZWQgYW1vdW50IGNvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjY4CiAgICAvLyBjb25maWcub3Blbl9wcm9wb3NhbF9mZWUsCiAgICBkaWcgMQogICAgZHVwCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjkKICAgIC8vIGNvbmZpZy5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLAogICAgZHVwCiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyODgKICAgIC8vIHJldHVybiBhbW91bnQgKiBmcmFjdGlvbl9pbl9icHMgLy8gQlBTCiAgICBkaWcgMgogICAgKgogICAgcHVzaGludCAxMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzMyCiAgICAvLyBVSW50NjQoTUFYX01CUl9QRVJfQVBQICsgTUFYX01CUl9QRVJfQk9YICsgQUNDT1VOVF9NQlIpICsgZGFlbW9uX29wc19mdW5kaW5nCiAgICBwdXNoaW50IDE2ODM1MzAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMzUKICAgIC8vIGFzc2VydCBvcGVuX3Byb3Bvc2FsX2ZlZSA+IHRvX3N1YnN0cmFjdCwgZXJyLklOVkFMSURfT1BFTl9QUk9QT1NBTF9GRUUKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIEludmFsaWQgb3BlbiBwcm9wb3NhbCBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzNwogICAgLy8gbWJyX2F2YWlsYWJsZV9mb3JfY29tbWl0dGVlID0gb3Blbl9wcm9wb3NhbF9mZWUgLSB0b19zdWJzdHJhY3QKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzA0LTMwNgogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIHB1c2hpbnQgMTg5MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzOQogICAgLy8gc2VsZi5tYXhfY29tbWl0dGVlX3NpemUudmFsdWUgPSBtYnJfYXZhaWxhYmxlX2Zvcl9jb21taXR0ZWUgLy8gdm90ZXJfbWJyCiAgICAvCiAgICBieXRlYyA0OCAvLyAweDZkNjE3ODVmNjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MzY5N2E2NQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3NQogICAgLy8gPCBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblswXQogICAgZXh0cmFjdCA3MiAzMgogICAgZHVwCiAgICBidXJ5IDE4CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njc0LTY3NgogICAgLy8gMAogICAgLy8gPCBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3NgogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIGRpZyAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njc1LTY3NgogICAgLy8gPCBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIGludGNfMyAvLyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzYKICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzFdCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzUtNjc2CiAgICAvLyA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgZGlnIDEwCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njc0LTY3NgogICAgLy8gMAogICAgLy8gPCBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY3NwogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMl0KICAgIGRpZyAxNgogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzYtNjc3CiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMl0KICAgIGRpZyA5CiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njc1LTY3NwogICAgLy8gPCBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzJdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzgKICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzNdCiAgICBkaWcgMTYKICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzctNjc4CiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsyXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bM10KICAgIGRpZyA4CiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njc2LTY3OAogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzJdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblszXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxNgogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzMtNjc5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIDAKICAgIC8vICAgICA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICAvLyAgICAgPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIC8vICAgICA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsyXQogICAgLy8gICAgIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzNdCiAgICAvLyApLCBlcnIuSU5DT05TSVNURU5UX0RJU0NVU1NJT05fRFVSQVRJT05fQ09ORklHCiAgICBhc3NlcnQgLy8gSW5jb25zaXN0ZW50IGRpc2N1c3Npb24gZHVyYXRpb24gY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODMKICAgIC8vIDwgY29uZmlnLnZvdGluZ19kdXJhdGlvblswXQogICAgZGlnIDEKICAgIGV4dHJhY3QgMTA0IDMyCiAgICBkdXAKICAgIGJ1cnkgMjIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4Mi02ODQKICAgIC8vIDAKICAgIC8vIDwgY29uZmlnLnZvdGluZ19kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAyMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njg0CiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICBkaWcgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4My02ODQKICAgIC8vIDwgY29uZmlnLnZvdGluZ19kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgaW50Y18zIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4NAogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODMtNjg0CiAgICAvLyA8IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMF0KICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMV0KICAgIGRpZyA3CiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjgyLTY4NAogICAgLy8gMAogICAgLy8gPCBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODUKICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMl0KICAgIGRpZyAyMAogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODQtNjg1CiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzJdCiAgICBkaWcgNgogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4My02ODUKICAgIC8vIDwgY29uZmlnLnZvdGluZ19kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsyXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAyMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njg2CiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzNdCiAgICBkaWcgMjAKICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODUtNjg2CiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzJdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzNdCiAgICBkaWcgNQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4NC02ODYKICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMV0KICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMl0KICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bM10KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMjIKICAgIGludGNfMSAvLyAxCgpjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX21lcmdlQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjgxLTY4NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICAwCiAgICAvLyAgICAgPCBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICAvLyAgICAgPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgLy8gICAgIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMl0KICAgIC8vICAgICA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzNdCiAgICAvLyApLCBlcnIuSU5DT05TSVNURU5UX1ZPVElOR19EVVJBVElPTl9DT05GSUcKICAgIGFzc2VydCAvLyBJbmNvbnNpc3RlbnQgdm90aW5nIGR1cmF0aW9uIGNvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjkxCiAgICAvLyA8IGNvbmZpZy5xdW9ydW1bMF0KICAgIGRpZyAxCiAgICBleHRyYWN0IDEzNiAyNAogICAgZHVwCiAgICBidXJ5IDIxCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTAtNjkxCiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy5xdW9ydW1bMF0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMjYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5Mi02OTMKICAgIC8vICMgUXVvcnVtIE1lZGl1bSBubyBsb25nZXIgdXNlZAogICAgLy8gPCBjb25maWcucXVvcnVtWzJdCiAgICBkaWcgMTkKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTEKICAgIC8vIDwgY29uZmlnLnF1b3J1bVswXQogICAgZGlnIDQKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5MC02OTEKICAgIC8vIDAKICAgIC8vIDwgY29uZmlnLnF1b3J1bVswXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAyNgogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMjc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2ODktNjk0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIDAKICAgIC8vICAgICA8IGNvbmZpZy5xdW9ydW1bMF0KICAgIC8vICAgICAjIFF1b3J1bSBNZWRpdW0gbm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICA8IGNvbmZpZy5xdW9ydW1bMl0KICAgIC8vICksIGVyci5JTkNPTlNJU1RFTlRfUVVPUlVNX0NPTkZJRwogICAgYXNzZXJ0IC8vIEluY29uc2lzdGVudCBxdW9ydW0gY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTgKICAgIC8vIDwgY29uZmlnLndlaWdodGVkX3F1b3J1bVswXQogICAgZGlnIDEKICAgIGV4dHJhY3QgMTYwIDI0CiAgICBkdXAKICAgIGJ1cnkgMjAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5Ny02OTgKICAgIC8vIDAKICAgIC8vIDwgY29uZmlnLndlaWdodGVkX3F1b3J1bVswXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAzMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njk5LTcwMAogICAgLy8gIyBXZWlnaHRlZCBRdW9ydW0gTWVkaXVtIG5vIGxvbmdlciB1c2VkCiAgICAvLyA8IGNvbmZpZy53ZWlnaHRlZF9xdW9ydW1bMl0KICAgIGRpZyAxOAogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5OAogICAgLy8gPCBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzBdCiAgICBkaWcgMwogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njk3LTY5OAogICAgLy8gMAogICAgLy8gPCBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzBdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDMwCiAgICBpbnRjXzEgLy8gMQoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9tZXJnZUAzMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5Ni03MDEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgMAogICAgLy8gICAgIDwgY29uZmlnLndlaWdodGVkX3F1b3J1bVswXQogICAgLy8gICAgICMgV2VpZ2h0ZWQgUXVvcnVtIE1lZGl1bSBubyBsb25nZXIgdXNlZAogICAgLy8gICAgIDwgY29uZmlnLndlaWdodGVkX3F1b3J1bVsyXQogICAgLy8gKSwgZXJyLklOQ09OU0lTVEVOVF9XRUlHSFRFRF9RVU9SVU1fQ09ORklHCiAgICBhc3NlcnQgLy8gSW5jb25zaXN0ZW50IHdlaWdodGVkIHF1b3J1bSBjb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwMwogICAgLy8gc2VsZi54Z292X2ZlZS52YWx1ZSA9IGNvbmZpZy54Z292X2ZlZQogICAgYnl0ZWMgMTkgLy8gMHg3ODY3NmY3NjVmNjY2NTY1CiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwNAogICAgLy8gc2VsZi5wcm9wb3Nlcl9mZWUudmFsdWUgPSBjb25maWcucHJvcG9zZXJfZmVlCiAgICBieXRlYyAyMCAvLyAweDcwNzI2ZjcwNmY3MzY1NzI1ZjY2NjU2NQogICAgZGlnIDE0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzA1CiAgICAvLyBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlID0gY29uZmlnLm9wZW5fcHJvcG9zYWxfZmVlCiAgICBieXRlYyAyMSAvLyAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUKICAgIGRpZyAxNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwNgogICAgLy8gc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlID0gY29uZmlnLmRhZW1vbl9vcHNfZnVuZGluZ19icHMKICAgIGJ5dGVjIDI2IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIGRpZyAxNgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwNwogICAgLy8gc2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2Jwcy52YWx1ZSA9IGNvbmZpZy5wcm9wb3NhbF9jb21taXRtZW50X2JwcwogICAgZGlnIDEKICAgIGR1cAogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgMjcgLy8gMHg3MDcyNmY3MDZmNzM2MTZjNWY2MzZmNmQ2ZDY5NzQ2ZDY1NmU3NDVmNjI3MDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzA5CiAgICAvLyBzZWxmLm1pbl9yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlID0gY29uZmlnLm1pbl9yZXF1ZXN0ZWRfYW1vdW50CiAgICBieXRlYyAyOCAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGRpZyAxNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMAogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbC52YWx1ZSA9IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFswXQogICAgZHVwCiAgICBleHRyYWN0IDQ4IDI0CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgMjkgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzExCiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bS52YWx1ZSA9IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTAtNzExCiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlID0gY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bS52YWx1ZSA9IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgaW50Y18zIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMQogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0udmFsdWUgPSBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMV0KICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzMCAvLyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZkNjU2NDY5NzU2ZAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMgogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSA9IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsyXQogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDMxIC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmM2MTcyNjc2NQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxNAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsLnZhbHVlID0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMF0KICAgIGJ5dGVjIDMyIC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGRpZyAxMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxNQogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bS52YWx1ZSA9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzFdCiAgICBkaWcgMTcKICAgIGR1cAogICAgaW50Y18zIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzMyAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTYKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZS52YWx1ZSA9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzJdCiAgICBkdXAKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzNCAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzE3CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlLnZhbHVlID0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bM10KICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzNSAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTkKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsLnZhbHVlID0gY29uZmlnLnZvdGluZ19kdXJhdGlvblswXQogICAgYnl0ZWMgMzYgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGRpZyA4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzIwCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUgPSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICBkaWcgMjEKICAgIGR1cAogICAgaW50Y18zIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzNyAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzIxCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZS52YWx1ZSA9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMl0KICAgIGR1cAogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDM4IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzIyCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UudmFsdWUgPSBjb25maWcudm90aW5nX2R1cmF0aW9uWzNdCiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgMzkgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyNAogICAgLy8gc2VsZi5xdW9ydW1fc21hbGwudmFsdWUgPSBjb25maWcucXVvcnVtWzBdCiAgICBieXRlYyA0MCAvLyAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgZGlnIDUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MjUKICAgIC8vIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSA9IFVJbnQ2NCgwKSAgIyBObyBsb25nZXIgdXNlZAogICAgYnl0ZWMgNDEgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MjYKICAgIC8vIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlID0gY29uZmlnLnF1b3J1bVsyXQogICAgZGlnIDIwCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgNDIgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MjgKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsLnZhbHVlID0gY29uZmlnLndlaWdodGVkX3F1b3J1bVswXQogICAgYnl0ZWMgNDMgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIGRpZyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzI5CiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0udmFsdWUgPSBVSW50NjQoMCkgICMgTm8gbG9uZ2VyIHVzZWQKICAgIGJ5dGVjIDQ0IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzMwCiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSA9IGNvbmZpZy53ZWlnaHRlZF9xdW9ydW1bMl0KICAgIGRpZyAxOQogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDQ1IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzMyCiAgICAvLyBzZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlID0gY29uZmlnLmFic2VuY2VfdG9sZXJhbmNlCiAgICBkdXAKICAgIHB1c2hpbnQgMTg0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgMjIgLy8gMHg2MTYyNzM2NTZlNjM2NTVmNzQ2ZjZjNjU3MjYxNmU2MzY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzMzCiAgICAvLyBzZWxmLmdvdmVybmFuY2VfcGVyaW9kLnZhbHVlID0gY29uZmlnLmdvdmVybmFuY2VfcGVyaW9kCiAgICBkdXAKICAgIHB1c2hpbnQgMTkyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgNDkgLy8gMHg2NzZmNzY2NTcyNmU2MTZlNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzM0CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUgPSBjb25maWcuY29tbWl0dGVlX2dyYWNlX3BlcmlvZAogICAgcHVzaGludCAyMDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyA1MCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjc3MjYxNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAzMDoKICAgIGludGNfMCAvLyAwCiAgICBiIGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMzEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMjY6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX21lcmdlQDI3Cgpjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDIyOgogICAgaW50Y18wIC8vIDAKICAgIGIgY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9tZXJnZUAyMwoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxNjoKICAgIGludGNfMCAvLyAwCiAgICBiIGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMTcKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMTA6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX21lcmdlQDExCgpjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudXBkYXRlX3hnb3ZfcmVnaXN0cnlbcm91dGluZ10oKSAtPiB2b2lkOgp1cGRhdGVfeGdvdl9yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0NQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjQKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI3CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18xIC8vIDB4NzgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2NQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmhhc194Z292X3N0YXR1cyhUeG4uc2VuZGVyKSwgZXJyLkFMUkVBRFlfWEdPVgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI3CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzY1CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKFR4bi5zZW5kZXIpLCBlcnIuQUxSRUFEWV9YR09WCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjYKICAgIC8vIGFzc2VydCBzZWxmLnZhbGlkX3hnb3ZfcGF5bWVudChwYXltZW50KSwgZXJyLklOVkFMSURfUEFZTUVOVAogICAgY2FsbHN1YiB2YWxpZF94Z292X3BheW1lbnQKICAgIGFzc2VydCAvLyBJbnZhbGlkIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2OQogICAgLy8geGdvdl9hZGRyZXNzPVR4bi5zZW5kZXIsIHZvdGluZ19hZGRyZXNzPXZvdGluZ19hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjgtNzcwCiAgICAvLyBzZWxmLnN1YnNjcmliZV94Z292X2FuZF9lbWl0KAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcz1UeG4uc2VuZGVyLCB2b3RpbmdfYWRkcmVzcz12b3RpbmdfYWRkcmVzcwogICAgLy8gKQogICAgc3dhcAogICAgY2FsbHN1YiBzdWJzY3JpYmVfeGdvdl9hbmRfZW1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzQ3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS51bnN1YnNjcmliZV94Z292W3JvdXRpbmddKCkgLT4gdm9pZDoKdW5zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4MgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzEgLy8gMHg3OAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzgzCiAgICAvLyBhc3NlcnQgc2VsZi5oYXNfeGdvdl9zdGF0dXMoVHhuLnNlbmRlciksIGVyci5OT1RfWEdPVgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI3CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzgzCiAgICAvLyBhc3NlcnQgc2VsZi5oYXNfeGdvdl9zdGF0dXMoVHhuLnNlbmRlciksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODUKICAgIC8vIHNlbGYudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdChUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiB1bnN1YnNjcmliZV94Z292X2FuZF9lbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnVuc3Vic2NyaWJlX2Fic2VudGVlW3JvdXRpbmddKCkgLT4gdm9pZDoKdW5zdWJzY3JpYmVfYWJzZW50ZWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwMgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzEgLy8gMHg3OAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwMwogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDQKICAgIC8vIGFzc2VydCBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udG9sZXJhdGVkX2Fic2VuY2VzID09IDAsIGVyci5VTkFVVEhPUklaRUQKICAgIGJveF9nZXQKICAgIHBvcAogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgIQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODA2CiAgICAvLyBzZWxmLnVuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQoeGdvdl9hZGRyZXNzKQogICAgY2FsbHN1YiB1bnN1YnNjcmliZV94Z292X2FuZF9lbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlcXVlc3Rfc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZXF1ZXN0X3N1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODMzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBvd25lcl9hZGRyZXNzLCBlcnIuVU5BVVRIT1JJWkVECiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMwogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzNAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzEgLy8gMHg3OAogICAgZGlnIDQKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzUKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfeGdvdl9zdGF0dXMoeGdvdl9hZGRyZXNzKSwgZXJyLkFMUkVBRFlfWEdPVgogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYW4geEdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODM2CiAgICAvLyBhc3NlcnQgc2VsZi52YWxpZF94Z292X3BheW1lbnQocGF5bWVudCksIGVyci5JTlZBTElEX1BBWU1FTlQKICAgIGNhbGxzdWIgdmFsaWRfeGdvdl9wYXltZW50CiAgICBhc3NlcnQgLy8gSW52YWxpZCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzgtODM5CiAgICAvLyAjIGNyZWF0ZSByZXF1ZXN0IGJveAogICAgLy8gcmlkID0gc2VsZi5yZXF1ZXN0X2lkLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gMHg3MjY1NzE3NTY1NzM3NDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcXVlc3RfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NDAtODQ0CiAgICAvLyBzZWxmLnJlcXVlc3RfYm94W3JpZF0gPSB0eXAuWEdvdlN1YnNjcmliZVJlcXVlc3RCb3hWYWx1ZSgKICAgIC8vICAgICB4Z292X2FkZHI9eGdvdl9hZGRyZXNzLAogICAgLy8gICAgIG93bmVyX2FkZHI9b3duZXJfYWRkcmVzcywKICAgIC8vICAgICByZWxhdGlvbl90eXBlPXJlbGF0aW9uX3R5cGUsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODQwCiAgICAvLyBzZWxmLnJlcXVlc3RfYm94W3JpZF0gPSB0eXAuWEdvdlN1YnNjcmliZVJlcXVlc3RCb3hWYWx1ZSgKICAgIGRpZyAxCiAgICBpdG9iCiAgICBieXRlYyAyMyAvLyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MC04NDQKICAgIC8vIHNlbGYucmVxdWVzdF9ib3hbcmlkXSA9IHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlKAogICAgLy8gICAgIHhnb3ZfYWRkcj14Z292X2FkZHJlc3MsCiAgICAvLyAgICAgb3duZXJfYWRkcj1vd25lcl9hZGRyZXNzLAogICAgLy8gICAgIHJlbGF0aW9uX3R5cGU9cmVsYXRpb25fdHlwZSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0Ni04NDcKICAgIC8vICMgaW5jcmVtZW50IHJlcXVlc3QgaWQKICAgIC8vIHNlbGYucmVxdWVzdF9pZC52YWx1ZSArPSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTIgLy8gMHg3MjY1NzE3NTY1NzM3NDVmNjk2NAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuYXBwcm92ZV9zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFwcHJvdmVfc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NjIKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODY0CiAgICAvLyB4Z292X2FkZHJlc3MgPSBzZWxmLnJlcXVlc3RfYm94W3JlcXVlc3RfaWRdLnhnb3ZfYWRkcgogICAgaXRvYgogICAgYnl0ZWMgMjMgLy8gMHg3MgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcXVlc3RfYm94IGVudHJ5IGV4aXN0cwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2NQogICAgLy8gdm90aW5nX2FkZHJlc3MgPSBzZWxmLnJlcXVlc3RfYm94W3JlcXVlc3RfaWRdLm93bmVyX2FkZHIKICAgIHN3YXAKICAgIGV4dHJhY3QgMzIgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMSAvLyAweDc4CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2NgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmhhc194Z292X3N0YXR1cyh4Z292X2FkZHJlc3MpLCBlcnIuQUxSRUFEWV9YR09WCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NjgtODcwCiAgICAvLyBzZWxmLnN1YnNjcmliZV94Z292X2FuZF9lbWl0KAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcz14Z292X2FkZHJlc3MsIHZvdGluZ19hZGRyZXNzPXZvdGluZ19hZGRyZXNzCiAgICAvLyApCiAgICBjYWxsc3ViIHN1YnNjcmliZV94Z292X2FuZF9lbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzItODczCiAgICAvLyAjIGRlbGV0ZSB0aGUgcmVxdWVzdAogICAgLy8gZGVsIHNlbGYucmVxdWVzdF9ib3hbcmVxdWVzdF9pZF0KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZWplY3Rfc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZWplY3Rfc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4ODcKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODg5LTg5MAogICAgLy8gIyBkZWxldGUgdGhlIHJlcXVlc3QKICAgIC8vIGRlbCBzZWxmLnJlcXVlc3RfYm94W3JlcXVlc3RfaWRdCiAgICBpdG9iCiAgICBieXRlYyAyMyAvLyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4OTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MTcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IG93bmVyX2FkZHJlc3MsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgIGRpZyAzCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTE4CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMSAvLyAweDc4CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxOQogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MjAKICAgIC8vIGFzc2VydCBzZWxmLnZhbGlkX3hnb3ZfcGF5bWVudChwYXltZW50KSwgZXJyLklOVkFMSURfUEFZTUVOVAogICAgY2FsbHN1YiB2YWxpZF94Z292X3BheW1lbnQKICAgIGFzc2VydCAvLyBJbnZhbGlkIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyMi05MjMKICAgIC8vICMgY3JlYXRlIHVuc3Vic2NyaWJlIHJlcXVlc3QgYm94CiAgICAvLyBydWlkID0gc2VsZi5yZXF1ZXN0X2lkLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gMHg3MjY1NzE3NTY1NzM3NDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJlcXVlc3RfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MjQtOTI4CiAgICAvLyBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3J1aWRdID0gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94VmFsdWUoCiAgICAvLyAgICAgeGdvdl9hZGRyPXhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBvd25lcl9hZGRyPW93bmVyX2FkZHJlc3MsCiAgICAvLyAgICAgcmVsYXRpb25fdHlwZT1yZWxhdGlvbl90eXBlLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyNAogICAgLy8gc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtydWlkXSA9IHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlKAogICAgZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDI0IC8vIDB4NzI3NQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MjQtOTI4CiAgICAvLyBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3J1aWRdID0gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94VmFsdWUoCiAgICAvLyAgICAgeGdvdl9hZGRyPXhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBvd25lcl9hZGRyPW93bmVyX2FkZHJlc3MsCiAgICAvLyAgICAgcmVsYXRpb25fdHlwZT1yZWxhdGlvbl90eXBlLAogICAgLy8gKQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTMwLTkzMQogICAgLy8gIyBpbmNyZW1lbnQgcmVxdWVzdCBpZAogICAgLy8gc2VsZi5yZXF1ZXN0X2lkLnZhbHVlICs9IDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMiAvLyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5hcHByb3ZlX3Vuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgphcHByb3ZlX3Vuc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NDYKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ4CiAgICAvLyB4Z292X2FkZHJlc3MgPSBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3JlcXVlc3RfaWRdLnhnb3ZfYWRkcgogICAgaXRvYgogICAgYnl0ZWMgMjQgLy8gMHg3Mjc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdF91bnN1YnNjcmliZV9ib3ggZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMSAvLyAweDc4CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0OQogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NTEKICAgIC8vIHNlbGYudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdCh4Z292X2FkZHJlc3MpCiAgICBjYWxsc3ViIHVuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1My05NTQKICAgIC8vICMgZGVsZXRlIHRoZSByZXF1ZXN0CiAgICAvLyBkZWwgc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtyZXF1ZXN0X2lkXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MzMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlamVjdF91bnN1YnNjcmliZV94Z292W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVqZWN0X3Vuc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NjgKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTcwLTk3MQogICAgLy8gIyBkZWxldGUgdGhlIHJlcXVlc3QKICAgIC8vIGRlbCBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3JlcXVlc3RfaWRdCiAgICBpdG9iCiAgICBieXRlYyAyNCAvLyAweDcyNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnNldF92b3RpbmdfYWNjb3VudFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF92b3RpbmdfYWNjb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5OTAKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI3CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18xIC8vIDB4NzgKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5OTEKICAgIC8vIGFzc2VydCBzZWxmLmhhc194Z292X3N0YXR1cyh4Z292X2FkZHJlc3MpLCBlcnIuTk9UX1hHT1YKICAgIGFzc2VydCAvLyBOb3QgYW4geEdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTkyCiAgICAvLyBhc3NlcnQgc2VsZi5jYWxsZXJfaXNfeGdvdl9vcl92b3RpbmdfYWRkcmVzcyh4Z292X2FkZHJlc3MpLCBlcnIuVU5BVVRIT1JJWkVECiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3MKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5NC05OTUKICAgIC8vICMgVXBkYXRlIHRoZSB2b3RpbmcgYWNjb3VudCBpbiB0aGUgeEdvdiBib3gKICAgIC8vIHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS52b3RpbmdfYWRkcmVzcyA9IHZvdGluZ19hZGRyZXNzCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTczCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zdWJzY3JpYmVfcHJvcG9zZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJzY3JpYmVfcHJvcG9zZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5OTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTEKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxMwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgbm90IGluIHNlbGYucHJvcG9zZXJfYm94LCBlcnIuQUxSRUFEWV9QUk9QT1NFUgogICAgYnl0ZWNfMyAvLyAweDcwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYSBwcm9wb3NlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxNgogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTQtMTAxNwogICAgLy8gIyBjaGVjayBmZWUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxOAogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IHNlbGYucHJvcG9zZXJfZmVlLnZhbHVlLCBlcnIuV1JPTkdfUEFZTUVOVF9BTU9VTlQKICAgIGd0eG5zIEFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vIDB4NzA3MjZmNzA2ZjczNjU3MjVmNjY2NTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXJfZmVlIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBwYXltZW50IGFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyMAogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbVHhuLnNlbmRlcl0gPSBzZWxmLm1ha2VfcHJvcG9zZXJfYm94KAogICAgYnl0ZWNfMyAvLyAweDcwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNS00MDkKICAgIC8vIHJldHVybiB0eXAuUHJvcG9zZXJCb3hWYWx1ZSgKICAgIC8vICAgICBhY3RpdmVfcHJvcG9zYWw9YWN0aXZlX3Byb3Bvc2FsLAogICAgLy8gICAgIGt5Y19zdGF0dXM9a3ljX3N0YXR1cywKICAgIC8vICAgICBreWNfZXhwaXJpbmc9a3ljX2V4cGlyaW5nLAogICAgLy8gKQogICAgYnl0ZWMgNTIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMjAtMTAyMgogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbVHhuLnNlbmRlcl0gPSBzZWxmLm1ha2VfcHJvcG9zZXJfYm94KAogICAgLy8gICAgIGFjdGl2ZV9wcm9wb3NhbD1GYWxzZSwga3ljX3N0YXR1cz1GYWxzZSwga3ljX2V4cGlyaW5nPVVJbnQ2NCgwKQogICAgLy8gKQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyNAogICAgLy8gYXJjNC5lbWl0KHR5cC5Qcm9wb3NlclN1YnNjcmliZWQocHJvcG9zZXI9VHhuLnNlbmRlciwgcm91bmQ9R2xvYmFsLnJvdW5kKSkKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxYWM0ZWRjZCAvLyBtZXRob2QgIlByb3Bvc2VyU3Vic2NyaWJlZChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTk3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfcHJvcG9zZXJfa3ljW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3Byb3Bvc2VyX2t5YzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDQ3LTEwNDgKICAgIC8vICMgY2hlY2sgaWYga3ljIHByb3ZpZGVyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmt5Y19wcm92aWRlci52YWx1ZSwgZXJyLlVOQVVUSE9SSVpFRAogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vIDB4NmI3OTYzNWY3MDcyNmY3NjY5NjQ2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYua3ljX3Byb3ZpZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDkKICAgIC8vIGFzc2VydCBwcm9wb3NlciBpbiBzZWxmLnByb3Bvc2VyX2JveCwgZXJyLlBST1BPU0VSX0RPRVNfTk9UX0VYSVNUCiAgICBieXRlY18zIC8vIDB4NzAKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zZXIgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTEKICAgIC8vIGFjdGl2ZV9wcm9wb3NhbCA9IHNlbGYucHJvcG9zZXJfYm94W3Byb3Bvc2VyXS5jb3B5KCkuYWN0aXZlX3Byb3Bvc2FsCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDA1LTQwOQogICAgLy8gcmV0dXJuIHR5cC5Qcm9wb3NlckJveFZhbHVlKAogICAgLy8gICAgIGFjdGl2ZV9wcm9wb3NhbD1hY3RpdmVfcHJvcG9zYWwsCiAgICAvLyAgICAga3ljX3N0YXR1cz1reWNfc3RhdHVzLAogICAgLy8gICAgIGt5Y19leHBpcmluZz1reWNfZXhwaXJpbmcsCiAgICAvLyApCiAgICBieXRlYyA2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgaW50Y18xIC8vIDEKICAgIHVuY292ZXIgNAogICAgc2V0Yml0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1My0xMDU3CiAgICAvLyBzZWxmLnByb3Bvc2VyX2JveFtwcm9wb3Nlcl0gPSBzZWxmLm1ha2VfcHJvcG9zZXJfYm94KAogICAgLy8gICAgIGFjdGl2ZV9wcm9wb3NhbD1hY3RpdmVfcHJvcG9zYWwsCiAgICAvLyAgICAga3ljX3N0YXR1cz1reWNfc3RhdHVzLAogICAgLy8gICAgIGt5Y19leHBpcmluZz1reWNfZXhwaXJpbmcsCiAgICAvLyApCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDYyCiAgICAvLyB2YWxpZF9reWM9Ym9vbChzZWxmLnZhbGlkX2t5Yyhwcm9wb3NlcikpLAogICAgZHVwCiAgICBjYWxsc3ViIHZhbGlkX2t5YwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2MwogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDYwLTEwNjQKICAgIC8vIHR5cC5Qcm9wb3NlcktZQygKICAgIC8vICAgICBwcm9wb3Nlcj1wcm9wb3NlciwKICAgIC8vICAgICB2YWxpZF9reWM9Ym9vbChzZWxmLnZhbGlkX2t5Yyhwcm9wb3NlcikpLAogICAgLy8gICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIGJ5dGVjIDYgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMwogICAgc2V0Yml0CiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDU5LTEwNjUKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICB0eXAuUHJvcG9zZXJLWUMoCiAgICAvLyAgICAgICAgIHByb3Bvc2VyPXByb3Bvc2VyLAogICAgLy8gICAgICAgICB2YWxpZF9reWM9Ym9vbChzZWxmLnZhbGlkX2t5Yyhwcm9wb3NlcikpLAogICAgLy8gICAgICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OWI1YWY3NjEgLy8gbWV0aG9kICJQcm9wb3NlcktZQyhhZGRyZXNzLGJvb2wsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDI2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5kZWNsYXJlX2NvbW1pdHRlZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlY2xhcmVfY29tbWl0dGVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI0CiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBzZWxmLmNvbW1pdHRlZV9tYW5hZ2VyLnZhbHVlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjE2ZTYxNjc2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21hbmFnZXIgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA4NwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9jb21taXR0ZWVfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDg5CiAgICAvLyBhc3NlcnQgc2l6ZSA+IDAsIGVyci5XUk9OR19DT01NSVRURUVfTUVNQkVSUwogICAgZGlnIDEKICAgIGFzc2VydCAvLyBXcm9uZyBDb21taXR0ZWUgTWVtYmVycwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5MAogICAgLy8gYXNzZXJ0IHZvdGVzID4gMCwgZXJyLldST05HX0NPTU1JVFRFRV9WT1RFUwogICAgZHVwCiAgICBhc3NlcnQgLy8gV3JvbmcgQ29tbWl0dGVlIFZvdGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDkxCiAgICAvLyBhc3NlcnQgc2l6ZSA8PSBzZWxmLm1heF9jb21taXR0ZWVfc2l6ZS52YWx1ZSwgZXJyLkNPTU1JVFRFRV9TSVpFX1RPT19MQVJHRQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ4IC8vIDB4NmQ2MTc4NWY2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjczNjk3YTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X2NvbW1pdHRlZV9zaXplIGV4aXN0cwogICAgZGlnIDIKICAgID49CiAgICBhc3NlcnQgLy8gQ29tbWl0dGVlIHNpemUgaXMgdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDkzCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9pZC52YWx1ZSA9IGNvbW1pdHRlZV9pZC5jb3B5KCkKICAgIGJ5dGVjIDUzIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgPSBzaXplCiAgICBieXRlYyA0NiAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGRpZyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5NQogICAgLy8gc2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUgPSB2b3RlcwogICAgYnl0ZWMgNDcgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5NgogICAgLy8gc2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUgPSBzZWxmLmdldF9jb21taXR0ZWVfYW5jaG9yKCkKICAgIGNhbGxzdWIgZ2V0X2NvbW1pdHRlZV9hbmNob3IKICAgIGJ5dGVjIDUxIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwMQogICAgLy8gc2l6ZT1hcmM0LlVJbnQzMihzaXplKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTAyCiAgICAvLyB2b3Rlcz1hcmM0LlVJbnQzMih2b3RlcyksCiAgICBzd2FwCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwMwogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDk5LTExMDQKICAgIC8vIHR5cC5OZXdDb21taXR0ZWUoCiAgICAvLyAgICAgY29tbWl0dGVlX2lkPWNvbW1pdHRlZV9pZCwKICAgIC8vICAgICBzaXplPWFyYzQuVUludDMyKHNpemUpLAogICAgLy8gICAgIHZvdGVzPWFyYzQuVUludDMyKHZvdGVzKSwKICAgIC8vICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDk4LTExMDUKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICB0eXAuTmV3Q29tbWl0dGVlKAogICAgLy8gICAgICAgICBjb21taXR0ZWVfaWQ9Y29tbWl0dGVlX2lkLAogICAgLy8gICAgICAgICBzaXplPWFyYzQuVUludDMyKHNpemUpLAogICAgLy8gICAgICAgICB2b3Rlcz1hcmM0LlVJbnQzMih2b3RlcyksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4NzliNTZhOSAvLyBtZXRob2QgIk5ld0NvbW1pdHRlZShieXRlWzMyXSx1aW50MzIsdWludDMyLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkub3Blbl9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm9wZW5fcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyOAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTI5CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSwgZXJyLlBBVVNFRF9QUk9QT1NBTFMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3Byb3Bvc2FscyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBDcmVhdGlvbiBvZiBwcm9wb3NhbHMgaXMgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTMxCiAgICAvLyBjb21taXR0ZWVfYW5jaG9yID0gc2VsZi5nZXRfY29tbWl0dGVlX2FuY2hvcigpCiAgICBjYWxsc3ViIGdldF9jb21taXR0ZWVfYW5jaG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTMyCiAgICAvLyBjb21taXR0ZWVfZGVsYXkgPSBHbG9iYWwucm91bmQgLSBjb21taXR0ZWVfYW5jaG9yCiAgICBnbG9iYWwgUm91bmQKICAgIGRpZyAxCiAgICAtCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTM0CiAgICAvLyBjb21taXR0ZWVfYW5jaG9yID09IHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNTEgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZjNjE3Mzc0NWY2MTZlNjM2ODZmNzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTEzNC0xMTM1CiAgICAvLyBjb21taXR0ZWVfYW5jaG9yID09IHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlCiAgICAvLyBvciBjb21taXR0ZWVfZGVsYXkgPD0gc2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kLnZhbHVlCiAgICBibnogb3Blbl9wcm9wb3NhbF9ib29sX3RydWVAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTEzNQogICAgLy8gb3IgY29tbWl0dGVlX2RlbGF5IDw9IHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2NzcyNjE2MzY1NWY3MDY1NzI2OTZmNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kIGV4aXN0cwogICAgZGlnIDEKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTM0LTExMzUKICAgIC8vIGNvbW1pdHRlZV9hbmNob3IgPT0gc2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUKICAgIC8vIG9yIGNvbW1pdHRlZV9kZWxheSA8PSBzZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUKICAgIGJ6IG9wZW5fcHJvcG9zYWxfYm9vbF9mYWxzZUA0CgpvcGVuX3Byb3Bvc2FsX2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18xIC8vIDEKCm9wZW5fcHJvcG9zYWxfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTEzMy0xMTM2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNvbW1pdHRlZV9hbmNob3IgPT0gc2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUKICAgIC8vICAgICBvciBjb21taXR0ZWVfZGVsYXkgPD0gc2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kLnZhbHVlCiAgICAvLyApLCBlcnIuQ09NTUlUVEVFX1NUQUxFCiAgICBhc3NlcnQgLy8gQ29tbWl0dGVlIGlzIHN0YWxlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTM4LTExMzkKICAgIC8vICMgQ2hlY2sgaWYgdGhlIGNhbGxlciBpcyBhIHJlZ2lzdGVyZWQgcHJvcG9zZXIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyIGluIHNlbGYucHJvcG9zZXJfYm94LCBlcnIuVU5BVVRIT1JJWkVECiAgICBieXRlY18zIC8vIDB4NzAKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTQxLTExNDIKICAgIC8vICMgQ2hlY2sgaWYgdGhlIHByb3Bvc2VyIGFscmVhZHkgaGFzIGFuIGFjdGl2ZSBwcm9wb3NhbAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnByb3Bvc2VyX2JveFsKICAgIGJ5dGVjXzMgLy8gMHg3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0MwogICAgLy8gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0MS0xMTQ0CiAgICAvLyAjIENoZWNrIGlmIHRoZSBwcm9wb3NlciBhbHJlYWR5IGhhcyBhbiBhY3RpdmUgcHJvcG9zYWwKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wcm9wb3Nlcl9ib3hbCiAgICAvLyAgICAgVHhuLnNlbmRlcgogICAgLy8gXS5hY3RpdmVfcHJvcG9zYWwsIGVyci5BTFJFQURZX0FDVElWRV9QUk9QT1NBTAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3Nlcl9ib3ggZW50cnkgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAhCiAgICBhc3NlcnQgLy8gUHJvcG9zZXIgYWxyZWFkeSBoYXMgYW4gYWN0aXZlIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTQ1CiAgICAvLyBhc3NlcnQgc2VsZi52YWxpZF9reWMoVHhuLnNlbmRlciksIGVyci5JTlZBTElEX0tZQwogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiB2YWxpZF9reWMKICAgIGFzc2VydCAvLyBJbnZhbGlkIEtZQwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0NwogICAgLy8gYXNzZXJ0IFR4bi5mZWUgPj0gKEdsb2JhbC5taW5fdHhuX2ZlZSAqIDMpLCBlcnIuSU5TVUZGSUNJRU5UX0ZFRQogICAgdHhuIEZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgcHVzaGludCAzCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNTEKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDEKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0OS0xMTUyCiAgICAvLyAjIEVuc3VyZSB0aGUgdHJhbnNhY3Rpb24gaGFzIHRoZSBjb3JyZWN0IHBheW1lbnQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1MwogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IHNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUsIGVyci5XUk9OR19QQVlNRU5UX0FNT1VOVAogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjEgLy8gMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBwYXltZW50IGFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1NQogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTU3CiAgICAvLyBhc3NlcnQgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLCBlcnIuTUlTU0lOR19QUk9QT1NBTF9BUFBST1ZBTF9QUk9HUkFNCiAgICBieXRlYyA1IC8vIDB4NzA2MQogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIE1pc3NpbmcgcHJvcG9zYWwgYXBwcm92YWwgcHJvZ3JhbQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2NwogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmxlbmd0aCArIGNvbXBpbGVkX2NsZWFyX3N0YXRlXzEubGVuZ3RoCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2NQogICAgLy8gYnl0ZXNfcGVyX3BhZ2UgPSBVSW50NjQoQllURVNfUEVSX0FQUF9QQUdFKQogICAgaW50YyA0IC8vIDIwNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNjkKICAgIC8vIHRvdGFsX3BhZ2VzID0gdG90YWxfc2l6ZSAvLyBieXRlc19wZXJfcGFnZQogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3MS0xMTc0CiAgICAvLyAjIFRoZSBmb2xsb3dpbmcgYXNzZXJ0aW9uIG1ha2VzIHN1cmUgdGhlIGxvb3AtdW5yb2xsaW5nIGlzIGNvbnNpc3RlbnQKICAgIC8vIGFzc2VydCB0b3RhbF9wYWdlcyA9PSBVSW50NjQoCiAgICAvLyAgICAgUFJPUE9TQUxfQVBQUk9WQUxfUEFHRVMKICAgIC8vICksIGVyci5JTlZBTElEX1BST1BPU0FMX0FQUFJPVkFMX1BST0dSQU1fU0laRQogICAgZHVwCiAgICBwdXNoaW50IDIKICAgID09CiAgICBhc3NlcnQgLy8gSW52YWxpZCBwcm9wb3NhbCBhcHByb3ZhbCBwcm9ncmFtIHNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzYKICAgIC8vIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5sZW5ndGggLSAodG90YWxfcGFnZXMgLSAxKSAqIGJ5dGVzX3Blcl9wYWdlCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTY1CiAgICAvLyBieXRlc19wZXJfcGFnZSA9IFVJbnQ2NChCWVRFU19QRVJfQVBQX1BBR0UpCiAgICBpbnRjIDQgLy8gMjA0OAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3NgogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmxlbmd0aCAtICh0b3RhbF9wYWdlcyAtIDEpICogYnl0ZXNfcGVyX3BhZ2UKICAgICoKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3OAogICAgLy8gcGFnZV8xID0gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoCiAgICBieXRlYyA1IC8vIDB4NzA2MQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3OQogICAgLy8gMCAqIGJ5dGVzX3Blcl9wYWdlLCBieXRlc19wZXJfcGFnZQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNjUKICAgIC8vIGJ5dGVzX3Blcl9wYWdlID0gVUludDY0KEJZVEVTX1BFUl9BUFBfUEFHRSkKICAgIGludGMgNCAvLyAyMDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTc4LTExODAKICAgIC8vIHBhZ2VfMSA9IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5leHRyYWN0KAogICAgLy8gICAgIDAgKiBieXRlc19wZXJfcGFnZSwgYnl0ZXNfcGVyX3BhZ2UKICAgIC8vICkKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTgxCiAgICAvLyBwYWdlXzIgPSBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0uZXh0cmFjdCgKICAgIGJ5dGVjIDUgLy8gMHg3MDYxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTY1CiAgICAvLyBieXRlc19wZXJfcGFnZSA9IFVJbnQ2NChCWVRFU19QRVJfQVBQX1BBR0UpCiAgICBpbnRjIDQgLy8gMjA0OAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE4MS0xMTgzCiAgICAvLyBwYWdlXzIgPSBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0uZXh0cmFjdCgKICAgIC8vICAgICAxICogYnl0ZXNfcGVyX3BhZ2UsIGJ5dGVzX2xhc3RfcGFnZQogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE4NS0xMTkzCiAgICAvLyB0eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwuY3JlYXRlLAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT0ocGFnZV8xLCBwYWdlXzIpLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29tcGlsZWRfY2xlYXJfc3RhdGVfMSwKICAgIC8vICAgICBnbG9iYWxfbnVtX3VpbnQ9cGNmZy5HTE9CQUxfVUlOVFMsCiAgICAvLyAgICAgZ2xvYmFsX251bV9ieXRlcz1wY2ZnLkdMT0JBTF9CWVRFUywKICAgIC8vICAgICBleHRyYV9wcm9ncmFtX3BhZ2VzPXRvdGFsX3BhZ2VzLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE4NwogICAgLy8gVHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBFeHRyYVByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5MQogICAgLy8gZ2xvYmFsX251bV9ieXRlcz1wY2ZnLkdMT0JBTF9CWVRFUywKICAgIHB1c2hpbnQgMwogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTAKICAgIC8vIGdsb2JhbF9udW1fdWludD1wY2ZnLkdMT0JBTF9VSU5UUywKICAgIHB1c2hpbnQgMjcKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1OS0xMTYzCiAgICAvLyAjIGNsZWFyX3N0YXRlX3Byb2dyYW0gaXMgYSB0dXBsZSBvZiAyIEJ5dGVzIGVsZW1lbnRzIHdoZXJlIGVhY2ggaXMgbWF4IDQwOTYgYnl0ZXMKICAgIC8vICMgd2Ugb25seSB1c2UgdGhlIGZpcnN0IGVsZW1lbnQgaGVyZSBhcyB3ZSBhc3N1bWUgdGhlIGNsZWFyIHN0YXRlIHByb2dyYW0gaXMgc21hbGwgZW5vdWdoCiAgICAvLyBjb21waWxlZF9jbGVhcl9zdGF0ZV8xLCBfY29tcGlsZWRfY2xlYXJfc3RhdGVfMiA9IGNvbXBpbGVfY29udHJhY3QoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwKICAgIC8vICkuY2xlYXJfc3RhdGVfcHJvZ3JhbQogICAgcHVzaGJ5dGVzIGJhc2U2NChDb0VCUXc9PSkKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW1QYWdlcwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTg2CiAgICAvLyBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5jcmVhdGUsCiAgICBwdXNoYnl0ZXMgMHhjYzY5NGVhYSAvLyBtZXRob2QgImNyZWF0ZShhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExODUtMTE5MwogICAgLy8gdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLmNyZWF0ZSwKICAgIC8vICAgICBUeG4uc2VuZGVyLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09KHBhZ2VfMSwgcGFnZV8yKSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbXBpbGVkX2NsZWFyX3N0YXRlXzEsCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXBjZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9cGNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgZXh0cmFfcHJvZ3JhbV9wYWdlcz10b3RhbF9wYWdlcywKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTk1CiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5Ny0xMjAyCiAgICAvLyAjIFRyYW5zZmVyIGZ1bmRzIHRvIHRoZSBuZXcgUHJvcG9zYWwgQXBwLCBleGNsdWRpbmcgdGhlIE1CUiBuZWVkZWQgZm9yIHRoZSBQcm9wb3NhbCBBcHAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj10eC5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1zZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlIC0gKG1icl9hZnRlciAtIG1icl9iZWZvcmUpLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5OQogICAgLy8gcmVjZWl2ZXI9dHguY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIGRpZyAxCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjAwCiAgICAvLyBhbW91bnQ9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSAtIChtYnJfYWZ0ZXIgLSBtYnJfYmVmb3JlKSwKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgLQogICAgdW5jb3ZlciAzCiAgICBzd2FwCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE5Ny0xMTk4CiAgICAvLyAjIFRyYW5zZmVyIGZ1bmRzIHRvIHRoZSBuZXcgUHJvcG9zYWwgQXBwLCBleGNsdWRpbmcgdGhlIE1CUiBuZWVkZWQgZm9yIHRoZSBQcm9wb3NhbCBBcHAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTk3LTEyMDIKICAgIC8vICMgVHJhbnNmZXIgZnVuZHMgdG8gdGhlIG5ldyBQcm9wb3NhbCBBcHAsIGV4Y2x1ZGluZyB0aGUgTUJSIG5lZWRlZCBmb3IgdGhlIFByb3Bvc2FsIEFwcAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXR4LmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PXNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUgLSAobWJyX2FmdGVyIC0gbWJyX2JlZm9yZSksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwNAogICAgLy8gc2VsZi5pbmNyZW1lbnRfcGVuZGluZ19wcm9wb3NhbHMoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MgogICAgLy8gc2VsZi5wZW5kaW5nX3Byb3Bvc2Fscy52YWx1ZSArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX3Byb3Bvc2FscyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA4IC8vIDB4NzA2NTZlNjQ2OTZlNjc1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MwogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbcHJvcG9zZXJdLmFjdGl2ZV9wcm9wb3NhbCA9IFRydWUKICAgIGJ5dGVjXzMgLy8gMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzEgLy8gMQogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDkKICAgIC8vIHByb3Bvc2VyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjEwCiAgICAvLyByb3VuZD1HbG9iYWwucm91bmQsCiAgICBnbG9iYWwgUm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDctMTIxMQogICAgLy8gdHlwLk5ld1Byb3Bvc2FsKAogICAgLy8gICAgIHByb3Bvc2FsX2lkPXR4LmNyZWF0ZWRfYXBwLmlkLAogICAgLy8gICAgIHByb3Bvc2VyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBkdXAKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwNi0xMjEyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgdHlwLk5ld1Byb3Bvc2FsKAogICAgLy8gICAgICAgICBwcm9wb3NhbF9pZD10eC5jcmVhdGVkX2FwcC5pZCwKICAgIC8vICAgICAgICAgcHJvcG9zZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDBkMWEwNTE5IC8vIG1ldGhvZCAiTmV3UHJvcG9zYWwodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm9wZW5fcHJvcG9zYWxfYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgb3Blbl9wcm9wb3NhbF9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjE2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjQ2CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDgtMTI0OQogICAgLy8gIyB2ZXJpZnkgcHJvcG9zYWxfaWQgaWQgaXMgZ2VudWluZSBwcm9wb3NhbAogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX3Byb3Bvc2FsKHByb3Bvc2FsX2lkKSwgZXJyLklOVkFMSURfUFJPUE9TQUwKICAgIGRpZyAzCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMSAvLyAweDc4CiAgICBkaWcgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI1MAogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjUxLTEyNTMKICAgIC8vIGFzc2VydCBzZWxmLmNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzKAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcwogICAgLy8gKSwgZXJyLk1VU1RfQkVfWEdPVl9PUl9WT1RJTkdfQUREUkVTUwogICAgZGlnIDMKICAgIGNhbGxzdWIgY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3MKICAgIGFzc2VydCAvLyBNdXN0IGJlIHhnb3Ygb3Igdm90aW5nIGFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTUtMTI1NgogICAgLy8gIyBVcG9uIHZvdGUgdGhlIGFic2VuY2UgdG9sZXJhbmNlIGlzIHJlc2V0CiAgICAvLyBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udG9sZXJhdGVkX2Fic2VuY2VzID0gc2VsZi5hYnNlbmNlX3RvbGVyYW5jZS52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIyIC8vIDB4NjE2MjczNjU2ZTYzNjU1Zjc0NmY2YzY1NzI2MTZlNjM2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFic2VuY2VfdG9sZXJhbmNlIGV4aXN0cwogICAgaXRvYgogICAgZGlnIDEKICAgIGludGNfMiAvLyAzMgogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI1NwogICAgLy8gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3NdLmxhc3Rfdm90ZV90aW1lc3RhbXAgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgcHVzaGludCA0MAogICAgc3dhcAogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTktMTI2NgogICAgLy8gIyBDYWxsIHRoZSBQcm9wb3NhbCBBcHAgdG8gcmVnaXN0ZXIgdGhlIHZvdGUKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnZvdGUsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcHJvdmFsX3ZvdGVzLAogICAgLy8gICAgIHJlamVjdGlvbl92b3RlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICB1bmNvdmVyIDMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2MQogICAgLy8gcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudm90ZSwKICAgIHB1c2hieXRlcyAweDE4NDFhMGQyIC8vIG1ldGhvZCAidm90ZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI1OS0xMjY2CiAgICAvLyAjIENhbGwgdGhlIFByb3Bvc2FsIEFwcCB0byByZWdpc3RlciB0aGUgdm90ZQogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudm90ZSwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2OAogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiB2b3RlX3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCnZvdGVfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2OAogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBieiB2b3RlX3Byb3Bvc2FsX2Vsc2VfYm9keUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2OQogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3MQogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWMgMTMgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjczCiAgICAvLyBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICBieXRlYyA1NCAvLyAiVm90ZXIgbm90IGZvdW5kIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3NQogICAgLy8gY2FzZSBlcnIuVk9URVNfSU5WQUxJRDoKICAgIHB1c2hieXRlc3MgIlZvdGVzIGludmFsaWQiICJWb3RpbmcgUGVyaW9kIEV4cGlyZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjcwLTEyODAKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIC8vICAgICAgICAgb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfTk9UX0ZPVU5EOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLlZPVEVSX05PVF9GT1VORCkKICAgIC8vICAgICBjYXNlIGVyci5WT1RFU19JTlZBTElEOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLlZPVEVTX0lOVkFMSUQpCiAgICAvLyAgICAgY2FzZSBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRCkKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIG9wLmVycigiVW5rbm93biBlcnJvciIpCiAgICB1bmNvdmVyIDQKICAgIG1hdGNoIHZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3IHZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA4IHZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMkA5IHZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfM0AxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4MAogICAgLy8gb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgp2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzNAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjc4CiAgICAvLyBvcC5lcnIoZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRCkKICAgIGVyciAvLyBWb3RpbmcgUGVyaW9kIEV4cGlyZWQKCnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMkA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3NgogICAgLy8gb3AuZXJyKGVyci5WT1RFU19JTlZBTElEKQogICAgZXJyIC8vIFZvdGVzIGludmFsaWQKCnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3NAogICAgLy8gb3AuZXJyKGVyci5WT1RFUl9OT1RfRk9VTkQpCiAgICBlcnIgLy8gVm90ZXIgbm90IGZvdW5kCgp2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzIKICAgIC8vIG9wLmVycihlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCnZvdGVfcHJvcG9zYWxfZWxzZV9ib2R5QDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4MgogICAgLy8gYXNzZXJ0IGVycm9yID09ICIiLCAiVW5rbm93biBlcnJvciIKICAgIGRpZyAxCiAgICBwdXNoYnl0ZXMgIiIKICAgID09CiAgICBhc3NlcnQgLy8gVW5rbm93biBlcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnZvdGVfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2OAogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBkaWcgMgogICAgZXh0cmFjdCA2IDQKICAgIGJ5dGVjIDE0IC8vICJFUlI6IgogICAgPT0KICAgIGIgdm90ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWw6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyODQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwMQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzAzLTEzMDQKICAgIC8vICMgVmVyaWZ5IHByb3Bvc2FsX2lkIGlzIGEgZ2VudWluZSBwcm9wb3NhbCBjcmVhdGVkIGJ5IHRoaXMgcmVnaXN0cnkKICAgIC8vIGFzc2VydCBzZWxmLl9pc19wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBkaWcgMQogICAgY2FsbHN1YiBfaXNfcHJvcG9zYWwKICAgIGFzc2VydCAvLyBJbnZhbGlkIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzA2LTEzMTMKICAgIC8vICMgVGhlIGBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXNgIGNhbGwgZ3VhcmFudGVlcyB0aGF0OgogICAgLy8gIyAtIEFueSBhYnNlbnRlZSBpbiB0aGUgYXJyYXkgaXMgcmVhbGx5IGFzc2lnbmVkIHRvIHRoZSBQcm9wb3NhbDsKICAgIC8vICMgLSBObyBhYnNlbnRlZSBpcyBkdXBsaWNhdGVkIGluIHRoZSBhcnJheS4KICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlcywKICAgIC8vICAgICBhYnNlbnRlZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzEwCiAgICAvLyBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXMsCiAgICBwdXNoYnl0ZXMgMHg3NmZmNGM3MCAvLyBtZXRob2QgInVuYXNzaWduX2Fic2VudGVlcyhhZGRyZXNzW10pc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzA2LTEzMTMKICAgIC8vICMgVGhlIGBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXNgIGNhbGwgZ3VhcmFudGVlcyB0aGF0OgogICAgLy8gIyAtIEFueSBhYnNlbnRlZSBpbiB0aGUgYXJyYXkgaXMgcmVhbGx5IGFzc2lnbmVkIHRvIHRoZSBQcm9wb3NhbDsKICAgIC8vICMgLSBObyBhYnNlbnRlZSBpcyBkdXBsaWNhdGVkIGluIHRoZSBhcnJheS4KICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlcywKICAgIC8vICAgICBhYnNlbnRlZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwbiAyCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGxlbgogICAgZHVwCiAgICBwdXNoaW50IDQKICAgIDwKICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0CiAgICBpbnRjXzAgLy8gMAoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfZWxzZV9ib2R5QDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzE2CiAgICAvLyBlcnJvcl93aXRob3V0X3ByZWZpeCA9IFN0cmluZy5mcm9tX2J5dGVzKGVycm9yLmJ5dGVzWzQ6XSkKICAgIHB1c2hpbnQgNAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgPj0KICAgIHB1c2hpbnQgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMwogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzE4CiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlYyAxMyAvLyAiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMjAKICAgIC8vIGNhc2UgZXJyLlZPVEVSX05PVF9GT1VORDoKICAgIGJ5dGVjIDU0IC8vICJWb3RlciBub3QgZm91bmQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzE3LTEzMjMKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIC8vICAgICAgICAgb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfTk9UX0ZPVU5EOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLlZPVEVSX05PVF9GT1VORCkKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIG9wLmVycigiVW5rbm93biBlcnJvciIpCiAgICB1bmNvdmVyIDIKICAgIG1hdGNoIHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3IHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzIzCiAgICAvLyBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMyMQogICAgLy8gb3AuZXJyKGVyci5WT1RFUl9OT1RfRk9VTkQpCiAgICBlcnIgLy8gVm90ZXIgbm90IGZvdW5kCgp1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTkKICAgIC8vIG9wLmVycihlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfZWxzZV9ib2R5QDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMyNQogICAgLy8gYXNzZXJ0IGVycm9yID09ICIiLCAiVW5rbm93biBlcnJvciIKICAgIGRpZyAxCiAgICBwdXNoYnl0ZXMgIiIKICAgID09CiAgICBhc3NlcnQgLy8gVW5rbm93biBlcnJvcgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNgoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9mb3JfaGVhZGVyQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMyNy0xMzMxCiAgICAvLyAjIOKaoO+4jyBXQVJOSU5HOiBUaGUgYWJzZW50ZWVzIGFycmF5OgogICAgLy8gIyAtIE1VU1QgaGF2ZSBvbmx5IGFic2VudGVlcyByZWFsbHkvc3RpbGwgYXNzaWduZWQgdG8gdGhlIFByb3Bvc2FsCiAgICAvLyAjIC0gTVVTVCBOT1QgaGF2ZSBkdXBsaWNhdGVzCiAgICAvLyAjIHdoaWNoIGlzIGd1YXJhbnRlZWQgYnkgdGhlIHByZXZpb3VzIEFCSSBjYWxsLgogICAgLy8gZm9yIGFic2VudGVlIGluIGFic2VudGVlczoKICAgIGRpZyA1CiAgICBkaWcgNAogICAgPAogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9hZnRlcl9mb3JAMjAKICAgIGRpZyA0CiAgICBleHRyYWN0IDIgMAogICAgZGlnIDYKICAgIGludGNfMiAvLyAzMgogICAgKgogICAgaW50Y18yIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgYnVyeSA5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzEgLy8gMHg3OAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgOAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzM0LTEzMzUKICAgIC8vIHNlbGYuaGFzX3hnb3Zfc3RhdHVzKGFic2VudGVlKQogICAgLy8gYW5kIHNlbGYueGdvdl9ib3hbYWJzZW50ZWVdLnRvbGVyYXRlZF9hYnNlbmNlcyA+IDAKICAgIGJ6IHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzNQogICAgLy8gYW5kIHNlbGYueGdvdl9ib3hbYWJzZW50ZWVdLnRvbGVyYXRlZF9hYnNlbmNlcyA+IDAKICAgIGRpZyA2CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2JveCBlbnRyeSBleGlzdHMKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzQtMTMzNQogICAgLy8gc2VsZi5oYXNfeGdvdl9zdGF0dXMoYWJzZW50ZWUpCiAgICAvLyBhbmQgc2VsZi54Z292X2JveFthYnNlbnRlZV0udG9sZXJhdGVkX2Fic2VuY2VzID4gMAogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDE4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzM3CiAgICAvLyBzZWxmLnhnb3ZfYm94W2Fic2VudGVlXS50b2xlcmF0ZWRfYWJzZW5jZXMgLT0gMQogICAgZGlnIDYKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9ib3ggZW50cnkgZXhpc3RzCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaXRvYgogICAgZGlnIDEKICAgIGludGNfMiAvLyAzMgogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzOAogICAgLy8gaWYgc2VsZi54Z292X2JveFthYnNlbnRlZV0udG9sZXJhdGVkX2Fic2VuY2VzID09IDA6CiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGludGNfMiAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGJueiB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzkKICAgIC8vIHNlbGYudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdChhYnNlbnRlZSkKICAgIGRpZyA3CiAgICBjYWxsc3ViIHVuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQKCnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxODoKICAgIGRpZyA1CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA2CiAgICBiIHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfZm9yX2hlYWRlckAxMgoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9hZnRlcl9mb3JAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjg0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGRpZyAyCiAgICBleHRyYWN0IDYgNAogICAgYnl0ZWMgMTQgLy8gIkVSUjoiCiAgICA9PQogICAgYiB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5wYXlfZ3JhbnRfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgpwYXlfZ3JhbnRfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1OS0xMzYwCiAgICAvLyAjIFZlcmlmeSB0aGUgY2FsbGVyIGlzIHRoZSB4R292IFBheW9yCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X3BheW9yKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9wYXlvcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2Mi0xMzYzCiAgICAvLyAjIFZlcmlmeSBwcm9wb3NhbF9pZCBpcyBhIGdlbnVpbmUgcHJvcG9zYWwgY3JlYXRlZCBieSB0aGlzIHJlZ2lzdHJ5CiAgICAvLyBhc3NlcnQgc2VsZi5faXNfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNjUtMTM2NgogICAgLy8gIyBSZWFkIHByb3Bvc2FsIHN0YXRlIGRpcmVjdGx5IGZyb20gdGhlIFByb3Bvc2FsIEFwcCdzIGdsb2JhbCBzdGF0ZQogICAgLy8gcHJvcG9zZXIgPSBzZWxmLmdldF9wcm9wb3NhbF9wcm9wb3Nlcihwcm9wb3NhbF9pZCkKICAgIGR1cAogICAgY2FsbHN1YiBnZXRfcHJvcG9zYWxfcHJvcG9zZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MS0yNTMKICAgIC8vIHJlcXVlc3RlZF9hbW91bnQsIHJlcXVlc3RlZF9hbW91bnRfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgcHJvcG9zYWwsIHBjZmcuR1NfS0VZX1JFUVVFU1RFRF9BTU9VTlQKICAgIC8vICkKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNTIKICAgIC8vIHByb3Bvc2FsLCBwY2ZnLkdTX0tFWV9SRVFVRVNURURfQU1PVU5UCiAgICBwdXNoYnl0ZXMgMHg3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjUxLTI1MwogICAgLy8gcmVxdWVzdGVkX2Ftb3VudCwgcmVxdWVzdGVkX2Ftb3VudF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBwcm9wb3NhbCwgcGNmZy5HU19LRVlfUkVRVUVTVEVEX0FNT1VOVAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NAogICAgLy8gYXNzZXJ0IHJlcXVlc3RlZF9hbW91bnRfZXhpc3RzLCBlcnIuTUlTU0lOR19LRVkKICAgIGFzc2VydCAvLyBNaXNzaW5nIGtleSBpbiBzdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2OQogICAgLy8gYXNzZXJ0IHByb3Bvc2VyIGluIHNlbGYucHJvcG9zZXJfYm94LCBlcnIuV1JPTkdfUFJPUE9TRVIKICAgIGJ5dGVjXzMgLy8gMHg3MAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gV3JvbmcgcHJvcG9zZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzEKICAgIC8vIGFzc2VydCBzZWxmLnZhbGlkX2t5Yyhwcm9wb3NlciksIGVyci5JTlZBTElEX0tZQwogICAgZGlnIDEKICAgIGNhbGxzdWIgdmFsaWRfa3ljCiAgICBhc3NlcnQgLy8gSW52YWxpZCBLWUMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzUKICAgIC8vIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMudmFsdWUgPj0gcmVxdWVzdGVkX2Ftb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICBkdXAKICAgIGRpZyAyCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3My0xMzc2CiAgICAvLyAjIFZlcmlmeSBzdWZmaWNpZW50IGZ1bmRzIGFyZSBhdmFpbGFibGUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSA+PSByZXF1ZXN0ZWRfYW1vdW50CiAgICAvLyApLCBlcnIuSU5TVUZGSUNJRU5UX1RSRUFTVVJZX0ZVTkRTCiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHRyZWFzdXJ5IGZ1bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjctMjY4CiAgICAvLyAjIFRyYW5zZmVyIHRoZSBmdW5kcyB0byB0aGUgcmVjZWl2ZXIKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1yZWNpcGllbnQsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3MC0yNzEKICAgIC8vICMgVXBkYXRlIHRoZSBvdXRzdGFuZGluZyBmdW5kcwogICAgLy8gc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSAtPSBhbW91bnQKICAgIHN3YXAKICAgIC0KICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4MAogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwocHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwuZnVuZCwgYXBwX2lkPXByb3Bvc2FsX2lkKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHg4YTVlNGM4MCAvLyBtZXRob2QgImZ1bmQoKXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXBuIDIKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODIKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogcGF5X2dyYW50X3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCnBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzgyCiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IHBheV9ncmFudF9wcm9wb3NhbF9lbHNlX2JvZHlAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4MwogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4NQogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWMgMTMgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzg0LTEzODgKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIC8vICAgICAgICAgb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICAvLyAgICAgY2FzZSBfOgogICAgLy8gICAgICAgICBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgc3dhcAogICAgbWF0Y2ggcGF5X2dyYW50X3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4OAogICAgLy8gb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgpwYXlfZ3JhbnRfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4NgogICAgLy8gb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKcGF5X2dyYW50X3Byb3Bvc2FsX2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5MAogICAgLy8gYXNzZXJ0IGVycm9yID09ICIiLCAiVW5rbm93biBlcnJvciIKICAgIGRpZyAxCiAgICBwdXNoYnl0ZXMgIiIKICAgID09CiAgICBhc3NlcnQgLy8gVW5rbm93biBlcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzgyCiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGRpZyAyCiAgICBleHRyYWN0IDYgNAogICAgYnl0ZWMgMTQgLy8gIkVSUjoiCiAgICA9PQogICAgYiBwYXlfZ3JhbnRfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmZpbmFsaXplX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKZmluYWxpemVfcHJvcG9zYWw6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzOQogICAgLy8gc3RhdHVzLCBzdGF0dXNfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIHBjZmcuR1NfS0VZX1NUQVRVUykKICAgIHB1c2hieXRlcyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNDAKICAgIC8vIGFzc2VydCBzdGF0dXNfZXhpc3RzLCBlcnIuTUlTU0lOR19LRVkKICAgIGFzc2VydCAvLyBNaXNzaW5nIGtleSBpbiBzdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwOC0xNDEwCiAgICAvLyBpZiBwcm9wb3NhbF9zdGF0dXMgPT0gVUludDY0KHBlbm0uU1RBVFVTX0VNUFRZKSBvciBwcm9wb3NhbF9zdGF0dXMgPT0gVUludDY0KAogICAgLy8gICAgIHBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyApOgogICAgYnogZmluYWxpemVfcHJvcG9zYWxfaWZfYm9keUAzCiAgICBkdXAKICAgIHB1c2hpbnQgMTAKICAgID09CiAgICBieiBmaW5hbGl6ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDQKCmZpbmFsaXplX3Byb3Bvc2FsX2lmX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9kYWVtb24udmFsdWUsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOCAvLyAweDc4Njc2Zjc2NWY2NDYxNjU2ZDZmNmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2RhZW1vbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCgpmaW5hbGl6ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDEzLTE0MTQKICAgIC8vICMgVmVyaWZ5IHByb3Bvc2FsX2lkIGlzIGEgZ2VudWluZSBwcm9wb3NhbCBjcmVhdGVkIGJ5IHRoaXMgcmVnaXN0cnkKICAgIC8vIGFzc2VydCBzZWxmLl9pc19wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBkaWcgMQogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTYtMTQxOAogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwuZmluYWxpemUsIGFwcF9pZD1wcm9wb3NhbF9pZAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDE3CiAgICAvLyBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZSwgYXBwX2lkPXByb3Bvc2FsX2lkCiAgICBwdXNoYnl0ZXMgMHg4MDIwNjliNCAvLyBtZXRob2QgImZpbmFsaXplKClzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxNi0xNDE4CiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZSwgYXBwX2lkPXByb3Bvc2FsX2lkCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGJ1cnkgNgogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MjAKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIGJ1cnkgNAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDcKICAgIGludGNfMCAvLyAwCgpmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDIwCiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IGZpbmFsaXplX3Byb3Bvc2FsX2Vsc2VfYm9keUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyMQogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDUKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyMwogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWMgMTMgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDI1CiAgICAvLyBjYXNlIGVyci5WT1RFUlNfQVNTSUdORUQ6CiAgICBwdXNoYnl0ZXMgIlRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MjItMTQyOAogICAgLy8gbWF0Y2ggZXJyb3Jfd2l0aG91dF9wcmVmaXg6CiAgICAvLyAgICAgY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUlNfQVNTSUdORUQ6CiAgICAvLyAgICAgICAgIG9wLmVycihlcnIuVk9URVJTX0FTU0lHTkVEKQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIHVuY292ZXIgMgogICAgbWF0Y2ggZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEAxMCBmaW5hbGl6ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8xQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDI4CiAgICAvLyBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCmZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDI2CiAgICAvLyBvcC5lcnIoZXJyLlZPVEVSU19BU1NJR05FRCkKICAgIGVyciAvLyBUaGVyZSBhcmUgdm90ZXJzIGFzc2lnbmVkIHRvIHRoaXMgcHJvcG9zYWwKCmZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDI0CiAgICAvLyBvcC5lcnIoZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIGVyciAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCgpmaW5hbGl6ZV9wcm9wb3NhbF9lbHNlX2JvZHlAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDMwCiAgICAvLyBhc3NlcnQgZXJyb3IgPT0gIiIsICJVbmtub3duIGVycm9yIgogICAgZGlnIDMKICAgIHB1c2hieXRlcyAiIgogICAgPT0KICAgIGFzc2VydCAvLyBVbmtub3duIGVycm9yCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDMyCiAgICAvLyBzZWxmLmRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2Fscyhwcm9wb3NhbF9pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIGRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2FscwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmZpbmFsaXplX3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MjAKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDQKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlYyAxNCAvLyAiRVJSOiIKICAgID09CiAgICBiIGZpbmFsaXplX3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5kcm9wX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKZHJvcF9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDkKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1MS0xNDUyCiAgICAvLyAjIFZlcmlmeSBwcm9wb3NhbF9pZCBpcyBhIGdlbnVpbmUgcHJvcG9zYWwgY3JlYXRlZCBieSB0aGlzIHJlZ2lzdHJ5CiAgICAvLyBhc3NlcnQgc2VsZi5faXNfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NTQKICAgIC8vIHByb3Bvc2VyID0gc2VsZi5nZXRfcHJvcG9zYWxfcHJvcG9zZXIocHJvcG9zYWxfaWQpCiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDU1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBwcm9wb3NlciwgZXJyLlVOQVVUSE9SSVpFRAogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NTcKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLmRyb3AsIGFwcF9pZD1wcm9wb3NhbF9pZCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGJ5dGVzIDB4NzM3MTMyMWEgLy8gbWV0aG9kICJkcm9wKClzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwbiAyCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDU5CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGxlbgogICAgZHVwCiAgICBwdXNoaW50IDQKICAgIDwKICAgIGJ6IGRyb3BfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0CiAgICBpbnRjXzAgLy8gMAoKZHJvcF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDU5CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IGRyb3BfcHJvcG9zYWxfZWxzZV9ib2R5QDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjAKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAzCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjIKICAgIC8vIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIGJ5dGVjIDEzIC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2MS0xNDY1CiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIG9wLmVycihlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIHN3YXAKICAgIG1hdGNoIGRyb3BfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDY1CiAgICAvLyBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCmRyb3BfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2MwogICAgLy8gb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKZHJvcF9wcm9wb3NhbF9lbHNlX2JvZHlAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjcKICAgIC8vIGFzc2VydCBlcnJvciA9PSAiIiwgIlVua25vd24gZXJyb3IiCiAgICBkaWcgMQogICAgcHVzaGJ5dGVzICIiCiAgICA9PQogICAgYXNzZXJ0IC8vIFVua25vd24gZXJyb3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjkKICAgIC8vIHNlbGYuZGVjcmVtZW50X3BlbmRpbmdfcHJvcG9zYWxzKHByb3Bvc2FsX2lkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgZGVjcmVtZW50X3BlbmRpbmdfcHJvcG9zYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDM0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZHJvcF9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDU5CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGRpZyAyCiAgICBleHRyYWN0IDYgNAogICAgYnl0ZWMgMTQgLy8gIkVSUjoiCiAgICA9PQogICAgYiBkcm9wX3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5kZXBvc2l0X2Z1bmRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVwb3NpdF9mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0ODQKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDgzLTE0ODUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCBlcnIuV1JPTkdfUkVDRUlWRVIKICAgIGFzc2VydCAvLyBXcm9uZyBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ4NgogICAgLy8gc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSArPSBwYXltZW50LmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICBzd2FwCiAgICBndHhucyBBbW91bnQKICAgICsKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ3MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkud2l0aGRyYXdfZnVuZHNbcm91dGluZ10oKSAtPiB2b2lkOgp3aXRoZHJhd19mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0ODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTAyCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MDMKICAgIC8vIGFzc2VydCBhbW91bnQgPD0gc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSwgZXJyLklOU1VGRklDSUVOVF9GVU5EUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICBkdXAyCiAgICA8PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwNAogICAgLy8gYXNzZXJ0IFR4bi5mZWUgPj0gKEdsb2JhbC5taW5fdHhuX2ZlZSAqIDIpLCBlcnIuSU5TVUZGSUNJRU5UX0ZFRQogICAgdHhuIEZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgcHVzaGludCAyCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MDUKICAgIC8vIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMudmFsdWUgLT0gYW1vdW50CiAgICBkaWcgMQogICAgLQogICAgYnl0ZWMgNCAvLyAweDZmNzU3NDczNzQ2MTZlNjQ2OTZlNjc1ZjY2NzU2ZTY0NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTA3LTE1MTEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnhnb3ZfbWFuYWdlci52YWx1ZSwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwOAogICAgLy8gcmVjZWl2ZXI9c2VsZi54Z292X21hbmFnZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfbWFuYWdlciBleGlzdHMKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTA3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTEwCiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwNy0xNTExCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi54Z292X21hbmFnZXIudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS53aXRoZHJhd19hdmFpbGFibGVfZnVuZHNbcm91dGluZ10oKSAtPiB2b2lkOgp3aXRoZHJhd19hdmFpbGFibGVfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUyNwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9wYXlvcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfcGF5b3IKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MjgKICAgIC8vIGFzc2VydCBUeG4uZmVlID49IChHbG9iYWwubWluX3R4bl9mZWUgKiAyKSwgZXJyLklOU1VGRklDSUVOVF9GRUUKICAgIHR4biBGZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIHB1c2hpbnQgMgogICAgKgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTI5CiAgICAvLyBhc3NlcnQgYW1vdW50IDw9IHNlbGYuY29tcHV0ZV9hdmFpbGFibGVfZnVuZHMoKSwgZXJyLklOU1VGRklDSUVOVF9GVU5EUwogICAgY2FsbHN1YiBjb21wdXRlX2F2YWlsYWJsZV9mdW5kcwogICAgZGlnIDEKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IGZ1bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTMwLTE1MzQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnhnb3ZfcGF5b3IudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzEKICAgIC8vIHJlY2VpdmVyPXNlbGYueGdvdl9wYXlvci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4Nzg2NzZmNzY1ZjcwNjE3OTZmNzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X3BheW9yIGV4aXN0cwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzMKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTMwLTE1MzQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnhnb3ZfcGF5b3IudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTEzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfYXZhaWxhYmxlX2Z1bmRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2F2YWlsYWJsZV9mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NDcKICAgIC8vIHJldHVybiBzZWxmLmNvbXB1dGVfYXZhaWxhYmxlX2Z1bmRzKCkKICAgIGNhbGxzdWIgY29tcHV0ZV9hdmFpbGFibGVfZnVuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfc3RhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTU2CiAgICAvLyBwYXVzZWRfcmVnaXN0cnk9c2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NTcKICAgIC8vIHBhdXNlZF9wcm9wb3NhbHM9c2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vIDB4NzA2MTc1NzM2NTY0NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcHJvcG9zYWxzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1OAogICAgLy8geGdvdl9tYW5hZ2VyPXNlbGYueGdvdl9tYW5hZ2VyLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg3ODY3NmY3NjVmNmQ2MTZlNjE2NzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X21hbmFnZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTU5CiAgICAvLyB4Z292X3BheW9yPXNlbGYueGdvdl9wYXlvci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vIDB4Nzg2NzZmNzY1ZjcwNjE3OTZmNzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X3BheW9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2MAogICAgLy8geGdvdl9jb3VuY2lsPXNlbGYueGdvdl9jb3VuY2lsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI1IC8vIDB4Nzg2NzZmNzY1ZjYzNmY3NTZlNjM2OTZjCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9jb3VuY2lsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2MQogICAgLy8geGdvdl9zdWJzY3JpYmVyPXNlbGYueGdvdl9zdWJzY3JpYmVyLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4Nzg2NzZmNzY1ZjczNzU2MjczNjM3MjY5NjI2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9zdWJzY3JpYmVyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2MgogICAgLy8ga3ljX3Byb3ZpZGVyPXNlbGYua3ljX3Byb3ZpZGVyLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vIDB4NmI3OTYzNWY3MDcyNmY3NjY5NjQ2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYua3ljX3Byb3ZpZGVyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2MwogICAgLy8gY29tbWl0dGVlX21hbmFnZXI9c2VsZi5jb21taXR0ZWVfbWFuYWdlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNyAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2MTZlNjE2NzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWFuYWdlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NjQKICAgIC8vIHhnb3ZfZGFlbW9uPXNlbGYueGdvdl9kYWVtb24udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTggLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9kYWVtb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTY1CiAgICAvLyB4Z292X2ZlZT1zZWxmLnhnb3ZfZmVlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vIDB4Nzg2NzZmNzY1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfZmVlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2NgogICAgLy8gcHJvcG9zZXJfZmVlPXNlbGYucHJvcG9zZXJfZmVlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vIDB4NzA3MjZmNzA2ZjczNjU3MjVmNjY2NTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXJfZmVlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2NwogICAgLy8gb3Blbl9wcm9wb3NhbF9mZWU9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NjgKICAgIC8vIGRhZW1vbl9vcHNfZnVuZGluZ19icHM9c2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI2IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU2OQogICAgLy8gcHJvcG9zYWxfY29tbWl0bWVudF9icHM9c2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2Jwcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNyAvLyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2JwcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NzAKICAgIC8vIG1pbl9yZXF1ZXN0ZWRfYW1vdW50PXNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjggLy8gMHg2ZDY5NmU1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTczCiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI5IC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU3NAogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzAgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTc1CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMxIC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU3MS0xNTc3CiAgICAvLyBtYXhfcmVxdWVzdGVkX2Ftb3VudD1GaXhlZEFycmF5KAogICAgLy8gICAgICgKICAgIC8vICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU4MAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMyIC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU4MQogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMyAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1ODIKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNCAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1ODMKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzUgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTc4LTE1ODUKICAgIC8vIGRpc2N1c3Npb25fZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTg4CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNiAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1ODkKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNyAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uX21lZGl1bSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OTAKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM4IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5MQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM5IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU4Ni0xNTkzCiAgICAvLyB2b3RpbmdfZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OTYKICAgIC8vIHNlbGYucXVvcnVtX3NtYWxsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQwIC8vIDB4NzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtX3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5NwogICAgLy8gc2VsZi5xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQxIC8vIDB4NzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdW9ydW1fbWVkaXVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5OAogICAgLy8gc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDIgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdW9ydW1fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTk0LTE2MDAKICAgIC8vIHF1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICgKICAgIC8vICAgICAgICAgc2VsZi5xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwMwogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDMgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjA0CiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDQgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjA1CiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0NSAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MDEtMTYwNwogICAgLy8gd2VpZ2h0ZWRfcXVvcnVtPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgKAogICAgLy8gICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgLy8gICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIC8vICAgICApCiAgICAvLyApLAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjA4CiAgICAvLyBvdXRzdGFuZGluZ19mdW5kcz1zZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjA5CiAgICAvLyBwZW5kaW5nX3Byb3Bvc2Fscz1zZWxmLnBlbmRpbmdfcHJvcG9zYWxzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gMHg3MDY1NmU2NDY5NmU2NzVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVuZGluZ19wcm9wb3NhbHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjEwCiAgICAvLyBjb21taXR0ZWVfaWQ9c2VsZi5jb21taXR0ZWVfaWQudmFsdWUuY29weSgpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUzIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYxMQogICAgLy8gY29tbWl0dGVlX21lbWJlcnM9c2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0NiAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWVtYmVycyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MTIKICAgIC8vIGNvbW1pdHRlZV92b3Rlcz1zZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0NyAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV92b3RlcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MTMKICAgIC8vIGFic2VuY2VfdG9sZXJhbmNlPXNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gMHg2MTYyNzM2NTZlNjM2NTVmNzQ2ZjZjNjU3MjYxNmU2MzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWJzZW5jZV90b2xlcmFuY2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjE0CiAgICAvLyBnb3Zlcm5hbmNlX3BlcmlvZD1zZWxmLmdvdmVybmFuY2VfcGVyaW9kLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ5IC8vIDB4Njc2Zjc2NjU3MjZlNjE2ZTYzNjU1ZjcwNjU3MjY5NmY2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvdmVybmFuY2VfcGVyaW9kIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYxNQogICAgLy8gY29tbWl0dGVlX2dyYWNlX3BlcmlvZD1zZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNTAgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY3NzI2MTYzNjU1ZjcwNjU3MjY5NmY2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjE2CiAgICAvLyBjb21taXR0ZWVfbGFzdF9hbmNob3I9c2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNTEgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZjNjE3Mzc0NWY2MTZlNjM2ODZmNzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTU1LTE2MTcKICAgIC8vIHJldHVybiB0eXAuVHlwZWRHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBwYXVzZWRfcmVnaXN0cnk9c2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsCiAgICAvLyAgICAgcGF1c2VkX3Byb3Bvc2Fscz1zZWxmLnBhdXNlZF9wcm9wb3NhbHMudmFsdWUsCiAgICAvLyAgICAgeGdvdl9tYW5hZ2VyPXNlbGYueGdvdl9tYW5hZ2VyLnZhbHVlLAogICAgLy8gICAgIHhnb3ZfcGF5b3I9c2VsZi54Z292X3BheW9yLnZhbHVlLAogICAgLy8gICAgIHhnb3ZfY291bmNpbD1zZWxmLnhnb3ZfY291bmNpbC52YWx1ZSwKICAgIC8vICAgICB4Z292X3N1YnNjcmliZXI9c2VsZi54Z292X3N1YnNjcmliZXIudmFsdWUsCiAgICAvLyAgICAga3ljX3Byb3ZpZGVyPXNlbGYua3ljX3Byb3ZpZGVyLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9tYW5hZ2VyPXNlbGYuY29tbWl0dGVlX21hbmFnZXIudmFsdWUsCiAgICAvLyAgICAgeGdvdl9kYWVtb249c2VsZi54Z292X2RhZW1vbi52YWx1ZSwKICAgIC8vICAgICB4Z292X2ZlZT1zZWxmLnhnb3ZfZmVlLnZhbHVlLAogICAgLy8gICAgIHByb3Bvc2VyX2ZlZT1zZWxmLnByb3Bvc2VyX2ZlZS52YWx1ZSwKICAgIC8vICAgICBvcGVuX3Byb3Bvc2FsX2ZlZT1zZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlLAogICAgLy8gICAgIGRhZW1vbl9vcHNfZnVuZGluZ19icHM9c2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlLAogICAgLy8gICAgIHByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzPXNlbGYucHJvcG9zYWxfY29tbWl0bWVudF9icHMudmFsdWUsCiAgICAvLyAgICAgbWluX3JlcXVlc3RlZF9hbW91bnQ9c2VsZi5taW5fcmVxdWVzdGVkX2Ftb3VudC52YWx1ZSwKICAgIC8vICAgICBtYXhfcmVxdWVzdGVkX2Ftb3VudD1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBkaXNjdXNzaW9uX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICB2b3RpbmdfZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgcXVvcnVtPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgLy8gICAgICAgICAgICAgc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIHdlaWdodGVkX3F1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBvdXRzdGFuZGluZ19mdW5kcz1zZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlLAogICAgLy8gICAgIHBlbmRpbmdfcHJvcG9zYWxzPXNlbGYucGVuZGluZ19wcm9wb3NhbHMudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX2lkPXNlbGYuY29tbWl0dGVlX2lkLnZhbHVlLmNvcHkoKSwKICAgIC8vICAgICBjb21taXR0ZWVfbWVtYmVycz1zZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV92b3Rlcz1zZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSwKICAgIC8vICAgICBhYnNlbmNlX3RvbGVyYW5jZT1zZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlLAogICAgLy8gICAgIGdvdmVybmFuY2VfcGVyaW9kPXNlbGYuZ292ZXJuYW5jZV9wZXJpb2QudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX2dyYWNlX3BlcmlvZD1zZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX2xhc3RfYW5jaG9yPXNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlLAogICAgLy8gKQogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAzMAogICAgc2V0Yml0CiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciAyOQogICAgc2V0Yml0CiAgICB1bmNvdmVyIDI3CiAgICBjb25jYXQKICAgIHVuY292ZXIgMjYKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDI0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMjMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIxCiAgICBjb25jYXQKICAgIHVuY292ZXIgMjAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxOQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE4CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTcKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNgogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE1CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDEyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF94Z292X2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzEgLy8gMHg3OAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MzIKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF94Z292X2JveF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzMwogICAgLy8gdmFsID0gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3NdLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfYm94IGVudHJ5IGV4aXN0cwoKZ2V0X3hnb3ZfYm94X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWMgNiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfeGdvdl9ib3hfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjM1LTE2NDAKICAgIC8vIHZhbCA9IHR5cC5YR292Qm94VmFsdWUoCiAgICAvLyAgICAgdm90aW5nX2FkZHJlc3M9QWNjb3VudCgpLAogICAgLy8gICAgIHRvbGVyYXRlZF9hYnNlbmNlcz1VSW50NjQoMCksCiAgICAvLyAgICAgbGFzdF92b3RlX3RpbWVzdGFtcD1VSW50NjQoMCksCiAgICAvLyAgICAgc3Vic2NyaXB0aW9uX3JvdW5kPVVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgYiBnZXRfeGdvdl9ib3hfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF9wcm9wb3Nlcl9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvcG9zZXJfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY0NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjAKICAgIC8vIGV4aXN0cyA9IHByb3Bvc2VyX2FkZHJlc3MgaW4gc2VsZi5wcm9wb3Nlcl9ib3gKICAgIGJ5dGVjXzMgLy8gMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjEKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF9wcm9wb3Nlcl9ib3hfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjIKICAgIC8vIHZhbCA9IHNlbGYucHJvcG9zZXJfYm94W3Byb3Bvc2VyX2FkZHJlc3NdLmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyX2JveCBlbnRyeSBleGlzdHMKCmdldF9wcm9wb3Nlcl9ib3hfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY0NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyA2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9wcm9wb3Nlcl9ib3hfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjY0LTE2NjgKICAgIC8vIHZhbCA9IHR5cC5Qcm9wb3NlckJveFZhbHVlKAogICAgLy8gICAgIGFjdGl2ZV9wcm9wb3NhbD1GYWxzZSwKICAgIC8vICAgICBreWNfc3RhdHVzPUZhbHNlLAogICAgLy8gICAgIGt5Y19leHBpcmluZz1VSW50NjQoMCksCiAgICAvLyApCiAgICBieXRlYyA1MiAvLyAweDAwMDAwMDAwMDAwMDAwMDAwMAogICAgYiBnZXRfcHJvcG9zZXJfYm94X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfcmVxdWVzdF9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmVxdWVzdF9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjcyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2ODgKICAgIC8vIGV4aXN0cyA9IHJlcXVlc3RfaWQgaW4gc2VsZi5yZXF1ZXN0X2JveAogICAgaXRvYgogICAgYnl0ZWMgMjMgLy8gMHg3MgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2ODkKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF9yZXF1ZXN0X2JveF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5MAogICAgLy8gdmFsID0gc2VsZi5yZXF1ZXN0X2JveFtyZXF1ZXN0X2lkXS5jb3B5KCkKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0X2JveCBlbnRyeSBleGlzdHMKCmdldF9yZXF1ZXN0X2JveF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjcyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDYgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGRpZyAzCiAgICBzZXRiaXQKICAgIGNvbmNhdAogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X3JlcXVlc3RfYm94X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5Mi0xNjk2CiAgICAvLyB2YWwgPSB0eXAuWEdvdlN1YnNjcmliZVJlcXVlc3RCb3hWYWx1ZSgKICAgIC8vICAgICB4Z292X2FkZHI9QWNjb3VudCgpLAogICAgLy8gICAgIG93bmVyX2FkZHI9QWNjb3VudCgpLAogICAgLy8gICAgIHJlbGF0aW9uX3R5cGU9VUludDY0KDApLAogICAgLy8gKQogICAgYnl0ZWMgNTUgLy8gYmFzZTMyKEFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgYiBnZXRfcmVxdWVzdF9ib3hfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTcxNAogICAgLy8gZXhpc3RzID0gcmVxdWVzdF9pZCBpbiBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94CiAgICBpdG9iCiAgICBieXRlYyAyNCAvLyAweDcyNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzE1CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MTYKICAgIC8vIHZhbCA9IHNlbGYucmVxdWVzdF91bnN1YnNjcmliZV9ib3hbcmVxdWVzdF9pZF0uY29weSgpCiAgICBkaWcgMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdF91bnN1YnNjcmliZV9ib3ggZW50cnkgZXhpc3RzCgpnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTcwMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyA2IC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgMwogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MTgtMTcyMgogICAgLy8gdmFsID0gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94VmFsdWUoCiAgICAvLyAgICAgeGdvdl9hZGRyPUFjY291bnQoKSwKICAgIC8vICAgICBvd25lcl9hZGRyPUFjY291bnQoKSwKICAgIC8vICAgICByZWxhdGlvbl90eXBlPVVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ5dGVjIDU1IC8vIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIGIgZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5pc19wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmlzX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTcyNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjgKICAgIC8vIGFzc2VydCBzZWxmLl9pc19wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmlzX3hnb3ZfbWFuYWdlcigpIC0+IHVpbnQ2NDoKaXNfeGdvdl9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE1CiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfbWFuYWdlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gMHg3ODY3NmY3NjVmNmQ2MTZlNjE2NzY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X21hbmFnZXIgZXhpc3RzCiAgICA9PQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmlzX3hnb3ZfcGF5b3IoKSAtPiB1aW50NjQ6CmlzX3hnb3ZfcGF5b3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTgKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9wYXlvci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gMHg3ODY3NmY3NjVmNzA2MTc5NmY3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfcGF5b3IgZXhpc3RzCiAgICA9PQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmlzX3hnb3Zfc3Vic2NyaWJlcigpIC0+IHVpbnQ2NDoKaXNfeGdvdl9zdWJzY3JpYmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjIxCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBzZWxmLnhnb3Zfc3Vic2NyaWJlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4Nzg2NzZmNzY1ZjczNzU2MjczNjM3MjY5NjI2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9zdWJzY3JpYmVyIGV4aXN0cwogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5jYWxsZXJfaXNfeGdvdl9vcl92b3RpbmdfYWRkcmVzcyh4Z292X2FkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CmNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI5CiAgICAvLyBkZWYgY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3Moc2VsZiwgeGdvdl9hZGRyZXNzOiBBY2NvdW50KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzEKICAgIC8vIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzEtMjMyCiAgICAvLyBUeG4uc2VuZGVyID09IHhnb3ZfYWRkcmVzcwogICAgLy8gb3IgVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udm90aW5nX2FkZHJlc3MKICAgIGJueiBjYWxsZXJfaXNfeGdvdl9vcl92b3RpbmdfYWRkcmVzc19ib29sX3RydWVAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjMyCiAgICAvLyBvciBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS52b3RpbmdfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMSAvLyAweDc4CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9ib3ggZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDAgMzIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzEtMjMyCiAgICAvLyBUeG4uc2VuZGVyID09IHhnb3ZfYWRkcmVzcwogICAgLy8gb3IgVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udm90aW5nX2FkZHJlc3MKICAgIGJ6IGNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzX2Jvb2xfZmFsc2VAMwoKY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3NfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjMwLTIzMwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHhnb3ZfYWRkcmVzcwogICAgLy8gICAgIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3NdLnZvdGluZ19hZGRyZXNzCiAgICAvLyApCiAgICByZXRzdWIKCmNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzAtMjMzCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzCiAgICAvLyAgICAgb3IgVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udm90aW5nX2FkZHJlc3MKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5faXNfcHJvcG9zYWwocHJvcG9zYWw6IHVpbnQ2NCkgLT4gdWludDY0OgpfaXNfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzUKICAgIC8vIGRlZiBfaXNfcHJvcG9zYWwoc2VsZiwgcHJvcG9zYWw6IEFwcGxpY2F0aW9uKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBwcm9wb3NhbC5jcmVhdG9yID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX3BhcmFtc19nZXQgQXBwQ3JlYXRvcgogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyKHByb3Bvc2FsOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfcHJvcG9zYWxfcHJvcG9zZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNDMKICAgIC8vIGRlZiBnZXRfcHJvcG9zYWxfcHJvcG9zZXIoc2VsZiwgcHJvcG9zYWw6IEFwcGxpY2F0aW9uKSAtPiBBY2NvdW50OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNDQtMjQ2CiAgICAvLyBwcm9wb3Nlcl9ieXRlcywgcHJvcG9zZXJfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF9ieXRlcygKICAgIC8vICAgICBwcm9wb3NhbCwgcGNmZy5HU19LRVlfUFJPUE9TRVIKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ1CiAgICAvLyBwcm9wb3NhbCwgcGNmZy5HU19LRVlfUFJPUE9TRVIKICAgIHB1c2hieXRlcyAweDcwNzI2ZjcwNmY3MzY1NzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NC0yNDYKICAgIC8vIHByb3Bvc2VyX2J5dGVzLCBwcm9wb3Nlcl9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHByb3Bvc2FsLCBwY2ZnLkdTX0tFWV9QUk9QT1NFUgogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NwogICAgLy8gYXNzZXJ0IHByb3Bvc2VyX2V4aXN0cywgZXJyLk1JU1NJTkdfS0VZCiAgICBhc3NlcnQgLy8gTWlzc2luZyBrZXkgaW4gc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0OAogICAgLy8gcmV0dXJuIEFjY291bnQocHJvcG9zZXJfYnl0ZXMpCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuY29tcHV0ZV9hdmFpbGFibGVfZnVuZHMoKSAtPiB1aW50NjQ6CmNvbXB1dGVfYXZhaWxhYmxlX2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjU5CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjYwCiAgICAvLyAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjU5LTI2MAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICAvLyAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Mi0yNjMKICAgIC8vICMgRW5zdXJlIHRoYXQgc3BlbmRhYmxlIGZ1bmRzIGV4Y2VlZCBmdW5kcyBhbGxvY2F0ZWQgdG8gUHJvcG9zYWxzCiAgICAvLyBhc3NlcnQgc3BlbmRhYmxlX2Z1bmRzID4gc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSwgZXJyLklOU1VGRklDSUVOVF9GVU5EUwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICBkdXAyCiAgICA+CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IGZ1bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjQKICAgIC8vIHJldHVybiBzcGVuZGFibGVfZnVuZHMgLSBzZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlCiAgICAtCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudmFsaWRfeGdvdl9wYXltZW50KHBheW1lbnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp2YWxpZF94Z292X3BheW1lbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNzMKICAgIC8vIGRlZiB2YWxpZF94Z292X3BheW1lbnQoc2VsZiwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NQogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NS0yNzYKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gYW5kIHBheW1lbnQuYW1vdW50ID09IHNlbGYueGdvdl9mZWUudmFsdWUKICAgIGJ6IHZhbGlkX3hnb3ZfcGF5bWVudF9ib29sX2ZhbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NgogICAgLy8gYW5kIHBheW1lbnQuYW1vdW50ID09IHNlbGYueGdvdl9mZWUudmFsdWUKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gMHg3ODY3NmY3NjVmNjY2NTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9mZWUgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Mjc1LTI3NgogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyBhbmQgcGF5bWVudC5hbW91bnQgPT0gc2VsZi54Z292X2ZlZS52YWx1ZQogICAgYnogdmFsaWRfeGdvdl9wYXltZW50X2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NC0yNzcKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyAgICAgYW5kIHBheW1lbnQuYW1vdW50ID09IHNlbGYueGdvdl9mZWUudmFsdWUKICAgIC8vICkKICAgIHJldHN1YgoKdmFsaWRfeGdvdl9wYXltZW50X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNzQtMjc3CiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gICAgIGFuZCBwYXltZW50LmFtb3VudCA9PSBzZWxmLnhnb3ZfZmVlLnZhbHVlCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudmFsaWRfa3ljKGFkZHJlc3M6IGJ5dGVzKSAtPiB1aW50NjQ6CnZhbGlkX2t5YzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3OQogICAgLy8gZGVmIHZhbGlkX2t5YyhzZWxmLCBhZGRyZXNzOiBBY2NvdW50KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyODEKICAgIC8vIHNlbGYucHJvcG9zZXJfYm94W2FkZHJlc3NdLmt5Y19zdGF0dXMKICAgIGJ5dGVjXzMgLy8gMHg3MAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXJfYm94IGVudHJ5IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjgxLTI4MgogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbYWRkcmVzc10ua3ljX3N0YXR1cwogICAgLy8gYW5kIHNlbGYucHJvcG9zZXJfYm94W2FkZHJlc3NdLmt5Y19leHBpcmluZyA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieiB2YWxpZF9reWNfYm9vbF9mYWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyODIKICAgIC8vIGFuZCBzZWxmLnByb3Bvc2VyX2JveFthZGRyZXNzXS5reWNfZXhwaXJpbmcgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZnJhbWVfZGlnIDAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyX2JveCBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjgxLTI4MgogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbYWRkcmVzc10ua3ljX3N0YXR1cwogICAgLy8gYW5kIHNlbGYucHJvcG9zZXJfYm94W2FkZHJlc3NdLmt5Y19leHBpcmluZyA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBieiB2YWxpZF9reWNfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQoKdmFsaWRfa3ljX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MC0yODMKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi5wcm9wb3Nlcl9ib3hbYWRkcmVzc10ua3ljX3N0YXR1cwogICAgLy8gICAgIGFuZCBzZWxmLnByb3Bvc2VyX2JveFthZGRyZXNzXS5reWNfZXhwaXJpbmcgPiBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgLy8gKQogICAgc3dhcAogICAgcmV0c3ViCgp2YWxpZF9reWNfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgdmFsaWRfa3ljX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfY29tbWl0dGVlX2FuY2hvcigpIC0+IHVpbnQ2NDoKZ2V0X2NvbW1pdHRlZV9hbmNob3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMDkKICAgIC8vIHIgPSBHbG9iYWwucm91bmQKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzEwCiAgICAvLyByZXR1cm4gciAtIChyICUgc2VsZi5nb3Zlcm5hbmNlX3BlcmlvZC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0OSAvLyAweDY3NmY3NjY1NzI2ZTYxNmU2MzY1NWY3MDY1NzI2OTZmNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb3Zlcm5hbmNlX3BlcmlvZCBleGlzdHMKICAgIGRpZyAxCiAgICBzd2FwCiAgICAlCiAgICAtCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZGVjcmVtZW50X3BlbmRpbmdfcHJvcG9zYWxzKHByb3Bvc2FsOiB1aW50NjQpIC0+IHZvaWQ6CmRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2FsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0NQogICAgLy8gZGVmIGRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2FscyhzZWxmLCBwcm9wb3NhbDogQXBwbGljYXRpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0NgogICAgLy8gc2VsZi5wZW5kaW5nX3Byb3Bvc2Fscy52YWx1ZSAtPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX3Byb3Bvc2FscyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlYyA4IC8vIDB4NzA2NTZlNjQ2OTZlNjc1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0NwogICAgLy8gcHJvcG9zZXIgPSBzZWxmLmdldF9wcm9wb3NhbF9wcm9wb3Nlcihwcm9wb3NhbCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBnZXRfcHJvcG9zYWxfcHJvcG9zZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0OAogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbcHJvcG9zZXJdLmFjdGl2ZV9wcm9wb3NhbCA9IEZhbHNlCiAgICBieXRlY18zIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBzZXRiaXQKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnN1YnNjcmliZV94Z292X2FuZF9lbWl0KHhnb3ZfYWRkcmVzczogYnl0ZXMsIHZvdGluZ19hZGRyZXNzOiBieXRlcykgLT4gdm9pZDoKc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNjctMzY5CiAgICAvLyBkZWYgc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQoCiAgICAvLyAgICAgc2VsZiwgKiwgeGdvdl9hZGRyZXNzOiBBY2NvdW50LCB2b3RpbmdfYWRkcmVzczogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzEgLy8gMHg3OAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNzAtMzcxCiAgICAvLyAjIFRoZSBmb2xsb3dpbmcgYXNzZXJ0aW9uIG1heSBiZSByZWR1bmRhbnQgaW4gc29tZSBpbnZvY2F0aW9ucy4KICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfeGdvdl9zdGF0dXMoeGdvdl9hZGRyZXNzKSwgZXJyLkFMUkVBRFlfWEdPVgogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYW4geEdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzYyCiAgICAvLyB0b2xlcmF0ZWRfYWJzZW5jZXM9c2VsZi5hYnNlbmNlX3RvbGVyYW5jZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAweDYxNjI3MzY1NmU2MzY1NWY3NDZmNmM2NTcyNjE2ZTYzNjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYnNlbmNlX3RvbGVyYW5jZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2NAogICAgLy8gc3Vic2NyaXB0aW9uX3JvdW5kPUdsb2JhbC5yb3VuZCwKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzYwLTM2NQogICAgLy8gcmV0dXJuIHR5cC5YR292Qm94VmFsdWUoCiAgICAvLyAgICAgdm90aW5nX2FkZHJlc3M9dm90aW5nX2FkZHJlc3MsCiAgICAvLyAgICAgdG9sZXJhdGVkX2Fic2VuY2VzPXNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUsCiAgICAvLyAgICAgbGFzdF92b3RlX3RpbWVzdGFtcD1VSW50NjQoMCksCiAgICAvLyAgICAgc3Vic2NyaXB0aW9uX3JvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIHN3YXAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNjMKICAgIC8vIGxhc3Rfdm90ZV90aW1lc3RhbXA9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2MC0zNjUKICAgIC8vIHJldHVybiB0eXAuWEdvdkJveFZhbHVlKAogICAgLy8gICAgIHZvdGluZ19hZGRyZXNzPXZvdGluZ19hZGRyZXNzLAogICAgLy8gICAgIHRvbGVyYXRlZF9hYnNlbmNlcz1zZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlLAogICAgLy8gICAgIGxhc3Rfdm90ZV90aW1lc3RhbXA9VUludDY0KDApLAogICAgLy8gICAgIHN1YnNjcmlwdGlvbl9yb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyApCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzcyCiAgICAvLyBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10gPSBzZWxmLm1ha2VfeGdvdl9ib3godm90aW5nX2FkZHJlc3MpCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNzMKICAgIC8vIHNlbGYueGdvdnMudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vIDB4Nzg2NzZmNzY3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDExIC8vIDB4Nzg2NzZmNzY3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3NgogICAgLy8geGdvdj14Z292X2FkZHJlc3MsIGRlbGVnYXRlPXZvdGluZ19hZGRyZXNzLCByb3VuZD1HbG9iYWwucm91bmQKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Mzc1LTM3NwogICAgLy8gdHlwLlhHb3ZTdWJzY3JpYmVkKAogICAgLy8gICAgIHhnb3Y9eGdvdl9hZGRyZXNzLCBkZWxlZ2F0ZT12b3RpbmdfYWRkcmVzcywgcm91bmQ9R2xvYmFsLnJvdW5kCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3NC0zNzgKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICB0eXAuWEdvdlN1YnNjcmliZWQoCiAgICAvLyAgICAgICAgIHhnb3Y9eGdvdl9hZGRyZXNzLCBkZWxlZ2F0ZT12b3RpbmdfYWRkcmVzcywgcm91bmQ9R2xvYmFsLnJvdW5kCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MjQxZmRjNTEgLy8gbWV0aG9kICJYR292U3Vic2NyaWJlZChhZGRyZXNzLGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdCh4Z292X2FkZHJlc3M6IGJ5dGVzKSAtPiB2b2lkOgp1bnN1YnNjcmliZV94Z292X2FuZF9lbWl0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzgwCiAgICAvLyBkZWYgdW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdChzZWxmLCB4Z292X2FkZHJlc3M6IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMSAvLyAweDc4CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4MS0zODIKICAgIC8vICMgVGhlIGZvbGxvd2luZyBhc3NlcnRpb24gbWF5IGJlIHJlZHVuZGFudCBpbiBzb21lIGludm9jYXRpb25zLgogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozODMKICAgIC8vIGRlbCBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Mzg0CiAgICAvLyBzZWxmLnhnb3ZzLnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292cyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozODUKICAgIC8vIGFyYzQuZW1pdCh0eXAuWEdvdlVuc3Vic2NyaWJlZCh4Z292PXhnb3ZfYWRkcmVzcywgcm91bmQ9R2xvYmFsLnJvdW5kKSkKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDdiYTI1ODAzIC8vIG1ldGhvZCAiWEdvdlVuc3Vic2NyaWJlZChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [4287], "errorMessage": "Address length is 32 bytes"}, {"pc": [1835], "errorMessage": "Already a proposer"}, {"pc": [1391, 1514, 1587, 4432], "errorMessage": "Already an xGov"}, {"pc": [2139], "errorMessage": "Committee is stale"}, {"pc": [2019], "errorMessage": "Committee size is too large"}, {"pc": [2108], "errorMessage": "Creation of proposals is paused"}, {"pc": [1033], "errorMessage": "Inconsistent discussion duration config"}, {"pc": [1118], "errorMessage": "Inconsistent quorum config"}, {"pc": [929], "errorMessage": "Inconsistent requested amount config"}, {"pc": [1089], "errorMessage": "Inconsistent voting duration config"}, {"pc": [1147], "errorMessage": "Inconsistent weighted quorum config"}, {"pc": [2172, 3495, 3543], "errorMessage": "Insufficient fee"}, {"pc": [3486, 3550, 4307], "errorMessage": "Insufficient funds"}, {"pc": [2940], "errorMessage": "Insufficient treasury funds"}, {"pc": [2163, 2930], "errorMessage": "Invalid KYC"}, {"pc": [966], "errorMessage": "Invalid open proposal fee"}, {"pc": [1395, 1518, 1675], "errorMessage": "Invalid payment"}, {"pc": [2422, 2672, 2890, 3124, 3312, 4194], "errorMessage": "Invalid proposal"}, {"pc": [2214], "errorMessage": "Invalid proposal approval program size"}, {"pc": [875], "errorMessage": "Invalid proposer fee"}, {"pc": [861], "errorMessage": "Invalid xGov fee"}, {"pc": [2916, 3098, 4282], "errorMessage": "Missing key in state"}, {"pc": [2202], "errorMessage": "Missing proposal approval program"}, {"pc": [2437], "errorMessage": "Must be xgov or voting address"}, {"pc": [1417, 1447, 1671, 1738, 1798, 2431, 4495], "errorMessage": "Not an xGov"}, {"pc": [2157], "errorMessage": "Proposer already has an active proposal"}, {"pc": [1920], "errorMessage": "Proposer does not exist"}, {"pc": [1382, 1409, 1438, 1505, 1663, 1789, 1826, 2101, 2416, 2666, 3307], "errorMessage": "Registry's non-admin methods are paused"}, {"pc": [3266], "errorMessage": "There are voters assigned to this proposal"}, {"pc": [584, 636, 647, 657, 666, 676, 685, 703, 721, 739, 757, 775, 793, 811, 839, 1356, 1453, 1499, 1562, 1607, 1657, 1719, 1758, 1804, 1911, 2005, 2147, 2885, 3117, 3320, 3478, 3534], "errorMessage": "Unauthorized"}, {"pc": [2602, 2612, 2768, 2776, 3050, 3057, 3265, 3273, 3408, 3415], "errorMessage": "Unknown error"}, {"pc": [2605, 2769], "errorMessage": "Voter not found"}, {"pc": [2604], "errorMessage": "Votes invalid"}, {"pc": [2603], "errorMessage": "Voting Period Expired"}, {"pc": [2008], "errorMessage": "Wrong Committee Members"}, {"pc": [2010], "errorMessage": "Wrong Committee Votes"}, {"pc": [10], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [16], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [20], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [24], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [2606, 2770, 3051, 3267, 3409], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [1842, 2181, 3450], "errorMessage": "Wrong Receiver"}, {"pc": [1851, 2193], "errorMessage": "Wrong payment amount"}, {"pc": [2924], "errorMessage": "Wrong proposer"}, {"pc": [2198, 2292, 4293, 4298], "errorMessage": "account funded"}, {"pc": [2298, 4261], "errorMessage": "application exists"}, {"pc": [2496, 2704, 2991, 3155, 3349], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [2442, 3826, 4437], "errorMessage": "check self.absence_tolerance exists"}, {"pc": [2131, 3836], "errorMessage": "check self.committee_grace_period exists"}, {"pc": [3811], "errorMessage": "check self.committee_id exists"}, {"pc": [2122, 3841], "errorMessage": "check self.committee_last_anchor exists"}, {"pc": [2003, 3618], "errorMessage": "check self.committee_manager exists"}, {"pc": [3816], "errorMessage": "check self.committee_members exists"}, {"pc": [3821], "errorMessage": "check self.committee_votes exists"}, {"pc": [3643], "errorMessage": "check self.daemon_ops_funding_bps exists"}, {"pc": [3693], "errorMessage": "check self.discussion_duration_large exists"}, {"pc": [3688], "errorMessage": "check self.discussion_duration_medium exists"}, {"pc": [3683], "errorMessage": "check self.discussion_duration_small exists"}, {"pc": [3698], "errorMessage": "check self.discussion_duration_xlarge exists"}, {"pc": [3831, 4380], "errorMessage": "check self.governance_period exists"}, {"pc": [1909, 3613], "errorMessage": "check self.kyc_provider exists"}, {"pc": [2015], "errorMessage": "check self.max_committee_size exists"}, {"pc": [3668], "errorMessage": "check self.max_requested_amount_large exists"}, {"pc": [3663], "errorMessage": "check self.max_requested_amount_medium exists"}, {"pc": [3658], "errorMessage": "check self.max_requested_amount_small exists"}, {"pc": [3653], "errorMessage": "check self.min_requested_amount exists"}, {"pc": [2188, 3638], "errorMessage": "check self.open_proposal_fee exists"}, {"pc": [2935, 3455, 3483, 3801, 4304], "errorMessage": "check self.outstanding_funds exists"}, {"pc": [2106, 3588], "errorMessage": "check self.paused_proposals exists"}, {"pc": [1380, 1407, 1436, 1503, 1661, 1787, 1824, 2099, 2414, 2664, 3305, 3583], "errorMessage": "check self.paused_registry exists"}, {"pc": [2324, 3806, 4394], "errorMessage": "check self.pending_proposals exists"}, {"pc": [3648], "errorMessage": "check self.proposal_commitment_bps exists"}, {"pc": [2153, 4073, 4349, 4358], "errorMessage": "check self.proposer_box entry exists"}, {"pc": [1849, 3633], "errorMessage": "check self.proposer_fee exists"}, {"pc": [3761], "errorMessage": "check self.quorum_large exists"}, {"pc": [3756], "errorMessage": "check self.quorum_medium exists"}, {"pc": [3751], "errorMessage": "check self.quorum_small exists"}, {"pc": [1570, 4118], "errorMessage": "check self.request_box entry exists"}, {"pc": [1523, 1680], "errorMessage": "check self.request_id exists"}, {"pc": [1727, 4163], "errorMessage": "check self.request_unsubscribe_box entry exists"}, {"pc": [3727], "errorMessage": "check self.voting_duration_large exists"}, {"pc": [3722], "errorMessage": "check self.voting_duration_medium exists"}, {"pc": [3717], "errorMessage": "check self.voting_duration_small exists"}, {"pc": [3732], "errorMessage": "check self.voting_duration_xlarge exists"}, {"pc": [3786], "errorMessage": "check self.weighted_quorum_large exists"}, {"pc": [3781], "errorMessage": "check self.weighted_quorum_medium exists"}, {"pc": [3776], "errorMessage": "check self.weighted_quorum_small exists"}, {"pc": [2817, 2827, 3975, 4242], "errorMessage": "check self.xgov_box entry exists"}, {"pc": [3603], "errorMessage": "check self.xgov_council exists"}, {"pc": [3115, 3623], "errorMessage": "check self.xgov_daemon exists"}, {"pc": [3628, 4331], "errorMessage": "check self.xgov_fee exists"}, {"pc": [3508, 3593, 4203], "errorMessage": "check self.xgov_manager exists"}, {"pc": [3556, 3598, 4212], "errorMessage": "check self.xgov_payor exists"}, {"pc": [3608, 4221], "errorMessage": "check self.xgov_subscriber exists"}, {"pc": [4457, 4502], "errorMessage": "check self.xgovs exists"}, {"pc": [2798], "errorMessage": "index access is out of bounds"}, {"pc": [1808, 2343, 2449, 2456, 2838, 4418], "errorMessage": "index out of bounds"}, {"pc": [621, 2503, 2647, 2711, 2998, 3162, 3356], "errorMessage": "invalid array length header"}, {"pc": [1891], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [2660], "errorMessage": "invalid number of bytes for arc4.dynamic_array<account>"}, {"pc": [629], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [699, 717, 735, 753, 771, 789, 807, 1366, 1432, 1466, 1474, 1624, 1632, 1775, 1783, 1883, 1978, 2394, 3959, 4057], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [579, 614, 1482, 1557, 1602, 1640, 1714, 1753, 1901, 1986, 1995, 2385, 2402, 2410, 2637, 2880, 3082, 3299, 3473, 3529, 4099, 4144, 4189], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [835], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.XGovRegistryConfig"}, {"pc": [2510, 2718, 3005, 3169, 3363], "errorMessage": "invalid number of bytes for string"}, {"pc": [2048, 2058], "errorMessage": "overflow"}, {"pc": [1376, 1493, 1651, 1820, 2095, 3443], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"entropy": {"type": "AVMBytes"}}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "desc": "Create the xGov Registry.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The size of the Proposal Approval Program contract", "name": "size"}], "name": "init_proposal_contract", "returns": {"type": "void"}, "desc": "Initializes the Proposal Approval Program contract.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The offset in the Proposal Approval Program contract", "name": "offset"}, {"type": "byte[]", "desc": "The data to load into the Proposal Approval Program contract", "name": "data"}], "name": "load_proposal_contract", "returns": {"type": "void"}, "desc": "Loads the Proposal Approval Program contract.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "delete_proposal_contract_box", "returns": {"type": "void"}, "desc": "Deletes the Proposal Approval Program contract box.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_registry", "returns": {"type": "void"}, "desc": "Pauses the xGov Registry non-administrative methods.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_proposals", "returns": {"type": "void"}, "desc": "Pauses the creation of new Proposals.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_registry", "returns": {"type": "void"}, "desc": "Resumes the xGov Registry non-administrative methods.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_proposals", "returns": {"type": "void"}, "desc": "Resumes the creation of new Proposals.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Manager", "name": "manager"}], "name": "set_xgov_manager", "returns": {"type": "void"}, "desc": "Sets the xGov Manager.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Payor", "name": "payor"}], "name": "set_payor", "returns": {"type": "void"}, "desc": "Sets the xGov Payor.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Council", "name": "council"}], "name": "set_xgov_council", "returns": {"type": "void"}, "desc": "Sets the xGov Council.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Subscriber", "name": "subscriber"}], "name": "set_xgov_subscriber", "returns": {"type": "void"}, "desc": "Sets the xGov Subscriber.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new KYC Provider", "name": "provider"}], "name": "set_kyc_provider", "returns": {"type": "void"}, "desc": "Sets the KYC provider.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Manager", "name": "manager"}], "name": "set_committee_manager", "returns": {"type": "void"}, "desc": "Sets the Committee Manager.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the new xGov Daemon", "name": "xgov_daemon"}], "name": "set_xgov_daemon", "returns": {"type": "void"}, "desc": "Sets the xGov Daemon.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,uint64)", "desc": "Configuration class containing the field data", "name": "config", "struct": "XGovRegistryConfig"}], "name": "config_xgov_registry", "returns": {"type": "void"}, "desc": "Sets the configuration of the xGov Registry.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_xgov_registry", "returns": {"type": "void"}, "desc": "Updates the xGov Registry contract.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the voting account for the xGov", "name": "voting_address"}, {"type": "pay", "desc": "The payment transaction covering the xGov fee", "name": "payment"}], "name": "subscribe_xgov", "returns": {"type": "void"}, "desc": "Subscribes the sender to being an xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "address", "name": "delegate"}, {"type": "uint64", "name": "round"}], "name": "XGovSubscribed", "desc": "An xGov subscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Unsubscribes the sender from being an xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "(Account): The address of the absentee xGov to unsubscribe", "name": "xgov_address"}], "name": "unsubscribe_absentee", "returns": {"type": "void"}, "desc": "Unsubscribes an absentee xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}, {"type": "address", "desc": "The address of the xGov Address owner/controller (Voting Address)", "name": "owner_address"}, {"type": "uint64", "desc": "The type of relationship enum", "name": "relation_type"}, {"type": "pay", "desc": "The payment transaction covering the xGov fee", "name": "payment"}], "name": "request_subscribe_xgov", "returns": {"type": "void"}, "desc": "Requests to subscribe to the xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the request to approve", "name": "request_id"}], "name": "approve_subscribe_xgov", "returns": {"type": "void"}, "desc": "Approves a subscribe request to xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "address", "name": "delegate"}, {"type": "uint64", "name": "round"}], "name": "XGovSubscribed", "desc": "An xGov subscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the request to reject", "name": "request_id"}], "name": "reject_subscribe_xgov", "returns": {"type": "void"}, "desc": "Rejects a subscribe request to xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}, {"type": "address", "desc": "The address of the xGov Address owner/controller", "name": "owner_address"}, {"type": "uint64", "desc": "The type of relationship enum", "name": "relation_type"}, {"type": "pay", "desc": "The payment transaction covering the xGov (unsubscribe) fee", "name": "payment"}], "name": "request_unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Requests to unsubscribe from the xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the unsubscribe request to approve", "name": "request_id"}], "name": "approve_unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Approves a request to unsubscribe from xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the unsubscribe request to reject", "name": "request_id"}], "name": "reject_unsubscribe_xgov", "returns": {"type": "void"}, "desc": "Rejects a request to unsubscribe from xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The xGov address delegating voting power", "name": "xgov_address"}, {"type": "address", "desc": "The voting account address to delegate voting power to", "name": "voting_address"}], "name": "set_voting_account", "returns": {"type": "void"}, "desc": "Sets the Voting Address for the xGov.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "The payment transaction covering the Proposer fee", "name": "payment"}], "name": "subscribe_proposer", "returns": {"type": "void"}, "desc": "Subscribes the sender to being a Proposer.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "ProposerSubscribed", "desc": "A Proposer subscribed"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Proposer", "name": "proposer"}, {"type": "bool", "desc": "The new status of the Proposer", "name": "kyc_status"}, {"type": "uint64", "desc": "The expiration date as a unix timestamp of the time the KYC expires", "name": "kyc_expiring"}], "name": "set_proposer_kyc", "returns": {"type": "void"}, "desc": "Sets a proposer's KYC status.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "proposer"}, {"type": "bool", "name": "valid_kyc"}, {"type": "uint64", "name": "round"}], "name": "ProposerKYC", "desc": "A Proposer KYC status update"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "desc": "The ID of the xGov Committee", "name": "committee_id"}, {"type": "uint64", "desc": "The size of the xGov Committee", "name": "size"}, {"type": "uint64", "desc": "The voting power of the xGov Committee", "name": "votes"}], "name": "declare_committee", "returns": {"type": "void"}, "desc": "Sets the xGov Committee in charge. The xGov Daemon assigns its members to\neach submitted Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint32", "name": "size"}, {"type": "uint32", "name": "votes"}, {"type": "uint64", "name": "round"}], "name": "NewCommittee", "desc": "A new xGov Committee has been elected"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "desc": "The ID of the xGov Committee", "name": "committee_id"}, {"type": "uint64", "desc": "The size of the xGov Committee", "name": "size"}, {"type": "uint64", "desc": "The voting power of the xGov Committee", "name": "votes"}, {"type": "byte[32]", "desc": "The Merkle root of the xGov Committee members", "name": "committee_root"}], "name": "declare_committee_with_root", "returns": {"type": "void"}, "desc": "Sets the xGov Committee in charge, committed by the Merkle root of its\n(address, votes) members. Members prove their membership when voting, so submitted Proposals open the voting without voters assignment.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint32", "name": "size"}, {"type": "uint32", "name": "votes"}, {"type": "uint64", "name": "round"}], "name": "NewCommittee", "desc": "A new xGov Committee has been elected"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "payment for covering the proposal fee (includes child contract MBR)", "name": "payment"}], "name": "open_proposal", "returns": {"type": "uint64"}, "desc": "Creates a new Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "NewProposal", "desc": "A new Proposal has been opened"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app being voted on", "name": "proposal_id"}, {"type": "address", "desc": "(Account): The address of the xGov being voted on behalf of", "name": "xgov_address"}, {"type": "uint64", "desc": "(UInt64): The number of approvals votes allocated", "name": "approval_votes"}, {"type": "uint64", "desc": "(UInt64): The number of rejections votes allocated", "name": "rejection_votes"}], "name": "vote_proposal", "returns": {"type": "void"}, "desc": "Votes on a Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app being voted on", "name": "proposal_id"}, {"type": "address", "desc": "(Account): The address of the xGov being voted on behalf of", "name": "xgov_address"}, {"type": "uint64", "desc": "(UInt64): The votes of the xGov in the Committee", "name": "voting_power"}, {"type": "uint64", "desc": "(UInt64): The position of the xGov in the Committee Merkle tree", "name": "ordinal"}, {"type": "byte[32][]", "desc": "(Array[typ.Bytes32]): The Merkle proof of the xGov membership", "name": "proof"}, {"type": "uint64", "desc": "(UInt64): The number of approvals votes allocated", "name": "approval_votes"}, {"type": "uint64", "desc": "(UInt64): The number of rejections votes allocated", "name": "rejection_votes"}], "name": "vote_proposal_with_proof", "returns": {"type": "void"}, "desc": "Votes on a Proposal whose xGov Committee was declared with a Merkle root.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app being voted on", "name": "proposal_id"}, {"type": "(address,uint64,uint64)[]", "desc": "(Array[typ.XGovVote]): The xGov addresses with the number of approvals and rejections votes allocated by each", "name": "votes"}], "name": "vote_proposal_batch", "returns": {"type": "void"}, "desc": "Votes on a Proposal on behalf of several xGovs in a single app call, as a\ndelegate holding their voting address.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "(Account): The address of the xGov being voted on behalf of", "name": "xgov_address"}, {"type": "(uint64,uint64,uint64)[]", "desc": "(Array[typ.ProposalVote]): The Proposal application IDs with the number of approvals and rejections votes allocated to each", "name": "votes"}], "name": "vote_proposals", "returns": {"type": "void"}, "desc": "Votes on several Proposals on behalf of an xGov in a single app call.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the scrutinized Proposal", "name": "proposal_id"}, {"type": "address[]", "desc": "List of absentees to be unassigned", "name": "absentees"}], "name": "unassign_absentee_from_proposal", "returns": {"type": "void"}, "desc": "Unassign absentees from a scrutinized Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the scrutinized Proposal", "name": "proposal_id"}, {"type": "address", "desc": "The address of the absentee", "name": "xgov_address"}, {"type": "uint64", "desc": "The votes of the absentee in the Committee", "name": "voting_power"}, {"type": "uint64", "desc": "The position of the absentee in the Committee Merkle tree", "name": "ordinal"}, {"type": "byte[32][]", "desc": "The Merkle proof of the absentee membership", "name": "proof"}], "name": "unassign_absentee_from_proposal_with_proof", "returns": {"type": "void"}, "desc": "Unassign an absentee from a scrutinized Proposal whose xGov Committee was\ndeclared with a Merkle root.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the approved Proposal", "name": "proposal_id"}], "name": "pay_grant_proposal", "returns": {"type": "void"}, "desc": "Disburses the funds for an approved Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app to finalize", "name": "proposal_id"}], "name": "finalize_proposal", "returns": {"type": "void"}, "desc": "Finalize a Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The application ID of the Proposal app to drop", "name": "proposal_id"}], "name": "drop_proposal", "returns": {"type": "void"}, "desc": "Drops a Proposal.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "desc": "the deposit transaction", "name": "payment"}], "name": "deposit_funds", "returns": {"type": "void"}, "desc": "Deposits xGov program funds into the xGov Treasury (xGov Registry Account).", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "the amount to remove", "name": "amount"}], "name": "withdraw_funds", "returns": {"type": "void"}, "desc": "Remove xGov program funds from the xGov Treasury (xGov Registry Account).", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "Amount to withdraw (in microALGO)", "name": "amount"}], "name": "withdraw_available_funds", "returns": {"type": "void"}, "desc": "Withdraw the available balance (excluding MBR and Proposals funds) from the xGov Registry.", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_available_funds", "returns": {"type": "uint64", "desc": "The available funds in microALGO"}, "desc": "Get the available funds (excluding MBR and Proposals funds)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state", "returns": {"type": "(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)", "struct": "TypedGlobalState"}, "desc": "Returns the xGov Registry state.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state_version", "returns": {"type": "uint64"}, "desc": "Returns the xGov Registry state version, incremented by every mutating method.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the xGov", "name": "xgov_address"}], "name": "get_xgov_box", "returns": {"type": "((address,uint64,uint64,uint64),bool)", "desc": "The xGov box value bool: `True` if xGov box exists, else `False`"}, "desc": "Returns the xGov box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "The addresses of the xGovs", "name": "xgov_addresses"}], "name": "get_xgov_boxes", "returns": {"type": "((address,uint64,uint64,uint64),bool)[]", "desc": "The xGov box value, and whether the xGov box exists, of each address"}, "desc": "Returns the xGov boxes for the given addresses, as `get_xgov_box`.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "The address of the Proposer", "name": "proposer_address"}], "name": "get_proposer_box", "returns": {"type": "((bool,bool,uint64),bool)", "desc": "The Proposer box value bool: `True` if Proposer box exists, else `False`"}, "desc": "Returns the Proposer box for the given address.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "desc": "The addresses of the Proposers", "name": "proposer_addresses"}], "name": "get_proposer_boxes", "returns": {"type": "((bool,bool,uint64),bool)[]", "desc": "The Proposer box value, and whether the Proposer box exists, of each address"}, "desc": "Returns the Proposer boxes for the given addresses, as `get_proposer_box`.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the subscribe request", "name": "request_id"}], "name": "get_request_box", "returns": {"type": "((address,address,uint64),bool)", "desc": "The subscribe request box value bool: `True` if xGov subscribe request box exists, else `False`"}, "desc": "Returns the xGov subscribe request box for the given request ID.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "The IDs of the subscribe requests", "name": "request_ids"}], "name": "get_request_boxes", "returns": {"type": "((address,address,uint64),bool)[]", "desc": "The subscribe request box value, and whether the box exists, of each request ID"}, "desc": "Returns the xGov subscribe request boxes for the given request IDs, as\n`get_request_box`.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "The ID of the unsubscribe request", "name": "request_id"}], "name": "get_request_unsubscribe_box", "returns": {"type": "((address,address,uint64),bool)", "desc": "The unsubscribe request box value bool: `True` if xGov unsubscribe request box exists, else `False`"}, "desc": "Returns the xGov unsubscribe request box for the given unsubscribe request ID.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "The IDs of the unsubscribe requests", "name": "request_ids"}], "name": "get_request_unsubscribe_boxes", "returns": {"type": "((address,address,uint64),bool)[]", "desc": "The unsubscribe request box value, and whether the box exists, of each request ID"}, "desc": "Returns the xGov unsubscribe request boxes for the given unsubscribe\nrequest IDs, as `get_request_unsubscribe_box`.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "The application IDs of the Proposals", "name": "proposal_ids"}], "name": "get_proposals_summary", "returns": {"type": "(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]", "desc": "The state of each Proposal, with `exists` `False` (and zero values) if the ID is not a Proposal of the registry"}, "desc": "Returns a compact state of several Proposals, read from their global state.\nThe summaries are returned in a single log, which bounds a call to `MAX_PROPOSALS_SUMMARY` Proposals (see `read_proposals_summary` to read more Proposals across calls).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "is_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "XGovRegistry", "state": {"keys": {"box": {"proposal_approval_program": {"key": "cGE=", "keyType": "AVMBytes", "valueType": "AVMBytes"}}, "global": {"xgov_manager": {"key": "eGdvdl9tYW5hZ2Vy", "keyType": "AVMBytes", "valueType": "address"}, "xgov_subscriber": {"key": "eGdvdl9zdWJzY3JpYmVy", "keyType": "AVMBytes", "valueType": "address"}, "xgov_payor": {"key": "eGdvdl9wYXlvcg==", "keyType": "AVMBytes", "valueType": "address"}, "xgov_council": {"key": "eGdvdl9jb3VuY2ls", "keyType": "AVMBytes", "valueType": "address"}, "kyc_provider": {"key": "a3ljX3Byb3ZpZGVy", "keyType": "AVMBytes", "valueType": "address"}, "committee_manager": {"key": "Y29tbWl0dGVlX21hbmFnZXI=", "keyType": "AVMBytes", "valueType": "address"}, "xgov_daemon": {"key": "eGdvdl9kYWVtb24=", "keyType": "AVMBytes", "valueType": "address"}, "paused_registry": {"key": "cGF1c2VkX3JlZ2lzdHJ5", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused_proposals": {"key": "cGF1c2VkX3Byb3Bvc2Fscw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "outstanding_funds": {"key": "b3V0c3RhbmRpbmdfZnVuZHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "xgov_fee": {"key": "eGdvdl9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "proposer_fee": {"key": "cHJvcG9zZXJfZmVl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_proposal_fee": {"key": "b3Blbl9wcm9wb3NhbF9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "daemon_ops_funding_bps": {"key": "ZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "proposal_commitment_bps": {"key": "cHJvcG9zYWxfY29tbWl0bWVudF9icHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "min_requested_amount": {"key": "bWluX3JlcXVlc3RlZF9hbW91bnQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_small": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGw=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_medium": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVt", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_large": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_small": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_medium": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_large": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_xlarge": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_small": {"key": "dm90aW5nX2R1cmF0aW9uX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_medium": {"key": "dm90aW5nX2R1cmF0aW9uX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_large": {"key": "dm90aW5nX2R1cmF0aW9uX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_xlarge": {"key": "dm90aW5nX2R1cmF0aW9uX3hsYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_small": {"key": "cXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_medium": {"key": "cXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_large": {"key": "cXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_small": {"key": "d2VpZ2h0ZWRfcXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_medium": {"key": "d2VpZ2h0ZWRfcXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_large": {"key": "d2VpZ2h0ZWRfcXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_id": {"key": "Y29tbWl0dGVlX2lk", "keyType": "AVMBytes", "valueType": "byte[32]"}, "committee_members": {"key": "Y29tbWl0dGVlX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_votes": {"key": "Y29tbWl0dGVlX3ZvdGVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_committee_size": {"key": "bWF4X2NvbW1pdHRlZV9zaXpl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "xgovs": {"key": "eGdvdnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "pending_proposals": {"key": "cGVuZGluZ19wcm9wb3NhbHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "request_id": {"key": "cmVxdWVzdF9pZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "absence_tolerance": {"key": "YWJzZW5jZV90b2xlcmFuY2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "governance_period": {"key": "Z292ZXJuYW5jZV9wZXJpb2Q=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_grace_period": {"key": "Y29tbWl0dGVlX2dyYWNlX3BlcmlvZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_last_anchor": {"key": "Y29tbWl0dGVlX2xhc3RfYW5jaG9y", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_root": {"key": "Y29tbWl0dGVlX3Jvb3Q=", "keyType": "AVMBytes", "valueType": "AVMBytes"}, "state_version": {"key": "c3RhdGVfdmVyc2lvbg==", "keyType": "AVMBytes", "valueType": "uint64"}}, "local": {}}, "maps": {"box": {"xgov_box": {"keyType": "address", "valueType": "XGovBoxValue", "prefix": "eA=="}, "request_box": {"keyType": "uint64", "valueType": "XGovSubscribeRequestBoxValue", "prefix": "cg=="}, "request_unsubscribe_box": {"keyType": "uint64", "valueType": "XGovSubscribeRequestBoxValue", "prefix": "cnU="}, "proposer_box": {"keyType": "address", "valueType": "ProposerBoxValue", "prefix": "cA=="}, "voters": {"keyType": "address", "valueType": "uint64", "prefix": "Vg=="}, "voted_bitmap": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "Qg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 28, "ints": 36}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"ProposerBoxValue": [{"name": "active_proposal", "type": "bool"}, {"name": "kyc_status", "type": "bool"}, {"name": "kyc_expiring", "type": "uint64"}], "TypedGlobalState": [{"name": "paused_registry", "type": "bool"}, {"name": "paused_proposals", "type": "bool"}, {"name": "xgov_manager", "type": "address"}, {"name": "xgov_payor", "type": "address"}, {"name": "xgov_council", "type": "address"}, {"name": "xgov_subscriber", "type": "address"}, {"name": "kyc_provider", "type": "address"}, {"name": "committee_manager", "type": "address"}, {"name": "xgov_daemon", "type": "address"}, {"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "outstanding_funds", "type": "uint64"}, {"name": "pending_proposals", "type": "uint64"}, {"name": "committee_id", "type": "byte[32]"}, {"name": "committee_members", "type": "uint64"}, {"name": "committee_votes", "type": "uint64"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}, {"name": "committee_last_anchor", "type": "uint64"}], "XGovBoxValue": [{"name": "voting_address", "type": "address"}, {"name": "tolerated_absences", "type": "uint64"}, {"name": "last_vote_timestamp", "type": "uint64"}, {"name": "subscription_round", "type": "uint64"}], "XGovRegistryConfig": [{"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}], "XGovSubscribeRequestBoxValue": [{"name": "xgov_addr", "type": "address"}, {"name": "owner_addr", "type": "address"}, {"name": "relation_type", "type": "uint64"}]}, "byteCode": {"approval": "CiAGAAEIIIAQ1JMBJj8EFR98dQ9wYXVzZWRfcmVnaXN0cnkBeAEAEW91dHN0YW5kaW5nX2Z1bmRzAXACcGEMeGdvdl9tYW5hZ2VyEXBlbmRpbmdfcHJvcG9zYWxzCnhnb3ZfcGF5b3IQcGF1c2VkX3Byb3Bvc2FscwV4Z292cwpyZXF1ZXN0X2lkAXICcnUiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZARFUlI6AgAAD3hnb3Zfc3Vic2NyaWJlcgxreWNfcHJvdmlkZXIRY29tbWl0dGVlX21hbmFnZXILeGdvdl9kYWVtb24IeGdvdl9mZWUMcHJvcG9zZXJfZmVlEW9wZW5fcHJvcG9zYWxfZmVlD2NvbW1pdHRlZV92b3RlcxJtYXhfY29tbWl0dGVlX3NpemURYWJzZW5jZV90b2xlcmFuY2UMeGdvdl9jb3VuY2lsHGRhZW1vbl9vcGVyYXRpb25fZnVuZGluZ19icHMXcHJvcG9zYWxfY29tbWl0bWVudF9icHMUbWluX3JlcXVlc3RlZF9hbW91bnQabWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwbbWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtGm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlGWRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwaZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0ZZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZRpkaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZRV2b3RpbmdfZHVyYXRpb25fc21hbGwWdm90aW5nX2R1cmF0aW9uX21lZGl1bRV2b3RpbmdfZHVyYXRpb25fbGFyZ2UWdm90aW5nX2R1cmF0aW9uX3hsYXJnZQxxdW9ydW1fc21hbGwNcXVvcnVtX21lZGl1bQxxdW9ydW1fbGFyZ2UVd2VpZ2h0ZWRfcXVvcnVtX3NtYWxsFndlaWdodGVkX3F1b3J1bV9tZWRpdW0Vd2VpZ2h0ZWRfcXVvcnVtX2xhcmdlEWNvbW1pdHRlZV9tZW1iZXJzEWdvdmVybmFuY2VfcGVyaW9kFmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QVY29tbWl0dGVlX2xhc3RfYW5jaG9yDXN0YXRlX3ZlcnNpb24JAAAAAAAAAAAADmNvbW1pdHRlZV9yb290BBhBoNIQcmVxdWVzdGVkX2Ftb3VudAZzdGF0dXMMY29tbWl0dGVlX2lkCAAAAAAAAAAAD1ZvdGVyIG5vdCBmb3VuZAAxGEAAtjE1gRwSRDE0gSQSRDE3FEQxNhREJwcyA2cnEjIDZycJMgNnJxwyA2cnEzIDZycUMgNnJxUyA2cpImcnCiJnJwQiZycWImcnFyJnJxgiZycdImcnHiJnJx8iZycgImcnISJnJyIiZycjImcnJCJnJyUiZycmImcnJyJnJygiZycpImcnKiJnJysiZycsImcnLSJnJy4iZycvImcnMCJnJzEiZycZImcnGiJnJwsiZycIImcnDCJngARJVsGrNhoAjgEBqTEZFEQxGEEBkoI4BJWcR2IEbB9WTQThClEuBIb34OYEOeJtigSYNS6GBPpO1uIE1snMGgRcSEBVBDfWrfEE1CFrbgS6hSDyBBZ3sw4EhLfSaASvfxhgBKCCzvgE3zn9uQTKD2o6BEUHc5AEPDG8AgQNLHiRBJP6zboEzos6HAT66ggfBA2ieIUEek/uQwRS3RDXBNTTemQEqbtyuQQ0NJ3MBBWPjdYEKQ8yogRofLNWBFsFOQ8EX+JZNQR2FqKuBNsnua8E9ZEHVgRlYQqfBP3GlcIEupCrVAQaZ0tFBKjVrpQEauXrRgQpVwE7BCdjDWUE0dfyqgSCT5i8BG5zXP8ESVSLoAQprNoTBIJnhPYEto/LlQTUlavPBCaYMgAE29g92TYaAI44ACkATwB3AIQAkACdAKkAtgDLAOAA9QEKAR8BNAFJA2oDmgOyA9cENQRlBH4E2wUFBR4FTAWSBfMGKAaDB60IEQilCTMJywpOCtILjAxmDPcNGg1bDY4NmA8LDxwPMw+GD50P8BALEGAQexDQEr0AAQAjQ4AETFxhujYaAI4BAA0AMRmBBBIxGBBEQgNEJwcxAGcnPkkSRCNDNhoBSRUkEkQXiBKXRIgTdCcGvUUBQQAGJwZM0yNDJwZMuUhC//Y2GgFJFSQSRBc2GgJJIlmBAghLARUSRFcCAIgSYESIEz0nBk4CuyNDiBJSRIgTLycGvEgjQ4gSRUSIEyIpI2cjQ4gSOUSIExYnCiNnI0OIEixEiBMJKSJnI0OIEiBEiBL9JwoiZyNDNhoBSRUlEkSIEgtEiBLoJwdMZyNDNhoBSRUlEkSIEfZEiBLTJwlMZyNDNhoBSRUlEkSIEeFEiBK+JxxMZyNDNhoBSRUlEkSIEcxEiBKpJxJMZyNDNhoBSRUlEkSIEbdEiBKUJxNMZyNDNhoBSRUlEkSIEaJEiBJ/JxRMZyNDNhoBSRUlEkSIEY1EiBJqJxVMZyNDIkcEgABHDTYaAUcCFYHQARJEiBFuRIgSSyJbSYHUqQIPQQHwSYHUkAIPQQHnI0RLAUkkW0lFEIHklgEPRIEoW0lFDkEByksBVzAYSUUTIltJRQ1LDQ1BAbdLESRbSUUMSwwNQQGqSxGBEFtLCw1BAZ8jREsBSYEQW0lOAkURSYEYW0lFE0sCC4GQTgqB5MWDCAhLAksBDURPAkwJIQUKJxpMZ1dIIElFEiJbSUULQQFbSxAkW0lFCksKD0EBTksQgRBbSUUJSwkPQQFASxCBGFtLCA9BATUjREsBV2ggSUUWIltJRQhBAR9LFCRbSUUHSwcPQQESSxSBEFtJRQZLBg9BAQRLFIEYW0sFD0EA+SNESwFXiBhJRRUiW0lFBUEA40sTgRBbSwQNQQDYI0RLAVegGElFFCJbSUUEQQDCSxKBEFtLAw1BALcjRCcWSwFnJxdLDmcnGEsPZycdSxBnSwFJJVsnHkxnJx9LDmdJVzAYSSJbJyBMZ0kkWychTGeBEFsnIkxnJyNLC2dLEUkkWyckTGdJgRBbJyVMZ4EYWycmTGcnJ0sIZ0sVSSRbJyhMZ0mBEFsnKUxngRhbJypMZycrSwVnJywiZ0sUgRBbJy1MZycuSwRnJy8iZ0sTgRBbJzBMZ0mBuAFbJxtMZ0mBwAFbJzJMZ4HIAVsnM0xnI0MiQv9GIkL/JSJC/wQiQv7IIkL+XiJC/haID2hEiBBFI0M2GgFJFSUSRDEWIwlJOBAjEkQiKWVEFEQqMQBQvUUBFESID69EiBAbMQBMiBAxI0MiKWVEFEQqMQBQvUUBRIgQAjEAiBBZI0M2GgFJFSUSRCIpZUQURCpLAVBJvUUBRL5IJVsURIgP24gQNCNDNhoBSRUlEkQ2GgJJFSUSRDYaA0kVJBJEFzEWIwlJOBAjEkQxAEsDEkQiKWVEFEQqSwRQvUUBFESIDytEiA+XIicMZURPA08DUE8CFlBLARYnDUxQTL8jCCcMTGcjQzYaAUkVJBJEF4gOnUSID2gWJw1MUEm+RElXACBMVyAgKksCUL1FARREiA9ovEgjQzYaAUkVJBJEF4gObUSIDzgWJw1MULxII0M2GgFJFSUSRDYaAkkVJRJENhoDSRUkEkQXMRYjCUk4ECMSRDEASwMSRCIpZUQURCpLBFC9RQFEiA6FRIgO8SInDGVETwNPA1BPAhZQSwEWJw5MUEy/IwgnDExnI0M2GgFJFSQSRBeIDfdEiA7CFicOTFBJvkRXACAqSwFQvUUBRIgPCLxII0M2GgFJFSQSRBeIDc1EiA6YFicOTFC8SCNDNhoBSRUlEkQ2GgJJFSUSRCIpZUQURCpLAlBJvUUBRE8CiA2lRIgOZyJPArsjQzEWIwlJOBAjEkQiKWVEFEQnBTEAUL1FARRESTgHMgoSRDgIIicXZUQSRIgONCcFMQBQJza/MQAyBhZQgAQaxO3NTFCwI0M2GgFJFSUSRDYaAkkVIxJEIlM2GgNJFSQSRBcxACInE2VEEkQnBUsDUEm9RQFEiA3qSb5EIlMrIk8CVCNPBFRPAhZQv0mIDYEyBisiTwNUTwJMUEwWUIAEm1r3YUxQsCNDNhoBSRUlEkQ2GgJJFSQSRBc2GgNJFSQSRBeIDZ1PAksCTwKIDhpIIicaZUQORCc3gABnI0M2GgFJFSUSRDYaAkkVJBJEFzYaA0kVJBJEFzYaBEkVJRJEiA1gTwNLA08DiA3dSEsBgYBACCMJgYBACoHULwtPAoEHCCQKgZADCwgiJxplRCEFCw5EJzdMZyNDMRYjCUk4ECMSRCIpZUQURCInCmVEFESIDRCIDN4yBksBCUwiJzRlRBJAAAsiJzNlREsBD0EA7yNEJwUxAFC9RQFEJwUxAFC+RCJTFEQxAIgMhkQxATIAgQMLD0RLAUk4BzIKEkQ4CCInGGVETEsBEkQyCnMARCcGvURJgQQIIQQKSYECEkRJIwkhBAtPAkwJJwYiIQS6JwYhBE8DurExAE8DsjiBBLI1gR2yNIAECoEBQ7JCTwKyQEyyQIAEzGlOqrIashqBBrIQIrIBs7Q9MgpzAESxSwFyCERMTwMJTwNMCbIIsgcjshAisgGzMQAiJwhlRCMIJwhMZycFTFBJIiO6IiNUIky7MQAyBk8CFklPA1BPAhZQgAQNGgUZTFCwKExQsCNDIkL/DjYaAUkVJBJEFzYaAkkVJRJENhoDSRUkEkQ2GgRJFSQSRIgL3EsDSwOIDLKxTwOyGCc4shpPArIaTLIashqBBrIQIrIBs7Q+SVcABCgSRElXBABJIlmBAghMFRJEVwYAiAy2I0M2GgFJFSQSRBc2GgJJFSUSRDYaA0kVJBJENhoESRUkEkQ2GgVJIlklC4ECCEsBFRJENhoGSRUkEkQ2GgdJFSQSRIgLWEsGSwaIDC6xTwayGIAEBnP+ObIaTwWyGk8EshpPA7IaTwKyGkyyGrIagQayECKyAbO0PklXAAQoEkRJVwQASSJZgQIITBUSRFcGAIgMIiNDNhoBSRUkEkQXSTYaAklOAkkiWUlOA0mBMAuBAghPAhUSRCIpZUQUREyICjRERIgK1yJJSwIMQQAdSwJXAgBLAUlOAoEwC4EwWFcAIIgLqyMIRQFC/9yxSwOyGIAEeTVTabIaSwKyGoEGshAisgGztD5JVwAEKBJESVcEAEkiWYECCEwVEkRXBgCIC5QjQzYaAUcCFSUSRDYaAklOAkkiWUlOA0mBGAuBAghPAhUSRCIpZUQURESICk+ICz4iSUsCDEEAYEsCVwIASwFJTgKBGAuBGFhJIltJiAmFRLFLAVcICE8CVxAITwKyGCc4shpLBrIaTLIashqBBrIQIrIBs7Q+SVcABCgSRElXBABJIlmBAghMFRJEVwYAiAsDIwhFAUL/mSNDNhoBSRUkEkQXNhoCSU4CSSJZSU4DJQuBAghLARUSRCIpZUQUREsBiAkQRIgJtLFMshiABHb/THCyGrIagQayECKyAbO0PklXAAQoEkRJVwQASSJZgQIITBUSRFcGAIgLIyJJSwIMQQAYSwJXAgBLAUlOAiULJViIC1EjCEUBQv/hI0M2GgFJFSQSRBc2GgJJFSUSRDYaA0kVJBJENhoESRUkEkQ2GgVJIlklC4ECCEsBFRJEIillRBRESwSICHtEiAkfsU8EshiABKKWUYCyGksDshpPArIaTLIashqBBrIQIrIBs7Q+SVcABCgSRElXBABJIlmBAghMFRJEVwYAiAqCiArGI0M2GgFJFSQSRBeIB/dESYgIIkSICMZJiAgmSwEnOWVEJwVLAlC9RQFESwGICFxEIicEZURJSwIPRLFLAbIITwKyByOyECKyAbNMCScETGexshiABIpeTICyGoEGshAisgGztD5HAlcABCgSRElXBABJIlmBAghMFRJEVwYASRVJgQQMQQAqIkEAHoEESwFJTgIPgQRLAk8CTUsDTE8CUicPTI4BAAEAAEsBgAASRCNDSwJXBgQnEBJC/8wiSYAANhoBSRUkEkQXSYgIECc6ZUxJTwJEQQAHSYEKEkEACTEAIicVZUQSREsBSYgHR0SxshiABIAgabSyGoEGshAisgGztD5JRQZJVwAEKBJESVcEAEkiWYECCEwVEkRXBgBJRQUVSUUEgQQMQQBfIkEAToEESwNJTgIPgQRLAk8CTUsFTE8CUicPgCpUaGVyZSBhcmUgdm90ZXJzIGFzc2lnbmVkIHRvIHRoaXMgcHJvcG9zYWxPAo4CAAIAAQAAAEsDgAASREsBiAcyI0NLBFcGBCcQEkL/lzYaAUkVJBJEF0kiKWVEFERJiAaLRIgHL0mIBo8xABJEsbIYgARzcTIashqBBrIQIrIBs7Q+RwJXAAQoEkRJVwQASSJZgQIITBUSRFcGAEkVSYEEDEEALyJBAB6BBEsBSU4CD4EESwJPAk1LA0xPAlInD0yOAQABAABLAYAAEkRLA4gGoSNDSwJXBgQnEBJC/8cxFiMJSTgQIxJESTgHMgoSRIgGoiInBGVETDgICCcETGcjQzYaAUkVJBJEF4gFpkQiJwRlREsBD0QxATIAgQILD0SIBnEiJwRlREsBCScETGexIicHZUSyB7III7IQIrIBsyNDNhoBSRUkEkQXiAVuRDEBMgCBAgsPRIgFtEsBD0SIBjKxIicJZUSyB7III7IQIrIBsyNDiAWXFihMULAjQyIpZUQiJwplRCInB2VEIicJZUQiJxxlRCInEmVEIicTZUQiJxRlRCInFWVEIicWZUQiJxdlRCInGGVEIicdZUQiJx5lRCInH2VEIicgZUQiJyFlRCInImVETwIWTwIWUEwWUCInI2VEIickZUQiJyVlRCInJmVETwMWTwMWUE8CFlBMFlAiJydlRCInKGVEIicpZUQiJyplRE8DFk8DFlBPAhZQTBZQIicrZUQiJyxlRCInLWVETwIWTwIWUEwWUCInLmVEIicvZUQiJzBlRE8CFk8CFlBMFlAiJwRlRCInCGVEIic7ZUQiJzFlRCInGWVEIicbZUQiJzJlRCInM2VEIic0ZUQrIk8eVCNPHVRPG1BPGlBPGVBPGFBPF1BPFlBPFVBPFBZQTxMWUE8SFlBPERZQTxAWUE8PFlBPDlBPDVBPDFBPC1BPClBPCRZQTwgWUE8HUE8GFlBPBRZQTwQWUE8DFlBPAhZQTBZQKExQsCNDIic1ZSc8TgJNFxYoTFCwI0M2GgFJFSUSRIgGoysiTwJUUChMULAjQzYaAUcCIllJTgIlC4ECCEwVEkQnESJJSwMMQQAvSwNXAgBLAUlOAiULJViIBmkrIk8CVFBLA0kiWSMIFlcGAFwATFBFAyMIRQFC/8ooSwJQsCNDNhoBSRUlEkSIBpErIk8CVFAoTFCwI0M2GgFHAiJZSU4CJQuBAghMFRJEJxEiSUsDDEEAL0sDVwIASwFJTgIlCyVYiAZXKyJPAlRQSwNJIlkjCBZXBgBcAExQRQMjCEUBQv/KKEsCULAjQzYaAUkVJBJEFycNTIgGRCsiTwJUUChMULAjQzYaAUcCIllJTgIkC4ECCEwVEkQnESJJSwMMQQAxSwNXAgBLAUlOAiQLWycNTIgGCCsiTwJUUEsDSSJZIwgWVwYAXABMUEUDIwhFAUL/yChLAlCwI0M2GgFJFSQSRBcnDkyIBdQrIk8CVFAoTFCwI0M2GgFHAiJZSU4CJAuBAghMFRJEJxEiSUsDDEEAMUsDVwIASwFJTgIkC1snDkyIBZgrIk8CVFBLA0kiWSMIFlcGAFwATFBFAyMIRQFC/8goSwJQsCNDIoAANhoBRwIiWUlOAkkkC4ECCE8CFRJEgQYORCcRIklLAwxBAcBLA1cCAEsBJAtbSUUGcgdMRQdBAAhLBTIKE0EAJIGaAa9JFYGaARJESwJJIlkjCBZXBgBcAExQRQJJIwhFAUL/uEsESYgB1EsBJzplSExLAoAJZmluYWxpemVkZUgiE0sDgBBmdW5kaW5nX2NhdGVnb3J5ZUhOBEsDJzllSE4FSwOADWxvY2tlZF9hbW91bnRlSE4GSwOADm9wZW5fdGltZXN0YW1wZUhOB0sDgBRzdWJtaXNzaW9uX3RpbWVzdGFtcGVITghLA4AWdm90ZV9vcGVuaW5nX3RpbWVzdGFtcGVITglLAycZZUhOCksDgBBxdW9ydW1fdGhyZXNob2xkZUhOC0sDgBl3ZWlnaHRlZF9xdW9ydW1fdGhyZXNob2xkZUhODEsDgA12b3RlZF9tZW1iZXJzZUhODUsDgBFib3ljb3R0ZWRfbWVtYmVyc2VITg5LA4AJYXBwcm92YWxzZUhOD0sDgApyZWplY3Rpb25zZUhOEE8DgAVudWxsc2VIThCAAYBPAlBPAhZQKyJPA1RQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQTBZQQv5oKEsCULAjQzYaAUkVJBJEF4gAPEQjQzEAIicHZUQSiTEAIicJZUQSiTEAIicSZUQSiYoBATEAi/8SQAAPMQAqi/9QvkRXACASQQACI4kiiYoBAYv/cgdEMgoSiYoBAYv/gAhwcm9wb3NlcmVESRUlEkSJMgpzAEQyCnMBRAkiJwRlREoNRAmJigEBi/84BzIKEkEAD4v/OAgiJxZlRBJBAAIjiSKJigEBJwWL/1BJvkQjU0EAD4sAvkQjWzIHDUEAAyNMiSJC//oyBiInMmVESwFMGAmJigEAIicIZUQjCScITGeL/4j/cycFTFBJIiO6IklUIky7iSInNWUnPE4CTRcjCBYnNUsBZ4AE8Ngt4ExQsImKAgAqi/5QSb1FARREIicbZUQyBkwWi/9MUCIWUEwWUL8iJwtlRCMIJwtMZzIGi/6L/1BMFlCABCQf3FFMULCJigEAKov/UEm9RQFEvEgiJwtlRCMJJwtMZzIGFov/TFCABHuiWANMULCJigMBMQAiJxRlRBJEi/5Ei/9EJzuL/WcnMYv+ZycZi/9niP8nJzRMZ4v+FkmTJQ5EVwQEi/8WSZMlDkRXBAQyBov9TwNQTwJQTBZQgASHm1apTFCwi/2JigIAIillRBREi/6I/m1Ei/+IAAGJigEAKov/UEm9RQFEi/+I/jdEIicbZUQWSwElTwK7MgcWgShMu4mKAQCL/xVJgQQMQQByIkEAZ4EEiwBJTgIPgQRLAk8CTYv/TE8CUicPJz2CAxNWb3RlciBhbHJlYWR5IHZvdGVkDVZvdGVzIGludmFsaWQVVm90aW5nIFBlcmlvZCBFeHBpcmVkTwWOBQAFAAQAAwACAAEAAAAAAACL/4AAEkSJi/9XAAQnEBJC/4SKAQCL/xVJgQQMQQAvIkEAJIEEiwBJTgIPgQRLAk8CTYv/TE8CUicPJz1PAo4CAAIAAQAAAIv/gAASRImL/1cABCcQEkL/x4oBACqL/1BJvUUBQQAliwC+RCVbQQAciwBJvkQlWyMJFksBJU8Cu75IJVtAAAWL/4j+QImKAQIqi/9QSb1JTwJIQQALiwC+RIsBTwNPA4mAOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQv+8igECJwWL/1BJvUlPAkhBAAuLAL5EiwFPA08DiSc2Qv/0igICi/8Wi/5MUEm9SU8CSEEAC4sAvkSLAU8DTwOJgEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABC/6w=", "clear": "CoEBQw=="}, "desc": "xGov Registry Contract", "events": [{"args": [{"type": "uint64", "name": "version"}], "name": "StateVersion", "desc": "The state of the xGov Registry (or of the Proposal) has been updated"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "address", "name": "delegate"}, {"type": "uint64", "name": "round"}], "name": "XGovSubscribed", "desc": "An xGov subscribed (either through self-onboarding or managed onboarding)"}, {"args": [{"type": "address", "name": "xgov"}, {"type": "uint64", "name": "round"}], "name": "XGovUnsubscribed", "desc": "An xGov unsubscribed (either through self-onboarding or managed onboarding)"}, {"args": [{"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "ProposerSubscribed", "desc": "A Proposer subscribed"}, {"args": [{"type": "address", "name": "proposer"}, {"type": "bool", "name": "valid_kyc"}, {"type": "uint64", "name": "round"}], "name": "ProposerKYC", "desc": "A Proposer KYC status update"}, {"args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint32", "name": "size"}, {"type": "uint32", "name": "votes"}, {"type": "uint64", "name": "round"}], "name": "NewCommittee", "desc": "A new xGov Committee has been elected"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "proposer"}, {"type": "uint64", "name": "round"}], "name": "NewProposal", "desc": "A new Proposal has been opened"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAyMDQ4IDE4OTAwCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkgMHg3OCAweDAwIDB4NmY3NTc0NzM3NDYxNmU2NDY5NmU2NzVmNjY3NTZlNjQ3MyAweDcwIDB4NzA2MSAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MiAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMgMHg3ODY3NmY3NjVmNzA2MTc5NmY3MiAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczIDB4Nzg2NzZmNzY3MyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0IDB4NzIgMHg3Mjc1ICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIiAiRVJSOiIgMHgwMDAwIDB4Nzg2NzZmNzY1ZjczNzU2MjczNjM3MjY5NjI2NTcyIDB4NmI3OTYzNWY3MDcyNmY3NjY5NjQ2NTcyIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDYxNmU2MTY3NjU3MiAweDc4Njc2Zjc2NWY2NDYxNjU2ZDZmNmUgMHg3ODY3NmY3NjVmNjY2NTY1IDB4NzA3MjZmNzA2ZjczNjU3MjVmNjY2NTY1IDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NSAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MyAweDZkNjE3ODVmNjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MzY5N2E2NSAweDYxNjI3MzY1NmU2MzY1NWY3NDZmNmM2NTcyNjE2ZTYzNjUgMHg3ODY3NmY3NjVmNjM2Zjc1NmU2MzY5NmMgMHg2NDYxNjU2ZDZmNmU1ZjZmNzA2NTcyNjE3NDY5NmY2ZTVmNjY3NTZlNjQ2OTZlNjc1ZjYyNzA3MyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMgMHg2ZDY5NmU1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0IDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNzM2ZDYxNmM2YyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZkNjU2NDY5NzU2ZCAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZjNjE3MjY3NjUgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NSAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZCAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NSAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1IDB4NzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjIDB4NzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQgMHg3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZCAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NSAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMgMHg2NzZmNzY2NTcyNmU2MTZlNjM2NTVmNzA2NTcyNjk2ZjY0IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2NzcyNjE2MzY1NWY3MDY1NzI2OTZmNjQgMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZjNjE3Mzc0NWY2MTZlNjM2ODZmNzIgMHg3Mzc0NjE3NDY1NWY3NjY1NzI3MzY5NmY2ZSAweDAwMDAwMDAwMDAwMDAwMDAwMCAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzI2ZjZmNzQgMHgxODQxYTBkMiAweDcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0IDB4NzM3NDYxNzQ3NTczIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0IDB4MDAwMDAwMDAwMDAwMDAwMCAiVm90ZXIgbm90IGZvdW5kIiBUTVBMX2VudHJvcHkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5LTYwCiAgICAvLyAjIFByZWNvbmRpdGlvbnMKICAgIC8vIGFzc2VydCBUeG4uZ2xvYmFsX251bV9ieXRlX3NsaWNlID09IGNmZy5HTE9CQUxfQllURVMsIGVyci5XUk9OR19HTE9CQUxfQllURVMKICAgIHR4biBHbG9iYWxOdW1CeXRlU2xpY2UKICAgIHB1c2hpbnQgMjgKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgR2xvYmFsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxCiAgICAvLyBhc3NlcnQgVHhuLmdsb2JhbF9udW1fdWludCA9PSBjZmcuR0xPQkFMX1VJTlRTLCBlcnIuV1JPTkdfR0xPQkFMX1VJTlRTCiAgICB0eG4gR2xvYmFsTnVtVWludAogICAgcHVzaGludCAzNgogICAgPT0KICAgIGFzc2VydCAvLyBXcm9uZyBHbG9iYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIGFzc2VydCBUeG4ubG9jYWxfbnVtX2J5dGVfc2xpY2UgPT0gY2ZnLkxPQ0FMX0JZVEVTLCBlcnIuV1JPTkdfTE9DQUxfQllURVMKICAgIHR4biBMb2NhbE51bUJ5dGVTbGljZQogICAgIQogICAgYXNzZXJ0IC8vIFdyb25nIExvY2FsIEJ5dGVzIGFsbG9jYXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBhc3NlcnQgVHhuLmxvY2FsX251bV91aW50ID09IGNmZy5MT0NBTF9VSU5UUywgZXJyLldST05HX0xPQ0FMX1VJTlRTCiAgICB0eG4gTG9jYWxOdW1VaW50CiAgICAhCiAgICBhc3NlcnQgLy8gV3JvbmcgTG9jYWwgVUludHMgYWxsb2NhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjUtNjYKICAgIC8vICMgUm9sZS1CYXNlZCBBY2Nlc3MgQ29udHJvbCAoUkJBQykKICAgIC8vIHNlbGYueGdvdl9tYW5hZ2VyID0gR2xvYmFsU3RhdGUoQWNjb3VudCgpLCBrZXk9Y2ZnLkdTX0tFWV9YR09WX01BTkFHRVIpCiAgICBieXRlYyA3IC8vIDB4Nzg2NzZmNzY1ZjZkNjE2ZTYxNjc2NTcyCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NwogICAgLy8gc2VsZi54Z292X3N1YnNjcmliZXIgPSBHbG9iYWxTdGF0ZShBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX1hHT1ZfU1VCU0NSSUJFUikKICAgIGJ5dGVjIDE4IC8vIDB4Nzg2NzZmNzY1ZjczNzU2MjczNjM3MjY5NjI2NTcyCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2OAogICAgLy8gc2VsZi54Z292X3BheW9yID0gR2xvYmFsU3RhdGUoQWNjb3VudCgpLCBrZXk9Y2ZnLkdTX0tFWV9YR09WX1BBWU9SKQogICAgYnl0ZWMgOSAvLyAweDc4Njc2Zjc2NWY3MDYxNzk2ZjcyCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2OQogICAgLy8gc2VsZi54Z292X2NvdW5jaWwgPSBHbG9iYWxTdGF0ZShBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX1hHT1ZfQ09VTkNJTCkKICAgIGJ5dGVjIDI4IC8vIDB4Nzg2NzZmNzY1ZjYzNmY3NTZlNjM2OTZjCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5reWNfcHJvdmlkZXIgPSBHbG9iYWxTdGF0ZShBY2NvdW50KCksIGtleT1jZmcuR1NfS0VZX0tZQ19QUk9WSURFUikKICAgIGJ5dGVjIDE5IC8vIDB4NmI3OTYzNWY3MDcyNmY3NjY5NjQ2NTcyCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MgogICAgLy8gQWNjb3VudCgpLCBrZXk9Y2ZnLkdTX0tFWV9DT01NSVRURUVfTUFOQUdFUgogICAgYnl0ZWMgMjAgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjE2ZTYxNjc2NTcyCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxLTczCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tYW5hZ2VyID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgQWNjb3VudCgpLCBrZXk9Y2ZnLkdTX0tFWV9DT01NSVRURUVfTUFOQUdFUgogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBzZWxmLnhnb3ZfZGFlbW9uID0gR2xvYmFsU3RhdGUoQWNjb3VudCgpLCBrZXk9Y2ZnLkdTX0tFWV9YR09WX0RBRU1PTikKICAgIGJ5dGVjIDIxIC8vIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzgKICAgIC8vIEZhbHNlLCBrZXk9Y2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlkgICMgbm9xYTogRkJUMDAzCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzYtNzkKICAgIC8vICMgUmVnaXN0cnkgQ29udHJvbCBTdGF0ZXMKICAgIC8vIHNlbGYucGF1c2VkX3JlZ2lzdHJ5ID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgRmFsc2UsIGtleT1jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSAgIyBub3FhOiBGQlQwMDMKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MQogICAgLy8gRmFsc2UsIGtleT1jZmcuR1NfS0VZX1BBVVNFRF9QUk9QT1NBTFMgICMgbm9xYTogRkJUMDAzCiAgICBieXRlYyAxMCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODAtODIKICAgIC8vIHNlbGYucGF1c2VkX3Byb3Bvc2FscyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEZhbHNlLCBrZXk9Y2ZnLkdTX0tFWV9QQVVTRURfUFJPUE9TQUxTICAjIG5vcWE6IEZCVDAwMwogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0LTg1CiAgICAvLyAjIHhHb3YgVHJlYXN1cnkKICAgIC8vIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfT1VUU1RBTkRJTkdfRlVORFMpCiAgICBieXRlYyA0IC8vIDB4NmY3NTc0NzM3NDYxNmU2NDY5NmU2NzVmNjY3NTZlNjQ3MwogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4Ny04OAogICAgLy8gIyBGZWVzCiAgICAvLyBzZWxmLnhnb3ZfZmVlID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1hHT1ZfRkVFKQogICAgYnl0ZWMgMjIgLy8gMHg3ODY3NmY3NjVmNjY2NTY1CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLnByb3Bvc2VyX2ZlZSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9QUk9QT1NFUl9GRUUpCiAgICBieXRlYyAyMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzI1ZjY2NjU2NQogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MAogICAgLy8gc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9PUEVOX1BST1BPU0FMX0ZFRSkKICAgIGJ5dGVjIDI0IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MgogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMKICAgIGJ5dGVjIDI5IC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MS05MwogICAgLy8gc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NQogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1BST1BPU0FMX0NPTU1JVE1FTlRfQlBTCiAgICBieXRlYyAzMCAvLyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NC05NgogICAgLy8gc2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2JwcyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9QUk9QT1NBTF9DT01NSVRNRU5UX0JQUwogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMAogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX01JTl9SRVFVRVNURURfQU1PVU5UCiAgICBieXRlYyAzMSAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5OC0xMDEKICAgIC8vICMgUmVxdWVzdGVkIEFtb3VudCBMaW1pdHMKICAgIC8vIHNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDQKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTAogICAgYnl0ZWMgMzIgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzLTEwNQogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNwogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX01FRElVTQogICAgYnl0ZWMgMzMgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDYtMTA4CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0KICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTAKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRQogICAgYnl0ZWMgMzQgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5LTExMQogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNQogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fU01BTEwKICAgIGJ5dGVjIDM1IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTMtMTE2CiAgICAvLyAjIFRpbWUgTGltaXRzCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9TTUFMTAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOAogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fTUVESVVNCiAgICBieXRlYyAzNiAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTctMTE5CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fTUVESVVNCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9MQVJHRQogICAgYnl0ZWMgMzcgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMC0xMjIKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI0CiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UKICAgIGJ5dGVjIDM4IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMy0xMjUKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjcKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fU01BTEwKICAgIGJ5dGVjIDM5IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2LTEyOAogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1NNQUxMCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX01FRElVTQogICAgYnl0ZWMgNDAgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOS0xMzEKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX0xBUkdFCiAgICBieXRlYyA0MSAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMi0xMzQKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9MQVJHRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9YTEFSR0UKICAgIGJ5dGVjIDQyIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzUtMTM3CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1hMQVJHRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOS0xNDAKICAgIC8vICMgUXVvcnVtcwogICAgLy8gc2VsZi5xdW9ydW1fc21hbGwgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUVVPUlVNX1NNQUxMKQogICAgYnl0ZWMgNDMgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUVVPUlVNX01FRElVTQogICAgYnl0ZWMgNDQgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MS0xNDMKICAgIC8vIHNlbGYucXVvcnVtX21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9RVU9SVU1fTUVESVVNCiAgICAvLyApICAjIE5vIGxvbmdlciB1c2VkCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0CiAgICAvLyBzZWxmLnF1b3J1bV9sYXJnZSA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9RVU9SVU1fTEFSR0UpCiAgICBieXRlYyA0NSAvLyAweDcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDgKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwKICAgIGJ5dGVjIDQ2IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2LTE0OQogICAgLy8gIyBXZWlnaHRlZCBRdW9ydW1zCiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTEKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTUVESVVNICAjIE5vIGxvbmdlciB1c2VkCiAgICBieXRlYyA0NyAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwLTE1MgogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1dFSUdIVEVEX1FVT1JVTV9NRURJVU0gICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTQKICAgIC8vIFVJbnQ2NCgpLCBrZXk9Y2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTEFSR0UKICAgIGJ5dGVjIDQ4IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUzLTE1NQogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX0xBUkdFCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX0NPTU1JVFRFRV9NRU1CRVJTKQogICAgYnl0ZWMgNDkgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MAogICAgLy8gc2VsZi5jb21taXR0ZWVfdm90ZXMgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTKQogICAgYnl0ZWMgMjUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYyCiAgICAvLyBVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfTUFYX0NPTU1JVFRFRV9TSVpFCiAgICBieXRlYyAyNiAvLyAweDZkNjE3ODVmNjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MzY5N2E2NQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MS0xNjMKICAgIC8vIHNlbGYubWF4X2NvbW1pdHRlZV9zaXplID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1jZmcuR1NfS0VZX01BWF9DT01NSVRURUVfU0laRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NS0xNjYKICAgIC8vICMgQ291bnRlcnMKICAgIC8vIHNlbGYueGdvdnMgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfWEdPVlMpCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY3CiAgICAvLyBzZWxmLnBlbmRpbmdfcHJvcG9zYWxzID0gR2xvYmFsU3RhdGUoVUludDY0KCksIGtleT1jZmcuR1NfS0VZX1BFTkRJTkdfUFJPUE9TQUxTKQogICAgYnl0ZWMgOCAvLyAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY4CiAgICAvLyBzZWxmLnJlcXVlc3RfaWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoKSwga2V5PWNmZy5HU19LRVlfUkVRVUVTVF9JRCkKICAgIGJ5dGVjIDEyIC8vIDB4NzI2NTcxNzU2NTczNzQ1ZjY5NjQKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0Ny01NQogICAgLy8gY2xhc3MgWEdvdlJlZ2lzdHJ5KAogICAgLy8gICAgIFhHb3ZSZWdpc3RyeUludGVyZmFjZSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoCiAgICAvLyAgICAgICAgIGdsb2JhbF9ieXRlcz1jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgICAgICBnbG9iYWxfdWludHM9Y2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICAgICAgbG9jYWxfYnl0ZXM9Y2ZnLkxPQ0FMX0JZVEVTLAogICAgLy8gICAgICAgICBsb2NhbF91aW50cz1jZmcuTE9DQUxfVUlOVFMsCiAgICAvLyAgICAgKSwKICAgIC8vICk6CiAgICBwdXNoYnl0ZXMgMHg0OTU2YzFhYiAvLyBtZXRob2QgInVwZGF0ZV94Z292X3JlZ2lzdHJ5KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfeGdvdl9yZWdpc3RyeV9yb3V0ZUA0CgptYWluX3N3aXRjaF9jYXNlX25leHRANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3LTU1CiAgICAvLyBjbGFzcyBYR292UmVnaXN0cnkoCiAgICAvLyAgICAgWEdvdlJlZ2lzdHJ5SW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BANjQKICAgIHB1c2hieXRlc3MgMHg5NTljNDc2MiAweDZjMWY1NjRkIDB4ZTEwYTUxMmUgMHg4NmY3ZTBlNiAweDM5ZTI2ZDhhIDB4OTgzNTJlODYgMHhmYTRlZDZlMiAweGQ2YzljYzFhIDB4NWM0ODQwNTUgMHgzN2Q2YWRmMSAweGQ0MjE2YjZlIDB4YmE4NTIwZjIgMHgxNjc3YjMwZSAweDg0YjdkMjY4IDB4YWY3ZjE4NjAgMHhhMDgyY2VmOCAweGRmMzlmZGI5IDB4Y2EwZjZhM2EgMHg0NTA3NzM5MCAweDNjMzFiYzAyIDB4MGQyYzc4OTEgMHg5M2ZhY2RiYSAweGNlOGIzYTFjIDB4ZmFlYTA4MWYgMHgwZGEyNzg4NSAweDdhNGZlZTQzIDB4NTJkZDEwZDcgMHhkNGQzN2E2NCAweGE5YmI3MmI5IDB4MzQzNDlkY2MgMHgxNThmOGRkNiAweDI5MGYzMmEyIDB4Njg3Y2IzNTYgMHg1YjA1MzkwZiAweDVmZTI1OTM1IDB4NzYxNmEyYWUgMHhkYjI3YjlhZiAweGY1OTEwNzU2IDB4NjU2MTBhOWYgMHhmZGM2OTVjMiAweGJhOTBhYjU0IDB4MWE2NzRiNDUgMHhhOGQ1YWU5NCAweDZhZTVlYjQ2IDB4Mjk1NzAxM2IgMHgyNzYzMGQ2NSAweGQxZDdmMmFhIDB4ODI0Zjk4YmMgMHg2ZTczNWNmZiAweDQ5NTQ4YmEwIDB4MjlhY2RhMTMgMHg4MjY3ODRmNiAweGI2OGZjYjk1IDB4ZDQ5NWFiY2YgMHgyNjk4MzIwMCAweGRiZDgzZGQ5IC8vIG1ldGhvZCAiaW5pdF9wcm9wb3NhbF9jb250cmFjdCh1aW50NjQpdm9pZCIsIG1ldGhvZCAibG9hZF9wcm9wb3NhbF9jb250cmFjdCh1aW50NjQsYnl0ZVtdKXZvaWQiLCBtZXRob2QgImRlbGV0ZV9wcm9wb3NhbF9jb250cmFjdF9ib3goKXZvaWQiLCBtZXRob2QgInBhdXNlX3JlZ2lzdHJ5KCl2b2lkIiwgbWV0aG9kICJwYXVzZV9wcm9wb3NhbHMoKXZvaWQiLCBtZXRob2QgInJlc3VtZV9yZWdpc3RyeSgpdm9pZCIsIG1ldGhvZCAicmVzdW1lX3Byb3Bvc2Fscygpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfbWFuYWdlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF9wYXlvcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF94Z292X2NvdW5jaWwoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzZXRfeGdvdl9zdWJzY3JpYmVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X2t5Y19wcm92aWRlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF9jb21taXR0ZWVfbWFuYWdlcihhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF94Z292X2RhZW1vbihhZGRyZXNzKXZvaWQiLCBtZXRob2QgImNvbmZpZ194Z292X3JlZ2lzdHJ5KCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjRbM10sdWludDY0WzRdLHVpbnQ2NFs0XSx1aW50NjRbM10sdWludDY0WzNdLHVpbnQ2NCx1aW50NjQsdWludDY0KSl2b2lkIiwgbWV0aG9kICJzdWJzY3JpYmVfeGdvdihhZGRyZXNzLHBheSl2b2lkIiwgbWV0aG9kICJ1bnN1YnNjcmliZV94Z292KCl2b2lkIiwgbWV0aG9kICJ1bnN1YnNjcmliZV9hYnNlbnRlZShhZGRyZXNzKXZvaWQiLCBtZXRob2QgInJlcXVlc3Rfc3Vic2NyaWJlX3hnb3YoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV9zdWJzY3JpYmVfeGdvdih1aW50NjQpdm9pZCIsIG1ldGhvZCAicmVqZWN0X3N1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3YoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV91bnN1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWplY3RfdW5zdWJzY3JpYmVfeGdvdih1aW50NjQpdm9pZCIsIG1ldGhvZCAic2V0X3ZvdGluZ19hY2NvdW50KGFkZHJlc3MsYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzdWJzY3JpYmVfcHJvcG9zZXIocGF5KXZvaWQiLCBtZXRob2QgInNldF9wcm9wb3Nlcl9reWMoYWRkcmVzcyxib29sLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJkZWNsYXJlX2NvbW1pdHRlZShieXRlWzMyXSx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgImRlY2xhcmVfY29tbWl0dGVlX3dpdGhfcm9vdChieXRlWzMyXSx1aW50NjQsdWludDY0LGJ5dGVbMzJdKXZvaWQiLCBtZXRob2QgIm9wZW5fcHJvcG9zYWwocGF5KXVpbnQ2NCIsIG1ldGhvZCAidm90ZV9wcm9wb3NhbCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgInZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZih1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0LGJ5dGVbMzJdW10sdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ2b3RlX3Byb3Bvc2FsX2JhdGNoKHVpbnQ2NCwoYWRkcmVzcyx1aW50NjQsdWludDY0KVtdKXZvaWQiLCBtZXRob2QgInZvdGVfcHJvcG9zYWxzKGFkZHJlc3MsKHVpbnQ2NCx1aW50NjQsdWludDY0KVtdKXZvaWQiLCBtZXRob2QgInVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWwodWludDY0LGFkZHJlc3NbXSl2b2lkIiwgbWV0aG9kICJ1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3dpdGhfcHJvb2YodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCxieXRlWzMyXVtdKXZvaWQiLCBtZXRob2QgInBheV9ncmFudF9wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZmluYWxpemVfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImRyb3BfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImRlcG9zaXRfZnVuZHMocGF5KXZvaWQiLCBtZXRob2QgIndpdGhkcmF3X2Z1bmRzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhd19hdmFpbGFibGVfZnVuZHModWludDY0KXZvaWQiLCBtZXRob2QgImdldF9hdmFpbGFibGVfZnVuZHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXRlKCkoYm9vbCxib29sLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0WzNdLHVpbnQ2NFs0XSx1aW50NjRbNF0sdWludDY0WzNdLHVpbnQ2NFszXSx1aW50NjQsdWludDY0LGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3N0YXRlX3ZlcnNpb24oKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3hnb3ZfYm94ZXMoYWRkcmVzc1tdKSgoYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCksYm9vbClbXSIsIG1ldGhvZCAiZ2V0X3Byb3Bvc2VyX2JveChhZGRyZXNzKSgoYm9vbCxib29sLHVpbnQ2NCksYm9vbCkiLCBtZXRob2QgImdldF9wcm9wb3Nlcl9ib3hlcyhhZGRyZXNzW10pKChib29sLGJvb2wsdWludDY0KSxib29sKVtdIiwgbWV0aG9kICJnZXRfcmVxdWVzdF9ib3godWludDY0KSgoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCksYm9vbCkiLCBtZXRob2QgImdldF9yZXF1ZXN0X2JveGVzKHVpbnQ2NFtdKSgoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCksYm9vbClbXSIsIG1ldGhvZCAiZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94KHVpbnQ2NCkoKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpLGJvb2wpIiwgbWV0aG9kICJnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hlcyh1aW50NjRbXSkoKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpLGJvb2wpW10iLCBtZXRob2QgImdldF9wcm9wb3NhbHNfc3VtbWFyeSh1aW50NjRbXSkoYm9vbCxhZGRyZXNzLHVpbnQ2NCxib29sLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpW10iLCBtZXRob2QgImlzX3Byb3Bvc2FsKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJvcF91cCgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGluaXRfcHJvcG9zYWxfY29udHJhY3QgbG9hZF9wcm9wb3NhbF9jb250cmFjdCBkZWxldGVfcHJvcG9zYWxfY29udHJhY3RfYm94IHBhdXNlX3JlZ2lzdHJ5IHBhdXNlX3Byb3Bvc2FscyByZXN1bWVfcmVnaXN0cnkgcmVzdW1lX3Byb3Bvc2FscyBzZXRfeGdvdl9tYW5hZ2VyIHNldF9wYXlvciBzZXRfeGdvdl9jb3VuY2lsIHNldF94Z292X3N1YnNjcmliZXIgc2V0X2t5Y19wcm92aWRlciBzZXRfY29tbWl0dGVlX21hbmFnZXIgc2V0X3hnb3ZfZGFlbW9uIGNvbmZpZ194Z292X3JlZ2lzdHJ5IHN1YnNjcmliZV94Z292IHVuc3Vic2NyaWJlX3hnb3YgdW5zdWJzY3JpYmVfYWJzZW50ZWUgcmVxdWVzdF9zdWJzY3JpYmVfeGdvdiBhcHByb3ZlX3N1YnNjcmliZV94Z292IHJlamVjdF9zdWJzY3JpYmVfeGdvdiByZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3YgYXBwcm92ZV91bnN1YnNjcmliZV94Z292IHJlamVjdF91bnN1YnNjcmliZV94Z292IHNldF92b3RpbmdfYWNjb3VudCBzdWJzY3JpYmVfcHJvcG9zZXIgc2V0X3Byb3Bvc2VyX2t5YyBkZWNsYXJlX2NvbW1pdHRlZSBkZWNsYXJlX2NvbW1pdHRlZV93aXRoX3Jvb3Qgb3Blbl9wcm9wb3NhbCB2b3RlX3Byb3Bvc2FsIHZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZiB2b3RlX3Byb3Bvc2FsX2JhdGNoIHZvdGVfcHJvcG9zYWxzIHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWwgdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF93aXRoX3Byb29mIHBheV9ncmFudF9wcm9wb3NhbCBmaW5hbGl6ZV9wcm9wb3NhbCBkcm9wX3Byb3Bvc2FsIGRlcG9zaXRfZnVuZHMgd2l0aGRyYXdfZnVuZHMgd2l0aGRyYXdfYXZhaWxhYmxlX2Z1bmRzIGdldF9hdmFpbGFibGVfZnVuZHMgZ2V0X3N0YXRlIGdldF9zdGF0ZV92ZXJzaW9uIGdldF94Z292X2JveCBnZXRfeGdvdl9ib3hlcyBnZXRfcHJvcG9zZXJfYm94IGdldF9wcm9wb3Nlcl9ib3hlcyBnZXRfcmVxdWVzdF9ib3ggZ2V0X3JlcXVlc3RfYm94ZXMgZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94IGdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveGVzIGdldF9wcm9wb3NhbHNfc3VtbWFyeSBpc19wcm9wb3NhbCBtYWluX29wX3VwX3JvdXRlQDYyCiAgICBlcnIKCm1haW5fb3BfdXBfcm91dGVANjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfTm9PcEA2NDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3LTU1CiAgICAvLyBjbGFzcyBYR292UmVnaXN0cnkoCiAgICAvLyAgICAgWEdvdlJlZ2lzdHJ5SW50ZXJmYWNlLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscygKICAgIC8vICAgICAgICAgZ2xvYmFsX2J5dGVzPWNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgICAgIGdsb2JhbF91aW50cz1jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgICAgICBsb2NhbF9ieXRlcz1jZmcuTE9DQUxfQllURVMsCiAgICAvLyAgICAgICAgIGxvY2FsX3VpbnRzPWNmZy5MT0NBTF9VSU5UUywKICAgIC8vICAgICApLAogICAgLy8gKToKICAgIHB1c2hieXRlcyAweDRjNWM2MWJhIC8vIG1ldGhvZCAiY3JlYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggY3JlYXRlCiAgICBlcnIKCm1haW5fdXBkYXRlX3hnb3ZfcmVnaXN0cnlfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA0IC8vIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICYmCiAgICBhc3NlcnQKICAgIGIgdXBkYXRlX3hnb3ZfcmVnaXN0cnkKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDkzCiAgICAvLyBzZWxmLnhnb3ZfbWFuYWdlci52YWx1ZSA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjIDcgLy8gMHg3ODY3NmY3NjVmNmQ2MTZlNjE2NzY1NzIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjEKICAgIC8vIHJldHVybiBUZW1wbGF0ZVZhcltCeXRlc10oImVudHJvcHkiKSAgIyB0cmljayB0byBhbGxvdyBmcmVzaCBkZXBsb3ltZW50CiAgICBieXRlYyA2MiAvLyBUTVBMX2VudHJvcHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NAogICAgLy8gYXNzZXJ0IHNlbGYuZW50cm9weSgpID09IFRlbXBsYXRlVmFyW0J5dGVzXSgiZW50cm9weSIpCiAgICBkdXAKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmluaXRfcHJvcG9zYWxfY29udHJhY3Rbcm91dGluZ10oKSAtPiB2b2lkOgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDk2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTA4CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMAogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMgogICAgLy8gaWYgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtOgogICAgYnl0ZWMgNiAvLyAweDcwNjEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogaW5pdF9wcm9wb3NhbF9jb250cmFjdF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTEzCiAgICAvLyBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0ucmVzaXplKHNpemUpCiAgICBieXRlYyA2IC8vIDB4NzA2MQogICAgc3dhcAogICAgYm94X3Jlc2l6ZQoKaW5pdF9wcm9wb3NhbF9jb250cmFjdF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0OTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTE1LTUxNgogICAgLy8gIyBJbml0aWFsaXplIHRoZSBQcm9wb3NhbCBBcHByb3ZhbCBQcm9ncmFtIGNvbnRyYWN0CiAgICAvLyBfY3JlYXRlZCA9IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5jcmVhdGUoc2l6ZT1zaXplKQogICAgYnl0ZWMgNiAvLyAweDcwNjEKICAgIHN3YXAKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgYiBpbml0X3Byb3Bvc2FsX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5sb2FkX3Byb3Bvc2FsX2NvbnRyYWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKbG9hZF9wcm9wb3NhbF9jb250cmFjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTMxCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzMwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNS01MzYKICAgIC8vICMgTG9hZCB0aGUgUHJvcG9zYWwgQXBwcm92YWwgUHJvZ3JhbSBjb250cmFjdAogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLnJlcGxhY2Uoc3RhcnRfaW5kZXg9b2Zmc2V0LCB2YWx1ZT1kYXRhKQogICAgYnl0ZWMgNiAvLyAweDcwNjEKICAgIGNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1MTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmRlbGV0ZV9wcm9wb3NhbF9jb250cmFjdF9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpkZWxldGVfcHJvcG9zYWxfY29udHJhY3RfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ3CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0OQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MS01NTIKICAgIC8vICMgRGVsZXRlIHRoZSBQcm9wb3NhbCBBcHByb3ZhbCBQcm9ncmFtIGNvbnRyYWN0IGJveAogICAgLy8gZGVsIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS52YWx1ZQogICAgYnl0ZWMgNiAvLyAweDcwNjEKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTM4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5wYXVzZV9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnBhdXNlX3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTYwCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MgogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MwogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUgPSBUcnVlCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkucGF1c2VfcHJvcG9zYWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKcGF1c2VfcHJvcG9zYWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTcxCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3NAogICAgLy8gc2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWMgMTAgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlc3VtZV9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlc3VtZV9yZWdpc3RyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4MgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODQKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1ODUKICAgIC8vIHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlID0gRmFsc2UKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NTc2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZXN1bWVfcHJvcG9zYWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKcmVzdW1lX3Byb3Bvc2FsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5MwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTUKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTYKICAgIC8vIHNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSA9IEZhbHNlCiAgICBieXRlYyAxMCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X3hnb3ZfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo1OTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxMAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2MTIKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2MTMKICAgIC8vIHNlbGYueGdvdl9tYW5hZ2VyLnZhbHVlID0gbWFuYWdlcgogICAgYnl0ZWMgNyAvLyAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X3BheW9yW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3BheW9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjE1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2MjcKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjI5CiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjMwCiAgICAvLyBzZWxmLnhnb3ZfcGF5b3IudmFsdWUgPSBwYXlvcgogICAgYnl0ZWMgOSAvLyAweDc4Njc2Zjc2NWY3MDYxNzk2ZjcyCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjE1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfeGdvdl9jb3VuY2lsW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3hnb3ZfY291bmNpbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ0CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0NgogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0NwogICAgLy8gc2VsZi54Z292X2NvdW5jaWwudmFsdWUgPSBjb3VuY2lsCiAgICBieXRlYyAyOCAvLyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X3hnb3Zfc3Vic2NyaWJlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X3N1YnNjcmliZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2MQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjMKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NjQKICAgIC8vIHNlbGYueGdvdl9zdWJzY3JpYmVyLnZhbHVlID0gc3Vic2NyaWJlcgogICAgYnl0ZWMgMTggLy8gMHg3ODY3NmY3NjVmNzM3NTYyNzM2MzcyNjk2MjY1NzIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnNldF9reWNfcHJvdmlkZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfa3ljX3Byb3ZpZGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjY2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2NzgKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjgwCiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjgxCiAgICAvLyBzZWxmLmt5Y19wcm92aWRlci52YWx1ZSA9IHByb3ZpZGVyCiAgICBieXRlYyAxOSAvLyAweDZiNzk2MzVmNzA3MjZmNzY2OTY0NjU3MgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuc2V0X2NvbW1pdHRlZV9tYW5hZ2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X2NvbW1pdHRlZV9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo2OTUKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njk3CiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Njk4CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tYW5hZ2VyLnZhbHVlID0gbWFuYWdlcgogICAgYnl0ZWMgMjAgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjE2ZTYxNjc2NTcyCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NjgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfeGdvdl9kYWVtb25bcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9kYWVtb246CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9tYW5hZ2VyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9tYW5hZ2VyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTQKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTUKICAgIC8vIHNlbGYueGdvdl9kYWVtb24udmFsdWUgPSB4Z292X2RhZW1vbgogICAgYnl0ZWMgMjEgLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzAwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5jb25maWdfeGdvdl9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNvbmZpZ194Z292X3JlZ2lzdHJ5OgogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gNAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGxlbgogICAgcHVzaGludCAyMDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlhHb3ZSZWdpc3RyeUNvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzI5CiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczMQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2MAogICAgLy8gY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfYm94X21iciBhbmQgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfcmVxdWVzdF9ib3hfbWJyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzcxLTM3MwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIHB1c2hpbnQgMzgxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2MAogICAgLy8gY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfYm94X21iciBhbmQgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfcmVxdWVzdF9ib3hfbWJyCiAgICA+PQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUA0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3MS0zNzMKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAga2V5X3ByZWZpeF9sZW5ndGggKyBrZXlfdHlwZV9zaXplICsgdmFsdWVfdHlwZV9zaXplCiAgICAvLyApICogUEVSX0JZVEVfSU5fQk9YX01CUiArIFBFUl9CT1hfTUJSCiAgICBwdXNoaW50IDM0OTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjAKICAgIC8vIGNvbmZpZy54Z292X2ZlZSA+PSB4Z292X2JveF9tYnIgYW5kIGNvbmZpZy54Z292X2ZlZSA+PSB4Z292X3JlcXVlc3RfYm94X21icgogICAgPj0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc1OS03NjEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfYm94X21iciBhbmQgY29uZmlnLnhnb3ZfZmVlID49IHhnb3ZfcmVxdWVzdF9ib3hfbWJyCiAgICAvLyApLCBlcnIuSU5WQUxJRF9YR09WX0ZFRQogICAgYXNzZXJ0IC8vIEludmFsaWQgeEdvdiBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2MwogICAgLy8gYXNzZXJ0IGNvbmZpZy5wcm9wb3Nlcl9mZWUgPj0gcHJvcG9zZXJfYm94X21iciwgZXJyLklOVkFMSURfUFJPUE9TRVJfRkVFCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzcxLTM3MwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIHB1c2hpbnQgMTkzMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2MwogICAgLy8gYXNzZXJ0IGNvbmZpZy5wcm9wb3Nlcl9mZWUgPj0gcHJvcG9zZXJfYm94X21iciwgZXJyLklOVkFMSURfUFJPUE9TRVJfRkVFCiAgICA+PQogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zZXIgZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjcKICAgIC8vIDwgY29uZmlnLm1pbl9yZXF1ZXN0ZWRfYW1vdW50CiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjYtNzY4CiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2OAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIGRpZyAxCiAgICBleHRyYWN0IDQ4IDI0CiAgICBkdXAKICAgIGJ1cnkgMTkKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjctNzY4CiAgICAvLyA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIGRpZyAxMwogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzY2LTc2OAogICAgLy8gMAogICAgLy8gPCBjb25maWcubWluX3JlcXVlc3RlZF9hbW91bnQKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjkKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICBkaWcgMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2OC03NjkKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgaW50Y18yIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2OQogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMV0KICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2OC03NjkKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgZGlnIDEyCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjctNzY5CiAgICAvLyA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzAKICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzJdCiAgICBkaWcgMTcKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjktNzcwCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMl0KICAgIGRpZyAxMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzY4LTc3MAogICAgLy8gPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIC8vIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICAvLyA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsyXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxMAogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NjUtNzcxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIDAKICAgIC8vICAgICA8IGNvbmZpZy5taW5fcmVxdWVzdGVkX2Ftb3VudAogICAgLy8gICAgIDwgY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICAvLyAgICAgPCBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMV0KICAgIC8vICAgICA8IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsyXQogICAgLy8gKSwgZXJyLklOQ09OU0lTVEVOVF9SRVFVRVNURURfQU1PVU5UX0NPTkZJRwogICAgYXNzZXJ0IC8vIEluY29uc2lzdGVudCByZXF1ZXN0ZWQgYW1vdW50IGNvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Nzc0CiAgICAvLyBjb25maWcub3Blbl9wcm9wb3NhbF9mZWUsCiAgICBkaWcgMQogICAgZHVwCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3NzUKICAgIC8vIGNvbmZpZy5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLAogICAgZHVwCiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNTUKICAgIC8vIHJldHVybiBhbW91bnQgKiBmcmFjdGlvbl9pbl9icHMgLy8gQlBTCiAgICBkaWcgMgogICAgKgogICAgcHVzaGludCAxMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Mzk5CiAgICAvLyBVSW50NjQoTUFYX01CUl9QRVJfQVBQICsgTUFYX01CUl9QRVJfQk9YICsgQUNDT1VOVF9NQlIpICsgZGFlbW9uX29wc19mdW5kaW5nCiAgICBwdXNoaW50IDE2ODM1MzAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0MDIKICAgIC8vIGFzc2VydCBvcGVuX3Byb3Bvc2FsX2ZlZSA+IHRvX3N1YnN0cmFjdCwgZXJyLklOVkFMSURfT1BFTl9QUk9QT1NBTF9GRUUKICAgIGRpZyAyCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIEludmFsaWQgb3BlbiBwcm9wb3NhbCBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNAogICAgLy8gbWJyX2F2YWlsYWJsZV9mb3JfY29tbWl0dGVlID0gb3Blbl9wcm9wb3NhbF9mZWUgLSB0b19zdWJzdHJhY3QKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzcxLTM3MwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIGludGMgNSAvLyAxODkwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDA2CiAgICAvLyBzZWxmLm1heF9jb21taXR0ZWVfc2l6ZS52YWx1ZSA9IG1icl9hdmFpbGFibGVfZm9yX2NvbW1pdHRlZSAvLyB2b3Rlcl9tYnIKICAgIC8KICAgIGJ5dGVjIDI2IC8vIDB4NmQ2MTc4NWY2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjczNjk3YTY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzgxCiAgICAvLyA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICBleHRyYWN0IDcyIDMyCiAgICBkdXAKICAgIGJ1cnkgMTgKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDExCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODAtNzgyCiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzgyCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgZGlnIDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODEtNzgyCiAgICAvLyA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgaW50Y18yIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4MgogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4MS03ODIKICAgIC8vIDwgY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMF0KICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzFdCiAgICBkaWcgMTAKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODAtNzgyCiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzgzCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsyXQogICAgZGlnIDE2CiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4Mi03ODMKICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzFdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsyXQogICAgZGlnIDkKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODEtNzgzCiAgICAvLyA8IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMl0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4NAogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bM10KICAgIGRpZyAxNgogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4My03ODQKICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzJdCiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblszXQogICAgZGlnIDgKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODItNzg0CiAgICAvLyA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgLy8gPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMl0KICAgIC8vIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzNdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDE2CiAgICBpbnRjXzEgLy8gMQoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9tZXJnZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3OS03ODUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgMAogICAgLy8gICAgIDwgY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMF0KICAgIC8vICAgICA8PSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblsxXQogICAgLy8gICAgIDw9IGNvbmZpZy5kaXNjdXNzaW9uX2R1cmF0aW9uWzJdCiAgICAvLyAgICAgPD0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bM10KICAgIC8vICksIGVyci5JTkNPTlNJU1RFTlRfRElTQ1VTU0lPTl9EVVJBVElPTl9DT05GSUcKICAgIGFzc2VydCAvLyBJbmNvbnNpc3RlbnQgZGlzY3Vzc2lvbiBkdXJhdGlvbiBjb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4OQogICAgLy8gPCBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICBkaWcgMQogICAgZXh0cmFjdCAxMDQgMzIKICAgIGR1cAogICAgYnVyeSAyMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Nzg4LTc5MAogICAgLy8gMAogICAgLy8gPCBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3OTAKICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMV0KICAgIGRpZyAyMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Nzg5LTc5MAogICAgLy8gPCBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICBpbnRjXzIgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzkwCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc4OS03OTAKICAgIC8vIDwgY29uZmlnLnZvdGluZ19kdXJhdGlvblswXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgZGlnIDcKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODgtNzkwCiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMF0KICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMV0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5MQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsyXQogICAgZGlnIDIwCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5MC03OTEKICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMV0KICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMl0KICAgIGRpZyA2CiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Nzg5LTc5MQogICAgLy8gPCBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICAvLyA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzJdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3OTIKICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bM10KICAgIGRpZyAyMAogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5MS03OTIKICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMl0KICAgIC8vIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bM10KICAgIGRpZyA1CiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NzkwLTc5MgogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsxXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsyXQogICAgLy8gPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblszXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAyMgogICAgaW50Y18xIC8vIDEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3ODctNzkzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIDAKICAgIC8vICAgICA8IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMF0KICAgIC8vICAgICA8PSBjb25maWcudm90aW5nX2R1cmF0aW9uWzFdCiAgICAvLyAgICAgPD0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsyXQogICAgLy8gICAgIDw9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bM10KICAgIC8vICksIGVyci5JTkNPTlNJU1RFTlRfVk9USU5HX0RVUkFUSU9OX0NPTkZJRwogICAgYXNzZXJ0IC8vIEluY29uc2lzdGVudCB2b3RpbmcgZHVyYXRpb24gY29uZmlnCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3OTcKICAgIC8vIDwgY29uZmlnLnF1b3J1bVswXQogICAgZGlnIDEKICAgIGV4dHJhY3QgMTM2IDI0CiAgICBkdXAKICAgIGJ1cnkgMjEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5Ni03OTcKICAgIC8vIDAKICAgIC8vIDwgY29uZmlnLnF1b3J1bVswXQogICAgYnogY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAyNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk4LTc5OQogICAgLy8gIyBRdW9ydW0gTWVkaXVtIG5vIGxvbmdlciB1c2VkCiAgICAvLyA8IGNvbmZpZy5xdW9ydW1bMl0KICAgIGRpZyAxOQogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NwogICAgLy8gPCBjb25maWcucXVvcnVtWzBdCiAgICBkaWcgNAogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk2LTc5NwogICAgLy8gMAogICAgLy8gPCBjb25maWcucXVvcnVtWzBdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDI2CiAgICBpbnRjXzEgLy8gMQoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9tZXJnZUAyNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NS04MDAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgMAogICAgLy8gICAgIDwgY29uZmlnLnF1b3J1bVswXQogICAgLy8gICAgICMgUXVvcnVtIE1lZGl1bSBubyBsb25nZXIgdXNlZAogICAgLy8gICAgIDwgY29uZmlnLnF1b3J1bVsyXQogICAgLy8gKSwgZXJyLklOQ09OU0lTVEVOVF9RVU9SVU1fQ09ORklHCiAgICBhc3NlcnQgLy8gSW5jb25zaXN0ZW50IHF1b3J1bSBjb25maWcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwNAogICAgLy8gPCBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzBdCiAgICBkaWcgMQogICAgZXh0cmFjdCAxNjAgMjQKICAgIGR1cAogICAgYnVyeSAyMAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODAzLTgwNAogICAgLy8gMAogICAgLy8gPCBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzBdCiAgICBieiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDMwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDUtODA2CiAgICAvLyAjIFdlaWdodGVkIFF1b3J1bSBNZWRpdW0gbm8gbG9uZ2VyIHVzZWQKICAgIC8vIDwgY29uZmlnLndlaWdodGVkX3F1b3J1bVsyXQogICAgZGlnIDE4CiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODA0CiAgICAvLyA8IGNvbmZpZy53ZWlnaHRlZF9xdW9ydW1bMF0KICAgIGRpZyAzCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MDMtODA0CiAgICAvLyAwCiAgICAvLyA8IGNvbmZpZy53ZWlnaHRlZF9xdW9ydW1bMF0KICAgIGJ6IGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMzAKICAgIGludGNfMSAvLyAxCgpjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX21lcmdlQDMxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODAyLTgwNwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICAwCiAgICAvLyAgICAgPCBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzBdCiAgICAvLyAgICAgIyBXZWlnaHRlZCBRdW9ydW0gTWVkaXVtIG5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgPCBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzJdCiAgICAvLyApLCBlcnIuSU5DT05TSVNURU5UX1dFSUdIVEVEX1FVT1JVTV9DT05GSUcKICAgIGFzc2VydCAvLyBJbmNvbnNpc3RlbnQgd2VpZ2h0ZWQgcXVvcnVtIGNvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODA5CiAgICAvLyBzZWxmLnhnb3ZfZmVlLnZhbHVlID0gY29uZmlnLnhnb3ZfZmVlCiAgICBieXRlYyAyMiAvLyAweDc4Njc2Zjc2NWY2NjY1NjUKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODEwCiAgICAvLyBzZWxmLnByb3Bvc2VyX2ZlZS52YWx1ZSA9IGNvbmZpZy5wcm9wb3Nlcl9mZWUKICAgIGJ5dGVjIDIzIC8vIDB4NzA3MjZmNzA2ZjczNjU3MjVmNjY2NTY1CiAgICBkaWcgMTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MTEKICAgIC8vIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUgPSBjb25maWcub3Blbl9wcm9wb3NhbF9mZWUKICAgIGJ5dGVjIDI0IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgZGlnIDE1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODEyCiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUgPSBjb25maWcuZGFlbW9uX29wc19mdW5kaW5nX2JwcwogICAgYnl0ZWMgMjkgLy8gMHg2NDYxNjU2ZDZmNmU1ZjZmNzA2NTcyNjE3NDY5NmY2ZTVmNjY3NTZlNjQ2OTZlNjc1ZjYyNzA3MwogICAgZGlnIDE2CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODEzCiAgICAvLyBzZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzLnZhbHVlID0gY29uZmlnLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzMCAvLyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MTUKICAgIC8vIHNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQudmFsdWUgPSBjb25maWcubWluX3JlcXVlc3RlZF9hbW91bnQKICAgIGJ5dGVjIDMxIC8vIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgZGlnIDE0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODE2CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlID0gY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzBdCiAgICBkdXAKICAgIGV4dHJhY3QgNDggMjQKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAzMiAvLyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjczNmQ2MTZjNmMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MTcKICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlID0gY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxNi04MTcKICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwudmFsdWUgPSBjb25maWcubWF4X3JlcXVlc3RlZF9hbW91bnRbMF0KICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlID0gY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzFdCiAgICBpbnRjXzIgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODE3CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bS52YWx1ZSA9IGNvbmZpZy5tYXhfcmVxdWVzdGVkX2Ftb3VudFsxXQogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDMzIC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmQ2NTY0Njk3NTZkCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODE4CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlLnZhbHVlID0gY29uZmlnLm1heF9yZXF1ZXN0ZWRfYW1vdW50WzJdCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgMzQgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODIwCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwudmFsdWUgPSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblswXQogICAgYnl0ZWMgMzUgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YwogICAgZGlnIDExCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODIxCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtLnZhbHVlID0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMV0KICAgIGRpZyAxNwogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDM2IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZAogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyMgogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlID0gY29uZmlnLmRpc2N1c3Npb25fZHVyYXRpb25bMl0KICAgIGR1cAogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDM3IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MjMKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UudmFsdWUgPSBjb25maWcuZGlzY3Vzc2lvbl9kdXJhdGlvblszXQogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDM4IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyNQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwudmFsdWUgPSBjb25maWcudm90aW5nX2R1cmF0aW9uWzBdCiAgICBieXRlYyAzOSAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YwogICAgZGlnIDgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MjYKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX21lZGl1bS52YWx1ZSA9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bMV0KICAgIGRpZyAyMQogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDQwIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MjcKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlLnZhbHVlID0gY29uZmlnLnZvdGluZ19kdXJhdGlvblsyXQogICAgZHVwCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgNDEgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MjgKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSA9IGNvbmZpZy52b3RpbmdfZHVyYXRpb25bM10KICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyA0MiAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODMwCiAgICAvLyBzZWxmLnF1b3J1bV9zbWFsbC52YWx1ZSA9IGNvbmZpZy5xdW9ydW1bMF0KICAgIGJ5dGVjIDQzIC8vIDB4NzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICBkaWcgNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMQogICAgLy8gc2VsZi5xdW9ydW1fbWVkaXVtLnZhbHVlID0gVUludDY0KDApICAjIE5vIGxvbmdlciB1c2VkCiAgICBieXRlYyA0NCAvLyAweDcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMgogICAgLy8gc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUgPSBjb25maWcucXVvcnVtWzJdCiAgICBkaWcgMjAKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyA0NSAvLyAweDcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzNAogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUgPSBjb25maWcud2VpZ2h0ZWRfcXVvcnVtWzBdCiAgICBieXRlYyA0NiAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgZGlnIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzUKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bS52YWx1ZSA9IFVJbnQ2NCgwKSAgIyBObyBsb25nZXIgdXNlZAogICAgYnl0ZWMgNDcgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzYKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX2xhcmdlLnZhbHVlID0gY29uZmlnLndlaWdodGVkX3F1b3J1bVsyXQogICAgZGlnIDE5CiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgYnl0ZWMgNDggLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzgKICAgIC8vIHNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUgPSBjb25maWcuYWJzZW5jZV90b2xlcmFuY2UKICAgIGR1cAogICAgcHVzaGludCAxODQKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyAyNyAvLyAweDYxNjI3MzY1NmU2MzY1NWY3NDZmNmM2NTcyNjE2ZTYzNjUKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4MzkKICAgIC8vIHNlbGYuZ292ZXJuYW5jZV9wZXJpb2QudmFsdWUgPSBjb25maWcuZ292ZXJuYW5jZV9wZXJpb2QKICAgIGR1cAogICAgcHVzaGludCAxOTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBieXRlYyA1MCAvLyAweDY3NmY3NjY1NzI2ZTYxNmU2MzY1NWY3MDY1NzI2OTZmNjQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NDAKICAgIC8vIHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZSA9IGNvbmZpZy5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kCiAgICBwdXNoaW50IDIwMAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ5dGVjIDUxIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2NzcyNjE2MzY1NWY3MDY1NzI2OTZmNjQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo3MTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDMwOgogICAgaW50Y18wIC8vIDAKICAgIGIgY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9tZXJnZUAzMQoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAyNjoKICAgIGludGNfMCAvLyAwCiAgICBiIGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMjcKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VAMjI6CiAgICBpbnRjXzAgLy8gMAogICAgYiBjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX21lcmdlQDIzCgpjb25maWdfeGdvdl9yZWdpc3RyeV9ib29sX2ZhbHNlQDE2OgogICAgaW50Y18wIC8vIDAKICAgIGIgY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9tZXJnZUAxNwoKY29uZmlnX3hnb3ZfcmVnaXN0cnlfYm9vbF9mYWxzZUAxMDoKICAgIGludGNfMCAvLyAwCiAgICBiIGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VAMTEKCmNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGNvbmZpZ194Z292X3JlZ2lzdHJ5X2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS51cGRhdGVfeGdvdl9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZV94Z292X3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODUxCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgY2FsbHN1YiBpc194Z292X21hbmFnZXIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1MwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3MgogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzIgLy8gMHg3OAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODczCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKFR4bi5zZW5kZXIpLCBlcnIuQUxSRUFEWV9YR09WCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NzMKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfeGdvdl9zdGF0dXMoVHhuLnNlbmRlciksIGVyci5BTFJFQURZX1hHT1YKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3NAogICAgLy8gYXNzZXJ0IHNlbGYudmFsaWRfeGdvdl9wYXltZW50KHBheW1lbnQpLCBlcnIuSU5WQUxJRF9QQVlNRU5UCiAgICBjYWxsc3ViIHZhbGlkX3hnb3ZfcGF5bWVudAogICAgYXNzZXJ0IC8vIEludmFsaWQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODc2CiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODc5CiAgICAvLyB4Z292X2FkZHJlc3M9VHhuLnNlbmRlciwgdm90aW5nX2FkZHJlc3M9dm90aW5nX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg3OC04ODAKICAgIC8vIHNlbGYuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQoCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzPVR4bi5zZW5kZXIsIHZvdGluZ19hZGRyZXNzPXZvdGluZ19hZGRyZXNzCiAgICAvLyApCiAgICBzd2FwCiAgICBjYWxsc3ViIHN1YnNjcmliZV94Z292X2FuZF9lbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4NTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnVuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgp1bnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6ODkyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNgogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMiAvLyAweDc4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4OTMKICAgIC8vIGFzc2VydCBzZWxmLmhhc194Z292X3N0YXR1cyhUeG4uc2VuZGVyKSwgZXJyLk5PVF9YR09WCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo4OTMKICAgIC8vIGFzc2VydCBzZWxmLmhhc194Z292X3N0YXR1cyhUeG4uc2VuZGVyKSwgZXJyLk5PVF9YR09WCiAgICBhc3NlcnQgLy8gTm90IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5NQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5NwogICAgLy8gc2VsZi51bnN1YnNjcmliZV94Z292X2FuZF9lbWl0KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIHVuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudW5zdWJzY3JpYmVfYWJzZW50ZWVbcm91dGluZ10oKSAtPiB2b2lkOgp1bnN1YnNjcmliZV9hYnNlbnRlZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTEzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNgogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMiAvLyAweDc4CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTE0CiAgICAvLyBhc3NlcnQgc2VsZi5oYXNfeGdvdl9zdGF0dXMoeGdvdl9hZGRyZXNzKSwgZXJyLk5PVF9YR09WCiAgICBhc3NlcnQgLy8gTm90IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxNQogICAgLy8gYXNzZXJ0IHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS50b2xlcmF0ZWRfYWJzZW5jZXMgPT0gMCwgZXJyLlVOQVVUSE9SSVpFRAogICAgYm94X2dldAogICAgcG9wCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICAhCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MTcKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MTkKICAgIC8vIHNlbGYudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdCh4Z292X2FkZHJlc3MpCiAgICBjYWxsc3ViIHVuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkucmVxdWVzdF9zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlcXVlc3Rfc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5MjEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NDYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IG93bmVyX2FkZHJlc3MsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgIGRpZyAzCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ3CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNgogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMiAvLyAweDc4CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0OAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmhhc194Z292X3N0YXR1cyh4Z292X2FkZHJlc3MpLCBlcnIuQUxSRUFEWV9YR09WCiAgICAhCiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NDkKICAgIC8vIGFzc2VydCBzZWxmLnZhbGlkX3hnb3ZfcGF5bWVudChwYXltZW50KSwgZXJyLklOVkFMSURfUEFZTUVOVAogICAgY2FsbHN1YiB2YWxpZF94Z292X3BheW1lbnQKICAgIGFzc2VydCAvLyBJbnZhbGlkIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1MQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1My05NTQKICAgIC8vICMgY3JlYXRlIHJlcXVlc3QgYm94CiAgICAvLyByaWQgPSBzZWxmLnJlcXVlc3RfaWQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1NS05NTkKICAgIC8vIHNlbGYucmVxdWVzdF9ib3hbcmlkXSA9IHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlKAogICAgLy8gICAgIHhnb3ZfYWRkcj14Z292X2FkZHJlc3MsCiAgICAvLyAgICAgb3duZXJfYWRkcj1vd25lcl9hZGRyZXNzLAogICAgLy8gICAgIHJlbGF0aW9uX3R5cGU9cmVsYXRpb25fdHlwZSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NTUKICAgIC8vIHNlbGYucmVxdWVzdF9ib3hbcmlkXSA9IHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlKAogICAgZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDEzIC8vIDB4NzIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTU1LTk1OQogICAgLy8gc2VsZi5yZXF1ZXN0X2JveFtyaWRdID0gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94VmFsdWUoCiAgICAvLyAgICAgeGdvdl9hZGRyPXhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBvd25lcl9hZGRyPW93bmVyX2FkZHJlc3MsCiAgICAvLyAgICAgcmVsYXRpb25fdHlwZT1yZWxhdGlvbl90eXBlLAogICAgLy8gKQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTYxLTk2MgogICAgLy8gIyBpbmNyZW1lbnQgcmVxdWVzdCBpZAogICAgLy8gc2VsZi5yZXF1ZXN0X2lkLnZhbHVlICs9IDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMiAvLyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTIxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5hcHByb3ZlX3N1YnNjcmliZV94Z292W3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3NwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9zdWJzY3JpYmVyKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9zdWJzY3JpYmVyCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NzkKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5ODEKICAgIC8vIHhnb3ZfYWRkcmVzcyA9IHNlbGYucmVxdWVzdF9ib3hbcmVxdWVzdF9pZF0ueGdvdl9hZGRyCiAgICBpdG9iCiAgICBieXRlYyAxMyAvLyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdF9ib3ggZW50cnkgZXhpc3RzCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTgyCiAgICAvLyB2b3RpbmdfYWRkcmVzcyA9IHNlbGYucmVxdWVzdF9ib3hbcmVxdWVzdF9pZF0ub3duZXJfYWRkcgogICAgc3dhcAogICAgZXh0cmFjdCAzMiAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjM2CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18yIC8vIDB4NzgKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTgzCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5BTFJFQURZX1hHT1YKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4NS05ODcKICAgIC8vIHNlbGYuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQoCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzPXhnb3ZfYWRkcmVzcywgdm90aW5nX2FkZHJlc3M9dm90aW5nX2FkZHJlc3MKICAgIC8vICkKICAgIGNhbGxzdWIgc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4OS05OTAKICAgIC8vICMgZGVsZXRlIHRoZSByZXF1ZXN0CiAgICAvLyBkZWwgc2VsZi5yZXF1ZXN0X2JveFtyZXF1ZXN0X2lkXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo5NjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlamVjdF9zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdF9zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDQKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAwNgogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDgtMTAwOQogICAgLy8gIyBkZWxldGUgdGhlIHJlcXVlc3QKICAgIC8vIGRlbCBzZWxmLnJlcXVlc3RfYm94W3JlcXVlc3RfaWRdCiAgICBpdG9iCiAgICBieXRlYyAxMyAvLyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6OTkyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDExCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzNgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gb3duZXJfYWRkcmVzcywgZXJyLlVOQVVUSE9SSVpFRAogICAgdHhuIFNlbmRlcgogICAgZGlnIDMKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDM3CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNgogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMiAvLyAweDc4CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMzgKICAgIC8vIGFzc2VydCBzZWxmLmhhc194Z292X3N0YXR1cyh4Z292X2FkZHJlc3MpLCBlcnIuTk9UX1hHT1YKICAgIGFzc2VydCAvLyBOb3QgYW4geEdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzOQogICAgLy8gYXNzZXJ0IHNlbGYudmFsaWRfeGdvdl9wYXltZW50KHBheW1lbnQpLCBlcnIuSU5WQUxJRF9QQVlNRU5UCiAgICBjYWxsc3ViIHZhbGlkX3hnb3ZfcGF5bWVudAogICAgYXNzZXJ0IC8vIEludmFsaWQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA0MQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDMtMTA0NAogICAgLy8gIyBjcmVhdGUgdW5zdWJzY3JpYmUgcmVxdWVzdCBib3gKICAgIC8vIHJ1aWQgPSBzZWxmLnJlcXVlc3RfaWQudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmVxdWVzdF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDUtMTA0OQogICAgLy8gc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtydWlkXSA9IHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlKAogICAgLy8gICAgIHhnb3ZfYWRkcj14Z292X2FkZHJlc3MsCiAgICAvLyAgICAgb3duZXJfYWRkcj1vd25lcl9hZGRyZXNzLAogICAgLy8gICAgIHJlbGF0aW9uX3R5cGU9cmVsYXRpb25fdHlwZSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDQ1CiAgICAvLyBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3J1aWRdID0gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94VmFsdWUoCiAgICBkaWcgMQogICAgaXRvYgogICAgYnl0ZWMgMTQgLy8gMHg3Mjc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDUtMTA0OQogICAgLy8gc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtydWlkXSA9IHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlKAogICAgLy8gICAgIHhnb3ZfYWRkcj14Z292X2FkZHJlc3MsCiAgICAvLyAgICAgb3duZXJfYWRkcj1vd25lcl9hZGRyZXNzLAogICAgLy8gICAgIHJlbGF0aW9uX3R5cGU9cmVsYXRpb25fdHlwZSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTEtMTA1MgogICAgLy8gIyBpbmNyZW1lbnQgcmVxdWVzdCBpZAogICAgLy8gc2VsZi5yZXF1ZXN0X2lkLnZhbHVlICs9IDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxMiAvLyAweDcyNjU3MTc1NjU3Mzc0NWY2OTY0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuYXBwcm92ZV91bnN1YnNjcmliZV94Z292W3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV91bnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNjcKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2OQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNzEKICAgIC8vIHhnb3ZfYWRkcmVzcyA9IHNlbGYucmVxdWVzdF91bnN1YnNjcmliZV9ib3hbcmVxdWVzdF9pZF0ueGdvdl9hZGRyCiAgICBpdG9iCiAgICBieXRlYyAxNCAvLyAweDcyNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjM2CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18yIC8vIDB4NzgKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA3MgogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDc0CiAgICAvLyBzZWxmLnVuc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQoeGdvdl9hZGRyZXNzKQogICAgY2FsbHN1YiB1bnN1YnNjcmliZV94Z292X2FuZF9lbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDc2LTEwNzcKICAgIC8vICMgZGVsZXRlIHRoZSByZXF1ZXN0CiAgICAvLyBkZWwgc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtyZXF1ZXN0X2lkXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZWplY3RfdW5zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdF91bnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA3OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTEKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3Zfc3Vic2NyaWJlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3Zfc3Vic2NyaWJlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5MwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTUtMTA5NgogICAgLy8gIyBkZWxldGUgdGhlIHJlcXVlc3QKICAgIC8vIGRlbCBzZWxmLnJlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3JlcXVlc3RfaWRdCiAgICBpdG9iCiAgICBieXRlYyAxNCAvLyAweDcyNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfdm90aW5nX2FjY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdm90aW5nX2FjY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTUKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjM2CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18yIC8vIDB4NzgKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTE2CiAgICAvLyBhc3NlcnQgc2VsZi5oYXNfeGdvdl9zdGF0dXMoeGdvdl9hZGRyZXNzKSwgZXJyLk5PVF9YR09WCiAgICBhc3NlcnQgLy8gTm90IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTcKICAgIC8vIGFzc2VydCBzZWxmLmNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzKHhnb3ZfYWRkcmVzcyksIGVyci5VTkFVVEhPUklaRUQKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBjYWxsZXJfaXNfeGdvdl9vcl92b3RpbmdfYWRkcmVzcwogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTExOQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMjEtMTEyMgogICAgLy8gIyBVcGRhdGUgdGhlIHZvdGluZyBhY2NvdW50IGluIHRoZSB4R292IGJveAogICAgLy8gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3NdLnZvdGluZ19hZGRyZXNzID0gdm90aW5nX2FkZHJlc3MKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMDk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zdWJzY3JpYmVfcHJvcG9zZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJzY3JpYmVfcHJvcG9zZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTM4CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyIG5vdCBpbiBzZWxmLnByb3Bvc2VyX2JveCwgZXJyLkFMUkVBRFlfUFJPUE9TRVIKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGEgcHJvcG9zZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDMKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTQxLTExNDQKICAgIC8vICMgY2hlY2sgZmVlCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDUKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBzZWxmLnByb3Bvc2VyX2ZlZS52YWx1ZSwgZXJyLldST05HX1BBWU1FTlRfQU1PVU5UCiAgICBndHhucyBBbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzI1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyX2ZlZSBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGF5bWVudCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDcKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTQ5CiAgICAvLyBzZWxmLnByb3Bvc2VyX2JveFtUeG4uc2VuZGVyXSA9IHNlbGYubWFrZV9wcm9wb3Nlcl9ib3goCiAgICBieXRlYyA1IC8vIDB4NzAKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDgxLTQ4NQogICAgLy8gcmV0dXJuIHR5cC5Qcm9wb3NlckJveFZhbHVlKAogICAgLy8gICAgIGFjdGl2ZV9wcm9wb3NhbD1hY3RpdmVfcHJvcG9zYWwsCiAgICAvLyAgICAga3ljX3N0YXR1cz1reWNfc3RhdHVzLAogICAgLy8gICAgIGt5Y19leHBpcmluZz1reWNfZXhwaXJpbmcsCiAgICAvLyApCiAgICBieXRlYyA1NCAvLyAweDAwMDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0OS0xMTUxCiAgICAvLyBzZWxmLnByb3Bvc2VyX2JveFtUeG4uc2VuZGVyXSA9IHNlbGYubWFrZV9wcm9wb3Nlcl9ib3goCiAgICAvLyAgICAgYWN0aXZlX3Byb3Bvc2FsPUZhbHNlLCBreWNfc3RhdHVzPUZhbHNlLCBreWNfZXhwaXJpbmc9VUludDY0KDApCiAgICAvLyApCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTUzCiAgICAvLyBhcmM0LmVtaXQodHlwLlByb3Bvc2VyU3Vic2NyaWJlZChwcm9wb3Nlcj1UeG4uc2VuZGVyLCByb3VuZD1HbG9iYWwucm91bmQpKQogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIFJvdW5kCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDFhYzRlZGNkIC8vIG1ldGhvZCAiUHJvcG9zZXJTdWJzY3JpYmVkKGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5zZXRfcHJvcG9zZXJfa3ljW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3Byb3Bvc2VyX2t5YzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTc2LTExNzcKICAgIC8vICMgY2hlY2sgaWYga3ljIHByb3ZpZGVyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmt5Y19wcm92aWRlci52YWx1ZSwgZXJyLlVOQVVUSE9SSVpFRAogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vIDB4NmI3OTYzNWY3MDcyNmY3NjY5NjQ2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYua3ljX3Byb3ZpZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzgKICAgIC8vIGFzc2VydCBwcm9wb3NlciBpbiBzZWxmLnByb3Bvc2VyX2JveCwgZXJyLlBST1BPU0VSX0RPRVNfTk9UX0VYSVNUCiAgICBieXRlYyA1IC8vIDB4NzAKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zZXIgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExODAKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTgyCiAgICAvLyBhY3RpdmVfcHJvcG9zYWwgPSBzZWxmLnByb3Bvc2VyX2JveFtwcm9wb3Nlcl0uY29weSgpLmFjdGl2ZV9wcm9wb3NhbAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3Nlcl9ib3ggZW50cnkgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0ODEtNDg1CiAgICAvLyByZXR1cm4gdHlwLlByb3Bvc2VyQm94VmFsdWUoCiAgICAvLyAgICAgYWN0aXZlX3Byb3Bvc2FsPWFjdGl2ZV9wcm9wb3NhbCwKICAgIC8vICAgICBreWNfc3RhdHVzPWt5Y19zdGF0dXMsCiAgICAvLyAgICAga3ljX2V4cGlyaW5nPWt5Y19leHBpcmluZywKICAgIC8vICkKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzEgLy8gMQogICAgdW5jb3ZlciA0CiAgICBzZXRiaXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTg0LTExODgKICAgIC8vIHNlbGYucHJvcG9zZXJfYm94W3Byb3Bvc2VyXSA9IHNlbGYubWFrZV9wcm9wb3Nlcl9ib3goCiAgICAvLyAgICAgYWN0aXZlX3Byb3Bvc2FsPWFjdGl2ZV9wcm9wb3NhbCwKICAgIC8vICAgICBreWNfc3RhdHVzPWt5Y19zdGF0dXMsCiAgICAvLyAgICAga3ljX2V4cGlyaW5nPWt5Y19leHBpcmluZywKICAgIC8vICkKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTMKICAgIC8vIHZhbGlkX2t5Yz1ib29sKHNlbGYudmFsaWRfa3ljKHByb3Bvc2VyKSksCiAgICBkdXAKICAgIGNhbGxzdWIgdmFsaWRfa3ljCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMTk0CiAgICAvLyByb3VuZD1HbG9iYWwucm91bmQsCiAgICBnbG9iYWwgUm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTEtMTE5NQogICAgLy8gdHlwLlByb3Bvc2VyS1lDKAogICAgLy8gICAgIHByb3Bvc2VyPXByb3Bvc2VyLAogICAgLy8gICAgIHZhbGlkX2t5Yz1ib29sKHNlbGYudmFsaWRfa3ljKHByb3Bvc2VyKSksCiAgICAvLyAgICAgcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgLy8gKQogICAgYnl0ZWNfMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAzCiAgICBzZXRiaXQKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTAtMTE5NgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIHR5cC5Qcm9wb3NlcktZQygKICAgIC8vICAgICAgICAgcHJvcG9zZXI9cHJvcG9zZXIsCiAgICAvLyAgICAgICAgIHZhbGlkX2t5Yz1ib29sKHNlbGYudmFsaWRfa3ljKHByb3Bvc2VyKSksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg5YjVhZjc2MSAvLyBtZXRob2QgIlByb3Bvc2VyS1lDKGFkZHJlc3MsYm9vbCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmRlY2xhcmVfY29tbWl0dGVlW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVjbGFyZV9jb21taXR0ZWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjM4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjU5CiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2MQogICAgLy8gc2VsZi5zZXRfY29tbWl0dGVlKGNvbW1pdHRlZV9pZCwgc2l6ZSwgdm90ZXMpCiAgICB1bmNvdmVyIDIKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgc2V0X2NvbW1pdHRlZQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjYyCiAgICAvLyBhc3NlcnQgc2l6ZSA8PSBzZWxmLm1heF9jb21taXR0ZWVfc2l6ZS52YWx1ZSwgZXJyLkNPTU1JVFRFRV9TSVpFX1RPT19MQVJHRQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI2IC8vIDB4NmQ2MTc4NWY2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjczNjk3YTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X2NvbW1pdHRlZV9zaXplIGV4aXN0cwogICAgPD0KICAgIGFzc2VydCAvLyBDb21taXR0ZWUgc2l6ZSBpcyB0b28gbGFyZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNjQKICAgIC8vIHNlbGYuY29tbWl0dGVlX3Jvb3QudmFsdWUgPSBCeXRlcygpCiAgICBieXRlYyA1NSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzI2ZjZmNzQKICAgIHB1c2hieXRlcyAweAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmRlY2xhcmVfY29tbWl0dGVlX3dpdGhfcm9vdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlY2xhcmVfY29tbWl0dGVlX3dpdGhfcm9vdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5NQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTcKICAgIC8vIHNlbGYuc2V0X2NvbW1pdHRlZShjb21taXR0ZWVfaWQsIHNpemUsIHZvdGVzKQogICAgdW5jb3ZlciAzCiAgICBkaWcgMwogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIHNldF9jb21taXR0ZWUKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzMQogICAgLy8gY29tbWl0dGVlX3NpemUgKyBwY3RzLlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMgLSAxCiAgICBkaWcgMQogICAgcHVzaGludCA4MTkyCiAgICArCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzMgogICAgLy8gKSAvLyBwY3RzLlZPVEVEX0JJVE1BUF9QQUdFX01FTUJFUlMKICAgIHB1c2hpbnQgODE5MgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzMC0xMjMyCiAgICAvLyBwYWdlcyA9ICgKICAgIC8vICAgICBjb21taXR0ZWVfc2l6ZSArIHBjdHMuVk9URURfQklUTUFQX1BBR0VfTUVNQkVSUyAtIDEKICAgIC8vICkgLy8gcGN0cy5WT1RFRF9CSVRNQVBfUEFHRV9NRU1CRVJTCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNzEtMzczCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIGtleV9wcmVmaXhfbGVuZ3RoICsga2V5X3R5cGVfc2l6ZSArIHZhbHVlX3R5cGVfc2l6ZQogICAgLy8gKSAqIFBFUl9CWVRFX0lOX0JPWF9NQlIgKyBQRVJfQk9YX01CUgogICAgcHVzaGludCA2MTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjM2CiAgICAvLyByZXR1cm4gcGFnZXMgKiBwYWdlX21iciArIChjb21taXR0ZWVfc2l6ZSArIDcpIC8vIDggKiBQRVJfQllURV9JTl9CT1hfTUJSCiAgICAqCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgNwogICAgKwogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIHB1c2hpbnQgNDAwCiAgICAqCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzAzCiAgICAvLyA8PSBzZWxmLm1heF9jb21taXR0ZWVfc2l6ZS52YWx1ZSAqIHZvdGVyX21icgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI2IC8vIDB4NmQ2MTc4NWY2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjczNjk3YTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X2NvbW1pdHRlZV9zaXplIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzcxLTM3MwogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBrZXlfcHJlZml4X2xlbmd0aCArIGtleV90eXBlX3NpemUgKyB2YWx1ZV90eXBlX3NpemUKICAgIC8vICkgKiBQRVJfQllURV9JTl9CT1hfTUJSICsgUEVSX0JPWF9NQlIKICAgIGludGMgNSAvLyAxODkwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwMwogICAgLy8gPD0gc2VsZi5tYXhfY29tbWl0dGVlX3NpemUudmFsdWUgKiB2b3Rlcl9tYnIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDItMTMwMwogICAgLy8gc2VsZi5jYWxjX3ZvdGVkX2JpdG1hcF9tYnIoc2l6ZSkKICAgIC8vIDw9IHNlbGYubWF4X2NvbW1pdHRlZV9zaXplLnZhbHVlICogdm90ZXJfbWJyCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwMS0xMzA0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuY2FsY192b3RlZF9iaXRtYXBfbWJyKHNpemUpCiAgICAvLyAgICAgPD0gc2VsZi5tYXhfY29tbWl0dGVlX3NpemUudmFsdWUgKiB2b3Rlcl9tYnIKICAgIC8vICksIGVyci5DT01NSVRURUVfU0laRV9UT09fTEFSR0UKICAgIGFzc2VydCAvLyBDb21taXR0ZWUgc2l6ZSBpcyB0b28gbGFyZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDYKICAgIC8vIHNlbGYuY29tbWl0dGVlX3Jvb3QudmFsdWUgPSBjb21taXR0ZWVfcm9vdC5ieXRlcwogICAgYnl0ZWMgNTUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjcyNmY2Zjc0CiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkub3Blbl9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm9wZW5fcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMyOQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzMwCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSwgZXJyLlBBVVNFRF9QUk9QT1NBTFMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3Byb3Bvc2FscyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBDcmVhdGlvbiBvZiBwcm9wb3NhbHMgaXMgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzMyCiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzNAogICAgLy8gY29tbWl0dGVlX2FuY2hvciA9IHNlbGYuZ2V0X2NvbW1pdHRlZV9hbmNob3IoKQogICAgY2FsbHN1YiBnZXRfY29tbWl0dGVlX2FuY2hvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzNQogICAgLy8gY29tbWl0dGVlX2RlbGF5ID0gR2xvYmFsLnJvdW5kIC0gY29tbWl0dGVlX2FuY2hvcgogICAgZ2xvYmFsIFJvdW5kCiAgICBkaWcgMQogICAgLQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzNwogICAgLy8gY29tbWl0dGVlX2FuY2hvciA9PSBzZWxmLmNvbW1pdHRlZV9sYXN0X2FuY2hvci52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUyIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzctMTMzOAogICAgLy8gY29tbWl0dGVlX2FuY2hvciA9PSBzZWxmLmNvbW1pdHRlZV9sYXN0X2FuY2hvci52YWx1ZQogICAgLy8gb3IgY29tbWl0dGVlX2RlbGF5IDw9IHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZQogICAgYm56IG9wZW5fcHJvcG9zYWxfYm9vbF90cnVlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzgKICAgIC8vIG9yIGNvbW1pdHRlZV9kZWxheSA8PSBzZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1MSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjc3MjYxNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZCBleGlzdHMKICAgIGRpZyAxCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMzNy0xMzM4CiAgICAvLyBjb21taXR0ZWVfYW5jaG9yID09IHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlCiAgICAvLyBvciBjb21taXR0ZWVfZGVsYXkgPD0gc2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kLnZhbHVlCiAgICBieiBvcGVuX3Byb3Bvc2FsX2Jvb2xfZmFsc2VANAoKb3Blbl9wcm9wb3NhbF9ib29sX3RydWVAMzoKICAgIGludGNfMSAvLyAxCgpvcGVuX3Byb3Bvc2FsX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzYtMTMzOQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjb21taXR0ZWVfYW5jaG9yID09IHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlCiAgICAvLyAgICAgb3IgY29tbWl0dGVlX2RlbGF5IDw9IHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZQogICAgLy8gKSwgZXJyLkNPTU1JVFRFRV9TVEFMRQogICAgYXNzZXJ0IC8vIENvbW1pdHRlZSBpcyBzdGFsZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM0MS0xMzQyCiAgICAvLyAjIENoZWNrIGlmIHRoZSBjYWxsZXIgaXMgYSByZWdpc3RlcmVkIHByb3Bvc2VyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBpbiBzZWxmLnByb3Bvc2VyX2JveCwgZXJyLlVOQVVUSE9SSVpFRAogICAgYnl0ZWMgNSAvLyAweDcwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM0NC0xMzQ1CiAgICAvLyAjIENoZWNrIGlmIHRoZSBwcm9wb3NlciBhbHJlYWR5IGhhcyBhbiBhY3RpdmUgcHJvcG9zYWwKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wcm9wb3Nlcl9ib3hbCiAgICBieXRlYyA1IC8vIDB4NzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNDYKICAgIC8vIFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNDQtMTM0NwogICAgLy8gIyBDaGVjayBpZiB0aGUgcHJvcG9zZXIgYWxyZWFkeSBoYXMgYW4gYWN0aXZlIHByb3Bvc2FsCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucHJvcG9zZXJfYm94WwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0uYWN0aXZlX3Byb3Bvc2FsLCBlcnIuQUxSRUFEWV9BQ1RJVkVfUFJPUE9TQUwKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXJfYm94IGVudHJ5IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgIQogICAgYXNzZXJ0IC8vIFByb3Bvc2VyIGFscmVhZHkgaGFzIGFuIGFjdGl2ZSBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM0OAogICAgLy8gYXNzZXJ0IHNlbGYudmFsaWRfa3ljKFR4bi5zZW5kZXIpLCBlcnIuSU5WQUxJRF9LWUMKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgdmFsaWRfa3ljCiAgICBhc3NlcnQgLy8gSW52YWxpZCBLWUMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTAKICAgIC8vIGFzc2VydCBUeG4uZmVlID49IChHbG9iYWwubWluX3R4bl9mZWUgKiAzKSwgZXJyLklOU1VGRklDSUVOVF9GRUUKICAgIHR4biBGZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIHB1c2hpbnQgMwogICAgKgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzU0CiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGRpZyAxCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTItMTM1NQogICAgLy8gIyBFbnN1cmUgdGhlIHRyYW5zYWN0aW9uIGhhcyB0aGUgY29ycmVjdCBwYXltZW50CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTYKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlLCBlcnIuV1JPTkdfUEFZTUVOVF9BTU9VTlQKICAgIGd0eG5zIEFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI0IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlIGV4aXN0cwogICAgc3dhcAogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcGF5bWVudCBhbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTgKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2MAogICAgLy8gYXNzZXJ0IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbSwgZXJyLk1JU1NJTkdfUFJPUE9TQUxfQVBQUk9WQUxfUFJPR1JBTQogICAgYnl0ZWMgNiAvLyAweDcwNjEKICAgIGJveF9sZW4KICAgIGFzc2VydCAvLyBNaXNzaW5nIHByb3Bvc2FsIGFwcHJvdmFsIHByb2dyYW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzAKICAgIC8vIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5sZW5ndGggKyBjb21waWxlZF9jbGVhcl9zdGF0ZV8xLmxlbmd0aAogICAgZHVwCiAgICBwdXNoaW50IDQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNjgKICAgIC8vIGJ5dGVzX3Blcl9wYWdlID0gVUludDY0KEJZVEVTX1BFUl9BUFBfUEFHRSkKICAgIGludGMgNCAvLyAyMDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzcyCiAgICAvLyB0b3RhbF9wYWdlcyA9IHRvdGFsX3NpemUgLy8gYnl0ZXNfcGVyX3BhZ2UKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzQtMTM3NwogICAgLy8gIyBUaGUgZm9sbG93aW5nIGFzc2VydGlvbiBtYWtlcyBzdXJlIHRoZSBsb29wLXVucm9sbGluZyBpcyBjb25zaXN0ZW50CiAgICAvLyBhc3NlcnQgdG90YWxfcGFnZXMgPT0gVUludDY0KAogICAgLy8gICAgIFBST1BPU0FMX0FQUFJPVkFMX1BBR0VTCiAgICAvLyApLCBlcnIuSU5WQUxJRF9QUk9QT1NBTF9BUFBST1ZBTF9QUk9HUkFNX1NJWkUKICAgIGR1cAogICAgcHVzaGludCAyCiAgICA9PQogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwgYXBwcm92YWwgcHJvZ3JhbSBzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzc5CiAgICAvLyBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0ubGVuZ3RoIC0gKHRvdGFsX3BhZ2VzIC0gMSkgKiBieXRlc19wZXJfcGFnZQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2OAogICAgLy8gYnl0ZXNfcGVyX3BhZ2UgPSBVSW50NjQoQllURVNfUEVSX0FQUF9QQUdFKQogICAgaW50YyA0IC8vIDIwNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzkKICAgIC8vIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5sZW5ndGggLSAodG90YWxfcGFnZXMgLSAxKSAqIGJ5dGVzX3Blcl9wYWdlCiAgICAqCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODEKICAgIC8vIHBhZ2VfMSA9IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5leHRyYWN0KAogICAgYnl0ZWMgNiAvLyAweDcwNjEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODIKICAgIC8vIDAgKiBieXRlc19wZXJfcGFnZSwgYnl0ZXNfcGVyX3BhZ2UKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzY4CiAgICAvLyBieXRlc19wZXJfcGFnZSA9IFVJbnQ2NChCWVRFU19QRVJfQVBQX1BBR0UpCiAgICBpbnRjIDQgLy8gMjA0OAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4MS0xMzgzCiAgICAvLyBwYWdlXzEgPSBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0uZXh0cmFjdCgKICAgIC8vICAgICAwICogYnl0ZXNfcGVyX3BhZ2UsIGJ5dGVzX3Blcl9wYWdlCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4NAogICAgLy8gcGFnZV8yID0gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoCiAgICBieXRlYyA2IC8vIDB4NzA2MQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2OAogICAgLy8gYnl0ZXNfcGVyX3BhZ2UgPSBVSW50NjQoQllURVNfUEVSX0FQUF9QQUdFKQogICAgaW50YyA0IC8vIDIwNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODQtMTM4NgogICAgLy8gcGFnZV8yID0gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoCiAgICAvLyAgICAgMSAqIGJ5dGVzX3Blcl9wYWdlLCBieXRlc19sYXN0X3BhZ2UKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODgtMTM5NgogICAgLy8gdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLmNyZWF0ZSwKICAgIC8vICAgICBUeG4uc2VuZGVyLAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09KHBhZ2VfMSwgcGFnZV8yKSwKICAgIC8vICAgICBjbGVhcl9zdGF0ZV9wcm9ncmFtPWNvbXBpbGVkX2NsZWFyX3N0YXRlXzEsCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PXBjZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9cGNmZy5HTE9CQUxfQllURVMsCiAgICAvLyAgICAgZXh0cmFfcHJvZ3JhbV9wYWdlcz10b3RhbF9wYWdlcywKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTAKICAgIC8vIFR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDMKICAgIGl0eG5fZmllbGQgRXh0cmFQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTQKICAgIC8vIGdsb2JhbF9udW1fYnl0ZXM9cGNmZy5HTE9CQUxfQllURVMsCiAgICBwdXNoaW50IDQKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzkzCiAgICAvLyBnbG9iYWxfbnVtX3VpbnQ9cGNmZy5HTE9CQUxfVUlOVFMsCiAgICBwdXNoaW50IDI5CiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bVVpbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNjItMTM2NgogICAgLy8gIyBjbGVhcl9zdGF0ZV9wcm9ncmFtIGlzIGEgdHVwbGUgb2YgMiBCeXRlcyBlbGVtZW50cyB3aGVyZSBlYWNoIGlzIG1heCA0MDk2IGJ5dGVzCiAgICAvLyAjIHdlIG9ubHkgdXNlIHRoZSBmaXJzdCBlbGVtZW50IGhlcmUgYXMgd2UgYXNzdW1lIHRoZSBjbGVhciBzdGF0ZSBwcm9ncmFtIGlzIHNtYWxsIGVub3VnaAogICAgLy8gY29tcGlsZWRfY2xlYXJfc3RhdGVfMSwgX2NvbXBpbGVkX2NsZWFyX3N0YXRlXzIgPSBjb21waWxlX2NvbnRyYWN0KAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsCiAgICAvLyApLmNsZWFyX3N0YXRlX3Byb2dyYW0KICAgIHB1c2hieXRlcyBiYXNlNjQoQ29FQlF3PT0pCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4OQogICAgLy8gcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwuY3JlYXRlLAogICAgcHVzaGJ5dGVzIDB4Y2M2OTRlYWEgLy8gbWV0aG9kICJjcmVhdGUoYWRkcmVzcyl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMzg4LTEzOTYKICAgIC8vIHR4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5jcmVhdGUsCiAgICAvLyAgICAgVHhuLnNlbmRlciwKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPShwYWdlXzEsIHBhZ2VfMiksCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jb21waWxlZF9jbGVhcl9zdGF0ZV8xLAogICAgLy8gICAgIGdsb2JhbF9udW1fdWludD1wY2ZnLkdMT0JBTF9VSU5UUywKICAgIC8vICAgICBnbG9iYWxfbnVtX2J5dGVzPXBjZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9dG90YWxfcGFnZXMsCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5OAogICAgLy8gbWJyX2FmdGVyID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDAtMTQwNQogICAgLy8gIyBUcmFuc2ZlciBmdW5kcyB0byB0aGUgbmV3IFByb3Bvc2FsIEFwcCwgZXhjbHVkaW5nIHRoZSBNQlIgbmVlZGVkIGZvciB0aGUgUHJvcG9zYWwgQXBwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9dHguY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSAtIChtYnJfYWZ0ZXIgLSBtYnJfYmVmb3JlKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDIKICAgIC8vIHJlY2VpdmVyPXR4LmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICBkaWcgMQogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwMwogICAgLy8gYW1vdW50PXNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUgLSAobWJyX2FmdGVyIC0gbWJyX2JlZm9yZSksCiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIC0KICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDAtMTQwMQogICAgLy8gIyBUcmFuc2ZlciBmdW5kcyB0byB0aGUgbmV3IFByb3Bvc2FsIEFwcCwgZXhjbHVkaW5nIHRoZSBNQlIgbmVlZGVkIGZvciB0aGUgUHJvcG9zYWwgQXBwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDA0CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwMC0xNDA1CiAgICAvLyAjIFRyYW5zZmVyIGZ1bmRzIHRvIHRoZSBuZXcgUHJvcG9zYWwgQXBwLCBleGNsdWRpbmcgdGhlIE1CUiBuZWVkZWQgZm9yIHRoZSBQcm9wb3NhbCBBcHAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj10eC5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1zZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlIC0gKG1icl9hZnRlciAtIG1icl9iZWZvcmUpLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDcKICAgIC8vIHNlbGYuaW5jcmVtZW50X3BlbmRpbmdfcHJvcG9zYWxzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0MDkKICAgIC8vIHNlbGYucGVuZGluZ19wcm9wb3NhbHMudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gMHg3MDY1NmU2NDY5NmU2NzVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGVuZGluZ19wcm9wb3NhbHMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAweDcwNjU2ZTY0Njk2ZTY3NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0MTAKICAgIC8vIHNlbGYucHJvcG9zZXJfYm94W3Byb3Bvc2VyXS5hY3RpdmVfcHJvcG9zYWwgPSBUcnVlCiAgICBieXRlYyA1IC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18xIC8vIDEKICAgIHNldGJpdAogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDEyCiAgICAvLyBwcm9wb3Nlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxMwogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDEwLTE0MTQKICAgIC8vIHR5cC5OZXdQcm9wb3NhbCgKICAgIC8vICAgICBwcm9wb3NhbF9pZD10eC5jcmVhdGVkX2FwcC5pZCwKICAgIC8vICAgICBwcm9wb3Nlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgZHVwCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDktMTQxNQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIHR5cC5OZXdQcm9wb3NhbCgKICAgIC8vICAgICAgICAgcHJvcG9zYWxfaWQ9dHguY3JlYXRlZF9hcHAuaWQsCiAgICAvLyAgICAgICAgIHByb3Bvc2VyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwZDFhMDUxOSAvLyBtZXRob2QgIk5ld1Byb3Bvc2FsKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpvcGVuX3Byb3Bvc2FsX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIG9wZW5fcHJvcG9zYWxfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnZvdGVfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgp2b3RlX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ4NwogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0ODkKICAgIC8vIHNlbGYudm90ZV9wcm9wb3NhbF9jaGVja19hdXRob3JpemF0aW9uKHByb3Bvc2FsX2lkLCB4Z292X2FkZHJlc3MpCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGNhbGxzdWIgdm90ZV9wcm9wb3NhbF9jaGVja19hdXRob3JpemF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDkxLTE0OTgKICAgIC8vICMgQ2FsbCB0aGUgUHJvcG9zYWwgQXBwIHRvIHJlZ2lzdGVyIHRoZSB2b3RlCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC52b3RlLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBhcHByb3ZhbF92b3RlcywKICAgIC8vICAgICByZWplY3Rpb25fdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTMKICAgIC8vIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnZvdGUsCiAgICBieXRlYyA1NiAvLyBtZXRob2QgInZvdGUoYWRkcmVzcyx1aW50NjQsdWludDY0KXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTEtMTQ5OAogICAgLy8gIyBDYWxsIHRoZSBQcm9wb3NhbCBBcHAgdG8gcmVnaXN0ZXIgdGhlIHZvdGUKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnZvdGUsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcHJvdmFsX3ZvdGVzLAogICAgLy8gICAgIHJlamVjdGlvbl92b3RlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTAwCiAgICAvLyBzZWxmLmFzc2VydF9ub192b3RlX2Vycm9yKGVycm9yKQogICAgY2FsbHN1YiBhc3NlcnRfbm9fdm90ZV9lcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbF93aXRoX3Byb29mW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTM4CiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0MAogICAgLy8gc2VsZi52b3RlX3Byb3Bvc2FsX2NoZWNrX2F1dGhvcml6YXRpb24ocHJvcG9zYWxfaWQsIHhnb3ZfYWRkcmVzcykKICAgIGRpZyA2CiAgICBkaWcgNgogICAgY2FsbHN1YiB2b3RlX3Byb3Bvc2FsX2NoZWNrX2F1dGhvcml6YXRpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NDItMTU1MgogICAgLy8gIyBDYWxsIHRoZSBQcm9wb3NhbCBBcHAgdG8gdmVyaWZ5IHRoZSBtZW1iZXJzaGlwIGFuZCByZWdpc3RlciB0aGUgdm90ZQogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudm90ZV93aXRoX3Byb29mLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICB2b3RpbmdfcG93ZXIsCiAgICAvLyAgICAgb3JkaW5hbCwKICAgIC8vICAgICBwcm9vZiwKICAgIC8vICAgICBhcHByb3ZhbF92b3RlcywKICAgIC8vICAgICByZWplY3Rpb25fdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgdW5jb3ZlciA2CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NDQKICAgIC8vIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnZvdGVfd2l0aF9wcm9vZiwKICAgIHB1c2hieXRlcyAweDA2NzNmZTM5IC8vIG1ldGhvZCAidm90ZV93aXRoX3Byb29mKGFkZHJlc3MsdWludDY0LHVpbnQ2NCxieXRlWzMyXVtdLHVpbnQ2NCx1aW50NjQpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNQogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgNAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0Mi0xNTUyCiAgICAvLyAjIENhbGwgdGhlIFByb3Bvc2FsIEFwcCB0byB2ZXJpZnkgdGhlIG1lbWJlcnNoaXAgYW5kIHJlZ2lzdGVyIHRoZSB2b3RlCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC52b3RlX3dpdGhfcHJvb2YsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIHZvdGluZ19wb3dlciwKICAgIC8vICAgICBvcmRpbmFsLAogICAgLy8gICAgIHByb29mLAogICAgLy8gICAgIGFwcHJvdmFsX3ZvdGVzLAogICAgLy8gICAgIHJlamVjdGlvbl92b3RlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTU0CiAgICAvLyBzZWxmLmFzc2VydF9ub192b3RlX2Vycm9yKGVycm9yKQogICAgY2FsbHN1YiBhc3NlcnRfbm9fdm90ZV9lcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbF9iYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfcHJvcG9zYWxfYmF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTU2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBwdXNoaW50IDQ4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuWEdvdlZvdGU+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTg1CiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1ODYKICAgIC8vIGFzc2VydCBzZWxmLl9pc19wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBzd2FwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1ODcKICAgIC8vIGFzc2VydCB2b3Rlcy5sZW5ndGgsIGVyci5FTVBUWV9QQVlMT0FECiAgICBhc3NlcnQgLy8gRW1wdHkgcGF5bG9hZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU4OQogICAgLy8gc2VsZi5idW1wX3N0YXRlX3ZlcnNpb24oKQogICAgY2FsbHN1YiBidW1wX3N0YXRlX3ZlcnNpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OTEKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3Rlcy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCnZvdGVfcHJvcG9zYWxfYmF0Y2hfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiB2b3RlX3Byb3Bvc2FsX2JhdGNoX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTkyCiAgICAvLyBzZWxmLnZvdGVfY2hlY2tfeGdvdih2b3Rlc1tpXS54Z292X2FkZHJlc3MpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDgKICAgICoKICAgIHB1c2hpbnQgNDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZXh0cmFjdCAwIDMyCiAgICBjYWxsc3ViIHZvdGVfY2hlY2tfeGdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHZvdGVfcHJvcG9zYWxfYmF0Y2hfZm9yX2hlYWRlckAyCgp2b3RlX3Byb3Bvc2FsX2JhdGNoX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTU5NC0xNTk5CiAgICAvLyAjIEEgc2luZ2xlIFByb3Bvc2FsIEFwcCBjYWxsIHJlZ2lzdGVycyBhbGwgdGhlIHZvdGVzCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC52b3RlX2JhdGNoLAogICAgLy8gICAgIHZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIGRpZyAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1OTYKICAgIC8vIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnZvdGVfYmF0Y2gsCiAgICBwdXNoYnl0ZXMgMHg3OTM1NTM2OSAvLyBtZXRob2QgInZvdGVfYmF0Y2goKGFkZHJlc3MsdWludDY0LHVpbnQ2NClbXSlzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNTk0LTE1OTkKICAgIC8vICMgQSBzaW5nbGUgUHJvcG9zYWwgQXBwIGNhbGwgcmVnaXN0ZXJzIGFsbCB0aGUgdm90ZXMKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnZvdGVfYmF0Y2gsCiAgICAvLyAgICAgdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwMQogICAgLy8gc2VsZi5hc3NlcnRfbm9fdm90ZV9lcnJvcihlcnJvcikKICAgIGNhbGxzdWIgYXNzZXJ0X25vX3ZvdGVfZXJyb3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnZvdGVfcHJvcG9zYWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV9wcm9wb3NhbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMwogICAgZHVwCiAgICBwdXNoaW50IDI0CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmNvbW1vbi5hYmlfdHlwZXMuUHJvcG9zYWxWb3RlPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzMQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjMyCiAgICAvLyBhc3NlcnQgdm90ZXMubGVuZ3RoLCBlcnIuRU1QVFlfUEFZTE9BRAogICAgYXNzZXJ0IC8vIEVtcHR5IHBheWxvYWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MzQKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjM2LTE2MzcKICAgIC8vICMgVGhlIHhHb3YgQm94IGlzIHVwZGF0ZWQgb25jZSBmb3IgYWxsIHRoZSBQcm9wb3NhbHMKICAgIC8vIHNlbGYudm90ZV9jaGVja194Z292KHhnb3ZfYWRkcmVzcykKICAgIGNhbGxzdWIgdm90ZV9jaGVja194Z292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjM5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCgp2b3RlX3Byb3Bvc2Fsc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjM5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHZvdGVfcHJvcG9zYWxzX2FmdGVyX2ZvckA2CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQwLTE2NDEKICAgIC8vIHZvdGUgPSB2b3Rlc1tpXS5jb3B5KCkKICAgIC8vIHByb3Bvc2FsX2lkID0gQXBwbGljYXRpb24odm90ZS5wcm9wb3NhbF9pZCkKICAgIGRpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAyNAogICAgKgogICAgcHVzaGludCAyNAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQxCiAgICAvLyBwcm9wb3NhbF9pZCA9IEFwcGxpY2F0aW9uKHZvdGUucHJvcG9zYWxfaWQpCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDAtMTY0MQogICAgLy8gdm90ZSA9IHZvdGVzW2ldLmNvcHkoKQogICAgLy8gcHJvcG9zYWxfaWQgPSBBcHBsaWNhdGlvbih2b3RlLnByb3Bvc2FsX2lkKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDEKICAgIC8vIHByb3Bvc2FsX2lkID0gQXBwbGljYXRpb24odm90ZS5wcm9wb3NhbF9pZCkKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQyCiAgICAvLyBhc3NlcnQgc2VsZi5faXNfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDQtMTY1MQogICAgLy8gIyBDYWxsIHRoZSBQcm9wb3NhbCBBcHAgdG8gcmVnaXN0ZXIgdGhlIHZvdGUsIHRoZSBpbm5lciBmZWUgaXMgcG9vbGVkCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC52b3RlLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICB2b3RlLmFwcHJvdmFscywKICAgIC8vICAgICB2b3RlLnJlamVjdGlvbnMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY0OAogICAgLy8gdm90ZS5hcHByb3ZhbHMsCiAgICBkaWcgMQogICAgZXh0cmFjdCA4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDkKICAgIC8vIHZvdGUucmVqZWN0aW9ucywKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCAxNiA4CiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY0NgogICAgLy8gcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudm90ZSwKICAgIGJ5dGVjIDU2IC8vIG1ldGhvZCAidm90ZShhZGRyZXNzLHVpbnQ2NCx1aW50NjQpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGRpZyA2CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjQ0LTE2NTEKICAgIC8vICMgQ2FsbCB0aGUgUHJvcG9zYWwgQXBwIHRvIHJlZ2lzdGVyIHRoZSB2b3RlLCB0aGUgaW5uZXIgZmVlIGlzIHBvb2xlZAogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudm90ZSwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgdm90ZS5hcHByb3ZhbHMsCiAgICAvLyAgICAgdm90ZS5yZWplY3Rpb25zLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cAogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NTMKICAgIC8vIHNlbGYuYXNzZXJ0X25vX3ZvdGVfZXJyb3IoZXJyb3IpCiAgICBjYWxsc3ViIGFzc2VydF9ub192b3RlX2Vycm9yCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjM5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uodm90ZXMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgdm90ZV9wcm9wb3NhbHNfZm9yX2hlYWRlckAyCgp2b3RlX3Byb3Bvc2Fsc19hZnRlcl9mb3JANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgp1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY1NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFjY291bnQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjcyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NzQtMTY3NQogICAgLy8gIyBWZXJpZnkgcHJvcG9zYWxfaWQgaXMgYSBnZW51aW5lIHByb3Bvc2FsIGNyZWF0ZWQgYnkgdGhpcyByZWdpc3RyeQogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX3Byb3Bvc2FsKHByb3Bvc2FsX2lkKSwgZXJyLklOVkFMSURfUFJPUE9TQUwKICAgIGRpZyAxCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NzcKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjc5LTE2ODYKICAgIC8vICMgVGhlIGBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXNgIGNhbGwgZ3VhcmFudGVlcyB0aGF0OgogICAgLy8gIyAtIEFueSBhYnNlbnRlZSBpbiB0aGUgYXJyYXkgaXMgcmVhbGx5IGFzc2lnbmVkIHRvIHRoZSBQcm9wb3NhbDsKICAgIC8vICMgLSBObyBhYnNlbnRlZSBpcyBkdXBsaWNhdGVkIGluIHRoZSBhcnJheS4KICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlcywKICAgIC8vICAgICBhYnNlbnRlZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjgzCiAgICAvLyBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXMsCiAgICBwdXNoYnl0ZXMgMHg3NmZmNGM3MCAvLyBtZXRob2QgInVuYXNzaWduX2Fic2VudGVlcyhhZGRyZXNzW10pc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjc5LTE2ODYKICAgIC8vICMgVGhlIGBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXNgIGNhbGwgZ3VhcmFudGVlcyB0aGF0OgogICAgLy8gIyAtIEFueSBhYnNlbnRlZSBpbiB0aGUgYXJyYXkgaXMgcmVhbGx5IGFzc2lnbmVkIHRvIHRoZSBQcm9wb3NhbDsKICAgIC8vICMgLSBObyBhYnNlbnRlZSBpcyBkdXBsaWNhdGVkIGluIHRoZSBhcnJheS4KICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIHByb3Bvc2FsX2NvbnRyYWN0LlByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlcywKICAgIC8vICAgICBhYnNlbnRlZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY4OAogICAgLy8gc2VsZi5hc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3IoZXJyb3IpCiAgICBjYWxsc3ViIGFzc2VydF9ub191bmFzc2lnbl9lcnJvcgogICAgaW50Y18wIC8vIDAKCnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfZm9yX2hlYWRlckAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5MC0xNjk1CiAgICAvLyAjIOKaoO+4jyBXQVJOSU5HOiBUaGUgYWJzZW50ZWVzIGFycmF5OgogICAgLy8gIyAtIE1VU1QgaGF2ZSBvbmx5IGFic2VudGVlcyByZWFsbHkvc3RpbGwgYXNzaWduZWQgdG8gdGhlIFByb3Bvc2FsCiAgICAvLyAjIC0gTVVTVCBOT1QgaGF2ZSBkdXBsaWNhdGVzCiAgICAvLyAjIHdoaWNoIGlzIGd1YXJhbnRlZWQgYnkgdGhlIHByZXZpb3VzIEFCSSBjYWxsLCBzbyBvbmx5IHRoZSB4R292cyBvZiB0aGUKICAgIC8vICMgUHJvcG9zYWwgQ29tbWl0dGVlIGFyZSBjaGFyZ2VkIGFuIGFic2VuY2UuCiAgICAvLyBmb3IgYWJzZW50ZWUgaW4gYWJzZW50ZWVzOgogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9hZnRlcl9mb3JANgogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjk2CiAgICAvLyBzZWxmLmNoYXJnZV9hYnNlbmNlKGFic2VudGVlKQogICAgY2FsbHN1YiBjaGFyZ2VfYWJzZW5jZQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX2Zvcl9oZWFkZXJAMwoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9hZnRlcl9mb3JANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfd2l0aF9wcm9vZltyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfd2l0aF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTcyNwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwgZXJyLlBBVVNFRF9SRUdJU1RSWQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUmVnaXN0cnkncyBub24tYWRtaW4gbWV0aG9kcyBhcmUgcGF1c2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzI5LTE3MzAKICAgIC8vICMgVmVyaWZ5IHByb3Bvc2FsX2lkIGlzIGEgZ2VudWluZSBwcm9wb3NhbCBjcmVhdGVkIGJ5IHRoaXMgcmVnaXN0cnkKICAgIC8vIGFzc2VydCBzZWxmLl9pc19wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBkaWcgNAogICAgY2FsbHN1YiBfaXNfcHJvcG9zYWwKICAgIGFzc2VydCAvLyBJbnZhbGlkIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzMyCiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTczNC0xNzQzCiAgICAvLyAjIFRoZSBgUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZmAgY2FsbCBndWFyYW50ZWVzIHRoYXQgdGhlCiAgICAvLyAjIGFic2VudGVlIGlzIGEgQ29tbWl0dGVlIG1lbWJlciB3aG8gaGFzIG5vdCB2b3RlZCBhbmQgaXMgY2hhcmdlZCBvbmNlCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICB2b3RpbmdfcG93ZXIsCiAgICAvLyAgICAgb3JkaW5hbCwKICAgIC8vICAgICBwcm9vZiwKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICB1bmNvdmVyIDQKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTczNwogICAgLy8gcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZiwKICAgIHB1c2hieXRlcyAweGEyOTY1MTgwIC8vIG1ldGhvZCAidW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZihhZGRyZXNzLHVpbnQ2NCx1aW50NjQsYnl0ZVszMl1bXSlzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZGlnIDMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MzQtMTc0MwogICAgLy8gIyBUaGUgYFByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlX3dpdGhfcHJvb2ZgIGNhbGwgZ3VhcmFudGVlcyB0aGF0IHRoZQogICAgLy8gIyBhYnNlbnRlZSBpcyBhIENvbW1pdHRlZSBtZW1iZXIgd2hvIGhhcyBub3Qgdm90ZWQgYW5kIGlzIGNoYXJnZWQgb25jZQogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZiwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgdm90aW5nX3Bvd2VyLAogICAgLy8gICAgIG9yZGluYWwsCiAgICAvLyAgICAgcHJvb2YsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc0NQogICAgLy8gc2VsZi5hc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3IoZXJyb3IpCiAgICBjYWxsc3ViIGFzc2VydF9ub191bmFzc2lnbl9lcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc0NwogICAgLy8gc2VsZi5jaGFyZ2VfYWJzZW5jZSh4Z292X2FkZHJlc3MpCiAgICBjYWxsc3ViIGNoYXJnZV9hYnNlbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNjk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5wYXlfZ3JhbnRfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgpwYXlfZ3JhbnRfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzcyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc5MC0xNzkxCiAgICAvLyAjIFZlcmlmeSB0aGUgY2FsbGVyIGlzIHRoZSB4R292IFBheW9yCiAgICAvLyBhc3NlcnQgc2VsZi5pc194Z292X3BheW9yKCksIGVyci5VTkFVVEhPUklaRUQKICAgIGNhbGxzdWIgaXNfeGdvdl9wYXlvcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc5My0xNzk0CiAgICAvLyAjIFZlcmlmeSBwcm9wb3NhbF9pZCBpcyBhIGdlbnVpbmUgcHJvcG9zYWwgY3JlYXRlZCBieSB0aGlzIHJlZ2lzdHJ5CiAgICAvLyBhc3NlcnQgc2VsZi5faXNfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3OTYKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzk4LTE3OTkKICAgIC8vICMgUmVhZCBwcm9wb3NhbCBzdGF0ZSBkaXJlY3RseSBmcm9tIHRoZSBQcm9wb3NhbCBBcHAncyBnbG9iYWwgc3RhdGUKICAgIC8vIHByb3Bvc2VyID0gc2VsZi5nZXRfcHJvcG9zYWxfcHJvcG9zZXIocHJvcG9zYWxfaWQpCiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjAtMjYyCiAgICAvLyByZXF1ZXN0ZWRfYW1vdW50LCByZXF1ZXN0ZWRfYW1vdW50X2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIHByb3Bvc2FsLCBwY2ZnLkdTX0tFWV9SRVFVRVNURURfQU1PVU5UCiAgICAvLyApCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjYxCiAgICAvLyBwcm9wb3NhbCwgcGNmZy5HU19LRVlfUkVRVUVTVEVEX0FNT1VOVAogICAgYnl0ZWMgNTcgLy8gMHg3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjYwLTI2MgogICAgLy8gcmVxdWVzdGVkX2Ftb3VudCwgcmVxdWVzdGVkX2Ftb3VudF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NCgKICAgIC8vICAgICBwcm9wb3NhbCwgcGNmZy5HU19LRVlfUkVRVUVTVEVEX0FNT1VOVAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2MwogICAgLy8gYXNzZXJ0IHJlcXVlc3RlZF9hbW91bnRfZXhpc3RzLCBlcnIuTUlTU0lOR19LRVkKICAgIGFzc2VydCAvLyBNaXNzaW5nIGtleSBpbiBzdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgwMgogICAgLy8gYXNzZXJ0IHByb3Bvc2VyIGluIHNlbGYucHJvcG9zZXJfYm94LCBlcnIuV1JPTkdfUFJPUE9TRVIKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gV3JvbmcgcHJvcG9zZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MDQKICAgIC8vIGFzc2VydCBzZWxmLnZhbGlkX2t5Yyhwcm9wb3NlciksIGVyci5JTlZBTElEX0tZQwogICAgZGlnIDEKICAgIGNhbGxzdWIgdmFsaWRfa3ljCiAgICBhc3NlcnQgLy8gSW52YWxpZCBLWUMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MDgKICAgIC8vIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMudmFsdWUgPj0gcmVxdWVzdGVkX2Ftb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICBkdXAKICAgIGRpZyAyCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgwNi0xODA5CiAgICAvLyAjIFZlcmlmeSBzdWZmaWNpZW50IGZ1bmRzIGFyZSBhdmFpbGFibGUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSA+PSByZXF1ZXN0ZWRfYW1vdW50CiAgICAvLyApLCBlcnIuSU5TVUZGSUNJRU5UX1RSRUFTVVJZX0ZVTkRTCiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHRyZWFzdXJ5IGZ1bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMzQtMzM1CiAgICAvLyAjIFRyYW5zZmVyIHRoZSBmdW5kcyB0byB0aGUgcmVjZWl2ZXIKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1yZWNpcGllbnQsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzNy0zMzgKICAgIC8vICMgVXBkYXRlIHRoZSBvdXRzdGFuZGluZyBmdW5kcwogICAgLy8gc2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSAtPSBhbW91bnQKICAgIHN3YXAKICAgIC0KICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgxMwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwocHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwuZnVuZCwgYXBwX2lkPXByb3Bvc2FsX2lkKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHg4YTVlNGM4MCAvLyBtZXRob2QgImZ1bmQoKXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXBuIDIKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MTUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogcGF5X2dyYW50X3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCnBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IHBheV9ncmFudF9wcm9wb3NhbF9lbHNlX2JvZHlAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgxNgogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgxOAogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWMgMTUgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODE3LTE4MjEKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIC8vICAgICAgICAgb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICAvLyAgICAgY2FzZSBfOgogICAgLy8gICAgICAgICBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgc3dhcAogICAgbWF0Y2ggcGF5X2dyYW50X3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyMQogICAgLy8gb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgpwYXlfZ3JhbnRfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgxOQogICAgLy8gb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKcGF5X2dyYW50X3Byb3Bvc2FsX2Vsc2VfYm9keUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyMwogICAgLy8gYXNzZXJ0IGVycm9yID09ICIiLCAiVW5rbm93biBlcnJvciIKICAgIGRpZyAxCiAgICBwdXNoYnl0ZXMgIiIKICAgID09CiAgICBhc3NlcnQgLy8gVW5rbm93biBlcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc3MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGRpZyAyCiAgICBleHRyYWN0IDYgNAogICAgYnl0ZWMgMTYgLy8gIkVSUjoiCiAgICA9PQogICAgYiBwYXlfZ3JhbnRfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmZpbmFsaXplX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKZmluYWxpemVfcHJvcG9zYWw6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NDAKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNDgKICAgIC8vIHN0YXR1cywgc3RhdHVzX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHByb3Bvc2FsLCBwY2ZnLkdTX0tFWV9TVEFUVVMpCiAgICBieXRlYyA1OCAvLyAweDczNzQ2MTc0NzU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNDkKICAgIC8vIGFzc2VydCBzdGF0dXNfZXhpc3RzLCBlcnIuTUlTU0lOR19LRVkKICAgIGFzc2VydCAvLyBNaXNzaW5nIGtleSBpbiBzdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg0My0xODQ1CiAgICAvLyBpZiBwcm9wb3NhbF9zdGF0dXMgPT0gVUludDY0KHBlbm0uU1RBVFVTX0VNUFRZKSBvciBwcm9wb3NhbF9zdGF0dXMgPT0gVUludDY0KAogICAgLy8gICAgIHBlbm0uU1RBVFVTX0RSQUZUCiAgICAvLyApOgogICAgYnogZmluYWxpemVfcHJvcG9zYWxfaWZfYm9keUAzCiAgICBkdXAKICAgIHB1c2hpbnQgMTAKICAgID09CiAgICBieiBmaW5hbGl6ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDQKCmZpbmFsaXplX3Byb3Bvc2FsX2lmX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NDYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9kYWVtb24udmFsdWUsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAweDc4Njc2Zjc2NWY2NDYxNjU2ZDZmNmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2RhZW1vbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCgpmaW5hbGl6ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODQ4LTE4NDkKICAgIC8vICMgVmVyaWZ5IHByb3Bvc2FsX2lkIGlzIGEgZ2VudWluZSBwcm9wb3NhbCBjcmVhdGVkIGJ5IHRoaXMgcmVnaXN0cnkKICAgIC8vIGFzc2VydCBzZWxmLl9pc19wcm9wb3NhbChwcm9wb3NhbF9pZCksIGVyci5JTlZBTElEX1BST1BPU0FMCiAgICBkaWcgMQogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NTEtMTg1MwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgcHJvcG9zYWxfY29udHJhY3QuUHJvcG9zYWwuZmluYWxpemUsIGFwcF9pZD1wcm9wb3NhbF9pZAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODUyCiAgICAvLyBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZSwgYXBwX2lkPXByb3Bvc2FsX2lkCiAgICBwdXNoYnl0ZXMgMHg4MDIwNjliNCAvLyBtZXRob2QgImZpbmFsaXplKClzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1MS0xODUzCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5maW5hbGl6ZSwgYXBwX2lkPXByb3Bvc2FsX2lkCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGJ1cnkgNgogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NTUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIGJ1cnkgNAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDcKICAgIGludGNfMCAvLyAwCgpmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODU1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IGZpbmFsaXplX3Byb3Bvc2FsX2Vsc2VfYm9keUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1NgogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDUKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1OAogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWMgMTUgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODYwCiAgICAvLyBjYXNlIGVyci5WT1RFUlNfQVNTSUdORUQ6CiAgICBwdXNoYnl0ZXMgIlRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NTctMTg2MwogICAgLy8gbWF0Y2ggZXJyb3Jfd2l0aG91dF9wcmVmaXg6CiAgICAvLyAgICAgY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUlNfQVNTSUdORUQ6CiAgICAvLyAgICAgICAgIG9wLmVycihlcnIuVk9URVJTX0FTU0lHTkVEKQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIHVuY292ZXIgMgogICAgbWF0Y2ggZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEAxMCBmaW5hbGl6ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8xQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODYzCiAgICAvLyBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCmZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODYxCiAgICAvLyBvcC5lcnIoZXJyLlZPVEVSU19BU1NJR05FRCkKICAgIGVyciAvLyBUaGVyZSBhcmUgdm90ZXJzIGFzc2lnbmVkIHRvIHRoaXMgcHJvcG9zYWwKCmZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODU5CiAgICAvLyBvcC5lcnIoZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIGVyciAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCgpmaW5hbGl6ZV9wcm9wb3NhbF9lbHNlX2JvZHlAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODY1CiAgICAvLyBhc3NlcnQgZXJyb3IgPT0gIiIsICJVbmtub3duIGVycm9yIgogICAgZGlnIDMKICAgIHB1c2hieXRlcyAiIgogICAgPT0KICAgIGFzc2VydCAvLyBVbmtub3duIGVycm9yCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODY3CiAgICAvLyBzZWxmLmRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2Fscyhwcm9wb3NhbF9pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIGRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2FscwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmZpbmFsaXplX3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NTUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDQKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlYyAxNiAvLyAiRVJSOiIKICAgID09CiAgICBiIGZpbmFsaXplX3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5kcm9wX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKZHJvcF9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4ODQKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsIGVyci5QQVVTRURfUkVHSVNUUlkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgIQogICAgYXNzZXJ0IC8vIFJlZ2lzdHJ5J3Mgbm9uLWFkbWluIG1ldGhvZHMgYXJlIHBhdXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg4Ni0xODg3CiAgICAvLyAjIFZlcmlmeSBwcm9wb3NhbF9pZCBpcyBhIGdlbnVpbmUgcHJvcG9zYWwgY3JlYXRlZCBieSB0aGlzIHJlZ2lzdHJ5CiAgICAvLyBhc3NlcnQgc2VsZi5faXNfcHJvcG9zYWwocHJvcG9zYWxfaWQpLCBlcnIuSU5WQUxJRF9QUk9QT1NBTAogICAgZHVwCiAgICBjYWxsc3ViIF9pc19wcm9wb3NhbAogICAgYXNzZXJ0IC8vIEludmFsaWQgcHJvcG9zYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4ODkKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODkxCiAgICAvLyBwcm9wb3NlciA9IHNlbGYuZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyKHByb3Bvc2FsX2lkKQogICAgZHVwCiAgICBjYWxsc3ViIGdldF9wcm9wb3NhbF9wcm9wb3NlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg5MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcHJvcG9zZXIsIGVyci5VTkFVVEhPUklaRUQKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODk0CiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbChwcm9wb3NhbF9jb250cmFjdC5Qcm9wb3NhbC5kcm9wLCBhcHBfaWQ9cHJvcG9zYWxfaWQpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweDczNzEzMjFhIC8vIG1ldGhvZCAiZHJvcCgpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg5NgogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBkcm9wX3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCmRyb3BfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg5NgogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBieiBkcm9wX3Byb3Bvc2FsX2Vsc2VfYm9keUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODk3CiAgICAvLyBlcnJvcl93aXRob3V0X3ByZWZpeCA9IFN0cmluZy5mcm9tX2J5dGVzKGVycm9yLmJ5dGVzWzQ6XSkKICAgIHB1c2hpbnQgNAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgPj0KICAgIHB1c2hpbnQgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMwogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxODk5CiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlYyAxNSAvLyAiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4OTgtMTkwMgogICAgLy8gbWF0Y2ggZXJyb3Jfd2l0aG91dF9wcmVmaXg6CiAgICAvLyAgICAgY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIG9wLmVycigiVW5rbm93biBlcnJvciIpCiAgICBzd2FwCiAgICBtYXRjaCBkcm9wX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTkwMgogICAgLy8gb3AuZXJyKCJVbmtub3duIGVycm9yIikKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgpkcm9wX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MDAKICAgIC8vIG9wLmVycihlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCmRyb3BfcHJvcG9zYWxfZWxzZV9ib2R5QDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTA0CiAgICAvLyBhc3NlcnQgZXJyb3IgPT0gIiIsICJVbmtub3duIGVycm9yIgogICAgZGlnIDEKICAgIHB1c2hieXRlcyAiIgogICAgPT0KICAgIGFzc2VydCAvLyBVbmtub3duIGVycm9yCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTA2CiAgICAvLyBzZWxmLmRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2Fscyhwcm9wb3NhbF9pZCkKICAgIGRpZyAzCiAgICBjYWxsc3ViIGRlY3JlbWVudF9wZW5kaW5nX3Byb3Bvc2FscwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg2OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmRyb3BfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTg5NgogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBkaWcgMgogICAgZXh0cmFjdCA2IDQKICAgIGJ5dGVjIDE2IC8vICJFUlI6IgogICAgPT0KICAgIGIgZHJvcF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZGVwb3NpdF9mdW5kc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlcG9zaXRfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTIxCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGR1cAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTkyMC0xOTIyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgZXJyLldST05HX1JFQ0VJVkVSCiAgICBhc3NlcnQgLy8gV3JvbmcgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MjQKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTI1CiAgICAvLyBzZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlICs9IHBheW1lbnQuYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDZmNzU3NDczNzQ2MTZlNjQ2OTZlNjc1ZjY2NzU2ZTY0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vdXRzdGFuZGluZ19mdW5kcyBleGlzdHMKICAgIHN3YXAKICAgIGd0eG5zIEFtb3VudAogICAgKwogICAgYnl0ZWMgNCAvLyAweDZmNzU3NDczNzQ2MTZlNjQ2OTZlNjc1ZjY2NzU2ZTY0NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS53aXRoZHJhd19mdW5kc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CndpdGhkcmF3X2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTkyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NDEKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfbWFuYWdlcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfbWFuYWdlcgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0MgogICAgLy8gYXNzZXJ0IGFtb3VudCA8PSBzZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlLCBlcnIuSU5TVUZGSUNJRU5UX0ZVTkRTCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDZmNzU3NDczNzQ2MTZlNjQ2OTZlNjc1ZjY2NzU2ZTY0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vdXRzdGFuZGluZ19mdW5kcyBleGlzdHMKICAgIGRpZyAxCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0MwogICAgLy8gYXNzZXJ0IFR4bi5mZWUgPj0gKEdsb2JhbC5taW5fdHhuX2ZlZSAqIDIpLCBlcnIuSU5TVUZGSUNJRU5UX0ZFRQogICAgdHhuIEZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgcHVzaGludCAyCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBmZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NDUKICAgIC8vIHNlbGYuYnVtcF9zdGF0ZV92ZXJzaW9uKCkKICAgIGNhbGxzdWIgYnVtcF9zdGF0ZV92ZXJzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTQ2CiAgICAvLyBzZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlIC09IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg2Zjc1NzQ3Mzc0NjE2ZTY0Njk2ZTY3NWY2Njc1NmU2NDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMgZXhpc3RzCiAgICBkaWcgMQogICAgLQogICAgYnl0ZWMgNCAvLyAweDZmNzU3NDczNzQ2MTZlNjQ2OTZlNjc1ZjY2NzU2ZTY0NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTQ4LTE5NTIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLnhnb3ZfbWFuYWdlci52YWx1ZSwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0OQogICAgLy8gcmVjZWl2ZXI9c2VsZi54Z292X21hbmFnZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfbWFuYWdlciBleGlzdHMKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTQ4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTUxCiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0OC0xOTUyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi54Z292X21hbmFnZXIudmFsdWUsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS53aXRoZHJhd19hdmFpbGFibGVfZnVuZHNbcm91dGluZ10oKSAtPiB2b2lkOgp3aXRoZHJhd19hdmFpbGFibGVfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTU0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk2OAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfeGdvdl9wYXlvcigpLCBlcnIuVU5BVVRIT1JJWkVECiAgICBjYWxsc3ViIGlzX3hnb3ZfcGF5b3IKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NjkKICAgIC8vIGFzc2VydCBUeG4uZmVlID49IChHbG9iYWwubWluX3R4bl9mZWUgKiAyKSwgZXJyLklOU1VGRklDSUVOVF9GRUUKICAgIHR4biBGZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIHB1c2hpbnQgMgogICAgKgogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTcwCiAgICAvLyBhc3NlcnQgYW1vdW50IDw9IHNlbGYuY29tcHV0ZV9hdmFpbGFibGVfZnVuZHMoKSwgZXJyLklOU1VGRklDSUVOVF9GVU5EUwogICAgY2FsbHN1YiBjb21wdXRlX2F2YWlsYWJsZV9mdW5kcwogICAgZGlnIDEKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IGZ1bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTcyCiAgICAvLyBzZWxmLmJ1bXBfc3RhdGVfdmVyc2lvbigpCiAgICBjYWxsc3ViIGJ1bXBfc3RhdGVfdmVyc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk3My0xOTc3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi54Z292X3BheW9yLnZhbHVlLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTc0CiAgICAvLyByZWNlaXZlcj1zZWxmLnhnb3ZfcGF5b3IudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAweDc4Njc2Zjc2NWY3MDYxNzk2ZjcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9wYXlvciBleGlzdHMKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTczCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTc2CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk3My0xOTc3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi54Z292X3BheW9yLnZhbHVlLAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZ2V0X2F2YWlsYWJsZV9mdW5kc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9hdmFpbGFibGVfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTkwCiAgICAvLyByZXR1cm4gc2VsZi5jb21wdXRlX2F2YWlsYWJsZV9mdW5kcygpCiAgICBjYWxsc3ViIGNvbXB1dGVfYXZhaWxhYmxlX2Z1bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxOTc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZ2V0X3N0YXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3N0YXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk5OQogICAgLy8gcGF1c2VkX3JlZ2lzdHJ5PXNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDAwCiAgICAvLyBwYXVzZWRfcHJvcG9zYWxzPXNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3Byb3Bvc2FscyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDEKICAgIC8vIHhnb3ZfbWFuYWdlcj1zZWxmLnhnb3ZfbWFuYWdlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4Nzg2NzZmNzY1ZjZkNjE2ZTYxNjc2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9tYW5hZ2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAwMgogICAgLy8geGdvdl9wYXlvcj1zZWxmLnhnb3ZfcGF5b3IudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAweDc4Njc2Zjc2NWY3MDYxNzk2ZjcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9wYXlvciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDMKICAgIC8vIHhnb3ZfY291bmNpbD1zZWxmLnhnb3ZfY291bmNpbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOCAvLyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfY291bmNpbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDQKICAgIC8vIHhnb3Zfc3Vic2NyaWJlcj1zZWxmLnhnb3Zfc3Vic2NyaWJlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOCAvLyAweDc4Njc2Zjc2NWY3Mzc1NjI3MzYzNzI2OTYyNjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3Zfc3Vic2NyaWJlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDUKICAgIC8vIGt5Y19wcm92aWRlcj1zZWxmLmt5Y19wcm92aWRlci52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOSAvLyAweDZiNzk2MzVmNzA3MjZmNzY2OTY0NjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmt5Y19wcm92aWRlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDYKICAgIC8vIGNvbW1pdHRlZV9tYW5hZ2VyPXNlbGYuY29tbWl0dGVlX21hbmFnZXIudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjAgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjE2ZTYxNjc2NTcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21hbmFnZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDA3CiAgICAvLyB4Z292X2RhZW1vbj1zZWxmLnhnb3ZfZGFlbW9uLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfZGFlbW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAwOAogICAgLy8geGdvdl9mZWU9c2VsZi54Z292X2ZlZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAweDc4Njc2Zjc2NWY2NjY1NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2ZlZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDkKICAgIC8vIHByb3Bvc2VyX2ZlZT1zZWxmLnByb3Bvc2VyX2ZlZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAweDcwNzI2ZjcwNmY3MzY1NzI1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb3Bvc2VyX2ZlZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMTAKICAgIC8vIG9wZW5fcHJvcG9zYWxfZmVlPXNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjQgLy8gMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDExCiAgICAvLyBkYWVtb25fb3BzX2Z1bmRpbmdfYnBzPXNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOSAvLyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2JwcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMTIKICAgIC8vIHByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzPXNlbGYucHJvcG9zYWxfY29tbWl0bWVudF9icHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzAgLy8gMHg3MDcyNmY3MDZmNzM2MTZjNWY2MzZmNmQ2ZDY5NzQ2ZDY1NmU3NDVmNjI3MDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxfY29tbWl0bWVudF9icHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDEzCiAgICAvLyBtaW5fcmVxdWVzdGVkX2Ftb3VudD1zZWxmLm1pbl9yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMxIC8vIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbl9yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAxNgogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMiAvLyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMTcKICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMzIC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAxOAogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNCAvLyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMTQtMjAyMAogICAgLy8gbWF4X3JlcXVlc3RlZF9hbW91bnQ9Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMjMKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNSAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMjQKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzYgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDI1CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzcgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDI2CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM4IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAyMS0yMDI4CiAgICAvLyBkaXNjdXNzaW9uX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgKAogICAgLy8gICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIC8vICAgICApCiAgICAvLyApLAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAzMQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzkgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDMyCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDAgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDMzCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0MSAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMzQKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0MiAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMjktMjAzNgogICAgLy8gdm90aW5nX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgKAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDM5CiAgICAvLyBzZWxmLnF1b3J1bV9zbWFsbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0MyAvLyAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1b3J1bV9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNDAKICAgIC8vIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0NCAvLyAweDcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtX21lZGl1bSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNDEKICAgIC8vIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ1IC8vIDB4NzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtX2xhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjAzNy0yMDQzCiAgICAvLyBxdW9ydW09Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYucXVvcnVtX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnF1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgICAgIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNDYKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ2IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA0NwogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ3IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA0OAogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDggLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDQ0LTIwNTAKICAgIC8vIHdlaWdodGVkX3F1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICgKICAgIC8vICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1MQogICAgLy8gb3V0c3RhbmRpbmdfZnVuZHM9c2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vIDB4NmY3NTc0NzM3NDYxNmU2NDY5NmU2NzVmNjY3NTZlNjQ3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm91dHN0YW5kaW5nX2Z1bmRzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1MgogICAgLy8gcGVuZGluZ19wcm9wb3NhbHM9c2VsZi5wZW5kaW5nX3Byb3Bvc2Fscy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA2NTZlNjQ2OTZlNjc1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlbmRpbmdfcHJvcG9zYWxzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1MwogICAgLy8gY29tbWl0dGVlX2lkPXNlbGYuY29tbWl0dGVlX2lkLnZhbHVlLmNvcHkoKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1OSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNTQKICAgIC8vIGNvbW1pdHRlZV9tZW1iZXJzPXNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDkgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDU1CiAgICAvLyBjb21taXR0ZWVfdm90ZXM9c2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjUgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfdm90ZXMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDU2CiAgICAvLyBhYnNlbmNlX3RvbGVyYW5jZT1zZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI3IC8vIDB4NjE2MjczNjU2ZTYzNjU1Zjc0NmY2YzY1NzI2MTZlNjM2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFic2VuY2VfdG9sZXJhbmNlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1NwogICAgLy8gZ292ZXJuYW5jZV9wZXJpb2Q9c2VsZi5nb3Zlcm5hbmNlX3BlcmlvZC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1MCAvLyAweDY3NmY3NjY1NzI2ZTYxNmU2MzY1NWY3MDY1NzI2OTZmNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb3Zlcm5hbmNlX3BlcmlvZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNTgKICAgIC8vIGNvbW1pdHRlZV9ncmFjZV9wZXJpb2Q9c2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUxIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2NzcyNjE2MzY1NWY3MDY1NzI2OTZmNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1OQogICAgLy8gY29tbWl0dGVlX2xhc3RfYW5jaG9yPXNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUyIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTk5OC0yMDYwCiAgICAvLyByZXR1cm4gdHlwLlR5cGVkR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgcGF1c2VkX3JlZ2lzdHJ5PXNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLAogICAgLy8gICAgIHBhdXNlZF9wcm9wb3NhbHM9c2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlLAogICAgLy8gICAgIHhnb3ZfbWFuYWdlcj1zZWxmLnhnb3ZfbWFuYWdlci52YWx1ZSwKICAgIC8vICAgICB4Z292X3BheW9yPXNlbGYueGdvdl9wYXlvci52YWx1ZSwKICAgIC8vICAgICB4Z292X2NvdW5jaWw9c2VsZi54Z292X2NvdW5jaWwudmFsdWUsCiAgICAvLyAgICAgeGdvdl9zdWJzY3JpYmVyPXNlbGYueGdvdl9zdWJzY3JpYmVyLnZhbHVlLAogICAgLy8gICAgIGt5Y19wcm92aWRlcj1zZWxmLmt5Y19wcm92aWRlci52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfbWFuYWdlcj1zZWxmLmNvbW1pdHRlZV9tYW5hZ2VyLnZhbHVlLAogICAgLy8gICAgIHhnb3ZfZGFlbW9uPXNlbGYueGdvdl9kYWVtb24udmFsdWUsCiAgICAvLyAgICAgeGdvdl9mZWU9c2VsZi54Z292X2ZlZS52YWx1ZSwKICAgIC8vICAgICBwcm9wb3Nlcl9mZWU9c2VsZi5wcm9wb3Nlcl9mZWUudmFsdWUsCiAgICAvLyAgICAgb3Blbl9wcm9wb3NhbF9mZWU9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSwKICAgIC8vICAgICBkYWVtb25fb3BzX2Z1bmRpbmdfYnBzPXNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZSwKICAgIC8vICAgICBwcm9wb3NhbF9jb21taXRtZW50X2Jwcz1zZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzLnZhbHVlLAogICAgLy8gICAgIG1pbl9yZXF1ZXN0ZWRfYW1vdW50PXNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICAvLyAgICAgbWF4X3JlcXVlc3RlZF9hbW91bnQ9Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgZGlzY3Vzc2lvbl9kdXJhdGlvbj1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgdm90aW5nX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIHF1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLnF1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICB3ZWlnaHRlZF9xdW9ydW09Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgb3V0c3RhbmRpbmdfZnVuZHM9c2VsZi5vdXRzdGFuZGluZ19mdW5kcy52YWx1ZSwKICAgIC8vICAgICBwZW5kaW5nX3Byb3Bvc2Fscz1zZWxmLnBlbmRpbmdfcHJvcG9zYWxzLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9pZD1zZWxmLmNvbW1pdHRlZV9pZC52YWx1ZS5jb3B5KCksCiAgICAvLyAgICAgY29tbWl0dGVlX21lbWJlcnM9c2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfdm90ZXM9c2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsCiAgICAvLyAgICAgYWJzZW5jZV90b2xlcmFuY2U9c2VsZi5hYnNlbmNlX3RvbGVyYW5jZS52YWx1ZSwKICAgIC8vICAgICBnb3Zlcm5hbmNlX3BlcmlvZD1zZWxmLmdvdmVybmFuY2VfcGVyaW9kLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9ncmFjZV9wZXJpb2Q9c2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9sYXN0X2FuY2hvcj1zZWxmLmNvbW1pdHRlZV9sYXN0X2FuY2hvci52YWx1ZSwKICAgIC8vICkKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMzAKICAgIHNldGJpdAogICAgaW50Y18xIC8vIDEKICAgIHVuY292ZXIgMjkKICAgIHNldGJpdAogICAgdW5jb3ZlciAyNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDI2CiAgICBjb25jYXQKICAgIHVuY292ZXIgMjUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMjIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTkKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxOAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE3CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTYKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDExCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5OTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfc3RhdGVfdmVyc2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9zdGF0ZV92ZXJzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDE4CiAgICAvLyByZXR1cm4gc2VsZi5zdGF0ZV92ZXJzaW9uLmdldChkZWZhdWx0PWFyYzQuVUludDY0KDApKS5hc191aW50NjQoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUzIC8vIDB4NzM3NDYxNzQ2NTVmNzY2NTcyNzM2OTZmNmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBieXRlYyA2MCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjEwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF94Z292X2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTI4CiAgICAvLyByZXR1cm4gc2VsZi5yZWFkX3hnb3ZfYm94KHhnb3ZfYWRkcmVzcykKICAgIGNhbGxzdWIgcmVhZF94Z292X2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjExNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF94Z292X2JveGVzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3hnb3ZfYm94ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTMwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFjY291bnQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTQ0CiAgICAvLyBlbnRyaWVzID0gQXJyYXlbdHlwLlhHb3ZCb3hFbnRyeV0oKQogICAgYnl0ZWMgMTcgLy8gMHgwMDAwCiAgICBpbnRjXzAgLy8gMAoKZ2V0X3hnb3ZfYm94ZXNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE0NQogICAgLy8gZm9yIHhnb3ZfYWRkcmVzcyBpbiB4Z292X2FkZHJlc3NlczoKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IGdldF94Z292X2JveGVzX2FmdGVyX2ZvckA1CiAgICBkaWcgMwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgaW50Y18zIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNDYKICAgIC8vIHZhbCwgZXhpc3RzID0gc2VsZi5yZWFkX3hnb3ZfYm94KHhnb3ZfYWRkcmVzcykKICAgIGNhbGxzdWIgcmVhZF94Z292X2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE0NwogICAgLy8gZW50cmllcy5hcHBlbmQodHlwLlhHb3ZCb3hFbnRyeSh2YWx1ZT12YWwuY29weSgpLCBleGlzdHM9ZXhpc3RzKSkKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE0NwogICAgLy8gZW50cmllcy5hcHBlbmQodHlwLlhHb3ZCb3hFbnRyeSh2YWx1ZT12YWwuY29weSgpLCBleGlzdHM9ZXhpc3RzKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgcmVwbGFjZTIgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBidXJ5IDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgZ2V0X3hnb3ZfYm94ZXNfZm9yX2hlYWRlckAyCgpnZXRfeGdvdl9ib3hlc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZ2V0X3Byb3Bvc2VyX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9wb3Nlcl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE2NgogICAgLy8gcmV0dXJuIHNlbGYucmVhZF9wcm9wb3Nlcl9ib3gocHJvcG9zZXJfYWRkcmVzcykKICAgIGNhbGxzdWIgcmVhZF9wcm9wb3Nlcl9ib3gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfcHJvcG9zZXJfYm94ZXNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvcG9zZXJfYm94ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTY4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFjY291bnQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTgyCiAgICAvLyBlbnRyaWVzID0gQXJyYXlbdHlwLlByb3Bvc2VyQm94RW50cnldKCkKICAgIGJ5dGVjIDE3IC8vIDB4MDAwMAogICAgaW50Y18wIC8vIDAKCmdldF9wcm9wb3Nlcl9ib3hlc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTgzCiAgICAvLyBmb3IgcHJvcG9zZXJfYWRkcmVzcyBpbiBwcm9wb3Nlcl9hZGRyZXNzZXM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfcHJvcG9zZXJfYm94ZXNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE4NAogICAgLy8gdmFsLCBleGlzdHMgPSBzZWxmLnJlYWRfcHJvcG9zZXJfYm94KHByb3Bvc2VyX2FkZHJlc3MpCiAgICBjYWxsc3ViIHJlYWRfcHJvcG9zZXJfYm94CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTg1CiAgICAvLyBlbnRyaWVzLmFwcGVuZCh0eXAuUHJvcG9zZXJCb3hFbnRyeSh2YWx1ZT12YWwuY29weSgpLCBleGlzdHM9ZXhpc3RzKSkKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE4NQogICAgLy8gZW50cmllcy5hcHBlbmQodHlwLlByb3Bvc2VyQm94RW50cnkodmFsdWU9dmFsLmNvcHkoKSwgZXhpc3RzPWV4aXN0cykpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDAKICAgIHJlcGxhY2UyIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnVyeSAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGdldF9wcm9wb3Nlcl9ib3hlc19mb3JfaGVhZGVyQDIKCmdldF9wcm9wb3Nlcl9ib3hlc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZ2V0X3JlcXVlc3RfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JlcXVlc3RfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjE4OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjA0CiAgICAvLyByZXR1cm4gc2VsZi5yZWFkX3JlcXVlc3RfYm94KHNlbGYucmVxdWVzdF9ib3gsIHJlcXVlc3RfaWQpCiAgICBieXRlYyAxMyAvLyAweDcyCiAgICBzd2FwCiAgICBjYWxsc3ViIHJlYWRfcmVxdWVzdF9ib3gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMyAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfcmVxdWVzdF9ib3hlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXF1ZXN0X2JveGVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjIwNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PHVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMjEKICAgIC8vIGVudHJpZXMgPSBBcnJheVt0eXAuWEdvdlN1YnNjcmliZVJlcXVlc3RCb3hFbnRyeV0oKQogICAgYnl0ZWMgMTcgLy8gMHgwMDAwCiAgICBpbnRjXzAgLy8gMAoKZ2V0X3JlcXVlc3RfYm94ZXNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjIyMgogICAgLy8gZm9yIHJlcXVlc3RfaWQgaW4gcmVxdWVzdF9pZHM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfcmVxdWVzdF9ib3hlc19hZnRlcl9mb3JANQogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMjMKICAgIC8vIHZhbCwgZXhpc3RzID0gc2VsZi5yZWFkX3JlcXVlc3RfYm94KHNlbGYucmVxdWVzdF9ib3gsIHJlcXVlc3RfaWQpCiAgICBieXRlYyAxMyAvLyAweDcyCiAgICBzd2FwCiAgICBjYWxsc3ViIHJlYWRfcmVxdWVzdF9ib3gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMjUKICAgIC8vIHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveEVudHJ5KHZhbHVlPXZhbC5jb3B5KCksIGV4aXN0cz1leGlzdHMpCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBkaWcgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMjQtMjIyNgogICAgLy8gZW50cmllcy5hcHBlbmQoCiAgICAvLyAgICAgdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94RW50cnkodmFsdWU9dmFsLmNvcHkoKSwgZXhpc3RzPWV4aXN0cykKICAgIC8vICkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgcmVwbGFjZTIgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBidXJ5IDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgZ2V0X3JlcXVlc3RfYm94ZXNfZm9yX2hlYWRlckAyCgpnZXRfcmVxdWVzdF9ib3hlc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjIyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjQzCiAgICAvLyByZXR1cm4gc2VsZi5yZWFkX3JlcXVlc3RfYm94KHNlbGYucmVxdWVzdF91bnN1YnNjcmliZV9ib3gsIHJlcXVlc3RfaWQpCiAgICBieXRlYyAxNCAvLyAweDcyNzUKICAgIHN3YXAKICAgIGNhbGxzdWIgcmVhZF9yZXF1ZXN0X2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjIyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveGVzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjQ1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8dWludDY0PgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI2MAogICAgLy8gZW50cmllcyA9IEFycmF5W3R5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveEVudHJ5XSgpCiAgICBieXRlYyAxNyAvLyAweDAwMDAKICAgIGludGNfMCAvLyAwCgpnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hlc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjYxCiAgICAvLyBmb3IgcmVxdWVzdF9pZCBpbiByZXF1ZXN0X2lkczoKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IGdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveGVzX2FmdGVyX2ZvckA1CiAgICBkaWcgMwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI2MwogICAgLy8gc2VsZi5yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveCwgcmVxdWVzdF9pZAogICAgYnl0ZWMgMTQgLy8gMHg3Mjc1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjYyLTIyNjQKICAgIC8vIHZhbCwgZXhpc3RzID0gc2VsZi5yZWFkX3JlcXVlc3RfYm94KAogICAgLy8gICAgIHNlbGYucmVxdWVzdF91bnN1YnNjcmliZV9ib3gsIHJlcXVlc3RfaWQKICAgIC8vICkKICAgIHN3YXAKICAgIGNhbGxzdWIgcmVhZF9yZXF1ZXN0X2JveAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI2NgogICAgLy8gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94RW50cnkodmFsdWU9dmFsLmNvcHkoKSwgZXhpc3RzPWV4aXN0cykKICAgIGJ5dGVjXzMgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI2NS0yMjY3CiAgICAvLyBlbnRyaWVzLmFwcGVuZCgKICAgIC8vICAgICB0eXAuWEdvdlN1YnNjcmliZVJlcXVlc3RCb3hFbnRyeSh2YWx1ZT12YWwuY29weSgpLCBleGlzdHM9ZXhpc3RzKQogICAgLy8gKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ1cnkgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hlc19mb3JfaGVhZGVyQDIKCmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveGVzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI0NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfcHJvcG9zYWxzX3N1bW1hcnlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvcG9zYWxzX3N1bW1hcnk6CiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PHVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyOTIKICAgIC8vIGFzc2VydCBwcm9wb3NhbF9pZHMubGVuZ3RoIDw9IE1BWF9QUk9QT1NBTFNfU1VNTUFSWSwgZXJyLlRPT19NQU5ZX1BST1BPU0FMUwogICAgcHVzaGludCA2CiAgICA8PQogICAgYXNzZXJ0IC8vIFRvbyBtYW55IHByb3Bvc2FscwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI5NAogICAgLy8gc3VtbWFyaWVzID0gQXJyYXlbdHlwLlByb3Bvc2FsU3VtbWFyeV0oKQogICAgYnl0ZWMgMTcgLy8gMHgwMDAwCiAgICBpbnRjXzAgLy8gMAoKZ2V0X3Byb3Bvc2Fsc19zdW1tYXJ5X2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyOTUKICAgIC8vIGZvciBwcm9wb3NhbF9pZCBpbiBwcm9wb3NhbF9pZHM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfcHJvcG9zYWxzX3N1bW1hcnlfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3MgogICAgLy8gY3JlYXRvciwgYXBwX2V4aXN0cyA9IG9wLkFwcFBhcmFtc0dldC5hcHBfY3JlYXRvcihwcm9wb3NhbCkKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcENyZWF0b3IKICAgIHN3YXAKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjczCiAgICAvLyBpZiBub3QgYXBwX2V4aXN0cyBvciBjcmVhdG9yICE9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3M6CiAgICBieiBnZXRfcHJvcG9zYWxzX3N1bW1hcnlfaWZfYm9keUA4CiAgICBkaWcgNQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgICE9CiAgICBieiBnZXRfcHJvcG9zYWxzX3N1bW1hcnlfYWZ0ZXJfaWZfZWxzZUA5CgpnZXRfcHJvcG9zYWxzX3N1bW1hcnlfaWZfYm9keUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Mjc2CiAgICAvLyB0eXAuUHJvcG9zYWxTdW1tYXJ5LCBvcC5iemVybyhzaXplX29mKHR5cC5Qcm9wb3NhbFN1bW1hcnkpKQogICAgcHVzaGludCAxNTQKICAgIGJ6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNzQtMjc3CiAgICAvLyAjIEFsbCB6ZXJvIHZhbHVlcywgd2l0aCBgZXhpc3RzYCBGYWxzZQogICAgLy8gcmV0dXJuIGFyYzQuZGVjb2RlKAogICAgLy8gICAgIHR5cC5Qcm9wb3NhbFN1bW1hcnksIG9wLmJ6ZXJvKHNpemVfb2YodHlwLlByb3Bvc2FsU3VtbWFyeSkpCiAgICAvLyApCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAxNTQKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlByb3Bvc2FsU3VtbWFyeQoKZ2V0X3Byb3Bvc2Fsc19zdW1tYXJ5X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlYWRfcHJvcG9zYWxfc3VtbWFyeUAxMDoKICAgIGRpZyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI5NgogICAgLy8gc3VtbWFyaWVzLmFwcGVuZChzZWxmLnJlYWRfcHJvcG9zYWxfc3VtbWFyeShBcHBsaWNhdGlvbihwcm9wb3NhbF9pZCkpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ1cnkgMgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGdldF9wcm9wb3NhbHNfc3VtbWFyeV9mb3JfaGVhZGVyQDIKCmdldF9wcm9wb3NhbHNfc3VtbWFyeV9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyODEKICAgIC8vIHByb3Bvc2VyPXNlbGYuZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyKHByb3Bvc2FsKSwKICAgIGRpZyA0CiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjctMjY4CiAgICAvLyAjIE1pc3Npbmcga2V5cyBhcmUgcmVhZCBhcyB6ZXJvCiAgICAvLyB2YWx1ZSwgX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHByb3Bvc2FsLCBrZXkpCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjgyCiAgICAvLyBzdGF0dXM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9TVEFUVVMpKSwKICAgIGJ5dGVjIDU4IC8vIDB4NzM3NDYxNzQ3NTczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjctMjY4CiAgICAvLyAjIE1pc3Npbmcga2V5cyBhcmUgcmVhZCBhcyB6ZXJvCiAgICAvLyB2YWx1ZSwgX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHByb3Bvc2FsLCBrZXkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBzd2FwCiAgICBkaWcgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6Mjg0CiAgICAvLyBzZWxmLmdldF9wcm9wb3NhbF91aW50NjQocHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX0ZJTkFMSVpFRCkpCiAgICBwdXNoYnl0ZXMgMHg2NjY5NmU2MTZjNjk3YTY1NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4My0yODUKICAgIC8vIGZpbmFsaXplZD1ib29sKAogICAgLy8gICAgIHNlbGYuZ2V0X3Byb3Bvc2FsX3VpbnQ2NChwcm9wb3NhbCwgQnl0ZXMocGNmZy5HU19LRVlfRklOQUxJWkVEKSkKICAgIC8vICksCiAgICBpbnRjXzAgLy8gMAogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGRpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyODcKICAgIC8vIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9GVU5ESU5HX0NBVEVHT1JZKQogICAgcHVzaGJ5dGVzIDB4NjY3NTZlNjQ2OTZlNjc1ZjYzNjE3NDY1Njc2ZjcyNzkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGNvdmVyIDQKICAgIGRpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyOTAKICAgIC8vIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9SRVFVRVNURURfQU1PVU5UKQogICAgYnl0ZWMgNTcgLy8gMHg3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgNQogICAgZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MwogICAgLy8gcHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX0xPQ0tFRF9BTU9VTlQpCiAgICBwdXNoYnl0ZXMgMHg2YzZmNjM2YjY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgNgogICAgZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5NQogICAgLy8gb3Blbl90cz1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQocHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX09QRU5fVFMpKSwKICAgIHB1c2hieXRlcyAweDZmNzA2NTZlNWY3NDY5NmQ2NTczNzQ2MTZkNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGNvdmVyIDcKICAgIGRpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyOTcKICAgIC8vIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9TVUJNSVNTSU9OX1RTKQogICAgcHVzaGJ5dGVzIDB4NzM3NTYyNmQ2OTczNzM2OTZmNmU1Zjc0Njk2ZDY1NzM3NDYxNmQ3MAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgOAogICAgZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMAogICAgLy8gcHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX1ZPVEVfT1BFTl9UUykKICAgIHB1c2hieXRlcyAweDc2NmY3NDY1NWY2ZjcwNjU2ZTY5NmU2NzVmNzQ2OTZkNjU3Mzc0NjE2ZDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjctMjY4CiAgICAvLyAjIE1pc3Npbmcga2V5cyBhcmUgcmVhZCBhcyB6ZXJvCiAgICAvLyB2YWx1ZSwgX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHByb3Bvc2FsLCBrZXkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBjb3ZlciA5CiAgICBkaWcgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzAzCiAgICAvLyBwcm9wb3NhbCwgQnl0ZXMoY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMpCiAgICBieXRlYyAyNSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgMTAKICAgIGRpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMDYKICAgIC8vIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9RVU9SVU1fVEhSRVNIT0xEKQogICAgcHVzaGJ5dGVzIDB4NzE3NTZmNzI3NTZkNWY3NDY4NzI2NTczNjg2ZjZjNjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGNvdmVyIDExCiAgICBkaWcgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzA5CiAgICAvLyBwcm9wb3NhbCwgQnl0ZXMocGNmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX1RIUkVTSE9MRCkKICAgIHB1c2hieXRlcyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzQ2ODcyNjU3MzY4NmY2YzY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNjctMjY4CiAgICAvLyAjIE1pc3Npbmcga2V5cyBhcmUgcmVhZCBhcyB6ZXJvCiAgICAvLyB2YWx1ZSwgX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHByb3Bvc2FsLCBrZXkpCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICBjb3ZlciAxMgogICAgZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxMgogICAgLy8gcHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX1ZPVEVEX01FTUJFUlMpCiAgICBwdXNoYnl0ZXMgMHg3NjZmNzQ2NTY0NWY2ZDY1NmQ2MjY1NzI3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgMTMKICAgIGRpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMTUKICAgIC8vIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9CT1lDT1RURURfTUVNQkVSUykKICAgIHB1c2hieXRlcyAweDYyNmY3OTYzNmY3NDc0NjU2NDVmNmQ2NTZkNjI2NTcyNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGNvdmVyIDE0CiAgICBkaWcgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzE3CiAgICAvLyBhcHByb3ZhbHM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9BUFBST1ZBTFMpKSwKICAgIHB1c2hieXRlcyAweDYxNzA3MDcyNmY3NjYxNmM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgMTUKICAgIGRpZyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMTkKICAgIC8vIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9SRUpFQ1RJT05TKQogICAgcHVzaGJ5dGVzIDB4NzI2NTZhNjU2Mzc0Njk2ZjZlNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2Ny0yNjgKICAgIC8vICMgTWlzc2luZyBrZXlzIGFyZSByZWFkIGFzIHplcm8KICAgIC8vIHZhbHVlLCBfZXhpc3RzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocHJvcG9zYWwsIGtleSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIGNvdmVyIDE2CiAgICB1bmNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMQogICAgLy8gbnVsbHM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9OVUxMUykpLAogICAgcHVzaGJ5dGVzIDB4NmU3NTZjNmM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3LTI2OAogICAgLy8gIyBNaXNzaW5nIGtleXMgYXJlIHJlYWQgYXMgemVybwogICAgLy8gdmFsdWUsIF9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChwcm9wb3NhbCwga2V5KQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHBvcAogICAgY292ZXIgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3OS0zMjIKICAgIC8vIHJldHVybiB0eXAuUHJvcG9zYWxTdW1tYXJ5KAogICAgLy8gICAgIGV4aXN0cz1UcnVlLAogICAgLy8gICAgIHByb3Bvc2VyPXNlbGYuZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyKHByb3Bvc2FsKSwKICAgIC8vICAgICBzdGF0dXM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9TVEFUVVMpKSwKICAgIC8vICAgICBmaW5hbGl6ZWQ9Ym9vbCgKICAgIC8vICAgICAgICAgc2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9GSU5BTElaRUQpKQogICAgLy8gICAgICksCiAgICAvLyAgICAgZnVuZGluZ19jYXRlZ29yeT1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQoCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9GVU5ESU5HX0NBVEVHT1JZKQogICAgLy8gICAgICksCiAgICAvLyAgICAgcmVxdWVzdGVkX2Ftb3VudD1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQoCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9SRVFVRVNURURfQU1PVU5UKQogICAgLy8gICAgICksCiAgICAvLyAgICAgbG9ja2VkX2Ftb3VudD1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQoCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9MT0NLRURfQU1PVU5UKQogICAgLy8gICAgICksCiAgICAvLyAgICAgb3Blbl90cz1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQocHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX09QRU5fVFMpKSwKICAgIC8vICAgICBzdWJtaXNzaW9uX3RzPXNlbGYuZ2V0X3Byb3Bvc2FsX3VpbnQ2NCgKICAgIC8vICAgICAgICAgcHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX1NVQk1JU1NJT05fVFMpCiAgICAvLyAgICAgKSwKICAgIC8vICAgICB2b3RlX29wZW5fdHM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KAogICAgLy8gICAgICAgICBwcm9wb3NhbCwgQnl0ZXMocGNmZy5HU19LRVlfVk9URV9PUEVOX1RTKQogICAgLy8gICAgICksCiAgICAvLyAgICAgY29tbWl0dGVlX3ZvdGVzPXNlbGYuZ2V0X3Byb3Bvc2FsX3VpbnQ2NCgKICAgIC8vICAgICAgICAgcHJvcG9zYWwsIEJ5dGVzKGNmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTKQogICAgLy8gICAgICksCiAgICAvLyAgICAgcXVvcnVtX3RocmVzaG9sZD1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQoCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9RVU9SVU1fVEhSRVNIT0xEKQogICAgLy8gICAgICksCiAgICAvLyAgICAgd2VpZ2h0ZWRfcXVvcnVtX3RocmVzaG9sZD1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQoCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fVEhSRVNIT0xEKQogICAgLy8gICAgICksCiAgICAvLyAgICAgdm90ZWRfbWVtYmVycz1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQoCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9WT1RFRF9NRU1CRVJTKQogICAgLy8gICAgICksCiAgICAvLyAgICAgYm95Y290dGVkX21lbWJlcnM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KAogICAgLy8gICAgICAgICBwcm9wb3NhbCwgQnl0ZXMocGNmZy5HU19LRVlfQk9ZQ09UVEVEX01FTUJFUlMpCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBhcHByb3ZhbHM9c2VsZi5nZXRfcHJvcG9zYWxfdWludDY0KHByb3Bvc2FsLCBCeXRlcyhwY2ZnLkdTX0tFWV9BUFBST1ZBTFMpKSwKICAgIC8vICAgICByZWplY3Rpb25zPXNlbGYuZ2V0X3Byb3Bvc2FsX3VpbnQ2NCgKICAgIC8vICAgICAgICAgcHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX1JFSkVDVElPTlMpCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBudWxscz1zZWxmLmdldF9wcm9wb3NhbF91aW50NjQocHJvcG9zYWwsIEJ5dGVzKHBjZmcuR1NfS0VZX05VTExTKSksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4MAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlY18zIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDMKICAgIHNldGJpdAogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI5NgogICAgLy8gc3VtbWFyaWVzLmFwcGVuZChzZWxmLnJlYWRfcHJvcG9zYWxfc3VtbWFyeShBcHBsaWNhdGlvbihwcm9wb3NhbF9pZCkpKQogICAgYiBnZXRfcHJvcG9zYWxzX3N1bW1hcnlfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkucmVhZF9wcm9wb3NhbF9zdW1tYXJ5QDEwCgpnZXRfcHJvcG9zYWxzX3N1bW1hcnlfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgZGlnIDIKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmlzX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKaXNfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjk5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjMwMQogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX3Byb3Bvc2FsKHByb3Bvc2FsX2lkKSwgZXJyLklOVkFMSURfUFJPUE9TQUwKICAgIGNhbGxzdWIgX2lzX3Byb3Bvc2FsCiAgICBhc3NlcnQgLy8gSW52YWxpZCBwcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjI5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuaXNfeGdvdl9tYW5hZ2VyKCkgLT4gdWludDY0Ogppc194Z292X21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMjQKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9tYW5hZ2VyLnZhbHVlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAweDc4Njc2Zjc2NWY2ZDYxNmU2MTY3NjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfbWFuYWdlciBleGlzdHMKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuaXNfeGdvdl9wYXlvcigpIC0+IHVpbnQ2NDoKaXNfeGdvdl9wYXlvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gc2VsZi54Z292X3BheW9yLnZhbHVlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAweDc4Njc2Zjc2NWY3MDYxNzk2ZjcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9wYXlvciBleGlzdHMKICAgID09CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuaXNfeGdvdl9zdWJzY3JpYmVyKCkgLT4gdWludDY0Ogppc194Z292X3N1YnNjcmliZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzAKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9zdWJzY3JpYmVyLnZhbHVlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTggLy8gMHg3ODY3NmY3NjVmNzM3NTYyNzM2MzcyNjk2MjY1NzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X3N1YnNjcmliZXIgZXhpc3RzCiAgICA9PQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzKHhnb3ZfYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NDoKY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzgKICAgIC8vIGRlZiBjYWxsZXJfaXNfeGdvdl9vcl92b3RpbmdfYWRkcmVzcyhzZWxmLCB4Z292X2FkZHJlc3M6IEFjY291bnQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MAogICAgLy8gVHhuLnNlbmRlciA9PSB4Z292X2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MC0yNDEKICAgIC8vIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzCiAgICAvLyBvciBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS52b3RpbmdfYWRkcmVzcwogICAgYm56IGNhbGxlcl9pc194Z292X29yX3ZvdGluZ19hZGRyZXNzX2Jvb2xfdHJ1ZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNDEKICAgIC8vIG9yIFR4bi5zZW5kZXIgPT0gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3NdLnZvdGluZ19hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vIDB4NzgKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2JveCBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMCAzMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MC0yNDEKICAgIC8vIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzCiAgICAvLyBvciBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS52b3RpbmdfYWRkcmVzcwogICAgYnogY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3NfYm9vbF9mYWxzZUAzCgpjYWxsZXJfaXNfeGdvdl9vcl92b3RpbmdfYWRkcmVzc19ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzktMjQyCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0geGdvdl9hZGRyZXNzCiAgICAvLyAgICAgb3IgVHhuLnNlbmRlciA9PSBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udm90aW5nX2FkZHJlc3MKICAgIC8vICkKICAgIHJldHN1YgoKY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3NfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzOS0yNDIKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSB4Z292X2FkZHJlc3MKICAgIC8vICAgICBvciBUeG4uc2VuZGVyID09IHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS52b3RpbmdfYWRkcmVzcwogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5Ll9pc19wcm9wb3NhbChwcm9wb3NhbDogdWludDY0KSAtPiB1aW50NjQ6Cl9pc19wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NAogICAgLy8gZGVmIF9pc19wcm9wb3NhbChzZWxmLCBwcm9wb3NhbDogQXBwbGljYXRpb24pIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NQogICAgLy8gcmV0dXJuIHByb3Bvc2FsLmNyZWF0b3IgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfcGFyYW1zX2dldCBBcHBDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5nZXRfcHJvcG9zYWxfcHJvcG9zZXIocHJvcG9zYWw6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9wcm9wb3NhbF9wcm9wb3NlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MgogICAgLy8gZGVmIGdldF9wcm9wb3NhbF9wcm9wb3NlcihzZWxmLCBwcm9wb3NhbDogQXBwbGljYXRpb24pIC0+IEFjY291bnQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1My0yNTUKICAgIC8vIHByb3Bvc2VyX2J5dGVzLCBwcm9wb3Nlcl9leGlzdHMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKAogICAgLy8gICAgIHByb3Bvc2FsLCBwY2ZnLkdTX0tFWV9QUk9QT1NFUgogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyNTQKICAgIC8vIHByb3Bvc2FsLCBwY2ZnLkdTX0tFWV9QUk9QT1NFUgogICAgcHVzaGJ5dGVzIDB4NzA3MjZmNzA2ZjczNjU3MgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjUzLTI1NQogICAgLy8gcHJvcG9zZXJfYnl0ZXMsIHByb3Bvc2VyX2V4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgcHJvcG9zYWwsIHBjZmcuR1NfS0VZX1BST1BPU0VSCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjU2CiAgICAvLyBhc3NlcnQgcHJvcG9zZXJfZXhpc3RzLCBlcnIuTUlTU0lOR19LRVkKICAgIGFzc2VydCAvLyBNaXNzaW5nIGtleSBpbiBzdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjU3CiAgICAvLyByZXR1cm4gQWNjb3VudChwcm9wb3Nlcl9ieXRlcykKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5jb21wdXRlX2F2YWlsYWJsZV9mdW5kcygpIC0+IHVpbnQ2NDoKY29tcHV0ZV9hdmFpbGFibGVfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMjYKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMjcKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozMjYtMzI3CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzI5LTMzMAogICAgLy8gIyBFbnN1cmUgdGhhdCBzcGVuZGFibGUgZnVuZHMgZXhjZWVkIGZ1bmRzIGFsbG9jYXRlZCB0byBQcm9wb3NhbHMKICAgIC8vIGFzc2VydCBzcGVuZGFibGVfZnVuZHMgPiBzZWxmLm91dHN0YW5kaW5nX2Z1bmRzLnZhbHVlLCBlcnIuSU5TVUZGSUNJRU5UX0ZVTkRTCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAweDZmNzU3NDczNzQ2MTZlNjQ2OTZlNjc1ZjY2NzU2ZTY0NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vdXRzdGFuZGluZ19mdW5kcyBleGlzdHMKICAgIGR1cDIKICAgID4KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZnVuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMQogICAgLy8gcmV0dXJuIHNwZW5kYWJsZV9mdW5kcyAtIHNlbGYub3V0c3RhbmRpbmdfZnVuZHMudmFsdWUKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS52YWxpZF94Z292X3BheW1lbnQocGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CnZhbGlkX3hnb3ZfcGF5bWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MAogICAgLy8gZGVmIHZhbGlkX3hnb3ZfcGF5bWVudChzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzQyCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzQyLTM0MwogICAgLy8gcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyBhbmQgcGF5bWVudC5hbW91bnQgPT0gc2VsZi54Z292X2ZlZS52YWx1ZQogICAgYnogdmFsaWRfeGdvdl9wYXltZW50X2Jvb2xfZmFsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzQzCiAgICAvLyBhbmQgcGF5bWVudC5hbW91bnQgPT0gc2VsZi54Z292X2ZlZS52YWx1ZQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMiAvLyAweDc4Njc2Zjc2NWY2NjY1NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2ZlZSBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNDItMzQzCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vIGFuZCBwYXltZW50LmFtb3VudCA9PSBzZWxmLnhnb3ZfZmVlLnZhbHVlCiAgICBieiB2YWxpZF94Z292X3BheW1lbnRfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzQxLTM0NAogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICAgICBhbmQgcGF5bWVudC5hbW91bnQgPT0gc2VsZi54Z292X2ZlZS52YWx1ZQogICAgLy8gKQogICAgcmV0c3ViCgp2YWxpZF94Z292X3BheW1lbnRfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0MS0zNDQKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyAgICAgYW5kIHBheW1lbnQuYW1vdW50ID09IHNlbGYueGdvdl9mZWUudmFsdWUKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS52YWxpZF9reWMoYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NDoKdmFsaWRfa3ljOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzQ2CiAgICAvLyBkZWYgdmFsaWRfa3ljKHNlbGYsIGFkZHJlc3M6IEFjY291bnQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0OAogICAgLy8gc2VsZi5wcm9wb3Nlcl9ib3hbYWRkcmVzc10ua3ljX3N0YXR1cwogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3Nlcl9ib3ggZW50cnkgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNDgtMzQ5CiAgICAvLyBzZWxmLnByb3Bvc2VyX2JveFthZGRyZXNzXS5reWNfc3RhdHVzCiAgICAvLyBhbmQgc2VsZi5wcm9wb3Nlcl9ib3hbYWRkcmVzc10ua3ljX2V4cGlyaW5nID4gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ6IHZhbGlkX2t5Y19ib29sX2ZhbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0OQogICAgLy8gYW5kIHNlbGYucHJvcG9zZXJfYm94W2FkZHJlc3NdLmt5Y19leHBpcmluZyA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXJfYm94IGVudHJ5IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIGV4dHJhY3RfdWludDY0CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNDgtMzQ5CiAgICAvLyBzZWxmLnByb3Bvc2VyX2JveFthZGRyZXNzXS5reWNfc3RhdHVzCiAgICAvLyBhbmQgc2VsZi5wcm9wb3Nlcl9ib3hbYWRkcmVzc10ua3ljX2V4cGlyaW5nID4gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ6IHZhbGlkX2t5Y19ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgp2YWxpZF9reWNfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MzQ3LTM1MAogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBzZWxmLnByb3Bvc2VyX2JveFthZGRyZXNzXS5reWNfc3RhdHVzCiAgICAvLyAgICAgYW5kIHNlbGYucHJvcG9zZXJfYm94W2FkZHJlc3NdLmt5Y19leHBpcmluZyA+IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICAvLyApCiAgICBzd2FwCiAgICByZXRzdWIKCnZhbGlkX2t5Y19ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiB2YWxpZF9reWNfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LmdldF9jb21taXR0ZWVfYW5jaG9yKCkgLT4gdWludDY0OgpnZXRfY29tbWl0dGVlX2FuY2hvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3NgogICAgLy8gciA9IEdsb2JhbC5yb3VuZAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTozNzcKICAgIC8vIHJldHVybiByIC0gKHIgJSBzZWxmLmdvdmVybmFuY2VfcGVyaW9kLnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUwIC8vIDB4Njc2Zjc2NjU3MjZlNjE2ZTYzNjU1ZjcwNjU3MjY5NmY2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdvdmVybmFuY2VfcGVyaW9kIGV4aXN0cwogICAgZGlnIDEKICAgIHN3YXAKICAgICUKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5kZWNyZW1lbnRfcGVuZGluZ19wcm9wb3NhbHMocHJvcG9zYWw6IHVpbnQ2NCkgLT4gdm9pZDoKZGVjcmVtZW50X3BlbmRpbmdfcHJvcG9zYWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDEyCiAgICAvLyBkZWYgZGVjcmVtZW50X3BlbmRpbmdfcHJvcG9zYWxzKHNlbGYsIHByb3Bvc2FsOiBBcHBsaWNhdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDEzCiAgICAvLyBzZWxmLnBlbmRpbmdfcHJvcG9zYWxzLnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vIDB4NzA2NTZlNjQ2OTZlNjc1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlbmRpbmdfcHJvcG9zYWxzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjIDggLy8gMHg3MDY1NmU2NDY5NmU2NzVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDE0CiAgICAvLyBwcm9wb3NlciA9IHNlbGYuZ2V0X3Byb3Bvc2FsX3Byb3Bvc2VyKHByb3Bvc2FsKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGdldF9wcm9wb3NhbF9wcm9wb3NlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDE1CiAgICAvLyBzZWxmLnByb3Bvc2VyX2JveFtwcm9wb3Nlcl0uYWN0aXZlX3Byb3Bvc2FsID0gRmFsc2UKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHNldGJpdAogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkuYnVtcF9zdGF0ZV92ZXJzaW9uKCkgLT4gdm9pZDoKYnVtcF9zdGF0ZV92ZXJzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDE4CiAgICAvLyByZXR1cm4gc2VsZi5zdGF0ZV92ZXJzaW9uLmdldChkZWZhdWx0PWFyYzQuVUludDY0KDApKS5hc191aW50NjQoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUzIC8vIDB4NzM3NDYxNzQ2NTVmNzY2NTcyNzM2OTZmNmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBieXRlYyA2MCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDIxLTQyMgogICAgLy8gIyBDYWxsZWQgYnkgZXZlcnkgbXV0YXRpbmcgbWV0aG9kLCBsZXRzIGNsaWVudHMgZGV0ZWN0IHN0YXRlIGNoYW5nZXMKICAgIC8vIHZlcnNpb24gPSBzZWxmLmdldF9jdXJyZW50X3N0YXRlX3ZlcnNpb24oKSArIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0MjMKICAgIC8vIHNlbGYuc3RhdGVfdmVyc2lvbi52YWx1ZSA9IGFyYzQuVUludDY0KHZlcnNpb24pCiAgICBpdG9iCiAgICBieXRlYyA1MyAvLyAweDczNzQ2MTc0NjU1Zjc2NjU3MjczNjk2ZjZlCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyNAogICAgLy8gYXJjNC5lbWl0KHR5cC5TdGF0ZVZlcnNpb24odmVyc2lvbj12ZXJzaW9uKSkKICAgIHB1c2hieXRlcyAweGYwZDgyZGUwIC8vIG1ldGhvZCAiU3RhdGVWZXJzaW9uKHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnN1YnNjcmliZV94Z292X2FuZF9lbWl0KHhnb3ZfYWRkcmVzczogYnl0ZXMsIHZvdGluZ19hZGRyZXNzOiBieXRlcykgLT4gdm9pZDoKc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDMtNDQ1CiAgICAvLyBkZWYgc3Vic2NyaWJlX3hnb3ZfYW5kX2VtaXQoCiAgICAvLyAgICAgc2VsZiwgKiwgeGdvdl9hZGRyZXNzOiBBY2NvdW50LCB2b3RpbmdfYWRkcmVzczogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzIgLy8gMHg3OAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDYtNDQ3CiAgICAvLyAjIFRoZSBmb2xsb3dpbmcgYXNzZXJ0aW9uIG1heSBiZSByZWR1bmRhbnQgaW4gc29tZSBpbnZvY2F0aW9ucy4KICAgIC8vIGFzc2VydCBub3Qgc2VsZi5oYXNfeGdvdl9zdGF0dXMoeGdvdl9hZGRyZXNzKSwgZXJyLkFMUkVBRFlfWEdPVgogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgYW4geEdvdgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDM4CiAgICAvLyB0b2xlcmF0ZWRfYWJzZW5jZXM9c2VsZi5hYnNlbmNlX3RvbGVyYW5jZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNyAvLyAweDYxNjI3MzY1NmU2MzY1NWY3NDZmNmM2NTcyNjE2ZTYzNjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYnNlbmNlX3RvbGVyYW5jZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gc3Vic2NyaXB0aW9uX3JvdW5kPUdsb2JhbC5yb3VuZCwKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDM2LTQ0MQogICAgLy8gcmV0dXJuIHR5cC5YR292Qm94VmFsdWUoCiAgICAvLyAgICAgdm90aW5nX2FkZHJlc3M9dm90aW5nX2FkZHJlc3MsCiAgICAvLyAgICAgdG9sZXJhdGVkX2Fic2VuY2VzPXNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUsCiAgICAvLyAgICAgbGFzdF92b3RlX3RpbWVzdGFtcD1VSW50NjQoMCksCiAgICAvLyAgICAgc3Vic2NyaXB0aW9uX3JvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICkKICAgIHN3YXAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0MzkKICAgIC8vIGxhc3Rfdm90ZV90aW1lc3RhbXA9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzNi00NDEKICAgIC8vIHJldHVybiB0eXAuWEdvdkJveFZhbHVlKAogICAgLy8gICAgIHZvdGluZ19hZGRyZXNzPXZvdGluZ19hZGRyZXNzLAogICAgLy8gICAgIHRvbGVyYXRlZF9hYnNlbmNlcz1zZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlLAogICAgLy8gICAgIGxhc3Rfdm90ZV90aW1lc3RhbXA9VUludDY0KDApLAogICAgLy8gICAgIHN1YnNjcmlwdGlvbl9yb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyApCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDQ4CiAgICAvLyBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10gPSBzZWxmLm1ha2VfeGdvdl9ib3godm90aW5nX2FkZHJlc3MpCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NDkKICAgIC8vIHNlbGYueGdvdnMudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vIDB4Nzg2NzZmNzY3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDExIC8vIDB4Nzg2NzZmNzY3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1MgogICAgLy8geGdvdj14Z292X2FkZHJlc3MsIGRlbGVnYXRlPXZvdGluZ19hZGRyZXNzLCByb3VuZD1HbG9iYWwucm91bmQKICAgIGdsb2JhbCBSb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDUxLTQ1MwogICAgLy8gdHlwLlhHb3ZTdWJzY3JpYmVkKAogICAgLy8gICAgIHhnb3Y9eGdvdl9hZGRyZXNzLCBkZWxlZ2F0ZT12b3RpbmdfYWRkcmVzcywgcm91bmQ9R2xvYmFsLnJvdW5kCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1MC00NTQKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICB0eXAuWEdvdlN1YnNjcmliZWQoCiAgICAvLyAgICAgICAgIHhnb3Y9eGdvdl9hZGRyZXNzLCBkZWxlZ2F0ZT12b3RpbmdfYWRkcmVzcywgcm91bmQ9R2xvYmFsLnJvdW5kCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MjQxZmRjNTEgLy8gbWV0aG9kICJYR292U3Vic2NyaWJlZChhZGRyZXNzLGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdCh4Z292X2FkZHJlc3M6IGJ5dGVzKSAtPiB2b2lkOgp1bnN1YnNjcmliZV94Z292X2FuZF9lbWl0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDU2CiAgICAvLyBkZWYgdW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdChzZWxmLCB4Z292X2FkZHJlc3M6IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNgogICAgLy8gcmV0dXJuIGEgaW4gc2VsZi54Z292X2JveAogICAgYnl0ZWNfMiAvLyAweDc4CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1Ny00NTgKICAgIC8vICMgVGhlIGZvbGxvd2luZyBhc3NlcnRpb24gbWF5IGJlIHJlZHVuZGFudCBpbiBzb21lIGludm9jYXRpb25zLgogICAgLy8gYXNzZXJ0IHNlbGYuaGFzX3hnb3Zfc3RhdHVzKHhnb3ZfYWRkcmVzcyksIGVyci5OT1RfWEdPVgogICAgYXNzZXJ0IC8vIE5vdCBhbiB4R292CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NTkKICAgIC8vIGRlbCBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10KICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6NDYwCiAgICAvLyBzZWxmLnhnb3ZzLnZhbHVlIC09IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292cyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weTo0NjEKICAgIC8vIGFyYzQuZW1pdCh0eXAuWEdvdlVuc3Vic2NyaWJlZCh4Z292PXhnb3ZfYWRkcmVzcywgcm91bmQ9R2xvYmFsLnJvdW5kKSkKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDdiYTI1ODAzIC8vIG1ldGhvZCAiWEdvdlVuc3Vic2NyaWJlZChhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnNldF9jb21taXR0ZWUoY29tbWl0dGVlX2lkOiBieXRlcywgc2l6ZTogdWludDY0LCB2b3RlczogdWludDY0KSAtPiBieXRlczoKc2V0X2NvbW1pdHRlZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTgtMTIwMAogICAgLy8gZGVmIHNldF9jb21taXR0ZWUoCiAgICAvLyAgICAgc2VsZiwgY29tbWl0dGVlX2lkOiB0eXAuQnl0ZXMzMiwgc2l6ZTogVUludDY0LCB2b3RlczogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzMwogICAgLy8gcmV0dXJuIFR4bi5zZW5kZXIgPT0gc2VsZi5jb21taXR0ZWVfbWFuYWdlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDYxNmU2MTY3NjU3MgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9tYW5hZ2VyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDEKICAgIC8vIGFzc2VydCBzZWxmLmlzX3hnb3ZfY29tbWl0dGVlX21hbmFnZXIoKSwgZXJyLlVOQVVUSE9SSVpFRAogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwMwogICAgLy8gYXNzZXJ0IHNpemUgPiAwLCBlcnIuV1JPTkdfQ09NTUlUVEVFX01FTUJFUlMKICAgIGZyYW1lX2RpZyAtMgogICAgYXNzZXJ0IC8vIFdyb25nIENvbW1pdHRlZSBNZW1iZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjA0CiAgICAvLyBhc3NlcnQgdm90ZXMgPiAwLCBlcnIuV1JPTkdfQ09NTUlUVEVFX1ZPVEVTCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBXcm9uZyBDb21taXR0ZWUgVm90ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDYKICAgIC8vIHNlbGYuY29tbWl0dGVlX2lkLnZhbHVlID0gY29tbWl0dGVlX2lkLmNvcHkoKQogICAgYnl0ZWMgNTkgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQKICAgIGZyYW1lX2RpZyAtMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDcKICAgIC8vIHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgPSBzaXplCiAgICBieXRlYyA0OSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDgKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlID0gdm90ZXMKICAgIGJ5dGVjIDI1IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3NjZmNzQ2NTczCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjA5CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9sYXN0X2FuY2hvci52YWx1ZSA9IHNlbGYuZ2V0X2NvbW1pdHRlZV9hbmNob3IoKQogICAgY2FsbHN1YiBnZXRfY29tbWl0dGVlX2FuY2hvcgogICAgYnl0ZWMgNTIgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZjNjE3Mzc0NWY2MTZlNjM2ODZmNzIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjE0CiAgICAvLyBzaXplPWFyYzQuVUludDMyKHNpemUpLAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxNQogICAgLy8gdm90ZXM9YXJjNC5VSW50MzIodm90ZXMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxNgogICAgLy8gcm91bmQ9R2xvYmFsLnJvdW5kLAogICAgZ2xvYmFsIFJvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjEyLTEyMTcKICAgIC8vIHR5cC5OZXdDb21taXR0ZWUoCiAgICAvLyAgICAgY29tbWl0dGVlX2lkPWNvbW1pdHRlZV9pZCwKICAgIC8vICAgICBzaXplPWFyYzQuVUludDMyKHNpemUpLAogICAgLy8gICAgIHZvdGVzPWFyYzQuVUludDMyKHZvdGVzKSwKICAgIC8vICAgICByb3VuZD1HbG9iYWwucm91bmQsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxMjExLTEyMTgKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICB0eXAuTmV3Q29tbWl0dGVlKAogICAgLy8gICAgICAgICBjb21taXR0ZWVfaWQ9Y29tbWl0dGVlX2lkLAogICAgLy8gICAgICAgICBzaXplPWFyYzQuVUludDMyKHNpemUpLAogICAgLy8gICAgICAgICB2b3Rlcz1hcmM0LlVJbnQzMih2b3RlcyksCiAgICAvLyAgICAgICAgIHJvdW5kPUdsb2JhbC5yb3VuZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg4NzliNTZhOSAvLyBtZXRob2QgIk5ld0NvbW1pdHRlZShieXRlWzMyXSx1aW50MzIsdWludDMyLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgZnJhbWVfZGlnIC0zCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudm90ZV9wcm9wb3NhbF9jaGVja19hdXRob3JpemF0aW9uKHByb3Bvc2FsX2lkOiB1aW50NjQsIHhnb3ZfYWRkcmVzczogYnl0ZXMpIC0+IHZvaWQ6CnZvdGVfcHJvcG9zYWxfY2hlY2tfYXV0aG9yaXphdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTktMTQyMQogICAgLy8gZGVmIHZvdGVfcHJvcG9zYWxfY2hlY2tfYXV0aG9yaXphdGlvbigKICAgIC8vICAgICBzZWxmLCBwcm9wb3NhbF9pZDogQXBwbGljYXRpb24sIHhnb3ZfYWRkcmVzczogQWNjb3VudAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDIyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLCBlcnIuUEFVU0VEX1JFR0lTVFJZCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9yZWdpc3RyeSBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBSZWdpc3RyeSdzIG5vbi1hZG1pbiBtZXRob2RzIGFyZSBwYXVzZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MjQtMTQyNQogICAgLy8gIyB2ZXJpZnkgcHJvcG9zYWxfaWQgaWQgaXMgZ2VudWluZSBwcm9wb3NhbAogICAgLy8gYXNzZXJ0IHNlbGYuX2lzX3Byb3Bvc2FsKHByb3Bvc2FsX2lkKSwgZXJyLklOVkFMSURfUFJPUE9TQUwKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfaXNfcHJvcG9zYWwKICAgIGFzc2VydCAvLyBJbnZhbGlkIHByb3Bvc2FsCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDI2CiAgICAvLyBzZWxmLnZvdGVfY2hlY2tfeGdvdih4Z292X2FkZHJlc3MpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgdm90ZV9jaGVja194Z292CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkudm90ZV9jaGVja194Z292KHhnb3ZfYWRkcmVzczogYnl0ZXMpIC0+IHZvaWQ6CnZvdGVfY2hlY2tfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MjgKICAgIC8vIGRlZiB2b3RlX2NoZWNrX3hnb3Yoc2VsZiwgeGdvdl9hZGRyZXNzOiBBY2NvdW50KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzIgLy8gMHg3OAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDI5CiAgICAvLyBhc3NlcnQgc2VsZi5oYXNfeGdvdl9zdGF0dXMoeGdvdl9hZGRyZXNzKSwgZXJyLk5PVF9YR09WCiAgICBhc3NlcnQgLy8gTm90IGFuIHhHb3YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzAtMTQzMgogICAgLy8gYXNzZXJ0IHNlbGYuY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3MoCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzCiAgICAvLyApLCBlcnIuTVVTVF9CRV9YR09WX09SX1ZPVElOR19BRERSRVNTCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY2FsbGVyX2lzX3hnb3Zfb3Jfdm90aW5nX2FkZHJlc3MKICAgIGFzc2VydCAvLyBNdXN0IGJlIHhnb3Ygb3Igdm90aW5nIGFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzQtMTQzNQogICAgLy8gIyBVcG9uIHZvdGUgdGhlIGFic2VuY2UgdG9sZXJhbmNlIGlzIHJlc2V0CiAgICAvLyBzZWxmLnhnb3ZfYm94W3hnb3ZfYWRkcmVzc10udG9sZXJhdGVkX2Fic2VuY2VzID0gc2VsZi5hYnNlbmNlX3RvbGVyYW5jZS52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI3IC8vIDB4NjE2MjczNjU2ZTYzNjU1Zjc0NmY2YzY1NzI2MTZlNjM2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFic2VuY2VfdG9sZXJhbmNlIGV4aXN0cwogICAgaXRvYgogICAgZGlnIDEKICAgIGludGNfMyAvLyAzMgogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzNgogICAgLy8gc2VsZi54Z292X2JveFt4Z292X2FkZHJlc3NdLmxhc3Rfdm90ZV90aW1lc3RhbXAgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgcHVzaGludCA0MAogICAgc3dhcAogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5hc3NlcnRfbm9fdm90ZV9lcnJvcihlcnJvcjogYnl0ZXMpIC0+IHZvaWQ6CmFzc2VydF9ub192b3RlX2Vycm9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzOAogICAgLy8gZGVmIGFzc2VydF9ub192b3RlX2Vycm9yKHNlbGYsIGVycm9yOiB0eXAuRXJyb3IpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBhc3NlcnRfbm9fdm90ZV9lcnJvcl90ZXJuYXJ5X2ZhbHNlQDIKICAgIGludGNfMCAvLyAwCgphc3NlcnRfbm9fdm90ZV9lcnJvcl90ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDM5CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IGFzc2VydF9ub192b3RlX2Vycm9yX2Vsc2VfYm9keUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0MAogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDIKICAgIC8vIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIGJ5dGVjIDE1IC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0NAogICAgLy8gY2FzZSBlcnIuVk9URVJfTk9UX0ZPVU5EOgogICAgYnl0ZWMgNjEgLy8gIlZvdGVyIG5vdCBmb3VuZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDYKICAgIC8vIGNhc2UgZXJyLlZPVEVSX0FMUkVBRFlfVk9URUQ6CiAgICBwdXNoYnl0ZXNzICJWb3RlciBhbHJlYWR5IHZvdGVkIiAiVm90ZXMgaW52YWxpZCIgIlZvdGluZyBQZXJpb2QgRXhwaXJlZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDEtMTQ1MwogICAgLy8gbWF0Y2ggZXJyb3Jfd2l0aG91dF9wcmVmaXg6CiAgICAvLyAgICAgY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLldST05HX1BST1BPU0FMX1NUQVRVUykKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICAvLyAgICAgICAgIG9wLmVycihlcnIuVk9URVJfTk9UX0ZPVU5EKQogICAgLy8gICAgIGNhc2UgZXJyLlZPVEVSX0FMUkVBRFlfVk9URUQ6CiAgICAvLyAgICAgICAgIG9wLmVycihlcnIuVk9URVJfQUxSRUFEWV9WT1RFRCkKICAgIC8vICAgICBjYXNlIGVyci5WT1RFU19JTlZBTElEOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLlZPVEVTX0lOVkFMSUQpCiAgICAvLyAgICAgY2FzZSBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEOgogICAgLy8gICAgICAgICBvcC5lcnIoZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRCkKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIG9wLmVycigiVW5rbm93biBlcnJvciIpCiAgICB1bmNvdmVyIDUKICAgIG1hdGNoIGFzc2VydF9ub192b3RlX2Vycm9yX3N3aXRjaF9jYXNlXzBANSBhc3NlcnRfbm9fdm90ZV9lcnJvcl9zd2l0Y2hfY2FzZV8xQDYgYXNzZXJ0X25vX3ZvdGVfZXJyb3Jfc3dpdGNoX2Nhc2VfMkA3IGFzc2VydF9ub192b3RlX2Vycm9yX3N3aXRjaF9jYXNlXzNAOCBhc3NlcnRfbm9fdm90ZV9lcnJvcl9zd2l0Y2hfY2FzZV80QDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NTMKICAgIC8vIG9wLmVycigiVW5rbm93biBlcnJvciIpCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKYXNzZXJ0X25vX3ZvdGVfZXJyb3Jfc3dpdGNoX2Nhc2VfNEA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1MQogICAgLy8gb3AuZXJyKGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQpCiAgICBlcnIgLy8gVm90aW5nIFBlcmlvZCBFeHBpcmVkCgphc3NlcnRfbm9fdm90ZV9lcnJvcl9zd2l0Y2hfY2FzZV8zQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNDQ5CiAgICAvLyBvcC5lcnIoZXJyLlZPVEVTX0lOVkFMSUQpCiAgICBlcnIgLy8gVm90ZXMgaW52YWxpZAoKYXNzZXJ0X25vX3ZvdGVfZXJyb3Jfc3dpdGNoX2Nhc2VfMkA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0NwogICAgLy8gb3AuZXJyKGVyci5WT1RFUl9BTFJFQURZX1ZPVEVEKQogICAgZXJyIC8vIFZvdGVyIGFscmVhZHkgdm90ZWQKCmFzc2VydF9ub192b3RlX2Vycm9yX3N3aXRjaF9jYXNlXzFANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDUKICAgIC8vIG9wLmVycihlcnIuVk9URVJfTk9UX0ZPVU5EKQogICAgZXJyIC8vIFZvdGVyIG5vdCBmb3VuZAoKYXNzZXJ0X25vX3ZvdGVfZXJyb3Jfc3dpdGNoX2Nhc2VfMEA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0MwogICAgLy8gb3AuZXJyKGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMpCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKYXNzZXJ0X25vX3ZvdGVfZXJyb3JfZWxzZV9ib2R5QDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1NQogICAgLy8gYXNzZXJ0IGVycm9yID09ICIiLCAiVW5rbm93biBlcnJvciIKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGJ5dGVzICIiCiAgICA9PQogICAgYXNzZXJ0IC8vIFVua25vd24gZXJyb3IKICAgIHJldHN1YgoKYXNzZXJ0X25vX3ZvdGVfZXJyb3JfdGVybmFyeV9mYWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzOQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlYyAxNiAvLyAiRVJSOiIKICAgID09CiAgICBiIGFzc2VydF9ub192b3RlX2Vycm9yX3Rlcm5hcnlfbWVyZ2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5hc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3IoZXJyb3I6IGJ5dGVzKSAtPiB2b2lkOgphc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzQ5CiAgICAvLyBkZWYgYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yKHNlbGYsIGVycm9yOiB0eXAuRXJyb3IpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTAKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBhc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3JfdGVybmFyeV9mYWxzZUAyCiAgICBpbnRjXzAgLy8gMAoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3Rlcm5hcnlfbWVyZ2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTAKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgYnogYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzUxCiAgICAvLyBlcnJvcl93aXRob3V0X3ByZWZpeCA9IFN0cmluZy5mcm9tX2J5dGVzKGVycm9yLmJ5dGVzWzQ6XSkKICAgIHB1c2hpbnQgNAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgPj0KICAgIHB1c2hpbnQgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc1MwogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWMgMTUgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzU1CiAgICAvLyBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICBieXRlYyA2MSAvLyAiVm90ZXIgbm90IGZvdW5kIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc1Mi0xNzU4CiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIG9wLmVycihlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgLy8gICAgIGNhc2UgZXJyLlZPVEVSX05PVF9GT1VORDoKICAgIC8vICAgICAgICAgb3AuZXJyKGVyci5WT1RFUl9OT1RfRk9VTkQpCiAgICAvLyAgICAgY2FzZSBfOgogICAgLy8gICAgICAgICBvcC5lcnIoIlVua25vd24gZXJyb3IiKQogICAgdW5jb3ZlciAyCiAgICBtYXRjaCBhc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3Jfc3dpdGNoX2Nhc2VfMEA1IGFzc2VydF9ub191bmFzc2lnbl9lcnJvcl9zd2l0Y2hfY2FzZV8xQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTgKICAgIC8vIG9wLmVycigiVW5rbm93biBlcnJvciIpCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3N3aXRjaF9jYXNlXzFANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTYKICAgIC8vIG9wLmVycihlcnIuVk9URVJfTk9UX0ZPVU5EKQogICAgZXJyIC8vIFZvdGVyIG5vdCBmb3VuZAoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3N3aXRjaF9jYXNlXzBANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTQKICAgIC8vIG9wLmVycihlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTKQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCmFzc2VydF9ub191bmFzc2lnbl9lcnJvcl9lbHNlX2JvZHlAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NjAKICAgIC8vIGFzc2VydCBlcnJvciA9PSAiIiwgIlVua25vd24gZXJyb3IiCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hieXRlcyAiIgogICAgPT0KICAgIGFzc2VydCAvLyBVbmtub3duIGVycm9yCiAgICByZXRzdWIKCmFzc2VydF9ub191bmFzc2lnbl9lcnJvcl90ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzUwCiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjIDE2IC8vICJFUlI6IgogICAgPT0KICAgIGIgYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3Rlcm5hcnlfbWVyZ2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5jaGFyZ2VfYWJzZW5jZShhYnNlbnRlZTogYnl0ZXMpIC0+IHZvaWQ6CmNoYXJnZV9hYnNlbmNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2MgogICAgLy8gZGVmIGNoYXJnZV9hYnNlbmNlKHNlbGYsIGFic2VudGVlOiBBY2NvdW50KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMzYKICAgIC8vIHJldHVybiBhIGluIHNlbGYueGdvdl9ib3gKICAgIGJ5dGVjXzIgLy8gMHg3OAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzY1LTE3NjYKICAgIC8vIHNlbGYuaGFzX3hnb3Zfc3RhdHVzKGFic2VudGVlKQogICAgLy8gYW5kIHNlbGYueGdvdl9ib3hbYWJzZW50ZWVdLnRvbGVyYXRlZF9hYnNlbmNlcyA+IDAKICAgIGJ6IGNoYXJnZV9hYnNlbmNlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2NgogICAgLy8gYW5kIHNlbGYueGdvdl9ib3hbYWJzZW50ZWVdLnRvbGVyYXRlZF9hYnNlbmNlcyA+IDAKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2JveCBlbnRyeSBleGlzdHMKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NjUtMTc2NgogICAgLy8gc2VsZi5oYXNfeGdvdl9zdGF0dXMoYWJzZW50ZWUpCiAgICAvLyBhbmQgc2VsZi54Z292X2JveFthYnNlbnRlZV0udG9sZXJhdGVkX2Fic2VuY2VzID4gMAogICAgYnogY2hhcmdlX2Fic2VuY2VfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToxNzY4CiAgICAvLyBzZWxmLnhnb3ZfYm94W2Fic2VudGVlXS50b2xlcmF0ZWRfYWJzZW5jZXMgLT0gMQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9ib3ggZW50cnkgZXhpc3RzCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaXRvYgogICAgZGlnIDEKICAgIGludGNfMyAvLyAzMgogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2OQogICAgLy8gaWYgc2VsZi54Z292X2JveFthYnNlbnRlZV0udG9sZXJhdGVkX2Fic2VuY2VzID09IDA6CiAgICBib3hfZ2V0CiAgICBwb3AKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGJueiBjaGFyZ2VfYWJzZW5jZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NzAKICAgIC8vIHNlbGYudW5zdWJzY3JpYmVfeGdvdl9hbmRfZW1pdChhYnNlbnRlZSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiB1bnN1YnNjcmliZV94Z292X2FuZF9lbWl0CgpjaGFyZ2VfYWJzZW5jZV9hZnRlcl9pZl9lbHNlQDU6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeS5jb250cmFjdC5YR292UmVnaXN0cnkucmVhZF94Z292X2JveCh4Z292X2FkZHJlc3M6IGJ5dGVzKSAtPiBieXRlcywgdWludDY0OgpyZWFkX3hnb3ZfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA2MgogICAgLy8gZGVmIHJlYWRfeGdvdl9ib3goc2VsZiwgeGdvdl9hZGRyZXNzOiBBY2NvdW50KSAtPiB0dXBsZVt0eXAuWEdvdkJveFZhbHVlLCBib29sXToKICAgIHByb3RvIDEgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjM2CiAgICAvLyByZXR1cm4gYSBpbiBzZWxmLnhnb3ZfYm94CiAgICBieXRlY18yIC8vIDB4NzgKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNjQKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IHJlYWRfeGdvdl9ib3hfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNjUKICAgIC8vIHZhbCA9IHNlbGYueGdvdl9ib3hbeGdvdl9hZGRyZXNzXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi54Z292X2JveCBlbnRyeSBleGlzdHMKCnJlYWRfeGdvdl9ib3hfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3NAogICAgLy8gcmV0dXJuIHZhbC5jb3B5KCksIGV4aXN0cwogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICByZXRzdWIKCnJlYWRfeGdvdl9ib3hfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDY3LTIwNzIKICAgIC8vIHZhbCA9IHR5cC5YR292Qm94VmFsdWUoCiAgICAvLyAgICAgdm90aW5nX2FkZHJlc3M9QWNjb3VudCgpLAogICAgLy8gICAgIHRvbGVyYXRlZF9hYnNlbmNlcz1VSW50NjQoMCksCiAgICAvLyAgICAgbGFzdF92b3RlX3RpbWVzdGFtcD1VSW50NjQoMCksCiAgICAvLyAgICAgc3Vic2NyaXB0aW9uX3JvdW5kPVVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgYiByZWFkX3hnb3ZfYm94X2FmdGVyX2lmX2Vsc2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5LmNvbnRyYWN0LlhHb3ZSZWdpc3RyeS5yZWFkX3Byb3Bvc2VyX2JveChwcm9wb3Nlcl9hZGRyZXNzOiBieXRlcykgLT4gYnl0ZXMsIHVpbnQ2NDoKcmVhZF9wcm9wb3Nlcl9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDc2LTIwNzgKICAgIC8vIGRlZiByZWFkX3Byb3Bvc2VyX2JveCgKICAgIC8vICAgICBzZWxmLCBwcm9wb3Nlcl9hZGRyZXNzOiBBY2NvdW50CiAgICAvLyApIC0+IHR1cGxlW3R5cC5Qcm9wb3NlckJveFZhbHVlLCBib29sXToKICAgIHByb3RvIDEgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3OQogICAgLy8gZXhpc3RzID0gcHJvcG9zZXJfYWRkcmVzcyBpbiBzZWxmLnByb3Bvc2VyX2JveAogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDgwCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiByZWFkX3Byb3Bvc2VyX2JveF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA4MQogICAgLy8gdmFsID0gc2VsZi5wcm9wb3Nlcl9ib3hbcHJvcG9zZXJfYWRkcmVzc10uY29weSgpCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zZXJfYm94IGVudHJ5IGV4aXN0cwoKcmVhZF9wcm9wb3Nlcl9ib3hfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA4OQogICAgLy8gcmV0dXJuIHZhbC5jb3B5KCksIGV4aXN0cwogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICByZXRzdWIKCnJlYWRfcHJvcG9zZXJfYm94X2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA4My0yMDg3CiAgICAvLyB2YWwgPSB0eXAuUHJvcG9zZXJCb3hWYWx1ZSgKICAgIC8vICAgICBhY3RpdmVfcHJvcG9zYWw9RmFsc2UsCiAgICAvLyAgICAga3ljX3N0YXR1cz1GYWxzZSwKICAgIC8vICAgICBreWNfZXhwaXJpbmc9VUludDY0KDApLAogICAgLy8gKQogICAgYnl0ZWMgNTQgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGIgcmVhZF9wcm9wb3Nlcl9ib3hfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnkuY29udHJhY3QuWEdvdlJlZ2lzdHJ5LnJlYWRfcmVxdWVzdF9ib3gocmVxdWVzdF9ib3g6IGJ5dGVzLCByZXF1ZXN0X2lkOiB1aW50NjQpIC0+IGJ5dGVzLCB1aW50NjQ6CnJlYWRfcmVxdWVzdF9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDkxLTIwOTUKICAgIC8vIGRlZiByZWFkX3JlcXVlc3RfYm94KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmVxdWVzdF9ib3g6IEJveE1hcFtVSW50NjQsIHR5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlXSwKICAgIC8vICAgICByZXF1ZXN0X2lkOiBVSW50NjQsCiAgICAvLyApIC0+IHR1cGxlW3R5cC5YR292U3Vic2NyaWJlUmVxdWVzdEJveFZhbHVlLCBib29sXToKICAgIHByb3RvIDIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnkvY29udHJhY3QucHk6MjA5NgogICAgLy8gZXhpc3RzID0gcmVxdWVzdF9pZCBpbiByZXF1ZXN0X2JveAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDk3CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiByZWFkX3JlcXVlc3RfYm94X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMDk4CiAgICAvLyB2YWwgPSByZXF1ZXN0X2JveFtyZXF1ZXN0X2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgQm94TWFwIGVudHJ5IGV4aXN0cwoKcmVhZF9yZXF1ZXN0X2JveF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeS9jb250cmFjdC5weToyMTA2CiAgICAvLyByZXR1cm4gdmFsLmNvcHkoKSwgZXhpc3RzCiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKcmVhZF9yZXF1ZXN0X2JveF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMDAtMjEwNAogICAgLy8gdmFsID0gdHlwLlhHb3ZTdWJzY3JpYmVSZXF1ZXN0Qm94VmFsdWUoCiAgICAvLyAgICAgeGdvdl9hZGRyPUFjY291bnQoKSwKICAgIC8vICAgICBvd25lcl9hZGRyPUFjY291bnQoKSwKICAgIC8vICAgICByZWxhdGlvbl90eXBlPVVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyBiYXNlMzIoQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICBiIHJlYWRfcmVxdWVzdF9ib3hfYWZ0ZXJfaWZfZWxzZUAzCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "cblocks", "sourceInfo": [{"pc": [5510], "errorMessage": "Address length is 32 bytes"}, {"pc": [1989], "errorMessage": "Already a proposer"}, {"pc": [1514, 1646, 1725, 5685], "errorMessage": "Already an xGov"}, {"pc": [2331], "errorMessage": "Committee is stale"}, {"pc": [2176, 2268], "errorMessage": "Committee size is too large"}, {"pc": [2297], "errorMessage": "Creation of proposals is paused"}, {"pc": [2866, 3002], "errorMessage": "Empty payload"}, {"pc": [1153], "errorMessage": "Inconsistent discussion duration config"}, {"pc": [1238], "errorMessage": "Inconsistent quorum config"}, {"pc": [1051], "errorMessage": "Inconsistent requested amount config"}, {"pc": [1209], "errorMessage": "Inconsistent voting duration config"}, {"pc": [1267], "errorMessage": "Inconsistent weighted quorum config"}, {"pc": [2366, 3992, 4048], "errorMessage": "Insufficient fee"}, {"pc": [3983, 4055, 5530], "errorMessage": "Insufficient funds"}, {"pc": [3433], "errorMessage": "Insufficient treasury funds"}, {"pc": [2357, 3423], "errorMessage": "Invalid KYC"}, {"pc": [1088], "errorMessage": "Invalid open proposal fee"}, {"pc": [1518, 1650, 1816], "errorMessage": "Invalid payment"}, {"pc": [2865, 3040, 3157, 3306, 3395, 3614, 3802, 5417, 5880], "errorMessage": "Invalid proposal"}, {"pc": [2408], "errorMessage": "Invalid proposal approval program size"}, {"pc": [997], "errorMessage": "Invalid proposer fee"}, {"pc": [983], "errorMessage": "Invalid xGov fee"}, {"pc": [3408, 3588, 5505], "errorMessage": "Missing key in state"}, {"pc": [2396], "errorMessage": "Missing proposal approval program"}, {"pc": [5904], "errorMessage": "Must be xgov or voting address"}, {"pc": [1543, 1576, 1812, 1885, 1948, 5748, 5898], "errorMessage": "Not an xGov"}, {"pc": [2351], "errorMessage": "Proposer already has an active proposal"}, {"pc": [2079], "errorMessage": "Proposer does not exist"}, {"pc": [1505, 1535, 1567, 1637, 1804, 1939, 1979, 2290, 2860, 3001, 3151, 3300, 3797, 5874], "errorMessage": "Registry's non-admin methods are paused"}, {"pc": [3756], "errorMessage": "There are voters assigned to this proposal"}, {"pc": [4939], "errorMessage": "Too many proposals"}, {"pc": [661, 716, 730, 743, 755, 768, 780, 801, 822, 843, 864, 885, 906, 927, 958, 1476, 1582, 1631, 1697, 1745, 1798, 1863, 1905, 1954, 2069, 2340, 3390, 3607, 3813, 3974, 4039, 5790], "errorMessage": "Unauthorized"}, {"pc": [3543, 3550, 3755, 3763, 3901, 3908, 6039, 6050, 6113, 6121], "errorMessage": "Unknown error"}, {"pc": [6042], "errorMessage": "Voter already voted"}, {"pc": [6043, 6114], "errorMessage": "Voter not found"}, {"pc": [6041], "errorMessage": "Votes invalid"}, {"pc": [6040], "errorMessage": "Voting Period Expired"}, {"pc": [5793], "errorMessage": "Wrong Committee Members"}, {"pc": [5796], "errorMessage": "Wrong Committee Votes"}, {"pc": [10], "errorMessage": "Wrong Global Bytes allocation"}, {"pc": [16], "errorMessage": "Wrong Global UInts allocation"}, {"pc": [20], "errorMessage": "Wrong Local Bytes allocation"}, {"pc": [24], "errorMessage": "Wrong Local UInts allocation"}, {"pc": [3544, 3757, 3902, 6044, 6115], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [1996, 2375, 3943], "errorMessage": "Wrong Receiver"}, {"pc": [2005, 2387], "errorMessage": "Wrong payment amount"}, {"pc": [3417], "errorMessage": "Wrong proposer"}, {"pc": [2392, 2486, 5516, 5521], "errorMessage": "account funded"}, {"pc": [2492, 5484], "errorMessage": "application exists"}, {"pc": [2650, 2798, 2940, 3085, 3191, 3352, 3484, 3645, 3842], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [6329], "errorMessage": "check BoxMap entry exists"}, {"pc": [4334, 5690, 5909], "errorMessage": "check self.absence_tolerance exists"}, {"pc": [2323, 4344], "errorMessage": "check self.committee_grace_period exists"}, {"pc": [4319], "errorMessage": "check self.committee_id exists"}, {"pc": [2314, 4349], "errorMessage": "check self.committee_last_anchor exists"}, {"pc": [4126, 5788], "errorMessage": "check self.committee_manager exists"}, {"pc": [4324], "errorMessage": "check self.committee_members exists"}, {"pc": [4329], "errorMessage": "check self.committee_votes exists"}, {"pc": [4151], "errorMessage": "check self.daemon_ops_funding_bps exists"}, {"pc": [4201], "errorMessage": "check self.discussion_duration_large exists"}, {"pc": [4196], "errorMessage": "check self.discussion_duration_medium exists"}, {"pc": [4191], "errorMessage": "check self.discussion_duration_small exists"}, {"pc": [4206], "errorMessage": "check self.discussion_duration_xlarge exists"}, {"pc": [4339, 5604], "errorMessage": "check self.governance_period exists"}, {"pc": [2067, 4121], "errorMessage": "check self.kyc_provider exists"}, {"pc": [2174, 2263], "errorMessage": "check self.max_committee_size exists"}, {"pc": [4176], "errorMessage": "check self.max_requested_amount_large exists"}, {"pc": [4171], "errorMessage": "check self.max_requested_amount_medium exists"}, {"pc": [4166], "errorMessage": "check self.max_requested_amount_small exists"}, {"pc": [4161], "errorMessage": "check self.min_requested_amount exists"}, {"pc": [2382, 4146], "errorMessage": "check self.open_proposal_fee exists"}, {"pc": [3428, 3951, 3979, 4000, 4309, 5527], "errorMessage": "check self.outstanding_funds exists"}, {"pc": [2295, 4096], "errorMessage": "check self.paused_proposals exists"}, {"pc": [1503, 1533, 1565, 1635, 1802, 1937, 1977, 2288, 2858, 2999, 3149, 3298, 3795, 4091, 5872], "errorMessage": "check self.paused_registry exists"}, {"pc": [2518, 4314, 5618], "errorMessage": "check self.pending_proposals exists"}, {"pc": [4156], "errorMessage": "check self.proposal_commitment_bps exists"}, {"pc": [2085, 2347, 5573, 5582, 6294], "errorMessage": "check self.proposer_box entry exists"}, {"pc": [2003, 4141], "errorMessage": "check self.proposer_fee exists"}, {"pc": [4269], "errorMessage": "check self.quorum_large exists"}, {"pc": [4264], "errorMessage": "check self.quorum_medium exists"}, {"pc": [4259], "errorMessage": "check self.quorum_small exists"}, {"pc": [1708], "errorMessage": "check self.request_box entry exists"}, {"pc": [1658, 1824], "errorMessage": "check self.request_id exists"}, {"pc": [1874], "errorMessage": "check self.request_unsubscribe_box entry exists"}, {"pc": [4235], "errorMessage": "check self.voting_duration_large exists"}, {"pc": [4230], "errorMessage": "check self.voting_duration_medium exists"}, {"pc": [4225], "errorMessage": "check self.voting_duration_small exists"}, {"pc": [4240], "errorMessage": "check self.voting_duration_xlarge exists"}, {"pc": [4294], "errorMessage": "check self.weighted_quorum_large exists"}, {"pc": [4289], "errorMessage": "check self.weighted_quorum_medium exists"}, {"pc": [4284], "errorMessage": "check self.weighted_quorum_small exists"}, {"pc": [5465, 6151, 6161, 6205], "errorMessage": "check self.xgov_box entry exists"}, {"pc": [4111], "errorMessage": "check self.xgov_council exists"}, {"pc": [3605, 4131], "errorMessage": "check self.xgov_daemon exists"}, {"pc": [4136, 5554], "errorMessage": "check self.xgov_fee exists"}, {"pc": [4013, 4101, 5426], "errorMessage": "check self.xgov_manager exists"}, {"pc": [4064, 4106, 5435], "errorMessage": "check self.xgov_payor exists"}, {"pc": [4116, 5444], "errorMessage": "check self.xgov_subscriber exists"}, {"pc": [5710, 5755], "errorMessage": "check self.xgovs exists"}, {"pc": [2893, 3032, 3233, 4541, 4647], "errorMessage": "index access is out of bounds"}, {"pc": [1961, 2538, 5643, 5916, 5923, 6172], "errorMessage": "index out of bounds"}, {"pc": [701, 2657, 2711, 2805, 2839, 2947, 2980, 3092, 3132, 3198, 3284, 3359, 3491, 3652, 3849, 4505, 4611, 4721, 4833, 4921], "errorMessage": "invalid array length header"}, {"pc": [2049], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [3145, 4517, 4623], "errorMessage": "invalid number of bytes for arc4.dynamic_array<account>"}, {"pc": [2721, 3294], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [709], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [2995], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.ProposalVote>"}, {"pc": [2854], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.XGovVote>"}, {"pc": [4733, 4845, 4935], "errorMessage": "invalid number of bytes for arc4.dynamic_array<uint64>"}, {"pc": [797, 818, 839, 860, 881, 902, 923, 1489, 1561, 1598, 1606, 1765, 1773, 1925, 1933, 2041, 2138, 2191, 2217, 2589, 2689, 2971, 3262, 4483, 4589], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [656, 694, 1614, 1692, 1740, 1781, 1858, 1900, 2059, 2146, 2155, 2199, 2208, 2580, 2597, 2605, 2680, 2697, 2705, 2729, 2737, 2828, 3122, 3253, 3270, 3278, 3385, 3575, 3789, 3969, 4034, 4695, 4807, 5412], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [4989], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.ProposalSummary"}, {"pc": [954], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.XGovRegistryConfig"}, {"pc": [2664, 2812, 2954, 3099, 3205, 3366, 3498, 3659, 3856], "errorMessage": "invalid number of bytes for string"}, {"pc": [5826, 5837], "errorMessage": "overflow"}, {"pc": [1499, 1625, 1792, 1973, 2284, 3936], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"entropy": {"type": "AVMBytes"}}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -349,6 +349,18 @@ class DeclareCommitteeArgs:
     def abi_method_signature(self) -> str:
         return "declare_committee(byte[32],uint64,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DeclareCommitteeWithRootArgs:
+    """Dataclass for declare_committee_with_root arguments"""
+    committee_id: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    size: int
+    votes: int
+    committee_root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class OpenProposalArgs:
     """Dataclass for open_proposal arguments"""
@@ -370,6 +382,41 @@ class VoteProposalArgs:
     def abi_method_signature(self) -> str:
         return "vote_proposal(uint64,address,uint64,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteProposalWithProofArgs:
+    """Dataclass for vote_proposal_with_proof arguments"""
+    proposal_id: int
+    xgov_address: str
+    voting_power: int
+    ordinal: int
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    approval_votes: int
+    rejection_votes: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteProposalBatchArgs:
+    """Dataclass for vote_proposal_batch arguments"""
+    proposal_id: int
+    votes: list[tuple[str, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_proposal_batch(uint64,(address,uint64,uint64)[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteProposalsArgs:
+    """Dataclass for vote_proposals arguments"""
+    xgov_address: str
+    votes: list[tuple[int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_proposals(address,(uint64,uint64,uint64)[])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class UnassignAbsenteeFromProposalArgs:
     """Dataclass for unassign_absentee_from_proposal arguments"""
@@ -380,6 +427,19 @@ class UnassignAbsenteeFromProposalArgs:
     def abi_method_signature(self) -> str:
         return "unassign_absentee_from_proposal(uint64,address[])void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class UnassignAbsenteeFromProposalWithProofArgs:
+    """Dataclass for unassign_absentee_from_proposal_with_proof arguments"""
+    proposal_id: int
+    xgov_address: str
+    voting_power: int
+    ordinal: int
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PayGrantProposalArgs:
     """Dataclass for pay_grant_proposal arguments"""
@@ -443,6 +503,15 @@ class GetXgovBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_xgov_box(address)((address,uint64,uint64,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetXgovBoxesArgs:
+    """Dataclass for get_xgov_boxes arguments"""
+    xgov_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetProposerBoxArgs:
     """Dataclass for get_proposer_box arguments"""
@@ -452,6 +521,15 @@ class GetProposerBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_proposer_box(address)((bool,bool,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetProposerBoxesArgs:
+    """Dataclass for get_proposer_boxes arguments"""
+    proposer_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetRequestBoxArgs:
     """Dataclass for get_request_box arguments"""
@@ -461,6 +539,15 @@ class GetRequestBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_request_box(uint64)((address,address,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRequestBoxesArgs:
+    """Dataclass for get_request_boxes arguments"""
+    request_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_request_boxes(uint64[])((address,address,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetRequestUnsubscribeBoxArgs:
     """Dataclass for get_request_unsubscribe_box arguments"""
@@ -470,6 +557,24 @@ class GetRequestUnsubscribeBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_request_unsubscribe_box(uint64)((address,address,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRequestUnsubscribeBoxesArgs:
+    """Dataclass for get_request_unsubscribe_boxes arguments"""
+    request_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetProposalsSummaryArgs:
+    """Dataclass for get_proposals_summary arguments"""
+    proposal_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class IsProposalArgs:
     """Dataclass for is_proposal arguments"""
@@ -858,6 +963,19 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+            "args": method_args,
+        }))
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -884,6 +1002,45 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -897,6 +1054,19 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+            "args": method_args,
+        }))
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -997,6 +1167,17 @@ class XGovRegistryParams:
             "method": "get_state()(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)",
         }))
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }))
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -1010,6 +1191,19 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -1023,6 +1217,19 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -1036,6 +1243,19 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -1049,6 +1269,32 @@ class XGovRegistryParams:
             "args": method_args,
         }))
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }))
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -1473,6 +1719,19 @@ class XGovRegistryCreateTransactionParams:
             "args": method_args,
         }))
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+            "args": method_args,
+        }))
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -1499,6 +1758,45 @@ class XGovRegistryCreateTransactionParams:
             "args": method_args,
         }))
 
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -1512,6 +1810,19 @@ class XGovRegistryCreateTransactionParams:
             "args": method_args,
         }))
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+            "args": method_args,
+        }))
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -1612,6 +1923,17 @@ class XGovRegistryCreateTransactionParams:
             "method": "get_state()(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)",
         }))
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }))
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -1625,74 +1947,139 @@ class XGovRegistryCreateTransactionParams:
             "args": method_args,
         }))
 
-    def get_proposer_box(
+    def get_xgov_boxes(
         self,
-        args: tuple[str] | GetProposerBoxArgs,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_proposer_box(address)((bool,bool,uint64),bool)",
+            "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
             "args": method_args,
         }))
 
-    def get_request_box(
+    def get_proposer_box(
         self,
-        args: tuple[int] | GetRequestBoxArgs,
+        args: tuple[str] | GetProposerBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_request_box(uint64)((address,address,uint64),bool)",
+            "method": "get_proposer_box(address)((bool,bool,uint64),bool)",
             "args": method_args,
         }))
 
-    def get_request_unsubscribe_box(
+    def get_proposer_boxes(
         self,
-        args: tuple[int] | GetRequestUnsubscribeBoxArgs,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_request_unsubscribe_box(uint64)((address,address,uint64),bool)",
+            "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
             "args": method_args,
         }))
 
-    def is_proposal(
+    def get_request_box(
         self,
-        args: tuple[int] | IsProposalArgs,
+        args: tuple[int] | GetRequestBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "is_proposal(uint64)void",
+            "method": "get_request_box(uint64)((address,address,uint64),bool)",
             "args": method_args,
         }))
 
-    def op_up(
+    def get_request_boxes(
         self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "op_up()void",
+            "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
         }))
 
-    def create(
+    def get_request_unsubscribe_box(
         self,
+        args: tuple[int] | GetRequestUnsubscribeBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_box(uint64)((address,address,uint64),bool)",
+            "args": method_args,
+        }))
+
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }))
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
+    def is_proposal(
+        self,
+        args: tuple[int] | IsProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "is_proposal(uint64)void",
+            "args": method_args,
+        }))
+
+    def op_up(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "op_up()void",
+        }))
+
+    def create(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
@@ -2175,6 +2562,22 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -2207,6 +2610,54 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -2223,6 +2674,22 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -2347,6 +2814,20 @@ class XGovRegistrySend:
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(TypedGlobalState, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[TypedGlobalState], parsed_response)
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -2363,6 +2844,22 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, int, int, int], bool]], parsed_response)
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, int, int, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, int, int, int], bool]]], parsed_response)
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -2379,6 +2876,22 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[bool, bool, int], bool]], parsed_response)
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[bool, bool, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[bool, bool, int], bool]]], parsed_response)
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -2395,6 +2908,22 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, str, int], bool]], parsed_response)
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]], parsed_response)
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -2411,6 +2940,38 @@ class XGovRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, str, int], bool]], parsed_response)
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]], parsed_response)
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]], parsed_response)
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -2512,6 +3073,8 @@ class GlobalStateValue(typing.TypedDict):
     governance_period: int
     committee_grace_period: int
     committee_last_anchor: int
+    committee_root: bytes
+    state_version: int
 
 class BoxStateValue(typing.TypedDict):
     """Shape of box state key values"""
@@ -2912,6 +3475,22 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def committee_root(self) -> bytes:
+        """Get the current value of the committee_root key in global_state state"""
+        value = self.app_client.state.global_state.get_value("committee_root")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def state_version(self) -> int:
+        """Get the current value of the state_version key in global_state state"""
+        value = self.app_client.state.global_state.get_value("state_version")
+        if isinstance(value, dict) and "uint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["uint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
 class _BoxState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -2992,6 +3571,15 @@ class _BoxState:
             None
         )
 
+    @property
+    def voted_bitmap(self) -> "_MapState[int, bytes]":
+        """Get values from the voted_bitmap map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "voted_bitmap",
+            None
+        )
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -3339,6 +3927,12 @@ class XGovRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["declare_committee_with_root(byte[32],uint64,uint64,byte[32])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["open_proposal(pay)uint64"],
@@ -3351,12 +3945,36 @@ class XGovRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_proposal_batch(uint64,(address,uint64,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_proposals(address,(uint64,uint64,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["unassign_absentee_from_proposal(uint64,address[])void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["pay_grant_proposal(uint64)void"],
@@ -3405,30 +4023,66 @@ class XGovRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> TypedGlobalState | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_state_version()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_xgov_box(address)((address,uint64,uint64,uint64),bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[tuple[str, int, int, int], bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[str, int, int, int], bool]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_proposer_box(address)((bool,bool,uint64),bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[tuple[bool, bool, int], bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_proposer_boxes(address[])((bool,bool,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[bool, bool, int], bool]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_request_box(uint64)((address,address,uint64),bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[tuple[str, str, int], bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_request_boxes(uint64[])((address,address,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[str, str, int], bool]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_request_unsubscribe_box(uint64)((address,address,uint64),bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[tuple[str, str, int], bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[str, str, int], bool]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["is_proposal(uint64)void"],
@@ -3463,7 +4117,7 @@ class XGovRegistryClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | TypedGlobalState | int | tuple[tuple[bool, bool, int], bool] | tuple[tuple[str, int, int, int], bool] | tuple[tuple[str, str, int], bool]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | TypedGlobalState | int | list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | list[tuple[tuple[bool, bool, int], bool]] | list[tuple[tuple[str, int, int, int], bool]] | list[tuple[tuple[str, str, int], bool]] | tuple[tuple[bool, bool, int], bool] | tuple[tuple[str, int, int, int], bool] | tuple[tuple[str, str, int], bool]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -4222,14 +4876,34 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
-    def open_proposal(
+    def declare_committee_with_root(
         self,
-        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the open_proposal(pay)uint64 ABI method"""
+        """Creates a new instance using the declare_committee_with_root(byte[32],uint64,uint64,byte[32])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def open_proposal(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_proposal(pay)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
@@ -4262,6 +4936,66 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_proposal_batch(uint64,(address,uint64,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_proposals(address,(uint64,uint64,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -4282,6 +5016,26 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -4440,6 +5194,25 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_state_version(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_state_version()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_state_version()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -4460,6 +5233,26 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -4480,6 +5273,26 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_proposer_boxes(address[])((bool,bool,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -4500,6 +5313,26 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_request_boxes(uint64[])((address,address,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -4520,6 +5353,46 @@ class XGovRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -5288,6 +6161,25 @@ class XGovRegistryComposer:
         )
         return self
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.declare_committee_with_root(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void", v
+            )
+        )
+        return self
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -5326,6 +6218,63 @@ class XGovRegistryComposer:
         )
         return self
 
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_proposal_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_proposal_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_proposal_batch(uint64,(address,uint64,uint64)[])void", v
+            )
+        )
+        return self
+
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_proposals(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_proposals(address,(uint64,uint64,uint64)[])void", v
+            )
+        )
+        return self
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -5345,6 +6294,25 @@ class XGovRegistryComposer:
         )
         return self
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.unassign_absentee_from_proposal_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void", v
+            )
+        )
+        return self
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -5495,6 +6463,24 @@ class XGovRegistryComposer:
         )
         return self
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_state_version(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_state_version()uint64", v
+            )
+        )
+        return self
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -5514,6 +6500,25 @@ class XGovRegistryComposer:
         )
         return self
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_xgov_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -5533,6 +6538,25 @@ class XGovRegistryComposer:
         )
         return self
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_proposer_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -5552,6 +6576,25 @@ class XGovRegistryComposer:
         )
         return self
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_request_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_request_boxes(uint64[])((address,address,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -5571,6 +6614,44 @@ class XGovRegistryComposer:
         )
         return self
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_request_unsubscribe_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]", v
+            )
+        )
+        return self
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XGovRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_proposals_summary(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]", v
+            )
+        )
+        return self
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -238,6 +238,15 @@ class XgovRegistryMock(algopy.arc4.ARC4Client, typing.Protocol):
         votes: algopy.arc4.UIntN[typing.Literal[64]],
     ) -> None: ...
 
+    @algopy.arc4.abimethod
+    def declare_committee_with_root(
+        self,
+        committee_id: algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]],
+        size: algopy.arc4.UIntN[typing.Literal[64]],
+        votes: algopy.arc4.UIntN[typing.Literal[64]],
+        committee_root: algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]],
+    ) -> None: ...
+
     @algopy.arc4.abimethod
     def open_proposal(
         self,
@@ -253,6 +262,32 @@ class XgovRegistryMock(algopy.arc4.ARC4Client, typing.Protocol):
         rejection_votes: algopy.arc4.UIntN[typing.Literal[64]],
     ) -> None: ...
 
+    @algopy.arc4.abimethod
+    def vote_proposals(
+        self,
+        xgov_address: algopy.arc4.Address,
+        votes: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]],
+    ) -> None: ...
+
+    @algopy.arc4.abimethod
+    def vote_proposal_batch(
+        self,
+        proposal_id: algopy.arc4.UIntN[typing.Literal[64]],
+        votes: algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]],
+    ) -> None: ...
+
+    @algopy.arc4.abimethod
+    def vote_proposal_with_proof(
+        self,
+        proposal_id: algopy.arc4.UIntN[typing.Literal[64]],
+        xgov_address: algopy.arc4.Address,
+        voting_power: algopy.arc4.UIntN[typing.Literal[64]],
+        ordinal: algopy.arc4.UIntN[typing.Literal[64]],
+        proof: algopy.arc4.DynamicArray[algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]]],
+        approval_votes: algopy.arc4.UIntN[typing.Literal[64]],
+        rejection_votes: algopy.arc4.UIntN[typing.Literal[64]],
+    ) -> None: ...
+
     @algopy.arc4.abimethod
     def unassign_absentee_from_proposal(
         self,
@@ -260,6 +295,16 @@ class XgovRegistryMock(algopy.arc4.ARC4Client, typing.Protocol):
         absentees: algopy.arc4.DynamicArray[algopy.arc4.Address],
     ) -> None: ...
 
+    @algopy.arc4.abimethod
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        proposal_id: algopy.arc4.UIntN[typing.Literal[64]],
+        xgov_address: algopy.arc4.Address,
+        voting_power: algopy.arc4.UIntN[typing.Literal[64]],
+        ordinal: algopy.arc4.UIntN[typing.Literal[64]],
+        proof: algopy.arc4.DynamicArray[algopy.arc4.StaticArray[algopy.arc4.Byte, typing.Literal[32]]],
+    ) -> None: ...
+
     @algopy.arc4.abimethod
     def pay_grant_proposal(
         self,
@@ -306,30 +351,65 @@ class XgovRegistryMock(algopy.arc4.ARC4Client, typing.Protocol):
         self,
     ) -> TypedGlobalState: ...
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_state_version(
+        self,
+    ) -> algopy.arc4.UIntN[typing.Literal[64]]: ...
+
     @algopy.arc4.abimethod(readonly=True)
     def get_xgov_box(
         self,
         xgov_address: algopy.arc4.Address,
     ) -> algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]: ...
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_xgov_boxes(
+        self,
+        xgov_addresses: algopy.arc4.DynamicArray[algopy.arc4.Address],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]: ...
+
     @algopy.arc4.abimethod(readonly=True)
     def get_proposer_box(
         self,
         proposer_address: algopy.arc4.Address,
     ) -> algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Bool, algopy.arc4.Bool, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]: ...
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_proposer_boxes(
+        self,
+        proposer_addresses: algopy.arc4.DynamicArray[algopy.arc4.Address],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Bool, algopy.arc4.Bool, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]: ...
+
     @algopy.arc4.abimethod(readonly=True)
     def get_request_box(
         self,
         request_id: algopy.arc4.UIntN[typing.Literal[64]],
     ) -> algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]: ...
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_request_boxes(
+        self,
+        request_ids: algopy.arc4.DynamicArray[algopy.arc4.UIntN[typing.Literal[64]]],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]: ...
+
     @algopy.arc4.abimethod(readonly=True)
     def get_request_unsubscribe_box(
         self,
         request_id: algopy.arc4.UIntN[typing.Literal[64]],
     ) -> algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]: ...
 
+    @algopy.arc4.abimethod(readonly=True)
+    def get_request_unsubscribe_boxes(
+        self,
+        request_ids: algopy.arc4.DynamicArray[algopy.arc4.UIntN[typing.Literal[64]]],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Tuple[algopy.arc4.Address, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]]], algopy.arc4.Bool]]: ...
+
+    @algopy.arc4.abimethod(readonly=True)
+    def get_proposals_summary(
+        self,
+        proposal_ids: algopy.arc4.DynamicArray[algopy.arc4.UIntN[typing.Literal[64]]],
+    ) -> algopy.arc4.DynamicArray[algopy.arc4.Tuple[algopy.arc4.Bool, algopy.arc4.Address, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.Bool, algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]], algopy.arc4.UIntN[typing.Literal[64]]]]: ...
+
     @algopy.arc4.abimethod
     def is_proposal(
         self,
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "size"}], "name": "init_proposal_contract", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "offset"}, {"type": "byte[]", "name": "data"}], "name": "load_proposal_contract", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "delete_proposal_contract_box", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_proposals", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_proposals", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "manager"}], "name": "set_xgov_manager", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "payor"}], "name": "set_payor", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "council"}], "name": "set_xgov_council", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "subscriber"}], "name": "set_xgov_subscriber", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "provider"}], "name": "set_kyc_provider", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "manager"}], "name": "set_committee_manager", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_daemon"}], "name": "set_xgov_daemon", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,uint64)", "name": "config", "struct": "XGovRegistryConfig"}], "name": "config_xgov_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_xgov_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "voting_address"}, {"type": "pay", "name": "payment"}], "name": "subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}], "name": "unsubscribe_absentee", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "approve_subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "reject_subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "owner_address"}, {"type": "uint64", "name": "relation_type"}, {"type": "pay", "name": "payment"}], "name": "request_subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "owner_address"}, {"type": "uint64", "name": "relation_type"}, {"type": "pay", "name": "payment"}], "name": "request_unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "approve_unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "reject_unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "voting_address"}], "name": "set_voting_account", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "subscribe_proposer", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "proposer"}, {"type": "bool", "name": "kyc_status"}, {"type": "uint64", "name": "kyc_expiring"}], "name": "set_proposer_kyc", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint64", "name": "size"}, {"type": "uint64", "name": "votes"}], "name": "declare_committee", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "open_proposal", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "approval_votes"}, {"type": "uint64", "name": "rejection_votes"}], "name": "vote_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address[]", "name": "absentees"}], "name": "unassign_absentee_from_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "pay_grant_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "finalize_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "drop_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "deposit_funds", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw_funds", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw_available_funds", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_available_funds", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state", "returns": {"type": "(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)", "struct": "TypedGlobalState"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}], "name": "get_xgov_box", "returns": {"type": "((address,uint64,uint64,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "proposer_address"}], "name": "get_proposer_box", "returns": {"type": "((bool,bool,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "get_request_box", "returns": {"type": "((address,address,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "get_request_unsubscribe_box", "returns": {"type": "((address,address,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "is_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "proposer"}], "name": "create_empty_proposal", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "XgovRegistryMock", "state": {"keys": {"box": {}, "global": {"xgov_council": {"key": "eGdvdl9jb3VuY2ls", "keyType": "AVMBytes", "valueType": "address"}, "xgov_daemon": {"key": "eGdvdl9kYWVtb24=", "keyType": "AVMBytes", "valueType": "address"}, "paused_registry": {"key": "cGF1c2VkX3JlZ2lzdHJ5", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused_proposals": {"key": "cGF1c2VkX3Byb3Bvc2Fscw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_proposal_fee": {"key": "b3Blbl9wcm9wb3NhbF9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "daemon_ops_funding_bps": {"key": "ZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "proposal_commitment_bps": {"key": "cHJvcG9zYWxfY29tbWl0bWVudF9icHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "min_requested_amount": {"key": "bWluX3JlcXVlc3RlZF9hbW91bnQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_small": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGw=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_medium": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVt", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_large": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_small": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_medium": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_large": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_xlarge": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_small": {"key": "dm90aW5nX2R1cmF0aW9uX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_medium": {"key": "dm90aW5nX2R1cmF0aW9uX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_large": {"key": "dm90aW5nX2R1cmF0aW9uX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_xlarge": {"key": "dm90aW5nX2R1cmF0aW9uX3hsYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_id": {"key": "Y29tbWl0dGVlX2lk", "keyType": "AVMBytes", "valueType": "byte[32]"}, "committee_members": {"key": "Y29tbWl0dGVlX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_votes": {"key": "Y29tbWl0dGVlX3ZvdGVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_small": {"key": "cXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_medium": {"key": "cXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_large": {"key": "cXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_small": {"key": "d2VpZ2h0ZWRfcXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_medium": {"key": "d2VpZ2h0ZWRfcXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_large": {"key": "d2VpZ2h0ZWRfcXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "absence_tolerance": {"key": "YWJzZW5jZV90b2xlcmFuY2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "governance_period": {"key": "Z292ZXJuYW5jZV9wZXJpb2Q=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_grace_period": {"key": "Y29tbWl0dGVlX2dyYWNlX3BlcmlvZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_last_anchor": {"key": "Y29tbWl0dGVlX2xhc3RfYW5jaG9y", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 3, "ints": 29}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"TypedGlobalState": [{"name": "paused_registry", "type": "bool"}, {"name": "paused_proposals", "type": "bool"}, {"name": "xgov_manager", "type": "address"}, {"name": "xgov_payor", "type": "address"}, {"name": "xgov_council", "type": "address"}, {"name": "xgov_subscriber", "type": "address"}, {"name": "kyc_provider", "type": "address"}, {"name": "committee_manager", "type": "address"}, {"name": "xgov_daemon", "type": "address"}, {"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "outstanding_funds", "type": "uint64"}, {"name": "pending_proposals", "type": "uint64"}, {"name": "committee_id", "type": "byte[32]"}, {"name": "committee_members", "type": "uint64"}, {"name": "committee_votes", "type": "uint64"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}, {"name": "committee_last_anchor", "type": "uint64"}], "XGovRegistryConfig": [{"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}]}, "byteCode": {"approval": "CiAHAQAIIIDfboDUkwGA9SQmKAQVH3x1Ildyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQERVJSOg9wYXVzZWRfcmVnaXN0cnkQcGF1c2VkX3Byb3Bvc2Fscwx4Z292X2NvdW5jaWwLeGdvdl9kYWVtb24Rb3Blbl9wcm9wb3NhbF9mZWUMY29tbWl0dGVlX2lkEWNvbW1pdHRlZV9tZW1iZXJzD2NvbW1pdHRlZV92b3RlcxxkYWVtb25fb3BlcmF0aW9uX2Z1bmRpbmdfYnBzF3Byb3Bvc2FsX2NvbW1pdG1lbnRfYnBzFG1pbl9yZXF1ZXN0ZWRfYW1vdW50Gm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsG21heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bRptYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZRlkaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsGmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtGWRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UaZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UVdm90aW5nX2R1cmF0aW9uX3NtYWxsFnZvdGluZ19kdXJhdGlvbl9tZWRpdW0Vdm90aW5nX2R1cmF0aW9uX2xhcmdlFnZvdGluZ19kdXJhdGlvbl94bGFyZ2UMcXVvcnVtX3NtYWxsDXF1b3J1bV9tZWRpdW0McXVvcnVtX2xhcmdlFXdlaWdodGVkX3F1b3J1bV9zbWFsbBZ3ZWlnaHRlZF9xdW9ydW1fbWVkaXVtFXdlaWdodGVkX3F1b3J1bV9sYXJnZRFhYnNlbmNlX3RvbGVyYW5jZRFnb3Zlcm5hbmNlX3BlcmlvZBZjb21taXR0ZWVfZ3JhY2VfcGVyaW9kFWNvbW1pdHRlZV9sYXN0X2FuY2hvcgwVH3x1AAAAAAAAAAAMVW5hdXRob3JpemVkD1ZvdGVyIG5vdCBmb3VuZA5NaXNzaW5nIENvbmZpZ00VH3x1AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADEYQADYJwUyA2cnBjIDZysjZycEI2cnB4GAwtcvZycLgfQDZycMgawCZycNgYDyi6gJZycOgYD09pBdZycPgYDQ28P0AmcnEIGAoLeH6QVnJxEhBGcnEiEEZycTIQRnJxQhBWcnFSEGZycWIQZnJxeBgOpJZycYIQVnJwiAIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwZycJI2cnCiNnJxmBuBdnJxojZycbgdg2ZyccgYgnZycdI2cnHoHYNmcnH4EFZycggcCEPWcnIYGQTmcnIiNngARJVsGrNhoAjgEBhDEZFEQxGEEBa4IuBJWcR2IEbB9WTQThClEuBIb34OYEOeJtigSYNS6GBPpO1uIE1snMGgRcSEBVBDfWrfEE1CFrbgS6hSDyBBZ3sw4EhLfSaASvfxhgBKCCzvgE3zn9uQTKD2o6BDwxvAIEDSx4kQRFB3OQBJP6zboEzos6HAT66ggfBA2ieIUEek/uQwRS3RDXBNTTemQENDSdzAQVj43WBF/iWTUE2ye5rwT1kQdWBGVhCp8E/caVwgS6kKtUBBpnS0UEqNWulARq5etGBCdjDWUEgk+YvARJVIugBIJnhPYEJpgyAATDhrA/BNvYPdk2GgCOLgA7AEQAIAAbABUAEAAKAFoAYwBsAHoAgwCMAJUAowCuAAgAwADJANIA2wD7ARsBJAEtAT0BSAFfAYkBlwJ7AwcDegQcBIkElASdAAMEpgXzBjwGVgZiBm4GdwABACJDJyOwIkMiQycEI2ciQysjZyJDJwQiZyJDKyJnIkMiQ4AETFxhujYaAI4BAAEAIkMxGYEEEjEYEEM2GgEVJBJEIkM2GgEVJBJENhoCSSNZgQIITBUSRCJDNhoBFSUSRCJDNhoBFSUSRCJDNhoBSRUlEkQnBUxnIkM2GgEVJRJEIkM2GgEVJRJEIkM2GgEVJRJEIkM2GgFJFSUSRCcGTGciQzYaARWB0AESRCJDNhoBFSUSRDEWIgk4ECISRCJDNhoBFSUSRCJDNhoBFSQSRCJDNhoBFSQSRCJDNhoBFSUSRDYaAhUlEkQ2GgMVJBJEMRYiCTgQIhJEIkM2GgEVJRJENhoCFSUSRDYaAxUkEkQxFiIJOBAiEkQiQzYaARUkEkQiQzYaARUkEkQiQzYaARUlEkQ2GgIVJRJEIkMxFiIJOBAiEkQiQzYaARUlEkQ2GgIVIhJENhoDFSQSRCJDNhoBSRUlEkQ2GgJJFSQSRBc2GgNJFSQSRBcnCE8DZycJTwJnJwpMZyJDMRYiCTgQIhJEJyOwIkM2GgFJFSQSRBc2GgJJFSUSRDYaA0kVJBJENhoESRUkEkSxTwOyGIAEGEGg0rIaTwKyGkyyGrIagQayECOyAbO0PkcCVwAEKBJESVcEAEkjWYECCEwVEkRXBgBJFUmBBAxBAHcjQQBxgQRLAUlOAg+BBEsCTwJNSwNMTwJSJyQnJYICE1ZvdGVyIGFscmVhZHkgdm90ZWQNVm90ZXMgaW52YWxpZCcmKYAVVm90aW5nIFBlcmlvZCBFeHBpcmVkTweOBwAHAAYABQAEAAMAAgABAAAAAAAAAAAiQ0sCVwYEKhJC/4A2GgFJFSQSRBc2GgJJI1klC4ECCEsBFRJEsUyyGIAEdv9McLIashqBBrIQI7IBs7Q+RwJXAAQoEkRJVwQASSNZgQIITBUSRFcGAEkVSYEEDEEALyNBACOBBEsBSU4CD4EESwJPAk1LA0xPAlIpJyVPAo4CAAIAAQAAAEsBgAASRCJDSwJXBgQqEkL/yDYaAUkVJBJEF7GyGIAEil5MgLIagQayECOyAbO0PkcCVwAEKBJESVcEAEkjWYECCEwVEkRXBgBJFUmBBAxBACkjQQAjgQRLAUlOAg+BBEsCTwJNSwNMTwJSJyQpTwKOAgACAAEAAAAiQ0sCVwYEKhJC/842GgFJFSQSRBexshiABIAgabSyGoEGshAjsgGztD5HAlcABCgSRElXBABJI1mBAghMFRJEVwYASRVJgQQMQQBYI0EAUoEESwFJTgIPgQRLAk8CTUsDTE8CUiknJoAqVGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsTwOOAwADAAIAAQAAAAAiQ0sCVwYEKhJC/582GgFJFSQSRBexshiABHNxMhqyGoEGshAjsgGztD5HAlcABCgSRElXBABJI1mBAghMFRJEVwYASRVJgQQMQQAjI0EAHYEESwFJTgIPgQRLAk8CTUsDTE8CUilMjgEAAQAAIkNLAlcGBCoSQv/UMRYiCTgQIhJEIkM2GgEVJBJEIkM2GgEVJBJEIkMjK2VEIycEZUQyA0kjJwVlRDIDRwIjJwZlRCMnB2VEIycLZUQjJwxlRCMnDWVEIycOZUQjJw9lRCMnEGVETwIWTwIWUEwWUCMnEWVEIycSZUQjJxNlRCMnFGVETwMWTwMWUE8CFlBMFlAjJxVlRCMnFmVEIycXZUQjJxhlRE8DFk8DFlBPAhZQTBZQIycZZUQjJxplRCMnG2VETwIWTwIWUEwWUCMnHGVEIycdZUQjJx5lRE8CFk8CFlBMFlAjJwhlRCMnCWVEIycKZUQjJx9lRCMnIGVEIychZUQjJyJlRIABACNPGlQiTxlUTxdQTxZQTxVQTxRQTxNQTxJQTxFQIxZMSwFQSwFQTxEWUE8QFlBPDxZQTw4WUE8NUE8MUE8LUE8KUE8JUEsBUExQTwdQTwYWUE8FFlBPBBZQTwMWUE8CFlBMFlAoTFCwIkM2GgEVJRJEgD0VH3x1AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsCJDNhoBFSUSRIAOFR98dQAAAAAAAAAAAACwIkM2GgEVJBJEJyewIkM2GgEVJBJEJyewIkM2GgEVJBJEIkM2GgFJFSUSRDIKcwFEsYEbsjSBA7I1gQKyOIAECoEBQ7JCgIAgCiAFAAEgCpBOJikGc3RhdHVzAAlmaW5hbGl6ZWQIcHJvcG9zZXIPcmVnaXN0cnlfYXBwX2lkEGFzc2lnbmVkX21lbWJlcnMNdm90ZWRfbWVtYmVycwlhcHByb3ZhbHMKcmVqZWN0aW9ucwFNBBUffHURY29tbWl0dGVlX21lbWJlcnMQcmVxdWVzdGVkX2Ftb3VudBFib3ljb3R0ZWRfbWVtYmVycwVudWxscw9jb21taXR0ZWVfdm90ZXMQZnVuZGluZ19jYXRlZ29yeQ5hc3NpZ25lZF92b3RlcwFWAQANbG9ja2VkX2Ftb3VudBBxdW9ydW1fdGhyZXNob2xkGXdlaWdodGVkX3F1b3J1bV90aHJlc2hvbGQmRVJSOldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQMY29tbWl0dGVlX2lkEW9wZW5fcHJvcG9zYWxfZmVlHGRhZW1vbl9vcGVyYXRpb25fZnVuZGluZ19icHMOb3Blbl90aW1lc3RhbXAWdm90ZV9vcGVuaW5nX3RpbWVzdGFtcAxmdW5kaW5nX3R5cGUPdm90aW5nX2R1cmF0aW9uD3BhdXNlZF9yZWdpc3RyeRRzdWJtaXNzaW9uX3RpbWVzdGFtcBFtZXRhZGF0YV91cGxvYWRlZAV0aXRsZQVmb2N1cxNkaXNjdXNzaW9uX2R1cmF0aW9uFG1pbl9yZXF1ZXN0ZWRfYW1vdW50Gm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlC3hnb3ZfZGFlbW9uE0VSUjpWb3RlciBub3QgZm91bmQxGEAAijE1gQMSRDE0gRsSRDE3FEQxNhREKzIDZycEImcnGClnJwsiZycPImcnGSJnJxoiZycbImcnICJnJxwiZygiZyoiZychImcnIilnJxAiZycjImcnHSJnJwwiZycUImcnJCJnJx4iZycVImcnFiJnJwUiZycRImcnBiJnJw0iZycHImcnCCJnJw4iZ4AEJDeNPDYaAI4BAJExGRREMRhBAHqCEATtrrnKBHFDmU8Ec3EyGgQ05hPKBA2asNcEGEGg0gRzTb7MBHb/THAEIS2fBwSKXkyABCrBmwUEgCBptAS2Seh0BCRhX5AENpxCugTb2D3ZNhoAjhAAXwOOA+QEKwRwBXAHUwfDCF4IyAj/CYcKaAtBC24AAQAjQ4AEzGlOqjYaAI4BAA0AMRmBBRIxGBBEQgosNhoBSRUkEkQyDUQrTGcnBDINZycYiAvkJxhMZycLiAvOJwtMZycPiAvFJw9MZycZiAu8JxlMZycaiAuzJxpMZyNDKUcCMRYjCUk4ECMSRDYaAUkiWYECCEsBFRJEVwIANhoCSRWBCBJEFzYaA0kVgQgSRBc2GgRJFSMSRCcfiAtuFESIC9BEIihlREAC3yIqZURAAtgjREsDSRWBew5EKRNESwIlEkAACEsCgRQSQQK4I0QnJYgLNycmiAsySwNJTgJPAw9ESwEPRIAXcHJvcG9zYWxfY29tbWl0bWVudF9icHOICwlLAQshBApLBkk4ACIrZUQSREk4BzIKEkQ4CElFCRJEJyJLBWeAGm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsiArGgBttYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW2ICqZFCQ5BAgglJxBMZycdSwNnJwxLAmdJFycjTGcnFEsGZyInEGVMSU4CRQpESUQiJwxlREQlEkEBi4AZZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbIgKUCckTGciJxBlTElOAkUKRCUSQQESgBV2b3RpbmdfZHVyYXRpb25fc21hbGyICiJFBiceSwZngAxxdW9ydW1fc21hbGyICgqADHF1b3J1bV9sYXJnZYgJ+UsBCScliAnxJyaICexLAQkiJwxlRE8CCU8CC0wKCCInC2VECyEECicVTGeAFXdlaWdodGVkX3F1b3J1bV9zbWFsbIgJtIAVd2VpZ2h0ZWRfcXVvcnVtX2xhcmdliAmaSwEJJyWICZInJogJjUsBCSInDGVETwIJTwILTAoIIicPZUQLIQQKJxZMZyglZycbMgdnIicdZUQWSZOBCA5EVwcBIicMZUQiJxBlRBZJk4EIDkRXBwEyBk8CFk8DTFBPAlBMFlCABEsVjZhMULAjQ0sHgRQSQQAggBZ2b3RpbmdfZHVyYXRpb25fbWVkaXVtiAkHRQZC/uKAFXZvdGluZ19kdXJhdGlvbl9sYXJnZYgI6EUGQv7DSweBFBJBACKAGmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtiAi8Qv5pgBlkaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdliAibQv5ISwFLBw5BAAWBFEL97IEeQv3nIkL9RSJC/SU2GgFJIlmBAghLARUSRFcCAEk2GgJJFSMSRCJTJx+ICF0URIgIpEwVSU4DRCchI2dBAA4nCbxIJwm8SCcJTL8jQycJvURJSwMIJwlM0ycJTE8Cu0L/6SKICKFEIihlRCUTQAAHIiplREEALCcXRQFJKRNBABBJSRUWVwYCTFAnCkxQsCNDIitlRIgIjCcJvEgqI2cpQv/fKUUBQv/SJx+IB9wURIgIIzIHIicbZUQJIickZUQPRCInIWVERCcniAfKSRUkEkQiJxllRCInGmVECyEECogILSiBFGcnIDIHZyNDKUk2GgFHAiJZSU4CgSgLgQIITBUSRIgH8kQiKGVEgRQSRDEWQADSMgRFAyNFBEsDSwMMQQANSwNJiAgNIwhFBEL/6yJFBEsDSwEMQQBFSwFXAgBLBElOAoEoC4EoWElXACBMJFsnEk8CUEm9RQEUREsBREsBFr8iJwVlRCMIJwVMZyInEWVECCcRTGcjCEUEQv+zIicFZUQiJwtlRBJBAFYiJxFlRCInD2VEEkQogRlnMgcnHEsBZyInHmVESwEIIicVZUQWSZMkDkRXBAQiJxZlRBZJkyQORFcEBDIGTwQWTwQWUE8DUE8CUEwWUIAE3OvhxUxQsCNDIogHTEL/QyJJKTYaAUkVJBJENhoCSRWBCBJEFzYaA0kVgQgSRBeIBvdEIihlRIEZE0EBiicXRQZLBSkTQQARSwVJFRZXBgJMUCcKTFCwI0MnEksDUElFBr1FAUABJScoRQZLBSkSQQEVSwS+RBdJRQUiJwZlRCMIJwZMZ0sCSwKIBklBAMMiJw1lRCMIJw1MZyIjSwRLBogHCEsGSRUjSwEPI0sCTwJNTFJJFSQSREsEFkmTJA5EVwQESwQWSZMkDkRXBARPBBZJkyQORFcEBCInBmVEFkmTJA5EVwQEIicNZUQWSZMkDkRXBAQiJwdlRBZJkyQORFcEBCInCGVEFkmTJA5EVwQEIicOZUQWSZMkDkRXBAQyBk8JTwlQTwhQTwdQJxMiTwlUUE8GUE8FUE8EUE8DUE8CUEwWUIAEqRCKGkxQsClC/vgiSwRLA0lOAglLA0lOAwlJTgNOBCInB2VECCcHTGciJwhlRAgnCExnIicOZUQIJw5MZ0L/FUsFQv6+SwS+RBdJRQVLAksCCAxBACRLA0sCSwKIBS9AABiAEUVSUjpWb3RlcyBpbnZhbGlkRQZC/qopRQZC/qSIBPxAACCAGUVSUjpWb3RpbmcgUGVyaW9kIEV4cGlyZWRFBkL+VClFBkL+TiknH4gEsxREIihlRIEZEkSIBMBBAAaIBOBBAFAjRIgFW0EAQogFakEAPIgFf0EANiNFAUlBACEogR5niAS7MgYnEyJLBFQjTwNUTBZQgASLeJUUTFCwI0MogShnIitlRIgE8EL/1SJFAUL/xyJC/60iRwIpNhoBRwIiWUlOAiQLgQIITBUSRIgErEQiKGVEgR4SQAAKIihlRIEoEkEAByIqZURBAF8nF0UFSwQpE0EAEUsESRUWVwYCTFAnCkxQsCNDIkUDSwJLAQxBADRLAVcCAEsDJAskWElFBycSTFBJRQW9RQFAAAUnKEL/xksDvkQXSwZMiATASwIjCEUDQv/EKUL/rilFBUL/nzYaAUkVIxJEIlNJMQCADHhnb3ZfY291bmNpbIgDnUkVJBJEEkQiKGVEgR4SRCInBWVEFERBACUogTxnIicEZURyCESIBAIyBicTIksDVEwWUIAErugXGUxQsCNDKIEtZyIrZUSIA+FC/9wiiAO9RCIoZUSBLRNBACInF0UBSSkTQQAQSUkVFlcGAkxQJwpMULAjQyiBMmcpQv/pKUUBQv/cIkkpRwI2GgFHAiJZSU4CJAuBAghMFRJEiANhRCIoZUSBFBJEMRZAAFgyBEUDI0UFSwRLAwxBAA1LBEmIA3wjCEUFQv/rIkUESwNLAQxBAC9LAVcCAEsEJAskWElFBycSTFBJRQi9RQFBAAtLBr5EF0sGTIgDlksDIwhFBEL/ySNDIogDNUL/vSKIAv5EIiplREAALiIoZURBAKkiKGVEJRNBAKAiKGVEgTITQQCWIihlRIE8E0EAjCIoZUSBKBNBAIInF0UBSSkTQQAQSUkVFlcGAkxQJwpMULAjQyInBWVEQQAzgC5FUlI6VGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsQv+2IihlRCUSQQAHIitlRIgCgCInBGVEcghEMgpzAEQyCnMBRAmIAlYqI2cpQv+JKUUBQv98iAIvRCIqZUREJwm8SCInBGVEcghEMgpzAESIAiwjQyIrZUQiJwRlRCInImVEIicbZUQiJyBlRCInHGVEIihlRCIqZUQiJxBlRCInI2VEFkmTgQgORFcHASInHWVEIicMZUQiJxRlRCInGGVEIicLZUQiJw9lRCInBmVEIicNZUQiJwdlRCInCGVEIicOZURPExZPFExQSxMVFlcGAk8UUEyAAgDEUE8TFlBPEhZQTxEWUE8QFlAnEyJPEVRQTw4WUE8NUE8MFlBPCxZQTwoWUE8JUE8IFlBPBxZQTwYWUE8FFlBPBBZQTwMWUE8CFlBMUCcKTFCwI0M2GgFJFSQSRCcSTFBJvUlPAkhBABRLAb5EFxYnEyJLA1RQJwpMULAjQyJC/+0iJxVlRBZJkyQORFcEBCInFmVEFkmTJA5EVwQEIicGZUQWSZMkDkRXBAQiJw1lRBZJkyQORFcEBCInB2VEFkmTJA5EVwQEIicIZUQWSZMkDkRXBAQiJw5lRBZJkyQORFcEBIgA/IgBDogBJogAcE8KTwpQTwlQTwhQTwdQTwZQTwVQJxMiTwZUI08FVIECTwRUgQNPA1RQJwpMULAjQ4oBASInBGVEi/9lRImKAQEiJwRlRIv/ZUSJMgciJxxlRAkiJx5lRA6JigMBi/6L/RJBAAqL/4v9EkEAAiOJIokiJwZlRCInC2VEEomIABhEIihlRCUSQQAKIiplREAAAyNEiSJC//oxACIrZUQSiTEAJ7JAgLcBJ4j/l0kVJBJEEokyDSInBGVEEomKAgCxi/+yCIv+sgcjshAisgGziYoBACInFGVEi/9MiP/eJxQiZ4mKAQCL/zgYMggSRIv/ORoANhoAEkSJIicVZUQiJwZlRCInDWVECUsBDxCJIicWZUQiJwdlRCInCGVECCInDmVECEsBDxCJIicHZUQiJwhlRA2JigIAJxKL/lBJvUUBRIv/RCInBWVEIwknBUxnIicRZUSL/wknEUxnvEiJskCABMxpTqqyGkyyGoEGshAjsgGztD0yCnMBRLFLAXIIRCMnB2VETwJPBAkJsgiyByKyECOyAbMWKExQsCJD", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgOCAzMiAxODE0NDAwIDI0MTkyMDAgNjA0ODAwCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiICJFUlI6IiAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OSAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczIDB4Nzg2NzZmNzY1ZjYzNmY3NTZlNjM2OTZjIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZSAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUgMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQgMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3NjZmNzQ2NTczIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMgMHg3MDcyNmY3MDZmNzM2MTZjNWY2MzZmNmQ2ZDY5NzQ2ZDY1NmU3NDVmNjI3MDczIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NCAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjczNmQ2MTZjNmMgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1IDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1IDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NSAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YyAweDcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkIDB4NzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1IDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUgMHg2MTYyNzM2NTZlNjM2NTVmNzQ2ZjZjNjU3MjYxNmU2MzY1IDB4Njc2Zjc2NjU3MjZlNjE2ZTYzNjU1ZjcwNjU3MjY5NmY2NCAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjc3MjYxNjM2NTVmNzA2NTcyNjk2ZjY0IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwICJVbmF1dGhvcml6ZWQiICJWb3RlciBub3QgZm91bmQiICJNaXNzaW5nIENvbmZpZyIgYmFzZTMyKENVUFhZNUlBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfWEdPVl9DT1VOQ0lMLAogICAgYnl0ZWMgNSAvLyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyOQogICAgLy8gQWNjb3VudCgpLAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI3LTMxCiAgICAvLyAjIFJvbGUtQmFzZWQgQWNjZXNzIENvbnRyb2wgKFJCQUMpCiAgICAvLyBzZWxmLnhnb3ZfY291bmNpbCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFjY291bnQoKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfWEdPVl9DT1VOQ0lMLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzQKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9YR09WX0RBRU1PTiwKICAgIGJ5dGVjIDYgLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBBY2NvdW50KCksCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzItMzUKICAgIC8vIHNlbGYueGdvdl9kYWVtb24gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1hHT1ZfREFFTU9OLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDAKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9QQVVTRURfUkVHSVNUUlksCiAgICBieXRlY18zIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBGYWxzZSwgICMgbm9xYTogRkJUMDAzCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNy00MQogICAgLy8gIyBSZWdpc3RyeSBDb250cm9sIFN0YXRlcwogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBGYWxzZSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfUEFVU0VEX1BST1BPU0FMUywKICAgIGJ5dGVjIDQgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MwogICAgLy8gRmFsc2UsICAjIG5vcWE6IEZCVDAwMwogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDItNDUKICAgIC8vIHNlbGYucGF1c2VkX3Byb3Bvc2FscyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEZhbHNlLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfUEFVU0VEX1BST1BPU0FMUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUwCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUsCiAgICBieXRlYyA3IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0OQogICAgLy8gVUludDY0KHJlZ19jZmcuT1BFTl9QUk9QT1NBTF9GRUUpLAogICAgcHVzaGludCAxMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDctNTEKICAgIC8vICMgRmVlcwogICAgLy8gc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLk9QRU5fUFJPUE9TQUxfRkVFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NAogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMsCiAgICBieXRlYyAxMSAvLyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBVSW50NjQocmVnX2NmZy5EQUVNT05fT1BTX0ZVTkRJTkdfQlBTKSwKICAgIHB1c2hpbnQgNTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUyLTU1CiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5EQUVNT05fT1BTX0ZVTkRJTkdfQlBTKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfUFJPUE9TQUxfQ09NTUlUTUVOVF9CUFMsCiAgICBieXRlYyAxMiAvLyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTcKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLlBST1BPU0FMX0NPTU1JVE1FTlRfQlBTKSwKICAgIHB1c2hpbnQgMzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU2LTU5CiAgICAvLyBzZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuUFJPUE9TQUxfQ09NTUlUTUVOVF9CUFMpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9QUk9QT1NBTF9DT01NSVRNRU5UX0JQUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQsCiAgICBieXRlYyAxMyAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjMKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLk1JTl9SRVFVRVNURURfQU1PVU5UKSwKICAgIHB1c2hpbnQgMjUwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2MS02NQogICAgLy8gIyBSZXF1ZXN0ZWQgQW1vdW50IExpbWl0cwogICAgLy8gc2VsZi5taW5fcmVxdWVzdGVkX2Ftb3VudCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLk1JTl9SRVFVRVNURURfQU1PVU5UKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2OAogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX1NNQUxMLAogICAgYnl0ZWMgMTQgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY3CiAgICAvLyBVSW50NjQocmVnX2NmZy5NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTCksCiAgICBwdXNoaW50IDI1MDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY2LTY5CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuTUFYX1JFUVVFU1RFRF9BTU9VTlRfU01BTEwpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTUVESVVNLAogICAgYnl0ZWMgMTUgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzEKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLk1BWF9SRVFVRVNURURfQU1PVU5UX01FRElVTSksCiAgICBwdXNoaW50IDEwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3MC03MwogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0pLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NgogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFLAogICAgYnl0ZWMgMTYgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBVSW50NjQocmVnX2NmZy5NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSksCiAgICBwdXNoaW50IDIwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NC03NwogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLk1BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTEFSR0UsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo4MgogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fU01BTEwsCiAgICBieXRlYyAxNyAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBVSW50NjQocmVnX2NmZy5ESVNDVVNTSU9OX0RVUkFUSU9OX1NNQUxMKSwKICAgIGludGMgNCAvLyAxODE0NDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc5LTgzCiAgICAvLyAjIFRpbWUgTGltaXRzCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5ESVNDVVNTSU9OX0RVUkFUSU9OX1NNQUxMKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9TTUFMTCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0sCiAgICBieXRlYyAxOCAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6ODUKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkRJU0NVU1NJT05fRFVSQVRJT05fTUVESVVNKSwKICAgIGludGMgNCAvLyAxODE0NDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojg0LTg3CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0pLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX01FRElVTSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9MQVJHRSwKICAgIGJ5dGVjIDE5IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6ODkKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkRJU0NVU1NJT05fRFVSQVRJT05fTEFSR0UpLAogICAgaW50YyA0IC8vIDE4MTQ0MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6ODgtOTEKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLkRJU0NVU1NJT05fRFVSQVRJT05fTEFSR0UpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTQKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX1hMQVJHRSwKICAgIGJ5dGVjIDIwIC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo5MwogICAgLy8gVUludDY0KHJlZ19jZmcuRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UpLAogICAgaW50YyA1IC8vIDI0MTkyMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTItOTUKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5ESVNDVVNTSU9OX0RVUkFUSU9OX1hMQVJHRSksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fWExBUkdFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTgKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fU01BTEwsCiAgICBieXRlYyAyMSAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo5NwogICAgLy8gVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX1NNQUxMKSwKICAgIGludGMgNiAvLyA2MDQ4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTYtOTkKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX1NNQUxMKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1NNQUxMLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAyCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX01FRElVTSwKICAgIGJ5dGVjIDIyIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAxCiAgICAvLyBVSW50NjQocmVnX2NmZy5WT1RJTkdfRFVSQVRJT05fTUVESVVNKSwKICAgIGludGMgNiAvLyA2MDQ4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAwLTEwMwogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX01FRElVTSksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9NRURJVU0sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDYKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTEFSR0UsCiAgICBieXRlYyAyMyAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDUKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLlZPVElOR19EVVJBVElPTl9MQVJHRSksCiAgICBwdXNoaW50IDEyMDk2MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTA0LTEwNwogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fbGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5WT1RJTkdfRFVSQVRJT05fTEFSR0UpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTEFSR0UsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMTAKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fWExBUkdFLAogICAgYnl0ZWMgMjQgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDkKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLlZPVElOR19EVVJBVElPTl9YTEFSR0UpLAogICAgaW50YyA1IC8vIDI0MTkyMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTA4LTExMQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX1hMQVJHRSksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9YTEFSR0UsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMTYKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfSUQsCiAgICBieXRlYyA4IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExNQogICAgLy8gdHlwLkJ5dGVzMzIuZnJvbV9ieXRlcyhiIjAiICogMzIpLAogICAgcHVzaGJ5dGVzIDB4MzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMTMtMTE3CiAgICAvLyAjIHhHb3YgQ29tbWl0dGVlCiAgICAvLyBzZWxmLmNvbW1pdHRlZV9pZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIHR5cC5CeXRlczMyLmZyb21fYnl0ZXMoYiIwIiAqIDMyKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX0lELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTIwCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX01FTUJFUlMsCiAgICBieXRlYyA5IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMTkKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTE4LTEyMQogICAgLy8gc2VsZi5jb21taXR0ZWVfbWVtYmVycyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEyNAogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9WT1RFUywKICAgIGJ5dGVjIDEwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3NjZmNzQ2NTczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMjItMTI1CiAgICAvLyBzZWxmLmNvbW1pdHRlZV92b3RlcyA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfVk9URVMsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMzAKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9RVU9SVU1fU01BTEwsCiAgICBieXRlYyAyNSAvLyAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMjkKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLlFVT1JVTV9TTUFMTCksCiAgICBwdXNoaW50IDMwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTI3LTEzMQogICAgLy8gIyBRdW9ydW1zCiAgICAvLyBzZWxmLnF1b3J1bV9zbWFsbCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLlFVT1JVTV9TTUFMTCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1FVT1JVTV9TTUFMTCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzNAogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1FVT1JVTV9NRURJVU0sCiAgICBieXRlYyAyNiAvLyAweDcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gVUludDY0KHJlZ19jZmcuUVVPUlVNX01FRElVTSksCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMzItMTM1CiAgICAvLyBzZWxmLnF1b3J1bV9tZWRpdW0gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5RVU9SVU1fTUVESVVNKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfUVVPUlVNX01FRElVTSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzOAogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1FVT1JVTV9MQVJHRSwKICAgIGJ5dGVjIDI3IC8vIDB4NzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gVUludDY0KHJlZ19jZmcuUVVPUlVNX0xBUkdFKSwKICAgIHB1c2hpbnQgNzAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMzYtMTM5CiAgICAvLyBzZWxmLnF1b3J1bV9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLlFVT1JVTV9MQVJHRSksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1FVT1JVTV9MQVJHRSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE0NAogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1dFSUdIVEVEX1FVT1JVTV9TTUFMTCwKICAgIGJ5dGVjIDI4IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE0MwogICAgLy8gVUludDY0KHJlZ19jZmcuV0VJR0hURURfUVVPUlVNX1NNQUxMKSwKICAgIHB1c2hpbnQgNTAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNDEtMTQ1CiAgICAvLyAjIFdlaWdodGVkIFF1b3J1bXMKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuV0VJR0hURURfUVVPUlVNX1NNQUxMKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX1NNQUxMLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQ4CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX01FRElVTSwKICAgIGJ5dGVjIDI5IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQ3CiAgICAvLyBVSW50NjQocmVnX2NmZy5XRUlHSFRFRF9RVU9SVU1fTUVESVVNKSwKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE0Ni0xNDkKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLldFSUdIVEVEX1FVT1JVTV9NRURJVU0pLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTUVESVVNLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTUyCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX0xBUkdFLAogICAgYnl0ZWMgMzAgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTUxCiAgICAvLyBVSW50NjQocmVnX2NmZy5XRUlHSFRFRF9RVU9SVU1fTEFSR0UpLAogICAgcHVzaGludCA3MDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE1MC0xNTMKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX2xhcmdlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuV0VJR0hURURfUVVPUlVNX0xBUkdFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX0xBUkdFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTU3CiAgICAvLyBVSW50NjQocmVnX2NmZy5BQlNFTkNFX1RPTEVSQU5DRSksIGtleT1yZWdfY2ZnLkdTX0tFWV9BQlNFTkNFX1RPTEVSQU5DRQogICAgYnl0ZWMgMzEgLy8gMHg2MTYyNzM2NTZlNjM2NTVmNzQ2ZjZjNjU3MjYxNmU2MzY1CiAgICBwdXNoaW50IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTU1LTE1OAogICAgLy8gIyBOZXcgVmFyaWFibGVzIChpbnRyb2R1Y2VkIGFmdGVyIE1haW5OZXQgZGVwbG95bWVudCkKICAgIC8vIHNlbGYuYWJzZW5jZV90b2xlcmFuY2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5BQlNFTkNFX1RPTEVSQU5DRSksIGtleT1yZWdfY2ZnLkdTX0tFWV9BQlNFTkNFX1RPTEVSQU5DRQogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTYwCiAgICAvLyBVSW50NjQocmVnX2NmZy5HT1ZFUk5BTkNFX1BFUklPRCksIGtleT1yZWdfY2ZnLkdTX0tFWV9HT1ZFUk5BTkNFX1BFUklPRAogICAgYnl0ZWMgMzIgLy8gMHg2NzZmNzY2NTcyNmU2MTZlNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICBwdXNoaW50IDEwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTU5LTE2MQogICAgLy8gc2VsZi5nb3Zlcm5hbmNlX3BlcmlvZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLkdPVkVSTkFOQ0VfUEVSSU9EKSwga2V5PXJlZ19jZmcuR1NfS0VZX0dPVkVSTkFOQ0VfUEVSSU9ECiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjQKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfR1JBQ0VfUEVSSU9ELAogICAgYnl0ZWMgMzMgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY3NzI2MTYzNjU1ZjcwNjU3MjY5NmY2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjMKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkNPTU1JVFRFRV9HUkFDRV9QRVJJT0QpLAogICAgcHVzaGludCAxMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjItMTY1CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5DT01NSVRURUVfR1JBQ0VfUEVSSU9EKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX0dSQUNFX1BFUklPRCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gVUludDY0KCksIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTEFTVF9BTkNIT1IKICAgIGJ5dGVjIDM0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjYtMTY4CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9sYXN0X2FuY2hvciA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NCgpLCBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX0xBU1RfQU5DSE9SCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI0CiAgICAvLyBjbGFzcyBYZ292UmVnaXN0cnlNb2NrKFhHb3ZSZWdpc3RyeUludGVyZmFjZSk6CiAgICBwdXNoYnl0ZXMgMHg0OTU2YzFhYiAvLyBtZXRob2QgInVwZGF0ZV94Z292X3JlZ2lzdHJ5KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl91cGRhdGVfeGdvdl9yZWdpc3RyeV9yb3V0ZUA0CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBieiBtYWluX2NyZWF0ZV9Ob09wQDU0CiAgICBwdXNoYnl0ZXNzIDB4OTU5YzQ3NjIgMHg2YzFmNTY0ZCAweGUxMGE1MTJlIDB4ODZmN2UwZTYgMHgzOWUyNmQ4YSAweDk4MzUyZTg2IDB4ZmE0ZWQ2ZTIgMHhkNmM5Y2MxYSAweDVjNDg0MDU1IDB4MzdkNmFkZjEgMHhkNDIxNmI2ZSAweGJhODUyMGYyIDB4MTY3N2IzMGUgMHg4NGI3ZDI2OCAweGFmN2YxODYwIDB4YTA4MmNlZjggMHhkZjM5ZmRiOSAweGNhMGY2YTNhIDB4M2MzMWJjMDIgMHgwZDJjNzg5MSAweDQ1MDc3MzkwIDB4OTNmYWNkYmEgMHhjZThiM2ExYyAweGZhZWEwODFmIDB4MGRhMjc4ODUgMHg3YTRmZWU0MyAweDUyZGQxMGQ3IDB4ZDRkMzdhNjQgMHgzNDM0OWRjYyAweDE1OGY4ZGQ2IDB4NWZlMjU5MzUgMHhkYjI3YjlhZiAweGY1OTEwNzU2IDB4NjU2MTBhOWYgMHhmZGM2OTVjMiAweGJhOTBhYjU0IDB4MWE2NzRiNDUgMHhhOGQ1YWU5NCAweDZhZTVlYjQ2IDB4Mjc2MzBkNjUgMHg4MjRmOThiYyAweDQ5NTQ4YmEwIDB4ODI2Nzg0ZjYgMHgyNjk4MzIwMCAweGMzODZiMDNmIDB4ZGJkODNkZDkgLy8gbWV0aG9kICJpbml0X3Byb3Bvc2FsX2NvbnRyYWN0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJsb2FkX3Byb3Bvc2FsX2NvbnRyYWN0KHVpbnQ2NCxieXRlW10pdm9pZCIsIG1ldGhvZCAiZGVsZXRlX3Byb3Bvc2FsX2NvbnRyYWN0X2JveCgpdm9pZCIsIG1ldGhvZCAicGF1c2VfcmVnaXN0cnkoKXZvaWQiLCBtZXRob2QgInBhdXNlX3Byb3Bvc2Fscygpdm9pZCIsIG1ldGhvZCAicmVzdW1lX3JlZ2lzdHJ5KCl2b2lkIiwgbWV0aG9kICJyZXN1bWVfcHJvcG9zYWxzKCl2b2lkIiwgbWV0aG9kICJzZXRfeGdvdl9tYW5hZ2VyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3BheW9yKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfY291bmNpbChhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF94Z292X3N1YnNjcmliZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzZXRfa3ljX3Byb3ZpZGVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X2NvbW1pdHRlZV9tYW5hZ2VyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfZGFlbW9uKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiY29uZmlnX3hnb3ZfcmVnaXN0cnkoKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NFszXSx1aW50NjRbNF0sdWludDY0WzRdLHVpbnQ2NFszXSx1aW50NjRbM10sdWludDY0LHVpbnQ2NCx1aW50NjQpKXZvaWQiLCBtZXRob2QgInN1YnNjcmliZV94Z292KGFkZHJlc3MscGF5KXZvaWQiLCBtZXRob2QgInVuc3Vic2NyaWJlX3hnb3YoKXZvaWQiLCBtZXRob2QgInVuc3Vic2NyaWJlX2Fic2VudGVlKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV9zdWJzY3JpYmVfeGdvdih1aW50NjQpdm9pZCIsIG1ldGhvZCAicmVqZWN0X3N1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZXF1ZXN0X3N1YnNjcmliZV94Z292KGFkZHJlc3MsYWRkcmVzcyx1aW50NjQscGF5KXZvaWQiLCBtZXRob2QgInJlcXVlc3RfdW5zdWJzY3JpYmVfeGdvdihhZGRyZXNzLGFkZHJlc3MsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX3Vuc3Vic2NyaWJlX3hnb3YodWludDY0KXZvaWQiLCBtZXRob2QgInJlamVjdF91bnN1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzZXRfdm90aW5nX2FjY291bnQoYWRkcmVzcyxhZGRyZXNzKXZvaWQiLCBtZXRob2QgInN1YnNjcmliZV9wcm9wb3NlcihwYXkpdm9pZCIsIG1ldGhvZCAic2V0X3Byb3Bvc2VyX2t5YyhhZGRyZXNzLGJvb2wsdWludDY0KXZvaWQiLCBtZXRob2QgImRlY2xhcmVfY29tbWl0dGVlKGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAib3Blbl9wcm9wb3NhbChwYXkpdWludDY0IiwgbWV0aG9kICJ2b3RlX3Byb3Bvc2FsKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAidW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbCh1aW50NjQsYWRkcmVzc1tdKXZvaWQiLCBtZXRob2QgInBheV9ncmFudF9wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZmluYWxpemVfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImRyb3BfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImRlcG9zaXRfZnVuZHMocGF5KXZvaWQiLCBtZXRob2QgIndpdGhkcmF3X2Z1bmRzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhd19hdmFpbGFibGVfZnVuZHModWludDY0KXZvaWQiLCBtZXRob2QgImdldF9hdmFpbGFibGVfZnVuZHMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXRlKCkoYm9vbCxib29sLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0WzNdLHVpbnQ2NFs0XSx1aW50NjRbNF0sdWludDY0WzNdLHVpbnQ2NFszXSx1aW50NjQsdWludDY0LGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3hnb3ZfYm94KGFkZHJlc3MpKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3Byb3Bvc2VyX2JveChhZGRyZXNzKSgoYm9vbCxib29sLHVpbnQ2NCksYm9vbCkiLCBtZXRob2QgImdldF9yZXF1ZXN0X2JveCh1aW50NjQpKChhZGRyZXNzLGFkZHJlc3MsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94KHVpbnQ2NCkoKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQpLGJvb2wpIiwgbWV0aG9kICJpc19wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiY3JlYXRlX2VtcHR5X3Byb3Bvc2FsKGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJvcF91cCgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGluaXRfcHJvcG9zYWxfY29udHJhY3QgbG9hZF9wcm9wb3NhbF9jb250cmFjdCBtYWluX2RlbGV0ZV9wcm9wb3NhbF9jb250cmFjdF9ib3hfcm91dGVAOSBtYWluX3BhdXNlX3JlZ2lzdHJ5X3JvdXRlQDEwIG1haW5fcGF1c2VfcHJvcG9zYWxzX3JvdXRlQDExIG1haW5fcmVzdW1lX3JlZ2lzdHJ5X3JvdXRlQDEyIG1haW5fcmVzdW1lX3Byb3Bvc2Fsc19yb3V0ZUAxMyBzZXRfeGdvdl9tYW5hZ2VyIHNldF9wYXlvciBzZXRfeGdvdl9jb3VuY2lsIHNldF94Z292X3N1YnNjcmliZXIgc2V0X2t5Y19wcm92aWRlciBzZXRfY29tbWl0dGVlX21hbmFnZXIgc2V0X3hnb3ZfZGFlbW9uIGNvbmZpZ194Z292X3JlZ2lzdHJ5IHN1YnNjcmliZV94Z292IG1haW5fdW5zdWJzY3JpYmVfeGdvdl9yb3V0ZUAyMyB1bnN1YnNjcmliZV9hYnNlbnRlZSBhcHByb3ZlX3N1YnNjcmliZV94Z292IHJlamVjdF9zdWJzY3JpYmVfeGdvdiByZXF1ZXN0X3N1YnNjcmliZV94Z292IHJlcXVlc3RfdW5zdWJzY3JpYmVfeGdvdiBhcHByb3ZlX3Vuc3Vic2NyaWJlX3hnb3YgcmVqZWN0X3Vuc3Vic2NyaWJlX3hnb3Ygc2V0X3ZvdGluZ19hY2NvdW50IHN1YnNjcmliZV9wcm9wb3NlciBzZXRfcHJvcG9zZXJfa3ljIGRlY2xhcmVfY29tbWl0dGVlIG9wZW5fcHJvcG9zYWwgdm90ZV9wcm9wb3NhbCB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsIHBheV9ncmFudF9wcm9wb3NhbCBmaW5hbGl6ZV9wcm9wb3NhbCBkcm9wX3Byb3Bvc2FsIGRlcG9zaXRfZnVuZHMgd2l0aGRyYXdfZnVuZHMgd2l0aGRyYXdfYXZhaWxhYmxlX2Z1bmRzIG1haW5fZ2V0X2F2YWlsYWJsZV9mdW5kc19yb3V0ZUA0NCBnZXRfc3RhdGUgZ2V0X3hnb3ZfYm94IGdldF9wcm9wb3Nlcl9ib3ggZ2V0X3JlcXVlc3RfYm94IGdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveCBpc19wcm9wb3NhbCBjcmVhdGVfZW1wdHlfcHJvcG9zYWwgbWFpbl9vcF91cF9yb3V0ZUA1MgogICAgZXJyCgptYWluX29wX3VwX3JvdXRlQDUyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1ODUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hdmFpbGFibGVfZnVuZHNfcm91dGVANDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQzNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlYyAzNSAvLyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3Vuc3Vic2NyaWJlX3hnb3Zfcm91dGVAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVzdW1lX3Byb3Bvc2Fsc19yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjAwCiAgICAvLyBzZWxmLnBhdXNlZF9wcm9wb3NhbHMudmFsdWUgPSBGYWxzZQogICAgYnl0ZWMgNCAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTk4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZXN1bWVfcmVnaXN0cnlfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUgPSBGYWxzZQogICAgYnl0ZWNfMyAvLyAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OQogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcGF1c2VfcHJvcG9zYWxzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxOTIKICAgIC8vIHNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSA9IFRydWUKICAgIGJ5dGVjIDQgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgaW50Y18wIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcGF1c2VfcmVnaXN0cnlfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gc2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUgPSBUcnVlCiAgICBieXRlY18zIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzAgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfcHJvcG9zYWxfY29udHJhY3RfYm94X3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX05vT3BANTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI0CiAgICAvLyBjbGFzcyBYZ292UmVnaXN0cnlNb2NrKFhHb3ZSZWdpc3RyeUludGVyZmFjZSk6CiAgICBwdXNoYnl0ZXMgMHg0YzVjNjFiYSAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX3JvdXRlQDU1CiAgICBlcnIKCm1haW5fY3JlYXRlX3JvdXRlQDU1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVfeGdvdl9yZWdpc3RyeV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNCAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmluaXRfcHJvcG9zYWxfY29udHJhY3Rbcm91dGluZ10oKSAtPiB2b2lkOgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5sb2FkX3Byb3Bvc2FsX2NvbnRyYWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKbG9hZF9wcm9wb3NhbF9jb250cmFjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTc4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3hnb3ZfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3BheW9yW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3BheW9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF94Z292X2NvdW5jaWxbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9jb3VuY2lsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjEyCiAgICAvLyBzZWxmLnhnb3ZfY291bmNpbC52YWx1ZSA9IGNvdW5jaWwKICAgIGJ5dGVjIDUgLy8gMHg3ODY3NmY3NjVmNjM2Zjc1NmU2MzY5NmMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIxMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3hnb3Zfc3Vic2NyaWJlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X3N1YnNjcmliZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIxNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X2t5Y19wcm92aWRlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9reWNfcHJvdmlkZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIxOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X2NvbW1pdHRlZV9tYW5hZ2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X2NvbW1pdHRlZV9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF94Z292X2RhZW1vbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X2RhZW1vbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjI2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIyOAogICAgLy8gc2VsZi54Z292X2RhZW1vbi52YWx1ZSA9IHhnb3ZfZGFlbW9uCiAgICBieXRlYyA2IC8vIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjI2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5jb25maWdfeGdvdl9yZWdpc3RyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNvbmZpZ194Z292X3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIHB1c2hpbnQgMjA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292UmVnaXN0cnlDb25maWcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjM4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay51bnN1YnNjcmliZV9hYnNlbnRlZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuc3Vic2NyaWJlX2Fic2VudGVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmFwcHJvdmVfc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgphcHByb3ZlX3N1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5yZWplY3Rfc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZWplY3Rfc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnJlcXVlc3Rfc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZXF1ZXN0X3N1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5yZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmFwcHJvdmVfdW5zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFwcHJvdmVfdW5zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sucmVqZWN0X3Vuc3Vic2NyaWJlX3hnb3Zbcm91dGluZ10oKSAtPiB2b2lkOgpyZWplY3RfdW5zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mjg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3ZvdGluZ19hY2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3ZvdGluZ19hY2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyOTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnN1YnNjcmliZV9wcm9wb3Nlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1YnNjcmliZV9wcm9wb3NlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mjk2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5zZXRfcHJvcG9zZXJfa3ljW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3Byb3Bvc2VyX2t5YzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzAwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgbGVuCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5kZWNsYXJlX2NvbW1pdHRlZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlY2xhcmVfY29tbWl0dGVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzE0CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9pZC52YWx1ZSA9IGNvbW1pdHRlZV9pZC5jb3B5KCkKICAgIGJ5dGVjIDggLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQKICAgIHVuY292ZXIgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzE1CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlID0gc2l6ZQogICAgYnl0ZWMgOSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIHVuY292ZXIgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzE2CiAgICAvLyBzZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSA9IHZvdGVzCiAgICBieXRlYyAxMCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzEwCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5vcGVuX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKb3Blbl9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgYnl0ZWMgMzUgLy8gMHgxNTFmN2M3NTAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKdm90ZV9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzIyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMzMS0zMzcKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIFByb3Bvc2FsLnZvdGUsCiAgICAvLyAgICAgeGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcHJvdmFsX3ZvdGVzLAogICAgLy8gICAgIHJlamVjdGlvbl92b3RlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICB1bmNvdmVyIDMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMzIKICAgIC8vIFByb3Bvc2FsLnZvdGUsCiAgICBwdXNoYnl0ZXMgMHgxODQxYTBkMiAvLyBtZXRob2QgInZvdGUoYWRkcmVzcyx1aW50NjQsdWludDY0KXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzMxLTMzNwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudm90ZSwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMzkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogdm90ZV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQKICAgIGludGNfMSAvLyAwCgp2b3RlX3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzM5CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IHZvdGVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNDAKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAzCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzQyCiAgICAvLyBjYXNlIGVyci5VTkFVVEhPUklaRUQ6CiAgICBieXRlYyAzNiAvLyAiVW5hdXRob3JpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNDQKICAgIC8vIGNhc2UgZXJyLlZPVEVSX05PVF9GT1VORDoKICAgIGJ5dGVjIDM3IC8vICJWb3RlciBub3QgZm91bmQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM0NgogICAgLy8gY2FzZSBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRDoKICAgIHB1c2hieXRlc3MgIlZvdGVyIGFscmVhZHkgdm90ZWQiICJWb3RlcyBpbnZhbGlkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNTAKICAgIC8vIGNhc2UgZXJyLk1JU1NJTkdfQ09ORklHOgogICAgYnl0ZWMgMzggLy8gIk1pc3NpbmcgQ29uZmlnIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNTIKICAgIC8vIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIGJ5dGVjXzEgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gY2FzZSBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEOgogICAgcHVzaGJ5dGVzICJWb3RpbmcgUGVyaW9kIEV4cGlyZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM0MS0zNTcKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLlVOQVVUSE9SSVpFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVU5BVVRIT1JJWkVEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSX05PVF9GT1VORCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVNfSU5WQUxJRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVNfSU5WQUxJRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuTUlTU0lOR19DT05GSUc6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLk1JU1NJTkdfQ09ORklHICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQgICMgbm9xYQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgdW5jb3ZlciA3CiAgICBtYXRjaCB2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANyB2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAOCB2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzJAOSB2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzNAMTAgdm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV80QDExIHZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfNUAxMiB2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzZAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzU3CiAgICAvLyBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKdm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV82QDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNTUKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRCAgIyBub3FhCiAgICBlcnIgLy8gVm90aW5nIFBlcmlvZCBFeHBpcmVkCgp2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1MwogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTICAjIG5vcWEKICAgIGVyciAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCgp2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzRAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1MQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuTUlTU0lOR19DT05GSUcgICMgbm9xYQogICAgZXJyIC8vIE1pc3NpbmcgQ29uZmlnCgp2b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzNAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM0OQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVNfSU5WQUxJRCAgIyBub3FhCiAgICBlcnIgLy8gVm90ZXMgaW52YWxpZAoKdm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM0NwogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRCAgIyBub3FhCiAgICBlcnIgLy8gVm90ZXIgYWxyZWFkeSB2b3RlZAoKdm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8xQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfTk9UX0ZPVU5EICAjIG5vcWEKICAgIGVyciAvLyBWb3RlciBub3QgZm91bmQKCnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNDMKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLlVOQVVUSE9SSVpFRCAgIyBub3FhCiAgICBlcnIgLy8gVW5hdXRob3JpemVkCgp2b3RlX3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCnZvdGVfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMzkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlY18yIC8vICJFUlI6IgogICAgPT0KICAgIGIgdm90ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YWNjb3VudD4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzYzLTM2NwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVzLAogICAgLy8gICAgIGFic2VudGVlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzY0CiAgICAvLyBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXMsCiAgICBwdXNoYnl0ZXMgMHg3NmZmNGM3MCAvLyBtZXRob2QgInVuYXNzaWduX2Fic2VudGVlcyhhZGRyZXNzW10pc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM2My0zNjcKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIFByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlcywKICAgIC8vICAgICBhYnNlbnRlZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwbiAyCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM2OQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18xIC8vIDAKCnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNjkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgYnogdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzcwCiAgICAvLyBlcnJvcl93aXRob3V0X3ByZWZpeCA9IFN0cmluZy5mcm9tX2J5dGVzKGVycm9yLmJ5dGVzWzQ6XSkKICAgIHB1c2hpbnQgNAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgPj0KICAgIHB1c2hpbnQgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMwogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM3MgogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWNfMSAvLyAiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzc0CiAgICAvLyBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICBieXRlYyAzNyAvLyAiVm90ZXIgbm90IGZvdW5kIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzEtMzc3CiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfTk9UX0ZPVU5EOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUl9OT1RfRk9VTkQgICMgbm9xYQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgdW5jb3ZlciAyCiAgICBtYXRjaCB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANyB1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzcKICAgIC8vIGFzc2VydCBGYWxzZSwgIlVua25vd24gZXJyb3IiICAjIG5vcWEKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgp1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzc1CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUl9OT1RfRk9VTkQgICMgbm9xYQogICAgZXJyIC8vIFZvdGVyIG5vdCBmb3VuZAoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM3MwogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTICAjIG5vcWEKICAgIGVyciAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCgp1bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsX2Vsc2VfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzc5CiAgICAvLyBhc3NlcnQgZXJyb3IgPT0gIiIsICJVbmtub3duIGVycm9yIgogICAgZGlnIDEKICAgIHB1c2hieXRlcyAiIgogICAgPT0KICAgIGFzc2VydCAvLyBVbmtub3duIGVycm9yCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNjkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlY18yIC8vICJFUlI6IgogICAgPT0KICAgIGIgdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sucGF5X2dyYW50X3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKcGF5X2dyYW50X3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM4MwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoUHJvcG9zYWwuZnVuZCwgYXBwX2lkPXByb3Bvc2FsX2lkKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHg4YTVlNGM4MCAvLyBtZXRob2QgImZ1bmQoKXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXBuIDIKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzg1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGxlbgogICAgZHVwCiAgICBwdXNoaW50IDQKICAgIDwKICAgIGJ6IHBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQKICAgIGludGNfMSAvLyAwCgpwYXlfZ3JhbnRfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgYnogcGF5X2dyYW50X3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzg2CiAgICAvLyBlcnJvcl93aXRob3V0X3ByZWZpeCA9IFN0cmluZy5mcm9tX2J5dGVzKGVycm9yLmJ5dGVzWzQ6XSkKICAgIHB1c2hpbnQgNAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgPj0KICAgIHB1c2hpbnQgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBkaWcgMwogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gY2FzZSBlcnIuVU5BVVRIT1JJWkVEOgogICAgYnl0ZWMgMzYgLy8gIlVuYXV0aG9yaXplZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzkwCiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlY18xIC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODctMzkzCiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5VTkFVVEhPUklaRUQ6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLlVOQVVUSE9SSVpFRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMgICMgbm9xYQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgdW5jb3ZlciAyCiAgICBtYXRjaCBwYXlfZ3JhbnRfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3IHBheV9ncmFudF9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8xQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzkzCiAgICAvLyBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKcGF5X2dyYW50X3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzkxCiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMgICMgbm9xYQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCnBheV9ncmFudF9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVU5BVVRIT1JJWkVEICAjIG5vcWEKICAgIGVyciAvLyBVbmF1dGhvcml6ZWQKCnBheV9ncmFudF9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgpwYXlfZ3JhbnRfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlY18yIC8vICJFUlI6IgogICAgPT0KICAgIGIgcGF5X2dyYW50X3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5maW5hbGl6ZV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmZpbmFsaXplX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM5NwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoUHJvcG9zYWwuZmluYWxpemUsIGFwcF9pZD1wcm9wb3NhbF9pZCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgcHVzaGJ5dGVzIDB4ODAyMDY5YjQgLy8gbWV0aG9kICJmaW5hbGl6ZSgpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogZmluYWxpemVfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMAoKZmluYWxpemVfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgYnogZmluYWxpemVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDAKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAzCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDAyCiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlY18xIC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDQKICAgIC8vIGNhc2UgZXJyLk1JU1NJTkdfQ09ORklHOgogICAgYnl0ZWMgMzggLy8gIk1pc3NpbmcgQ29uZmlnIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDYKICAgIC8vIGNhc2UgZXJyLlZPVEVSU19BU1NJR05FRDoKICAgIHB1c2hieXRlcyAiVGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDEtNDA5CiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuTUlTU0lOR19DT05GSUc6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLk1JU1NJTkdfQ09ORklHICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUlNfQVNTSUdORUQ6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSU19BU1NJR05FRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBfOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICB1bmNvdmVyIDMKICAgIG1hdGNoIGZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANyBmaW5hbGl6ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8xQDggZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMkA5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQwOQogICAgLy8gYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCmZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzJAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDA3CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUlNfQVNTSUdORUQgICMgbm9xYQogICAgZXJyIC8vIFRoZXJlIGFyZSB2b3RlcnMgYXNzaWduZWQgdG8gdGhpcyBwcm9wb3NhbAoKZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDUKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLk1JU1NJTkdfQ09ORklHICAjIG5vcWEKICAgIGVyciAvLyBNaXNzaW5nIENvbmZpZwoKZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDMKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKZmluYWxpemVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKZmluYWxpemVfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlY18yIC8vICJFUlI6IgogICAgPT0KICAgIGIgZmluYWxpemVfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmRyb3BfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgpkcm9wX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQxMwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoUHJvcG9zYWwuZHJvcCwgYXBwX2lkPXByb3Bvc2FsX2lkKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHg3MzcxMzIxYSAvLyBtZXRob2QgImRyb3AoKXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXBuIDIKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGxlbgogICAgZHVwCiAgICBwdXNoaW50IDQKICAgIDwKICAgIGJ6IGRyb3BfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMAoKZHJvcF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQxNQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBieiBkcm9wX3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MTYKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAzCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDE4CiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlY18xIC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MTctNDIxCiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBfOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBzd2FwCiAgICBtYXRjaCBkcm9wX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MjEKICAgIC8vIGFzc2VydCBGYWxzZSwgIlVua25vd24gZXJyb3IiICAjIG5vcWEKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgpkcm9wX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDE5CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMgICMgbm9xYQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCmRyb3BfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgpkcm9wX3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDE1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGRpZyAyCiAgICBleHRyYWN0IDYgNAogICAgYnl0ZWNfMiAvLyAiRVJSOiIKICAgID09CiAgICBiIGRyb3BfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmRlcG9zaXRfZnVuZHNbcm91dGluZ10oKSAtPiB2b2lkOgpkZXBvc2l0X2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLndpdGhkcmF3X2Z1bmRzW3JvdXRpbmddKCkgLT4gdm9pZDoKd2l0aGRyYXdfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLndpdGhkcmF3X2F2YWlsYWJsZV9mdW5kc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CndpdGhkcmF3X2F2YWlsYWJsZV9mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDMxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZ2V0X3N0YXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3N0YXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NDIKICAgIC8vIHBhdXNlZF9yZWdpc3RyeT1zZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18zIC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3JlZ2lzdHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NDMKICAgIC8vIHBhdXNlZF9wcm9wb3NhbHM9c2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDQgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcwNzI2ZjcwNmY3MzYxNmM3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBhdXNlZF9wcm9wb3NhbHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0NAogICAgLy8geGdvdl9tYW5hZ2VyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDQ1CiAgICAvLyB4Z292X3BheW9yPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDQ2CiAgICAvLyB4Z292X2NvdW5jaWw9c2VsZi54Z292X2NvdW5jaWwudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNSAvLyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfY291bmNpbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDQ3CiAgICAvLyB4Z292X3N1YnNjcmliZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NDgtNDQ5CiAgICAvLyBreWNfcHJvdmlkZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vIGNvbW1pdHRlZV9tYW5hZ2VyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDUwCiAgICAvLyB4Z292X2RhZW1vbj1zZWxmLnhnb3ZfZGFlbW9uLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDYgLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYueGdvdl9kYWVtb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ1MwogICAgLy8gb3Blbl9wcm9wb3NhbF9mZWU9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyA3IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NTQKICAgIC8vIGRhZW1vbl9vcHNfZnVuZGluZ19icHM9c2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDExIC8vIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NTUKICAgIC8vIHByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzPXNlbGYucHJvcG9zYWxfY29tbWl0bWVudF9icHMudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMTIgLy8gMHg3MDcyNmY3MDZmNzM2MTZjNWY2MzZmNmQ2ZDY5NzQ2ZDY1NmU3NDVmNjI3MDczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvcG9zYWxfY29tbWl0bWVudF9icHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ1NgogICAgLy8gbWluX3JlcXVlc3RlZF9hbW91bnQ9c2VsZi5taW5fcmVxdWVzdGVkX2Ftb3VudC52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyAxMyAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taW5fcmVxdWVzdGVkX2Ftb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDU5CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDE0IC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjAKICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDE1IC8vIDB4NmQ2MTc4NWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NDVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjEKICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMTYgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ1Ny00NjMKICAgIC8vIG1heF9yZXF1ZXN0ZWRfYW1vdW50PUZpeGVkQXJyYXkoCiAgICAvLyAgICAgKAogICAgLy8gICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bS52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSwKICAgIC8vICAgICApCiAgICAvLyApLAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ2NgogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDE3IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjcKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMTggLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ2OAogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDE5IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjkKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMjAgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ2NC00NzEKICAgIC8vIGRpc2N1c3Npb25fZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ3NAogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMjEgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDIyIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NzYKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDIzIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NzcKICAgIC8vIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyAyNCAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDcyLTQ3OQogICAgLy8gdm90aW5nX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgKAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ4MgogICAgLy8gc2VsZi5xdW9ydW1fc21hbGwudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMjUgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdW9ydW1fc21hbGwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ4MwogICAgLy8gc2VsZi5xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDI2IC8vIDB4NzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdW9ydW1fbWVkaXVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0ODQKICAgIC8vIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDI3IC8vIDB4NzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVvcnVtX2xhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0ODAtNDg2CiAgICAvLyBxdW9ydW09Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYucXVvcnVtX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnF1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgICAgIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDg5CiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbC52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyAyOCAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDkwCiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMjkgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMzAgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ4Ny00OTMKICAgIC8vIHdlaWdodGVkX3F1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICgKICAgIC8vICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0OTYKICAgIC8vIGNvbW1pdHRlZV9pZD1zZWxmLmNvbW1pdHRlZV9pZC52YWx1ZS5jb3B5KCksCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgOCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDk3CiAgICAvLyBjb21taXR0ZWVfbWVtYmVycz1zZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDkgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX21lbWJlcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ5OAogICAgLy8gY29tbWl0dGVlX3ZvdGVzPXNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlLAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDEwIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3NjZmNzQ2NTczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX3ZvdGVzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0OTkKICAgIC8vIGFic2VuY2VfdG9sZXJhbmNlPXNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMzEgLy8gMHg2MTYyNzM2NTZlNjM2NTVmNzQ2ZjZjNjU3MjYxNmU2MzY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWJzZW5jZV90b2xlcmFuY2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUwMAogICAgLy8gZ292ZXJuYW5jZV9wZXJpb2Q9c2VsZi5nb3Zlcm5hbmNlX3BlcmlvZC52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyAzMiAvLyAweDY3NmY3NjY1NzI2ZTYxNmU2MzY1NWY3MDY1NzI2OTZmNjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb3Zlcm5hbmNlX3BlcmlvZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTAxCiAgICAvLyBjb21taXR0ZWVfZ3JhY2VfcGVyaW9kPXNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyAzMyAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjc3MjYxNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTAyCiAgICAvLyBjb21taXR0ZWVfbGFzdF9hbmNob3I9c2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUsCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgMzQgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZjNjE3Mzc0NWY2MTZlNjM2ODZmNzIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0MS01MDMKICAgIC8vIHJldHVybiB0eXAuVHlwZWRHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBwYXVzZWRfcmVnaXN0cnk9c2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsCiAgICAvLyAgICAgcGF1c2VkX3Byb3Bvc2Fscz1zZWxmLnBhdXNlZF9wcm9wb3NhbHMudmFsdWUsCiAgICAvLyAgICAgeGdvdl9tYW5hZ2VyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgeGdvdl9wYXlvcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIHhnb3ZfY291bmNpbD1zZWxmLnhnb3ZfY291bmNpbC52YWx1ZSwKICAgIC8vICAgICB4Z292X3N1YnNjcmliZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICBreWNfcHJvdmlkZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICBjb21taXR0ZWVfbWFuYWdlcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIHhnb3ZfZGFlbW9uPXNlbGYueGdvdl9kYWVtb24udmFsdWUsCiAgICAvLyAgICAgeGdvdl9mZWU9VUludDY0KDApLAogICAgLy8gICAgIHByb3Bvc2VyX2ZlZT1VSW50NjQoMCksCiAgICAvLyAgICAgb3Blbl9wcm9wb3NhbF9mZWU9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSwKICAgIC8vICAgICBkYWVtb25fb3BzX2Z1bmRpbmdfYnBzPXNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZSwKICAgIC8vICAgICBwcm9wb3NhbF9jb21taXRtZW50X2Jwcz1zZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzLnZhbHVlLAogICAgLy8gICAgIG1pbl9yZXF1ZXN0ZWRfYW1vdW50PXNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICAvLyAgICAgbWF4X3JlcXVlc3RlZF9hbW91bnQ9Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgZGlzY3Vzc2lvbl9kdXJhdGlvbj1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgdm90aW5nX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIHF1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLnF1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICB3ZWlnaHRlZF9xdW9ydW09Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgb3V0c3RhbmRpbmdfZnVuZHM9VUludDY0KDApLAogICAgLy8gICAgIHBlbmRpbmdfcHJvcG9zYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21taXR0ZWVfaWQ9c2VsZi5jb21taXR0ZWVfaWQudmFsdWUuY29weSgpLAogICAgLy8gICAgIGNvbW1pdHRlZV9tZW1iZXJzPXNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX3ZvdGVzPXNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlLAogICAgLy8gICAgIGFic2VuY2VfdG9sZXJhbmNlPXNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUsCiAgICAvLyAgICAgZ292ZXJuYW5jZV9wZXJpb2Q9c2VsZi5nb3Zlcm5hbmNlX3BlcmlvZC52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfZ3JhY2VfcGVyaW9kPXNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfbGFzdF9hbmNob3I9c2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUsCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMjYKICAgIHNldGJpdAogICAgaW50Y18wIC8vIDEKICAgIHVuY292ZXIgMjUKICAgIHNldGJpdAogICAgdW5jb3ZlciAyMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMjEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDE5CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTgKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ1MQogICAgLy8geGdvdl9mZWU9VUludDY0KDApLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDQxLTUwMwogICAgLy8gcmV0dXJuIHR5cC5UeXBlZEdsb2JhbFN0YXRlKAogICAgLy8gICAgIHBhdXNlZF9yZWdpc3RyeT1zZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSwKICAgIC8vICAgICBwYXVzZWRfcHJvcG9zYWxzPXNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSwKICAgIC8vICAgICB4Z292X21hbmFnZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICB4Z292X3BheW9yPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgeGdvdl9jb3VuY2lsPXNlbGYueGdvdl9jb3VuY2lsLnZhbHVlLAogICAgLy8gICAgIHhnb3Zfc3Vic2NyaWJlcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIGt5Y19wcm92aWRlcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIGNvbW1pdHRlZV9tYW5hZ2VyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgeGdvdl9kYWVtb249c2VsZi54Z292X2RhZW1vbi52YWx1ZSwKICAgIC8vICAgICB4Z292X2ZlZT1VSW50NjQoMCksCiAgICAvLyAgICAgcHJvcG9zZXJfZmVlPVVJbnQ2NCgwKSwKICAgIC8vICAgICBvcGVuX3Byb3Bvc2FsX2ZlZT1zZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlLAogICAgLy8gICAgIGRhZW1vbl9vcHNfZnVuZGluZ19icHM9c2VsZi5kYWVtb25fb3BzX2Z1bmRpbmdfYnBzLnZhbHVlLAogICAgLy8gICAgIHByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzPXNlbGYucHJvcG9zYWxfY29tbWl0bWVudF9icHMudmFsdWUsCiAgICAvLyAgICAgbWluX3JlcXVlc3RlZF9hbW91bnQ9c2VsZi5taW5fcmVxdWVzdGVkX2Ftb3VudC52YWx1ZSwKICAgIC8vICAgICBtYXhfcmVxdWVzdGVkX2Ftb3VudD1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBkaXNjdXNzaW9uX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICB2b3RpbmdfZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgcXVvcnVtPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgLy8gICAgICAgICAgICAgc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIHdlaWdodGVkX3F1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBvdXRzdGFuZGluZ19mdW5kcz1VSW50NjQoMCksCiAgICAvLyAgICAgcGVuZGluZ19wcm9wb3NhbHM9VUludDY0KDApLAogICAgLy8gICAgIGNvbW1pdHRlZV9pZD1zZWxmLmNvbW1pdHRlZV9pZC52YWx1ZS5jb3B5KCksCiAgICAvLyAgICAgY29tbWl0dGVlX21lbWJlcnM9c2VsZi5jb21taXR0ZWVfbWVtYmVycy52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfdm90ZXM9c2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsCiAgICAvLyAgICAgYWJzZW5jZV90b2xlcmFuY2U9c2VsZi5hYnNlbmNlX3RvbGVyYW5jZS52YWx1ZSwKICAgIC8vICAgICBnb3Zlcm5hbmNlX3BlcmlvZD1zZWxmLmdvdmVybmFuY2VfcGVyaW9kLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9ncmFjZV9wZXJpb2Q9c2VsZi5jb21taXR0ZWVfZ3JhY2VfcGVyaW9kLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV9sYXN0X2FuY2hvcj1zZWxmLmNvbW1pdHRlZV9sYXN0X2FuY2hvci52YWx1ZSwKICAgIC8vICkKICAgIGl0b2IKICAgIHN3YXAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTcKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNgogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE1CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDEyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZ2V0X3hnb3ZfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3hnb3ZfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MDUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgcHVzaGJ5dGVzIGJhc2UzMihDVVBYWTVJQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5nZXRfcHJvcG9zZXJfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Byb3Bvc2VyX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTE3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5nZXRfcmVxdWVzdF9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcmVxdWVzdF9ib3g6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUzMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnl0ZWMgMzkgLy8gYmFzZTMyKENVUFhZNUlBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3JlcXVlc3RfdW5zdWJzY3JpYmVfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ5dGVjIDM5IC8vIGJhc2UzMihDVVBYWTVJQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmlzX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKaXNfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmNyZWF0ZV9lbXB0eV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNyZWF0ZV9lbXB0eV9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTY0CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU3MAogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NzEtNTc0CiAgICAvLyByZXMgPSBhcmM0LmFyYzRfY3JlYXRlKAogICAgLy8gICAgIFByb3Bvc2FsLAogICAgLy8gICAgIHByb3Bvc2VyLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCAyNwogICAgaXR4bl9maWVsZCBHbG9iYWxOdW1VaW50CiAgICBwdXNoaW50IDMKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtQnl0ZVNsaWNlCiAgICBwdXNoaW50IDIKICAgIGl0eG5fZmllbGQgRXh0cmFQcm9ncmFtUGFnZXMKICAgIHB1c2hieXRlcyBiYXNlNjQoQ29FQlF3PT0pCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIHB1c2hieXRlcyBiYXNlNjQoQ2lBRkFBRWdDcEJPSmlrR2MzUmhkSFZ6QUFsbWFXNWhiR2w2WldRSWNISnZjRzl6WlhJUGNtVm5hWE4wY25sZllYQndYMmxrRUdGemMybG5ibVZrWDIxbGJXSmxjbk1OZG05MFpXUmZiV1Z0WW1WeWN3bGhjSEJ5YjNaaGJITUtjbVZxWldOMGFXOXVjd0ZOQkJVZmZIVVJZMjl0YldsMGRHVmxYMjFsYldKbGNuTVFjbVZ4ZFdWemRHVmtYMkZ0YjNWdWRCRmliM2xqYjNSMFpXUmZiV1Z0WW1WeWN3VnVkV3hzY3c5amIyMXRhWFIwWldWZmRtOTBaWE1RWm5WdVpHbHVaMTlqWVhSbFoyOXllUTVoYzNOcFoyNWxaRjkyYjNSbGN3RldBUUFOYkc5amEyVmtYMkZ0YjNWdWRCQnhkVzl5ZFcxZmRHaHlaWE5vYjJ4a0dYZGxhV2RvZEdWa1gzRjFiM0oxYlY5MGFISmxjMmh2YkdRbVJWSlNPbGR5YjI1bklGQnliM0J2YzJGc0lGTjBZWFIxY3lCdmNpQm1hVzVoYkdsNlpXUU1ZMjl0YldsMGRHVmxYMmxrRVc5d1pXNWZjSEp2Y0c5ellXeGZabVZsSEdSaFpXMXZibDl2Y0dWeVlYUnBiMjVmWm5WdVpHbHVaMTlpY0hNT2IzQmxibDkwYVcxbGMzUmhiWEFXZG05MFpWOXZjR1Z1YVc1blgzUnBiV1Z6ZEdGdGNBeG1kVzVrYVc1blgzUjVjR1VQZG05MGFXNW5YMlIxY21GMGFXOXVEM0JoZFhObFpGOXlaV2RwYzNSeWVSUnpkV0p0YVhOemFXOXVYM1JwYldWemRHRnRjQkZ0WlhSaFpHRjBZVjkxY0d4dllXUmxaQVYwYVhSc1pRVm1iMk4xY3hOa2FYTmpkWE56YVc5dVgyUjFjbUYwYVc5dUZHMXBibDl5WlhGMVpYTjBaV1JmWVcxdmRXNTBHbTFoZUY5eVpYRjFaWE4wWldSZllXMXZkVzUwWDJ4aGNtZGxDM2huYjNaZlpHRmxiVzl1RTBWU1VqcFdiM1JsY2lCdWIzUWdabTkxYm1ReEdFQUFpakUxZ1FNU1JERTBnUnNTUkRFM0ZFUXhOaFJFS3pJRFp5Y0VJbWNuR0Nsbkp3c2laeWNQSW1jbkdTSm5KeG9pWnljYkltY25JQ0puSnh3aVp5Z2laeW9pWnljaEltY25JaWxuSnhBaVp5Y2pJbWNuSFNKbkp3d2laeWNVSW1jbkpDSm5KeDRpWnljVkltY25GaUpuSndVaVp5Y1JJbWNuQmlKbkp3MGlaeWNISW1jbkNDSm5KdzRpWjRBRUpEZU5QRFlhQUk0QkFKRXhHUlJFTVJoQkFIcUNFQVR0cnJuS0JIRkRtVThFYzNFeUdnUTA1aFBLQkEyYXNOY0VHRUdnMGdSelRiN01CSGIvVEhBRUlTMmZCd1NLWGt5QUJDckJtd1VFZ0NCcHRBUzJTZWgwQkNSaFg1QUVOcHhDdWdUYjJEM1pOaG9BamhBQVh3T09BK1FFS3dSd0JYQUhVd2ZEQ0Y0SXlBai9DWWNLYUF0QkMyNEFBUUFqUTRBRXpHbE9xallhQUk0QkFBMEFNUm1CQlJJeEdCQkVRZ29zTmhvQlNSVWtFa1F5RFVRclRHY25CRElOWnljWWlBdmtKeGhNWnljTGlBdk9Kd3RNWnljUGlBdkZKdzlNWnljWmlBdThKeGxNWnljYWlBdXpKeHBNWnlOREtVY0NNUllqQ1VrNEVDTVNSRFlhQVVraVdZRUNDRXNCRlJKRVZ3SUFOaG9DU1JXQkNCSkVGellhQTBrVmdRZ1NSQmMyR2dSSkZTTVNSQ2NmaUF0dUZFU0lDOUJFSWlobFJFQUMzeUlxWlVSQUF0Z2pSRXNEU1JXQmV3NUVLUk5FU3dJbEVrQUFDRXNDZ1JRU1FRSzRJMFFuSllnTE55Y21pQXN5U3dOSlRnSlBBdzlFU3dFUFJJQVhjSEp2Y0c5ellXeGZZMjl0YldsMGJXVnVkRjlpY0hPSUN3bExBUXNoQkFwTEJrazRBQ0lyWlVRU1JFazRCeklLRWtRNENFbEZDUkpFSnlKTEJXZUFHbTFoZUY5eVpYRjFaWE4wWldSZllXMXZkVzUwWDNOdFlXeHNpQXJHZ0J0dFlYaGZjbVZ4ZFdWemRHVmtYMkZ0YjNWdWRGOXRaV1JwZFcySUNxWkZDUTVCQWdnbEp4Qk1aeWNkU3dObkp3eExBbWRKRnljalRHY25GRXNHWnlJbkVHVk1TVTRDUlFwRVNVUWlKd3hsUkVRbEVrRUJpNEFaWkdselkzVnpjMmx2Ymw5a2RYSmhkR2x2Ymw5emJXRnNiSWdLVUNja1RHY2lKeEJsVEVsT0FrVUtSQ1VTUVFFU2dCVjJiM1JwYm1kZlpIVnlZWFJwYjI1ZmMyMWhiR3lJQ2lKRkJpY2VTd1puZ0F4eGRXOXlkVzFmYzIxaGJHeUlDZ3FBREhGMWIzSjFiVjlzWVhKblpZZ0orVXNCQ1NjbGlBbnhKeWFJQ2V4TEFRa2lKd3hsUkU4Q0NVOENDMHdLQ0NJbkMyVkVDeUVFQ2ljVlRHZUFGWGRsYVdkb2RHVmtYM0YxYjNKMWJWOXpiV0ZzYklnSnRJQVZkMlZwWjJoMFpXUmZjWFZ2Y25WdFgyeGhjbWRsaUFtYVN3RUpKeVdJQ1pJbkpvZ0pqVXNCQ1NJbkRHVkVUd0lKVHdJTFRBb0lJaWNQWlVRTElRUUtKeFpNWnlnbFp5Y2JNZ2RuSWljZFpVUVdTWk9CQ0E1RVZ3Y0JJaWNNWlVRaUp4QmxSQlpKazRFSURrUlhCd0V5Qms4Q0ZrOERURkJQQWxCTUZsQ0FCRXNWalpoTVVMQWpRMHNIZ1JRU1FRQWdnQloyYjNScGJtZGZaSFZ5WVhScGIyNWZiV1ZrYVhWdGlBa0hSUVpDL3VLQUZYWnZkR2x1WjE5a2RYSmhkR2x2Ymw5c1lYSm5aWWdJNkVVR1F2N0RTd2VCRkJKQkFDS0FHbVJwYzJOMWMzTnBiMjVmWkhWeVlYUnBiMjVmYldWa2FYVnRpQWk4UXY1cGdCbGthWE5qZFhOemFXOXVYMlIxY21GMGFXOXVYMnhoY21kbGlBaWJRdjVJU3dGTEJ3NUJBQVdCRkVMOTdJRWVRdjNuSWtMOVJTSkMvU1UyR2dGSklsbUJBZ2hMQVJVU1JGY0NBRWsyR2dKSkZTTVNSQ0pUSngrSUNGMFVSSWdJcEV3VlNVNERSQ2NoSTJkQkFBNG5DYnhJSndtOFNDY0pUTDhqUXljSnZVUkpTd01JSndsTTB5Y0pURThDdTBMLzZTS0lDS0ZFSWlobFJDVVRRQUFISWlwbFJFRUFMQ2NYUlFGSktSTkJBQkJKU1JVV1Z3WUNURkFuQ2t4UXNDTkRJaXRsUklnSWpDY0p2RWdxSTJjcFF2L2ZLVVVCUXYvU0p4K0lCOXdVUklnSUl6SUhJaWNiWlVRSklpY2taVVFQUkNJbklXVkVSQ2NuaUFmS1NSVWtFa1FpSnhsbFJDSW5HbVZFQ3lFRUNvZ0lMU2lCRkdjbklESUhaeU5ES1VrMkdnRkhBaUpaU1U0Q2dTZ0xnUUlJVEJVU1JJZ0g4a1FpS0dWRWdSUVNSREVXUUFEU01nUkZBeU5GQkVzRFN3TU1RUUFOU3dOSmlBZ05Jd2hGQkVMLzZ5SkZCRXNEU3dFTVFRQkZTd0ZYQWdCTEJFbE9Bb0VvQzRFb1dFbFhBQ0JNSkZzbkVrOENVRW05UlFFVVJFc0JSRXNCRnI4aUp3VmxSQ01JSndWTVp5SW5FV1ZFQ0NjUlRHY2pDRVVFUXYreklpY0ZaVVFpSnd0bFJCSkJBRllpSnhGbFJDSW5EMlZFRWtRb2dSbG5NZ2NuSEVzQlp5SW5IbVZFU3dFSUlpY1ZaVVFXU1pNa0RrUlhCQVFpSnhabFJCWkpreVFPUkZjRUJESUdUd1FXVHdRV1VFOERVRThDVUV3V1VJQUUzT3ZoeFV4UXNDTkRJb2dIVEVML1F5SkpLVFlhQVVrVkpCSkVOaG9DU1JXQkNCSkVGellhQTBrVmdRZ1NSQmVJQnZkRUlpaGxSSUVaRTBFQmlpY1hSUVpMQlNrVFFRQVJTd1ZKRlJaWEJnSk1VQ2NLVEZDd0kwTW5Fa3NEVUVsRkJyMUZBVUFCSlNjb1JRWkxCU2tTUVFFVlN3UytSQmRKUlFVaUp3WmxSQ01JSndaTVowc0NTd0tJQmtsQkFNTWlKdzFsUkNNSUp3MU1aeUlqU3dSTEJvZ0hDRXNHU1JValN3RVBJMHNDVHdKTlRGSkpGU1FTUkVzRUZrbVRKQTVFVndRRVN3UVdTWk1rRGtSWEJBUlBCQlpKa3lRT1JGY0VCQ0luQm1WRUZrbVRKQTVFVndRRUlpY05aVVFXU1pNa0RrUlhCQVFpSndkbFJCWkpreVFPUkZjRUJDSW5DR1ZFRmttVEpBNUVWd1FFSWljT1pVUVdTWk1rRGtSWEJBUXlCazhKVHdsUVR3aFFUd2RRSnhNaVR3bFVVRThHVUU4RlVFOEVVRThEVUU4Q1VFd1dVSUFFcVJDS0dreFFzQ2xDL3ZnaVN3UkxBMGxPQWdsTEEwbE9Bd2xKVGdOT0JDSW5CMlZFQ0NjSFRHY2lKd2hsUkFnbkNFeG5JaWNPWlVRSUp3NU1aMEwvRlVzRlF2NitTd1MrUkJkSlJRVkxBa3NDQ0F4QkFDUkxBMHNDU3dLSUJTOUFBQmlBRVVWU1VqcFdiM1JsY3lCcGJuWmhiR2xrUlFaQy9xb3BSUVpDL3FTSUJQeEFBQ0NBR1VWU1VqcFdiM1JwYm1jZ1VHVnlhVzlrSUVWNGNHbHlaV1JGQmtMK1ZDbEZCa0wrVGlrbkg0Z0VzeFJFSWlobFJJRVpFa1NJQk1CQkFBYUlCT0JCQUZBalJJZ0ZXMEVBUW9nRmFrRUFQSWdGZjBFQU5pTkZBVWxCQUNFb2dSNW5pQVM3TWdZbkV5SkxCRlFqVHdOVVRCWlFnQVNMZUpVVVRGQ3dJME1vZ1NobklpdGxSSWdFOEVMLzFTSkZBVUwveHlKQy82MGlSd0lwTmhvQlJ3SWlXVWxPQWlRTGdRSUlUQlVTUklnRXJFUWlLR1ZFZ1I0U1FBQUtJaWhsUklFb0VrRUFCeUlxWlVSQkFGOG5GMFVGU3dRcEUwRUFFVXNFU1JVV1Z3WUNURkFuQ2t4UXNDTkRJa1VEU3dKTEFReEJBRFJMQVZjQ0FFc0RKQXNrV0VsRkJ5Y1NURkJKUlFXOVJRRkFBQVVuS0VML3hrc0R2a1FYU3daTWlBVEFTd0lqQ0VVRFF2L0VLVUwvcmlsRkJVTC9uellhQVVrVkl4SkVJbE5KTVFDQURIaG5iM1pmWTI5MWJtTnBiSWdEblVrVkpCSkVFa1FpS0dWRWdSNFNSQ0luQldWRUZFUkJBQ1VvZ1R4bklpY0VaVVJ5Q0VTSUJBSXlCaWNUSWtzRFZFd1dVSUFFcnVnWEdVeFFzQ05ES0lFdFp5SXJaVVNJQStGQy85d2lpQU85UkNJb1pVU0JMUk5CQUNJbkYwVUJTU2tUUVFBUVNVa1ZGbGNHQWt4UUp3cE1VTEFqUXlpQk1tY3BRdi9wS1VVQlF2L2NJa2twUndJMkdnRkhBaUpaU1U0Q0pBdUJBZ2hNRlJKRWlBTmhSQ0lvWlVTQkZCSkVNUlpBQUZneUJFVURJMFVGU3dSTEF3eEJBQTFMQkVtSUEzd2pDRVVGUXYvcklrVUVTd05MQVF4QkFDOUxBVmNDQUVzRUpBc2tXRWxGQnljU1RGQkpSUWk5UlFGQkFBdExCcjVFRjBzR1RJZ0Rsa3NESXdoRkJFTC95U05ESW9nRE5VTC92U0tJQXY1RUlpcGxSRUFBTGlJb1pVUkJBS2tpS0dWRUpSTkJBS0FpS0dWRWdUSVRRUUNXSWlobFJJRThFMEVBakNJb1pVU0JLQk5CQUlJbkYwVUJTU2tUUVFBUVNVa1ZGbGNHQWt4UUp3cE1VTEFqUXlJbkJXVkVRUUF6Z0M1RlVsSTZWR2hsY21VZ1lYSmxJSFp2ZEdWeWN5QmhjM05wWjI1bFpDQjBieUIwYUdseklIQnliM0J2YzJGc1F2KzJJaWhsUkNVU1FRQUhJaXRsUklnQ2dDSW5CR1ZFY2doRU1ncHpBRVF5Q25NQlJBbUlBbFlxSTJjcFF2K0pLVVVCUXY5OGlBSXZSQ0lxWlVSRUp3bThTQ0luQkdWRWNnaEVNZ3B6QUVTSUFpd2pReUlyWlVRaUp3UmxSQ0luSW1WRUlpY2JaVVFpSnlCbFJDSW5IR1ZFSWlobFJDSXFaVVFpSnhCbFJDSW5JMlZFRmttVGdRZ09SRmNIQVNJbkhXVkVJaWNNWlVRaUp4UmxSQ0luR0dWRUlpY0xaVVFpSnc5bFJDSW5CbVZFSWljTlpVUWlKd2RsUkNJbkNHVkVJaWNPWlVSUEV4WlBGRXhRU3hNVkZsY0dBazhVVUV5QUFnREVVRThURmxCUEVoWlFUeEVXVUU4UUZsQW5FeUpQRVZSUVR3NFdVRThOVUU4TUZsQlBDeFpRVHdvV1VFOEpVRThJRmxCUEJ4WlFUd1lXVUU4RkZsQlBCQlpRVHdNV1VFOENGbEJNVUNjS1RGQ3dJME0yR2dGSkZTUVNSQ2NTVEZCSnZVbFBBa2hCQUJSTEFiNUVGeFluRXlKTEExUlFKd3BNVUxBalF5SkMvKzBpSnhWbFJCWkpreVFPUkZjRUJDSW5GbVZFRmttVEpBNUVWd1FFSWljR1pVUVdTWk1rRGtSWEJBUWlKdzFsUkJaSmt5UU9SRmNFQkNJbkIyVkVGa21USkE1RVZ3UUVJaWNJWlVRV1NaTWtEa1JYQkFRaUp3NWxSQlpKa3lRT1JGY0VCSWdBL0lnQkRvZ0JKb2dBY0U4S1R3cFFUd2xRVHdoUVR3ZFFUd1pRVHdWUUp4TWlUd1pVSTA4RlZJRUNUd1JVZ1FOUEExUlFKd3BNVUxBalE0b0JBU0luQkdWRWkvOWxSSW1LQVFFaUp3UmxSSXYvWlVTSk1nY2lKeHhsUkFraUp4NWxSQTZKaWdNQmkvNkwvUkpCQUFxTC80djlFa0VBQWlPSklva2lKd1psUkNJbkMyVkVFb21JQUJoRUlpaGxSQ1VTUVFBS0lpcGxSRUFBQXlORWlTSkMvL294QUNJclpVUVNpVEVBSnc9PSkKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIHB1c2hieXRlcyBiYXNlNjQoSjRqL2wwa1ZKQkpFRW9reURTSW5CR1ZFRW9tS0FnQ3hpLyt5Q0l2K3NnY2pzaEFpc2dHemlZb0JBQ0luRkdWRWkvOU1pUC9lSnhRaVo0bUtBUUNML3pnWU1nZ1NSSXYvT1JvQU5ob0FFa1NKSWljVlpVUWlKd1psUkNJbkRXVkVDVXNCRHhDSklpY1daVVFpSndkbFJDSW5DR1ZFQ0NJbkRtVkVDRXNCRHhDSklpY0haVVFpSndobFJBMkppZ0lBSnhLTC9sQkp2VVVCUkl2L1JDSW5CV1ZFSXdrbkJVeG5JaWNSWlVTTC93a25FVXhudkVpSikKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTcyCiAgICAvLyBQcm9wb3NhbCwKICAgIHB1c2hieXRlcyAweGNjNjk0ZWFhIC8vIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3Mpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NzEtNTc0CiAgICAvLyByZXMgPSBhcmM0LmFyYzRfY3JlYXRlKAogICAgLy8gICAgIFByb3Bvc2FsLAogICAgLy8gICAgIHByb3Bvc2VyLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTc1CiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTc3LTU4MQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlcy5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1zZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlIC0gKG1icl9hZnRlciAtIG1icl9iZWZvcmUpLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NzgKICAgIC8vIHJlY2VpdmVyPXJlcy5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgZGlnIDEKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTc5CiAgICAvLyBhbW91bnQ9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSAtIChtYnJfYWZ0ZXIgLSBtYnJfYmVmb3JlKSwKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyA3IC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZW5fcHJvcG9zYWxfZmVlIGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDQKICAgIC0KICAgIC0KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU3NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18wIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1ODAKICAgIC8vIGZlZT0wLAogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU3Ny01ODEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1yZXMuY3JlYXRlZF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSAtIChtYnJfYWZ0ZXIgLSBtYnJfYmVmb3JlKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU2NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [2052, 2472], "errorMessage": "Missing Config"}, {"pc": [2471], "errorMessage": "There are voters assigned to this proposal"}, {"pc": [2056, 2311], "errorMessage": "Unauthorized"}, {"pc": [2049, 2188, 2196, 2309, 2470, 2581], "errorMessage": "Unknown error"}, {"pc": [2054], "errorMessage": "Voter already voted"}, {"pc": [2055, 2189], "errorMessage": "Voter not found"}, {"pc": [2053], "errorMessage": "Votes invalid"}, {"pc": [2050], "errorMessage": "Voting Period Expired"}, {"pc": [2051, 2190, 2310, 2473, 2582], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [3101, 7437], "errorMessage": "account funded"}, {"pc": [7443], "errorMessage": "application exists"}, {"pc": [1913, 2125, 2246, 2361, 2523], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [2832], "errorMessage": "check self.absence_tolerance exists"}, {"pc": [2842], "errorMessage": "check self.committee_grace_period exists"}, {"pc": [2817], "errorMessage": "check self.committee_id exists"}, {"pc": [2847], "errorMessage": "check self.committee_last_anchor exists"}, {"pc": [2822], "errorMessage": "check self.committee_members exists"}, {"pc": [2827], "errorMessage": "check self.committee_votes exists"}, {"pc": [2659], "errorMessage": "check self.daemon_ops_funding_bps exists"}, {"pc": [2709], "errorMessage": "check self.discussion_duration_large exists"}, {"pc": [2704], "errorMessage": "check self.discussion_duration_medium exists"}, {"pc": [2699], "errorMessage": "check self.discussion_duration_small exists"}, {"pc": [2714], "errorMessage": "check self.discussion_duration_xlarge exists"}, {"pc": [2837], "errorMessage": "check self.governance_period exists"}, {"pc": [2684], "errorMessage": "check self.max_requested_amount_large exists"}, {"pc": [2679], "errorMessage": "check self.max_requested_amount_medium exists"}, {"pc": [2674], "errorMessage": "check self.max_requested_amount_small exists"}, {"pc": [2669], "errorMessage": "check self.min_requested_amount exists"}, {"pc": [2654, 7448], "errorMessage": "check self.open_proposal_fee exists"}, {"pc": [2632], "errorMessage": "check self.paused_proposals exists"}, {"pc": [2627], "errorMessage": "check self.paused_registry exists"}, {"pc": [2664], "errorMessage": "check self.proposal_commitment_bps exists"}, {"pc": [2777], "errorMessage": "check self.quorum_large exists"}, {"pc": [2772], "errorMessage": "check self.quorum_medium exists"}, {"pc": [2767], "errorMessage": "check self.quorum_small exists"}, {"pc": [2743], "errorMessage": "check self.voting_duration_large exists"}, {"pc": [2738], "errorMessage": "check self.voting_duration_medium exists"}, {"pc": [2733], "errorMessage": "check self.voting_duration_small exists"}, {"pc": [2748], "errorMessage": "check self.voting_duration_xlarge exists"}, {"pc": [2802], "errorMessage": "check self.weighted_quorum_large exists"}, {"pc": [2797], "errorMessage": "check self.weighted_quorum_medium exists"}, {"pc": [2792], "errorMessage": "check self.weighted_quorum_small exists"}, {"pc": [2640], "errorMessage": "check self.xgov_council exists"}, {"pc": [2649], "errorMessage": "check self.xgov_daemon exists"}, {"pc": [1514, 1920, 2083, 2132, 2253, 2368, 2530], "errorMessage": "invalid array length header"}, {"pc": [1775], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [2093], "errorMessage": "invalid number of bytes for arc4.dynamic_array<account>"}, {"pc": [1521], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [1530, 1539, 1549, 1562, 1571, 1580, 1590, 1614, 1632, 1659, 1666, 1691, 1698, 1741, 1748, 1768, 1792, 1857, 2963, 3036, 3096], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [1499, 1508, 1641, 1650, 1673, 1705, 1723, 1732, 1782, 1800, 1809, 1848, 1865, 1873, 2076, 2216, 2331, 2493, 2612, 2621, 3062, 3074, 3086], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1605], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.XGovRegistryConfig"}, {"pc": [1927, 2139, 2260, 2375, 2537], "errorMessage": "invalid number of bytes for string"}, {"pc": [1623, 1682, 1714, 1759, 1835, 2603], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "size"}], "name": "init_proposal_contract", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "offset"}, {"type": "byte[]", "name": "data"}], "name": "load_proposal_contract", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "delete_proposal_contract_box", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pause_proposals", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "resume_proposals", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "manager"}], "name": "set_xgov_manager", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "payor"}], "name": "set_payor", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "council"}], "name": "set_xgov_council", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "subscriber"}], "name": "set_xgov_subscriber", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "provider"}], "name": "set_kyc_provider", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "manager"}], "name": "set_committee_manager", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_daemon"}], "name": "set_xgov_daemon", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,uint64)", "name": "config", "struct": "XGovRegistryConfig"}], "name": "config_xgov_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["UpdateApplication"], "create": []}, "args": [], "name": "update_xgov_registry", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "voting_address"}, {"type": "pay", "name": "payment"}], "name": "subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}], "name": "unsubscribe_absentee", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "approve_subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "reject_subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "owner_address"}, {"type": "uint64", "name": "relation_type"}, {"type": "pay", "name": "payment"}], "name": "request_subscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "owner_address"}, {"type": "uint64", "name": "relation_type"}, {"type": "pay", "name": "payment"}], "name": "request_unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "approve_unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "reject_unsubscribe_xgov", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "address", "name": "voting_address"}], "name": "set_voting_account", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "subscribe_proposer", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "proposer"}, {"type": "bool", "name": "kyc_status"}, {"type": "uint64", "name": "kyc_expiring"}], "name": "set_proposer_kyc", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint64", "name": "size"}, {"type": "uint64", "name": "votes"}], "name": "declare_committee", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "name": "committee_id"}, {"type": "uint64", "name": "size"}, {"type": "uint64", "name": "votes"}, {"type": "byte[32]", "name": "committee_root"}], "name": "declare_committee_with_root", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "open_proposal", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "approval_votes"}, {"type": "uint64", "name": "rejection_votes"}], "name": "vote_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}, {"type": "(uint64,uint64,uint64)[]", "name": "votes"}], "name": "vote_proposals", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "(address,uint64,uint64)[]", "name": "votes"}], "name": "vote_proposal_batch", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voting_power"}, {"type": "uint64", "name": "ordinal"}, {"type": "byte[32][]", "name": "proof"}, {"type": "uint64", "name": "approval_votes"}, {"type": "uint64", "name": "rejection_votes"}], "name": "vote_proposal_with_proof", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address[]", "name": "absentees"}], "name": "unassign_absentee_from_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "xgov_address"}, {"type": "uint64", "name": "voting_power"}, {"type": "uint64", "name": "ordinal"}, {"type": "byte[32][]", "name": "proof"}], "name": "unassign_absentee_from_proposal_with_proof", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "pay_grant_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "finalize_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "drop_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "deposit_funds", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw_funds", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw_available_funds", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_available_funds", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state", "returns": {"type": "(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)", "struct": "TypedGlobalState"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_state_version", "returns": {"type": "uint64"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "xgov_address"}], "name": "get_xgov_box", "returns": {"type": "((address,uint64,uint64,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "xgov_addresses"}], "name": "get_xgov_boxes", "returns": {"type": "((address,uint64,uint64,uint64),bool)[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "proposer_address"}], "name": "get_proposer_box", "returns": {"type": "((bool,bool,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "proposer_addresses"}], "name": "get_proposer_boxes", "returns": {"type": "((bool,bool,uint64),bool)[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "get_request_box", "returns": {"type": "((address,address,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "request_ids"}], "name": "get_request_boxes", "returns": {"type": "((address,address,uint64),bool)[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "request_id"}], "name": "get_request_unsubscribe_box", "returns": {"type": "((address,address,uint64),bool)"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "request_ids"}], "name": "get_request_unsubscribe_boxes", "returns": {"type": "((address,address,uint64),bool)[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "proposal_ids"}], "name": "get_proposals_summary", "returns": {"type": "(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "is_proposal", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "proposer"}], "name": "create_empty_proposal", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "op_up", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}], "name": "XgovRegistryMock", "state": {"keys": {"box": {"proposal_approval_program": {"key": "cGE=", "keyType": "AVMBytes", "valueType": "AVMBytes"}}, "global": {"xgov_council": {"key": "eGdvdl9jb3VuY2ls", "keyType": "AVMBytes", "valueType": "address"}, "xgov_daemon": {"key": "eGdvdl9kYWVtb24=", "keyType": "AVMBytes", "valueType": "address"}, "paused_registry": {"key": "cGF1c2VkX3JlZ2lzdHJ5", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "paused_proposals": {"key": "cGF1c2VkX3Byb3Bvc2Fscw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "open_proposal_fee": {"key": "b3Blbl9wcm9wb3NhbF9mZWU=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "daemon_ops_funding_bps": {"key": "ZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcw==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "proposal_commitment_bps": {"key": "cHJvcG9zYWxfY29tbWl0bWVudF9icHM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "min_requested_amount": {"key": "bWluX3JlcXVlc3RlZF9hbW91bnQ=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_small": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGw=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_medium": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVt", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "max_requested_amount_large": {"key": "bWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_small": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_medium": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9tZWRpdW0=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_large": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "discussion_duration_xlarge": {"key": "ZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_small": {"key": "dm90aW5nX2R1cmF0aW9uX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_medium": {"key": "dm90aW5nX2R1cmF0aW9uX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_large": {"key": "dm90aW5nX2R1cmF0aW9uX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "voting_duration_xlarge": {"key": "dm90aW5nX2R1cmF0aW9uX3hsYXJnZQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_id": {"key": "Y29tbWl0dGVlX2lk", "keyType": "AVMBytes", "valueType": "byte[32]"}, "committee_members": {"key": "Y29tbWl0dGVlX21lbWJlcnM=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_votes": {"key": "Y29tbWl0dGVlX3ZvdGVz", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_root": {"key": "Y29tbWl0dGVlX3Jvb3Q=", "keyType": "AVMBytes", "valueType": "AVMBytes"}, "quorum_small": {"key": "cXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_medium": {"key": "cXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "quorum_large": {"key": "cXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_small": {"key": "d2VpZ2h0ZWRfcXVvcnVtX3NtYWxs", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_medium": {"key": "d2VpZ2h0ZWRfcXVvcnVtX21lZGl1bQ==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "weighted_quorum_large": {"key": "d2VpZ2h0ZWRfcXVvcnVtX2xhcmdl", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "absence_tolerance": {"key": "YWJzZW5jZV90b2xlcmFuY2U=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "governance_period": {"key": "Z292ZXJuYW5jZV9wZXJpb2Q=", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_grace_period": {"key": "Y29tbWl0dGVlX2dyYWNlX3BlcmlvZA==", "keyType": "AVMBytes", "valueType": "AVMUint64"}, "committee_last_anchor": {"key": "Y29tbWl0dGVlX2xhc3RfYW5jaG9y", "keyType": "AVMBytes", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 4, "ints": 29}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"TypedGlobalState": [{"name": "paused_registry", "type": "bool"}, {"name": "paused_proposals", "type": "bool"}, {"name": "xgov_manager", "type": "address"}, {"name": "xgov_payor", "type": "address"}, {"name": "xgov_council", "type": "address"}, {"name": "xgov_subscriber", "type": "address"}, {"name": "kyc_provider", "type": "address"}, {"name": "committee_manager", "type": "address"}, {"name": "xgov_daemon", "type": "address"}, {"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "outstanding_funds", "type": "uint64"}, {"name": "pending_proposals", "type": "uint64"}, {"name": "committee_id", "type": "byte[32]"}, {"name": "committee_members", "type": "uint64"}, {"name": "committee_votes", "type": "uint64"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}, {"name": "committee_last_anchor", "type": "uint64"}], "XGovRegistryConfig": [{"name": "xgov_fee", "type": "uint64"}, {"name": "proposer_fee", "type": "uint64"}, {"name": "open_proposal_fee", "type": "uint64"}, {"name": "daemon_ops_funding_bps", "type": "uint64"}, {"name": "proposal_commitment_bps", "type": "uint64"}, {"name": "min_requested_amount", "type": "uint64"}, {"name": "max_requested_amount", "type": "uint64[3]"}, {"name": "discussion_duration", "type": "uint64[4]"}, {"name": "voting_duration", "type": "uint64[4]"}, {"name": "quorum", "type": "uint64[3]"}, {"name": "weighted_quorum", "type": "uint64[3]"}, {"name": "absence_tolerance", "type": "uint64"}, {"name": "governance_period", "type": "uint64"}, {"name": "committee_grace_period", "type": "uint64"}]}, "byteCode": {"approval": "CiAIAAEIIIAQgN9ugNSTAYD1JCYuBBUffHUCcGEiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZARFUlI6BhUffHUAAA9wYXVzZWRfcmVnaXN0cnkQcGF1c2VkX3Byb3Bvc2Fscwxjb21taXR0ZWVfaWQRY29tbWl0dGVlX21lbWJlcnMPY29tbWl0dGVlX3ZvdGVzD1ZvdGVyIG5vdCBmb3VuZAx4Z292X2NvdW5jaWwLeGdvdl9kYWVtb24Rb3Blbl9wcm9wb3NhbF9mZWUOY29tbWl0dGVlX3Jvb3QMFR98dQAAAAAAAAAAE1ZvdGVyIGFscmVhZHkgdm90ZWQNVm90ZXMgaW52YWxpZBVWb3RpbmcgUGVyaW9kIEV4cGlyZWQcZGFlbW9uX29wZXJhdGlvbl9mdW5kaW5nX2Jwcxdwcm9wb3NhbF9jb21taXRtZW50X2JwcxRtaW5fcmVxdWVzdGVkX2Ftb3VudBptYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbBttYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0abWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UZZGlzY3Vzc2lvbl9kdXJhdGlvbl9zbWFsbBpkaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bRlkaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlGmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlFXZvdGluZ19kdXJhdGlvbl9zbWFsbBZ2b3RpbmdfZHVyYXRpb25fbWVkaXVtFXZvdGluZ19kdXJhdGlvbl9sYXJnZRZ2b3RpbmdfZHVyYXRpb25feGxhcmdlDHF1b3J1bV9zbWFsbA1xdW9ydW1fbWVkaXVtDHF1b3J1bV9sYXJnZRV3ZWlnaHRlZF9xdW9ydW1fc21hbGwWd2VpZ2h0ZWRfcXVvcnVtX21lZGl1bRV3ZWlnaHRlZF9xdW9ydW1fbGFyZ2URYWJzZW5jZV90b2xlcmFuY2URZ292ZXJuYW5jZV9wZXJpb2QWY29tbWl0dGVlX2dyYWNlX3BlcmlvZBVjb21taXR0ZWVfbGFzdF9hbmNob3IMVW5hdXRob3JpemVkDk1pc3NpbmcgQ29uZmlnTRUffHUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMRhAAN4nCzIDZycMMgNnJwUiZycGImcnDYGAwtcvZycTgfQDZycUgawCZycVgYDyi6gJZycWgYD09pBdZycXgYDQ28P0AmcnGIGAoLeH6QVnJxkhBWcnGiEFZycbIQVnJxwhBmcnHSEHZyceIQdnJx+BgOpJZycgIQZnJweAIDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwZycIImcnCSJnJw6AAGcnIYG4F2cnIiJnJyOB2DZnJySBiCdnJyUiZycmgdg2ZycngQVnJyiBwIQ9ZycpgZBOZycqImeABElWwas2GgCOAQHbMRkURDEYQQHCgjkElZxHYgRsH1ZNBOEKUS4Ehvfg5gQ54m2KBJg1LoYE+k7W4gTWycwaBFxIQFUEN9at8QTUIWtuBLqFIPIEFnezDgSEt9JoBK9/GGAEoILO+ATfOf25BMoPajoEPDG8AgQNLHiRBEUHc5AEk/rNugTOizocBPrqCB8EDaJ4hQR6T+5DBFLdENcE1NN6ZASpu3K5BDQ0ncwEFY+N1gRbBTkPBGh8s1YEKQ8yogRf4lk1BHYWoq4E2ye5rwT1kQdWBGVhCp8E/caVwgS6kKtUBBpnS0UEqNWulARq5etGBClXATsEJ2MNZQTR1/KqBIJPmLwEbnNc/wRJVIugBCms2hMEgmeE9gS2j8uVBNSVq88EJpgyAATDhrA/BNvYPdk2GgCOOQBFAGEAJwAhABsAFQAPAIEAigCTAKEAqgCzALwAygDVAA0A5wDwAPkBAgEiAUIBSwFUAWQBbwGGAbUB7AH6AiICdgMMA90EKwSdBRAFsgYfBioGMwAIBjwAAweKB9MH5wgBCBUIIQg1CEEIVQhpCHIAAQAjQycPsCNDJw+wI0MjQycGImcjQycFImcjQycGI2cjQycFI2cjQym8SCNDgARMXGG6NhoAjgEAAQAjQzEZgQQSMRgQQzYaAUkVJBJEFym9RQFBAAUpTNMjQylMuUhC//c2GgFJFSQSRBc2GgJJIlmBAghLARUSRFcCAClOArsjQzYaARUlEkQjQzYaARUlEkQjQzYaAUkVJRJEJwtMZyNDNhoBFSUSRCNDNhoBFSUSRCNDNhoBFSUSRCNDNhoBSRUlEkQnDExnI0M2GgEVgdABEkQjQzYaARUlEkQxFiMJOBAjEkQjQzYaARUlEkQjQzYaARUkEkQjQzYaARUkEkQjQzYaARUlEkQ2GgIVJRJENhoDFSQSRDEWIwk4ECMSRCNDNhoBFSUSRDYaAhUlEkQ2GgMVJBJEMRYjCTgQIxJEI0M2GgEVJBJEI0M2GgEVJBJEI0M2GgEVJRJENhoCFSUSRCNDMRYjCTgQIxJEI0M2GgEVJRJENhoCFSMSRDYaAxUkEkQjQzYaAUkVJRJENhoCSRUkEkQXNhoDSRUkEkQXJwdPA2cnCE8CZycJTGcnDoAAZyNDNhoBSRUlEkQ2GgJJFSQSRBc2GgNJFSQSRBc2GgRJFSUSRCcHTwRnJwhPA2cnCU8CZycOTGcjQzEWIwk4ECMSRCcPsCNDNhoBSRUkEkQXNhoCSRUlEkQ2GgNJFSQSRBc2GgRJFSQSRBeIBs8jQzYaAUkVJRJENhoCRwIiWUlOAoEYC4ECCEwVEkQiSUsCDEEALksCVwIASwFJTgKBGAuBGFhJIltLASRbTwKBEFtPAksHTwNPA4gGgiMIRQFC/8sjQzYaAUkVJBJEFzYaAkkiWYEwC4ECCEsBFRJEsUyyGIAEeTVTabIashqBBrIQIrIBs7Q+RwJXAAQoEkRJVwQASSJZgQIITBUSRFcGAEkVSYEEDEEAOCJBADKBBEsBSU4CD4EESwJPAk1LA0xPAlInCicQJxEqJxJPBY4FAAUABAADAAIAAQAAAAAAACNDSwJXBgQrEkL/vzYaAUkVJBJEFzYaAkkVJRJENhoDSRUkEkQ2GgRJFSQSRDYaBUkiWSULgQIISwEVEkQ2GgZJFSQSRDYaB0kVJBJEsU8GshiABAZz/jmyGk8FshpPBLIaTwOyGk8CshpMshqyGoEGshAisgGztD5HAlcABCgSRElXBABJIlmBAghMFRJEVwYASRVJgQQMQQA4IkEAMoEESwFJTgIPgQRLAk8CTUsDTE8CUicKJxAnESonEk8FjgUABQAEAAMAAgABAAAAAAAAI0NLAlcGBCsSQv+/NhoBSRUkEkQXNhoCSSJZJQuBAghLARUSRLFMshiABHb/THCyGrIagQayECKyAbO0PklXAAQoEkRJVwQASSJZgQIITBUSRFcGAIgFXCNDNhoBSRUkEkQXNhoCSRUlEkQ2GgNJFSQSRDYaBEkVJBJENhoFSSJZJQuBAghLARUSRLFPBLIYgASillGAshpPA7IaTwKyGkyyGrIagQayECKyAbO0PklXAAQoEkRJVwQASSJZgQIITBUSRFcGAIgE6iNDNhoBSRUkEkQXsbIYgASKXkyAshqBBrIQIrIBs7Q+RwJXAAQoEkRJVwQASSJZgQIITBUSRFcGAEkVSYEEDEEAKSJBACOBBEsBSU4CD4EESwJPAk1LA0xPAlInKypPAo4CAAIAAQAAACNDSwJXBgQrEkL/zjYaAUkVJBJEF7GyGIAEgCBptLIagQayECKyAbO0PkcCVwAEKBJESVcEAEkiWYECCEwVEkRXBgBJFUmBBAxBAFgiQQBSgQRLAUlOAg+BBEsCTwJNSwNMTwJSKicsgCpUaGVyZSBhcmUgdm90ZXJzIGFzc2lnbmVkIHRvIHRoaXMgcHJvcG9zYWxPA44DAAMAAgABAAAAACNDSwJXBgQrEkL/nzYaAUkVJBJEF7GyGIAEc3EyGrIagQayECKyAbO0PkcCVwAEKBJESVcEAEkiWYECCEwVEkRXBgBJFUmBBAxBACMiQQAdgQRLAUlOAg+BBEsCTwJNSwNMTwJSKkyOAQABAAAjQ0sCVwYEKxJC/9QxFiMJOBAjEkQjQzYaARUkEkQjQzYaARUkEkQjQyInBWVEIicGZUQyA0kiJwtlRDIDRwIiJwxlRCInDWVEIicTZUQiJxRlRCInFWVEIicWZUQiJxdlRCInGGVETwIWTwIWUEwWUCInGWVEIicaZUQiJxtlRCInHGVETwMWTwMWUE8CFlBMFlAiJx1lRCInHmVEIicfZUQiJyBlRE8DFk8DFlBPAhZQTBZQIichZUQiJyJlRCInI2VETwIWTwIWUEwWUCInJGVEIiclZUQiJyZlRE8CFk8CFlBMFlAiJwdlRCInCGVEIicJZUQiJydlRCInKGVEIicpZUQiJyplRIABACJPGlQjTxlUTxdQTxZQTxVQTxRQTxNQTxJQTxFQIhZMSwFQSwFQTxEWUE8QFlBPDxZQTw4WUE8NUE8MUE8LUE8KUE8JUEsBUExQTwdQTwYWUE8FFlBPBBZQTwMWUE8CFlBMFlAoTFCwI0M2GgEVJRJEgD0VH3x1AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsCNDNhoBSSJZJQuBAghMFRJEJwSwI0M2GgEVJRJEgA4VH3x1AAAAAAAAAAAAALAjQzYaAUkiWSULgQIITBUSRCcEsCNDNhoBFSQSRCctsCNDNhoBSSJZJAuBAghMFRJEJwSwI0M2GgEVJBJEJy2wI0M2GgFJIlkkC4ECCEwVEkQnBLAjQzYaAUkiWSQLgQIITBUSRCcEsCNDNhoBFSQSRCNDNhoBSRUlEkQpvUQyCnMBRLEpIiEEuksCIQQJKSEETwK6TwOBBAghBAqyOIEEsjWBHbI0gAQKgQFDskJMskCyQIAEzGlOqrIaTLIagQayECKyAbO0PTIKcwFEsUsBcghEIicNZURPAk8ECQmyCLIHI7IQIrIBsxYoTFCwI0OKBACxi/4Wi/8Wi/yyGIAEGEGg0rIai/2yGkyyGrIagQayECKyAbO0PkcCVwAEKBJESVcEAEkiWYECCEwVEkRXBgBJFUmBBAxBAEEiQQA8gQSLAklOAg+BBEsCTwJNiwFMTwJSJysnCicQJxEnLConEk8HjgcABwAGAAUABAADAAIAAQAAAAAAAAAAiYsAVwYEKxJC/7aKAQCL/xVJgQQMQQAuIkEAI4EEiwBJTgIPgQRLAk8CTYv/TE8CUionCk8CjgIAAgABAAAAi/+AABJEiYv/VwAEKxJC/8k=", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiAyMDQ4IDE4MTQ0MDAgMjQxOTIwMCA2MDQ4MDAKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAweDcwNjEgIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiICJFUlI6IiAweDE1MWY3Yzc1MDAwMCAweDcwNjE3NTczNjU2NDVmNzI2NTY3Njk3Mzc0NzI3OSAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MyAiVm90ZXIgbm90IGZvdW5kIiAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YyAweDc4Njc2Zjc2NWY2NDYxNjU2ZDZmNmUgMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MjZmNmY3NCAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDAwMCAiVm90ZXIgYWxyZWFkeSB2b3RlZCIgIlZvdGVzIGludmFsaWQiICJWb3RpbmcgUGVyaW9kIEV4cGlyZWQiIDB4NjQ2MTY1NmQ2ZjZlNWY2ZjcwNjU3MjYxNzQ2OTZmNmU1ZjY2NzU2ZTY0Njk2ZTY3NWY2MjcwNzMgMHg3MDcyNmY3MDZmNzM2MTZjNWY2MzZmNmQ2ZDY5NzQ2ZDY1NmU3NDVmNjI3MDczIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NCAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjczNmQ2MTZjNmMgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQgMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1IDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjczNmQ2MTZjNmMgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmQ2NTY0Njk3NTZkIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUgMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1IDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUgMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NSAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YyAweDcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkIDB4NzE3NTZmNzI3NTZkNWY2YzYxNzI2NzY1IDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQgMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUgMHg2MTYyNzM2NTZlNjM2NTVmNzQ2ZjZjNjU3MjYxNmU2MzY1IDB4Njc2Zjc2NjU3MjZlNjE2ZTYzNjU1ZjcwNjU3MjY5NmY2NCAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjc3MjYxNjM2NTVmNzA2NTcyNjk2ZjY0IDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyICJVbmF1dGhvcml6ZWQiICJNaXNzaW5nIENvbmZpZyIgYmFzZTMyKENVUFhZNUlBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfWEdPVl9DT1VOQ0lMLAogICAgYnl0ZWMgMTEgLy8gMHg3ODY3NmY3NjVmNjM2Zjc1NmU2MzY5NmMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzQKICAgIC8vIEFjY291bnQoKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMi0zNgogICAgLy8gIyBSb2xlLUJhc2VkIEFjY2VzcyBDb250cm9sIChSQkFDKQogICAgLy8gc2VsZi54Z292X2NvdW5jaWwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBBY2NvdW50KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1hHT1ZfQ09VTkNJTCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfWEdPVl9EQUVNT04sCiAgICBieXRlYyAxMiAvLyAweDc4Njc2Zjc2NWY2NDYxNjU2ZDZmNmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzgKICAgIC8vIEFjY291bnQoKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNy00MAogICAgLy8gc2VsZi54Z292X2RhZW1vbiA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEFjY291bnQoKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfWEdPVl9EQUVNT04sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1BBVVNFRF9SRUdJU1RSWSwKICAgIGJ5dGVjIDUgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDQKICAgIC8vIEZhbHNlLCAgIyBub3FhOiBGQlQwMDMKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyLTQ2CiAgICAvLyAjIFJlZ2lzdHJ5IENvbnRyb2wgU3RhdGVzCiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIEZhbHNlLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfUEFVU0VEX1JFR0lTVFJZLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDkKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9QQVVTRURfUFJPUE9TQUxTLAogICAgYnl0ZWMgNiAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBGYWxzZSwgICMgbm9xYTogRkJUMDAzCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0Ny01MAogICAgLy8gc2VsZi5wYXVzZWRfcHJvcG9zYWxzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgRmFsc2UsICAjIG5vcWE6IEZCVDAwMwogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9QQVVTRURfUFJPUE9TQUxTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTUKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9PUEVOX1BST1BPU0FMX0ZFRSwKICAgIGJ5dGVjIDEzIC8vIDB4NmY3MDY1NmU1ZjcwNzI2ZjcwNmY3MzYxNmM1ZjY2NjU2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NAogICAgLy8gVUludDY0KHJlZ19jZmcuT1BFTl9QUk9QT1NBTF9GRUUpLAogICAgcHVzaGludCAxMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTItNTYKICAgIC8vICMgRmVlcwogICAgLy8gc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLk9QRU5fUFJPUE9TQUxfRkVFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfT1BFTl9QUk9QT1NBTF9GRUUsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1OQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0RBRU1PTl9PUFNfRlVORElOR19CUFMsCiAgICBieXRlYyAxOSAvLyAweDY0NjE2NTZkNmY2ZTVmNmY3MDY1NzI2MTc0Njk2ZjZlNWY2Njc1NmU2NDY5NmU2NzVmNjI3MDczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU4CiAgICAvLyBVSW50NjQocmVnX2NmZy5EQUVNT05fT1BTX0ZVTkRJTkdfQlBTKSwKICAgIHB1c2hpbnQgNTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU3LTYwCiAgICAvLyBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5EQUVNT05fT1BTX0ZVTkRJTkdfQlBTKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfREFFTU9OX09QU19GVU5ESU5HX0JQUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYzCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfUFJPUE9TQUxfQ09NTUlUTUVOVF9CUFMsCiAgICBieXRlYyAyMCAvLyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjIKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLlBST1BPU0FMX0NPTU1JVE1FTlRfQlBTKSwKICAgIHB1c2hpbnQgMzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYxLTY0CiAgICAvLyBzZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuUFJPUE9TQUxfQ09NTUlUTUVOVF9CUFMpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9QUk9QT1NBTF9DT01NSVRNRU5UX0JQUywKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY5CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQsCiAgICBieXRlYyAyMSAvLyAweDZkNjk2ZTVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjgKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLk1JTl9SRVFVRVNURURfQU1PVU5UKSwKICAgIHB1c2hpbnQgMjUwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2Ni03MAogICAgLy8gIyBSZXF1ZXN0ZWQgQW1vdW50IExpbWl0cwogICAgLy8gc2VsZi5taW5fcmVxdWVzdGVkX2Ftb3VudCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLk1JTl9SRVFVRVNURURfQU1PVU5UKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfTUlOX1JFUVVFU1RFRF9BTU9VTlQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3MwogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX1NNQUxMLAogICAgYnl0ZWMgMjIgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjcyCiAgICAvLyBVSW50NjQocmVnX2NmZy5NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTCksCiAgICBwdXNoaW50IDI1MDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjcxLTc0CiAgICAvLyBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X3NtYWxsID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuTUFYX1JFUVVFU1RFRF9BTU9VTlRfU01BTEwpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9TTUFMTCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTUVESVVNLAogICAgYnl0ZWMgMjMgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzYKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLk1BWF9SRVFVRVNURURfQU1PVU5UX01FRElVTSksCiAgICBwdXNoaW50IDEwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NS03OAogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0pLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9NQVhfUkVRVUVTVEVEX0FNT1VOVF9NRURJVU0sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo4MQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX01BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFLAogICAgYnl0ZWMgMjQgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBVSW50NjQocmVnX2NmZy5NQVhfUkVRVUVTVEVEX0FNT1VOVF9MQVJHRSksCiAgICBwdXNoaW50IDIwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3OS04MgogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLk1BWF9SRVFVRVNURURfQU1PVU5UX0xBUkdFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfTUFYX1JFUVVFU1RFRF9BTU9VTlRfTEFSR0UsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo4NwogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0RJU0NVU1NJT05fRFVSQVRJT05fU01BTEwsCiAgICBieXRlYyAyNSAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBVSW50NjQocmVnX2NmZy5ESVNDVVNTSU9OX0RVUkFUSU9OX1NNQUxMKSwKICAgIGludGMgNSAvLyAxODE0NDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojg0LTg4CiAgICAvLyAjIFRpbWUgTGltaXRzCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5ESVNDVVNTSU9OX0RVUkFUSU9OX1NNQUxMKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9TTUFMTCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0sCiAgICBieXRlYyAyNiAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTAKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkRJU0NVU1NJT05fRFVSQVRJT05fTUVESVVNKSwKICAgIGludGMgNSAvLyAxODE0NDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojg5LTkyCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuRElTQ1VTU0lPTl9EVVJBVElPTl9NRURJVU0pLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX01FRElVTSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfRElTQ1VTU0lPTl9EVVJBVElPTl9MQVJHRSwKICAgIGJ5dGVjIDI3IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTQKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkRJU0NVU1NJT05fRFVSQVRJT05fTEFSR0UpLAogICAgaW50YyA1IC8vIDE4MTQ0MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTMtOTYKICAgIC8vIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLkRJU0NVU1NJT05fRFVSQVRJT05fTEFSR0UpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX0xBUkdFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTkKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX1hMQVJHRSwKICAgIGJ5dGVjIDI4IC8vIDB4NjQ2OTczNjM3NTczNzM2OTZmNmU1ZjY0NzU3MjYxNzQ2OTZmNmU1Zjc4NmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo5OAogICAgLy8gVUludDY0KHJlZ19jZmcuRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UpLAogICAgaW50YyA2IC8vIDI0MTkyMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6OTctMTAwCiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25feGxhcmdlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuRElTQ1VTU0lPTl9EVVJBVElPTl9YTEFSR0UpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9ESVNDVVNTSU9OX0RVUkFUSU9OX1hMQVJHRSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEwMwogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9TTUFMTCwKICAgIGJ5dGVjIDI5IC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX1NNQUxMKSwKICAgIGludGMgNyAvLyA2MDQ4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTAxLTEwNAogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5WT1RJTkdfRFVSQVRJT05fU01BTEwpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fU01BTEwsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDcKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9WT1RJTkdfRFVSQVRJT05fTUVESVVNLAogICAgYnl0ZWMgMzAgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDYKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLlZPVElOR19EVVJBVElPTl9NRURJVU0pLAogICAgaW50YyA3IC8vIDYwNDgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDUtMTA4CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0gPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5WT1RJTkdfRFVSQVRJT05fTUVESVVNKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX01FRElVTSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExMQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9MQVJHRSwKICAgIGJ5dGVjIDMxIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExMAogICAgLy8gVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX0xBUkdFKSwKICAgIHB1c2hpbnQgMTIwOTYwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMDktMTEyCiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9sYXJnZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLlZPVElOR19EVVJBVElPTl9MQVJHRSksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9MQVJHRSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExNQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1ZPVElOR19EVVJBVElPTl9YTEFSR0UsCiAgICBieXRlYyAzMiAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzg2YzYxNzI2NzY1CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExNAogICAgLy8gVUludDY0KHJlZ19jZmcuVk9USU5HX0RVUkFUSU9OX1hMQVJHRSksCiAgICBpbnRjIDYgLy8gMjQxOTIwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMTMtMTE2CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5WT1RJTkdfRFVSQVRJT05fWExBUkdFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfVk9USU5HX0RVUkFUSU9OX1hMQVJHRSwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEyMQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9JRCwKICAgIGJ5dGVjIDcgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTIwCiAgICAvLyB0eXAuQnl0ZXMzMi5mcm9tX2J5dGVzKGIiMCIgKiAzMiksCiAgICBwdXNoYnl0ZXMgMHgzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwMzAzMDMwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjExOC0xMjIKICAgIC8vICMgeEdvdiBDb21taXR0ZWUKICAgIC8vIHNlbGYuY29tbWl0dGVlX2lkID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgdHlwLkJ5dGVzMzIuZnJvbV9ieXRlcyhiIjAiICogMzIpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfSUQsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMjUKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTUVNQkVSUywKICAgIGJ5dGVjIDggLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZkNjU2ZDYyNjU3MjczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEyNAogICAgLy8gVUludDY0KCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMjMtMTI2CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9NRU1CRVJTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTI5CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTLAogICAgYnl0ZWMgOSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMjgKICAgIC8vIFVJbnQ2NCgpLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTI3LTEzMAogICAgLy8gc2VsZi5jb21taXR0ZWVfdm90ZXMgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQoKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1ZPVEVTLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTMzCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfQ09NTUlUVEVFX1JPT1QsCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzI2ZjZmNzQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTMyCiAgICAvLyBCeXRlcygpLAogICAgcHVzaGJ5dGVzIDB4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzMS0xMzQKICAgIC8vIHNlbGYuY29tbWl0dGVlX3Jvb3QgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBCeXRlcygpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfUk9PVCwKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzOQogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX1FVT1JVTV9TTUFMTCwKICAgIGJ5dGVjIDMzIC8vIDB4NzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjEzOAogICAgLy8gVUludDY0KHJlZ19jZmcuUVVPUlVNX1NNQUxMKSwKICAgIHB1c2hpbnQgMzAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxMzYtMTQwCiAgICAvLyAjIFF1b3J1bXMKICAgIC8vIHNlbGYucXVvcnVtX3NtYWxsID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuUVVPUlVNX1NNQUxMKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfUVVPUlVNX1NNQUxMLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQzCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfUVVPUlVNX01FRElVTSwKICAgIGJ5dGVjIDM0IC8vIDB4NzE3NTZmNzI3NTZkNWY2ZDY1NjQ2OTc1NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQyCiAgICAvLyBVSW50NjQocmVnX2NmZy5RVU9SVU1fTUVESVVNKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE0MS0xNDQKICAgIC8vIHNlbGYucXVvcnVtX21lZGl1bSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLlFVT1JVTV9NRURJVU0pLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9RVU9SVU1fTUVESVVNLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQ3CiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfUVVPUlVNX0xBUkdFLAogICAgYnl0ZWMgMzUgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTQ2CiAgICAvLyBVSW50NjQocmVnX2NmZy5RVU9SVU1fTEFSR0UpLAogICAgcHVzaGludCA3MDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE0NS0xNDgKICAgIC8vIHNlbGYucXVvcnVtX2xhcmdlID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuUVVPUlVNX0xBUkdFKSwKICAgIC8vICAgICBrZXk9cmVnX2NmZy5HU19LRVlfUVVPUlVNX0xBUkdFLAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTUzCiAgICAvLyBrZXk9cmVnX2NmZy5HU19LRVlfV0VJR0hURURfUVVPUlVNX1NNQUxMLAogICAgYnl0ZWMgMzYgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjczNmQ2MTZjNmMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTUyCiAgICAvLyBVSW50NjQocmVnX2NmZy5XRUlHSFRFRF9RVU9SVU1fU01BTEwpLAogICAgcHVzaGludCA1MDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE1MC0xNTQKICAgIC8vICMgV2VpZ2h0ZWQgUXVvcnVtcwogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5XRUlHSFRFRF9RVU9SVU1fU01BTEwpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fU01BTEwsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNTcKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTUVESVVNLAogICAgYnl0ZWMgMzcgLy8gMHg3NzY1Njk2NzY4NzQ2NTY0NWY3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNTYKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLldFSUdIVEVEX1FVT1JVTV9NRURJVU0pLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTU1LTE1OAogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuV0VJR0hURURfUVVPUlVNX01FRElVTSksCiAgICAvLyAgICAga2V5PXJlZ19jZmcuR1NfS0VZX1dFSUdIVEVEX1FVT1JVTV9NRURJVU0sCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjEKICAgIC8vIGtleT1yZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTEFSR0UsCiAgICBieXRlYyAzOCAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjAKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLldFSUdIVEVEX1FVT1JVTV9MQVJHRSksCiAgICBwdXNoaW50IDcwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTU5LTE2MgogICAgLy8gc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UgPSBHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBVSW50NjQocmVnX2NmZy5XRUlHSFRFRF9RVU9SVU1fTEFSR0UpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9XRUlHSFRFRF9RVU9SVU1fTEFSR0UsCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjYKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkFCU0VOQ0VfVE9MRVJBTkNFKSwga2V5PXJlZ19jZmcuR1NfS0VZX0FCU0VOQ0VfVE9MRVJBTkNFCiAgICBieXRlYyAzOSAvLyAweDYxNjI3MzY1NmU2MzY1NWY3NDZmNmM2NTcyNjE2ZTYzNjUKICAgIHB1c2hpbnQgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjQtMTY3CiAgICAvLyAjIE5ldyBWYXJpYWJsZXMgKGludHJvZHVjZWQgYWZ0ZXIgTWFpbk5ldCBkZXBsb3ltZW50KQogICAgLy8gc2VsZi5hYnNlbmNlX3RvbGVyYW5jZSA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLkFCU0VOQ0VfVE9MRVJBTkNFKSwga2V5PXJlZ19jZmcuR1NfS0VZX0FCU0VOQ0VfVE9MRVJBTkNFCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjkKICAgIC8vIFVJbnQ2NChyZWdfY2ZnLkdPVkVSTkFOQ0VfUEVSSU9EKSwga2V5PXJlZ19jZmcuR1NfS0VZX0dPVkVSTkFOQ0VfUEVSSU9ECiAgICBieXRlYyA0MCAvLyAweDY3NmY3NjY1NzI2ZTYxNmU2MzY1NWY3MDY1NzI2OTZmNjQKICAgIHB1c2hpbnQgMTAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxNjgtMTcwCiAgICAvLyBzZWxmLmdvdmVybmFuY2VfcGVyaW9kID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KHJlZ19jZmcuR09WRVJOQU5DRV9QRVJJT0QpLCBrZXk9cmVnX2NmZy5HU19LRVlfR09WRVJOQU5DRV9QRVJJT0QKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE3MwogICAgLy8ga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9HUkFDRV9QRVJJT0QsCiAgICBieXRlYyA0MSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjc3MjYxNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE3MgogICAgLy8gVUludDY0KHJlZ19jZmcuQ09NTUlUVEVFX0dSQUNFX1BFUklPRCksCiAgICBwdXNoaW50IDEwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE3MS0xNzQKICAgIC8vIHNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZCA9IEdsb2JhbFN0YXRlKAogICAgLy8gICAgIFVJbnQ2NChyZWdfY2ZnLkNPTU1JVFRFRV9HUkFDRV9QRVJJT0QpLAogICAgLy8gICAgIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfR1JBQ0VfUEVSSU9ELAogICAgLy8gKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTc2CiAgICAvLyBVSW50NjQoKSwga2V5PXJlZ19jZmcuR1NfS0VZX0NPTU1JVFRFRV9MQVNUX0FOQ0hPUgogICAgYnl0ZWMgNDIgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjZjNjE3Mzc0NWY2MTZlNjM2ODZmNzIKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE3NS0xNzcKICAgIC8vIHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yID0gR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgVUludDY0KCksIGtleT1yZWdfY2ZnLkdTX0tFWV9DT01NSVRURUVfTEFTVF9BTkNIT1IKICAgIC8vICkKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjkKICAgIC8vIGNsYXNzIFhnb3ZSZWdpc3RyeU1vY2soWEdvdlJlZ2lzdHJ5SW50ZXJmYWNlKToKICAgIHB1c2hieXRlcyAweDQ5NTZjMWFiIC8vIG1ldGhvZCAidXBkYXRlX3hnb3ZfcmVnaXN0cnkoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3VwZGF0ZV94Z292X3JlZ2lzdHJ5X3JvdXRlQDQKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BANjUKICAgIHB1c2hieXRlc3MgMHg5NTljNDc2MiAweDZjMWY1NjRkIDB4ZTEwYTUxMmUgMHg4NmY3ZTBlNiAweDM5ZTI2ZDhhIDB4OTgzNTJlODYgMHhmYTRlZDZlMiAweGQ2YzljYzFhIDB4NWM0ODQwNTUgMHgzN2Q2YWRmMSAweGQ0MjE2YjZlIDB4YmE4NTIwZjIgMHgxNjc3YjMwZSAweDg0YjdkMjY4IDB4YWY3ZjE4NjAgMHhhMDgyY2VmOCAweGRmMzlmZGI5IDB4Y2EwZjZhM2EgMHgzYzMxYmMwMiAweDBkMmM3ODkxIDB4NDUwNzczOTAgMHg5M2ZhY2RiYSAweGNlOGIzYTFjIDB4ZmFlYTA4MWYgMHgwZGEyNzg4NSAweDdhNGZlZTQzIDB4NTJkZDEwZDcgMHhkNGQzN2E2NCAweGE5YmI3MmI5IDB4MzQzNDlkY2MgMHgxNThmOGRkNiAweDViMDUzOTBmIDB4Njg3Y2IzNTYgMHgyOTBmMzJhMiAweDVmZTI1OTM1IDB4NzYxNmEyYWUgMHhkYjI3YjlhZiAweGY1OTEwNzU2IDB4NjU2MTBhOWYgMHhmZGM2OTVjMiAweGJhOTBhYjU0IDB4MWE2NzRiNDUgMHhhOGQ1YWU5NCAweDZhZTVlYjQ2IDB4Mjk1NzAxM2IgMHgyNzYzMGQ2NSAweGQxZDdmMmFhIDB4ODI0Zjk4YmMgMHg2ZTczNWNmZiAweDQ5NTQ4YmEwIDB4MjlhY2RhMTMgMHg4MjY3ODRmNiAweGI2OGZjYjk1IDB4ZDQ5NWFiY2YgMHgyNjk4MzIwMCAweGMzODZiMDNmIDB4ZGJkODNkZDkgLy8gbWV0aG9kICJpbml0X3Byb3Bvc2FsX2NvbnRyYWN0KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJsb2FkX3Byb3Bvc2FsX2NvbnRyYWN0KHVpbnQ2NCxieXRlW10pdm9pZCIsIG1ldGhvZCAiZGVsZXRlX3Byb3Bvc2FsX2NvbnRyYWN0X2JveCgpdm9pZCIsIG1ldGhvZCAicGF1c2VfcmVnaXN0cnkoKXZvaWQiLCBtZXRob2QgInBhdXNlX3Byb3Bvc2Fscygpdm9pZCIsIG1ldGhvZCAicmVzdW1lX3JlZ2lzdHJ5KCl2b2lkIiwgbWV0aG9kICJyZXN1bWVfcHJvcG9zYWxzKCl2b2lkIiwgbWV0aG9kICJzZXRfeGdvdl9tYW5hZ2VyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3BheW9yKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfY291bmNpbChhZGRyZXNzKXZvaWQiLCBtZXRob2QgInNldF94Z292X3N1YnNjcmliZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJzZXRfa3ljX3Byb3ZpZGVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X2NvbW1pdHRlZV9tYW5hZ2VyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAic2V0X3hnb3ZfZGFlbW9uKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiY29uZmlnX3hnb3ZfcmVnaXN0cnkoKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NFszXSx1aW50NjRbNF0sdWludDY0WzRdLHVpbnQ2NFszXSx1aW50NjRbM10sdWludDY0LHVpbnQ2NCx1aW50NjQpKXZvaWQiLCBtZXRob2QgInN1YnNjcmliZV94Z292KGFkZHJlc3MscGF5KXZvaWQiLCBtZXRob2QgInVuc3Vic2NyaWJlX3hnb3YoKXZvaWQiLCBtZXRob2QgInVuc3Vic2NyaWJlX2Fic2VudGVlKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV9zdWJzY3JpYmVfeGdvdih1aW50NjQpdm9pZCIsIG1ldGhvZCAicmVqZWN0X3N1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZXF1ZXN0X3N1YnNjcmliZV94Z292KGFkZHJlc3MsYWRkcmVzcyx1aW50NjQscGF5KXZvaWQiLCBtZXRob2QgInJlcXVlc3RfdW5zdWJzY3JpYmVfeGdvdihhZGRyZXNzLGFkZHJlc3MsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX3Vuc3Vic2NyaWJlX3hnb3YodWludDY0KXZvaWQiLCBtZXRob2QgInJlamVjdF91bnN1YnNjcmliZV94Z292KHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzZXRfdm90aW5nX2FjY291bnQoYWRkcmVzcyxhZGRyZXNzKXZvaWQiLCBtZXRob2QgInN1YnNjcmliZV9wcm9wb3NlcihwYXkpdm9pZCIsIG1ldGhvZCAic2V0X3Byb3Bvc2VyX2t5YyhhZGRyZXNzLGJvb2wsdWludDY0KXZvaWQiLCBtZXRob2QgImRlY2xhcmVfY29tbWl0dGVlKGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAiZGVjbGFyZV9jb21taXR0ZWVfd2l0aF9yb290KGJ5dGVbMzJdLHVpbnQ2NCx1aW50NjQsYnl0ZVszMl0pdm9pZCIsIG1ldGhvZCAib3Blbl9wcm9wb3NhbChwYXkpdWludDY0IiwgbWV0aG9kICJ2b3RlX3Byb3Bvc2FsKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAidm90ZV9wcm9wb3NhbHMoYWRkcmVzcywodWludDY0LHVpbnQ2NCx1aW50NjQpW10pdm9pZCIsIG1ldGhvZCAidm90ZV9wcm9wb3NhbF9iYXRjaCh1aW50NjQsKGFkZHJlc3MsdWludDY0LHVpbnQ2NClbXSl2b2lkIiwgbWV0aG9kICJ2b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2YodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCxieXRlWzMyXVtdLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAidW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbCh1aW50NjQsYWRkcmVzc1tdKXZvaWQiLCBtZXRob2QgInVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfd2l0aF9wcm9vZih1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0LGJ5dGVbMzJdW10pdm9pZCIsIG1ldGhvZCAicGF5X2dyYW50X3Byb3Bvc2FsKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJmaW5hbGl6ZV9wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZHJvcF9wcm9wb3NhbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZGVwb3NpdF9mdW5kcyhwYXkpdm9pZCIsIG1ldGhvZCAid2l0aGRyYXdfZnVuZHModWludDY0KXZvaWQiLCBtZXRob2QgIndpdGhkcmF3X2F2YWlsYWJsZV9mdW5kcyh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X2F2YWlsYWJsZV9mdW5kcygpdWludDY0IiwgbWV0aG9kICJnZXRfc3RhdGUoKShib29sLGJvb2wsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjRbM10sdWludDY0WzRdLHVpbnQ2NFs0XSx1aW50NjRbM10sdWludDY0WzNdLHVpbnQ2NCx1aW50NjQsYnl0ZVszMl0sdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfc3RhdGVfdmVyc2lvbigpdWludDY0IiwgbWV0aG9kICJnZXRfeGdvdl9ib3goYWRkcmVzcykoKGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpLGJvb2wpIiwgbWV0aG9kICJnZXRfeGdvdl9ib3hlcyhhZGRyZXNzW10pKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0KSxib29sKVtdIiwgbWV0aG9kICJnZXRfcHJvcG9zZXJfYm94KGFkZHJlc3MpKChib29sLGJvb2wsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3Byb3Bvc2VyX2JveGVzKGFkZHJlc3NbXSkoKGJvb2wsYm9vbCx1aW50NjQpLGJvb2wpW10iLCBtZXRob2QgImdldF9yZXF1ZXN0X2JveCh1aW50NjQpKChhZGRyZXNzLGFkZHJlc3MsdWludDY0KSxib29sKSIsIG1ldGhvZCAiZ2V0X3JlcXVlc3RfYm94ZXModWludDY0W10pKChhZGRyZXNzLGFkZHJlc3MsdWludDY0KSxib29sKVtdIiwgbWV0aG9kICJnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3godWludDY0KSgoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCksYm9vbCkiLCBtZXRob2QgImdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveGVzKHVpbnQ2NFtdKSgoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCksYm9vbClbXSIsIG1ldGhvZCAiZ2V0X3Byb3Bvc2Fsc19zdW1tYXJ5KHVpbnQ2NFtdKShib29sLGFkZHJlc3MsdWludDY0LGJvb2wsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NClbXSIsIG1ldGhvZCAiaXNfcHJvcG9zYWwodWludDY0KXZvaWQiLCBtZXRob2QgImNyZWF0ZV9lbXB0eV9wcm9wb3NhbChhZGRyZXNzKXVpbnQ2NCIsIG1ldGhvZCAib3BfdXAoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBpbml0X3Byb3Bvc2FsX2NvbnRyYWN0IGxvYWRfcHJvcG9zYWxfY29udHJhY3QgbWFpbl9kZWxldGVfcHJvcG9zYWxfY29udHJhY3RfYm94X3JvdXRlQDkgbWFpbl9wYXVzZV9yZWdpc3RyeV9yb3V0ZUAxMCBtYWluX3BhdXNlX3Byb3Bvc2Fsc19yb3V0ZUAxMSBtYWluX3Jlc3VtZV9yZWdpc3RyeV9yb3V0ZUAxMiBtYWluX3Jlc3VtZV9wcm9wb3NhbHNfcm91dGVAMTMgc2V0X3hnb3ZfbWFuYWdlciBzZXRfcGF5b3Igc2V0X3hnb3ZfY291bmNpbCBzZXRfeGdvdl9zdWJzY3JpYmVyIHNldF9reWNfcHJvdmlkZXIgc2V0X2NvbW1pdHRlZV9tYW5hZ2VyIHNldF94Z292X2RhZW1vbiBjb25maWdfeGdvdl9yZWdpc3RyeSBzdWJzY3JpYmVfeGdvdiBtYWluX3Vuc3Vic2NyaWJlX3hnb3Zfcm91dGVAMjMgdW5zdWJzY3JpYmVfYWJzZW50ZWUgYXBwcm92ZV9zdWJzY3JpYmVfeGdvdiByZWplY3Rfc3Vic2NyaWJlX3hnb3YgcmVxdWVzdF9zdWJzY3JpYmVfeGdvdiByZXF1ZXN0X3Vuc3Vic2NyaWJlX3hnb3YgYXBwcm92ZV91bnN1YnNjcmliZV94Z292IHJlamVjdF91bnN1YnNjcmliZV94Z292IHNldF92b3RpbmdfYWNjb3VudCBzdWJzY3JpYmVfcHJvcG9zZXIgc2V0X3Byb3Bvc2VyX2t5YyBkZWNsYXJlX2NvbW1pdHRlZSBkZWNsYXJlX2NvbW1pdHRlZV93aXRoX3Jvb3Qgb3Blbl9wcm9wb3NhbCB2b3RlX3Byb3Bvc2FsIHZvdGVfcHJvcG9zYWxzIHZvdGVfcHJvcG9zYWxfYmF0Y2ggdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mIHVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWwgdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbF93aXRoX3Byb29mIHBheV9ncmFudF9wcm9wb3NhbCBmaW5hbGl6ZV9wcm9wb3NhbCBkcm9wX3Byb3Bvc2FsIGRlcG9zaXRfZnVuZHMgd2l0aGRyYXdfZnVuZHMgd2l0aGRyYXdfYXZhaWxhYmxlX2Z1bmRzIG1haW5fZ2V0X2F2YWlsYWJsZV9mdW5kc19yb3V0ZUA0OSBnZXRfc3RhdGUgbWFpbl9nZXRfc3RhdGVfdmVyc2lvbl9yb3V0ZUA1MSBnZXRfeGdvdl9ib3ggZ2V0X3hnb3ZfYm94ZXMgZ2V0X3Byb3Bvc2VyX2JveCBnZXRfcHJvcG9zZXJfYm94ZXMgZ2V0X3JlcXVlc3RfYm94IGdldF9yZXF1ZXN0X2JveGVzIGdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveCBnZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hlcyBnZXRfcHJvcG9zYWxzX3N1bW1hcnkgaXNfcHJvcG9zYWwgY3JlYXRlX2VtcHR5X3Byb3Bvc2FsIG1haW5fb3BfdXBfcm91dGVANjMKICAgIGVycgoKbWFpbl9vcF91cF9yb3V0ZUA2MzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Nzc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfc3RhdGVfdmVyc2lvbl9yb3V0ZUA1MToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjQ1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDE1IC8vIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2F2YWlsYWJsZV9mdW5kc19yb3V0ZUA0OToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjIDE1IC8vIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fdW5zdWJzY3JpYmVfeGdvdl9yb3V0ZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjYxCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZXN1bWVfcHJvcG9zYWxzX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMTcKICAgIC8vIHNlbGYucGF1c2VkX3Byb3Bvc2Fscy52YWx1ZSA9IEZhbHNlCiAgICBieXRlYyA2IC8vIDB4NzA2MTc1NzM2NTY0NWY3MDcyNmY3MDZmNzM2MTZjNzMKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3Jlc3VtZV9yZWdpc3RyeV9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjEzCiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSA9IEZhbHNlCiAgICBieXRlYyA1IC8vIDB4NzA2MTc1NzM2NTY0NWY3MjY1Njc2OTczNzQ3Mjc5CiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjExCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9wYXVzZV9wcm9wb3NhbHNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIwOQogICAgLy8gc2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlID0gVHJ1ZQogICAgYnl0ZWMgNiAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9wYXVzZV9yZWdpc3RyeV9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjA1CiAgICAvLyBzZWxmLnBhdXNlZF9yZWdpc3RyeS52YWx1ZSA9IFRydWUKICAgIGJ5dGVjIDUgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RlbGV0ZV9wcm9wb3NhbF9jb250cmFjdF9ib3hfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjAxCiAgICAvLyBkZWwgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLnZhbHVlCiAgICBieXRlY18xIC8vIDB4NzA2MQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX05vT3BANjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI5CiAgICAvLyBjbGFzcyBYZ292UmVnaXN0cnlNb2NrKFhHb3ZSZWdpc3RyeUludGVyZmFjZSk6CiAgICBwdXNoYnl0ZXMgMHg0YzVjNjFiYSAvLyBtZXRob2QgImNyZWF0ZSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX3JvdXRlQDY2CiAgICBlcnIKCm1haW5fY3JlYXRlX3JvdXRlQDY2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxODQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVfeGdvdl9yZWdpc3RyeV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNCAvLyBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAmJgogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmluaXRfcHJvcG9zYWxfY29udHJhY3Rbcm91dGluZ10oKSAtPiB2b2lkOgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxODgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gaWYgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtOgogICAgYnl0ZWNfMSAvLyAweDcwNjEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogaW5pdF9wcm9wb3NhbF9jb250cmFjdF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToxOTEKICAgIC8vIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5yZXNpemUoc2l6ZSkKICAgIGJ5dGVjXzEgLy8gMHg3MDYxCiAgICBzd2FwCiAgICBib3hfcmVzaXplCgppbml0X3Byb3Bvc2FsX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKaW5pdF9wcm9wb3NhbF9jb250cmFjdF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTkzCiAgICAvLyBfY3JlYXRlZCA9IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5jcmVhdGUoc2l6ZT1zaXplKQogICAgYnl0ZWNfMSAvLyAweDcwNjEKICAgIHN3YXAKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgYiBpbml0X3Byb3Bvc2FsX2NvbnRyYWN0X2FmdGVyX2lmX2Vsc2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5sb2FkX3Byb3Bvc2FsX2NvbnRyYWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKbG9hZF9wcm9wb3NhbF9jb250cmFjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MTk1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5NwogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLnJlcGxhY2Uoc3RhcnRfaW5kZXg9b2Zmc2V0LCB2YWx1ZT1kYXRhKQogICAgYnl0ZWNfMSAvLyAweDcwNjEKICAgIGNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3hnb3ZfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF94Z292X21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjIxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc2V0X3BheW9yW3JvdXRpbmddKCkgLT4gdm9pZDoKc2V0X3BheW9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMjMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF94Z292X2NvdW5jaWxbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9jb3VuY2lsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjI5CiAgICAvLyBzZWxmLnhnb3ZfY291bmNpbC52YWx1ZSA9IGNvdW5jaWwKICAgIGJ5dGVjIDExIC8vIDB4Nzg2NzZmNzY1ZjYzNmY3NTZlNjM2OTZjCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF94Z292X3N1YnNjcmliZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9zdWJzY3JpYmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF9reWNfcHJvdmlkZXJbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfa3ljX3Byb3ZpZGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyMzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF9jb21taXR0ZWVfbWFuYWdlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF9jb21taXR0ZWVfbWFuYWdlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5zZXRfeGdvdl9kYWVtb25bcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfeGdvdl9kYWVtb246CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNDUKICAgIC8vIHNlbGYueGdvdl9kYWVtb24udmFsdWUgPSB4Z292X2RhZW1vbgogICAgYnl0ZWMgMTIgLy8gMHg3ODY3NmY3NjVmNjQ2MTY1NmQ2ZjZlCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmNvbmZpZ194Z292X3JlZ2lzdHJ5W3JvdXRpbmddKCkgLT4gdm9pZDoKY29uZmlnX3hnb3ZfcmVnaXN0cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgcHVzaGludCAyMDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24uYWJpX3R5cGVzLlhHb3ZSZWdpc3RyeUNvbmZpZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyNTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnVuc3Vic2NyaWJlX2Fic2VudGVlW3JvdXRpbmddKCkgLT4gdm9pZDoKdW5zdWJzY3JpYmVfYWJzZW50ZWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suYXBwcm92ZV9zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CmFwcHJvdmVfc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI2OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnJlamVjdF9zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdF9zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MjczCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sucmVxdWVzdF9zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlcXVlc3Rfc3Vic2NyaWJlX3hnb3Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjI3NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnJlcXVlc3RfdW5zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlcXVlc3RfdW5zdWJzY3JpYmVfeGdvdjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mjg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suYXBwcm92ZV91bnN1YnNjcmliZV94Z292W3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV91bnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weToyOTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5yZWplY3RfdW5zdWJzY3JpYmVfeGdvdltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdF91bnN1YnNjcmliZV94Z292OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5zZXRfdm90aW5nX2FjY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdm90aW5nX2FjY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suc3Vic2NyaWJlX3Byb3Bvc2VyW3JvdXRpbmddKCkgLT4gdm9pZDoKc3Vic2NyaWJlX3Byb3Bvc2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnNldF9wcm9wb3Nlcl9reWNbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfcHJvcG9zZXJfa3ljOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmRlY2xhcmVfY29tbWl0dGVlW3JvdXRpbmddKCkgLT4gdm9pZDoKZGVjbGFyZV9jb21taXR0ZWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMzEKICAgIC8vIHNlbGYuY29tbWl0dGVlX2lkLnZhbHVlID0gY29tbWl0dGVlX2lkLmNvcHkoKQogICAgYnl0ZWMgNyAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNjk2NAogICAgdW5jb3ZlciAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMzIKICAgIC8vIHNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUgPSBzaXplCiAgICBieXRlYyA4IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2ZDY1NmQ2MjY1NzI3MwogICAgdW5jb3ZlciAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMzMKICAgIC8vIHNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlID0gdm90ZXMKICAgIGJ5dGVjIDkgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1Zjc2NmY3NDY1NzMKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMzNAogICAgLy8gc2VsZi5jb21taXR0ZWVfcm9vdC52YWx1ZSA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE0IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3MjZmNmY3NAogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozMjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmRlY2xhcmVfY29tbWl0dGVlX3dpdGhfcm9vdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlY2xhcmVfY29tbWl0dGVlX3dpdGhfcm9vdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzM2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzQ1CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9pZC52YWx1ZSA9IGNvbW1pdHRlZV9pZC5jb3B5KCkKICAgIGJ5dGVjIDcgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY5NjQKICAgIHVuY292ZXIgNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzQ2CiAgICAvLyBzZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlID0gc2l6ZQogICAgYnl0ZWMgOCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIHVuY292ZXIgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzQ3CiAgICAvLyBzZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSA9IHZvdGVzCiAgICBieXRlYyA5IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY3NjZmNzQ2NTczCiAgICB1bmNvdmVyIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gc2VsZi5jb21taXR0ZWVfcm9vdC52YWx1ZSA9IGNvbW1pdHRlZV9yb290LmJ5dGVzCiAgICBieXRlYyAxNCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzI2ZjZmNzQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjMzNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sub3Blbl9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm9wZW5fcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGJ5dGVjIDE1IC8vIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2Fsc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnZvdGVfcHJvcG9zYWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAyNAogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5Qcm9wb3NhbFZvdGU+CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM5OAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHZvdGVzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAoKdm90ZV9wcm9wb3NhbHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTgKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3Rlcy5sZW5ndGgpOgogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgYnogdm90ZV9wcm9wb3NhbHNfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDAxCiAgICAvLyBwcm9wb3NhbF9pZD1BcHBsaWNhdGlvbih2b3RlLnByb3Bvc2FsX2lkKSwKICAgIGRpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAyNAogICAgKgogICAgcHVzaGludCAyNAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDMKICAgIC8vIGFwcHJvdmFsX3ZvdGVzPXZvdGUuYXBwcm92YWxzLAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDQKICAgIC8vIHJlamVjdGlvbl92b3Rlcz12b3RlLnJlamVjdGlvbnMsCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgMTYKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQwMC00MDUKICAgIC8vIHNlbGYudm90ZV9wcm9wb3NhbCgKICAgIC8vICAgICBwcm9wb3NhbF9pZD1BcHBsaWNhdGlvbih2b3RlLnByb3Bvc2FsX2lkKSwKICAgIC8vICAgICB4Z292X2FkZHJlc3M9eGdvdl9hZGRyZXNzLAogICAgLy8gICAgIGFwcHJvdmFsX3ZvdGVzPXZvdGUuYXBwcm92YWxzLAogICAgLy8gICAgIHJlamVjdGlvbl92b3Rlcz12b3RlLnJlamVjdGlvbnMsCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGRpZyA3CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTgKICAgIC8vIGZvciBpIGluIHVyYW5nZSh2b3Rlcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiB2b3RlX3Byb3Bvc2Fsc19mb3JfaGVhZGVyQDIKCnZvdGVfcHJvcG9zYWxzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozOTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgp2b3RlX3Byb3Bvc2FsX2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDQ4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuY29tbW9uLmFiaV90eXBlcy5YR292Vm90ZT4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDE0LTQxOAogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudm90ZV9iYXRjaCwKICAgIC8vICAgICB2b3RlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDE1CiAgICAvLyBQcm9wb3NhbC52b3RlX2JhdGNoLAogICAgcHVzaGJ5dGVzIDB4NzkzNTUzNjkgLy8gbWV0aG9kICJ2b3RlX2JhdGNoKChhZGRyZXNzLHVpbnQ2NCx1aW50NjQpW10pc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQxNC00MTgKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIFByb3Bvc2FsLnZvdGVfYmF0Y2gsCiAgICAvLyAgICAgdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwbiAyCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyMAogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiB2b3RlX3Byb3Bvc2FsX2JhdGNoX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCnZvdGVfcHJvcG9zYWxfYmF0Y2hfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MjAKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgYnogdm90ZV9wcm9wb3NhbF9iYXRjaF9hZnRlcl9pZl9lbHNlQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyMQogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MjMKICAgIC8vIGNhc2UgZXJyLlZPVEVSX05PVF9GT1VORDoKICAgIGJ5dGVjIDEwIC8vICJWb3RlciBub3QgZm91bmQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyNQogICAgLy8gY2FzZSBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRDoKICAgIGJ5dGVjIDE2IC8vICJWb3RlciBhbHJlYWR5IHZvdGVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MjcKICAgIC8vIGNhc2UgZXJyLlZPVEVTX0lOVkFMSUQ6CiAgICBieXRlYyAxNyAvLyAiVm90ZXMgaW52YWxpZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDI5CiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlY18yIC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MzEKICAgIC8vIGNhc2UgZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRDoKICAgIGJ5dGVjIDE4IC8vICJWb3RpbmcgUGVyaW9kIEV4cGlyZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyMi00MzQKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLlZPVEVSX05PVF9GT1VORDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfTk9UX0ZPVU5EICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUl9BTFJFQURZX1ZPVEVEOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUl9BTFJFQURZX1ZPVEVEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5WT1RFU19JTlZBTElEOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RFU19JTlZBTElEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQgICMgbm9xYQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgdW5jb3ZlciA1CiAgICBtYXRjaCB2b3RlX3Byb3Bvc2FsX2JhdGNoX3N3aXRjaF9jYXNlXzBANyB2b3RlX3Byb3Bvc2FsX2JhdGNoX3N3aXRjaF9jYXNlXzFAOCB2b3RlX3Byb3Bvc2FsX2JhdGNoX3N3aXRjaF9jYXNlXzJAOSB2b3RlX3Byb3Bvc2FsX2JhdGNoX3N3aXRjaF9jYXNlXzNAMTAgdm90ZV9wcm9wb3NhbF9iYXRjaF9zd2l0Y2hfY2FzZV80QDExCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQzNAogICAgLy8gYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCnZvdGVfcHJvcG9zYWxfYmF0Y2hfc3dpdGNoX2Nhc2VfNEAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDMyCiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQgICMgbm9xYQogICAgZXJyIC8vIFZvdGluZyBQZXJpb2QgRXhwaXJlZAoKdm90ZV9wcm9wb3NhbF9iYXRjaF9zd2l0Y2hfY2FzZV8zQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MzAKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKdm90ZV9wcm9wb3NhbF9iYXRjaF9zd2l0Y2hfY2FzZV8yQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyOAogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVNfSU5WQUxJRCAgIyBub3FhCiAgICBlcnIgLy8gVm90ZXMgaW52YWxpZAoKdm90ZV9wcm9wb3NhbF9iYXRjaF9zd2l0Y2hfY2FzZV8xQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyNgogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRCAgIyBub3FhCiAgICBlcnIgLy8gVm90ZXIgYWxyZWFkeSB2b3RlZAoKdm90ZV9wcm9wb3NhbF9iYXRjaF9zd2l0Y2hfY2FzZV8wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyNAogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfTk9UX0ZPVU5EICAjIG5vcWEKICAgIGVyciAvLyBWb3RlciBub3QgZm91bmQKCnZvdGVfcHJvcG9zYWxfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKdm90ZV9wcm9wb3NhbF9iYXRjaF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQyMAogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBkaWcgMgogICAgZXh0cmFjdCA2IDQKICAgIGJ5dGVjXzMgLy8gIkVSUjoiCiAgICA9PQogICAgYiB2b3RlX3Byb3Bvc2FsX2JhdGNoX3Rlcm5hcnlfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2Zbcm91dGluZ10oKSAtPiB2b2lkOgp2b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQzNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0OC00NTcKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIFByb3Bvc2FsLnZvdGVfd2l0aF9wcm9vZiwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgdm90aW5nX3Bvd2VyLAogICAgLy8gICAgIG9yZGluYWwsCiAgICAvLyAgICAgcHJvb2YsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIHVuY292ZXIgNgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0OQogICAgLy8gUHJvcG9zYWwudm90ZV93aXRoX3Byb29mLAogICAgcHVzaGJ5dGVzIDB4MDY3M2ZlMzkgLy8gbWV0aG9kICJ2b3RlX3dpdGhfcHJvb2YoYWRkcmVzcyx1aW50NjQsdWludDY0LGJ5dGVbMzJdW10sdWludDY0LHVpbnQ2NClzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA1CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ0OC00NTcKICAgIC8vIGVycm9yLCBfdHggPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIFByb3Bvc2FsLnZvdGVfd2l0aF9wcm9vZiwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgdm90aW5nX3Bvd2VyLAogICAgLy8gICAgIG9yZGluYWwsCiAgICAvLyAgICAgcHJvb2YsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NTkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCnZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZl90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ1OQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBieiB2b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjAKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAzCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDYyCiAgICAvLyBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICBieXRlYyAxMCAvLyAiVm90ZXIgbm90IGZvdW5kIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjQKICAgIC8vIGNhc2UgZXJyLlZPVEVSX0FMUkVBRFlfVk9URUQ6CiAgICBieXRlYyAxNiAvLyAiVm90ZXIgYWxyZWFkeSB2b3RlZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDY2CiAgICAvLyBjYXNlIGVyci5WT1RFU19JTlZBTElEOgogICAgYnl0ZWMgMTcgLy8gIlZvdGVzIGludmFsaWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ2OAogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWNfMiAvLyAiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDcwCiAgICAvLyBjYXNlIGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQ6CiAgICBieXRlYyAxOCAvLyAiVm90aW5nIFBlcmlvZCBFeHBpcmVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjEtNDczCiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSX05PVF9GT1VORCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVNfSU5WQUxJRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVNfSU5WQUxJRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMgICMgbm9xYQogICAgLy8gICAgIGNhc2UgZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgIlVua25vd24gZXJyb3IiICAjIG5vcWEKICAgIHVuY292ZXIgNQogICAgbWF0Y2ggdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3N3aXRjaF9jYXNlXzBANyB2b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2Zfc3dpdGNoX2Nhc2VfMUA4IHZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZl9zd2l0Y2hfY2FzZV8yQDkgdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3N3aXRjaF9jYXNlXzNAMTAgdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3N3aXRjaF9jYXNlXzRAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDczCiAgICAvLyBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3N3aXRjaF9jYXNlXzRAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ3MQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEICAjIG5vcWEKICAgIGVyciAvLyBWb3RpbmcgUGVyaW9kIEV4cGlyZWQKCnZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZl9zd2l0Y2hfY2FzZV8zQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjkKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3N3aXRjaF9jYXNlXzJAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDY3CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RFU19JTlZBTElEICAjIG5vcWEKICAgIGVyciAvLyBWb3RlcyBpbnZhbGlkCgp2b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2Zfc3dpdGNoX2Nhc2VfMUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NjUKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSX0FMUkVBRFlfVk9URUQgICMgbm9xYQogICAgZXJyIC8vIFZvdGVyIGFscmVhZHkgdm90ZWQKCnZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZl9zd2l0Y2hfY2FzZV8wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfTk9UX0ZPVU5EICAjIG5vcWEKICAgIGVyciAvLyBWb3RlciBub3QgZm91bmQKCnZvdGVfcHJvcG9zYWxfd2l0aF9wcm9vZl9hZnRlcl9pZl9lbHNlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0MzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp2b3RlX3Byb3Bvc2FsX3dpdGhfcHJvb2ZfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NTkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlY18zIC8vICJFUlI6IgogICAgPT0KICAgIGIgdm90ZV9wcm9wb3NhbF93aXRoX3Byb29mX3Rlcm5hcnlfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay51bmFzc2lnbl9hYnNlbnRlZV9mcm9tX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKdW5hc3NpZ25fYWJzZW50ZWVfZnJvbV9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDc1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NzktNDgzCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZXMsCiAgICAvLyAgICAgYWJzZW50ZWVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0ODAKICAgIC8vIFByb3Bvc2FsLnVuYXNzaWduX2Fic2VudGVlcywKICAgIHB1c2hieXRlcyAweDc2ZmY0YzcwIC8vIG1ldGhvZCAidW5hc3NpZ25fYWJzZW50ZWVzKGFkZHJlc3NbXSlzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDc5LTQ4MwogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVzLAogICAgLy8gICAgIGFic2VudGVlcywKICAgIC8vICAgICBhcHBfaWQ9cHJvcG9zYWxfaWQsCiAgICAvLyApCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBMYXN0TG9nCiAgICBkdXAKICAgIGV4dHJhY3QgMCA0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgID09CiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gbG9nIHZhbHVlIGlzIG5vdCB0aGUgcmVzdWx0IG9mIGFuIEFCSSByZXR1cm4KICAgIGR1cAogICAgZXh0cmFjdCA0IDAKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBzdHJpbmcKICAgIGV4dHJhY3QgNiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gc2VsZi5hc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3IoZXJyb3IpCiAgICBjYWxsc3ViIGFzc2VydF9ub191bmFzc2lnbl9lcnJvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo0NzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfd2l0aF9wcm9vZltyb3V0aW5nXSgpIC0+IHZvaWQ6CnVuYXNzaWduX2Fic2VudGVlX2Zyb21fcHJvcG9zYWxfd2l0aF9wcm9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDg3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDk3LTUwNAogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZiwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgdm90aW5nX3Bvd2VyLAogICAgLy8gICAgIG9yZGluYWwsCiAgICAvLyAgICAgcHJvb2YsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgdW5jb3ZlciA0CiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDk4CiAgICAvLyBQcm9wb3NhbC51bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mLAogICAgcHVzaGJ5dGVzIDB4YTI5NjUxODAgLy8gbWV0aG9kICJ1bmFzc2lnbl9hYnNlbnRlZV93aXRoX3Byb29mKGFkZHJlc3MsdWludDY0LHVpbnQ2NCxieXRlWzMyXVtdKXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDk3LTUwNAogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudW5hc3NpZ25fYWJzZW50ZWVfd2l0aF9wcm9vZiwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgdm90aW5nX3Bvd2VyLAogICAgLy8gICAgIG9yZGluYWwsCiAgICAvLyAgICAgcHJvb2YsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MDYKICAgIC8vIHNlbGYuYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yKGVycm9yKQogICAgY2FsbHN1YiBhc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NDg3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5wYXlfZ3JhbnRfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgpwYXlfZ3JhbnRfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUyMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTIzCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbChQcm9wb3NhbC5mdW5kLCBhcHBfaWQ9cHJvcG9zYWxfaWQpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweDhhNWU0YzgwIC8vIG1ldGhvZCAiZnVuZCgpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MjUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogcGF5X2dyYW50X3Byb3Bvc2FsX3Rlcm5hcnlfZmFsc2VANAogICAgaW50Y18wIC8vIDAKCnBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUyNQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBieiBwYXlfZ3JhbnRfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MjYKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAzCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTI4CiAgICAvLyBjYXNlIGVyci5VTkFVVEhPUklaRUQ6CiAgICBieXRlYyA0MyAvLyAiVW5hdXRob3JpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MzAKICAgIC8vIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIGJ5dGVjXzIgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUyNy01MzMKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLlVOQVVUSE9SSVpFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVU5BVVRIT1JJWkVEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBfOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICB1bmNvdmVyIDIKICAgIG1hdGNoIHBheV9ncmFudF9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8wQDcgcGF5X2dyYW50X3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MzMKICAgIC8vIGFzc2VydCBGYWxzZSwgIlVua25vd24gZXJyb3IiICAjIG5vcWEKICAgIGVyciAvLyBVbmtub3duIGVycm9yCgpwYXlfZ3JhbnRfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MzEKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKcGF5X2dyYW50X3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzBANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTI5CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5VTkFVVEhPUklaRUQgICMgbm9xYQogICAgZXJyIC8vIFVuYXV0aG9yaXplZAoKcGF5X2dyYW50X3Byb3Bvc2FsX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUyMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnBheV9ncmFudF9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUyNQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBkaWcgMgogICAgZXh0cmFjdCA2IDQKICAgIGJ5dGVjXzMgLy8gIkVSUjoiCiAgICA9PQogICAgYiBwYXlfZ3JhbnRfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmZpbmFsaXplX3Byb3Bvc2FsW3JvdXRpbmddKCkgLT4gdm9pZDoKZmluYWxpemVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUzNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTM3CiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbChQcm9wb3NhbC5maW5hbGl6ZSwgYXBwX2lkPXByb3Bvc2FsX2lkKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBwdXNoYnl0ZXMgMHg4MDIwNjliNCAvLyBtZXRob2QgImZpbmFsaXplKClzdHJpbmciCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwbiAyCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICBkdXAKICAgIGV4dHJhY3QgNCAwCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3Igc3RyaW5nCiAgICBleHRyYWN0IDYgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQKICAgIGludGNfMCAvLyAwCgpmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBieiBmaW5hbGl6ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU0MAogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NDIKICAgIC8vIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIGJ5dGVjXzIgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU0NAogICAgLy8gY2FzZSBlcnIuTUlTU0lOR19DT05GSUc6CiAgICBieXRlYyA0NCAvLyAiTWlzc2luZyBDb25maWciCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU0NgogICAgLy8gY2FzZSBlcnIuVk9URVJTX0FTU0lHTkVEOgogICAgcHVzaGJ5dGVzICJUaGVyZSBhcmUgdm90ZXJzIGFzc2lnbmVkIHRvIHRoaXMgcHJvcG9zYWwiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU0MS01NDkKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5NSVNTSU5HX0NPTkZJRzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuTUlTU0lOR19DT05GSUcgICMgbm9xYQogICAgLy8gICAgIGNhc2UgZXJyLlZPVEVSU19BU1NJR05FRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJTX0FTU0lHTkVEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgIlVua25vd24gZXJyb3IiICAjIG5vcWEKICAgIHVuY292ZXIgMwogICAgbWF0Y2ggZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3IGZpbmFsaXplX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFAOCBmaW5hbGl6ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8yQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTQ5CiAgICAvLyBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKZmluYWxpemVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMkA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NDcKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSU19BU1NJR05FRCAgIyBub3FhCiAgICBlcnIgLy8gVGhlcmUgYXJlIHZvdGVycyBhc3NpZ25lZCB0byB0aGlzIHByb3Bvc2FsCgpmaW5hbGl6ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8xQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU0NQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuTUlTU0lOR19DT05GSUcgICMgbm9xYQogICAgZXJyIC8vIE1pc3NpbmcgQ29uZmlnCgpmaW5hbGl6ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8wQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU0MwogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTICAjIG5vcWEKICAgIGVyciAvLyBXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkCgpmaW5hbGl6ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBkaWcgMgogICAgZXh0cmFjdCA2IDQKICAgIGJ5dGVjXzMgLy8gIkVSUjoiCiAgICA9PQogICAgYiBmaW5hbGl6ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZHJvcF9wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmRyb3BfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTUzCiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbChQcm9wb3NhbC5kcm9wLCBhcHBfaWQ9cHJvcG9zYWxfaWQpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIHB1c2hieXRlcyAweDczNzEzMjFhIC8vIG1ldGhvZCAiZHJvcCgpc3RyaW5nIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NTUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogZHJvcF9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDQKICAgIGludGNfMCAvLyAwCgpkcm9wX3Byb3Bvc2FsX3Rlcm5hcnlfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTU1CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IGRyb3BfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU1NgogICAgLy8gZXJyb3Jfd2l0aG91dF9wcmVmaXggPSBTdHJpbmcuZnJvbV9ieXRlcyhlcnJvci5ieXRlc1s0Ol0pCiAgICBwdXNoaW50IDQKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDQKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NTgKICAgIC8vIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIGJ5dGVjXzIgLy8gIldyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU1Ny01NjEKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTICAjIG5vcWEKICAgIC8vICAgICBjYXNlIF86CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgIlVua25vd24gZXJyb3IiICAjIG5vcWEKICAgIHN3YXAKICAgIG1hdGNoIGRyb3BfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU2MQogICAgLy8gYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgZXJyIC8vIFVua25vd24gZXJyb3IKCmRyb3BfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NTkKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICBlcnIgLy8gV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZAoKZHJvcF9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmRyb3BfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NTUKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA0CiAgICBieXRlY18zIC8vICJFUlI6IgogICAgPT0KICAgIGIgZHJvcF9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZGVwb3NpdF9mdW5kc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmRlcG9zaXRfZnVuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sud2l0aGRyYXdfZnVuZHNbcm91dGluZ10oKSAtPiB2b2lkOgp3aXRoZHJhd19mdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTY3CiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sud2l0aGRyYXdfYXZhaWxhYmxlX2Z1bmRzW3JvdXRpbmddKCkgLT4gdm9pZDoKd2l0aGRyYXdfYXZhaWxhYmxlX2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1NzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5nZXRfc3RhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU4MgogICAgLy8gcGF1c2VkX3JlZ2lzdHJ5PXNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gMHg3MDYxNzU3MzY1NjQ1ZjcyNjU2NzY5NzM3NDcyNzkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYXVzZWRfcmVnaXN0cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU4MwogICAgLy8gcGF1c2VkX3Byb3Bvc2Fscz1zZWxmLnBhdXNlZF9wcm9wb3NhbHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAweDcwNjE3NTczNjU2NDVmNzA3MjZmNzA2ZjczNjE2YzczCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGF1c2VkX3Byb3Bvc2FscyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTg0CiAgICAvLyB4Z292X21hbmFnZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1ODUKICAgIC8vIHhnb3ZfcGF5b3I9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1ODYKICAgIC8vIHhnb3ZfY291bmNpbD1zZWxmLnhnb3ZfY291bmNpbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAweDc4Njc2Zjc2NWY2MzZmNzU2ZTYzNjk2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfY291bmNpbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTg3CiAgICAvLyB4Z292X3N1YnNjcmliZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1ODgtNTg5CiAgICAvLyBreWNfcHJvdmlkZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vIGNvbW1pdHRlZV9tYW5hZ2VyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTkwCiAgICAvLyB4Z292X2RhZW1vbj1zZWxmLnhnb3ZfZGFlbW9uLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vIDB4Nzg2NzZmNzY1ZjY0NjE2NTZkNmY2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnhnb3ZfZGFlbW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1OTMKICAgIC8vIG9wZW5fcHJvcG9zYWxfZmVlPXNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTMgLy8gMHg2ZjcwNjU2ZTVmNzA3MjZmNzA2ZjczNjE2YzVmNjY2NTY1CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3Blbl9wcm9wb3NhbF9mZWUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU5NAogICAgLy8gZGFlbW9uX29wc19mdW5kaW5nX2Jwcz1zZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gMHg2NDYxNjU2ZDZmNmU1ZjZmNzA2NTcyNjE3NDY5NmY2ZTVmNjY3NTZlNjQ2OTZlNjc1ZjYyNzA3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU5NQogICAgLy8gcHJvcG9zYWxfY29tbWl0bWVudF9icHM9c2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2Jwcy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAweDcwNzI2ZjcwNmY3MzYxNmM1ZjYzNmY2ZDZkNjk3NDZkNjU2ZTc0NWY2MjcwNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2JwcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTk2CiAgICAvLyBtaW5fcmVxdWVzdGVkX2Ftb3VudD1zZWxmLm1pbl9yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vIDB4NmQ2OTZlNWY3MjY1NzE3NTY1NzM3NDY1NjQ1ZjYxNmQ2Zjc1NmU3NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbl9yZXF1ZXN0ZWRfYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1OTkKICAgIC8vIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY3MzZkNjE2YzZjCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjMgLy8gMHg2ZDYxNzg1ZjcyNjU3MTc1NjU3Mzc0NjU2NDVmNjE2ZDZmNzU2ZTc0NWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYwMQogICAgLy8gc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNCAvLyAweDZkNjE3ODVmNzI2NTcxNzU2NTczNzQ2NTY0NWY2MTZkNmY3NTZlNzQ1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTk3LTYwMwogICAgLy8gbWF4X3JlcXVlc3RlZF9hbW91bnQ9Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X2xhcmdlLnZhbHVlLAogICAgLy8gICAgICkKICAgIC8vICksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjA2CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjUgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYwNwogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNiAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY2ZDY1NjQ2OTc1NmQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjA4CiAgICAvLyBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjcgLy8gMHg2NDY5NzM2Mzc1NzM3MzY5NmY2ZTVmNjQ3NTcyNjE3NDY5NmY2ZTVmNmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYwOQogICAgLy8gc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOCAvLyAweDY0Njk3MzYzNzU3MzczNjk2ZjZlNWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjA0LTYxMQogICAgLy8gZGlzY3Vzc2lvbl9kdXJhdGlvbj1GaXhlZEFycmF5KAogICAgLy8gICAgICgKICAgIC8vICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjE0CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOSAvLyAweDc2NmY3NDY5NmU2NzVmNjQ3NTcyNjE3NDY5NmY2ZTVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjE1CiAgICAvLyBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzAgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZkNjU2NDY5NzU2ZAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYxNgogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzEgLy8gMHg3NjZmNzQ2OTZlNjc1ZjY0NzU3MjYxNzQ2OTZmNmU1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZHVyYXRpb25fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYxNwogICAgLy8gc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMyIC8vIDB4NzY2Zjc0Njk2ZTY3NWY2NDc1NzI2MTc0Njk2ZjZlNWY3ODZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2MTItNjE5CiAgICAvLyB2b3RpbmdfZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAoCiAgICAvLyAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9tZWRpdW0udmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjIyCiAgICAvLyBzZWxmLnF1b3J1bV9zbWFsbC52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMyAvLyAweDcxNzU2ZjcyNzU2ZDVmNzM2ZDYxNmM2YwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1b3J1bV9zbWFsbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjIzCiAgICAvLyBzZWxmLnF1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzQgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZkNjU2NDY5NzU2ZAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnF1b3J1bV9tZWRpdW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzUgLy8gMHg3MTc1NmY3Mjc1NmQ1ZjZjNjE3MjY3NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdW9ydW1fbGFyZ2UgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYyMC02MjYKICAgIC8vIHF1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICgKICAgIC8vICAgICAgICAgc2VsZi5xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgc2VsZi5xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgKQogICAgLy8gKSwKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2MjkKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM2IC8vIDB4Nzc2NTY5Njc2ODc0NjU2NDVmNzE3NTZmNzI3NTZkNWY3MzZkNjE2YzZjCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2MzAKICAgIC8vIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNyAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmQ2NTY0Njk3NTZkCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX21lZGl1bSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjMxCiAgICAvLyBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzOCAvLyAweDc3NjU2OTY3Njg3NDY1NjQ1ZjcxNzU2ZjcyNzU2ZDVmNmM2MTcyNjc2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjI3LTYzMwogICAgLy8gd2VpZ2h0ZWRfcXVvcnVtPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgKAogICAgLy8gICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgLy8gICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIC8vICAgICApCiAgICAvLyApLAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjYzNgogICAgLy8gY29tbWl0dGVlX2lkPXNlbGYuY29tbWl0dGVlX2lkLnZhbHVlLmNvcHkoKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2MzcKICAgIC8vIGNvbW1pdHRlZV9tZW1iZXJzPXNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNmQ2NTZkNjI2NTcyNzMKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21taXR0ZWVfbWVtYmVycyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjM4CiAgICAvLyBjb21taXR0ZWVfdm90ZXM9c2VsZi5jb21taXR0ZWVfdm90ZXMudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAweDYzNmY2ZDZkNjk3NDc0NjU2NTVmNzY2Zjc0NjU3MwogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV92b3RlcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjM5CiAgICAvLyBhYnNlbmNlX3RvbGVyYW5jZT1zZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM5IC8vIDB4NjE2MjczNjU2ZTYzNjU1Zjc0NmY2YzY1NzI2MTZlNjM2NQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFic2VuY2VfdG9sZXJhbmNlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2NDAKICAgIC8vIGdvdmVybmFuY2VfcGVyaW9kPXNlbGYuZ292ZXJuYW5jZV9wZXJpb2QudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDAgLy8gMHg2NzZmNzY2NTcyNmU2MTZlNjM2NTVmNzA2NTcyNjk2ZjY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJuYW5jZV9wZXJpb2QgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY0MQogICAgLy8gY29tbWl0dGVlX2dyYWNlX3BlcmlvZD1zZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDEgLy8gMHg2MzZmNmQ2ZDY5NzQ3NDY1NjU1ZjY3NzI2MTYzNjU1ZjcwNjU3MjY5NmY2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjY0MgogICAgLy8gY29tbWl0dGVlX2xhc3RfYW5jaG9yPXNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQyIC8vIDB4NjM2ZjZkNmQ2OTc0NzQ2NTY1NWY2YzYxNzM3NDVmNjE2ZTYzNjg2ZjcyCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1ODEtNjQzCiAgICAvLyByZXR1cm4gdHlwLlR5cGVkR2xvYmFsU3RhdGUoCiAgICAvLyAgICAgcGF1c2VkX3JlZ2lzdHJ5PXNlbGYucGF1c2VkX3JlZ2lzdHJ5LnZhbHVlLAogICAgLy8gICAgIHBhdXNlZF9wcm9wb3NhbHM9c2VsZi5wYXVzZWRfcHJvcG9zYWxzLnZhbHVlLAogICAgLy8gICAgIHhnb3ZfbWFuYWdlcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIHhnb3ZfcGF5b3I9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICB4Z292X2NvdW5jaWw9c2VsZi54Z292X2NvdW5jaWwudmFsdWUsCiAgICAvLyAgICAgeGdvdl9zdWJzY3JpYmVyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAga3ljX3Byb3ZpZGVyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgY29tbWl0dGVlX21hbmFnZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICB4Z292X2RhZW1vbj1zZWxmLnhnb3ZfZGFlbW9uLnZhbHVlLAogICAgLy8gICAgIHhnb3ZfZmVlPVVJbnQ2NCgwKSwKICAgIC8vICAgICBwcm9wb3Nlcl9mZWU9VUludDY0KDApLAogICAgLy8gICAgIG9wZW5fcHJvcG9zYWxfZmVlPXNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUsCiAgICAvLyAgICAgZGFlbW9uX29wc19mdW5kaW5nX2Jwcz1zZWxmLmRhZW1vbl9vcHNfZnVuZGluZ19icHMudmFsdWUsCiAgICAvLyAgICAgcHJvcG9zYWxfY29tbWl0bWVudF9icHM9c2VsZi5wcm9wb3NhbF9jb21taXRtZW50X2Jwcy52YWx1ZSwKICAgIC8vICAgICBtaW5fcmVxdWVzdGVkX2Ftb3VudD1zZWxmLm1pbl9yZXF1ZXN0ZWRfYW1vdW50LnZhbHVlLAogICAgLy8gICAgIG1heF9yZXF1ZXN0ZWRfYW1vdW50PUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLm1heF9yZXF1ZXN0ZWRfYW1vdW50X21lZGl1bS52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIGRpc2N1c3Npb25fZHVyYXRpb249Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYuZGlzY3Vzc2lvbl9kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIHZvdGluZ19kdXJhdGlvbj1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX21lZGl1bS52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25feGxhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBxdW9ydW09Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi5xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnF1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgICAgICAgICBzZWxmLnF1b3J1bV9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgd2VpZ2h0ZWRfcXVvcnVtPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYud2VpZ2h0ZWRfcXVvcnVtX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbWVkaXVtLnZhbHVlLCAgIyBObyBsb25nZXIgdXNlZAogICAgLy8gICAgICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIG91dHN0YW5kaW5nX2Z1bmRzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBwZW5kaW5nX3Byb3Bvc2Fscz1VSW50NjQoMCksCiAgICAvLyAgICAgY29tbWl0dGVlX2lkPXNlbGYuY29tbWl0dGVlX2lkLnZhbHVlLmNvcHkoKSwKICAgIC8vICAgICBjb21taXR0ZWVfbWVtYmVycz1zZWxmLmNvbW1pdHRlZV9tZW1iZXJzLnZhbHVlLAogICAgLy8gICAgIGNvbW1pdHRlZV92b3Rlcz1zZWxmLmNvbW1pdHRlZV92b3Rlcy52YWx1ZSwKICAgIC8vICAgICBhYnNlbmNlX3RvbGVyYW5jZT1zZWxmLmFic2VuY2VfdG9sZXJhbmNlLnZhbHVlLAogICAgLy8gICAgIGdvdmVybmFuY2VfcGVyaW9kPXNlbGYuZ292ZXJuYW5jZV9wZXJpb2QudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX2dyYWNlX3BlcmlvZD1zZWxmLmNvbW1pdHRlZV9ncmFjZV9wZXJpb2QudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX2xhc3RfYW5jaG9yPXNlbGYuY29tbWl0dGVlX2xhc3RfYW5jaG9yLnZhbHVlLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDI2CiAgICBzZXRiaXQKICAgIGludGNfMSAvLyAxCiAgICB1bmNvdmVyIDI1CiAgICBzZXRiaXQKICAgIHVuY292ZXIgMjMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIxCiAgICBjb25jYXQKICAgIHVuY292ZXIgMjAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxOQogICAgY29uY2F0CiAgICB1bmNvdmVyIDE4CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTcKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1OTEKICAgIC8vIHhnb3ZfZmVlPVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU4MS02NDMKICAgIC8vIHJldHVybiB0eXAuVHlwZWRHbG9iYWxTdGF0ZSgKICAgIC8vICAgICBwYXVzZWRfcmVnaXN0cnk9c2VsZi5wYXVzZWRfcmVnaXN0cnkudmFsdWUsCiAgICAvLyAgICAgcGF1c2VkX3Byb3Bvc2Fscz1zZWxmLnBhdXNlZF9wcm9wb3NhbHMudmFsdWUsCiAgICAvLyAgICAgeGdvdl9tYW5hZ2VyPUdsb2JhbC56ZXJvX2FkZHJlc3MsCiAgICAvLyAgICAgeGdvdl9wYXlvcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIHhnb3ZfY291bmNpbD1zZWxmLnhnb3ZfY291bmNpbC52YWx1ZSwKICAgIC8vICAgICB4Z292X3N1YnNjcmliZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICBreWNfcHJvdmlkZXI9R2xvYmFsLnplcm9fYWRkcmVzcywKICAgIC8vICAgICBjb21taXR0ZWVfbWFuYWdlcj1HbG9iYWwuemVyb19hZGRyZXNzLAogICAgLy8gICAgIHhnb3ZfZGFlbW9uPXNlbGYueGdvdl9kYWVtb24udmFsdWUsCiAgICAvLyAgICAgeGdvdl9mZWU9VUludDY0KDApLAogICAgLy8gICAgIHByb3Bvc2VyX2ZlZT1VSW50NjQoMCksCiAgICAvLyAgICAgb3Blbl9wcm9wb3NhbF9mZWU9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSwKICAgIC8vICAgICBkYWVtb25fb3BzX2Z1bmRpbmdfYnBzPXNlbGYuZGFlbW9uX29wc19mdW5kaW5nX2Jwcy52YWx1ZSwKICAgIC8vICAgICBwcm9wb3NhbF9jb21taXRtZW50X2Jwcz1zZWxmLnByb3Bvc2FsX2NvbW1pdG1lbnRfYnBzLnZhbHVlLAogICAgLy8gICAgIG1pbl9yZXF1ZXN0ZWRfYW1vdW50PXNlbGYubWluX3JlcXVlc3RlZF9hbW91bnQudmFsdWUsCiAgICAvLyAgICAgbWF4X3JlcXVlc3RlZF9hbW91bnQ9Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYubWF4X3JlcXVlc3RlZF9hbW91bnRfbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5tYXhfcmVxdWVzdGVkX2Ftb3VudF9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgZGlzY3Vzc2lvbl9kdXJhdGlvbj1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLmRpc2N1c3Npb25fZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi5kaXNjdXNzaW9uX2R1cmF0aW9uX3hsYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgdm90aW5nX2R1cmF0aW9uPUZpeGVkQXJyYXkoCiAgICAvLyAgICAgICAgICgKICAgIC8vICAgICAgICAgICAgIHNlbGYudm90aW5nX2R1cmF0aW9uX3NtYWxsLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbWVkaXVtLnZhbHVlLAogICAgLy8gICAgICAgICAgICAgc2VsZi52b3RpbmdfZHVyYXRpb25fbGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLnZvdGluZ19kdXJhdGlvbl94bGFyZ2UudmFsdWUsCiAgICAvLyAgICAgICAgICkKICAgIC8vICAgICApLAogICAgLy8gICAgIHF1b3J1bT1GaXhlZEFycmF5KAogICAgLy8gICAgICAgICAoCiAgICAvLyAgICAgICAgICAgICBzZWxmLnF1b3J1bV9zbWFsbC52YWx1ZSwKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX21lZGl1bS52YWx1ZSwgICMgTm8gbG9uZ2VyIHVzZWQKICAgIC8vICAgICAgICAgICAgIHNlbGYucXVvcnVtX2xhcmdlLnZhbHVlLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICB3ZWlnaHRlZF9xdW9ydW09Rml4ZWRBcnJheSgKICAgIC8vICAgICAgICAgKAogICAgLy8gICAgICAgICAgICAgc2VsZi53ZWlnaHRlZF9xdW9ydW1fc21hbGwudmFsdWUsCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9tZWRpdW0udmFsdWUsICAjIE5vIGxvbmdlciB1c2VkCiAgICAvLyAgICAgICAgICAgICBzZWxmLndlaWdodGVkX3F1b3J1bV9sYXJnZS52YWx1ZSwKICAgIC8vICAgICAgICAgKQogICAgLy8gICAgICksCiAgICAvLyAgICAgb3V0c3RhbmRpbmdfZnVuZHM9VUludDY0KDApLAogICAgLy8gICAgIHBlbmRpbmdfcHJvcG9zYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBjb21taXR0ZWVfaWQ9c2VsZi5jb21taXR0ZWVfaWQudmFsdWUuY29weSgpLAogICAgLy8gICAgIGNvbW1pdHRlZV9tZW1iZXJzPXNlbGYuY29tbWl0dGVlX21lbWJlcnMudmFsdWUsCiAgICAvLyAgICAgY29tbWl0dGVlX3ZvdGVzPXNlbGYuY29tbWl0dGVlX3ZvdGVzLnZhbHVlLAogICAgLy8gICAgIGFic2VuY2VfdG9sZXJhbmNlPXNlbGYuYWJzZW5jZV90b2xlcmFuY2UudmFsdWUsCiAgICAvLyAgICAgZ292ZXJuYW5jZV9wZXJpb2Q9c2VsZi5nb3Zlcm5hbmNlX3BlcmlvZC52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfZ3JhY2VfcGVyaW9kPXNlbGYuY29tbWl0dGVlX2dyYWNlX3BlcmlvZC52YWx1ZSwKICAgIC8vICAgICBjb21taXR0ZWVfbGFzdF9hbmNob3I9c2VsZi5jb21taXR0ZWVfbGFzdF9hbmNob3IudmFsdWUsCiAgICAvLyApCiAgICBpdG9iCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDE3CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTYKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNQogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDE0CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDExCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBjb25jYXQKICAgIHVuY292ZXIgNgogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGl0b2IKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjU3OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF94Z292X2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF94Z292X2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHB1c2hieXRlcyBiYXNlMzIoQ1VQWFk1SUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suZ2V0X3hnb3ZfYm94ZXNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfeGdvdl9ib3hlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjYxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1MDAwMAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF9wcm9wb3Nlcl9ib3hbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvcG9zZXJfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo2NjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF9wcm9wb3Nlcl9ib3hlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9wb3Nlcl9ib3hlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NjgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhY2NvdW50PgogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1MDAwMAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF9yZXF1ZXN0X2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXF1ZXN0X2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Njg4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBieXRlYyA0NSAvLyBiYXNlMzIoQ1VQWFk1SUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5nZXRfcmVxdWVzdF9ib3hlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXF1ZXN0X2JveGVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3MDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8dWludDY0PgogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1MDAwMAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzA5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBieXRlYyA0NSAvLyBiYXNlMzIoQ1VQWFk1SUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5nZXRfcmVxdWVzdF91bnN1YnNjcmliZV9ib3hlc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9yZXF1ZXN0X3Vuc3Vic2NyaWJlX2JveGVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3MjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8dWludDY0PgogICAgYnl0ZWMgNCAvLyAweDE1MWY3Yzc1MDAwMAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLmdldF9wcm9wb3NhbHNfc3VtbWFyeVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9wb3NhbHNfc3VtbWFyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzI4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PHVpbnQ2ND4KICAgIGJ5dGVjIDQgLy8gMHgxNTFmN2M3NTAwMDAKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5pc19wcm9wb3NhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmlzX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3MzQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay5jcmVhdGVfZW1wdHlfcHJvcG9zYWxbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfZW1wdHlfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjczOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NTEKICAgIC8vIGFwcHJvdmFsX2xlbmd0aCA9IHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5sZW5ndGgKICAgIGJ5dGVjXzEgLy8gMHg3MDYxCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NTMKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzU0LTc2OAogICAgLy8gcmVzID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBQcm9wb3NhbC5jcmVhdGUsCiAgICAvLyAgICAgcHJvcG9zZXIsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT0oCiAgICAvLyAgICAgICAgIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5leHRyYWN0KDAsIGJ5dGVzX3Blcl9wYWdlKSwKICAgIC8vICAgICAgICAgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoCiAgICAvLyAgICAgICAgICAgICBieXRlc19wZXJfcGFnZSwgYXBwcm92YWxfbGVuZ3RoIC0gYnl0ZXNfcGVyX3BhZ2UKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29tcGlsZWRfY2xlYXJfc3RhdGVfMSwKICAgIC8vICAgICBnbG9iYWxfbnVtX3VpbnQ9cHJvcF9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9cHJvcF9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9KGFwcHJvdmFsX2xlbmd0aCArIGNvbXBpbGVkX2NsZWFyX3N0YXRlXzEubGVuZ3RoKQogICAgLy8gICAgIC8vIGJ5dGVzX3Blcl9wYWdlLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NTgKICAgIC8vIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5leHRyYWN0KDAsIGJ5dGVzX3Blcl9wYWdlKSwKICAgIGJ5dGVjXzEgLy8gMHg3MDYxCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NTAKICAgIC8vIGJ5dGVzX3Blcl9wYWdlID0gVUludDY0KEJZVEVTX1BFUl9BUFBfUEFHRSkKICAgIGludGMgNCAvLyAyMDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc1OAogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoMCwgYnl0ZXNfcGVyX3BhZ2UpLAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzYwCiAgICAvLyBieXRlc19wZXJfcGFnZSwgYXBwcm92YWxfbGVuZ3RoIC0gYnl0ZXNfcGVyX3BhZ2UKICAgIGRpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc1MAogICAgLy8gYnl0ZXNfcGVyX3BhZ2UgPSBVSW50NjQoQllURVNfUEVSX0FQUF9QQUdFKQogICAgaW50YyA0IC8vIDIwNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzYwCiAgICAvLyBieXRlc19wZXJfcGFnZSwgYXBwcm92YWxfbGVuZ3RoIC0gYnl0ZXNfcGVyX3BhZ2UKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzU5CiAgICAvLyBzZWxmLnByb3Bvc2FsX2FwcHJvdmFsX3Byb2dyYW0uZXh0cmFjdCgKICAgIGJ5dGVjXzEgLy8gMHg3MDYxCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5Ojc1MAogICAgLy8gYnl0ZXNfcGVyX3BhZ2UgPSBVSW50NjQoQllURVNfUEVSX0FQUF9QQUdFKQogICAgaW50YyA0IC8vIDIwNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzU5LTc2MQogICAgLy8gc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoCiAgICAvLyAgICAgYnl0ZXNfcGVyX3BhZ2UsIGFwcHJvdmFsX2xlbmd0aCAtIGJ5dGVzX3Blcl9wYWdlCiAgICAvLyApLAogICAgdW5jb3ZlciAyCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NjYKICAgIC8vIGV4dHJhX3Byb2dyYW1fcGFnZXM9KGFwcHJvdmFsX2xlbmd0aCArIGNvbXBpbGVkX2NsZWFyX3N0YXRlXzEubGVuZ3RoKQogICAgdW5jb3ZlciAzCiAgICBwdXNoaW50IDQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzUwCiAgICAvLyBieXRlc19wZXJfcGFnZSA9IFVJbnQ2NChCWVRFU19QRVJfQVBQX1BBR0UpCiAgICBpbnRjIDQgLy8gMjA0OAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NjYtNzY3CiAgICAvLyBleHRyYV9wcm9ncmFtX3BhZ2VzPShhcHByb3ZhbF9sZW5ndGggKyBjb21waWxlZF9jbGVhcl9zdGF0ZV8xLmxlbmd0aCkKICAgIC8vIC8vIGJ5dGVzX3Blcl9wYWdlLAogICAgLwogICAgaXR4bl9maWVsZCBFeHRyYVByb2dyYW1QYWdlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NjUKICAgIC8vIGdsb2JhbF9udW1fYnl0ZXM9cHJvcF9jZmcuR0xPQkFMX0JZVEVTLAogICAgcHVzaGludCA0CiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bUJ5dGVTbGljZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NjQKICAgIC8vIGdsb2JhbF9udW1fdWludD1wcm9wX2NmZy5HTE9CQUxfVUlOVFMsCiAgICBwdXNoaW50IDI5CiAgICBpdHhuX2ZpZWxkIEdsb2JhbE51bVVpbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzQ0LTc0OAogICAgLy8gIyBUaGUgUHJvcG9zYWwgQXBwcm92YWwgUHJvZ3JhbSBpcyBsb2FkZWQgZnJvbSBhIGJveCwgYXMgdGhlIHhHb3YgUmVnaXN0cnkKICAgIC8vICMgZG9lcywgc28gdGhlIG1vY2sgcHJvZ3JhbSBkb2VzIG5vdCBlbWJlZCBpdAogICAgLy8gY29tcGlsZWRfY2xlYXJfc3RhdGVfMSwgX2NvbXBpbGVkX2NsZWFyX3N0YXRlXzIgPSBjb21waWxlX2NvbnRyYWN0KAogICAgLy8gICAgIFByb3Bvc2FsCiAgICAvLyApLmNsZWFyX3N0YXRlX3Byb2dyYW0KICAgIHB1c2hieXRlcyBiYXNlNjQoQ29FQlF3PT0pCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtUGFnZXMKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtUGFnZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzU1CiAgICAvLyBQcm9wb3NhbC5jcmVhdGUsCiAgICBwdXNoYnl0ZXMgMHhjYzY5NGVhYSAvLyBtZXRob2QgImNyZWF0ZShhZGRyZXNzKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzU0LTc2OAogICAgLy8gcmVzID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBQcm9wb3NhbC5jcmVhdGUsCiAgICAvLyAgICAgcHJvcG9zZXIsCiAgICAvLyAgICAgYXBwcm92YWxfcHJvZ3JhbT0oCiAgICAvLyAgICAgICAgIHNlbGYucHJvcG9zYWxfYXBwcm92YWxfcHJvZ3JhbS5leHRyYWN0KDAsIGJ5dGVzX3Blcl9wYWdlKSwKICAgIC8vICAgICAgICAgc2VsZi5wcm9wb3NhbF9hcHByb3ZhbF9wcm9ncmFtLmV4dHJhY3QoCiAgICAvLyAgICAgICAgICAgICBieXRlc19wZXJfcGFnZSwgYXBwcm92YWxfbGVuZ3RoIC0gYnl0ZXNfcGVyX3BhZ2UKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y29tcGlsZWRfY2xlYXJfc3RhdGVfMSwKICAgIC8vICAgICBnbG9iYWxfbnVtX3VpbnQ9cHJvcF9jZmcuR0xPQkFMX1VJTlRTLAogICAgLy8gICAgIGdsb2JhbF9udW1fYnl0ZXM9cHJvcF9jZmcuR0xPQkFMX0JZVEVTLAogICAgLy8gICAgIGV4dHJhX3Byb2dyYW1fcGFnZXM9KGFwcHJvdmFsX2xlbmd0aCArIGNvbXBpbGVkX2NsZWFyX3N0YXRlXzEubGVuZ3RoKQogICAgLy8gICAgIC8vIGJ5dGVzX3Blcl9wYWdlLAogICAgLy8gKQogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzY5CiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzcxLTc3NQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXJlcy5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1zZWxmLm9wZW5fcHJvcG9zYWxfZmVlLnZhbHVlIC0gKG1icl9hZnRlciAtIG1icl9iZWZvcmUpLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NzIKICAgIC8vIHJlY2VpdmVyPXJlcy5jcmVhdGVkX2FwcC5hZGRyZXNzLAogICAgZGlnIDEKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NzczCiAgICAvLyBhbW91bnQ9c2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZS52YWx1ZSAtIChtYnJfYWZ0ZXIgLSBtYnJfYmVmb3JlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAweDZmNzA2NTZlNWY3MDcyNmY3MDZmNzM2MTZjNWY2NjY1NjUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcGVuX3Byb3Bvc2FsX2ZlZSBleGlzdHMKICAgIHVuY292ZXIgMgogICAgdW5jb3ZlciA0CiAgICAtCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NzEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Nzc0CiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3NzEtNzc1CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9cmVzLmNyZWF0ZWRfYXBwLmFkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PXNlbGYub3Blbl9wcm9wb3NhbF9mZWUudmFsdWUgLSAobWJyX2FmdGVyIC0gbWJyX2JlZm9yZSksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo3MzgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgpCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWwocHJvcG9zYWxfaWQ6IHVpbnQ2NCwgeGdvdl9hZGRyZXNzOiBieXRlcywgYXBwcm92YWxfdm90ZXM6IHVpbnQ2NCwgcmVqZWN0aW9uX3ZvdGVzOiB1aW50NjQpIC0+IHZvaWQ6CnNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNTQtMzYyCiAgICAvLyBAYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHZvdGVfcHJvcG9zYWwoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAqLAogICAgLy8gICAgIHByb3Bvc2FsX2lkOiBBcHBsaWNhdGlvbiwKICAgIC8vICAgICB4Z292X2FkZHJlc3M6IEFjY291bnQsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXM6IFVJbnQ2NCwKICAgIC8vICAgICByZWplY3Rpb25fdm90ZXM6IFVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNjMtMzY5CiAgICAvLyBlcnJvciwgX3R4ID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBQcm9wb3NhbC52b3RlLAogICAgLy8gICAgIHhnb3ZfYWRkcmVzcywKICAgIC8vICAgICBhcHByb3ZhbF92b3RlcywKICAgIC8vICAgICByZWplY3Rpb25fdm90ZXMsCiAgICAvLyAgICAgYXBwX2lkPXByb3Bvc2FsX2lkLAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNjYKICAgIC8vIGFwcHJvdmFsX3ZvdGVzLAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM2NwogICAgLy8gcmVqZWN0aW9uX3ZvdGVzLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNjQKICAgIC8vIFByb3Bvc2FsLnZvdGUsCiAgICBwdXNoYnl0ZXMgMHgxODQxYTBkMiAvLyBtZXRob2QgInZvdGUoYWRkcmVzcyx1aW50NjQsdWludDY0KXN0cmluZyIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzYzLTM2OQogICAgLy8gZXJyb3IsIF90eCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgUHJvcG9zYWwudm90ZSwKICAgIC8vICAgICB4Z292X2FkZHJlc3MsCiAgICAvLyAgICAgYXBwcm92YWxfdm90ZXMsCiAgICAvLyAgICAgcmVqZWN0aW9uX3ZvdGVzLAogICAgLy8gICAgIGFwcF9pZD1wcm9wb3NhbF9pZCwKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIExhc3RMb2cKICAgIGR1cG4gMgogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIHN0cmluZwogICAgZXh0cmFjdCA2IDAKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzEKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgNAogICAgPAogICAgYnogc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfdGVybmFyeV9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMAoKc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfdGVybmFyeV9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzEKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgYnogc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfYWZ0ZXJfaWZfZWxzZUAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzIKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzc0CiAgICAvLyBjYXNlIGVyci5VTkFVVEhPUklaRUQ6CiAgICBieXRlYyA0MyAvLyAiVW5hdXRob3JpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzYKICAgIC8vIGNhc2UgZXJyLlZPVEVSX05PVF9GT1VORDoKICAgIGJ5dGVjIDEwIC8vICJWb3RlciBub3QgZm91bmQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM3OAogICAgLy8gY2FzZSBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRDoKICAgIGJ5dGVjIDE2IC8vICJWb3RlciBhbHJlYWR5IHZvdGVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODAKICAgIC8vIGNhc2UgZXJyLlZPVEVTX0lOVkFMSUQ6CiAgICBieXRlYyAxNyAvLyAiVm90ZXMgaW52YWxpZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6MzgyCiAgICAvLyBjYXNlIGVyci5NSVNTSU5HX0NPTkZJRzoKICAgIGJ5dGVjIDQ0IC8vICJNaXNzaW5nIENvbmZpZyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzg0CiAgICAvLyBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICBieXRlY18yIC8vICJXcm9uZyBQcm9wb3NhbCBTdGF0dXMgb3IgZmluYWxpemVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozODYKICAgIC8vIGNhc2UgZXJyLlZPVElOR19QRVJJT0RfRVhQSVJFRDoKICAgIGJ5dGVjIDE4IC8vICJWb3RpbmcgUGVyaW9kIEV4cGlyZWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM3My0zODkKICAgIC8vIG1hdGNoIGVycm9yX3dpdGhvdXRfcHJlZml4OgogICAgLy8gICAgIGNhc2UgZXJyLlVOQVVUSE9SSVpFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVU5BVVRIT1JJWkVEICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSX05PVF9GT1VORCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVJfQUxSRUFEWV9WT1RFRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVNfSU5WQUxJRDoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVNfSU5WQUxJRCAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuTUlTU0lOR19DT05GSUc6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLk1JU1NJTkdfQ09ORklHICAjIG5vcWEKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9USU5HX1BFUklPRF9FWFBJUkVEOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQgICMgbm9xYQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgdW5jb3ZlciA3CiAgICBtYXRjaCBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8wQDYgc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMUA3IHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzJAOCBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8zQDkgc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfNEAxMCBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV81QDExIHNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzZAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzg5CiAgICAvLyBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfNkAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzg3CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RJTkdfUEVSSU9EX0VYUElSRUQgICMgbm9xYQogICAgZXJyIC8vIFZvdGluZyBQZXJpb2QgRXhwaXJlZAoKc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfNUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzg1CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMgICMgbm9xYQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCnNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzRAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM4MwogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuTUlTU0lOR19DT05GSUcgICMgbm9xYQogICAgZXJyIC8vIE1pc3NpbmcgQ29uZmlnCgpzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF9zd2l0Y2hfY2FzZV8zQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM4MQogICAgLy8gYXNzZXJ0IEZhbHNlLCBlcnIuVk9URVNfSU5WQUxJRCAgIyBub3FhCiAgICBlcnIgLy8gVm90ZXMgaW52YWxpZAoKc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMkA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzkKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLlZPVEVSX0FMUkVBRFlfVk9URUQgICMgbm9xYQogICAgZXJyIC8vIFZvdGVyIGFscmVhZHkgdm90ZWQKCnNtYXJ0X2NvbnRyYWN0cy54Z292X3JlZ2lzdHJ5X21vY2suY29udHJhY3QuWGdvdlJlZ2lzdHJ5TW9jay52b3RlX3Byb3Bvc2FsX3N3aXRjaF9jYXNlXzFANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6Mzc3CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUl9OT1RfRk9VTkQgICMgbm9xYQogICAgZXJyIC8vIFZvdGVyIG5vdCBmb3VuZAoKc21hcnRfY29udHJhY3RzLnhnb3ZfcmVnaXN0cnlfbW9jay5jb250cmFjdC5YZ292UmVnaXN0cnlNb2NrLnZvdGVfcHJvcG9zYWxfc3dpdGNoX2Nhc2VfMEA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTozNzUKICAgIC8vIGFzc2VydCBGYWxzZSwgZXJyLlVOQVVUSE9SSVpFRCAgIyBub3FhCiAgICBlcnIgLy8gVW5hdXRob3JpemVkCgpzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF9hZnRlcl9pZl9lbHNlQDE0OgogICAgcmV0c3ViCgpzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF90ZXJuYXJ5X2ZhbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjM3MQogICAgLy8gaWYgZXJyb3Iuc3RhcnRzd2l0aChlcnIuQVJDXzY1X1BSRUZJWCk6CiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCA2IDQKICAgIGJ5dGVjXzMgLy8gIkVSUjoiCiAgICA9PQogICAgYiBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2sudm90ZV9wcm9wb3NhbF90ZXJuYXJ5X21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMueGdvdl9yZWdpc3RyeV9tb2NrLmNvbnRyYWN0Llhnb3ZSZWdpc3RyeU1vY2suYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yKGVycm9yOiBieXRlcykgLT4gdm9pZDoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MDgKICAgIC8vIGRlZiBhc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3Ioc2VsZiwgZXJyb3I6IHR5cC5FcnJvcikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MDkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCA0CiAgICA8CiAgICBieiBhc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3JfdGVybmFyeV9mYWxzZUAyCiAgICBpbnRjXzAgLy8gMAoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3Rlcm5hcnlfbWVyZ2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTA5CiAgICAvLyBpZiBlcnJvci5zdGFydHN3aXRoKGVyci5BUkNfNjVfUFJFRklYKToKICAgIGJ6IGFzc2VydF9ub191bmFzc2lnbl9lcnJvcl9lbHNlX2JvZHlAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MTAKICAgIC8vIGVycm9yX3dpdGhvdXRfcHJlZml4ID0gU3RyaW5nLmZyb21fYnl0ZXMoZXJyb3IuYnl0ZXNbNDpdKQogICAgcHVzaGludCA0CiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICA+PQogICAgcHVzaGludCA0CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMveGdvdl9yZWdpc3RyeV9tb2NrL2NvbnRyYWN0LnB5OjUxMgogICAgLy8gY2FzZSBlcnIuV1JPTkdfUFJPUE9TQUxfU1RBVFVTOgogICAgYnl0ZWNfMiAvLyAiV3JvbmcgUHJvcG9zYWwgU3RhdHVzIG9yIGZpbmFsaXplZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTE0CiAgICAvLyBjYXNlIGVyci5WT1RFUl9OT1RfRk9VTkQ6CiAgICBieXRlYyAxMCAvLyAiVm90ZXIgbm90IGZvdW5kIgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MTEtNTE3CiAgICAvLyBtYXRjaCBlcnJvcl93aXRob3V0X3ByZWZpeDoKICAgIC8vICAgICBjYXNlIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVM6CiAgICAvLyAgICAgICAgIGFzc2VydCBGYWxzZSwgZXJyLldST05HX1BST1BPU0FMX1NUQVRVUyAgIyBub3FhCiAgICAvLyAgICAgY2FzZSBlcnIuVk9URVJfTk9UX0ZPVU5EOgogICAgLy8gICAgICAgICBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUl9OT1RfRk9VTkQgICMgbm9xYQogICAgLy8gICAgIGNhc2UgXzoKICAgIC8vICAgICAgICAgYXNzZXJ0IEZhbHNlLCAiVW5rbm93biBlcnJvciIgICMgbm9xYQogICAgdW5jb3ZlciAyCiAgICBtYXRjaCBhc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3Jfc3dpdGNoX2Nhc2VfMEA1IGFzc2VydF9ub191bmFzc2lnbl9lcnJvcl9zd2l0Y2hfY2FzZV8xQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTE3CiAgICAvLyBhc3NlcnQgRmFsc2UsICJVbmtub3duIGVycm9yIiAgIyBub3FhCiAgICBlcnIgLy8gVW5rbm93biBlcnJvcgoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3N3aXRjaF9jYXNlXzFANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTE1CiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5WT1RFUl9OT1RfRk9VTkQgICMgbm9xYQogICAgZXJyIC8vIFZvdGVyIG5vdCBmb3VuZAoKYXNzZXJ0X25vX3VuYXNzaWduX2Vycm9yX3N3aXRjaF9jYXNlXzBANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTEzCiAgICAvLyBhc3NlcnQgRmFsc2UsIGVyci5XUk9OR19QUk9QT1NBTF9TVEFUVVMgICMgbm9xYQogICAgZXJyIC8vIFdyb25nIFByb3Bvc2FsIFN0YXR1cyBvciBmaW5hbGl6ZWQKCmFzc2VydF9ub191bmFzc2lnbl9lcnJvcl9lbHNlX2JvZHlAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy94Z292X3JlZ2lzdHJ5X21vY2svY29udHJhY3QucHk6NTE5CiAgICAvLyBhc3NlcnQgZXJyb3IgPT0gIiIsICJVbmtub3duIGVycm9yIgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoYnl0ZXMgIiIKICAgID09CiAgICBhc3NlcnQgLy8gVW5rbm93biBlcnJvcgogICAgcmV0c3ViCgphc3NlcnRfbm9fdW5hc3NpZ25fZXJyb3JfdGVybmFyeV9mYWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3hnb3ZfcmVnaXN0cnlfbW9jay9jb250cmFjdC5weTo1MDkKICAgIC8vIGlmIGVycm9yLnN0YXJ0c3dpdGgoZXJyLkFSQ182NV9QUkVGSVgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMyAvLyAiRVJSOiIKICAgID09CiAgICBiIGFzc2VydF9ub191bmFzc2lnbl9lcnJvcl90ZXJuYXJ5X21lcmdlQDMK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [3044, 4021], "errorMessage": "Missing Config"}, {"pc": [3043], "errorMessage": "There are voters assigned to this proposal"}, {"pc": [2883, 4025], "errorMessage": "Unauthorized"}, {"pc": [2362, 2571, 2881, 3042, 3153, 4018, 4086, 4094], "errorMessage": "Unknown error"}, {"pc": [2366, 2575, 4023], "errorMessage": "Voter already voted"}, {"pc": [2367, 2576, 4024, 4087], "errorMessage": "Voter not found"}, {"pc": [2365, 2574, 4022], "errorMessage": "Votes invalid"}, {"pc": [2363, 2572, 4019], "errorMessage": "Voting Period Expired"}, {"pc": [2364, 2573, 2882, 3045, 3154, 4020, 4088], "errorMessage": "Wrong Proposal Status or finalized"}, {"pc": [3777, 3851], "errorMessage": "account funded"}, {"pc": [3857], "errorMessage": "application exists"}, {"pc": [2287, 2496, 2644, 2758, 2818, 2933, 3095, 3935], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [3405], "errorMessage": "check self.absence_tolerance exists"}, {"pc": [3415], "errorMessage": "check self.committee_grace_period exists"}, {"pc": [3390], "errorMessage": "check self.committee_id exists"}, {"pc": [3420], "errorMessage": "check self.committee_last_anchor exists"}, {"pc": [3395], "errorMessage": "check self.committee_members exists"}, {"pc": [3400], "errorMessage": "check self.committee_votes exists"}, {"pc": [3232], "errorMessage": "check self.daemon_ops_funding_bps exists"}, {"pc": [3282], "errorMessage": "check self.discussion_duration_large exists"}, {"pc": [3277], "errorMessage": "check self.discussion_duration_medium exists"}, {"pc": [3272], "errorMessage": "check self.discussion_duration_small exists"}, {"pc": [3287], "errorMessage": "check self.discussion_duration_xlarge exists"}, {"pc": [3410], "errorMessage": "check self.governance_period exists"}, {"pc": [3257], "errorMessage": "check self.max_requested_amount_large exists"}, {"pc": [3252], "errorMessage": "check self.max_requested_amount_medium exists"}, {"pc": [3247], "errorMessage": "check self.max_requested_amount_small exists"}, {"pc": [3242], "errorMessage": "check self.min_requested_amount exists"}, {"pc": [3227, 3862], "errorMessage": "check self.open_proposal_fee exists"}, {"pc": [3205], "errorMessage": "check self.paused_proposals exists"}, {"pc": [3200], "errorMessage": "check self.paused_registry exists"}, {"pc": [3772], "errorMessage": "check self.proposal_approval_program exists"}, {"pc": [3237], "errorMessage": "check self.proposal_commitment_bps exists"}, {"pc": [3350], "errorMessage": "check self.quorum_large exists"}, {"pc": [3345], "errorMessage": "check self.quorum_medium exists"}, {"pc": [3340], "errorMessage": "check self.quorum_small exists"}, {"pc": [3316], "errorMessage": "check self.voting_duration_large exists"}, {"pc": [3311], "errorMessage": "check self.voting_duration_medium exists"}, {"pc": [3306], "errorMessage": "check self.voting_duration_small exists"}, {"pc": [3321], "errorMessage": "check self.voting_duration_xlarge exists"}, {"pc": [3375], "errorMessage": "check self.weighted_quorum_large exists"}, {"pc": [3370], "errorMessage": "check self.weighted_quorum_medium exists"}, {"pc": [3365], "errorMessage": "check self.weighted_quorum_small exists"}, {"pc": [3213], "errorMessage": "check self.xgov_council exists"}, {"pc": [3222], "errorMessage": "check self.xgov_daemon exists"}, {"pc": [2197], "errorMessage": "index access is out of bounds"}, {"pc": [1711, 2160, 2244, 2294, 2418, 2503, 2603, 2651, 2705, 2765, 2825, 2940, 3102, 3608, 3654, 3686, 3718, 3738, 3942], "errorMessage": "invalid array length header"}, {"pc": [1980], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [2613, 3617, 3663], "errorMessage": "invalid number of bytes for arc4.dynamic_array<account>"}, {"pc": [2428, 2715], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [1719], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [2173], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.ProposalVote>"}, {"pc": [2255], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.common.abi_types.XGovVote>"}, {"pc": [3695, 3727, 3747], "errorMessage": "invalid number of bytes for arc4.dynamic_array<uint64>"}, {"pc": [1735, 1744, 1754, 1767, 1776, 1785, 1795, 1819, 1837, 1864, 1871, 1896, 1903, 1946, 1953, 1973, 1997, 2044, 2070, 2122, 2153, 2396, 2683, 3536, 3629, 3769], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [1676, 1704, 1846, 1855, 1878, 1910, 1928, 1937, 1987, 2005, 2014, 2052, 2061, 2113, 2130, 2139, 2237, 2387, 2404, 2412, 2436, 2444, 2596, 2674, 2691, 2699, 2788, 2903, 3065, 3184, 3193, 3675, 3707, 3759], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1810], "errorMessage": "invalid number of bytes for smart_contracts.common.abi_types.XGovRegistryConfig"}, {"pc": [2301, 2510, 2658, 2772, 2832, 2947, 3109, 3949], "errorMessage": "invalid number of bytes for string"}, {"pc": [1828, 1887, 1919, 1964, 2100, 3175], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -327,6 +327,18 @@ class DeclareCommitteeArgs:
     def abi_method_signature(self) -> str:
         return "declare_committee(byte[32],uint64,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DeclareCommitteeWithRootArgs:
+    """Dataclass for declare_committee_with_root arguments"""
+    committee_id: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    size: int
+    votes: int
+    committee_root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class OpenProposalArgs:
     """Dataclass for open_proposal arguments"""
@@ -348,6 +360,41 @@ class VoteProposalArgs:
     def abi_method_signature(self) -> str:
         return "vote_proposal(uint64,address,uint64,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteProposalsArgs:
+    """Dataclass for vote_proposals arguments"""
+    xgov_address: str
+    votes: list[tuple[int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_proposals(address,(uint64,uint64,uint64)[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteProposalBatchArgs:
+    """Dataclass for vote_proposal_batch arguments"""
+    proposal_id: int
+    votes: list[tuple[str, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_proposal_batch(uint64,(address,uint64,uint64)[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VoteProposalWithProofArgs:
+    """Dataclass for vote_proposal_with_proof arguments"""
+    proposal_id: int
+    xgov_address: str
+    voting_power: int
+    ordinal: int
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+    approval_votes: int
+    rejection_votes: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class UnassignAbsenteeFromProposalArgs:
     """Dataclass for unassign_absentee_from_proposal arguments"""
@@ -358,6 +405,19 @@ class UnassignAbsenteeFromProposalArgs:
     def abi_method_signature(self) -> str:
         return "unassign_absentee_from_proposal(uint64,address[])void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class UnassignAbsenteeFromProposalWithProofArgs:
+    """Dataclass for unassign_absentee_from_proposal_with_proof arguments"""
+    proposal_id: int
+    xgov_address: str
+    voting_power: int
+    ordinal: int
+    proof: list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PayGrantProposalArgs:
     """Dataclass for pay_grant_proposal arguments"""
@@ -421,6 +481,15 @@ class GetXgovBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_xgov_box(address)((address,uint64,uint64,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetXgovBoxesArgs:
+    """Dataclass for get_xgov_boxes arguments"""
+    xgov_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetProposerBoxArgs:
     """Dataclass for get_proposer_box arguments"""
@@ -430,6 +499,15 @@ class GetProposerBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_proposer_box(address)((bool,bool,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetProposerBoxesArgs:
+    """Dataclass for get_proposer_boxes arguments"""
+    proposer_addresses: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetRequestBoxArgs:
     """Dataclass for get_request_box arguments"""
@@ -439,6 +517,15 @@ class GetRequestBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_request_box(uint64)((address,address,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRequestBoxesArgs:
+    """Dataclass for get_request_boxes arguments"""
+    request_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_request_boxes(uint64[])((address,address,uint64),bool)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetRequestUnsubscribeBoxArgs:
     """Dataclass for get_request_unsubscribe_box arguments"""
@@ -448,6 +535,24 @@ class GetRequestUnsubscribeBoxArgs:
     def abi_method_signature(self) -> str:
         return "get_request_unsubscribe_box(uint64)((address,address,uint64),bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRequestUnsubscribeBoxesArgs:
+    """Dataclass for get_request_unsubscribe_boxes arguments"""
+    request_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetProposalsSummaryArgs:
+    """Dataclass for get_proposals_summary arguments"""
+    proposal_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class IsProposalArgs:
     """Dataclass for is_proposal arguments"""
@@ -845,6 +950,19 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+            "args": method_args,
+        }))
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -871,6 +989,45 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+            "args": method_args,
+        }))
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -884,6 +1041,19 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+            "args": method_args,
+        }))
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -984,6 +1154,17 @@ class XgovRegistryMockParams:
             "method": "get_state()(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)",
         }))
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }))
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -997,6 +1178,19 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -1010,6 +1204,19 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -1023,6 +1230,19 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }))
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -1036,6 +1256,32 @@ class XgovRegistryMockParams:
             "args": method_args,
         }))
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }))
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -1473,6 +1719,19 @@ class XgovRegistryMockCreateTransactionParams:
             "args": method_args,
         }))
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+            "args": method_args,
+        }))
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -1499,6 +1758,45 @@ class XgovRegistryMockCreateTransactionParams:
             "args": method_args,
         }))
 
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+            "args": method_args,
+        }))
+
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+            "args": method_args,
+        }))
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -1512,6 +1810,19 @@ class XgovRegistryMockCreateTransactionParams:
             "args": method_args,
         }))
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+            "args": method_args,
+        }))
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -1612,6 +1923,17 @@ class XgovRegistryMockCreateTransactionParams:
             "method": "get_state()(bool,bool,address,address,address,address,address,address,address,uint64,uint64,uint64,uint64,uint64,uint64,uint64[3],uint64[4],uint64[4],uint64[3],uint64[3],uint64,uint64,byte[32],uint64,uint64,uint64,uint64,uint64,uint64)",
         }))
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }))
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -1625,80 +1947,145 @@ class XgovRegistryMockCreateTransactionParams:
             "args": method_args,
         }))
 
-    def get_proposer_box(
+    def get_xgov_boxes(
         self,
-        args: tuple[str] | GetProposerBoxArgs,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_proposer_box(address)((bool,bool,uint64),bool)",
+            "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
             "args": method_args,
         }))
 
-    def get_request_box(
+    def get_proposer_box(
         self,
-        args: tuple[int] | GetRequestBoxArgs,
+        args: tuple[str] | GetProposerBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_request_box(uint64)((address,address,uint64),bool)",
+            "method": "get_proposer_box(address)((bool,bool,uint64),bool)",
             "args": method_args,
         }))
 
-    def get_request_unsubscribe_box(
+    def get_proposer_boxes(
         self,
-        args: tuple[int] | GetRequestUnsubscribeBoxArgs,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_request_unsubscribe_box(uint64)((address,address,uint64),bool)",
+            "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
             "args": method_args,
         }))
 
-    def is_proposal(
+    def get_request_box(
         self,
-        args: tuple[int] | IsProposalArgs,
+        args: tuple[int] | GetRequestBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "is_proposal(uint64)void",
+            "method": "get_request_box(uint64)((address,address,uint64),bool)",
             "args": method_args,
         }))
 
-    def create_empty_proposal(
+    def get_request_boxes(
         self,
-        args: tuple[str] | CreateEmptyProposalArgs,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_empty_proposal(address)uint64",
+            "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
             "args": method_args,
         }))
 
-    def op_up(
+    def get_request_unsubscribe_box(
         self,
+        args: tuple[int] | GetRequestUnsubscribeBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "op_up()void",
+            "method": "get_request_unsubscribe_box(uint64)((address,address,uint64),bool)",
+            "args": method_args,
+        }))
+
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }))
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
+    def is_proposal(
+        self,
+        args: tuple[int] | IsProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "is_proposal(uint64)void",
+            "args": method_args,
+        }))
+
+    def create_empty_proposal(
+        self,
+        args: tuple[str] | CreateEmptyProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_empty_proposal(address)uint64",
+            "args": method_args,
+        }))
+
+    def op_up(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "op_up()void",
         }))
 
     def create(
@@ -2188,6 +2575,22 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -2220,6 +2623,54 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -2236,6 +2687,22 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -2360,6 +2827,20 @@ class XgovRegistryMockSend:
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(TypedGlobalState, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[TypedGlobalState], parsed_response)
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_state_version()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -2376,6 +2857,22 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, int, int, int], bool]], parsed_response)
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, int, int, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, int, int, int], bool]]], parsed_response)
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -2392,6 +2889,22 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[bool, bool, int], bool]], parsed_response)
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[bool, bool, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[bool, bool, int], bool]]], parsed_response)
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -2408,6 +2921,22 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, str, int], bool]], parsed_response)
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]], parsed_response)
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -2424,6 +2953,38 @@ class XgovRegistryMockSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, str, int], bool]], parsed_response)
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[tuple[str, str, int], bool]]], parsed_response)
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]], parsed_response)
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -2519,6 +3080,7 @@ class GlobalStateValue(typing.TypedDict):
     committee_id: bytes
     committee_members: int
     committee_votes: int
+    committee_root: bytes
     quorum_small: int
     quorum_medium: int
     quorum_large: int
@@ -2530,6 +3092,10 @@ class GlobalStateValue(typing.TypedDict):
     committee_grace_period: int
     committee_last_anchor: int
 
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    proposal_approval_program: bytes
+
 class XgovRegistryMockState:
     """Methods to access state for the current XgovRegistryMock app"""
 
@@ -2543,6 +3109,13 @@ class XgovRegistryMockState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -2742,6 +3315,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def committee_root(self) -> bytes:
+        """Get the current value of the committee_root key in global_state state"""
+        value = self.app_client.state.global_state.get_value("committee_root")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
     @property
     def quorum_small(self) -> int:
         """Get the current value of the quorum_small key in global_state state"""
@@ -2822,6 +3403,37 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def proposal_approval_program(self) -> bytes:
+        """Get the current value of the proposal_approval_program key in box state"""
+        value = self.app_client.state.box.get_value("proposal_approval_program")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
 class XgovRegistryMockClient:
     """Client for interacting with XgovRegistryMock smart contract"""
 
@@ -3134,6 +3746,12 @@ class XgovRegistryMockClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["declare_committee_with_root(byte[32],uint64,uint64,byte[32])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["open_proposal(pay)uint64"],
@@ -3146,12 +3764,36 @@ class XgovRegistryMockClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_proposals(address,(uint64,uint64,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_proposal_batch(uint64,(address,uint64,uint64)[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["unassign_absentee_from_proposal(uint64,address[])void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["pay_grant_proposal(uint64)void"],
@@ -3200,12 +3842,24 @@ class XgovRegistryMockClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> TypedGlobalState | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_state_version()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_xgov_box(address)((address,uint64,uint64,uint64),bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[tuple[str, int, int, int], bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[str, int, int, int], bool]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_proposer_box(address)((bool,bool,uint64),bool)"],
@@ -3214,19 +3868,43 @@ class XgovRegistryMockClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_request_box(uint64)((address,address,uint64),bool)"],
+        method: typing.Literal["get_proposer_boxes(address[])((bool,bool,uint64),bool)[]"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> tuple[tuple[str, str, int], bool] | None: ...
+    ) -> list[tuple[tuple[bool, bool, int], bool]] | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_request_unsubscribe_box(uint64)((address,address,uint64),bool)"],
+        method: typing.Literal["get_request_box(uint64)((address,address,uint64),bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[tuple[str, str, int], bool] | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["is_proposal(uint64)void"],
+        method: typing.Literal["get_request_boxes(uint64[])((address,address,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[str, str, int], bool]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_request_unsubscribe_box(uint64)((address,address,uint64),bool)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[tuple[str, str, int], bool] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[tuple[str, str, int], bool]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["is_proposal(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
@@ -3264,7 +3942,7 @@ class XgovRegistryMockClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | TypedGlobalState | int | tuple[tuple[bool, bool, int], bool] | tuple[tuple[str, int, int, int], bool] | tuple[tuple[str, str, int], bool]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | TypedGlobalState | int | list[tuple[bool, str, int, bool, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | list[tuple[tuple[bool, bool, int], bool]] | list[tuple[tuple[str, int, int, int], bool]] | list[tuple[tuple[str, str, int], bool]] | tuple[tuple[bool, bool, int], bool] | tuple[tuple[str, int, int, int], bool] | tuple[tuple[str, str, int], bool]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -4023,6 +4701,26 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the declare_committee_with_root(byte[32],uint64,uint64,byte[32])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -4063,6 +4761,66 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_proposals(address,(uint64,uint64,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_proposals(address,(uint64,uint64,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_proposal_batch(uint64,(address,uint64,uint64)[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_proposal_batch(uint64,(address,uint64,uint64)[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -4083,6 +4841,26 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -4241,6 +5019,25 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_state_version(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_state_version()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_state_version()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -4261,6 +5058,26 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -4281,6 +5098,26 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_proposer_boxes(address[])((bool,bool,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -4301,6 +5138,26 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_request_boxes(uint64[])((address,address,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_request_boxes(uint64[])((address,address,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -4321,6 +5178,46 @@ class XgovRegistryMockFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
@@ -5109,6 +6006,25 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def declare_committee_with_root(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | DeclareCommitteeWithRootArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.declare_committee_with_root(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "declare_committee_with_root(byte[32],uint64,uint64,byte[32])void", v
+            )
+        )
+        return self
+
     def open_proposal(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | OpenProposalArgs,
@@ -5147,6 +6063,63 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def vote_proposals(
+        self,
+        args: tuple[str, list[tuple[int, int, int]]] | VoteProposalsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_proposals(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_proposals(address,(uint64,uint64,uint64)[])void", v
+            )
+        )
+        return self
+
+    def vote_proposal_batch(
+        self,
+        args: tuple[int, list[tuple[str, int, int]]] | VoteProposalBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_proposal_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_proposal_batch(uint64,(address,uint64,uint64)[])void", v
+            )
+        )
+        return self
+
+    def vote_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]], int, int] | VoteProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.vote_proposal_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "vote_proposal_with_proof(uint64,address,uint64,uint64,byte[32][],uint64,uint64)void", v
+            )
+        )
+        return self
+
     def unassign_absentee_from_proposal(
         self,
         args: tuple[int, list[str]] | UnassignAbsenteeFromProposalArgs,
@@ -5166,6 +6139,25 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        args: tuple[int, str, int, int, list[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]] | UnassignAbsenteeFromProposalWithProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.unassign_absentee_from_proposal_with_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "unassign_absentee_from_proposal_with_proof(uint64,address,uint64,uint64,byte[32][])void", v
+            )
+        )
+        return self
+
     def pay_grant_proposal(
         self,
         args: tuple[int] | PayGrantProposalArgs,
@@ -5316,6 +6308,24 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def get_state_version(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_state_version(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_state_version()uint64", v
+            )
+        )
+        return self
+
     def get_xgov_box(
         self,
         args: tuple[str] | GetXgovBoxArgs,
@@ -5335,6 +6345,25 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def get_xgov_boxes(
+        self,
+        args: tuple[list[str]] | GetXgovBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_xgov_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_xgov_boxes(address[])((address,uint64,uint64,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def get_proposer_box(
         self,
         args: tuple[str] | GetProposerBoxArgs,
@@ -5354,6 +6383,25 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def get_proposer_boxes(
+        self,
+        args: tuple[list[str]] | GetProposerBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_proposer_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_proposer_boxes(address[])((bool,bool,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def get_request_box(
         self,
         args: tuple[int] | GetRequestBoxArgs,
@@ -5373,6 +6421,25 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def get_request_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_request_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_request_boxes(uint64[])((address,address,uint64),bool)[]", v
+            )
+        )
+        return self
+
     def get_request_unsubscribe_box(
         self,
         args: tuple[int] | GetRequestUnsubscribeBoxArgs,
@@ -5392,6 +6459,44 @@ class XgovRegistryMockComposer:
         )
         return self
 
+    def get_request_unsubscribe_boxes(
+        self,
+        args: tuple[list[int]] | GetRequestUnsubscribeBoxesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_request_unsubscribe_boxes(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_request_unsubscribe_boxes(uint64[])((address,address,uint64),bool)[]", v
+            )
+        )
+        return self
+
+    def get_proposals_summary(
+        self,
+        args: tuple[list[int]] | GetProposalsSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> "XgovRegistryMockComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_proposals_summary(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_proposals_summary(uint64[])(bool,address,uint64,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)[]", v
+            )
+        )
+        return self
+
     def is_proposal(
         self,
         args: tuple[int] | IsProposalArgs,
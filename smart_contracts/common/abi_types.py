@@ -34,11 +34,46 @@ class ProposalTypedGlobalState(Struct, kw_only=True):
     nulls: UInt64
 
 
+class ProposalSummary(Struct, kw_only=True):
+    """Compact Proposal state read by the xGov Registry"""
+
+    exists: bool
+    proposer: Account
+    status: UInt64
+    finalized: bool
+    funding_category: UInt64
+    requested_amount: MicroAlgo
+    locked_amount: MicroAlgo
+    open_ts: TimeStamp
+    submission_ts: TimeStamp
+    vote_open_ts: TimeStamp
+    committee_votes: UInt64
+    quorum_threshold: UInt64
+    weighted_quorum_threshold: UInt64
+    voted_members: UInt64
+    boycotted_members: UInt64
+    approvals: UInt64
+    rejections: UInt64
+    nulls: UInt64
+
+
 class CommitteeMember(Struct, kw_only=True):
     address: Account
     voting_power: UInt64
 
 
+class ProposalVote(Struct, kw_only=True):
+    proposal_id: UInt64
+    approvals: UInt64
+    rejections: UInt64
+
+
+class XGovVote(Struct, kw_only=True):
+    xgov_address: Account
+    approvals: UInt64
+    rejections: UInt64
+
+
 Empty = arc4.StaticArray[arc4.Byte, t.Literal[0]]
 
 
@@ -50,6 +85,16 @@ class CouncilVote(Struct, kw_only=True):
 CouncilVotingBox = arc4.DynamicArray[CouncilVote]
 
 
+class CouncilTally(Struct, kw_only=True):
+    approvals: UInt64
+    rejections: UInt64
+
+
+class CouncilProposalVote(Struct, kw_only=True):
+    proposal_id: UInt64
+    block: bool
+
+
 class TypedGlobalState(Struct, kw_only=True):
     paused_registry: bool
     paused_proposals: bool
@@ -111,6 +156,16 @@ class ProposerBoxValue(Struct, kw_only=True):
     kyc_expiring: UInt64
 
 
+class ProposerBoxEntry(Struct, kw_only=True):
+    value: ProposerBoxValue
+    exists: bool
+
+
+class XGovSubscribeRequestBoxEntry(Struct, kw_only=True):
+    value: XGovSubscribeRequestBoxValue
+    exists: bool
+
+
 class XGovBoxValue(Struct, kw_only=True):
     voting_address: Account
     tolerated_absences: UInt64
@@ -118,6 +173,11 @@ class XGovBoxValue(Struct, kw_only=True):
     subscription_round: UInt64
 
 
+class XGovBoxEntry(Struct, kw_only=True):
+    value: XGovBoxValue
+    exists: bool
+
+
 class VotingState(Struct, kw_only=True):
     """The voting state of the Proposal"""
 
@@ -134,6 +194,15 @@ class VotingState(Struct, kw_only=True):
     plebiscite: bool
 
 
+# ARC-28 Events
+
+
+class StateVersion(Struct, kw_only=True):
+    """The state of the xGov Registry (or of the Proposal) has been updated"""
+
+    version: UInt64
+
+
 # ARC-28 xGov Registry Events
 
 
@@ -12,9 +12,26 @@ GS_KEY_MEMBER_COUNT: Final[bytes] = b"member_count"
 
 # Boxes
 MEMBERS_KEY_PREFIX: Final[bytes] = b"M"
+NEXT_MEMBER_ORDINAL_KEY: Final[bytes] = b"N"
+# Member ordinals, kept after the member removal
+MEMBER_ORDINALS_KEY_PREFIX: Final[bytes] = b"O"
+TALLIES_KEY_PREFIX: Final[bytes] = b"T"
+VOTED_BITMAP_KEY_PREFIX: Final[bytes] = b"B"
+# Votes cast before the tallies, migrated on the next vote of the Proposal
 VOTES_KEY_PREFIX: Final[bytes] = b"V"
 
 MEMBER_BOX_KEY_SIZE: Final[int] = 33  # 1 byte for prefix + 32 bytes for address
-MEMBER_BOX_VALUE_SIZE: Final[int] = 0
+MEMBER_BOX_VALUE_SIZE: Final[int] = 8  # member ordinal
+
+MEMBER_ORDINAL_BOX_KEY_SIZE: Final[int] = 33  # 1 byte for prefix + 32 bytes for address
+MEMBER_ORDINAL_BOX_VALUE_SIZE: Final[int] = 8
+
+NEXT_MEMBER_ORDINAL_BOX_KEY_SIZE: Final[int] = 1
+NEXT_MEMBER_ORDINAL_BOX_VALUE_SIZE: Final[int] = 8
+
+TALLY_BOX_KEY_SIZE: Final[int] = 9  # 1 byte for prefix + 8 bytes for proposal ID
+TALLY_BOX_VALUE_SIZE: Final[int] = 16  # approvals and rejections
+
+VOTED_BITMAP_BOX_KEY_SIZE: Final[int] = 9  # 1 byte for prefix + 8 bytes for proposal ID
 
 VOTES_BOX_KEY_SIZE: Final[int] = 9  # 1 byte for prefix + 8 bytes for proposal ID
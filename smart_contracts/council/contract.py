@@ -2,7 +2,10 @@
 
 from algopy import (
     Account,
+    Application,
     ARC4Contract,
+    Array,
+    Box,
     BoxMap,
     Bytes,
     GlobalState,
@@ -10,6 +13,8 @@ from algopy import (
     Txn,
     UInt64,
     arc4,
+    op,
+    size_of,
     urange,
 )
 from algopy.op import AppGlobal
@@ -21,7 +26,6 @@ from ..proposal import config as proposal_cfg
 from ..proposal import contract as proposal_contract
 from ..proposal import enums as proposal_enm
 from ..xgov_registry import config as reg_cfg
-from ..xgov_registry import contract as registry_contract
 from . import config as council_cfg
 
 
@@ -54,11 +58,30 @@ class Council(
             key=council_cfg.GS_KEY_MEMBER_COUNT,
         )
 
+        # Members are mapped to their ordinal, never reused
         self.members = BoxMap(
-            Account, typ.Empty, key_prefix=council_cfg.MEMBERS_KEY_PREFIX
+            Account, UInt64, key_prefix=council_cfg.MEMBERS_KEY_PREFIX
         )
 
-        self.votes = BoxMap(
+        # Ordinals survive the member removal, so a re-added member keeps its bit
+        # in the voted bitmaps and cannot vote twice
+        self.member_ordinals = BoxMap(
+            Account, UInt64, key_prefix=council_cfg.MEMBER_ORDINALS_KEY_PREFIX
+        )
+
+        self.next_member_ordinal = Box(UInt64, key=council_cfg.NEXT_MEMBER_ORDINAL_KEY)
+
+        self.tallies = BoxMap(
+            UInt64, typ.CouncilTally, key_prefix=council_cfg.TALLIES_KEY_PREFIX
+        )
+
+        # Members that voted a Proposal, indexed by member ordinal
+        self.voted_bitmap = BoxMap(
+            UInt64, Bytes, key_prefix=council_cfg.VOTED_BITMAP_KEY_PREFIX
+        )
+
+        # Votes cast before the tallies, on Proposals still under review
+        self.legacy_votes = BoxMap(
             UInt64, typ.CouncilVotingBox, key_prefix=council_cfg.VOTES_KEY_PREFIX
         )
 
@@ -79,6 +102,53 @@ class Council(
             self.get_bytes_from_registry_config(Bytes(reg_cfg.GS_KEY_COMMITTEE_MANAGER))
         )
 
+    def take_member_ordinal(self, member: Account) -> UInt64:
+        if member not in self.member_ordinals:
+            ordinal = self.next_member_ordinal.get(default=UInt64(0))
+            self.next_member_ordinal.value = ordinal + 1
+            self.member_ordinals[member] = ordinal
+        return self.member_ordinals[member]
+
+    def get_member_ordinal(self, member: Account) -> UInt64:
+        # Members added before the ordinals get one on their first vote
+        if self.members.length(member) == 0:
+            self.members.box(member).resize(size_of(UInt64))
+            self.members[member] = self.take_member_ordinal(member)
+        return self.members[member]
+
+    def set_voted(self, proposal_id: UInt64, ordinal: UInt64) -> None:
+        voted_bitmap = self.voted_bitmap.box(proposal_id)
+        byte_index = ordinal // 8
+        if voted_bitmap.length <= byte_index:
+            # Members added after the first vote of the Proposal
+            voted_bitmap.resize(byte_index + 1)
+
+        voted_byte = voted_bitmap.extract(byte_index, 1)
+        bit_index = ordinal % 8
+        assert not op.getbit(voted_byte, bit_index), err.VOTER_ALREADY_VOTED
+        voted_bitmap.replace(
+            byte_index, op.setbit_bytes(voted_byte, bit_index, True)  # noqa: FBT003
+        )
+
+    def migrate_legacy_votes(self, proposal_id: UInt64) -> None:
+        # Reviews in flight during the update to the tallies keep their votes,
+        # and the legacy box MBR is freed
+        legacy_votes = self.legacy_votes[proposal_id].copy()
+        for i in urange(legacy_votes.length):
+            legacy_vote = legacy_votes[i].copy()
+            if legacy_vote.block:
+                self.tallies[proposal_id].rejections += 1
+            else:
+                self.tallies[proposal_id].approvals += 1
+
+            # Removed members can no longer vote
+            if legacy_vote.address in self.members:
+                self.set_voted(
+                    proposal_id, self.get_member_ordinal(legacy_vote.address)
+                )
+
+        del self.legacy_votes[proposal_id]
+
     @arc4.abimethod(create="require")
     def create(self, registry_id: UInt64) -> None:
         """
@@ -123,7 +193,7 @@ class Council(
         assert self.is_committee_manager(), err.UNAUTHORIZED
         assert address.native not in self.members, err.VOTER_ALREADY_ASSIGNED
 
-        self.members[address.native] = typ.Empty()
+        self.members[address.native] = self.take_member_ordinal(address.native)
         self.member_count.value += 1
 
     @arc4.abimethod()
@@ -145,6 +215,54 @@ class Council(
         del self.members[address.native]
         self.member_count.value -= 1
 
+    def is_proposal(self, proposal_id: UInt64) -> bool:
+        # Same check as the xGov Registry `is_proposal`, without the app call
+        return (
+            Application(proposal_id).creator
+            == Application(self.registry_app_id.value).address
+        )
+
+    def register_vote(
+        self, proposal_id: UInt64, block: bool, ordinal: UInt64  # noqa: FBT001
+    ) -> None:
+        if proposal_id not in self.tallies:
+            assert self.is_proposal(proposal_id), err.INVALID_PROPOSAL
+
+            status, exists = AppGlobal.get_ex_uint64(
+                proposal_id, Bytes(proposal_cfg.GS_KEY_STATUS)
+            )
+
+            assert exists, err.INVALID_PROPOSAL
+            assert status == proposal_enm.STATUS_APPROVED, err.WRONG_PROPOSAL_STATUS
+
+            self.tallies[proposal_id] = typ.CouncilTally(
+                approvals=UInt64(0),
+                rejections=UInt64(0),
+            )
+            self.voted_bitmap.box(proposal_id).create(
+                size=(self.next_member_ordinal.value + 7) // 8
+            )
+            if proposal_id in self.legacy_votes:
+                self.migrate_legacy_votes(proposal_id)
+
+        self.set_voted(proposal_id, ordinal)
+
+        if block:
+            self.tallies[proposal_id].rejections += 1
+        else:
+            self.tallies[proposal_id].approvals += 1
+
+        half_plus_one = (self.member_count.value // 2) + 1
+        tally = self.tallies[proposal_id].copy()
+        if tally.approvals >= half_plus_one or tally.rejections >= half_plus_one:
+            # this will allow the proposal to be reviewed
+            block = tally.rejections >= half_plus_one
+
+            arc4.abi_call(proposal_contract.Proposal.review, block, app_id=proposal_id)
+
+            del self.tallies[proposal_id]
+            del self.voted_bitmap[proposal_id]
+
     @arc4.abimethod()
     def vote(self, proposal_id: UInt64, block: bool) -> None:  # noqa: FBT001
         """
@@ -158,65 +276,44 @@ class Council(
             err.VOTER_NOT_FOUND: If the sender is not a member of the council.
             err.INVALID_PROPOSAL: If the proposal ID is invalid or does not exist.
             err.WRONG_PROPOSAL_STATUS: If the proposal is not approved.
-            err.ALREADY_VOTED: If the sender has already voted on this proposal.
+            err.VOTER_ALREADY_VOTED: If the sender has already voted on this proposal.
         """
 
         assert Txn.sender in self.members, err.VOTER_NOT_FOUND
 
-        if proposal_id not in self.votes:
-            # we dont need any error handling here
-            # if its invalid the transaction will fail
-            arc4.abi_call(
-                registry_contract.XGovRegistry.is_proposal,
-                arc4.UInt64(proposal_id),
-                app_id=self.registry_app_id.value,
-            )
+        self.register_vote(proposal_id, block, self.get_member_ordinal(Txn.sender))
 
-            status, exists = AppGlobal.get_ex_uint64(
-                proposal_id, Bytes(proposal_cfg.GS_KEY_STATUS)
-            )
-
-            assert exists, err.INVALID_PROPOSAL
-            assert status == proposal_enm.STATUS_APPROVED, err.WRONG_PROPOSAL_STATUS
+    @arc4.abimethod()
+    def vote_many(self, votes: Array[typ.CouncilProposalVote]) -> None:
+        """
+        Cast votes on several proposals in a single app call. Proposals reaching
+        the majority are reviewed within the call.
 
-            self.votes[proposal_id] = arc4.DynamicArray(
-                typ.CouncilVote(
-                    address=Txn.sender,
-                    block=block,
-                )
-            )
+        Args:
+            votes: The IDs of the proposals to vote on, with whether or not to
+                block each of them.
 
-        else:
-            half_plus_one = (self.member_count.value // 2) + 1
-            approvals = UInt64(0) if block else UInt64(1)
-            rejections = UInt64(0) if not block else UInt64(1)
+        Raises:
+            err.VOTER_NOT_FOUND: If the sender is not a member of the council.
+            err.EMPTY_PAYLOAD: If no votes are provided.
+            err.DUPLICATE_PROPOSAL: If a proposal is voted more than once.
+            err.INVALID_PROPOSAL: If a proposal ID is invalid or does not exist.
+            err.WRONG_PROPOSAL_STATUS: If a proposal is not approved.
+            err.VOTER_ALREADY_VOTED: If the sender has already voted on a proposal.
+        """
 
-            for i in urange(self.votes[proposal_id].length):
+        assert Txn.sender in self.members, err.VOTER_NOT_FOUND
+        assert votes.length, err.EMPTY_PAYLOAD
+        for i in urange(1, votes.length):
+            for j in urange(i):
                 assert (
-                    Txn.sender != self.votes[proposal_id][i].address
-                ), err.VOTER_ALREADY_VOTED
-
-                if self.votes[proposal_id][i].block:
-                    rejections += 1
-                else:
-                    approvals += 1
-
-            self.votes[proposal_id].append(
-                typ.CouncilVote(
-                    address=Txn.sender,
-                    block=block,
-                )
-            )
-
-            if approvals >= half_plus_one or rejections >= half_plus_one:
-                # this will allow the proposal to be reviewed
-                block = rejections >= half_plus_one
-
-                arc4.abi_call(
-                    proposal_contract.Proposal.review, block, app_id=proposal_id
-                )
+                    votes[i].proposal_id != votes[j].proposal_id
+                ), err.DUPLICATE_PROPOSAL
 
-                del self.votes[proposal_id]
+        ordinal = self.get_member_ordinal(Txn.sender)
+        for i in urange(votes.length):
+            vote = votes[i].copy()
+            self.register_vote(vote.proposal_id, vote.block, ordinal)
 
     @arc4.abimethod()
     def op_up(self) -> None:
@@ -20,13 +20,48 @@ from smart_contracts.artifacts.council.council_client import (
     CreateArgs,
     RemoveMemberArgs,
 )
+from smart_contracts.council import config as council_cfg
+from smart_contracts.xgov_registry.constants import PER_BOX_MBR, PER_BYTE_IN_BOX_MBR
 
 logger = logging.getLogger(__name__)
 
 deployer_min_spending = AlgoAmount.from_algo(3)
-# Cover box storage costs for council members and votes
-# mbr on votes is freed after all members vote
-council_min_spending = AlgoAmount.from_algo(2)
+
+# Members ever added and Proposals under review covered by the Council funding
+COUNCIL_FUNDED_MEMBERS = 48
+COUNCIL_FUNDED_REVIEWS = 16
+
+
+def _box_mbr(key_size: int, value_size: int) -> int:
+    return PER_BOX_MBR + (key_size + value_size) * PER_BYTE_IN_BOX_MBR
+
+
+# Cover box storage costs for council members and votes: each member has a
+# member box and an ordinal box, the latter kept after the member removal.
+# Legacy member boxes grow to hold the ordinal (covered as a member box), and
+# legacy votes boxes are freed on migration. MBR on tallies and voted bitmaps is
+# freed once the proposal is reviewed.
+council_min_spending = AlgoAmount(
+    micro_algo=_box_mbr(
+        council_cfg.NEXT_MEMBER_ORDINAL_BOX_KEY_SIZE,
+        council_cfg.NEXT_MEMBER_ORDINAL_BOX_VALUE_SIZE,
+    )
+    + COUNCIL_FUNDED_MEMBERS
+    * (
+        _box_mbr(council_cfg.MEMBER_BOX_KEY_SIZE, council_cfg.MEMBER_BOX_VALUE_SIZE)
+        + _box_mbr(
+            council_cfg.MEMBER_ORDINAL_BOX_KEY_SIZE,
+            council_cfg.MEMBER_ORDINAL_BOX_VALUE_SIZE,
+        )
+    )
+    + COUNCIL_FUNDED_REVIEWS
+    * (
+        _box_mbr(council_cfg.TALLY_BOX_KEY_SIZE, council_cfg.TALLY_BOX_VALUE_SIZE)
+        + _box_mbr(
+            council_cfg.VOTED_BITMAP_BOX_KEY_SIZE, (COUNCIL_FUNDED_MEMBERS + 7) // 8
+        )
+    )
+)
 
 
 def _get_council_factory(
@@ -65,8 +65,11 @@ VOTER_NOT_FOUND = "Voter not found"
 VOTER_ALREADY_VOTED = "Voter already voted"
 VOTES_INVALID = "Votes invalid"
 VOTERS_ASSIGNED = "There are voters assigned to this proposal"
+VOTER_BUCKET_FULL = "Voter bucket is full"
 
 EMPTY_PAYLOAD = "Empty payload"
+TOO_MANY_PROPOSALS = "Too many proposals"
+DUPLICATE_PROPOSAL = "Duplicate proposal"
 
 PAUSED_REGISTRY = "Registry's non-admin methods are paused"
 PAUSED_PROPOSALS = "Creation of proposals is paused"
@@ -50,6 +50,15 @@ class ProposalInterface(ARC4Contract, ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    @arc4.abimethod()
+    def assign_voters_to_buckets(
+        self,
+        *,
+        voters: Array[typ.CommitteeMember],
+    ) -> None:
+        pass
+
     @abstractmethod
     @arc4.abimethod()
     def vote(
@@ -57,6 +66,25 @@ class ProposalInterface(ARC4Contract, ABC):
     ) -> typ.Error:
         pass
 
+    @abstractmethod
+    @arc4.abimethod()
+    def vote_batch(self, *, votes: Array[typ.XGovVote]) -> typ.Error:
+        pass
+
+    @abstractmethod
+    @arc4.abimethod()
+    def vote_with_proof(
+        self,
+        *,
+        voter: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+        approvals: UInt64,
+        rejections: UInt64,
+    ) -> typ.Error:
+        pass
+
     @abstractmethod
     @arc4.abimethod()
     def scrutiny(self) -> None:
@@ -67,6 +95,18 @@ class ProposalInterface(ARC4Contract, ABC):
     def unassign_absentees(self, *, absentees: Array[Account]) -> typ.Error:
         pass
 
+    @abstractmethod
+    @arc4.abimethod()
+    def unassign_absentee_with_proof(
+        self,
+        *,
+        absentee: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+    ) -> typ.Error:
+        pass
+
     @abstractmethod
     @arc4.abimethod()
     def review(self, *, block: bool) -> None:
@@ -97,11 +137,21 @@ class ProposalInterface(ARC4Contract, ABC):
     def get_state(self) -> typ.ProposalTypedGlobalState:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_state_version(self) -> UInt64:
+        pass
+
     @abstractmethod
     @arc4.abimethod(readonly=True)
     def get_voter_box(self, *, voter_address: Account) -> tuple[UInt64, bool]:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_voted_bitmap_page(self, *, page: UInt64) -> tuple[Bytes, bool]:
+        pass
+
     @abstractmethod
     @arc4.abimethod(readonly=True)
     def get_voting_state(self) -> typ.VotingState:
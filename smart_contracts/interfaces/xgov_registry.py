@@ -184,6 +184,18 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    @arc4.abimethod()
+    def declare_committee_with_root(
+        self,
+        *,
+        committee_id: typ.Bytes32,
+        size: UInt64,
+        votes: UInt64,
+        committee_root: typ.Bytes32,
+    ) -> None:
+        pass
+
     @abstractmethod
     @arc4.abimethod
     def open_proposal(self, *, payment: gtxn.PaymentTransaction) -> UInt64:
@@ -201,6 +213,41 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    @arc4.abimethod()
+    def vote_proposal_with_proof(
+        self,
+        *,
+        proposal_id: Application,
+        xgov_address: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+        approval_votes: UInt64,
+        rejection_votes: UInt64,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    @arc4.abimethod()
+    def vote_proposal_batch(
+        self,
+        *,
+        proposal_id: Application,
+        votes: Array[typ.XGovVote],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    @arc4.abimethod()
+    def vote_proposals(
+        self,
+        *,
+        xgov_address: Account,
+        votes: Array[typ.ProposalVote],
+    ) -> None:
+        pass
+
     @abstractmethod
     @arc4.abimethod()
     def unassign_absentee_from_proposal(
@@ -208,6 +255,19 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    @arc4.abimethod()
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        *,
+        proposal_id: Application,
+        xgov_address: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+    ) -> None:
+        pass
+
     @abstractmethod
     @arc4.abimethod()
     def pay_grant_proposal(self, *, proposal_id: Application) -> None:
@@ -248,11 +308,23 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     def get_state(self) -> typ.TypedGlobalState:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_state_version(self) -> UInt64:
+        pass
+
     @abstractmethod
     @arc4.abimethod(readonly=True)
     def get_xgov_box(self, *, xgov_address: Account) -> tuple[typ.XGovBoxValue, bool]:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_xgov_boxes(
+        self, *, xgov_addresses: Array[Account]
+    ) -> Array[typ.XGovBoxEntry]:
+        pass
+
     @abstractmethod
     @arc4.abimethod(readonly=True)
     def get_proposer_box(
@@ -260,6 +332,13 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     ) -> tuple[typ.ProposerBoxValue, bool]:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_proposer_boxes(
+        self, *, proposer_addresses: Array[Account]
+    ) -> Array[typ.ProposerBoxEntry]:
+        pass
+
     @abstractmethod
     @arc4.abimethod(readonly=True)
     def get_request_box(
@@ -267,6 +346,13 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     ) -> tuple[typ.XGovSubscribeRequestBoxValue, bool]:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_request_boxes(
+        self, *, request_ids: Array[UInt64]
+    ) -> Array[typ.XGovSubscribeRequestBoxEntry]:
+        pass
+
     @abstractmethod
     @arc4.abimethod(readonly=True)
     def get_request_unsubscribe_box(
@@ -274,6 +360,20 @@ class XGovRegistryInterface(ARC4Contract, ABC):
     ) -> tuple[typ.XGovSubscribeRequestBoxValue, bool]:
         pass
 
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_request_unsubscribe_boxes(
+        self, *, request_ids: Array[UInt64]
+    ) -> Array[typ.XGovSubscribeRequestBoxEntry]:
+        pass
+
+    @abstractmethod
+    @arc4.abimethod(readonly=True)
+    def get_proposals_summary(
+        self, *, proposal_ids: Array[UInt64]
+    ) -> Array[typ.ProposalSummary]:
+        pass
+
     @abstractmethod
     @arc4.abimethod()
     def is_proposal(self, *, proposal_id: Application) -> None:
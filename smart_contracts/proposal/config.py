@@ -1,8 +1,8 @@
 from typing import Final
 
 # State Schema
-GLOBAL_BYTES: Final[int] = 3
-GLOBAL_UINTS: Final[int] = 27
+GLOBAL_BYTES: Final[int] = 4
+GLOBAL_UINTS: Final[int] = 29
 LOCAL_BYTES: Final[int] = 0
 LOCAL_UINTS: Final[int] = 0
 
@@ -34,7 +34,11 @@ GS_KEY_BOYCOTTED_MEMBERS: Final[bytes] = b"boycotted_members"
 GS_KEY_APPROVALS: Final[bytes] = b"approvals"
 GS_KEY_REJECTIONS: Final[bytes] = b"rejections"
 GS_KEY_NULLS: Final[bytes] = b"nulls"
+GS_KEY_VOTER_BUCKETS: Final[bytes] = b"voter_buckets"
+GS_KEY_STATE_VERSION: Final[bytes] = b"state_version"
 
 # Boxes
 VOTER_BOX_KEY_PREFIX: Final[str] = "V"
 METADATA_BOX_KEY: Final[str] = "M"
+VOTED_BITMAP_BOX_KEY_PREFIX: Final[str] = "B"
+VOTER_BUCKET_BOX_KEY_PREFIX: Final[str] = "K"
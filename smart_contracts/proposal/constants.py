@@ -6,3 +6,18 @@ COMMITTEE_ID_LENGTH: Final[int] = 32
 TITLE_MAX_BYTES: Final[int] = 123
 
 BPS: Final[int] = 10_000
+
+# Committee Merkle tree, see smart_contracts/xgov_registry/committee_merkle.py
+COMMITTEE_LEAF_PREFIX: Final[bytes] = b"\x00"
+COMMITTEE_NODE_PREFIX: Final[bytes] = b"\x01"
+
+# Voted members bitmap, paged to fit the box I/O budget of a single box reference
+VOTED_BITMAP_PAGE_SIZE: Final[int] = 1_024  # bytes
+VOTED_BITMAP_PAGE_MEMBERS: Final[int] = 8 * VOTED_BITMAP_PAGE_SIZE
+
+# Bucketed voters, see Proposal.assign_voters_to_buckets
+VOTER_BUCKET_RECORD_SIZE: Final[int] = 32 + 8  # address, votes
+VOTER_BUCKET_MEMBERS: Final[int] = 16  # average bucket records
+VOTER_BUCKET_PREFIX_RANGE: Final[int] = 2**16  # address prefix (uint16) range
+# Bucket records within the box I/O budget of two box references (1KB each)
+VOTER_BUCKET_MAX_MEMBERS: Final[int] = 2 * 1_024 // VOTER_BUCKET_RECORD_SIZE
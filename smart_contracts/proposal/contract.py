@@ -4,6 +4,7 @@ from algopy import (
     Account,
     Application,
     Array,
+    BigUInt,
     Box,
     BoxMap,
     Bytes,
@@ -16,6 +17,7 @@ from algopy import (
     arc4,
     gtxn,
     itxn,
+    op,
     urange,
 )
 from algopy.op import AppGlobal, GTxn
@@ -74,6 +76,10 @@ class Proposal(
             UInt64(),
             key=reg_cfg.GS_KEY_COMMITTEE_VOTES,
         )
+        self.committee_root = GlobalState(
+            Bytes(),
+            key=reg_cfg.GS_KEY_COMMITTEE_ROOT,
+        )
         self.open_proposal_fee = GlobalState(
             UInt64(),
             key=reg_cfg.GS_KEY_OPEN_PROPOSAL_FEE,
@@ -182,6 +188,14 @@ class Proposal(
             UInt64(),
             key=prop_cfg.GS_KEY_NULLS,
         )
+        self.voter_buckets = GlobalState(
+            UInt64(),
+            key=prop_cfg.GS_KEY_VOTER_BUCKETS,
+        )
+        self.state_version = GlobalState(
+            UInt64(),
+            key=prop_cfg.GS_KEY_STATE_VERSION,
+        )
 
         # Boxes
         self.voters = BoxMap(
@@ -193,6 +207,16 @@ class Proposal(
             Bytes,
             key=prop_cfg.METADATA_BOX_KEY,
         )
+        self.voted_bitmap = BoxMap(
+            UInt64,  # Page index
+            Bytes,
+            key_prefix=prop_cfg.VOTED_BITMAP_BOX_KEY_PREFIX,
+        )
+        self.voter_bucket = BoxMap(
+            UInt64,  # Bucket index
+            Bytes,  # Sorted (address, votes) records
+            key_prefix=prop_cfg.VOTER_BUCKET_BOX_KEY_PREFIX,
+        )
 
     def get_uint_from_registry_config(self, global_state_key: Bytes) -> UInt64:
         value, exists = AppGlobal.get_ex_uint64(
@@ -273,13 +297,16 @@ class Proposal(
         return approvals == votes and rejections == votes
 
     def vote_input_validation(
-        self, voter: Account, approvals: UInt64, rejections: UInt64
+        self, votes: UInt64, approvals: UInt64, rejections: UInt64
     ) -> typ.Error:
-        if voter not in self.voters:
+        if votes == 0:
             return typ.Error(err.ARC_65_PREFIX + err.VOTER_NOT_FOUND)
 
-        votes = self.voters[voter]
+        return self.votes_validation(votes, approvals, rejections)
 
+    def votes_validation(
+        self, votes: UInt64, approvals: UInt64, rejections: UInt64
+    ) -> typ.Error:
         if (approvals + rejections > votes) and not self.is_boycott(
             votes, approvals, rejections
         ):
@@ -287,6 +314,68 @@ class Proposal(
 
         return typ.Error("")
 
+    def has_committee_root(self) -> bool:
+        return self.committee_root.value.length > 0
+
+    def is_committee_member(
+        self,
+        voter: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+    ) -> bool:
+        node = op.sha256(
+            Bytes(const.COMMITTEE_LEAF_PREFIX) + voter.bytes + op.itob(voting_power)
+        )
+        # The ordinal bits select the side of the node at each level
+        index = ordinal
+        for i in urange(proof.length):
+            if index % 2:
+                node = op.sha256(
+                    Bytes(const.COMMITTEE_NODE_PREFIX) + proof[i].bytes + node
+                )
+            else:
+                node = op.sha256(
+                    Bytes(const.COMMITTEE_NODE_PREFIX) + node + proof[i].bytes
+                )
+            index //= 2
+
+        # A fully consumed ordinal binds each member to a single bitmap position
+        return (
+            index == 0
+            and ordinal < self.committee_members.value
+            and node == self.committee_root.value
+        )
+
+    def has_voted(self, ordinal: UInt64) -> bool:
+        page = ordinal // const.VOTED_BITMAP_PAGE_MEMBERS
+        if page not in self.voted_bitmap:
+            return False
+        bit = ordinal % const.VOTED_BITMAP_PAGE_MEMBERS
+        return op.getbit(self.voted_bitmap.box(page).extract(bit // 8, 1), bit % 8)
+
+    def set_voted(self, ordinal: UInt64) -> None:
+        page = ordinal // const.VOTED_BITMAP_PAGE_MEMBERS
+        bitmap = self.voted_bitmap.box(page)
+        if not bitmap:
+            # The last page only covers the remaining members
+            page_size = (self.committee_members.value + 7) // 8 - (
+                page * const.VOTED_BITMAP_PAGE_SIZE
+            )
+            if page_size > const.VOTED_BITMAP_PAGE_SIZE:
+                page_size = UInt64(const.VOTED_BITMAP_PAGE_SIZE)
+            _created = bitmap.create(size=page_size)
+        bit = ordinal % const.VOTED_BITMAP_PAGE_MEMBERS
+        bitmap.replace(
+            bit // 8,
+            op.setbit_bytes(bitmap.extract(bit // 8, 1), bit % 8, True),  # noqa: FBT003
+        )
+
+    def unassign_member(self, ordinal: UInt64, voting_power: UInt64) -> None:
+        self.set_voted(ordinal)
+        self.assigned_members.value -= 1
+        self.assigned_votes.value -= voting_power
+
     def is_plebiscite(self) -> bool:
         return self.voted_members.value == self.committee_members.value
 
@@ -301,12 +390,53 @@ class Proposal(
         assert self.is_xgov_daemon(), err.UNAUTHORIZED
         assert self.status.value == enm.STATUS_SUBMITTED, err.WRONG_PROPOSAL_STATUS
 
+    def voters_group_validation(self) -> None:
+        if Txn.group_index == 0:
+            # Check that the entire group calls the same app and method
+            for i in urange(1, Global.group_size):
+                self.assert_same_app_and_method(i)
+        else:
+            # Check that the first transaction in the group calls the same app and method
+            self.assert_same_app_and_method(UInt64(0))
+
     def assign_voter_input_validation(
         self, voter: Account, voting_power: UInt64
     ) -> None:
         assert voter not in self.voters, err.VOTER_ALREADY_ASSIGNED
         assert voting_power > 0, err.INVALID_VOTING_POWER
 
+    def get_voter_bucket(self, voter: Account) -> UInt64:
+        # Buckets split the address prefix range, so voters are sorted across buckets
+        return (
+            op.extract_uint16(voter.bytes, 0)
+            * self.voter_buckets.value
+            // const.VOTER_BUCKET_PREFIX_RANGE
+        )
+
+    def get_voter(self, voter: Account) -> tuple[UInt64, UInt64]:
+        """Returns the voter votes (zero if not assigned) and its bucket record offset"""
+        if not self.voter_buckets.value:
+            return self.voters.get(voter, default=UInt64(0)), UInt64(0)
+
+        bucket = self.voter_bucket.box(self.get_voter_bucket(voter))
+        if not bucket:
+            return UInt64(0), UInt64(0)
+
+        # Binary search of the bucket records, sorted by address
+        low = UInt64(0)
+        high = bucket.length // const.VOTER_BUCKET_RECORD_SIZE
+        while low < high:
+            middle = (low + high) // 2
+            record = middle * const.VOTER_BUCKET_RECORD_SIZE
+            address = bucket.extract(record, 32)
+            if address == voter.bytes:
+                return op.btoi(bucket.extract(record + 32, 8)), record
+            if BigUInt.from_bytes(address) < BigUInt.from_bytes(voter.bytes):
+                low = middle + 1
+            else:
+                high = middle
+        return UInt64(0), UInt64(0)
+
     def unassign_voter_input_validation(
         self, voter: Account, voting_power: UInt64
     ) -> None:
@@ -602,6 +732,10 @@ class Proposal(
         self.committee_votes.value = self.get_uint_from_registry_config(
             Bytes(reg_cfg.GS_KEY_COMMITTEE_VOTES)
         )
+        # Empty if the Committee has no Merkle root (voters are assigned by the daemon)
+        self.committee_root.value, _exists = AppGlobal.get_ex_bytes(
+            self.registry_app_id.value, Bytes(reg_cfg.GS_KEY_COMMITTEE_ROOT)
+        )
         self.open_proposal_fee.value = self.get_uint_from_registry_config(
             Bytes(reg_cfg.GS_KEY_OPEN_PROPOSAL_FEE)
         )
@@ -650,6 +784,8 @@ class Proposal(
         self.open_input_validation(title, funding_type, requested_amount)
         self.open_payment_validation(payment, requested_amount)
 
+        self.bump_state_version()
+
         # Configure Proposal
         self.title.value = title
         self.funding_category.value = self.get_category(requested_amount)
@@ -705,6 +841,8 @@ class Proposal(
         self.upload_metadata_check_authorization()
         self.upload_metadata_input_validation(payload)
 
+        self.bump_state_version()
+
         self.metadata_uploaded.value = True
 
         if is_first_in_group:
@@ -731,6 +869,8 @@ class Proposal(
         if error != typ.Error(""):
             return error
 
+        self.bump_state_version()
+
         self.transfer_locked_amount(
             receiver=self.proposer.value,
         )
@@ -742,7 +882,8 @@ class Proposal(
 
     @arc4.abimethod()
     def submit(self) -> None:
-        """submit the proposal.
+        """submit the proposal. If the Committee has a Merkle root, the voting opens
+        right away, otherwise once the xGov Daemon has assigned the voters.
 
         Raises:
             err.PAUSED_REGISTRY: Registry's non-admin methods are paused
@@ -758,6 +899,8 @@ class Proposal(
 
         assert self.metadata_uploaded.value, err.MISSING_METADATA
 
+        self.bump_state_version()
+
         self.pay(
             receiver=Account(
                 self.get_bytes_from_registry_config(Bytes(reg_cfg.GS_KEY_XGOV_DAEMON))
@@ -769,6 +912,14 @@ class Proposal(
         self.status.value = UInt64(enm.STATUS_SUBMITTED)
         self.submission_ts.value = Global.latest_timestamp
 
+        if self.has_committee_root():
+            # Members prove their membership on vote, there are no voters to assign:
+            # the whole Committee is assigned, voters and absentees are unassigned
+            # by proof
+            self.assigned_members.value = self.committee_members.value
+            self.assigned_votes.value = self.committee_votes.value
+            self.open_voting()
+
     def _assign_voter(self, voter: Account, voting_power: UInt64) -> None:
         self.assign_voter_input_validation(voter, voting_power)
 
@@ -776,12 +927,112 @@ class Proposal(
         self.assigned_members.value += 1
         self.assigned_votes.value += voting_power
 
-    def _unassign_voter(self, voter: Account, voting_power: UInt64) -> None:
-        self.unassign_voter_input_validation(voter, voting_power)
+    def _assign_bucket_voter(self, voter: Account, voting_power: UInt64) -> None:
+        assert voting_power > 0, err.INVALID_VOTING_POWER
+
+        bucket = self.voter_bucket.box(self.get_voter_bucket(voter))
+        if bucket:
+            end = bucket.length
+            # Appending sorted voters keeps the bucket searchable
+            last_address = bucket.extract(end - const.VOTER_BUCKET_RECORD_SIZE, 32)
+            assert BigUInt.from_bytes(last_address) < BigUInt.from_bytes(
+                voter.bytes
+            ), err.VOTER_ALREADY_ASSIGNED
+            assert (
+                end < const.VOTER_BUCKET_MAX_MEMBERS * const.VOTER_BUCKET_RECORD_SIZE
+            ), err.VOTER_BUCKET_FULL
+            bucket.resize(end + const.VOTER_BUCKET_RECORD_SIZE)
+        else:
+            end = UInt64(0)
+            _created = bucket.create(size=UInt64(const.VOTER_BUCKET_RECORD_SIZE))
+        bucket.replace(end, voter.bytes + op.itob(voting_power))
+
+        self.assigned_members.value += 1
+        self.assigned_votes.value += voting_power
+
+    def _unassign_voter(
+        self, voter: Account, voting_power: UInt64, record: UInt64
+    ) -> None:
+        if self.voter_buckets.value:
+            bucket = self.voter_bucket.box(self.get_voter_bucket(voter))
+            length = bucket.length - const.VOTER_BUCKET_RECORD_SIZE
+            if length:
+                bucket.splice(record, const.VOTER_BUCKET_RECORD_SIZE, Bytes())
+                bucket.resize(length)
+            else:
+                del bucket.value
+        else:
+            self.unassign_voter_input_validation(voter, voting_power)
+            del self.voters[voter]
 
         self.assigned_members.value -= 1
         self.assigned_votes.value -= voting_power
-        del self.voters[voter]
+
+    def count_vote(
+        self, voter: Account, votes: UInt64, approvals: UInt64, rejections: UInt64
+    ) -> None:
+        self.voted_members.value += 1
+        if self.is_boycott(votes, approvals, rejections):
+            self.boycotted_members.value += 1
+            boycotted = True
+
+            nulls = UInt64(0)
+        else:
+            boycotted = False
+
+            nulls = votes - approvals - rejections
+
+            self.approvals.value += approvals
+            self.rejections.value += rejections
+            self.nulls.value += nulls
+
+        arc4.emit(
+            typ.Vote(
+                xgov=arc4.Address(voter),
+                approvals=arc4.UInt32(approvals),
+                rejections=arc4.UInt32(rejections),
+                nulls=arc4.UInt32(nulls),
+                boycotted=boycotted,
+                total_voters=arc4.UInt32(self.voted_members.value),
+                total_boycott=arc4.UInt32(self.boycotted_members.value),
+                total_approvals=arc4.UInt32(self.approvals.value),
+                total_rejections=arc4.UInt32(self.rejections.value),
+                total_nulls=arc4.UInt32(self.nulls.value),
+                round=Global.round,
+            )
+        )
+
+    def register_vote(
+        self, voter: Account, approvals: UInt64, rejections: UInt64
+    ) -> typ.Error:
+        votes, record = self.get_voter(voter)
+        error = self.vote_input_validation(votes, approvals, rejections)
+        if error != typ.Error(""):
+            return error
+
+        self._unassign_voter(voter, votes, record)
+        self.count_vote(voter, votes, approvals, rejections)
+
+        return typ.Error("")
+
+    def bump_state_version(self) -> None:
+        # Called by every mutating method, lets clients detect state changes
+        self.state_version.value += 1
+        arc4.emit(typ.StateVersion(version=self.state_version.value))
+
+    def open_voting(self) -> None:
+        self.status.value = UInt64(enm.STATUS_VOTING)
+        self.vote_open_ts.value = Global.latest_timestamp
+
+        arc4.emit(
+            typ.Submitted(
+                vote_opening=self.vote_open_ts.value,
+                vote_closing=self.vote_open_ts.value + self.voting_duration.value,
+                quorum_voters=arc4.UInt32(self.quorum_threshold.value),
+                weighted_quorum_votes=arc4.UInt32(self.weighted_quorum_threshold.value),
+                round=Global.round,
+            )
+        )
 
     @arc4.abimethod()
     def assign_voters(
@@ -807,36 +1058,71 @@ class Proposal(
         """
 
         self.assign_voters_check_authorization()
+        self.voters_group_validation()
+        assert not self.voter_buckets.value, err.VOTERS_ASSIGNED
 
-        if Txn.group_index == 0:
-            # Check that the entire group calls the same app and method
-            for i in urange(1, Global.group_size):
-                self.assert_same_app_and_method(i)
-        else:
-            # Check that the first transaction in the group calls the same app and method
-            self.assert_same_app_and_method(UInt64(0))
+        self.bump_state_version()
 
         for i in urange(voters.length):
             self._assign_voter(voters[i].address, voters[i].voting_power)
 
+        self.open_voting_if_assigned()
+
+    @arc4.abimethod()
+    def assign_voters_to_buckets(
+        self,
+        *,
+        voters: Array[CommitteeMember],
+    ) -> None:
+        """Assign multiple voters to the proposal, packed in bucket boxes.
+
+        Voters are stored in `ceil(committee_members / VOTER_BUCKET_MEMBERS)` bucket
+        boxes of sorted (address, votes) records, a bucket covering a range of the
+        address 2-byte prefix. Voters of a bucket must be assigned by ascending
+        address, up to `VOTER_BUCKET_MAX_MEMBERS` so that a bucket stays within the
+        box I/O budget of two box references. A proposal uses either voter boxes or
+        voter buckets.
+
+        Args:
+            voters (Array[CommitteeMember]): List of voter addresses with their voting power
+
+        Raises:
+            err.UNAUTHORIZED: If the sender is not the xGov Daemon
+            err.MISSING_CONFIG: If one of the required configuration values is missing
+            err.WRONG_PROPOSAL_STATUS: If the proposal status is not STATUS_SUBMITTED
+            err.WRONG_APP_ID: If the app ID is not as expected
+            err.WRONG_METHOD_CALL: If the method call is not as expected
+            err.VOTERS_ASSIGNED: If voters are already assigned to voter boxes
+            err.VOTER_ALREADY_ASSIGNED: If the voter is already assigned, or does not
+                follow the last voter of its bucket
+            err.VOTER_BUCKET_FULL: If the voter bucket already holds
+                `VOTER_BUCKET_MAX_MEMBERS` voters
+            err.INVALID_VOTING_POWER: If the voting power is not within the limits
+            err.VOTING_POWER_MISMATCH: If the total voting power does not match the committee votes
+
+        """
+
+        self.assign_voters_check_authorization()
+        self.voters_group_validation()
+        self.bump_state_version()
+
+        if not self.voter_buckets.value:
+            assert not self.assigned_members.value, err.VOTERS_ASSIGNED
+            self.voter_buckets.value = (
+                self.committee_members.value + const.VOTER_BUCKET_MEMBERS - 1
+            ) // const.VOTER_BUCKET_MEMBERS
+
+        for i in urange(voters.length):
+            self._assign_bucket_voter(voters[i].address, voters[i].voting_power)
+
+        self.open_voting_if_assigned()
+
+    def open_voting_if_assigned(self) -> None:
         if self.assigned_members.value == self.committee_members.value:
             assert (
                 self.assigned_votes.value == self.committee_votes.value
             ), err.VOTING_POWER_MISMATCH
-            self.status.value = UInt64(enm.STATUS_VOTING)
-            self.vote_open_ts.value = Global.latest_timestamp
-
-            arc4.emit(
-                typ.Submitted(
-                    vote_opening=self.vote_open_ts.value,
-                    vote_closing=self.vote_open_ts.value + self.voting_duration.value,
-                    quorum_voters=arc4.UInt32(self.quorum_threshold.value),
-                    weighted_quorum_votes=arc4.UInt32(
-                        self.weighted_quorum_threshold.value
-                    ),
-                    round=Global.round,
-                )
-            )
+            self.open_voting()
 
     @arc4.abimethod()
     def vote(
@@ -864,46 +1150,95 @@ class Proposal(
         if error != typ.Error(""):
             return error
 
-        error = self.vote_input_validation(voter, approvals, rejections)
-        if error == typ.Error(""):
-            votes = self.voters[voter]
+        self.bump_state_version()
 
-            self.voted_members.value += 1
-            if self.is_boycott(votes, approvals, rejections):
-                self.boycotted_members.value += 1
-                boycotted = True
+        return self.register_vote(voter, approvals, rejections)
 
-                nulls = UInt64(0)
-            else:
-                boycotted = False
+    @arc4.abimethod()
+    def vote_batch(self, *, votes: Array[typ.XGovVote]) -> typ.Error:
+        """Vote on the proposal for several voters. MUST BE CALLED BY THE REGISTRY CONTRACT.
 
-                nulls = votes - approvals - rejections
+        Args:
+            votes (Array[typ.XGovVote]): Voter addresses with their approvals and rejections
 
-                self.approvals.value += approvals
-                self.rejections.value += rejections
-                self.nulls.value += nulls
-        else:
+        Raises:
+            err.UNAUTHORIZED: If the sender is not the registry contract
+            err.VOTER_NOT_FOUND: If a voter is not assigned to the proposal
+            err.VOTER_ALREADY_VOTED: If a voter has already voted
+            err.VOTES_INVALID: If the votes are invalid
+            err.MISSING_CONFIG: If one of the required configuration values is missing
+            err.WRONG_PROPOSAL_STATUS: If the proposal status is not STATUS_VOTING
+            err.VOTING_PERIOD_EXPIRED: If the voting period has expired
+
+        """
+
+        error = self.vote_check_authorization()
+        if error != typ.Error(""):
             return error
 
-        self._unassign_voter(voter, votes)
+        self.bump_state_version()
 
-        arc4.emit(
-            typ.Vote(
-                xgov=arc4.Address(
-                    self.voters.box(voter).key[1:]
-                ),  # remove the Box prefix
-                approvals=arc4.UInt32(approvals),
-                rejections=arc4.UInt32(rejections),
-                nulls=arc4.UInt32(nulls),
-                boycotted=boycotted,
-                total_voters=arc4.UInt32(self.voted_members.value),
-                total_boycott=arc4.UInt32(self.boycotted_members.value),
-                total_approvals=arc4.UInt32(self.approvals.value),
-                total_rejections=arc4.UInt32(self.rejections.value),
-                total_nulls=arc4.UInt32(self.nulls.value),
-                round=Global.round,
+        # The first error is returned, the registry fails the whole batch on it
+        for i in urange(votes.length):
+            vote = votes[i].copy()
+            error = self.register_vote(
+                vote.xgov_address, vote.approvals, vote.rejections
             )
-        )
+            if error != typ.Error(""):
+                return error
+
+        return typ.Error("")
+
+    @arc4.abimethod()
+    def vote_with_proof(
+        self,
+        *,
+        voter: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+        approvals: UInt64,
+        rejections: UInt64,
+    ) -> typ.Error:
+        """Vote on the proposal as a member of a committee declared with a Merkle root.
+        MUST BE CALLED BY THE REGISTRY CONTRACT.
+
+        Args:
+            voter (Account): Voter address
+            voting_power (UInt64): Voter's votes in the committee
+            ordinal (UInt64): Voter's position in the committee Merkle tree
+            proof (Array[typ.Bytes32]): Sibling nodes from the voter's leaf to the root
+            approvals (UInt64): Number of approvals
+            rejections (UInt64): Number of rejections
+
+        Raises:
+            err.UNAUTHORIZED: If the sender is not the registry contract
+            err.VOTER_NOT_FOUND: If the membership proof does not match the committee root
+            err.VOTER_ALREADY_VOTED: If the voter has already voted
+            err.VOTES_INVALID: If the votes are invalid
+            err.WRONG_PROPOSAL_STATUS: If the proposal status is not STATUS_VOTING
+            err.VOTING_PERIOD_EXPIRED: If the voting period has expired
+
+        """
+
+        error = self.vote_check_authorization()
+        if error != typ.Error(""):
+            return error
+
+        self.bump_state_version()
+
+        if not self.is_committee_member(voter, voting_power, ordinal, proof):
+            return typ.Error(err.ARC_65_PREFIX + err.VOTER_NOT_FOUND)
+
+        if self.has_voted(ordinal):
+            return typ.Error(err.ARC_65_PREFIX + err.VOTER_ALREADY_VOTED)
+
+        error = self.votes_validation(voting_power, approvals, rejections)
+        if error != typ.Error(""):
+            return error
+
+        self.unassign_member(ordinal, voting_power)
+        self.count_vote(voter, voting_power, approvals, rejections)
 
         return typ.Error("")
 
@@ -922,6 +1257,8 @@ class Proposal(
 
         self.scrutiny_check_authorization()
 
+        self.bump_state_version()
+
         is_approved = self.is_proposal_approved()
 
         if is_approved:
@@ -957,12 +1294,55 @@ class Proposal(
         if error != typ.Error(""):
             return error
 
+        self.bump_state_version()
+
         # remove absentee
         for absentee in absentees:
-            if absentee not in self.voters:
+            votes, record = self.get_voter(absentee)
+            if votes == 0:
                 return typ.Error(err.ARC_65_PREFIX + err.VOTER_NOT_FOUND)
-            votes = self.voters[absentee]
-            self._unassign_voter(absentee, votes)
+            self._unassign_voter(absentee, votes, record)
+
+        return typ.Error("")
+
+    @arc4.abimethod()
+    def unassign_absentee_with_proof(
+        self,
+        *,
+        absentee: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+    ) -> typ.Error:
+        """
+        Unassign an absentee of a committee declared with a Merkle root from the
+        scrutinized proposal. Its ordinal is marked in the voted bitmap, so it is
+        unassigned once.
+
+        Args:
+            absentee (Account): Absentee address
+            voting_power (UInt64): Absentee's votes in the committee
+            ordinal (UInt64): Absentee's position in the committee Merkle tree
+            proof (Array[typ.Bytes32]): Sibling nodes from the absentee's leaf to the root
+
+        Raises:
+            err.UNAUTHORIZED: If the sender is not the registry contract
+            err.WRONG_PROPOSAL_STATUS: If the proposal status is not as expected
+            err.VOTER_NOT_FOUND: If the membership proof does not match the committee
+                root, or the absentee has voted or was already unassigned
+        """
+        error = self.unassign_absentees_check_authorization()
+        if error != typ.Error(""):
+            return error
+
+        self.bump_state_version()
+
+        if not self.is_committee_member(
+            absentee, voting_power, ordinal, proof
+        ) or self.has_voted(ordinal):
+            return typ.Error(err.ARC_65_PREFIX + err.VOTER_NOT_FOUND)
+
+        self.unassign_member(ordinal, voting_power)
 
         return typ.Error("")
 
@@ -985,6 +1365,8 @@ class Proposal(
         # check no assigned voters
         assert self.assigned_members.value == 0, err.VOTERS_ASSIGNED
 
+        self.bump_state_version()
+
         if block:
             self.status.value = UInt64(enm.STATUS_BLOCKED)
 
@@ -1017,6 +1399,8 @@ class Proposal(
         if error != typ.Error(""):
             return error
 
+        self.bump_state_version()
+
         self.status.value = UInt64(enm.STATUS_FUNDED)
 
         return typ.Error("")
@@ -1037,19 +1421,15 @@ class Proposal(
 
         """
         self.unassign_voters_check_authorization()
-        if Txn.group_index == 0:
-            # Check that the entire group calls the same app and method
-            for i in urange(1, Global.group_size):
-                self.assert_same_app_and_method(i)
-        else:
-            # Check that the first transaction in the group calls the same app and method
-            self.assert_same_app_and_method(UInt64(0))
+        self.voters_group_validation()
+
+        self.bump_state_version()
 
         # remove voters
         for voter in voters:
-            if voter in self.voters:
-                votes = self.voters[voter]
-                self._unassign_voter(voter, votes)
+            votes, record = self.get_voter(voter)
+            if votes:
+                self._unassign_voter(voter, votes, record)
 
     @arc4.abimethod()
     def finalize(self) -> typ.Error:
@@ -1066,6 +1446,8 @@ class Proposal(
         if error != typ.Error(""):
             return error
 
+        self.bump_state_version()
+
         # check no assigned voters
         if self.assigned_members.value > 0:
             return typ.Error(err.ARC_65_PREFIX + err.VOTERS_ASSIGNED)
@@ -1102,6 +1484,14 @@ class Proposal(
         # delete metadata box if it exists
         del self.metadata.value
 
+        # delete voted bitmap pages if they exist
+        if self.has_committee_root():
+            for page in urange(
+                (self.committee_members.value + const.VOTED_BITMAP_PAGE_MEMBERS - 1)
+                // const.VOTED_BITMAP_PAGE_MEMBERS
+            ):
+                del self.voted_bitmap[page]
+
         reg_app = Application(self.registry_app_id.value)
         self.pay(
             receiver=reg_app.address,
@@ -1140,6 +1530,16 @@ class Proposal(
             nulls=self.nulls.value,
         )
 
+    @arc4.abimethod(readonly=True)
+    def get_state_version(self) -> UInt64:
+        """Get the proposal state version, incremented by every mutating method.
+
+        Returns:
+            UInt64: The proposal state version
+
+        """
+        return self.state_version.value
+
     @arc4.abimethod(readonly=True)
     def get_voter_box(self, *, voter_address: Account) -> tuple[UInt64, bool]:
         """
@@ -1152,13 +1552,31 @@ class Proposal(
             votes: The voter's votes
             bool: `True` if voter's box exists, else `False`
         """
-        exists = voter_address in self.voters
+        votes, _record = self.get_voter(voter_address)
+
+        return votes, votes > 0
+
+    @arc4.abimethod(readonly=True)
+    def get_voted_bitmap_page(self, *, page: UInt64) -> tuple[Bytes, bool]:
+        """
+        Returns a page of the voted bitmap, where the bit of a Committee member
+        ordinal is set once the member has voted.
+
+        Args:
+            page (UInt64): The index of the page, covering ordinals from
+                `page * VOTED_BITMAP_PAGE_MEMBERS`
+
+        Returns:
+            bitmap: The page content, empty if no member of the page has voted
+            bool: `True` if the page box exists, else `False`
+        """
+        exists = page in self.voted_bitmap
         if exists:
-            votes = self.voters[voter_address]
+            bitmap = self.voted_bitmap[page]
         else:
-            votes = UInt64(0)
+            bitmap = Bytes()
 
-        return votes, exists
+        return bitmap, exists
 
     @arc4.abimethod(readonly=True)
     def get_voting_state(self) -> typ.VotingState:
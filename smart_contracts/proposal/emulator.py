@@ -0,0 +1,857 @@
+"""
+Pure-Python reference model of the Proposal contract (`contract.py`).
+
+The model mirrors the contract state machine, its checks (in the contract order,
+raising the contract error) and its escrow flows, without any network access, so
+that governance scenarios and parameter changes can be explored in bulk before
+being applied with `config_xgov_registry`. A failing method leaves the model
+untouched, as a failing transaction leaves the contract untouched.
+
+Not modelled: the Minimum Balance Requirement (`balance` is the Proposal escrow
+balance above it), ARC-28 events and the transaction group validation of the
+daemon methods.
+"""
+
+import inspect
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import ParamSpec, TypeVar, cast
+
+from algosdk import encoding
+
+import smart_contracts.errors.std_errors as err
+from smart_contracts.proposal import constants as const
+from smart_contracts.proposal import enums as enm
+from smart_contracts.xgov_registry.committee_merkle import (
+    CommitteeMembershipProof,
+    verify_membership_proof,
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+XGovVote = tuple[str, int, int]
+
+
+class ProposalEmulatorError(Exception):
+    """A contract check failed, `error` is the contract error message"""
+
+    def __init__(self, error: str) -> None:
+        super().__init__(error)
+        self.error = error
+
+
+def _public_key(address: str) -> bytes:
+    public_key: bytes = encoding.decode_address(address)  # type: ignore[no-untyped-call]
+    return public_key
+
+
+def _require(condition: bool, error: str) -> None:  # noqa: FBT001
+    if not condition:
+        raise ProposalEmulatorError(error)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RegistryConfig:
+    """xGov Registry configuration read by the Proposal"""
+
+    xgov_daemon: str
+    xgov_council: str
+    paused_registry: bool = False
+    committee_id: bytes
+    committee_members: int
+    committee_votes: int
+    committee_root: bytes = b""
+    open_proposal_fee: int
+    daemon_ops_funding_bps: int
+    proposal_commitment_bps: int
+    min_requested_amount: int
+    max_requested_amount_small: int
+    max_requested_amount_medium: int
+    max_requested_amount_large: int
+    discussion_duration_small: int
+    discussion_duration_medium: int
+    discussion_duration_large: int
+    voting_duration_small: int
+    voting_duration_medium: int
+    voting_duration_large: int
+    quorum_small: int
+    quorum_large: int
+    weighted_quorum_small: int
+    weighted_quorum_large: int
+
+    @classmethod
+    def from_global_state(cls, global_state: Mapping[str, object]) -> "RegistryConfig":
+        """Reads the configuration from the xGov Registry (or mock) global state"""
+        fields = {
+            name: global_state[name]
+            for name in inspect.signature(cls).parameters
+            if name in global_state
+        }
+        fields["paused_registry"] = bool(fields.get("paused_registry", False))
+        return cls(**fields)  # type: ignore[arg-type]
+
+
+def relative_to_absolute_amount(amount: int, fraction_in_bps: int) -> int:
+    return amount * fraction_in_bps // const.BPS
+
+
+def get_category(requested_amount: int, config: RegistryConfig) -> int:
+    if requested_amount <= config.max_requested_amount_small:
+        return enm.FUNDING_CATEGORY_SMALL
+    elif requested_amount <= config.max_requested_amount_medium:
+        return enm.FUNDING_CATEGORY_MEDIUM
+    else:
+        return enm.FUNDING_CATEGORY_LARGE
+
+
+def _interpolate_bps(
+    requested_amount: int, min_bps: int, max_bps: int, config: RegistryConfig
+) -> int:
+    # Linear in the requested amount, from `min_bps` at the min requested amount
+    # to `max_bps` at the max requested amount
+    delta_amount = config.max_requested_amount_large - config.min_requested_amount
+    return (
+        min_bps
+        + (max_bps - min_bps)
+        * (requested_amount - config.min_requested_amount)
+        // delta_amount
+    )
+
+
+def compute_quorum_threshold(
+    committee_members: int, requested_amount: int, config: RegistryConfig
+) -> int:
+    quorum_bps = _interpolate_bps(
+        requested_amount, config.quorum_small, config.quorum_large, config
+    )
+    return relative_to_absolute_amount(committee_members, quorum_bps)
+
+
+def compute_weighted_quorum_threshold(
+    committee_votes: int, requested_amount: int, config: RegistryConfig
+) -> int:
+    weighted_quorum_bps = _interpolate_bps(
+        requested_amount,
+        config.weighted_quorum_small,
+        config.weighted_quorum_large,
+        config,
+    )
+    return relative_to_absolute_amount(committee_votes, weighted_quorum_bps)
+
+
+def is_boycott(votes: int, approvals: int, rejections: int) -> bool:
+    return approvals == votes and rejections == votes
+
+
+def is_proposal_approved(
+    *,
+    quorum_threshold: int,
+    weighted_quorum_threshold: int,
+    voted_members: int,
+    boycotted_members: int,
+    approvals: int,
+    rejections: int,
+    nulls: int,
+) -> bool:
+    """
+    Both quorums are reached (boycotts do not count for the voters quorum, nulls
+    count for both) and approvals have the relative majority over rejections.
+    """
+    is_quorum_voters_reached = (
+        quorum_threshold > 0 and voted_members - boycotted_members >= quorum_threshold
+    )
+    is_weighted_quorum_votes_reached = (
+        weighted_quorum_threshold > 0
+        and approvals + rejections + nulls >= weighted_quorum_threshold
+    )
+    return (
+        is_quorum_voters_reached
+        and is_weighted_quorum_votes_reached
+        and approvals > rejections
+    )
+
+
+def _atomic(method: Callable[P, R]) -> Callable[P, R]:
+    """Reverts the model if the method fails midway, as a failed transaction"""
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        emulator = args[0]
+        assert isinstance(emulator, ProposalEmulator)
+        with emulator._reverted_on_error():
+            return method(*args, **kwargs)
+
+    wrapper.__doc__ = method.__doc__
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class ProposalEmulator:
+    """
+    In-memory Proposal, created by the xGov Registry with its configuration.
+
+    Methods are named after the contract ABI methods. The latest block timestamp
+    is `now`, to be moved forward by the scenario. Methods called by the xGov
+    Registry take the `caller_app_id` (default: the registry), the others the
+    transaction `sender`. Payments from the Proposal escrow are recorded in
+    `payments`, as `(receiver, amount)`.
+
+    The contract vote methods return their errors, which the xGov Registry turns
+    into a failure: the model raises them, as seen from the xGov Registry.
+    """
+
+    def __init__(
+        self,
+        config: RegistryConfig,
+        *,
+        proposer: str,
+        registry_app_id: int = 0,
+        registry_address: str = "",
+        balance: int = 0,
+        now: int = 0,
+    ) -> None:
+        self.config = config
+        self.registry_address = registry_address
+        self.balance = balance
+        self.now = now
+        self.payments: list[tuple[str, int]] = []
+
+        # Base State
+        self.proposer = proposer
+        self.registry_app_id = registry_app_id
+
+        # From xGov Registry
+        self.committee_id = config.committee_id
+        self.committee_members = config.committee_members
+        self.committee_votes = config.committee_votes
+        self.committee_root = config.committee_root
+        self.open_proposal_fee = config.open_proposal_fee
+        self.daemon_ops_funding_bps = config.daemon_ops_funding_bps
+
+        # Time Anchors
+        self.open_ts = 0
+        self.submission_ts = 0
+        self.vote_open_ts = 0
+
+        # Proposal State
+        self.status = enm.STATUS_EMPTY
+        self.finalized = False
+        self.metadata_uploaded = False
+
+        # Proposal Configuration
+        self.title = ""
+        self.funding_category = enm.FUNDING_CATEGORY_NULL
+        self.focus = enm.FOCUS_NULL
+        self.funding_type = enm.FUNDING_NULL
+        self.requested_amount = 0
+        self.locked_amount = 0
+        self.discussion_duration = 0
+        self.voting_duration = 0
+        self.quorum_threshold = 0
+        self.weighted_quorum_threshold = 0
+
+        # Proposal Vote
+        self.assigned_members = 0
+        self.assigned_votes = 0
+        self.voted_members = 0
+        self.boycotted_members = 0
+        self.approvals = 0
+        self.rejections = 0
+        self.nulls = 0
+        self.voter_buckets = 0
+        self.state_version = 0
+
+        # Boxes
+        self.voters: dict[str, int] = {}
+        self.metadata = b""
+        self.voted_ordinals: set[int] = set()
+        # Public keys of each bucket voters, by ascending address
+        self.voter_bucket: dict[int, list[bytes]] = {}
+
+    @classmethod
+    def from_global_state(
+        cls,
+        config: RegistryConfig,
+        global_state: Mapping[str, object],
+        *,
+        voters: Mapping[str, int] | None = None,
+        registry_address: str = "",
+        balance: int = 0,
+        now: int = 0,
+    ) -> "ProposalEmulator":
+        """
+        Models an existing Proposal from its global state (`get_state`) and its
+        assigned voters. Voter buckets are rebuilt from the voters.
+        """
+        emulator = cls(
+            config,
+            proposer=str(global_state["proposer"]),
+            registry_app_id=cast(int, global_state["registry_app_id"]),
+            registry_address=registry_address,
+            balance=balance,
+            now=now,
+        )
+        state_keys = emulator.state().keys()
+        for name, value in global_state.items():
+            if name in state_keys:
+                setattr(emulator, name, value)
+        emulator.finalized = bool(emulator.finalized)
+        emulator.metadata_uploaded = bool(emulator.metadata_uploaded)
+        emulator.voters = dict(voters or {})
+        if emulator.voter_buckets:
+            public_keys: dict[str, bytes] = {
+                address: _public_key(address) for address in emulator.voters
+            }
+            for address in sorted(public_keys, key=public_keys.__getitem__):
+                emulator.voter_bucket.setdefault(
+                    emulator.get_voter_bucket(address), []
+                ).append(public_keys[address])
+        return emulator
+
+    def state(self) -> dict[str, object]:
+        """Global state, shaped as the Proposal client `global_state.get_all()`"""
+        return {
+            "proposer": self.proposer,
+            "registry_app_id": self.registry_app_id,
+            "committee_id": self.committee_id,
+            "committee_members": self.committee_members,
+            "committee_votes": self.committee_votes,
+            "committee_root": self.committee_root,
+            "open_proposal_fee": self.open_proposal_fee,
+            "daemon_ops_funding_bps": self.daemon_ops_funding_bps,
+            "open_ts": self.open_ts,
+            "submission_ts": self.submission_ts,
+            "vote_open_ts": self.vote_open_ts,
+            "status": self.status,
+            "finalized": int(self.finalized),
+            "metadata_uploaded": int(self.metadata_uploaded),
+            "title": self.title,
+            "funding_category": self.funding_category,
+            "focus": self.focus,
+            "funding_type": self.funding_type,
+            "requested_amount": self.requested_amount,
+            "locked_amount": self.locked_amount,
+            "discussion_duration": self.discussion_duration,
+            "voting_duration": self.voting_duration,
+            "quorum_threshold": self.quorum_threshold,
+            "weighted_quorum_threshold": self.weighted_quorum_threshold,
+            "assigned_members": self.assigned_members,
+            "assigned_votes": self.assigned_votes,
+            "voted_members": self.voted_members,
+            "boycotted_members": self.boycotted_members,
+            "approvals": self.approvals,
+            "rejections": self.rejections,
+            "nulls": self.nulls,
+            "voter_buckets": self.voter_buckets,
+            "state_version": self.state_version,
+        }
+
+    @contextmanager
+    def _reverted_on_error(self) -> Iterator[None]:
+        attributes = cast(dict[str, object], self.__dict__)
+        snapshot = dict(attributes)
+        containers = {
+            "payments": list(self.payments),
+            "voters": dict(self.voters),
+            "voted_ordinals": set(self.voted_ordinals),
+            "voter_bucket": {
+                bucket: list(members) for bucket, members in self.voter_bucket.items()
+            },
+        }
+        try:
+            yield
+        except ProposalEmulatorError:
+            attributes.update(snapshot)
+            attributes.update(containers)
+            raise
+
+    # Helpers, as in `contract.py`
+
+    def check_registry_not_paused(self) -> None:
+        _require(not self.config.paused_registry, err.PAUSED_REGISTRY)
+
+    def is_registry_call(self, caller_app_id: int | None) -> bool:
+        return caller_app_id is None or caller_app_id == self.registry_app_id
+
+    def is_voting_open(self) -> bool:
+        return self.now - self.vote_open_ts <= self.voting_duration
+
+    def is_plebiscite(self) -> bool:
+        return self.voted_members == self.committee_members
+
+    def has_committee_root(self) -> bool:
+        return len(self.committee_root) > 0
+
+    def is_committee_member(
+        self, voter: str, voting_power: int, ordinal: int, proof: Sequence[bytes]
+    ) -> bool:
+        membership = CommitteeMembershipProof(
+            address=voter, votes=voting_power, ordinal=ordinal, proof=tuple(proof)
+        )
+        return ordinal < self.committee_members and verify_membership_proof(
+            self.committee_root, membership
+        )
+
+    def unassign_member(self, ordinal: int, voting_power: int) -> None:
+        self.voted_ordinals.add(ordinal)
+        self.assigned_members -= 1
+        self.assigned_votes -= voting_power
+
+    def get_voter_bucket(self, voter: str) -> int:
+        public_key = _public_key(voter)
+        return (
+            int.from_bytes(public_key[:2], "big")
+            * self.voter_buckets
+            // const.VOTER_BUCKET_PREFIX_RANGE
+        )
+
+    def get_discussion_duration(self, category: int) -> int:
+        if category == enm.FUNDING_CATEGORY_SMALL:
+            return self.config.discussion_duration_small
+        elif category == enm.FUNDING_CATEGORY_MEDIUM:
+            return self.config.discussion_duration_medium
+        else:
+            return self.config.discussion_duration_large
+
+    def get_voting_duration(self, category: int) -> int:
+        if category == enm.FUNDING_CATEGORY_SMALL:
+            return self.config.voting_duration_small
+        elif category == enm.FUNDING_CATEGORY_MEDIUM:
+            return self.config.voting_duration_medium
+        else:
+            return self.config.voting_duration_large
+
+    def is_proposal_approved(self) -> bool:
+        return is_proposal_approved(
+            quorum_threshold=self.quorum_threshold,
+            weighted_quorum_threshold=self.weighted_quorum_threshold,
+            voted_members=self.voted_members,
+            boycotted_members=self.boycotted_members,
+            approvals=self.approvals,
+            rejections=self.rejections,
+            nulls=self.nulls,
+        )
+
+    def pay(self, receiver: str, amount: int) -> None:
+        _require(amount <= self.balance, err.INSUFFICIENT_FUNDS)
+        self.balance -= amount
+        self.payments.append((receiver, amount))
+
+    def transfer_locked_amount(self, receiver: str) -> None:
+        self.pay(receiver, self.locked_amount)
+        self.locked_amount = 0
+
+    def bump_state_version(self) -> None:
+        self.state_version += 1
+
+    def open_voting(self) -> None:
+        self.status = enm.STATUS_VOTING
+        self.vote_open_ts = self.now
+
+    def open_voting_if_assigned(self) -> None:
+        if self.assigned_members == self.committee_members:
+            _require(
+                self.assigned_votes == self.committee_votes,
+                err.VOTING_POWER_MISMATCH,
+            )
+            self.open_voting()
+
+    def assert_draft_and_proposer(self, sender: str) -> None:
+        _require(sender == self.proposer, err.UNAUTHORIZED)
+        _require(
+            self.status == enm.STATUS_DRAFT and not self.finalized,
+            err.WRONG_PROPOSAL_STATUS,
+        )
+
+    def get_voter(self, voter: str) -> int:
+        return self.voters.get(voter, 0)
+
+    def _assign_voter(self, voter: str, voting_power: int) -> None:
+        _require(voter not in self.voters, err.VOTER_ALREADY_ASSIGNED)
+        _require(voting_power > 0, err.INVALID_VOTING_POWER)
+        self.voters[voter] = voting_power
+        self.assigned_members += 1
+        self.assigned_votes += voting_power
+
+    def _assign_bucket_voter(self, voter: str, voting_power: int) -> None:
+        _require(voting_power > 0, err.INVALID_VOTING_POWER)
+        public_key = _public_key(voter)
+        bucket = self.voter_bucket.setdefault(self.get_voter_bucket(voter), [])
+        # Appending sorted voters keeps the bucket searchable
+        _require(not bucket or bucket[-1] < public_key, err.VOTER_ALREADY_ASSIGNED)
+        _require(len(bucket) < const.VOTER_BUCKET_MAX_MEMBERS, err.VOTER_BUCKET_FULL)
+        bucket.append(public_key)
+        self.voters[voter] = voting_power
+        self.assigned_members += 1
+        self.assigned_votes += voting_power
+
+    def _unassign_voter(self, voter: str, voting_power: int) -> None:
+        if self.voter_buckets:
+            bucket_index = self.get_voter_bucket(voter)
+            bucket = self.voter_bucket[bucket_index]
+            bucket.remove(_public_key(voter))
+            if not bucket:
+                del self.voter_bucket[bucket_index]
+        else:
+            _require(voter in self.voters, err.VOTER_NOT_FOUND)
+            _require(voting_power > 0, err.INVALID_VOTING_POWER)
+        del self.voters[voter]
+        self.assigned_members -= 1
+        self.assigned_votes -= voting_power
+
+    def votes_validation(self, votes: int, approvals: int, rejections: int) -> None:
+        _require(
+            approvals + rejections <= votes or is_boycott(votes, approvals, rejections),
+            err.VOTES_INVALID,
+        )
+
+    def count_vote(self, votes: int, approvals: int, rejections: int) -> None:
+        self.voted_members += 1
+        if is_boycott(votes, approvals, rejections):
+            self.boycotted_members += 1
+        else:
+            self.approvals += approvals
+            self.rejections += rejections
+            self.nulls += votes - approvals - rejections
+
+    def register_vote(self, voter: str, approvals: int, rejections: int) -> None:
+        votes = self.get_voter(voter)
+        _require(votes != 0, err.VOTER_NOT_FOUND)
+        self.votes_validation(votes, approvals, rejections)
+        self._unassign_voter(voter, votes)
+        self.count_vote(votes, approvals, rejections)
+
+    def vote_check_authorization(self, caller_app_id: int | None) -> None:
+        _require(self.is_registry_call(caller_app_id), err.UNAUTHORIZED)
+        _require(self.status == enm.STATUS_VOTING, err.WRONG_PROPOSAL_STATUS)
+        _require(self.is_voting_open(), err.VOTING_PERIOD_EXPIRED)
+
+    # ABI methods
+
+    @_atomic
+    def open(
+        self,
+        *,
+        sender: str,
+        title: str,
+        funding_type: int,
+        requested_amount: int,
+        focus: int,
+        payment_amount: int,
+        payment_sender: str | None = None,
+    ) -> None:
+        """Opens the first draft, the proposer locking `payment_amount`"""
+        self.check_registry_not_paused()
+        _require(sender == self.proposer, err.UNAUTHORIZED)
+        _require(
+            self.status == enm.STATUS_EMPTY and not self.finalized,
+            err.WRONG_PROPOSAL_STATUS,
+        )
+
+        _require(
+            0 < len(title.encode()) <= const.TITLE_MAX_BYTES, err.WRONG_TITLE_LENGTH
+        )
+        _require(
+            funding_type in (enm.FUNDING_PROACTIVE, enm.FUNDING_RETROACTIVE),
+            err.WRONG_FUNDING_TYPE,
+        )
+        _require(
+            requested_amount >= self.config.min_requested_amount,
+            err.WRONG_MIN_REQUESTED_AMOUNT,
+        )
+        _require(
+            requested_amount <= self.config.max_requested_amount_large,
+            err.WRONG_MAX_REQUESTED_AMOUNT,
+        )
+
+        _require((payment_sender or sender) == self.proposer, err.WRONG_SENDER)
+        _require(
+            payment_amount
+            == relative_to_absolute_amount(
+                requested_amount, self.config.proposal_commitment_bps
+            ),
+            err.WRONG_LOCKED_AMOUNT,
+        )
+        _require(requested_amount != 0, err.MISSING_CONFIG)
+
+        self.bump_state_version()
+        self.balance += payment_amount
+
+        self.title = title
+        self.funding_category = get_category(requested_amount, self.config)
+        self.funding_type = funding_type
+        self.requested_amount = requested_amount
+        self.focus = focus
+        self.locked_amount = payment_amount
+
+        self.discussion_duration = self.get_discussion_duration(self.funding_category)
+        self.voting_duration = self.get_voting_duration(self.funding_category)
+        self.quorum_threshold = compute_quorum_threshold(
+            self.committee_members, requested_amount, self.config
+        )
+        self.weighted_quorum_threshold = compute_weighted_quorum_threshold(
+            self.committee_votes, requested_amount, self.config
+        )
+
+        self.status = enm.STATUS_DRAFT
+        self.open_ts = self.now
+
+    @_atomic
+    def upload_metadata(
+        self, *, sender: str, payload: bytes, is_first_in_group: bool
+    ) -> None:
+        self.check_registry_not_paused()
+        self.assert_draft_and_proposer(sender)
+        _require(len(payload) > 0, err.EMPTY_PAYLOAD)
+
+        self.bump_state_version()
+        self.metadata_uploaded = True
+        self.metadata = payload if is_first_in_group else self.metadata + payload
+
+    @_atomic
+    def drop(self, *, caller_app_id: int | None = None) -> None:
+        _require(self.is_registry_call(caller_app_id), err.UNAUTHORIZED)
+        _require(
+            self.status == enm.STATUS_DRAFT and not self.finalized,
+            err.WRONG_PROPOSAL_STATUS,
+        )
+
+        self.bump_state_version()
+        self.transfer_locked_amount(self.proposer)
+        self.metadata = b""
+        self.finalized = True
+
+    @_atomic
+    def submit(self, *, sender: str) -> None:
+        """
+        Submits the draft, funding the xGov Daemon operations. The voting opens
+        right away if the Committee has a Merkle root.
+        """
+        self.check_registry_not_paused()
+        self.assert_draft_and_proposer(sender)
+        _require(self.now - self.open_ts >= self.discussion_duration, err.TOO_EARLY)
+        _require(self.metadata_uploaded, err.MISSING_METADATA)
+
+        self.bump_state_version()
+        self.pay(
+            self.config.xgov_daemon,
+            relative_to_absolute_amount(
+                self.open_proposal_fee, self.daemon_ops_funding_bps
+            ),
+        )
+        self.status = enm.STATUS_SUBMITTED
+        self.submission_ts = self.now
+
+        if self.has_committee_root():
+            self.assigned_members = self.committee_members
+            self.assigned_votes = self.committee_votes
+            self.open_voting()
+
+    def assign_voters_check_authorization(self, sender: str) -> None:
+        _require(sender == self.config.xgov_daemon, err.UNAUTHORIZED)
+        _require(self.status == enm.STATUS_SUBMITTED, err.WRONG_PROPOSAL_STATUS)
+
+    @_atomic
+    def assign_voters(self, *, sender: str, voters: Sequence[tuple[str, int]]) -> None:
+        self.assign_voters_check_authorization(sender)
+        _require(not self.voter_buckets, err.VOTERS_ASSIGNED)
+
+        self.bump_state_version()
+        for voter, voting_power in voters:
+            self._assign_voter(voter, voting_power)
+        self.open_voting_if_assigned()
+
+    @_atomic
+    def assign_voters_to_buckets(
+        self, *, sender: str, voters: Sequence[tuple[str, int]]
+    ) -> None:
+        self.assign_voters_check_authorization(sender)
+
+        self.bump_state_version()
+        if not self.voter_buckets:
+            _require(not self.assigned_members, err.VOTERS_ASSIGNED)
+            self.voter_buckets = (
+                self.committee_members + const.VOTER_BUCKET_MEMBERS - 1
+            ) // const.VOTER_BUCKET_MEMBERS
+
+        for voter, voting_power in voters:
+            self._assign_bucket_voter(voter, voting_power)
+        self.open_voting_if_assigned()
+
+    @_atomic
+    def vote(
+        self,
+        *,
+        voter: str,
+        approvals: int,
+        rejections: int,
+        caller_app_id: int | None = None,
+    ) -> None:
+        self.vote_check_authorization(caller_app_id)
+        self.bump_state_version()
+        self.register_vote(voter, approvals, rejections)
+
+    @_atomic
+    def vote_batch(
+        self, *, votes: Sequence[XGovVote], caller_app_id: int | None = None
+    ) -> None:
+        """Votes for several voters, all or none"""
+        self.vote_check_authorization(caller_app_id)
+        self.bump_state_version()
+        for voter, approvals, rejections in votes:
+            self.register_vote(voter, approvals, rejections)
+
+    @_atomic
+    def vote_with_proof(
+        self,
+        *,
+        voter: str,
+        voting_power: int,
+        ordinal: int,
+        proof: Sequence[bytes],
+        approvals: int,
+        rejections: int,
+        caller_app_id: int | None = None,
+    ) -> None:
+        self.vote_check_authorization(caller_app_id)
+        self.bump_state_version()
+
+        _require(
+            self.is_committee_member(voter, voting_power, ordinal, proof),
+            err.VOTER_NOT_FOUND,
+        )
+        _require(ordinal not in self.voted_ordinals, err.VOTER_ALREADY_VOTED)
+        self.votes_validation(voting_power, approvals, rejections)
+
+        self.unassign_member(ordinal, voting_power)
+        self.count_vote(voting_power, approvals, rejections)
+
+    @_atomic
+    def scrutiny(self) -> None:
+        """Closes the voting as Approved, or Rejected refunding the proposer"""
+        self.check_registry_not_paused()
+        _require(self.status == enm.STATUS_VOTING, err.WRONG_PROPOSAL_STATUS)
+        _require(not self.is_voting_open() or self.is_plebiscite(), err.VOTING_ONGOING)
+
+        self.bump_state_version()
+        if self.is_proposal_approved():
+            self.status = enm.STATUS_APPROVED
+        else:
+            self.status = enm.STATUS_REJECTED
+            self.transfer_locked_amount(self.proposer)
+
+    @_atomic
+    def unassign_absentees(
+        self, *, absentees: Sequence[str], caller_app_id: int | None = None
+    ) -> None:
+        _require(self.is_registry_call(caller_app_id), err.UNAUTHORIZED)
+        _require(
+            self.status in (enm.STATUS_APPROVED, enm.STATUS_REJECTED)
+            and not self.finalized,
+            err.WRONG_PROPOSAL_STATUS,
+        )
+
+        self.bump_state_version()
+        for absentee in absentees:
+            votes = self.get_voter(absentee)
+            _require(votes != 0, err.VOTER_NOT_FOUND)
+            self._unassign_voter(absentee, votes)
+
+    @_atomic
+    def unassign_absentee_with_proof(
+        self,
+        *,
+        absentee: str,
+        voting_power: int,
+        ordinal: int,
+        proof: Sequence[bytes],
+        caller_app_id: int | None = None,
+    ) -> None:
+        _require(self.is_registry_call(caller_app_id), err.UNAUTHORIZED)
+        _require(
+            self.status in (enm.STATUS_APPROVED, enm.STATUS_REJECTED)
+            and not self.finalized,
+            err.WRONG_PROPOSAL_STATUS,
+        )
+
+        self.bump_state_version()
+        _require(
+            self.is_committee_member(absentee, voting_power, ordinal, proof)
+            and ordinal not in self.voted_ordinals,
+            err.VOTER_NOT_FOUND,
+        )
+        self.unassign_member(ordinal, voting_power)
+
+    @_atomic
+    def review(self, *, sender: str, block: bool) -> None:
+        """
+        Council review: a veto slashes the locked amount to the xGov Registry,
+        otherwise it is refunded to the proposer.
+        """
+        _require(sender == self.config.xgov_council, err.UNAUTHORIZED)
+        _require(self.status == enm.STATUS_APPROVED, err.WRONG_PROPOSAL_STATUS)
+        _require(self.assigned_members == 0, err.VOTERS_ASSIGNED)
+
+        self.bump_state_version()
+        if block:
+            self.status = enm.STATUS_BLOCKED
+            self.transfer_locked_amount(self.registry_address)
+        else:
+            self.status = enm.STATUS_REVIEWED
+            self.transfer_locked_amount(self.proposer)
+
+    @_atomic
+    def fund(self, *, caller_app_id: int | None = None) -> None:
+        _require(self.is_registry_call(caller_app_id), err.UNAUTHORIZED)
+        _require(self.status == enm.STATUS_REVIEWED, err.WRONG_PROPOSAL_STATUS)
+
+        self.bump_state_version()
+        self.status = enm.STATUS_FUNDED
+
+    @_atomic
+    def unassign_voters(self, *, sender: str, voters: Sequence[str]) -> None:
+        _require(sender == self.config.xgov_daemon, err.UNAUTHORIZED)
+        _require(self.status == enm.STATUS_SUBMITTED, err.WRONG_PROPOSAL_STATUS)
+
+        self.bump_state_version()
+        for voter in voters:
+            votes = self.get_voter(voter)
+            if votes:
+                self._unassign_voter(voter, votes)
+
+    @_atomic
+    def finalize(self, *, caller_app_id: int | None = None) -> None:
+        """
+        Finalizes a closed Proposal, refunding the locked amount of a draft and
+        returning the escrow balance to the xGov Registry.
+        """
+        _require(self.is_registry_call(caller_app_id), err.UNAUTHORIZED)
+        _require(
+            not self.finalized
+            and self.status
+            in (
+                enm.STATUS_EMPTY,
+                enm.STATUS_DRAFT,
+                enm.STATUS_FUNDED,
+                enm.STATUS_BLOCKED,
+                enm.STATUS_REJECTED,
+            ),
+            err.WRONG_PROPOSAL_STATUS,
+        )
+
+        self.bump_state_version()
+        _require(self.assigned_members == 0, err.VOTERS_ASSIGNED)
+        if self.status == enm.STATUS_DRAFT:
+            self.transfer_locked_amount(self.proposer)
+        self.pay(self.registry_address, self.balance)
+        self.finalized = True
+
+    @_atomic
+    def delete(self, *, sender: str) -> None:
+        _require(sender == self.config.xgov_daemon, err.UNAUTHORIZED)
+        _require(self.finalized, err.WRONG_PROPOSAL_STATUS)
+
+        self.metadata = b""
+        self.voted_ordinals.clear()
+        self.pay(self.registry_address, self.balance)
@@ -0,0 +1,52 @@
+from algosdk import encoding
+
+from smart_contracts.proposal.config import (
+    VOTED_BITMAP_BOX_KEY_PREFIX,
+    VOTER_BOX_KEY_PREFIX,
+    VOTER_BUCKET_BOX_KEY_PREFIX,
+)
+from smart_contracts.xgov_registry.config import (
+    PROPOSER_BOX_MAP_PREFIX,
+    REQUEST_BOX_MAP_PREFIX,
+    REQUEST_UNSUBSCRIBE_BOX_MAP_PREFIX,
+    XGOV_BOX_MAP_PREFIX,
+)
+
+
+def _public_key(address: str) -> bytes:
+    public_key: bytes = encoding.decode_address(address)  # type: ignore[no-untyped-call]
+    return public_key
+
+
+# xGov Registry boxes
+
+
+def get_xgov_box_name(address: str) -> bytes:
+    return XGOV_BOX_MAP_PREFIX + _public_key(address)
+
+
+def get_proposer_box_name(address: str) -> bytes:
+    return PROPOSER_BOX_MAP_PREFIX + _public_key(address)
+
+
+def get_request_box_name(request_id: int) -> bytes:
+    return REQUEST_BOX_MAP_PREFIX + request_id.to_bytes(8, "big")
+
+
+def get_request_unsubscribe_box_name(request_id: int) -> bytes:
+    return REQUEST_UNSUBSCRIBE_BOX_MAP_PREFIX + request_id.to_bytes(8, "big")
+
+
+# Proposal boxes
+
+
+def get_voter_box_name(address: str) -> bytes:
+    return VOTER_BOX_KEY_PREFIX.encode() + _public_key(address)
+
+
+def get_voter_bucket_box_name(bucket: int) -> bytes:
+    return VOTER_BUCKET_BOX_KEY_PREFIX.encode() + bucket.to_bytes(8, "big")
+
+
+def get_voted_bitmap_box_name(page: int) -> bytes:
+    return VOTED_BITMAP_BOX_KEY_PREFIX.encode() + page.to_bytes(8, "big")
@@ -0,0 +1,219 @@
+from collections.abc import Callable, Iterable
+from typing import TypeVar, cast
+
+from algokit_utils import BoxReference, CommonAppCallParams
+
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    GetProposalsSummaryArgs,
+    GetProposerBoxesArgs,
+    GetRequestBoxesArgs,
+    GetRequestUnsubscribeBoxesArgs,
+    GetXgovBoxesArgs,
+    XGovRegistryClient,
+    XGovRegistryComposer,
+)
+from smart_contracts.xgov_registry.box_names import (
+    get_proposer_box_name,
+    get_request_box_name,
+    get_request_unsubscribe_box_name,
+    get_xgov_box_name,
+)
+from smart_contracts.xgov_registry.constants import (
+    MAX_APP_TXN_REFERENCES,
+    MAX_GROUP_SIZE,
+    MAX_PROPOSALS_SUMMARY,
+)
+
+K = TypeVar("K", str, int)
+
+# Each entry read by a batch view call needs its box reference
+ENTRIES_PER_CALL = MAX_APP_TXN_REFERENCES
+
+BoxEntry = tuple[tuple[object, ...], bool]
+ProposalSummaryEntry = tuple[object, ...]
+
+
+def _unique(keys: Iterable[K]) -> list[K]:
+    unique: list[K] = []
+    seen: set[K] = set()
+    for key in keys:
+        if key not in seen:
+            seen.add(key)
+            unique.append(key)
+    return unique
+
+
+def _read_entries(
+    xgov_registry_client: XGovRegistryClient,
+    keys: Iterable[K],
+    box_name: Callable[[K], bytes],
+    add_call: Callable[
+        [XGovRegistryComposer, list[K], CommonAppCallParams], XGovRegistryComposer
+    ],
+    sender: str | None,
+) -> dict[K, BoxEntry]:
+    """
+    Coalesces the keys (duplicates are read once) into batch view calls of
+    `ENTRIES_PER_CALL` entries, packed in simulated groups of `MAX_GROUP_SIZE`
+    calls.
+    """
+    unique = _unique(keys)
+    calls = [
+        list(unique[i : i + ENTRIES_PER_CALL])
+        for i in range(0, len(unique), ENTRIES_PER_CALL)
+    ]
+
+    entries: dict[K, BoxEntry] = {}
+    for start in range(0, len(calls), MAX_GROUP_SIZE):
+        group = calls[start : start + MAX_GROUP_SIZE]
+        composer = xgov_registry_client.new_group()
+        for i, call in enumerate(group):
+            add_call(
+                composer,
+                call,
+                CommonAppCallParams(
+                    sender=sender,
+                    box_references=[
+                        BoxReference(app_id=0, name=box_name(key)) for key in call
+                    ],
+                    # Distinguishes otherwise identical calls
+                    note=i.to_bytes(8, "big"),
+                ),
+            )
+        result = composer.simulate(
+            allow_empty_signatures=True,
+            skip_signatures=True,
+        )
+        for call, call_return in zip(group, result.returns, strict=True):
+            call_entries = cast(list[BoxEntry], call_return.value)
+            entries.update(zip(call, call_entries, strict=True))
+    return entries
+
+
+def read_xgov_boxes(
+    xgov_registry_client: XGovRegistryClient,
+    xgov_addresses: Iterable[str],
+    *,
+    sender: str | None = None,
+) -> dict[str, BoxEntry]:
+    """
+    Reads the xGov Boxes of several addresses with the fewest `get_xgov_boxes`
+    simulate calls.
+
+    Returns:
+        The `(xgov_box_value, exists)` entry of each address
+    """
+    return _read_entries(
+        xgov_registry_client,
+        xgov_addresses,
+        get_xgov_box_name,
+        lambda composer, call, params: composer.get_xgov_boxes(
+            args=GetXgovBoxesArgs(xgov_addresses=call), params=params
+        ),
+        sender,
+    )
+
+
+def read_proposer_boxes(
+    xgov_registry_client: XGovRegistryClient,
+    proposer_addresses: Iterable[str],
+    *,
+    sender: str | None = None,
+) -> dict[str, BoxEntry]:
+    """
+    Reads the Proposer Boxes of several addresses with the fewest
+    `get_proposer_boxes` simulate calls.
+
+    Returns:
+        The `(proposer_box_value, exists)` entry of each address
+    """
+    return _read_entries(
+        xgov_registry_client,
+        proposer_addresses,
+        get_proposer_box_name,
+        lambda composer, call, params: composer.get_proposer_boxes(
+            args=GetProposerBoxesArgs(proposer_addresses=call), params=params
+        ),
+        sender,
+    )
+
+
+def read_request_boxes(
+    xgov_registry_client: XGovRegistryClient,
+    request_ids: Iterable[int],
+    *,
+    unsubscribe: bool = False,
+    sender: str | None = None,
+) -> dict[int, BoxEntry]:
+    """
+    Reads the xGov subscribe (or unsubscribe) request Boxes of several request IDs
+    with the fewest `get_request_boxes` (or `get_request_unsubscribe_boxes`)
+    simulate calls.
+
+    Returns:
+        The `(request_box_value, exists)` entry of each request ID
+    """
+    if unsubscribe:
+        return _read_entries(
+            xgov_registry_client,
+            request_ids,
+            get_request_unsubscribe_box_name,
+            lambda composer, call, params: composer.get_request_unsubscribe_boxes(
+                args=GetRequestUnsubscribeBoxesArgs(request_ids=call), params=params
+            ),
+            sender,
+        )
+    return _read_entries(
+        xgov_registry_client,
+        request_ids,
+        get_request_box_name,
+        lambda composer, call, params: composer.get_request_boxes(
+            args=GetRequestBoxesArgs(request_ids=call), params=params
+        ),
+        sender,
+    )
+
+
+def read_proposals_summary(
+    xgov_registry_client: XGovRegistryClient,
+    proposal_ids: Iterable[int],
+    *,
+    sender: str | None = None,
+) -> dict[int, ProposalSummaryEntry]:
+    """
+    Reads the summary of several Proposals with the fewest `get_proposals_summary`
+    simulate calls, each call reading up to `MAX_PROPOSALS_SUMMARY` Proposals
+    (duplicates are read once).
+
+    Returns:
+        The `ProposalSummary` of each Proposal ID, with `exists` `False` if the ID
+        is not a Proposal of the xGov Registry
+    """
+    unique = _unique(proposal_ids)
+    calls = [
+        unique[i : i + MAX_PROPOSALS_SUMMARY]
+        for i in range(0, len(unique), MAX_PROPOSALS_SUMMARY)
+    ]
+
+    summaries: dict[int, ProposalSummaryEntry] = {}
+    for start in range(0, len(calls), MAX_GROUP_SIZE):
+        group = calls[start : start + MAX_GROUP_SIZE]
+        composer = xgov_registry_client.new_group()
+        for i, call in enumerate(group):
+            composer.get_proposals_summary(
+                args=GetProposalsSummaryArgs(proposal_ids=call),
+                params=CommonAppCallParams(
+                    sender=sender,
+                    app_references=call,
+                    # Distinguishes otherwise identical calls
+                    note=i.to_bytes(8, "big"),
+                ),
+            )
+        result = composer.simulate(
+            allow_empty_signatures=True,
+            skip_signatures=True,
+        )
+        for call, call_return in zip(group, result.returns, strict=True):
+            call_summaries = cast(list[ProposalSummaryEntry], call_return.value)
+            summaries.update(zip(call, call_summaries, strict=True))
+    return summaries
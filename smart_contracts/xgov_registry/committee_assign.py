@@ -0,0 +1,526 @@
+import logging
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TypeGuard
+
+from algokit_utils import BoxReference, CommonAppCallParams, TransactionComposer
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import wait_for_confirmation
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.proposal.proposal_client import (
+    AssignVotersArgs,
+    AssignVotersToBucketsArgs,
+    GlobalStateValue,
+    ProposalClient,
+    ProposalComposer,
+)
+from smart_contracts.proposal.constants import (
+    VOTER_BUCKET_MAX_MEMBERS,
+    VOTER_BUCKET_MEMBERS,
+    VOTER_BUCKET_PREFIX_RANGE,
+)
+from smart_contracts.proposal.enums import STATUS_SUBMITTED
+from smart_contracts.xgov_registry.box_names import (
+    get_voter_box_name,
+    get_voter_bucket_box_name,
+)
+from smart_contracts.xgov_registry.committee_publish import parse_positive_int
+from smart_contracts.xgov_registry.constants import (
+    ADDRESS_LENGTH,
+    DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD,
+    MAX_APP_TOTAL_ARG_LEN,
+    MAX_APP_TXN_REFERENCES,
+    MAX_GROUP_SIZE,
+    METHOD_SELECTOR_LENGTH,
+    UINT64_LENGTH,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_GROUPS_IN_FLIGHT = 8
+
+# The registry app must be available to read the xGov Daemon address
+_REGISTRY_APP_REFERENCES = 1
+
+
+def max_voters_per_transaction() -> int:
+    """
+    Voters one `assign_voters` call can assign: each voter needs its own Voter Box
+    reference and a `(address,uint64)` entry in the application arguments.
+    """
+    return min(
+        MAX_APP_TXN_REFERENCES,
+        (
+            MAX_APP_TOTAL_ARG_LEN
+            - METHOD_SELECTOR_LENGTH
+            - DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD
+        )
+        // (ADDRESS_LENGTH + UINT64_LENGTH),
+    )
+
+
+def max_bucket_voters_per_transaction() -> int:
+    """
+    Voters one `assign_voters_to_buckets` call can assign, bound by the application
+    arguments only: voters of the same bucket share its box reference.
+    """
+    return (
+        MAX_APP_TOTAL_ARG_LEN
+        - METHOD_SELECTOR_LENGTH
+        - DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD
+    ) // (ADDRESS_LENGTH + UINT64_LENGTH)
+
+
+def _public_key(address: str) -> bytes:
+    public_key: bytes = encoding.decode_address(address)  # type: ignore[no-untyped-call]
+    return public_key
+
+
+def _is_valid_address(address: object) -> TypeGuard[str]:
+    if not isinstance(address, str):
+        return False
+    valid: bool = encoding.is_valid_address(address)  # type: ignore[no-untyped-call]
+    return valid
+
+
+def voter_buckets_count(committee_size: int) -> int:
+    return (committee_size + VOTER_BUCKET_MEMBERS - 1) // VOTER_BUCKET_MEMBERS
+
+
+def get_voter_bucket(address: str, buckets: int) -> int:
+    """Bucket of a voter, as computed by `Proposal.get_voter_bucket`"""
+    prefix = _public_key(address)[:2]
+    return int.from_bytes(prefix, "big") * buckets // VOTER_BUCKET_PREFIX_RANGE
+
+
+def parse_committee_members(committee: Mapping[str, object]) -> list[tuple[str, int]]:
+    """
+    Reads the `(address, votes)` members of an ARC-86 committee document.
+    """
+    xgovs = committee.get("xGovs")
+    if not isinstance(xgovs, list):
+        raise ValueError("committee must contain an xGovs list")
+
+    members: list[tuple[str, int]] = []
+    for xgov in xgovs:
+        if not isinstance(xgov, Mapping):
+            raise ValueError("committee xGovs must be objects")
+        address = xgov.get("address")
+        if not _is_valid_address(address):
+            raise ValueError(f"invalid xGov address: {address!r}")
+        members.append((address, parse_positive_int(xgov.get("votes"), "votes")))
+    return members
+
+
+@dataclass(frozen=True)
+class VotersAssignmentPlan:
+    """
+    Atomic groups of `assign_voters` calls assigning a committee to a Proposal.
+
+    Attributes:
+        groups: Per group, the voters of each `assign_voters` call. The first call
+            of every group also references the xGov Registry app
+    """
+
+    groups: tuple[tuple[tuple[tuple[str, int], ...], ...], ...]
+
+    @property
+    def transaction_count(self) -> int:
+        return sum(len(group) for group in self.groups)
+
+    @property
+    def voters_count(self) -> int:
+        return sum(len(txn) for group in self.groups for txn in group)
+
+
+def plan_voters_assignment(
+    committee: Sequence[tuple[str, int]],
+    *,
+    max_committee_size: int | None = None,
+    max_group_size: int = MAX_GROUP_SIZE,
+) -> VotersAssignmentPlan:
+    """
+    Packs the committee in the fewest atomic groups of `assign_voters` calls.
+
+    Resources are shared in the group, so each group can reference up to
+    `max_group_size * MAX_APP_TXN_REFERENCES` boxes, one reference being taken by
+    the xGov Registry app.
+
+    Args:
+        committee: `(address, votes)` of the committee members
+        max_committee_size: xGov Registry `max_committee_size`, if known
+        max_group_size: Max transactions per atomic group
+
+    Returns:
+        The assignment plan
+    """
+    if max_group_size <= 0:
+        raise ValueError("max_group_size must be positive")
+    if max_committee_size is not None and len(committee) > max_committee_size:
+        raise ValueError(
+            f"committee size {len(committee)} exceeds max committee size {max_committee_size}"
+        )
+
+    _validate_members(committee)
+
+    per_txn = max_voters_per_transaction()
+    groups: list[tuple[tuple[tuple[str, int], ...], ...]] = []
+    start = 0
+    while start < len(committee):
+        group: list[tuple[tuple[str, int], ...]] = []
+        # The first call also carries the registry app reference
+        size = per_txn - _REGISTRY_APP_REFERENCES
+        while len(group) < max_group_size and start < len(committee):
+            group.append(tuple(committee[start : start + size]))
+            start += size
+            size = per_txn
+        groups.append(tuple(group))
+    return VotersAssignmentPlan(groups=tuple(groups))
+
+
+def plan_bucketed_voters_assignment(
+    committee: Sequence[tuple[str, int]],
+    *,
+    buckets: int,
+    max_group_size: int = MAX_GROUP_SIZE,
+) -> VotersAssignmentPlan:
+    """
+    Packs the committee in the fewest atomic groups of `assign_voters_to_buckets`
+    calls.
+
+    Voters are sorted by address, as each bucket must be filled by ascending
+    address. A bucket is never split across groups, so the groups are independent
+    and a bucket is either fully assigned or not at all. A call references the
+    buckets of its voters, up to `MAX_APP_TXN_REFERENCES` (the first call of a
+    group also references the xGov Registry app). The remaining references are
+    left empty to raise the box I/O budget of the group, which then always
+    covers the buckets written by the group.
+
+    Args:
+        committee: `(address, votes)` of the committee members
+        buckets: Proposal `voter_buckets`, see `voter_buckets_count`
+        max_group_size: Max transactions per atomic group
+
+    Returns:
+        The assignment plan
+
+    Raises:
+        ValueError: If a bucket exceeds `VOTER_BUCKET_MAX_MEMBERS`, in which case
+            the committee must be assigned to Voter Boxes
+    """
+    if max_group_size <= 0:
+        raise ValueError("max_group_size must be positive")
+    if buckets <= 0:
+        raise ValueError("buckets must be positive")
+    _validate_members(committee)
+
+    by_bucket: dict[int, list[tuple[str, int]]] = {}
+    for member in sorted(committee, key=_member_public_key):
+        by_bucket.setdefault(get_voter_bucket(member[0], buckets), []).append(member)
+    for bucket, members in by_bucket.items():
+        if len(members) > VOTER_BUCKET_MAX_MEMBERS:
+            raise ValueError(
+                f"bucket {bucket} has {len(members)} voters, "
+                f"max {VOTER_BUCKET_MAX_MEMBERS}"
+            )
+
+    per_txn = max_bucket_voters_per_transaction()
+    groups: list[tuple[tuple[tuple[str, int], ...], ...]] = []
+    group: list[list[tuple[str, int]]] = []
+    for bucket, members in by_bucket.items():
+        placed = _place_bucket(group, bucket, members, buckets, per_txn, max_group_size)
+        if placed is None:
+            groups.append(tuple(tuple(txn) for txn in group))
+            placed = _place_bucket(
+                [], bucket, members, buckets, per_txn, max_group_size
+            )
+            if placed is None:
+                raise ValueError(f"bucket {bucket} does not fit in an atomic group")
+        group = placed
+    if group:
+        groups.append(tuple(tuple(txn) for txn in group))
+    return VotersAssignmentPlan(groups=tuple(groups))
+
+
+def _member_public_key(member: tuple[str, int]) -> bytes:
+    return _public_key(member[0])
+
+
+def _validate_members(committee: Sequence[tuple[str, int]]) -> None:
+    seen: set[str] = set()
+    for address, votes in committee:
+        if address in seen:
+            raise ValueError(f"duplicate committee member: {address}")
+        if votes <= 0:
+            raise ValueError(f"invalid voting power for {address}: {votes}")
+        seen.add(address)
+
+
+def _txn_buckets(voters: Iterable[tuple[str, int]], buckets: int) -> list[int]:
+    return sorted({get_voter_bucket(address, buckets) for address, _ in voters})
+
+
+def _place_bucket(
+    group: Sequence[Sequence[tuple[str, int]]],
+    bucket: int,
+    members: Sequence[tuple[str, int]],
+    buckets: int,
+    per_txn: int,
+    max_group_size: int,
+) -> list[list[tuple[str, int]]] | None:
+    """Appends a bucket voters to a group, None if the group cannot hold them all"""
+    txns = [list(txn) for txn in group]
+    for member in members:
+        if txns:
+            txn = txns[-1]
+            max_references = MAX_APP_TXN_REFERENCES - (
+                _REGISTRY_APP_REFERENCES if len(txns) == 1 else 0
+            )
+            if len(txn) < per_txn and (
+                bucket in _txn_buckets(txn, buckets)
+                or len(_txn_buckets(txn, buckets)) < max_references
+            ):
+                txn.append(member)
+                continue
+        if len(txns) == max_group_size:
+            return None
+        txns.append([member])
+    return txns
+
+
+def get_existing_boxes(
+    proposal_client: ProposalClient, box_names: Iterable[bytes]
+) -> set[bytes]:
+    """
+    Returns the given box names that exist in the Proposal, read by name since
+    the Voter and bucket boxes names are known (no listing of the app boxes).
+    """
+    algod = proposal_client.algorand.client.algod
+    existing: set[bytes] = set()
+    for name in box_names:
+        try:
+            algod.application_box_by_name(proposal_client.app_id, name)
+        except AlgodHTTPError as exc:  # type: ignore[misc]
+            if exc.code == HTTPStatus.NOT_FOUND:  # type: ignore[misc]
+                continue
+            raise
+        existing.add(name)
+    return existing
+
+
+def compose_voters_assignment_group(
+    proposal_client: ProposalClient,
+    group: Sequence[Sequence[tuple[str, int]]],
+    *,
+    registry_app_id: int,
+    sender: str,
+    signer: TransactionSigner,
+) -> ProposalComposer:
+    """Composes an atomic group of `assign_voters` calls of an assignment plan"""
+    composer = proposal_client.new_group()
+    for i, voters in enumerate(group):
+        composer.assign_voters(
+            args=AssignVotersArgs(voters=list(voters)),
+            params=CommonAppCallParams(
+                sender=sender,
+                signer=signer,
+                app_references=[registry_app_id] if i == 0 else None,
+                box_references=[
+                    BoxReference(app_id=0, name=get_voter_box_name(address))
+                    for address, _ in voters
+                ],
+            ),
+        )
+    return composer
+
+
+def assign_committee(
+    proposal_client: ProposalClient,
+    committee: Iterable[tuple[str, int]],
+    *,
+    sender: str,
+    signer: TransactionSigner,
+    max_committee_size: int | None = None,
+    max_groups_in_flight: int = DEFAULT_MAX_GROUPS_IN_FLIGHT,
+) -> VotersAssignmentPlan:
+    """
+    Assigns a committee to a Submitted Proposal as the xGov Daemon.
+
+    Voters already assigned (e.g. by an interrupted run) are skipped. The groups are
+    independent, so up to `max_groups_in_flight` groups are submitted before waiting
+    for the oldest confirmation.
+
+    Args:
+        proposal_client: Client of the Proposal app
+        committee: `(address, votes)` of the committee members
+        sender: xGov Daemon address
+        signer: xGov Daemon signer
+        max_committee_size: xGov Registry `max_committee_size`, if known
+        max_groups_in_flight: Max groups submitted and not yet confirmed
+
+    Returns:
+        The executed assignment plan
+    """
+    committee = list(committee)
+    global_state = _get_assignable_state(
+        proposal_client, committee, max_groups_in_flight
+    )
+    if global_state["voter_buckets"]:
+        raise ValueError("proposal voters are assigned to buckets")
+
+    if global_state["assigned_members"]:
+        assigned = get_existing_boxes(
+            proposal_client, (get_voter_box_name(address) for address, _ in committee)
+        )
+        committee = [
+            member
+            for member in committee
+            if get_voter_box_name(member[0]) not in assigned
+        ]
+
+    plan = plan_voters_assignment(committee, max_committee_size=max_committee_size)
+    logger.info(
+        f"assigning {plan.voters_count} voter(s) to proposal {proposal_client.app_id} "
+        f"in {len(plan.groups)} group(s)"
+    )
+
+    algod = proposal_client.algorand.client.algod
+    in_flight: deque[str] = deque()
+    for group in plan.groups:
+        composer = compose_voters_assignment_group(
+            proposal_client,
+            group,
+            registry_app_id=global_state["registry_app_id"],
+            sender=sender,
+            signer=signer,
+        )
+        _send_group(algod, composer.composer(), in_flight, max_groups_in_flight)
+
+    while in_flight:
+        wait_for_confirmation(algod, in_flight.popleft())
+    return plan
+
+
+def assign_committee_to_buckets(
+    proposal_client: ProposalClient,
+    committee: Iterable[tuple[str, int]],
+    *,
+    sender: str,
+    signer: TransactionSigner,
+    max_groups_in_flight: int = DEFAULT_MAX_GROUPS_IN_FLIGHT,
+) -> VotersAssignmentPlan:
+    """
+    Assigns a committee to a Submitted Proposal as the xGov Daemon, packing the
+    voters in bucket boxes (see `Proposal.assign_voters_to_buckets`).
+
+    Buckets already assigned (e.g. by an interrupted run) are skipped: a bucket is
+    assigned by a single atomic group, so it is either complete or missing.
+
+    Args:
+        proposal_client: Client of the Proposal app
+        committee: `(address, votes)` of the committee members
+        sender: xGov Daemon address
+        signer: xGov Daemon signer
+        max_groups_in_flight: Max groups submitted and not yet confirmed
+
+    Returns:
+        The executed assignment plan
+    """
+    committee = list(committee)
+    global_state = _get_assignable_state(
+        proposal_client, committee, max_groups_in_flight
+    )
+    buckets = voter_buckets_count(len(committee))
+    if global_state["assigned_members"]:
+        if not global_state["voter_buckets"]:
+            raise ValueError("proposal voters are assigned to voter boxes")
+        assigned = get_existing_boxes(
+            proposal_client,
+            (get_voter_bucket_box_name(bucket) for bucket in range(buckets)),
+        )
+        committee = [
+            member
+            for member in committee
+            if get_voter_bucket_box_name(get_voter_bucket(member[0], buckets))
+            not in assigned
+        ]
+
+    plan = plan_bucketed_voters_assignment(committee, buckets=buckets)
+    logger.info(
+        f"assigning {plan.voters_count} voter(s) to proposal {proposal_client.app_id} "
+        f"buckets in {len(plan.groups)} group(s)"
+    )
+
+    algod = proposal_client.algorand.client.algod
+    in_flight: deque[str] = deque()
+    for group in plan.groups:
+        composer = proposal_client.new_group()
+        for i, voters in enumerate(group):
+            references = [
+                get_voter_bucket_box_name(bucket)
+                for bucket in _txn_buckets(voters, buckets)
+            ]
+            # Empty references raise the group box I/O budget
+            references += [b""] * (
+                MAX_APP_TXN_REFERENCES
+                - (_REGISTRY_APP_REFERENCES if i == 0 else 0)
+                - len(references)
+            )
+            composer.assign_voters_to_buckets(
+                args=AssignVotersToBucketsArgs(voters=list(voters)),
+                params=CommonAppCallParams(
+                    sender=sender,
+                    signer=signer,
+                    app_references=(
+                        [global_state["registry_app_id"]] if i == 0 else None
+                    ),
+                    box_references=[
+                        BoxReference(app_id=0, name=name) for name in references
+                    ],
+                ),
+            )
+        _send_group(algod, composer.composer(), in_flight, max_groups_in_flight)
+
+    while in_flight:
+        wait_for_confirmation(algod, in_flight.popleft())
+    return plan
+
+
+def _get_assignable_state(
+    proposal_client: ProposalClient,
+    committee: Sequence[tuple[str, int]],
+    max_groups_in_flight: int,
+) -> GlobalStateValue:
+    if max_groups_in_flight <= 0:
+        raise ValueError("max_groups_in_flight must be positive")
+
+    global_state = proposal_client.state.global_state.get_all()
+    if global_state["status"] != STATUS_SUBMITTED:
+        raise ValueError("proposal must be submitted to assign voters")
+    if len(committee) != global_state["committee_members"]:
+        raise ValueError(
+            f"committee has {len(committee)} members, proposal expects "
+            f"{global_state['committee_members']}"
+        )
+    if sum(votes for _, votes in committee) != global_state["committee_votes"]:
+        raise ValueError("committee votes do not match the proposal committee votes")
+    return global_state
+
+
+def _send_group(
+    algod: AlgodClient,
+    composer: TransactionComposer,
+    in_flight: deque[str],
+    max_groups_in_flight: int,
+) -> None:
+    signed = composer.build().atc.gather_signatures()
+    algod.send_transactions(signed)
+    txid: str = signed[0].get_txid()  # type: ignore[no-untyped-call]
+    in_flight.append(txid)
+    if len(in_flight) >= max_groups_in_flight:
+        wait_for_confirmation(algod, in_flight.popleft())
@@ -0,0 +1,230 @@
+import base64
+import hashlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import cast
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.proposal.constants import (
+    COMMITTEE_LEAF_PREFIX,
+    COMMITTEE_NODE_PREFIX,
+    VOTED_BITMAP_PAGE_MEMBERS,
+)
+from smart_contracts.xgov_registry.box_names import get_voted_bitmap_box_name
+
+# Sibling of the last node of a level with an odd number of nodes
+EMPTY_NODE = bytes(32)
+
+
+def _public_key(address: str) -> bytes:
+    return cast(bytes, encoding.decode_address(address))  # type: ignore[no-untyped-call]
+
+
+def _member_public_key(member: tuple[str, int]) -> bytes:
+    return _public_key(member[0])
+
+
+def committee_leaf(address: str, votes: int) -> bytes:
+    """
+    Hashes a committee member as a Merkle tree leaf:
+    `sha256(0x00 || address || uint64(votes))`.
+    """
+    return hashlib.sha256(
+        COMMITTEE_LEAF_PREFIX + _public_key(address) + votes.to_bytes(8, "big")
+    ).digest()
+
+
+def committee_node(left: bytes, right: bytes) -> bytes:
+    """Hashes two Merkle tree nodes: `sha256(0x01 || left || right)`."""
+    return hashlib.sha256(COMMITTEE_NODE_PREFIX + left + right).digest()
+
+
+@dataclass(frozen=True)
+class CommitteeMembershipProof:
+    """
+    Arguments of `vote_proposal_with_proof` and
+    `unassign_absentee_from_proposal_with_proof` proving an xGov Committee
+    membership.
+
+    Attributes:
+        address: xGov address
+        votes: xGov votes in the Committee
+        ordinal: Position of the xGov leaf, also its bit in the Proposal voted bitmap
+        proof: Sibling nodes from the xGov leaf to the root
+    """
+
+    address: str
+    votes: int
+    ordinal: int
+    proof: tuple[bytes, ...]
+
+    @property
+    def voted_bitmap_page(self) -> int:
+        """Index of the Proposal voted bitmap page box recording the xGov vote"""
+        return self.ordinal // VOTED_BITMAP_PAGE_MEMBERS
+
+
+def verify_membership_proof(root: bytes, membership: CommitteeMembershipProof) -> bool:
+    """
+    Verifies a membership proof as `Proposal.vote_with_proof` does, except for the
+    ordinal bound by the Committee size.
+    """
+    node = committee_leaf(membership.address, membership.votes)
+    index = membership.ordinal
+    for sibling in membership.proof:
+        node = (
+            committee_node(sibling, node)
+            if index % 2
+            else committee_node(node, sibling)
+        )
+        index //= 2
+    return index == 0 and node == root
+
+
+class CommitteeMerkleTree:
+    """
+    Merkle tree of the `(address, votes)` members of an ARC-86 xGov Committee.
+
+    Members are sorted by their address public key, so that anyone holding the
+    Committee can rebuild the root declared in the xGov Registry.
+
+    Args:
+        committee: `(address, votes)` of the committee members
+    """
+
+    def __init__(self, committee: Iterable[tuple[str, int]]) -> None:
+        members = sorted(committee, key=_member_public_key)
+        if not members:
+            raise ValueError("committee must not be empty")
+
+        self._ordinals: dict[str, int] = {}
+        for ordinal, (address, votes) in enumerate(members):
+            if address in self._ordinals:
+                raise ValueError(f"duplicate committee member: {address}")
+            if votes <= 0:
+                raise ValueError(f"invalid voting power for {address}: {votes}")
+            self._ordinals[address] = ordinal
+        self.members: tuple[tuple[str, int], ...] = tuple(members)
+
+        levels = [[committee_leaf(address, votes) for address, votes in members]]
+        while len(levels[-1]) > 1:
+            level = levels[-1]
+            if len(level) % 2:
+                level = [*level, EMPTY_NODE]
+            levels.append(
+                [
+                    committee_node(level[i], level[i + 1])
+                    for i in range(0, len(level), 2)
+                ]
+            )
+        self._levels = levels
+
+    @property
+    def root(self) -> bytes:
+        return self._levels[-1][0]
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+    @property
+    def votes(self) -> int:
+        return sum(votes for _, votes in self.members)
+
+    def ordinal(self, address: str) -> int:
+        try:
+            return self._ordinals[address]
+        except KeyError:
+            raise LookupError(f"not a committee member: {address}") from None
+
+    def absentees(self, bitmap_pages: Sequence[bytes | None]) -> list[str]:
+        """
+        Lists the members who have not voted a Proposal.
+
+        Args:
+            bitmap_pages: Content of the Proposal voted bitmap pages, as returned
+                by `get_voted_bitmap_pages`
+        """
+        return [
+            self.members[ordinal][0]
+            for ordinal in absentee_ordinals(bitmap_pages, self.size)
+        ]
+
+    def proof(self, address: str) -> CommitteeMembershipProof:
+        ordinal = self.ordinal(address)
+        siblings: list[bytes] = []
+        index = ordinal
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            siblings.append(level[sibling] if sibling < len(level) else EMPTY_NODE)
+            index //= 2
+        return CommitteeMembershipProof(
+            address=address,
+            votes=self.members[ordinal][1],
+            ordinal=ordinal,
+            proof=tuple(siblings),
+        )
+
+
+def voted_ordinals(bitmap_pages: Sequence[bytes | None]) -> list[int]:
+    """
+    Decodes the ordinals set in the Proposal voted bitmap pages, where bit 0 is
+    the most significant bit of the first byte.
+
+    Args:
+        bitmap_pages: Content of the voted bitmap page boxes by page index, None
+            for the pages not created yet (no vote in the page)
+    """
+    return [
+        page * VOTED_BITMAP_PAGE_MEMBERS + bit
+        for page, content in enumerate(bitmap_pages)
+        if content is not None
+        for bit in range(8 * len(content))
+        if content[bit // 8] & (0x80 >> (bit % 8))
+    ]
+
+
+def voted_bitmap_page_count(committee_size: int) -> int:
+    return (committee_size + VOTED_BITMAP_PAGE_MEMBERS - 1) // VOTED_BITMAP_PAGE_MEMBERS
+
+
+def absentee_ordinals(
+    bitmap_pages: Sequence[bytes | None], committee_size: int
+) -> list[int]:
+    """
+    Decodes the ordinals not set in the Proposal voted bitmap pages.
+
+    Args:
+        bitmap_pages: Content of the voted bitmap page boxes by page index, None
+            (or missing trailing pages) for the pages not created yet
+        committee_size: Size of the Committee voting the Proposal
+    """
+    voted = set(voted_ordinals(bitmap_pages))
+    return [ordinal for ordinal in range(committee_size) if ordinal not in voted]
+
+
+def get_voted_bitmap_pages(proposal_client: ProposalClient) -> list[bytes | None]:
+    """
+    Reads the voted bitmap of a Proposal, one box per page, with None for the
+    pages without votes. The page boxes are read by name, since their count
+    follows from the Committee size (no listing of the app boxes).
+    """
+    committee_size = proposal_client.state.global_state.committee_members
+    algod = proposal_client.algorand.client.algod
+    pages: list[bytes | None] = []
+    for page in range(voted_bitmap_page_count(committee_size)):
+        try:
+            box = algod.application_box_by_name(
+                proposal_client.app_id, get_voted_bitmap_box_name(page)
+            )
+        except AlgodHTTPError as exc:  # type: ignore[misc]
+            if exc.code == HTTPStatus.NOT_FOUND:  # type: ignore[misc]
+                pages.append(None)
+                continue
+            raise
+        pages.append(base64.b64decode(cast(dict[str, str], box)["value"]))
+    return pages
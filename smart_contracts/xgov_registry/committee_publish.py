@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import base64
 import binascii
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
 from collections.abc import Mapping
 from dataclasses import dataclass
+from pathlib import Path
+from typing import TypedDict, cast
 
 DEFAULT_TESTNET_COMMITTEE_MEMBERS = 30
 DEFAULT_TESTNET_COMMITTEE_VOTES = 9_000_000
@@ -101,7 +109,10 @@ def get_committee_entry(
     if not isinstance(committees, Mapping):
         raise ValueError("committee index must contain a committees mapping")
 
-    entry = committees.get(str(target_anchor))
+    return _parse_committee_entry(committees.get(str(target_anchor)), target_anchor)
+
+
+def _parse_committee_entry(entry: object, target_anchor: int) -> CommitteeIndexEntry:
     if not isinstance(entry, Mapping):
         raise LookupError(
             f"committee entry not found for target anchor {target_anchor}"
@@ -119,3 +130,371 @@ def get_committee_entry(
         total_members=total_members,
         total_votes=total_votes,
     )
+
+
+# ----------------------- Indexed Committee Index ----------------------- #
+
+# Sidecar layout: header, then an open addressing hash table of fixed-size slots
+# (anchor + 1, value start offset, value end offset), 0 marking an empty slot.
+_SIDECAR_MAGIC = b"XGCI"
+_SIDECAR_VERSION = 1
+# magic, version, capacity, count, indexed size, indexed mtime, resume offset,
+# sha256 of the indexed document prefix [0, resume offset)
+_SIDECAR_HEADER = struct.Struct("<4sIQQQQQ32s")
+_SIDECAR_SLOT = struct.Struct("<QQQ")
+
+
+class _SidecarHeader(TypedDict):
+    magic: bytes
+    version: int
+    capacity: int
+    count: int
+    indexed_size: int
+    indexed_mtime: int
+    resume_offset: int
+    prefix_hash: bytes
+
+
+def _unpack_sidecar_header(buffer: bytes | mmap.mmap) -> _SidecarHeader:
+    (
+        magic,
+        version,
+        capacity,
+        count,
+        indexed_size,
+        indexed_mtime,
+        resume_offset,
+        prefix_hash,
+    ) = cast(
+        tuple[bytes, int, int, int, int, int, int, bytes],
+        _SIDECAR_HEADER.unpack_from(buffer),
+    )
+    return _SidecarHeader(
+        magic=magic,
+        version=version,
+        capacity=capacity,
+        count=count,
+        indexed_size=indexed_size,
+        indexed_mtime=indexed_mtime,
+        resume_offset=resume_offset,
+        prefix_hash=prefix_hash,
+    )
+
+
+def _unpack_sidecar_slot(
+    buffer: bytes | bytearray | mmap.mmap, offset: int
+) -> tuple[int, int, int]:
+    """Returns the `(anchor + 1, start, end)` of the slot at offset"""
+    return cast(tuple[int, int, int], _SIDECAR_SLOT.unpack_from(buffer, offset))
+
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_PRIMITIVE = re.compile(rb"[^,}\]\s]+")
+_CONTAINER_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+
+
+def _skip_whitespace(buffer: bytes | mmap.mmap, pos: int) -> int:
+    match = _WHITESPACE.match(buffer, pos)
+    return match.end() if match else pos
+
+
+def _expect(buffer: bytes | mmap.mmap, pos: int, token: bytes) -> int:
+    pos = _skip_whitespace(buffer, pos)
+    if buffer[pos : pos + 1] != token:
+        raise ValueError(f"invalid committee index: expected {token!r} at {pos}")
+    return pos + 1
+
+
+def _read_string(buffer: bytes | mmap.mmap, pos: int) -> tuple[str, int]:
+    pos = _skip_whitespace(buffer, pos)
+    match = _STRING.match(buffer, pos)
+    if match is None:
+        raise ValueError(f"invalid committee index: expected a string at {pos}")
+    return cast(str, json.loads(match.group())), match.end()
+
+
+def _skip_value(buffer: bytes | mmap.mmap, pos: int) -> tuple[int, int]:
+    """Returns the start and end offsets of the JSON value at pos"""
+    start = _skip_whitespace(buffer, pos)
+    first = buffer[start : start + 1]
+    if first == b'"':
+        match = _STRING.match(buffer, start)
+        if match is None:
+            raise ValueError(f"invalid committee index: bad string at {start}")
+        return start, match.end()
+    if first in (b"{", b"["):
+        depth = 0
+        for match in _CONTAINER_TOKEN.finditer(buffer, start):
+            token = match.group()
+            if token in (b"{", b"["):
+                depth += 1
+            elif token in (b"}", b"]"):
+                depth -= 1
+                if not depth:
+                    return start, match.end()
+        raise ValueError(f"invalid committee index: unterminated value at {start}")
+    match = _PRIMITIVE.match(buffer, start)
+    if match is None:
+        raise ValueError(f"invalid committee index: expected a value at {start}")
+    return start, match.end()
+
+
+def _scan_committees(
+    buffer: bytes | mmap.mmap, pos: int
+) -> tuple[list[tuple[int, int, int]], int]:
+    """
+    Scans the members of the committees object from pos, just after its opening
+    brace or after an already scanned member.
+
+    Returns:
+        The `(anchor, start, end)` offsets of the member values and the offset
+        right after the last scanned member
+    """
+    entries: list[tuple[int, int, int]] = []
+    resume_offset = pos
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        token = buffer[pos : pos + 1]
+        if token == b"}":
+            return entries, resume_offset
+        if token == b",":
+            pos += 1
+        key, pos = _read_string(buffer, pos)
+        pos = _expect(buffer, pos, b":")
+        start, pos = _skip_value(buffer, pos)
+        try:
+            anchor = int(key)
+        except ValueError:
+            # Not an anchor, cannot be looked up
+            anchor = -1
+        if anchor >= 0:
+            entries.append((anchor, start, pos))
+        resume_offset = pos
+
+
+def _find_committees(buffer: bytes | mmap.mmap) -> int:
+    """Returns the offset right after the opening brace of the committees object"""
+    pos = _expect(buffer, 0, b"{")
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if buffer[pos : pos + 1] == b"}":
+            raise ValueError("committee index must contain a committees mapping")
+        if buffer[pos : pos + 1] == b",":
+            pos += 1
+        key, pos = _read_string(buffer, pos)
+        pos = _expect(buffer, pos, b":")
+        if key == "committees":
+            pos = _skip_whitespace(buffer, pos)
+            if buffer[pos : pos + 1] != b"{":
+                raise ValueError("committee index must contain a committees mapping")
+            return pos + 1
+        _, pos = _skip_value(buffer, pos)
+
+
+def _slot_index(anchor: int, capacity: int) -> int:
+    # Fibonacci hashing, anchors are usually multiples of the governance period
+    return ((anchor * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) % capacity
+
+
+class CommitteeIndex:
+    """
+    Committee index document (ARC-86) with O(1) lookups by target anchor.
+
+    The document is scanned once, without being loaded in memory, to build a
+    memory-mapped sidecar hash table of the anchor to entry offsets. When the
+    document grows by appending committees, only the new tail is scanned. Entries
+    are decoded lazily on lookup.
+
+    Args:
+        index_path: Path of the committee index JSON document
+        sidecar_path: Path of the offsets sidecar (defaults to `<index_path>.idx`)
+    """
+
+    def __init__(
+        self, index_path: str | Path, sidecar_path: str | Path | None = None
+    ) -> None:
+        self.index_path = Path(index_path)
+        self.sidecar_path = (
+            Path(sidecar_path)
+            if sidecar_path is not None
+            else self.index_path.with_name(self.index_path.name + ".idx")
+        )
+        # Empty files cannot be memory-mapped
+        if self.index_path.stat().st_size == 0:
+            raise ValueError("committee index must contain a committees mapping")
+        self._document_file = self.index_path.open("rb")
+        self._document = mmap.mmap(
+            self._document_file.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        try:
+            self._update_sidecar()
+            self._sidecar_file = self.sidecar_path.open("rb")
+        except BaseException:
+            self._close_document()
+            raise
+        if os.fstat(self._sidecar_file.fileno()).st_size < _SIDECAR_HEADER.size:
+            # Truncated by another writer since it was (re)built
+            self._sidecar_file.close()
+            self._close_document()
+            raise ValueError(f"invalid committee index sidecar {self.sidecar_path}")
+        self._sidecar = mmap.mmap(
+            self._sidecar_file.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        header = _unpack_sidecar_header(self._sidecar)
+        self._capacity = header["capacity"]
+        self._count = header["count"]
+
+    def __enter__(self) -> CommitteeIndex:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._sidecar.close()
+        self._sidecar_file.close()
+        self._close_document()
+
+    def _close_document(self) -> None:
+        self._document.close()
+        self._document_file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, target_anchor: object) -> bool:
+        return (
+            isinstance(target_anchor, int) and self._offsets(target_anchor) is not None
+        )
+
+    def _offsets(self, target_anchor: int) -> tuple[int, int] | None:
+        slot = _slot_index(target_anchor, self._capacity)
+        for _ in range(self._capacity):
+            key, start, end = _unpack_sidecar_slot(
+                self._sidecar, _SIDECAR_HEADER.size + slot * _SIDECAR_SLOT.size
+            )
+            if not key:
+                return None
+            if key == target_anchor + 1:
+                return start, end
+            slot = (slot + 1) % self._capacity
+        return None
+
+    def get(self, target_anchor: int) -> CommitteeIndexEntry:
+        offsets = self._offsets(target_anchor)
+        if offsets is None:
+            raise LookupError(
+                f"committee entry not found for target anchor {target_anchor}"
+            )
+        start, end = offsets
+        entry: object = json.loads(self._document[start:end])
+        return _parse_committee_entry(entry, target_anchor)
+
+    def _update_sidecar(self) -> None:
+        stat = self.index_path.stat()
+        header, entries = self._read_sidecar()
+        if header is not None:
+            indexed_size = header["indexed_size"]
+            resume_offset = header["resume_offset"]
+            if (
+                indexed_size == stat.st_size
+                and header["indexed_mtime"] == stat.st_mtime_ns
+            ):
+                return
+            prefix_hash = header["prefix_hash"]
+            if indexed_size <= stat.st_size and prefix_hash == self._prefix_hash(
+                resume_offset
+            ):
+                new_entries, resume_offset = _scan_committees(
+                    self._document, resume_offset
+                )
+                self._write_sidecar(
+                    entries + new_entries, stat.st_size, stat.st_mtime_ns, resume_offset
+                )
+                return
+
+        new_entries, resume_offset = _scan_committees(
+            self._document, _find_committees(self._document)
+        )
+        self._write_sidecar(new_entries, stat.st_size, stat.st_mtime_ns, resume_offset)
+
+    def _prefix_hash(self, end: int) -> bytes:
+        digest = hashlib.sha256()
+        for pos in range(0, end, 1 << 20):
+            digest.update(self._document[pos : min(pos + (1 << 20), end)])
+        return digest.digest()
+
+    def _read_sidecar(
+        self,
+    ) -> tuple[_SidecarHeader | None, list[tuple[int, int, int]]]:
+        try:
+            content = self.sidecar_path.read_bytes()
+            header = _unpack_sidecar_header(content)
+        except (OSError, struct.error):
+            return None, []
+        expected_size = _SIDECAR_HEADER.size + header["capacity"] * _SIDECAR_SLOT.size
+        if (
+            header["magic"] != _SIDECAR_MAGIC
+            or header["version"] != _SIDECAR_VERSION
+            or len(content) != expected_size
+        ):
+            return None, []
+        slots = (
+            _unpack_sidecar_slot(content, offset)
+            for offset in range(_SIDECAR_HEADER.size, expected_size, _SIDECAR_SLOT.size)
+        )
+        entries = [(key - 1, start, end) for key, start, end in slots if key]
+        return header, entries
+
+    def _write_sidecar(
+        self,
+        entries: list[tuple[int, int, int]],
+        indexed_size: int,
+        indexed_mtime: int,
+        resume_offset: int,
+    ) -> None:
+        # Keep the load factor at most 1/2 for short probe sequences
+        capacity = 1
+        while capacity < 2 * len(entries) + 1:
+            capacity *= 2
+
+        table = bytearray(capacity * _SIDECAR_SLOT.size)
+        count = 0
+        for anchor, start, end in entries:
+            slot = _slot_index(anchor, capacity)
+            while True:
+                key = _unpack_sidecar_slot(table, slot * _SIDECAR_SLOT.size)[0]
+                if not key or key == anchor + 1:
+                    # Later duplicates win, as with json.loads
+                    count += not key
+                    _SIDECAR_SLOT.pack_into(
+                        table, slot * _SIDECAR_SLOT.size, anchor + 1, start, end
+                    )
+                    break
+                slot = (slot + 1) % capacity
+
+        header = _SIDECAR_HEADER.pack(
+            _SIDECAR_MAGIC,
+            _SIDECAR_VERSION,
+            capacity,
+            count,
+            indexed_size,
+            indexed_mtime,
+            resume_offset,
+            self._prefix_hash(resume_offset),
+        )
+        # Write aside and rename, so readers never see a partial sidecar
+        tmp_path = self.sidecar_path.with_name(self.sidecar_path.name + ".tmp")
+        tmp_path.write_bytes(header + table)
+        os.replace(tmp_path, self.sidecar_path)
+
+
+def load_committee_entry(
+    index_path: str | Path,
+    target_anchor: int,
+    sidecar_path: str | Path | None = None,
+) -> CommitteeIndexEntry:
+    """Looks up a committee entry in an index document file, see CommitteeIndex"""
+    with CommitteeIndex(index_path, sidecar_path) as index:
+        return index.get(target_anchor)
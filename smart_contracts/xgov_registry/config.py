@@ -56,6 +56,8 @@ GS_KEY_ABSENCE_TOLERANCE: Final[bytes] = b"absence_tolerance"
 GS_KEY_GOVERNANCE_PERIOD: Final[bytes] = b"governance_period"
 GS_KEY_COMMITTEE_GRACE_PERIOD: Final[bytes] = b"committee_grace_period"
 GS_KEY_COMMITTEE_LAST_ANCHOR: Final[bytes] = b"committee_last_anchor"
+GS_KEY_COMMITTEE_ROOT: Final[bytes] = b"committee_root"
+GS_KEY_STATE_VERSION: Final[bytes] = b"state_version"
 
 # Box key prefixes
 PROPOSAL_APPROVAL_PROGRAM_BOX: Final[bytes] = b"pa"
@@ -34,3 +34,15 @@ MAX_APP_TOTAL_ARG_LEN: Final[int] = 2048
 METHOD_SELECTOR_LENGTH: Final[int] = 4
 UINT64_LENGTH: Final[int] = 8
 DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD: Final[int] = 2
+MAX_GROUP_SIZE: Final[int] = 16
+MAX_APP_TXN_REFERENCES: Final[int] = 8
+ADDRESS_LENGTH: Final[int] = 32
+MAX_LOG_SIZE: Final[int] = 1_024
+ARC4_RETURN_PREFIX_LENGTH: Final[int] = 4
+
+# ARC-4 encoding of `ProposalSummary`: 2 bools, an address and 15 uint64
+PROPOSAL_SUMMARY_SIZE: Final[int] = 2 + ADDRESS_LENGTH + 15 * UINT64_LENGTH
+# Proposals whose summaries fit in the `get_proposals_summary` return log
+MAX_PROPOSALS_SUMMARY: Final[int] = (
+    MAX_LOG_SIZE - ARC4_RETURN_PREFIX_LENGTH - DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD
+) // PROPOSAL_SUMMARY_SIZE
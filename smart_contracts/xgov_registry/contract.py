@@ -19,6 +19,7 @@ from algopy import (
     itxn,
     op,
     size_of,
+    urange,
 )
 
 import smart_contracts.common.abi_types as typ
@@ -36,6 +37,7 @@ from .constants import (
     BYTES_PER_APP_PAGE,
     MAX_MBR_PER_APP,
     MAX_MBR_PER_BOX,
+    MAX_PROPOSALS_SUMMARY,
     PER_BOX_MBR,
     PER_BYTE_IN_BOX_MBR,
     PROPOSAL_APPROVAL_PAGES,
@@ -195,6 +197,11 @@ class XGovRegistry(
             UInt64,
             key_prefix=pcfg.VOTER_BOX_KEY_PREFIX,
         )
+        self.voted_bitmap = BoxMap(
+            UInt64,
+            Bytes,
+            key_prefix=pcfg.VOTED_BITMAP_BOX_KEY_PREFIX,
+        )
 
         # New Variables (introduced after MainNet deployment)
         self.absence_tolerance = GlobalState(UInt64, key=cfg.GS_KEY_ABSENCE_TOLERANCE)
@@ -205,6 +212,8 @@ class XGovRegistry(
         self.committee_last_anchor = GlobalState(
             UInt64, key=cfg.GS_KEY_COMMITTEE_LAST_ANCHOR
         )
+        self.committee_root = GlobalState(Bytes, key=cfg.GS_KEY_COMMITTEE_ROOT)
+        self.state_version = GlobalState(arc4.UInt64, key=cfg.GS_KEY_STATE_VERSION)
         # ⚠️ No more Global UInt64 available in the State Schema, further additional
         # integers must be encoded as Global Bytes.
 
@@ -254,6 +263,64 @@ class XGovRegistry(
         assert requested_amount_exists, err.MISSING_KEY
         return requested_amount
 
+    def get_proposal_uint64(self, proposal: Application, key: Bytes) -> UInt64:
+        # Missing keys are read as zero
+        value, _exists = op.AppGlobal.get_ex_uint64(proposal, key)
+        return value
+
+    def read_proposal_summary(self, proposal: Application) -> typ.ProposalSummary:
+        creator, app_exists = op.AppParamsGet.app_creator(proposal)
+        if not app_exists or creator != Global.current_application_address:
+            # All zero values, with `exists` False
+            return arc4.decode(
+                typ.ProposalSummary, op.bzero(size_of(typ.ProposalSummary))
+            )
+
+        return typ.ProposalSummary(
+            exists=True,
+            proposer=self.get_proposal_proposer(proposal),
+            status=self.get_proposal_uint64(proposal, Bytes(pcfg.GS_KEY_STATUS)),
+            finalized=bool(
+                self.get_proposal_uint64(proposal, Bytes(pcfg.GS_KEY_FINALIZED))
+            ),
+            funding_category=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_FUNDING_CATEGORY)
+            ),
+            requested_amount=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_REQUESTED_AMOUNT)
+            ),
+            locked_amount=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_LOCKED_AMOUNT)
+            ),
+            open_ts=self.get_proposal_uint64(proposal, Bytes(pcfg.GS_KEY_OPEN_TS)),
+            submission_ts=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_SUBMISSION_TS)
+            ),
+            vote_open_ts=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_VOTE_OPEN_TS)
+            ),
+            committee_votes=self.get_proposal_uint64(
+                proposal, Bytes(cfg.GS_KEY_COMMITTEE_VOTES)
+            ),
+            quorum_threshold=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_QUORUM_THRESHOLD)
+            ),
+            weighted_quorum_threshold=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_WEIGHTED_QUORUM_THRESHOLD)
+            ),
+            voted_members=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_VOTED_MEMBERS)
+            ),
+            boycotted_members=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_BOYCOTTED_MEMBERS)
+            ),
+            approvals=self.get_proposal_uint64(proposal, Bytes(pcfg.GS_KEY_APPROVALS)),
+            rejections=self.get_proposal_uint64(
+                proposal, Bytes(pcfg.GS_KEY_REJECTIONS)
+            ),
+            nulls=self.get_proposal_uint64(proposal, Bytes(pcfg.GS_KEY_NULLS)),
+        )
+
     def compute_available_funds(self) -> UInt64:
         spendable_funds = (
             Global.current_application_address.balance
@@ -347,6 +414,15 @@ class XGovRegistry(
         proposer = self.get_proposal_proposer(proposal)
         self.proposer_box[proposer].active_proposal = False
 
+    def get_current_state_version(self) -> UInt64:
+        return self.state_version.get(default=arc4.UInt64(0)).as_uint64()
+
+    def bump_state_version(self) -> None:
+        # Called by every mutating method, lets clients detect state changes
+        version = self.get_current_state_version() + 1
+        self.state_version.value = arc4.UInt64(version)
+        arc4.emit(typ.StateVersion(version=version))
+
     def make_xgov_box(self, voting_address: Account) -> typ.XGovBoxValue:
         """
         Creates a new xGov box with the given voting address.
@@ -431,6 +507,8 @@ class XGovRegistry(
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         if self.proposal_approval_program:
             self.proposal_approval_program.resize(size)
         else:
@@ -452,6 +530,8 @@ class XGovRegistry(
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         # Load the Proposal Approval Program contract
         self.proposal_approval_program.replace(start_index=offset, value=data)
 
@@ -466,6 +546,8 @@ class XGovRegistry(
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         # Delete the Proposal Approval Program contract box
         del self.proposal_approval_program.value
 
@@ -476,6 +558,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.paused_registry.value = True
 
     @arc4.abimethod()
@@ -485,6 +569,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.paused_proposals.value = True
 
     @arc4.abimethod()
@@ -494,6 +580,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.paused_registry.value = False
 
     @arc4.abimethod()
@@ -503,6 +591,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.paused_proposals.value = False
 
     @arc4.abimethod()
@@ -518,6 +608,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.xgov_manager.value = manager
 
     @arc4.abimethod()
@@ -533,6 +625,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.xgov_payor.value = payor
 
     @arc4.abimethod()
@@ -548,6 +642,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.xgov_council.value = council
 
     @arc4.abimethod()
@@ -563,6 +659,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.xgov_subscriber.value = subscriber
 
     @arc4.abimethod()
@@ -578,6 +676,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.kyc_provider.value = provider
 
     @arc4.abimethod()
@@ -593,6 +693,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.committee_manager.value = manager
 
     @arc4.abimethod()
@@ -608,6 +710,8 @@ class XGovRegistry(
         """
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
+
+        self.bump_state_version()
         self.xgov_daemon.value = xgov_daemon
 
     @arc4.abimethod()
@@ -624,6 +728,8 @@ class XGovRegistry(
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         # ⚠️ WARNING: Any update that modifies Box MBRs must be followed by a
         # reconfiguration of the Registry to ensure consistency
         xgov_box_mbr = self.calc_box_map_mbr(
@@ -744,6 +850,8 @@ class XGovRegistry(
 
         assert self.is_xgov_manager(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
     @arc4.abimethod()
     def subscribe_xgov(
         self, *, voting_address: Account, payment: gtxn.PaymentTransaction
@@ -765,6 +873,8 @@ class XGovRegistry(
         assert not self.has_xgov_status(Txn.sender), err.ALREADY_XGOV
         assert self.valid_xgov_payment(payment), err.INVALID_PAYMENT
 
+        self.bump_state_version()
+
         self.subscribe_xgov_and_emit(
             xgov_address=Txn.sender, voting_address=voting_address
         )
@@ -782,13 +892,14 @@ class XGovRegistry(
         assert not self.paused_registry.value, err.PAUSED_REGISTRY
         assert self.has_xgov_status(Txn.sender), err.NOT_XGOV
 
+        self.bump_state_version()
+
         self.unsubscribe_xgov_and_emit(Txn.sender)
 
     @arc4.abimethod()
     def unsubscribe_absentee(self, *, xgov_address: Account) -> None:
         """
-        Unsubscribes an absentee xGov. This is a temporary method used only for the
-        first absentees removal at the inception of the absenteeism penalty.
+        Unsubscribes an absentee xGov.
 
         Args:
             xgov_address: (Account): The address of the absentee xGov to unsubscribe
@@ -803,6 +914,8 @@ class XGovRegistry(
         assert self.has_xgov_status(xgov_address), err.NOT_XGOV
         assert self.xgov_box[xgov_address].tolerated_absences == 0, err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         self.unsubscribe_xgov_and_emit(xgov_address)
 
     @arc4.abimethod()
@@ -835,6 +948,8 @@ class XGovRegistry(
         assert not self.has_xgov_status(xgov_address), err.ALREADY_XGOV
         assert self.valid_xgov_payment(payment), err.INVALID_PAYMENT
 
+        self.bump_state_version()
+
         # create request box
         rid = self.request_id.value
         self.request_box[rid] = typ.XGovSubscribeRequestBoxValue(
@@ -861,6 +976,8 @@ class XGovRegistry(
 
         assert self.is_xgov_subscriber(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         xgov_address = self.request_box[request_id].xgov_addr
         voting_address = self.request_box[request_id].owner_addr
         assert not self.has_xgov_status(xgov_address), err.ALREADY_XGOV
@@ -886,6 +1003,8 @@ class XGovRegistry(
 
         assert self.is_xgov_subscriber(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         # delete the request
         del self.request_box[request_id]
 
@@ -919,6 +1038,8 @@ class XGovRegistry(
         assert self.has_xgov_status(xgov_address), err.NOT_XGOV
         assert self.valid_xgov_payment(payment), err.INVALID_PAYMENT
 
+        self.bump_state_version()
+
         # create unsubscribe request box
         ruid = self.request_id.value
         self.request_unsubscribe_box[ruid] = typ.XGovSubscribeRequestBoxValue(
@@ -945,6 +1066,8 @@ class XGovRegistry(
 
         assert self.is_xgov_subscriber(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         xgov_address = self.request_unsubscribe_box[request_id].xgov_addr
         assert self.has_xgov_status(xgov_address), err.NOT_XGOV
 
@@ -967,6 +1090,8 @@ class XGovRegistry(
 
         assert self.is_xgov_subscriber(), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         # delete the request
         del self.request_unsubscribe_box[request_id]
 
@@ -991,6 +1116,8 @@ class XGovRegistry(
         assert self.has_xgov_status(xgov_address), err.NOT_XGOV
         assert self.caller_is_xgov_or_voting_address(xgov_address), err.UNAUTHORIZED
 
+        self.bump_state_version()
+
         # Update the voting account in the xGov box
         self.xgov_box[xgov_address].voting_address = voting_address
 
@@ -1017,6 +1144,8 @@ class XGovRegistry(
         ), err.WRONG_RECEIVER
         assert payment.amount == self.proposer_fee.value, err.WRONG_PAYMENT_AMOUNT
 
+        self.bump_state_version()
+
         self.proposer_box[Txn.sender] = self.make_proposer_box(
             active_proposal=False, kyc_status=False, kyc_expiring=UInt64(0)
         )
@@ -1048,6 +1177,8 @@ class XGovRegistry(
         assert Txn.sender == self.kyc_provider.value, err.UNAUTHORIZED
         assert proposer in self.proposer_box, err.PROPOSER_DOES_NOT_EXIST
 
+        self.bump_state_version()
+
         active_proposal = self.proposer_box[proposer].copy().active_proposal
 
         self.proposer_box[proposer] = self.make_proposer_box(
@@ -1064,12 +1195,53 @@ class XGovRegistry(
             )
         )
 
+    def set_committee(
+        self, committee_id: typ.Bytes32, size: UInt64, votes: UInt64
+    ) -> None:
+        assert self.is_xgov_committee_manager(), err.UNAUTHORIZED
+        assert committee_id.length == pcts.COMMITTEE_ID_LENGTH, err.WRONG_CID_LENGTH
+        assert size > 0, err.WRONG_COMMITTEE_MEMBERS
+        assert votes > 0, err.WRONG_COMMITTEE_VOTES
+
+        self.committee_id.value = committee_id.copy()
+        self.committee_members.value = size
+        self.committee_votes.value = votes
+        self.committee_last_anchor.value = self.get_committee_anchor()
+
+        arc4.emit(
+            typ.NewCommittee(
+                committee_id=committee_id,
+                size=arc4.UInt32(size),
+                votes=arc4.UInt32(votes),
+                round=Global.round,
+            )
+        )
+
+    def calc_voted_bitmap_mbr(self, committee_size: UInt64) -> UInt64:
+        """
+        Calculates the MBR of the Proposal voted bitmap pages for a Committee.
+
+        Args:
+            committee_size (UInt64): The size of the xGov Committee
+
+        Returns:
+            UInt64: The MBR of all the voted bitmap pages
+        """
+        pages = (
+            committee_size + pcts.VOTED_BITMAP_PAGE_MEMBERS - 1
+        ) // pcts.VOTED_BITMAP_PAGE_MEMBERS
+        page_mbr = self.calc_box_map_mbr(
+            self.voted_bitmap.key_prefix.length, size_of(UInt64), UInt64(0)
+        )
+        return pages * page_mbr + (committee_size + 7) // 8 * PER_BYTE_IN_BOX_MBR
+
     @arc4.abimethod()
     def declare_committee(
         self, *, committee_id: typ.Bytes32, size: UInt64, votes: UInt64
     ) -> None:
         """
-        Sets the xGov Committee in charge.
+        Sets the xGov Committee in charge. The xGov Daemon assigns its members to
+        each submitted Proposal.
 
         Args:
             committee_id (typ.Bytes32): The ID of the xGov Committee
@@ -1084,25 +1256,54 @@ class XGovRegistry(
             err.COMMITTEE_SIZE_TOO_LARGE: If the committee size exceeds the maximum allowed size
         """
 
-        assert self.is_xgov_committee_manager(), err.UNAUTHORIZED
-        assert committee_id.length == pcts.COMMITTEE_ID_LENGTH, err.WRONG_CID_LENGTH
-        assert size > 0, err.WRONG_COMMITTEE_MEMBERS
-        assert votes > 0, err.WRONG_COMMITTEE_VOTES
+        self.bump_state_version()
+
+        self.set_committee(committee_id, size, votes)
         assert size <= self.max_committee_size.value, err.COMMITTEE_SIZE_TOO_LARGE
 
-        self.committee_id.value = committee_id.copy()
-        self.committee_members.value = size
-        self.committee_votes.value = votes
-        self.committee_last_anchor.value = self.get_committee_anchor()
+        self.committee_root.value = Bytes()
 
-        arc4.emit(
-            typ.NewCommittee(
-                committee_id=committee_id,
-                size=arc4.UInt32(size),
-                votes=arc4.UInt32(votes),
-                round=Global.round,
-            )
+    @arc4.abimethod()
+    def declare_committee_with_root(
+        self,
+        *,
+        committee_id: typ.Bytes32,
+        size: UInt64,
+        votes: UInt64,
+        committee_root: typ.Bytes32,
+    ) -> None:
+        """
+        Sets the xGov Committee in charge, committed by the Merkle root of its
+        (address, votes) members. Members prove their membership when voting, so
+        submitted Proposals open the voting without voters assignment.
+
+        Args:
+            committee_id (typ.Bytes32): The ID of the xGov Committee
+            size (UInt64): The size of the xGov Committee
+            votes (UInt64): The voting power of the xGov Committee
+            committee_root (typ.Bytes32): The Merkle root of the xGov Committee members
+
+        Raises:
+            err.UNAUTHORIZED: If the sender is not the xGov Manager
+            err.WRONG_CID_LENGTH: If the committee ID is not of the correct length
+            err.WRONG_COMMITTEE_MEMBERS: If the committee is empty
+            err.WRONG_COMMITTEE_VOTES: If the committee voting power is zero
+            err.COMMITTEE_SIZE_TOO_LARGE: If the Proposal voted bitmap MBR exceeds the
+                MBR reserved for the voters by the open proposal fee
+        """
+
+        self.bump_state_version()
+
+        self.set_committee(committee_id, size, votes)
+        voter_mbr = self.calc_box_map_mbr(
+            self.voters.key_prefix.length, size_of(Account), size_of(UInt64)
         )
+        assert (
+            self.calc_voted_bitmap_mbr(size)
+            <= self.max_committee_size.value * voter_mbr
+        ), err.COMMITTEE_SIZE_TOO_LARGE
+
+        self.committee_root.value = committee_root.bytes
 
     @arc4.abimethod
     def open_proposal(self, *, payment: gtxn.PaymentTransaction) -> UInt64:
@@ -1128,6 +1329,8 @@ class XGovRegistry(
         assert not self.paused_registry.value, err.PAUSED_REGISTRY
         assert not self.paused_proposals.value, err.PAUSED_PROPOSALS
 
+        self.bump_state_version()
+
         committee_anchor = self.get_committee_anchor()
         committee_delay = Global.round - committee_anchor
         assert (
@@ -1213,6 +1416,44 @@ class XGovRegistry(
 
         return tx.created_app.id
 
+    def vote_proposal_check_authorization(
+        self, proposal_id: Application, xgov_address: Account
+    ) -> None:
+        assert not self.paused_registry.value, err.PAUSED_REGISTRY
+
+        # verify proposal_id id is genuine proposal
+        assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
+        self.vote_check_xgov(xgov_address)
+
+    def vote_check_xgov(self, xgov_address: Account) -> None:
+        assert self.has_xgov_status(xgov_address), err.NOT_XGOV
+        assert self.caller_is_xgov_or_voting_address(
+            xgov_address
+        ), err.MUST_BE_XGOV_OR_VOTING_ADDRESS
+
+        # Upon vote the absence tolerance is reset
+        self.xgov_box[xgov_address].tolerated_absences = self.absence_tolerance.value
+        self.xgov_box[xgov_address].last_vote_timestamp = Global.latest_timestamp
+
+    def assert_no_vote_error(self, error: typ.Error) -> None:
+        if error.startswith(err.ARC_65_PREFIX):
+            error_without_prefix = String.from_bytes(error.bytes[4:])
+            match error_without_prefix:
+                case err.WRONG_PROPOSAL_STATUS:
+                    op.err(err.WRONG_PROPOSAL_STATUS)
+                case err.VOTER_NOT_FOUND:
+                    op.err(err.VOTER_NOT_FOUND)
+                case err.VOTER_ALREADY_VOTED:
+                    op.err(err.VOTER_ALREADY_VOTED)
+                case err.VOTES_INVALID:
+                    op.err(err.VOTES_INVALID)
+                case err.VOTING_PERIOD_EXPIRED:
+                    op.err(err.VOTING_PERIOD_EXPIRED)
+                case _:
+                    op.err("Unknown error")
+        else:
+            assert error == "", "Unknown error"
+
     @arc4.abimethod()
     def vote_proposal(
         self,
@@ -1243,18 +1484,9 @@ class XGovRegistry(
             err.VOTING_PERIOD_EXPIRED: If the voting period for the Proposal has expired
         """
 
-        assert not self.paused_registry.value, err.PAUSED_REGISTRY
+        self.bump_state_version()
 
-        # verify proposal_id id is genuine proposal
-        assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
-        assert self.has_xgov_status(xgov_address), err.NOT_XGOV
-        assert self.caller_is_xgov_or_voting_address(
-            xgov_address
-        ), err.MUST_BE_XGOV_OR_VOTING_ADDRESS
-
-        # Upon vote the absence tolerance is reset
-        self.xgov_box[xgov_address].tolerated_absences = self.absence_tolerance.value
-        self.xgov_box[xgov_address].last_vote_timestamp = Global.latest_timestamp
+        self.vote_proposal_check_authorization(proposal_id, xgov_address)
 
         # Call the Proposal App to register the vote
         error, _tx = arc4.abi_call(
@@ -1265,21 +1497,160 @@ class XGovRegistry(
             app_id=proposal_id,
         )
 
-        if error.startswith(err.ARC_65_PREFIX):
-            error_without_prefix = String.from_bytes(error.bytes[4:])
-            match error_without_prefix:
-                case err.WRONG_PROPOSAL_STATUS:
-                    op.err(err.WRONG_PROPOSAL_STATUS)
-                case err.VOTER_NOT_FOUND:
-                    op.err(err.VOTER_NOT_FOUND)
-                case err.VOTES_INVALID:
-                    op.err(err.VOTES_INVALID)
-                case err.VOTING_PERIOD_EXPIRED:
-                    op.err(err.VOTING_PERIOD_EXPIRED)
-                case _:
-                    op.err("Unknown error")
-        else:
-            assert error == "", "Unknown error"
+        self.assert_no_vote_error(error)
+
+    @arc4.abimethod()
+    def vote_proposal_with_proof(
+        self,
+        *,
+        proposal_id: Application,
+        xgov_address: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+        approval_votes: UInt64,
+        rejection_votes: UInt64,
+    ) -> None:
+        """
+        Votes on a Proposal whose xGov Committee was declared with a Merkle root.
+
+        Args:
+            proposal_id (Application): The application ID of the Proposal app being voted on
+            xgov_address: (Account): The address of the xGov being voted on behalf of
+            voting_power: (UInt64): The votes of the xGov in the Committee
+            ordinal: (UInt64): The position of the xGov in the Committee Merkle tree
+            proof: (Array[typ.Bytes32]): The Merkle proof of the xGov membership
+            approval_votes: (UInt64): The number of approvals votes allocated
+            rejection_votes: (UInt64): The number of rejections votes allocated
+
+        Raises:
+            err.PAUSED_REGISTRY: If the xGov Registry is paused
+            err.INVALID_PROPOSAL: If the Proposal ID is not a Proposal contract
+            err.NOT_XGOV: If the xGov Address is not an xGov
+            err.MUST_BE_XGOV_OR_VOTING_ADDRESS: If the sender is not the xgov_address or the voting_address
+            err.WRONG_PROPOSAL_STATUS: If the Proposal is not in the voting state
+            err.VOTER_NOT_FOUND: If the membership proof does not match the Committee root
+            err.VOTER_ALREADY_VOTED: If the xGov has already voted on this Proposal
+            err.VOTES_INVALID: If the votes are invalid
+            err.VOTING_PERIOD_EXPIRED: If the voting period for the Proposal has expired
+        """
+
+        self.bump_state_version()
+
+        self.vote_proposal_check_authorization(proposal_id, xgov_address)
+
+        # Call the Proposal App to verify the membership and register the vote
+        error, _tx = arc4.abi_call(
+            proposal_contract.Proposal.vote_with_proof,
+            xgov_address,
+            voting_power,
+            ordinal,
+            proof,
+            approval_votes,
+            rejection_votes,
+            app_id=proposal_id,
+        )
+
+        self.assert_no_vote_error(error)
+
+    @arc4.abimethod()
+    def vote_proposal_batch(
+        self,
+        *,
+        proposal_id: Application,
+        votes: Array[typ.XGovVote],
+    ) -> None:
+        """
+        Votes on a Proposal on behalf of several xGovs in a single app call, as a
+        delegate holding their voting address.
+
+        Args:
+            proposal_id (Application): The application ID of the Proposal app being voted on
+            votes: (Array[typ.XGovVote]): The xGov addresses with the number of approvals
+                and rejections votes allocated by each
+
+        Raises:
+            err.PAUSED_REGISTRY: If the xGov Registry is paused
+            err.INVALID_PROPOSAL: If the Proposal ID is not a Proposal contract
+            err.EMPTY_PAYLOAD: If no xGov votes are provided
+            err.NOT_XGOV: If an xGov Address is not an xGov
+            err.MUST_BE_XGOV_OR_VOTING_ADDRESS: If the sender is not the xgov_address or the voting_address of an xGov
+            err.WRONG_PROPOSAL_STATUS: If the Proposal is not in the voting state
+            err.VOTER_NOT_FOUND: If an xGov is not found in the Proposal's voting registry
+            err.VOTER_ALREADY_VOTED: If an xGov has already voted on this Proposal
+            err.VOTES_INVALID: If the votes are invalid
+            err.VOTING_PERIOD_EXPIRED: If the voting period for the Proposal has expired
+        """
+
+        assert not self.paused_registry.value, err.PAUSED_REGISTRY
+        assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
+        assert votes.length, err.EMPTY_PAYLOAD
+
+        self.bump_state_version()
+
+        for i in urange(votes.length):
+            self.vote_check_xgov(votes[i].xgov_address)
+
+        # A single Proposal App call registers all the votes
+        error, _tx = arc4.abi_call(
+            proposal_contract.Proposal.vote_batch,
+            votes,
+            app_id=proposal_id,
+        )
+
+        self.assert_no_vote_error(error)
+
+    @arc4.abimethod()
+    def vote_proposals(
+        self,
+        *,
+        xgov_address: Account,
+        votes: Array[typ.ProposalVote],
+    ) -> None:
+        """
+        Votes on several Proposals on behalf of an xGov in a single app call.
+
+        Args:
+            xgov_address: (Account): The address of the xGov being voted on behalf of
+            votes: (Array[typ.ProposalVote]): The Proposal application IDs with the
+                number of approvals and rejections votes allocated to each
+
+        Raises:
+            err.PAUSED_REGISTRY: If the xGov Registry is paused
+            err.EMPTY_PAYLOAD: If no Proposal votes are provided
+            err.NOT_XGOV: If the xGov Address is not an xGov
+            err.MUST_BE_XGOV_OR_VOTING_ADDRESS: If the sender is not the xgov_address or the voting_address
+            err.INVALID_PROPOSAL: If a Proposal ID is not a Proposal contract
+            err.WRONG_PROPOSAL_STATUS: If a Proposal is not in the voting state
+            err.VOTER_NOT_FOUND: If the xGov is not found in a Proposal's voting registry
+            err.VOTER_ALREADY_VOTED: If the xGov has already voted on a Proposal
+            err.VOTES_INVALID: If the votes are invalid
+            err.VOTING_PERIOD_EXPIRED: If the voting period for a Proposal has expired
+        """
+
+        assert not self.paused_registry.value, err.PAUSED_REGISTRY
+        assert votes.length, err.EMPTY_PAYLOAD
+
+        self.bump_state_version()
+
+        # The xGov Box is updated once for all the Proposals
+        self.vote_check_xgov(xgov_address)
+
+        for i in urange(votes.length):
+            vote = votes[i].copy()
+            proposal_id = Application(vote.proposal_id)
+            assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
+
+            # Call the Proposal App to register the vote, the inner fee is pooled
+            error, _tx = arc4.abi_call(
+                proposal_contract.Proposal.vote,
+                xgov_address,
+                vote.approvals,
+                vote.rejections,
+                app_id=proposal_id,
+            )
+
+            self.assert_no_vote_error(error)
 
     @arc4.abimethod()
     def unassign_absentee_from_proposal(
@@ -1303,6 +1674,8 @@ class XGovRegistry(
         # Verify proposal_id is a genuine proposal created by this registry
         assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
 
+        self.bump_state_version()
+
         # The `Proposal.unassign_absentees` call guarantees that:
         # - Any absentee in the array is really assigned to the Proposal;
         # - No absentee is duplicated in the array.
@@ -1312,6 +1685,68 @@ class XGovRegistry(
             app_id=proposal_id,
         )
 
+        self.assert_no_unassign_error(error)
+
+        # ⚠️ WARNING: The absentees array:
+        # - MUST have only absentees really/still assigned to the Proposal
+        # - MUST NOT have duplicates
+        # which is guaranteed by the previous ABI call, so only the xGovs of the
+        # Proposal Committee are charged an absence.
+        for absentee in absentees:
+            self.charge_absence(absentee)
+
+    @arc4.abimethod()
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        *,
+        proposal_id: Application,
+        xgov_address: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+    ) -> None:
+        """
+        Unassign an absentee from a scrutinized Proposal whose xGov Committee was
+        declared with a Merkle root.
+
+        Args:
+            proposal_id (Application): The application ID of the scrutinized Proposal
+            xgov_address (Account): The address of the absentee
+            voting_power (UInt64): The votes of the absentee in the Committee
+            ordinal (UInt64): The position of the absentee in the Committee Merkle tree
+            proof (Array[typ.Bytes32]): The Merkle proof of the absentee membership
+
+        Raises:
+            err.PAUSED_REGISTRY: If the xGov Registry is paused
+            err.INVALID_PROPOSAL: If the Proposal ID is not a Proposal contract
+            err.WRONG_PROPOSAL_STATUS: If the Proposal is not scrutinized
+            err.VOTER_NOT_FOUND: If the membership proof does not match the Committee
+                root, or the absentee has voted or was already unassigned
+        """
+
+        assert not self.paused_registry.value, err.PAUSED_REGISTRY
+
+        # Verify proposal_id is a genuine proposal created by this registry
+        assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
+
+        self.bump_state_version()
+
+        # The `Proposal.unassign_absentee_with_proof` call guarantees that the
+        # absentee is a Committee member who has not voted and is charged once
+        error, _tx = arc4.abi_call(
+            proposal_contract.Proposal.unassign_absentee_with_proof,
+            xgov_address,
+            voting_power,
+            ordinal,
+            proof,
+            app_id=proposal_id,
+        )
+
+        self.assert_no_unassign_error(error)
+
+        self.charge_absence(xgov_address)
+
+    def assert_no_unassign_error(self, error: typ.Error) -> None:
         if error.startswith(err.ARC_65_PREFIX):
             error_without_prefix = String.from_bytes(error.bytes[4:])
             match error_without_prefix:
@@ -1324,19 +1759,15 @@ class XGovRegistry(
         else:
             assert error == "", "Unknown error"
 
-        # ⚠️ WARNING: The absentees array:
-        # - MUST have only absentees really/still assigned to the Proposal
-        # - MUST NOT have duplicates
-        # which is guaranteed by the previous ABI call.
-        for absentee in absentees:
-            # The absentee might have already self-unsubscribed
-            if (
-                self.has_xgov_status(absentee)
-                and self.xgov_box[absentee].tolerated_absences > 0
-            ):
-                self.xgov_box[absentee].tolerated_absences -= 1
-                if self.xgov_box[absentee].tolerated_absences == 0:
-                    self.unsubscribe_xgov_and_emit(absentee)
+    def charge_absence(self, absentee: Account) -> None:
+        # The absentee might have already self-unsubscribed
+        if (
+            self.has_xgov_status(absentee)
+            and self.xgov_box[absentee].tolerated_absences > 0
+        ):
+            self.xgov_box[absentee].tolerated_absences -= 1
+            if self.xgov_box[absentee].tolerated_absences == 0:
+                self.unsubscribe_xgov_and_emit(absentee)
 
     @arc4.abimethod()
     def pay_grant_proposal(self, *, proposal_id: Application) -> None:
@@ -1362,6 +1793,8 @@ class XGovRegistry(
         # Verify proposal_id is a genuine proposal created by this registry
         assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
 
+        self.bump_state_version()
+
         # Read proposal state directly from the Proposal App's global state
         proposer = self.get_proposal_proposer(proposal_id)
         requested_amount = self.get_proposal_requested_amount(proposal_id)
@@ -1404,6 +1837,8 @@ class XGovRegistry(
             err.VOTERS_ASSIGNED: If there are still assigned voters
         """
 
+        self.bump_state_version()
+
         proposal_status = self.get_proposal_status(proposal_id)
         if proposal_status == UInt64(penm.STATUS_EMPTY) or proposal_status == UInt64(
             penm.STATUS_DRAFT
@@ -1451,6 +1886,8 @@ class XGovRegistry(
         # Verify proposal_id is a genuine proposal created by this registry
         assert self._is_proposal(proposal_id), err.INVALID_PROPOSAL
 
+        self.bump_state_version()
+
         proposer = self.get_proposal_proposer(proposal_id)
         assert Txn.sender == proposer, err.UNAUTHORIZED
 
@@ -1483,6 +1920,8 @@ class XGovRegistry(
         assert (
             payment.receiver == Global.current_application_address
         ), err.WRONG_RECEIVER
+
+        self.bump_state_version()
         self.outstanding_funds.value += payment.amount
 
     @arc4.abimethod()
@@ -1502,6 +1941,8 @@ class XGovRegistry(
         assert self.is_xgov_manager(), err.UNAUTHORIZED
         assert amount <= self.outstanding_funds.value, err.INSUFFICIENT_FUNDS
         assert Txn.fee >= (Global.min_txn_fee * 2), err.INSUFFICIENT_FEE
+
+        self.bump_state_version()
         self.outstanding_funds.value -= amount
 
         itxn.Payment(
@@ -1527,6 +1968,8 @@ class XGovRegistry(
         assert self.is_xgov_payor(), err.UNAUTHORIZED
         assert Txn.fee >= (Global.min_txn_fee * 2), err.INSUFFICIENT_FEE
         assert amount <= self.compute_available_funds(), err.INSUFFICIENT_FUNDS
+
+        self.bump_state_version()
         itxn.Payment(
             receiver=self.xgov_payor.value,
             amount=amount,
@@ -1616,6 +2059,60 @@ class XGovRegistry(
             committee_last_anchor=self.committee_last_anchor.value,
         )
 
+    def read_xgov_box(self, xgov_address: Account) -> tuple[typ.XGovBoxValue, bool]:
+        exists = self.has_xgov_status(xgov_address)
+        if exists:
+            val = self.xgov_box[xgov_address].copy()
+        else:
+            val = typ.XGovBoxValue(
+                voting_address=Account(),
+                tolerated_absences=UInt64(0),
+                last_vote_timestamp=UInt64(0),
+                subscription_round=UInt64(0),
+            )
+
+        return val.copy(), exists
+
+    def read_proposer_box(
+        self, proposer_address: Account
+    ) -> tuple[typ.ProposerBoxValue, bool]:
+        exists = proposer_address in self.proposer_box
+        if exists:
+            val = self.proposer_box[proposer_address].copy()
+        else:
+            val = typ.ProposerBoxValue(
+                active_proposal=False,
+                kyc_status=False,
+                kyc_expiring=UInt64(0),
+            )
+
+        return val.copy(), exists
+
+    def read_request_box(
+        self,
+        request_box: BoxMap[UInt64, typ.XGovSubscribeRequestBoxValue],
+        request_id: UInt64,
+    ) -> tuple[typ.XGovSubscribeRequestBoxValue, bool]:
+        exists = request_id in request_box
+        if exists:
+            val = request_box[request_id].copy()
+        else:
+            val = typ.XGovSubscribeRequestBoxValue(
+                xgov_addr=Account(),
+                owner_addr=Account(),
+                relation_type=UInt64(0),
+            )
+
+        return val.copy(), exists
+
+    @arc4.abimethod(readonly=True)
+    def get_state_version(self) -> UInt64:
+        """
+        Returns the xGov Registry state version, incremented by every mutating method.
+        """
+
+        return self.get_current_state_version()
+
     @arc4.abimethod(readonly=True)
     def get_xgov_box(self, *, xgov_address: Account) -> tuple[typ.XGovBoxValue, bool]:
         """
@@ -1628,18 +2125,27 @@ class XGovRegistry(
             typ.XGovBoxValue: The xGov box value
             bool: `True` if xGov box exists, else `False`
         """
-        exists = self.has_xgov_status(xgov_address)
-        if exists:
-            val = self.xgov_box[xgov_address].copy()
-        else:
-            val = typ.XGovBoxValue(
-                voting_address=Account(),
-                tolerated_absences=UInt64(0),
-                last_vote_timestamp=UInt64(0),
-                subscription_round=UInt64(0),
-            )
+        return self.read_xgov_box(xgov_address)
 
-        return val.copy(), exists
+    @arc4.abimethod(readonly=True)
+    def get_xgov_boxes(
+        self, *, xgov_addresses: Array[Account]
+    ) -> Array[typ.XGovBoxEntry]:
+        """
+        Returns the xGov boxes for the given addresses, as `get_xgov_box`.
+
+        Args:
+            xgov_addresses (Array[Account]): The addresses of the xGovs
+
+        Returns:
+            Array[typ.XGovBoxEntry]: The xGov box value, and whether the xGov box
+                exists, of each address
+        """
+        entries = Array[typ.XGovBoxEntry]()
+        for xgov_address in xgov_addresses:
+            val, exists = self.read_xgov_box(xgov_address)
+            entries.append(typ.XGovBoxEntry(value=val.copy(), exists=exists))
+        return entries
 
     @arc4.abimethod(readonly=True)
     def get_proposer_box(
@@ -1657,17 +2163,27 @@ class XGovRegistry(
             typ.ProposerBoxValue: The Proposer box value
             bool: `True` if Proposer box exists, else `False`
         """
-        exists = proposer_address in self.proposer_box
-        if exists:
-            val = self.proposer_box[proposer_address].copy()
-        else:
-            val = typ.ProposerBoxValue(
-                active_proposal=False,
-                kyc_status=False,
-                kyc_expiring=UInt64(0),
-            )
+        return self.read_proposer_box(proposer_address)
 
-        return val.copy(), exists
+    @arc4.abimethod(readonly=True)
+    def get_proposer_boxes(
+        self, *, proposer_addresses: Array[Account]
+    ) -> Array[typ.ProposerBoxEntry]:
+        """
+        Returns the Proposer boxes for the given addresses, as `get_proposer_box`.
+
+        Args:
+            proposer_addresses (Array[Account]): The addresses of the Proposers
+
+        Returns:
+            Array[typ.ProposerBoxEntry]: The Proposer box value, and whether the
+                Proposer box exists, of each address
+        """
+        entries = Array[typ.ProposerBoxEntry]()
+        for proposer_address in proposer_addresses:
+            val, exists = self.read_proposer_box(proposer_address)
+            entries.append(typ.ProposerBoxEntry(value=val.copy(), exists=exists))
+        return entries
 
     @arc4.abimethod(readonly=True)
     def get_request_box(
@@ -1685,17 +2201,30 @@ class XGovRegistry(
             typ.XGovSubscribeRequestBoxValue: The subscribe request box value
             bool: `True` if xGov subscribe request box exists, else `False`
         """
-        exists = request_id in self.request_box
-        if exists:
-            val = self.request_box[request_id].copy()
-        else:
-            val = typ.XGovSubscribeRequestBoxValue(
-                xgov_addr=Account(),
-                owner_addr=Account(),
-                relation_type=UInt64(0),
-            )
+        return self.read_request_box(self.request_box, request_id)
 
-        return val.copy(), exists
+    @arc4.abimethod(readonly=True)
+    def get_request_boxes(
+        self, *, request_ids: Array[UInt64]
+    ) -> Array[typ.XGovSubscribeRequestBoxEntry]:
+        """
+        Returns the xGov subscribe request boxes for the given request IDs, as
+        `get_request_box`.
+
+        Args:
+            request_ids (Array[UInt64]): The IDs of the subscribe requests
+
+        Returns:
+            Array[typ.XGovSubscribeRequestBoxEntry]: The subscribe request box
+                value, and whether the box exists, of each request ID
+        """
+        entries = Array[typ.XGovSubscribeRequestBoxEntry]()
+        for request_id in request_ids:
+            val, exists = self.read_request_box(self.request_box, request_id)
+            entries.append(
+                typ.XGovSubscribeRequestBoxEntry(value=val.copy(), exists=exists)
+            )
+        return entries
 
     @arc4.abimethod(readonly=True)
     def get_request_unsubscribe_box(
@@ -1711,17 +2240,61 @@ class XGovRegistry(
             typ.XGovSubscribeRequestBoxValue: The unsubscribe request box value
             bool: `True` if xGov unsubscribe request box exists, else `False`
         """
-        exists = request_id in self.request_unsubscribe_box
-        if exists:
-            val = self.request_unsubscribe_box[request_id].copy()
-        else:
-            val = typ.XGovSubscribeRequestBoxValue(
-                xgov_addr=Account(),
-                owner_addr=Account(),
-                relation_type=UInt64(0),
+        return self.read_request_box(self.request_unsubscribe_box, request_id)
+
+    @arc4.abimethod(readonly=True)
+    def get_request_unsubscribe_boxes(
+        self, *, request_ids: Array[UInt64]
+    ) -> Array[typ.XGovSubscribeRequestBoxEntry]:
+        """
+        Returns the xGov unsubscribe request boxes for the given unsubscribe
+        request IDs, as `get_request_unsubscribe_box`.
+
+        Args:
+            request_ids (Array[UInt64]): The IDs of the unsubscribe requests
+
+        Returns:
+            Array[typ.XGovSubscribeRequestBoxEntry]: The unsubscribe request box
+                value, and whether the box exists, of each request ID
+        """
+        entries = Array[typ.XGovSubscribeRequestBoxEntry]()
+        for request_id in request_ids:
+            val, exists = self.read_request_box(
+                self.request_unsubscribe_box, request_id
             )
+            entries.append(
+                typ.XGovSubscribeRequestBoxEntry(value=val.copy(), exists=exists)
+            )
+        return entries
 
-        return val.copy(), exists
+    @arc4.abimethod(readonly=True)
+    def get_proposals_summary(
+        self, *, proposal_ids: Array[UInt64]
+    ) -> Array[typ.ProposalSummary]:
+        """
+        Returns a compact state of several Proposals, read from their global state.
+
+        The summaries are returned in a single log, which bounds a call to
+        `MAX_PROPOSALS_SUMMARY` Proposals (see `read_proposals_summary` to read
+        more Proposals across calls).
+
+        Args:
+            proposal_ids (Array[UInt64]): The application IDs of the Proposals
+
+        Returns:
+            Array[typ.ProposalSummary]: The state of each Proposal, with `exists`
+                `False` (and zero values) if the ID is not a Proposal of the registry
+
+        Raises:
+            err.TOO_MANY_PROPOSALS: If more than `MAX_PROPOSALS_SUMMARY` Proposals
+                are requested
+        """
+        assert proposal_ids.length <= MAX_PROPOSALS_SUMMARY, err.TOO_MANY_PROPOSALS
+
+        summaries = Array[typ.ProposalSummary]()
+        for proposal_id in proposal_ids:
+            summaries.append(self.read_proposal_summary(Application(proposal_id)))
+        return summaries
 
     @arc4.abimethod()
     def is_proposal(self, *, proposal_id: Application) -> None:
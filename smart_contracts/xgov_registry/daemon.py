@@ -0,0 +1,713 @@
+import asyncio
+import base64
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from http import HTTPStatus
+from pathlib import Path
+from typing import TypedDict, cast
+
+from algokit_utils import AlgoAmount, BoxReference, CommonAppCallParams
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.constants import MIN_TXN_FEE
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    FinalizeProposalArgs,
+    UnassignAbsenteeFromProposalArgs,
+    UnassignAbsenteeFromProposalWithProofArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.proposal.constants import VOTER_BUCKET_RECORD_SIZE
+from smart_contracts.proposal.enums import (
+    STATUS_APPROVED,
+    STATUS_BLOCKED,
+    STATUS_FUNDED,
+    STATUS_REJECTED,
+    STATUS_SUBMITTED,
+    STATUS_VOTING,
+)
+from smart_contracts.xgov_registry.box_names import (
+    get_voted_bitmap_box_name,
+    get_voter_box_name,
+    get_voter_bucket_box_name,
+)
+from smart_contracts.xgov_registry.committee_assign import (
+    DEFAULT_MAX_GROUPS_IN_FLIGHT,
+    _get_assignable_state,
+    compose_voters_assignment_group,
+    get_existing_boxes,
+    get_voter_bucket,
+    plan_voters_assignment,
+)
+from smart_contracts.xgov_registry.committee_merkle import (
+    CommitteeMerkleTree,
+    get_voted_bitmap_pages,
+)
+from smart_contracts.xgov_registry.constants import (
+    ADDRESS_LENGTH,
+    MAX_APP_TXN_REFERENCES,
+    MAX_GROUP_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 4.0  # seconds
+
+ACTION_ASSIGN_VOTERS = "assign_voters"
+ACTION_SCRUTINY = "scrutiny"
+ACTION_UNASSIGN_ABSENTEES = "unassign_absentees"
+ACTION_FINALIZE = "finalize"
+
+# The Proposal app is passed as a foreign app index argument
+_PROPOSAL_APP_REFERENCES = 1
+
+# A voter bucket may exceed the 1KB box I/O budget of its reference, the spare
+# references of a call are left empty to raise the budget
+_BUCKETS_PER_TRANSACTION = (MAX_APP_TXN_REFERENCES - _PROPOSAL_APP_REFERENCES) // 2
+
+# Inner calls paid by the outer transaction
+_SCRUTINY_FEE = AlgoAmount(micro_algo=2 * MIN_TXN_FEE)
+_UNASSIGN_ABSENTEES_FEE = AlgoAmount(micro_algo=2 * MIN_TXN_FEE)
+_FINALIZE_FEE = AlgoAmount(micro_algo=3 * MIN_TXN_FEE)
+
+CommitteeMembers = Callable[[bytes], Sequence[tuple[str, int]]]
+SignedGroup = list[GenericSignedTransaction]
+
+# Subsets of the algod responses read by the xGov Daemon
+NodeStatus = TypedDict("NodeStatus", {"last-round": int})
+PendingTransactionInfo = TypedDict(
+    "PendingTransactionInfo",
+    {"confirmed-round": int, "pool-error": str},
+    total=False,
+)
+
+
+class CreatedApp(TypedDict):
+    id: int
+
+
+AccountInfo = TypedDict("AccountInfo", {"created-apps": list[CreatedApp]}, total=False)
+
+
+class BlockHeader(TypedDict, total=False):
+    ts: int
+
+
+class BlockResponse(TypedDict):
+    block: BlockHeader
+
+
+class BoxResponse(TypedDict):
+    value: str
+
+
+class CheckpointDocument(TypedDict):
+    finalized: list[int]
+    in_flight: dict[str, list[int]]
+
+
+def next_action(global_state: Mapping[str, object], now: int) -> str | None:
+    """
+    Next xGov Daemon action on a Proposal, None if the Proposal is waiting for
+    someone else (proposer, xGovs, Council, payor) or is finalized.
+
+    Args:
+        global_state: Proposal global state
+        now: Latest block timestamp
+    """
+    state = cast(Mapping[str, int], global_state)
+    if state["finalized"]:
+        return None
+
+    status = state["status"]
+    if status == STATUS_SUBMITTED:
+        if state["assigned_members"] < state["committee_members"]:
+            return ACTION_ASSIGN_VOTERS
+    elif status == STATUS_VOTING:
+        if (
+            state["voted_members"] == state["committee_members"]
+            or now - state["vote_open_ts"] > state["voting_duration"]
+        ):
+            return ACTION_SCRUTINY
+    elif status in (STATUS_APPROVED, STATUS_REJECTED):
+        # Approved Proposals are reviewed by the Council once absentees are gone
+        if state["assigned_members"]:
+            return ACTION_UNASSIGN_ABSENTEES
+        if status == STATUS_REJECTED:
+            return ACTION_FINALIZE
+    elif status in (STATUS_FUNDED, STATUS_BLOCKED):
+        return ACTION_FINALIZE
+    return None
+
+
+def plan_absentees_unassignment(
+    absentees: Sequence[str],
+    *,
+    buckets: int = 0,
+    max_group_size: int = MAX_GROUP_SIZE,
+) -> tuple[tuple[tuple[str, ...], ...], ...]:
+    """
+    Packs the absentees of a scrutinized Proposal in atomic groups of
+    `unassign_absentee_from_proposal` calls.
+
+    A call references the Voter Box of each of its absentees, or the bucket box
+    shared by the absentees of the same bucket.
+
+    Args:
+        absentees: Addresses of the voters still assigned to the Proposal
+        buckets: Proposal `voter_buckets`, zero if voters have Voter Boxes
+        max_group_size: Max transactions per atomic group
+
+    Returns:
+        Per group, the absentees of each call
+    """
+    if max_group_size <= 0:
+        raise ValueError("max_group_size must be positive")
+
+    max_boxes = (
+        _BUCKETS_PER_TRANSACTION
+        if buckets
+        else MAX_APP_TXN_REFERENCES - _PROPOSAL_APP_REFERENCES
+    )
+    if buckets:
+
+        def bucket(address: str) -> int:
+            return get_voter_bucket(address, buckets)
+
+        absentees = sorted(absentees, key=bucket)
+
+    calls: list[tuple[str, ...]] = []
+    call: list[str] = []
+    boxes: set[bytes] = set()
+    for address in absentees:
+        box = _absentee_box_name(address, buckets)
+        if box not in boxes and len(boxes) == max_boxes:
+            calls.append(tuple(call))
+            call, boxes = [], set()
+        call.append(address)
+        boxes.add(box)
+    if call:
+        calls.append(tuple(call))
+    return tuple(
+        tuple(calls[i : i + max_group_size])
+        for i in range(0, len(calls), max_group_size)
+    )
+
+
+def _absentee_box_name(address: str, buckets: int) -> bytes:
+    if buckets:
+        return get_voter_bucket_box_name(get_voter_bucket(address, buckets))
+    return get_voter_box_name(address)
+
+
+def get_absentees(
+    proposal_client: ProposalClient, committee: Iterable[str]
+) -> list[str]:
+    """
+    Voters still assigned to a scrutinized Proposal, read from the Voter Boxes of
+    the committee members or from the voter bucket boxes. The boxes are read by
+    name, since their names follow from the committee and the bucket count (no
+    listing of the app boxes).
+    """
+    buckets = proposal_client.state.global_state.voter_buckets
+    if not buckets:
+        committee = list(committee)
+        assigned = get_existing_boxes(
+            proposal_client, (get_voter_box_name(address) for address in committee)
+        )
+        return [
+            address for address in committee if get_voter_box_name(address) in assigned
+        ]
+
+    algod = proposal_client.algorand.client.algod
+    absentees: list[str] = []
+    for bucket in range(buckets):
+        try:
+            box = algod.application_box_by_name(
+                proposal_client.app_id, get_voter_bucket_box_name(bucket)
+            )
+        except AlgodHTTPError as exc:  # type: ignore[misc]
+            # Emptied buckets are deleted
+            if exc.code == HTTPStatus.NOT_FOUND:  # type: ignore[misc]
+                continue
+            raise
+        records = base64.b64decode(cast(BoxResponse, box)["value"])
+        absentees.extend(
+            _encode_address(records[i : i + ADDRESS_LENGTH])
+            for i in range(0, len(records), VOTER_BUCKET_RECORD_SIZE)
+        )
+    return absentees
+
+
+def _encode_address(public_key: bytes) -> str:
+    address: str = encoding.encode_address(public_key)  # type: ignore[no-untyped-call]
+    return address
+
+
+class DaemonCheckpoint:
+    """
+    JSON checkpoint of the xGov Daemon: the finalized Proposals (no longer
+    watched) and the submitted groups not yet confirmed, awaited on restart
+    before any Proposal is acted on again.
+
+    The file is replaced atomically on each change.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.finalized: set[int] = set()
+        # First transaction ID of each group in flight: (proposal_id, last_valid)
+        self.in_flight: dict[str, tuple[int, int]] = {}
+        if self.path.exists():
+            document = cast(CheckpointDocument, json.loads(self.path.read_text()))
+            self.finalized = set(document["finalized"])
+            self.in_flight = {
+                txid: (proposal_id, last_valid)
+                for txid, (proposal_id, last_valid) in document["in_flight"].items()
+            }
+
+    def save(self) -> None:
+        document: CheckpointDocument = {
+            "finalized": sorted(self.finalized),
+            "in_flight": {txid: list(entry) for txid, entry in self.in_flight.items()},
+        }
+        temporary_path = self.path.with_name(self.path.name + ".tmp")
+        temporary_path.write_text(json.dumps(document, indent=2))
+        os.replace(temporary_path, self.path)
+
+    def mark_finalized(self, proposal_id: int) -> None:
+        self.finalized.add(proposal_id)
+        self.save()
+
+    def add_in_flight(self, txid: str, proposal_id: int, last_valid: int) -> None:
+        self.in_flight[txid] = (proposal_id, last_valid)
+        self.save()
+
+    def remove_in_flight(self, txid: str) -> None:
+        if self.in_flight.pop(txid, None) is not None:
+            self.save()
+
+
+class ConfirmationWaiter:
+    """
+    Waits for the confirmation of many transactions at once: after each new
+    round, all the pending transactions are checked together, instead of each
+    submitter polling algod on its own.
+    """
+
+    def __init__(self, algod: AlgodClient) -> None:
+        self.algod = algod
+        self._pending: dict[str, tuple[int, asyncio.Future[int | None]]] = {}
+        self._wakeup = asyncio.Event()
+
+    async def wait(self, txid: str, last_valid: int) -> int | None:
+        """
+        Returns the confirmation round of a transaction, None if algod does not
+        know it (e.g. confirmed before a restart and pruned from the pool).
+
+        Raises:
+            RuntimeError: If the transaction is rejected by the pool or expired
+        """
+        if txid not in self._pending:
+            future = cast(
+                asyncio.Future[int | None], asyncio.get_running_loop().create_future()
+            )
+            self._pending[txid] = (last_valid, future)
+            self._wakeup.set()
+        return await self._pending[txid][1]
+
+    async def run(self) -> None:
+        last_round = await asyncio.to_thread(self._last_round)
+        while True:
+            await self._wakeup.wait()
+            last_round = await asyncio.to_thread(self._last_round_after, last_round)
+            await self.check(last_round)
+            if not self._pending:
+                self._wakeup.clear()
+
+    async def check(self, last_round: int) -> None:
+        txids = list(self._pending)
+        infos = await asyncio.gather(
+            *(asyncio.to_thread(self._pending_info, txid) for txid in txids)
+        )
+        for txid, info in zip(txids, infos, strict=True):
+            last_valid, future = self._pending[txid]
+            if info is None:
+                future.set_result(None)
+            elif info.get("confirmed-round"):
+                future.set_result(info["confirmed-round"])
+            elif info.get("pool-error"):
+                future.set_exception(
+                    RuntimeError(f"transaction {txid} rejected: {info['pool-error']}")
+                )
+            elif last_round > last_valid:
+                future.set_exception(RuntimeError(f"transaction {txid} expired"))
+            else:
+                continue
+            del self._pending[txid]
+
+    def _last_round(self) -> int:
+        return cast(NodeStatus, self.algod.status())["last-round"]
+
+    def _last_round_after(self, round_number: int) -> int:
+        status = self.algod.status_after_block(round_number)
+        return cast(NodeStatus, status)["last-round"]
+
+    def _pending_info(self, txid: str) -> PendingTransactionInfo | None:
+        try:
+            info = self.algod.pending_transaction_info(txid)
+        except AlgodHTTPError as exc:  # type: ignore[misc]
+            if exc.code == HTTPStatus.NOT_FOUND:  # type: ignore[misc]
+                return None
+            raise
+        return cast(PendingTransactionInfo, info)
+
+
+class XGovDaemon:
+    """
+    Drives the Proposals lifecycle as the xGov Daemon: assigns the committee to
+    Submitted Proposals, scrutinizes the Proposals whose voting ended, unassigns
+    the absentees of scrutinized Proposals and finalizes the closed ones.
+
+    Each Proposal has its own work queue, so actions on a Proposal are
+    sequential while different Proposals progress concurrently. The atomic
+    groups of an action are independent and submitted concurrently, up to
+    `max_in_flight` unconfirmed groups overall, and confirmed by a shared
+    `ConfirmationWaiter`. Every action re-reads the on-chain state it acts on,
+    and the groups in flight are checkpointed, so a restarted daemon neither
+    repeats confirmed work nor races its own pending groups.
+    """
+
+    def __init__(
+        self,
+        xgov_registry_client: XGovRegistryClient,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        committee_members: CommitteeMembers,
+        checkpoint_path: str | Path,
+        proposal_ids: Callable[[], Iterable[int]] | None = None,
+        max_in_flight: int = DEFAULT_MAX_GROUPS_IN_FLIGHT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            xgov_registry_client: Client of the xGov Registry app
+            sender: xGov Daemon address
+            signer: xGov Daemon signer
+            committee_members: `(address, votes)` members of a committee ID
+            checkpoint_path: Daemon checkpoint file
+            proposal_ids: Proposals to watch, defaults to the apps created by the
+                xGov Registry (see also `EventIndexer.proposal_ids`)
+            max_in_flight: Max groups submitted and not yet confirmed
+            poll_interval: Seconds between two observations of the Proposals
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self.xgov_registry_client = xgov_registry_client
+        self.algod = xgov_registry_client.algorand.client.algod
+        self.sender = sender
+        self.signer = signer
+        self.committee_members = committee_members
+        self.checkpoint = DaemonCheckpoint(checkpoint_path)
+        self.proposal_ids = proposal_ids or self._created_apps
+        self.poll_interval = poll_interval
+        self.max_in_flight = max_in_flight
+        self.waiter = ConfirmationWaiter(self.algod)
+        self._window = asyncio.Semaphore(max_in_flight)
+        self._queues: dict[int, asyncio.Queue[str]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        self._scheduled: set[int] = set()
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Watches the Proposals until `stop` is set"""
+        stop = stop or asyncio.Event()
+        confirmer = asyncio.create_task(self.waiter.run())
+        try:
+            await self.recover()
+            while not stop.is_set():
+                await self.tick()
+                try:
+                    await asyncio.wait_for(stop.wait(), self.poll_interval)
+                except TimeoutError:
+                    pass
+        finally:
+            for task in [confirmer, *self._workers.values()]:
+                task.cancel()
+            await asyncio.gather(
+                confirmer, *self._workers.values(), return_exceptions=True
+            )
+            self._workers.clear()
+            self._queues.clear()
+            self._scheduled.clear()
+
+    async def recover(self) -> None:
+        """Waits for the groups left in flight by a previous run"""
+        if self.checkpoint.in_flight:
+            logger.info(
+                f"waiting for {len(self.checkpoint.in_flight)} group(s) in flight"
+            )
+        await asyncio.gather(
+            *(
+                self._confirm(txid, last_valid)
+                for txid, (_, last_valid) in list(self.checkpoint.in_flight.items())
+            ),
+            return_exceptions=True,
+        )
+
+    async def tick(self) -> None:
+        """Observes the idle Proposals and queues their next action"""
+        proposal_ids = await asyncio.to_thread(lambda: list(self.proposal_ids()))
+        watched = [
+            proposal_id
+            for proposal_id in proposal_ids
+            if proposal_id not in self.checkpoint.finalized
+            and proposal_id not in self._scheduled
+        ]
+        if not watched:
+            return
+
+        now = await asyncio.to_thread(self._latest_timestamp)
+        states = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._proposal_client(proposal_id).state.global_state.get_all
+                )
+                for proposal_id in watched
+            ),
+            return_exceptions=True,
+        )
+        for proposal_id, state in zip(watched, states, strict=True):
+            if isinstance(state, BaseException):
+                logger.warning(f"cannot read proposal {proposal_id}: {state}")
+                continue
+            if state["finalized"]:
+                self.checkpoint.mark_finalized(proposal_id)
+                continue
+            action = next_action(cast(Mapping[str, object], state), now)
+            if action is not None:
+                self._schedule(proposal_id, action)
+
+    def _schedule(self, proposal_id: int, action: str) -> None:
+        if proposal_id not in self._queues:
+            self._queues[proposal_id] = asyncio.Queue()
+            self._workers[proposal_id] = asyncio.create_task(
+                self._proposal_worker(proposal_id)
+            )
+        self._scheduled.add(proposal_id)
+        self._queues[proposal_id].put_nowait(action)
+
+    async def _proposal_worker(self, proposal_id: int) -> None:
+        queue = self._queues[proposal_id]
+        while proposal_id not in self.checkpoint.finalized:
+            action = await queue.get()
+            try:
+                await self._run_action(proposal_id, action)
+            except Exception:
+                # Retried on a later tick, from the on-chain state
+                logger.exception(f"{action} failed on proposal {proposal_id}")
+            finally:
+                self._scheduled.discard(proposal_id)
+                queue.task_done()
+        del self._queues[proposal_id]
+        del self._workers[proposal_id]
+
+    async def _run_action(self, proposal_id: int, action: str) -> None:
+        proposal_client = self._proposal_client(proposal_id)
+        builders: dict[str, Callable[[ProposalClient], list[SignedGroup]]] = {
+            ACTION_ASSIGN_VOTERS: self._build_voters_assignment,
+            ACTION_SCRUTINY: self._build_scrutiny,
+            ACTION_UNASSIGN_ABSENTEES: self._build_absentees_unassignment,
+            ACTION_FINALIZE: self._build_finalize,
+        }
+        groups = await asyncio.to_thread(builders[action], proposal_client)
+        logger.info(f"{action} on proposal {proposal_id} in {len(groups)} group(s)")
+        await asyncio.gather(*(self._submit(proposal_id, group) for group in groups))
+        if action == ACTION_FINALIZE:
+            self.checkpoint.mark_finalized(proposal_id)
+
+    async def _submit(self, proposal_id: int, group: SignedGroup) -> None:
+        txid: str = group[0].get_txid()  # type: ignore[no-untyped-call]
+        last_valid: int = group[0].transaction.last_valid_round
+        async with self._window:
+            # Checkpointed before sending: a restart cannot miss a sent group
+            self.checkpoint.add_in_flight(txid, proposal_id, last_valid)
+            await asyncio.to_thread(self._send, group)
+            await self._confirm(txid, last_valid)
+
+    def _send(self, group: SignedGroup) -> None:
+        self.algod.send_transactions(group)
+
+    async def _confirm(self, txid: str, last_valid: int) -> None:
+        try:
+            await self.waiter.wait(txid, last_valid)
+        finally:
+            self.checkpoint.remove_in_flight(txid)
+
+    def _proposal_client(self, proposal_id: int) -> ProposalClient:
+        return ProposalClient(
+            algorand=self.xgov_registry_client.algorand,
+            app_id=proposal_id,
+            default_sender=self.sender,
+            default_signer=self.signer,
+        )
+
+    def _created_apps(self) -> list[int]:
+        account = cast(
+            AccountInfo,
+            self.algod.account_info(self.xgov_registry_client.app_address),
+        )
+        return [app["id"] for app in account.get("created-apps", [])]
+
+    def _latest_timestamp(self) -> int:
+        status = cast(NodeStatus, self.algod.status())
+        block = cast(
+            BlockResponse,
+            self.algod.block_info(status["last-round"], header_only=True),
+        )
+        return block["block"].get("ts", 0)
+
+    def _build_voters_assignment(
+        self, proposal_client: ProposalClient
+    ) -> list[SignedGroup]:
+        committee_id = proposal_client.state.global_state.committee_id
+        committee = list(self.committee_members(committee_id))
+        global_state = _get_assignable_state(
+            proposal_client, committee, self.max_in_flight
+        )
+        if global_state["voter_buckets"]:
+            raise ValueError("proposal voters are assigned to buckets")
+        if global_state["assigned_members"]:
+            assigned = get_existing_boxes(
+                proposal_client,
+                (get_voter_box_name(address) for address, _ in committee),
+            )
+            committee = [
+                member
+                for member in committee
+                if get_voter_box_name(member[0]) not in assigned
+            ]
+
+        plan = plan_voters_assignment(committee)
+        return [
+            compose_voters_assignment_group(
+                proposal_client,
+                group,
+                registry_app_id=global_state["registry_app_id"],
+                sender=self.sender,
+                signer=self.signer,
+            )
+            .composer()
+            .build()
+            .atc.gather_signatures()
+            for group in plan.groups
+        ]
+
+    def _build_scrutiny(self, proposal_client: ProposalClient) -> list[SignedGroup]:
+        composer = proposal_client.new_group().scrutiny(
+            params=CommonAppCallParams(
+                sender=self.sender, signer=self.signer, static_fee=_SCRUTINY_FEE
+            )
+        )
+        return [composer.composer().build().atc.gather_signatures()]
+
+    def _build_absentees_unassignment(
+        self, proposal_client: ProposalClient
+    ) -> list[SignedGroup]:
+        if proposal_client.state.global_state.committee_root:
+            return self._build_absentees_unassignment_with_proof(proposal_client)
+
+        proposal_id = proposal_client.app_id
+        global_state = proposal_client.state.global_state
+        committee = self.committee_members(global_state.committee_id)
+        buckets = global_state.voter_buckets
+        plan = plan_absentees_unassignment(
+            get_absentees(proposal_client, (address for address, _ in committee)),
+            buckets=buckets,
+        )
+
+        groups: list[SignedGroup] = []
+        for group in plan:
+            composer = self.xgov_registry_client.new_group()
+            for i, absentees in enumerate(group):
+                names: list[bytes] = []
+                for address in absentees:
+                    name = _absentee_box_name(address, buckets)
+                    if name not in names:
+                        names.append(name)
+                if buckets:
+                    names += [b""] * (
+                        MAX_APP_TXN_REFERENCES - _PROPOSAL_APP_REFERENCES - len(names)
+                    )
+                composer.unassign_absentee_from_proposal(
+                    args=UnassignAbsenteeFromProposalArgs(
+                        proposal_id=proposal_id, absentees=list(absentees)
+                    ),
+                    params=CommonAppCallParams(
+                        sender=self.sender,
+                        signer=self.signer,
+                        static_fee=_UNASSIGN_ABSENTEES_FEE,
+                        box_references=[
+                            BoxReference(app_id=proposal_id, name=name)
+                            for name in names
+                        ],
+                        # Distinguishes otherwise identical calls
+                        note=i.to_bytes(8, "big"),
+                    ),
+                )
+            groups.append(composer.composer().build().atc.gather_signatures())
+        return groups
+
+    def _build_absentees_unassignment_with_proof(
+        self, proposal_client: ProposalClient
+    ) -> list[SignedGroup]:
+        global_state = proposal_client.state.global_state
+        tree = CommitteeMerkleTree(self.committee_members(global_state.committee_id))
+        if tree.root != global_state.committee_root:
+            raise ValueError("committee members do not match the committee root")
+        absentees = tree.absentees(get_voted_bitmap_pages(proposal_client))
+
+        groups: list[SignedGroup] = []
+        for i in range(0, len(absentees), MAX_GROUP_SIZE):
+            composer = self.xgov_registry_client.new_group()
+            for address in absentees[i : i + MAX_GROUP_SIZE]:
+                membership = tree.proof(address)
+                composer.unassign_absentee_from_proposal_with_proof(
+                    args=UnassignAbsenteeFromProposalWithProofArgs(
+                        proposal_id=proposal_client.app_id,
+                        xgov_address=membership.address,
+                        voting_power=membership.votes,
+                        ordinal=membership.ordinal,
+                        proof=list(membership.proof),
+                    ),
+                    params=CommonAppCallParams(
+                        sender=self.sender,
+                        signer=self.signer,
+                        static_fee=_UNASSIGN_ABSENTEES_FEE,
+                        box_references=[
+                            BoxReference(
+                                app_id=proposal_client.app_id,
+                                name=get_voted_bitmap_box_name(
+                                    membership.voted_bitmap_page
+                                ),
+                            )
+                        ],
+                    ),
+                )
+            groups.append(composer.composer().build().atc.gather_signatures())
+        return groups
+
+    def _build_finalize(self, proposal_client: ProposalClient) -> list[SignedGroup]:
+        composer = self.xgov_registry_client.new_group().finalize_proposal(
+            args=FinalizeProposalArgs(proposal_id=proposal_client.app_id),
+            params=CommonAppCallParams(
+                sender=self.sender, signer=self.signer, static_fee=_FINALIZE_FEE
+            ),
+        )
+        return [composer.composer().build().atc.gather_signatures()]
@@ -0,0 +1,275 @@
+import logging
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from algokit_utils import AlgoAmount, BoxReference, CommonAppCallParams
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    TransactionSigner,
+)
+from algosdk.constants import MIN_TXN_FEE
+from algosdk.transaction import wait_for_confirmation
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    VoteProposalBatchArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.proposal.enums import STATUS_VOTING
+from smart_contracts.xgov_registry.box_names import (
+    get_voter_box_name,
+    get_voter_bucket_box_name,
+    get_xgov_box_name,
+)
+from smart_contracts.xgov_registry.committee_assign import (
+    DEFAULT_MAX_GROUPS_IN_FLIGHT,
+    _send_group,
+    get_voter_bucket,
+)
+from smart_contracts.xgov_registry.constants import (
+    ADDRESS_LENGTH,
+    DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD,
+    MAX_APP_TOTAL_ARG_LEN,
+    MAX_APP_TXN_REFERENCES,
+    MAX_GROUP_SIZE,
+    METHOD_SELECTOR_LENGTH,
+    UINT64_LENGTH,
+)
+
+logger = logging.getLogger(__name__)
+
+# The Proposal app is passed as a foreign app index argument
+_APPLICATION_ARG_LENGTH = 1
+
+# Every transaction of the group references the Proposal app, so that it can
+# carry Proposal boxes references
+_PROPOSAL_APP_REFERENCES = 1
+
+# `vote_proposal_batch` pays for its Proposal `vote_batch` inner call
+_VOTE_BATCH_FEE = AlgoAmount(micro_algo=2 * MIN_TXN_FEE)
+
+XGovVote = tuple[str, int, int]
+
+
+def max_xgov_votes_per_transaction() -> int:
+    """
+    xGov votes one `vote_proposal_batch` call can carry, bound by the application
+    arguments: each vote is an `(address,uint64,uint64)` entry.
+    """
+    return (
+        MAX_APP_TOTAL_ARG_LEN
+        - METHOD_SELECTOR_LENGTH
+        - _APPLICATION_ARG_LENGTH
+        - DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD
+    ) // (ADDRESS_LENGTH + 2 * UINT64_LENGTH)
+
+
+@dataclass(frozen=True)
+class DelegatedVotesGroup:
+    """
+    Atomic group voting a Proposal for several xGovs.
+
+    Attributes:
+        calls: `(xgov_address, approvals, rejections)` votes of each
+            `vote_proposal_batch` call
+        op_ups: Registry `op_up` calls appended to the group, carrying the box
+            references that do not fit in the `vote_proposal_batch` calls
+    """
+
+    calls: tuple[tuple[XGovVote, ...], ...]
+    op_ups: int
+
+    @property
+    def votes(self) -> tuple[XGovVote, ...]:
+        return tuple(vote for call in self.calls for vote in call)
+
+
+@dataclass(frozen=True)
+class DelegatedVotesPlan:
+    """Atomic groups of `vote_proposal_batch` calls voting a Proposal."""
+
+    groups: tuple[DelegatedVotesGroup, ...]
+
+    @property
+    def transaction_count(self) -> int:
+        return sum(len(group.calls) + group.op_ups for group in self.groups)
+
+    @property
+    def votes_count(self) -> int:
+        return sum(len(group.votes) for group in self.groups)
+
+
+def _vote_box_names(address: str, buckets: int) -> tuple[bytes, bytes]:
+    """Registry xGov Box and Proposal Voter (or bucket) Box of an xGov vote"""
+    return get_xgov_box_name(address), (
+        get_voter_bucket_box_name(get_voter_bucket(address, buckets))
+        if buckets
+        else get_voter_box_name(address)
+    )
+
+
+def _group_transactions(votes: int, box_references: int, per_txn: int) -> int:
+    calls = -(-votes // per_txn)
+    per_txn_references = MAX_APP_TXN_REFERENCES - _PROPOSAL_APP_REFERENCES
+    return max(calls, -(-box_references // per_txn_references))
+
+
+def plan_delegated_votes(
+    votes: Sequence[XGovVote],
+    *,
+    buckets: int = 0,
+    max_group_size: int = MAX_GROUP_SIZE,
+    max_votes_per_group: int | None = None,
+) -> DelegatedVotesPlan:
+    """
+    Packs the xGov votes of a Proposal in the fewest atomic groups.
+
+    Box references are shared by the group: the votes of a group are split in
+    `vote_proposal_batch` calls, and the box references exceeding their slots are
+    carried by Registry `op_up` calls, which also raise the group opcode budget.
+    Each vote needs the xGov Box and the Proposal Voter Box, or the voter bucket
+    box shared by the xGovs of the same bucket.
+
+    Args:
+        votes: `(xgov_address, approvals, rejections)` of the xGovs
+        buckets: Proposal `voter_buckets`, zero if voters have Voter Boxes
+        max_group_size: Max transactions per atomic group
+        max_votes_per_group: Max votes per atomic group, to bound the group
+            opcode budget consumption
+
+    Returns:
+        The voting plan
+    """
+    if max_group_size <= 0:
+        raise ValueError("max_group_size must be positive")
+    if max_votes_per_group is not None and max_votes_per_group <= 0:
+        raise ValueError("max_votes_per_group must be positive")
+    addresses = [address for address, _, _ in votes]
+    if len(set(addresses)) != len(addresses):
+        raise ValueError("duplicate xGov votes")
+
+    per_txn = max_xgov_votes_per_transaction()
+    groups: list[DelegatedVotesGroup] = []
+    group: list[XGovVote] = []
+    boxes: set[bytes] = set()
+
+    def close_group() -> None:
+        calls = tuple(
+            tuple(group[i : i + per_txn]) for i in range(0, len(group), per_txn)
+        )
+        transactions = _group_transactions(len(group), len(boxes), per_txn)
+        groups.append(
+            DelegatedVotesGroup(calls=calls, op_ups=transactions - len(calls))
+        )
+
+    for vote in votes:
+        vote_boxes = boxes | set(_vote_box_names(vote[0], buckets))
+        if group and (
+            _group_transactions(len(group) + 1, len(vote_boxes), per_txn)
+            > max_group_size
+            or len(group) == max_votes_per_group
+        ):
+            close_group()
+            group, boxes = [], set()
+            vote_boxes = set(_vote_box_names(vote[0], buckets))
+        if _group_transactions(1, len(vote_boxes), per_txn) > max_group_size:
+            raise ValueError("an xGov vote does not fit in an atomic group")
+        group.append(vote)
+        boxes = vote_boxes
+    if group:
+        close_group()
+    return DelegatedVotesPlan(groups=tuple(groups))
+
+
+def vote_proposal_delegated(
+    xgov_registry_client: XGovRegistryClient,
+    proposal_client: ProposalClient,
+    votes: Iterable[XGovVote],
+    *,
+    sender: str,
+    signer: TransactionSigner,
+    max_votes_per_group: int | None = None,
+    max_groups_in_flight: int = DEFAULT_MAX_GROUPS_IN_FLIGHT,
+) -> DelegatedVotesPlan:
+    """
+    Votes a Proposal on behalf of several xGovs as a delegate holding their
+    voting address (see `XGovRegistry.vote_proposal_batch`).
+
+    Groups are independent: a failing group (e.g. an xGov that already voted)
+    does not revert the votes of the other groups.
+
+    Args:
+        xgov_registry_client: Client of the xGov Registry app
+        proposal_client: Client of the Proposal app in voting
+        votes: `(xgov_address, approvals, rejections)` of the xGovs
+        sender: Voting address of the xGovs
+        signer: Voting address signer
+        max_votes_per_group: Max votes per atomic group
+        max_groups_in_flight: Max groups submitted and not yet confirmed
+
+    Returns:
+        The executed voting plan
+    """
+    if max_groups_in_flight <= 0:
+        raise ValueError("max_groups_in_flight must be positive")
+    global_state = proposal_client.state.global_state.get_all()
+    if global_state["status"] != STATUS_VOTING:
+        raise ValueError("proposal must be in voting to vote")
+    buckets = global_state["voter_buckets"]
+
+    plan = plan_delegated_votes(
+        list(votes), buckets=buckets, max_votes_per_group=max_votes_per_group
+    )
+    logger.info(
+        f"voting proposal {proposal_client.app_id} for {plan.votes_count} xGov(s) "
+        f"in {len(plan.groups)} group(s)"
+    )
+
+    proposal_id = proposal_client.app_id
+    algod = xgov_registry_client.algorand.client.algod
+    in_flight: deque[str] = deque()
+    for group in plan.groups:
+        references: list[BoxReference | str | bytes | AccountTransactionSigner] = []
+        seen: set[bytes] = set()
+        for address, _, _ in group.votes:
+            xgov_box, voter_box = _vote_box_names(address, buckets)
+            references.append(BoxReference(app_id=0, name=xgov_box))
+            if voter_box not in seen:
+                seen.add(voter_box)
+                references.append(BoxReference(app_id=proposal_id, name=voter_box))
+
+        per_txn_references = MAX_APP_TXN_REFERENCES - _PROPOSAL_APP_REFERENCES
+        slots = [
+            references[i : i + per_txn_references]
+            for i in range(0, len(references), per_txn_references)
+        ]
+        slots += [[]] * (len(group.calls) + group.op_ups - len(slots))
+
+        composer = xgov_registry_client.new_group()
+        for call, box_references in zip(group.calls, slots, strict=False):
+            composer.vote_proposal_batch(
+                args=VoteProposalBatchArgs(proposal_id=proposal_id, votes=list(call)),
+                params=CommonAppCallParams(
+                    sender=sender,
+                    signer=signer,
+                    static_fee=_VOTE_BATCH_FEE,
+                    box_references=box_references,
+                ),
+            )
+        for i, box_references in enumerate(slots[len(group.calls) :]):
+            composer.op_up(
+                params=CommonAppCallParams(
+                    sender=sender,
+                    signer=signer,
+                    app_references=[proposal_id],
+                    box_references=box_references,
+                    # Distinguishes the otherwise identical op_up calls
+                    note=i.to_bytes(8, "big"),
+                ),
+            )
+        _send_group(algod, composer.composer(), in_flight, max_groups_in_flight)
+
+    while in_flight:
+        wait_for_confirmation(algod, in_flight.popleft())
+    return plan
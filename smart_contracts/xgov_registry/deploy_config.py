@@ -1,8 +1,12 @@
 import base64
+import json
 import logging
 import os
 import random
+from collections.abc import Callable, Mapping
+from http import HTTPStatus
 from pathlib import Path
+from typing import cast
 
 from algokit_utils import (
     AlgoAmount,
@@ -15,21 +19,25 @@ from algokit_utils import (
     SigningAccount,
 )
 from algosdk import encoding
-from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.error import AlgodHTTPError
 from algosdk.transaction import Multisig
 from dotenv import load_dotenv
 
 from smart_contracts.artifacts.proposal.proposal_client import ProposalFactory
 from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    GlobalStateValue,
     XGovRegistryClient,
+    XGovRegistryComposer,
 )
+from smart_contracts.xgov_registry.committee_assign import parse_committee_members
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
 from smart_contracts.xgov_registry.committee_publish import (
+    load_committee_entry,
     resolve_mainnet_committee_values,
     resolve_testnet_committee_values,
 )
-from smart_contracts.xgov_registry.helpers import (
-    load_proposal_contract_data_size_per_transaction,
-)
+from smart_contracts.xgov_registry.helpers import plan_proposal_program_upload
 from smart_contracts.xgov_registry.vault_tx_signer import (
     HashicorpVaultMultisigTransactionSigner,
     TransitSecretEngine,
@@ -60,9 +68,9 @@ def _get_environment_or_localnet_deployer(
     return algorand_client.account.from_environment("DEPLOYER")
 
 
-def _create_vault_signer_from_env() -> (
-    tuple[HashicorpVaultMultisigTransactionSigner | None, str, SigningAccount]
-):
+def _create_vault_signer_from_env(
+    algorand_client: AlgorandClient,
+) -> tuple[HashicorpVaultMultisigTransactionSigner | None, str, SigningAccount]:
     """Helper function to create vault multisig signer from environment variables.
 
     Creates a 1-of-2 multisig where:
@@ -90,7 +98,6 @@ def _create_vault_signer_from_env() -> (
     - deployer_address is the multisig address to use for deployment
     - deployer_account is the AlgoKit account object or None if using vault
     """
-    algorand_client = AlgorandClient.from_environment()
     gh_deployer = _get_environment_or_localnet_deployer(algorand_client)
 
     try:
@@ -186,7 +193,7 @@ def _get_registry_app_client_by_creator_and_name(
     algorand_client: AlgorandClient,
     *,
     deployer_address: str,
-    signer: AccountTransactionSigner | HashicorpVaultMultisigTransactionSigner,
+    signer: TransactionSigner,
     creator_address: str,
 ) -> XGovRegistryClient:
     from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
@@ -206,23 +213,123 @@ def _get_registry_app_client_by_creator_and_name(
     )
 
 
-def _declare_committee(algorand_client: AlgorandClient) -> None:
+class _DeploySession:
+    """
+    State shared by the deploy commands run in the same process.
+
+    The Algorand client, the admin signer, the resolved xGov Registry app client
+    and its global state are created once and reused by every command. Admin
+    commands that do not depend on each other's on-chain effects append their
+    calls to a shared atomic group, sent by `flush`.
+    """
+
+    def __init__(self, algorand_client: AlgorandClient) -> None:
+        self.algorand_client = algorand_client
+        self._admin: tuple[str, SigningAccount, TransactionSigner] | None = None
+        self._app_client: XGovRegistryClient | None = None
+        self._global_state: GlobalStateValue | None = None
+        self._group: XGovRegistryComposer | None = None
+        self._funded: set[str] = set()
+
+    def admin(self) -> tuple[str, SigningAccount, TransactionSigner]:
+        """
+        Returns the admin (deployer) address, the environment deployer account and
+        the admin signer, using the Vault multisig signer if available.
+        """
+        if self._admin is None:
+            vault_signer, deployer_address, gh_deployer = _create_vault_signer_from_env(
+                self.algorand_client
+            )
+            signer = vault_signer if vault_signer else gh_deployer.signer
+            self._admin = (deployer_address, gh_deployer, signer)
+        return self._admin
+
+    def ensure_funded(self, address: str) -> None:
+        if address in self._funded:
+            return
+        self.algorand_client.account.ensure_funded_from_environment(
+            account_to_fund=address, min_spending_balance=deployer_min_spending
+        )
+        self._funded.add(address)
+
+    def app_client(self) -> XGovRegistryClient:
+        """
+        Returns the xGov Registry app client, resolved by creator and name once.
+        Calls must set their sender and signer explicitly.
+        """
+        if self._app_client is None:
+            deployer = _get_environment_or_localnet_deployer(self.algorand_client)
+            self._app_client = _get_registry_app_client_by_creator_and_name(
+                self.algorand_client,
+                deployer_address=deployer.address,
+                signer=deployer.signer,
+                creator_address=deployer.address,
+            )
+        return self._app_client
+
+    def set_app_client(self, app_client: XGovRegistryClient) -> None:
+        self._app_client = app_client
+        self._global_state = None
+
+    def global_state(self) -> GlobalStateValue:
+        """Returns the xGov Registry global state, read once until the next send"""
+        if self._global_state is None:
+            self._global_state = self.app_client().state.global_state.get_all()
+        return self._global_state
+
+    def invalidate_state(self) -> None:
+        self._global_state = None
+
+    def group(self) -> XGovRegistryComposer:
+        """Returns the pending admin atomic group, creating it if needed"""
+        if self._group is None:
+            self._group = self.app_client().new_group()
+        return self._group
+
+    def flush(self) -> None:
+        """Sends the pending admin atomic group, if any"""
+        if self._group is None:
+            return
+        group, self._group = self._group, None
+        try:
+            group.send()
+        except Exception as e:
+            logger.error(f"Failed to send admin group: {e}")
+            raise
+        finally:
+            self.invalidate_state()
+        logger.info("Admin group sent successfully")
+
+
+def _declare_committee(session: _DeploySession) -> None:
     from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
         DeclareCommitteeArgs,
+        DeclareCommitteeWithRootArgs,
     )
 
+    algorand_client = session.algorand_client
     deployer_address, deployer = _create_deployer_signer_from_env(algorand_client)
     signer = deployer.signer
 
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer_address,
-        min_spending_balance=deployer_min_spending,
-    )
+    session.ensure_funded(deployer_address)
 
     expected_target_anchor = int(os.environ["XGOV_REG_EXPECTED_TARGET_ANCHOR"])
-    committee_id_b64 = os.environ["XGOV_REG_COMMITTEE_ID_B64"]
-    committee_total_members = os.environ["XGOV_REG_COMMITTEE_TOTAL_MEMBERS"]
-    committee_total_votes = os.environ["XGOV_REG_COMMITTEE_TOTAL_VOTES"]
+    committee_total_members: str | int
+    committee_total_votes: str | int
+    # Optional local committee index document, to look the committee up by anchor
+    if committee_index_file := os.environ.get(
+        "XGOV_REG_COMMITTEE_INDEX_FILE", ""
+    ).strip():
+        committee_entry = load_committee_entry(
+            committee_index_file, expected_target_anchor
+        )
+        committee_id_b64 = committee_entry.committee_id_b64
+        committee_total_members = committee_entry.total_members
+        committee_total_votes = committee_entry.total_votes
+    else:
+        committee_id_b64 = os.environ["XGOV_REG_COMMITTEE_ID_B64"]
+        committee_total_members = os.environ["XGOV_REG_COMMITTEE_TOTAL_MEMBERS"]
+        committee_total_votes = os.environ["XGOV_REG_COMMITTEE_TOTAL_VOTES"]
 
     if algorand_client.client.is_testnet() or algorand_client.client.is_localnet():
         committee_id, total_members, total_votes = resolve_testnet_committee_values(
@@ -237,24 +344,35 @@ def _declare_committee(algorand_client: AlgorandClient) -> None:
             total_votes=committee_total_votes,
         )
 
-    app_client = _get_registry_app_client_by_creator_and_name(
-        algorand_client,
-        deployer_address=deployer_address,
-        signer=signer,
-        creator_address=deployer.address,
-    )
+    # Optional ARC-86 committee document, to declare the committee Merkle root
+    committee_tree = None
+    if committee_file := os.environ.get("XGOV_REG_COMMITTEE_FILE", "").strip():
+        committee = cast(
+            Mapping[str, object], json.loads(Path(committee_file).read_text())
+        )
+        committee_tree = CommitteeMerkleTree(parse_committee_members(committee))
+        if (committee_tree.size, committee_tree.votes) != (total_members, total_votes):
+            raise ValueError(
+                f"Committee file has {committee_tree.size} members and "
+                f"{committee_tree.votes} votes, expected {total_members} members and "
+                f"{total_votes} votes"
+            )
+
+    app_client = session.app_client()
 
-    current_state = app_client.state.global_state
-    current_committee_last_anchor = current_state.committee_last_anchor or 0
+    current_state = session.global_state()
+    current_committee_last_anchor = current_state.get("committee_last_anchor") or 0
     if current_committee_last_anchor >= expected_target_anchor:
         raise ValueError(
             "Registry committee_last_anchor is already at or beyond the expected target anchor"
         )
-    if current_state.max_committee_size is None:
+    max_committee_size = current_state.get("max_committee_size")
+    if max_committee_size is None:
         raise ValueError("Registry max_committee_size is not configured")
-    if total_members > current_state.max_committee_size:
+    # The xGov Registry bounds committees with a root by the voted bitmap MBR
+    if committee_tree is None and total_members > max_committee_size:
         raise ValueError(
-            f"Committee members {total_members} exceed max_committee_size {current_state.max_committee_size}"
+            f"Committee members {total_members} exceed max_committee_size {max_committee_size}"
         )
 
     logger.info(
@@ -264,24 +382,90 @@ def _declare_committee(algorand_client: AlgorandClient) -> None:
         total_members,
         total_votes,
     )
-    app_client.send.declare_committee(
-        args=DeclareCommitteeArgs(
-            committee_id=committee_id,
-            size=total_members,
-            votes=total_votes,
-        ),
-        params=CommonAppCallParams(
-            sender=deployer_address,
-            signer=signer,
-        ),
-    )
+    params = CommonAppCallParams(sender=deployer_address, signer=signer)
+    if committee_tree is None:
+        app_client.send.declare_committee(
+            args=DeclareCommitteeArgs(
+                committee_id=committee_id,
+                size=total_members,
+                votes=total_votes,
+            ),
+            params=params,
+        )
+    else:
+        logger.info(
+            "Declaring committee root %s",
+            base64.b64encode(committee_tree.root).decode(),
+        )
+        app_client.send.declare_committee_with_root(
+            args=DeclareCommitteeWithRootArgs(
+                committee_id=committee_id,
+                size=total_members,
+                votes=total_votes,
+                committee_root=committee_tree.root,
+            ),
+            params=params,
+        )
+    session.invalidate_state()
     logger.info("Committee successfully declared")
 
 
-def _deploy_xgov_registry(algorand_client: AlgorandClient) -> None:
+def _get_proposal_program_box(app_client: XGovRegistryClient) -> bytes | None:
+    try:
+        return app_client.state.box.proposal_approval_program
+    except AlgodHTTPError as exc:  # type: ignore[misc]
+        # The xGov Registry exists, so a missing resource is the box
+        if exc.code == HTTPStatus.NOT_FOUND:  # type: ignore[misc]
+            return None
+        raise
+
+
+def _upload_proposal_program(
+    app_client: XGovRegistryClient,
+    *,
+    program: bytes,
+    sender: str,
+    signer: TransactionSigner,
+) -> None:
+    """
+    Uploads the Proposal Approval Program to the xGov Registry box, re-sending
+    only the chunks that differ from the current box content, packed in atomic
+    groups.
+    """
     from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
-        ConfigXgovRegistryArgs,
         InitProposalContractArgs,
+        LoadProposalContractArgs,
+    )
+
+    plan = plan_proposal_program_upload(program, _get_proposal_program_box(app_client))
+    if not plan.transaction_count:
+        logger.info("proposal approval program is up to date")
+        return
+
+    params = CommonAppCallParams(sender=sender, signer=signer)
+    groups = plan.groups()
+    logger.info(
+        f"uploading {len(plan.chunks)} proposal approval program chunk(s) "
+        f"in {len(groups)} group(s)"
+    )
+    for init_size, chunks in groups:
+        group = app_client.new_group()
+        if init_size is not None:
+            group.init_proposal_contract(
+                args=InitProposalContractArgs(size=init_size),
+                params=params,
+            )
+        for offset, data in chunks:
+            group.load_proposal_contract(
+                args=LoadProposalContractArgs(offset=offset, data=data),
+                params=params,
+            )
+        group.send()
+
+
+def _deploy_xgov_registry(session: _DeploySession) -> None:
+    from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+        ConfigXgovRegistryArgs,
         SetCommitteeManagerArgs,
         SetKycProviderArgs,
         SetPayorArgs,
@@ -295,13 +479,9 @@ def _deploy_xgov_registry(algorand_client: AlgorandClient) -> None:
         XGovRegistryMethodCallUpdateParams,
     )
 
-    # Try to create Vault signer first, fallback to environment if not available
-    vault_signer, deployer_address, gh_deployer = _create_vault_signer_from_env()
-    signer = vault_signer if vault_signer else gh_deployer.signer
-
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer_address, min_spending_balance=deployer_min_spending
-    )
+    algorand_client = session.algorand_client
+    deployer_address, gh_deployer, signer = session.admin()
+    session.ensure_funded(deployer_address)
 
     template_values = {"entropy": b""}
 
@@ -365,6 +545,7 @@ def _deploy_xgov_registry(algorand_client: AlgorandClient) -> None:
         ),
         existing_deployments=existing_deployments,
     )
+    session.set_app_client(app_client)
 
     logger.info("uploading proposal approval program to box")
 
@@ -378,30 +559,13 @@ def _deploy_xgov_registry(algorand_client: AlgorandClient) -> None:
     )
 
     compiled_proposal = proposal_factory.app_factory.compile()
-    app_client.send.init_proposal_contract(
-        args=InitProposalContractArgs(
-            size=len(compiled_proposal.approval_program),
-        ),
-        params=CommonAppCallParams(
-            sender=deployer_address,
-            signer=signer,
-        ),
+    _upload_proposal_program(
+        app_client,
+        program=compiled_proposal.approval_program,
+        sender=deployer_address,
+        signer=signer,
     )
 
-    data_size_per_transaction = load_proposal_contract_data_size_per_transaction()
-    bulks = 1 + len(compiled_proposal.approval_program) // data_size_per_transaction
-    for i in range(bulks):
-        chunk = compiled_proposal.approval_program[
-            i * data_size_per_transaction : (i + 1) * data_size_per_transaction
-        ]
-        app_client.send.load_proposal_contract(
-            args=(i * data_size_per_transaction, chunk),
-            params=CommonAppCallParams(
-                sender=deployer_address,
-                signer=signer,
-            ),
-        )
-
     should_set_roles = os.environ.get("XGOV_REG_SET_ROLES", "false").lower() == "true"
     if should_set_roles:
         test_admin = os.environ["TEST_ADMIN"]
@@ -520,7 +684,7 @@ def _deploy_xgov_registry(algorand_client: AlgorandClient) -> None:
         logger.info("Skipping xGov registry configuration as requested")
 
 
-def _set_roles(algorand_client: AlgorandClient) -> None:
+def _set_roles(session: _DeploySession) -> None:
     from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
         SetCommitteeManagerArgs,
         SetKycProviderArgs,
@@ -531,22 +695,11 @@ def _set_roles(algorand_client: AlgorandClient) -> None:
         SetXgovSubscriberArgs,
     )
 
-    # Try to create Vault signer first, fallback to environment if not available
-    vault_signer, deployer_address, gh_deployer = _create_vault_signer_from_env()
-    signer = vault_signer if vault_signer else gh_deployer.signer
+    deployer_address, _, signer = session.admin()
+    session.ensure_funded(deployer_address)
 
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer_address, min_spending_balance=deployer_min_spending
-    )
-
-    app_client = _get_registry_app_client_by_creator_and_name(
-        algorand_client,
-        deployer_address=deployer_address,
-        signer=signer,
-        creator_address=gh_deployer.address,
-    )
-
-    roles_group = app_client.new_group()
+    # Sent by the session, possibly together with other admin commands
+    roles_group = session.group()
 
     if xgov_manager := os.environ.get("XGOV_REG_SET_ROLES_XGOV_MANAGER"):
         roles_group.set_xgov_manager(
@@ -604,37 +757,19 @@ def _set_roles(algorand_client: AlgorandClient) -> None:
                 signer=signer,
             ),
         )
-
-    try:
-        roles_group.send()
-        logger.info("Roles successfully set using roles_group.send()")
-    except Exception as e:
-        logger.error(f"Failed to set roles using roles_group.send(): {e}")
-        raise
+    logger.info("Roles added to the admin group")
 
 
-def _configure_xgov_registry(algorand_client: AlgorandClient) -> None:
+def _configure_xgov_registry(session: _DeploySession) -> None:
     from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
         ConfigXgovRegistryArgs,
         XGovRegistryConfig,
     )
 
-    # Try to create Vault signer first, fallback to environment if not available
-    vault_signer, deployer_address, gh_deployer = _create_vault_signer_from_env()
-    signer = vault_signer if vault_signer else gh_deployer.signer
-
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer_address, min_spending_balance=deployer_min_spending
-    )
-
-    app_client = _get_registry_app_client_by_creator_and_name(
-        algorand_client,
-        deployer_address=deployer_address,
-        signer=signer,
-        creator_address=gh_deployer.address,
-    )
+    deployer_address, _, signer = session.admin()
+    session.ensure_funded(deployer_address)
 
-    current_state = app_client.state.global_state
+    current_state = session.global_state()
 
     # Helper function to parse comma-separated integers with fallback to defaults
     def parse_comma_separated_ints(env_var_name: str, defaults: list[int]) -> list[int]:
@@ -663,60 +798,60 @@ def _configure_xgov_registry(algorand_client: AlgorandClient) -> None:
     max_requested_amounts = parse_comma_separated_ints(
         "XGOV_CFG_MAX_REQUESTED_AMOUNT",
         [
-            current_state.max_requested_amount_small,
-            current_state.max_requested_amount_medium,
-            current_state.max_requested_amount_large,
+            current_state["max_requested_amount_small"],
+            current_state["max_requested_amount_medium"],
+            current_state["max_requested_amount_large"],
         ],
     )
     discussion_durations = parse_comma_separated_ints(
         "XGOV_CFG_DISCUSSION_DURATION",
         [
-            current_state.discussion_duration_small,
-            current_state.discussion_duration_medium,
-            current_state.discussion_duration_large,
-            current_state.discussion_duration_xlarge,
+            current_state["discussion_duration_small"],
+            current_state["discussion_duration_medium"],
+            current_state["discussion_duration_large"],
+            current_state["discussion_duration_xlarge"],
         ],
     )
     voting_durations = parse_comma_separated_ints(
         "XGOV_CFG_VOTING_DURATION",
         [
-            current_state.voting_duration_small,
-            current_state.voting_duration_medium,
-            current_state.voting_duration_large,
-            current_state.voting_duration_xlarge,
+            current_state["voting_duration_small"],
+            current_state["voting_duration_medium"],
+            current_state["voting_duration_large"],
+            current_state["voting_duration_xlarge"],
         ],
     )
     quorums = parse_comma_separated_ints(
         "XGOV_CFG_QUORUM",
         [
-            current_state.quorum_small,
-            current_state.quorum_medium,
-            current_state.quorum_large,
+            current_state["quorum_small"],
+            current_state["quorum_medium"],
+            current_state["quorum_large"],
         ],
     )
     weighted_quorums = parse_comma_separated_ints(
         "XGOV_CFG_WEIGHTED_QUORUM",
         [
-            current_state.weighted_quorum_small,
-            current_state.weighted_quorum_medium,
-            current_state.weighted_quorum_large,
+            current_state["weighted_quorum_small"],
+            current_state["weighted_quorum_medium"],
+            current_state["weighted_quorum_large"],
         ],
     )
 
     config = XGovRegistryConfig(
-        xgov_fee=parse_int("XGOV_CFG_XGOV_FEE", current_state.xgov_fee),
-        proposer_fee=parse_int("XGOV_CFG_PROPOSER_FEE", current_state.proposer_fee),
+        xgov_fee=parse_int("XGOV_CFG_XGOV_FEE", current_state["xgov_fee"]),
+        proposer_fee=parse_int("XGOV_CFG_PROPOSER_FEE", current_state["proposer_fee"]),
         open_proposal_fee=parse_int(
-            "XGOV_CFG_OPEN_PROPOSAL_FEE", current_state.open_proposal_fee
+            "XGOV_CFG_OPEN_PROPOSAL_FEE", current_state["open_proposal_fee"]
         ),
         daemon_ops_funding_bps=parse_int(
-            "XGOV_CFG_DAEMON_OPS_FUNDING_BPS", current_state.daemon_ops_funding_bps
+            "XGOV_CFG_DAEMON_OPS_FUNDING_BPS", current_state["daemon_ops_funding_bps"]
         ),
         proposal_commitment_bps=parse_int(
-            "XGOV_CFG_PROPOSAL_COMMITMENT_BPS", current_state.proposal_commitment_bps
+            "XGOV_CFG_PROPOSAL_COMMITMENT_BPS", current_state["proposal_commitment_bps"]
         ),
         min_requested_amount=parse_int(
-            "XGOV_CFG_MIN_REQUESTED_AMOUNT", current_state.min_requested_amount
+            "XGOV_CFG_MIN_REQUESTED_AMOUNT", current_state["min_requested_amount"]
         ),
         max_requested_amount=(
             max_requested_amounts[0],
@@ -742,48 +877,32 @@ def _configure_xgov_registry(algorand_client: AlgorandClient) -> None:
             weighted_quorums[2],
         ),
         absence_tolerance=parse_int(
-            "XGOV_CFG_ABSENCE_TOLERANCE", current_state.absence_tolerance
+            "XGOV_CFG_ABSENCE_TOLERANCE", current_state["absence_tolerance"]
         ),
         governance_period=parse_int(
-            "XGOV_CFG_GOVERNANCE_PERIOD", current_state.governance_period
+            "XGOV_CFG_GOVERNANCE_PERIOD", current_state["governance_period"]
         ),
         committee_grace_period=parse_int(
-            "XGOV_CFG_COMMITTEE_GRACE_PERIOD", current_state.committee_grace_period
+            "XGOV_CFG_COMMITTEE_GRACE_PERIOD", current_state["committee_grace_period"]
         ),
     )
 
     logger.info(f"Configuring xGov registry with: {config}")
-    try:
-        app_client.send.config_xgov_registry(
-            args=ConfigXgovRegistryArgs(
-                config=config,
-            ),
-            params=CommonAppCallParams(
-                sender=deployer_address,
-                signer=signer,
-            ),
-        )
-        logger.info("xGov registry configured successfully")
-    except Exception as e:
-        logger.error(f"Failed to configure xGov registry: {e}")
-        raise
-
-
-def _pause_or_resume(algorand_client: AlgorandClient) -> None:
-    # Try to create Vault signer first, fallback to environment if not available
-    vault_signer, deployer_address, gh_deployer = _create_vault_signer_from_env()
-    signer = vault_signer if vault_signer else gh_deployer.signer
-
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer_address, min_spending_balance=deployer_min_spending
+    # Sent by the session, possibly together with other admin commands
+    session.group().config_xgov_registry(
+        args=ConfigXgovRegistryArgs(
+            config=config,
+        ),
+        params=CommonAppCallParams(
+            sender=deployer_address,
+            signer=signer,
+        ),
     )
 
-    app_client = _get_registry_app_client_by_creator_and_name(
-        algorand_client,
-        deployer_address=deployer_address,
-        signer=signer,
-        creator_address=gh_deployer.address,
-    )
+
+def _pause_or_resume(session: _DeploySession) -> None:
+    deployer_address, _, signer = session.admin()
+    session.ensure_funded(deployer_address)
 
     pause_proposals = (
         os.environ.get("XGOV_REG_PAUSE_PROPOSALS", "false").lower() == "true"
@@ -797,67 +916,60 @@ def _pause_or_resume(algorand_client: AlgorandClient) -> None:
     resume_registry = (
         os.environ.get("XGOV_REG_RESUME_REGISTRY", "false").lower() == "true"
     )
-    try:
-        group = app_client.new_group()
-        if pause_proposals:
-            logger.info("Pausing proposals")
-            group.pause_proposals(
-                params=CommonAppCallParams(
-                    sender=deployer_address,
-                    signer=signer,
-                ),
-            )
-        if resume_proposals:
-            logger.info("Resuming proposals")
-            group.resume_proposals(
-                params=CommonAppCallParams(
-                    sender=deployer_address,
-                    signer=signer,
-                ),
-            )
-        if pause_registry:
-            logger.info("Pausing registry")
-            group.pause_registry(
-                params=CommonAppCallParams(
-                    sender=deployer_address,
-                    signer=signer,
-                ),
-            )
-        if resume_registry:
-            logger.info("Resuming registry")
-            group.resume_registry(
-                params=CommonAppCallParams(
-                    sender=deployer_address,
-                    signer=signer,
-                ),
-            )
-        group.send()
-        logger.info("Pause/Resume operations completed successfully")
-    except Exception as e:
-        logger.error(f"Failed to pause/resume: {e}")
-        raise
+    # Sent by the session, possibly together with other admin commands
+    group = session.group()
+    if pause_proposals:
+        logger.info("Pausing proposals")
+        group.pause_proposals(
+            params=CommonAppCallParams(
+                sender=deployer_address,
+                signer=signer,
+            ),
+        )
+    if resume_proposals:
+        logger.info("Resuming proposals")
+        group.resume_proposals(
+            params=CommonAppCallParams(
+                sender=deployer_address,
+                signer=signer,
+            ),
+        )
+    if pause_registry:
+        logger.info("Pausing registry")
+        group.pause_registry(
+            params=CommonAppCallParams(
+                sender=deployer_address,
+                signer=signer,
+            ),
+        )
+    if resume_registry:
+        logger.info("Resuming registry")
+        group.resume_registry(
+            params=CommonAppCallParams(
+                sender=deployer_address,
+                signer=signer,
+            ),
+        )
+    logger.info("Pause/Resume operations added to the admin group")
 
 
-def _delete_test_deployment(algorand_client: AlgorandClient) -> None:
+def _delete_test_deployment(session: _DeploySession) -> None:
     import base64
 
     from algokit_utils import AppDeleteParams, AppUpdateParams
     from algosdk.transaction import OnComplete
 
+    algorand_client = session.algorand_client
     if algorand_client.client.is_mainnet():
         raise ValueError("Cannot delete deployments on MainNet")
 
-    _load_network_env(algorand_client)
-
     logger.info("Deleting test deployment")
 
     deployer = algorand_client.account.from_environment("DEPLOYER")
 
     logger.info(f"Deployer address: {deployer.address}")
 
-    algorand_client.account.ensure_funded_from_environment(
-        account_to_fund=deployer, min_spending_balance=deployer_min_spending
-    )
+    session.ensure_funded(deployer.address)
 
     try:
         stable_deployment_id = int(os.environ["XGOV_REGISTRY_APP_ID"])
@@ -920,26 +1032,53 @@ def _load_network_env(algorand_client: AlgorandClient) -> None:
         load_dotenv(REPO_ROOT / ".env.testnet", override=True)
 
 
+# Commands appending their calls to the session admin group instead of sending them
+_GROUPED_COMMANDS = frozenset(
+    {"set_roles", "configure_xgov_registry", "pause_or_resume"}
+)
+
+_COMMANDS: dict[str, Callable[[_DeploySession], None]] = {
+    "deploy": _deploy_xgov_registry,
+    "set_roles": _set_roles,
+    "configure_xgov_registry": _configure_xgov_registry,
+    "pause_or_resume": _pause_or_resume,
+    "declare_committee": _declare_committee,
+    "delete_test_deployment": _delete_test_deployment,
+}
+
+# Suggested params are reused across the commands of a session
+SESSION_SUGGESTED_PARAMS_CACHE_TIMEOUT_MS = 60_000
+
+
 def deploy() -> None:
+    """
+    Runs the comma-separated list of commands in XGOV_REG_DEPLOY_COMMAND, in order,
+    in a single session (e.g. `deploy,set_roles,configure_xgov_registry`).
+
+    Consecutive `set_roles`, `configure_xgov_registry` and `pause_or_resume`
+    commands are sent in the same atomic group.
+    """
     algorand_client = AlgorandClient.from_environment()
     _load_network_env(algorand_client)
     command = os.environ.get("XGOV_REG_DEPLOY_COMMAND")
     logger.info(f"XGOV_REG_DEPLOY_COMMAND: {command}")
     algorand_client.set_default_validity_window(100)
-    if command == "deploy":
-        _deploy_xgov_registry(algorand_client)
-    elif command == "set_roles":
-        _set_roles(algorand_client)
-    elif command == "configure_xgov_registry":
-        _configure_xgov_registry(algorand_client)
-    elif command == "pause_or_resume":
-        _pause_or_resume(algorand_client)
-    elif command == "declare_committee":
-        _declare_committee(algorand_client)
-    elif command == "delete_test_deployment":
-        _delete_test_deployment(algorand_client)
-    else:
+    algorand_client.set_suggested_params_cache_timeout(
+        SESSION_SUGGESTED_PARAMS_CACHE_TIMEOUT_MS
+    )
+
+    commands = [c.strip() for c in (command or "").split(",") if c.strip()]
+    unknown_commands = [c for c in commands if c not in _COMMANDS]
+    if not commands or unknown_commands:
         raise ValueError(
             f"Unknown command: {command}. Valid commands are: deploy, set_roles, configure_xgov_registry, "
             f"pause_or_resume, declare_committee, delete_test_deployment"
         )
+
+    session = _DeploySession(algorand_client)
+    for name in commands:
+        if name not in _GROUPED_COMMANDS:
+            session.flush()
+        logger.info(f"Running deploy command: {name}")
+        _COMMANDS[name](session)
+    session.flush()
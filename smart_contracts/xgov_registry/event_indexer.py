@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol, TypedDict, cast
+
+import msgpack  # type: ignore[import-untyped]
+from algosdk import abi
+from algosdk.v2client.algod import AlgodClient
+
+ARTIFACTS_PATH = Path(__file__).resolve().parents[1] / "artifacts"
+XGOV_REGISTRY_ARC56_PATH = ARTIFACTS_PATH / "xgov_registry" / "XGovRegistry.arc56.json"
+PROPOSAL_ARC56_PATH = ARTIFACTS_PATH / "proposal" / "Proposal.arc56.json"
+
+REGISTRY = "registry"
+PROPOSAL = "proposal"
+
+DEFAULT_BATCH_ROUNDS = 100
+DEFAULT_PREFETCH_WORKERS = 8
+
+SELECTOR_LENGTH = 4
+BLOCK_FILE_SUFFIX = ".msgpack"
+
+# Columns shared by every event table, the event arguments follow
+EVENT_COLUMNS = ("confirmed_round", "txn_path", "log_index", "app_id")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexer_checkpoint (
+    registry_app_id INTEGER PRIMARY KEY,
+    last_round INTEGER NOT NULL
+);
+"""
+
+
+class Arc56EventArg(TypedDict):
+    name: str
+    type: str
+
+
+class Arc56Event(TypedDict):
+    name: str
+    args: list[Arc56EventArg]
+
+
+class Arc56Spec(TypedDict):
+    """Subset of an ARC-56 spec read by the indexer"""
+
+    events: list[Arc56Event]
+
+
+# Subset of the algod msgpack block fields read by the indexer
+
+
+class BlockTxn(TypedDict, total=False):
+    apid: int
+
+
+class ApplyData(TypedDict, total=False):
+    lg: list[bytes]
+    itx: list[SignedTxnInBlock]
+
+
+class SignedTxnInBlock(TypedDict, total=False):
+    txn: BlockTxn
+    apid: int
+    dt: ApplyData
+
+
+class Block(TypedDict, total=False):
+    rnd: int
+    txns: list[SignedTxnInBlock]
+
+
+NodeStatus = TypedDict("NodeStatus", {"last-round": int})
+
+
+@dataclass(frozen=True)
+class EventSpec:
+    contract: str
+    name: str
+    arg_names: tuple[str, ...]
+    arg_types: tuple[str, ...]
+    selector: bytes
+    codec: abi.TupleType = field(compare=False)
+
+    @property
+    def table(self) -> str:
+        snake_name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", self.name).lower()
+        return f"{self.contract}_{snake_name}"
+
+    def decode(self, payload: bytes) -> dict[str, object]:
+        values = cast(list[object], self.codec.decode(payload))
+        return {
+            name: _column_value(arg_type, value)
+            for name, arg_type, value in zip(
+                self.arg_names, self.arg_types, values, strict=True
+            )
+        }
+
+
+@dataclass(frozen=True)
+class IndexedEvent:
+    spec: EventSpec
+    confirmed_round: int
+    txn_path: str
+    log_index: int
+    app_id: int
+    args: dict[str, object]
+
+    def row(self) -> tuple[object, ...]:
+        return (
+            self.confirmed_round,
+            self.txn_path,
+            self.log_index,
+            self.app_id,
+            *self.args.values(),
+        )
+
+
+def _column_value(arg_type: str, value: object) -> object:
+    if arg_type == "bool":
+        return int(cast(bool, value))
+    if arg_type.startswith("byte["):
+        return bytes(cast(list[int], value))
+    return value
+
+
+def _column_type(arg_type: str) -> str:
+    if arg_type == "bool" or arg_type.startswith("uint"):
+        return "INTEGER"
+    if arg_type in ("address", "string"):
+        return "TEXT"
+    return "BLOB"
+
+
+def load_event_specs(arc56_path: Path, contract: str) -> dict[bytes, EventSpec]:
+    """
+    Loads the ARC-28 events declared in an ARC-56 spec, keyed by selector (the
+    first 4 bytes of the SHA-512/256 of the event signature).
+    """
+    arc56 = cast(Arc56Spec, json.loads(arc56_path.read_text()))
+    specs: dict[bytes, EventSpec] = {}
+    for event in arc56["events"]:
+        arg_names = tuple(arg["name"] for arg in event["args"])
+        arg_types = tuple(arg["type"] for arg in event["args"])
+        signature = f"{event['name']}({','.join(arg_types)})"
+        selector = hashlib.new("sha512_256", signature.encode()).digest()[
+            :SELECTOR_LENGTH
+        ]
+        codec = abi.ABIType.from_string(f"({','.join(arg_types)})")
+        specs[selector] = EventSpec(
+            contract=contract,
+            name=event["name"],
+            arg_names=arg_names,
+            arg_types=arg_types,
+            selector=selector,
+            codec=cast(abi.TupleType, codec),
+        )
+    return specs
+
+
+def _decode_map_keys(pairs: list[tuple[object, object]]) -> dict[object, object]:
+    # Field names are ASCII, state keys are arbitrary bytes (kept lossless)
+    return {
+        key.decode(errors="surrogateescape") if isinstance(key, bytes) else key: value
+        for key, value in pairs
+    }
+
+
+def decode_block(raw_block: bytes) -> Block:
+    """
+    Decodes an algod msgpack block response. Values are kept raw (logs are
+    msgpack strings of arbitrary bytes), map keys are decoded.
+    """
+    response: object = msgpack.unpackb(  # type: ignore[misc]
+        raw_block,
+        raw=True,
+        strict_map_key=False,
+        object_pairs_hook=_decode_map_keys,
+    )
+    return cast(dict[str, Block], response)["block"]
+
+
+def iter_app_logs(block: Block) -> Iterator[tuple[str, int, Sequence[bytes]]]:
+    """
+    Walks the block transactions (inner transactions included, depth first) and
+    yields the `(txn_path, app_id, logs)` of each application call with logs.
+
+    The `txn_path` is the transaction index in the block, followed by the inner
+    transaction indexes (e.g. `3/0/1`).
+    """
+    stack: list[tuple[str, SignedTxnInBlock]] = [
+        (str(index), stib) for index, stib in enumerate(block.get("txns", []))
+    ]
+    stack.reverse()
+    while stack:
+        path, stib = stack.pop()
+        txn: BlockTxn = stib.get("txn", {})
+        apply_data: ApplyData = stib.get("dt", {})
+        # Application creations have the new ID in the apply data
+        app_id = txn.get("apid") or stib.get("apid", 0)
+        logs = apply_data.get("lg", [])
+        if app_id and logs:
+            yield path, app_id, logs
+        inners = apply_data.get("itx", [])
+        stack.extend(
+            (f"{path}/{index}", inner)
+            for index, inner in reversed(list(enumerate(inners)))
+        )
+
+
+class BlockSource(Protocol):
+    def last_round(self) -> int: ...
+
+    def block(self, round_number: int) -> bytes:
+        """Returns the msgpack encoded block response of a round"""
+        ...
+
+
+class AlgodBlockSource:
+    def __init__(self, algod_client: AlgodClient) -> None:
+        self.algod_client = algod_client
+
+    def last_round(self) -> int:
+        status = cast(NodeStatus, self.algod_client.status())
+        return int(status["last-round"])
+
+    def block(self, round_number: int) -> bytes:
+        return cast(
+            bytes,
+            self.algod_client.block_info(round_number, response_format="msgpack"),
+        )
+
+
+class RecordedBlockSource:
+    """Blocks recorded as `<round>.msgpack` files (see `record_blocks`)"""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def last_round(self) -> int:
+        rounds = [
+            int(path.stem) for path in self.directory.glob(f"*{BLOCK_FILE_SUFFIX}")
+        ]
+        if not rounds:
+            raise ValueError(f"no recorded block in {self.directory}")
+        return max(rounds)
+
+    def block(self, round_number: int) -> bytes:
+        return (self.directory / f"{round_number}{BLOCK_FILE_SUFFIX}").read_bytes()
+
+
+def record_blocks(
+    source: BlockSource, rounds: Iterable[int], directory: str | Path
+) -> None:
+    """Records blocks of a source as fixtures for a `RecordedBlockSource`"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for round_number in rounds:
+        (directory / f"{round_number}{BLOCK_FILE_SUFFIX}").write_bytes(
+            source.block(round_number)
+        )
+
+
+def open_database(path: str | Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class EventIndexer:
+    """
+    Incremental indexer of the xGov Registry and Proposal ARC-28 events into
+    SQLite, one table per event.
+
+    The Proposals are discovered from the Registry `NewProposal` events, so blocks
+    must be indexed in order. The checkpoint (last indexed round) is committed in
+    the same transaction as the events of a batch, so an interrupted sync resumes
+    from the last committed batch.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        registry_app_id: int,
+        *,
+        registry_arc56_path: Path = XGOV_REGISTRY_ARC56_PATH,
+        proposal_arc56_path: Path = PROPOSAL_ARC56_PATH,
+    ) -> None:
+        self.connection = connection
+        self.registry_app_id = registry_app_id
+        self.specs = {
+            REGISTRY: load_event_specs(registry_arc56_path, REGISTRY),
+            PROPOSAL: load_event_specs(proposal_arc56_path, PROPOSAL),
+        }
+        self._create_schema()
+        rows = cast(
+            list[tuple[int]],
+            self.connection.execute(
+                "SELECT proposal_id FROM registry_new_proposal WHERE app_id = ?",
+                (registry_app_id,),
+            ).fetchall(),
+        )
+        self.proposal_ids = {proposal_id for (proposal_id,) in rows}
+
+    def _create_schema(self) -> None:
+        statements = [SCHEMA]
+        for specs in self.specs.values():
+            for spec in specs.values():
+                columns = ", ".join(
+                    f'"{name}" {_column_type(arg_type)}'
+                    for name, arg_type in zip(
+                        spec.arg_names, spec.arg_types, strict=True
+                    )
+                )
+                statements.append(
+                    f'CREATE TABLE IF NOT EXISTS "{spec.table}" ('
+                    "confirmed_round INTEGER NOT NULL, txn_path TEXT NOT NULL, "
+                    "log_index INTEGER NOT NULL, app_id INTEGER NOT NULL, "
+                    f"{columns}, "
+                    "PRIMARY KEY (confirmed_round, txn_path, log_index));\n"
+                    f'CREATE INDEX IF NOT EXISTS "{spec.table}_app_id" '
+                    f'ON "{spec.table}" (app_id);'
+                )
+        self.connection.executescript("\n".join(statements))
+
+    @property
+    def checkpoint(self) -> int | None:
+        """Last indexed round, None if nothing has been indexed yet"""
+        row = cast(
+            tuple[int] | None,
+            self.connection.execute(
+                "SELECT last_round FROM indexer_checkpoint WHERE registry_app_id = ?",
+                (self.registry_app_id,),
+            ).fetchone(),
+        )
+        return None if row is None else row[0]
+
+    def decode_events(self, block: Block) -> list[IndexedEvent]:
+        """
+        Decodes the Registry and Proposal events of a block. Proposals created in
+        the block are tracked from their `NewProposal` event on.
+        """
+        confirmed_round = block.get("rnd", 0)
+        events: list[IndexedEvent] = []
+        for txn_path, app_id, logs in iter_app_logs(block):
+            if app_id == self.registry_app_id:
+                specs = self.specs[REGISTRY]
+            elif app_id in self.proposal_ids:
+                specs = self.specs[PROPOSAL]
+            else:
+                continue
+            for log_index, log in enumerate(logs):
+                spec = specs.get(log[:SELECTOR_LENGTH])
+                if spec is None:
+                    continue
+                event = IndexedEvent(
+                    spec=spec,
+                    confirmed_round=confirmed_round,
+                    txn_path=txn_path,
+                    log_index=log_index,
+                    app_id=app_id,
+                    args=spec.decode(log[SELECTOR_LENGTH:]),
+                )
+                if spec.contract == REGISTRY and spec.name == "NewProposal":
+                    self.proposal_ids.add(cast(int, event.args["proposal_id"]))
+                events.append(event)
+        return events
+
+    def index_blocks(self, blocks: Iterable[Block]) -> int:
+        """
+        Indexes decoded blocks (in round order) in a single transaction, moving
+        the checkpoint to the last block round.
+
+        Returns:
+            The number of indexed events
+        """
+        rows: dict[EventSpec, list[tuple[object, ...]]] = {}
+        last_round: int | None = None
+        for block in blocks:
+            for event in self.decode_events(block):
+                rows.setdefault(event.spec, []).append(event.row())
+            last_round = block.get("rnd", 0)
+        if last_round is None:
+            return 0
+
+        with self.connection:
+            for spec, spec_rows in rows.items():
+                placeholders = ", ".join(
+                    "?" * (len(EVENT_COLUMNS) + len(spec.arg_names))
+                )
+                # Re-indexed rounds are ignored
+                self.connection.executemany(
+                    f'INSERT OR IGNORE INTO "{spec.table}" VALUES ({placeholders})',
+                    spec_rows,
+                )
+            self.connection.execute(
+                "INSERT INTO indexer_checkpoint (registry_app_id, last_round) "
+                "VALUES (?, ?) ON CONFLICT (registry_app_id) "
+                "DO UPDATE SET last_round = excluded.last_round",
+                (self.registry_app_id, last_round),
+            )
+        return sum(len(spec_rows) for spec_rows in rows.values())
+
+    def sync(
+        self,
+        source: BlockSource,
+        *,
+        start_round: int = 0,
+        to_round: int | None = None,
+        batch_rounds: int = DEFAULT_BATCH_ROUNDS,
+        prefetch_workers: int = DEFAULT_PREFETCH_WORKERS,
+    ) -> int:
+        """
+        Indexes the blocks from the checkpoint (or from `start_round`, usually the
+        Registry creation round, on the first sync) up to `to_round` (default: the
+        source last round), in batches of `batch_rounds` blocks fetched by
+        `prefetch_workers` threads.
+
+        Returns:
+            The number of indexed events
+        """
+        if batch_rounds <= 0:
+            raise ValueError("batch_rounds must be greater than zero")
+        checkpoint = self.checkpoint
+        first_round = start_round if checkpoint is None else checkpoint + 1
+        last_round = source.last_round() if to_round is None else to_round
+
+        indexed = 0
+        with ThreadPoolExecutor(max_workers=prefetch_workers) as executor:
+            for batch_start in range(first_round, last_round + 1, batch_rounds):
+                rounds = range(
+                    batch_start, min(batch_start + batch_rounds, last_round + 1)
+                )
+                raw_blocks = executor.map(source.block, rounds)
+                indexed += self.index_blocks(
+                    decode_block(raw_block) for raw_block in raw_blocks
+                )
+        return indexed
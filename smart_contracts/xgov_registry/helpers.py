@@ -1,6 +1,9 @@
+from dataclasses import dataclass
+
 from smart_contracts.xgov_registry.constants import (
     DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD,
     MAX_APP_TOTAL_ARG_LEN,
+    MAX_GROUP_SIZE,
     METHOD_SELECTOR_LENGTH,
     UINT64_LENGTH,
 )
@@ -13,3 +16,80 @@ def load_proposal_contract_data_size_per_transaction() -> int:
         - UINT64_LENGTH
         - DYNAMIC_BYTE_ARRAY_LENGTH_OVERHEAD
     )
+
+
+@dataclass(frozen=True)
+class ProposalProgramUploadPlan:
+    """
+    Calls required to make the Proposal Approval Program box match a program.
+
+    Attributes:
+        init_size: Size to pass to `init_proposal_contract`, None if the box
+            already has the right size
+        chunks: `(offset, data)` arguments of the `load_proposal_contract` calls
+    """
+
+    init_size: int | None
+    chunks: tuple[tuple[int, bytes], ...]
+
+    @property
+    def transaction_count(self) -> int:
+        return (self.init_size is not None) + len(self.chunks)
+
+    def groups(
+        self, max_group_size: int = MAX_GROUP_SIZE
+    ) -> list[tuple[int | None, tuple[tuple[int, bytes], ...]]]:
+        """
+        Packs the calls into atomic groups of at most `max_group_size` transactions.
+        The init call, if any, always leads the first group.
+
+        Returns:
+            A list of `(init_size, chunks)` per group, where `init_size` is only set
+            on the first group
+        """
+        groups: list[tuple[int | None, tuple[tuple[int, bytes], ...]]] = []
+        init_size = self.init_size
+        start = 0
+        while start < len(self.chunks) or init_size is not None:
+            size = max_group_size - (init_size is not None)
+            groups.append((init_size, self.chunks[start : start + size]))
+            init_size = None
+            start += size
+        return groups
+
+
+def plan_proposal_program_upload(
+    program: bytes,
+    current: bytes | None,
+    chunk_size: int | None = None,
+) -> ProposalProgramUploadPlan:
+    """
+    Plans the upload of the Proposal Approval Program, skipping the chunks whose
+    bytes are already stored in the box.
+
+    Args:
+        program: Compiled Proposal Approval Program
+        current: Current content of the Proposal Approval Program box, None if the
+            box does not exist
+        chunk_size: Bytes loaded per transaction (defaults to the maximum allowed)
+
+    Returns:
+        The upload plan
+    """
+    if chunk_size is None:
+        chunk_size = load_proposal_contract_data_size_per_transaction()
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    init_size = (
+        None if current is not None and len(current) == len(program) else len(program)
+    )
+    # Resizing the box preserves the existing prefix and zero-fills the rest
+    stored = (current or b"")[: len(program)].ljust(len(program), b"\0")
+
+    chunks = tuple(
+        (offset, program[offset : offset + chunk_size])
+        for offset in range(0, len(program), chunk_size)
+        if program[offset : offset + chunk_size] != stored[offset : offset + chunk_size]
+    )
+    return ProposalProgramUploadPlan(init_size=init_size, chunks=chunks)
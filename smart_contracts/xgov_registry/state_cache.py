@@ -0,0 +1,112 @@
+from collections.abc import Callable
+from typing import Generic, TypeVar, cast
+
+from algokit_utils import SendAtomicTransactionComposerResults
+
+from smart_contracts.artifacts.proposal.proposal_client import (
+    ProposalClient,
+    ProposalTypedGlobalState,
+)
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    TypedGlobalState,
+    XGovRegistryClient,
+)
+
+T = TypeVar("T")
+
+
+class VersionedStateCache(Generic[T]):
+    """
+    Caches an application state, re-read only when the application `state_version`
+    moves.
+
+    The state is read together with its version in a single simulated group, so
+    the cached version is always the one of the cached state.
+    """
+
+    def __init__(
+        self,
+        read_version: Callable[[], int],
+        read_versioned_state: Callable[[], tuple[int, T]],
+    ) -> None:
+        self._read_version = read_version
+        self._read_versioned_state = read_versioned_state
+        self._version: int | None = None
+        self._state: T | None = None
+
+    @property
+    def version(self) -> int | None:
+        """Version of the cached state, None if no state has been read yet"""
+        return self._version
+
+    def get(self) -> T:
+        """Returns the application state, re-read if its version moved"""
+        if self._state is None or self._read_version() != self._version:
+            self._version, self._state = self._read_versioned_state()
+        return self._state
+
+    def invalidate(self) -> None:
+        self._version = None
+        self._state = None
+
+
+def _checked_return(value: T | None, method: str) -> T:
+    if value is None:
+        raise RuntimeError(f"{method} returned no value")
+    return value
+
+
+def _versioned_state(
+    result: SendAtomicTransactionComposerResults, state_struct: type[T]
+) -> tuple[int, T]:
+    """Parses the `get_state_version` and `get_state` returns of a simulated group"""
+    version, state = (call_return.value for call_return in result.returns)
+    return (
+        cast(int, _checked_return(version, "get_state_version")),
+        state_struct(*cast(tuple[object, ...], _checked_return(state, "get_state"))),
+    )
+
+
+def xgov_registry_state_cache(
+    xgov_registry_client: XGovRegistryClient,
+) -> VersionedStateCache[TypedGlobalState]:
+    """Cache of the xGov Registry `get_state`"""
+
+    def read_version() -> int:
+        return _checked_return(
+            xgov_registry_client.send.get_state_version().abi_return,
+            "get_state_version",
+        )
+
+    def read_versioned_state() -> tuple[int, TypedGlobalState]:
+        result = (
+            xgov_registry_client.new_group()
+            .get_state_version()
+            .get_state()
+            .simulate(allow_empty_signatures=True, skip_signatures=True)
+        )
+        return _versioned_state(result, TypedGlobalState)
+
+    return VersionedStateCache(read_version, read_versioned_state)
+
+
+def proposal_state_cache(
+    proposal_client: ProposalClient,
+) -> VersionedStateCache[ProposalTypedGlobalState]:
+    """Cache of the Proposal `get_state`"""
+
+    def read_version() -> int:
+        return _checked_return(
+            proposal_client.send.get_state_version().abi_return, "get_state_version"
+        )
+
+    def read_versioned_state() -> tuple[int, ProposalTypedGlobalState]:
+        result = (
+            proposal_client.new_group()
+            .get_state_version()
+            .get_state()
+            .simulate(allow_empty_signatures=True, skip_signatures=True)
+        )
+        return _versioned_state(result, ProposalTypedGlobalState)
+
+    return VersionedStateCache(read_version, read_versioned_state)
@@ -1,6 +1,11 @@
 import base64
+import json
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypedDict, cast
 
 import hvac
 from algosdk import constants, encoding
@@ -15,6 +20,7 @@ from algosdk.transaction import (
     SignedTransaction,
     Transaction,
 )
+from nacl.secret import SecretBox
 
 ## TODO:
 # Add more auth methods as needed (AWS, GCP, etc.)
@@ -23,15 +29,31 @@ from algosdk.transaction import (
 class VaultAuth(ABC):
     """Abstract base class for Vault authentication methods"""
 
+    # Whether the token obtained by this method can be cached and reused
+    cacheable: bool = True
+    # Non-secret attributes of the credentials, set by the methods using them
+    mount_point: str = ""
+    role: str = ""
+    role_id: str = ""
+
     @abstractmethod
     def authenticate(self, vault_client: hvac.Client) -> None:
         """Authenticate the vault client"""
         pass
 
+    def cache_identity(self) -> str:
+        """Non-secret identity of the credentials, used to key cached tokens"""
+        return ":".join(
+            (type(self).__name__, self.mount_point, self.role or self.role_id)
+        )
+
 
 class TokenAuth(VaultAuth):
     """Token-based authentication"""
 
+    # The token is already provided, there is nothing to cache
+    cacheable = False
+
     def __init__(self, token: str):
         self.token = token
 
@@ -174,7 +196,6 @@ class GitHubActionsAuth(VaultAuth):
 
     def authenticate(self, vault_client: hvac.Client) -> None:
         try:
-            import json
             import urllib.parse
             import urllib.request
 
@@ -220,6 +241,194 @@ class GitHubActionsAuth(VaultAuth):
             ) from exc
 
 
+class _VaultCacheContent(TypedDict, total=False):
+    tokens: dict[str, dict[str, str | float | bool]]
+    public_keys: dict[str, str]
+
+
+class VaultCache:
+    """
+    Cache of Vault auth tokens and transit public keys, shared by the secret
+    engines of a process so that consecutive deploy commands authenticate and
+    read keys only once.
+
+    Tokens are reused while their TTL lasts and renewed (renew-self) when they
+    are about to expire. The cache is kept in memory and, if a file and a key
+    are configured, persisted to disk encrypted with NaCl SecretBox.
+
+    Args:
+        file_path: Encrypted cache file (optional)
+        encryption_key: 32-byte key of the encrypted cache file (required with
+            `file_path`)
+    """
+
+    # Tokens expiring sooner than this are discarded (seconds)
+    MIN_TOKEN_TTL = 60
+    # Renewable tokens expiring sooner than this are renewed (seconds)
+    RENEW_TOKEN_TTL = 300
+
+    def __init__(
+        self, file_path: str | None = None, encryption_key: bytes | None = None
+    ) -> None:
+        if file_path and (encryption_key is None or len(encryption_key) != 32):
+            raise ValueError("A 32-byte encryption key is required by the Vault cache")
+        self.file_path = file_path
+        self.encryption_key = encryption_key
+        self._tokens: dict[str, dict[str, str | float | bool]] = {}
+        self._public_keys: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def token_key(vault_url: str, namespace: str | None, vault_auth: VaultAuth) -> str:
+        return f"{vault_url}|{namespace or ''}|{vault_auth.cache_identity()}"
+
+    @staticmethod
+    def public_key_key(
+        vault_url: str,
+        namespace: str | None,
+        mount_path: str,
+        key_name: str,
+        key_version: int,
+    ) -> str:
+        return f"{vault_url}|{namespace or ''}|{mount_path}|{key_name}|{key_version}"
+
+    def authenticate(
+        self,
+        vault_client: hvac.Client,
+        vault_auth: VaultAuth,
+        namespace: str | None = None,
+    ) -> None:
+        """Authenticate the vault client, reusing a cached token if still valid"""
+        if not vault_auth.cacheable:
+            vault_auth.authenticate(vault_client)
+            return
+
+        key = self.token_key(vault_client.url, namespace, vault_auth)
+        with self._lock:
+            cached = self._tokens.get(key)
+        if cached and self._reuse_token(vault_client, cached):
+            return
+
+        vault_auth.authenticate(vault_client)
+        try:
+            token_info = vault_client.auth.token.lookup_self()["data"]  # type: ignore
+        except Exception:
+            # Token introspection may be denied by policy, do not cache
+            return
+        self._store_token(
+            key,
+            token=vault_client.token,
+            ttl=int(token_info.get("ttl", 0)),  # type: ignore
+            renewable=bool(token_info.get("renewable", False)),  # type: ignore
+        )
+
+    def _reuse_token(
+        self, vault_client: hvac.Client, cached: dict[str, str | float | bool]
+    ) -> bool:
+        remaining = float(cached["expires_at"]) - time.time()
+        if remaining < self.MIN_TOKEN_TTL:
+            return False
+
+        vault_client.token = str(cached["token"])
+        try:
+            if remaining < self.RENEW_TOKEN_TTL and cached["renewable"]:
+                renewal = vault_client.auth.token.renew_self()["auth"]  # type: ignore
+                cached["expires_at"] = time.time() + int(renewal["lease_duration"])  # type: ignore
+                self._save()
+            return bool(vault_client.is_authenticated())
+        except Exception:
+            # Revoked or otherwise unusable token, authenticate again
+            return False
+
+    def _store_token(self, key: str, token: str, ttl: int, *, renewable: bool) -> None:
+        if ttl <= 0:
+            # Tokens without TTL (e.g. root tokens) are not cached
+            return
+        with self._lock:
+            self._tokens[key] = {
+                "token": token,
+                "expires_at": time.time() + ttl,
+                "renewable": renewable,
+            }
+        self._save()
+
+    def get_public_key(self, key: str) -> bytes | None:
+        with self._lock:
+            public_key_b64 = self._public_keys.get(key)
+        return base64.b64decode(public_key_b64) if public_key_b64 else None
+
+    def set_public_key(self, key: str, public_key: bytes) -> None:
+        with self._lock:
+            self._public_keys[key] = base64.b64encode(public_key).decode()
+        self._save()
+
+    def _secret_box(self) -> SecretBox:
+        # The encryption key is checked on init whenever a cache file is set
+        assert self.encryption_key is not None
+        return SecretBox(self.encryption_key)
+
+    def _load(self) -> None:
+        if not self.file_path or not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, "rb") as f:
+                content = cast(
+                    _VaultCacheContent,
+                    json.loads(self._secret_box().decrypt(f.read())),
+                )
+        except Exception:
+            # Unreadable or encrypted with another key, start from scratch
+            return
+        now = time.time()
+        self._tokens = {
+            key: token
+            for key, token in content.get("tokens", {}).items()
+            if float(token["expires_at"]) > now
+        }
+        self._public_keys = content.get("public_keys", {})
+
+    def _save(self) -> None:
+        if not self.file_path:
+            return
+        with self._lock:
+            cache_content: _VaultCacheContent = {
+                "tokens": self._tokens,
+                "public_keys": self._public_keys,
+            }
+            content = json.dumps(cache_content).encode()
+        encrypted = bytes(self._secret_box().encrypt(content))
+        fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(encrypted)
+
+
+_vault_cache: VaultCache | None = None
+
+
+def get_vault_cache() -> VaultCache:
+    """
+    Get the process-wide Vault cache, created on first use from the environment.
+
+    Optional environment variables (both required to persist the cache on disk):
+    - VAULT_CACHE_FILE: Path of the encrypted cache file
+    - VAULT_CACHE_KEY: Base64-encoded 32-byte encryption key of the cache file
+    """
+    global _vault_cache
+    if _vault_cache is None:
+        file_path = os.environ.get("VAULT_CACHE_FILE") or None
+        encryption_key_b64 = os.environ.get("VAULT_CACHE_KEY")
+        if file_path and not encryption_key_b64:
+            raise ValueError("VAULT_CACHE_KEY is required when VAULT_CACHE_FILE is set")
+        _vault_cache = VaultCache(
+            file_path=file_path,
+            encryption_key=(
+                base64.b64decode(encryption_key_b64) if file_path else None  # type: ignore
+            ),
+        )
+    return _vault_cache
+
+
 class VaultSecretEngine(ABC):
     """Abstract base class for Vault secret engines"""
 
@@ -233,31 +442,57 @@ class VaultSecretEngine(ABC):
         """Sign data and return the signature"""
         pass
 
+    def sign_data_batch(self, data_b64_list: list[str], key_name: str) -> list[str]:
+        """
+        Sign several data items with the same key and return the signatures in
+        the same order. Engines supporting batch requests should override this.
+        """
+        return [self.sign_data(data_b64, key_name) for data_b64 in data_b64_list]
+
 
 class TransitSecretEngine(VaultSecretEngine):
     """Transit secret engine implementation"""
 
+    # Version of the transit key used for signing
+    KEY_VERSION = 1
+
     def __init__(
-        self, vault_url: str, vault_auth: VaultAuth, mount_path: str = "transit"
+        self,
+        vault_url: str,
+        vault_auth: VaultAuth,
+        mount_path: str = "transit",
+        cache: VaultCache | None = None,
     ):
         self.vault_url = vault_url
         self.vault_auth = vault_auth
         self.mount_path = mount_path
+        self.cache = cache if cache is not None else get_vault_cache()
 
         # Initialize the Vault client with namespace if provided
-        vault_namespace = os.environ.get("VAULT_NAMESPACE")
-        if vault_namespace:
+        self.vault_namespace = os.environ.get("VAULT_NAMESPACE") or None
+        if self.vault_namespace:
             self.vault_client = hvac.Client(
-                url=self.vault_url, namespace=vault_namespace
+                url=self.vault_url, namespace=self.vault_namespace
             )
         else:
             self.vault_client = hvac.Client(url=self.vault_url)
 
-        # Authenticate using the provided auth method
-        self.vault_auth.authenticate(self.vault_client)
+        # Authenticate using the provided auth method, unless a cached token is valid
+        self.cache.authenticate(
+            self.vault_client, self.vault_auth, self.vault_namespace
+        )
 
     def setup_and_derive_public_key(self, key_name: str) -> bytes:
         """Setup transit engine and derive the public key bytes from the Vault key"""
+        cache_key = self.cache.public_key_key(
+            self.vault_url,
+            self.vault_namespace,
+            self.mount_path,
+            key_name,
+            self.KEY_VERSION,
+        )
+        if (cached_public_key := self.cache.get_public_key(cache_key)) is not None:
+            return cached_public_key
         try:
             # Get the public key from Vault (this also verifies the key exists)
             try:
@@ -267,9 +502,10 @@ class TransitSecretEngine(VaultSecretEngine):
             except Exception as e:
                 raise ValueError(f"Key '{key_name}' not found in transit engine") from e
             # Extract public key bytes
-            public_key_b64 = key_info["data"]["keys"]["1"]["public_key"]  # type: ignore
+            public_key_b64 = key_info["data"]["keys"][str(self.KEY_VERSION)]["public_key"]  # type: ignore
             public_key_bytes = base64.b64decode(public_key_b64)  # type: ignore
 
+            self.cache.set_public_key(cache_key, public_key_bytes)
             return public_key_bytes
 
         except Exception as exc:
@@ -291,28 +527,72 @@ class TransitSecretEngine(VaultSecretEngine):
 
             # Extract signature from Vault response
             vault_signature = sign_response["data"]["signature"]  # type: ignore
-            # Vault returns signature in format "vault:v1:base64signature"
-            signature_b64 = vault_signature.split(":")[-1]  # type: ignore
+            return _decode_vault_signature(vault_signature)  # type: ignore
+
+        except Exception as exc:
+            raise ValueError(f"Failed to sign data with transit engine: {exc}") from exc
+
+    def sign_data_batch(self, data_b64_list: list[str], key_name: str) -> list[str]:
+        """Sign several data items using a single Vault transit batch request"""
+        if not data_b64_list:
+            return []
+        try:
+            sign_response = self.vault_client.secrets.transit.sign_data(  # type: ignore
+                name=key_name,
+                batch_input=[{"input": data_b64} for data_b64 in data_b64_list],
+                prehashed=False,  # Ed25519 handles hashing internally
+                mount_point=self.mount_path,
+            )
+            batch_results: list[dict[str, str]] = sign_response["data"]["batch_results"]  # type: ignore
+        except Exception as exc:
+            raise ValueError(
+                f"Failed to batch sign data with transit engine: {exc}"
+            ) from exc
 
-            # Add padding if needed for proper base64 decoding
-            missing_padding = len(signature_b64) % 4  # type: ignore
-            if missing_padding:
-                signature_b64 += "=" * (4 - missing_padding)  # type: ignore
+        if len(batch_results) != len(data_b64_list):
+            raise ValueError(
+                f"Vault returned {len(batch_results)} signatures "
+                f"for {len(data_b64_list)} items"
+            )
 
-            # Verify the signature is valid base64 and correct length
+        signatures: list[str] = []
+        errors: list[str] = []
+        for i, result in enumerate(batch_results):
+            if result.get("error"):
+                errors.append(f"item {i}: {result['error']}")
+                continue
             try:
-                signature_bytes = base64.b64decode(signature_b64)  # type: ignore
-                if len(signature_bytes) != 64:  # Ed25519 signatures are 64 bytes
-                    raise ValueError(
-                        f"Invalid signature length: {len(signature_bytes)}"
-                    )
+                signatures.append(_decode_vault_signature(result["signature"]))
             except Exception as e:
-                raise ValueError(f"Invalid signature from Vault: {e}") from e
+                errors.append(f"item {i}: {e}")
+        if errors:
+            raise ValueError(
+                f"Failed to batch sign data with transit engine: {'; '.join(errors)}"
+            )
+        return signatures
 
-            return signature_b64  # type: ignore
 
-        except Exception as exc:
-            raise ValueError(f"Failed to sign data with transit engine: {exc}") from exc
+def _decode_vault_signature(vault_signature: str) -> str:
+    """
+    Converts a Vault signature ("vault:v1:base64signature") to a padded base64
+    Ed25519 signature.
+    """
+    signature_b64 = vault_signature.split(":")[-1]
+
+    # Add padding if needed for proper base64 decoding
+    missing_padding = len(signature_b64) % 4
+    if missing_padding:
+        signature_b64 += "=" * (4 - missing_padding)
+
+    # Verify the signature is valid base64 and correct length
+    try:
+        signature_bytes = base64.b64decode(signature_b64)
+        if len(signature_bytes) != 64:  # Ed25519 signatures are 64 bytes
+            raise ValueError(f"Invalid signature length: {len(signature_bytes)}")
+    except Exception as e:
+        raise ValueError(f"Invalid signature from Vault: {e}") from e
+
+    return signature_b64
 
 
 class HashicorpVaultTransactionSigner(TransactionSigner):
@@ -349,7 +629,7 @@ class HashicorpVaultTransactionSigner(TransactionSigner):
             list of signed transaction bytes
         """
         try:
-            signed_txns: list[SignedTransaction] = []
+            to_sign_b64_list: list[str] = []
 
             for i in indexes:
                 if i >= len(txn_group):
@@ -368,15 +648,18 @@ class HashicorpVaultTransactionSigner(TransactionSigner):
                 to_sign = constants.txid_prefix + base64.b64decode(encoded_txn)  # type: ignore
 
                 # Convert to base64 for Vault API
-                to_sign_b64 = base64.b64encode(to_sign).decode("utf-8")
+                to_sign_b64_list.append(base64.b64encode(to_sign).decode("utf-8"))
 
-                # Sign using the secret engine
-                signature_b64 = self.secret_engine.sign_data(to_sign_b64, self.key_name)
-
-                # Create signed transaction with the base64 signature
-                signed_txn = SignedTransaction(transaction=txn, signature=signature_b64)
+            # Sign the whole group with a single secret engine request
+            signatures_b64 = self.secret_engine.sign_data_batch(
+                to_sign_b64_list, self.key_name
+            )
 
-                signed_txns.append(signed_txn)
+            # Create signed transactions with the base64 signatures
+            signed_txns = [
+                SignedTransaction(transaction=txn_group[i], signature=signature_b64)
+                for i, signature_b64 in zip(indexes, signatures_b64, strict=True)
+            ]
 
             return signed_txns  # type: ignore
 
@@ -419,10 +702,17 @@ class HashicorpVaultMultisigTransactionSigner(TransactionSigner):
         vault_url: URL of the HashiCorp Vault instance
         vault_token: Authentication token for Vault
         secret_engine: The secret engine implementation to use
+        key_names: Names of the Vault keys of the multisig subsigners
+        max_workers: Maximum number of keys signing concurrently (defaults to the
+            multisig threshold)
     """
 
     def __init__(
-        self, msig: Multisig, secret_engine: VaultSecretEngine, key_names: list[str]
+        self,
+        msig: Multisig,
+        secret_engine: VaultSecretEngine,
+        key_names: list[str],
+        max_workers: int | None = None,
     ) -> None:
         super().__init__()
         self.msig = msig
@@ -432,6 +722,9 @@ class HashicorpVaultMultisigTransactionSigner(TransactionSigner):
             )
             for key_name in key_names
         ]
+        # Keys are signed concurrently, by default as many as the threshold
+        self.threshold = int(msig.threshold)  # type: ignore
+        self.max_workers = max_workers or max(self.threshold, 1)
         self._address = msig.address()  # type: ignore
 
     def sign_transactions(
@@ -450,23 +743,59 @@ class HashicorpVaultMultisigTransactionSigner(TransactionSigner):
         """
         self.msig.validate()  # type: ignore
 
-        pk_to_signed_txs: dict[bytes, list[SignedTransaction]] = {}
-        for signer in self.vault_transaction_signers:
-            signed_txns = signer.sign_transactions(txn_group, indexes)
-            pk = signer.public_key_bytes
-            pk_to_signed_txs[pk] = signed_txns  # type: ignore
+        pk_to_signed_txs = self._sign_with_threshold_keys(txn_group, indexes)
 
         stxns: list[GenericSignedTransaction] = []
         for i, ii in enumerate(indexes):
-            mtxn = MultisigTransaction(txn_group[ii], self.msig)
+            # Each transaction gets its own unsigned copy of the multisig, since
+            # the subsigs are written in place
+            mtxn = MultisigTransaction(txn_group[ii], self.msig.get_multisig_account())  # type: ignore
             for subsig in mtxn.multisig.subsigs:
-                pk = subsig.public_key
-                if pk in pk_to_signed_txs:  # type: ignore
-                    stxns_part = pk_to_signed_txs[pk]  # type: ignore
+                pk: bytes = subsig.public_key
+                if pk in pk_to_signed_txs:
+                    stxns_part = pk_to_signed_txs[pk]
                     subsig.signature = base64.b64decode(stxns_part[i].signature)  # type: ignore
             stxns.append(mtxn)
         return stxns
 
+    def _sign_with_threshold_keys(
+        self, txn_group: list[Transaction], indexes: list[int]
+    ) -> dict[bytes, list[SignedTransaction]]:
+        """
+        Sign with the Vault keys concurrently until the multisig threshold is met.
+
+        Keys are tried in their configured order, in waves of as many keys as
+        signatures are still missing, so the signing keys only depend on which
+        keys fail. Remaining keys are not used once the threshold is met.
+        """
+        threshold = self.threshold
+        pending = list(self.vault_transaction_signers)
+        pk_to_signed_txs: dict[bytes, list[SignedTransaction]] = {}
+        errors: list[str] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while len(pk_to_signed_txs) < threshold and pending:
+                wave = pending[: threshold - len(pk_to_signed_txs)]
+                pending = pending[len(wave) :]
+                futures = [
+                    executor.submit(signer.sign_transactions, txn_group, indexes)
+                    for signer in wave
+                ]
+                for signer, future in zip(wave, futures, strict=True):
+                    try:
+                        signed_txns = future.result()
+                    except Exception as exc:
+                        errors.append(f"{signer.key_name}: {exc}")
+                        continue
+                    pk_to_signed_txs[signer.public_key_bytes] = signed_txns  # type: ignore
+
+        if len(pk_to_signed_txs) < threshold:
+            raise RuntimeError(
+                f"Failed to reach multisig threshold ({len(pk_to_signed_txs)}/"
+                f"{threshold}) with Vault: {'; '.join(errors)}"
+            )
+        return pk_to_signed_txs
+
     @property
     def address(self) -> str:
         """Get the Algorand address associated with this signer"""
@@ -2,6 +2,7 @@ from algopy import (
     Account,
     Application,
     Array,
+    Box,
     Bytes,
     FixedArray,
     Global,
@@ -9,8 +10,10 @@ from algopy import (
     String,
     UInt64,
     arc4,
+    compile_contract,
     gtxn,
     itxn,
+    urange,
 )
 
 import smart_contracts.common.abi_types as typ
@@ -18,7 +21,9 @@ import smart_contracts.errors.std_errors as err
 from smart_contracts.interfaces.xgov_registry import XGovRegistryInterface
 from smart_contracts.proposal.contract import Proposal
 
+from ..proposal import config as prop_cfg
 from ..xgov_registry import config as reg_cfg
+from ..xgov_registry.constants import BYTES_PER_APP_PAGE
 
 
 class XgovRegistryMock(XGovRegistryInterface):
@@ -123,6 +128,10 @@ class XgovRegistryMock(XGovRegistryInterface):
             UInt64(),
             key=reg_cfg.GS_KEY_COMMITTEE_VOTES,
         )
+        self.committee_root = GlobalState(
+            Bytes(),
+            key=reg_cfg.GS_KEY_COMMITTEE_ROOT,
+        )
 
         # Quorums
         self.quorum_small = GlobalState(
@@ -167,21 +176,29 @@ class XgovRegistryMock(XGovRegistryInterface):
             UInt64(), key=reg_cfg.GS_KEY_COMMITTEE_LAST_ANCHOR
         )
 
+        # Boxes
+        self.proposal_approval_program = Box(
+            Bytes, key=reg_cfg.PROPOSAL_APPROVAL_PROGRAM_BOX
+        )
+
     @arc4.abimethod(create="require")
     def create(self) -> None:
         pass
 
     @arc4.abimethod()
     def init_proposal_contract(self, *, size: UInt64) -> None:
-        pass
+        if self.proposal_approval_program:
+            self.proposal_approval_program.resize(size)
+        else:
+            _created = self.proposal_approval_program.create(size=size)
 
     @arc4.abimethod()
     def load_proposal_contract(self, *, offset: UInt64, data: Bytes) -> None:
-        pass
+        self.proposal_approval_program.replace(start_index=offset, value=data)
 
     @arc4.abimethod()
     def delete_proposal_contract_box(self) -> None:
-        pass
+        del self.proposal_approval_program.value
 
     @arc4.abimethod()
     def pause_registry(self) -> None:
@@ -314,6 +331,21 @@ class XgovRegistryMock(XGovRegistryInterface):
         self.committee_id.value = committee_id.copy()
         self.committee_members.value = size
         self.committee_votes.value = votes
+        self.committee_root.value = Bytes()
+
+    @arc4.abimethod()
+    def declare_committee_with_root(
+        self,
+        *,
+        committee_id: typ.Bytes32,
+        size: UInt64,
+        votes: UInt64,
+        committee_root: typ.Bytes32,
+    ) -> None:
+        self.committee_id.value = committee_id.copy()
+        self.committee_members.value = size
+        self.committee_votes.value = votes
+        self.committee_root.value = committee_root.bytes
 
     @arc4.abimethod()
     def open_proposal(self, *, payment: gtxn.PaymentTransaction) -> UInt64:
@@ -356,6 +388,90 @@ class XgovRegistryMock(XGovRegistryInterface):
                 case _:
                     assert False, "Unknown error"  # noqa
 
+    @arc4.abimethod()
+    def vote_proposals(
+        self,
+        *,
+        xgov_address: Account,
+        votes: Array[typ.ProposalVote],
+    ) -> None:
+        for i in urange(votes.length):
+            vote = votes[i].copy()
+            self.vote_proposal(
+                proposal_id=Application(vote.proposal_id),
+                xgov_address=xgov_address,
+                approval_votes=vote.approvals,
+                rejection_votes=vote.rejections,
+            )
+
+    @arc4.abimethod()
+    def vote_proposal_batch(
+        self,
+        *,
+        proposal_id: Application,
+        votes: Array[typ.XGovVote],
+    ) -> None:
+        error, _tx = arc4.abi_call(
+            Proposal.vote_batch,
+            votes,
+            app_id=proposal_id,
+        )
+
+        if error.startswith(err.ARC_65_PREFIX):
+            error_without_prefix = String.from_bytes(error.bytes[4:])
+            match error_without_prefix:
+                case err.VOTER_NOT_FOUND:
+                    assert False, err.VOTER_NOT_FOUND  # noqa
+                case err.VOTER_ALREADY_VOTED:
+                    assert False, err.VOTER_ALREADY_VOTED  # noqa
+                case err.VOTES_INVALID:
+                    assert False, err.VOTES_INVALID  # noqa
+                case err.WRONG_PROPOSAL_STATUS:
+                    assert False, err.WRONG_PROPOSAL_STATUS  # noqa
+                case err.VOTING_PERIOD_EXPIRED:
+                    assert False, err.VOTING_PERIOD_EXPIRED  # noqa
+                case _:
+                    assert False, "Unknown error"  # noqa
+
+    @arc4.abimethod()
+    def vote_proposal_with_proof(
+        self,
+        *,
+        proposal_id: Application,
+        xgov_address: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+        approval_votes: UInt64,
+        rejection_votes: UInt64,
+    ) -> None:
+        error, _tx = arc4.abi_call(
+            Proposal.vote_with_proof,
+            xgov_address,
+            voting_power,
+            ordinal,
+            proof,
+            approval_votes,
+            rejection_votes,
+            app_id=proposal_id,
+        )
+
+        if error.startswith(err.ARC_65_PREFIX):
+            error_without_prefix = String.from_bytes(error.bytes[4:])
+            match error_without_prefix:
+                case err.VOTER_NOT_FOUND:
+                    assert False, err.VOTER_NOT_FOUND  # noqa
+                case err.VOTER_ALREADY_VOTED:
+                    assert False, err.VOTER_ALREADY_VOTED  # noqa
+                case err.VOTES_INVALID:
+                    assert False, err.VOTES_INVALID  # noqa
+                case err.WRONG_PROPOSAL_STATUS:
+                    assert False, err.WRONG_PROPOSAL_STATUS  # noqa
+                case err.VOTING_PERIOD_EXPIRED:
+                    assert False, err.VOTING_PERIOD_EXPIRED  # noqa
+                case _:
+                    assert False, "Unknown error"  # noqa
+
     @arc4.abimethod()
     def unassign_absentee_from_proposal(
         self, *, proposal_id: Application, absentees: Array[Account]
@@ -366,6 +482,30 @@ class XgovRegistryMock(XGovRegistryInterface):
             app_id=proposal_id,
         )
 
+        self.assert_no_unassign_error(error)
+
+    @arc4.abimethod()
+    def unassign_absentee_from_proposal_with_proof(
+        self,
+        *,
+        proposal_id: Application,
+        xgov_address: Account,
+        voting_power: UInt64,
+        ordinal: UInt64,
+        proof: Array[typ.Bytes32],
+    ) -> None:
+        error, _tx = arc4.abi_call(
+            Proposal.unassign_absentee_with_proof,
+            xgov_address,
+            voting_power,
+            ordinal,
+            proof,
+            app_id=proposal_id,
+        )
+
+        self.assert_no_unassign_error(error)
+
+    def assert_no_unassign_error(self, error: typ.Error) -> None:
         if error.startswith(err.ARC_65_PREFIX):
             error_without_prefix = String.from_bytes(error.bytes[4:])
             match error_without_prefix:
@@ -502,6 +642,10 @@ class XgovRegistryMock(XGovRegistryInterface):
             committee_last_anchor=self.committee_last_anchor.value,
         )
 
+    @arc4.abimethod(readonly=True)
+    def get_state_version(self) -> UInt64:
+        return UInt64(0)
+
     @arc4.abimethod(readonly=True)
     def get_xgov_box(self, *, xgov_address: Account) -> tuple[typ.XGovBoxValue, bool]:
         return (
@@ -514,6 +658,12 @@ class XgovRegistryMock(XGovRegistryInterface):
             False,
         )
 
+    @arc4.abimethod(readonly=True)
+    def get_xgov_boxes(
+        self, *, xgov_addresses: Array[Account]
+    ) -> Array[typ.XGovBoxEntry]:
+        return Array[typ.XGovBoxEntry]()
+
     @arc4.abimethod(readonly=True)
     def get_proposer_box(
         self,
@@ -529,6 +679,12 @@ class XgovRegistryMock(XGovRegistryInterface):
             False,
         )
 
+    @arc4.abimethod(readonly=True)
+    def get_proposer_boxes(
+        self, *, proposer_addresses: Array[Account]
+    ) -> Array[typ.ProposerBoxEntry]:
+        return Array[typ.ProposerBoxEntry]()
+
     @arc4.abimethod(readonly=True)
     def get_request_box(
         self,
@@ -544,6 +700,12 @@ class XgovRegistryMock(XGovRegistryInterface):
             False,
         )
 
+    @arc4.abimethod(readonly=True)
+    def get_request_boxes(
+        self, *, request_ids: Array[UInt64]
+    ) -> Array[typ.XGovSubscribeRequestBoxEntry]:
+        return Array[typ.XGovSubscribeRequestBoxEntry]()
+
     @arc4.abimethod(readonly=True)
     def get_request_unsubscribe_box(
         self, *, request_id: UInt64
@@ -557,6 +719,18 @@ class XgovRegistryMock(XGovRegistryInterface):
             False,
         )
 
+    @arc4.abimethod(readonly=True)
+    def get_request_unsubscribe_boxes(
+        self, *, request_ids: Array[UInt64]
+    ) -> Array[typ.XGovSubscribeRequestBoxEntry]:
+        return Array[typ.XGovSubscribeRequestBoxEntry]()
+
+    @arc4.abimethod(readonly=True)
+    def get_proposals_summary(
+        self, *, proposal_ids: Array[UInt64]
+    ) -> Array[typ.ProposalSummary]:
+        return Array[typ.ProposalSummary]()
+
     @arc4.abimethod()
     def is_proposal(self, *, proposal_id: Application) -> None:
         return
@@ -567,10 +741,30 @@ class XgovRegistryMock(XGovRegistryInterface):
         *,
         proposer: Account,
     ) -> UInt64:
+        # The Proposal Approval Program is loaded from a box, as the xGov Registry
+        # does, so the mock program does not embed it
+        compiled_clear_state_1, _compiled_clear_state_2 = compile_contract(
+            Proposal
+        ).clear_state_program
+
+        bytes_per_page = UInt64(BYTES_PER_APP_PAGE)
+        approval_length = self.proposal_approval_program.length
+
         mbr_before = Global.current_application_address.min_balance
-        res = arc4.arc4_create(
-            Proposal,
+        res = arc4.abi_call(
+            Proposal.create,
             proposer,
+            approval_program=(
+                self.proposal_approval_program.extract(0, bytes_per_page),
+                self.proposal_approval_program.extract(
+                    bytes_per_page, approval_length - bytes_per_page
+                ),
+            ),
+            clear_state_program=compiled_clear_state_1,
+            global_num_uint=prop_cfg.GLOBAL_UINTS,
+            global_num_bytes=prop_cfg.GLOBAL_BYTES,
+            extra_program_pages=(approval_length + compiled_clear_state_1.length)
+            // bytes_per_page,
         )
         mbr_after = Global.current_application_address.min_balance
 
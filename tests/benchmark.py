@@ -0,0 +1,377 @@
+"""
+Opcode budget and fee benchmarks driven by algod `simulate`.
+
+Each benchmark simulates a transaction group with execution tracing and records,
+for the whole group (inner transactions included):
+
+- the opcode budget consumed and the op-up calls it would need;
+- the inner transactions issued;
+- the box reads and writes, counted from the traced opcodes;
+- the minimum fee covering outer, inner and op-up transactions.
+
+Results are written as a versioned JSON report and a Markdown table, and checked
+against a stored baseline so that budget and fee growth fails the test run.
+"""
+
+import ast
+import base64
+import json
+import math
+import os
+import tomllib
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    SigningAccount,
+    TransactionComposer,
+)
+from algosdk.constants import MIN_TXN_FEE
+from algosdk.v2client.models import SimulateTraceConfig
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ARTIFACTS_DIR = REPO_ROOT / "smart_contracts" / "artifacts"
+
+BENCHMARK_REPORT_VERSION = 1
+BENCHMARK_BASELINE_PATH = Path(
+    os.environ.get(
+        "BENCHMARK_BASELINE_PATH", REPO_ROOT / "tests" / "benchmark_baseline.json"
+    )
+)
+BENCHMARK_REPORT_DIR = Path(
+    os.environ.get("BENCHMARK_REPORT_DIR", REPO_ROOT / "benchmark-report")
+)
+# Relative opcode budget growth tolerated before failing (e.g. "0.02" for 2%)
+BENCHMARK_OPCODE_TOLERANCE = float(os.environ.get("BENCHMARK_OPCODE_TOLERANCE", "0"))
+
+APP_CALL_OPCODE_BUDGET = 700
+MAX_EXTRA_OPCODE_BUDGET = 320_000  # 20_000 per transaction in a group of 16
+
+# https://dev.algorand.co/concepts/smart-contracts/opcodes-overview/#box-access
+BOX_READ_OPCODES = frozenset({0xBA, 0xBD, 0xBE})  # box_extract, box_len, box_get
+BOX_WRITE_OPCODES = frozenset(
+    # box_create, box_replace, box_del, box_put, box_splice, box_resize
+    {0xB9, 0xBB, 0xBC, 0xBF, 0xD2, 0xD3}
+)
+
+# Fee of the benchmarked calls: simulate checks fees, the recorded min fee does not
+# depend on it
+BENCHMARK_STATIC_FEE = AlgoAmount(micro_algo=MIN_TXN_FEE * 16)
+
+_BENCHMARK_TEST_PREFIX = "test_benchmark_"
+
+_TRACE_CONFIG = SimulateTraceConfig(enable=True)
+
+
+@dataclass(frozen=True)
+class MethodCost:
+    opcode_cost: int
+    op_ups: int
+    inner_txns: int
+    box_reads: int
+    box_writes: int
+    min_fee: int
+
+
+@dataclass
+class _TraceCounters:
+    app_calls: int = 0
+    inner_txns: int = 0
+    box_reads: int = 0
+    box_writes: int = 0
+
+
+def benchmark_key(contract: str, method: str, case: str = "") -> str:
+    return f"{contract}.{method}" + (f"[{case}]" if case else "")
+
+
+def abi_method_names(arc56_path: Path) -> set[str]:
+    return {method["name"] for method in json.loads(arc56_path.read_text())["methods"]}
+
+
+def benchmarked_methods(test_path: Path) -> set[str]:
+    """Methods benchmarked by the `test_benchmark_<method>` tests of a module"""
+    return {
+        node.name.removeprefix(_BENCHMARK_TEST_PREFIX)
+        for node in ast.parse(test_path.read_text()).body
+        if isinstance(node, ast.FunctionDef)
+        and node.name.startswith(_BENCHMARK_TEST_PREFIX)
+    }
+
+
+def benchmark_params(sender: SigningAccount | None = None) -> CommonAppCallParams:
+    return CommonAppCallParams(
+        sender=sender.address if sender is not None else None,
+        static_fee=BENCHMARK_STATIC_FEE,
+    )
+
+
+def _iter_app_calls(
+    txn_result: Mapping[str, object], trace: Mapping[str, object]
+) -> Iterator[tuple[Mapping[str, object], Mapping[str, object]]]:
+    """Yields the (pending transaction, execution trace) of each executed program"""
+    yield txn_result, trace
+    inner_txns = txn_result.get("inner-txns") or []
+    inner_traces = trace.get("inner-trace") or []
+    assert isinstance(inner_txns, list) and isinstance(inner_traces, list)
+    for inner_txn, inner_trace in zip(inner_txns, inner_traces, strict=False):
+        yield from _iter_app_calls(inner_txn, inner_trace)
+
+
+class _ProgramCache:
+    def __init__(self, algorand_client: AlgorandClient) -> None:
+        self._algod = algorand_client.client.algod
+        self._programs: dict[int, bytes] = {}
+
+    def approval_program(self, txn_result: Mapping[str, object]) -> bytes | None:
+        txn = txn_result["txn"]["txn"]  # type: ignore[index]
+        if txn.get("type") != "appl":
+            return None
+        if "apap" in txn and not txn.get("apid"):
+            # App creation, the program is in the transaction
+            return base64.b64decode(txn["apap"])
+        app_id = txn.get("apid", 0)
+        if app_id not in self._programs:
+            app_info = self._algod.application_info(app_id)
+            self._programs[app_id] = base64.b64decode(
+                app_info["params"]["approval-program"]  # type: ignore[call-overload, index]
+            )
+        return self._programs[app_id]
+
+
+def _count_trace(
+    programs: _ProgramCache,
+    txn_result: Mapping[str, object],
+    trace: Mapping[str, object],
+) -> _TraceCounters:
+    counters = _TraceCounters()
+    for call_result, call_trace in _iter_app_calls(txn_result, trace):
+        if call_result is not txn_result:
+            counters.inner_txns += 1
+        program = programs.approval_program(call_result)
+        if program is None:
+            continue
+        # Every app call, inner ones included, adds its budget to the group pool
+        counters.app_calls += 1
+        for unit in call_trace.get("approval-program-trace") or []:  # type: ignore[attr-defined]
+            opcode = program[unit["pc"]]
+            if opcode in BOX_READ_OPCODES:
+                counters.box_reads += 1
+            elif opcode in BOX_WRITE_OPCODES:
+                counters.box_writes += 1
+    return counters
+
+
+def simulate_cost(
+    algorand_client: AlgorandClient, composer: TransactionComposer
+) -> MethodCost:
+    """
+    Simulates the group with execution tracing and unlimited opcode budget.
+
+    Args:
+        algorand_client: Client used to fetch the executed approval programs
+        composer: Group to simulate, it is not sent
+
+    Returns:
+        The cost of the whole group
+    """
+    result = composer.simulate(
+        allow_unnamed_resources=True,
+        extra_opcode_budget=MAX_EXTRA_OPCODE_BUDGET,
+        exec_trace_config=_TRACE_CONFIG,
+        skip_signatures=True,
+    )
+    assert result.simulate_response is not None
+    group = result.simulate_response["txn-groups"][0]
+    programs = _ProgramCache(algorand_client)
+
+    app_calls = inner_txns = box_reads = box_writes = 0
+    for txn in group["txn-results"]:
+        counters = _count_trace(
+            programs, txn["txn-result"], txn.get("exec-trace") or {}
+        )
+        app_calls += counters.app_calls
+        inner_txns += counters.inner_txns
+        box_reads += counters.box_reads
+        box_writes += counters.box_writes
+
+    opcode_cost = group.get("app-budget-consumed", 0)
+    missing_budget = opcode_cost - APP_CALL_OPCODE_BUDGET * app_calls
+    op_ups = max(0, math.ceil(missing_budget / APP_CALL_OPCODE_BUDGET))
+    return MethodCost(
+        opcode_cost=opcode_cost,
+        op_ups=op_ups,
+        inner_txns=inner_txns,
+        box_reads=box_reads,
+        box_writes=box_writes,
+        min_fee=MIN_TXN_FEE * (len(group["txn-results"]) + inner_txns + op_ups),
+    )
+
+
+def find_regressions(
+    costs: Mapping[str, MethodCost],
+    baseline: Mapping[str, Mapping[str, int]],
+    opcode_tolerance: float = 0.0,
+) -> list[str]:
+    """
+    Compares the costs with a baseline.
+
+    Args:
+        costs: Measured costs by benchmark key
+        baseline: Baseline costs by benchmark key, keys not in the baseline are new
+            benchmarks and cannot regress
+        opcode_tolerance: Relative opcode budget growth tolerated
+
+    Returns:
+        A description of each metric exceeding the baseline
+    """
+    regressions = []
+    for key, cost in costs.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        for field in fields(MethodCost):
+            current = getattr(cost, field.name)
+            allowed = reference.get(field.name, current)
+            if field.name == "opcode_cost":
+                allowed = math.floor(allowed * (1 + opcode_tolerance))
+            if current > allowed:
+                regressions.append(
+                    f"{key}: {field.name} {reference.get(field.name)} -> {current}"
+                )
+    return regressions
+
+
+def render_markdown(costs: Mapping[str, MethodCost]) -> str:
+    header = ["Benchmark", *(field.name for field in fields(MethodCost))]
+    lines = [
+        f"# Opcode budget and fee benchmarks (v{BENCHMARK_REPORT_VERSION})",
+        "",
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join([" --- "] + [" ---: "] * (len(header) - 1)) + "|",
+    ]
+    for key in sorted(costs):
+        values = asdict(costs[key]).values()
+        lines.append("| " + " | ".join([f"`{key}`", *map(str, values)]) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def _project_version() -> str:
+    with (REPO_ROOT / "pyproject.toml").open("rb") as f:
+        return str(tomllib.load(f)["tool"]["poetry"]["version"])
+
+
+def _read_baseline(path: Path, *, required: bool) -> dict[str, dict[str, int]]:
+    if not path.exists():
+        if required:
+            raise FileNotFoundError(
+                f"benchmark baseline {path} is missing, generate it with "
+                "BENCHMARK_UPDATE_BASELINE=1"
+            )
+        return {}
+    document = json.loads(path.read_text())
+    if document.get("version") != BENCHMARK_REPORT_VERSION:
+        raise ValueError(
+            f"benchmark baseline version {document.get('version')} is not "
+            f"{BENCHMARK_REPORT_VERSION}, regenerate it with BENCHMARK_UPDATE_BASELINE=1"
+        )
+    return document["benchmarks"]  # type: ignore[no-any-return]
+
+
+class BenchmarkRecorder:
+    """
+    Collects the benchmarks of a test session and gates them against the baseline.
+
+    Set BENCHMARK_UPDATE_BASELINE=1 to overwrite the baseline with the session
+    results instead of checking them. A missing baseline only skips the gate
+    outside CI, where it is required.
+    """
+
+    def __init__(
+        self,
+        algorand_client: AlgorandClient,
+        *,
+        baseline_path: Path = BENCHMARK_BASELINE_PATH,
+        report_dir: Path = BENCHMARK_REPORT_DIR,
+        update_baseline: bool = False,
+        require_baseline: bool = False,
+        opcode_tolerance: float = BENCHMARK_OPCODE_TOLERANCE,
+    ) -> None:
+        self.algorand_client = algorand_client
+        self.baseline_path = baseline_path
+        self.report_dir = report_dir
+        self.update_baseline = update_baseline
+        self.opcode_tolerance = opcode_tolerance
+        self.baseline = (
+            {}
+            if update_baseline
+            else _read_baseline(baseline_path, required=require_baseline)
+        )
+        self.costs: dict[str, MethodCost] = {}
+
+    def measure(
+        self,
+        composer: TransactionComposer,
+        *,
+        contract: str,
+        method: str,
+        case: str = "",
+    ) -> MethodCost:
+        """
+        Simulates and records the group, failing if it regresses on the baseline.
+        """
+        key = benchmark_key(contract, method, case)
+        cost = simulate_cost(self.algorand_client, composer)
+        self.costs[key] = cost
+        regressions = find_regressions(
+            {key: cost}, self.baseline, self.opcode_tolerance
+        )
+        assert not regressions, "benchmark regression: " + "; ".join(regressions)
+        return cost
+
+    def covered_methods(self, contract: str) -> set[str]:
+        prefix = f"{contract}."
+        return {
+            key.removeprefix(prefix).split("[")[0]
+            for key in self.costs
+            if key.startswith(prefix)
+        }
+
+    def report(self) -> dict[str, object]:
+        return {
+            "version": BENCHMARK_REPORT_VERSION,
+            "project_version": _project_version(),
+            "benchmarks": {key: asdict(self.costs[key]) for key in sorted(self.costs)},
+        }
+
+    def write(self) -> None:
+        if not self.costs:
+            return
+        report = json.dumps(self.report(), indent=2) + "\n"
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        (self.report_dir / "benchmarks.json").write_text(report)
+        (self.report_dir / "benchmarks.md").write_text(render_markdown(self.costs))
+        if self.update_baseline:
+            self.baseline_path.write_text(report)
+
+
+@dataclass(frozen=True)
+class ContractBenchmark:
+    """Measures the benchmarks of a contract"""
+
+    contract: str
+
+    def __call__(
+        self,
+        recorder: BenchmarkRecorder,
+        composer: TransactionComposer,
+        method: str,
+        case: str = "",
+    ) -> MethodCost:
+        return recorder.measure(
+            composer, contract=self.contract, method=method, case=case
+        )
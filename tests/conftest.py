@@ -1,3 +1,5 @@
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,8 @@ from algokit_utils import (
 from algosdk.constants import MIN_TXN_FEE
 from dotenv import load_dotenv
 
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
+from tests.benchmark import BenchmarkRecorder
 from tests.common import (
     DEFAULT_COMMITTEE_MEMBERS,
     DEFAULT_MEMBER_VOTES,
@@ -16,6 +20,9 @@ from tests.common import (
     CommitteeMember,
 )
 
+# Tests depending on this fixture, directly or not, run against localnet
+LOCALNET_FIXTURE = "algorand_client"
+
 
 @pytest.fixture(autouse=True, scope="session")
 def environment_fixture() -> None:
@@ -30,16 +37,35 @@ def algorand_client() -> AlgorandClient:
     return client
 
 
+@pytest.fixture(scope="session")
+def benchmark_recorder(
+    algorand_client: AlgorandClient,
+) -> Iterator[BenchmarkRecorder]:
+    recorder = BenchmarkRecorder(
+        algorand_client,
+        update_baseline=os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1",
+        # The regression gate cannot be skipped in CI
+        require_baseline=os.environ.get("CI") == "true",
+    )
+    yield recorder
+    recorder.write()
+
+
 @pytest.fixture(autouse=True, scope="function")
-def reset_blockchain_timestamp(algorand_client: AlgorandClient):
+def reset_blockchain_timestamp(request: pytest.FixtureRequest) -> Iterator[None]:
     """Reset blockchain timestamp after each test to prevent time leakage"""
+    # Offline tests never touch localnet
+    if LOCALNET_FIXTURE not in request.fixturenames:
+        yield
+        return
+    algorand_client: AlgorandClient = request.getfixturevalue(LOCALNET_FIXTURE)
     yield  # Run the test first
     # Reset after test completes
     algorand_client.client.algod.set_timestamp_offset(0)
 
 
 @pytest.fixture(autouse=True, scope="function")
-def isolate_error_transformers(algorand_client: AlgorandClient):
+def isolate_error_transformers(request: pytest.FixtureRequest) -> Iterator[None]:
     """Prevent error-transformer leakage between tests.
 
     Every ``AppClient`` created during test setup registers an error
@@ -59,6 +85,10 @@ def isolate_error_transformers(algorand_client: AlgorandClient):
     contains only session-scoped transformers) and restores it
     afterwards, so function-scoped transformers never leak across tests.
     """
+    if LOCALNET_FIXTURE not in request.fixturenames:
+        yield
+        return
+    algorand_client: AlgorandClient = request.getfixturevalue(LOCALNET_FIXTURE)
     baseline = algorand_client._error_transformers.copy()
     yield
     algorand_client._error_transformers.clear()
@@ -184,6 +214,11 @@ def committee(algorand_client: AlgorandClient) -> list[CommitteeMember]:
     return members
 
 
+@pytest.fixture(scope="session")
+def committee_tree(committee: list[CommitteeMember]) -> CommitteeMerkleTree:
+    return CommitteeMerkleTree((cm.account.address, cm.votes) for cm in committee)
+
+
 @pytest.fixture(scope="session")
 def no_role_account(algorand_client: AlgorandClient) -> SigningAccount:
     account = algorand_client.account.random()
@@ -1,11 +1,19 @@
 from algosdk.encoding import decode_address
 
-from smart_contracts.council.config import MEMBERS_KEY_PREFIX, VOTES_KEY_PREFIX
+from smart_contracts.council.config import (
+    MEMBERS_KEY_PREFIX,
+    TALLIES_KEY_PREFIX,
+    VOTED_BITMAP_KEY_PREFIX,
+)
 
 
 def members_box_name(address: str) -> bytes:
     return MEMBERS_KEY_PREFIX + decode_address(address)  # type: ignore
 
 
-def votes_box_name(pid: int) -> bytes:
-    return VOTES_KEY_PREFIX + pid.to_bytes(8, "big")
+def tally_box_name(pid: int) -> bytes:
+    return TALLIES_KEY_PREFIX + pid.to_bytes(8, "big")
+
+
+def voted_bitmap_box_name(pid: int) -> bytes:
+    return VOTED_BITMAP_KEY_PREFIX + pid.to_bytes(8, "big")
@@ -1,6 +1,11 @@
+from pathlib import Path
+
 import pytest
 from algokit_utils import (
     AlgorandClient,
+    AppClient,
+    AppClientMethodCallParams,
+    AppFactoryCreateMethodCallParams,
     CommonAppCallParams,
     SigningAccount,
 )
@@ -18,11 +23,14 @@ from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
 )
 from tests.common import INITIAL_FUNDS, CommitteeMember
 from tests.xgov_registry.conftest import (
+    alternative_proposer,
     approved_proposal_client,
     draft_proposal_client,
     proposal_client,
     proposer,
     proposer_no_kyc,
+    second_approved_proposal_client,
+    second_voting_proposal_client,
     subscribed_committee,
     voting_proposal_client,
     xgov_registry_client,
@@ -92,3 +100,59 @@ def council_members(
         )
 
     return committee
+
+
+# Council program deployed before the review tallies, with "V" votes boxes
+LEGACY_COUNCIL_SPEC = Path(__file__).parent / "legacy" / "Council.arc56.json"
+
+
+@pytest.fixture(scope="function")
+def legacy_council_client(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    committee_manager: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+) -> AppClient:
+    config.configure(
+        debug=False,
+        populate_app_call_resources=True,
+    )
+
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=deployer,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+
+    factory = algorand_client.client.get_app_factory(
+        app_spec=LEGACY_COUNCIL_SPEC.read_text(),
+        default_sender=deployer.address,
+    )
+    client, _ = factory.send.create(
+        AppFactoryCreateMethodCallParams(
+            method="create", args=[xgov_registry_client.app_id]
+        )
+    )
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=client.app_address,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+
+    xgov_registry_client.send.set_xgov_council(
+        args=SetXgovCouncilArgs(
+            council=client.app_address,
+        ),
+        params=CommonAppCallParams(sender=deployer.address, signer=deployer.signer),
+    )
+
+    for member in committee:
+        client.send.call(
+            AppClientMethodCallParams(
+                method="add_member",
+                args=[member.account.address],
+                sender=committee_manager.address,
+                signer=committee_manager.signer,
+            )
+        )
+
+    return client
@@ -39,6 +39,13 @@ def test_add_member_success(
         "member_count"
     )
 
+    # Members get increasing ordinals
+    box_state = council_client.state.box
+    assert (
+        box_state.members.get_value(no_role_account.address)
+        == box_state.next_member_ordinal - 1
+    )
+
 
 def test_add_member_not_admin(
     algorand_client: AlgorandClient,
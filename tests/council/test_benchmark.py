@@ -0,0 +1,172 @@
+import pytest
+from algokit_utils import (
+    AlgorandClient,
+    CommonAppCallParams,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.council.council_client import (
+    AddMemberArgs,
+    CouncilClient,
+    CouncilFactory,
+    CreateArgs,
+    RemoveMemberArgs,
+    VoteArgs,
+    VoteManyArgs,
+)
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    XGovRegistryClient,
+)
+from tests.benchmark import (
+    BenchmarkRecorder,
+    ContractBenchmark,
+    benchmark_params,
+)
+from tests.common import DEFAULT_COMMITTEE_MEMBERS, CommitteeMember
+
+CONTRACT = "Council"
+
+COUNCIL_SIZES = [1, 5, DEFAULT_COMMITTEE_MEMBERS]
+
+_measure = ContractBenchmark(CONTRACT)
+
+
+def test_benchmark_create(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    factory = algorand_client.client.get_typed_app_factory(
+        typed_factory=CouncilFactory,
+        default_sender=deployer.address,
+    )
+    composer = algorand_client.new_group().add_app_create_method_call(
+        factory.params.create.create(
+            args=CreateArgs(registry_id=xgov_registry_client.app_id)
+        )
+    )
+    _measure(benchmark_recorder, composer, "create")
+
+
+def test_benchmark_update_council(
+    deployer: SigningAccount,
+    council_client: CouncilClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = council_client.new_group().update.update_council(
+        params=benchmark_params(deployer)
+    )
+    _measure(benchmark_recorder, composer.composer(), "update_council")
+
+
+def test_benchmark_add_member(
+    committee_manager: SigningAccount,
+    no_role_account: SigningAccount,
+    council_client: CouncilClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = council_client.new_group().add_member(
+        args=AddMemberArgs(address=no_role_account.address),
+        params=benchmark_params(committee_manager),
+    )
+    _measure(benchmark_recorder, composer.composer(), "add_member")
+
+
+def test_benchmark_remove_member(
+    committee_manager: SigningAccount,
+    council_members: list[CommitteeMember],
+    council_client: CouncilClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = council_client.new_group().remove_member(
+        args=RemoveMemberArgs(address=council_members[0].account.address),
+        params=benchmark_params(committee_manager),
+    )
+    _measure(benchmark_recorder, composer.composer(), "remove_member")
+
+
+@pytest.mark.parametrize("council_size", COUNCIL_SIZES)
+def test_benchmark_vote(
+    council_size: int,
+    committee_manager: SigningAccount,
+    committee: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    members = committee[:council_size]
+    for member in members:
+        council_client.send.add_member(
+            args=AddMemberArgs(address=member.account.address),
+            params=CommonAppCallParams(sender=committee_manager.address),
+        )
+
+    # Benchmark the vote reaching the majority, which also reviews the proposal
+    deciding_vote = council_size // 2
+    for member in members[:deciding_vote]:
+        council_client.send.vote(
+            args=VoteArgs(proposal_id=approved_proposal_client.app_id, block=False),
+            params=benchmark_params(member.account),
+        )
+
+    composer = council_client.new_group().vote(
+        args=VoteArgs(proposal_id=approved_proposal_client.app_id, block=False),
+        params=benchmark_params(members[deciding_vote].account),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote",
+        f"council_size={council_size}",
+    )
+
+
+@pytest.mark.parametrize("council_size", COUNCIL_SIZES)
+def test_benchmark_vote_many(
+    council_size: int,
+    committee_manager: SigningAccount,
+    committee: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    second_approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    members = committee[:council_size]
+    for member in members:
+        council_client.send.add_member(
+            args=AddMemberArgs(address=member.account.address),
+            params=CommonAppCallParams(sender=committee_manager.address),
+        )
+
+    # Benchmark the votes reaching the majority on both proposals
+    votes = [
+        (approved_proposal_client.app_id, False),
+        (second_approved_proposal_client.app_id, True),
+    ]
+    deciding_vote = council_size // 2
+    for member in members[:deciding_vote]:
+        council_client.send.vote_many(
+            args=VoteManyArgs(votes=votes),
+            params=benchmark_params(member.account),
+        )
+
+    composer = council_client.new_group().vote_many(
+        args=VoteManyArgs(votes=votes),
+        params=benchmark_params(members[deciding_vote].account),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote_many",
+        f"council_size={council_size}",
+    )
+
+
+def test_benchmark_op_up(
+    council_client: CouncilClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = council_client.new_group().op_up()
+    _measure(benchmark_recorder, composer.composer(), "op_up")
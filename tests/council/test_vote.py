@@ -2,18 +2,30 @@ import pytest
 from algokit_utils import (
     AlgoAmount,
     AlgorandClient,
+    AppClient,
+    AppClientCompilationParams,
+    AppClientMethodCallParams,
     BoxReference,
     CommonAppCallParams,
     LogicError,
     SigningAccount,
 )
 
-from smart_contracts.artifacts.council.council_client import CouncilClient, VoteArgs
+from smart_contracts.artifacts.council.council_client import (
+    AddMemberArgs,
+    CouncilClient,
+    RemoveMemberArgs,
+    VoteArgs,
+)
 from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
 from smart_contracts.errors import std_errors as err
 from smart_contracts.proposal.enums import STATUS_BLOCKED, STATUS_REVIEWED
 from tests.common import CommitteeMember
-from tests.council.common import members_box_name, votes_box_name
+from tests.council.common import (
+    members_box_name,
+    tally_box_name,
+    voted_bitmap_box_name,
+)
 from tests.utils import ERROR_TO_REGEX
 
 
@@ -28,7 +40,10 @@ def test_vote_approve_success(
     proposal_id = approved_proposal_client.app_id
     half_plus_one = (len(council_members) // 2) + 1
 
-    refs = [BoxReference(app_id=0, name=votes_box_name(proposal_id))]
+    refs = [
+        BoxReference(app_id=0, name=tally_box_name(proposal_id)),
+        BoxReference(app_id=0, name=voted_bitmap_box_name(proposal_id)),
+    ]
     for member in council_members[:half_plus_one]:
         refs.append(
             BoxReference(app_id=0, name=members_box_name(member.account.address))
@@ -74,7 +89,10 @@ def test_vote_reject_success(
     proposal_id = approved_proposal_client.app_id
     half_plus_one = (len(council_members) // 2) + 1
 
-    refs = [BoxReference(app_id=0, name=votes_box_name(proposal_id))]
+    refs = [
+        BoxReference(app_id=0, name=tally_box_name(proposal_id)),
+        BoxReference(app_id=0, name=voted_bitmap_box_name(proposal_id)),
+    ]
     for member in council_members[:half_plus_one]:
         refs.append(
             BoxReference(app_id=0, name=members_box_name(member.account.address))
@@ -121,7 +139,8 @@ def test_vote_mix_success(
     half_plus_one = (len(council_members) // 2) + 1
 
     refs: list[BoxReference] = [
-        BoxReference(app_id=0, name=votes_box_name(proposal_id))
+        BoxReference(app_id=0, name=tally_box_name(proposal_id)),
+        BoxReference(app_id=0, name=voted_bitmap_box_name(proposal_id)),
     ]
     for member in council_members:
         refs.append(
@@ -251,3 +270,188 @@ def test_vote_not_a_proposal(
 
     with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.VOTER_NOT_FOUND]):
         composer.send()
+
+
+def test_vote_already_voted(
+    min_fee_times_3: AlgoAmount,
+    council_members: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    proposal_id = approved_proposal_client.app_id
+    member = council_members[0]
+    params = CommonAppCallParams(
+        sender=member.account.address,
+        signer=member.account.signer,
+        static_fee=min_fee_times_3,
+    )
+
+    council_client.send.vote(
+        args=VoteArgs(proposal_id=proposal_id, block=False), params=params
+    )
+
+    tally = council_client.state.box.tallies.get_value(proposal_id)
+    assert (tally.approvals, tally.rejections) == (1, 0)
+
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.VOTER_ALREADY_VOTED]):
+        council_client.send.vote(
+            args=VoteArgs(proposal_id=proposal_id, block=True),
+            # Distinguishes the otherwise identical transaction
+            params=CommonAppCallParams(
+                sender=member.account.address,
+                signer=member.account.signer,
+                static_fee=min_fee_times_3,
+                note=b"again",
+            ),
+        )
+
+
+def test_vote_member_removed_and_added_again(
+    min_fee_times_3: AlgoAmount,
+    committee_manager: SigningAccount,
+    council_members: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    proposal_id = approved_proposal_client.app_id
+    member = council_members[0]
+    council_client.send.vote(
+        args=VoteArgs(proposal_id=proposal_id, block=False),
+        params=CommonAppCallParams(
+            sender=member.account.address,
+            signer=member.account.signer,
+            static_fee=min_fee_times_3,
+        ),
+    )
+    ordinal = council_client.state.box.members.get_value(member.account.address)
+
+    council_client.send.remove_member(
+        args=RemoveMemberArgs(address=member.account.address),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+    council_client.send.add_member(
+        args=AddMemberArgs(address=member.account.address),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+
+    # The member gets its ordinal back, thus its voted bit
+    assert council_client.state.box.members.get_value(member.account.address) == ordinal
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.VOTER_ALREADY_VOTED]):
+        council_client.send.vote(
+            args=VoteArgs(proposal_id=proposal_id, block=False),
+            params=CommonAppCallParams(
+                sender=member.account.address,
+                signer=member.account.signer,
+                static_fee=min_fee_times_3,
+                note=b"again",
+            ),
+        )
+    tally = council_client.state.box.tallies.get_value(proposal_id)
+    assert (tally.approvals, tally.rejections) == (1, 0)
+
+
+def test_vote_member_added_after_first_vote(
+    algorand_client: AlgorandClient,
+    min_fee_times_3: AlgoAmount,
+    committee_manager: SigningAccount,
+    council_members: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    proposal_id = approved_proposal_client.app_id
+    member = council_members[0]
+    council_client.send.vote(
+        args=VoteArgs(proposal_id=proposal_id, block=True),
+        params=CommonAppCallParams(
+            sender=member.account.address,
+            signer=member.account.signer,
+            static_fee=min_fee_times_3,
+        ),
+    )
+    bitmap_size = len(council_client.state.box.voted_bitmap.get_value(proposal_id))
+
+    # Enough new members to need a larger voted bitmap
+    new_members = [algorand_client.account.random() for _ in range(9)]
+    for account in new_members:
+        council_client.send.add_member(
+            args=AddMemberArgs(address=account.address),
+            params=CommonAppCallParams(sender=committee_manager.address),
+        )
+
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=new_members[-1],
+        min_spending_balance=AlgoAmount(algo=1),
+    )
+    council_client.send.vote(
+        args=VoteArgs(proposal_id=proposal_id, block=True),
+        params=CommonAppCallParams(
+            sender=new_members[-1].address,
+            signer=new_members[-1].signer,
+            static_fee=min_fee_times_3,
+        ),
+    )
+
+    tally = council_client.state.box.tallies.get_value(proposal_id)
+    assert (tally.approvals, tally.rejections) == (0, 2)
+    assert (
+        len(council_client.state.box.voted_bitmap.get_value(proposal_id)) > bitmap_size
+    )
+
+
+def test_vote_migrates_legacy_votes(
+    deployer: SigningAccount,
+    min_fee_times_3: AlgoAmount,
+    committee: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    legacy_council_client: AppClient,
+) -> None:
+    proposal_id = approved_proposal_client.app_id
+    half_plus_one = (len(committee) // 2) + 1
+    legacy_voter, *members = committee[:half_plus_one]
+
+    # A review in flight during the update to the tallies
+    legacy_council_client.send.call(
+        AppClientMethodCallParams(
+            method="vote",
+            args=[proposal_id, False],
+            sender=legacy_voter.account.address,
+            signer=legacy_voter.account.signer,
+            static_fee=min_fee_times_3,
+        )
+    )
+    council_client = CouncilClient(
+        algorand=legacy_council_client.algorand,
+        app_id=legacy_council_client.app_id,
+    )
+    council_client.send.update.update_council(
+        compilation_params=AppClientCompilationParams(
+            deploy_time_params={"entropy": b""}
+        ),
+        params=CommonAppCallParams(sender=deployer.address, signer=deployer.signer),
+    )
+    assert council_client.state.box.legacy_votes.get_map()
+
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.VOTER_ALREADY_VOTED]):
+        council_client.send.vote(
+            args=VoteArgs(proposal_id=proposal_id, block=False),
+            params=CommonAppCallParams(
+                sender=legacy_voter.account.address,
+                signer=legacy_voter.account.signer,
+                static_fee=min_fee_times_3,
+            ),
+        )
+
+    # The legacy vote counts towards the majority
+    for member in members:
+        council_client.send.vote(
+            args=VoteArgs(proposal_id=proposal_id, block=False),
+            params=CommonAppCallParams(
+                sender=member.account.address,
+                signer=member.account.signer,
+                static_fee=min_fee_times_3,
+            ),
+        )
+
+    global_state = approved_proposal_client.state.global_state.get_all()
+    assert global_state.get("status") == STATUS_REVIEWED
+    assert not council_client.state.box.legacy_votes.get_map()
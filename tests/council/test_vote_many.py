@@ -0,0 +1,127 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.council.council_client import (
+    CouncilClient,
+    VoteManyArgs,
+)
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.errors import std_errors as err
+from smart_contracts.proposal.enums import STATUS_BLOCKED, STATUS_REVIEWED
+from tests.common import CommitteeMember
+from tests.utils import ERROR_TO_REGEX
+
+
+def _params(member: CommitteeMember, static_fee: AlgoAmount) -> CommonAppCallParams:
+    return CommonAppCallParams(
+        sender=member.account.address,
+        signer=member.account.signer,
+        static_fee=static_fee,
+    )
+
+
+def test_vote_many_success(
+    min_fee_times_3: AlgoAmount,
+    council_members: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    second_approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    half_plus_one = (len(council_members) // 2) + 1
+    votes = [
+        (approved_proposal_client.app_id, False),
+        (second_approved_proposal_client.app_id, True),
+    ]
+
+    for member in council_members[:half_plus_one]:
+        council_client.send.vote_many(
+            args=VoteManyArgs(votes=votes),
+            params=_params(member, min_fee_times_3),
+        )
+
+    # Both proposals are reviewed by the deciding call
+    assert approved_proposal_client.state.global_state.status == STATUS_REVIEWED
+    assert second_approved_proposal_client.state.global_state.status == STATUS_BLOCKED
+    assert council_client.state.box.tallies.get_map() == {}
+
+
+def test_vote_many_empty(
+    council_members: list[CommitteeMember],
+    council_client: CouncilClient,
+) -> None:
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.EMPTY_PAYLOAD]):
+        council_client.send.vote_many(
+            args=VoteManyArgs(votes=[]),
+            params=CommonAppCallParams(sender=council_members[0].account.address),
+        )
+
+
+def test_vote_many_not_member(
+    min_fee_times_3: AlgoAmount,
+    no_role_account: SigningAccount,
+    approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.VOTER_NOT_FOUND]):
+        council_client.send.vote_many(
+            args=VoteManyArgs(votes=[(approved_proposal_client.app_id, False)]),
+            params=CommonAppCallParams(
+                sender=no_role_account.address, static_fee=min_fee_times_3
+            ),
+        )
+
+
+def test_vote_many_not_a_proposal(
+    min_fee_times_3: AlgoAmount,
+    council_members: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    registry_app_id = council_client.state.global_state.registry_app_id
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.INVALID_PROPOSAL]):
+        council_client.send.vote_many(
+            args=VoteManyArgs(
+                votes=[
+                    (approved_proposal_client.app_id, False),
+                    (registry_app_id, False),
+                ]
+            ),
+            params=_params(council_members[0], min_fee_times_3),
+        )
+
+    # The whole call is reverted
+    assert council_client.state.box.tallies.get_map() == {}
+
+
+def test_vote_many_duplicate_proposal(
+    min_fee_times_3: AlgoAmount,
+    council_members: list[CommitteeMember],
+    approved_proposal_client: ProposalClient,
+    second_approved_proposal_client: ProposalClient,
+    council_client: CouncilClient,
+) -> None:
+    proposal_id = approved_proposal_client.app_id
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.DUPLICATE_PROPOSAL]):
+        council_client.send.vote_many(
+            args=VoteManyArgs(votes=[(proposal_id, False), (proposal_id, True)]),
+            params=_params(council_members[0], min_fee_times_3),
+        )
+
+    # Duplicates are rejected before any vote, wherever they are in the list
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.DUPLICATE_PROPOSAL]):
+        council_client.send.vote_many(
+            args=VoteManyArgs(
+                votes=[
+                    (proposal_id, False),
+                    (second_approved_proposal_client.app_id, False),
+                    (proposal_id, False),
+                ]
+            ),
+            params=_params(council_members[0], min_fee_times_3),
+        )
+    assert council_client.state.box.tallies.get_map() == {}
@@ -26,12 +26,14 @@ from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
 from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
     FinalizeProposalArgs,
     UnassignAbsenteeFromProposalArgs,
+    UnassignAbsenteeFromProposalWithProofArgs,
     XgovRegistryMockClient,
     XgovRegistryMockComposer,
 )
 from smart_contracts.proposal.config import (
     GLOBAL_BYTES,
     GLOBAL_UINTS,
+    VOTED_BITMAP_BOX_KEY_PREFIX,
     VOTER_BOX_KEY_PREFIX,
 )
 from smart_contracts.proposal.enums import (
@@ -50,6 +52,7 @@ from smart_contracts.proposal.enums import (
     STATUS_VOTING,
 )
 from smart_contracts.xgov_registry import config as reg_cfg
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMembershipProof
 from smart_contracts.xgov_registry.constants import PROPOSAL_APPROVAL_PAGES
 from tests.common import (
     DEFAULT_COMMITTEE_ID,
@@ -93,6 +96,10 @@ def get_voter_box_key(voter_address: str) -> bytes:
     return VOTER_BOX_KEY_PREFIX.encode() + decode_address(voter_address)  # type: ignore
 
 
+def get_voted_bitmap_box_key(page: int) -> bytes:
+    return VOTED_BITMAP_BOX_KEY_PREFIX.encode() + page.to_bytes(8, "big")
+
+
 def get_locked_amount(requested_amount: AlgoAmount) -> AlgoAmount:
     return AlgoAmount(
         micro_algo=relative_to_absolute_amount(
@@ -695,6 +702,25 @@ def unassign_absentees(
         )
 
 
+def unassign_absentee_with_proof(
+    xgov_registry_client_composer: XgovRegistryMockComposer,
+    proposal_app_id: int,
+    membership: CommitteeMembershipProof,
+    *,
+    static_fee: AlgoAmount = AlgoAmount(micro_algo=MIN_TXN_FEE * 2),  # noqa: B008
+) -> None:
+    xgov_registry_client_composer.unassign_absentee_from_proposal_with_proof(
+        args=UnassignAbsenteeFromProposalWithProofArgs(
+            proposal_id=proposal_app_id,
+            xgov_address=membership.address,
+            voting_power=membership.votes,
+            ordinal=membership.ordinal,
+            proof=list(membership.proof),
+        ),
+        params=CommonAppCallParams(static_fee=static_fee),
+    )
+
+
 def assign_voters(
     proposal_client_composer: ProposalComposer,
     committee: list[CommitteeMember],
@@ -9,11 +9,13 @@ from algokit_utils.config import config
 
 from smart_contracts.artifacts.proposal.proposal_client import (
     ProposalClient,
+    ProposalFactory,
     ReviewArgs,
 )
 from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
     CreateEmptyProposalArgs,
     DeclareCommitteeArgs,
+    DeclareCommitteeWithRootArgs,
     PayGrantProposalArgs,
     SetXgovCouncilArgs,
     SetXgovDaemonArgs,
@@ -21,7 +23,10 @@ from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client impo
     XgovRegistryMockClient,
     XgovRegistryMockFactory,
 )
+from smart_contracts.xgov_registry.committee_assign import assign_committee_to_buckets
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
 from smart_contracts.xgov_registry.config import MAX_REQUESTED_AMOUNT_LARGE
+from smart_contracts.xgov_registry.helpers import plan_proposal_program_upload
 from tests.common import (
     DEFAULT_COMMITTEE_ID,
     DEFAULT_COMMITTEE_MEMBERS,
@@ -72,6 +77,21 @@ def xgov_registry_mock_client(
         min_spending_balance=AlgoAmount(micro_algo=int(INITIAL_FUNDS.micro_algo) * 100),
     )
 
+    # The mock creates Proposals from the loaded Approval Program, as the xGov Registry
+    approval_program = (
+        algorand_client.client.get_typed_app_factory(typed_factory=ProposalFactory)
+        .app_factory.compile()
+        .approval_program
+    )
+    plan = plan_proposal_program_upload(approval_program, None)
+    for init_size, chunks in plan.groups():
+        composer = client.new_group()
+        if init_size is not None:
+            composer.init_proposal_contract(args=(init_size,))
+        for offset, chunk in chunks:
+            composer.load_proposal_contract(args=(offset, chunk))
+        composer.send()
+
     client.send.set_xgov_daemon(args=SetXgovDaemonArgs(xgov_daemon=xgov_daemon.address))
     client.send.set_xgov_council(args=SetXgovCouncilArgs(council=xgov_council.address))
     client.send.declare_committee(
@@ -110,6 +130,57 @@ def proposal_client(
     return client
 
 
+@pytest.fixture(scope="function")
+def merkle_voting_proposal_client(
+    algorand_client: AlgorandClient,
+    min_fee_times_3: AlgoAmount,
+    proposer: SigningAccount,
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+) -> ProposalClient:
+    xgov_registry_mock_client.send.declare_committee_with_root(
+        args=DeclareCommitteeWithRootArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=committee_tree.size,
+            votes=committee_tree.votes,
+            committee_root=committee_tree.root,
+        )
+    )
+    try:
+        proposal_app_id = xgov_registry_mock_client.send.create_empty_proposal(
+            args=CreateEmptyProposalArgs(proposer=proposer.address),
+            params=CommonAppCallParams(static_fee=min_fee_times_3),
+        ).abi_return
+    finally:
+        # Restore the committee without root for the other fixtures
+        xgov_registry_mock_client.send.declare_committee(
+            args=DeclareCommitteeArgs(
+                committee_id=DEFAULT_COMMITTEE_ID,
+                size=DEFAULT_COMMITTEE_MEMBERS,
+                votes=DEFAULT_COMMITTEE_VOTES,
+            )
+        )
+
+    client = ProposalClient(
+        algorand=algorand_client,
+        app_id=proposal_app_id,  # type: ignore
+    )
+    open_proposal(client, algorand_client, proposer)
+    # The voting opens on submission, without voters assignment
+    submit_proposal(client, xgov_registry_mock_client, proposer)
+    return client
+
+
+@pytest.fixture(scope="function")
+def merkle_rejected_proposal_client(
+    no_role_account: SigningAccount,
+    min_fee_times_2: AlgoAmount,
+    merkle_voting_proposal_client: ProposalClient,
+) -> ProposalClient:
+    scrutinize_proposal(no_role_account, merkle_voting_proposal_client, min_fee_times_2)
+    return merkle_voting_proposal_client
+
+
 @pytest.fixture(scope="function")
 def draft_proposal_client(
     algorand_client: AlgorandClient,
@@ -151,6 +222,21 @@ def voting_proposal_client(
     return submitted_proposal_client
 
 
+@pytest.fixture(scope="function")
+def bucketed_voting_proposal_client(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> ProposalClient:
+    assign_committee_to_buckets(
+        submitted_proposal_client,
+        [(cm.account.address, cm.votes) for cm in committee],
+        sender=xgov_daemon.address,
+        signer=xgov_daemon.signer,
+    )
+    return submitted_proposal_client
+
+
 @pytest.fixture(scope="function")
 def rejected_proposal_client(
     no_role_account: SigningAccount,
@@ -0,0 +1,224 @@
+"""
+Vectorized what-if analysis of the Proposal approval rules.
+
+The quorum thresholds (`compute_quorum_threshold`,
+`compute_weighted_quorum_threshold`) and the approval outcome
+(`is_proposal_approved`) of the Proposal contract are evaluated over NumPy arrays
+in a single pass, with the contract uint64 integer semantics: floor divisions,
+and masked cells where the AVM would fail (underflow, overflow, division by
+zero), so that a grid is never rejected because of some of its cells.
+
+Every input broadcasts against the others, so grids of requested amounts,
+committees, vote distributions and xGov Registry configuration values are built
+with `numpy.ix_` (or explicit new axes), e.g. to tune the quorums against the
+historical turnout:
+
+    params = QuorumParams.from_config(
+        config, quorum_small=np.arange(1_000, 5_001, 500)[:, None]
+    )
+    approved = are_proposals_approved(params, requested_amount=amounts, ...)
+
+The results match the scalar reference model in
+`smart_contracts/proposal/emulator.py`. NumPy is a development dependency, so
+the analysis lives with the tests.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    XGovRegistryConfig,
+)
+from smart_contracts.proposal import constants as const
+from smart_contracts.proposal.emulator import RegistryConfig
+
+UInt64Array = np.ma.MaskedArray[tuple[int, ...], np.dtype[np.uint64]]
+BoolArray = np.ma.MaskedArray[tuple[int, ...], np.dtype[np.bool_]]
+
+
+def as_uint64(values: ArrayLike, name: str) -> UInt64Array:
+    """
+    Reads `values` as AVM uint64, masking the negative values.
+
+    Raises:
+        TypeError: If the values are not integers
+    """
+    array = np.ma.asarray(values)
+    if array.dtype == np.bool_ or not np.issubdtype(array.dtype, np.integer):
+        raise TypeError(f"{name} must be integers, got {array.dtype}")
+    negative = array < 0 if np.issubdtype(array.dtype, np.signedinteger) else False
+    return np.ma.masked_where(negative, array.astype(np.uint64))
+
+
+def _masked_where(invalid: BoolArray, values: UInt64Array) -> UInt64Array:
+    return np.ma.masked_where(np.broadcast_to(invalid, values.shape), values)
+
+
+def _sub(minuend: UInt64Array, subtrahend: UInt64Array) -> UInt64Array:
+    return _masked_where(minuend < subtrahend, minuend - subtrahend)
+
+
+def _add(augend: UInt64Array, addend: UInt64Array) -> UInt64Array:
+    total = augend + addend
+    # The sum wraps around on overflow, the AVM fails instead
+    return _masked_where(total < augend, total)
+
+
+def _mul(multiplicand: UInt64Array, multiplier: UInt64Array) -> UInt64Array:
+    product = multiplicand * multiplier
+    # The product wraps around on overflow, the AVM fails instead
+    divisor = np.ma.where(multiplicand == 0, np.uint64(1), multiplicand)
+    return _masked_where(
+        (multiplicand != 0) & (product // divisor != multiplier), product
+    )
+
+
+def _floordiv(dividend: UInt64Array, divisor: UInt64Array) -> UInt64Array:
+    by_zero = divisor == 0
+    quotient = dividend // np.ma.where(by_zero, np.uint64(1), divisor)
+    return _masked_where(by_zero, quotient)
+
+
+@dataclass(frozen=True, kw_only=True)
+class QuorumParams:
+    """xGov Registry configuration values of the quorums, as uint64 arrays"""
+
+    min_requested_amount: UInt64Array
+    max_requested_amount_large: UInt64Array
+    quorum_small: UInt64Array
+    quorum_large: UInt64Array
+    weighted_quorum_small: UInt64Array
+    weighted_quorum_large: UInt64Array
+
+    @classmethod
+    def from_config(
+        cls, config: RegistryConfig | XGovRegistryConfig, **overrides: ArrayLike
+    ) -> "QuorumParams":
+        """
+        Reads the values from a configuration, `overrides` replace some of them
+        with the values (or grid axes) to explore.
+        """
+        values: dict[str, ArrayLike]
+        if isinstance(config, XGovRegistryConfig):
+            values = {
+                "min_requested_amount": config.min_requested_amount,
+                "max_requested_amount_large": config.max_requested_amount[2],
+                "quorum_small": config.quorum[0],
+                "quorum_large": config.quorum[2],
+                "weighted_quorum_small": config.weighted_quorum[0],
+                "weighted_quorum_large": config.weighted_quorum[2],
+            }
+        else:
+            values = {
+                "min_requested_amount": config.min_requested_amount,
+                "max_requested_amount_large": config.max_requested_amount_large,
+                "quorum_small": config.quorum_small,
+                "quorum_large": config.quorum_large,
+                "weighted_quorum_small": config.weighted_quorum_small,
+                "weighted_quorum_large": config.weighted_quorum_large,
+            }
+        values.update(overrides)
+        return cls(**{name: as_uint64(value, name) for name, value in values.items()})
+
+
+def relative_to_absolute_amounts(
+    amount: ArrayLike, fraction_in_bps: ArrayLike
+) -> UInt64Array:
+    return _floordiv(
+        _mul(
+            as_uint64(amount, "amount"),
+            as_uint64(fraction_in_bps, "fraction_in_bps"),
+        ),
+        as_uint64(const.BPS, "BPS"),
+    )
+
+
+def _interpolate_bps(
+    requested_amount: ArrayLike,
+    min_bps: UInt64Array,
+    max_bps: UInt64Array,
+    params: QuorumParams,
+) -> UInt64Array:
+    # Linear in the requested amount, from `min_bps` at the min requested amount
+    # to `max_bps` at the max requested amount
+    delta_bps = _sub(max_bps, min_bps)
+    delta_amount = _sub(params.max_requested_amount_large, params.min_requested_amount)
+    amount_offset = _sub(
+        as_uint64(requested_amount, "requested_amount"), params.min_requested_amount
+    )
+    return _add(min_bps, _floordiv(_mul(delta_bps, amount_offset), delta_amount))
+
+
+def compute_quorum_thresholds(
+    params: QuorumParams, *, committee_members: ArrayLike, requested_amount: ArrayLike
+) -> UInt64Array:
+    """Voters quorum thresholds, as `Proposal.compute_quorum_threshold`"""
+    quorum_bps = _interpolate_bps(
+        requested_amount, params.quorum_small, params.quorum_large, params
+    )
+    return relative_to_absolute_amounts(committee_members, quorum_bps)
+
+
+def compute_weighted_quorum_thresholds(
+    params: QuorumParams, *, committee_votes: ArrayLike, requested_amount: ArrayLike
+) -> UInt64Array:
+    """Votes quorum thresholds, as `Proposal.compute_weighted_quorum_threshold`"""
+    weighted_quorum_bps = _interpolate_bps(
+        requested_amount,
+        params.weighted_quorum_small,
+        params.weighted_quorum_large,
+        params,
+    )
+    return relative_to_absolute_amounts(committee_votes, weighted_quorum_bps)
+
+
+def has_majority_approved(approvals: ArrayLike, rejections: ArrayLike) -> BoolArray:
+    # Null votes do not affect the relative majority
+    return as_uint64(approvals, "approvals") > as_uint64(rejections, "rejections")
+
+
+def are_proposals_approved(
+    params: QuorumParams,
+    *,
+    requested_amount: ArrayLike,
+    committee_members: ArrayLike,
+    committee_votes: ArrayLike,
+    voted_members: ArrayLike,
+    boycotted_members: ArrayLike,
+    approvals: ArrayLike,
+    rejections: ArrayLike,
+    nulls: ArrayLike,
+) -> BoolArray:
+    """
+    Scrutiny outcomes, as `Proposal.is_proposal_approved`: both quorums are
+    reached (boycotts do not count for the voters quorum, nulls count for both)
+    and approvals have the relative majority over rejections. The outcomes are
+    masked where the contract would fail.
+    """
+    quorum_threshold = compute_quorum_thresholds(
+        params, committee_members=committee_members, requested_amount=requested_amount
+    )
+    weighted_quorum_threshold = compute_weighted_quorum_thresholds(
+        params, committee_votes=committee_votes, requested_amount=requested_amount
+    )
+    approvals = as_uint64(approvals, "approvals")
+    rejections = as_uint64(rejections, "rejections")
+    cast_votes = _add(_add(approvals, rejections), as_uint64(nulls, "nulls"))
+
+    is_quorum_voters_reached = (quorum_threshold > 0) & (
+        _sub(
+            as_uint64(voted_members, "voted_members"),
+            as_uint64(boycotted_members, "boycotted_members"),
+        )
+        >= quorum_threshold
+    )
+    is_weighted_quorum_votes_reached = (weighted_quorum_threshold > 0) & (
+        cast_votes >= weighted_quorum_threshold
+    )
+    return np.ma.asarray(
+        is_quorum_voters_reached
+        & is_weighted_quorum_votes_reached
+        & has_majority_approved(approvals, rejections)
+    )
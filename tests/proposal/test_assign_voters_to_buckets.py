@@ -0,0 +1,282 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+from algosdk.encoding import decode_address
+
+from smart_contracts.artifacts.proposal.proposal_client import (
+    AssignVotersArgs,
+    AssignVotersToBucketsArgs,
+    GetVoterBoxArgs,
+    ProposalClient,
+    UnassignVotersArgs,
+)
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    VoteProposalArgs,
+    XgovRegistryMockClient,
+)
+from smart_contracts.errors import std_errors as err
+from smart_contracts.xgov_registry.box_names import get_voter_bucket_box_name
+from smart_contracts.xgov_registry.committee_assign import (
+    get_voter_bucket,
+    voter_buckets_count,
+)
+from tests.common import DEFAULT_MEMBER_VOTES, CommitteeMember
+from tests.proposal.common import (
+    assert_voting_proposal_global_state,
+)
+
+
+def _same_bucket_members(
+    committee: list[CommitteeMember],
+) -> tuple[CommitteeMember, CommitteeMember]:
+    buckets = voter_buckets_count(len(committee))
+    by_bucket: dict[int, list[CommitteeMember]] = {}
+    for cm in committee:
+        by_bucket.setdefault(get_voter_bucket(cm.account.address, buckets), []).append(
+            cm
+        )
+    members = next(members for members in by_bucket.values() if len(members) > 1)
+    first, second = sorted(
+        members[:2],
+        key=lambda cm: decode_address(cm.account.address),  # type: ignore
+    )
+    return first, second
+
+
+def test_assign_voters_to_buckets_success(
+    algorand_client: AlgorandClient,
+    committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    bucketed_voting_proposal_client: ProposalClient,
+) -> None:
+    assert_voting_proposal_global_state(
+        bucketed_voting_proposal_client,
+        proposer_address=proposer.address,
+        registry_app_id=xgov_registry_mock_client.app_id,
+        assigned_members=len(committee),
+        assigned_votes=DEFAULT_MEMBER_VOTES * len(committee),
+    )
+    buckets = bucketed_voting_proposal_client.state.global_state.voter_buckets
+    assert buckets == voter_buckets_count(len(committee))
+
+    # Each bucket holds its voters (address, votes) records sorted by address
+    for bucket in range(buckets):
+        members = sorted(
+            (
+                decode_address(cm.account.address)  # type: ignore
+                for cm in committee
+                if get_voter_bucket(cm.account.address, buckets) == bucket
+            ),
+        )
+        assert algorand_client.app.get_box_value(
+            bucketed_voting_proposal_client.app_id, get_voter_bucket_box_name(bucket)
+        ) == b"".join(
+            address + DEFAULT_MEMBER_VOTES.to_bytes(8, "big") for address in members
+        )
+
+    for cm in committee:
+        votes, exists = bucketed_voting_proposal_client.send.get_voter_box(
+            args=GetVoterBoxArgs(voter_address=cm.account.address),
+            params=CommonAppCallParams(sender=proposer.address),
+        ).abi_return
+        assert exists
+        assert votes == cm.votes
+
+
+def test_assign_voters_to_buckets_not_xgov_daemon(
+    committee_member: CommitteeMember,
+    proposer: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED):
+        submitted_proposal_client.send.assign_voters_to_buckets(
+            args=AssignVotersToBucketsArgs(
+                voters=[(committee_member.account.address, committee_member.votes)]
+            ),
+            params=CommonAppCallParams(sender=proposer.address),
+        )
+
+
+def test_assign_voters_to_buckets_not_sorted(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    first, second = _same_bucket_members(committee)
+
+    with pytest.raises(LogicError, match=err.VOTER_ALREADY_ASSIGNED):
+        submitted_proposal_client.send.assign_voters_to_buckets(
+            args=AssignVotersToBucketsArgs(
+                voters=[
+                    (second.account.address, second.votes),
+                    (first.account.address, first.votes),
+                ]
+            ),
+            params=CommonAppCallParams(sender=xgov_daemon.address),
+        )
+
+
+def test_assign_voters_to_buckets_already_assigned(
+    committee_member: CommitteeMember,
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    voters = [(committee_member.account.address, committee_member.votes)]
+    submitted_proposal_client.send.assign_voters_to_buckets(
+        args=AssignVotersToBucketsArgs(voters=voters),
+        params=CommonAppCallParams(sender=xgov_daemon.address),
+    )
+
+    with pytest.raises(LogicError, match=err.VOTER_ALREADY_ASSIGNED):
+        submitted_proposal_client.send.assign_voters_to_buckets(
+            args=AssignVotersToBucketsArgs(voters=voters),
+            params=CommonAppCallParams(sender=xgov_daemon.address, note=b"again"),
+        )
+
+
+def test_assign_voters_to_buckets_after_voter_boxes(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    submitted_proposal_client.send.assign_voters(
+        args=AssignVotersArgs(
+            voters=[(committee[0].account.address, committee[0].votes)]
+        ),
+        params=CommonAppCallParams(sender=xgov_daemon.address),
+    )
+
+    with pytest.raises(LogicError, match=err.VOTERS_ASSIGNED):
+        submitted_proposal_client.send.assign_voters_to_buckets(
+            args=AssignVotersToBucketsArgs(
+                voters=[(committee[1].account.address, committee[1].votes)]
+            ),
+            params=CommonAppCallParams(sender=xgov_daemon.address),
+        )
+
+
+def test_assign_voters_after_buckets(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    submitted_proposal_client.send.assign_voters_to_buckets(
+        args=AssignVotersToBucketsArgs(
+            voters=[(committee[0].account.address, committee[0].votes)]
+        ),
+        params=CommonAppCallParams(sender=xgov_daemon.address),
+    )
+
+    with pytest.raises(LogicError, match=err.VOTERS_ASSIGNED):
+        submitted_proposal_client.send.assign_voters(
+            args=AssignVotersArgs(
+                voters=[(committee[1].account.address, committee[1].votes)]
+            ),
+            params=CommonAppCallParams(sender=xgov_daemon.address),
+        )
+
+
+def test_unassign_bucket_voters(
+    algorand_client: AlgorandClient,
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    first, second = _same_bucket_members(committee)
+    voters = [
+        (first.account.address, first.votes),
+        (second.account.address, second.votes),
+    ]
+    submitted_proposal_client.send.assign_voters_to_buckets(
+        args=AssignVotersToBucketsArgs(voters=voters),
+        params=CommonAppCallParams(sender=xgov_daemon.address),
+    )
+
+    submitted_proposal_client.send.unassign_voters(
+        args=UnassignVotersArgs(voters=[first.account.address]),
+        params=CommonAppCallParams(sender=xgov_daemon.address),
+    )
+    assert submitted_proposal_client.state.global_state.assigned_members == 1
+
+    submitted_proposal_client.send.unassign_voters(
+        args=UnassignVotersArgs(voters=[second.account.address]),
+        params=CommonAppCallParams(sender=xgov_daemon.address),
+    )
+    assert submitted_proposal_client.state.global_state.assigned_members == 0
+    # Empty buckets are deleted
+    assert not [
+        box
+        for box in algorand_client.app.get_box_names(submitted_proposal_client.app_id)
+        if box.name_raw.startswith(get_voter_bucket_box_name(0)[:1])
+    ]
+
+    # The rolled back voters can be assigned again
+    submitted_proposal_client.send.assign_voters_to_buckets(
+        args=AssignVotersToBucketsArgs(voters=voters),
+        params=CommonAppCallParams(sender=xgov_daemon.address, note=b"again"),
+    )
+    assert submitted_proposal_client.state.global_state.assigned_members == 2
+
+
+def test_vote_bucket_voter(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    bucketed_voting_proposal_client: ProposalClient,
+) -> None:
+    vote_args = VoteProposalArgs(
+        proposal_id=bucketed_voting_proposal_client.app_id,
+        xgov_address=committee[0].account.address,
+        approval_votes=committee[0].votes,
+        rejection_votes=0,
+    )
+    xgov_registry_mock_client.send.vote_proposal(
+        args=vote_args,
+        params=CommonAppCallParams(static_fee=min_fee_times_2),
+    )
+
+    assert_voting_proposal_global_state(
+        bucketed_voting_proposal_client,
+        proposer_address=proposer.address,
+        registry_app_id=xgov_registry_mock_client.app_id,
+        voted_members=1,
+        approvals=committee[0].votes,
+        assigned_members=len(committee) - 1,
+        assigned_votes=DEFAULT_MEMBER_VOTES * (len(committee) - 1),
+    )
+    _, exists = bucketed_voting_proposal_client.send.get_voter_box(
+        args=GetVoterBoxArgs(voter_address=committee[0].account.address),
+        params=CommonAppCallParams(sender=proposer.address),
+    ).abi_return
+    assert not exists
+
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        xgov_registry_mock_client.send.vote_proposal(
+            args=vote_args,
+            params=CommonAppCallParams(static_fee=min_fee_times_2, note=b"again"),
+        )
+
+
+def test_vote_bucket_not_committee_member(
+    min_fee_times_2: AlgoAmount,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    bucketed_voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        xgov_registry_mock_client.send.vote_proposal(
+            args=VoteProposalArgs(
+                proposal_id=bucketed_voting_proposal_client.app_id,
+                xgov_address=proposer.address,
+                approval_votes=42,
+                rejection_votes=0,
+            ),
+            params=CommonAppCallParams(static_fee=min_fee_times_2),
+        )
@@ -0,0 +1,546 @@
+import pytest
+from algokit_utils import (
+    AlgorandClient,
+    CommonAppCallParams,
+    PaymentParams,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.proposal.proposal_client import (
+    AssignVotersArgs,
+    AssignVotersToBucketsArgs,
+    GetVotedBitmapPageArgs,
+    GetVoterBoxArgs,
+    OpenArgs,
+    ProposalClient,
+    ReviewArgs,
+)
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    CreateEmptyProposalArgs,
+    DeclareCommitteeArgs,
+    DropProposalArgs,
+    FinalizeProposalArgs,
+    PayGrantProposalArgs,
+    VoteProposalArgs,
+    VoteProposalBatchArgs,
+    VoteProposalWithProofArgs,
+    XgovRegistryMockClient,
+)
+from smart_contracts.proposal.enums import FUNDING_PROACTIVE
+from smart_contracts.xgov_registry.committee_assign import (
+    max_voters_per_transaction,
+    plan_bucketed_voters_assignment,
+    plan_voters_assignment,
+    voter_buckets_count,
+)
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
+from smart_contracts.xgov_registry.constants import MAX_GROUP_SIZE
+from tests.benchmark import (
+    BENCHMARK_STATIC_FEE,
+    BenchmarkRecorder,
+    ContractBenchmark,
+    benchmark_params,
+)
+from tests.common import (
+    DEFAULT_COMMITTEE_ID,
+    DEFAULT_COMMITTEE_MEMBERS,
+    DEFAULT_COMMITTEE_VOTES,
+    DEFAULT_MEMBER_VOTES,
+    INITIAL_FUNDS,
+    CommitteeMember,
+)
+from tests.proposal.common import (
+    DEFAULT_FOCUS,
+    LOCKED_AMOUNT,
+    PROPOSAL_TITLE,
+    REQUESTED_AMOUNT,
+    assign_voters,
+    end_voting_session_time,
+    finalize_proposal,
+    open_proposal,
+    submit_proposal,
+    unassign_absentee_with_proof,
+    unassign_absentees,
+    unassign_voters,
+    upload_metadata,
+)
+from tests.utils import time_warp
+
+CONTRACT = "Proposal"
+
+# From one to several upload_metadata calls, see MAX_UPLOAD_PAYLOAD_SIZE
+METADATA_SIZES = [1, 1_024, 4_096]
+
+# Up to a full assign_voters group, the first call also references the registry
+COMMITTEE_SIZES = [
+    1,
+    max_voters_per_transaction(),
+    MAX_GROUP_SIZE * max_voters_per_transaction() - 1,
+]
+
+ABSENTEES_BATCH_LENGTHS = [1, 8, DEFAULT_COMMITTEE_MEMBERS]
+
+VOTE_BATCH_LENGTHS = [1, 8, DEFAULT_COMMITTEE_MEMBERS]
+
+_measure = ContractBenchmark(CONTRACT)
+
+
+def _declare_committee(
+    xgov_registry_mock_client: XgovRegistryMockClient, size: int, votes: int
+) -> None:
+    xgov_registry_mock_client.send.declare_committee(
+        args=DeclareCommitteeArgs(
+            committee_id=DEFAULT_COMMITTEE_ID, size=size, votes=votes
+        )
+    )
+
+
+def test_benchmark_create(
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group().create_empty_proposal(
+        args=CreateEmptyProposalArgs(proposer=proposer.address),
+        params=benchmark_params(),
+    )
+    _measure(benchmark_recorder, composer.composer(), "create")
+
+
+def test_benchmark_open(
+    algorand_client: AlgorandClient,
+    proposer: SigningAccount,
+    proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = proposal_client.new_group().open(
+        args=OpenArgs(
+            payment=algorand_client.create_transaction.payment(
+                PaymentParams(
+                    sender=proposer.address,
+                    receiver=proposal_client.app_address,
+                    amount=LOCKED_AMOUNT,
+                )
+            ),
+            title=PROPOSAL_TITLE,
+            funding_type=FUNDING_PROACTIVE,
+            requested_amount=REQUESTED_AMOUNT.amount_in_micro_algo,
+            focus=DEFAULT_FOCUS,
+        ),
+        params=benchmark_params(proposer),
+    )
+    _measure(benchmark_recorder, composer.composer(), "open")
+
+
+@pytest.mark.parametrize("metadata_size", METADATA_SIZES)
+def test_benchmark_upload_metadata(
+    metadata_size: int,
+    proposer: SigningAccount,
+    draft_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = draft_proposal_client.new_group()
+    upload_metadata(composer, proposer, b"M" * metadata_size)
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "upload_metadata",
+        f"metadata_size={metadata_size}",
+    )
+
+
+def test_benchmark_drop(
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    draft_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group().drop_proposal(
+        args=DropProposalArgs(proposal_id=draft_proposal_client.app_id),
+        params=benchmark_params(proposer),
+    )
+    _measure(benchmark_recorder, composer.composer(), "drop")
+
+
+def test_benchmark_submit(
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    draft_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    time_warp(
+        draft_proposal_client.state.global_state.open_ts
+        + xgov_registry_mock_client.state.global_state.discussion_duration_large
+    )
+    composer = draft_proposal_client.new_group().submit(
+        params=benchmark_params(proposer)
+    )
+    _measure(benchmark_recorder, composer.composer(), "submit")
+
+
+@pytest.mark.parametrize("committee_size", COMMITTEE_SIZES)
+def test_benchmark_assign_voters(
+    committee_size: int,
+    algorand_client: AlgorandClient,
+    proposer: SigningAccount,
+    xgov_daemon: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    committee = [
+        (algorand_client.account.random().address, DEFAULT_MEMBER_VOTES)
+        for _ in range(committee_size)
+    ]
+    proposal_client = _submitted_proposal(
+        algorand_client, proposer, xgov_registry_mock_client, committee_size
+    )
+
+    (group,) = plan_voters_assignment(committee).groups
+    composer = proposal_client.new_group()
+    for voters in group:
+        composer.assign_voters(
+            args=AssignVotersArgs(voters=list(voters)),
+            params=CommonAppCallParams(sender=xgov_daemon.address),
+        )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "assign_voters",
+        f"committee_size={committee_size}",
+    )
+
+
+@pytest.mark.parametrize("committee_size", COMMITTEE_SIZES)
+def test_benchmark_assign_voters_to_buckets(
+    committee_size: int,
+    algorand_client: AlgorandClient,
+    proposer: SigningAccount,
+    xgov_daemon: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    committee = [
+        (algorand_client.account.random().address, DEFAULT_MEMBER_VOTES)
+        for _ in range(committee_size)
+    ]
+    proposal_client = _submitted_proposal(
+        algorand_client, proposer, xgov_registry_mock_client, committee_size
+    )
+
+    (group,) = plan_bucketed_voters_assignment(
+        committee, buckets=voter_buckets_count(committee_size)
+    ).groups
+    composer = proposal_client.new_group()
+    for voters in group:
+        composer.assign_voters_to_buckets(
+            args=AssignVotersToBucketsArgs(voters=list(voters)),
+            params=CommonAppCallParams(sender=xgov_daemon.address),
+        )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "assign_voters_to_buckets",
+        f"committee_size={committee_size}",
+    )
+
+
+def _submitted_proposal(
+    algorand_client: AlgorandClient,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    committee_size: int,
+) -> ProposalClient:
+    # The Proposal reads the committee from the registry on creation
+    _declare_committee(
+        xgov_registry_mock_client,
+        committee_size,
+        committee_size * DEFAULT_MEMBER_VOTES,
+    )
+    try:
+        proposal_app_id = xgov_registry_mock_client.send.create_empty_proposal(
+            args=CreateEmptyProposalArgs(proposer=proposer.address),
+            params=benchmark_params(),
+        ).abi_return
+    finally:
+        _declare_committee(
+            xgov_registry_mock_client,
+            DEFAULT_COMMITTEE_MEMBERS,
+            DEFAULT_COMMITTEE_VOTES,
+        )
+
+    proposal_client = ProposalClient(
+        algorand=algorand_client,
+        app_id=proposal_app_id,  # type: ignore
+    )
+    open_proposal(proposal_client, algorand_client, proposer)
+    submit_proposal(proposal_client, xgov_registry_mock_client, proposer)
+    # Voter Boxes MBR
+    algorand_client.account.ensure_funded_from_environment(
+        account_to_fund=proposal_client.app_address,
+        min_spending_balance=INITIAL_FUNDS,
+    )
+    return proposal_client
+
+
+def test_benchmark_vote(
+    committee: list[CommitteeMember],
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group().vote_proposal(
+        args=VoteProposalArgs(
+            proposal_id=voting_proposal_client.app_id,
+            xgov_address=committee[0].account.address,
+            approval_votes=committee[0].votes,
+            rejection_votes=0,
+        ),
+        params=benchmark_params(),
+    )
+    _measure(benchmark_recorder, composer.composer(), "vote")
+
+
+@pytest.mark.parametrize("batch_length", VOTE_BATCH_LENGTHS)
+def test_benchmark_vote_batch(
+    batch_length: int,
+    committee: list[CommitteeMember],
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group().vote_proposal_batch(
+        args=VoteProposalBatchArgs(
+            proposal_id=voting_proposal_client.app_id,
+            votes=[
+                (cm.account.address, cm.votes, 0) for cm in committee[:batch_length]
+            ],
+        ),
+        params=benchmark_params(),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote_batch",
+        f"batch_length={batch_length}",
+    )
+
+
+def test_benchmark_vote_with_proof(
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    composer = xgov_registry_mock_client.new_group().vote_proposal_with_proof(
+        args=VoteProposalWithProofArgs(
+            proposal_id=merkle_voting_proposal_client.app_id,
+            xgov_address=membership.address,
+            voting_power=membership.votes,
+            ordinal=membership.ordinal,
+            proof=list(membership.proof),
+            approval_votes=membership.votes,
+            rejection_votes=0,
+        ),
+        params=benchmark_params(),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote_with_proof",
+        f"committee_size={committee_tree.size}",
+    )
+
+
+def test_benchmark_scrutiny(
+    no_role_account: SigningAccount,
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    end_voting_session_time(voting_proposal_client)
+    composer = voting_proposal_client.new_group().scrutiny(
+        params=benchmark_params(no_role_account)
+    )
+    _measure(benchmark_recorder, composer.composer(), "scrutiny")
+
+
+@pytest.mark.parametrize("batch_length", ABSENTEES_BATCH_LENGTHS)
+def test_benchmark_unassign_absentees(
+    batch_length: int,
+    committee: list[CommitteeMember],
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    rejected_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentees(
+        composer,
+        rejected_proposal_client.app_id,
+        committee[:batch_length],
+        static_fee=BENCHMARK_STATIC_FEE,
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "unassign_absentees",
+        f"absentees={batch_length}",
+    )
+
+
+def test_benchmark_unassign_absentee_with_proof(
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_rejected_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentee_with_proof(
+        composer,
+        merkle_rejected_proposal_client.app_id,
+        committee_tree.proof(committee[0].account.address),
+        static_fee=BENCHMARK_STATIC_FEE,
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "unassign_absentee_with_proof",
+        f"committee_size={committee_tree.size}",
+    )
+
+
+def test_benchmark_review(
+    xgov_council: SigningAccount,
+    cleaned_approved_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = cleaned_approved_proposal_client.new_group().review(
+        args=ReviewArgs(block=False),
+        params=benchmark_params(xgov_council),
+    )
+    _measure(benchmark_recorder, composer.composer(), "review")
+
+
+def test_benchmark_fund(
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    reviewed_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group().pay_grant_proposal(
+        args=PayGrantProposalArgs(proposal_id=reviewed_proposal_client.app_id),
+        params=benchmark_params(),
+    )
+    _measure(benchmark_recorder, composer.composer(), "fund")
+
+
+def test_benchmark_unassign_voters(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    submitted_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    voters = committee[: max_voters_per_transaction()]
+    composer = submitted_proposal_client.new_group()
+    assign_voters(composer, voters, xgov_daemon)
+    composer.send()
+
+    composer = submitted_proposal_client.new_group()
+    unassign_voters(composer, voters, xgov_daemon)
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "unassign_voters",
+        f"voters={len(voters)}",
+    )
+
+
+def test_benchmark_finalize(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    rejected_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentees(composer, rejected_proposal_client.app_id, committee)
+    composer.send()
+
+    composer = xgov_registry_mock_client.new_group().finalize_proposal(
+        args=FinalizeProposalArgs(proposal_id=rejected_proposal_client.app_id),
+        params=benchmark_params(xgov_daemon),
+    )
+    _measure(benchmark_recorder, composer.composer(), "finalize")
+
+
+def test_benchmark_delete(
+    committee: list[CommitteeMember],
+    xgov_daemon: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    rejected_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentees(composer, rejected_proposal_client.app_id, committee)
+    composer.send()
+    finalize_proposal(
+        xgov_registry_mock_client, rejected_proposal_client.app_id, xgov_daemon
+    )
+
+    composer = rejected_proposal_client.new_group().delete.delete(
+        params=benchmark_params(xgov_daemon)
+    )
+    _measure(benchmark_recorder, composer.composer(), "delete")
+
+
+def test_benchmark_get_state(
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = voting_proposal_client.new_group().get_state()
+    _measure(benchmark_recorder, composer.composer(), "get_state")
+
+
+def test_benchmark_get_state_version(
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = voting_proposal_client.new_group().get_state_version()
+    _measure(benchmark_recorder, composer.composer(), "get_state_version")
+
+
+def test_benchmark_get_voter_box(
+    committee: list[CommitteeMember],
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = voting_proposal_client.new_group().get_voter_box(
+        args=GetVoterBoxArgs(voter_address=committee[0].account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "get_voter_box")
+
+
+def test_benchmark_get_voted_bitmap_page(
+    merkle_voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = merkle_voting_proposal_client.new_group().get_voted_bitmap_page(
+        args=GetVotedBitmapPageArgs(page=0)
+    )
+    _measure(benchmark_recorder, composer.composer(), "get_voted_bitmap_page")
+
+
+def test_benchmark_get_voting_state(
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = voting_proposal_client.new_group().get_voting_state()
+    _measure(benchmark_recorder, composer.composer(), "get_voting_state")
+
+
+def test_benchmark_op_up(
+    proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = proposal_client.new_group().op_up()
+    _measure(benchmark_recorder, composer.composer(), "op_up")
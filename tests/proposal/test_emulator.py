@@ -0,0 +1,346 @@
+import random
+
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, SigningAccount
+from algosdk import account, encoding
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    VoteProposalBatchArgs,
+    XgovRegistryMockClient,
+)
+from smart_contracts.errors import std_errors as err
+from smart_contracts.proposal import constants as const
+from smart_contracts.proposal import enums as enm
+from smart_contracts.proposal.emulator import (
+    ProposalEmulator,
+    ProposalEmulatorError,
+    RegistryConfig,
+    compute_quorum_threshold,
+    compute_weighted_quorum_threshold,
+    relative_to_absolute_amount,
+)
+from smart_contracts.xgov_registry import config as reg_cfg
+from smart_contracts.xgov_registry.committee_assign import (
+    get_voter_bucket,
+    voter_buckets_count,
+)
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
+from tests.common import CommitteeMember
+
+DAEMON = account.generate_account()[1]  # type: ignore[no-untyped-call]
+COUNCIL = account.generate_account()[1]  # type: ignore[no-untyped-call]
+PROPOSER = account.generate_account()[1]  # type: ignore[no-untyped-call]
+REGISTRY = account.generate_account()[1]  # type: ignore[no-untyped-call]
+REGISTRY_APP_ID = 1001
+MEMBERS = 10
+MEMBER_VOTES = 10
+REQUESTED_AMOUNT = reg_cfg.MIN_REQUESTED_AMOUNT
+LOCKED_AMOUNT = relative_to_absolute_amount(
+    REQUESTED_AMOUNT, reg_cfg.PROPOSAL_COMMITMENT_BPS
+)
+DAEMON_FUNDING = relative_to_absolute_amount(
+    reg_cfg.OPEN_PROPOSAL_FEE, reg_cfg.DAEMON_OPS_FUNDING_BPS
+)
+
+
+def _voters(count: int = MEMBERS) -> list[tuple[str, int]]:
+    return [
+        (account.generate_account()[1], MEMBER_VOTES)  # type: ignore[no-untyped-call]
+        for _ in range(count)
+    ]
+
+
+def _config(**overrides: object) -> RegistryConfig:
+    values: dict[str, object] = {
+        "xgov_daemon": DAEMON,
+        "xgov_council": COUNCIL,
+        "committee_id": b"\x01" * 32,
+        "committee_members": MEMBERS,
+        "committee_votes": MEMBERS * MEMBER_VOTES,
+        "open_proposal_fee": reg_cfg.OPEN_PROPOSAL_FEE,
+        "daemon_ops_funding_bps": reg_cfg.DAEMON_OPS_FUNDING_BPS,
+        "proposal_commitment_bps": reg_cfg.PROPOSAL_COMMITMENT_BPS,
+        "min_requested_amount": reg_cfg.MIN_REQUESTED_AMOUNT,
+        "max_requested_amount_small": reg_cfg.MAX_REQUESTED_AMOUNT_SMALL,
+        "max_requested_amount_medium": reg_cfg.MAX_REQUESTED_AMOUNT_MEDIUM,
+        "max_requested_amount_large": reg_cfg.MAX_REQUESTED_AMOUNT_LARGE,
+        "discussion_duration_small": reg_cfg.DISCUSSION_DURATION_SMALL,
+        "discussion_duration_medium": reg_cfg.DISCUSSION_DURATION_MEDIUM,
+        "discussion_duration_large": reg_cfg.DISCUSSION_DURATION_LARGE,
+        "voting_duration_small": reg_cfg.VOTING_DURATION_SMALL,
+        "voting_duration_medium": reg_cfg.VOTING_DURATION_MEDIUM,
+        "voting_duration_large": reg_cfg.VOTING_DURATION_LARGE,
+        "quorum_small": reg_cfg.QUORUM_SMALL,
+        "quorum_large": reg_cfg.QUORUM_LARGE,
+        "weighted_quorum_small": reg_cfg.WEIGHTED_QUORUM_SMALL,
+        "weighted_quorum_large": reg_cfg.WEIGHTED_QUORUM_LARGE,
+    }
+    values.update(overrides)
+    return RegistryConfig.from_global_state(values)
+
+
+def _submitted(config: RegistryConfig | None = None) -> ProposalEmulator:
+    proposal = ProposalEmulator(
+        config or _config(),
+        proposer=PROPOSER,
+        registry_app_id=REGISTRY_APP_ID,
+        registry_address=REGISTRY,
+        balance=reg_cfg.OPEN_PROPOSAL_FEE,
+    )
+    proposal.open(
+        sender=PROPOSER,
+        title="Test Proposal",
+        funding_type=enm.FUNDING_RETROACTIVE,
+        requested_amount=REQUESTED_AMOUNT,
+        focus=42,
+        payment_amount=LOCKED_AMOUNT,
+    )
+    proposal.upload_metadata(sender=PROPOSER, payload=b"META", is_first_in_group=True)
+    proposal.now += proposal.discussion_duration
+    proposal.submit(sender=PROPOSER)
+    return proposal
+
+
+@pytest.fixture()
+def voting_proposal() -> tuple[ProposalEmulator, list[tuple[str, int]]]:
+    proposal = _submitted()
+    voters = _voters()
+    proposal.assign_voters(sender=DAEMON, voters=voters)
+    return proposal, voters
+
+
+def test_emulator_thresholds() -> None:
+    config = _config()
+    assert compute_quorum_threshold(
+        MEMBERS, reg_cfg.MIN_REQUESTED_AMOUNT, config
+    ) == relative_to_absolute_amount(MEMBERS, reg_cfg.QUORUM_SMALL)
+    assert compute_weighted_quorum_threshold(
+        MEMBERS * MEMBER_VOTES, reg_cfg.MAX_REQUESTED_AMOUNT_LARGE, config
+    ) == relative_to_absolute_amount(
+        MEMBERS * MEMBER_VOTES, reg_cfg.WEIGHTED_QUORUM_LARGE
+    )
+
+
+def test_emulator_lifecycle_approved(
+    voting_proposal: tuple[ProposalEmulator, list[tuple[str, int]]],
+) -> None:
+    proposal, voters = voting_proposal
+    assert proposal.status == enm.STATUS_VOTING
+    assert proposal.payments == [(DAEMON, DAEMON_FUNDING)]
+
+    proposal.vote_batch(
+        votes=[(voter, votes, 0) for voter, votes in voters[:-1]]
+        + [(voters[-1][0], MEMBER_VOTES, MEMBER_VOTES)]
+    )
+    assert proposal.boycotted_members == 1
+    assert proposal.is_plebiscite()
+    proposal.scrutiny()
+    assert proposal.status == enm.STATUS_APPROVED
+
+    proposal.review(sender=COUNCIL, block=False)
+    proposal.fund()
+    proposal.finalize()
+    assert proposal.status == enm.STATUS_FUNDED
+    assert proposal.finalized
+    assert proposal.payments[1:] == [
+        (PROPOSER, LOCKED_AMOUNT),
+        (REGISTRY, reg_cfg.OPEN_PROPOSAL_FEE - DAEMON_FUNDING),
+    ]
+    assert proposal.balance == 0
+
+
+def test_emulator_rejected_absentees(
+    voting_proposal: tuple[ProposalEmulator, list[tuple[str, int]]],
+) -> None:
+    proposal, voters = voting_proposal
+    proposal.vote(voter=voters[0][0], approvals=0, rejections=MEMBER_VOTES)
+
+    with pytest.raises(ProposalEmulatorError, match=err.VOTING_ONGOING):
+        proposal.scrutiny()
+    proposal.now += proposal.voting_duration + 1
+    proposal.scrutiny()
+    assert proposal.status == enm.STATUS_REJECTED
+    assert proposal.locked_amount == 0
+
+    with pytest.raises(ProposalEmulatorError, match=err.VOTERS_ASSIGNED):
+        proposal.finalize()
+    proposal.unassign_absentees(absentees=[voter for voter, _ in voters[1:]])
+    proposal.finalize()
+    assert proposal.finalized
+
+
+def test_emulator_failure_reverts(
+    voting_proposal: tuple[ProposalEmulator, list[tuple[str, int]]],
+) -> None:
+    proposal, voters = voting_proposal
+    before = proposal.state()
+
+    # The duplicated voter fails the whole batch
+    with pytest.raises(ProposalEmulatorError, match=err.VOTER_NOT_FOUND):
+        proposal.vote_batch(
+            votes=[(voters[0][0], MEMBER_VOTES, 0), (voters[0][0], MEMBER_VOTES, 0)]
+        )
+    with pytest.raises(ProposalEmulatorError, match=err.VOTES_INVALID):
+        proposal.vote(voter=voters[0][0], approvals=MEMBER_VOTES, rejections=1)
+    with pytest.raises(ProposalEmulatorError, match=err.UNAUTHORIZED):
+        proposal.vote(voter=voters[0][0], approvals=1, rejections=0, caller_app_id=1)
+
+    assert proposal.state() == before
+    assert voters[0][0] in proposal.voters
+
+
+def test_emulator_bucket_voters() -> None:
+    proposal = _submitted()
+    # Ascending addresses, thus ascending buckets
+    voters = sorted(_voters(), key=lambda voter: encoding.decode_address(voter[0]))  # type: ignore[no-untyped-call]
+
+    with pytest.raises(ProposalEmulatorError, match=err.VOTER_ALREADY_ASSIGNED):
+        proposal.assign_voters_to_buckets(sender=DAEMON, voters=voters[::-1])
+    assert proposal.voter_buckets == 0
+    assert proposal.voter_bucket == {}
+
+    proposal.assign_voters_to_buckets(sender=DAEMON, voters=voters)
+    assert proposal.status == enm.STATUS_VOTING
+    assert proposal.voter_buckets == 1
+
+    proposal.vote(voter=voters[3][0], approvals=MEMBER_VOTES, rejections=0)
+    assert proposal.assigned_members == MEMBERS - 1
+    assert len(proposal.voter_bucket[0]) == MEMBERS - 1
+
+
+def test_emulator_bucket_full() -> None:
+    members = const.VOTER_BUCKET_MAX_MEMBERS + 1
+    buckets = voter_buckets_count(members)
+    proposal = _submitted(
+        _config(committee_members=members, committee_votes=members * MEMBER_VOTES)
+    )
+    # The first bucket gets all the voters
+    voters: list[tuple[str, int]] = []
+    while len(voters) < members:
+        voter = _voters(1)[0]
+        if get_voter_bucket(voter[0], buckets) == 0:
+            voters.append(voter)
+    voters.sort(key=lambda voter: encoding.decode_address(voter[0]))  # type: ignore[no-untyped-call]
+
+    with pytest.raises(ProposalEmulatorError, match=err.VOTER_BUCKET_FULL):
+        proposal.assign_voters_to_buckets(sender=DAEMON, voters=voters)
+    assert proposal.assigned_members == 0
+
+
+def test_emulator_vote_with_proof() -> None:
+    committee = _voters()
+    tree = CommitteeMerkleTree(committee)
+    proposal = _submitted(_config(committee_root=tree.root))
+    assert proposal.status == enm.STATUS_VOTING
+
+    voter, votes = committee[0]
+    membership = tree.proof(voter)
+    proposal.vote_with_proof(
+        voter=voter,
+        voting_power=votes,
+        ordinal=membership.ordinal,
+        proof=membership.proof,
+        approvals=votes,
+        rejections=0,
+    )
+    assert proposal.approvals == votes
+    assert proposal.assigned_members == MEMBERS - 1
+
+    with pytest.raises(ProposalEmulatorError, match=err.VOTER_ALREADY_VOTED):
+        proposal.vote_with_proof(
+            voter=voter,
+            voting_power=votes,
+            ordinal=membership.ordinal,
+            proof=membership.proof,
+            approvals=votes,
+            rejections=0,
+        )
+    with pytest.raises(ProposalEmulatorError, match=err.VOTER_NOT_FOUND):
+        proposal.vote_with_proof(
+            voter=voter,
+            voting_power=votes + 1,
+            ordinal=membership.ordinal,
+            proof=membership.proof,
+            approvals=0,
+            rejections=0,
+        )
+
+
+def test_emulator_unassign_absentee_with_proof() -> None:
+    committee = _voters()
+    tree = CommitteeMerkleTree(committee)
+    proposal = _submitted(_config(committee_root=tree.root))
+    voter = tree.proof(committee[0][0])
+    proposal.vote_with_proof(
+        voter=voter.address,
+        voting_power=voter.votes,
+        ordinal=voter.ordinal,
+        proof=voter.proof,
+        approvals=voter.votes,
+        rejections=0,
+    )
+    proposal.now += proposal.voting_duration + 1
+    proposal.scrutiny()
+
+    absentee = tree.proof(committee[1][0])
+    proposal.unassign_absentee_with_proof(
+        absentee=absentee.address,
+        voting_power=absentee.votes,
+        ordinal=absentee.ordinal,
+        proof=absentee.proof,
+    )
+    assert proposal.assigned_members == MEMBERS - 2
+    assert proposal.assigned_votes == (MEMBERS - 2) * MEMBER_VOTES
+
+    # Voters and unassigned absentees cannot be charged an absence
+    for membership in (absentee, voter):
+        with pytest.raises(ProposalEmulatorError, match=err.VOTER_NOT_FOUND):
+            proposal.unassign_absentee_with_proof(
+                absentee=membership.address,
+                voting_power=membership.votes,
+                ordinal=membership.ordinal,
+                proof=membership.proof,
+            )
+    assert proposal.voted_ordinals == {voter.ordinal, absentee.ordinal}
+
+
+def test_emulator_matches_contract(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    config = RegistryConfig.from_global_state(
+        xgov_registry_mock_client.state.global_state.get_all()
+    )
+    emulator = ProposalEmulator.from_global_state(
+        config,
+        voting_proposal_client.state.global_state.get_all(),
+        voters={cm.account.address: cm.votes for cm in committee},
+        now=voting_proposal_client.state.global_state.vote_open_ts,
+    )
+
+    rng = random.Random(42)
+    votes = []
+    for cm in committee:
+        approvals = rng.randint(0, cm.votes)
+        rejections = rng.choice([cm.votes, rng.randint(0, cm.votes - approvals)])
+        votes.append((cm.account.address, approvals, rejections))
+
+    for batch in (votes[:10], votes[10:]):
+        xgov_registry_mock_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id, votes=batch
+            ),
+            params=CommonAppCallParams(static_fee=min_fee_times_2),
+        )
+        emulator.vote_batch(votes=batch)
+        assert emulator.state() == voting_proposal_client.state.global_state.get_all()
+
+    voting_proposal_client.send.scrutiny(
+        params=CommonAppCallParams(sender=proposer.address, static_fee=min_fee_times_2)
+    )
+    emulator.scrutiny()
+    assert emulator.state() == voting_proposal_client.state.global_state.get_all()
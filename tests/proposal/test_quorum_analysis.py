@@ -0,0 +1,139 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from smart_contracts.proposal.emulator import (
+    compute_quorum_threshold,
+    compute_weighted_quorum_threshold,
+    is_proposal_approved,
+)
+from tests.proposal.quorum_analysis import (
+    QuorumParams,
+    are_proposals_approved,
+    compute_quorum_thresholds,
+    compute_weighted_quorum_thresholds,
+)
+from tests.proposal.test_emulator import MEMBER_VOTES, MEMBERS, _config
+
+CONFIG = _config()
+AMOUNTS = np.linspace(
+    CONFIG.min_requested_amount, CONFIG.max_requested_amount_large, 37, dtype=np.uint64
+)
+COMMITTEE_MEMBERS = np.arange(1, 200, 7, dtype=np.uint64)
+
+
+def test_thresholds_match_emulator() -> None:
+    params = QuorumParams.from_config(CONFIG)
+    members, amounts = np.ix_(COMMITTEE_MEMBERS, AMOUNTS)
+
+    quorum = compute_quorum_thresholds(
+        params, committee_members=members, requested_amount=amounts
+    )
+    weighted_quorum = compute_weighted_quorum_thresholds(
+        params, committee_votes=members * MEMBER_VOTES, requested_amount=amounts
+    )
+
+    assert (
+        quorum.shape == weighted_quorum.shape == (len(COMMITTEE_MEMBERS), len(AMOUNTS))
+    )
+    for (i, size), (j, amount) in itertools.product(
+        enumerate(COMMITTEE_MEMBERS.tolist()), enumerate(AMOUNTS.tolist())
+    ):
+        assert quorum[i, j] == compute_quorum_threshold(size, amount, CONFIG)
+        assert weighted_quorum[i, j] == compute_weighted_quorum_threshold(
+            size * MEMBER_VOTES, amount, CONFIG
+        )
+
+
+def test_approval_grid_matches_emulator() -> None:
+    quorums_small = np.arange(1_000, 5_001, 1_000)
+    params = QuorumParams.from_config(CONFIG, quorum_small=quorums_small[:, None])
+    rng = np.random.default_rng(42)
+    voted = rng.integers(0, MEMBERS + 1, size=500)
+    boycotted = rng.integers(0, voted + 1)
+    approvals = rng.integers(0, voted * MEMBER_VOTES + 1)
+    rejections = rng.integers(0, voted * MEMBER_VOTES - approvals + 1)
+    nulls = voted * MEMBER_VOTES - approvals - rejections
+    amounts = rng.integers(
+        CONFIG.min_requested_amount, CONFIG.max_requested_amount_large + 1, size=500
+    )
+
+    approved = are_proposals_approved(
+        params,
+        requested_amount=amounts,
+        committee_members=MEMBERS,
+        committee_votes=MEMBERS * MEMBER_VOTES,
+        voted_members=voted,
+        boycotted_members=boycotted,
+        approvals=approvals,
+        rejections=rejections,
+        nulls=nulls,
+    )
+
+    assert approved.shape == (len(quorums_small), 500)
+    assert approved.any() and not approved.all()
+    for i, quorum_small in enumerate(quorums_small.tolist()):
+        config = _config(quorum_small=quorum_small)
+        for k, amount in enumerate(amounts.tolist()):
+            assert approved[i, k] == is_proposal_approved(
+                quorum_threshold=compute_quorum_threshold(MEMBERS, amount, config),
+                weighted_quorum_threshold=compute_weighted_quorum_threshold(
+                    MEMBERS * MEMBER_VOTES, amount, config
+                ),
+                voted_members=int(voted[k]),
+                boycotted_members=int(boycotted[k]),
+                approvals=int(approvals[k]),
+                rejections=int(rejections[k]),
+                nulls=int(nulls[k]),
+            )
+
+
+def test_uint64_failures_masked() -> None:
+    params = QuorumParams.from_config(CONFIG)
+    min_amount = CONFIG.min_requested_amount
+
+    # Underflow below the min requested amount
+    quorum = compute_quorum_thresholds(
+        params, committee_members=MEMBERS, requested_amount=[min_amount - 1, min_amount]
+    )
+    assert quorum.mask.tolist() == [True, False]
+    assert quorum[1] == compute_quorum_threshold(MEMBERS, min_amount, CONFIG)
+
+    # Overflow of the committee votes times the quorum
+    weighted_quorum = compute_weighted_quorum_thresholds(
+        params,
+        committee_votes=np.array(
+            [np.iinfo(np.uint64).max, MEMBERS * MEMBER_VOTES], dtype=np.uint64
+        ),
+        requested_amount=min_amount,
+    )
+    assert weighted_quorum.mask.tolist() == [True, False]
+
+    # Division by zero with an empty requested amounts range
+    quorum = compute_quorum_thresholds(
+        QuorumParams.from_config(
+            CONFIG, max_requested_amount_large=[min_amount, min_amount + 1]
+        ),
+        committee_members=MEMBERS,
+        requested_amount=min_amount,
+    )
+    assert quorum.mask.tolist() == [True, False]
+
+    # Negative values are no uint64
+    approved = are_proposals_approved(
+        params,
+        requested_amount=min_amount,
+        committee_members=MEMBERS,
+        committee_votes=MEMBERS * MEMBER_VOTES,
+        voted_members=MEMBERS,
+        boycotted_members=0,
+        approvals=[-1, MEMBERS * MEMBER_VOTES],
+        rejections=0,
+        nulls=0,
+    )
+    assert approved.mask.tolist() == [True, False]
+    assert approved[1]
+
+    with pytest.raises(TypeError, match="integers"):
+        QuorumParams.from_config(CONFIG, quorum_small=0.3)
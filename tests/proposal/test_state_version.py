@@ -0,0 +1,43 @@
+from algokit_utils import AlgoAmount, CommonAppCallParams, SigningAccount
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    VoteProposalArgs,
+    XgovRegistryMockClient,
+)
+from smart_contracts.xgov_registry.state_cache import proposal_state_cache
+from tests.common import CommitteeMember
+
+
+def test_state_version_success(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    version = voting_proposal_client.send.get_state_version(
+        params=CommonAppCallParams(sender=proposer.address)
+    ).abi_return
+    # Opened, metadata uploaded, submitted and voters assigned
+    assert version
+    assert version == voting_proposal_client.state.global_state.state_version
+
+    cache = proposal_state_cache(voting_proposal_client)
+    state = cache.get()
+    assert cache.get() is state
+    assert cache.version == version
+
+    xgov_registry_mock_client.send.vote_proposal(
+        args=VoteProposalArgs(
+            proposal_id=voting_proposal_client.app_id,
+            xgov_address=committee[0].account.address,
+            approval_votes=committee[0].votes,
+            rejection_votes=0,
+        ),
+        params=CommonAppCallParams(static_fee=min_fee_times_2),
+    )
+
+    assert voting_proposal_client.state.global_state.state_version == version + 1
+    assert cache.get().approvals == committee[0].votes
+    assert cache.version == version + 1
@@ -0,0 +1,139 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.proposal.proposal_client import (
+    GetVoterBoxArgs,
+    ProposalClient,
+)
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    VoteProposalBatchArgs,
+    XgovRegistryMockClient,
+)
+from smart_contracts.errors import std_errors as err
+from tests.common import DEFAULT_MEMBER_VOTES, CommitteeMember
+from tests.proposal.common import assert_voting_proposal_global_state
+
+
+@pytest.mark.parametrize(
+    "voting_proposal", ["voting_proposal_client", "bucketed_voting_proposal_client"]
+)
+def test_vote_batch_success(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal: str,
+    request: pytest.FixtureRequest,
+) -> None:
+    proposal_client: ProposalClient = request.getfixturevalue(voting_proposal)
+    voters = committee[:3]
+    xgov_registry_mock_client.send.vote_proposal_batch(
+        args=VoteProposalBatchArgs(
+            proposal_id=proposal_client.app_id,
+            votes=[
+                (voters[0].account.address, voters[0].votes, 0),
+                (voters[1].account.address, 0, voters[1].votes),
+                (voters[2].account.address, 0, 0),
+            ],
+        ),
+        params=CommonAppCallParams(static_fee=min_fee_times_2),
+    )
+
+    assert_voting_proposal_global_state(
+        proposal_client,
+        proposer_address=proposer.address,
+        registry_app_id=xgov_registry_mock_client.app_id,
+        voted_members=len(voters),
+        approvals=voters[0].votes,
+        rejections=voters[1].votes,
+        nulls=voters[2].votes,
+        assigned_members=len(committee) - len(voters),
+        assigned_votes=DEFAULT_MEMBER_VOTES * (len(committee) - len(voters)),
+    )
+
+    for voter in voters:
+        _, exists = proposal_client.send.get_voter_box(
+            args=GetVoterBoxArgs(voter_address=voter.account.address),
+            params=CommonAppCallParams(sender=proposer.address),
+        ).abi_return
+        assert not exists
+
+
+def test_vote_batch_not_committee_member(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        xgov_registry_mock_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[
+                    (committee[0].account.address, committee[0].votes, 0),
+                    (proposer.address, 42, 0),
+                ],
+            ),
+            params=CommonAppCallParams(static_fee=min_fee_times_2),
+        )
+
+    # The whole batch is reverted
+    assert voting_proposal_client.state.global_state.voted_members == 0
+
+
+def test_vote_batch_duplicate_voter(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    vote = (committee[0].account.address, committee[0].votes, 0)
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        xgov_registry_mock_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[vote, vote],
+            ),
+            params=CommonAppCallParams(static_fee=min_fee_times_2),
+        )
+
+
+def test_vote_batch_invalid(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.VOTES_INVALID):
+        xgov_registry_mock_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[
+                    (committee[0].account.address, committee[0].votes, 0),
+                    (committee[1].account.address, committee[1].votes + 1, 0),
+                ],
+            ),
+            params=CommonAppCallParams(static_fee=min_fee_times_2),
+        )
+
+
+def test_vote_batch_submitted_proposal(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    submitted_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.WRONG_PROPOSAL_STATUS):
+        xgov_registry_mock_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=submitted_proposal_client.app_id,
+                votes=[(committee[0].account.address, committee[0].votes, 0)],
+            ),
+            params=CommonAppCallParams(static_fee=min_fee_times_2),
+        )
@@ -0,0 +1,414 @@
+import dataclasses
+
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    CommonAppCallParams,
+    LogicError,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.proposal.proposal_client import (
+    GetVotedBitmapPageArgs,
+    ProposalClient,
+)
+from smart_contracts.artifacts.xgov_registry_mock.xgov_registry_mock_client import (
+    VoteProposalWithProofArgs,
+    XgovRegistryMockClient,
+)
+from smart_contracts.errors import std_errors as err
+from smart_contracts.xgov_registry.committee_merkle import (
+    CommitteeMembershipProof,
+    CommitteeMerkleTree,
+    get_voted_bitmap_pages,
+    voted_ordinals,
+)
+from smart_contracts.xgov_registry.constants import MAX_GROUP_SIZE
+from tests.common import CommitteeMember
+from tests.proposal.common import (
+    assert_rejected_proposal_global_state,
+    assert_voting_proposal_global_state,
+    get_voted_bitmap_box_key,
+    scrutinize_proposal,
+    unassign_absentee_with_proof,
+)
+
+
+def _vote_with_proof(
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    proposal_client: ProposalClient,
+    membership: CommitteeMembershipProof,
+    fee: AlgoAmount,
+    *,
+    approvals: int,
+    rejections: int = 0,
+) -> None:
+    xgov_registry_mock_client.send.vote_proposal_with_proof(
+        args=VoteProposalWithProofArgs(
+            proposal_id=proposal_client.app_id,
+            xgov_address=membership.address,
+            voting_power=membership.votes,
+            ordinal=membership.ordinal,
+            proof=list(membership.proof),
+            approval_votes=approvals,
+            rejection_votes=rejections,
+        ),
+        params=CommonAppCallParams(static_fee=fee),
+    )
+
+
+def test_vote_with_proof_success(
+    algorand_client: AlgorandClient,
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    _vote_with_proof(
+        xgov_registry_mock_client,
+        merkle_voting_proposal_client,
+        membership,
+        min_fee_times_2,
+        approvals=membership.votes,
+    )
+
+    assert_voting_proposal_global_state(
+        merkle_voting_proposal_client,
+        proposer_address=proposer.address,
+        registry_app_id=xgov_registry_mock_client.app_id,
+        voted_members=1,
+        approvals=membership.votes,
+        # The Committee Root assigns every member, voters are unassigned
+        assigned_members=committee_tree.size - 1,
+        assigned_votes=committee_tree.votes - membership.votes,
+    )
+
+    page = algorand_client.app.get_box_value(
+        merkle_voting_proposal_client.app_id,
+        get_voted_bitmap_box_key(membership.voted_bitmap_page),
+    )
+    assert len(page) == (committee_tree.size + 7) // 8
+    assert voted_ordinals([page]) == [membership.ordinal]
+
+
+def test_vote_with_proof_all_members(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    for cm in committee:
+        membership = committee_tree.proof(cm.account.address)
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            merkle_voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=0,
+            rejections=membership.votes,
+        )
+
+    assert_voting_proposal_global_state(
+        merkle_voting_proposal_client,
+        proposer_address=proposer.address,
+        registry_app_id=xgov_registry_mock_client.app_id,
+        voted_members=committee_tree.size,
+        rejections=committee_tree.votes,
+    )
+
+
+def test_vote_with_proof_already_voted(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    _vote_with_proof(
+        xgov_registry_mock_client,
+        merkle_voting_proposal_client,
+        membership,
+        min_fee_times_2,
+        approvals=membership.votes,
+    )
+
+    with pytest.raises(LogicError, match=err.VOTER_ALREADY_VOTED):
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            merkle_voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=membership.votes,
+        )
+
+
+def test_vote_with_proof_wrong_voting_power(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    membership = dataclasses.replace(membership, votes=membership.votes + 1)
+
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            merkle_voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=membership.votes,
+        )
+
+
+def test_vote_with_proof_not_committee_member(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    # Proof of a member, claimed by someone else
+    membership = committee_tree.proof(committee[0].account.address)
+    membership = dataclasses.replace(membership, address=proposer.address)
+
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            merkle_voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=membership.votes,
+        )
+
+
+def test_vote_with_proof_invalid_votes(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+
+    with pytest.raises(LogicError, match=err.VOTES_INVALID):
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            merkle_voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=membership.votes + 1,
+        )
+
+
+def test_vote_with_proof_assigned_voters_proposal(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    # Proposals submitted to a Committee without root only accept assigned voters
+    membership = committee_tree.proof(committee[0].account.address)
+
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=membership.votes,
+        )
+
+
+def test_get_voted_bitmap_page(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    bitmap, exists = merkle_voting_proposal_client.send.get_voted_bitmap_page(
+        args=GetVotedBitmapPageArgs(page=0),
+        params=CommonAppCallParams(sender=proposer.address),
+    ).abi_return
+    assert not exists
+    assert bitmap == b""
+
+    membership = committee_tree.proof(committee[0].account.address)
+    _vote_with_proof(
+        xgov_registry_mock_client,
+        merkle_voting_proposal_client,
+        membership,
+        min_fee_times_2,
+        approvals=membership.votes,
+    )
+
+    bitmap, exists = merkle_voting_proposal_client.send.get_voted_bitmap_page(
+        args=GetVotedBitmapPageArgs(page=0),
+        params=CommonAppCallParams(sender=proposer.address),
+    ).abi_return
+    assert exists
+    assert voted_ordinals([bytes(bitmap)]) == [membership.ordinal]
+
+
+def test_absentees(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    assert committee_tree.absentees(
+        get_voted_bitmap_pages(merkle_voting_proposal_client)
+    ) == [address for address, _ in committee_tree.members]
+
+    voters = committee[:-1]
+    for cm in voters:
+        membership = committee_tree.proof(cm.account.address)
+        _vote_with_proof(
+            xgov_registry_mock_client,
+            merkle_voting_proposal_client,
+            membership,
+            min_fee_times_2,
+            approvals=membership.votes,
+        )
+
+    assert committee_tree.absentees(
+        get_voted_bitmap_pages(merkle_voting_proposal_client)
+    ) == [committee[-1].account.address]
+
+
+def test_unassign_absentee_with_proof(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+    no_role_account: SigningAccount,
+) -> None:
+    voter = committee_tree.proof(committee[0].account.address)
+    _vote_with_proof(
+        xgov_registry_mock_client,
+        merkle_voting_proposal_client,
+        voter,
+        min_fee_times_2,
+        approvals=0,
+        rejections=voter.votes,
+    )
+    scrutinize_proposal(no_role_account, merkle_voting_proposal_client, min_fee_times_2)
+
+    absentees = committee_tree.absentees(
+        get_voted_bitmap_pages(merkle_voting_proposal_client)
+    )
+    for i in range(0, len(absentees), MAX_GROUP_SIZE):
+        composer = xgov_registry_mock_client.new_group()
+        for address in absentees[i : i + MAX_GROUP_SIZE]:
+            unassign_absentee_with_proof(
+                composer,
+                merkle_voting_proposal_client.app_id,
+                committee_tree.proof(address),
+            )
+        composer.send()
+
+    assert_rejected_proposal_global_state(
+        merkle_voting_proposal_client,
+        proposer_address=proposer.address,
+        registry_app_id=xgov_registry_mock_client.app_id,
+        voted_members=1,
+        rejections=voter.votes,
+    )
+    # Absentees are marked in the bitmap, as voters
+    assert not committee_tree.absentees(
+        get_voted_bitmap_pages(merkle_voting_proposal_client)
+    )
+
+
+def test_unassign_absentee_with_proof_voter(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+    no_role_account: SigningAccount,
+) -> None:
+    voter = committee_tree.proof(committee[0].account.address)
+    _vote_with_proof(
+        xgov_registry_mock_client,
+        merkle_voting_proposal_client,
+        voter,
+        min_fee_times_2,
+        approvals=voter.votes,
+    )
+    scrutinize_proposal(no_role_account, merkle_voting_proposal_client, min_fee_times_2)
+
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentee_with_proof(composer, merkle_voting_proposal_client.app_id, voter)
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        composer.send()
+
+
+def test_unassign_absentee_with_proof_twice(
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_rejected_proposal_client: ProposalClient,
+) -> None:
+    absentee = committee_tree.proof(committee[0].account.address)
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentee_with_proof(
+        composer, merkle_rejected_proposal_client.app_id, absentee
+    )
+    composer.send()
+
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentee_with_proof(
+        composer, merkle_rejected_proposal_client.app_id, absentee
+    )
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        composer.send()
+
+
+def test_unassign_absentee_with_proof_wrong_proof(
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    proposer: SigningAccount,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_rejected_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentee_with_proof(
+        composer,
+        merkle_rejected_proposal_client.app_id,
+        dataclasses.replace(membership, address=proposer.address),
+    )
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        composer.send()
+
+
+def test_unassign_absentee_with_proof_voting(
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_mock_client: XgovRegistryMockClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    composer = xgov_registry_mock_client.new_group()
+    unassign_absentee_with_proof(
+        composer,
+        merkle_voting_proposal_client.app_id,
+        committee_tree.proof(committee[0].account.address),
+    )
+    with pytest.raises(LogicError, match=err.WRONG_PROPOSAL_STATUS):
+        composer.send()
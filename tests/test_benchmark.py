@@ -0,0 +1,114 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from tests.benchmark import (
+    ARTIFACTS_DIR,
+    BENCHMARK_REPORT_VERSION,
+    MethodCost,
+    _read_baseline,
+    abi_method_names,
+    benchmark_key,
+    benchmarked_methods,
+    find_regressions,
+    render_markdown,
+)
+
+COST = MethodCost(
+    opcode_cost=1_000,
+    op_ups=1,
+    inner_txns=2,
+    box_reads=3,
+    box_writes=4,
+    min_fee=4_000,
+)
+BASELINE = {"Proposal.vote": asdict(COST)}
+
+TESTS_DIR = Path(__file__).parent
+
+# Benchmarked contracts: (ARC-56 spec, benchmark tests, methods not benchmarked)
+BENCHMARKED_CONTRACTS = [
+    pytest.param(
+        ARTIFACTS_DIR / "xgov_registry" / "XGovRegistry.arc56.json",
+        TESTS_DIR / "xgov_registry" / "test_benchmark.py",
+        # Not reachable on LocalNet, see test_unsubscribe_absentee
+        {"unsubscribe_absentee"},
+        id="XGovRegistry",
+    ),
+    pytest.param(
+        ARTIFACTS_DIR / "proposal" / "Proposal.arc56.json",
+        TESTS_DIR / "proposal" / "test_benchmark.py",
+        set(),
+        id="Proposal",
+    ),
+    pytest.param(
+        ARTIFACTS_DIR / "council" / "Council.arc56.json",
+        TESTS_DIR / "council" / "test_benchmark.py",
+        set(),
+        id="Council",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("arc56_path", "test_path", "unreachable_methods"), BENCHMARKED_CONTRACTS
+)
+def test_benchmarks_cover_abi_methods(
+    arc56_path: Path, test_path: Path, unreachable_methods: set[str]
+) -> None:
+    assert benchmarked_methods(test_path) | unreachable_methods == abi_method_names(
+        arc56_path
+    )
+
+
+def test_benchmark_key() -> None:
+    assert benchmark_key("Proposal", "vote") == "Proposal.vote"
+    assert benchmark_key("Council", "vote", "council_size=5") == (
+        "Council.vote[council_size=5]"
+    )
+
+
+def test_find_regressions_none() -> None:
+    assert not find_regressions({"Proposal.vote": COST}, BASELINE)
+    # New benchmarks cannot regress
+    assert not find_regressions({"Proposal.submit": COST}, BASELINE)
+
+
+def test_find_regressions_metric_growth() -> None:
+    cost = MethodCost(**{**asdict(COST), "box_writes": 5, "min_fee": 5_000})
+
+    assert find_regressions({"Proposal.vote": cost}, BASELINE) == [
+        "Proposal.vote: box_writes 4 -> 5",
+        "Proposal.vote: min_fee 4000 -> 5000",
+    ]
+
+
+def test_find_regressions_opcode_tolerance() -> None:
+    cost = MethodCost(**{**asdict(COST), "opcode_cost": 1_020})
+
+    assert find_regressions({"Proposal.vote": cost}, BASELINE)
+    assert not find_regressions({"Proposal.vote": cost}, BASELINE, 0.02)
+
+
+def test_render_markdown() -> None:
+    markdown = render_markdown({"Proposal.vote": COST})
+
+    assert f"(v{BENCHMARK_REPORT_VERSION})" in markdown
+    assert "| `Proposal.vote` | 1000 | 1 | 2 | 3 | 4 | 4000 |" in markdown
+
+
+def test_read_baseline_wrong_version(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"version": 0, "benchmarks": BASELINE}))
+
+    with pytest.raises(ValueError, match="regenerate"):
+        _read_baseline(path, required=False)
+
+
+def test_read_baseline_missing(tmp_path: Path) -> None:
+    assert _read_baseline(tmp_path / "baseline.json", required=False) == {}
+
+    with pytest.raises(FileNotFoundError, match="BENCHMARK_UPDATE_BASELINE=1"):
+        _read_baseline(tmp_path / "baseline.json", required=True)
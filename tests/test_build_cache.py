@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+import smart_contracts.__main__ as sc
+
+
+@pytest.fixture()
+def contract_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Temporary `smart_contracts` package with a contract and its imports"""
+    root = tmp_path / "smart_contracts"
+    (root / "common").mkdir(parents=True)
+    (root / "dummy").mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "common" / "__init__.py").write_text("")
+    (root / "common" / "helpers.py").write_text("VALUE = 1\n")
+    (root / "dummy" / "__init__.py").write_text("")
+    (root / "dummy" / "constants.py").write_text(
+        "from smart_contracts.common.helpers import VALUE\n"
+    )
+    (root / "dummy" / "unused.py").write_text("")
+    (root / "dummy" / "contract.py").write_text(
+        "import algopy\n"
+        "from smart_contracts.common import helpers\n"
+        "from . import constants\n"
+    )
+    monkeypatch.setattr(sc, "root_path", root)
+    return root
+
+
+def test_contract_sources(contract_tree: Path) -> None:
+    assert sc.contract_sources(contract_tree / "dummy" / "contract.py") == sorted(
+        [
+            contract_tree / "common" / "__init__.py",
+            contract_tree / "common" / "helpers.py",
+            contract_tree / "dummy" / "__init__.py",
+            contract_tree / "dummy" / "constants.py",
+            contract_tree / "dummy" / "contract.py",
+        ]
+    )
+
+
+def test_build_contracts_skips_up_to_date(
+    contract_tree: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    built: list[Path] = []
+
+    def fake_build(output_dir: Path, contract_path: Path) -> Path:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        (output_dir / "Dummy.arc56.json").write_text("{}")
+        built.append(contract_path)
+        return output_dir
+
+    monkeypatch.setattr(sc, "build", fake_build)
+    artifacts = tmp_path / "artifacts"
+    contract = sc.SmartContract(
+        path=contract_tree / "dummy" / "contract.py", name="dummy"
+    )
+
+    sc.build_contracts(artifacts, [contract], jobs=1)
+    sc.build_contracts(artifacts, [contract], jobs=1)
+    assert len(built) == 1
+
+    # A change in a transitive import invalidates the manifest
+    (contract_tree / "common" / "helpers.py").write_text("VALUE = 2\n")
+    sc.build_contracts(artifacts, [contract], jobs=1)
+    assert len(built) == 2
+
+    # Unrelated sources and missing outputs
+    (contract_tree / "dummy" / "unused.py").write_text("CHANGED = True\n")
+    sc.build_contracts(artifacts, [contract], jobs=1)
+    assert len(built) == 2
+    (artifacts / "dummy" / "Dummy.arc56.json").unlink()
+    sc.build_contracts(artifacts, [contract], jobs=1)
+    assert len(built) == 3
+
+    sc.build_contracts(artifacts, [contract], force=True, jobs=1)
+    assert len(built) == 4
+
+
+@pytest.mark.parametrize("jobs", ["zero", "0", "-2", "1.5"])
+def test_invalid_build_jobs(jobs: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SMART_CONTRACTS_BUILD_JOBS", jobs)
+    with pytest.raises(ValueError, match="SMART_CONTRACTS_BUILD_JOBS"):
+        sc._build_options_from_env()
+
+
+def test_build_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SMART_CONTRACTS_BUILD_JOBS", "4")
+    monkeypatch.setenv("SMART_CONTRACTS_BUILD_FORCE", "true")
+    assert sc._build_options_from_env() == (True, 4)
+    monkeypatch.delenv("SMART_CONTRACTS_BUILD_JOBS")
+    assert sc._build_options_from_env() == (True, None)
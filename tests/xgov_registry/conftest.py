@@ -13,6 +13,7 @@ from algokit_utils import (
     SigningAccount,
 )
 from algokit_utils.config import config
+from algosdk import account
 from algosdk.transaction import Transaction
 
 from smart_contracts.artifacts.proposal.proposal_client import (
@@ -25,6 +26,7 @@ from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
     ApproveSubscribeXgovArgs,
     ConfigXgovRegistryArgs,
     DeclareCommitteeArgs,
+    DeclareCommitteeWithRootArgs,
     DepositFundsArgs,
     OpenProposalArgs,
     PayGrantProposalArgs,
@@ -50,6 +52,7 @@ from smart_contracts.artifacts.xgov_subscriber_app_mock.x_gov_subscriber_app_moc
 )
 from smart_contracts.proposal import enums as enm
 from smart_contracts.xgov_registry import config as regcfg
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
 from smart_contracts.xgov_registry.helpers import (
     load_proposal_contract_data_size_per_transaction,
 )
@@ -535,6 +538,21 @@ def proposal_client(
     min_fee_times_3: AlgoAmount,
     proposer: SigningAccount,
     xgov_registry_client: XGovRegistryClient,
+) -> ProposalClient:
+    return _open_proposal_app(
+        algorand_client=algorand_client,
+        proposer=proposer,
+        xgov_registry_client=xgov_registry_client,
+        static_fee=min_fee_times_3,
+    )
+
+
+def _open_proposal_app(
+    *,
+    algorand_client: AlgorandClient,
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    static_fee: AlgoAmount,
 ) -> ProposalClient:
     open_proposal_fee = get_open_proposal_fee(xgov_registry_client)
     _ensure_funded(
@@ -553,7 +571,7 @@ def proposal_client(
                 amount=open_proposal_fee,
             )
         ),
-        params=CommonAppCallParams(sender=proposer.address, static_fee=min_fee_times_3),
+        params=CommonAppCallParams(sender=proposer.address, static_fee=static_fee),
     ).abi_return
 
     return ProposalClient(
@@ -605,6 +623,94 @@ def voting_proposal_client(
     return draft_proposal_client
 
 
+@pytest.fixture(scope="function")
+def second_voting_proposal_client(
+    algorand_client: AlgorandClient,
+    min_fee_times_3: AlgoAmount,
+    xgov_daemon: SigningAccount,
+    alternative_proposer: SigningAccount,
+    subscribed_committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+) -> ProposalClient:
+    proposal_client = _open_proposal_app(
+        algorand_client=algorand_client,
+        proposer=alternative_proposer,
+        xgov_registry_client=xgov_registry_client,
+        static_fee=min_fee_times_3,
+    )
+    locked_amount = get_locked_amount(REQUESTED_AMOUNT)
+    _ensure_funded(
+        algorand_client,
+        alternative_proposer,
+        min_spending_balance=locked_amount,
+        min_funding_increment=locked_amount,
+    )
+    _open_and_upload_draft(
+        algorand_client=algorand_client,
+        proposal_client=proposal_client,
+        proposer=alternative_proposer,
+        locked_amount=locked_amount,
+        requested_amount_micro_algo=REQUESTED_AMOUNT.amount_in_micro_algo,
+    )
+    _submit_and_assign(
+        proposal_client=proposal_client,
+        xgov_registry_client=xgov_registry_client,
+        proposer=alternative_proposer,
+        committee=subscribed_committee,
+        xgov_daemon=xgov_daemon,
+    )
+    return proposal_client
+
+
+@pytest.fixture(scope="function")
+def merkle_voting_proposal_client(
+    algorand_client: AlgorandClient,
+    min_fee_times_3: AlgoAmount,
+    committee_manager: SigningAccount,
+    committee_tree: CommitteeMerkleTree,
+    subscribed_committee: list[CommitteeMember],
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+) -> ProposalClient:
+    xgov_registry_client.send.declare_committee_with_root(
+        args=DeclareCommitteeWithRootArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=committee_tree.size,
+            votes=committee_tree.votes,
+            committee_root=committee_tree.root,
+        ),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+    proposal_client = _open_proposal_app(
+        algorand_client=algorand_client,
+        proposer=proposer,
+        xgov_registry_client=xgov_registry_client,
+        static_fee=min_fee_times_3,
+    )
+
+    locked_amount = get_locked_amount(REQUESTED_AMOUNT)
+    _ensure_funded(
+        algorand_client,
+        proposer,
+        min_spending_balance=locked_amount,
+        min_funding_increment=locked_amount,
+    )
+    _open_and_upload_draft(
+        algorand_client=algorand_client,
+        proposal_client=proposal_client,
+        proposer=proposer,
+        locked_amount=locked_amount,
+        requested_amount_micro_algo=REQUESTED_AMOUNT.amount_in_micro_algo,
+    )
+    # The voting opens on submission, without voters assignment
+    submit_proposal(
+        proposal_client=proposal_client,
+        xgov_registry_client=xgov_registry_client,
+        proposer=proposer,
+    )
+    return proposal_client
+
+
 @pytest.fixture(scope="function")
 def voting_proposal_client_requested_too_much(
     algorand_client: AlgorandClient,
@@ -689,6 +795,24 @@ def approved_proposal_client(
     return voting_proposal_client
 
 
+@pytest.fixture(scope="function")
+def second_approved_proposal_client(
+    min_fee_times_2: AlgoAmount,
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    second_voting_proposal_client: ProposalClient,
+) -> ProposalClient:
+    _vote_all_approve(
+        xgov_registry_client=xgov_registry_client,
+        committee=committee,
+        proposal_id=second_voting_proposal_client.app_id,
+        static_fee=min_fee_times_2,
+    )
+    scrutinize_proposal(no_role_account, second_voting_proposal_client, min_fee_times_2)
+    return second_voting_proposal_client
+
+
 @pytest.fixture(scope="function")
 def reviewed_proposal_client(
     xgov_council: SigningAccount,
@@ -0,0 +1,956 @@
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    AppClientCompilationParams,
+    CommonAppCallParams,
+    SigningAccount,
+)
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    ApproveSubscribeXgovArgs,
+    ApproveUnsubscribeXgovArgs,
+    ConfigXgovRegistryArgs,
+    DeclareCommitteeArgs,
+    DeclareCommitteeWithRootArgs,
+    DepositFundsArgs,
+    DropProposalArgs,
+    FinalizeProposalArgs,
+    GetProposalsSummaryArgs,
+    GetProposerBoxArgs,
+    GetProposerBoxesArgs,
+    GetRequestBoxArgs,
+    GetRequestBoxesArgs,
+    GetRequestUnsubscribeBoxArgs,
+    GetRequestUnsubscribeBoxesArgs,
+    GetXgovBoxArgs,
+    GetXgovBoxesArgs,
+    InitProposalContractArgs,
+    IsProposalArgs,
+    LoadProposalContractArgs,
+    OpenProposalArgs,
+    PayGrantProposalArgs,
+    RejectSubscribeXgovArgs,
+    RejectUnsubscribeXgovArgs,
+    RequestSubscribeXgovArgs,
+    RequestUnsubscribeXgovArgs,
+    SetCommitteeManagerArgs,
+    SetKycProviderArgs,
+    SetPayorArgs,
+    SetProposerKycArgs,
+    SetVotingAccountArgs,
+    SetXgovCouncilArgs,
+    SetXgovDaemonArgs,
+    SetXgovManagerArgs,
+    SetXgovSubscriberArgs,
+    SubscribeProposerArgs,
+    SubscribeXgovArgs,
+    UnassignAbsenteeFromProposalWithProofArgs,
+    VoteProposalArgs,
+    VoteProposalBatchArgs,
+    VoteProposalsArgs,
+    VoteProposalWithProofArgs,
+    WithdrawAvailableFundsArgs,
+    WithdrawFundsArgs,
+    XGovRegistryClient,
+    XGovRegistryConfig,
+    XGovRegistryFactory,
+)
+from smart_contracts.artifacts.xgov_subscriber_app_mock.x_gov_subscriber_app_mock_client import (
+    XGovSubscriberAppMockClient,
+)
+from smart_contracts.xgov_registry.committee_merkle import CommitteeMerkleTree
+from smart_contracts.xgov_registry.constants import MAX_PROPOSALS_SUMMARY
+from smart_contracts.xgov_registry.helpers import (
+    load_proposal_contract_data_size_per_transaction,
+)
+from tests.benchmark import (
+    BENCHMARK_STATIC_FEE,
+    BenchmarkRecorder,
+    ContractBenchmark,
+    benchmark_params,
+)
+from tests.common import (
+    DEFAULT_COMMITTEE_ID,
+    DEFAULT_COMMITTEE_MEMBERS,
+    DEFAULT_COMMITTEE_VOTES,
+    CommitteeMember,
+)
+from tests.proposal.common import scrutinize_proposal, unassign_absentees
+from tests.xgov_registry.common import (
+    TREASURY_AMOUNT,
+    UNLIMITED_KYC_EXPIRATION,
+    get_open_proposal_fee,
+    get_proposer_fee,
+    get_xgov_fee,
+)
+from tests.xgov_registry.conftest import _payment
+
+CONTRACT = "XGovRegistry"
+
+ABSENTEES_BATCH_LENGTHS = [1, 8, DEFAULT_COMMITTEE_MEMBERS]
+
+VOTE_BATCH_LENGTHS = [1, 8, DEFAULT_COMMITTEE_MEMBERS]
+
+READ_BATCH_LENGTHS = [1, 8]
+
+_measure = ContractBenchmark(CONTRACT)
+
+
+def test_benchmark_create(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    factory = algorand_client.client.get_typed_app_factory(
+        typed_factory=XGovRegistryFactory,
+        default_sender=deployer.address,
+        compilation_params=AppClientCompilationParams(
+            deploy_time_params={"entropy": b""}
+        ),
+    )
+    composer = algorand_client.new_group().add_app_create_method_call(
+        factory.params.create.create()
+    )
+    _measure(benchmark_recorder, composer, "create")
+
+
+def test_benchmark_init_proposal_contract(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    program = xgov_registry_client.state.box.proposal_approval_program
+    composer = xgov_registry_client.new_group().init_proposal_contract(
+        args=InitProposalContractArgs(size=len(program))
+    )
+    _measure(
+        benchmark_recorder, composer.composer(), "init_proposal_contract", "resize"
+    )
+
+
+def test_benchmark_load_proposal_contract(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    program = xgov_registry_client.state.box.proposal_approval_program
+    data = program[: load_proposal_contract_data_size_per_transaction()]
+    composer = xgov_registry_client.new_group().load_proposal_contract(
+        args=LoadProposalContractArgs(offset=0, data=data)
+    )
+    _measure(benchmark_recorder, composer.composer(), "load_proposal_contract")
+
+
+def test_benchmark_delete_proposal_contract_box(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().delete_proposal_contract_box()
+    _measure(benchmark_recorder, composer.composer(), "delete_proposal_contract_box")
+
+
+def test_benchmark_pause_registry(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().pause_registry()
+    _measure(benchmark_recorder, composer.composer(), "pause_registry")
+
+
+def test_benchmark_pause_proposals(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().pause_proposals()
+    _measure(benchmark_recorder, composer.composer(), "pause_proposals")
+
+
+def test_benchmark_resume_registry(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    xgov_registry_client.send.pause_registry()
+    composer = xgov_registry_client.new_group().resume_registry()
+    _measure(benchmark_recorder, composer.composer(), "resume_registry")
+
+
+def test_benchmark_resume_proposals(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    xgov_registry_client.send.pause_proposals()
+    composer = xgov_registry_client.new_group().resume_proposals()
+    _measure(benchmark_recorder, composer.composer(), "resume_proposals")
+
+
+def test_benchmark_set_xgov_manager(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_xgov_manager(
+        args=SetXgovManagerArgs(manager=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_xgov_manager")
+
+
+def test_benchmark_set_payor(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_payor(
+        args=SetPayorArgs(payor=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_payor")
+
+
+def test_benchmark_set_xgov_council(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_xgov_council(
+        args=SetXgovCouncilArgs(council=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_xgov_council")
+
+
+def test_benchmark_set_xgov_subscriber(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_xgov_subscriber(
+        args=SetXgovSubscriberArgs(subscriber=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_xgov_subscriber")
+
+
+def test_benchmark_set_kyc_provider(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_kyc_provider(
+        args=SetKycProviderArgs(provider=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_kyc_provider")
+
+
+def test_benchmark_set_committee_manager(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_committee_manager(
+        args=SetCommitteeManagerArgs(manager=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_committee_manager")
+
+
+def test_benchmark_set_xgov_daemon(
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_xgov_daemon(
+        args=SetXgovDaemonArgs(xgov_daemon=no_role_account.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_xgov_daemon")
+
+
+def test_benchmark_config_xgov_registry(
+    xgov_registry_config: XGovRegistryConfig,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().config_xgov_registry(
+        args=ConfigXgovRegistryArgs(config=xgov_registry_config)
+    )
+    _measure(benchmark_recorder, composer.composer(), "config_xgov_registry")
+
+
+def test_benchmark_update_xgov_registry(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().update.update_xgov_registry(
+        compilation_params=AppClientCompilationParams(
+            deploy_time_params={"entropy": b""}
+        ),
+    )
+    _measure(benchmark_recorder, composer.composer(), "update_xgov_registry")
+
+
+def test_benchmark_subscribe_xgov(
+    algorand_client: AlgorandClient,
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().subscribe_xgov(
+        args=SubscribeXgovArgs(
+            voting_address=no_role_account.address,
+            payment=_payment(
+                algorand_client,
+                sender=no_role_account.address,
+                receiver=xgov_registry_client.app_address,
+                amount=get_xgov_fee(xgov_registry_client),
+            ),
+        ),
+        params=benchmark_params(no_role_account),
+    )
+    _measure(benchmark_recorder, composer.composer(), "subscribe_xgov")
+
+
+def test_benchmark_unsubscribe_xgov(
+    xgov: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().unsubscribe_xgov(
+        params=benchmark_params(xgov)
+    )
+    _measure(benchmark_recorder, composer.composer(), "unsubscribe_xgov")
+
+
+def test_benchmark_request_subscribe_xgov(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    xgov_subscriber_app: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().request_subscribe_xgov(
+        args=RequestSubscribeXgovArgs(
+            xgov_address=xgov_subscriber_app.app_address,
+            owner_address=deployer.address,
+            relation_type=0,
+            payment=_payment(
+                algorand_client,
+                sender=deployer.address,
+                receiver=xgov_registry_client.app_address,
+                amount=get_xgov_fee(xgov_registry_client),
+            ),
+        ),
+        params=benchmark_params(deployer),
+    )
+    _measure(benchmark_recorder, composer.composer(), "request_subscribe_xgov")
+
+
+def test_benchmark_approve_subscribe_xgov(
+    xgov_subscriber: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_subscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().approve_subscribe_xgov(
+        args=ApproveSubscribeXgovArgs(
+            request_id=xgov_registry_client.state.global_state.request_id - 1
+        ),
+        params=benchmark_params(xgov_subscriber),
+    )
+    _measure(benchmark_recorder, composer.composer(), "approve_subscribe_xgov")
+
+
+def test_benchmark_reject_subscribe_xgov(
+    xgov_subscriber: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_subscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().reject_subscribe_xgov(
+        args=RejectSubscribeXgovArgs(
+            request_id=xgov_registry_client.state.global_state.request_id - 1
+        ),
+        params=benchmark_params(xgov_subscriber),
+    )
+    _measure(benchmark_recorder, composer.composer(), "reject_subscribe_xgov")
+
+
+def test_benchmark_request_unsubscribe_xgov(
+    algorand_client: AlgorandClient,
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_managed_subscription: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().request_unsubscribe_xgov(
+        args=RequestUnsubscribeXgovArgs(
+            xgov_address=app_xgov_managed_subscription.app_address,
+            owner_address=no_role_account.address,
+            relation_type=0,
+            payment=_payment(
+                algorand_client,
+                sender=no_role_account.address,
+                receiver=xgov_registry_client.app_address,
+                amount=get_xgov_fee(xgov_registry_client),
+            ),
+        ),
+        params=benchmark_params(no_role_account),
+    )
+    _measure(benchmark_recorder, composer.composer(), "request_unsubscribe_xgov")
+
+
+def test_benchmark_approve_unsubscribe_xgov(
+    xgov_subscriber: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_unsubscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().approve_unsubscribe_xgov(
+        args=ApproveUnsubscribeXgovArgs(
+            request_id=xgov_registry_client.state.global_state.request_id - 1
+        ),
+        params=benchmark_params(xgov_subscriber),
+    )
+    _measure(benchmark_recorder, composer.composer(), "approve_unsubscribe_xgov")
+
+
+def test_benchmark_reject_unsubscribe_xgov(
+    xgov_subscriber: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_unsubscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().reject_unsubscribe_xgov(
+        args=RejectUnsubscribeXgovArgs(
+            request_id=xgov_registry_client.state.global_state.request_id - 1
+        ),
+        params=benchmark_params(xgov_subscriber),
+    )
+    _measure(benchmark_recorder, composer.composer(), "reject_unsubscribe_xgov")
+
+
+def test_benchmark_set_voting_account(
+    no_role_account: SigningAccount,
+    xgov: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_voting_account(
+        args=SetVotingAccountArgs(
+            xgov_address=xgov.address,
+            voting_address=no_role_account.address,
+        ),
+        params=benchmark_params(xgov),
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_voting_account")
+
+
+def test_benchmark_subscribe_proposer(
+    algorand_client: AlgorandClient,
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().subscribe_proposer(
+        args=SubscribeProposerArgs(
+            payment=_payment(
+                algorand_client,
+                sender=no_role_account.address,
+                receiver=xgov_registry_client.app_address,
+                amount=get_proposer_fee(xgov_registry_client),
+            )
+        ),
+        params=benchmark_params(no_role_account),
+    )
+    _measure(benchmark_recorder, composer.composer(), "subscribe_proposer")
+
+
+def test_benchmark_set_proposer_kyc(
+    kyc_provider: SigningAccount,
+    proposer_no_kyc: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().set_proposer_kyc(
+        args=SetProposerKycArgs(
+            proposer=proposer_no_kyc.address,
+            kyc_status=True,
+            kyc_expiring=UNLIMITED_KYC_EXPIRATION,
+        ),
+        params=benchmark_params(kyc_provider),
+    )
+    _measure(benchmark_recorder, composer.composer(), "set_proposer_kyc")
+
+
+def test_benchmark_declare_committee(
+    committee_manager: SigningAccount,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = (
+        xgov_registry_client_committee_not_declared.new_group().declare_committee(
+            args=DeclareCommitteeArgs(
+                committee_id=DEFAULT_COMMITTEE_ID,
+                size=DEFAULT_COMMITTEE_MEMBERS,
+                votes=DEFAULT_COMMITTEE_VOTES,
+            ),
+            params=benchmark_params(committee_manager),
+        )
+    )
+    _measure(benchmark_recorder, composer.composer(), "declare_committee")
+
+
+def test_benchmark_declare_committee_with_root(
+    committee_manager: SigningAccount,
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client_committee_not_declared.new_group().declare_committee_with_root(
+        args=DeclareCommitteeWithRootArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=committee_tree.size,
+            votes=committee_tree.votes,
+            committee_root=committee_tree.root,
+        ),
+        params=benchmark_params(committee_manager),
+    )
+    _measure(benchmark_recorder, composer.composer(), "declare_committee_with_root")
+
+
+def test_benchmark_open_proposal(
+    algorand_client: AlgorandClient,
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().open_proposal(
+        args=OpenProposalArgs(
+            payment=_payment(
+                algorand_client,
+                sender=proposer.address,
+                receiver=xgov_registry_client.app_address,
+                amount=get_open_proposal_fee(xgov_registry_client),
+            )
+        ),
+        params=benchmark_params(proposer),
+    )
+    _measure(benchmark_recorder, composer.composer(), "open_proposal")
+
+
+def test_benchmark_vote_proposal(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().vote_proposal(
+        args=VoteProposalArgs(
+            proposal_id=voting_proposal_client.app_id,
+            xgov_address=committee[0].account.address,
+            approval_votes=committee[0].votes,
+            rejection_votes=0,
+        ),
+        params=benchmark_params(committee[0].account),
+    )
+    _measure(benchmark_recorder, composer.composer(), "vote_proposal")
+
+
+@pytest.mark.parametrize("batch_length", VOTE_BATCH_LENGTHS)
+def test_benchmark_vote_proposal_batch(
+    batch_length: int,
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    members = committee[:batch_length]
+    for cm in members:
+        xgov_registry_client.send.set_voting_account(
+            args=SetVotingAccountArgs(
+                xgov_address=cm.account.address,
+                voting_address=no_role_account.address,
+            ),
+            params=CommonAppCallParams(sender=cm.account.address),
+        )
+
+    composer = xgov_registry_client.new_group().vote_proposal_batch(
+        args=VoteProposalBatchArgs(
+            proposal_id=voting_proposal_client.app_id,
+            votes=[(cm.account.address, cm.votes, 0) for cm in members],
+        ),
+        params=benchmark_params(no_role_account),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote_proposal_batch",
+        f"batch_length={batch_length}",
+    )
+
+
+def test_benchmark_vote_proposals(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+    second_voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    proposals = [voting_proposal_client, second_voting_proposal_client]
+    composer = xgov_registry_client.new_group().vote_proposals(
+        args=VoteProposalsArgs(
+            xgov_address=committee[0].account.address,
+            votes=[(p.app_id, committee[0].votes, 0) for p in proposals],
+        ),
+        params=benchmark_params(committee[0].account),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote_proposals",
+        f"proposals={len(proposals)}",
+    )
+
+
+def test_benchmark_vote_proposal_with_proof(
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    composer = xgov_registry_client.new_group().vote_proposal_with_proof(
+        args=VoteProposalWithProofArgs(
+            proposal_id=merkle_voting_proposal_client.app_id,
+            xgov_address=membership.address,
+            voting_power=membership.votes,
+            ordinal=membership.ordinal,
+            proof=list(membership.proof),
+            approval_votes=membership.votes,
+            rejection_votes=0,
+        ),
+        params=benchmark_params(committee[0].account),
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "vote_proposal_with_proof",
+        f"committee_size={committee_tree.size}",
+    )
+
+
+@pytest.mark.parametrize("batch_length", ABSENTEES_BATCH_LENGTHS)
+def test_benchmark_unassign_absentee_from_proposal(
+    batch_length: int,
+    xgov_registry_client: XGovRegistryClient,
+    rejected_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    absentees = list(rejected_proposal_client.state.box.voters.get_map())
+    composer = xgov_registry_client.new_group()
+    unassign_absentees(
+        composer,
+        rejected_proposal_client.app_id,
+        absentees[:batch_length],
+        static_fee=BENCHMARK_STATIC_FEE,
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "unassign_absentee_from_proposal",
+        f"absentees={batch_length}",
+    )
+
+
+def test_benchmark_unassign_absentee_from_proposal_with_proof(
+    min_fee_times_2: AlgoAmount,
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    scrutinize_proposal(no_role_account, merkle_voting_proposal_client, min_fee_times_2)
+    membership = committee_tree.proof(committee[0].account.address)
+    composer = (
+        xgov_registry_client.new_group().unassign_absentee_from_proposal_with_proof(
+            args=UnassignAbsenteeFromProposalWithProofArgs(
+                proposal_id=merkle_voting_proposal_client.app_id,
+                xgov_address=membership.address,
+                voting_power=membership.votes,
+                ordinal=membership.ordinal,
+                proof=list(membership.proof),
+            ),
+            params=benchmark_params(),
+        )
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "unassign_absentee_from_proposal_with_proof",
+        f"committee_size={committee_tree.size}",
+    )
+
+
+def test_benchmark_pay_grant_proposal(
+    xgov_payor: SigningAccount,
+    funded_xgov_registry_client: XGovRegistryClient,
+    reviewed_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = funded_xgov_registry_client.new_group().pay_grant_proposal(
+        args=PayGrantProposalArgs(proposal_id=reviewed_proposal_client.app_id),
+        params=benchmark_params(xgov_payor),
+    )
+    _measure(benchmark_recorder, composer.composer(), "pay_grant_proposal")
+
+
+def test_benchmark_finalize_proposal(
+    xgov_daemon: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    funded_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().finalize_proposal(
+        args=FinalizeProposalArgs(proposal_id=funded_proposal_client.app_id),
+        params=benchmark_params(xgov_daemon),
+    )
+    _measure(benchmark_recorder, composer.composer(), "finalize_proposal")
+
+
+def test_benchmark_drop_proposal(
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    draft_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().drop_proposal(
+        args=DropProposalArgs(proposal_id=draft_proposal_client.app_id),
+        params=benchmark_params(proposer),
+    )
+    _measure(benchmark_recorder, composer.composer(), "drop_proposal")
+
+
+def test_benchmark_deposit_funds(
+    algorand_client: AlgorandClient,
+    deployer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().deposit_funds(
+        args=DepositFundsArgs(
+            payment=_payment(
+                algorand_client,
+                sender=deployer.address,
+                receiver=xgov_registry_client.app_address,
+                amount=AlgoAmount(algo=1),
+            )
+        )
+    )
+    _measure(benchmark_recorder, composer.composer(), "deposit_funds")
+
+
+def test_benchmark_withdraw_funds(
+    funded_xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = funded_xgov_registry_client.new_group().withdraw_funds(
+        args=WithdrawFundsArgs(amount=TREASURY_AMOUNT.micro_algo),
+        params=benchmark_params(),
+    )
+    _measure(benchmark_recorder, composer.composer(), "withdraw_funds")
+
+
+def test_benchmark_withdraw_available_funds(
+    xgov_payor: SigningAccount,
+    funded_xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    available = funded_xgov_registry_client.send.get_available_funds().abi_return
+    composer = funded_xgov_registry_client.new_group().withdraw_available_funds(
+        args=WithdrawAvailableFundsArgs(amount=available),  # type: ignore[arg-type]
+        params=benchmark_params(xgov_payor),
+    )
+    _measure(benchmark_recorder, composer.composer(), "withdraw_available_funds")
+
+
+def test_benchmark_get_available_funds(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_available_funds()
+    _measure(benchmark_recorder, composer.composer(), "get_available_funds")
+
+
+def test_benchmark_get_state(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_state()
+    _measure(benchmark_recorder, composer.composer(), "get_state")
+
+
+def test_benchmark_get_state_version(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_state_version()
+    _measure(benchmark_recorder, composer.composer(), "get_state_version")
+
+
+def test_benchmark_get_xgov_box(
+    xgov: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_xgov_box(
+        args=GetXgovBoxArgs(xgov_address=xgov.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "get_xgov_box")
+
+
+def test_benchmark_get_proposer_box(
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_proposer_box(
+        args=GetProposerBoxArgs(proposer_address=proposer.address)
+    )
+    _measure(benchmark_recorder, composer.composer(), "get_proposer_box")
+
+
+def test_benchmark_get_request_box(
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_subscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_request_box(
+        args=GetRequestBoxArgs(
+            request_id=xgov_registry_client.state.global_state.request_id - 1
+        )
+    )
+    _measure(benchmark_recorder, composer.composer(), "get_request_box")
+
+
+def test_benchmark_get_request_unsubscribe_box(
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_unsubscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_request_unsubscribe_box(
+        args=GetRequestUnsubscribeBoxArgs(
+            request_id=xgov_registry_client.state.global_state.request_id - 1
+        )
+    )
+    _measure(benchmark_recorder, composer.composer(), "get_request_unsubscribe_box")
+
+
+@pytest.mark.parametrize("batch_length", READ_BATCH_LENGTHS)
+def test_benchmark_get_xgov_boxes(
+    batch_length: int,
+    xgov: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_xgov_boxes(
+        args=GetXgovBoxesArgs(xgov_addresses=[xgov.address] * batch_length)
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "get_xgov_boxes",
+        f"entries={batch_length}",
+    )
+
+
+@pytest.mark.parametrize("batch_length", READ_BATCH_LENGTHS)
+def test_benchmark_get_proposer_boxes(
+    batch_length: int,
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_proposer_boxes(
+        args=GetProposerBoxesArgs(proposer_addresses=[proposer.address] * batch_length)
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "get_proposer_boxes",
+        f"entries={batch_length}",
+    )
+
+
+@pytest.mark.parametrize("batch_length", READ_BATCH_LENGTHS)
+def test_benchmark_get_request_boxes(
+    batch_length: int,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_subscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    request_id = xgov_registry_client.state.global_state.request_id - 1
+    composer = xgov_registry_client.new_group().get_request_boxes(
+        args=GetRequestBoxesArgs(request_ids=[request_id] * batch_length)
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "get_request_boxes",
+        f"entries={batch_length}",
+    )
+
+
+@pytest.mark.parametrize("batch_length", READ_BATCH_LENGTHS)
+def test_benchmark_get_request_unsubscribe_boxes(
+    batch_length: int,
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_unsubscribe_requested: XGovSubscriberAppMockClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    request_id = xgov_registry_client.state.global_state.request_id - 1
+    composer = xgov_registry_client.new_group().get_request_unsubscribe_boxes(
+        args=GetRequestUnsubscribeBoxesArgs(request_ids=[request_id] * batch_length)
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "get_request_unsubscribe_boxes",
+        f"entries={batch_length}",
+    )
+
+
+@pytest.mark.parametrize("batch_length", [1, MAX_PROPOSALS_SUMMARY])
+def test_benchmark_get_proposals_summary(
+    batch_length: int,
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().get_proposals_summary(
+        args=GetProposalsSummaryArgs(
+            proposal_ids=[voting_proposal_client.app_id] * batch_length
+        )
+    )
+    _measure(
+        benchmark_recorder,
+        composer.composer(),
+        "get_proposals_summary",
+        f"proposals={batch_length}",
+    )
+
+
+def test_benchmark_is_proposal(
+    xgov_registry_client: XGovRegistryClient,
+    proposal_client: ProposalClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().is_proposal(
+        args=IsProposalArgs(proposal_id=proposal_client.app_id)
+    )
+    _measure(benchmark_recorder, composer.composer(), "is_proposal")
+
+
+def test_benchmark_op_up(
+    xgov_registry_client: XGovRegistryClient,
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    composer = xgov_registry_client.new_group().op_up()
+    _measure(benchmark_recorder, composer.composer(), "op_up")
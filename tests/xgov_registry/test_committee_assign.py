@@ -0,0 +1,215 @@
+from types import SimpleNamespace
+
+import pytest
+from algosdk import account, encoding
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.proposal.constants import (
+    VOTER_BUCKET_MAX_MEMBERS,
+    VOTER_BUCKET_PREFIX_RANGE,
+)
+from smart_contracts.xgov_registry.box_names import get_voter_bucket_box_name
+from smart_contracts.xgov_registry.committee_assign import (
+    get_existing_boxes,
+    get_voter_bucket,
+    max_bucket_voters_per_transaction,
+    max_voters_per_transaction,
+    parse_committee_members,
+    plan_bucketed_voters_assignment,
+    plan_voters_assignment,
+    voter_buckets_count,
+)
+from smart_contracts.xgov_registry.constants import (
+    MAX_APP_TXN_REFERENCES,
+    MAX_GROUP_SIZE,
+)
+
+PER_TXN = max_voters_per_transaction()
+GROUP_CAPACITY = MAX_GROUP_SIZE * MAX_APP_TXN_REFERENCES - 1
+
+
+def _committee(size: int) -> list[tuple[str, int]]:
+    return [(account.generate_account()[1], i + 1) for i in range(size)]
+
+
+def test_max_voters_per_transaction_bound_by_references() -> None:
+    assert PER_TXN == MAX_APP_TXN_REFERENCES
+
+
+def test_plan_small_committee_single_transaction() -> None:
+    committee = _committee(PER_TXN - 1)
+
+    plan = plan_voters_assignment(committee)
+
+    assert plan.groups == ((tuple(committee),),)
+    assert plan.transaction_count == 1
+    assert plan.voters_count == len(committee)
+
+
+def test_plan_first_call_reserves_registry_reference() -> None:
+    committee = _committee(PER_TXN)
+
+    plan = plan_voters_assignment(committee)
+
+    assert plan.groups == ((tuple(committee[:-1]), tuple(committee[-1:])),)
+
+
+def test_plan_fewest_groups() -> None:
+    committee = _committee(2 * GROUP_CAPACITY + 1)
+
+    plan = plan_voters_assignment(committee)
+
+    assert len(plan.groups) == 3
+    assert [len(group) for group in plan.groups] == [MAX_GROUP_SIZE] * 2 + [1]
+    assert all(len(group[0]) == PER_TXN - 1 for group in plan.groups[:2])
+    assert all(len(txn) <= PER_TXN for group in plan.groups for txn in group)
+    assert [m for group in plan.groups for txn in group for m in txn] == committee
+
+
+def test_plan_empty_committee() -> None:
+    assert plan_voters_assignment([]).groups == ()
+
+
+def test_plan_rejects_oversized_committee() -> None:
+    with pytest.raises(ValueError, match="exceeds max committee size"):
+        plan_voters_assignment(_committee(3), max_committee_size=2)
+
+
+def test_plan_rejects_duplicate_members() -> None:
+    committee = _committee(2)
+    with pytest.raises(ValueError, match="duplicate committee member"):
+        plan_voters_assignment([*committee, committee[0]])
+
+
+def test_plan_rejects_non_positive_votes() -> None:
+    address, _ = _committee(1)[0]
+    with pytest.raises(ValueError, match="invalid voting power"):
+        plan_voters_assignment([(address, 0)])
+
+
+def test_parse_committee_members() -> None:
+    committee = _committee(2)
+    document = {"xGovs": [{"address": a, "votes": v} for a, v in committee]}
+
+    assert parse_committee_members(document) == committee
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {},
+        {"xGovs": [{"address": "not-an-address", "votes": 1}]},
+        {"xGovs": ["member"]},
+    ],
+)
+def test_parse_committee_members_rejects_invalid_documents(
+    document: dict[str, object],
+) -> None:
+    with pytest.raises(ValueError):
+        parse_committee_members(document)
+
+
+def _public_key(address: str) -> bytes:
+    return encoding.decode_address(address)  # type: ignore[no-any-return]
+
+
+def test_voter_buckets_count() -> None:
+    assert voter_buckets_count(1) == 1
+    assert voter_buckets_count(16) == 1
+    assert voter_buckets_count(17) == 2
+
+
+def test_get_voter_bucket_sorted_prefix_ranges() -> None:
+    committee = sorted(_committee(100), key=lambda member: _public_key(member[0]))
+    buckets = [get_voter_bucket(address, 7) for address, _ in committee]
+
+    assert buckets == sorted(buckets)
+    assert all(0 <= bucket < 7 for bucket in buckets)
+    address = encoding.encode_address(b"\xff" * 32)  # type: ignore[no-untyped-call]
+    assert get_voter_bucket(address, VOTER_BUCKET_PREFIX_RANGE) == (
+        VOTER_BUCKET_PREFIX_RANGE - 1
+    )
+
+
+def test_plan_bucketed_sorted_and_bucket_atomic() -> None:
+    committee = _committee(4_000)
+    buckets = voter_buckets_count(len(committee))
+
+    plan = plan_bucketed_voters_assignment(committee, buckets=buckets)
+
+    voters = [m for group in plan.groups for txn in group for m in txn]
+    assert voters == sorted(committee, key=lambda member: _public_key(member[0]))
+    assert all(len(group) <= MAX_GROUP_SIZE for group in plan.groups)
+    assert all(
+        len(txn) <= max_bucket_voters_per_transaction()
+        for group in plan.groups
+        for txn in group
+    )
+    group_buckets = [
+        {get_voter_bucket(a, buckets) for txn in group for a, _ in txn}
+        for group in plan.groups
+    ]
+    # A bucket is never split across groups
+    assert sum(len(b) for b in group_buckets) == len(set().union(*group_buckets))
+    for group in plan.groups:
+        for i, txn in enumerate(group):
+            txn_buckets = {get_voter_bucket(a, buckets) for a, _ in txn}
+            assert len(txn_buckets) <= MAX_APP_TXN_REFERENCES - (1 if i == 0 else 0)
+
+
+def test_plan_bucketed_fewer_transactions() -> None:
+    committee = _committee(GROUP_CAPACITY)
+    buckets = voter_buckets_count(len(committee))
+
+    assert (
+        plan_bucketed_voters_assignment(committee, buckets=buckets).transaction_count
+        < plan_voters_assignment(committee).transaction_count
+    )
+
+
+def test_plan_bucketed_rejects_invalid_buckets() -> None:
+    with pytest.raises(ValueError, match="buckets must be positive"):
+        plan_bucketed_voters_assignment(_committee(1), buckets=0)
+
+
+def test_plan_bucketed_rejects_full_bucket() -> None:
+    committee = _committee(VOTER_BUCKET_MAX_MEMBERS + 1)
+
+    with pytest.raises(ValueError, match=f"max {VOTER_BUCKET_MAX_MEMBERS}"):
+        plan_bucketed_voters_assignment(committee, buckets=1)
+
+
+def test_plan_bucketed_rejects_duplicate_members() -> None:
+    committee = _committee(2)
+    with pytest.raises(ValueError, match="duplicate committee member"):
+        plan_bucketed_voters_assignment([*committee, committee[0]], buckets=1)
+
+
+class _BoxAlgod:
+    """Stub of the algod box endpoint, any box listing would fail"""
+
+    def __init__(self, boxes: set[bytes]) -> None:
+        self.boxes = boxes
+        self.requested: list[bytes] = []
+
+    def application_box_by_name(self, app_id: int, name: bytes) -> dict[str, str]:
+        self.requested.append(name)
+        if name == b"unavailable":
+            raise AlgodHTTPError("internal error", code=500)  # type: ignore[no-untyped-call]
+        if name not in self.boxes:
+            raise AlgodHTTPError("box not found", code=404)  # type: ignore[no-untyped-call]
+        return {"name": name.hex()}
+
+
+def test_get_existing_boxes() -> None:
+    names = [get_voter_bucket_box_name(bucket) for bucket in range(4)]
+    algod = _BoxAlgod({names[1], names[3]})
+    proposal_client = SimpleNamespace(
+        app_id=1, algorand=SimpleNamespace(client=SimpleNamespace(algod=algod))
+    )
+
+    assert get_existing_boxes(proposal_client, names) == {names[1], names[3]}  # type: ignore[arg-type]
+    assert algod.requested == names
+
+    with pytest.raises(AlgodHTTPError, match="internal error"):
+        get_existing_boxes(proposal_client, [b"unavailable"])  # type: ignore[arg-type]
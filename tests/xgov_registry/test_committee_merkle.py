@@ -0,0 +1,149 @@
+import dataclasses
+
+import pytest
+from algosdk import account
+
+from smart_contracts.proposal.constants import VOTED_BITMAP_PAGE_MEMBERS
+from smart_contracts.xgov_registry.committee_merkle import (
+    EMPTY_NODE,
+    CommitteeMerkleTree,
+    absentee_ordinals,
+    committee_leaf,
+    committee_node,
+    verify_membership_proof,
+    voted_bitmap_page_count,
+    voted_ordinals,
+)
+
+
+def _committee(size: int) -> list[tuple[str, int]]:
+    return [(account.generate_account()[1], votes) for votes in range(1, size + 1)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 20])
+def test_proofs_verify(size: int) -> None:
+    committee = _committee(size)
+    tree = CommitteeMerkleTree(committee)
+
+    assert tree.size == size
+    assert tree.votes == sum(votes for _, votes in committee)
+    assert sorted(tree.ordinal(address) for address, _ in committee) == list(
+        range(size)
+    )
+    for address, votes in committee:
+        membership = tree.proof(address)
+        assert membership.votes == votes
+        assert verify_membership_proof(tree.root, membership)
+
+
+def test_root_independent_of_order() -> None:
+    committee = _committee(5)
+
+    assert (
+        CommitteeMerkleTree(committee).root
+        == CommitteeMerkleTree(reversed(committee)).root
+    )
+
+
+def test_root_single_member() -> None:
+    address, votes = _committee(1)[0]
+
+    assert CommitteeMerkleTree([(address, votes)]).root == committee_leaf(
+        address, votes
+    )
+
+
+def test_root_odd_level_padding() -> None:
+    tree = CommitteeMerkleTree(_committee(3))
+    leaves = [committee_leaf(address, votes) for address, votes in tree.members]
+
+    assert tree.root == committee_node(
+        committee_node(leaves[0], leaves[1]),
+        committee_node(leaves[2], EMPTY_NODE),
+    )
+
+
+def test_proof_wrong_votes() -> None:
+    committee = _committee(4)
+    tree = CommitteeMerkleTree(committee)
+    membership = tree.proof(committee[0][0])
+
+    assert not verify_membership_proof(
+        tree.root, dataclasses.replace(membership, votes=membership.votes + 1)
+    )
+
+
+def test_proof_wrong_ordinal() -> None:
+    committee = _committee(4)
+    tree = CommitteeMerkleTree(committee)
+    membership = tree.proof(committee[0][0])
+
+    assert not verify_membership_proof(
+        tree.root, dataclasses.replace(membership, ordinal=membership.ordinal ^ 1)
+    )
+    assert not verify_membership_proof(
+        tree.root, dataclasses.replace(membership, ordinal=membership.ordinal + 4)
+    )
+
+
+def test_not_member() -> None:
+    tree = CommitteeMerkleTree(_committee(2))
+
+    with pytest.raises(LookupError):
+        tree.proof(_committee(1)[0][0])
+
+
+def test_empty_committee() -> None:
+    with pytest.raises(ValueError, match="empty"):
+        CommitteeMerkleTree([])
+
+
+def test_duplicate_member() -> None:
+    address, votes = _committee(1)[0]
+
+    with pytest.raises(ValueError, match="duplicate"):
+        CommitteeMerkleTree([(address, votes), (address, votes)])
+
+
+def test_invalid_votes() -> None:
+    address, _ = _committee(1)[0]
+
+    with pytest.raises(ValueError, match="voting power"):
+        CommitteeMerkleTree([(address, 0)])
+
+
+def test_voted_ordinals() -> None:
+    first_page = bytes([0b1000_0001, 0, 0b0100_0000])
+    last_page = bytes([0b0010_0000])
+
+    assert voted_ordinals([first_page, None, last_page]) == [
+        0,
+        7,
+        17,
+        2 * VOTED_BITMAP_PAGE_MEMBERS + 2,
+    ]
+
+
+def test_voted_bitmap_page_count() -> None:
+    assert voted_bitmap_page_count(1) == 1
+    assert voted_bitmap_page_count(VOTED_BITMAP_PAGE_MEMBERS) == 1
+    assert voted_bitmap_page_count(VOTED_BITMAP_PAGE_MEMBERS + 1) == 2
+
+
+def test_absentee_ordinals() -> None:
+    first_page = bytes([0b1011_1111, 0b1100_0000])
+
+    assert absentee_ordinals([first_page], 10) == [1]
+    # Pages without votes are not created
+    assert absentee_ordinals([None], 3) == [0, 1, 2]
+    assert absentee_ordinals([], 3) == [0, 1, 2]
+
+
+def test_absentees() -> None:
+    tree = CommitteeMerkleTree(_committee(10))
+    page = bytearray(2)
+    for ordinal in range(1, tree.size):
+        page[ordinal // 8] |= 0x80 >> (ordinal % 8)
+
+    assert tree.absentees([bytes(page)]) == [tree.members[0][0]]
+    assert tree.absentees([None]) == [address for address, _ in tree.members]
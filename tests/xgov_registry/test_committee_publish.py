@@ -1,11 +1,16 @@
+import json
+from pathlib import Path
+
 import pytest
 
 from smart_contracts.xgov_registry.committee_publish import (
     DEFAULT_TESTNET_COMMITTEE_MEMBERS,
     DEFAULT_TESTNET_COMMITTEE_VOTES,
+    CommitteeIndex,
     compute_target_anchor,
     decode_committee_id_b64,
     get_committee_entry,
+    load_committee_entry,
     parse_positive_int,
     resolve_mainnet_committee_values,
     resolve_testnet_committee_values,
@@ -150,3 +155,113 @@ def test_resolve_testnet_committee_values_reject_invalid_overrides(
         resolve_testnet_committee_values(
             VALID_COMMITTEE_ID_B64, committee_members, committee_votes
         )
+
+
+def _committee(members: int) -> dict[str, object]:
+    return {
+        "committeeId": VALID_COMMITTEE_ID_B64,
+        "totalMembers": members,
+        "totalVotes": members * 1_000,
+    }
+
+
+def _write_index(path: Path, committees: dict[str, object]) -> None:
+    path.write_text(
+        json.dumps(
+            {"version": 1, "network": {"name": "x}{"}, "committees": committees},
+            indent=2,
+        )
+    )
+
+
+def test_committee_index_lookup(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    _write_index(
+        index_path,
+        {
+            str(anchor): _committee(anchor // 1_000_000)
+            for anchor in range(1_000_000, 60_000_001, 1_000_000)
+        },
+    )
+
+    with CommitteeIndex(index_path) as index:
+        assert len(index) == 60
+        assert 60_000_000 in index
+        assert 60_000_001 not in index
+        entry = index.get(60_000_000)
+
+    assert entry.committee_id_b64 == VALID_COMMITTEE_ID_B64
+    assert entry.total_members == 60
+    assert entry.total_votes == 60_000
+    assert (tmp_path / "committees.json.idx").exists()
+
+
+def test_committee_index_missing_target_anchor(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    _write_index(index_path, {})
+
+    with pytest.raises(LookupError, match="target anchor 60000000"):
+        load_committee_entry(index_path, 60_000_000)
+
+
+def test_committee_index_invalid_committee_id(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    _write_index(
+        index_path,
+        {"60000000": {"committeeId": "", "totalMembers": 10, "totalVotes": 20}},
+    )
+
+    with pytest.raises(ValueError, match="committeeId is missing"):
+        load_committee_entry(index_path, 60_000_000)
+
+
+def test_committee_index_missing_committees(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    index_path.write_text(json.dumps({"version": 1}))
+
+    with pytest.raises(ValueError, match="committees mapping"):
+        load_committee_entry(index_path, 60_000_000)
+
+
+def test_committee_index_appended_entries(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    committees: dict[str, object] = {"59000000": _committee(59)}
+    _write_index(index_path, committees)
+    assert load_committee_entry(index_path, 59_000_000).total_members == 59
+
+    committees["60000000"] = _committee(60)
+    _write_index(index_path, committees)
+
+    assert load_committee_entry(index_path, 59_000_000).total_members == 59
+    assert load_committee_entry(index_path, 60_000_000).total_members == 60
+
+
+def test_committee_index_rewritten_document(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    _write_index(index_path, {"59000000": _committee(59)})
+    assert load_committee_entry(index_path, 59_000_000).total_members == 59
+
+    _write_index(index_path, {"59000000": _committee(5)})
+
+    assert load_committee_entry(index_path, 59_000_000).total_members == 5
+
+
+def test_committee_index_empty_document(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    index_path.touch()
+
+    with pytest.raises(ValueError, match="committees mapping"):
+        load_committee_entry(index_path, 60_000_000)
+
+
+def test_committee_index_empty_sidecar(tmp_path: Path) -> None:
+    index_path = tmp_path / "committees.json"
+    sidecar_path = tmp_path / "committees.idx"
+    _write_index(index_path, {"60000000": _committee(60)})
+    # Freshly created, e.g. by a temporary file helper
+    sidecar_path.touch()
+
+    assert (
+        load_committee_entry(index_path, 60_000_000, sidecar_path).total_members == 60
+    )
+    assert sidecar_path.stat().st_size > 0
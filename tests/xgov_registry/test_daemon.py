@@ -0,0 +1,157 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.proposal.enums import (
+    STATUS_APPROVED,
+    STATUS_DRAFT,
+    STATUS_FUNDED,
+    STATUS_REJECTED,
+    STATUS_REVIEWED,
+    STATUS_SUBMITTED,
+    STATUS_VOTING,
+)
+from smart_contracts.xgov_registry.committee_assign import get_voter_bucket
+from smart_contracts.xgov_registry.daemon import (
+    ACTION_ASSIGN_VOTERS,
+    ACTION_FINALIZE,
+    ACTION_SCRUTINY,
+    ACTION_UNASSIGN_ABSENTEES,
+    ConfirmationWaiter,
+    DaemonCheckpoint,
+    next_action,
+    plan_absentees_unassignment,
+)
+
+NOW = 10_000
+
+
+def _addresses(count: int) -> list[str]:
+    return [account.generate_account()[1] for _ in range(count)]  # type: ignore[no-untyped-call]
+
+
+def _state(**overrides: int) -> dict[str, int]:
+    state = {
+        "status": STATUS_VOTING,
+        "finalized": 0,
+        "committee_members": 10,
+        "assigned_members": 10,
+        "voted_members": 0,
+        "vote_open_ts": NOW - 100,
+        "voting_duration": 200,
+    }
+    state.update(overrides)
+    return state
+
+
+@pytest.mark.parametrize(
+    ("state", "action"),
+    [
+        (_state(status=STATUS_DRAFT), None),
+        (_state(status=STATUS_SUBMITTED, assigned_members=4), ACTION_ASSIGN_VOTERS),
+        (_state(), None),
+        (_state(voted_members=10, assigned_members=0), ACTION_SCRUTINY),
+        (_state(vote_open_ts=NOW - 201), ACTION_SCRUTINY),
+        (_state(status=STATUS_APPROVED, assigned_members=2), ACTION_UNASSIGN_ABSENTEES),
+        (_state(status=STATUS_APPROVED, assigned_members=0), None),
+        (_state(status=STATUS_REJECTED, assigned_members=0), ACTION_FINALIZE),
+        (_state(status=STATUS_REVIEWED), None),
+        (_state(status=STATUS_FUNDED), ACTION_FINALIZE),
+        (_state(status=STATUS_FUNDED, finalized=1), None),
+    ],
+)
+def test_next_action(state: dict[str, int], action: str | None) -> None:
+    assert next_action(state, NOW) == action
+
+
+def test_plan_absentees_unassignment_voter_boxes() -> None:
+    absentees = _addresses(20)
+    plan = plan_absentees_unassignment(absentees)
+    assert [len(call) for group in plan for call in group] == [7, 7, 6]
+    assert [address for group in plan for call in group for address in call] == (
+        absentees
+    )
+
+    assert len(plan_absentees_unassignment(absentees, max_group_size=2)) == 2
+
+
+def test_plan_absentees_unassignment_buckets() -> None:
+    buckets = 4
+    absentees = _addresses(40)
+    plan = plan_absentees_unassignment(absentees, buckets=buckets)
+    calls = [call for group in plan for call in group]
+    assert sorted(address for call in calls for address in call) == sorted(absentees)
+    for call in calls:
+        assert len({get_voter_bucket(address, buckets) for address in call}) <= 3
+
+
+def test_plan_absentees_unassignment_rejects_invalid_group_size() -> None:
+    with pytest.raises(ValueError, match="max_group_size"):
+        plan_absentees_unassignment([], max_group_size=0)
+
+
+def test_daemon_checkpoint_roundtrip(tmp_path: Path) -> None:
+    path = tmp_path / "daemon.json"
+    checkpoint = DaemonCheckpoint(path)
+    checkpoint.mark_finalized(1001)
+    checkpoint.add_in_flight("TXID1", 1002, 500)
+    checkpoint.add_in_flight("TXID2", 1003, 600)
+    checkpoint.remove_in_flight("TXID2")
+
+    restored = DaemonCheckpoint(path)
+    assert restored.finalized == {1001}
+    assert restored.in_flight == {"TXID1": (1002, 500)}
+
+
+class _FakeAlgod:
+    def __init__(self, pending: dict[str, dict[str, Any]]) -> None:
+        self.pending = pending
+
+    def pending_transaction_info(self, txid: str) -> dict[str, Any]:
+        if txid not in self.pending:
+            raise AlgodHTTPError("not found", 404)  # type: ignore[no-untyped-call]
+        return self.pending[txid]
+
+
+def test_confirmation_waiter_checks_pending_together() -> None:
+    algod = _FakeAlgod(
+        {
+            "CONFIRMED": {"confirmed-round": 11},
+            "REJECTED": {"pool-error": "overspend"},
+            "EXPIRED": {},
+            "PENDING": {},
+        }
+    )
+
+    async def scenario() -> None:
+        waiter = ConfirmationWaiter(algod)  # type: ignore[arg-type]
+        waits = {
+            txid: asyncio.ensure_future(waiter.wait(txid, last_valid))
+            for txid, last_valid in [
+                ("CONFIRMED", 100),
+                ("REJECTED", 100),
+                ("UNKNOWN", 100),
+                ("EXPIRED", 10),
+                ("PENDING", 100),
+            ]
+        }
+        await asyncio.sleep(0)
+        await waiter.check(11)
+
+        assert await waits["CONFIRMED"] == 11
+        assert await waits["UNKNOWN"] is None
+        with pytest.raises(RuntimeError, match="rejected"):
+            await waits["REJECTED"]
+        with pytest.raises(RuntimeError, match="expired"):
+            await waits["EXPIRED"]
+        assert not waits["PENDING"].done()
+
+        algod.pending["PENDING"] = {"confirmed-round": 12}
+        await waiter.check(12)
+        assert await waits["PENDING"] == 12
+
+    asyncio.run(scenario())
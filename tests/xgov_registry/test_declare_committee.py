@@ -3,9 +3,11 @@ from algokit_utils import CommonAppCallParams, LogicError, SigningAccount
 
 from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
     DeclareCommitteeArgs,
+    DeclareCommitteeWithRootArgs,
     XGovRegistryClient,
 )
 from smart_contracts.errors import std_errors as err
+from smart_contracts.proposal.constants import VOTED_BITMAP_PAGE_MEMBERS
 from tests.common import (
     DEFAULT_COMMITTEE_ID,
     DEFAULT_COMMITTEE_MEMBERS,
@@ -13,6 +15,8 @@ from tests.common import (
 )
 from tests.xgov_registry.common import assert_committee
 
+COMMITTEE_ROOT = bytes(range(32))
+
 
 def test_declare_committee_success(
     committee_manager: SigningAccount,
@@ -66,3 +70,112 @@ def test_declare_committee_too_large(
             ),
             params=CommonAppCallParams(sender=committee_manager.address),
         )
+
+
+def test_declare_committee_with_root_success(
+    committee_manager: SigningAccount,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+) -> None:
+    xgov_registry_client_committee_not_declared.send.declare_committee_with_root(
+        args=DeclareCommitteeWithRootArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=DEFAULT_COMMITTEE_MEMBERS,
+            votes=DEFAULT_COMMITTEE_VOTES,
+            committee_root=COMMITTEE_ROOT,
+        ),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+
+    assert_committee(
+        xgov_registry_client=xgov_registry_client_committee_not_declared,
+        committee_id=DEFAULT_COMMITTEE_ID,
+        committee_size=DEFAULT_COMMITTEE_MEMBERS,
+        committee_votes=DEFAULT_COMMITTEE_VOTES,
+    )
+    global_state = xgov_registry_client_committee_not_declared.state.global_state
+    assert bytes(global_state.committee_root) == COMMITTEE_ROOT
+
+
+def test_declare_committee_with_root_larger_than_max_size(
+    committee_manager: SigningAccount,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+) -> None:
+    # The voted bitmap MBR is bounded, not the Committee size
+    max_committee_size = (
+        xgov_registry_client_committee_not_declared.state.global_state.max_committee_size
+    )
+    xgov_registry_client_committee_not_declared.send.declare_committee_with_root(
+        args=DeclareCommitteeWithRootArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=max_committee_size + 1,
+            votes=DEFAULT_COMMITTEE_VOTES,
+            committee_root=COMMITTEE_ROOT,
+        ),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+
+    assert (
+        xgov_registry_client_committee_not_declared.state.global_state.committee_members
+        == max_committee_size + 1
+    )
+
+
+def test_declare_committee_with_root_too_large(
+    committee_manager: SigningAccount,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+) -> None:
+    max_committee_size = (
+        xgov_registry_client_committee_not_declared.state.global_state.max_committee_size
+    )
+    with pytest.raises(LogicError, match=err.COMMITTEE_SIZE_TOO_LARGE):
+        xgov_registry_client_committee_not_declared.send.declare_committee_with_root(
+            args=DeclareCommitteeWithRootArgs(
+                committee_id=DEFAULT_COMMITTEE_ID,
+                size=max_committee_size * VOTED_BITMAP_PAGE_MEMBERS,
+                votes=DEFAULT_COMMITTEE_VOTES,
+                committee_root=COMMITTEE_ROOT,
+            ),
+            params=CommonAppCallParams(sender=committee_manager.address),
+        )
+
+
+def test_declare_committee_resets_root(
+    committee_manager: SigningAccount,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+) -> None:
+    xgov_registry_client_committee_not_declared.send.declare_committee_with_root(
+        args=DeclareCommitteeWithRootArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=DEFAULT_COMMITTEE_MEMBERS,
+            votes=DEFAULT_COMMITTEE_VOTES,
+            committee_root=COMMITTEE_ROOT,
+        ),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+    xgov_registry_client_committee_not_declared.send.declare_committee(
+        args=DeclareCommitteeArgs(
+            committee_id=DEFAULT_COMMITTEE_ID,
+            size=DEFAULT_COMMITTEE_MEMBERS,
+            votes=DEFAULT_COMMITTEE_VOTES,
+        ),
+        params=CommonAppCallParams(sender=committee_manager.address),
+    )
+
+    global_state = xgov_registry_client_committee_not_declared.state.global_state
+    assert bytes(global_state.committee_root) == b""
+
+
+def test_declare_committee_with_root_not_manager(
+    no_role_account: SigningAccount,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.UNAUTHORIZED):
+        xgov_registry_client_committee_not_declared.send.declare_committee_with_root(
+            args=DeclareCommitteeWithRootArgs(
+                committee_id=DEFAULT_COMMITTEE_ID,
+                size=DEFAULT_COMMITTEE_MEMBERS,
+                votes=DEFAULT_COMMITTEE_VOTES,
+                committee_root=COMMITTEE_ROOT,
+            ),
+            params=CommonAppCallParams(sender=no_role_account.address),
+        )
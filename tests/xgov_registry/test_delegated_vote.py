@@ -0,0 +1,95 @@
+import pytest
+from algosdk import account
+
+from smart_contracts.xgov_registry.constants import (
+    MAX_APP_TXN_REFERENCES,
+    MAX_GROUP_SIZE,
+)
+from smart_contracts.xgov_registry.delegated_vote import (
+    max_xgov_votes_per_transaction,
+    plan_delegated_votes,
+)
+
+PER_TXN = max_xgov_votes_per_transaction()
+# Each transaction references the Proposal app, each vote two boxes
+GROUP_CAPACITY = MAX_GROUP_SIZE * (MAX_APP_TXN_REFERENCES - 1) // 2
+
+
+def _votes(size: int) -> list[tuple[str, int, int]]:
+    return [(account.generate_account()[1], i + 1, 0) for i in range(size)]
+
+
+def test_max_xgov_votes_per_transaction_bound_by_arguments() -> None:
+    assert PER_TXN == 42
+
+
+def test_plan_single_vote() -> None:
+    votes = _votes(1)
+
+    plan = plan_delegated_votes(votes)
+
+    assert len(plan.groups) == 1
+    assert plan.groups[0].calls == (tuple(votes),)
+    assert plan.groups[0].op_ups == 0
+    assert plan.transaction_count == 1
+
+
+def test_plan_op_ups_carry_references() -> None:
+    votes = _votes(4)
+
+    plan = plan_delegated_votes(votes)
+
+    assert plan.groups[0].calls == (tuple(votes),)
+    assert plan.groups[0].op_ups == 1
+
+
+def test_plan_fewest_groups() -> None:
+    votes = _votes(2 * GROUP_CAPACITY + 1)
+
+    plan = plan_delegated_votes(votes)
+
+    assert [len(group.votes) for group in plan.groups] == [GROUP_CAPACITY] * 2 + [1]
+    assert all(
+        len(group.calls) + group.op_ups == MAX_GROUP_SIZE for group in plan.groups[:2]
+    )
+    assert all(len(call) <= PER_TXN for group in plan.groups for call in group.calls)
+    assert [vote for group in plan.groups for vote in group.votes] == votes
+    assert plan.votes_count == len(votes)
+
+
+def test_plan_buckets_share_references() -> None:
+    votes = _votes(2 * GROUP_CAPACITY - 1)
+
+    plan = plan_delegated_votes(votes, buckets=1)
+
+    # The single voter bucket box is referenced once per group
+    assert len(plan.groups) == 1
+    assert plan.groups[0].calls == (
+        tuple(votes[:PER_TXN]),
+        tuple(votes[PER_TXN : 2 * PER_TXN]),
+        tuple(votes[2 * PER_TXN :]),
+    )
+
+
+def test_plan_max_votes_per_group() -> None:
+    votes = _votes(10)
+
+    plan = plan_delegated_votes(votes, max_votes_per_group=4)
+
+    assert [len(group.votes) for group in plan.groups] == [4, 4, 2]
+
+
+def test_plan_rejects_duplicate_votes() -> None:
+    votes = _votes(2)
+
+    with pytest.raises(ValueError, match="duplicate"):
+        plan_delegated_votes([*votes, votes[0]])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_group_size": 0}, {"max_votes_per_group": 0}],
+)
+def test_plan_rejects_invalid_bounds(kwargs: dict[str, int]) -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        plan_delegated_votes(_votes(1), **kwargs)
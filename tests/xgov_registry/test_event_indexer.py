@@ -0,0 +1,154 @@
+import sqlite3
+from pathlib import Path
+
+import msgpack  # type: ignore[import-untyped]
+import pytest
+from algosdk import encoding
+
+from smart_contracts.xgov_registry.event_indexer import (
+    PROPOSAL,
+    PROPOSAL_ARC56_PATH,
+    REGISTRY,
+    XGOV_REGISTRY_ARC56_PATH,
+    ApplyData,
+    Block,
+    EventIndexer,
+    EventSpec,
+    RecordedBlockSource,
+    SignedTxnInBlock,
+    iter_app_logs,
+    load_event_specs,
+)
+
+REGISTRY_APP_ID = 1001
+PROPOSAL_APP_ID = 2001
+OTHER_APP_ID = 3001
+PROPOSER = encoding.encode_address(bytes(range(32)))  # type: ignore[no-untyped-call]
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+REGISTRY_SPECS = {
+    spec.name: spec
+    for spec in load_event_specs(XGOV_REGISTRY_ARC56_PATH, REGISTRY).values()
+}
+PROPOSAL_SPECS = {
+    spec.name: spec for spec in load_event_specs(PROPOSAL_ARC56_PATH, PROPOSAL).values()
+}
+
+
+def _log(specs: dict[str, EventSpec], name: str, *values: object) -> bytes:
+    spec = specs[name]
+    return bytes(spec.selector + spec.codec.encode(list(values)))
+
+
+def _app_call(
+    app_id: int, logs: list[bytes], inners: list[SignedTxnInBlock] | None = None
+) -> SignedTxnInBlock:
+    apply_data: ApplyData = {"lg": logs}
+    if inners:
+        apply_data["itx"] = inners
+    return {"txn": {"apid": app_id}, "dt": apply_data}
+
+
+def _write_block(
+    directory: Path, round_number: int, txns: list[SignedTxnInBlock]
+) -> None:
+    block: Block = {"rnd": round_number, "txns": txns}
+    (directory / f"{round_number}.msgpack").write_bytes(
+        msgpack.packb({"block": block}, use_bin_type=True)
+    )
+
+
+@pytest.fixture()
+def recorded_blocks(tmp_path: Path) -> Path:
+    opened = _log(PROPOSAL_SPECS, "Opened", 0, 10_000_000, 1, 11)
+    _write_block(
+        tmp_path,
+        10,
+        [
+            _app_call(
+                REGISTRY_APP_ID,
+                [
+                    _log(REGISTRY_SPECS, "StateVersion", 1),
+                    _log(REGISTRY_SPECS, "NewProposal", PROPOSAL_APP_ID, PROPOSER, 10),
+                    ABI_RETURN_PREFIX + PROPOSAL_APP_ID.to_bytes(8, "big"),
+                ],
+            )
+        ],
+    )
+    _write_block(
+        tmp_path,
+        11,
+        [
+            # Same selector emitted by an unrelated application
+            _app_call(OTHER_APP_ID, [opened]),
+            _app_call(
+                OTHER_APP_ID,
+                [],
+                inners=[_app_call(PROPOSAL_APP_ID, [opened])],
+            ),
+        ],
+    )
+    _write_block(tmp_path, 12, [])
+    return tmp_path
+
+
+def test_iter_app_logs_inner_transactions() -> None:
+    block: Block = {
+        "txns": [
+            _app_call(1, [b"a"], inners=[_app_call(2, [b"b"]), _app_call(3, [])]),
+            _app_call(4, [b"c"]),
+        ]
+    }
+    assert list(iter_app_logs(block)) == [
+        ("0", 1, [b"a"]),
+        ("0/0", 2, [b"b"]),
+        ("1", 4, [b"c"]),
+    ]
+
+
+def test_event_indexer_sync(recorded_blocks: Path, tmp_path: Path) -> None:
+    connection = sqlite3.connect(tmp_path / "events.sqlite")
+    indexer = EventIndexer(connection, REGISTRY_APP_ID)
+    source = RecordedBlockSource(recorded_blocks)
+
+    assert indexer.sync(source, start_round=10, batch_rounds=2) == 3
+    assert indexer.checkpoint == 12
+
+    assert connection.execute(
+        "SELECT confirmed_round, txn_path, log_index, app_id, proposal_id, proposer,"
+        " round FROM registry_new_proposal"
+    ).fetchall() == [(10, "0", 1, REGISTRY_APP_ID, PROPOSAL_APP_ID, PROPOSER, 10)]
+    assert connection.execute(
+        "SELECT txn_path, app_id, requested_amount FROM proposal_opened"
+    ).fetchall() == [("1/0", PROPOSAL_APP_ID, 10_000_000)]
+
+
+def test_event_indexer_resume(recorded_blocks: Path, tmp_path: Path) -> None:
+    database = tmp_path / "events.sqlite"
+    source = RecordedBlockSource(recorded_blocks)
+    EventIndexer(sqlite3.connect(database), REGISTRY_APP_ID).sync(
+        source, start_round=10, to_round=10
+    )
+
+    # The checkpoint and the discovered Proposals are restored
+    indexer = EventIndexer(sqlite3.connect(database), REGISTRY_APP_ID)
+    assert indexer.checkpoint == 10
+    assert indexer.proposal_ids == {PROPOSAL_APP_ID}
+    assert indexer.sync(source) == 1
+    assert indexer.checkpoint == 12
+
+    # Nothing left to index
+    assert indexer.sync(source) == 0
+
+
+def test_event_indexer_reindex_ignored(recorded_blocks: Path, tmp_path: Path) -> None:
+    connection = sqlite3.connect(tmp_path / "events.sqlite")
+    source = RecordedBlockSource(recorded_blocks)
+    EventIndexer(connection, REGISTRY_APP_ID).sync(source, start_round=10)
+    connection.execute("DELETE FROM indexer_checkpoint")
+    connection.commit()
+
+    EventIndexer(connection, REGISTRY_APP_ID).sync(source, start_round=10)
+    assert connection.execute(
+        "SELECT COUNT(*) FROM registry_state_version"
+    ).fetchone() == (1,)
@@ -0,0 +1,116 @@
+import pytest
+from algokit_utils import LogicError
+from algosdk.constants import ZERO_ADDRESS
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    GetProposalsSummaryArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.errors import std_errors as err
+from smart_contracts.proposal.enums import STATUS_APPROVED, STATUS_VOTING
+from smart_contracts.xgov_registry.box_views import read_proposals_summary
+from smart_contracts.xgov_registry.constants import MAX_PROPOSALS_SUMMARY
+from tests.utils import ERROR_TO_REGEX
+
+NOT_A_PROPOSAL_SUMMARY = (False, ZERO_ADDRESS, 0, False) + (0,) * 14
+
+
+def _expected_summary(proposal_client: ProposalClient) -> tuple[object, ...]:
+    state = proposal_client.state.global_state
+    return (
+        True,
+        state.proposer,
+        state.status,
+        bool(state.finalized),
+        state.funding_category,
+        state.requested_amount,
+        state.locked_amount,
+        state.open_ts,
+        state.submission_ts,
+        state.vote_open_ts,
+        state.committee_votes,
+        state.quorum_threshold,
+        state.weighted_quorum_threshold,
+        state.voted_members,
+        state.boycotted_members,
+        state.approvals,
+        state.rejections,
+        state.nulls,
+    )
+
+
+def test_get_proposals_summary_success(
+    xgov_registry_client: XGovRegistryClient,
+    approved_proposal_client: ProposalClient,
+    second_voting_proposal_client: ProposalClient,
+) -> None:
+    summaries = xgov_registry_client.send.get_proposals_summary(
+        args=GetProposalsSummaryArgs(
+            proposal_ids=[
+                approved_proposal_client.app_id,
+                second_voting_proposal_client.app_id,
+            ]
+        )
+    ).abi_return
+
+    assert summaries == [
+        _expected_summary(approved_proposal_client),
+        _expected_summary(second_voting_proposal_client),
+    ]
+    assert [summary[2] for summary in summaries] == [STATUS_APPROVED, STATUS_VOTING]
+
+
+def test_get_proposals_summary_not_a_proposal(
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    # Neither an app created by the registry, nor an existing app
+    not_proposals = [xgov_registry_client.app_id, 2**64 - 1]
+    summaries = xgov_registry_client.send.get_proposals_summary(
+        args=GetProposalsSummaryArgs(
+            proposal_ids=[*not_proposals, voting_proposal_client.app_id]
+        )
+    ).abi_return
+
+    assert summaries[:2] == [NOT_A_PROPOSAL_SUMMARY] * 2
+    assert summaries[2] == _expected_summary(voting_proposal_client)
+
+
+def test_get_proposals_summary_too_many(
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=ERROR_TO_REGEX[err.TOO_MANY_PROPOSALS]):
+        xgov_registry_client.send.get_proposals_summary(
+            args=GetProposalsSummaryArgs(
+                proposal_ids=[voting_proposal_client.app_id]
+                * (MAX_PROPOSALS_SUMMARY + 1)
+            )
+        )
+
+
+def test_read_proposals_summary_chunks_calls(
+    xgov_registry_client: XGovRegistryClient,
+    approved_proposal_client: ProposalClient,
+    second_voting_proposal_client: ProposalClient,
+) -> None:
+    # More IDs than a single call reads, with a duplicate
+    not_proposals = [2**64 - 1 - i for i in range(MAX_PROPOSALS_SUMMARY)]
+    proposal_ids = [
+        approved_proposal_client.app_id,
+        *not_proposals,
+        second_voting_proposal_client.app_id,
+        approved_proposal_client.app_id,
+    ]
+
+    summaries = read_proposals_summary(xgov_registry_client, proposal_ids)
+
+    assert list(summaries) == proposal_ids[:-1]
+    assert summaries[approved_proposal_client.app_id] == _expected_summary(
+        approved_proposal_client
+    )
+    assert summaries[second_voting_proposal_client.app_id] == _expected_summary(
+        second_voting_proposal_client
+    )
+    assert all(summaries[pid] == NOT_A_PROPOSAL_SUMMARY for pid in not_proposals)
@@ -5,6 +5,7 @@ from algosdk.error import AlgodHTTPError
 
 from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
     GetProposerBoxArgs,
+    GetProposerBoxesArgs,
     ProposerBoxValue,
     XGovRegistryClient,
 )
@@ -55,3 +56,21 @@ def test_get_proposer_box_not_exists_success(
 
     with pytest.raises(AlgodHTTPError, match="box not found"):
         xgov_registry_client.state.box.proposer_box.get_value(ZERO_ADDRESS)
+
+
+def test_get_proposer_boxes_success(
+    proposer: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    addresses = [ZERO_ADDRESS, proposer.address]
+    entries = xgov_registry_client.send.get_proposer_boxes(
+        args=GetProposerBoxesArgs(proposer_addresses=addresses)
+    ).abi_return
+
+    assert entries == [
+        xgov_registry_client.send.get_proposer_box(
+            args=GetProposerBoxArgs(proposer_address=address)
+        ).abi_return
+        for address in addresses
+    ]
+    assert [exists for _, exists in entries] == [False, True]
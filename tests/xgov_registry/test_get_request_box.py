@@ -7,6 +7,9 @@ from artifacts.xgov_subscriber_app_mock.x_gov_subscriber_app_mock_client import
 
 from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
     GetRequestBoxArgs,
+    GetRequestBoxesArgs,
+    GetRequestUnsubscribeBoxArgs,
+    GetRequestUnsubscribeBoxesArgs,
     XGovRegistryClient,
     XGovSubscribeRequestBoxValue,
 )
@@ -57,3 +60,41 @@ def test_get_request_box_not_exists_success(
 
     with pytest.raises(AlgodHTTPError, match="box not found"):
         xgov_registry_client.state.box.request_box.get_value(request_id)
+
+
+def test_get_request_boxes_success(
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_subscribe_requested: XGovSubscriberAppMockClient,
+) -> None:
+    request_id = xgov_registry_client.state.global_state.request_id
+    request_ids = [request_id - 1, request_id]
+    entries = xgov_registry_client.send.get_request_boxes(
+        args=GetRequestBoxesArgs(request_ids=request_ids)
+    ).abi_return
+
+    assert entries == [
+        xgov_registry_client.send.get_request_box(
+            args=GetRequestBoxArgs(request_id=request_id)
+        ).abi_return
+        for request_id in request_ids
+    ]
+    assert [exists for _, exists in entries] == [True, False]
+
+
+def test_get_request_unsubscribe_boxes_success(
+    xgov_registry_client: XGovRegistryClient,
+    app_xgov_unsubscribe_requested: XGovSubscriberAppMockClient,
+) -> None:
+    request_id = xgov_registry_client.state.global_state.request_id
+    request_ids = [request_id - 1, request_id]
+    entries = xgov_registry_client.send.get_request_unsubscribe_boxes(
+        args=GetRequestUnsubscribeBoxesArgs(request_ids=request_ids)
+    ).abi_return
+
+    assert entries == [
+        xgov_registry_client.send.get_request_unsubscribe_box(
+            args=GetRequestUnsubscribeBoxArgs(request_id=request_id)
+        ).abi_return
+        for request_id in request_ids
+    ]
+    assert [exists for _, exists in entries] == [True, False]
@@ -5,9 +5,12 @@ from algosdk.error import AlgodHTTPError
 
 from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
     GetXgovBoxArgs,
+    GetXgovBoxesArgs,
     XGovBoxValue,
     XGovRegistryClient,
 )
+from smart_contracts.xgov_registry.box_views import ENTRIES_PER_CALL, read_xgov_boxes
+from tests.common import CommitteeMember
 
 
 def test_get_xgov_box_exists_success(
@@ -56,3 +59,50 @@ def test_get_xgov_box_not_exists_success(
 
     with pytest.raises(AlgodHTTPError, match="box not found"):
         xgov_registry_client.state.box.xgov_box.get_value(ZERO_ADDRESS)
+
+
+def test_get_xgov_boxes_success(
+    xgov: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    addresses = [xgov.address, ZERO_ADDRESS, xgov.address]
+    entries = xgov_registry_client.send.get_xgov_boxes(
+        args=GetXgovBoxesArgs(xgov_addresses=addresses)
+    ).abi_return
+
+    assert entries == [
+        xgov_registry_client.send.get_xgov_box(
+            args=GetXgovBoxArgs(xgov_address=address)
+        ).abi_return
+        for address in addresses
+    ]
+    assert [exists for _, exists in entries] == [True, False, True]
+
+
+def test_get_xgov_boxes_empty(
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    entries = xgov_registry_client.send.get_xgov_boxes(
+        args=GetXgovBoxesArgs(xgov_addresses=[])
+    ).abi_return
+
+    assert entries == []
+
+
+def test_read_xgov_boxes_coalesces_calls(
+    subscribed_committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    addresses = [
+        cm.account.address for cm in subscribed_committee[: ENTRIES_PER_CALL + 1]
+    ]
+
+    entries = read_xgov_boxes(
+        xgov_registry_client,
+        [*addresses, ZERO_ADDRESS, addresses[0]],
+        sender=addresses[0],
+    )
+
+    assert list(entries) == [*addresses, ZERO_ADDRESS]
+    assert all(entries[address][1] for address in addresses)
+    assert not entries[ZERO_ADDRESS][1]
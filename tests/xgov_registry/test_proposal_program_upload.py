@@ -0,0 +1,117 @@
+import pytest
+from algokit_utils import AlgoAmount, AlgorandClient
+
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    SetXgovManagerArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.xgov_registry.constants import MAX_GROUP_SIZE
+from smart_contracts.xgov_registry.deploy_config import _upload_proposal_program
+from smart_contracts.xgov_registry.helpers import (
+    load_proposal_contract_data_size_per_transaction,
+    plan_proposal_program_upload,
+)
+from smart_contracts.xgov_registry.vault_tx_signer import (
+    HashicorpVaultMultisigTransactionSigner,
+)
+from tests.xgov_registry.conftest import _ensure_funded
+from tests.xgov_registry.test_vault_tx_signer import KEY_NAMES, _KeyEngine, _multisig
+
+CHUNK_SIZE = load_proposal_contract_data_size_per_transaction()
+PROGRAM = bytes(range(256)) * 17  # 2 full chunks and a partial one
+
+
+def test_plan_missing_box() -> None:
+    plan = plan_proposal_program_upload(PROGRAM, None)
+
+    assert plan.init_size == len(PROGRAM)
+    assert plan.chunks == (
+        (0, PROGRAM[:CHUNK_SIZE]),
+        (CHUNK_SIZE, PROGRAM[CHUNK_SIZE : 2 * CHUNK_SIZE]),
+        (2 * CHUNK_SIZE, PROGRAM[2 * CHUNK_SIZE :]),
+    )
+    assert plan.groups() == [(len(PROGRAM), plan.chunks)]
+
+
+def test_plan_up_to_date_box() -> None:
+    plan = plan_proposal_program_upload(PROGRAM, PROGRAM)
+
+    assert plan.init_size is None
+    assert plan.chunks == ()
+    assert plan.transaction_count == 0
+    assert plan.groups() == []
+
+
+def test_plan_changed_chunk_only() -> None:
+    current = bytearray(PROGRAM)
+    current[CHUNK_SIZE + 1] ^= 0xFF
+
+    plan = plan_proposal_program_upload(PROGRAM, bytes(current))
+
+    assert plan.init_size is None
+    assert plan.chunks == ((CHUNK_SIZE, PROGRAM[CHUNK_SIZE : 2 * CHUNK_SIZE]),)
+
+
+def test_plan_resized_box_keeps_matching_prefix() -> None:
+    plan = plan_proposal_program_upload(PROGRAM, PROGRAM[:CHUNK_SIZE])
+
+    assert plan.init_size == len(PROGRAM)
+    assert [offset for offset, _ in plan.chunks] == [CHUNK_SIZE, 2 * CHUNK_SIZE]
+
+
+def test_plan_shrunk_program() -> None:
+    program = PROGRAM[: CHUNK_SIZE + 10]
+
+    plan = plan_proposal_program_upload(program, PROGRAM)
+
+    assert plan.init_size == len(program)
+    assert plan.chunks == ()
+
+
+def test_plan_groups_respect_max_group_size() -> None:
+    program = bytes(range(256)) * 40
+
+    plan = plan_proposal_program_upload(program, None, chunk_size=256)
+    groups = plan.groups()
+
+    assert plan.transaction_count == 41
+    assert [(init is not None) + len(chunks) for init, chunks in groups] == [
+        MAX_GROUP_SIZE,
+        MAX_GROUP_SIZE,
+        41 - 2 * MAX_GROUP_SIZE,
+    ]
+    assert groups[0][0] == len(program)
+    assert all(init is None for init, _ in groups[1:])
+
+
+def test_plan_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        plan_proposal_program_upload(PROGRAM, None, chunk_size=0)
+
+
+def test_upload_groups_with_multisig_signer(
+    algorand_client: AlgorandClient,
+    xgov_registry_client_committee_not_declared: XGovRegistryClient,
+) -> None:
+    client = xgov_registry_client_committee_not_declared
+    engine = _KeyEngine(KEY_NAMES)
+    msig = _multisig(engine, threshold=2)
+    manager = msig.address()  # type: ignore[no-untyped-call]
+    _ensure_funded(algorand_client, manager, min_spending_balance=AlgoAmount(algo=1))
+    client.send.set_xgov_manager(args=SetXgovManagerArgs(manager=manager))
+
+    # Every chunk differs, so the whole program is sent in multi-transaction groups
+    current = client.state.box.proposal_approval_program
+    program = bytes(byte ^ 0xFF for byte in current)
+    plan = plan_proposal_program_upload(program, current)
+    assert plan.init_size is None
+    assert len(plan.chunks) > 1
+
+    _upload_proposal_program(
+        client,
+        program=program,
+        sender=manager,
+        signer=HashicorpVaultMultisigTransactionSigner(msig, engine, KEY_NAMES),
+    )
+
+    assert client.state.box.proposal_approval_program == program
@@ -0,0 +1,45 @@
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    XGovRegistryClient,
+)
+from smart_contracts.xgov_registry.state_cache import (
+    VersionedStateCache,
+    xgov_registry_state_cache,
+)
+
+
+def test_state_version_success(xgov_registry_client: XGovRegistryClient) -> None:
+    version = xgov_registry_client.send.get_state_version().abi_return
+    assert version
+
+    cache = xgov_registry_state_cache(xgov_registry_client)
+    state = cache.get()
+    assert cache.get() is state
+    assert not state.paused_registry
+
+    xgov_registry_client.send.pause_registry()
+    assert xgov_registry_client.send.get_state_version().abi_return == version + 1
+    assert cache.get().paused_registry
+
+    xgov_registry_client.send.resume_registry()
+    assert cache.version == version + 2
+
+
+def test_state_cache_reads_state_on_version_change() -> None:
+    versions = iter([1, 2, 2])
+    reads: list[int] = []
+
+    def read_versioned_state() -> tuple[int, int]:
+        reads.append(len(reads))
+        return len(reads), len(reads)
+
+    cache = VersionedStateCache(lambda: next(versions), read_versioned_state)
+
+    # The first read takes the version from the state group, not from the poll
+    assert cache.version is None
+    assert [cache.get() for _ in range(4)] == [1, 1, 2, 2]
+    assert len(reads) == 2
+    assert cache.version == 2
+
+    cache.invalidate()
+    assert cache.get() == 3
+    assert cache.version == 3
@@ -227,6 +227,50 @@ def test_unassign_and_delete(
         assert not exists
 
 
+def test_unassign_charges_assigned_xgovs_only(
+    algorand_client: AlgorandClient,
+    xgov_registry_client: XGovRegistryClient,
+    rejected_proposal_client: ProposalClient,
+) -> None:
+    # An xGov subscribed out of the Proposal Committee
+    outsider = algorand_client.account.random()
+    xgov_fee = AlgoAmount(micro_algo=xgov_registry_client.state.global_state.xgov_fee)
+    _ensure_funded(
+        algorand_client,
+        outsider,
+        min_spending_balance=AlgoAmount(algo=xgov_fee.algo * 2),
+        min_funding_increment=xgov_fee,
+    )
+    xgov_registry_client.send.subscribe_xgov(
+        args=SubscribeXgovArgs(
+            payment=_payment(
+                algorand_client,
+                sender=outsider.address,
+                receiver=xgov_registry_client.app_address,
+                amount=xgov_fee,
+            ),
+            voting_address=outsider.address,
+        ),
+        params=CommonAppCallParams(sender=outsider.address),
+    )
+
+    absentees = list(rejected_proposal_client.state.box.voters.get_map())
+    unassigned = absentees[:1]
+    before = absence_tolerance(xgov_registry_client, [*absentees, outsider.address])
+
+    composer = xgov_registry_client.new_group()
+    unassign_absentees(
+        composer, rejected_proposal_client.app_id, unassigned, op_up_count=3
+    )
+    composer.send()
+
+    after = absence_tolerance(xgov_registry_client, [*absentees, outsider.address])
+    assert after == {
+        **before,
+        **{a: before[a] - 1 for a in unassigned},
+    }
+
+
 def test_unassign_with_unsubscribed_xgov(
     committee: list[CommitteeMember],
     xgov_registry_client: XGovRegistryClient,
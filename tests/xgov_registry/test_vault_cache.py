@@ -0,0 +1,194 @@
+import os
+import stat
+from pathlib import Path
+from typing import Any
+
+import hvac
+import pytest
+
+from smart_contracts.xgov_registry.vault_tx_signer import (
+    TokenAuth,
+    VaultAuth,
+    VaultCache,
+)
+
+VAULT_URL = "https://vault.example:8200"
+ENCRYPTION_KEY = bytes(range(32))
+
+
+class _TokenApi:
+    def __init__(self, client: "_VaultClient") -> None:
+        self.client = client
+
+    def lookup_self(self) -> dict[str, Any]:
+        return {"data": self.client.server.tokens[self.client.token]}
+
+    def renew_self(self) -> dict[str, Any]:
+        self.client.server.renewals += 1
+        return {"auth": {"lease_duration": self.client.server.ttl}}
+
+
+class _AuthApi:
+    def __init__(self, client: "_VaultClient") -> None:
+        self.token = _TokenApi(client)
+
+
+class _VaultServer:
+    """Token store shared by the stubbed hvac clients"""
+
+    def __init__(self, ttl: int, *, renewable: bool = True) -> None:
+        self.ttl = ttl
+        self.renewable = renewable
+        self.tokens: dict[str, dict[str, Any]] = {}
+        self.logins = 0
+        self.renewals = 0
+
+    def login(self) -> str:
+        self.logins += 1
+        token = f"token-{self.logins}"
+        self.tokens[token] = {"ttl": self.ttl, "renewable": self.renewable}
+        return token
+
+
+class _VaultClient:
+    """Stub of the `hvac.Client` surface used by the Vault cache"""
+
+    def __init__(self, server: _VaultServer) -> None:
+        self.url = VAULT_URL
+        self.server = server
+        self.token: str | None = None
+        self.auth = _AuthApi(self)
+
+    def is_authenticated(self) -> bool:
+        return self.token in self.server.tokens
+
+
+class _LoginAuth(VaultAuth):
+    def __init__(self, server: _VaultServer, role: str = "deployer") -> None:
+        self.server = server
+        self.role = role
+
+    def authenticate(self, vault_client: hvac.Client) -> None:
+        vault_client.token = self.server.login()
+
+
+def _authenticate(
+    cache: VaultCache, server: _VaultServer, auth: VaultAuth | None = None
+) -> _VaultClient:
+    client = _VaultClient(server)
+    cache.authenticate(client, auth or _LoginAuth(server))  # type: ignore[arg-type]
+    return client
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1_000_000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    return now
+
+
+def test_token_reuse(clock: list[float]) -> None:
+    server = _VaultServer(ttl=3_600)
+    cache = VaultCache()
+
+    first = _authenticate(cache, server)
+    clock[0] += 1_000
+    second = _authenticate(cache, server)
+    assert server.logins == 1
+    assert second.token == first.token
+
+    # Other credentials do not share the token
+    _authenticate(cache, server, _LoginAuth(server, role="operator"))
+    assert server.logins == 2
+
+
+def test_token_renewal(clock: list[float]) -> None:
+    server = _VaultServer(ttl=3_600)
+    cache = VaultCache()
+    _authenticate(cache, server)
+
+    clock[0] += 3_600 - VaultCache.RENEW_TOKEN_TTL + 1
+    _authenticate(cache, server)
+    assert (server.logins, server.renewals) == (1, 1)
+
+    # The renewal extends the cached expiration
+    clock[0] += 3_600 - VaultCache.RENEW_TOKEN_TTL - 1
+    _authenticate(cache, server)
+    assert (server.logins, server.renewals) == (1, 1)
+
+
+def test_token_ttl_floor(clock: list[float]) -> None:
+    server = _VaultServer(ttl=3_600, renewable=False)
+    cache = VaultCache()
+    _authenticate(cache, server)
+
+    clock[0] += 3_600 - VaultCache.RENEW_TOKEN_TTL + 1
+    _authenticate(cache, server)
+    assert (server.logins, server.renewals) == (1, 0)
+
+    clock[0] += VaultCache.RENEW_TOKEN_TTL - VaultCache.MIN_TOKEN_TTL
+    _authenticate(cache, server)
+    assert (server.logins, server.renewals) == (2, 0)
+
+
+def test_revoked_token(clock: list[float]) -> None:
+    server = _VaultServer(ttl=3_600)
+    cache = VaultCache()
+    first = _authenticate(cache, server)
+
+    del server.tokens[str(first.token)]
+    second = _authenticate(cache, server)
+    assert server.logins == 2
+    assert second.token != first.token
+
+
+def test_uncached_tokens(clock: list[float]) -> None:
+    # Tokens without a TTL (e.g. root tokens)
+    server = _VaultServer(ttl=0)
+    cache = VaultCache()
+    _authenticate(cache, server)
+    _authenticate(cache, server)
+    assert server.logins == 2
+
+    # Token auth has nothing to cache
+    server.tokens["static"] = {"ttl": 3_600, "renewable": True}
+    client = _authenticate(cache, server, TokenAuth("static"))
+    assert client.token == "static"
+    assert cache._tokens == {}
+
+
+def test_public_key_namespaces() -> None:
+    cache = VaultCache()
+    root_key = cache.public_key_key(VAULT_URL, None, "transit", "deployer", 1)
+    team_key = cache.public_key_key(VAULT_URL, "team", "transit", "deployer", 1)
+    assert root_key != team_key
+
+    cache.set_public_key(root_key, b"\x01" * 32)
+    assert cache.get_public_key(root_key) == b"\x01" * 32
+    assert cache.get_public_key(team_key) is None
+
+
+def test_cache_file_round_trip(tmp_path: Path, clock: list[float]) -> None:
+    cache_file = str(tmp_path / "vault-cache")
+    server = _VaultServer(ttl=3_600)
+    cache = VaultCache(cache_file, ENCRYPTION_KEY)
+    client = _authenticate(cache, server)
+    public_key = cache.public_key_key(VAULT_URL, None, "transit", "deployer", 1)
+    cache.set_public_key(public_key, b"\x02" * 32)
+
+    assert stat.S_IMODE(os.stat(cache_file).st_mode) == 0o600
+    with open(cache_file, "rb") as f:
+        assert str(client.token).encode() not in f.read()
+
+    reloaded = VaultCache(cache_file, ENCRYPTION_KEY)
+    assert _authenticate(reloaded, server).token == client.token
+    assert server.logins == 1
+    assert reloaded.get_public_key(public_key) == b"\x02" * 32
+
+    # Expired tokens are dropped on load, another key cannot read the file
+    clock[0] += 3_600
+    assert VaultCache(cache_file, ENCRYPTION_KEY)._tokens == {}
+    assert VaultCache(cache_file, bytes(32)).get_public_key(public_key) is None
+
+    with pytest.raises(ValueError, match="32-byte"):
+        VaultCache(cache_file, b"short")
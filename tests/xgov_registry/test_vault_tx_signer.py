@@ -0,0 +1,250 @@
+import base64
+import threading
+from typing import Any
+
+import pytest
+from algosdk import constants, encoding
+from algosdk.transaction import (
+    Multisig,
+    MultisigTransaction,
+    PaymentTxn,
+    SuggestedParams,
+    Transaction,
+    assign_group_id,
+)
+from nacl.signing import SigningKey, VerifyKey
+
+from smart_contracts.xgov_registry.vault_tx_signer import (
+    HashicorpVaultMultisigTransactionSigner,
+    HashicorpVaultTransactionSigner,
+    TokenAuth,
+    TransitSecretEngine,
+    VaultCache,
+    VaultSecretEngine,
+)
+
+KEY_NAMES = ["key-0", "key-1", "key-2"]
+VAULT_URL = "https://vault.example:8200"
+
+
+class _KeyEngine(VaultSecretEngine):
+    """Secret engine signing with local Ed25519 keys, recording the signing keys"""
+
+    def __init__(self, key_names: list[str], failing: set[str] | None = None) -> None:
+        self.keys = {
+            name: SigningKey(bytes([i + 1]) * 32) for i, name in enumerate(key_names)
+        }
+        self.failing = failing or set()
+        self.signing_keys: list[str] = []
+        self._lock = threading.Lock()
+
+    def setup_and_derive_public_key(self, key_name: str) -> bytes:
+        return bytes(self.keys[key_name].verify_key)
+
+    def sign_data(self, data_b64: str, key_name: str) -> str:
+        with self._lock:
+            self.signing_keys.append(key_name)
+        if key_name in self.failing:
+            raise ValueError(f"{key_name} is sealed")
+        signature = self.keys[key_name].sign(base64.b64decode(data_b64)).signature
+        return base64.b64encode(signature).decode()
+
+
+class _TransitApi:
+    """Stub of the `hvac` transit secrets engine, signing with local keys"""
+
+    def __init__(self) -> None:
+        self.key = SigningKey(b"\x07" * 32)
+        self.requests: list[dict[str, Any]] = []
+        self.failing_inputs: set[str] = set()
+        self.dropped_results = 0
+
+    def read_key(self, **kwargs: Any) -> dict[str, Any]:
+        public_key = base64.b64encode(bytes(self.key.verify_key)).decode()
+        return {"data": {"keys": {"1": {"public_key": public_key}}}}
+
+    def sign_data(self, **kwargs: Any) -> dict[str, Any]:
+        self.requests.append(kwargs)
+        results = [self._sign(item["input"]) for item in kwargs["batch_input"]]
+        return {
+            "data": {"batch_results": results[: len(results) - self.dropped_results]}
+        }
+
+    def _sign(self, data_b64: str) -> dict[str, str]:
+        if data_b64 in self.failing_inputs:
+            return {"error": "invalid input"}
+        signature = self.key.sign(base64.b64decode(data_b64)).signature
+        # Vault strips the base64 padding
+        return {
+            "signature": "vault:v1:" + base64.b64encode(signature).decode().rstrip("=")
+        }
+
+
+class _VaultClient:
+    """Stub of the `hvac.Client` surface used by the transit secret engine"""
+
+    transit = _TransitApi()
+
+    def __init__(self, url: str, namespace: str | None = None) -> None:
+        self.url = url
+        self.token: str | None = None
+        self.secrets = self
+
+    def is_authenticated(self) -> bool:
+        return self.token is not None
+
+
+@pytest.fixture()
+def transit(monkeypatch: pytest.MonkeyPatch) -> _TransitApi:
+    monkeypatch.setattr(_VaultClient, "transit", _TransitApi())
+    monkeypatch.setattr("hvac.Client", _VaultClient)
+    return _VaultClient.transit
+
+
+def _transit_engine() -> TransitSecretEngine:
+    return TransitSecretEngine(VAULT_URL, TokenAuth("token"), cache=VaultCache())
+
+
+def _multisig(engine: _KeyEngine, threshold: int) -> Multisig:
+    return Multisig(  # type: ignore[no-untyped-call]
+        version=1,
+        threshold=threshold,
+        addresses=[
+            encoding.encode_address(engine.setup_and_derive_public_key(name))  # type: ignore[no-untyped-call]
+            for name in KEY_NAMES
+        ],
+    )
+
+
+def _txn_group(msig: Multisig, size: int) -> list[Transaction]:
+    params = SuggestedParams(  # type: ignore[no-untyped-call]
+        fee=constants.MIN_TXN_FEE, first=1, last=1_000, gh=b"\x01" * 32, flat_fee=True
+    )
+    sender = msig.address()  # type: ignore[no-untyped-call]
+    txns: list[Transaction] = [
+        PaymentTxn(sender, params, sender, amt=i, note=bytes([i]))  # type: ignore[no-untyped-call]
+        for i in range(size)
+    ]
+    return assign_group_id(txns)  # type: ignore[no-untyped-call, no-any-return]
+
+
+def _verified_signers(mtxn: MultisigTransaction) -> list[bytes]:
+    """Public keys of the subsigs, verifying every subsig signature"""
+    message = constants.txid_prefix + base64.b64decode(
+        encoding.msgpack_encode(mtxn.transaction)  # type: ignore[no-untyped-call]
+    )
+    signers = []
+    for subsig in mtxn.multisig.subsigs:
+        if subsig.signature is not None:
+            VerifyKey(subsig.public_key).verify(message, subsig.signature)
+            signers.append(subsig.public_key)
+    return signers
+
+
+def test_multisig_group_signatures() -> None:
+    engine = _KeyEngine(KEY_NAMES)
+    msig = _multisig(engine, threshold=2)
+    signer = HashicorpVaultMultisigTransactionSigner(msig, engine, KEY_NAMES)
+    txns = _txn_group(msig, 3)
+
+    stxns = signer.sign_transactions(txns, [0, 1, 2])
+
+    assert [stxn.transaction for stxn in stxns] == txns
+    expected_signers = [engine.setup_and_derive_public_key(k) for k in KEY_NAMES[:2]]
+    for stxn in stxns:
+        assert isinstance(stxn, MultisigTransaction)
+        assert _verified_signers(stxn) == expected_signers
+    # The configured multisig is never signed in place
+    assert all(subsig.signature is None for subsig in msig.subsigs)
+
+
+def test_multisig_threshold_only() -> None:
+    engine = _KeyEngine(KEY_NAMES)
+    msig = _multisig(engine, threshold=2)
+    signer = HashicorpVaultMultisigTransactionSigner(msig, engine, KEY_NAMES)
+
+    signer.sign_transactions(_txn_group(msig, 2), [0, 1])
+
+    # One batch per key, the third key is never used
+    assert sorted(engine.signing_keys) == ["key-0", "key-0", "key-1", "key-1"]
+
+
+def test_multisig_waves() -> None:
+    engine = _KeyEngine(KEY_NAMES, failing={"key-0"})
+    msig = _multisig(engine, threshold=2)
+    signer = HashicorpVaultMultisigTransactionSigner(msig, engine, KEY_NAMES)
+
+    (stxn,) = signer.sign_transactions(_txn_group(msig, 1), [0])
+
+    # The first wave is key-0 and key-1, the second one replaces key-0 by key-2
+    assert sorted(engine.signing_keys[:2]) == ["key-0", "key-1"]
+    assert engine.signing_keys[2:] == ["key-2"]
+    assert isinstance(stxn, MultisigTransaction)
+    assert _verified_signers(stxn) == [
+        engine.setup_and_derive_public_key(k) for k in KEY_NAMES[1:]
+    ]
+
+
+def test_multisig_threshold_not_reached() -> None:
+    engine = _KeyEngine(KEY_NAMES, failing={"key-0", "key-2"})
+    msig = _multisig(engine, threshold=2)
+    signer = HashicorpVaultMultisigTransactionSigner(msig, engine, KEY_NAMES)
+
+    with pytest.raises(RuntimeError, match=r"threshold \(1/2\)") as exc_info:
+        signer.sign_transactions(_txn_group(msig, 1), [0])
+    assert "key-0" in str(exc_info.value)
+    assert "key-2" in str(exc_info.value)
+
+
+def test_transit_batch_order(transit: _TransitApi) -> None:
+    items = [base64.b64encode(bytes([i]) * (i + 1)).decode() for i in range(5)]
+
+    signatures = _transit_engine().sign_data_batch(items, "deployer")
+
+    # One request, whose batch inputs map to the results in order
+    (request,) = transit.requests
+    assert request["name"] == "deployer"
+    assert request["mount_point"] == "transit"
+    assert [item["input"] for item in request["batch_input"]] == items
+    assert len(signatures) == len(items)
+    for item, signature in zip(items, signatures, strict=True):
+        transit.key.verify_key.verify(
+            base64.b64decode(item), base64.b64decode(signature)
+        )
+
+
+def test_transit_batch_failures(transit: _TransitApi) -> None:
+    engine = _transit_engine()
+    assert engine.sign_data_batch([], "deployer") == []
+    assert transit.requests == []
+
+    items = [base64.b64encode(bytes([i])).decode() for i in range(3)]
+    transit.failing_inputs = {items[2]}
+    with pytest.raises(ValueError, match="item 2: invalid input"):
+        engine.sign_data_batch(items, "deployer")
+
+    transit.failing_inputs = set()
+    transit.dropped_results = 1
+    with pytest.raises(ValueError, match="returned 2 signatures for 3 items"):
+        engine.sign_data_batch(items, "deployer")
+
+
+def test_transit_group_signing(transit: _TransitApi) -> None:
+    signer = HashicorpVaultTransactionSigner(
+        secret_engine=_transit_engine(), key_name="deployer"
+    )
+    msig = _multisig(_KeyEngine(KEY_NAMES), threshold=1)
+    txns = _txn_group(msig, 4)
+
+    stxns = signer.sign_transactions(txns, [3, 1])
+
+    # The selected transactions are signed with a single batch request
+    assert len(transit.requests) == 1
+    assert [stxn.transaction for stxn in stxns] == [txns[3], txns[1]]
+    for stxn in stxns:
+        message = constants.txid_prefix + base64.b64decode(
+            encoding.msgpack_encode(stxn.transaction)  # type: ignore[no-untyped-call]
+        )
+        transit.key.verify_key.verify(
+            message, base64.b64decode(stxn.signature)  # type: ignore[union-attr]
+        )
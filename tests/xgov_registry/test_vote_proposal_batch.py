@@ -0,0 +1,167 @@
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    SetVotingAccountArgs,
+    VoteProposalBatchArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.errors import std_errors as err
+from smart_contracts.xgov_registry.delegated_vote import vote_proposal_delegated
+from tests.common import CommitteeMember
+
+
+def _delegate(
+    xgov_registry_client: XGovRegistryClient,
+    members: list[CommitteeMember],
+    delegate: SigningAccount,
+) -> None:
+    for cm in members:
+        xgov_registry_client.send.set_voting_account(
+            args=SetVotingAccountArgs(
+                xgov_address=cm.account.address,
+                voting_address=delegate.address,
+            ),
+            params=CommonAppCallParams(sender=cm.account.address),
+        )
+
+
+def test_vote_proposal_batch_success(
+    min_fee_times_2: AlgoAmount,
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    members = committee[:3]
+    _delegate(xgov_registry_client, members, no_role_account)
+
+    xgov_registry_client.send.vote_proposal_batch(
+        args=VoteProposalBatchArgs(
+            proposal_id=voting_proposal_client.app_id,
+            votes=[(cm.account.address, cm.votes, 0) for cm in members],
+        ),
+        params=CommonAppCallParams(
+            sender=no_role_account.address, static_fee=min_fee_times_2
+        ),
+    )
+
+    global_state = voting_proposal_client.state.global_state
+    assert global_state.voted_members == len(members)
+    assert global_state.approvals == sum(cm.votes for cm in members)
+
+    absence_tolerance = xgov_registry_client.state.global_state.absence_tolerance
+    for cm in members:
+        xgov_box = xgov_registry_client.state.box.xgov_box.get_value(cm.account.address)
+        assert xgov_box.tolerated_absences == absence_tolerance
+        assert xgov_box.last_vote_timestamp > 0  # type: ignore
+
+
+def test_vote_proposal_batch_not_voting_address(
+    min_fee_times_2: AlgoAmount,
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    # Only the first xGov delegated its vote
+    _delegate(xgov_registry_client, committee[:1], no_role_account)
+
+    with pytest.raises(LogicError, match=err.MUST_BE_XGOV_OR_VOTING_ADDRESS):
+        xgov_registry_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[(cm.account.address, cm.votes, 0) for cm in committee[:2]],
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address, static_fee=min_fee_times_2
+            ),
+        )
+
+
+def test_vote_proposal_batch_not_an_xgov(
+    min_fee_times_2: AlgoAmount,
+    no_role_account: SigningAccount,
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.NOT_XGOV):
+        xgov_registry_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[(no_role_account.address, 1, 0)],
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address, static_fee=min_fee_times_2
+            ),
+        )
+
+
+def test_vote_proposal_batch_empty(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.EMPTY_PAYLOAD):
+        xgov_registry_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[],
+            ),
+            params=CommonAppCallParams(sender=committee[0].account.address),
+        )
+
+
+def test_vote_proposal_batch_not_a_proposal_app(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.INVALID_PROPOSAL):
+        xgov_registry_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=xgov_registry_client.app_id,
+                votes=[(committee[0].account.address, committee[0].votes, 0)],
+            ),
+            params=CommonAppCallParams(sender=committee[0].account.address),
+        )
+
+
+def test_vote_proposal_batch_paused_registry(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    xgov_registry_client.send.pause_registry()
+    with pytest.raises(LogicError, match=err.PAUSED_REGISTRY):
+        xgov_registry_client.send.vote_proposal_batch(
+            args=VoteProposalBatchArgs(
+                proposal_id=voting_proposal_client.app_id,
+                votes=[(committee[0].account.address, committee[0].votes, 0)],
+            ),
+            params=CommonAppCallParams(sender=committee[0].account.address),
+        )
+    xgov_registry_client.send.resume_registry()
+
+
+def test_vote_proposal_delegated(
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    _delegate(xgov_registry_client, committee, no_role_account)
+
+    plan = vote_proposal_delegated(
+        xgov_registry_client,
+        voting_proposal_client,
+        [(cm.account.address, 0, cm.votes) for cm in committee],
+        sender=no_role_account.address,
+        signer=no_role_account.signer,
+        max_votes_per_group=4,
+    )
+
+    assert plan.votes_count == len(committee)
+    global_state = voting_proposal_client.state.global_state
+    assert global_state.voted_members == len(committee)
+    assert global_state.rejections == sum(cm.votes for cm in committee)
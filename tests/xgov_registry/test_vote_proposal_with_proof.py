@@ -0,0 +1,201 @@
+import dataclasses
+
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    UnassignAbsenteeFromProposalWithProofArgs,
+    VoteProposalWithProofArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.errors import std_errors as err
+from smart_contracts.xgov_registry.committee_merkle import (
+    CommitteeMembershipProof,
+    CommitteeMerkleTree,
+)
+from tests.common import CommitteeMember
+from tests.proposal.common import absence_tolerance, scrutinize_proposal
+
+
+def _vote_with_proof_args(
+    proposal_client: ProposalClient,
+    membership: CommitteeMembershipProof,
+) -> VoteProposalWithProofArgs:
+    return VoteProposalWithProofArgs(
+        proposal_id=proposal_client.app_id,
+        xgov_address=membership.address,
+        voting_power=membership.votes,
+        ordinal=membership.ordinal,
+        proof=list(membership.proof),
+        approval_votes=membership.votes,
+        rejection_votes=0,
+    )
+
+
+def _unassign_absentee_with_proof_args(
+    proposal_client: ProposalClient,
+    membership: CommitteeMembershipProof,
+) -> UnassignAbsenteeFromProposalWithProofArgs:
+    return UnassignAbsenteeFromProposalWithProofArgs(
+        proposal_id=proposal_client.app_id,
+        xgov_address=membership.address,
+        voting_power=membership.votes,
+        ordinal=membership.ordinal,
+        proof=list(membership.proof),
+    )
+
+
+def test_vote_proposal_with_proof_success(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    xgov_registry_client.send.vote_proposal_with_proof(
+        args=_vote_with_proof_args(merkle_voting_proposal_client, membership),
+        params=CommonAppCallParams(
+            sender=committee[0].account.address,
+            static_fee=min_fee_times_2,
+        ),
+    )
+
+    global_state = merkle_voting_proposal_client.state.global_state
+    assert global_state.voted_members == 1
+    assert global_state.approvals == membership.votes
+
+    xgov_box = xgov_registry_client.state.box.xgov_box.get_value(
+        committee[0].account.address
+    )
+    assert xgov_box.last_vote_timestamp > 0  # type: ignore
+
+
+def test_vote_proposal_with_proof_already_voted(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    params = CommonAppCallParams(
+        sender=committee[0].account.address,
+        static_fee=min_fee_times_2,
+    )
+    xgov_registry_client.send.vote_proposal_with_proof(
+        args=_vote_with_proof_args(merkle_voting_proposal_client, membership),
+        params=params,
+    )
+
+    with pytest.raises(LogicError, match=err.VOTER_ALREADY_VOTED):
+        xgov_registry_client.send.vote_proposal_with_proof(
+            args=_vote_with_proof_args(merkle_voting_proposal_client, membership),
+            params=params,
+        )
+
+
+def test_vote_proposal_with_proof_invalid_proof(
+    min_fee_times_2: AlgoAmount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    # A valid proof with another member's ordinal
+    membership = committee_tree.proof(committee[0].account.address)
+    membership = dataclasses.replace(membership, ordinal=membership.ordinal ^ 1)
+
+    with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+        xgov_registry_client.send.vote_proposal_with_proof(
+            args=_vote_with_proof_args(merkle_voting_proposal_client, membership),
+            params=CommonAppCallParams(
+                sender=committee[0].account.address,
+                static_fee=min_fee_times_2,
+            ),
+        )
+
+
+def test_vote_proposal_with_proof_not_an_xgov(
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+    membership = dataclasses.replace(membership, address=no_role_account.address)
+
+    with pytest.raises(LogicError, match=err.NOT_XGOV):
+        xgov_registry_client.send.vote_proposal_with_proof(
+            args=_vote_with_proof_args(merkle_voting_proposal_client, membership),
+            params=CommonAppCallParams(sender=no_role_account.address),
+        )
+
+
+def test_vote_proposal_with_proof_not_xgov_or_voting_address(
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    membership = committee_tree.proof(committee[0].account.address)
+
+    with pytest.raises(LogicError, match=err.MUST_BE_XGOV_OR_VOTING_ADDRESS):
+        xgov_registry_client.send.vote_proposal_with_proof(
+            args=_vote_with_proof_args(merkle_voting_proposal_client, membership),
+            params=CommonAppCallParams(sender=no_role_account.address),
+        )
+
+
+def test_unassign_absentee_from_proposal_with_proof(
+    min_fee_times_2: AlgoAmount,
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    committee_tree: CommitteeMerkleTree,
+    xgov_registry_client: XGovRegistryClient,
+    merkle_voting_proposal_client: ProposalClient,
+) -> None:
+    voter, absentee = (committee_tree.proof(cm.account.address) for cm in committee[:2])
+    xgov_registry_client.send.vote_proposal_with_proof(
+        args=_vote_with_proof_args(merkle_voting_proposal_client, voter),
+        params=CommonAppCallParams(
+            sender=voter.address,
+            static_fee=min_fee_times_2,
+        ),
+    )
+    scrutinize_proposal(no_role_account, merkle_voting_proposal_client, min_fee_times_2)
+    tolerance = absence_tolerance(
+        xgov_registry_client, [voter.address, absentee.address]
+    )
+
+    xgov_registry_client.send.unassign_absentee_from_proposal_with_proof(
+        args=_unassign_absentee_with_proof_args(
+            merkle_voting_proposal_client, absentee
+        ),
+        params=CommonAppCallParams(static_fee=min_fee_times_2),
+    )
+
+    assert absence_tolerance(
+        xgov_registry_client, [voter.address, absentee.address]
+    ) == {
+        voter.address: tolerance[voter.address],
+        absentee.address: tolerance[absentee.address] - 1,
+    }
+    assert merkle_voting_proposal_client.state.global_state.assigned_members == (
+        committee_tree.size - 2
+    )
+
+    # Voters and unassigned absentees are not charged an absence
+    for membership in (voter, absentee):
+        with pytest.raises(LogicError, match=err.VOTER_NOT_FOUND):
+            xgov_registry_client.send.unassign_absentee_from_proposal_with_proof(
+                args=_unassign_absentee_with_proof_args(
+                    merkle_voting_proposal_client, membership
+                ),
+                params=CommonAppCallParams(
+                    static_fee=min_fee_times_2, note=membership.address.encode()
+                ),
+            )
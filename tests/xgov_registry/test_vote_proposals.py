@@ -0,0 +1,178 @@
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, LogicError, SigningAccount
+from algosdk.constants import MIN_TXN_FEE
+
+from smart_contracts.artifacts.proposal.proposal_client import ProposalClient
+from smart_contracts.artifacts.xgov_registry.x_gov_registry_client import (
+    SetVotingAccountArgs,
+    VoteProposalsArgs,
+    XGovRegistryClient,
+)
+from smart_contracts.errors import std_errors as err
+from tests.common import DEFAULT_COMMITTEE_VOTES, CommitteeMember
+
+
+def _fee(proposals: int) -> AlgoAmount:
+    # The outer call pools the fees of the inner Proposal calls
+    return AlgoAmount(micro_algo=MIN_TXN_FEE * (1 + proposals))
+
+
+@pytest.mark.parametrize(
+    "account_role",
+    ["xgov_address", "voting_address"],
+)
+def test_vote_proposals_success(
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+    second_voting_proposal_client: ProposalClient,
+    account_role: str,
+) -> None:
+    xgov = committee[0]
+    sender = xgov.account.address
+    if account_role == "voting_address":
+        sender = no_role_account.address
+        xgov_registry_client.send.set_voting_account(
+            args=SetVotingAccountArgs(
+                xgov_address=xgov.account.address,
+                voting_address=sender,
+            ),
+            params=CommonAppCallParams(sender=xgov.account.address),
+        )
+
+    xgov_registry_client.send.vote_proposals(
+        args=VoteProposalsArgs(
+            xgov_address=xgov.account.address,
+            votes=[
+                (voting_proposal_client.app_id, xgov.votes, 0),
+                (second_voting_proposal_client.app_id, 0, xgov.votes),
+            ],
+        ),
+        params=CommonAppCallParams(sender=sender, static_fee=_fee(2)),
+    )
+
+    first = voting_proposal_client.state.global_state
+    assert first.voted_members == 1
+    assert first.approvals == xgov.votes
+    assert first.rejections == 0
+
+    second = second_voting_proposal_client.state.global_state
+    assert second.voted_members == 1
+    assert second.approvals == 0
+    assert second.rejections == xgov.votes
+
+    xgov_box = xgov_registry_client.state.box.xgov_box.get_value(xgov.account.address)
+    assert (
+        xgov_box.tolerated_absences
+        == xgov_registry_client.state.global_state.absence_tolerance
+    )
+    assert xgov_box.last_vote_timestamp > 0  # type: ignore
+
+
+def test_vote_proposals_paused_registry(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    xgov_registry_client.send.pause_registry()
+    with pytest.raises(LogicError, match=err.PAUSED_REGISTRY):
+        xgov_registry_client.send.vote_proposals(
+            args=VoteProposalsArgs(
+                xgov_address=committee[0].account.address,
+                votes=[(voting_proposal_client.app_id, committee[0].votes, 0)],
+            ),
+            params=CommonAppCallParams(
+                sender=committee[0].account.address, static_fee=_fee(1)
+            ),
+        )
+    xgov_registry_client.send.resume_registry()
+
+
+def test_vote_proposals_empty(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.EMPTY_PAYLOAD):
+        xgov_registry_client.send.vote_proposals(
+            args=VoteProposalsArgs(
+                xgov_address=committee[0].account.address,
+                votes=[],
+            ),
+            params=CommonAppCallParams(sender=committee[0].account.address),
+        )
+
+
+def test_vote_proposals_not_a_proposal_app(
+    committee: list[CommitteeMember],
+    xgov_registry_client: XGovRegistryClient,
+    voting_proposal_client: ProposalClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.INVALID_PROPOSAL):
+        xgov_registry_client.send.vote_proposals(
+            args=VoteProposalsArgs(
+                xgov_address=committee[0].account.address,
+                votes=[
+                    (voting_proposal_client.app_id, committee[0].votes, 0),
+                    (xgov_registry_client.app_id, committee[0].votes, 0),
+                ],
+            ),
+            params=CommonAppCallParams(
+                sender=committee[0].account.address, static_fee=_fee(2)
+            ),
+        )
+
+
+def test_vote_proposals_not_an_xgov(
+    no_role_account: SigningAccount,
+    voting_proposal_client: ProposalClient,
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.NOT_XGOV):
+        xgov_registry_client.send.vote_proposals(
+            args=VoteProposalsArgs(
+                xgov_address=no_role_account.address,
+                votes=[(voting_proposal_client.app_id, DEFAULT_COMMITTEE_VOTES, 0)],
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address, static_fee=_fee(1)
+            ),
+        )
+
+
+def test_vote_proposals_not_xgov_or_voting_address(
+    no_role_account: SigningAccount,
+    committee: list[CommitteeMember],
+    voting_proposal_client: ProposalClient,
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.MUST_BE_XGOV_OR_VOTING_ADDRESS):
+        xgov_registry_client.send.vote_proposals(
+            args=VoteProposalsArgs(
+                xgov_address=committee[0].account.address,
+                votes=[(voting_proposal_client.app_id, committee[0].votes, 0)],
+            ),
+            params=CommonAppCallParams(
+                sender=no_role_account.address, static_fee=_fee(1)
+            ),
+        )
+
+
+def test_vote_proposals_same_proposal_twice(
+    committee: list[CommitteeMember],
+    voting_proposal_client: ProposalClient,
+    xgov_registry_client: XGovRegistryClient,
+) -> None:
+    with pytest.raises(LogicError, match=err.VOTER_ALREADY_VOTED):
+        xgov_registry_client.send.vote_proposals(
+            args=VoteProposalsArgs(
+                xgov_address=committee[0].account.address,
+                votes=[
+                    (voting_proposal_client.app_id, committee[0].votes, 0),
+                    (voting_proposal_client.app_id, committee[0].votes, 0),
+                ],
+            ),
+            params=CommonAppCallParams(
+                sender=committee[0].account.address, static_fee=_fee(2)
+            ),
+        )